@@ -1,29 +1,9 @@
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from dataclasses import dataclass
+from typing import List
 import csv
 
-
-@dataclass
-class Invitado:
-    rol: str
-    nombre: str
-    apellido: str
-    amistades: List[str] = field(default_factory=list)
-    enemistades: List[str] = field(default_factory=list)
-
-@dataclass
-class Mesa:
-    mesa_id: int
-    numAsientos: int
-    nombMesa: Optional[str] = None
-    invitados: List[Invitado] = field(default_factory=list)
-
-@dataclass
-class Evento:
-    nombre: str
-    fecha: str
-    ubicacion: str
-    mesas: List[Mesa] = field(default_factory=list)
+# Invitado, Mesa y Evento son los del núcleo de mesas
+from nucleo_mesas.modelo import Evento, Invitado, Mesa, crear_invitado
 
 
 # --- Compatibilidad: pequeño modelo usado en `modelos.py` ---
@@ -55,7 +35,7 @@ def importar_invitados_csv(ruta_csv: str, delimitador: str = ";") -> List[Invita
             # convertir "pref1|pref2" -> ["pref1", "pref2"]
             preferencias = [p.strip() for p in prefs_raw.split("|") if p.strip()]
 
-            invitado = Invitado(
+            invitado = crear_invitado(
                 rol=rol,
                 nombre=nombre,
                 apellido=apellido,
@@ -94,6 +74,8 @@ def exportar_invitados_csv(evento: Evento, ruta="invitados.csv", delim=";"):
         for m in evento.mesas:
             etiqueta = m.nombMesa if m.nombMesa else f"Mesa{m.mesa_id}"
             for inv in m.invitados:
+                if inv is None:
+                    continue
                 w.writerow([m.mesa_id, etiqueta, inv.nombre, inv.apellido, inv.rol, "|".join(inv.preferencias)])
 
 def exportar_todo_csv(evento: Evento, no_asignados: List[Invitado], base="evento", delim=";"):
@@ -106,6 +88,8 @@ def exportar_todo_csv(evento: Evento, no_asignados: List[Invitado], base="evento
 import math
 from PyQt5 import QtWidgets, QtGui, QtCore
 
+from recursos import cache_pixmaps, ruta_icono
+
 ICON_SIZE = 56
 MARGIN = 24
 
@@ -137,7 +121,7 @@ def render_mesa(ui, invitados, capacidad, mostrar_huecos=True):
 
     data = list(invitados)
     if mostrar_huecos and len(data) < capacidad:
-        data = data + [{"nombre": "", "icon": "Resources/Icons/Gris.png"}] * (capacidad - len(data))
+        data = data + [{"nombre": "", "icon": ruta_icono("gris.png")}] * (capacidad - len(data))
 
     for i in range(n_slots):
         info = data[i] if i < len(data) else None
@@ -153,7 +137,7 @@ def render_mesa(ui, invitados, capacidad, mostrar_huecos=True):
         icon.setAlignment(QtCore.Qt.AlignCenter)
         icon.setStyleSheet("QLabel{background:transparent;}")
         if info and info.get("icon"):
-            icon.setPixmap(QtGui.QPixmap(info["icon"]))
+            icon.setPixmap(cache_pixmaps.pixmap(info["icon"], ICON_SIZE, arena.devicePixelRatioF()))
         icon.move(int(x - ICON_SIZE/2), int(y - ICON_SIZE/2))
         icon.show()
 
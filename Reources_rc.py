@@ -1,11342 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt5 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\xbf\x97\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0a\x4f\x69\x43\x43\x50\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x49\x43\x43\x20\x70\x72\x6f\x66\x69\
-\x6c\x65\x00\x00\x78\xda\x9d\x53\x67\x54\x53\xe9\x16\x3d\xf7\xde\
-\xf4\x42\x4b\x88\x80\x94\x4b\x6f\x52\x15\x08\x20\x52\x42\x8b\x80\
-\x14\x91\x26\x2a\x21\x09\x10\x4a\x88\x21\xa1\xd9\x15\x51\xc1\x11\
-\x45\x45\x04\x1b\xc8\xa0\x88\x03\x8e\x8e\x80\x8c\x15\x51\x2c\x0c\
-\x8a\x0a\xd8\x07\xe4\x21\xa2\x8e\x83\xa3\x88\x8a\xca\xfb\xe1\x7b\
-\xa3\x6b\xd6\xbc\xf7\xe6\xcd\xfe\xb5\xd7\x3e\xe7\xac\xf3\x9d\xb3\
-\xcf\x07\xc0\x08\x0c\x96\x48\x33\x51\x35\x80\x0c\xa9\x42\x1e\x11\
-\xe0\x83\xc7\xc4\xc6\xe1\xe4\x2e\x40\x81\x0a\x24\x70\x00\x10\x08\
-\xb3\x64\x21\x73\xfd\x23\x01\x00\xf8\x7e\x3c\x3c\x2b\x22\xc0\x07\
-\xbe\x00\x01\x78\xd3\x0b\x08\x00\xc0\x4d\x9b\xc0\x30\x1c\x87\xff\
-\x0f\xea\x42\x99\x5c\x01\x80\x84\x01\xc0\x74\x91\x38\x4b\x08\x80\
-\x14\x00\x40\x7a\x8e\x42\xa6\x00\x40\x46\x01\x80\x9d\x98\x26\x53\
-\x00\xa0\x04\x00\x60\xcb\x63\x62\xe3\x00\x50\x2d\x00\x60\x27\x7f\
-\xe6\xd3\x00\x80\x9d\xf8\x99\x7b\x01\x00\x5b\x94\x21\x15\x01\xa0\
-\x91\x00\x20\x13\x65\x88\x44\x00\x68\x3b\x00\xac\xcf\x56\x8a\x45\
-\x00\x58\x30\x00\x14\x66\x4b\xc4\x39\x00\xd8\x2d\x00\x30\x49\x57\
-\x66\x48\x00\xb0\xb7\x00\xc0\xce\x10\x0b\xb2\x00\x08\x0c\x00\x30\
-\x51\x88\x85\x29\x00\x04\x7b\x00\x60\xc8\x23\x23\x78\x00\x84\x99\
-\x00\x14\x46\xf2\x57\x3c\xf1\x2b\xae\x10\xe7\x2a\x00\x00\x78\x99\
-\xb2\x3c\xb9\x24\x39\x45\x81\x5b\x08\x2d\x71\x07\x57\x57\x2e\x1e\
-\x28\xce\x49\x17\x2b\x14\x36\x61\x02\x61\x9a\x40\x2e\xc2\x79\x99\
-\x19\x32\x81\x34\x0f\xe0\xf3\xcc\x00\x00\xa0\x91\x15\x11\xe0\x83\
-\xf3\xfd\x78\xce\x0e\xae\xce\xce\x36\x8e\xb6\x0e\x5f\x2d\xea\xbf\
-\x06\xff\x22\x62\x62\xe3\xfe\xe5\xcf\xab\x70\x40\x00\x00\xe1\x74\
-\x7e\xd1\xfe\x2c\x2f\xb3\x1a\x80\x3b\x06\x80\x6d\xfe\xa2\x25\xee\
-\x04\x68\x5e\x0b\xa0\x75\xf7\x8b\x66\xb2\x0f\x40\xb5\x00\xa0\xe9\
-\xda\x57\xf3\x70\xf8\x7e\x3c\x3c\x45\xa1\x90\xb9\xd9\xd9\xe5\xe4\
-\xe4\xd8\x4a\xc4\x42\x5b\x61\xca\x57\x7d\xfe\x67\xc2\x5f\xc0\x57\
-\xfd\x6c\xf9\x7e\x3c\xfc\xf7\xf5\xe0\xbe\xe2\x24\x81\x32\x5d\x81\
-\x47\x04\xf8\xe0\xc2\xcc\xf4\x4c\xa5\x1c\xcf\x92\x09\x84\x62\xdc\
-\xe6\x8f\x47\xfc\xb7\x0b\xff\xfc\x1d\xd3\x22\xc4\x49\x62\xb9\x58\
-\x2a\x14\xe3\x51\x12\x71\x8e\x44\x9a\x8c\xf3\x32\xa5\x22\x89\x42\
-\x92\x29\xc5\x25\xd2\xff\x64\xe2\xdf\x2c\xfb\x03\x3e\xdf\x35\x00\
-\xb0\x6a\x3e\x01\x7b\x91\x2d\xa8\x5d\x63\x03\xf6\x4b\x27\x10\x58\
-\x74\xc0\xe2\xf7\x00\x00\xf2\xbb\x6f\xc1\xd4\x28\x08\x03\x80\x68\
-\x83\xe1\xcf\x77\xff\xef\x3f\xfd\x47\xa0\x25\x00\x80\x66\x49\x92\
-\x71\x00\x00\x5e\x44\x24\x2e\x54\xca\xb3\x3f\xc7\x08\x00\x00\x44\
-\xa0\x81\x2a\xb0\x41\x1b\xf4\xc1\x18\x2c\xc0\x06\x1c\xc1\x05\xdc\
-\xc1\x0b\xfc\x60\x36\x84\x42\x24\xc4\xc2\x42\x10\x42\x0a\x64\x80\
-\x1c\x72\x60\x29\xac\x82\x42\x28\x86\xcd\xb0\x1d\x2a\x60\x2f\xd4\
-\x40\x1d\x34\xc0\x51\x68\x86\x93\x70\x0e\x2e\xc2\x55\xb8\x0e\x3d\
-\x70\x0f\xfa\x61\x08\x9e\xc1\x28\xbc\x81\x09\x04\x41\xc8\x08\x13\
-\x61\x21\xda\x88\x01\x62\x8a\x58\x23\x8e\x08\x17\x99\x85\xf8\x21\
-\xc1\x48\x04\x12\x8b\x24\x20\xc9\x88\x14\x51\x22\x4b\x91\x35\x48\
-\x31\x52\x8a\x54\x20\x55\x48\x1d\xf2\x3d\x72\x02\x39\x87\x5c\x46\
-\xba\x91\x3b\xc8\x00\x32\x82\xfc\x86\xbc\x47\x31\x94\x81\xb2\x51\
-\x3d\xd4\x0c\xb5\x43\xb9\xa8\x37\x1a\x84\x46\xa2\x0b\xd0\x64\x74\
-\x31\x9a\x8f\x16\xa0\x9b\xd0\x72\xb4\x1a\x3d\x8c\x36\xa1\xe7\xd0\
-\xab\x68\x0f\xda\x8f\x3e\x43\xc7\x30\xc0\xe8\x18\x07\x33\xc4\x6c\
-\x30\x2e\xc6\xc3\x42\xb1\x38\x2c\x09\x93\x63\xcb\xb1\x22\xac\x0c\
-\xab\xc6\x1a\xb0\x56\xac\x03\xbb\x89\xf5\x63\xcf\xb1\x77\x04\x12\
-\x81\x45\xc0\x09\x36\x04\x77\x42\x20\x61\x1e\x41\x48\x58\x4c\x58\
-\x4e\xd8\x48\xa8\x20\x1c\x24\x34\x11\xda\x09\x37\x09\x03\x84\x51\
-\xc2\x27\x22\x93\xa8\x4b\xb4\x26\xba\x11\xf9\xc4\x18\x62\x32\x31\
-\x87\x58\x48\x2c\x23\xd6\x12\x8f\x13\x2f\x10\x7b\x88\x43\xc4\x37\
-\x24\x12\x89\x43\x32\x27\xb9\x90\x02\x49\xb1\xa4\x54\xd2\x12\xd2\
-\x46\xd2\x6e\x52\x23\xe9\x2c\xa9\x9b\x34\x48\x1a\x23\x93\xc9\xda\
-\x64\x6b\xb2\x07\x39\x94\x2c\x20\x2b\xc8\x85\xe4\x9d\xe4\xc3\xe4\
-\x33\xe4\x1b\xe4\x21\xf2\x5b\x0a\x9d\x62\x40\x71\xa4\xf8\x53\xe2\
-\x28\x52\xca\x6a\x4a\x19\xe5\x10\xe5\x34\xe5\x06\x65\x98\x32\x41\
-\x55\xa3\x9a\x52\xdd\xa8\xa1\x54\x11\x35\x8f\x5a\x42\xad\xa1\xb6\
-\x52\xaf\x51\x87\xa8\x13\x34\x75\x9a\x39\xcd\x83\x16\x49\x4b\xa5\
-\xad\xa2\x95\xd3\x1a\x68\x17\x68\xf7\x69\xaf\xe8\x74\xba\x11\xdd\
-\x95\x1e\x4e\x97\xd0\x57\xd2\xcb\xe9\x47\xe8\x97\xe8\x03\xf4\x77\
-\x0c\x0d\x86\x15\x83\xc7\x88\x67\x28\x19\x9b\x18\x07\x18\x67\x19\
-\x77\x18\xaf\x98\x4c\xa6\x19\xd3\x8b\x19\xc7\x54\x30\x37\x31\xeb\
-\x98\xe7\x99\x0f\x99\x6f\x55\x58\x2a\xb6\x2a\x7c\x15\x91\xca\x0a\
-\x95\x4a\x95\x26\x95\x1b\x2a\x2f\x54\xa9\xaa\xa6\xaa\xde\xaa\x0b\
-\x55\xf3\x55\xcb\x54\x8f\xa9\x5e\x53\x7d\xae\x46\x55\x33\x53\xe3\
-\xa9\x09\xd4\x96\xab\x55\xaa\x9d\x50\xeb\x53\x1b\x53\x67\xa9\x3b\
-\xa8\x87\xaa\x67\xa8\x6f\x54\x3f\xa4\x7e\x59\xfd\x89\x06\x59\xc3\
-\x4c\xc3\x4f\x43\xa4\x51\xa0\xb1\x5f\xe3\xbc\xc6\x20\x0b\x63\x19\
-\xb3\x78\x2c\x21\x6b\x0d\xab\x86\x75\x81\x35\xc4\x26\xb1\xcd\xd9\
-\x7c\x76\x2a\xbb\x98\xfd\x1d\xbb\x8b\x3d\xaa\xa9\xa1\x39\x43\x33\
-\x4a\x33\x57\xb3\x52\xf3\x94\x66\x3f\x07\xe3\x98\x71\xf8\x9c\x74\
-\x4e\x09\xe7\x28\xa7\x97\xf3\x7e\x8a\xde\x14\xef\x29\xe2\x29\x1b\
-\xa6\x34\x4c\xb9\x31\x65\x5c\x6b\xaa\x96\x97\x96\x58\xab\x48\xab\
-\x51\xab\x47\xeb\xbd\x36\xae\xed\xa7\x9d\xa6\xbd\x45\xbb\x59\xfb\
-\x81\x0e\x41\xc7\x4a\x27\x5c\x27\x47\x67\x8f\xce\x05\x9d\xe7\x53\
-\xd9\x53\xdd\xa7\x0a\xa7\x16\x4d\x3d\x3a\xf5\xae\x2e\xaa\x6b\xa5\
-\x1b\xa1\xbb\x44\x77\xbf\x6e\xa7\xee\x98\x9e\xbe\x5e\x80\x9e\x4c\
-\x6f\xa7\xde\x79\xbd\xe7\xfa\x1c\x7d\x2f\xfd\x54\xfd\x6d\xfa\xa7\
-\xf5\x47\x0c\x58\x06\xb3\x0c\x24\x06\xdb\x0c\xce\x18\x3c\xc5\x35\
-\x71\x6f\x3c\x1d\x2f\xc7\xdb\xf1\x51\x43\x5d\xc3\x40\x43\xa5\x61\
-\x95\x61\x97\xe1\x84\x91\xb9\xd1\x3c\xa3\xd5\x46\x8d\x46\x0f\x8c\
-\x69\xc6\x5c\xe3\x24\xe3\x6d\xc6\x6d\xc6\xa3\x26\x06\x26\x21\x26\
-\x4b\x4d\xea\x4d\xee\x9a\x52\x4d\xb9\xa6\x29\xa6\x3b\x4c\x3b\x4c\
-\xc7\xcd\xcc\xcd\xa2\xcd\xd6\x99\x35\x9b\x3d\x31\xd7\x32\xe7\x9b\
-\xe7\x9b\xd7\x9b\xdf\xb7\x60\x5a\x78\x5a\x2c\xb6\xa8\xb6\xb8\x65\
-\x49\xb2\xe4\x5a\xa6\x59\xee\xb6\xbc\x6e\x85\x5a\x39\x59\xa5\x58\
-\x55\x5a\x5d\xb3\x46\xad\x9d\xad\x25\xd6\xbb\xad\xbb\xa7\x11\xa7\
-\xb9\x4e\x93\x4e\xab\x9e\xd6\x67\xc3\xb0\xf1\xb6\xc9\xb6\xa9\xb7\
-\x19\xb0\xe5\xd8\x06\xdb\xae\xb6\x6d\xb6\x7d\x61\x67\x62\x17\x67\
-\xb7\xc5\xae\xc3\xee\x93\xbd\x93\x7d\xba\x7d\x8d\xfd\x3d\x07\x0d\
-\x87\xd9\x0e\xab\x1d\x5a\x1d\x7e\x73\xb4\x72\x14\x3a\x56\x3a\xde\
-\x9a\xce\x9c\xee\x3f\x7d\xc5\xf4\x96\xe9\x2f\x67\x58\xcf\x10\xcf\
-\xd8\x33\xe3\xb6\x13\xcb\x29\xc4\x69\x9d\x53\x9b\xd3\x47\x67\x17\
-\x67\xb9\x73\x83\xf3\x88\x8b\x89\x4b\x82\xcb\x2e\x97\x3e\x2e\x9b\
-\x1b\xc6\xdd\xc8\xbd\xe4\x4a\x74\xf5\x71\x5d\xe1\x7a\xd2\xf5\x9d\
-\x9b\xb3\x9b\xc2\xed\xa8\xdb\xaf\xee\x36\xee\x69\xee\x87\xdc\x9f\
-\xcc\x34\x9f\x29\x9e\x59\x33\x73\xd0\xc3\xc8\x43\xe0\x51\xe5\xd1\
-\x3f\x0b\x9f\x95\x30\x6b\xdf\xac\x7e\x4f\x43\x4f\x81\x67\xb5\xe7\
-\x23\x2f\x63\x2f\x91\x57\xad\xd7\xb0\xb7\xa5\x77\xaa\xf7\x61\xef\
-\x17\x3e\xf6\x3e\x72\x9f\xe3\x3e\xe3\x3c\x37\xde\x32\xde\x59\x5f\
-\xcc\x37\xc0\xb7\xc8\xb7\xcb\x4f\xc3\x6f\x9e\x5f\x85\xdf\x43\x7f\
-\x23\xff\x64\xff\x7a\xff\xd1\x00\xa7\x80\x25\x01\x67\x03\x89\x81\
-\x41\x81\x5b\x02\xfb\xf8\x7a\x7c\x21\xbf\x8e\x3f\x3a\xdb\x65\xf6\
-\xb2\xd9\xed\x41\x8c\xa0\xb9\x41\x15\x41\x8f\x82\xad\x82\xe5\xc1\
-\xad\x21\x68\xc8\xec\x90\xad\x21\xf7\xe7\x98\xce\x91\xce\x69\x0e\
-\x85\x50\x7e\xe8\xd6\xd0\x07\x61\xe6\x61\x8b\xc3\x7e\x0c\x27\x85\
-\x87\x85\x57\x86\x3f\x8e\x70\x88\x58\x1a\xd1\x31\x97\x35\x77\xd1\
-\xdc\x43\x73\xdf\x44\xfa\x44\x96\x44\xde\x9b\x67\x31\x4f\x39\xaf\
-\x2d\x4a\x35\x2a\x3e\xaa\x2e\x6a\x3c\xda\x37\xba\x34\xba\x3f\xc6\
-\x2e\x66\x59\xcc\xd5\x58\x9d\x58\x49\x6c\x4b\x1c\x39\x2e\x2a\xae\
-\x36\x6e\x6c\xbe\xdf\xfc\xed\xf3\x87\xe2\x9d\xe2\x0b\xe3\x7b\x17\
-\x98\x2f\xc8\x5d\x70\x79\xa1\xce\xc2\xf4\x85\xa7\x16\xa9\x2e\x12\
-\x2c\x3a\x96\x40\x4c\x88\x4e\x38\x94\xf0\x41\x10\x2a\xa8\x16\x8c\
-\x25\xf2\x13\x77\x25\x8e\x0a\x79\xc2\x1d\xc2\x67\x22\x2f\xd1\x36\
-\xd1\x88\xd8\x43\x5c\x2a\x1e\x4e\xf2\x48\x2a\x4d\x7a\x92\xec\x91\
-\xbc\x35\x79\x24\xc5\x33\xa5\x2c\xe5\xb9\x84\x27\xa9\x90\xbc\x4c\
-\x0d\x4c\xdd\x9b\x3a\x9e\x16\x9a\x76\x20\x6d\x32\x3d\x3a\xbd\x31\
-\x83\x92\x91\x90\x71\x42\xaa\x21\x4d\x93\xb6\x67\xea\x67\xe6\x66\
-\x76\xcb\xac\x65\x85\xb2\xfe\xc5\x6e\x8b\xb7\x2f\x1e\x95\x07\xc9\
-\x6b\xb3\x90\xac\x05\x59\x2d\x0a\xb6\x42\xa6\xe8\x54\x5a\x28\xd7\
-\x2a\x07\xb2\x67\x65\x57\x66\xbf\xcd\x89\xca\x39\x96\xab\x9e\x2b\
-\xcd\xed\xcc\xb3\xca\xdb\x90\x37\x9c\xef\x9f\xff\xed\x12\xc2\x12\
-\xe1\x92\xb6\xa5\x86\x4b\x57\x2d\x1d\x58\xe6\xbd\xac\x6a\x39\xb2\
-\x3c\x71\x79\xdb\x0a\xe3\x15\x05\x2b\x86\x56\x06\xac\x3c\xb8\x8a\
-\xb6\x2a\x6d\xd5\x4f\xab\xed\x57\x97\xae\x7e\xbd\x26\x7a\x4d\x6b\
-\x81\x5e\xc1\xca\x82\xc1\xb5\x01\x6b\xeb\x0b\x55\x0a\xe5\x85\x7d\
-\xeb\xdc\xd7\xed\x5d\x4f\x58\x2f\x59\xdf\xb5\x61\xfa\x86\x9d\x1b\
-\x3e\x15\x89\x8a\xae\x14\xdb\x17\x97\x15\x7f\xd8\x28\xdc\x78\xe5\
-\x1b\x87\x6f\xca\xbf\x99\xdc\x94\xb4\xa9\xab\xc4\xb9\x64\xcf\x66\
-\xd2\x66\xe9\xe6\xde\x2d\x9e\x5b\x0e\x96\xaa\x97\xe6\x97\x0e\x6e\
-\x0d\xd9\xda\xb4\x0d\xdf\x56\xb4\xed\xf5\xf6\x45\xdb\x2f\x97\xcd\
-\x28\xdb\xbb\x83\xb6\x43\xb9\xa3\xbf\x3c\xb8\xbc\x65\xa7\xc9\xce\
-\xcd\x3b\x3f\x54\xa4\x54\xf4\x54\xfa\x54\x36\xee\xd2\xdd\xb5\x61\
-\xd7\xf8\x6e\xd1\xee\x1b\x7b\xbc\xf6\x34\xec\xd5\xdb\x5b\xbc\xf7\
-\xfd\x3e\xc9\xbe\xdb\x55\x01\x55\x4d\xd5\x66\xd5\x65\xfb\x49\xfb\
-\xb3\xf7\x3f\xae\x89\xaa\xe9\xf8\x96\xfb\x6d\x5d\xad\x4e\x6d\x71\
-\xed\xc7\x03\xd2\x03\xfd\x07\x23\x0e\xb6\xd7\xb9\xd4\xd5\x1d\xd2\
-\x3d\x54\x52\x8f\xd6\x2b\xeb\x47\x0e\xc7\x1f\xbe\xfe\x9d\xef\x77\
-\x2d\x0d\x36\x0d\x55\x8d\x9c\xc6\xe2\x23\x70\x44\x79\xe4\xe9\xf7\
-\x09\xdf\xf7\x1e\x0d\x3a\xda\x76\x8c\x7b\xac\xe1\x07\xd3\x1f\x76\
-\x1d\x67\x1d\x2f\x6a\x42\x9a\xf2\x9a\x46\x9b\x53\x9a\xfb\x5b\x62\
-\x5b\xba\x4f\xcc\x3e\xd1\xd6\xea\xde\x7a\xfc\x47\xdb\x1f\x0f\x9c\
-\x34\x3c\x59\x79\x4a\xf3\x54\xc9\x69\xda\xe9\x82\xd3\x93\x67\xf2\
-\xcf\x8c\x9d\x95\x9d\x7d\x7e\x2e\xf9\xdc\x60\xdb\xa2\xb6\x7b\xe7\
-\x63\xce\xdf\x6a\x0f\x6f\xef\xba\x10\x74\xe1\xd2\x45\xff\x8b\xe7\
-\x3b\xbc\x3b\xce\x5c\xf2\xb8\x74\xf2\xb2\xdb\xe5\x13\x57\xb8\x57\
-\x9a\xaf\x3a\x5f\x6d\xea\x74\xea\x3c\xfe\x93\xd3\x4f\xc7\xbb\x9c\
-\xbb\x9a\xae\xb9\x5c\x6b\xb9\xee\x7a\xbd\xb5\x7b\x66\xf7\xe9\x1b\
-\x9e\x37\xce\xdd\xf4\xbd\x79\xf1\x16\xff\xd6\xd5\x9e\x39\x3d\xdd\
-\xbd\xf3\x7a\x6f\xf7\xc5\xf7\xf5\xdf\x16\xdd\x7e\x72\x27\xfd\xce\
-\xcb\xbb\xd9\x77\x27\xee\xad\xbc\x4f\xbc\x5f\xf4\x40\xed\x41\xd9\
-\x43\xdd\x87\xd5\x3f\x5b\xfe\xdc\xd8\xef\xdc\x7f\x6a\xc0\x77\xa0\
-\xf3\xd1\xdc\x47\xf7\x06\x85\x83\xcf\xfe\x91\xf5\x8f\x0f\x43\x05\
-\x8f\x99\x8f\xcb\x86\x0d\x86\xeb\x9e\x38\x3e\x39\x39\xe2\x3f\x72\
-\xfd\xe9\xfc\xa7\x43\xcf\x64\xcf\x26\x9e\x17\xfe\xa2\xfe\xcb\xae\
-\x17\x16\x2f\x7e\xf8\xd5\xeb\xd7\xce\xd1\x98\xd1\xa1\x97\xf2\x97\
-\x93\xbf\x6d\x7c\xa5\xfd\xea\xc0\xeb\x19\xaf\xdb\xc6\xc2\xc6\x1e\
-\xbe\xc9\x78\x33\x31\x5e\xf4\x56\xfb\xed\xc1\x77\xdc\x77\x1d\xef\
-\xa3\xdf\x0f\x4f\xe4\x7c\x20\x7f\x28\xff\x68\xf9\xb1\xf5\x53\xd0\
-\xa7\xfb\x93\x19\x93\x93\xff\x04\x03\x98\xf3\xfc\x63\x33\x2d\xdb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8e\x7c\xfb\x51\x93\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\
-\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\xb4\xb2\
-\x49\x44\x41\x54\x78\xda\xec\xfd\x77\xb8\x6c\xe9\x55\x1e\x88\xbf\
-\xeb\xfb\x76\x55\x9d\x78\x73\xbe\xb7\xfb\x76\x0e\x6a\xa9\x5b\x52\
-\x2b\x27\x04\x08\x90\x90\x84\x00\x0b\x4c\xf8\x19\xdb\x80\xf1\xd8\
-\xc6\x11\xa7\x61\xb0\x71\x1e\xfb\x71\x18\xe7\x80\xc7\xf6\x78\x3c\
-\x36\x1e\x47\xcc\x60\x93\x0c\x36\x19\x81\x08\x12\xa8\x25\xa1\x56\
-\xab\xb3\x3a\xde\x78\x42\xd5\xde\xfb\x5b\xeb\xf7\xc7\x5a\x5f\xd8\
-\xbb\x76\x9d\x7b\x1b\xa9\xc3\x6d\xea\xbb\x4f\x3d\xe7\x9c\x3a\x75\
-\xea\xd6\xa9\xb3\x57\x7a\xd7\xbb\xde\x45\x22\x82\xe7\xeb\xd0\x17\
-\xfe\x79\x2c\xcf\x0b\x7a\x26\x00\x4e\x01\x38\x04\xe0\x20\x80\xd3\
-\x00\xce\xd8\xd7\x0c\x60\xdd\xee\x6f\x01\x3c\x65\x3f\xb3\x0b\xe0\
-\x59\x00\x4f\x02\x78\x1c\xc0\x05\x00\xe7\xed\xeb\xe9\xf2\x2d\x7d\
-\x69\x1c\xf9\x1f\xdf\xfd\xbc\x3c\x6f\xb5\x7c\x6b\xaf\xe9\x33\x36\
-\x83\xbf\x13\xc0\x5d\x00\xee\x00\x70\xab\x19\xfd\x61\x00\x2b\xe6\
-\x14\xae\x74\x18\xc0\xcc\x6e\x4f\x99\x23\x78\x00\xc0\x27\x01\xfc\
-\x86\x7d\x7c\x08\xc0\xce\xf2\x2d\x7f\x79\x9d\xa5\x03\xb8\xf6\xce\
-\x19\x00\x6f\x05\xf0\x16\x00\xef\x30\x83\x5f\xff\x1c\x9f\xd3\x01\
-\x58\xb5\xdb\x01\x00\xb7\x01\x78\x67\xf1\xfd\xa9\x39\x85\x5f\xb2\
-\xdb\xcf\x02\xf8\x15\x00\x5b\xcb\x3f\xc7\xd2\x01\x2c\xcf\xf3\x7f\
-\xae\x03\xf0\x5e\x00\x5f\x69\x86\xbf\xf9\x02\xff\xff\x2b\x00\x6e\
-\xb2\xdb\xd7\x58\xc6\xf0\x30\x80\x1f\x07\xf0\x93\xf6\xf1\x91\xe5\
-\x9f\x69\xe9\x00\x96\xe7\xf3\x77\xd6\x01\xbc\x1f\xc0\x57\x01\xf8\
-\x52\x8b\xcc\x9f\x43\x11\x79\x05\xac\x87\xe8\xb9\x66\x0c\x37\x00\
-\xf8\x66\xbb\x5d\x34\x27\xf0\x5f\x00\xfc\x90\xe1\x07\xcb\xb3\x74\
-\x00\xcb\xf3\x9b\x38\xa7\x00\xfc\x4e\x00\xdf\x64\x35\xfd\x73\x37\
-\x72\x11\xbd\x31\x03\x02\xc0\x39\xbd\x11\x0d\x1b\xba\x08\x10\x04\
-\x10\xd6\x5b\x7c\x1c\x39\x80\xae\xca\x39\xec\x37\x47\xf5\x55\x00\
-\x9e\x01\xf0\x03\x00\xfe\x15\x80\x9f\x00\x10\x96\x7f\xd2\xa5\x03\
-\x58\x9e\xab\xab\xed\x7f\x3f\x80\xdf\x05\xe0\xe4\x55\x1b\xbc\x00\
-\xe0\x00\xb0\x00\xd5\x08\x18\x79\x60\x3c\x02\xd6\x37\x80\xf5\x35\
-\x60\xdf\x2a\x30\x99\x00\xe3\x31\x30\x1a\xa9\x23\x80\xfd\x5c\xfc\
-\xd8\xb6\xc0\xac\x06\x9a\x06\xd8\xdd\x05\xb6\xa6\xc0\xf6\x8e\x7e\
-\xde\xb4\x40\x08\xfa\x7f\x90\x03\x1c\x5d\xc9\x21\x1c\xb1\xdf\xe1\
-\x77\x01\xf8\x39\x00\xff\x17\x80\xff\xd7\xb2\x84\xe5\x59\x3a\x80\
-\xe5\xe9\x9d\x55\x00\xdf\x06\xe0\x3b\xac\xd6\xbf\xb2\xd1\x33\x03\
-\x81\x81\xaa\x02\x26\x63\xe0\xe0\x01\xe0\xd8\x21\xe0\xd0\x21\x60\
-\xff\x1a\xb0\x3a\x06\x9c\x07\xbc\x45\x7e\x61\x8d\xf0\x2c\xfa\x73\
-\xcc\xf1\xc9\xd4\x01\x10\x65\x87\x40\xb0\xc7\x05\x75\x0c\xdb\x53\
-\xe0\xf2\x0e\x70\xe1\x02\x70\xee\x12\x70\x79\x4b\xef\xe7\x90\x33\
-\x8b\xc5\xe7\xcd\x76\xfb\xe3\x00\xfe\x19\x80\x7f\x09\xe0\x89\xe5\
-\x9f\x7c\xe9\x00\x96\x47\xcf\x07\x01\x7c\x27\x80\xd7\x5c\xf1\x91\
-\xcc\x6a\x94\xbe\x02\x0e\x1e\x04\x4e\x1f\x07\x8e\x1e\x02\x8e\x1e\
-\x00\x56\x26\x1a\xf9\x03\x03\xad\x19\xb8\x03\x56\x3c\x70\x72\xd5\
-\xe3\xd4\xda\x0a\x8e\xae\x56\x38\x38\xf6\xd8\x57\x39\xac\x7a\x87\
-\x91\x27\xb0\x08\x66\x2d\x63\xbb\x61\x5c\x98\xb6\x78\x76\xb7\xc6\
-\x93\xdb\x0d\x1e\xd9\x9a\xe1\xe2\x4c\x10\xd8\x03\x6b\xab\xc0\xc6\
-\x3a\x70\xea\xa8\x66\x03\xbb\x33\xe0\xc2\x25\xe0\xdc\x05\xe0\xd9\
-\xf3\xc0\xce\x8e\x3a\x0c\xef\xf6\xca\x0c\x6e\x05\xf0\x57\x01\xfc\
-\x01\x00\x7f\x1f\xc0\xf7\x40\xf9\x06\xcb\xb3\x74\x00\xbf\x25\xcf\
-\x2b\xcc\x20\xde\x7f\xc5\x68\x1f\x02\x00\x52\x23\x3c\x7d\x02\xb8\
-\xfe\x14\x70\xe2\x10\xb0\x32\xd6\xef\x37\xad\x1a\x3e\x09\x6e\xdc\
-\x9c\xe0\xd5\x87\x56\xf1\xba\x23\x6b\x78\xe5\xc1\x15\xdc\xb8\x39\
-\xc1\x99\xf5\x31\x56\x2b\x87\xb1\x23\xb8\x2b\x94\xf2\x4d\x10\xd4\
-\x2c\x38\x37\x6b\xf0\x99\x8b\x53\x7c\xfa\xfc\x14\xbf\xf0\xc4\x65\
-\x7c\xf4\xc9\xcb\xf8\xe8\xd3\x5b\xd8\x9a\xb1\x96\x11\xa7\x8f\xaa\
-\x43\x98\xce\x80\xa7\x2f\x00\x4f\x3f\x03\x9c\xbb\x08\xd4\x33\x75\
-\x02\x8b\xb3\x82\xeb\x00\xfc\x35\x00\xbf\xdb\x7e\xff\x7f\xb9\xbc\
-\x14\x5e\xdc\x43\x4b\x26\xe0\x0b\x7e\xfe\x20\x80\xef\x86\x12\x75\
-\x16\x1b\x7e\x1b\x00\xef\x81\xe3\x47\x81\x5b\xcf\x02\x67\x8e\x01\
-\xeb\xab\x9a\xa6\x37\x01\x08\x0c\xaa\x1c\x5e\x7b\x78\x15\x5f\x7c\
-\x6a\x1f\xbe\xf8\xd4\x06\xee\x3e\xb4\x8a\x23\x2b\x15\x2a\x8b\xc4\
-\x2c\x40\x2b\x62\x50\x81\xa4\xa7\x1e\xfc\x5b\x11\x40\x20\x10\xb4\
-\xcc\xaf\x0a\x6f\xb1\xd3\x04\x7c\xfa\xc2\x2e\x3e\xf4\xf8\x25\xfc\
-\xe0\xa7\x9f\xc5\x4f\x3d\x7c\x1e\x4f\x5f\xd8\xd5\x66\xe0\xd8\xeb\
-\x7f\xb4\x33\x05\x9e\x7e\x16\x78\xe2\x29\x60\x6b\x5b\x7f\x70\xef\
-\xf2\x00\x00\x7e\x18\xc0\x9f\x01\xf0\x8b\xcb\xcb\xe2\x0a\x95\xdf\
-\xf3\xc4\x04\x5c\x3a\x80\x17\xee\x9c\x05\xf0\xb7\x00\x7c\xf5\x1e\
-\x7f\x66\x33\xfc\x0a\xb8\xee\x14\x70\xc7\x8d\xc0\xc9\x23\x96\xde\
-\x07\x4b\xef\x05\x27\x37\xc7\x78\xff\xf5\x07\xf0\xdb\x6e\x38\x80\
-\x37\x1c\x5d\xc3\x81\xb1\x87\x00\xa8\x83\x20\x88\x9a\xba\xec\xf1\
-\x5f\x5c\xe1\x52\xeb\xfe\x0d\xcd\x21\x8c\x9c\x43\xe5\x08\x2d\x0b\
-\x1e\xb8\xb0\x8b\x1f\xfe\xf4\xb3\xf8\xf7\xbf\xfe\x59\xfc\xd4\x43\
-\xe7\x81\xba\x05\x46\x4e\x71\x87\xba\x01\x9e\x39\x0f\x7c\xf6\x49\
-\xe0\xe2\xa5\xab\x71\x04\x3b\x00\xfe\x77\xcb\x08\xda\xe5\x65\xb2\
-\x74\x00\x2f\xc7\xf3\xa5\x00\xfe\x21\x80\x9b\x17\x3e\x22\xa6\xfa\
-\x67\x4e\x02\xaf\xba\x0d\x38\x75\x44\xbb\xed\xad\x01\x7e\x02\xdc\
-\x76\x68\x05\xdf\x74\xcb\x61\x7c\xcd\x8d\x07\x70\xf3\xc6\x18\x42\
-\xc0\x2c\x1a\xbd\xf4\x4a\xf0\xcf\xe7\x9f\xd5\x9c\x4a\xec\x08\x8e\
-\x9c\xc3\xd8\x13\xb6\xea\x80\x9f\x7c\xe8\x3c\xfe\xd9\x2f\x3f\x82\
-\xff\xf6\x89\x27\x51\xef\x34\x40\x65\xc0\x60\x1b\x14\x23\x78\xec\
-\x09\xcd\x08\xae\xdc\x3d\xf8\x9f\x00\xfe\x10\x80\x5f\x5b\x5e\x2e\
-\x4b\x07\xf0\x72\x3a\xdf\x61\x11\x6e\x34\xf8\xdd\x88\xe8\x1f\x3e\
-\x04\xdc\x73\x07\x70\xd3\x29\x05\xd4\x82\xb5\xf6\x82\xe0\xba\xfd\
-\x13\xfc\xde\x3b\x8e\xe0\x1b\x6e\x3a\x88\x33\xeb\x23\xd4\x56\xab\
-\x8b\x59\x25\x5d\x55\xa4\x8f\x26\x7c\x15\x1e\x42\xf6\xce\x10\xa2\
-\xb3\x71\x20\xac\x54\x0e\x0d\x0b\x7e\xe6\xe1\x73\xf8\xfb\x3f\xfb\
-\x19\xfc\xc0\xc7\x3e\xab\x25\xca\xc8\xeb\x83\xea\xa0\x18\xc1\x13\
-\x4f\x69\xab\xd1\xef\x99\x0d\x3c\x0d\xe0\x8f\x00\xf8\x37\xcb\xcb\
-\xe6\x85\x71\x00\x4b\x10\xf0\xf9\x3b\x2b\x00\xfe\x0e\xb4\xc5\x37\
-\x7c\xda\x16\x18\x8d\x81\xbb\x6f\x05\x5e\x75\x2b\xb0\x36\xd1\xfb\
-\x5a\xad\xf1\x57\xc6\x1e\xbf\xf3\x8e\x43\xf8\x83\xaf\x38\x8a\x9b\
-\xf7\x8d\x31\x6b\x05\x17\xeb\xd0\x8d\xf6\xf2\x5c\x8c\xf8\x6a\x8c\
-\x5e\xf6\x2e\x0f\x84\x52\x56\xd0\x42\x50\xcf\x18\x8e\x80\xb7\x9f\
-\x3d\x84\x37\x9e\x39\x80\x1f\xf8\xf8\x29\xfc\xf5\xff\xf1\x1b\xf8\
-\xe8\x83\xe7\x80\x8a\x34\xf2\x1f\x3f\x0a\xec\xdf\x04\x1e\x7f\x12\
-\x38\x77\x3e\x83\x0e\xf3\xe7\x28\x80\x7f\x0d\xe0\x55\x00\xbe\x0b\
-\x4b\x12\xd1\xf3\x7e\x96\x0e\xe0\xf9\x39\x07\xa1\x04\x98\xaf\x58\
-\x94\x52\xa3\x6d\x81\x13\xc7\x81\x37\xdc\x0d\x9c\x3c\xac\x7d\xf5\
-\xb6\x35\x62\x0f\xe3\x9e\x63\xeb\xf8\xee\x57\x9f\xc0\x17\x9f\xdc\
-\x44\x10\xc1\xc5\x9a\xaf\xce\xf0\xcb\xff\x63\xae\x9a\x97\xe7\x1c\
-\xed\x87\x33\x09\xcb\x26\x8c\x3b\x10\x04\x68\xa6\x2d\xbc\x23\x7c\
-\xd5\x5d\x27\xf0\xa6\xeb\x0f\xe2\xef\xfd\xe4\xfd\xf8\x9e\x9f\xfd\
-\x34\xa6\xbb\x8d\x3a\x82\x51\x05\x5c\x7f\x1a\xd8\x5c\x57\x7c\x60\
-\xba\x67\x36\xf0\xa7\xa1\x03\x49\xdf\x82\x65\xbb\x70\xe9\x00\xae\
-\xb1\x73\x06\xc0\xf7\x02\x78\xdb\xc2\x5a\x9f\x3c\xf0\xaa\x57\x00\
-\xf7\xde\x01\xac\x8c\xd4\xf0\x01\x4d\xf9\x1d\xe1\x9b\xef\x3c\x8a\
-\x3f\xf9\xca\xa3\x38\xb1\x3a\xc2\x76\x1b\xc0\xcf\xc5\xf0\x17\x1a\
-\xb7\x0c\x38\x08\x5a\xfc\x84\x8b\x7e\x76\x2e\x53\xc8\x4e\x82\x5b\
-\xc1\x85\x36\x60\xff\x4a\x85\x3f\xf7\xee\x3b\xf1\xa6\xb3\x87\xf0\
-\x5d\x3f\xf0\x11\x3c\xf0\xf8\x05\xa0\xb2\x92\x60\xff\xa6\x32\x13\
-\x3f\xfb\x24\x70\xe9\x72\xa6\x1b\xcf\x9f\xaf\x06\x70\x0c\xc0\x37\
-\x60\x39\x68\xb4\x74\x00\xd7\xc8\xb9\x11\x3a\x10\xf3\xaa\x85\x29\
-\xff\xea\x1a\xf0\xe6\x57\x03\xb7\x5c\x07\x48\xd0\x74\xdf\x8c\x7f\
-\xff\x4a\x85\xef\xbc\xe7\x04\x7e\xd7\xcd\x07\xc1\x16\xf5\x3b\xc1\
-\xfb\x6a\x8c\x9f\x9e\xab\x13\xb8\x52\xd4\x8f\xd1\x5e\xba\x50\x82\
-\x14\xcf\x41\x5d\xc7\xb0\x5b\x07\x10\x01\x5f\x76\xc7\x71\xdc\x74\
-\xf8\xcd\xf8\xce\xef\xff\x55\xfc\xf8\xaf\x3d\xae\x00\x21\x43\x23\
-\xff\xa9\x13\xca\x62\x7c\xe6\x3c\xe6\x11\xcc\x74\xde\x06\x1d\x2e\
-\xfa\x00\x80\xfb\x97\x97\xd7\xd2\x01\xbc\x94\xcf\xf5\x00\xbe\x1f\
-\xc0\x2b\x07\xbf\xdb\x34\xc0\xd1\xa3\xc0\xdb\x5f\x0b\x1c\x3f\xa8\
-\x04\x9e\x58\x0b\x07\xc6\xc9\xcd\x31\xfe\xc6\xeb\x4e\xe1\x5d\x27\
-\x37\xb1\x1b\x18\x5c\x62\x76\x72\x25\x4b\x97\xc5\x29\xbd\x2c\xaa\
-\xf3\x0b\xab\x95\x2b\x94\x10\x22\xdd\x27\x60\x2c\xfe\xba\x78\xea\
-\x8b\xbb\x0d\xae\x3f\xb8\x86\x7f\xf0\xb5\xaf\xc7\x5f\xdc\xfc\x28\
-\xfe\xcd\x4f\xdf\x1f\x09\x07\xfa\x9c\x87\xf6\x2b\x58\xf8\xf4\x39\
-\x75\x84\xc3\x4e\xe0\x15\xd0\xe1\xa2\xf7\x02\xf8\xf4\xf2\x32\x5b\
-\x3a\x80\x97\xe2\x39\x0d\xe0\xfb\x16\x1b\x7f\x0b\x5c\x77\x06\x78\
-\xc7\xbd\xc0\xc6\xca\x9c\xf1\x5f\xbf\x7f\x05\xff\xe0\x4d\x67\xf0\
-\xda\x43\x2b\xb8\xd4\x30\xa4\x8f\xd8\xcb\x50\x74\xbf\x42\xea\x3e\
-\xe4\x3c\x3a\xd1\x5a\xba\x8e\x40\xf6\x28\x0f\xa4\xc8\x02\x7a\xd1\
-\xbe\x93\x09\xf4\x61\x02\x08\xb6\xa6\x01\xab\x23\x8f\xbf\xf4\xbe\
-\x7b\xb0\x31\xf2\xf8\x9e\x1f\xfd\x98\xb5\x04\xed\x67\xd6\x57\x01\
-\x3a\x04\x3c\x7d\x5e\xdf\x97\x61\x27\x70\xbb\x39\x81\x2f\x07\xf0\
-\x99\xe5\xe5\xb6\x74\x00\x2f\xa5\x73\x00\xc0\x7f\xc0\x20\x9f\xdf\
-\x58\x7b\xb7\xdc\x08\xbc\xfd\x35\x1a\xed\xda\x90\x1b\xea\x2c\x38\
-\xb3\x6f\x82\x7f\xf4\xa6\xd3\x78\xd5\x41\x35\xfe\x1c\xe0\xc5\x22\
-\x2b\x5d\x21\x13\x58\x70\x58\xba\xe5\x43\x69\xdc\x42\x0b\x22\x3d\
-\x7a\x46\x3f\xf0\x35\xcb\x70\xb9\x20\x0b\xee\x87\x60\xb7\x6e\x51\
-\x39\x87\x3f\xfd\x65\xaf\x84\x04\xc6\x3f\xfd\xd1\x5f\x07\x3c\x65\
-\x4c\x64\xe4\x80\xa3\xfb\x81\x67\x2e\x29\x91\x68\xd8\x09\xdc\x01\
-\xe0\x3f\x02\xf8\x32\x68\xbb\x70\x79\x96\x0e\xe0\x45\x3f\x23\x00\
-\xff\x1c\xc0\x9b\x86\x23\x7f\x00\xee\xb8\x15\x78\xeb\xdd\x1a\xf5\
-\x02\x77\x8c\xff\xe8\xfa\x08\x7f\xf3\xf5\xa7\xf1\x8a\xfd\x2b\xb8\
-\x58\x2f\x4a\x81\xe5\xea\x5a\xf8\xb4\x47\xda\xdf\x07\xee\xca\x7a\
-\x1e\xc3\x91\x3b\xb5\xfc\x48\xe6\x23\x7e\xc7\x51\xf4\x4b\x01\x19\
-\xc4\x1a\xda\xc0\xa8\x1c\xe1\x3b\xbe\xf4\x2e\x5c\xde\x99\xe1\xdf\
-\xfe\xe4\xc7\xd5\x09\x90\x39\x01\x07\xe0\xd0\x1a\x70\x7e\x1b\x98\
-\x2d\xcc\x04\x5e\x03\xe0\xff\x81\xea\x0e\x2c\xf5\x09\x97\x0e\xe0\
-\x45\x3f\x7f\xdd\x2e\xc6\xf9\x53\xb7\xc0\x9d\xb7\x00\x6f\xbb\x27\
-\x47\xce\x24\xae\x21\x58\x19\x7b\x7c\xd7\x3d\xc7\xf1\x9a\x83\x2b\
-\xb8\xd8\xb2\xd9\x64\x11\xb5\x39\x1a\x35\x75\xcb\xf6\x45\x47\x86\
-\x9c\x43\xb7\x26\xcf\x9f\xcb\x3c\x26\x90\xf4\x01\x7a\xa9\x3f\x97\
-\xe0\x5f\xd4\x1f\xb0\xcf\x53\x46\x31\xe0\x60\x64\x1e\x4f\x68\x03\
-\x63\xe4\x09\x7f\xec\xdd\xaf\xc2\x13\xe7\x2f\xe3\x7f\xfe\xca\x83\
-\x36\x4b\xc0\xfa\xa4\x04\x60\xff\x0a\x70\x7e\x07\x68\x64\xd1\xef\
-\xfb\xa5\x00\xfe\x1e\xb4\x45\xb8\x3c\x4b\x07\xf0\xa2\x9d\x6f\x03\
-\xf0\x87\x17\xd6\xfc\xb7\xde\x00\xbc\xf5\x9e\xae\x11\x26\x00\x0c\
-\xf8\xb6\xdb\x0f\xe3\x5d\x27\x36\x71\xa9\x65\xb5\x15\x42\x41\xb2\
-\x41\xb7\x56\x8f\x8e\x60\x10\x0b\xd8\xc3\xf0\x53\x39\x50\xdc\xcf\
-\x43\xd1\xbc\x7c\x0e\xd6\xd7\x91\xea\xfd\xc2\x01\x24\x01\x92\xf8\
-\x9a\x24\x47\xfd\xbe\x73\x29\xbf\x57\x7c\x68\x03\x63\x65\xe4\xf1\
-\xa7\xde\xfb\x1a\x3c\xf8\xe4\x79\x3c\xf8\x98\x11\x86\x44\x94\x0b\
-\x21\x02\xec\x1b\x01\x97\x9a\xbd\x9c\xc0\x37\x03\xf8\x38\x80\xbf\
-\xb1\xbc\x0c\x3f\xb7\xe3\x96\x6f\xc1\x6f\xea\xdc\xbb\xf0\xe2\x6b\
-\x1a\xe0\xcc\x29\xe0\xad\xaf\xd5\xb4\x3f\x45\x7e\xbb\x05\xc6\x3b\
-\x4f\xef\xc3\x37\xde\x78\x00\xdb\x2d\xa3\x11\x41\x2b\x4a\xf9\x6f\
-\x8d\x5d\xd7\x02\x7a\x9f\x20\x7f\x0e\xc9\xb7\xf8\x33\xe5\xad\xf3\
-\x7d\xf4\x9e\xa3\xb8\xdf\x26\x04\x5b\x06\x5a\x8e\xcf\x25\xf9\x73\
-\x06\x5a\x61\xfd\x3c\xd8\xd7\xc1\xbe\xcf\x76\x9f\x08\x5a\xe6\xe2\
-\x73\xfb\x18\xec\xbe\xf8\x31\x3e\x26\x08\x5a\x0e\x7a\x3f\x0b\xb6\
-\xa7\x35\x4e\x1d\x5c\xc7\x77\x7c\xf9\xab\x31\x99\xf8\x2c\x30\xc2\
-\x0c\x70\xab\x4e\x60\x8d\x00\xbf\x27\xee\xf1\x97\x01\x7c\xd1\xf2\
-\x52\x5c\x66\x00\x2f\x06\xe8\xf7\xcf\x31\xa4\xcc\xdb\xb6\xc0\x91\
-\xc3\x8a\xf6\x8f\x9d\xd6\xfc\x71\xac\x96\x34\xca\x1d\xd9\x98\xe0\
-\xf7\xdf\x7a\x18\x04\x60\x96\x9c\x83\x74\x23\x7c\x19\xf5\xfb\x11\
-\xfe\x4a\xf2\x7c\x43\x7d\x7f\xe9\x81\x7c\xfd\xc8\xcf\x03\x38\x80\
-\xf4\x4b\x83\x18\xd5\x8b\xcc\x40\x8a\xac\x01\x45\x69\x20\x03\x99\
-\x43\xc2\x15\xf4\x76\x79\xb7\xc6\x9b\x6f\x39\x89\xaf\x7d\xcb\x6d\
-\xf8\x57\x3f\xf2\xab\x6a\xec\x80\x39\x01\x7b\xec\x2a\x03\x3b\x6e\
-\x91\x13\x18\x03\xf8\x27\x50\xc5\xa1\x67\x96\x97\xe5\xd2\x01\xbc\
-\x50\xe7\xaf\x00\xb8\x7b\xee\x5e\x66\x60\x65\x45\x23\xff\xc6\x4a\
-\xb7\xaf\x4d\x19\xa9\xfb\x1d\x37\x1d\xc4\xd9\xcd\x31\xb6\x5b\xce\
-\x69\x7f\xac\xaf\xe3\xd7\x54\xd6\xdc\x74\x65\xa3\x1f\xea\xe7\x0b\
-\xf6\x30\xfe\x81\xb4\x3e\x1a\x27\x28\x1b\x60\x89\xf0\x97\x82\xa3\
-\xdc\x4f\xff\xa5\x0b\x04\x4a\x1f\x6c\xe4\x9e\x23\x41\x12\x20\xfd\
-\xba\x37\xdf\x8e\x9f\xbe\xef\x21\x7c\xe6\x91\xa7\x95\x20\xc4\x6c\
-\x3f\xa7\x22\x27\x18\xb7\xc0\x6c\xe1\x65\x7a\x0b\x74\xd0\xea\xf7\
-\x2c\x2f\xcb\xa5\x03\x78\x21\xce\x97\x01\xf8\xbd\xf3\xf6\x67\x17\
-\xf6\xeb\x5e\xa5\x6a\x3d\xa9\xcf\x8f\x1c\xfd\x59\xf0\x8a\x23\x6b\
-\xf8\xd2\x53\x1b\xd8\x6e\x58\xa7\x5c\x4a\xc3\x8f\x19\xc0\x55\xab\
-\x73\x5f\x81\xca\x3b\xf4\x78\xe9\x01\x74\x1d\xc3\x8e\x37\xee\x7e\
-\xde\x89\xe2\x43\x3f\x53\x38\x00\x19\xc8\x18\xa4\xe7\x74\xa2\xf1\
-\x43\xd0\x06\xe0\xc0\xda\x04\xdf\xf0\xd6\x3b\xf1\x97\xff\xed\x53\
-\x36\x12\x6d\x80\xa0\x58\x26\xe0\x18\xa8\x04\x68\x47\x8b\x7e\xb1\
-\x6f\x01\xf0\x9f\x01\xfc\xb7\xe5\xe5\xb9\x74\x00\xcf\xe7\xd9\x0f\
-\xe0\x6f\x0f\xe2\x26\x4d\x0b\xdc\x79\x2b\x70\xfb\xd9\x2e\xc9\xa7\
-\xfc\xe8\x09\x1f\xbc\x7e\x3f\x56\xbd\xc3\x6e\x30\x63\x70\xd4\x8d\
-\xce\xa0\x6e\xd4\x97\xa2\x3c\x48\x0e\x85\x16\xd7\x04\x24\xc3\x53\
-\x7d\x9d\xb4\xbe\x67\xfc\xd2\xcb\x04\x4a\x03\xee\x44\xf8\x9e\xc1\
-\x2f\x74\x02\x18\x70\x08\xfd\x2c\x40\x0a\xa2\x50\x8d\xb7\xdd\x7e\
-\x06\x77\xdf\x78\x1c\x1f\xfd\x8d\x47\x15\x10\x64\xce\x12\xe5\x02\
-\xc0\xd7\x00\x3b\x80\xab\x21\x87\x47\x50\xa1\x95\x9f\xc5\x72\x70\
-\x68\xe9\x00\x9e\xc7\xf3\xa7\x30\xa4\xd3\xdf\x06\xe0\xd8\x51\xe0\
-\x75\xaf\xc8\x17\x36\xf5\x2e\x4f\x8b\xfe\xf7\x1e\x5a\xc5\x56\x2b\
-\x60\x48\xaf\x35\x57\x18\x78\xc7\x19\xec\xf1\x6a\x88\x16\xd4\xfd\
-\x98\x37\xfc\xce\xe0\x4e\xd1\x09\x90\x01\xa3\x9e\xbb\xaf\x88\xde\
-\x5c\x66\x08\x7b\x18\xbc\x00\x40\xc8\x2d\x45\xb6\x1f\x4e\x18\x81\
-\xe4\xb2\x09\x82\xd5\x71\x85\xf7\xbd\xee\x56\x7c\xf4\xfe\xc7\x4c\
-\xfc\x84\x8b\xe7\xb2\xce\x80\xdb\x01\x64\x03\x10\x37\xf4\x0b\xdf\
-\x0e\xe0\x4f\x00\xf8\xdf\x96\x97\xe9\xd2\x01\x3c\x1f\xe7\x0e\xa8\
-\x5a\xcd\x7c\xea\x5f\x55\xc0\xeb\xef\x06\x56\x27\x99\xe5\x07\x9a\
-\x2b\x01\xde\x75\x62\x03\x63\x4f\x1a\xfd\x63\x94\x77\x92\x78\x01\
-\xb9\xff\xde\x37\x7c\x2b\x0d\xdc\x1e\x20\x20\x0d\x55\x05\x57\x1a\
-\xff\x95\x01\x43\xef\x7d\xcd\xdc\x75\x22\xdc\xc3\x02\x50\xf2\x04\
-\xa4\x8b\x1d\x48\x4e\xf5\x73\xc4\xb7\xb4\xbe\x93\x09\x08\x76\x66\
-\x35\xee\xb9\xf1\x38\x6e\x3a\x75\x08\x0f\x3c\xf8\x59\x63\x09\xc6\
-\xef\xc7\x72\x80\x01\xda\x06\x64\xe1\x56\xb4\x6f\x07\xf0\x2f\xb0\
-\x1c\x1a\x5a\x3a\x80\xe7\xe1\xfc\x79\x0c\x2d\xe0\x6c\x02\xf0\xca\
-\x5b\x80\x53\x87\x6d\xa4\x97\xe6\x8d\x92\x05\x47\x37\xc6\xb8\xe7\
-\xe0\x2a\x76\xac\x6d\x46\x65\xaa\x8f\xc2\x19\x80\x7a\x56\x5c\x7e\
-\xbc\x8a\x43\xc5\xd4\x1e\x0d\xa4\xff\x73\x0c\x41\xeb\xf9\x73\x0f\
-\xc0\xeb\xf7\xfc\x81\x6c\xdc\x5c\x02\x7b\x3d\x20\x30\x3e\x5f\xc4\
-\x0e\xb8\x87\x0f\x24\xe7\xc0\x9d\x32\xa2\x6d\x05\x6b\xe3\x0a\x6f\
-\xb9\xfd\x0c\x1e\xf8\xcc\x63\x99\x87\x10\x71\x80\xe4\x5c\x76\xed\
-\x92\x5d\x1d\x72\x6e\xfb\xa0\x12\xeb\xdf\xbc\xbc\x5c\x97\x0e\xe0\
-\xf3\x79\xde\x06\xd5\xef\xef\x9e\x10\x80\xfd\xfb\x54\xc9\x47\xb8\
-\x17\xf1\xbb\x06\x79\xcf\xc1\x55\xec\x1f\x3b\x4c\x83\x0c\x8f\xeb\
-\xba\xa1\x92\xbe\xef\x4c\x68\x20\xea\x53\x37\x9a\x77\xea\x08\x59\
-\xd0\x12\x2c\xea\xfb\x4e\x7a\xdf\x4b\xf9\x3b\x86\x57\x66\x03\xd2\
-\xfd\xfe\x5c\x26\xd1\x33\xfa\x94\x15\x70\xb7\x6d\x58\x3e\xce\x9c\
-\xc8\x3d\x37\x9e\xc0\x7f\x58\x5f\xc1\x74\x7b\xd7\xde\x93\xf8\x03\
-\x05\x26\x40\x5b\x00\x4d\x7a\x6f\x5a\x3a\xdf\x08\xd5\x5e\xfc\xf0\
-\xf2\xb2\x5d\x3a\x80\xcf\xd7\xf9\x13\x83\xc0\x9f\x40\x35\xfc\x36\
-\xd7\x94\xfc\x43\x34\x9c\x96\x3b\xc2\xdd\x07\x57\x12\x01\x27\x47\
-\xfb\xb2\x96\x2f\xa2\xbc\x14\x80\x5e\x62\x0f\x15\xcf\x39\xe4\x20\
-\x62\x46\x51\x1e\x1e\x28\x01\xca\xa9\xbe\xd2\x70\xcb\xc8\xcf\x5c\
-\x7c\xdd\x4b\xeb\x59\xe6\xef\xef\x97\x06\xcc\xdd\xc7\x50\xe9\x3c\
-\xb8\x87\x17\x64\x27\x10\x6a\xc1\x89\x03\xeb\xb8\xe9\xf8\x41\xdc\
-\xf7\xa9\x2d\x15\x0a\x49\x59\x00\x23\x73\x0d\x6a\xc0\x5d\x06\xe8\
-\xc0\x90\x03\x18\x03\xf8\x63\x50\x11\x91\xe5\x59\x3a\x80\xcf\xf9\
-\xbc\x15\x3a\x87\xde\x03\xfe\x5a\xe0\xd4\x49\xe0\x96\x33\x59\xcd\
-\x67\xa8\x30\x17\x60\xff\x4a\x85\xeb\xd6\x46\xd8\x0d\x9c\x05\xee\
-\x62\xef\x3f\x3a\x02\x29\x22\x39\xe1\x2a\x52\x7e\x1a\x18\xfe\xa1\
-\x6e\x1a\x41\x32\x30\xb4\x83\x81\xb6\x5f\x51\xb3\xb3\x0c\x47\xf9\
-\x32\x33\x08\x3c\x1f\xe1\xa5\x9f\x05\xf0\x7c\x46\x10\xef\x1f\x2c\
-\x03\x74\xdd\xd9\xca\xb8\xc2\x6d\x67\x8e\xe0\xbe\xdf\x78\xb8\xf8\
-\x3f\xb8\xc8\x5c\xec\x16\x2e\x03\xd5\x1a\x74\x16\x6b\xce\x09\x7c\
-\x35\x80\xbb\x00\x7c\x6c\x79\xf9\x2e\x1d\xc0\xe7\x7a\xbe\x1d\x99\
-\xa3\x96\x2f\x44\xe7\x81\xbb\x6e\x55\x99\xab\xa6\x9d\xaf\xc3\x29\
-\x3f\xf6\xba\xf5\x11\xd6\x47\x5e\x55\x7c\x93\x61\x8a\x45\xb8\x08\
-\xae\x15\x80\x60\xa7\x05\x88\xe1\xb4\x7f\xe8\x7e\x59\x84\xf6\xd1\
-\xbc\xd1\x73\x2f\xfd\x16\x99\x37\x7a\x2e\x6e\xd8\xe3\xbe\x32\x1b\
-\x60\xee\x39\x03\xee\x39\x05\x14\xe5\xc0\xbc\xb3\x68\xda\x80\x1b\
-\x8e\x1e\x50\xe5\xa0\xe8\x2c\x80\x1e\x86\x20\xda\x19\x08\x97\x00\
-\x7f\x64\xe8\x17\x9f\x00\xf8\x56\x00\x7f\x74\x79\xf9\x2e\x1d\xc0\
-\xe7\x72\x6e\xc1\xd0\xea\xae\x10\x80\xeb\x4e\x03\xa7\x8f\xe5\xe8\
-\x4f\x43\x41\x5b\x2f\xcc\x93\xab\x23\x10\x04\x35\x03\x12\xd3\x74\
-\x2e\x41\x3f\x64\x40\xb0\x1c\xa8\x21\x9a\xe7\x01\x5c\x21\x29\xe8\
-\x22\xfc\xd4\x45\xff\x86\x98\x81\xe5\xe7\xa5\x71\x27\x47\xc0\x5d\
-\x4c\x80\xa5\x07\xfe\x71\xf7\x67\xd1\xc3\x06\x78\xb1\xb1\x0f\x39\
-\x08\x61\xc6\x91\xfd\x6b\x58\x5b\x19\x61\x67\x7b\xd7\x7e\xf7\x98\
-\x05\x70\xb7\x74\x69\x2f\x03\x6e\x03\xa0\x15\x14\x13\x4e\xf1\x7c\
-\x3d\x74\x56\x60\x49\x11\x5e\x3a\x80\xdf\xf4\xf9\x26\x0c\x21\xff\
-\xce\x03\xb7\xdf\xa4\x79\xc1\x60\xf6\x5f\xd4\xee\x24\x38\xbe\x52\
-\xa1\x11\xa0\x66\x01\xb9\xc2\x5a\x59\x14\x59\x88\xc8\x7d\xfc\x58\
-\xf2\x02\x16\x3d\xf5\x73\x39\x73\xac\x3f\x19\x36\x6a\xc6\xc0\xd7\
-\x48\xbd\xfa\xec\x20\x78\x3e\x85\xe7\xb2\x6d\x58\xa4\xfa\xdc\x4f\
-\xf7\xfb\xce\x80\x3b\x20\x61\x08\xc0\xea\xb8\xc2\xe1\x7d\x6b\xd8\
-\xb9\xbc\x63\x8e\xb1\x78\x5c\xa7\xcc\x08\x40\x7b\x09\x18\x4f\x86\
-\xba\x9d\xc7\xa1\x3a\x82\xff\x6c\x79\x19\x2f\x1d\xc0\x6f\xe6\xac\
-\x02\xf8\xba\xc1\xe8\x7f\xec\x98\xae\xeb\x0a\xbc\xc0\x30\x8b\x7a\
-\xde\x39\x6c\x8c\x1c\x66\x36\x4d\x97\x4a\x04\x57\xa6\xe4\xf6\x78\
-\x96\xac\x92\xd3\x61\xe4\xd1\xd5\x19\xfd\x5c\x64\x97\xf9\xf6\x5f\
-\x87\xee\x5b\xa6\xf0\xe8\x46\xff\xd0\x77\x10\x43\xd9\xc1\x40\xd9\
-\x90\xb2\x03\xc9\x6b\xcc\x3b\xa5\x42\x11\xc9\xe3\xd7\x85\xb3\x20\
-\x12\x90\x00\xfb\x56\x27\x3a\x1d\x18\x65\xc3\x93\x81\x17\x34\xe1\
-\x98\x05\x54\x07\x00\x1a\xc4\x02\xbe\x6e\xe9\x00\x96\x0e\xe0\x37\
-\x7b\xde\x01\x5d\x69\x3d\x67\x64\x74\xf3\xf5\xc0\xb8\x82\x34\xed\
-\x15\x0c\x93\x50\x11\x30\xf1\x84\x3a\xe8\x88\x6f\xae\xf9\x51\xa0\
-\xff\x92\x35\xf2\x62\x4f\x3d\x76\xb8\xa8\x47\x15\xa6\xbd\x78\x01\
-\xb2\x40\xab\x0f\x03\x20\x5d\x0f\xe8\x0b\x45\x64\x1f\xc2\x00\xca\
-\x16\x60\xe8\x95\x01\x9d\x68\x8e\xc2\xb0\xfb\x69\x3e\xe7\xec\xa2\
-\x83\x17\x98\x51\xb3\x80\x20\xa8\x1c\x61\x6d\x52\xf5\x24\xc9\xfa\
-\xa5\x8c\x7d\x1e\x6a\xcb\x02\x8e\x0c\x29\x1c\xbf\x0d\xca\x10\xfc\
-\xe4\xf2\x72\x5e\x3a\x80\xe7\x7a\xe6\xfb\xfe\xcc\xc0\xe6\x86\x6e\
-\xe9\x6d\x43\xe6\xf1\xec\x71\x1c\x11\x46\x44\x68\x58\x10\x4a\x95\
-\x1f\x57\x10\x80\x4a\x14\x9e\x0a\xd0\x2e\x62\x02\xa5\xf1\xcb\x55\
-\xd4\x02\xe9\x67\x79\x7e\x02\x50\x7a\xad\xbf\x21\x00\xb0\x34\xfa\
-\x30\x50\xd3\x33\xcf\x67\x04\xfd\x9f\x17\x5e\x50\xfb\x73\x37\xf2\
-\x97\xe0\xa0\x51\x7e\x5d\xe5\x30\xae\xaa\xf9\x11\x62\x48\x77\xf4\
-\x38\x9e\xf6\x12\x30\x3a\x38\xf4\x7e\xac\x00\x78\xcf\xd2\x01\x2c\
-\x1d\xc0\x73\x3d\xfb\xec\xc2\xe9\xa5\xff\x0c\x3a\x7d\x12\x58\x2b\
-\x46\x7d\xcb\x56\xfd\x9c\x4d\x4a\xfa\xb2\x16\x06\x0b\xe5\xe1\x9f\
-\x58\xff\xf3\x02\xba\xae\xeb\x21\xf7\x25\x92\x3f\x8f\xf8\x75\xb3\
-\x04\x60\x9e\xc3\xdf\xa9\xd3\x8b\xc8\x9d\xa2\x7f\xaf\x0c\x98\x03\
-\xfc\xa4\xdb\x02\x4c\xa0\x1f\xf7\x70\x83\x7e\x59\xd0\x8b\xfe\xb0\
-\x9e\x7e\x2a\x0d\x0a\x0c\x80\x03\x60\x19\x80\x73\x6e\x01\x78\xd9\
-\xa3\x21\x03\x40\x98\x02\x61\x07\xa8\x36\x73\xcb\x30\x9f\xf7\x40\
-\x07\xb8\x96\x67\xe9\x00\xae\xfa\xbc\x09\x2a\xf3\xdd\x8d\xaa\x55\
-\x05\xba\xee\x64\xda\x94\x0b\x91\x79\x33\x2c\x01\x3d\xbb\x6a\x1b\
-\x53\xd2\xe1\x48\xf9\x23\x58\x8a\x6f\x29\x01\x97\x83\x40\x45\xf4\
-\x2f\xcb\x81\xe8\x2c\x92\xb2\xd0\xc0\x22\x0d\x19\x22\xeb\x60\x9e\
-\xdd\xc7\xdc\x4b\xed\xa3\x23\xe0\x6e\x94\x2f\x9d\x83\x14\x19\x81\
-\x14\xdf\x9f\x4b\xfd\x43\x37\xea\x73\xaf\xd6\xef\x44\x7d\xce\xff\
-\x57\x51\xd7\x37\xd4\x82\x39\x74\xcb\x17\x0c\x65\x03\x46\xa9\x96\
-\x16\x68\x2f\x43\xaa\xcd\x45\x7f\xcb\x93\x00\x3e\xbb\xbc\xac\x97\
-\x0e\xe0\x6a\xcf\xbb\x06\xd3\xff\x83\x07\x81\xc3\xfb\xbb\xe0\xdf\
-\x50\xfa\x1d\xb3\x54\x22\x88\x00\xd3\x36\x60\xe2\x09\xc1\x76\x00\
-\x74\xd2\x7f\x47\x39\xda\x77\xb2\x81\x02\x07\x10\x33\x7e\xc7\xe8\
-\x10\x12\x65\xc1\xff\xdd\x19\xe6\x31\x63\x0b\x25\xc8\x87\xc2\xb8\
-\x31\x0c\xf4\x85\xd2\xe0\x07\xa2\x7c\xe0\x79\x03\x2f\x81\xc0\xd2\
-\xb1\xa0\x30\xf4\xb2\x9d\xc7\xc5\x90\x4f\x9a\x1d\x60\x10\x18\xb3\
-\x26\x74\x23\xfd\x1c\xcd\x18\xa0\x92\xe7\xd0\x6c\x01\x93\x16\x03\
-\x1a\x62\xfb\xcc\x09\xfc\xe7\xe5\x65\xbd\x74\x00\x57\x73\x1c\x86\
-\x76\xfa\xb1\xc0\x9d\x38\x06\x1a\x8f\x20\xa1\xb5\x60\x4d\xbd\x64\
-\x7c\x5e\xbb\x3b\x30\x63\xbb\x15\xac\x8f\x8d\x06\x3c\x00\x14\xaa\
-\x15\xba\xfc\x31\x66\x11\x5c\x74\x14\xc8\xc0\x03\xe2\x4c\x34\xa2\
-\x81\xf4\xbf\x13\xe9\x31\x8f\xf0\x73\x3f\xed\x2f\x8c\xbd\x5f\xf7\
-\x87\x3e\x20\x58\x38\x84\xd0\x33\xc8\x30\x60\xf8\x71\x8c\x57\x60\
-\x7a\x7f\x76\x5f\x4c\xf7\xfb\x25\x82\x30\xc8\x5e\xef\x74\x56\xcf\
-\x4b\x96\x77\x3a\x1d\xbd\xd9\x07\xae\x41\x61\x1b\x52\xed\x1f\x02\
-\x03\xdf\xb2\x74\x00\x4b\x07\x70\xb5\xe7\x14\xe6\xf6\xfa\x09\xe0\
-\x2b\xe0\xd8\x91\x0e\x58\xd7\x17\xed\x1d\x02\x04\x59\x80\xcb\x6d\
-\xc0\x21\xae\xd0\xf4\x1d\x44\xe2\xc8\x97\xe8\x60\x11\xc5\x9d\xcb\
-\xe5\x80\xa7\x8c\x7d\xc5\x8e\x01\x64\xb1\x03\x88\xad\x3c\xf4\x53\
-\x7e\x8b\xde\xbc\x20\xd5\xef\x38\x04\x1e\x00\x04\x2d\x5a\x87\x1e\
-\x07\xa0\x03\x0c\xf2\x00\xf2\x1f\x7a\x25\x03\x77\x5b\x82\xf6\x33\
-\x4e\x54\x90\x74\x7b\x77\x66\xc9\x0e\x2d\xc8\x76\x4a\x67\x60\x80\
-\x67\xbb\x03\x54\xfb\x87\xfe\xa6\xaf\xc3\x73\x93\x4e\x5a\x3a\x80\
-\xdf\xc2\xe7\xb5\x00\x36\xba\x56\x0c\x60\x75\x05\xee\xe0\x3e\x48\
-\x1b\xb2\xb1\x97\xb5\xfe\x02\xc1\x4e\x61\xc1\xa5\x9a\x11\x98\xd1\
-\xf6\x77\xfd\x39\x74\xe7\xfc\x73\xed\x90\x33\x03\x57\x18\x7e\x02\
-\x1b\x07\xb4\x06\xcb\xc8\xd8\x1f\xe4\x89\x46\x2d\xa5\xf1\x17\x91\
-\x3e\x1a\x63\xe8\x39\x8b\xce\xcf\xf0\xde\xf8\x01\x2f\x00\xf7\x98\
-\xbb\x4e\x20\xe1\x04\x7d\x27\xa1\x9f\x93\x08\x38\xb4\xd8\xda\x99\
-\x16\x3a\x09\xf3\x76\x4b\xd4\x5d\x67\x46\x20\x48\xbb\x6d\x19\xc6\
-\x9c\x27\x7e\x25\x74\x5d\xfb\xb9\xe5\xe5\xbd\x74\x00\x57\x3a\xf3\
-\x5b\x7d\x39\xc0\x1d\x3c\x00\x9a\x8c\x21\x56\xab\x12\x9b\x30\x0d\
-\x47\xc4\xbe\x18\xc5\xef\x51\x72\x9f\x9d\xb6\x68\x78\xa2\x0e\xc0\
-\xc5\x09\x39\x97\xeb\x7c\x1e\x88\x6c\xe5\xad\x74\x36\xae\xa0\x0e\
-\x0f\x3a\x80\x21\xc4\x5f\xf2\x84\x5f\xe8\xb5\xef\x02\x77\xb3\x82\
-\x30\x60\xe4\xa5\xd3\xe0\xde\xe7\x7d\x40\xb0\x73\x5f\xdf\xc0\x43\
-\xef\x71\xbd\x1b\x0b\x1c\x09\x2e\xef\xcc\x70\x71\x77\x9a\xb3\x1c\
-\xea\x85\xfc\xde\xd8\x33\x19\xf8\x4a\xa1\x81\x70\x0b\xb8\x71\x3f\
-\xd8\x1f\x02\x70\x1b\x80\x9f\x5f\x5e\xde\x4b\x07\x70\xa5\x73\xe7\
-\x10\xb0\x47\x07\xf6\x01\xce\x83\x02\x77\x29\xf6\xfd\xc5\x19\x34\
-\x9f\x0d\x3c\x3b\x6b\x31\x6d\x39\x01\xfc\x20\xa7\x80\x9e\x14\x4a\
-\x3f\xa9\x77\xef\xe6\x3f\x4f\x03\x42\x62\x5e\x07\xf3\xba\x03\x7d\
-\xba\x6f\x9f\xdb\x1f\x38\xd3\x7a\xcb\xfb\x02\xcf\x67\x03\xfd\x12\
-\x20\x02\x7e\xfd\xfb\x85\xe7\xa3\x7f\x69\xf0\x73\xce\x80\xbb\x25\
-\xc0\x5c\x66\xc0\xa8\x3c\x70\xee\xf2\x36\xea\xba\x1d\x58\x89\xae\
-\xce\x80\x92\x43\x2c\x47\xa8\x09\x04\x06\xf1\x0e\xc4\x4f\xfa\x59\
-\x83\x83\x2a\x3a\x2d\x1d\xc0\xd2\x01\x5c\xf1\xbd\xb8\x63\xae\xd8\
-\xac\x46\x70\xfb\xf7\x83\x22\x70\x45\x80\x38\xb2\x39\x15\x65\xf1\
-\xc5\x6d\xbe\x24\x62\xe0\x60\xa6\xf0\x9e\x9b\xb5\xb8\xdc\x04\xac\
-\x8c\x1c\x24\x6a\x01\x94\x25\x7f\xa7\x0c\xb0\x6f\x24\x62\x8c\xeb\
-\x72\x0c\x98\xbb\xd3\x86\xe5\xeb\x1c\x1c\xed\xed\x75\x00\x3a\x0e\
-\xc1\x1c\x40\xbf\x3c\x08\x21\x03\x7b\xcc\x8b\x4b\x01\x19\xc8\x0c\
-\x3a\xc6\xbd\x00\xed\x97\xd0\x73\x18\xa1\x83\xee\x3f\x79\xfe\x52\
-\xaf\x5b\x92\x3d\x2a\x49\x57\x41\x39\x2e\x5b\x8a\xcd\x02\xe2\x66\
-\x51\xa1\x7f\xcb\xf2\xf2\x5e\x3a\x80\x2b\x9d\x75\x00\x67\xe7\xc0\
-\x26\xef\xe1\x36\xd6\xb3\x21\xd8\x15\x27\x56\x8b\x8a\x0c\x2c\xca\
-\x70\xd9\x6a\x77\xeb\x80\xa7\x76\x1b\x9c\xf1\xe3\x2c\x08\x42\xa5\
-\x1e\x20\x65\xa3\x67\x51\xfe\x7b\xfc\x71\x2e\x70\x00\x72\x45\x17\
-\xa0\xaf\x07\x50\x6a\xfa\xa3\xdb\x9b\x97\x81\xd4\x3e\x70\x37\xfd\
-\xef\x1b\xfc\x60\x19\xb0\x47\x09\x10\x39\x04\x21\xf4\x8c\x3e\x3a\
-\x85\x30\x00\x08\x76\x81\x41\x12\x46\x2b\x8c\x27\x9f\xbd\xb4\x37\
-\xea\xdf\x97\x18\xb7\xbf\x03\xc1\x41\x78\x36\x44\x06\xc2\xdc\xdf\
-\x75\x79\x96\x0e\x60\xe0\x9c\x44\x7f\xdb\x8f\x08\x68\xb2\x02\x1a\
-\x4f\x20\xc1\x88\x3f\x54\xb6\x01\x7a\x22\x9e\x6c\x75\x7e\x59\xa7\
-\x0a\xe3\xb1\x9d\x06\xc7\x57\x47\x79\x17\x80\x2b\x37\xef\x52\x8e\
-\xf4\x2e\xa6\xba\x51\x23\x20\x3a\x81\x68\xfc\xc8\xa9\x2f\x15\x75\
-\x47\x29\xda\x89\x1e\x06\x20\x03\x88\x7f\xe8\xf7\xf3\xd1\x75\x0a\
-\xdc\x6f\x0d\xf2\xfc\x7d\x65\x37\xa0\x54\xf2\x8d\x2b\xbe\xfa\xe9\
-\xff\x5c\x26\xc0\x1d\x50\xd0\x03\xb8\xb8\xb5\x83\x73\x97\x77\xcc\
-\x81\x32\x4a\x36\x60\x9e\xb5\xd2\x37\x8a\x84\x15\x0c\xb4\x99\x09\
-\x22\x82\xe7\x16\x0c\xc6\x00\x1f\xe0\x7a\xcc\x23\x2e\xcb\xb3\x74\
-\x00\x9d\x73\x06\x2a\x29\x55\xc2\xf8\x70\x1b\x1b\x70\xce\x43\x44\
-\xd2\x08\x3c\x99\xa8\x87\x38\x32\x3f\x40\xdd\xd1\xfe\x4e\x08\x23\
-\x3c\xb9\x5d\xe3\xf2\xbe\x09\x26\xde\xa9\x03\x49\x58\x00\xf2\x74\
-\x1e\x41\x1d\x01\x07\x6b\xf5\x15\xe2\x20\xdc\xef\xff\x97\x19\xc0\
-\x80\x46\xff\x9c\x03\x58\x10\xfd\xb9\xc4\x06\x38\x3b\x87\x4e\xc7\
-\x20\xf4\x58\x80\xa1\xb8\x7f\x20\x1b\x90\x50\x0c\x0c\xd9\xe7\x89\
-\x02\x1c\xe6\x71\x00\xcb\x0c\xc4\x01\x8f\x3d\x7b\x11\x6d\xd3\x74\
-\x07\xa3\xca\x51\x69\xfb\x25\x29\x76\x02\x8c\x26\x4d\xf6\x5e\x51\
-\x6c\x2b\xce\xb7\x64\x8f\xdb\xdf\x76\xba\xbc\xcc\x97\x0e\x60\xd1\
-\x39\x8c\xfe\xa5\x23\x02\x37\x99\xc0\x11\x21\x70\x00\x39\x9a\xdf\
-\x7c\x63\xc1\x59\x06\x45\x41\x34\x3a\xed\x36\x8c\xcf\x6e\x37\xb8\
-\x6e\x63\xac\x59\x00\x21\xff\x10\x15\x65\x01\x9b\x23\x70\xe6\x1c\
-\xd2\xee\x40\x67\xf4\x5f\x99\x77\x00\x9d\x34\x39\xd2\x8b\x8b\x41\
-\xa3\x39\xe3\x5f\x40\x03\x4e\xe9\x7f\x58\x9c\xfe\xcb\x00\x40\xc8\
-\xf3\xc6\x9c\x51\xff\x58\x1e\x70\xaf\x1b\xd0\x75\x18\x24\x82\x59\
-\xdd\xe2\xb1\x67\x2e\x16\x22\x28\x43\x7b\xce\x30\xf7\x26\x6b\xfa\
-\x6f\x1f\xc5\x81\xa4\x86\xcc\x8f\x07\x1f\x86\x0e\x07\x2d\x1d\xc0\
-\xd2\x01\x2c\x3c\x07\x31\x80\xad\xb9\xc9\x18\x0e\x64\x13\xb1\xa2\
-\x5d\x3f\x17\x6d\x2d\x8f\xf3\x52\x24\xa7\x76\xa6\xf6\x22\xa8\x47\
-\x78\x74\x6b\x86\x63\x2b\x1e\xe4\x9c\x82\x86\x91\xe8\x43\xd0\xad\
-\x37\xae\x44\xb5\x90\x47\x86\x1d\xba\xcc\xbf\x3e\x09\xa8\x2c\x03\
-\x3a\x0b\x35\xb8\x3b\xca\x1b\x78\x78\xd8\x67\xae\x13\x30\xd4\xfb\
-\x1f\x48\xfd\xa3\x11\x87\xd0\xcd\x0c\x3a\x64\x9f\xf2\xbe\xd0\xbd\
-\x0f\x9c\x66\x07\x3c\x29\xf8\x77\x79\x7b\x27\x53\xa3\x8b\x8e\x0a\
-\x15\xc6\x4f\x45\x9a\x45\x11\x43\x11\x02\x09\x19\xb4\x12\xb2\xf6\
-\x62\x3e\x6b\x50\x5a\xf0\x85\xe5\x65\xbe\x74\x00\x8b\xce\xbe\xb9\
-\x7b\x9c\x83\x1b\x4d\x40\x2c\x5a\xb6\x5b\xcd\x2f\x9c\xf1\x3b\xe1\
-\x7c\x95\xe6\x92\x54\xf2\x2c\xa0\x5d\xcc\x17\xa6\x0d\x9e\xdc\x69\
-\x70\x6c\x6d\x8c\x10\xc9\x32\x29\xad\xe7\x3c\xff\x4f\x50\xc3\x88\
-\x7d\xff\xb8\x4d\xa7\x23\x35\x1e\xb1\x82\x9e\x1f\xe8\xcb\x73\xf7\
-\x5b\x7f\x52\xa6\xfd\x66\xb4\xa1\xf7\xfd\xb6\x34\xf8\x90\xb3\x84\
-\x36\x14\x4a\x3c\xd2\x05\xf6\x86\x40\xbf\xb9\xcc\x60\xa0\x43\x10\
-\xc1\x3f\x66\x3c\xfc\xd4\x85\xee\x4e\x03\xe9\x61\x2c\x02\x90\xbd\
-\x4f\x94\x44\x50\x63\x37\x80\x00\xe7\xe1\xa2\x83\x98\x3f\x7e\xf0\
-\xef\xbb\x3c\x4b\x07\x50\x9c\xc9\x90\x03\xf0\xa3\x09\x28\x08\x9c\
-\x21\xff\xec\x78\x9e\xbf\x93\x52\xf5\xf2\x92\x2b\xfa\x7b\xa4\xc6\
-\xf8\xf0\xe5\x19\xf6\x8d\x3c\x5c\x6c\x1d\x46\x49\xb0\xb2\xd7\x9f\
-\x9c\x02\x15\x13\x80\xc9\x02\xf6\xfe\x0d\x16\x31\x01\x17\xce\xfb\
-\xf3\x30\xe0\x27\xbd\xfe\x7e\x04\x09\xa5\x68\x15\x76\x80\xc0\x7e\
-\x5b\xb0\x57\xeb\x27\xd4\x3f\xcc\x69\x02\x78\x12\x3c\x79\xfe\x12\
-\x2e\x6e\xed\x98\x50\x2a\x77\xb2\xfe\xc5\xbf\xb1\x22\xff\xea\x1f\
-\x1c\x1c\x79\x7b\xeb\x68\xd1\x75\xbe\xbe\xbc\xc4\x97\x0e\x60\xaf\
-\x33\x9a\x33\x26\x72\x70\xbe\x82\x0b\xa2\xe9\xbf\x11\xfe\x83\xeb\
-\x5f\x8a\x9a\xee\x4b\x39\xb7\xcf\x94\x87\x78\x2c\x90\x5d\x9e\xb5\
-\xf8\xec\x4e\x8d\x93\xeb\x23\xc5\xc6\x22\xc8\x47\x85\x4a\x50\xd9\
-\xe6\x4b\xc8\xff\xfc\x9a\xf1\xb9\xd7\x3a\x04\x02\xf6\xe5\xba\xb8\
-\xc8\x0a\x42\x98\x1f\xf5\x2d\x7b\xf9\xdc\x03\x04\x23\xa0\x57\x1a\
-\x7c\x18\x4a\xfb\x65\xa0\x04\x08\xbd\x76\xa0\xb5\xfe\x20\x98\x35\
-\x2d\x1e\x7d\xea\x82\xd1\x88\x0b\xe0\x2f\xed\x10\x28\x7f\x63\x2b\
-\xb4\xac\xed\x67\xd5\x3f\x88\xbc\x76\x06\xc8\xc1\x0d\xd3\xfe\x69\
-\xd0\xc1\x2f\xcf\xd2\x01\x2c\x40\x9a\xd2\x65\xe3\x9c\x83\x13\x31\
-\x06\xaf\x1a\x10\x59\x9a\x0f\xd7\x23\x00\x16\x29\x2b\x05\x01\x9c\
-\x11\x83\x0a\x43\x7f\xec\xf2\x0c\x1b\x95\xc3\x4a\xe5\x4c\x23\x00\
-\x3d\xa0\xaf\x9c\xfb\x2f\x36\x0c\xf7\x37\x01\x75\x16\x89\xa2\x9b\
-\xf6\x03\x0b\x94\x7a\x7a\xf3\x00\xe5\xa4\x5e\xe8\xb1\xfb\x42\x3f\
-\xa5\xef\x65\x05\x61\x28\xc2\x17\x1f\xe3\xaa\xef\x8e\xe1\x87\xce\
-\x20\x90\x13\xc1\x63\x4f\x5f\xc0\xce\xee\xd4\xca\x9d\xee\xca\xb0\
-\xb2\xbd\x9a\x8b\x2a\x17\xcd\x5e\x1d\xb4\x28\xfe\xe2\x9c\x3a\x82\
-\x34\x27\x30\xef\x00\xfc\xf2\x12\x5f\x3a\x80\xbd\x4e\x3d\x94\x66\
-\x7a\x38\x38\xb1\xd6\xbd\x00\x64\xda\x75\x64\x75\x40\xb4\xef\x08\
-\xd6\x75\xda\x80\x01\x26\x00\xea\x92\x51\x37\x75\x8b\x47\x2e\x4d\
-\x71\x76\x63\x62\xab\x01\xa8\xe0\x00\xa0\x6b\xfc\xf1\x16\xc1\xc4\
-\x05\x52\x80\x73\x0b\x3b\xa5\xe7\x10\x64\xa0\xbf\x5f\x76\x00\x64\
-\x28\xfd\xef\x81\x7e\x89\xec\x63\x91\xbf\xac\xe5\x03\x0f\x80\x7f\
-\x9c\x81\x3e\xe6\xb9\x99\x00\x47\x82\x0b\x5b\x3b\x78\xea\xfc\xa5\
-\x2e\x91\x2a\x65\x01\xdc\x1d\x79\x20\x32\xff\x68\x49\xbe\x19\x3e\
-\xc8\x99\xe1\x7b\x10\xb9\x45\x25\xc3\xd2\x01\x2c\x1d\xc0\x15\xcf\
-\x74\x61\xa5\xc9\x80\x83\xd8\xee\x4b\xc9\xb6\x46\xe6\x08\xa2\x8d\
-\x7a\xfb\x7e\x99\xb2\x33\x00\xb2\x55\xd9\x16\xe5\x2f\xee\xd4\x78\
-\x92\x80\xa3\x6b\x23\x93\x0a\x43\xde\xc1\x57\x46\xfb\xb2\xd4\xd8\
-\xab\xfe\xef\x30\xe5\x06\x16\x7e\x04\x1e\x58\xfa\xb1\x60\x9a\xaf\
-\xdf\x21\x90\x9e\x91\x87\xd0\x33\xfc\x05\xa3\xbe\x26\xf1\x95\x9d\
-\x45\x06\x0d\x09\x8c\x69\xd3\xe0\xb1\x67\x2e\x80\x99\x17\xe5\x5f\
-\x79\xce\x9a\x04\x54\x2e\x4c\x01\x99\xb1\x13\x1c\x69\xea\x0f\x38\
-\x38\xaa\x2c\x03\x98\x3b\x3c\xec\xe0\x97\x67\xe9\x00\xf2\xb9\x30\
-\xe8\x00\x58\x67\x77\x9c\x00\xe2\x0b\x32\x10\x34\x2d\x88\xc4\x3c\
-\x71\xd0\x3d\x01\x84\x4e\x4b\x2f\x65\x08\x71\x94\xd7\x22\xf9\x53\
-\xdb\x35\x2a\x02\x36\xc7\x95\x12\x89\x3a\xe5\x80\x5d\xc4\x8e\xf6\
-\x70\x00\x32\xd0\x2a\xef\xaa\xe6\x48\xac\xf7\x3b\xb2\x5d\x25\x79\
-\x07\x45\x5b\xaf\xa7\xfe\x63\xed\x3d\x2a\x53\x7e\x0e\x03\x00\xe1\
-\x02\xa4\x7f\xae\x1b\x20\x10\x13\xfd\xe0\xd0\xe2\xb3\xcf\x5c\xc4\
-\x6c\x56\x77\x07\xaa\x90\x9d\x17\xa5\xd6\x66\x97\x59\x49\x04\x6b\
-\xf9\xb9\x58\xa3\x81\x50\x69\xa9\xe6\x2b\xbd\x5f\x06\xf3\xa4\x66\
-\x79\x89\x2f\x1d\xc0\x5e\xe7\xd9\xa1\x3b\x1d\x0b\x7c\x00\x98\x08\
-\x12\x04\xde\xe5\x11\x55\x86\x98\x81\xeb\x2c\xbb\x0e\x09\x91\x69\
-\x78\x4a\xc1\xf6\x2b\xe6\xfb\xe3\x15\x19\x04\x4f\x6c\xcd\x40\xeb\
-\x82\xd5\x51\x95\xbb\x0a\x65\xad\xef\xfa\xa0\xdf\x02\xf5\x11\xe9\
-\xad\xd0\xea\x83\x81\x51\x76\x7b\x28\x0b\xe0\xee\x48\xaf\xcc\xd5\
-\xfa\x05\xb2\x3f\xc4\xfe\x93\xd0\x23\xff\x84\x3c\xcc\x94\xb2\x85\
-\xa8\x04\xc4\x20\x69\xf1\xf4\xf9\x2d\x9b\xf9\x47\x17\xb0\xec\x39\
-\x35\x2a\x59\x8e\xe4\xf4\xf5\xa7\x91\x40\xab\xf9\xe1\xe1\x9c\x03\
-\xb9\x0a\x8e\x2a\x80\xfc\x90\x03\x60\x2c\x49\x40\x4b\x07\x70\x85\
-\xf3\x84\x55\xed\xbe\x13\x38\xda\x00\x27\x64\xac\x5d\x82\x18\x6d\
-\x55\x48\x20\xb6\xed\xc7\x41\xa0\x9b\xbf\x45\x6d\xb3\x8d\x59\x40\
-\xc8\x9c\x7e\xb2\x6d\x40\xc8\x73\xfd\xa1\x55\x27\x70\x7c\x0d\x18\
-\x57\x94\xbe\x9d\x79\xc5\x0b\xda\x7f\x9d\x2d\x42\xe8\x0c\x03\x51\
-\xdf\x09\x00\xc9\xb8\x29\xde\x5f\xb6\xf4\xb8\x58\xe0\xc1\x0c\x19\
-\x6c\x0d\xaa\x21\x4b\x99\xfa\x77\xda\x7d\x43\xed\xbf\xd0\xb9\x8f\
-\xec\xf9\xcf\x5f\xde\xc6\xc5\xad\xdd\x6c\xec\xd4\x07\x2e\xb9\xe0\
-\x3a\x15\x9a\x89\xd6\xef\x37\xc8\x4f\xb1\x00\x4b\xff\x89\xbc\xa6\
-\xff\xae\xb2\x3f\xdf\x1c\xe5\xbf\x05\x70\x79\x79\x89\x2f\x1d\xc0\
-\x5e\xe7\x61\x00\xbb\x88\x8a\x40\xc6\xc1\x97\xb6\x81\x33\x1c\x40\
-\x62\x6b\x5e\xd4\xf0\x89\x32\x6b\xd5\x41\xd4\x0e\x5c\x8c\x64\x94\
-\x52\x7f\x35\x63\xe9\xed\x03\xd0\xef\xb5\x0c\x3c\xb9\x3d\xc3\xe1\
-\x49\x85\x71\xe5\xf2\xa2\x5f\xd0\x7c\x46\x50\x2c\x1d\xed\xec\x10\
-\x88\xaf\x23\x52\x89\x65\x20\xaa\x96\x2b\xbf\xa4\x27\xe2\x29\x3d\
-\xa3\x0f\x43\xd4\xdf\x0c\x08\x8a\x14\x8e\x41\x8a\x4e\x41\x28\xc8\
-\x42\x65\xbb\xcf\xf6\xfe\x5d\xda\xda\xc1\xa5\x68\xfc\x19\xde\x47\
-\xa2\x3e\x9a\x2a\x50\x97\xfb\x37\x9f\xfa\xe7\xbe\xbf\x83\x73\x6a\
-\xf8\xce\x79\x38\xe7\x17\x8d\xfb\x04\x00\x97\x96\x97\xf8\xd2\x01\
-\x5c\xa9\x04\x78\x1c\xaa\x1e\x63\xc6\x15\x20\xf5\x0c\x15\x28\x65\
-\xaa\x5e\xe3\xbc\x01\x82\x6a\xd8\x62\x4c\x3d\xe2\x22\xaa\x91\xe8\
-\xb8\xb0\x71\xfe\x13\x04\xe0\x0a\x4e\xaf\x7d\xde\x86\x16\xcf\xd4\
-\x2d\x0e\xac\x8d\x30\xa9\x2a\x2b\x1f\xfa\xbd\x7f\xe4\x36\x43\x0f\
-\x27\xeb\xa0\x68\x45\x3b\x3d\x19\x31\x4a\x79\x6e\x74\xa3\x7e\xd9\
-\x1a\x2c\x01\x43\x29\x67\x03\x7a\x19\x83\x65\x10\x12\xff\x8f\x64\
-\xfc\x61\x4e\x13\x90\x24\x80\x39\xe0\xf2\xe5\x5d\x6c\xef\xee\x22\
-\xb5\x06\xfb\x9b\x7e\xa4\x3b\xf8\x43\x85\x60\x42\xea\xf9\xa7\xd4\
-\x3f\x47\x7d\x47\x6a\xf8\xe4\x46\x20\x37\x02\x87\x41\xac\xef\x32\
-\x80\x9d\xe5\x25\xbe\x74\x00\x7b\x9d\x19\x80\x8f\x67\x07\xa0\x17\
-\x37\x37\x33\x78\x21\x78\x21\xb0\x30\xc4\xa9\x46\x67\x6e\xb3\x4b\
-\x9a\xd3\x67\xe2\x0c\xe8\x53\xe4\x00\xc0\x24\xbd\x29\x97\x01\xb1\
-\xed\xd7\x66\xa6\x5f\x00\x70\x6e\xbb\xc1\xc6\x88\xb1\x36\x72\x96\
-\x3d\xf4\x96\x8f\x50\x2f\x32\xf6\x76\x10\xcc\x75\x05\xfa\xad\x40\
-\x94\x2a\xbe\x03\x2b\xbc\x4a\x12\x4f\xcb\xf3\xca\xbf\x7d\x79\x70\
-\x33\x76\x29\xbb\x0a\x21\x97\x00\x04\x41\x08\x2d\x2e\x6f\xef\x62\
-\x36\x9d\x15\x80\x9e\x74\xa3\x7f\x2c\x5f\xe2\xfb\x93\xca\x19\xea\
-\xf6\x63\xe2\xc0\x8f\xb5\xfd\x5c\x6c\x01\xc2\x5b\x46\xe0\x6d\x1c\
-\x98\x86\xca\xbb\xd9\xf2\x12\x5f\x3a\x80\x2b\x9d\x5f\x81\x6e\x95\
-\x4d\x56\x16\xda\xc6\x78\x00\x04\x4f\x04\x11\x86\xb4\xaa\xdb\x91\
-\x14\xbc\x84\x40\xc4\x70\x24\xb6\xe7\x43\x12\xf1\x87\x6c\x76\x40\
-\x3f\x37\x3a\x4b\xd9\xb2\x2b\xea\x7c\xe1\x80\xcb\x6d\x40\xd3\x7a\
-\xac\x75\x28\xc3\x91\x4c\xc4\x16\x09\x0b\x2f\xd0\xe9\x9d\x17\x4e\
-\x20\x45\x78\x14\xe9\x3e\x06\x96\x76\x14\xda\xfd\x61\xc1\xa6\x9f\
-\x39\xb9\xaf\x62\x16\xa0\xcd\x8c\x42\xe9\xcc\x1b\x30\x9a\xa6\xc6\
-\xf6\xee\x0c\xa1\x69\xf2\x6b\x49\x54\xdf\xee\x92\x8f\x8c\x09\x98\
-\xb1\x4b\xd4\xfc\x33\xc3\x07\x65\xc0\x8f\xac\x04\x70\x5e\x67\x00\
-\x7c\xa5\xa5\x00\x55\xca\xb0\x9c\x3f\x4f\x2d\xbb\x00\x4b\x07\x70\
-\x35\xe7\x17\x7a\x3d\x00\xb4\xf5\x0c\x8e\x19\x95\x15\xe7\xc2\x04\
-\x21\x01\xb3\xc0\x5b\xfd\x9d\x17\xfa\x88\x65\xf6\x92\x26\x72\x93\
-\xde\xbf\x75\x0f\x08\xa4\x99\x41\x99\xaa\xa7\x45\x83\x6a\x01\xd3\
-\x9a\xd1\xb6\x01\x2b\x23\x8f\xca\x3b\xdb\x9c\x5b\x0a\x82\x52\xa1\
-\x89\xc7\x5d\x5c\x80\x87\x3a\x02\xa5\xc1\xf5\xd4\x82\x78\x80\xfc\
-\x93\x00\x3c\x19\x26\x10\xf5\xc7\x88\xb9\x0b\xfc\x71\x08\x98\xcd\
-\x6a\x4c\xeb\xba\x18\x22\xea\x19\x7c\x8f\xb7\x40\x56\x9e\x10\xf2\
-\xd2\x45\xb2\x8e\x07\x19\xcd\x97\xa4\x40\xff\x9d\x03\xb9\x11\xbc\
-\x1b\xc1\xb9\x11\x9c\x1f\x59\x06\xe0\x30\xd0\x06\x78\x7c\x79\x69\
-\x2f\x1d\xc0\xd5\x9c\x5f\x02\x70\x1e\x71\x34\xd8\x39\xcc\x76\x2e\
-\x82\xda\x80\xca\x13\x44\x08\x0c\xb2\xeb\xd7\xa4\xc1\x48\x59\x6d\
-\xa2\xfe\xc2\x4a\x02\x49\x3b\x40\x15\x23\x08\x79\xd1\x87\x7d\x4f\
-\x1c\xf5\x6a\xfb\x42\x28\x90\x08\xad\x04\x6c\x31\x63\x5c\x39\x8c\
-\x2b\x07\xe7\xdd\x82\x9d\xa0\x32\x3f\x2e\x5f\x6e\x28\x8a\x0e\xa2\
-\x6f\xbc\x90\x81\x01\xa0\x32\x95\x1f\xa2\x0e\x97\xed\xc1\x90\xb7\
-\x24\x71\xc6\x15\xda\x36\x60\x36\xad\x11\x42\x9b\xcb\x9d\x9c\x96\
-\xf4\x96\x94\x72\xe1\xb0\xb2\xd4\x37\xa5\xdf\x8b\x52\xed\x9f\x3e\
-\x92\x4b\xa9\xbf\x2b\x32\x01\xe7\xc6\x68\xb9\x31\xe5\xe6\xb9\x37\
-\xe9\x33\xcb\x4b\x7b\xe9\x00\xae\xe6\x3c\x6d\x65\xc0\x17\xc5\x3b\
-\xda\xa6\x46\x1b\x1a\x4c\xfc\x8a\x62\x00\x44\x10\x38\xbd\xd0\x6c\
-\xfd\x97\x4e\x0a\x0a\x44\xd4\x19\x04\xe2\x9c\x9d\x3b\x18\xb2\xdd\
-\x6b\xdf\x4b\x5f\xda\x97\xba\xb2\x60\x76\x7f\xdd\x06\x34\x21\x60\
-\x54\x79\x8c\x1c\x75\x37\x84\x97\x23\xc2\x31\x9a\x72\x91\x55\xb0\
-\x74\xdb\x84\x73\x1d\x00\x74\x87\x80\x3a\xf5\x3e\x7a\x4e\x01\xbd\
-\x8c\xa0\x78\x5e\x09\x08\xa1\x45\x5d\xb7\x9a\xee\x47\x16\x60\x51\
-\xdf\x77\xa5\xbd\x8b\xad\xc0\x88\xef\x8f\x80\xba\xb8\x7f\x2f\xfd\
-\x57\xc3\x77\xce\x83\xa8\xb2\xb6\xdf\x08\xce\x55\xf0\xa4\x99\xc0\
-\x34\xd4\x5d\x00\x35\x9f\x87\x96\x97\xf6\xd2\x01\x5c\xcd\x11\x00\
-\x1f\x4a\x0e\x80\x08\xc2\x2d\xea\xdd\x2d\x6c\x4c\xd6\x11\x24\x40\
-\x44\xf2\xe6\x6e\x21\xeb\x0a\x58\xa4\x4f\x73\xfa\x82\x10\xc9\x41\
-\x45\x8d\x4e\x44\x1a\xf9\x05\x20\xe6\x3c\x07\x50\xf2\xfe\xa5\x2c\
-\xee\x5d\x94\x15\x44\x5d\xb7\x68\x1d\xc1\x57\x04\xef\x5c\x31\x13\
-\x2f\x5d\x4d\xc0\xbe\xc1\x45\x87\x30\xb7\xe6\xbb\xbf\x01\x18\xc3\
-\xbb\x02\x3b\x4b\x47\x7a\xf3\x03\x10\x70\x1b\xd0\xb6\x01\xa1\xe5\
-\x62\x6f\x62\xf9\x7b\x90\xb5\x05\x7b\xa0\x45\x32\x7a\x73\x48\xd4\
-\xd5\x5b\x4f\xc6\x4f\x3e\xb5\xff\x94\xea\x5b\xa5\xf6\x9f\xa7\xd8\
-\x02\xd4\x5b\x33\xb8\x7e\x0d\x01\xcb\x15\xe1\x4b\x07\xf0\x1c\xce\
-\xcf\x76\xbe\x6a\x5b\xec\x6e\x9f\x87\x3f\x74\x12\x15\x3b\x33\x74\
-\x02\x8b\xa2\xfe\xda\x1a\xec\x97\xf4\xa6\x4e\x03\x8d\xa6\xd1\x06\
-\xe7\xa2\x72\x94\xff\x2a\x52\x5e\xfd\xd4\x18\x84\xe5\xf6\x60\x47\
-\x60\x11\x70\x2b\x68\xc1\x4a\x7d\x4d\xbd\x71\xee\x55\x04\x9c\x9f\
-\x2b\x69\xeb\xf1\x15\x46\x84\x0b\x9e\x00\x63\x4e\x4f\x90\xec\xa3\
-\xb4\x0a\xfe\xb1\xd5\xfa\xdc\x86\x5c\x2e\x74\x74\xca\xa4\x0b\x4c\
-\x76\x92\x80\x92\xa0\xd4\xc1\xf9\x7b\x42\x9f\x5d\xbe\x7f\x6c\xfd\
-\x79\x8b\xfc\xce\x57\x70\x7e\x0c\xf2\x63\x90\xf3\xa8\xdb\xdd\xa1\
-\xf4\xff\x02\x80\x4f\x2d\x2f\xeb\xa5\x03\xb8\xda\xf3\x73\x00\x9e\
-\x01\x70\x24\x66\x01\xdb\xbb\x97\x15\x08\x24\x82\x88\xd3\x2c\xc0\
-\xb0\x00\x8b\xed\xa8\x40\x68\xc1\x49\x8f\xd6\x09\xc0\x54\x0a\x59\
-\x8a\xd9\xbc\xb5\x07\xe3\xe4\xa0\x84\xac\x01\x18\x8c\x1b\x40\xa6\
-\xe7\xdf\x99\x08\x44\x67\x39\x4e\xa0\x80\x60\xb3\x06\xe4\xa8\xa3\
-\x1b\x32\xd7\x5b\x8f\x69\x7d\x7f\x52\x30\x6e\x1e\x4e\x29\x7e\xcf\
-\x28\x0b\xce\x80\x18\x25\x58\x61\x80\x62\xd9\x88\x38\x0d\xb2\x11\
-\x60\x2c\xeb\x13\x29\x36\xa8\x94\xdd\x8a\x4e\xe9\x53\x96\x01\x5a\
-\x33\x25\x8d\x3f\xa5\x60\x65\xa6\x9f\xf5\xfc\x15\xf0\xd3\x6c\xc0\
-\x39\x75\x08\x2c\x40\x1d\x78\x28\xfd\xff\x24\x96\x52\x60\x4b\x07\
-\xf0\x1c\xce\xb3\xe6\x04\xde\x1f\x81\xc0\xad\x4b\xe7\xd0\x86\x1a\
-\x23\x3f\xb2\x12\xc0\x9c\x80\xb8\x9c\xfe\x23\x72\x88\x0d\x10\x84\
-\x32\xe6\x88\x24\x61\x04\x89\xb8\xe7\xac\x1d\x68\x23\xae\x12\x27\
-\xe2\xc8\x65\xba\x30\x15\xd3\x80\x52\x08\x86\x94\x44\x22\x53\x29\
-\x92\x50\x2c\x1b\x41\x8f\x1c\x14\xdb\x11\xdc\xdb\x5f\x10\x7a\x53\
-\x83\x3c\x00\x10\x06\x51\xf9\xaf\xd8\xe2\xe3\xe2\xe7\x85\x3a\x9d\
-\x8b\x4e\xe0\x2f\xbb\x10\x9d\x4e\x45\x2e\x0b\xe2\x7a\xef\x38\xea\
-\x8b\x42\xf3\x94\x0a\xc1\x8f\x58\x06\x38\xd2\x76\x1f\xb9\xae\x23\
-\x70\x34\x82\xf7\x63\xec\xcc\x2e\x21\x70\xb0\xb5\x6b\x9d\xf3\xcb\
-\x58\xca\x81\x2f\x3c\x6e\xf9\x16\x0c\x9e\x9f\xc8\xa1\xc9\x21\x34\
-\x33\x6c\x6d\x5f\xc0\xd8\x57\xa8\x88\xec\xe6\xf4\x06\x42\x25\x04\
-\x2f\x80\x63\xa7\x93\x83\x41\xec\x23\xe0\x5b\x4b\x9f\x4d\x91\x97\
-\x12\xdf\x3d\xa7\xc9\x84\xbe\x71\xc9\x7c\x04\x47\xaf\x85\xd6\x97\
-\xf8\x2a\x1e\x27\x2c\x90\xa0\x51\x5b\x4b\x7c\xc9\xcb\x86\x82\x4a\
-\x98\x25\x0d\x51\x96\xa4\xd9\x29\x4c\x05\x3b\x58\xf4\xe7\xfb\xfb\
-\x39\xcb\x0c\x83\x8a\xd7\x35\xc4\x5c\xa4\x52\xd1\xb4\x4f\xef\xcd\
-\x8e\x2e\x9a\x7b\x22\xfb\xa4\x19\x7f\x97\x49\x3e\x36\xec\x93\x6e\
-\x7e\x0c\xef\xb5\xfd\xe7\x5c\x85\xdd\x50\x63\xc1\x02\xe0\x5f\x5a\
-\x5e\xce\x4b\x07\xf0\x5c\xcf\xff\x30\xf0\xc8\x60\xa4\x16\x17\x2e\
-\x3e\x8d\xca\x15\x46\x5f\xdc\x94\x29\xe8\xe0\x85\xe0\x98\x50\x89\
-\x4e\x11\x3a\xd1\x71\x61\x62\x81\xe3\x3c\x5a\x4b\xd2\xe7\xdb\xc7\
-\x49\xbd\x62\x6d\xf6\x9c\x80\x26\xe6\x55\x7e\x3a\xf5\xbc\xc5\xb9\
-\x50\x96\xe0\x65\x64\xa6\x5e\x6a\x5f\x44\x64\xe9\xad\x1c\x8f\xa5\
-\x01\x0a\x55\xe2\x3e\xb0\x87\x7e\xa9\x51\x12\x8f\xb8\xcc\xed\x3b\
-\x86\x4f\x65\x09\x60\x73\xfc\xd4\x31\xfe\xcc\xf7\xd7\x14\xdf\x6b\
-\xbd\x9f\xd2\xfd\x31\xbc\x1f\x2b\x0e\x80\x0a\xde\x8f\x20\x20\xec\
-\xd4\xdb\x43\x97\xf3\xcc\xb2\xb9\xe5\x59\x3a\x80\xe7\x74\x7e\x0d\
-\xc0\xc7\xf2\xbb\xe4\x71\xee\xc2\x53\x68\xdb\x1a\x23\xe7\x30\x22\
-\x87\x51\x34\x7e\x28\x43\xd0\xab\x44\x25\x3c\xe9\xc7\x4a\x08\x4e\
-\x00\x2f\x02\xcf\x9a\xea\xbb\xbe\xfe\x5e\xe9\x04\xe2\x20\x4c\x49\
-\x92\xe1\x81\x95\xdd\x83\x86\x4f\xdd\xf4\x5b\x8a\x3f\xad\xf4\x53\
-\xf3\x3e\x42\x5f\x18\x38\x53\xe1\x18\x62\x6a\xee\x06\x5a\x96\x25\
-\xd9\xa8\x6b\xde\x1d\xc9\xe4\x3e\x47\xa1\x48\xf7\xa3\x7c\xa7\x8b\
-\x4e\x80\x28\x09\x7b\x10\x5c\xfe\x47\xea\x00\xbc\xb7\x9a\xdf\x8f\
-\xe0\xfd\x08\xe4\x14\xfc\xf3\x6e\x82\xba\x9d\xa2\x6e\xeb\xa1\xfa\
-\xff\x3e\x00\x9f\x5e\x5e\xce\x4b\x07\xf0\x5c\x4f\x03\xe0\x07\xf3\
-\xbb\x44\x98\xee\x5c\xc6\x45\x2b\x03\x1c\xb4\x0c\xf0\xa4\xce\xa0\
-\x22\x87\x11\xf4\xe6\x63\x39\x00\xfb\x18\x54\x52\x3c\xc6\x39\x87\
-\x3c\xb9\x47\x83\x74\xdb\xb8\xbe\x4b\x3a\xdb\xb1\x3a\xe4\x9e\x48\
-\x9e\x91\x01\xf5\x9b\xf2\xf1\xdc\x8b\xfc\x65\x1d\xde\x77\x18\x3c\
-\x60\xac\xc9\x19\xb9\xa2\xde\xef\xfb\x82\xa2\xed\x28\xb1\x75\x49\
-\x9d\xff\x87\x0c\xeb\x48\x1a\xfe\x14\x2b\x7c\x67\x92\x5e\xae\x48\
-\xfb\x2b\x38\xf8\x82\xef\x1f\x01\xbf\x11\xaa\x6a\x6c\xd9\xc0\x08\
-\xde\x69\xf4\x77\x6e\x84\xad\xfa\x72\xc6\x51\xe6\x4b\xb9\x76\x79\
-\x39\x2f\x1d\xc0\x6f\xe6\xfc\x40\x06\x8f\x08\x08\x2d\x9e\x7a\xf6\
-\x31\x54\xce\x61\xec\x1c\xbc\x65\x02\x15\x1c\xc6\xaa\x49\x93\x9c\
-\x80\x13\x97\x22\xbf\x23\x82\x83\x98\xe1\xdb\x85\x2f\x80\x8b\x1a\
-\x77\x90\x3c\xa7\x6f\x25\x43\xb7\x8d\x86\xe1\xda\x56\xca\x54\xbe\
-\x54\x02\xc6\xfc\xa6\xe0\x64\xf0\x94\xb3\x85\xf4\x3c\xd4\x2d\x07\
-\x62\xce\x1f\x85\x0e\xd3\x86\xa1\xfe\x80\x11\xe7\x15\x67\x69\x92\
-\xaf\x74\x1c\x52\x2c\x4a\xcd\x09\x42\x72\x04\xe4\x32\xc9\xc7\x99\
-\xf1\x3b\x0f\xef\x2a\x63\xf6\x79\x4d\xf3\x2d\xdd\x8f\xc6\xee\xdd\
-\x18\x64\xed\x3f\xe7\xc6\x10\x08\xb6\xa6\x17\x87\xc0\x3f\x74\x9c\
-\xf8\xf2\x2c\x1d\xc0\x73\x3c\x1f\x02\xf0\xeb\xe9\x2b\xef\xf1\xd4\
-\xb3\x8f\x63\xda\xec\x60\xec\xbd\x96\x01\x44\x18\x91\x83\x27\x8f\
-\x11\x11\x3c\xa0\xb8\x00\x99\x13\x70\xce\x44\x45\x55\x4f\xc0\x33\
-\x0c\x0b\x10\x55\x0d\x66\xa4\x68\x4f\x92\xfb\xf1\xc4\x7d\x69\xef\
-\xc2\xd0\x81\x2e\x0b\x0f\xe8\x92\x7d\xb8\x28\x01\x3a\x6d\xf9\xb2\
-\x76\xb7\xcf\x03\x15\x14\xe5\x02\xb0\x4b\xc6\x5f\xa4\xf9\x34\x54\
-\x4f\x48\x77\x33\x71\x99\xf6\x53\xd9\x0a\xec\x96\x00\xa9\xbd\x67\
-\x85\x13\x91\x29\xfa\xb8\x11\xc8\x55\xf0\x66\xdc\x31\xdd\xf7\xde\
-\x0c\x9f\xec\xfb\x6e\xac\xce\xa0\x9a\x60\x67\x76\x09\xb3\x66\x36\
-\x94\xfe\x3f\xbc\xac\xff\x97\x0e\xe0\x73\x2d\x03\xbe\xb7\x44\xb4\
-\x9b\xdd\x6d\x3c\xf1\xec\x67\x31\x1e\x55\xa8\x1c\x29\x28\x18\x81\
-\x41\xf2\x7a\x83\xc3\x48\xf4\xe6\x85\x30\x12\x82\xc2\x55\xea\x20\
-\x9c\x38\x78\xd2\xc8\xef\x60\x11\x3f\x2a\xde\x74\x3e\xa7\xac\x2f\
-\x20\x7d\x0c\x00\x5d\x9c\xa0\x0f\xce\xa5\x52\x21\x1a\x79\xb1\x7e\
-\x1c\x05\x6e\x40\x54\x18\x2a\x75\x33\x85\xb4\xb4\x34\xbe\x30\xee\
-\x61\x09\xf6\x9f\x44\xe9\xb3\xa4\x52\x44\x49\x0b\x51\x6f\x25\xfa\
-\xef\x22\x52\x62\x6c\x3e\xa5\xf6\x3a\x32\x3a\x2f\x29\xbb\x4f\x53\
-\xfc\xb1\x46\x79\x1a\xc1\x91\x19\xbc\xd7\x96\x9f\xf3\x13\x1d\x00\
-\x22\x8f\x8b\x3b\xcf\xcc\x3b\x19\x3d\xff\x1f\x96\x2a\x40\x4b\x07\
-\xf0\x39\x9e\x7f\x07\x60\xbb\x8c\x5e\x0f\x7d\xf6\x33\x68\x43\x8b\
-\xb1\xf3\xf0\xce\xa1\x72\x64\x38\x00\x61\x44\x1e\x15\x39\xc5\x06\
-\x9c\xb7\xec\xc0\xc1\x5b\xdb\x50\x2f\x7f\x49\x32\xe3\xce\x80\x41\
-\x97\x32\x02\x4e\x5d\x83\x0e\x37\x5f\x7a\x48\x7f\xea\xed\x97\xc6\
-\x1a\xfb\xfb\x28\xd8\x7c\x45\xf9\x10\x1f\xcb\x2e\xf7\xf0\xa5\x00\
-\xf9\x62\x79\xd0\x21\xf0\xa0\x37\x3e\x8c\x79\x60\x91\x8a\xfa\x5f\
-\x8a\xc1\x1d\x29\x2f\xb1\x1c\xf5\x15\xc9\x77\x99\xdd\xe7\x0a\x66\
-\x1f\x55\x1a\xf9\x2d\xba\x47\xc4\xdf\x59\xbb\xcf\xfb\x89\x7d\xdf\
-\xa3\xaa\x26\x98\x36\x5b\xb8\x34\xbb\x08\x38\x3f\x54\x20\xfd\x87\
-\xe5\xe5\xbb\x74\x00\x9f\xeb\x79\x00\xc0\x8f\x94\xdd\x80\xad\x4b\
-\xcf\xe2\x89\x73\x9f\xc5\xb8\x1a\xa5\xc8\x3f\x72\x84\xca\xf9\xc4\
-\x0f\x18\x3b\xaf\x99\x01\x3c\xbc\xf3\xd0\x7f\x9a\x29\x78\xc3\x08\
-\xf4\x56\xee\xb7\xe9\x71\x01\xcc\x80\x89\x55\x5a\xb0\xcb\xe9\x2f\
-\x3f\x22\x47\xf4\x50\x7c\x9e\x8c\x97\x72\xad\x0e\xea\x1a\x7f\xcc\
-\x1a\x52\x79\x51\xa8\xf5\x74\x64\xc3\x0b\x6d\x33\x14\xf5\x3f\x0a\
-\x6d\x42\x71\x16\xf9\x4b\x1d\x43\x4a\xd9\x8c\x4b\xa2\x1d\xdd\x94\
-\xdf\x99\x92\x8f\x52\x7b\xad\xc5\x57\x8d\x0b\xe3\xd7\x88\x9f\xd2\
-\xfe\x58\x1e\xb8\x11\xce\x6f\x3d\xa9\x1a\x86\xf3\xe7\x97\x01\xfc\
-\xf4\xf2\xf2\xbd\xf2\x59\x32\x01\xaf\x7c\xbe\x07\xc0\x57\x95\xc8\
-\xf8\xfd\x8f\xdd\x8f\xeb\x8e\x9c\xc6\xd8\xeb\xec\xb9\xc0\x63\x24\
-\x50\x45\x5a\x67\x53\x6d\xec\x55\xfe\x23\x66\xc8\x22\x20\xf1\xb6\
-\x50\x84\x41\xa4\x24\x3b\xd7\xeb\x96\x09\x17\x0b\x46\xcb\xed\xc0\
-\x50\x6d\xfc\x2e\xa3\xb6\xd8\x25\x50\xc2\xf3\x1d\x14\x9e\xe6\xa3\
-\x76\x89\xda\x33\x47\x4e\x72\x76\x1a\xcc\xf3\x08\x3f\x8a\x52\x24\
-\x6e\x45\x31\xe3\x4e\x3b\xd2\xcb\x55\x5d\xe5\x58\x6f\xdc\xdb\xc7\
-\xfa\x7b\x45\xa6\x9f\x8b\x13\x7e\x70\xe6\x20\x94\xdf\xef\x23\xe7\
-\xdf\x6b\x69\x40\x66\xf0\x91\xf4\xe3\xab\x09\x66\xcd\x36\x2e\x6c\
-\x3f\x33\x14\xfd\x01\xe0\xff\x5e\xa2\xff\x4b\x07\xf0\xf9\x3a\x3f\
-\x0a\xe0\x67\x00\xbc\x55\xc1\xc0\x0a\x17\xce\x3d\x85\xc7\x9e\x7d\
-\x1c\x37\x1e\xbf\x1e\x2c\x6c\xc3\x3b\x91\x42\x5b\x15\x2b\xfc\x04\
-\x0d\xc7\xad\xc2\xde\xf2\x73\x67\xf8\x9b\xd8\x50\x8d\x05\x61\x73\
-\x06\x9c\x46\x87\x4d\x89\x98\xd5\x11\x50\xb1\x32\x2c\x6d\x1f\x8a\
-\x51\x36\x7e\x4f\x5c\x57\x36\xbc\xab\x35\x8e\xd4\xa7\x97\x42\x05\
-\x08\x85\x53\x60\xee\x4a\x87\x25\xe3\x2f\xda\x95\x54\x3c\x87\x90\
-\xad\x39\xd7\xb9\x00\x32\xc6\x61\x1e\xe8\x75\xc9\x3f\x91\x08\xc8\
-\xeb\x00\x93\xae\xf3\xf2\x66\xf8\xa4\x06\x6f\x25\x80\x37\x4c\x20\
-\x4e\xfb\x69\xc4\xd7\x56\xa0\x37\x90\xd0\x51\x85\x67\x2f\x3d\xaa\
-\x9a\x03\xf3\x0e\xe0\x89\x0e\x76\xb3\x3c\x4b\x07\xf0\x39\x9e\x00\
-\xe0\xef\x24\x07\x60\x61\xfa\x93\x0f\x7f\x02\xd7\x1d\x3d\x89\x91\
-\xf7\x51\xed\x33\x0f\xe6\xd8\x62\x8b\xb4\xda\x4a\x48\x2f\x7a\x93\
-\x0f\x4c\x1a\x01\x0e\x08\x66\xf0\x44\x94\x86\x87\x38\xf6\xcb\xcb\
-\xa2\x36\x4e\xc8\x39\x4a\x8f\x97\x12\xd5\xef\x80\x78\x40\xb9\x56\
-\x7b\x21\x63\x2f\x1a\x3f\x97\x22\x9d\x34\x1f\xf5\xa3\x43\xa1\xdc\
-\x19\x48\x22\x9d\xa6\xf9\xaf\x3f\xe5\x41\xb6\xfc\x44\xd1\x7d\x01\
-\x39\x0f\x12\x56\xf9\x74\x32\xa3\x97\x3c\xe5\xe7\xe0\xb2\xd1\x93\
-\x57\xcc\xc4\x8f\x8d\x00\x64\x6a\x3f\xd6\xfb\x27\xaa\x50\xf9\x09\
-\x76\xeb\x8b\x38\xb7\xfd\xd4\xa2\xe8\xff\x2f\xa1\xba\x0e\xcb\xb3\
-\x74\x00\x9f\xb7\xf3\x5f\xa0\x9c\xf2\x7b\x63\x16\x70\xf1\xfc\xd3\
-\xb8\xff\xf1\xcf\xe0\xae\xeb\x6f\xd7\xa8\x4d\x19\x2c\xa7\xb8\xf1\
-\x57\x2a\x65\xd3\x4a\x50\xc3\x17\x01\x39\x07\x70\x9b\x76\xdd\x47\
-\x2f\xa1\x25\x02\x15\x1a\x9f\x64\x1d\x3a\x97\xb7\x0f\x95\xd1\x3a\
-\x06\x63\x72\x59\x39\x07\xfa\x75\xca\x10\x92\xc1\x0f\x4c\xe6\x15\
-\xca\xbd\x39\x33\xe8\xd5\x23\x8c\x62\xf3\x91\x3a\xb6\xb8\x8d\x07\
-\x60\x50\x62\x20\x46\x26\x3f\xdb\x40\x13\x59\xaa\x1f\xa3\xbd\xa4\
-\x74\x9f\x10\xc1\x50\x55\xf4\xf1\x36\xe8\xe3\x9d\xd7\xfb\x8c\x0b\
-\xe0\xd2\x6d\x0c\x22\x0f\x4f\x15\x40\x15\xc8\x39\x3c\x75\xe1\x21\
-\x70\x08\x43\x0e\xe0\x3c\x80\x7f\xb4\xbc\x5c\x97\x0e\xe0\xf3\x7d\
-\x6a\x00\xdf\x0d\x25\x07\xa5\x68\xf8\xf1\x07\x3f\x8e\xeb\x8f\x9d\
-\xc6\xfa\x78\x0d\x75\xd3\x9a\xe1\x2b\x05\x18\xe4\x15\xe5\xa7\x4a\
-\xd7\x8a\x9b\x01\x39\x1b\x04\x6a\x00\x10\x13\x9c\x08\x5a\xa8\x80\
-\x48\x28\xea\xe6\x28\x8b\xc1\x92\xe3\x2b\xa8\xb4\x61\xad\xbd\x89\
-\xbb\x6c\x5c\xe2\x72\xca\x4e\xd2\x6e\x3d\x44\x49\x52\x41\x5a\xd1\
-\x15\x65\x37\x73\x94\x97\xbc\xc5\xc8\x48\x7d\xb1\x3b\x40\xaa\x77\
-\x66\xbb\x4a\x39\xbd\x4e\x22\xd7\xd9\x54\x4c\x96\x09\x39\x9b\x02\
-\x74\x4e\x8d\x3d\xf7\x01\x7c\x8e\xfc\x36\xd5\xe7\x4d\xde\xab\x63\
-\xf8\x71\xe8\xc7\xa9\xea\x2f\xb9\x0a\x95\x9b\xe0\xc2\xe5\x47\x71\
-\x61\xfb\xe9\x45\xd1\xff\x1f\x63\xa9\xfe\xb3\x74\x00\xcf\xd3\xf9\
-\xaf\x00\xbe\x1f\xc0\x57\x68\x47\xc0\xa1\xde\xbe\x8c\x8f\xdc\xff\
-\xeb\x78\xc7\xab\xde\x0c\xb6\x6d\xb6\x14\x07\x80\x48\xd3\x7e\x5d\
-\x0c\xaa\x86\xe4\x09\x20\x0e\x66\x44\x0e\xe4\x82\xa6\xc7\xb6\x0d\
-\xc7\x19\x20\xef\x84\xc0\x44\x08\xc9\xe6\x09\x6c\x91\x9e\xa5\x00\
-\xfa\x50\xac\x13\x2f\x41\x3b\x92\xee\xec\x9d\xad\x07\xa3\x52\x6e\
-\xbb\x94\xe1\x32\x07\x41\x26\x79\xa6\x22\xa6\x1a\xe1\x59\x54\x8a\
-\x5b\x7f\xe7\xa0\xed\xca\x34\xd2\xeb\x8b\xe7\x75\x69\x3b\xaf\xf3\
-\x92\x98\x8e\x0e\x5e\x8b\x03\x03\xfe\xbc\x95\x01\x9e\x48\x8d\xdf\
-\xa2\xbe\x73\x4e\x39\x00\xce\x52\x7f\x53\xfe\x21\xa3\x05\x7b\x37\
-\x46\x08\x35\x1e\x3f\xf7\x69\x0c\xaf\x49\xc6\x23\x00\xfe\x8f\xe5\
-\x65\xba\x74\x00\xcf\xe7\xf9\xb3\x00\xde\x05\x60\x2d\x96\x02\x0f\
-\x3f\xfe\x00\x1e\x3a\x71\x1a\x37\x9d\x38\x8b\x69\x5d\x1b\xb5\x37\
-\x2d\x02\x56\x23\x60\x02\x71\x40\x6b\x56\xee\x98\x40\x14\xe0\x04\
-\x68\xc5\xf0\x70\x66\xb4\x02\x04\x61\xc5\x03\x2c\xa9\x57\x72\x1f\
-\xa5\x09\x7a\x82\x33\x3d\x82\xae\xb4\x86\x20\xef\x2c\x24\x90\x01\
-\x8f\x11\x85\x47\xd2\x13\x88\xca\xba\x92\x14\x77\x4d\x9b\x80\x4b\
-\xd0\x2f\xf2\x03\x74\x11\x8a\xae\x45\x32\x47\x46\xbe\x28\x39\x38\
-\xcd\xf3\xa7\x66\x85\x13\x1b\x8a\x32\xbd\x7e\x91\x6c\xf8\x14\x51\
-\x7f\xb2\xba\x9f\xac\xd6\xcf\xa5\x40\x8c\xfe\x69\x1c\xd8\x9e\xc7\
-\xbb\x0a\x8f\x3d\xfd\x31\x4c\x67\xdb\x80\x1b\xbc\x6c\xff\xfc\xb2\
-\xf6\x5f\x3a\x80\xe7\xfb\x7c\x04\xc0\x5f\x02\xf0\x57\x12\xbc\x1d\
-\x18\xbf\xf4\x89\x5f\xc5\xd1\x03\x87\xb1\xb9\xb2\x8e\x3a\xb4\xa9\
-\xbf\xdf\x32\x25\xc9\x2e\xef\x1c\x6a\x71\x70\x4c\x70\xec\x40\xe2\
-\xe0\xd9\xa1\x11\x41\xc3\x01\xce\x34\x04\xe3\x9e\x41\x16\xdb\x1a\
-\x0e\x20\x08\x59\x16\x00\x9d\x2a\x20\xcd\x08\x84\x24\xc9\x8f\x48\
-\x09\x14\xda\x68\xad\xa4\xdd\x00\xe6\x40\xca\x6d\x40\x70\x26\xc1\
-\x6d\x0c\x3d\xc7\x10\x71\x99\xf8\x17\xb3\x88\xb8\xda\xdc\xd2\xf8\
-\xd8\x9e\x24\x89\x59\x88\x83\x33\x45\x22\x6f\x1d\x82\xd8\xf3\x77\
-\x62\x72\x5e\x56\xf9\x6b\xd4\x8f\x9f\x67\x26\xa0\xa7\xa8\xf7\x6f\
-\x3f\x57\x44\x7f\x80\xe0\xfd\x18\x17\x2e\x3e\x86\xa7\xce\x3f\xa2\
-\x0e\x68\xfe\xfc\xb4\x81\x7f\xcb\xb3\x74\x00\xcf\xfb\xf9\x9b\x00\
-\xbe\x0c\xc0\x17\x68\x16\xe0\xb1\x73\xf9\x02\x7e\xe1\xe3\xbf\x82\
-\x77\xbd\xee\x6d\x18\x91\x07\x31\xe7\x21\x17\x0e\x70\x8e\x10\x44\
-\x75\xed\x3d\x13\x1c\x07\x38\x76\x68\xc9\xc1\x09\xc3\x91\x53\x9d\
-\x3f\x16\x04\x88\x2e\xe6\x41\x26\xf6\x79\x00\xcc\x26\x49\x6e\x99\
-\x00\x83\xb2\x32\x11\xb2\xc2\x90\x10\x67\x7d\x5d\x57\x15\x0a\xbd\
-\x64\xcf\xa4\x2a\x45\xc2\x92\x3b\x86\x4c\x71\x8f\x09\x50\x46\x76\
-\xe7\x12\xd1\x88\x20\x20\x32\x21\x13\x05\x33\x52\x5f\xdf\xc5\xd4\
-\x3f\x41\x7c\x4a\x79\x26\x63\x42\x3a\x88\x45\x7f\x1b\x9d\x76\x1e\
-\x64\xd3\x94\x64\xd1\x3f\x0b\x80\xe8\xd7\x48\x3b\x00\x47\xa8\xeb\
-\x2d\x3c\xfc\xc4\xc7\x8a\xd6\x67\xe7\xec\x00\xf8\xa3\x58\xf6\xfd\
-\x97\x0e\xe0\x05\x04\x04\xff\x00\x94\x1b\xb0\x3f\x96\x02\x8f\x3e\
-\xf6\x19\x7c\xe4\xe0\x21\xbc\xee\xf6\x57\x01\x4d\xab\x14\x5f\x52\
-\x65\xa0\x20\x84\x20\x62\x43\x41\x4e\xc5\x43\x38\xa0\x65\x87\x9a\
-\x19\x5e\x04\xad\x30\x9a\x10\x54\x85\xcb\xa9\x98\x08\x73\xcc\x02\
-\x08\xec\xc9\x5a\x86\xce\xc0\x42\xdd\x53\xa0\xa9\xbf\xeb\x0e\xfe\
-\x49\x54\x1c\x2e\x6a\x11\x89\xd0\x62\xda\x66\x9a\x3b\x01\xa4\x5c\
-\x06\x72\xd0\x7d\x88\x20\x93\x31\x73\x20\x8f\xd4\xb1\x20\x16\x88\
-\x84\x14\xf1\xc9\x2b\xe6\xe1\xc8\x40\xbe\xa8\x73\x4a\xde\xd2\xfc\
-\x9c\x19\xb8\xd8\xf6\x73\x50\x2a\xb0\xb5\xff\xe2\xa6\xdf\xc4\x12\
-\x4c\xd8\x02\x8c\x50\x24\x78\xf0\xf1\x8f\x62\x36\xdb\x01\xfc\xe0\
-\xe5\xfa\x17\x00\x7c\x78\x79\x59\x2e\x1d\xc0\x0b\x79\x3e\x06\xe0\
-\xf7\x01\xf8\xd7\x88\xab\x6b\x9d\xc3\xaf\x7e\xfc\x23\x38\xb4\xff\
-\x20\x6e\x3d\x7d\x3d\xa6\x4d\x0d\x07\x18\xd0\xa5\xc6\x4b\x96\xfe\
-\xb7\x12\x47\x86\x19\x9e\x19\x75\x08\xfa\xb5\xf7\x08\xc2\x68\x19\
-\x68\x45\xd0\x8a\xc0\xc7\x1d\x1d\x70\x08\xa2\xe9\xb7\x47\x5e\x52\
-\xc2\x92\xd5\xf5\xd8\xd6\x6e\x89\x5a\xad\xde\x5f\x21\x4b\x85\x59\
-\x9d\xa0\x0e\xa2\x98\x27\xa6\x00\x87\x38\xd6\xeb\x0c\x5f\x14\x08\
-\xb3\xc6\x73\xd2\x59\x05\xf2\x9c\x86\x0c\x1d\xe5\x72\x41\xbf\xae\
-\x34\xa2\x8b\xa8\xae\x29\xe9\x0e\x45\x7d\x0f\xd4\xac\x2b\x73\x00\
-\xaa\x07\x90\x59\x80\x91\x1e\x1c\x17\x7f\xc6\x69\x44\x4f\x1e\x0f\
-\x3d\xfa\x11\x5c\xb8\xf8\x04\xe0\x47\x43\x7f\x87\x1f\x07\xf0\xb7\
-\x96\x97\xe3\xd2\x01\xbc\x18\xe7\x7b\x01\xbc\x02\xc0\x77\x59\xbe\
-\x0d\x09\x01\x3f\xfd\xcb\x3f\x87\xf5\x95\x15\x9c\x3e\x7a\x3c\x39\
-\x01\x26\x8d\xa8\x4e\x1c\x82\x30\x3c\x9b\x84\x18\x33\x2a\x61\x33\
-\x7c\x41\xcd\x01\x2d\x0b\x46\x00\x1a\x56\x07\xa0\x52\x82\x02\x06\
-\x99\xfa\xb6\xa5\xfe\x20\x84\xc2\x11\x68\x17\xde\x3e\x1a\xbd\x57\
-\xb5\xff\xe2\x02\x13\xd1\x4d\xc5\x46\xcd\x8d\xd3\x87\x02\x86\x88\
-\x19\xba\x64\x4e\x82\x52\x7e\x59\x31\x0c\x23\xf2\x44\x6c\xc1\xd9\
-\x36\x04\xd5\x35\x70\xd6\x52\xb4\xe9\x46\x10\xbc\x8b\xdf\xb3\xe8\
-\x4f\x96\x09\xb8\x18\xed\x29\xcb\x7d\x97\x92\x60\x49\x9e\x8c\x50\
-\xb9\x11\x1e\xfb\xec\x27\xf0\xf8\x53\xf7\x2f\x02\xfd\x1e\x05\xf0\
-\xad\x58\xee\xfc\x5b\x3a\x80\x17\xf1\x7c\x37\x80\x3b\x00\x7c\x30\
-\xe2\x01\xb3\x9d\x6d\xfc\xd8\x87\x7e\x12\xef\x7d\xc7\xbb\x70\xf4\
-\xc0\x41\xcc\xda\xc6\x68\xbd\x16\xcd\x41\xf0\xec\xe0\x44\x50\x31\
-\xa3\x15\x41\x05\x46\xcb\x82\x8a\xd5\x11\xb4\x22\xf0\x41\xec\x73\
-\xb5\xc5\x56\x04\x2c\xce\x86\x01\x0d\x14\x34\xb2\x10\x47\x27\x60\
-\x8e\x21\xcd\x13\x78\xb2\x5d\x1d\x02\xe1\x56\xb9\x08\x16\xd9\xc9\
-\x79\x30\x5b\x4d\x2f\xba\xd5\x88\x44\x41\x3c\x62\x40\x3c\x6b\x4a\
-\x4f\xb1\xff\x6f\x69\x3a\x4b\x72\x37\x0e\x5a\x1e\x38\xe8\x3e\x44\
-\x47\x92\xba\x01\x24\x85\xf1\x47\xb5\xf3\xa4\xf3\x5f\xc8\x81\x49\
-\x1e\x47\xd6\x26\x06\xc1\xbb\x11\x9e\x7c\xea\xd3\x78\xf0\xb1\x5f\
-\x43\x6e\x79\x76\xce\x0c\xc0\xef\xc2\x72\xe5\xd7\xd2\x01\xbc\xc8\
-\x87\x01\x7c\x0b\x80\x43\x88\xdb\x84\xaa\x0a\xdb\x97\x2f\xe2\x47\
-\x7e\xee\x27\xf1\x15\xef\x7c\x17\xf6\x6f\x58\x67\xc0\x50\x7c\xd5\
-\x09\x04\x3c\x04\x81\x55\x39\x28\x88\xa0\x12\x75\x02\x41\x04\x0d\
-\x0b\x46\x15\x2c\x03\x10\x04\x98\x6e\x08\xeb\x1a\x71\x16\xcb\x06\
-\x12\x0e\x90\xcb\x01\x10\x81\x59\x0d\x4a\x1c\x20\xec\xc0\x10\x40\
-\xc6\x10\xa1\xd4\xfa\xeb\xa8\x75\x73\xd0\xe8\xcb\x92\x3a\x03\x80\
-\xf6\xf2\x63\x7b\x41\x97\x90\x14\xb9\x06\xc5\x88\x6f\x37\x12\x78\
-\x17\x71\x7b\x9b\x61\x8a\xdb\xce\x28\xaa\xfe\x46\x06\x81\xcd\x08\
-\xd8\xbd\x62\x43\x45\x22\x40\xe5\x46\x78\xe6\xd9\x87\xf1\xe9\x07\
-\x7f\xc9\xd6\x7c\x0d\x0e\xac\xfe\x61\x00\x3f\xb6\xbc\xfc\x96\x0e\
-\xe0\xa5\x70\x2e\x01\xf8\x7a\x28\x51\xe8\x75\xfa\xae\x8e\x70\xe1\
-\xd9\xa7\xf0\x43\x3f\xf3\x13\x78\xff\x3b\xbf\x08\x1b\xeb\xab\xa8\
-\x43\x00\x03\xf0\xe4\x10\x98\xe1\x49\x37\xfd\x54\xc2\x26\x0a\x24\
-\x29\xfa\x8f\x92\xd1\x0b\x5a\xdb\x2c\xd4\xa6\x3d\x9d\x64\x6d\x42\
-\xb2\xe9\x5f\x6d\x0b\xea\xb6\x2e\xc3\x04\x62\xaf\x5f\x08\x52\x65\
-\x26\xa1\xd8\x68\xb0\xf2\x82\x8a\xa8\x2a\x59\x98\x44\x45\x3c\xba\
-\x22\xa5\x71\x77\x9f\xa2\xf9\x51\xd6\x1c\x70\x4e\xbf\xef\x29\xfd\
-\x0f\xa9\xfe\x8f\x8b\x4a\x5c\xd2\x04\xec\xd2\x9c\xa3\xc1\x03\x36\
-\x1f\x21\x40\xe5\xc6\x38\x7f\xee\x31\xfc\xc6\xfd\x1f\x42\x08\x5c\
-\x6c\x4d\xea\x9c\xef\x04\xf0\x4f\x96\x97\xdd\xd2\x01\xbc\x94\xce\
-\x53\x00\x7e\x1b\x54\x3b\xe0\x76\x00\xc0\x68\x8c\xa7\x9e\x78\x1c\
-\xff\xe5\x7f\xfe\x77\xbc\xef\x0b\xbe\x10\x87\xf7\xef\xc3\x34\xb4\
-\x00\x01\xde\x7b\x30\xb4\xae\x67\x38\x70\x4a\xf5\xc5\x22\xbc\x68\
-\x36\x00\xb1\xa8\x2f\x85\xf1\x8b\xf2\x02\x12\x08\x88\x84\x0f\xb0\
-\x74\x92\x73\x73\x04\x76\xbf\x71\x04\xc4\x70\x04\x92\x3c\x35\x2c\
-\x46\x0b\x8e\x7a\x84\x14\x67\x05\x90\x35\x0b\x89\x4c\xb0\xa4\x48\
-\xf3\xe3\x7e\x03\x47\xe8\x38\x80\xf8\x1c\x51\x1b\xc0\x15\x02\x21\
-\x71\x4e\x81\xe2\x30\x22\x03\xf0\x80\x77\x23\x3c\xfd\xd4\x43\xf8\
-\xc4\x27\x7e\x0e\x4d\x53\x2f\xa2\xfa\xfe\x15\x00\xff\xfb\xf2\x72\
-\x5b\x3a\x80\x97\xe2\x79\x18\xaa\x1b\xf0\x23\x00\xce\xa8\x13\x18\
-\xe1\x99\x27\x9e\xc0\xf7\xfd\xe8\x8f\xe0\x7d\x5f\xfc\x45\x38\x7d\
-\xec\x08\xa6\x6d\x63\x1b\xb5\xa8\xa3\xe7\x31\x12\xa8\xa1\x8b\x14\
-\x52\x81\x92\x0c\x9c\x4b\xb1\xe0\x18\xfd\x59\x31\x80\xc0\x94\x78\
-\x00\x11\x1f\x08\xd1\x19\x48\xe4\x06\x92\x4d\xf3\x6a\xb6\x50\xae\
-\x27\x8c\x59\x40\xa9\x31\x10\xb1\x81\x94\xe2\x17\x06\x1f\x8d\x3d\
-\xdd\x22\x4f\x20\xfd\xb8\xe4\x49\x48\xbb\x4f\x90\x65\xcf\x32\x63\
-\x59\x00\xaf\x74\xe1\xc7\x1f\xfd\x34\x3e\xf9\xc9\x9f\x43\x18\x1e\
-\xf2\x01\x80\x3f\x07\x65\xfb\x2d\xcf\xd2\x01\xbc\x64\xcf\xc7\x2d\
-\x13\xf8\x7e\x00\xc7\xa3\x13\xb8\x70\xfe\x1c\xfe\xf3\x0f\xff\x30\
-\xde\xf7\xc5\x5f\x84\x5b\xce\x9e\xc1\xb4\xa9\xd3\x5a\xbd\x18\x9c\
-\xb9\x7f\x4b\x32\x80\x82\xb8\x47\x28\xa4\x96\x20\x75\x70\x80\x60\
-\x4e\x42\xac\xb6\x16\x4b\xaf\xe3\xe3\xf2\x88\x91\x39\x81\x62\x2f\
-\x11\x3a\xc3\x82\x59\x0a\x2c\xd6\xfb\x28\x40\xc2\x88\xfe\x5b\xd1\
-\x5e\x30\x09\xbb\xda\x86\xea\x38\x28\x09\x8b\x88\xad\x25\x8f\xaf\
-\x8b\x58\x20\x24\x20\xd1\x36\xe0\x83\x0f\xdc\x87\x4f\xfd\xc6\x2f\
-\x6a\xcd\x3f\x6f\xfc\x35\x80\x3f\x01\xe0\xef\x2e\x2f\xaf\xa5\x03\
-\xb8\x16\xce\x2f\x40\x07\x86\xfe\x63\xca\x04\xaa\x0a\xdb\x97\x2f\
-\xe3\xfb\x7e\xe8\x47\xf0\x45\x6f\x7f\x0b\x5e\x7b\xd7\xed\x10\x30\
-\x1a\x1b\xbe\x49\x92\x7c\x36\xf1\xc7\x45\x66\x10\xd2\x6a\x3f\xca\
-\x8e\xc1\x7a\xfc\x99\x1d\x68\xdf\x97\xf8\x1c\xd6\x94\x8b\x6d\x43\
-\xa3\x2a\x30\x53\x52\xea\xee\xcb\x0d\x52\x24\x0b\xa5\x68\xee\xc1\
-\xa2\xc5\x84\x14\xea\xbf\x0a\x01\xe4\x41\x22\xb1\x96\x83\xc4\xb2\
-\x21\x6d\x23\xd6\x5a\x3f\xee\x14\x94\x40\x69\x8f\xa1\x38\xe5\x0d\
-\x70\xd3\xe2\x93\x9f\xf8\x30\x1e\xfa\xcc\xaf\x21\x72\x29\x7a\xe7\
-\x21\x00\xdf\x86\x52\x96\x6d\x79\x96\x0e\xe0\x1a\x71\x02\xef\x03\
-\xf0\x9f\x01\xdc\x18\x9d\xc0\x6c\x36\xc5\x0f\xfe\xe8\x8f\xe3\xb3\
-\x4f\x3d\x8d\x2f\x79\xfb\x1b\xb1\xbe\x36\xc1\x2c\xb4\x10\xa7\x8c\
-\x99\x38\x6e\x2f\x14\xb5\x00\x28\x6b\x7b\x12\x65\xd5\x6f\xa7\x1e\
-\x23\x98\xd1\x0b\x69\x19\x00\xea\x27\xe8\xd9\x01\xc4\xe8\x9f\x54\
-\x01\xd2\x86\x6e\x4a\xe0\x9f\x2e\x3c\xb5\xc1\x61\xd1\x35\xe8\x59\
-\x0d\x9c\x4d\x48\xa8\xbb\x9f\x30\x6d\x4b\x66\x7d\x3c\xe2\xf6\x60\
-\xb1\x9d\x83\x24\x60\x97\xe9\xc7\x02\xad\xf7\xb7\x2e\x5e\xc4\xaf\
-\x7f\xe4\x67\xf1\xcc\x93\x0f\x29\xc3\x6f\xbe\xd5\xf7\x53\xd0\x0e\
-\xcb\x72\xb5\xf7\xd2\x01\x5c\x93\xe7\x23\x00\xde\x0b\xe0\xff\x05\
-\xf0\x2a\x00\x80\x57\x6a\xeb\xaf\xfe\xf2\xaf\xe2\xc9\xa7\x9f\xc6\
-\xfb\xbe\xe4\x0b\x70\xc3\xf5\xc7\x51\xb7\xad\xa9\x01\x11\xc4\x47\
-\x81\x9f\xc8\xed\x47\x6a\xef\x25\x01\x60\x98\x83\x00\x69\x06\x61\
-\x65\x00\x39\x97\xe6\x04\x62\xca\xcf\xb6\xf7\x8f\x25\x63\x00\xa5\
-\xfc\x9f\x74\xf6\x8f\x48\x92\x24\x8b\xdf\xd4\x32\x41\x14\x6f\x88\
-\x8e\x20\x14\xdf\x17\x51\x83\x4f\x8b\x46\x05\x21\x98\xb1\x3b\x80\
-\x5b\x01\x09\xeb\x70\x93\x53\xca\xf0\x63\x0f\x3d\x80\xfb\x3e\xf2\
-\x73\xd8\xdd\xbe\x08\x54\x73\x0c\xbf\x1d\x00\x7f\x1d\xc0\x5f\x03\
-\xb0\xbb\xbc\x8c\x9e\xdf\x43\x32\xac\xa9\xfe\xf9\x79\xf2\x2f\x5c\
-\x62\x36\x00\x8e\x41\xe7\xd4\x3f\x08\x60\x9c\xee\x6d\x1a\x4c\xd6\
-\xd6\xf1\x45\x6f\x7f\x23\xde\xfc\xba\xbb\x30\x9e\x78\xd4\x6d\xd0\
-\x79\x1d\x6f\x91\x5c\x19\x36\x56\x0e\x44\x36\x0d\xd2\x50\x50\xcc\
-\x16\xa2\xd1\x3b\x52\x96\x60\x04\xfe\xe2\x3c\x80\xd8\x3c\xbf\x4e\
-\x04\x53\x16\x04\x2a\x3e\xaa\xcd\xab\x41\x67\xf5\x30\xfb\x9a\xd5\
-\xc8\xa3\xa1\x07\xe3\x0b\x70\xb0\xfb\x82\x46\xfd\x20\x02\xb4\x0c\
-\x61\x75\x24\x1c\x04\xdc\x6a\x56\xe1\x5d\x85\xad\x8b\x5b\xf8\xc4\
-\xaf\x7d\x18\x0f\x3e\x70\x9f\xe2\x03\x7e\xae\xde\xff\x11\x00\x7f\
-\x08\xc0\x27\x97\x97\x4d\xf7\xc8\xff\xf8\xee\x65\x06\x70\x8d\x9e\
-\xa7\xa0\x23\xc4\x6f\x00\x70\x4b\xba\x77\x34\xc2\x6c\x3a\xc5\x0f\
-\xfe\xd0\x8f\xe3\x13\xf7\x7f\x06\xef\x79\xd7\x5b\x70\xf3\x0d\x27\
-\xc0\xc2\x68\x85\x8d\x47\x6b\xe9\xbe\xa3\xc4\xac\x91\xa2\xc9\xce\
-\x46\xcd\x55\xc9\x7f\x97\x14\x89\x54\xe0\x87\x12\x1e\x10\x41\x40\
-\xb6\x5e\xbc\x80\xb2\xf0\x2f\x72\xea\x0f\x21\x04\x93\x1b\x57\x23\
-\x56\xdc\x00\x16\xd1\xd5\xa8\xed\x7b\x2c\x60\xaf\x2b\xc4\xd9\xa9\
-\xb8\x29\xb5\x80\x54\xca\x44\x44\xd0\x32\xa3\x9a\x8c\xb0\x3b\x0d\
-\x78\xf4\xd3\x9f\xc2\xc7\x3f\xf2\x8b\xd8\xba\xf0\xb4\x46\x7d\x3f\
-\x88\xf4\xef\xb3\xac\xa9\x42\xb9\x9c\x75\x79\x96\x19\xc0\x35\x5a\
-\x5e\x7d\x39\x94\xb2\xfa\x25\x00\x36\x16\x3e\xb2\xae\x51\x4d\x56\
-\xf1\x86\x7b\x5f\x85\x2f\x7c\xc7\x6b\x70\xe2\xf8\x41\x04\x69\xd1\
-\x0a\x83\x9c\x32\xfa\xe0\x09\xe4\x5d\xb1\xc4\xc7\x75\x9c\x02\x15\
-\x65\x83\xda\xb6\x2b\x96\x04\x97\x8b\xb9\x29\xef\x11\xa1\xd4\xee\
-\x07\xb3\xd8\xfe\x0f\x35\xf2\xf8\x75\x4c\xf1\x39\xe4\xf4\x9e\x59\
-\xc1\x3c\x66\x06\x07\x20\x04\xd6\x68\x5f\xdc\x40\x1e\x6d\xf0\x38\
-\xff\xe8\x83\xe0\xcf\xfe\x3a\x3e\xfc\xf1\x07\xf1\xec\xb9\x1d\x60\
-\xb2\x92\x7b\x90\x58\x78\xed\xcd\x00\xfc\x30\x74\xd8\xea\xbf\xa2\
-\x5c\xce\xb2\xcc\x00\x96\x0e\xe0\x25\x7e\x36\x00\x7c\x2d\x14\xbd\
-\x7e\xe3\xde\x7f\xd5\x62\x81\xa6\xd7\xdb\xc6\xa1\x4d\xbc\xe9\x15\
-\xb7\xe0\x2d\xaf\xbb\x07\xa7\x4e\x1d\x02\x4b\x40\x2b\x41\x79\xfc\
-\xf6\x38\x71\x5a\xef\x6b\x89\x60\xb5\x3f\x99\xd1\x47\x6d\x31\x24\
-\x1e\xae\xd5\xf8\xa6\x28\x64\x19\x42\xda\x1d\x12\xc4\xb0\x02\xfd\
-\x3c\x18\x88\x27\xa2\xe9\x3b\x0b\xd4\xe8\x83\x45\x7b\x73\x02\xa1\
-\x8d\x0e\xc1\x1c\x40\xab\x8e\x83\x9c\x47\xdb\x12\x9e\x79\xf8\x61\
-\x7c\xf6\x57\x7f\x0a\x5b\x9f\xf9\x25\x6c\x8e\x5b\x1c\x3f\x7d\x0a\
-\xcf\xd4\x63\xfc\xea\xa7\x2f\x60\xa7\xa9\x80\xb5\x75\x1d\xf2\x29\
-\x81\x88\xe1\xf3\x49\xe8\x86\xa6\x7f\x0b\x5d\xf7\xbd\x74\x00\x4b\
-\x07\xf0\x92\x35\xfc\xff\x1f\x80\x3f\x08\x9d\x12\xbc\xb2\xd1\x4f\
-\x2a\x60\x6d\x0c\xac\x8e\xb5\xf6\x9f\xee\x00\x97\xce\x03\xbb\x53\
-\xac\x6f\x1e\xc0\x1b\xef\x7d\x0d\xde\xfe\x96\xd7\xe2\xec\xf5\xc7\
-\x00\x27\x68\x42\x88\x53\x36\x56\x16\x10\xc8\xeb\x4d\x22\xf9\xde\
-\x95\x3c\xdc\x62\x1f\x40\x1c\x0f\x26\x2a\x6a\xfe\xbc\xe4\x47\xa3\
-\x3c\x8a\x34\x3f\x46\x77\x8d\xf8\x1c\x2c\xfa\x07\xbd\xbf\x6d\x19\
-\x21\xe8\xfd\x2c\x04\x47\x15\xea\x19\xe3\xf1\xfb\x1f\xc0\x03\x3f\
-\xf7\xe3\xb8\x78\xff\x87\x51\xf1\x14\x93\xb5\x35\x8c\x46\x23\x38\
-\xe7\x70\xf8\xc0\x06\x36\x37\xd6\xf0\xeb\x9f\x78\x1a\x9f\x7c\xe4\
-\x1c\xb0\x79\x10\xd8\x77\x00\x18\xaf\xa5\x09\xc5\x94\x92\xcc\x9f\
-\x5d\x00\x3f\x64\x59\xc1\x7f\xfb\xad\x06\x10\x2e\x1d\xc0\x4b\xf7\
-\xac\x02\xf8\x26\x33\xfc\xbb\x86\xff\x7a\x66\x6d\x8e\x80\xc9\x08\
-\x58\x37\xa3\x9f\x54\x7a\x5f\x3d\x03\xb6\xb6\x81\x7a\x0a\x70\xab\
-\xa4\xff\xa6\x06\xa6\x33\x4c\x36\xf7\xe1\xde\xd7\xdc\x8d\xb7\xbc\
-\xe1\x35\xb8\xed\xb6\xeb\xb0\xb9\x39\x41\x60\x2d\x0f\x92\x5c\xb7\
-\x39\x02\x38\xd8\xc7\x8c\x1b\x90\x23\x9b\xb0\xb5\x56\x60\x6f\x47\
-\x48\x30\x16\x52\x30\x14\x5f\x11\xfc\x68\xf8\x92\x9c\x40\x30\x40\
-\x4f\x3f\xb7\xbd\xa1\xce\x83\x83\xc7\x85\x73\x97\xf1\x99\x8f\xde\
-\x87\xfb\x7f\xfe\xa7\xf0\xd4\x27\x3f\x0c\x1f\x76\xb1\xba\xbe\x8e\
-\xc9\x78\x82\xd1\x78\x84\x51\x55\x61\x34\x52\xe9\xef\xc9\xb8\xc2\
-\xc9\x63\x87\x70\xfe\xd9\x1d\xfc\xc4\xcf\x7d\x12\xd3\x96\x81\xfd\
-\xfb\x80\xf5\x7d\xc0\xea\x26\x50\xad\x6a\x5a\xb3\x77\x56\xf0\x71\
-\x68\x77\xe5\x7b\x01\xfc\xc6\xd2\x01\x2c\x1d\xc0\x8b\x75\xbe\x12\
-\xaa\x07\x70\xef\xe0\x77\xe3\xe6\x9d\xb1\x07\xd6\x27\xc0\xe6\x8a\
-\x3a\x80\xb4\x49\x97\x81\xba\x06\x66\x33\x68\x2e\xdd\xc2\xc2\x2b\
-\xac\x10\x07\x9a\x19\xb0\x3b\x05\x46\x23\xdc\x78\xf6\x06\xbc\xe6\
-\xde\x57\xe2\xb5\xaf\x79\x05\xae\xbf\xee\x08\x36\x36\x57\xc0\x60\
-\x04\x66\x6b\x1d\xda\xde\x01\x8f\x5c\x32\xb8\xe2\xf3\x84\x13\x58\
-\xfd\x2f\x79\x61\x70\xe0\x1c\xe9\x39\xd8\xd7\x6d\xae\xf9\xd9\xb6\
-\x0d\x93\xf7\x68\x1a\xc2\xd6\x85\x1d\x3c\xf8\x89\x47\xf0\xc9\x0f\
-\x7d\x08\xf7\xff\xd2\x87\x70\xf1\xb1\xfb\xe1\xa9\xc5\xea\xda\x3a\
-\x46\xe3\x09\xaa\xaa\xc2\x78\x54\x61\x32\xaa\x30\x1e\x8f\x31\x1e\
-\xe9\xd7\xde\x7b\x38\xef\x70\xe8\xc0\x06\xc6\xd5\x18\x3f\xf3\xf3\
-\x9f\xc2\xa3\x8f\x9f\x07\x56\xc6\xc0\x68\x04\xac\xad\x02\x6b\xfb\
-\x81\xc9\x3a\x40\xa3\xee\x0a\xb4\xf9\xb3\x05\xdd\x02\xfc\x7f\x43\
-\x37\x38\x85\xa5\x03\x58\x3a\x80\x17\xe2\xbc\xd5\x0c\xff\xdd\x0b\
-\x0d\xdf\x91\x46\xf9\x8d\x15\x60\x63\x02\x8c\x7c\xb6\xb8\x48\xc2\
-\x0f\x2d\xd0\xb4\x66\xf0\x9c\x9d\x40\x68\x2d\x13\x90\xc2\x29\xd4\
-\x9a\x29\xb4\x84\xea\xc0\x21\x9c\xbd\xf9\x36\xdc\xfd\xca\x1b\x71\
-\xe7\xed\x37\xe0\x96\x1b\x8f\x60\x63\x73\x15\x1b\x1b\x23\x38\x07\
-\xb4\xcc\x08\x36\xf2\x4b\x85\xd1\xc3\x15\x0e\xc0\xca\x03\x11\x31\
-\xa1\x11\x25\xf2\x04\x23\xf4\x88\xb1\x92\xc8\x03\x4d\x03\x5c\xbe\
-\xd0\xe0\xc2\x33\x97\xf0\xa9\x5f\x7b\x18\xf7\x7f\xe4\xd7\x71\xff\
-\x47\xee\xc3\xd3\x0f\x3f\x00\x99\x6e\xc1\x8f\x3c\xaa\xca\xa1\x22\
-\x41\xe5\x49\x3f\xaf\x3c\x46\xa3\x0a\x2b\xe3\x31\xc6\xa3\x91\x39\
-\x80\x11\x46\xa3\x0a\xa3\x71\x05\x47\x0e\xeb\x6b\x13\x1c\x3d\xb4\
-\x1f\x1f\xfe\xe8\x23\xf8\xe8\x47\x1f\xd2\xf7\xcb\x39\xa0\xaa\x80\
-\xc9\x18\x58\xd9\x50\x47\xe0\x27\x79\x6f\xc1\xe2\xf3\xf3\x00\xfe\
-\x19\x94\x81\x79\x7e\xe9\x00\x96\x0e\xe0\xf9\x38\xd7\x01\xf8\x33\
-\x00\x7e\x37\xfa\x2d\xd4\x58\xbf\x3a\x07\x6c\xae\x02\xfb\x57\xf5\
-\x82\xa6\x22\x13\x60\x6b\xef\x55\x26\xd6\xd9\x5a\xb4\x6f\xcc\xc8\
-\x03\x67\x83\x8f\x8e\x20\xd8\xaa\x21\x3f\x06\xaa\x09\xe0\x46\x3a\
-\x44\xd0\xd4\x40\xdd\x02\xa3\x0a\x9b\x6b\x13\x9c\xbd\xee\x14\x6e\
-\xbd\xf9\x08\x4e\x9d\x38\x86\xb3\x37\x1c\xc7\x99\xd3\xeb\x58\x99\
-\x4c\x30\x5a\x19\xa3\x1a\x03\x63\x5d\x52\x84\x11\xba\x72\xe2\xc1\
-\x20\xf7\x00\x60\x16\xf4\x69\x67\xb3\x1a\x5b\x97\x77\xf1\xe0\x03\
-\x17\xf1\xf8\x67\x1e\xc2\xe3\x0f\x3c\x8c\xfb\x7f\xfd\x11\x3c\xf9\
-\xd0\xfd\x98\x9e\xbf\x04\xd4\x3b\xc0\xa8\x02\xc6\x13\x55\xf6\x25\
-\xca\x55\x87\x13\x54\xc4\x18\x79\x60\xe4\x09\xe3\x71\x85\x51\x55\
-\x61\x65\x62\x8e\x60\x5c\x61\x32\x1e\xa1\xaa\x2a\x54\xbe\x82\xf7\
-\x84\x33\x27\x0e\xe3\x13\xf7\x3f\x89\x9f\xfa\xc5\xfb\xb5\x3d\x38\
-\x1a\xe9\x4c\x80\xb7\xf7\x6a\x65\x4d\x1d\x81\xbb\x2a\x47\xf0\x20\
-\x80\x7f\x0e\xe0\x9f\x42\xf7\x04\x2e\x1d\xc0\xd2\x01\x7c\x5e\xce\
-\x37\x43\xf7\x02\x9c\x9d\x03\xf5\x58\x34\xc2\xef\x5b\x05\xf6\xaf\
-\x03\x2b\x15\xf2\xb2\xcd\x82\x70\x3f\xb2\xc8\xc6\xa2\xa9\x7f\xb0\
-\x34\xbf\x6d\xd5\x19\x28\xaa\xa6\x9f\x4b\x50\x67\x32\x59\x03\xaa\
-\x15\xd5\xc4\x13\x00\x6d\xcc\x14\xcc\x49\xb4\x8d\xde\x66\x33\x60\
-\x56\x03\x95\x87\x1b\x8f\xb0\x36\xf6\xd8\xb7\xef\x20\x0e\x1f\x3e\
-\x88\xcd\xcd\x15\x6c\x6e\x8e\x30\x9e\x10\xf6\x6f\x38\x78\x3f\xc2\
-\xca\xda\x26\xa6\x5b\xe7\xd0\x34\x8c\x67\xcf\xd7\x08\x6d\xc0\x85\
-\x73\x53\x5c\xbe\xb8\x85\x73\x4f\x7e\x16\x5b\xe7\x9e\xc2\xee\x4e\
-\x03\xec\xec\x00\xed\x0c\x18\x39\x7d\x0d\xb1\x05\x99\x16\x13\x53\
-\x96\xf9\x72\xaa\x77\xe0\x1d\x69\x26\xe0\x18\x15\x31\xc6\x95\xc3\
-\x64\x3c\xc2\x64\x32\xc2\xca\x78\x84\xc9\x78\x84\xd1\x78\x84\xc9\
-\x48\x9d\x80\x73\x0e\xc7\x8f\xec\xc3\xd3\xe7\x77\xf0\x43\x3f\x71\
-\x1f\xea\x26\x00\x2b\x13\x75\x06\xce\x29\x6f\xa0\xaa\x80\xf1\x0a\
-\x30\x9a\xa8\xef\x15\xba\xd2\xdf\xeb\x51\xe8\x9a\xb0\x7f\x8a\x97\
-\xc1\xbe\x80\xa5\x03\x78\xf1\xce\x6b\xa0\x73\xe8\xef\x9e\x8b\xf8\
-\xcc\x6a\xf8\x07\x37\x80\x83\x9b\x0a\xea\x71\x50\x23\x85\xe4\x72\
-\x80\x05\x58\x5f\x01\xd6\x56\x72\xd4\x6f\xcd\xd0\xcb\x4c\x20\xd6\
-\xfe\xd5\xc8\xa2\xde\x9a\x46\xc2\xc0\xd9\x41\x44\x07\x10\x1d\x47\
-\x74\x1a\x1c\xbf\xdf\x68\xf9\xd0\xda\xe7\x75\x93\x33\x89\xf8\x33\
-\x22\x6a\x58\x6d\x6d\xb2\xe1\x11\xa4\x94\xdc\x3a\x8c\x2b\xbf\xa8\
-\x17\x71\xb9\xe0\x0e\x97\x4e\x00\xd1\x01\xa8\xf4\x97\xf7\x1e\xde\
-\x3b\x8c\x1c\x30\xf2\x8c\xb1\x13\x4c\xc6\xde\x9c\xc0\x18\x93\x89\
-\x3a\x82\xf1\x68\x84\x51\xa5\x4b\x43\x0e\x1d\xdc\x40\xdd\x02\xff\
-\xf9\x07\x7f\x19\xbb\xd1\x09\x38\x6f\xc4\xa1\x4a\x9d\x40\x35\x06\
-\xc6\x23\x80\xcc\x09\x04\x19\x9a\x23\x28\xcf\x67\xa0\xd4\xe2\xef\
-\xb9\x96\x31\x82\x25\x13\xf0\x85\x3f\x2b\x00\xfe\x24\x80\x3f\x0e\
-\x60\xb3\xf3\x9d\xa8\x56\x73\xf4\x00\x70\xec\x00\xb0\x5a\x65\x23\
-\x95\x5e\x76\x00\x01\x0e\xee\x53\x07\x10\x6b\x7d\xe7\x54\x17\x2c\
-\x3a\x5f\x67\xf7\xad\xad\x6a\x7f\x7c\x75\x4d\x2f\xf0\x60\x06\x9b\
-\x70\x30\x4b\xda\x1d\xa9\xb1\xc3\xa2\x31\x3b\xe8\x1e\x31\xbb\xb1\
-\x07\x7c\xd0\x54\x7a\x6c\xc6\x2f\x02\xeb\xef\xc1\xd0\x3e\x00\x13\
-\xc3\x24\x7a\xbc\x60\xe1\x24\x0a\x9a\xfb\xf4\xf6\x22\x1c\x0a\x07\
-\x90\x97\x92\xe8\x6a\x31\x52\xf9\x31\x7b\x8f\x44\x08\xa8\x1c\xe0\
-\x8c\x01\xdd\x06\x5d\x34\x82\xc6\x36\x1d\xbb\xb4\x16\xcc\x55\x84\
-\x0b\x97\x76\xb1\x7f\x73\x0d\x5f\xfb\xfe\xd7\xe3\xdf\xfd\xc0\x87\
-\xb1\x3b\x6b\x80\x15\xaf\xaf\x45\xb7\x90\xd9\xef\x01\xf5\x34\x23\
-\xaf\x35\x4d\x1d\xec\xf5\x0e\x3a\x82\x1b\x01\xfc\x43\xa8\x6a\xd3\
-\xff\x0a\x95\x73\x5f\x9e\xa5\x03\xd8\xf3\xbc\x11\x2a\x37\xfd\x96\
-\x2e\xb8\x67\xc3\xf3\x87\xf6\x01\xa7\x0e\x6b\xad\x1f\x8d\x34\xae\
-\xd6\x8a\xfd\xf7\xd6\xea\xfd\x23\x87\xd4\xf8\x9b\xd6\xd8\x7b\xde\
-\x34\xf9\x2d\xe2\xb2\xa8\xa1\x1e\xd8\x07\x6c\x6c\xea\xe7\x2d\x03\
-\x8d\xa9\x76\xc0\x26\xe5\x48\xe5\xbb\x41\xa4\x86\x04\x8b\xce\x8e\
-\x81\xe0\xf4\xb9\x43\x0b\xc0\x2b\x27\x97\x9c\x3a\x0b\x72\x80\xb3\
-\xec\xc0\x39\xfd\x1d\xc8\xee\x17\x36\x23\xb7\x1b\x53\x92\x06\xb7\
-\x2d\x85\xfa\x31\x32\xf7\x24\xaf\x1f\x4b\x2b\xc7\x0a\x27\x10\x24\
-\x2f\x06\x09\x71\x6c\xb8\x0d\xc6\x4e\x74\x10\x1a\x2b\xf1\xa8\x66\
-\x10\xb5\x49\x0e\x9c\xc8\xc1\x39\x86\xf3\x1e\x97\xb7\xa7\xd8\xbf\
-\x6f\x1d\x5f\xff\x81\x37\xe0\xdf\xfd\xd7\x5f\xc6\x56\xdd\x6a\xf4\
-\x8f\x4b\x12\xc4\x44\x11\x9c\xbd\xce\xc9\x04\x18\x5b\x2b\x75\x36\
-\x4b\xca\x47\x03\xe7\xed\x50\x19\xf1\xbf\x0e\xe0\x2f\x1a\xf4\xb1\
-\x74\x00\xcb\xb7\x60\xee\xfc\x29\x03\xfa\xd6\x3b\x91\x3c\x30\xb0\
-\x6f\x1d\x38\x7b\x02\x38\xbc\x4f\x0d\xa6\x69\xf3\x05\x47\x94\xf5\
-\xae\x44\xb4\x7e\x3d\x79\x04\xd8\x58\xd3\x7a\xdf\x11\xe0\x9d\x45\
-\x33\xd1\xa8\xed\x04\xd8\x1c\x03\x07\x36\x81\xb5\x35\xfd\xd9\x26\
-\xa8\xed\x55\xd1\xac\x22\x65\xaf\x77\x51\x07\x73\x0a\x69\x60\xd8\
-\x15\xc6\x6e\xce\xc0\x79\x2b\x0d\x6c\xd6\x3e\x98\xc1\x83\x72\x74\
-\xe7\x68\xfc\xc1\x5e\x97\x64\xb0\x12\x66\x64\x31\x93\x89\x33\xc4\
-\x49\x49\x24\x66\x09\x96\x9d\xd8\x8a\x41\x12\x4a\x8b\x4e\x45\x00\
-\x69\x39\x2f\x35\x15\xaf\x6b\xbe\x1b\x51\x47\xe4\x1a\x55\x0a\x76\
-\x0e\xce\x05\xf8\xf1\x08\x97\x77\x66\x38\xb0\xb1\x8a\xaf\xfb\x8a\
-\x37\xe0\x5f\x7f\xff\x87\xb1\x5b\x37\xc0\xc4\x65\xbc\xc5\x15\xef\
-\x73\x60\xc5\x05\xf6\xad\x01\xa1\x06\xb6\xb6\x80\xe9\x2c\xff\x4d\
-\xba\x67\x0c\xe0\x7f\xb3\x2e\xce\xef\x03\xf0\x89\xa5\x03\x58\x9e\
-\x32\x55\xfc\xbb\xd0\x39\xfe\x7c\xda\xa0\xc6\x7c\xcb\x75\xc0\x8d\
-\x27\xf4\xf3\xba\xd1\x28\x4d\x66\xc4\x62\x06\x16\xd3\x67\xef\x81\
-\xeb\x4f\x00\xeb\xab\xc0\xac\x51\x96\x9b\x33\x63\x8e\x98\xc0\xa8\
-\x02\x0e\xae\x03\x87\xf7\xeb\xe7\x4d\x2c\x21\x8c\x11\xd7\x44\xc7\
-\x12\xb2\x81\x25\x8a\xaf\x19\x32\x9b\xf1\x3b\xcb\x0c\x98\xcc\x31\
-\x38\x8b\xf6\xe6\x0c\x6c\x67\x1f\xc8\x32\x01\x72\xd9\xf0\x11\x60\
-\xdc\x62\x33\xf4\xd6\x9e\x0b\x49\xf9\x47\x39\xbe\x45\x49\x93\x76\
-\x0b\xd8\x0e\x71\x8a\x7b\x04\xba\xb8\x68\x5c\x17\x16\xd2\xfe\x11\
-\x75\x3e\xda\x8a\xac\x20\x8d\xe8\x92\x54\x34\xb6\x1b\x50\x77\x14\
-\x8e\xc7\x1e\x97\xb6\x67\x38\xb8\x7f\x1d\xdf\xf8\x81\xd7\xe3\x5f\
-\xff\x7f\xbf\x82\xdd\xc6\x32\x01\x92\x9e\x26\x41\xc4\x63\x08\x98\
-\x6c\x02\xeb\xfb\x81\xed\x4b\xc0\xf9\x73\xb9\x54\x9b\x3f\xef\xb4\
-\x6c\xe0\x0f\x03\xf8\xf7\x4b\x07\xb0\x3c\x1f\x00\xf0\x77\x3a\x08\
-\xbf\x92\xe0\x81\x23\x07\x81\xbb\x6e\xd4\xa8\xdf\x18\xa8\xa6\x92\
-\xb8\x96\x4e\x9b\xc1\xc1\x6a\xe9\xca\x03\x37\x9c\x00\x36\xd7\xd5\
-\xf8\x63\xd4\x87\x07\x1a\xab\x53\x57\x47\xc0\xe1\x75\x05\x0f\x99\
-\x34\xea\x97\x35\x7e\x4c\xef\x5b\xce\xf7\x91\x19\x37\xcc\x29\x10\
-\xb2\xb1\x07\xd2\xae\x01\x95\x0e\xc2\x8c\x5a\xe9\x81\x0a\x0c\xc6\
-\x2c\x21\x66\x02\x1c\x1d\x07\x6b\x46\x12\x23\xbf\x70\x61\x68\x45\
-\xea\x9d\x9c\x40\x5c\x29\x46\xf9\xfe\x18\x95\x6d\x5d\x90\xee\x2c\
-\x34\x19\x72\xb6\x15\x66\x3a\x44\xac\x72\x61\xc4\x10\xf8\xa4\x42\
-\x4c\xd4\x82\x9c\x92\x84\x9c\x73\xea\x04\xb6\xa6\x38\xb8\x6f\x0d\
-\xdf\xf0\xfe\x7b\xf1\x6f\x7e\xe0\x57\xb0\x5b\xb7\xc0\x8a\xe9\x07\
-\x04\xd1\xf2\x87\x0d\xaf\x88\xa0\x2c\x2a\xe0\xc8\x09\x60\xff\x41\
-\xe0\xc9\xcf\x02\x97\x2f\xc3\xd6\x11\xf5\xff\xe6\x27\xa1\x33\x06\
-\x7f\xd3\xb0\x81\x66\xe9\x00\x7e\xeb\x1d\x07\x5d\xee\xf1\x67\x50\
-\x2e\x9d\x6f\x03\x30\x1a\x03\xaf\xbc\x05\xb8\xfd\x8c\x02\x4e\x53\
-\xbb\x3e\x9c\xb7\xc1\x7a\x43\xd2\x13\xf8\x24\x3a\xdc\x72\xf3\x09\
-\xe0\xc0\x06\x30\x6b\x91\x77\x64\xb9\x6c\x6c\xeb\x2b\xc0\x89\x4d\
-\xe0\xc0\xaa\x5e\xc4\xb3\xa0\x2f\x23\xa6\xd5\x52\x8c\xc9\x9a\xc2\
-\x4e\x72\x08\xc5\x4b\x4c\xb8\x40\xc4\x25\xa2\xc3\x88\xf7\x85\xc2\
-\x09\x70\x00\x5a\xca\x25\x01\xda\x8c\x27\x44\x1c\x80\x38\x3b\xb5\
-\x98\x1d\x90\x49\x7c\x95\xb4\x41\x8a\x8e\x2a\x96\x00\x54\x48\x0c\
-\xc5\xd5\xe2\x11\x2c\x04\x98\x75\xc1\x08\x4c\xdd\x58\x2b\x19\xd6\
-\x2d\x45\x02\x10\x55\x20\xef\x40\xb5\xc0\xb9\x9c\x09\x78\x17\xe0\
-\xc7\x0e\x17\xb7\x66\x38\xb0\x6f\x0d\x5f\xfb\x9e\x57\xe3\x7b\x7f\
-\xf0\xa3\xa6\x99\xc0\x66\xfc\x45\x29\xc0\x9c\xab\xa1\x96\x81\xb5\
-\x4d\xe0\xd6\xfd\xc0\xb3\x4f\x03\x8f\x3f\xaa\xe5\xda\xf0\x08\xf2\
-\x77\x00\xb8\x09\xc0\xef\x01\xf0\xec\xd2\x01\xfc\xd6\x39\x67\x0c\
-\x1d\x7e\x7f\xa7\xd6\x6f\x5a\xe0\xe4\x51\xe0\x8d\x77\x01\x47\xf7\
-\x01\xd3\xda\x00\x3c\xca\x29\x3f\x15\x88\x7b\xac\xad\x9d\x03\x6e\
-\x39\x09\x1c\xde\xd4\xc8\xef\xec\x7b\xa6\x9d\x0f\xe7\x80\x03\x13\
-\xe0\xf8\x26\xb0\x31\x8e\x28\x99\xa2\xd8\xd1\xb8\x9b\x68\x90\x85\
-\x91\x51\x51\x0e\x24\x90\x91\x33\x28\x18\xcc\xf9\xb0\x3d\x9e\x8b\
-\xd2\x80\xb8\x78\xad\xe6\x08\xe0\x80\xca\x3a\x05\xb1\x7d\x18\x1d\
-\x40\xcc\x22\x88\xb4\x2c\x88\xcf\x93\x96\x88\x4a\x06\x09\x63\x37\
-\x01\xc8\xbf\x63\xc2\x0a\xca\xd6\xa1\xca\x9e\x53\xaa\x0d\x08\xad\
-\x08\x04\x41\xd5\x87\xe2\x2c\x03\x39\xa0\x16\x80\x1a\xeb\x0c\x04\
-\x38\xef\x31\x76\x0a\x0c\x1e\xda\xb7\x8e\xf7\xbf\xf3\x4e\xfc\xc7\
-\x1f\xfb\xb8\xb6\x03\x5d\xc1\xac\x0c\x5c\xe0\x17\x56\x0e\xb4\xac\
-\x25\xc3\x99\xb3\xc0\x91\xa3\xc0\x03\xf7\x03\xe7\xce\xa9\x13\x98\
-\xcf\x06\xbe\x0a\xc0\x29\x00\xdf\x08\xe0\xd3\x4b\x07\xf0\xf2\x3f\
-\x6f\x80\xf2\xc7\x6f\xcf\xa0\x5a\xd0\x48\xf7\x9a\x3b\x81\x37\xdc\
-\xae\xc4\x97\xdd\x3a\x1b\x79\x1f\x20\x63\x97\x01\x30\x02\x70\xd3\
-\x49\xe0\xc4\x41\x8d\xfc\x71\x56\x3f\xae\x01\x12\xd1\x74\xff\xc4\
-\xa6\xb6\xb5\x82\x19\x55\xe5\x3a\x41\x3d\xce\xed\x27\x07\x40\xc5\
-\xe4\x0e\x42\x7e\x2c\x17\x0e\x88\x2c\x1a\xc6\x36\x60\x4b\xb9\x03\
-\x10\x0c\x37\x60\x2b\x01\x82\x53\xa7\xc1\xd4\xcd\x10\x74\x0d\x89\
-\xed\xe5\x93\xf9\xcc\x42\x0a\xcc\x20\xb6\x0a\xd9\x59\x66\x53\x70\
-\x1e\x28\xd8\x6b\x95\x6c\xff\xf6\x18\x31\x89\x73\x70\x24\xf3\x99\
-\x6a\x41\xcb\x70\x14\x6c\x85\xd8\x08\xce\x0b\xfc\xac\xd1\xf5\xe1\
-\x56\x0e\xf8\xca\xe3\xc2\xd6\x14\xb7\x9d\x39\x84\x77\xbc\xfe\x26\
-\xfc\xe4\x87\x1e\x04\xf6\x8d\x0b\xe3\x47\xd6\x1a\x2f\x71\x81\x20\
-\x8a\xad\x6c\xee\x07\x5e\x7b\x2f\xf0\xe0\x67\x80\x07\x1e\x58\xa4\
-\x46\xf4\x46\xa8\x06\xc1\x37\x40\x35\x1d\x97\x0e\xe0\x65\x7a\xbe\
-\x01\xc0\x3f\x00\x70\x20\xdd\x53\x37\xc0\xc6\x06\xf0\xc5\xf7\x02\
-\x77\x9e\xd6\x08\x3e\x6b\x0a\xc3\xe7\x62\xd4\xd6\xa2\xba\x13\xab\
-\xbd\x05\xb8\xee\x28\x70\xe6\x98\xe1\x03\x65\x76\x60\xb7\x43\xeb\
-\xc0\xf1\x0d\x1d\x0a\x6a\xcd\x48\x9c\x2b\x5a\x69\x69\x65\x4e\xe1\
-\x0b\xb8\x70\x0e\x9c\x91\x7f\x38\xe3\x00\x14\x19\x41\xe9\x10\x22\
-\xd0\xe8\x62\x8b\x30\xa0\xb3\x95\x23\x14\x46\x1f\x9d\x1b\x39\x20\
-\x78\xcd\x00\x98\x73\x77\x21\x3a\x02\xb1\xff\x4f\x28\x47\xff\x58\
-\x1e\x90\xeb\xb6\x04\xa3\xd2\x08\x0a\xee\x00\x69\x3b\x51\x5b\xf8\
-\x92\xba\xa4\x08\x8c\x86\xd8\x5a\x81\xac\x7b\x06\xc9\xc3\x11\x83\
-\x5c\xab\x64\x22\xa7\x6b\xc4\xc7\x63\x87\xa7\xce\x6f\xe3\x1d\x77\
-\x5f\x87\x9d\x29\xe3\xc3\x1f\x7b\x02\xd8\x18\x65\x4e\x43\xb0\xb2\
-\xc7\x49\xf2\x67\xa8\xcc\x09\xd4\xad\x92\xb0\x5e\x71\x17\x70\xe4\
-\x08\xf0\x91\x8f\x02\xbb\x3b\x9a\x49\x74\xcf\xcd\xd0\x51\xe3\x6f\
-\x05\xf0\x7d\x4b\x07\xf0\xf2\x3b\x7f\x16\xe5\x72\x09\x11\x35\xf4\
-\xb3\xa7\x80\xf7\xbf\x09\x38\xb1\x0f\xd8\xb2\xf6\xb0\xf7\x99\x65\
-\x46\x45\x3a\xef\xa5\x00\xcf\x04\x38\x7e\x00\xb8\xf1\xb8\xcd\xd5\
-\x46\x07\x11\x8d\xc3\x8c\xff\xd8\x86\x66\x14\x6d\x24\x01\x21\x03\
-\x6c\x70\x40\x25\xb9\x8e\x1d\xb9\x81\x8c\xa0\x70\x28\x31\xc5\x26\
-\xce\x18\x43\x88\x51\x9c\x32\xc8\xc7\x91\xcd\x67\x8f\x0d\x94\xb9\
-\x0a\xf1\xe6\xec\x3e\xb1\x6c\x86\x5d\xee\x14\x94\xb8\x45\x30\x67\
-\x12\x25\x84\x38\xfe\x7c\x59\x16\xa0\x70\x62\x96\x45\x74\x3a\x99\
-\xfa\xda\xa3\x1c\x99\x8b\x49\x48\x60\x34\x14\x34\x63\x6a\x8c\x56\
-\xec\x47\xf0\x35\x1b\x26\xe0\xe1\x5c\x0b\xe7\x3d\x9c\xf7\x78\xe2\
-\xd9\xcb\xf8\xb2\x37\xdc\x80\x4b\x3b\x0d\x7e\xe3\xa1\x8b\xc0\x46\
-\x95\x17\x29\x04\xd6\xf7\xb2\x2c\x05\x22\xd4\x13\x1d\xc4\x0d\xd7\
-\x03\xc7\x0e\x01\x3f\xff\x61\xe0\x89\x27\xb5\x03\xd3\x2d\x09\x0e\
-\x43\xc5\x47\xbe\xcd\xb2\xc4\xa5\x03\x78\x19\x9c\x89\xb5\xf8\xbe\
-\x2d\xa3\xfc\x0c\xd4\x0c\x7a\xfd\x2b\x81\x0f\xbc\x1e\x32\xf1\xc0\
-\xf6\x2c\xa3\xf6\x6c\x75\x7b\x64\xe9\xb9\x82\x69\x16\xeb\xe9\xfd\
-\xab\xc0\xed\xa7\xf4\xe2\x4e\x46\x23\x99\x46\x7b\x70\xb5\x30\xfe\
-\x90\x5b\x85\x9e\xb2\x81\x04\x63\xf6\x8d\x6c\xad\x66\x5b\x08\x62\
-\xb8\xd8\xdf\xa7\xc2\x90\xa4\xd8\xbc\x59\x60\x02\x0e\x19\x8f\x40\
-\xc1\x4b\x88\xaf\xd7\x71\xd7\x31\xb0\xcb\x8e\xa3\x8a\xd9\x05\x72\
-\x46\x12\x85\x39\xc4\x69\x06\x50\xd6\xfd\x2e\xe4\xc7\xc4\x5d\x00\
-\x82\x14\xe9\xf5\x39\x5c\xce\x02\xa4\xc8\x14\x20\xb9\x9d\x0f\xd3\
-\x20\x6c\x39\xbd\x5c\x1d\x35\x70\x20\xaa\xe0\x9c\xc0\xbb\x5a\x4b\
-\x81\xca\xc3\x39\x8f\x6a\xe4\x70\xfe\xd2\x0e\xde\xf7\x96\x9b\xf1\
-\x4f\xcf\xdf\x87\xcb\xd3\x16\xa8\x38\xcf\x5d\x44\x85\x93\x08\xa0\
-\x06\x64\xb0\x30\x88\x82\xb9\x07\x0e\x00\xef\xfe\x42\xe0\x17\x7e\
-\x15\xf8\xf8\x27\xad\x14\x73\xfd\xeb\xe5\x9f\x03\x58\x03\xf0\x8f\
-\x97\x0e\xe0\xda\x3e\x87\x01\xfc\x5f\x28\xfb\xfb\x41\xeb\x60\xf7\
-\xfe\xb7\x00\xef\xbd\x47\x99\x7c\x5b\x0d\xc4\x1b\xed\x34\x58\x6f\
-\xbb\x63\xfc\x92\x41\x35\x31\x83\xbd\xfd\x94\x0e\xf7\xa4\xd4\xbf\
-\x30\xcc\x03\xab\xc0\xd1\x75\x35\xfe\x60\xce\x24\x8a\x7d\x66\xb1\
-\x3e\x7b\x3d\x66\xc0\x31\xfa\x0b\x80\x51\x6c\xaa\x73\x4e\xed\x3d\
-\x17\x91\xbf\x6c\x41\xb6\xd9\xe0\xe3\xff\x1f\x62\x88\x85\x6e\x16\
-\x4d\x34\x61\x8b\xf6\x89\x3d\x18\x4b\x07\xce\xe5\x84\x8f\x78\x00\
-\x19\x70\x68\x6d\x46\xd3\xfa\xcb\x65\x09\xe5\xd2\x22\x66\x08\x91\
-\x61\x58\x1a\x3e\x71\xc6\x17\xd8\x84\x4c\x38\x4a\x90\x6b\x66\x40\
-\xad\x58\x19\x10\xe0\x66\x8d\x6e\x1a\x76\x0e\xce\x0b\xaa\x59\x03\
-\xef\x3c\xbc\x53\x3d\x81\xba\x09\x58\x9d\x08\xbe\xe1\x5d\x77\xe2\
-\x5f\xfc\xb7\xfb\x50\xd7\xad\x4e\x49\x46\x8c\x26\xed\x50\x2b\x30\
-\x13\x26\x73\x06\x50\x9c\x66\x73\x02\xbc\xeb\x2d\xc0\xc1\xfd\x9a\
-\x0d\x20\xf4\x71\x01\x0f\x1d\x26\x5a\x85\xaa\x3a\x2f\x1d\xc0\x35\
-\x78\xae\x83\x12\x3d\xb2\x36\x5f\xd3\x02\x93\x15\x54\xdf\xf8\x85\
-\xa0\x77\xdc\x86\xb0\x3b\xd3\x0b\xa7\x8a\x17\x49\x4c\xf5\xed\xf3\
-\x68\x68\x9d\x56\x9c\x00\xb7\x1c\xd7\x76\xdf\xb4\x31\xe3\x2c\x6a\
-\xef\xf5\x15\x35\xfe\xb1\x37\xe2\x0d\x8a\x2e\x02\x32\xcf\xde\x11\
-\x8a\x7e\x19\x6c\x45\xae\x39\x05\x29\x3a\x95\xf6\x1c\x8d\x95\x0b\
-\xf1\x67\xc8\x1c\x47\x9c\x1b\xe8\x74\x28\x90\xcb\x83\x58\x02\x84\
-\xc2\x18\xcb\x52\x20\x12\x8e\xda\xc2\x81\x95\x38\x03\x38\x86\x6c\
-\x33\xe2\x98\x31\x98\x83\x71\x11\x18\x94\xec\xdc\x48\x32\x97\x00\
-\x2e\x67\x2f\x94\x29\xc5\x12\xf7\x10\x88\x43\xcb\x0c\x0a\x8a\x0f\
-\xd4\xce\xc1\xd5\xad\xce\x0a\x78\xd2\x8e\x80\x6b\x6c\xc0\x88\xe0\
-\xdd\x04\x97\xb7\x67\x38\x72\x60\x03\x5f\xfe\xd6\x1b\xf1\x7d\xff\
-\xf3\x41\x65\x03\x06\x2e\x34\x14\xc6\x6a\xf0\x8d\xcd\x11\x84\x98\
-\xd9\xd8\xdf\xb9\x66\x60\xc4\xc0\x5b\x5f\xa3\xd4\xee\x1f\xf9\x29\
-\x15\x5f\x99\xc7\x05\xfe\x96\xbd\x09\x7f\x6b\xe9\x00\xae\xad\x73\
-\x1b\x54\x1c\xe2\x95\x1d\xb0\x6f\x73\x1f\x26\x7f\xe0\x3d\xa0\xd7\
-\x5c\x8f\x76\x7b\xaa\x01\xdd\x97\x51\xbe\x68\x9b\xc5\xde\x78\xec\
-\xf9\x47\x43\x38\x7d\x00\x38\x79\x50\x09\x3c\x8e\xf2\x85\x45\xd0\
-\x16\xdf\x91\x75\xa5\xae\x06\x29\x9e\x27\x46\xa3\x08\xa2\x15\x46\
-\xec\x5d\xae\xf9\x25\x7e\x5d\xc8\xf6\x3a\xe4\x09\xc3\x68\x70\x0d\
-\x8a\x3a\xbc\x88\xf4\xbe\x30\x62\x14\x08\xbd\xed\x08\x48\xf3\x70\
-\x4c\x05\x99\x28\x66\x12\xde\xe6\x09\x22\x30\x59\x4c\x0a\x92\xcd\
-\xe7\xc7\x54\xdb\xb9\x8c\x73\xb0\x39\x32\x0a\x45\x26\x51\xf2\x04\
-\x4a\x70\xd3\xa6\x7a\x28\x2f\x16\x51\xe5\x61\xd2\xb1\x01\x30\x04\
-\xad\x95\x02\x31\x0b\x70\xf0\x4d\x8b\xaa\x6e\xe0\x2a\x07\xef\x2a\
-\x4c\x26\x1e\xe7\x2e\x4f\xf1\xea\x1b\x8f\xe0\xd1\x67\x66\xf8\xf0\
-\x27\x9e\xd5\x49\xc1\x34\xf5\x18\xa9\xcd\x34\xb0\x78\xd1\x6e\xad\
-\x01\x84\xf7\xde\x0e\x1c\xda\x00\xfe\xd3\x7f\x07\xb6\x2e\xeb\x3c\
-\x46\xf7\xfc\xcd\xc2\x19\x2c\x1d\xc0\x35\x70\x5e\x6d\xc6\x7f\x53\
-\xba\x67\x5a\x83\x8e\x1f\xc3\xea\x1f\x79\x1f\xe8\xae\xe3\x68\x2f\
-\x4d\x35\x28\x39\xa7\xdc\x1b\x2f\x19\xe4\x73\xdc\xad\xb1\x63\xf4\
-\x17\x01\xf6\xaf\x00\x37\x1d\xcb\x51\x34\xf5\xcd\x4d\xe4\xf3\xe8\
-\xba\xb2\xd5\xca\xf6\x58\x24\xc6\xc7\x80\x5f\x82\x6e\x40\xce\x1c\
-\x52\x44\x2d\x8c\x9a\x9c\x46\xe6\xc4\xf0\x43\x26\xe7\xa4\x65\x7e\
-\x45\x4b\x90\x62\x36\xe1\xb2\xd1\x3b\xcb\x28\x02\x67\xc3\xa6\x08\
-\x5a\x86\xdc\x5d\x40\xc9\x48\x6c\xbb\x2d\x4a\xa2\xec\x3c\x1c\x0a\
-\x90\x8f\x8b\xc1\xa2\x88\x57\x84\xac\x19\x40\xe5\xd6\x61\x2a\xf4\
-\x04\xb8\x97\x5c\x98\x13\x20\x75\x76\x8e\x02\x7c\xdd\x62\x6a\x59\
-\x80\x77\x0e\x95\x0f\x70\xbe\x41\xe5\x2b\x54\x95\x62\x04\xcf\x9e\
-\xdf\xc6\x7b\x5e\x77\x06\x8f\x3c\xb3\x8b\x27\x2f\xd4\x2a\x9a\x12\
-\xa2\x66\x02\xe7\xd4\x3f\x98\xf3\x6b\xed\x16\xcc\x09\x8a\x95\x04\
-\xaf\xb8\x1e\xd8\x7c\x3f\xf0\xbd\x3f\x0c\x3c\xf3\x8c\x96\x76\xf3\
-\x4e\x40\x5e\x6e\xe5\x80\x7b\x19\x1a\xff\xeb\x00\xfc\x40\xc7\xf8\
-\x77\x67\x70\xd7\x9f\xc6\xbe\x3f\xf3\x35\xa8\xee\x39\x05\xd9\x6d\
-\x4c\x48\xd3\x29\x2f\x3d\x46\xcd\xc4\xb5\x2f\x67\xe1\x29\x83\x70\
-\xde\x01\x37\x1d\x55\xe4\x38\x1a\x76\xfc\x99\x91\x53\x7a\xef\xda\
-\x38\x1b\x4c\xa4\xa0\x3a\x97\x1f\xdb\x99\xb7\x2f\xda\x70\xae\xb8\
-\x91\x8d\xd1\x8e\x48\x4b\x93\xca\xc8\x3b\xde\x29\xd5\xd8\x57\x8a\
-\x41\x8c\xad\x17\xef\xe3\xe3\xbd\xde\xe2\xf7\x47\xae\xf8\x99\xe2\
-\xf3\xaa\xd2\xc7\x7b\xa7\x75\x6f\x65\x1f\x7d\x65\xb3\xf7\x76\x73\
-\x23\x65\x37\xba\xca\xba\x17\x26\xd0\x41\xde\xe6\x1b\x4a\xba\x31\
-\xf5\xe8\xc7\xf6\x38\xf8\xb9\xa6\xc6\x5c\x87\x03\xa6\x46\xcc\x8c\
-\xd0\x0a\xda\x20\x68\x5b\x46\xd3\x06\xcc\xea\x16\xb3\xba\xc5\x74\
-\x16\xb0\x5b\x07\x4c\x67\xf1\xbe\x06\x21\x30\x5a\x66\xcc\xa6\x35\
-\x3e\xf8\xf6\x1b\x31\xf1\x64\xfa\x07\x21\xdf\x5a\xce\x86\x1f\x0a\
-\x50\xb0\xe3\x0c\x04\xd8\x69\x80\x5b\x4f\x00\xbf\xef\x2b\x81\x93\
-\x27\x55\x5c\x65\xfe\xfc\x2d\xe8\x10\xd1\xd2\x01\xbc\x44\xcf\x1b\
-\x00\xfc\x17\x00\xa7\xd3\x3d\x3b\x33\xf8\x9b\xaf\xc7\xa1\xef\xfe\
-\x1a\x8c\x6e\x3f\xac\x35\x7b\x64\x9f\xc5\x09\x3d\x71\xdd\x56\x5b\
-\x09\xe6\xc5\xcf\x05\xc0\x99\xfd\x9a\x2a\xb2\x74\xfb\xee\x9e\x80\
-\x43\x6b\x2a\xfa\x59\x5e\xe5\x71\x66\xa0\x94\xe9\x8e\xce\x25\xa2\
-\xf6\x25\x5f\x20\xb2\x07\xbd\xcf\xa3\xc3\xc9\x11\x38\x35\xe8\xaa\
-\xb8\x8d\xec\x7b\x23\x9f\x9d\xc4\xd8\xeb\xad\x32\x67\x30\xf6\x26\
-\xb3\x65\xf7\xc5\x9f\x75\x3e\x3b\x13\x5f\x65\x07\x11\x35\xf9\xbc\
-\xfd\x9c\xb3\xef\x47\x67\x50\x99\x33\x88\x33\x06\x2e\xaa\x80\xb8\
-\x02\x23\xf1\xf9\xbd\x03\xf4\xff\xa2\x1e\x8d\x19\x45\x66\xe5\xb3\
-\x13\x10\xa8\x1a\x71\x13\x04\x75\x1b\x50\x37\x01\xd3\x99\x3a\x81\
-\xdd\x9a\x31\x6d\x18\xd3\x59\x83\xba\x69\xd1\x98\xb8\xc9\xf6\xb4\
-\xc6\x91\x35\x8f\x2f\x7b\xc3\x69\x25\x6f\xc5\x96\x5f\x88\x62\x2b\
-\x92\x33\x81\xfe\x2e\xf6\xa0\xed\x47\xb4\x04\x6c\xb7\xc0\x99\x43\
-\xc0\xb7\x7f\x25\x70\xfa\xb4\x4e\x15\xce\x9f\xbf\x0f\x5d\xf6\xb2\
-\x74\x00\x2f\xb1\xf3\x46\x28\x79\xe3\x54\x69\xfc\xa3\xdb\xcf\xe2\
-\xd8\x9f\xff\xed\x18\xdf\x74\x10\x32\x6d\x01\xab\x29\xc5\x8c\x8f\
-\x28\x2a\xe6\x16\x17\x64\x69\xdc\x64\xaa\x33\xfb\xc6\x7a\x71\x24\
-\xe3\x97\xfc\xf8\xcd\x09\xb0\x6f\xa5\xe7\x3c\xcc\x48\x12\x79\xa8\
-\x47\x1f\xa6\xd2\xe0\x5d\x11\x3d\x29\x8f\x0e\xc7\x8f\xbe\x30\xf0\
-\xf2\xe6\x62\x44\x8f\x06\x6f\x86\x5c\x51\x11\xfd\xcd\x51\x44\x27\
-\x90\x8c\xdc\x6e\xbe\x78\x0d\xd1\xf8\x9d\xb3\xa8\xef\x33\xed\xd6\
-\x5b\x26\x40\xde\x34\x0d\x5c\x41\x77\x76\x39\x1b\x48\x99\x53\x99\
-\x19\x50\x2e\x49\x3a\xa7\x04\x22\xb5\x5c\xe0\xc8\x1a\x64\xcb\x04\
-\x42\x40\xd3\xb6\x98\xd6\x2d\x66\xb3\x16\xd3\x46\x30\xad\x03\xa6\
-\xb3\x06\xb3\x3a\x3b\x81\xf3\x97\xa7\x78\xfd\x4d\x07\x71\xf7\x6d\
-\x87\x80\x9d\x59\x2e\x01\x42\x9b\xd3\xff\x46\x14\x3b\xe9\x94\x01\
-\xc8\x6d\xc3\x00\xcd\x04\x4e\xef\x07\xfe\xe8\x57\x01\x67\xaf\x53\
-\x2a\xf8\xbc\xcd\xfc\x13\x00\x5f\xb7\x74\x00\x2f\x9d\x73\x0f\x80\
-\xff\x04\x9d\xf0\x4a\x69\xff\xe8\x96\xeb\x71\xe6\x2f\x7c\x1d\x56\
-\x6f\xd8\x0f\x9e\xb6\x10\xe7\x20\x3e\xef\xd7\xe3\xb8\x71\x37\xa5\
-\xe7\x54\xd4\xc0\x94\x5b\x59\x9e\x80\x1b\x0e\xe5\xd4\x9f\x8a\x88\
-\xb7\x32\x02\x0e\xac\x65\x20\x8f\xf2\x1e\xbf\xb4\x98\x63\x8e\x1d\
-\xe8\x8a\xcc\x00\xf3\x59\x00\x4a\xf2\x51\x61\xb0\xf1\xa3\x8f\xd1\
-\xdf\x1c\xc0\xa8\x97\xe6\xfb\x32\x53\xa0\x9c\x29\x54\x56\x36\x8c\
-\x62\x74\x8f\x59\x40\xe1\x68\x5c\x14\x2d\x29\xb2\x03\xe7\x8b\x32\
-\xc5\xd2\x7f\xef\x73\x29\xd0\x37\xf4\xfe\xef\x95\xd3\xa1\xae\x63\
-\xe8\xf8\x02\x75\x20\x22\x79\x27\x41\x08\x82\xa6\x0d\x96\x09\x34\
-\x98\xd6\xf1\xc6\x98\xd6\x01\x75\xdd\xa0\x6e\x5b\xb4\x21\x40\x44\
-\x70\xe1\xf2\x0e\xde\xff\xba\x93\xd8\x58\xab\x6c\x64\xbb\xd5\x12\
-\xa0\xb5\x0e\x47\xc2\x03\xec\x63\x63\x9f\x47\x87\x10\xbb\x1b\x3b\
-\xad\x66\x7b\x7f\xfc\xab\x81\x33\xa7\x86\x9c\xc0\x18\xaa\x40\xfc\
-\xe5\x4b\x07\xf0\xe2\x9f\xdb\xe7\x22\xff\xb4\xc6\xe8\xba\x53\xb8\
-\xe5\x2f\xfc\x76\xac\xde\xb0\x1f\x61\xda\x5a\xda\x5f\x96\xf6\xa4\
-\x99\x2c\x51\x26\xaa\x75\x22\x3f\x32\xb2\x7e\x72\x03\x38\xb0\x5e\
-\x00\x6e\xf6\xbd\x91\x0d\xf8\xc4\xfe\xbd\xeb\x65\x0e\xd4\xe3\xf3\
-\x97\x65\x05\x4a\xa6\x5e\x51\x2e\xa4\x5a\xdb\xe7\xac\x20\x3a\x8d\
-\x68\xfc\x09\x0f\x30\x56\xa1\x2f\xf1\x02\x9f\x53\xf8\xb9\xda\x9f\
-\x2c\x13\x28\x33\x80\xf8\x38\x5f\xfc\xff\xae\x48\xff\x29\x97\x03\
-\x31\xfa\xfb\x1e\x06\x40\x45\x39\x90\xee\x8b\xbf\xa7\x2b\x4a\x80\
-\x81\x89\xc6\xe4\x1c\xec\xa3\x77\xb0\x42\x00\x2c\x82\xc0\x11\x0f\
-\x60\x2d\x03\x66\x0d\x76\x67\xad\x96\x02\x75\x8b\xd9\xac\x41\xd3\
-\xb6\x08\xac\x98\x81\x07\xe3\xab\xdf\x7c\x5a\xd1\xfd\xb6\x10\x4f\
-\x6d\x42\x37\xf2\x97\x1f\x5b\x73\x06\x2d\x65\xa7\xb0\xd5\x02\xd7\
-\xef\x07\xfe\xd4\x6f\x03\x8e\x1f\x1f\xc2\x04\xd6\x00\xfc\x3f\x00\
-\xde\xb6\x74\x00\x2f\xde\x39\x6b\x35\xff\x0d\xe9\x9e\x59\x83\xd1\
-\xf1\x63\x78\xe5\x5f\xfa\x3a\x6c\xde\xac\x69\xbf\xb3\xed\x38\x31\
-\xe5\x8f\x17\xa7\x80\x92\x33\xe8\x5e\x98\x45\x7d\xb8\x5e\x01\xa7\
-\xf6\x17\xaa\x37\x45\x54\xdf\xb7\x92\xe7\xd3\xa9\xdf\x57\xef\x39\
-\x95\x0e\xc6\xb0\xc7\x47\x72\xf3\xf7\x97\x60\x62\xa7\x24\x28\x9d\
-\x00\x0d\x94\x09\x2e\x1b\x77\x02\xfa\x7a\x19\x84\x2f\xca\x83\xaa\
-\xbc\x2f\x1a\x73\x95\x33\x81\x91\xef\x3a\xa8\xe4\xa4\xe2\xc7\xaa\
-\x30\xfe\xa2\x0c\x9a\x1b\x6c\x42\x37\x1b\x10\xf4\x70\x93\xb8\xa8\
-\x84\x15\xe8\x0b\x8c\xba\x0d\x68\x42\xc0\xac\x6e\xb0\x5b\xab\x13\
-\xd8\xad\x83\x3a\x01\x2b\x05\x44\x04\x97\x76\x66\xb8\xe3\xe4\x1a\
-\x5e\x7b\xdb\x41\x60\x77\x66\xca\xc9\x85\xc4\x7a\x2b\x5a\x0a\xc4\
-\x8c\x20\x1a\x3c\x17\x9d\x81\xc6\x1c\xc2\xa5\x16\xb8\xf5\x08\xf0\
-\x9d\x1f\x04\x0e\x1d\xd6\xac\xa2\x7b\x0e\x42\x35\x05\xee\x5e\x3a\
-\x80\x17\xfe\x1c\xb2\x37\x3f\x4f\xf4\xd5\x2d\xfc\xc6\x26\x5e\xfb\
-\xe7\xbe\x06\x87\x6f\x3f\x82\xa6\x09\x9a\xe2\x43\x95\x6b\x81\x92\
-\x55\x9b\x9d\x80\xf2\x52\x8a\x36\x55\x04\x8a\x44\x80\xd3\xfb\x74\
-\x9b\x8f\x14\x3c\x01\xe7\x54\xd4\x63\x7d\xdc\x7d\x07\xa9\x1b\xcc\
-\xba\xb7\xde\x1d\xae\x1c\x2e\x72\xf3\x86\xdf\x29\x01\x4a\xe3\x77\
-\x45\xca\x4e\x5d\x70\x2f\x65\x07\xc5\xf7\xa3\xf1\x97\xa5\x44\x8c\
-\xe8\xbe\xfc\x39\x9f\x4b\x83\x68\xfc\x9e\xba\x59\x41\x8a\xfe\x54\
-\x38\x88\xb2\x33\x80\x2e\xa7\x20\xb6\x21\x41\xd9\x49\xa0\xc4\x03\
-\x7a\x59\x51\x22\x0b\xe9\xe7\x0c\xe5\x08\x04\x73\x04\x4d\x13\x30\
-\xab\x03\x66\x4d\x8b\x69\xdd\x68\x36\x50\xb7\x09\x14\x0c\x86\x1f\
-\x5c\xb8\x3c\xc5\xfb\x5e\x7b\x0c\x9b\xeb\x95\x82\xbe\x51\x6d\xb9\
-\x69\xcd\xe0\x91\x4b\x80\xe8\x0c\xd2\xd7\x96\x09\xb0\x01\x83\x97\
-\x67\xc0\xab\x4e\x00\x7f\xea\xab\x81\xd5\x0d\x7d\x8e\xee\x39\x69\
-\x2d\xe7\xb3\x4b\x07\xf0\xc2\x9d\x98\x7e\xbd\x21\xdd\xd3\x06\xa0\
-\xaa\xf0\x86\x3f\xfb\xdb\x70\xfa\xd5\xa7\xd0\x04\x31\x79\xca\xee\
-\x09\x28\x2e\x32\xf4\x38\x33\xe8\x19\xff\xfe\xb1\xb6\xf6\x62\xea\
-\x1f\x1d\xc4\xc8\x01\xfb\x26\x6a\x20\x49\x13\xb0\x48\x6b\x5d\xdf\
-\xfa\x7b\xe8\x77\xa7\xce\x1f\x30\x02\x1a\xc8\x0a\xca\x16\x61\x32\
-\x66\x5f\x00\x7a\xbe\xdb\x1d\x88\x4e\x20\x3a\x84\x12\x13\x88\x25\
-\x44\x59\x1e\xb8\xc2\xf8\xcb\xae\x81\x2f\x30\x01\x2a\x22\xbf\x2b\
-\x9d\x04\x45\x3d\xf0\x6c\xe8\x65\x8b\x10\x65\x46\xd0\xaf\xfd\xfb\
-\x5e\x33\xbf\x6d\x3a\x33\xa0\x9b\x89\x03\x0b\x9a\xc0\x68\x43\x40\
-\x5d\xb7\x86\x05\x68\x5b\x70\xda\x68\x5b\x70\x56\xb7\xea\x28\x42\
-\x80\x47\xc0\x07\xdf\x7c\x52\x55\x9c\x5a\x33\xfe\xd8\x15\x98\xc5\
-\xd4\xbf\x00\x07\xeb\xc2\x01\x84\xe2\x63\xed\x80\x4b\x35\xf0\xe6\
-\x1b\x80\x3f\xf2\x01\x63\x5d\xce\xa9\x8b\xdf\x62\xc1\xe8\xd0\xd2\
-\x01\xbc\x30\xe7\x1f\x01\x78\x4f\xfa\xca\xf8\xdf\xaf\xfb\x8e\x0f\
-\xe0\x8e\xb7\xdd\x82\xba\x47\x05\x97\x5e\x90\xee\x5c\x84\x51\x15\
-\x3b\xa2\xc0\x6d\xf1\x03\xa7\x36\x0b\x70\xaf\x30\xf4\xf5\x51\xae\
-\xfb\xe7\x6a\x7c\x0c\xa4\xff\xbd\x5a\x3f\xbd\x84\xde\xcf\x3a\x9a\
-\x7f\x9c\x1b\x20\x24\x95\x40\xa2\xed\x01\xec\x00\x79\x55\xd1\x1d\
-\xf0\x05\x5e\x30\xa2\x2e\x48\x18\x3f\x0e\xfd\xbc\x2f\xca\x83\x58\
-\xf3\x57\xfd\x2e\x40\x91\x2d\x74\xb2\x02\xd7\x03\xfd\x4a\xa0\xaf\
-\xd7\x26\x1d\x4c\x9d\xf2\x5d\xb1\x35\x18\x02\x23\x44\x7e\x40\x63\
-\xdc\x80\xda\x32\x80\x9a\xb5\x55\xd8\x34\x68\x83\x95\x02\xdb\x35\
-\x6e\x3f\xb1\x8a\x57\xdf\xb2\x5f\x77\x2b\xb6\xad\xae\x3d\x8a\x5d\
-\x81\xa6\x57\xff\xf7\x6f\x1d\x27\x00\x60\xab\x06\xde\x7b\x27\xf0\
-\x2d\x5f\xae\xc2\x25\xf3\xfb\x34\xde\x00\xe0\x5f\x42\xe5\xe4\x97\
-\x0e\xe0\x79\x3c\xdf\x0d\xdd\xc6\x9b\x2d\x78\xa7\xc1\x5d\xbf\xfd\
-\x9d\x78\xeb\x57\xbc\x1a\x33\x81\x29\xce\x44\x28\x29\x3f\x4e\xca\
-\x6b\x2e\x8e\xb0\xb2\x79\x8b\x72\x1b\x6d\x1b\x80\x83\x13\x9d\xf6\
-\x63\xe9\x46\xf8\x71\xa5\x75\x7f\xff\x42\x1e\xea\x70\xa1\x9f\xf1\
-\x52\x0f\x2b\x40\xf1\xb1\x00\x06\xe7\xf0\x00\x74\xcb\x85\xb2\x63\
-\xd0\x47\xfd\x4b\xc0\xb0\x2a\x38\x02\xfd\x74\xde\x53\xd7\x39\x94\
-\x38\x82\x2b\x10\xff\x12\x37\xa0\x02\x1b\x28\x1f\xe3\x4a\x22\xd0\
-\x00\x87\x22\x65\x01\x85\x13\x28\xb3\x01\x5a\x54\x3f\x45\xff\x1e\
-\xe9\xc2\x01\x6d\x1b\x14\x13\xb0\xa8\x3f\x9d\xd5\xd8\x9d\x69\x67\
-\xa0\xae\x5b\xcc\x9a\x16\x6d\xdb\x42\x84\x71\x71\x6b\x17\xef\x7b\
-\xcd\x61\xac\x4d\x48\x25\xc3\xdb\x56\x33\x82\xa6\x35\x1a\xb0\x74\
-\x09\x42\x65\x69\x30\x2b\x9c\x43\x20\x75\x02\xd3\x16\xf8\x1d\xaf\
-\x07\x3e\xf0\x76\x60\xa7\xc6\xc0\x8a\xb2\xf7\x19\x4f\x60\xe9\x00\
-\x9e\xa7\xf3\x8d\xe6\x00\xf2\xd9\x9e\xe1\xba\x77\xde\x8d\x77\xff\
-\x2f\xef\x44\x2d\x82\x3a\xb0\xb6\x90\x24\x4f\xf5\xb2\xe8\xca\x6b\
-\xe5\x9e\x67\xe3\x4f\x36\xcf\x80\xc4\x94\x21\x18\x2d\xf7\xe4\x46\
-\x0f\xbc\x32\x03\x59\x1b\x25\xe2\x4a\x27\xed\xa7\xe2\x02\xef\x83\
-\x81\xe8\x19\x84\xa3\x81\x1a\x78\x00\x2c\x74\xe5\xf3\xa3\x70\x04\
-\x94\x9d\x4a\xd9\xc3\x8f\x98\x40\x99\xde\x97\x5c\x02\x4f\x5d\x63\
-\x76\xae\x5b\x1e\x94\x9c\x80\xe8\x20\x5c\x91\x61\x38\xca\x8c\xc1\
-\x58\xfb\xa3\xc7\x6d\xa0\x1e\xa9\xc9\xf5\xb3\x22\x99\xc7\x43\xa8\
-\x7f\x49\xba\x4e\xee\xa6\x7e\x5a\xcb\x80\xc0\xda\x1a\x6c\x43\xb0\
-\x2c\x40\x39\x01\xbb\xf6\x79\x5d\x67\x3c\xa0\x6e\x03\xd6\x2a\xe0\
-\xbd\xf7\x1e\x55\x82\x50\xdc\xbe\xd4\xd4\xaa\xc5\xd8\x42\x9d\x40\
-\x23\xc0\xcc\x6e\x75\x69\xfc\x04\xec\xd8\xd7\x35\x80\x5d\xbb\xa0\
-\xfe\xf0\x17\x01\x6f\x7c\xa5\x39\x81\xb9\xf3\x2d\x50\x8d\xc9\xa5\
-\x03\xf8\x3c\x9f\x37\x5b\xea\x4f\x65\xbb\x6f\xdf\xed\xd7\xe3\x6b\
-\xfe\xd7\x0f\x60\x3c\xf1\xd8\x69\x59\x31\x9d\xb4\xee\x5a\xa7\xcd\
-\x42\xac\x25\x4d\x38\x42\x17\xdf\x68\xee\x2f\xad\x7a\x02\x8a\xc3\
-\x21\x81\x81\x43\xb6\xd1\xb7\xc0\x0a\x54\xcd\xb7\x02\x26\xe5\xc8\
-\xa8\x14\x7d\x6e\xf4\xa2\x5e\xa1\xe7\xdf\x89\xfc\x65\x6a\xdf\x2b\
-\x2d\xa8\x17\x01\xa9\x87\x0f\xb8\x01\x63\xa3\x9e\x91\x26\x10\xb0\
-\x48\xc9\x13\x5d\xb8\xc8\x06\xca\x2e\x40\xa7\xf7\x4f\x03\x51\xbe\
-\x8c\xf4\x25\x1f\xc0\x75\xb1\x01\x72\xdd\x2e\x80\x2b\xf0\x81\x0e\
-\xe8\xd2\x8f\xfa\xae\x97\x36\xa1\xe7\x1c\x04\x22\x91\x20\xa4\xf4\
-\xdf\xa6\x09\xca\x11\xa8\x1b\x4c\x67\x96\x09\xd4\x4a\x18\xaa\x9b\
-\x16\x6d\x1b\x34\x0b\xd8\x9e\xe1\x75\x37\xac\xe3\xe6\xd3\xab\x4a\
-\x10\x8a\xab\xd3\x42\x9b\x23\xfc\xac\x88\xfc\xb5\x65\x06\xb5\x19\
-\xbd\x20\x7f\xde\x10\x30\x65\x60\xad\x02\xfe\xf4\x07\x80\xeb\x4e\
-\x2f\xa2\x0c\xff\x39\x00\xbf\x7d\xe9\x00\x3e\x7f\xe7\x38\x74\xa6\
-\x7f\xb3\x04\xfd\xfc\xfa\x1a\xbe\xfe\x3b\x3e\x80\xa3\x87\x56\x71\
-\x79\x16\x6c\x0c\xdc\x22\x85\xb1\xc9\xd8\xd2\x00\x91\x3c\x7d\x46\
-\x31\x13\x08\x31\xf2\x8b\x7e\x8c\x73\xf9\x27\xd6\x91\xda\x07\xf1\
-\x5a\xac\x9c\x2e\xfd\xa4\x21\xf0\xaa\xdf\xd7\xc6\x80\xae\x5f\xbf\
-\x23\xd0\xab\x15\xfa\x19\x00\xa8\xcb\x15\xe8\xa4\xd1\x7d\x6c\xc1\
-\x65\x27\xe0\xd0\xad\xf1\x47\x65\x17\x81\x8a\xde\x7f\x2f\xda\x97\
-\xec\xc3\xa1\xae\x43\xfc\x7e\xe2\x26\x14\x0e\xa0\xcf\x07\xe8\x68\
-\x23\x2c\x00\x46\xe7\x7e\xcf\xa1\xf6\x09\x3a\xf8\x8b\xb0\x66\x77\
-\x6c\xad\xc1\xb6\x20\x08\xcd\xea\x06\xd3\xba\x35\xda\x70\x8d\xba\
-\x69\xd0\xb6\x01\xcc\x8c\x9d\x69\x8d\xaf\xb8\xf7\x30\x2a\x0a\x56\
-\x02\xd8\x42\xd5\xa6\x45\x8a\x18\xb5\x74\xeb\xfe\x76\x00\x1c\x6c\
-\xcd\x11\x6c\x33\x70\x7a\x1d\xf8\xd3\x5f\x09\x4c\x56\xf3\xa6\xa6\
-\xae\x5d\xfd\x63\x00\xf7\x2e\x1d\xc0\xe7\x7e\x2a\x00\xff\x27\x74\
-\xbc\x37\xd7\xef\x2d\xe3\x3d\xbf\xff\xdd\x78\xe5\xab\x4f\xe1\xe2\
-\xb4\xc5\x8c\x05\xb5\xdd\x5a\xe6\x94\x2e\x0a\x67\x47\x20\x45\x56\
-\x00\x66\x05\xff\x42\x4c\x19\x4c\x40\xf2\xe0\x44\x07\x7a\xa4\x50\
-\x00\x72\xa4\xc6\xef\x07\x7a\xd6\xa5\xe1\x8b\xcc\x97\x04\xe5\x16\
-\xcd\x32\xdd\xa5\x81\x2c\x20\xb5\xc0\xa8\x8b\x3b\x60\x80\x60\xd4\
-\xc7\x02\x4a\x7a\x71\x55\x64\x03\xfd\x19\x02\x3f\x40\xff\xed\x97\
-\x0b\x1d\xe3\x2f\xc1\xbe\x9e\x93\x88\x2d\x41\xf2\x3d\xe3\x2f\x80\
-\xc0\x41\xc7\x36\x84\x9b\xf4\x2e\xc5\xb9\xf2\x5a\x4c\xf9\xcb\x4a\
-\xbc\xa0\xc4\x9f\x38\x34\x34\x35\x3c\x60\x6a\xa5\xc0\xac\x8e\x0e\
-\x20\x60\x77\xd6\xe2\xf4\xfe\x0a\x6f\xb9\x63\x1f\xb0\x3d\x35\x27\
-\x50\xeb\xad\x65\xa3\x08\x47\x27\x60\xa5\xc0\x54\x72\x29\xc0\xe6\
-\x00\xa6\x96\x2d\xc4\x4c\xe1\x75\xa7\x81\x6f\x79\x8f\x6a\x0b\xcc\
-\x83\x82\x07\xac\x53\x75\x7c\xe9\x00\x3e\xb7\xf3\x67\xd1\xdf\xd6\
-\xb3\x33\xc3\x3d\xef\x7e\x03\xde\xff\x15\xf7\xe2\xd2\xb4\xc5\x94\
-\x81\x46\xcc\xf8\x83\xa0\x89\x3c\x72\xd6\x16\x92\x30\xeb\x4e\x3a\
-\x66\x08\x0b\x24\xd8\xd7\x75\x80\xb4\x02\x69\xc4\xf4\xfa\x00\x1c\
-\x5f\x9f\xc7\xa3\xe2\xa4\x1d\x7a\x2d\x3f\xc1\x3c\x6a\x5f\x5e\xbd\
-\x9d\xbe\x78\xcf\x98\x4b\x83\xee\x23\xe0\x9d\x0c\x02\xc3\xf3\x09\
-\x8b\xa2\xe8\x9c\x63\xa0\xcc\x14\xec\xa0\xfd\x45\xbb\xd0\xf5\x8c\
-\xbe\x72\x45\x5b\xaf\xd7\x75\x70\x94\xd3\x7e\x2a\xdb\x83\x65\x16\
-\xe0\xba\xbd\x7e\x0c\x00\xa0\x65\x29\xd4\x89\xfa\xd2\xbb\x3c\x29\
-\x41\xb8\x44\xba\x60\x24\x96\x02\x81\xb5\x23\xd0\xa5\x09\xb7\x98\
-\x36\x01\xb3\x26\xe8\xc0\x50\x08\x10\x09\xb8\xb0\x3d\xc3\xbb\xee\
-\x3a\x80\xcd\x75\xd2\x55\x6d\xc9\x09\x34\x19\x07\xa8\x8b\xee\x40\
-\x80\x06\x84\xda\x0c\xbf\x36\xa3\x9f\x99\x13\x98\x1a\x80\xf8\x0d\
-\xf7\x02\x5f\xfc\x3a\x2d\x2f\xe6\xcf\x1d\x50\xca\x70\xb5\x74\x00\
-\xbf\xb9\xf3\x65\xd0\xad\x2d\xf9\x4c\x1b\x1c\xbe\xf3\x2c\x7e\xc7\
-\x1f\xf8\x12\xec\x72\xc0\x56\xcb\xd8\x65\xc6\x2e\xab\xe1\x37\x66\
-\xf4\xca\x22\xd3\x6c\x40\x9d\x80\xde\x4f\xe6\x04\xd0\x0a\x28\x08\
-\x28\x30\x24\xa8\x3e\x20\x0e\x4e\xb4\xf6\x67\x74\xdb\x6e\x63\x9f\
-\x81\xbf\x45\x29\x3f\x68\xd8\x19\x74\xd4\x84\x30\xdc\x2e\xe8\x44\
-\x49\xd7\xab\x8f\x7b\x59\x43\x99\x95\xa4\xf4\xba\xe0\x07\x60\xa0\
-\xfe\xf6\xc5\x82\x92\xfe\x7d\xae\x00\xfc\xaa\x1e\x0b\xb0\x9c\x0f\
-\x28\x9d\x4b\x87\xa1\xd8\x1b\x78\x1a\x7a\x6c\x87\x0b\x80\x79\x47\
-\x30\xd8\x0e\x9c\x6f\xa7\x88\x39\x87\x38\x30\x14\xff\xbe\x6d\x1b\
-\x72\x6b\x70\x56\x2b\x26\x60\x23\xc3\x6d\x13\x12\x37\x60\xa5\x02\
-\xbe\xec\xd5\x07\x81\x9d\xa9\xae\x46\x6f\x66\xba\x54\x34\x96\x02\
-\x8d\x00\x33\xce\xce\xa0\x36\x43\x2f\x33\x82\xda\xbe\xde\x05\xb0\
-\x6b\x9a\x06\x7f\xe4\xdd\xc0\x0d\xd7\xa9\xc0\xec\xfc\x79\x2f\x80\
-\xef\x5a\x3a\x80\xe7\x7e\x4e\x58\x1d\x95\xbd\x67\x60\xd0\xea\x04\
-\xdf\xf4\xfb\xde\x83\x03\x07\x56\x71\x7e\x1a\xb0\xcd\xc0\x6e\x10\
-\xcc\x82\x60\x1a\xb4\x0b\x50\x07\xcd\x00\x38\xe4\xc8\xcf\x36\x22\
-\xca\x2d\x43\x5a\x86\x34\x7a\xd3\x3f\xbc\x89\x5b\x1e\x5f\x9b\x8f\
-\xe0\xa3\x5e\xf4\x5f\x68\xfc\x43\xbf\x42\xa1\x99\xd7\x07\x09\x87\
-\xb6\xd8\xf6\x9d\x84\x2b\x32\x08\x47\xc3\x03\x34\x43\x59\x42\x19\
-\xb9\x53\x7b\xaf\x07\x12\x46\xbc\x60\x44\xc6\x0f\x18\x40\xf0\xcb\
-\xfa\xbf\x6c\x4d\x96\xaa\x43\xae\xe7\xbc\x5c\x0f\x9b\x28\x1f\xd3\
-\xc7\x3a\x3a\x76\x2f\x58\xf0\x26\x16\x7f\x13\x49\xd9\x00\x33\x27\
-\x27\xdf\xb4\xc1\x58\x82\x0d\xa6\xd3\x1a\xd3\x69\x83\x99\x4d\x0b\
-\xce\xea\x06\x6d\x08\xe0\xc0\xb8\xb4\x3d\xc3\xeb\x6f\x58\xc7\xc9\
-\x23\x95\xd2\x84\x9b\xba\x70\x04\x21\x1b\x77\x23\x1a\x10\x66\xd2\
-\x2d\x11\xa6\x65\xb7\xc0\xbe\xbe\xcc\xc0\xb1\x15\xe0\xdb\xbf\x5c\
-\x15\x89\x98\x87\x5e\xfc\xff\x06\xe0\xdd\x4b\x07\xf0\xdc\xce\x3f\
-\x40\xc9\xf1\xb7\xe8\xff\xae\xaf\xfb\x02\xbc\xfa\xde\xb3\x78\x7a\
-\x6b\x86\x1d\x16\xec\x32\x63\xc6\x82\x99\x31\xc5\x9a\x20\x68\x23\
-\x69\xc4\xc0\x3d\x0e\xfa\x51\x82\x66\x03\x68\x45\x1d\x40\x6b\xc6\
-\x3f\x0d\xca\xfa\xdb\x37\xe9\x0e\xfc\x44\xb5\xde\x39\x70\x6f\xe0\
-\x73\xd9\xe3\x7b\xfd\x51\x58\x41\x31\x29\x38\xd4\xfe\xa6\xc5\x38\
-\x80\x73\xdd\xcc\xc0\xcd\x83\x65\xdd\xae\x81\xeb\x4e\x27\x96\x25\
-\x42\x89\x07\x44\x67\x41\xe8\x31\xfb\x86\x00\x42\x5f\x18\xbe\x9f\
-\xe7\xff\xbb\xfe\x18\x70\xe1\xb0\x08\xc3\x99\x50\xd9\x32\x5d\xe4\
-\x48\xe3\x9b\x17\x09\x42\xc2\xc5\xbc\x80\xa6\xfc\xb3\x36\x60\x3a\
-\x9b\x19\x37\xa0\xc1\xac\x69\xd0\x34\x2d\x42\x08\x4a\x15\x0e\x01\
-\xef\x7b\xcd\x21\x8d\xfc\x6d\x53\x80\x82\x05\x20\x38\x1b\x30\xfa\
-\xda\xbe\x37\x2d\x8c\x7f\x26\x9a\x05\x9c\x0f\xc0\x5b\x6f\x00\xbe\
-\xea\x1d\xc0\x6e\xb3\x08\xc7\xfa\x1e\xe8\x36\xaa\xa5\x03\xb8\x8a\
-\xf3\xad\x00\xbe\xba\x73\xcf\x6e\x8d\xeb\x5f\x7f\x07\xbe\xea\xb7\
-\xbd\x09\xcf\x6c\xd7\xb8\x18\x04\x5b\x81\xb1\x1b\x04\xbb\x2c\x98\
-\x06\xc6\x2c\x08\x1a\xce\x4e\x80\x5b\x4e\xce\x40\x42\x00\xb7\x26\
-\x14\xd1\x06\x35\xfc\xb8\x91\x97\x19\x38\xb1\x56\xa4\xd0\xb1\xef\
-\xef\x06\xb6\xf7\xec\x75\x8d\x0e\xd4\xb8\x1d\x3c\x20\x1a\xb2\x0c\
-\x64\xb8\x6e\xde\x90\x31\x10\x39\x41\xdd\xa9\xc3\x0e\x48\xe8\xba\
-\xb8\x43\x3f\x32\xbb\x1e\xeb\xaf\x94\x17\x77\x05\xc8\x17\xef\xeb\
-\xf0\x06\xca\xec\x00\x03\x9f\xbb\xae\x53\xc3\x00\x76\x21\x8b\xca\
-\xa2\x3e\xb6\x42\x0b\xbd\xa9\x14\x18\x01\x33\x83\x45\xb1\x80\x36\
-\x04\x04\x73\x02\x75\x9b\x39\x02\x29\x0b\x68\xd5\x09\x5c\xde\x69\
-\x70\xe7\xa9\x55\xdc\x76\x66\x45\x65\xe0\xdb\x99\x66\x00\xd3\x5d\
-\xc3\x03\x58\x1d\xc0\x2e\xe7\x2c\x60\x6a\x1f\xa3\x63\x88\x4e\x60\
-\xd7\x6e\x33\xd6\xc1\xa1\xaf\x7f\x0b\xf0\xca\x5b\x87\xc6\x87\x01\
-\x15\xa8\xfd\x47\x2f\x35\x9b\x7b\x29\x3a\x80\x5b\x00\xfc\xd5\xce\
-\x3d\x6d\x40\xb5\x6f\x03\x5f\xf7\xad\xef\x82\x8c\x09\x17\x9a\x16\
-\xdb\xcc\xd8\x66\xc1\x4e\x50\xe3\x4f\xd1\xbf\x65\xb4\x2d\x23\xb4\
-\x9a\xf6\x6b\xca\xaf\xc6\x2f\xac\xc0\x1f\x5b\xfa\x2f\xb3\x00\x99\
-\x05\xed\xeb\x1e\x5c\xeb\xac\xb8\x4e\xe9\xbf\x1b\xb8\x58\xb1\x00\
-\xf4\xdb\x2b\x7d\x95\x81\x3a\x3e\x19\xaf\xeb\x81\x8a\xd4\xcb\x7a\
-\x17\x44\xcb\xbe\x14\x39\xf6\xe0\x12\x74\x22\x3c\xb2\x22\x51\x49\
-\xf2\x89\x91\xbd\x2c\x07\x7c\xef\x63\x3f\xf5\x4f\xaf\xc7\x77\x5b\
-\x96\xa5\x03\xea\x03\x97\x0b\x9d\x28\x0d\xb7\x57\x07\x33\x86\xb2\
-\x14\xb0\xae\x80\xa9\x04\x65\x2c\xa0\x4e\x58\x40\xdd\x2a\x16\xc0\
-\xc2\xd8\x9d\xb5\x78\xef\xab\x0f\xc1\x4b\x0d\xcc\xa6\xea\x00\x9a\
-\x1a\x98\xed\xaa\x3e\x60\x2c\x0b\x6b\x2b\x05\xea\x12\x07\x30\x07\
-\x51\xb3\x19\xbf\x00\x3b\x02\xec\x04\xe5\x89\xfc\xee\x2f\x01\x56\
-\xd7\x86\xe6\x05\x60\x60\xf6\xef\x5f\x3a\x80\xbd\x5f\xcf\xdf\x81\
-\x6a\xf9\xe7\x53\x07\xbc\xf3\x83\x6f\xc3\x0d\xb7\x1e\xc7\x93\x3b\
-\x35\x2e\xb3\x60\x3b\x08\x76\x5b\xc1\x6e\x60\x4c\x5b\xc5\x00\x6a\
-\x73\x02\x21\x64\xe3\xd7\x8f\xa6\x0e\x63\x7f\x54\xaa\xd5\x11\xa0\
-\x65\x65\x84\x9d\x30\x09\xef\xf2\xea\x8a\x9c\xf8\xc1\x6b\x70\x00\
-\xad\x4f\xe9\xa9\x2c\xf8\x5e\xaf\x94\x4d\x58\x00\x0d\x3f\xf7\x82\
-\x79\xa2\xc1\xb7\x6c\xae\x4b\xe0\x06\x38\x35\xd4\xe5\xeb\x3b\x37\
-\x90\x55\x20\xa3\xf8\x7d\x4c\x80\xfa\xce\x82\x72\xf9\x90\xca\x8c\
-\x1e\x36\x90\xfb\x9d\xc3\x18\x05\xf6\xb2\xf3\xc5\x69\x97\x94\x6f\
-\xa5\x30\xc4\xda\xbe\x6d\x08\x68\x5b\xe5\x01\xa8\x62\x50\x8d\x69\
-\xdd\xa0\x6e\x02\x9a\x46\xb3\x80\xd8\x16\x3c\x7b\x78\x05\xf7\xde\
-\xb2\x61\x6d\xc1\x98\x09\xd4\x5a\x16\xb4\x21\xe3\x00\x8d\x19\xfb\
-\xd4\x0c\x3f\x3a\x82\x5d\xd1\xd2\xb1\x8e\xdf\x17\xe0\x5c\x0d\xdc\
-\x71\x0a\x78\xef\x5b\x55\x8f\x60\xf8\xfc\x25\x00\x77\x2d\x1d\xc0\
-\xf0\xf9\x26\xf4\x55\x56\x66\x35\x4e\xde\x73\x33\xbe\xe8\xbd\xaf\
-\xc5\x33\xdb\x33\x5c\x6a\x05\x97\x83\x60\xab\x65\x6c\x5b\x09\x30\
-\x6b\x19\xb5\xf5\x83\x83\x89\x47\xa4\x2c\xa0\xd5\x56\x1f\xb7\x0c\
-\x34\x01\xd2\x04\xf0\xcc\x4a\x80\x59\x50\x00\xec\xb8\x45\xff\xf2\
-\x5a\xab\x68\x0f\xe4\x5e\x7a\x13\x46\x57\xca\x00\x68\xbe\xc3\x25\
-\x03\x91\xb0\xdf\x2e\x74\x0b\xe8\xc4\x43\xed\xc4\x3e\xff\x80\x7a\
-\x53\x78\x7d\x56\x21\xf5\x8c\xb9\xec\x0e\x78\xf4\xd4\x89\xfa\x1c\
-\x80\x9e\x7c\x99\x2b\x19\x7d\x05\xcf\xbf\x93\x05\x14\x0e\x51\x4a\
-\xa7\xe3\xe6\xd3\x7d\x1a\x30\x7c\xe9\x3a\x5a\x41\xa4\x73\x8b\xb1\
-\x3c\x75\x6c\xb8\x35\x9a\x70\xdd\x34\xe6\x04\xac\x35\x58\x37\x4a\
-\x0e\xb2\x2c\xe0\xf2\x4e\x8d\x2f\xbb\xfb\x10\xc6\x63\xd1\xb6\x60\
-\x04\x03\x67\xbb\x8a\xe6\xd7\x6c\xc0\x60\xfc\x18\xd4\xe0\xa7\x41\
-\x9d\x41\x34\xfa\x9d\xc2\x21\x34\x02\x6c\xd7\xc0\x97\xbf\x1e\xb8\
-\xe5\xc6\x21\xfd\x00\x00\xd8\x6f\xf8\xd6\x78\xe9\x00\xe6\x51\xff\
-\xbf\xd4\xb9\x87\x19\x6e\x65\x05\xef\xfe\xc6\x77\x22\x8c\x3d\xce\
-\xd5\x6d\x32\xfe\x9d\xc0\x5a\xf7\xb7\x8c\x59\x08\xa8\xcd\x09\xb4\
-\x16\xf5\x43\x1b\xc0\x6d\x00\x37\x01\x62\x35\x3f\xd7\x21\xa5\xfd\
-\x32\x0b\x90\xdd\x16\x38\xb6\xaa\xfc\xfe\x32\xfd\x4f\x69\xf0\x22\
-\xe0\x8f\x16\x44\xaa\x5e\x5d\x3e\x08\x6c\xcb\xe2\xaf\x69\x28\x6b\
-\x18\xd8\x18\xdc\x49\x93\xa5\x5b\x0e\x74\x84\x35\x06\x4a\x83\x54\
-\xaf\xa3\x07\x04\xf6\xc6\x7a\xfb\x82\xa5\x44\xdd\xda\x7c\x6e\x7a\
-\xd1\x75\xa5\xce\xe6\xda\x7c\xa5\xe4\xda\xc0\x7b\x27\x32\x9f\xf9\
-\x5c\xa1\xaa\x22\x7b\x5e\x11\x49\x2c\xc1\xe8\x04\x9a\x10\x30\x6b\
-\xb4\x1b\xa0\x4c\x41\xc5\x03\xda\xb6\x05\x9b\xcc\xd8\xe1\xf5\x0a\
-\x6f\xbd\x7d\x53\xdb\x82\xb3\x59\x26\x07\xd5\x53\x2d\x05\xa6\x16\
-\x24\x62\xca\x5f\x5b\x09\x50\x07\xc5\x08\x5a\xc9\x98\x41\xc4\x0d\
-\xb6\x5a\xd5\x8a\xf8\xe0\x3b\xf7\xea\x0a\x7c\x01\x80\x6f\x5f\x3a\
-\x80\xee\xf9\x8b\x28\xd5\x7c\x0d\xf5\x7f\xd5\x17\xbf\x16\xd7\xdd\
-\x79\x0a\x4f\x6d\xd7\xb8\x14\x04\x97\x43\xc0\x56\xc3\xd8\x69\x19\
-\xd3\x36\x60\xd6\x46\xe3\xcf\xac\xb0\xb6\xb5\xf4\xbf\x65\xa0\x65\
-\x84\x54\xef\x33\x24\x7a\xf4\x59\xd0\xd6\xdf\xa9\x4d\x74\x34\xea\
-\x22\xf1\x87\xdc\x02\x43\xa5\x2e\xb0\x37\x77\x21\xef\x9d\x08\x74\
-\x59\x44\x0b\x8c\xa1\xf3\x10\x19\x40\xc9\xfb\x99\x00\x7a\x32\x5c\
-\xa5\xee\x40\x1f\x6b\xa0\x2c\x3b\x3e\x97\xe6\x17\x54\x62\xd7\x57\
-\x25\xa2\x6e\xc7\xa0\xf3\x5a\xae\x94\xe2\xf7\xf1\x82\x12\x0c\xa4\
-\x2b\xbc\x61\xb2\xc0\xc1\x4a\xe1\x3b\x18\x2c\x4a\xfb\x6d\x13\x43\
-\x50\x8d\x5c\xe7\x04\x34\x13\x98\x35\x2d\xea\x5a\x35\x04\x99\x03\
-\x2e\xef\xb6\xf8\xc2\xbb\x0e\x62\x6d\x85\x8d\x0f\x50\xe0\x01\x6d\
-\xa3\x25\x62\x1d\x9d\x40\x50\x59\xb1\x99\x95\x03\x53\xbb\xaf\x36\
-\xc3\xdf\xe1\x0c\x16\x5e\x9c\x02\xb7\x9f\x01\xde\x74\xcf\x5e\xa5\
-\xc0\x77\x41\xb7\x11\x2f\x1d\x00\x80\xb7\xa2\x2f\xb5\xdc\xb6\x58\
-\x3b\x7d\x14\x6f\x78\xef\xeb\x70\x7e\xa7\xc6\xa5\xb6\xc5\xe5\x36\
-\x60\xbb\x65\xec\x16\xb7\x59\x11\xf9\x43\x4c\xfb\x9b\x16\xdc\x58\
-\x06\xd0\x6a\xfa\xc6\xb3\xa0\x75\x7f\xdd\x82\x67\xad\x8e\x76\xee\
-\x1f\x03\x87\x56\xd3\xbe\xba\xee\x5c\x3e\x16\xf4\xe8\xaf\x12\xfb\
-\x93\x81\xeb\x17\x7b\x5d\xef\x32\xff\xb3\x7b\xb1\x0b\x1d\x2d\xd6\
-\xd9\xa3\x9e\xc0\xa9\xeb\x4d\x18\x76\x04\x49\xec\x2a\xf0\x7d\x86\
-\x61\x91\x2d\xcc\x75\x16\xfa\x63\xca\xa5\x43\xe8\x53\x80\xdd\x00\
-\x31\x8a\x7a\xe9\x3e\xcd\xff\x8e\x8b\x30\x94\x22\xab\x90\x82\x7e\
-\xab\x13\x9f\x26\x1e\x12\x94\x18\xd4\xd8\x60\x50\xc6\x04\x74\x5c\
-\xb8\x31\x40\xb0\x6e\x5b\xec\x5b\x19\xe1\x9d\x77\x1d\x00\x76\x76\
-\xd5\x09\xd4\xbb\xf9\x36\x9b\xe5\xf4\xbf\x36\xe3\x6f\x62\x07\x29\
-\x64\x27\x10\x71\x82\x59\x81\x17\xec\xb6\xc0\x17\xbf\x1e\x38\x7c\
-\x68\x68\x56\x00\x50\x39\xb1\xbf\xba\x74\x00\x5a\x71\xfe\x45\xf4\
-\xe9\x92\x41\xf0\x9a\xf7\xbd\x11\xa3\x43\xeb\x38\x37\x6d\x70\xa9\
-\x11\x6c\x35\x8c\xed\x26\x60\xa7\x0d\x98\xb6\x8c\xba\x89\xb5\xbf\
-\xd5\xfd\x4d\x40\xb0\x9b\x22\xfd\x21\x45\x7c\x4d\xf9\x03\x78\x1a\
-\xff\x60\x2d\x70\x66\x33\x93\x7c\x50\xb4\xfe\x1c\x5d\xc1\xd2\xe9\
-\xca\xbf\x15\x15\x33\x00\x5d\xd4\x6a\x01\x89\x60\x01\x10\x46\x0b\
-\x72\x62\x19\x28\x49\xe6\xb6\x19\xb9\xc2\xd8\x7b\x06\x48\x98\x57\
-\x21\xf6\xbd\xe5\x25\x69\x24\x79\x48\xd0\xa4\xe8\x5e\xf4\xc5\x54\
-\xb1\x80\xff\xdf\x77\x02\x22\xd8\x1b\x09\xec\xb5\x0f\x17\xb9\x4d\
-\x9b\xa3\x60\x48\x01\x08\x6a\x47\xa0\x6e\x32\x21\x28\x4e\x0a\xd6\
-\x4d\x83\x10\x02\x84\x19\x97\x77\x1a\xbc\xed\xf6\x43\x58\x5f\x15\
-\xcb\x02\x6c\x50\xa8\xde\xd5\x8c\xa0\x2e\x33\x81\xb6\x9b\x09\x94\
-\xd9\x40\xc4\x08\x76\xac\x3c\xb8\x5c\x03\x07\x36\x81\x2f\x78\x83\
-\x6d\x6c\x1e\x3c\x1f\x04\xf0\x95\xbf\xd5\x1d\xc0\xd7\x01\xf8\xc2\
-\x2e\xf0\xd7\xe0\xe0\xed\xd7\xe3\x86\x37\xdc\x86\x67\xb7\xa6\xb8\
-\xdc\x04\x6c\x37\x1a\xfd\xa7\xf1\xd6\x04\x4c\x5b\xe3\x7b\x37\x01\
-\x6d\xa3\x69\x5f\x32\xfe\x36\x80\x6b\x06\xcf\x5a\xf0\xb4\x55\x27\
-\xd0\x2a\x08\x88\x69\xab\x2d\xbe\xd3\x9b\xf3\xe0\x9f\xa7\xe1\x69\
-\xbd\xce\xa7\xb2\x20\x2b\x90\xc5\x76\xdd\xbf\xd8\xa5\x00\x13\xa5\
-\xe7\x24\x16\xd9\x83\xd0\x15\x9c\xd2\x80\xb1\xf4\x05\x48\x64\x80\
-\x67\xe0\x07\x18\x84\x73\x99\xc0\x02\xe9\xb2\xd2\x58\x5d\x81\x33\
-\x74\xc8\x4f\xd4\x5d\x84\x3a\x64\xe4\xa0\xc5\x2d\xd6\x45\x04\x21\
-\xea\x95\x02\xcc\x96\x09\x64\x27\x50\x37\x99\x1e\x3c\xb3\x8f\x75\
-\x63\x4a\xc2\x46\x20\x5a\x5b\x19\xe1\x0b\x5e\x61\x59\x40\xa8\x2d\
-\x13\x98\xe6\x92\x60\xd6\xda\xcd\xca\x81\xa9\x39\x82\x98\x19\x34\
-\x21\x97\x09\x29\x63\x60\x60\x6b\x06\xdc\x73\x3b\x70\xdd\x99\x21\
-\x2d\xc1\xb2\x2b\xb0\xf1\x5b\xd5\x01\xac\x02\xf8\xce\xae\x61\x08\
-\xe0\x2b\xdc\xf1\x25\xf7\x62\xe6\x09\x97\x66\x2d\xb6\x1b\xc6\x76\
-\x1b\xb0\xdb\x04\xec\x36\x6c\x75\x7f\x40\xd3\x30\x9a\x46\x23\x7f\
-\x8c\xfe\x5c\x82\x7f\x4d\xab\x91\xbf\x0e\xe0\x69\x0b\xde\x55\x47\
-\x80\x9d\x46\x89\x3f\x9b\x93\xae\x03\x70\x39\x9a\xcc\xe7\xe3\x83\
-\x16\x39\x6f\x88\x32\xd0\xbf\x2f\xbb\x04\x43\xe8\x3f\x7a\xd3\x84\
-\xb2\xa8\xdb\x80\x05\xf5\xf0\x80\x03\x72\x7d\x83\xef\x95\x03\xe8\
-\x71\x09\x5c\x2f\x83\xf0\x3d\xbd\x81\xa1\xa9\x3e\xea\x97\x00\xbd\
-\xee\x43\x9f\x97\x40\x43\x19\xce\x5e\xd5\x90\xec\x4d\xb1\x2e\x7a\
-\x02\x49\xe4\x25\xf1\x02\x34\x20\x34\xad\x1a\xfc\x6c\x56\x63\x56\
-\xd7\xca\x09\xb0\x4c\x20\x66\x01\x5b\xbb\x0d\xde\xf6\x8a\xa3\x58\
-\x5f\x03\x30\x2d\x0c\xbf\x31\x47\x50\x5b\x29\xd0\x16\xc6\x9e\x3a\
-\x03\x6d\xee\x0c\xa4\x12\xc0\x1e\x33\x6d\xb4\x9d\xfc\x96\xd7\x0e\
-\x60\x4a\xe9\xdc\x05\xe0\x7f\xf9\xad\xea\x00\x7e\x27\x80\x57\x74\
-\x7b\xfe\x2d\x8e\xbc\xf2\x26\x1c\xba\xf3\x3a\x5c\xd8\x9a\x61\xbb\
-\x61\xec\xb4\x01\xbb\x6d\xc8\x53\x5e\x75\xc8\x51\xbf\x4c\xfb\x6b\
-\xbd\x69\xab\x4f\x0d\x3e\x21\xfe\x56\xff\x63\xda\x6a\xcd\x7f\xc3\
-\x81\x22\x85\x8d\xef\xc6\x15\x58\x7f\x32\x04\xd2\xf5\x5b\x7b\x25\
-\x17\x20\x5f\x98\xf3\x4f\x24\x3d\x67\x20\xf3\x86\x2f\x0b\x8c\xa6\
-\x50\xce\xcd\xaf\xa5\xc8\x26\x86\xc8\x40\xfd\x8c\xa5\xdf\x39\x70\
-\x34\x4f\x2c\x72\xc3\x73\xf9\x09\x1b\x28\x9d\x4b\x9f\xb1\x28\xb2\
-\x77\x7b\x6f\xa8\xb3\xb2\x97\xc4\xda\x5e\x4e\x20\x8d\x6e\x8b\x8e\
-\x0b\x9b\x78\x48\xe0\xac\x1b\x10\x95\x84\xa7\xa9\x14\xc8\xfb\x04\
-\xda\xb6\xc5\xfa\x64\x8c\x77\xdc\x75\x48\xb3\x80\x66\xa6\x6d\xc1\
-\x59\x1c\x16\x8a\x44\xa1\x36\x97\x01\xb3\x36\x47\xfa\x19\x67\xe7\
-\x10\xb9\x01\x11\x17\xb8\x34\x05\x6e\xbc\x0e\xb8\xe9\xac\x96\x17\
-\xc3\xe7\x8f\xe1\x45\x1a\x1b\x7e\x31\x1d\xc0\x3e\x00\xdf\xd1\x35\
-\x20\x06\x8d\xc7\xb8\xee\xed\xaf\xc2\x4e\x08\xd8\xae\x5b\x6c\x37\
-\x2d\xb6\x6b\x5b\x0c\x69\x0e\x20\x3a\x81\xb6\x70\x02\x09\xf4\x4b\
-\x91\xbf\x05\xcf\xb4\x04\x90\x69\x74\x00\x41\xc1\x99\x8d\x0a\x38\
-\xb9\xd9\xad\xcd\x3a\xbc\x7a\xba\x52\x2e\xde\xeb\x6b\xcb\x73\xc0\
-\x07\x64\x3e\x55\x97\xc2\x19\x0c\x65\x14\x73\x77\xd3\x20\x28\x96\
-\x0c\x58\xfa\x49\x82\x60\x91\xde\x5e\x97\x0c\x84\x01\x61\x53\xcc\
-\x0f\xfd\xa4\xad\xc3\x57\x10\x44\x29\xb3\x91\xbd\x2c\x9b\x3e\x97\
-\xcb\x48\xf2\xc0\xb0\xfd\x1d\xd8\x66\x04\x72\x26\xd0\xa2\x6e\x6a\
-\xcc\xea\x16\xb5\x75\x03\x66\x75\xde\x2f\xc8\xcc\xd8\x9a\xb6\x78\
-\xcb\x1d\x47\xb1\x12\xb1\x80\xda\xc8\x41\x69\x58\x68\xaa\xea\x3f\
-\x53\x53\x18\x8e\x01\xa5\x69\xb3\x63\x18\xcc\x12\x6c\x3b\xd1\xdd\
-\xaf\xd2\xc5\xab\xc3\xb8\xc7\x49\x00\x7f\xe8\xb7\x9a\x03\xf8\x1d\
-\x50\xda\x6f\x11\xfd\x03\xf6\xdf\x79\x16\xe3\xeb\x8e\xe0\xf2\xd6\
-\x14\xbb\x4d\x50\xcd\xb7\xa6\x45\x5d\x67\x4d\xf8\xb2\xde\x0f\x4d\
-\x6b\xb7\x80\x50\x07\x70\xdd\x82\x23\xd8\x67\xde\x5a\x66\xc5\x1f\
-\x69\x5a\x03\xd7\xef\xd3\x5e\x6d\x99\x72\xd3\xa2\x08\xb5\x07\x2d\
-\x55\x06\x6a\xfa\x32\xcd\x97\x5e\x7a\x7f\xa5\x7a\x7f\xae\xfd\x27\
-\x8b\x71\x01\x59\xe4\x20\x16\xbc\x5e\xda\xe3\xf7\xa0\xbe\x13\x59\
-\x30\x83\x30\x57\x93\xd3\x00\x60\xba\x80\x17\x21\x72\xd5\x06\xfd\
-\x9c\xbc\x43\xaf\xc3\x20\x30\xca\x37\x0b\x38\x84\x94\x01\xb4\x26\
-\x1f\x36\xab\x6b\xcc\x66\x75\x2a\x03\x5a\x73\x00\x4d\xdb\xe2\xc0\
-\xfa\x2a\xde\x7c\xfb\x01\x60\x67\xc7\xb0\x80\x69\xee\x08\xb4\x91\
-\x2c\xd4\xe4\x36\x72\x5d\x64\x02\xf1\x7a\x9b\x16\x18\xc1\xae\x39\
-\x83\xed\x19\x70\xe2\x28\x70\xfd\x75\x3a\x74\x34\x7c\x7e\x2f\x5e\
-\x84\x61\xa1\x17\xcb\x01\xac\x00\xf8\x03\xfd\xda\x9f\x26\x63\x1c\
-\x79\xfd\x1d\x98\x36\x2d\x76\x67\x01\x3b\x31\xea\xd7\xba\x25\xb6\
-\x6d\x5a\x34\xb5\x7e\x6c\x6b\x6d\xf5\xb4\x8d\x46\x77\x69\x5a\x48\
-\xad\x91\x5f\xec\x8f\xa2\x59\x80\x79\xe9\xe8\xad\x21\xc0\x8d\x87\
-\xe6\x2f\x22\x47\x8b\xeb\xd0\xf2\x4e\x91\x2b\x24\x07\x43\x98\x80\
-\x2c\x68\x6d\x97\x4a\x41\x32\x7c\xc1\xcb\x40\x79\x30\x54\x92\x2c\
-\x9a\x58\x1c\x02\x2b\xe7\xe6\x08\xe2\x95\x40\xc3\x1d\x89\x52\x90\
-\x74\x11\xc1\x67\x6e\xcb\xd7\x15\xc6\xa5\x17\xd6\xf6\xb4\x60\xfe\
-\x41\xf6\xe8\x9a\x4a\x7e\x9f\xed\xfd\xd2\x52\xc0\x94\x84\x43\x9b\
-\x35\x03\x1a\x95\x0f\xd7\xa0\xa2\x59\x80\xee\x16\x64\xec\xcc\x02\
-\xde\xf1\xca\x13\xa8\x46\xc6\x0b\x08\xad\xe1\x01\x53\x60\xb6\x63\
-\x4e\xa0\x98\x1e\x9c\xb5\x79\xa0\xac\xb1\x68\x1f\xdb\x85\xa9\x3d\
-\x58\x64\x01\x77\xdc\x01\x8c\x16\x66\x01\x87\x5f\x0c\x2c\xe0\xc5\
-\x52\x2a\xf9\x20\x80\x3b\x3b\xf7\x34\x2d\xd6\xef\xb8\x09\xd5\xc9\
-\x43\xd8\xd9\xa9\xc1\x10\x95\x66\x13\x20\x40\x74\xaf\x63\xfc\x1c\
-\x91\x02\x5a\x52\x41\x59\xb5\xfd\x5a\x01\x37\xa6\xfa\xd3\x6a\x2d\
-\x26\xad\xcd\x75\xef\x36\xc0\xb1\x35\xe0\xc4\xa6\x7e\x1d\x2f\x54\
-\x19\x02\xff\xae\x32\x50\xc9\x1e\x51\x3a\x39\x0d\xea\xa2\x83\xfd\
-\x45\x24\xb1\x04\xe8\x38\x17\xea\x4a\x95\x97\x59\x44\xdf\x30\x64\
-\xe0\x7b\xf1\xf9\x88\x0a\xa0\x73\x8f\x2e\x42\x39\xa9\x47\x32\x6f\
-\x90\xb2\xa0\x92\x90\x01\xb9\xb3\xc1\xa1\x9f\xe2\x6b\x59\x50\x06\
-\x48\x0f\xe3\x00\x75\x41\xda\x2b\x16\x56\x92\x8a\x02\x16\xc0\x09\
-\x83\xd9\x99\x7c\x58\x8b\x26\x64\x40\xb0\x1e\x37\x98\x8d\x6b\x4c\
-\x9a\x31\x9a\x36\xa0\xaa\x54\x4f\xe0\xd8\x81\x4d\xdc\x7b\xf3\x41\
-\x7c\xe8\xbe\x67\xad\x25\x2c\x26\x8a\x42\x40\x1d\x75\x21\x46\xc5\
-\xdf\xd5\xe9\x16\x21\xbb\x0b\x1c\xba\x52\x6f\xf1\x77\x69\x66\xc0\
-\xc1\x43\xc0\xc9\xd3\xc0\x23\x0f\xe9\x8e\x85\xf9\xf3\xad\x00\xfe\
-\x2e\x80\xa7\x5e\xce\x0e\xc0\x01\xf8\x7d\xf3\xaf\xa4\xc2\xc6\x2b\
-\x6f\xd4\xa9\xad\x26\x20\x98\x03\xd0\x35\xee\x92\x57\xb7\x89\x0e\
-\x84\x06\x13\xf6\x14\x13\xfa\x14\x33\x7e\x04\xc9\x82\x1f\x71\x17\
-\x9c\xcd\x01\x60\xb7\x06\x6e\x3c\xa3\xfa\x7e\x75\x18\x40\x9a\x69\
-\x8f\x7c\x5b\xba\x0f\x11\xd9\xa3\x5e\x97\xc5\x29\xaf\xf4\x31\x03\
-\xe9\x35\x13\x64\x20\xa5\x5f\x94\x41\x14\x8e\x42\x06\x8c\x68\x51\
-\x90\xe5\xa1\xe7\x25\xbd\xd8\x69\xa0\xf9\x31\xd7\xfa\x5b\x50\x3e\
-\x0c\x75\xf8\xae\x58\xe0\x5f\x89\x73\xf1\x1c\x9c\x72\xa7\x4d\xab\
-\xc6\xef\x88\x11\x88\xd2\x46\xa1\x59\xd5\x60\x36\x6a\x30\xad\x6b\
-\xac\xd4\x23\xd4\x75\x83\xb6\x69\x11\xaa\x0a\x5c\x31\x76\x67\x8c\
-\x2f\xbc\xe7\x14\x7e\xf1\x13\x4f\x81\xeb\x59\x41\x92\x82\x8d\x45\
-\x03\x90\x16\xa0\x31\x20\xa6\x15\xc1\x4e\xdf\xd3\x28\xbe\xe2\xcd\
-\x89\x76\x30\x18\x73\x24\xd7\x9f\x05\x1e\x7b\x64\xd1\x6f\x70\xdc\
-\xda\xe2\x7f\xf7\xe5\xec\x00\xde\x0c\xe0\x4d\x9d\x7b\xda\x80\xf1\
-\xe9\xe3\xf0\x27\x0e\x61\xba\x33\x53\x2d\x7f\x08\x18\xa4\x0e\x80\
-\x24\x69\xc3\xb3\x64\x9d\xf8\xa8\x0f\x27\x6c\x8a\xae\xad\xc9\x7f\
-\xc5\xe8\xdf\x72\x96\xfa\x9e\xb5\xfa\xc7\xbc\xed\x48\x37\x5a\x96\
-\x48\xb6\x0c\xb4\xde\x06\x6b\xed\x81\x28\x3e\xf4\x78\x29\xa2\x34\
-\x4b\xcf\x41\xe0\x0a\xf5\xfd\x1e\x60\x60\xf9\xf3\x8c\x61\xd6\x21\
-\x0d\x77\x29\xe7\xbe\x37\x37\xa0\x54\xf4\xf2\xf9\x0a\xc8\xbd\xec\
-\x81\x97\x08\xf6\x68\x61\xf6\x5e\xb3\x60\xf8\x89\x45\x16\xbf\xee\
-\xb9\xf7\x4c\x72\xd3\x44\xb2\x68\x08\x33\x83\x88\x54\x10\x24\xb4\
-\x06\x08\x06\x2b\x05\xb4\x1b\x50\x37\x2d\x46\xa3\x16\x55\x68\xb1\
-\x3b\xab\x71\xdd\xb1\x03\xb8\xe3\xec\x3e\xdc\xf7\xc0\x25\x1d\x0a\
-\xab\xed\x89\x6b\x05\xaa\x81\xb1\x4a\x84\x83\xad\x1b\xe2\x72\xa6\
-\x14\x60\x8a\xcb\xe8\xf2\x14\x84\x01\x6a\x81\x83\x87\x81\x43\x47\
-\x80\x67\x9f\x56\x87\x30\x7f\x7e\x0f\x54\x09\xab\x7e\xb9\x3a\x80\
-\x6f\x1e\xc2\x1e\x56\x6f\xbb\x0e\xad\x08\x78\x16\x2c\xea\x5b\xb0\
-\x24\xa4\x94\x5f\x8a\x0c\x20\x52\x3f\x21\x02\x31\x79\x6f\x61\x33\
-\xfc\xa0\xab\xc2\x10\x9d\x40\xb0\xf4\xff\xec\x01\xe0\xc4\x3e\x75\
-\x0a\x8b\x2e\x4a\xb9\x42\x30\x92\x7e\x74\xe6\xe2\x62\x95\xec\x40\
-\x68\x08\xa0\x93\x6e\x84\x1e\x8a\xfa\x7d\x07\x22\x32\x10\xf9\xcb\
-\x9f\x97\x81\xff\x4b\x16\x47\x4e\x19\xc0\x25\xfa\x96\x45\x14\xf7\
-\xa5\x75\xbf\xdd\x71\x36\xd2\xbb\xc0\x07\x3c\x21\x5d\x4d\x04\x97\
-\xab\xc0\x5e\xae\x26\xec\xf3\x3c\xe8\x0a\x9d\x12\x74\x8e\x11\x58\
-\xa7\x04\x9b\xd6\x86\x84\xea\x1a\xb3\x7a\x6c\xf4\xe0\x1a\xe3\x30\
-\xc2\x38\x30\xa4\x62\x34\x2d\xf0\x85\x77\x9f\xc2\x7d\x9f\x7e\x06\
-\x68\xab\x2e\x2f\xc2\x41\xc5\x40\x1d\x00\x9a\xa8\x0e\x02\x07\xcd\
-\x02\x2a\x74\xf7\x45\x7a\x53\x19\x06\x34\xbb\x0a\xac\x4b\x55\x4e\
-\x9d\x51\x07\x30\x7c\x5e\x09\x95\x0f\xfb\xfe\x97\xa3\x03\x38\x81\
-\x3e\xf5\x91\x19\x6e\xdf\x06\xdc\xf1\x43\x68\x77\x2d\xfa\x53\x76\
-\x00\xb0\xaf\xb5\xcd\x63\x99\x41\x5c\xe9\xc5\x99\xf8\x21\xb6\xe2\
-\x4b\xd3\x7e\xc5\x03\x3a\x0e\x60\x56\x03\x37\x1f\x06\xc6\xce\x06\
-\x81\x8a\x74\x99\xf6\x00\xd8\x20\x7b\x3b\x82\x32\xa5\xef\x1b\x77\
-\x1f\xf9\x97\x3d\x1c\x8d\x5c\x09\x29\xbf\x02\xb8\x88\x2b\x60\x12\
-\x82\x79\xfa\xf0\x20\x05\x59\xe6\x3b\x0a\x83\x59\xf9\x02\xa1\x94\
-\xf9\x1e\xe4\x73\xc7\x55\x06\x15\x82\x9f\x5b\x39\xa0\xf0\x47\x94\
-\x0d\x23\x90\x93\xd4\xf3\x6f\x9a\xc6\x3a\x02\x0d\x66\x4d\x8d\xba\
-\x1e\xa3\x69\x1a\x84\xf1\x18\xcc\x01\xdb\xd3\x1a\xb7\x5f\x7f\x14\
-\xa7\x8e\xac\xe0\xf1\x73\x53\x35\xea\x86\x0a\x9d\x04\x8b\xe8\xc2\
-\x00\x8f\x75\xe1\x8a\x04\xbd\x50\xe3\x36\x25\x4f\xc5\xca\x39\xcb\
-\x02\x83\x28\x60\xb8\xef\x20\xb0\xb6\x0e\xec\xee\x98\x0a\xd5\x60\
-\x87\xec\x65\xe9\x00\xde\x87\xfe\x06\xd5\xc0\x18\x9d\x39\x01\xae\
-\x3c\xc2\xb4\x51\x63\x27\x4a\x7b\x39\xf2\x4d\x2f\x4c\x2e\xd6\x7a\
-\x89\x48\x8a\xfc\xd1\x19\xa8\xc1\xab\xee\x7f\x72\x00\x6d\xd0\x3f\
-\xc8\x6d\xc7\xae\xd0\x7a\xbb\x8a\x76\xdb\xa0\x01\xf6\x80\x3a\xf4\
-\xd2\xfd\xc1\x76\xde\x5e\xb5\xff\x15\x9c\x0e\x16\xcc\x19\x74\xc2\
-\xf5\x02\x1c\x40\xf6\xc0\x17\x64\x00\x2c\x90\xab\xa8\xcb\xa5\x57\
-\x06\xc8\x95\xde\x3f\x59\xe0\x5c\xe5\xca\x86\x2e\x7b\xfe\x42\x1d\
-\x30\x10\x42\x10\xd2\x8e\x80\x63\x67\xd3\x82\xad\x76\x93\xac\x0b\
-\x30\xb3\x5b\xdd\x28\x6b\x70\x14\x2a\x78\x1f\x40\x6e\x15\xef\x78\
-\xd5\x69\xfc\xdb\x1f\xbe\x2f\x6f\x83\xf2\x4e\x47\x82\xe3\x46\xd9\
-\xca\x69\xca\x2f\x3e\x83\x81\x6c\x7a\x0a\x11\x62\x72\xbd\x72\x86\
-\x59\xb3\x86\xc3\x47\x81\x47\x1e\x5c\xf4\x5b\x7e\x29\x54\x42\xec\
-\x91\x97\x5b\x1b\xf0\x6b\xe6\xdc\xf4\x78\x04\x7f\xe2\x30\xc2\xac\
-\x31\x36\x5f\x8b\x50\xb7\xc6\xea\x6b\x73\x7b\x2f\x7e\x5d\x07\x48\
-\xad\x6d\x3d\x49\xdf\x0f\x90\x59\x63\x3d\xd9\xb2\xed\x67\xdb\x5f\
-\x76\x67\xc0\xb1\x75\xd0\xa9\x7d\x19\xfd\x17\x59\x9c\x2a\x2f\x42\
-\xf8\x65\xa0\x0d\x38\x14\x71\x65\xa0\x25\x28\x03\xf5\xfd\x20\x58\
-\x28\x57\xe8\x30\xc8\x40\x06\x21\xf3\x28\xbd\x60\x38\xfb\x20\x5c\
-\x39\xa3\x19\x2a\x39\x64\x51\xa6\x21\xf9\x46\x03\x75\x0c\x61\x8f\
-\xba\x8a\x16\xa7\xf5\x57\x2c\x05\x68\xb1\x87\x48\x89\x0b\xdb\x4b\
-\x64\x30\x07\xdb\x30\xac\xc4\x20\x95\x0e\x53\x5a\xb0\x7e\x54\x27\
-\xd0\x06\x25\x11\x5d\xde\xa9\xf1\xfa\x3b\xcf\x60\x73\x5f\xa5\x82\
-\x21\xa1\x55\x24\x3f\xd8\x3e\x01\x6e\x54\x4e\xac\x9e\x9a\x9a\x50\
-\x93\x77\x0f\xd6\xad\x0d\x11\xb5\x1a\x7c\xe2\x35\xd9\x34\x7a\x7f\
-\xdd\x00\xfb\x0e\x69\x27\x60\x38\xeb\xdb\x07\xe0\xab\x5e\x6e\x19\
-\xc0\x2d\x00\xde\x3e\x97\xfe\x1f\x3a\x00\x59\x9b\x20\x4c\x6b\xe5\
-\x74\x15\x2b\xf5\xfa\xd7\x2e\x8b\xe4\xec\x4b\xd8\x16\x7e\x5a\xc4\
-\x0f\x92\x3f\x67\xab\xb7\x42\xd0\xaf\x77\x6b\xd0\x2d\x47\x81\x49\
-\x05\xaa\x43\x37\x70\x13\x2d\x30\x84\x7e\xfb\x4d\xae\x9c\x8e\x77\
-\x52\x7e\x19\x4e\xf7\xb1\xc0\x61\xf4\x23\x7c\x1f\xf0\x62\x0c\xe3\
-\x04\x57\x02\xce\xca\xee\x05\x0f\xbd\xe6\xde\x7d\x3c\x90\xc1\x94\
-\xbf\x57\xe9\x65\x64\xc0\xa1\x75\x1c\x95\x3c\x87\x96\xa9\x2c\xaa\
-\x55\xf6\x48\x01\xe4\x2a\x5a\xb4\x62\x6d\xc1\x00\x66\x9f\xa4\xc3\
-\x74\x2a\x30\xae\x11\x9b\x28\x35\xd8\x88\x41\x61\x34\x82\x0f\x2d\
-\x56\xd6\xd6\xf0\xa6\x3b\x8f\xe3\x47\x7f\xfe\x21\xeb\x00\x48\x4e\
-\xf1\x5b\xc3\x49\xc0\xd6\x36\x65\x80\x7d\x06\x00\x1d\xe5\x45\xb3\
-\xe5\x26\xda\xb8\xb1\xb6\x9a\x00\x6b\x1b\xc0\xe5\x0b\x9a\x11\xcc\
-\x9f\xaf\x04\xf0\xf7\x9e\x5b\x1b\xe4\xa5\xed\x00\xde\x0d\x1d\xfe\
-\xe9\x78\x71\x7f\xe4\x80\xd6\xf0\x26\xa2\x28\xae\xcb\x4a\x93\xd4\
-\xee\x8b\x38\x80\x5d\x80\x6c\x20\x55\x5c\xef\xcd\xa5\x03\x88\x38\
-\x80\xb5\xff\x3c\x80\x3b\x4e\x64\x20\x6b\x28\x75\x95\x01\xcb\x5a\
-\x54\xab\x97\x86\xc1\xfd\x0b\x7b\x51\x7a\xbe\x87\x43\x48\xde\xee\
-\x4a\x4e\x43\xba\x11\x9f\x16\x00\x67\x0b\xbb\x08\xb2\x37\xab\xb0\
-\xdf\xe6\x94\x32\x1a\x4b\x17\xdb\x98\x2b\x6f\x7a\xce\x4f\x7a\x65\
-\xc8\xd0\xff\x31\x7c\xe7\x82\x96\x05\x16\xfc\xce\xf3\xad\xcf\xee\
-\x9f\x95\x41\x70\xf6\x92\xd8\x88\x41\x2e\x65\x01\x75\x1b\x4b\x01\
-\xcd\x04\x56\x9a\x16\x61\x1c\xc0\x15\x63\x5a\x33\x5e\x7f\xd7\x59\
-\xfc\xf8\x2f\x7e\x06\xa1\xa9\x0d\x0b\x70\x05\xe8\x68\xcd\x7f\x27\
-\x40\x70\x1a\xd1\xd9\x65\x39\x39\x07\x03\x01\x4b\x67\x68\xd7\x28\
-\x11\xb0\xb1\x0f\xb8\x7c\x71\x91\xbd\xbc\x11\xc0\x59\x00\x0f\xbe\
-\x5c\x1c\xc0\x97\x0e\xa5\xff\x38\xb0\x0f\x32\xab\x4d\xee\x99\x3a\
-\x2c\xda\x12\x70\x4e\x5c\x1a\x93\x58\x8a\xeb\xbe\xd3\x1b\x6a\xfb\
-\xfe\x10\x97\x7c\xb2\x81\x7f\x75\x03\x1c\xda\x00\xae\x3b\xd8\x4d\
-\xff\x05\xc3\x86\xda\x37\x94\x4e\xbb\x4d\xf6\x46\xaa\x65\x01\xf2\
-\x1f\xff\x4f\x1e\xa2\x05\xd3\xde\x2d\xbf\x45\x6d\xc9\xb8\x48\xa3\
-\x4c\x67\x78\x51\x67\x43\xe6\x1d\x50\x7c\x0d\x3c\xd0\x96\xe4\x05\
-\xf8\x45\x69\xdc\xcc\xf3\x0e\xb1\x97\x82\x77\x77\xb0\xcb\xb0\x33\
-\x92\x45\x00\xa2\x5c\x21\xe2\xcb\x40\x5a\x53\xa2\x00\x71\x46\x20\
-\x83\xb2\x92\x66\x04\xb4\x0c\x50\x40\x50\x87\x84\x56\x9b\x1a\x4d\
-\xbb\x92\xd4\x84\xc6\x23\xc6\xb4\x6e\x70\xe6\xf8\x51\xdc\x7e\xc3\
-\x41\xdc\xf7\xe9\xf3\xa6\x14\x25\xc5\xcd\x32\xd6\xc6\xd0\x7d\x12\
-\xc3\x03\x7a\xf3\x14\xa5\xe3\xe4\x08\x1e\x02\x18\xaf\x9a\xd3\x08\
-\x43\xd9\xce\x9a\x05\xcd\x7f\xfc\x72\x70\x00\x87\xa1\xfd\xff\x22\
-\xfd\x17\xd0\xc6\x1a\x50\x79\xf0\xac\x31\xad\xc8\x1e\x27\x9d\x23\
-\xc8\x5e\xd4\x75\xdc\x7f\x33\xcd\x29\xc4\xb4\x3f\x66\x02\xad\x65\
-\x08\x3b\x53\xd0\x1b\x6f\x02\x36\xc6\x4a\xfe\x19\x4c\xf1\x17\x19\
-\xff\x40\xcd\xcf\x32\x8c\xee\x97\xe0\x5f\xe7\xf1\xbd\x8b\x93\x87\
-\x8c\x5a\xae\xa2\xf5\xb8\x00\x7f\x58\xd4\x61\xd8\x2b\x7b\xc1\x80\
-\x23\xe3\xde\x73\xb1\x0c\x94\x37\x03\x4f\xda\x21\x21\x49\xd7\xb9\
-\x5e\x0d\xbe\x41\xb2\xa0\xc4\xda\xab\x6d\x52\x3e\x74\x01\xa8\xd1\
-\xcb\x30\xf4\x72\x61\x10\xb1\x71\x02\x6c\x48\xa8\xae\xd1\x8c\xc7\
-\x86\x03\xd4\x68\x9a\x09\x9a\x56\xe9\xc1\xde\x07\x84\xe0\xf0\xe6\
-\x57\xdd\x80\xfb\x3e\xf5\x04\xd0\xfa\x3c\x04\xe5\x28\xa7\xfe\xb0\
-\x2e\x00\x58\x4b\x05\x76\x59\x77\x11\x45\xcb\x34\x5d\xb3\x76\xad\
-\x82\x80\xc9\x04\xd8\xde\x1e\x98\xa9\x00\xa0\x3a\x19\x2f\x0b\x07\
-\xf0\x3a\x00\x47\xe6\x92\xbb\x7d\xeb\x60\x0e\xe9\xcd\x90\x62\x18\
-\x45\x48\x3a\x53\xb3\x14\x45\x3b\x13\x13\x88\xcb\xbf\x6c\x2e\x05\
-\x84\x8b\xfa\xdf\xde\xec\x5b\x4e\xe4\x11\x55\xd1\xe7\x12\x19\x48\
-\x79\x3b\x86\x50\x1a\x7a\x3f\x8d\x1b\x30\x44\x5e\x50\x22\xf4\xbf\
-\x5f\x5e\x9c\x4c\xc3\x11\xb6\xdf\x65\x28\x53\xea\xbe\xa3\x19\x74\
-\x66\x7d\x63\xee\x00\x29\x5d\x83\x2e\x7f\x47\xee\x19\x63\xff\x67\
-\x3b\x4e\xb2\x77\x2b\x33\x24\x96\x01\x15\xa4\xb2\x6c\xe0\xab\x40\
-\xf6\x7b\x25\xc0\x50\xf7\x86\xf7\xee\x29\x0a\x48\x73\x01\x21\x50\
-\xec\x06\x08\x43\xc4\x65\x07\x60\xa3\xc2\xb3\x24\x1f\xd6\x60\x25\
-\xee\x10\x60\xc6\xf6\x6e\x83\x57\xdd\x7a\x3d\xf6\x6d\xfe\x32\x2e\
-\x4d\x1b\x6b\xef\x45\xac\xca\x6a\x77\x09\x80\x18\xa0\x27\x3e\xcb\
-\xa0\x39\x9f\x1d\x5c\xe9\x30\x99\xf3\x6d\xb4\x02\xd0\xf6\xa2\x5f\
-\xe2\x4d\x00\xd6\x01\x6c\x5f\xeb\x0e\xe0\x2d\x73\x7f\xdf\xca\x03\
-\x1b\x6b\xaa\xd0\x63\x2c\xae\x3e\xd7\xbc\xc4\x9c\x44\x86\x0c\x35\
-\x82\x2a\xdc\xfd\x3c\x96\x00\x75\xa3\xb4\xdf\x5b\x8f\xdb\xfe\xbf\
-\x3d\x22\xff\x60\x54\x2f\xff\x68\x03\x65\x00\x2f\xea\x08\x2c\x4a\
-\xaf\x65\x71\x7a\x3f\x54\x3b\xcb\x55\xb6\x24\xf7\x02\xc1\x16\x75\
-\x22\x3a\xce\x8a\xf6\x28\x81\xb8\xeb\x18\x58\x06\xb2\xee\x92\x04\
-\x25\x59\x0e\xad\xef\x04\xaf\x48\xfb\xc5\x62\xec\x05\x72\x65\xdc\
-\x62\xe1\x1b\xc5\xe9\x41\xc2\x01\xec\x5c\xda\x2e\xdc\x36\x2d\xda\
-\xb6\x51\x6e\x80\x69\x04\xa4\x69\xd3\x91\x8a\x8d\x8e\x47\x6b\x78\
-\xe3\x5d\xd7\xe1\x47\x7f\xea\x13\xaa\x24\x95\x16\xb9\x70\x61\x46\
-\x9c\x3d\x66\xd4\x4b\xe0\xb6\x00\x99\x7b\xc6\x8f\x48\x0c\xf2\x59\
-\x5b\x61\xfe\x9c\x01\x70\x37\x80\x9f\xbb\xd6\x1d\xc0\x1b\xfa\x7f\
-\x3d\x9a\x4c\x20\x95\xd3\xf6\x4a\x79\xcd\xd1\x50\x39\x38\x90\x8e\
-\x02\xc6\xc0\x32\x43\xe4\x50\x80\x82\xf6\x26\xcf\x66\xc0\x4d\x27\
-\x41\x87\x36\x54\x1a\x9c\x7b\xc6\xbb\x57\xfd\xbf\x88\xc4\x33\x07\
-\x84\x0d\x38\x06\xd9\x2b\x25\xa5\x3d\x52\xf3\x01\x47\x01\x59\x1c\
-\xe9\xfb\xe9\x3c\x2f\xe8\x5c\x94\x11\x5a\xa4\xdf\x5a\xe9\x7e\x3f\
-\x5e\xc7\x11\x4b\x29\x4b\x82\x44\x7e\xe1\x8c\x66\x97\xd9\x51\xc7\
-\x61\x0e\xcd\x4a\xf4\x1f\xbb\x47\xd7\x62\x30\xe4\x5f\x91\x3f\xbd\
-\xf0\x67\xf2\x5c\x94\x80\x58\x10\x48\x49\x41\x6d\x55\x69\xf4\x6f\
-\x33\x27\xa0\x09\x5a\x02\x04\x93\x18\xab\x5b\xc1\x6b\x5f\x71\x23\
-\x7e\xfc\x43\x9f\x44\x68\x1b\xa3\x49\x0b\x40\x86\x39\x39\xd1\x6c\
-\x80\xa0\x04\x80\x60\x72\xeb\x40\x57\x3f\x21\xbe\x27\x6c\x19\x6a\
-\x0c\x5c\xde\x69\x80\xa2\xc1\x36\xfd\x1b\xaf\x75\x07\xb0\x69\x5e\
-\xac\x5b\x47\xaf\xad\x68\xda\x1f\x38\xa7\x73\x11\xd8\xa2\xa1\x68\
-\xc9\xdd\x8b\x86\x65\xbe\xa6\x2a\x3d\x6c\x60\x60\xd6\x58\xfb\xcf\
-\xeb\x9c\x76\xdf\xb0\x07\xfb\xf2\xfd\x8c\x40\xe6\x33\x81\xc1\xf2\
-\x00\xc3\xb8\x00\x0f\x71\x09\xf6\x32\xe8\xa1\x96\xde\x00\x49\x68\
-\x51\x8b\x0d\x0b\x0c\x1c\xdd\xd7\x4c\xfd\x36\x5d\xe9\x5c\x43\xf1\
-\xc4\x6c\xb8\x0b\x0a\xd0\x72\x0e\x10\xec\x7f\xde\x2f\x13\xec\xce\
-\x18\x31\x65\x41\xf6\x30\x98\x0d\x5c\x6d\xda\x83\x41\xe7\x18\x77\
-\x09\x52\x11\x61\xc4\x14\x83\x98\x03\x02\x9b\x9c\xb8\x6d\x17\xae\
-\xed\x63\x54\x0e\x16\x51\x69\xf1\xb3\xa7\x4e\xe2\xfa\x93\xfb\xf1\
-\x99\x47\x2f\x74\xeb\xff\xb4\x47\xd2\x52\x44\xb1\x0c\x81\xcb\x1d\
-\x09\xd2\x2b\xfd\x82\x39\x00\xb1\x2c\xc1\xa9\xe3\x18\xe6\x36\xdc\
-\x7d\xad\x63\x00\xb7\xa0\x2f\x77\x44\x04\x59\x19\x81\xd8\xde\x04\
-\x2a\xd0\x6c\x37\x70\x81\xa1\x5f\x5f\x72\xd1\xaf\x2e\x30\x80\x64\
-\xfc\x56\xff\x8f\x1d\xe8\xf6\xeb\x2c\x23\xc8\x60\x97\x0c\x66\x89\
-\xfd\x8b\x79\x41\x69\xb0\xa8\x74\xc0\x10\x70\x56\x02\x81\x03\x2d\
-\xc3\x21\x34\x5c\xf6\xd2\x18\x1c\x40\xd3\x07\xd3\x63\xb1\x89\xde\
-\x05\x4c\x45\xd9\x03\x6c\xa4\xf9\x32\x82\xa8\xe0\x25\xc4\xf4\xde\
-\x3e\x4a\xc7\x89\x71\xb7\x14\xc8\xed\x93\xc5\xfd\x7e\x1a\x70\x5e\
-\xfd\x29\x45\x91\xe7\xc6\x03\x18\x72\x20\x05\x39\x48\x84\x20\x12\
-\x10\xd8\x21\xa4\x4d\x42\xda\x16\x6c\x5a\x15\x99\x8d\x9a\x81\x21\
-\x08\xaa\x8a\xe1\xfc\x2a\xde\x70\xd7\x59\x7c\xe6\xd3\x4f\x00\x93\
-\xca\x00\x3e\xce\xab\xcd\x25\x18\x26\x50\xe9\x7f\xe6\xa9\xc0\x08\
-\x0a\x27\x4c\xb0\xeb\x31\xe4\x6b\x75\x6f\xd6\xf4\xab\xd0\xe5\x16\
-\x7e\x5e\xcf\x0b\xc1\x04\x7c\x45\x7e\x27\xe2\xff\xea\x80\x51\xa5\
-\x69\x79\x99\x0a\xc5\xc8\x1d\xdf\xa0\x98\x72\x96\x91\x5d\xb8\x0b\
-\xa2\x44\x63\x0f\x21\xdf\x98\x95\x85\xb5\xb9\x0e\x9c\x3d\xa4\x4c\
-\xac\x04\x12\x6a\xe6\x96\x53\xd8\x21\x43\x1f\x48\x89\xa5\xc0\x19\
-\xe6\x5a\x69\x45\x74\xe3\x01\x6c\x00\x03\x9d\x04\x60\xb1\x23\xe0\
-\x01\x3c\x61\x2e\x5a\xe7\xd7\x40\x16\xd1\x09\xf1\xf3\x5e\x6d\x3f\
-\x70\x85\xa5\x2e\x55\xf9\xf3\x84\xde\x73\x95\x25\x6c\xa1\x75\x48\
-\x39\x72\xa7\xc7\xa6\xe7\x2c\x22\x7e\xdf\x21\x42\xf6\xe0\x44\x2c\
-\x48\xeb\xf7\x32\x7e\xba\x0a\x9f\x40\x45\x26\x20\x50\x58\xd0\x34\
-\x24\xf4\x23\xa3\x6d\x1b\xe3\x05\x84\xec\x04\x6c\xc1\x4c\x02\x03\
-\xa7\x2d\xee\xbe\xfd\x26\x8c\xd6\x9c\x32\xff\x42\x6b\xd7\x5d\xab\
-\xec\x40\x6e\xf5\xda\x6b\xed\xf3\xa6\xc9\x2a\x42\x6d\xad\xf7\xb5\
-\xc6\x0e\x0c\x8d\x5e\xdf\xad\x3d\x66\x78\x85\x54\x3c\xb7\xa2\xbf\
-\x2b\xf3\x1a\xcb\x00\x6e\x9f\xef\xff\x57\x0a\x02\x86\xa0\x57\x58\
-\xfc\xd8\xef\x3d\x97\xe9\x3f\xf7\x51\xf8\x05\xa9\x7f\x74\x26\xb3\
-\x1a\x74\xd3\x49\x60\x7d\x25\x2f\x66\x90\x01\x83\xe2\x81\x34\x98\
-\x17\x39\x84\x81\xd2\x60\xb0\x1d\x58\xfc\x0c\x64\x41\x16\x21\x03\
-\xa0\xdb\x82\x5e\xf9\x40\xa7\x80\xe6\x58\x78\xd4\xd1\x16\xa4\x3e\
-\x29\x26\x1a\x25\x89\x11\x54\x06\x32\x84\x39\x85\x21\x2e\x6d\x28\
-\x95\x00\x89\xac\x28\xd4\x65\xe1\x5b\x34\xcc\x92\x01\x52\xfc\x0a\
-\x03\xed\xbe\x21\x22\xd1\xd5\xd4\xf6\x72\xb5\xb5\x7f\x17\x50\xcd\
-\x72\x21\x26\x24\x63\x5b\x85\x43\x50\xc3\x8f\xaa\x41\x29\x1b\x30\
-\x1c\x40\x58\xd0\xb6\x01\x87\x0e\x1e\xc1\x2d\xd7\x1d\xc1\xc7\xef\
-\x7f\x22\x6b\x03\x04\xf3\xd8\x9e\xf3\x7f\x1b\x77\x27\x4a\x01\x16\
-\x3a\xea\x96\x44\x62\xe9\xbf\xc0\xae\x7f\x19\x16\x4a\x51\xc9\xf0\
-\x1b\xf1\x3c\x89\x84\xbc\x10\x19\xc0\xcd\xfd\x3f\x1e\x8d\x2b\x50\
-\xdf\x68\x53\xf4\x0e\xf3\x68\x7e\xe0\x2e\x00\x15\xb8\x9b\x11\x48\
-\xe8\x66\x06\x41\xc5\x19\xe9\xec\x51\x73\x34\x0c\x0a\x05\x5e\x10\
-\x89\x18\x73\xe8\x76\xf1\xc7\xe9\xd7\xf9\x83\xe4\x99\xde\x08\xb0\
-\x30\x16\x0e\xe9\xcc\x3d\xe7\x82\x34\x1c\xe5\x6b\xe8\x66\x06\x39\
-\x3a\xcf\xc7\x72\x32\xa3\x25\x57\xb2\x9b\xa5\x88\xc8\xf1\x91\x0e\
-\x24\xbd\x29\x3f\xa1\x5e\x29\xd4\x7d\xed\xc9\x1f\xd8\xeb\xa7\x4e\
-\x32\x40\xf9\x6b\x21\xcd\xae\x7a\x4c\x5e\xa2\x98\x21\xd0\x30\x39\
-\x68\x51\x94\x7f\x4e\x62\xab\xb8\x42\xa9\x20\x09\x15\xd0\xd2\x45\
-\xeb\xfb\x28\x1e\xca\x2c\xa6\x15\xa0\x2d\xc1\xc6\x06\x86\xda\xc0\
-\xe6\x04\x18\xce\x8f\x71\xef\x5d\x37\x2b\xb8\xdc\xb6\x1a\xbd\x83\
-\xf1\xff\x39\xe4\xaf\x43\xab\xb3\x02\xa1\xd1\x8f\xc2\x79\x4e\x20\
-\x3e\xbe\x2d\x32\x86\x50\xef\x85\x01\x78\x73\x00\xd7\x64\x06\xe0\
-\xd1\x17\xfe\x04\xb4\xf5\xc1\x62\x7c\x2d\xec\xa1\x1c\x33\xd4\xfb\
-\xee\x81\x7f\x65\xfb\x2f\x75\x02\x5a\x6d\xff\xdd\x7c\xda\xfe\x38\
-\x48\x60\x50\xac\xc5\x49\x58\xef\x89\xb4\xcc\x21\xf2\x0b\xf7\xda\
-\x7d\x3c\x10\xfd\xb9\xf7\xf8\x4e\xaf\xbd\xf7\xf3\x43\xc0\x63\x87\
-\xe3\xcf\x73\x6d\x41\x1a\x24\xbe\xc4\x97\x2c\x59\x00\xa3\x88\xd4\
-\x24\xd2\xb3\x41\x9a\xcb\x36\xa8\xec\x60\xb0\xf4\x18\x80\x76\x3d\
-\x76\x3a\x11\x6c\x8e\x85\x53\x39\x20\xe9\xff\x2a\x9e\x13\x64\x0e\
-\x86\x2c\x5b\x88\x44\x21\x07\x90\x8a\x73\x28\xc5\x9b\x7b\x8e\x80\
-\x7a\xf8\x81\x0c\x2b\x21\x2f\xc4\x36\xb0\x87\xf1\x93\xe1\xcb\x5d\
-\xe7\x22\x26\x18\xa2\x38\x80\xa6\xfd\x75\x2a\x05\x74\xdd\x5c\xec\
-\x06\x08\x04\x5b\xbb\x0d\xee\xb9\xe3\x16\xfc\xfb\xcd\x9f\xc6\x2c\
-\x34\x45\x26\xe5\x55\x23\xa0\xf2\x7a\x1d\xba\x62\x0d\xfb\x50\x97\
-\x23\x70\xaf\x1b\x10\xf2\x8c\xc1\xf0\x39\x7b\xad\x3a\x80\x15\xf4\
-\x95\x4e\xe3\xf6\x1d\xce\x17\x52\xda\x3c\x3b\xa8\xca\xdd\x6f\x67\
-\x71\x97\x07\x20\xdc\xe3\x02\xb0\x4e\x5e\x1d\xd8\x0f\x3a\x7d\x40\
-\xc5\x41\xb9\x0f\x54\x91\xdd\x67\x88\xb7\x77\x05\xbf\x00\x39\x43\
-\xe8\x1b\xaf\xc8\x02\xf4\x1b\xc3\x8a\x3d\x25\x61\x09\x57\x68\x25\
-\xf6\x4a\x82\xb9\xb5\x80\x71\x10\x0a\xa5\x0a\x97\x74\x70\x34\x2a\
-\xb2\x0f\x1a\x00\x04\x73\x19\x5f\xce\x12\x2c\x98\x1f\x48\xc0\x9f\
-\x69\x2d\x96\xcf\x9f\x5e\x87\xa4\xb8\xde\x35\x37\x49\xcb\x3a\x48\
-\x28\x95\x13\x52\x00\x7b\x24\xea\x10\xb2\xbd\xf7\xde\xc4\x85\xe4\
-\xa0\xdf\x44\x57\x20\x51\x83\xbb\xb5\x36\x8b\xc0\xb1\x8a\x85\x44\
-\x76\x60\x30\x0e\x40\xdd\x68\x09\xd0\xb6\x01\x1c\xc4\xb2\x84\x80\
-\xf5\x8d\x03\xb8\xf1\xf4\x11\x7c\xe2\xfe\xc7\xf3\x2a\xb5\xf4\x27\
-\x8e\xa9\xbe\xa5\xff\xd4\x53\x4d\x4e\x38\x51\x2e\x55\x49\x82\x66\
-\x05\x24\x10\x3f\x5a\xf4\x6b\x9d\xbc\x56\x1d\xc0\x61\x00\x07\xfa\
-\x1d\x00\x9d\x94\x6a\xed\xe2\x91\xcc\x00\x8c\x7f\x9c\x92\xd3\x5e\
-\x0a\x5b\xc6\x08\xd9\x01\x06\xcb\x79\x00\x2b\x1f\x9a\x06\x74\xc3\
-\x49\x60\xd5\xea\x7f\xc9\x75\x5f\xfc\x0f\x88\x15\x0c\x4a\xf5\x59\
-\xc9\x6d\xef\xd4\xfb\xc6\x47\xee\x64\x01\x72\xe5\x36\x58\x67\x98\
-\x66\x2f\x76\x5d\xd7\x19\xa4\xf6\x9c\x50\x81\xc2\xf7\xe3\xa0\x58\
-\x06\x95\x3d\x25\x75\xea\xf2\x02\x23\x28\x04\x4b\xa8\x4f\xc5\xe5\
-\x9e\x53\x1a\x62\x2b\x16\xec\xc9\xf2\xf7\xa4\x81\xb2\x3b\x19\x59\
-\xec\xe4\x52\x7c\x85\x31\x6b\xa1\xa2\x3d\x67\x59\x81\x70\xfa\x3d\
-\xe4\x4a\x6c\xa0\x3d\x35\x1b\xe4\x0a\xa5\x41\xce\x26\xf5\xff\x66\
-\x10\x7c\x9e\x0f\x10\xc5\x03\x9a\xa0\x5d\x81\xa8\x1e\xd4\xb4\x8c\
-\x36\x95\x09\x8c\xd1\x78\x1d\xf7\xde\x75\x33\x3e\xf1\xb1\x07\x14\
-\xcb\x82\x6e\xb2\xb2\xe2\x5f\x0d\xdf\x31\x92\x26\x18\xe7\xdf\x33\
-\x39\x01\x41\x0f\xd4\x0e\x05\x6f\x62\xb0\x0c\x38\x7a\xad\x3a\x80\
-\x93\x00\x26\x73\x0e\x80\x9c\xa5\xde\x92\xd3\xd9\xbe\xec\x73\xbf\
-\xfd\x23\x43\xf4\xd3\x12\x99\x2f\xea\xfb\x58\xff\x8f\x9c\xae\x67\
-\xea\x0b\x64\x14\x2d\xc1\x44\x7a\x41\x51\xdb\x73\x8f\xd2\xca\xd2\
-\xcd\x0a\x4a\x23\xe6\xa1\x72\x20\x96\x13\xb4\xf7\xcc\x40\x61\xec\
-\xd4\xbb\x90\x09\x45\xca\x2a\x65\x4d\x8f\x0e\x63\xaa\x6b\xf0\x34\
-\xbf\x4d\x8b\x2c\x52\x97\x11\xbf\x5f\xc2\x0c\x39\x35\x92\x3d\x11\
-\x7a\xb1\x9f\x53\x07\x4e\x1d\x61\x25\x31\xac\x01\xa2\x2d\x2e\x0d\
-\xf4\x0e\x04\xb6\x79\x0f\x4a\xaf\x49\x62\x57\x28\x01\x9b\xbc\x87\
-\x30\xd2\xe7\xd0\x0e\xb4\x00\x90\x9c\x50\x1c\x0e\x8a\xcd\x41\xdb\
-\x13\x18\x07\x84\xe2\x2e\x01\x05\x09\x15\x07\x00\x80\xad\x9d\x06\
-\xaf\xba\xe3\x56\x4c\x36\x7e\x12\xb3\xb6\xcd\x99\x92\x2b\xbb\x41\
-\x2e\x07\x2e\x42\x7a\x1f\xf4\x9a\x0a\xe9\xfa\x23\xe6\x1c\xb4\xda\
-\x00\x8c\xf7\x0c\xa4\xd7\xa4\x03\x38\x32\xd7\x02\xa4\x2c\xd5\x94\
-\xf2\xd9\x58\x9f\x11\xcd\x1b\x7c\x1f\xe0\xe1\x3e\x48\x57\x02\x7b\
-\xe6\x4d\x27\x13\xd0\x99\x93\xfa\xa6\x06\x49\xd1\xa9\x8c\xc2\x92\
-\x3a\x00\x91\x93\x1f\x25\xa8\xf9\x0a\xed\x40\x59\x30\x10\x24\x03\
-\x2d\x3b\x99\x9f\xb1\xe7\x6e\x9a\x4b\x3d\x94\x9f\xd0\x15\xe4\x20\
-\x19\x48\xef\x7b\x9c\x01\x42\x56\xa1\x25\xee\x72\xcf\xa9\xac\x11\
-\x12\x58\x27\x5d\x43\x87\x74\xd3\x7e\x50\x8f\xc6\xdc\x8f\xce\x5d\
-\x0d\x05\xea\x49\x21\x46\x69\x71\x72\x04\x09\xdd\x12\x41\x1d\x56\
-\xde\x2d\x48\x09\xa4\x8f\xc6\xe2\x40\xc4\x39\x52\x5f\x29\xfa\x0f\
-\x22\xff\xbd\xf2\xb1\x27\x5f\x2e\x65\x26\x25\x62\x97\x90\x6e\x11\
-\x0a\xcc\x68\x82\x72\x01\x9a\xc6\xba\x03\x41\x27\x08\xe3\xa6\xa1\
-\x7d\xfb\x8f\xe0\xc8\xa1\x7d\x78\xec\xb3\xe7\xf2\xd5\x4d\x05\xfa\
-\x1f\x7b\xcd\xe5\x5a\xf5\xb2\x7c\x15\xb2\xd4\x5f\x33\x00\x32\x00\
-\x5a\x87\xde\xdc\x90\x43\xdb\xf7\x7c\x19\xe8\xf3\xdd\x05\x38\x34\
-\xd7\x01\x20\x35\x62\x4a\x88\xbf\xf6\xed\x89\xcd\x23\x96\x28\x7f\
-\xc7\xb0\xb9\x3b\xed\x97\xbc\x67\x8f\x1b\xd0\xb6\x4a\xd4\x38\x7d\
-\x40\x55\x83\x0c\x1f\x88\x6f\x72\x7c\x6e\x0a\xc5\x00\x51\xc3\x5d\
-\x16\x5c\x69\xe8\x5c\xf0\xdf\xcb\xaf\x87\xf0\x01\xf4\x59\x81\x3d\
-\x21\x08\xe1\x02\xd1\xef\xd6\xd4\x7d\xff\xd7\xdb\xbb\xdb\x45\xdb\
-\x0b\x70\x2f\xf5\xf2\xcb\x9e\xbe\x75\xfa\x9c\x88\x5e\x87\xb1\xfb\
-\x97\x18\x80\x05\x0f\x47\xec\x79\x39\x3f\x3f\x95\xa5\x88\xbd\x76\
-\x07\x81\x03\xa7\xd7\xad\x5f\xe7\xc7\xa6\x9f\xe9\x0b\x09\x1b\xe8\
-\x47\xc5\x12\x11\x2a\x71\x83\xd4\x3a\x2c\xef\x53\xa3\x21\xa2\xe1\
-\x16\xe9\xc2\x4e\x81\x5c\xc1\x41\xd0\x1c\xce\x20\xa2\x6b\xc5\x03\
-\xdb\x3e\x41\x8b\xf8\x8d\xe1\x00\x6d\x50\x01\x91\x10\x94\x33\x00\
-\x61\x8c\xc6\x6b\x78\xe3\xdd\xb7\x02\xdb\x3b\x99\x83\xd2\x36\xc5\
-\xf5\x9c\xaf\x6b\x05\xa1\xdb\x0e\xf1\x87\xb8\xed\x5d\xb7\x41\xaf\
-\xfd\xc5\x5c\x9f\x8d\x6b\x35\x03\xd8\x3f\xf8\x77\x60\x9e\x5f\x4c\
-\xb9\x48\x30\x62\xae\x0f\x2e\xf3\x59\x00\x17\x6d\xc2\xb6\x05\x1d\
-\x3b\x0e\x5a\x5d\xd1\x41\x23\x14\x00\x4d\x27\x93\x40\x46\x62\xa3\
-\x67\x2a\xeb\x7d\x60\x98\x3f\xdf\x41\xcc\x87\x1c\x41\xaf\x8c\x18\
-\x18\x00\xa2\x82\xf6\x4b\x3d\xb2\x0b\xa1\x87\x0d\xc4\xc7\x0c\xc4\
-\x5f\x22\x35\xf8\x8c\x01\x48\x87\xa7\x43\xe5\xc8\x7c\x11\x20\x5d\
-\x49\x95\x4d\xff\x0f\x77\xb2\xaa\xd8\x72\xcc\x5c\xfa\xa2\x54\x49\
-\x91\x94\xe0\x4c\xbf\x51\x71\x01\x2a\xa6\xf0\x4b\x6d\x87\xd2\x01\
-\x14\x46\xce\x0e\xa9\x97\x61\x25\x41\xb2\xf9\x58\x2a\x40\xeb\xe7\
-\x41\xd3\xe6\x2b\xe5\xfc\xdd\xcc\x80\x0a\xc5\x60\xb1\x8e\x06\xc1\
-\xa9\x96\x24\x90\x07\x84\xac\x1c\x68\x6c\xa1\x48\xdb\xea\xba\x71\
-\x0e\x02\xae\x04\x75\x23\xb8\xee\xcc\xf5\xa8\x56\x2b\xb4\x6d\xa3\
-\xdb\x7e\x18\x6a\xec\xb1\x13\x80\xb8\x40\x35\x96\x04\x11\xfc\xe4\
-\xb9\x76\x2f\xa5\xf6\xaa\x28\x75\x60\xfe\x97\x5d\xbd\x56\x1d\xc0\
-\xc6\x90\x03\x88\x6d\x2a\xb2\xbf\xb8\x84\x0c\x6d\x6b\xe9\x3f\x90\
-\xce\x95\xe0\xdf\x20\x1e\x60\x6f\xe8\xac\x01\x9d\x3d\x0c\x9a\x8c\
-\x20\x75\xad\xe5\xc6\xa0\xaa\x4d\x01\x7c\x85\x90\x67\xbc\xb9\xd7\
-\xaf\xe7\x05\x33\x00\x73\xe8\x3d\xcf\xb7\x01\x3b\x8e\xa6\x34\x52\
-\x02\x7a\x5d\xa9\x79\x39\x3d\x2a\x16\xcb\x48\x77\x8b\x58\x59\x3e\
-\x48\x1c\x79\xed\x82\xfa\xce\xa2\x71\xff\xfe\x3e\x13\xd7\x95\xa0\
-\x01\x95\x69\x71\xf7\x77\xa5\xa2\xc2\x17\xcb\x0c\xe2\xb5\x5a\x42\
-\x15\x4e\xf2\xa8\x35\x91\x39\x04\x47\x40\xd0\xd4\x5e\x8a\x61\x28\
-\xcd\x76\x23\x6a\xce\xb9\x0c\x20\xb2\x88\x18\x31\x02\x6d\x2d\x4a\
-\x9f\x3f\x40\xe5\x64\xe2\x5e\x43\x45\x99\x03\x40\x70\xc5\xdf\x41\
-\x67\xfb\xc5\x30\x00\xa9\xcc\x09\x84\x58\xff\x47\x36\xa0\xa8\x03\
-\xb0\xdf\x6d\x3a\x6b\x70\xd7\xed\x37\x63\x65\x6d\x05\x5b\xdb\xb6\
-\x3c\x44\x0c\x08\x6c\x25\x0f\x02\xc5\xbd\x0a\x1c\x2c\x0b\x72\x29\
-\x0b\x24\x6b\x07\x52\xba\x7e\x82\xd1\x89\x17\xb6\xd3\xaf\xc9\x12\
-\x60\x7d\x30\x19\x63\xb1\x14\x5c\x09\x16\x7d\x7a\x2f\xc5\x74\x29\
-\xa5\xed\x45\x4a\xd5\x27\x10\x95\x48\x6a\x08\x80\xf3\xa0\x63\xc7\
-\x0b\x75\xa0\x42\x27\x80\xb3\x64\x98\xa4\xe7\x47\x2e\x03\x3a\x69\
-\x3e\x0a\xa5\xa1\xa1\xf9\xfa\xf8\x3a\x06\xda\x83\x1d\x96\x61\x34\
-\xfe\x32\xa2\xe7\x5a\x3c\x51\x77\x3b\xc6\xd6\xa7\xd6\xe6\xfb\x5d\
-\x81\x39\xe5\x8a\xb6\xf8\x3a\x82\x7e\x9d\xfb\xa5\x47\x24\x12\x90\
-\x70\xfe\x7f\x3b\x22\x2b\x9d\xcc\x5c\xff\x56\x92\xcb\x0b\x05\xfe\
-\x00\x67\xdd\x85\x92\x98\xe4\x62\x8b\x2f\xc1\x00\x04\x22\x2a\x16\
-\x0b\x3b\x4b\xf5\x5d\x27\x1b\x88\xe3\xf3\x89\xa8\x04\x97\xba\x42\
-\x54\x3c\x48\x7f\x7e\x28\xf5\xc7\x55\x74\x0c\x0a\x07\x46\x52\x70\
-\x01\x58\x6f\x88\x6a\x41\x31\x0b\x08\xc6\x03\xc8\x9d\x81\x10\xeb\
-\x74\x30\x1a\x59\xc1\x2b\x6f\xbb\x5e\x85\x41\x39\x76\xa0\x42\xc6\
-\xa1\x38\xe4\x12\x95\x59\x1d\x5a\x68\x2d\xdd\x0f\x73\xe4\x36\xda\
-\xbb\x0b\x50\x5d\xab\x0e\xa0\x5a\xd8\x96\xb1\xd6\x1d\x85\x88\x86\
-\xda\x2d\x84\x9e\x81\x87\xee\xa0\xcf\x10\x36\xc0\xc5\xcf\xac\x8c\
-\x40\x67\x8e\x18\xff\x3f\x4b\x84\x49\xa9\x1d\xc8\x36\x0f\x10\x8a\
-\x56\xe2\xac\x10\x10\x29\xb3\x80\x20\xf3\xb3\x00\x5c\x18\xff\x1c\
-\x2e\x50\x94\x0a\x6c\x06\xd4\x01\xf0\x0a\x2f\xd2\x43\xe3\x53\x0d\
-\x6f\x9f\x97\x0e\xc2\x19\x80\x96\x9d\x87\x46\xdb\x04\xf4\x59\x44\
-\xb6\x0e\x57\x36\x1d\x51\xa7\xe1\x50\x18\x32\xdb\x7d\xc2\xf6\x3d\
-\xfd\x7e\xfa\x3c\xd6\xfc\x52\xd4\xf9\xf6\xb3\xfa\x58\x2a\x9c\x84\
-\x7e\xee\x8a\x5a\x9f\x88\xd2\xfd\x11\xbb\x70\x66\xe8\x0e\xe5\x12\
-\x62\x57\x70\x40\xf2\xcf\x46\x30\x34\xc3\x06\x94\xbb\xc4\x1d\x27\
-\x70\xa5\xda\xbf\x4f\xd0\xe8\xed\x6c\x28\x5a\xcf\x6c\x64\x1f\xed\
-\xd0\x89\x45\xfd\xc8\x0f\xc8\x33\x01\x71\x15\xdd\xea\xca\x2a\x6e\
-\xba\xfe\x8c\x2a\x06\x4b\x61\xf4\xa1\xed\x32\x5b\x43\x6b\x8e\x33\
-\xcc\x05\x2d\xb2\x6b\x8f\x98\x13\x86\xf3\x42\x9f\xea\x85\x7e\xfe\
-\xc8\x4b\xcf\x3b\xdd\x29\xa5\x62\x65\xdf\x3f\xf5\xed\x93\xf6\x5d\
-\x51\xc8\xf2\x00\x1b\x10\x96\x29\xac\xae\x81\x0e\xae\xdb\xee\x3f\
-\x99\xdf\xda\x3b\xc4\xd9\x17\xc9\xbb\x03\x46\xae\x8b\x0f\x48\xf1\
-\x7f\xf2\xc0\x80\xce\x1e\xa2\x22\x73\xc4\x1c\x9b\x09\x27\xee\xf2\
-\x6d\x3a\x4c\xbe\x22\x92\xa3\x00\xf7\xb2\x4c\x9a\xbe\x27\x09\x3e\
-\x91\xde\x90\x5e\xef\x67\xcb\xb1\x5c\x1a\x1c\x25\xee\x03\x63\xf3\
-\xd2\x63\xe9\xc2\x14\xd2\xda\x5c\x0a\x16\x27\xe6\x07\x05\x23\x11\
-\x90\xa8\x54\x79\x8e\x6e\x83\xd3\xf7\x34\x9a\xea\x02\x4e\xad\xc3\
-\x5d\xe1\x1c\xa9\x18\x93\x2d\x60\x1a\xad\x09\x34\xcb\x61\x49\xd2\
-\xdf\x0b\x05\x48\x7b\x0e\x21\xa9\x04\x95\x40\x64\x39\x24\x14\x62\
-\x16\x10\x14\x00\x6c\xd9\xb8\x00\x82\x36\x08\x82\x08\x46\x00\xb6\
-\x76\x6a\xdc\x7c\xd3\x4d\x18\xef\x5b\x45\xdd\x36\x5a\xfb\x27\x81\
-\x50\x7b\x8f\x5d\x6c\x79\x87\x04\x6e\x94\x46\x4e\x52\xfe\x8d\x81\
-\x3d\xe8\xce\xe1\x5a\x75\x00\x6e\x28\xfa\x3b\x16\xc3\xa5\xec\x0f\
-\x18\x7b\xc5\xd4\x15\xcd\xec\x90\x77\xc4\xde\x87\x3e\xba\x5e\xe2\
-\x02\x6d\x0b\x77\xec\x38\x68\x34\xce\x3a\x03\x94\x5b\x3e\x02\x0c\
-\x0f\xe1\xc4\x48\xbf\xdb\xe8\xd2\x47\x14\x0c\x3e\x5e\xc0\xe1\x2f\
-\xe7\x02\xc0\x73\x0e\x20\x45\x7a\x43\xd9\xbb\x1c\xf8\x78\x31\x50\
-\xaf\xbe\x46\x8a\xe6\xd4\xd9\x59\x4a\x05\x20\x27\xa9\x45\x4f\xd2\
-\xf5\x9d\xf1\xf7\xa4\x01\x66\x61\x54\xaf\x96\x04\xb4\x70\xe7\xff\
-\xeb\xac\x02\x2b\x96\xaf\x94\xdd\x8d\x0e\x57\x81\x28\x13\x78\xa4\
-\xf7\xdc\xd4\x29\x60\xd4\x60\x9d\xc9\xb8\x13\x81\x1c\xa5\xbd\x6f\
-\x89\x23\x43\xce\xe8\xc5\xc1\x32\x83\xf8\x9e\x9a\x13\x30\x6c\x88\
-\x12\xb6\x41\xc8\xd8\x61\x29\x55\x2e\x7b\xb3\x05\x45\x3a\x0e\x36\
-\x2f\x40\x56\xb6\x9f\xc6\x95\x3c\x1b\x10\x67\x01\xda\xd6\x16\xd0\
-\x5a\xcb\xb0\x0d\x01\xd7\x9d\x39\x8d\xf1\xa8\x42\x5d\x4f\x6d\xc3\
-\x0f\x17\xad\x47\x05\x39\xc9\x71\xe2\x83\x94\xb4\x6c\xd7\x49\x52\
-\x7a\xdb\x84\xe7\x4f\x73\xad\x96\x00\xf5\x1c\x5b\x4c\x72\x6d\xa9\
-\xd1\x30\xb7\xd8\x28\x94\x83\x3e\x21\xb7\x47\x52\x9d\x5f\xa8\xd2\
-\x08\x77\x33\x80\x10\x80\xa6\x05\x9d\x3c\x00\xaa\x2a\x05\x58\xec\
-\x67\x25\x14\x6a\xc1\xa1\x27\x1d\x56\xae\x12\x6b\x6c\x89\xe8\x1c\
-\x00\x28\xf3\x9f\x33\x0f\xaa\xe9\x50\xfc\x9d\x92\x5e\x84\x45\xec\
-\x54\x2f\xc7\x76\x1b\xcd\xc9\x8e\x91\xa1\xef\x0e\x45\x09\x50\xd4\
-\xd8\x54\xb0\x02\x1d\x4b\xf1\xd8\x98\x5a\x4b\x97\xea\x1b\xcb\x09\
-\x6b\xf1\xc5\x00\xa5\xa9\xbd\x58\x59\x90\x5b\x87\x64\x33\x12\xd1\
-\x74\xb5\x1c\x88\x2d\xc5\xa2\x5d\x29\x39\x2b\xc9\xe9\xbc\x76\x04\
-\x1c\x69\x89\x40\xae\x28\x07\x6c\xaf\x9e\x4b\x3c\x07\x67\x64\x20\
-\xbb\x39\x2d\x21\x22\x3e\x40\xd1\xb9\xd8\x7d\x79\xe0\x89\xba\x99\
-\xa4\xf5\xde\x53\xbb\xf0\x2a\xc8\x41\x94\x76\x05\x14\x34\xe6\xc2\
-\xd9\x65\xe5\x60\x9b\x16\xe4\x9c\xfe\xb7\x96\x19\x44\x30\xb2\xe6\
-\x09\xee\xb8\xf5\x7a\x1d\xfd\x2d\xea\xfd\x8c\xee\x17\xe9\x7e\xd1\
-\xed\x29\x87\x25\x63\x53\x54\x7f\x87\x85\xe6\x38\xbb\x56\x33\x80\
-\x76\xb0\x2c\xb3\x9a\x27\xa7\xe7\x5c\xe8\x36\xc8\xdc\x54\x64\xc9\
-\x2d\x9f\x9b\x0b\x28\xdb\x80\xe4\x41\x87\x0e\xab\xe5\x85\x81\x99\
-\xfc\xce\xbc\x49\xf9\x3c\x85\x71\xef\x36\xf3\x9a\xee\x0b\x45\x42\
-\xa4\x93\x25\x50\x99\x01\x50\x17\x7c\xcb\xc0\x75\x9e\x4b\x8f\xed\
-\x37\x2a\xb2\x00\x1a\x28\x07\x50\x30\xfd\x92\x43\x20\x2a\x9e\x57\
-\x12\x99\x96\x3a\xe9\x65\x41\x06\x2a\xf1\x82\x85\xfb\x0a\x17\xcc\
-\xf0\x73\x77\xe5\x96\x14\x5c\x06\xa1\x0c\xd4\xe9\x7f\xe7\x92\xa3\
-\x13\x33\x60\x41\x0c\xe8\xd9\xe8\x25\x10\x84\x54\xe7\x82\xe2\x08\
-\x6d\x2c\xf3\xa8\x74\x7b\x9c\x70\x01\x61\x01\x91\x53\x12\x19\xc5\
-\x4c\xc8\x38\x03\xe0\xee\xcc\x07\x86\xc7\x8e\x73\x27\x80\xd0\x11\
-\x25\x81\x4e\x2b\xc4\x1a\x3f\x30\xdb\x12\x11\x03\x04\x83\xb5\x02\
-\x53\x1c\x62\x6c\xac\xef\xc3\x6d\x37\x9d\xc5\x87\x7f\xfa\x57\x80\
-\x15\xcb\x1c\xc5\x15\x25\xae\xcb\xad\x58\xca\x2d\xdd\x08\x8e\x66\
-\x98\x53\x8d\x5f\xa8\x5a\xe4\xb7\x76\xaf\x55\x07\xb0\x3d\xd8\xbb\
-\xe5\x88\x54\x77\xdb\x35\x12\x53\x4b\xfb\x43\xc6\xfe\xb2\xa0\x98\
-\x3a\x4b\xe8\xfa\x80\x2a\xd0\x64\x04\x77\xec\x88\x46\xf1\x20\xbd\
-\xb1\xd4\x21\x11\x8e\xbe\xe0\x25\x34\x1b\xa0\x1a\x58\x19\xf5\xd2\
-\x7f\xea\x0d\x0c\x75\x71\x00\x2a\xa4\xcb\xcb\x36\x13\x15\x91\xb3\
-\xe4\x02\xf4\xbb\x6f\x54\xa6\xd9\xa9\x5d\x9a\xeb\xf4\x84\xc2\x43\
-\x3a\xc3\x40\x25\x6e\x9c\x90\x79\x2e\x27\xfe\x64\x4e\x71\xa7\xef\
-\x5c\x3a\xcc\x46\xd0\xf0\xf4\x62\xda\xd6\x8a\x4e\x24\x2e\x77\x87\
-\x44\xa3\xd7\xbf\x5d\x11\xc5\xa3\xdb\x8a\x69\x3e\x6b\x4b\x8c\xc4\
-\x68\xc4\x4e\x8d\x3a\x1a\x86\x44\x8a\x60\xf1\xe4\xb1\x54\x54\x27\
-\x68\xee\x8e\x72\x0b\x34\x9b\xd7\x95\xe4\xc5\xba\xea\xb3\xd2\xe1\
-\x3b\x88\x49\x4c\xc4\x49\xc1\xc8\x0d\x90\x02\x08\xd4\x12\x01\x44\
-\x98\x35\x8c\xd5\x8d\x43\x70\x93\x0a\x1c\xd8\x36\x03\x1b\xc6\xe3\
-\xca\x3f\x7a\x2c\x01\x74\x06\x45\x1d\x56\x2e\xff\x1c\x39\x88\xf3\
-\xb6\x21\x68\xf0\xb5\x6f\xbd\x6c\x1c\x80\x98\x35\x38\x26\x30\x71\
-\x8a\x5a\x52\xa4\xca\x52\xae\xc7\x2a\xd2\xe1\xe4\x41\xca\x2d\x2b\
-\x05\x45\x98\xc6\x23\xd0\x81\xb5\xbc\x13\x60\x8e\x54\x24\x9d\x56\
-\x64\xc2\x04\x02\xba\xd9\xc0\x6e\xab\x11\xc9\x17\xc6\x50\x8a\x5d\
-\x4a\x97\xd6\x4b\xb1\xae\xe1\x6e\xbd\x4f\x05\xfd\x15\xe8\x02\x83\
-\x65\xab\x6f\x2e\x35\x04\x7a\x8c\x41\xce\x20\x62\x07\x63\x28\xd7\
-\xd0\xcb\x9c\xc1\x53\x41\x7f\xa5\x82\xf9\x46\xe5\x3c\x70\xc9\x72\
-\xa4\xa1\xe9\xc4\xcc\xcf\x40\xa6\x28\x64\x5c\x5d\x72\x7a\x2e\x2e\
-\x1b\x75\xcc\x0e\x54\xf0\x85\x92\x56\x81\x44\x84\xd0\x39\x08\x07\
-\xed\xef\xc7\xd6\x20\x05\x88\xf5\xfc\x13\xf8\x4a\x46\xd4\x11\x2a\
-\x34\x63\x9c\x39\x96\x90\x99\xbe\x91\x2f\xc0\x32\x47\x5c\x2e\xe3\
-\x0c\x0d\x95\x07\x92\x9d\x81\x08\x2b\x77\x84\x05\x81\x5b\xed\x06\
-\x84\x22\x23\xe0\x9c\xad\x4e\x67\x0d\x5e\xff\x9a\x57\xe0\xdf\xed\
-\x5b\xc7\xe5\xad\x99\x96\x23\x9c\x85\x51\xe2\x22\x18\x6d\x73\x46\
-\xbd\x4b\x07\x97\x1c\x40\x74\x84\xce\x96\x8e\x2c\xb4\xa3\xcb\xd7\
-\xaa\x03\x38\xbf\xc8\x13\x97\x48\xb5\x20\xb7\x41\x24\xa5\x09\x54\
-\x20\xcd\x92\xd3\x43\xe9\x49\x4e\xc7\xb4\xaf\x0d\xa0\xc3\x87\x40\
-\xe3\x89\x4a\x8d\x95\xe4\x74\xca\xdb\x85\xb3\x06\xc5\x80\xfe\x7f\
-\xd9\xd2\xdb\x9a\xe9\x32\x11\x19\x20\xfc\xf4\x91\xfe\x58\xff\x97\
-\xa2\x19\x1d\x1f\x26\x9d\x24\x84\xa8\xa0\xdd\xc7\x2c\x81\x32\x28\
-\x88\x4e\x3d\x5f\xf2\xd6\xd1\x91\xfc\xa2\x1e\x93\x90\x3a\xff\x77\
-\x77\x7e\xa1\xe3\x78\x4a\x99\xf3\xb2\x6f\xbe\x60\xc1\x49\xc7\x3d\
-\xc5\xfb\x1d\x29\x36\x97\x00\x39\x4a\xbf\x30\x91\x53\xc7\xee\x04\
-\xc2\x0e\x42\x0c\x72\x2e\xad\xd0\x26\x17\xd3\xf8\xae\x06\x7c\x39\
-\x3d\xa8\xd8\x42\x64\xe9\x65\xb6\x68\x9c\x38\x8c\xd3\x84\xc9\x09\
-\x90\x82\x70\x42\x00\x89\x2b\xba\x03\x57\xc2\x06\x64\x8e\x2c\xa4\
-\x25\x40\xce\x06\x42\x6a\x0b\x4a\x47\x4e\x4c\xaf\xdc\x89\x65\x87\
-\xdc\xa1\x5f\x52\xb9\xc1\xc9\x32\x0f\x72\x2e\xd7\xfc\x20\x38\xf2\
-\x20\xf2\x70\xe4\x10\x46\xa3\xe1\x1d\x27\x7a\x2e\x5e\xab\x20\xe0\
-\xb3\x83\xf6\xcf\x94\x52\xb9\x0c\x42\x75\x01\x14\xc4\x61\x89\xb4\
-\x38\xa4\x00\xd8\xb8\xd7\xab\x37\x7d\x35\x3a\x72\x50\x47\x33\x5b\
-\xee\x3e\xce\xf8\x06\x89\x14\xd4\x9a\x42\x50\x28\xe6\x0b\x3a\x00\
-\xa4\x00\xd3\x16\xd8\x69\x3a\xcf\xd1\x9f\x09\xa0\x82\x34\x94\xda\
-\x9b\x25\xb5\x73\xae\xdd\xc3\x1d\xe0\x0d\xe0\x94\x3d\xa4\xf4\x5e\
-\x24\xf7\xec\xa9\x1b\xdd\x1d\x24\x91\x6a\x34\xc3\xcc\x54\x52\x27\
-\x52\xf0\xf8\x91\x1f\x9f\xbe\x27\x9d\xef\x25\x50\xb2\xfc\x5e\x04\
-\x02\xb9\x7c\x5c\xee\xc9\x93\x81\x81\x91\x0b\xe0\x1c\x25\xc0\xae\
-\x04\xef\xc8\x90\x7e\x02\xd9\xe3\xad\x77\x1f\x89\x40\x06\x10\x3a\
-\x22\x90\xf3\x9d\x74\x38\x01\x83\x54\x70\x0d\x9c\xb1\xe8\x52\x4d\
-\x4d\x05\x6e\xe2\xba\xe0\x60\xea\xfc\xf4\xd6\xb0\x15\x12\x69\xd2\
-\x17\x1a\x29\xf8\x00\x09\x63\x46\x1e\x13\x66\xab\xff\x3b\x2b\x12\
-\x6c\x41\x2d\xaa\x35\xdc\xfd\xca\xdb\x80\xba\x99\x73\xc0\x19\xf4\
-\x8d\x91\x3e\x92\x9b\x9d\xbd\x5f\x9a\x0d\x78\xe7\x20\x6e\xbc\x57\
-\x1b\xf0\xfc\xb5\x9a\x01\x3c\x61\x2d\x8c\x51\xbf\x1b\xeb\x4c\x31\
-\x86\x2d\x25\x94\x14\x05\x7b\x64\x2e\x2e\x80\xc1\xce\x8c\x7e\x99\
-\x09\x28\xf1\xc2\x1d\x5a\x07\x79\x07\xa9\xfb\xeb\xb2\x7b\x6e\xb5\
-\x43\xd5\xe5\x79\x60\x2f\x46\xc7\x6d\xeb\xbe\x8c\x7c\x17\x6f\xe8\
-\x4d\xf1\x51\x09\xf6\xc5\xd7\x4c\xdd\xe5\x1e\x9d\x81\x99\x38\x96\
-\x1a\x33\x08\x2e\xa3\x3e\x75\xf6\xdb\x6b\xfa\x9f\x51\x7c\x9a\x9b\
-\xec\xc3\xfc\x90\x50\x1f\x77\x18\x2c\x35\x7a\x04\xa6\x39\x7d\x80\
-\xe2\x91\x73\x0b\x7b\x29\x73\xdb\x41\xd6\xa9\xcb\xb5\xbb\xb6\xf0\
-\x49\xd5\x77\xa3\x53\x10\x82\x90\xb3\x89\x65\xd6\x56\x20\x72\xaa\
-\xaf\x94\x6d\xc3\x02\xe2\x9a\xb8\x50\xb6\x40\xb5\x35\x28\x06\xf8\
-\x81\x08\x62\x60\xb2\x90\xd1\x8c\x39\x3b\x87\x84\x1b\xc9\x95\x88\
-\x42\x54\x94\x93\x31\xc9\x94\x4e\xc5\x97\x9b\x46\x26\x0c\x62\x99\
-\xaa\xb0\x60\x63\x6d\x05\xb7\x9c\x3d\x89\x9f\x69\x82\x05\x7b\xea\
-\x70\x8e\x1c\xe5\x6c\xc0\x51\x74\x58\xd1\xf8\x3d\x9c\xaf\x40\xe4\
-\x11\x2a\x87\xc5\x0b\x52\x87\x03\xe9\xb5\xe0\x00\x3e\x0b\x60\xda\
-\x77\x00\x21\x46\x15\x29\x7b\xda\xd2\x4b\xf1\xa4\x07\xa6\x95\x2a\
-\x33\x56\xcb\x8a\xf1\x08\x58\x00\x57\xc1\x6d\x1c\xb2\x29\x43\x4e\
-\x69\x58\x04\x12\x51\x0e\x59\xf4\xa7\xf4\xfa\x83\x3d\xf1\xf3\x96\
-\x81\x4b\x0c\x6c\x4e\xec\xe7\x7b\xc6\x5f\x4c\xcf\x0e\x23\xfd\x05\
-\xf2\x5b\xa6\xf4\x25\x51\x47\x72\x49\xa0\xdf\x93\x54\x22\x51\xcf\
-\x79\x24\x7e\x40\x09\x5e\x17\x8f\x29\x5f\x1b\x75\x58\x82\x45\x90\
-\x33\xce\x03\x0d\xad\xfc\x5a\xf0\xb5\x74\x76\x16\x14\x85\x59\x12\
-\x6e\xc9\x72\x5f\x52\x46\x54\x17\x51\x71\x81\x88\xb3\x36\xa6\x83\
-\x18\x10\x28\xa9\x66\x8e\x23\xb3\xc1\x3a\x0e\x4e\x5f\x1f\x99\xa1\
-\x0b\x75\xc9\x50\xd1\x51\xa0\xd0\x19\xb0\x4c\x41\x58\x92\xd3\xd0\
-\xd2\x80\x0a\x21\x18\x29\xda\x89\x32\x97\x3d\x94\x08\x2c\x97\x4d\
-\x10\x4b\xfb\x33\x21\x35\x4b\xd9\x05\x26\x6c\xcf\x5c\x7e\x6e\x14\
-\xd3\x9b\x51\x7f\x91\x62\xc4\xf7\xe9\xe6\x9c\x57\x07\xe0\x46\x70\
-\xbe\x42\xf0\x6e\xaf\x61\xc6\x27\xae\x55\x07\x70\xc1\x5e\xfc\x66\
-\x27\x00\xb3\xad\x50\x8b\xff\xa4\xb7\xea\xad\x04\xfd\xc8\x0c\x9f\
-\xbb\x7a\xf3\x54\x08\x54\x0a\x0b\x30\x1a\xc3\xed\x3f\x00\xd4\x41\
-\x5b\x4e\x31\xb5\x76\xa4\x4e\x22\x14\xfc\x97\x0e\x88\x88\x42\xa1\
-\x05\xf3\xbb\xf2\xda\x00\x5c\x16\x60\x7d\x9c\x08\x4b\x71\x47\x61\
-\x39\xd8\x16\x17\x9b\x74\x0c\x19\xe8\xa4\xde\x59\xdd\x87\x3a\x11\
-\x3b\x8d\x06\x53\x59\x2e\x14\x2d\x3f\xd3\xe6\xa7\x94\x15\x64\xca\
-\xaf\x0a\x4b\x14\x98\x0a\x17\x98\x03\x75\xf1\x03\x14\xc2\xc0\x83\
-\x33\x0e\x1d\xc5\xa0\x62\x8c\xb0\x54\x6b\x8a\x60\x1e\x9b\x21\x89\
-\xee\x71\xec\xa8\x3a\x25\x7a\xaf\x07\xb9\x16\x08\x66\xf4\xd0\xda\
-\x3c\xa6\xc4\xfa\x97\x0d\xa6\x9f\x61\x85\x86\x23\xc3\xcf\xe2\xcc\
-\x40\xf1\xcb\x8a\xb3\x4c\x81\x0b\xcc\x40\x3a\x40\xa0\x66\x1e\xbd\
-\xe1\x29\xa1\x01\x60\xb0\xdf\x6b\x36\x26\x85\x74\x56\x89\x98\xd1\
-\x53\x57\x80\xca\x24\xe5\x04\xc0\x74\xd6\xe2\xfa\x1b\xce\x62\xb4\
-\xb9\x8e\x56\x8c\x03\x51\x16\x4d\xa4\xb5\xbf\x23\xaf\xc9\x3f\x79\
-\x90\xab\xe0\xc8\xc1\xf9\x11\xbc\xab\xc0\xde\x81\x17\x77\x00\x80\
-\xe7\x71\x45\xf8\xf3\xed\x00\xa6\x00\xee\x87\x6a\x9b\x77\xb9\x8d\
-\x22\x18\xe5\x79\x32\xed\xce\x4a\xec\xc5\x96\xd2\xf3\x59\xce\x2b\
-\xd6\x7f\xda\x32\x2a\x48\x69\xc2\x40\xe5\xe1\xf6\xad\x2a\x00\x98\
-\xd2\x39\xc9\xd3\x72\x76\x01\x2e\x5c\x8c\x39\x84\xf0\x47\x80\x71\
-\x47\x85\x45\x15\x14\xb4\x08\x5a\xe6\xd8\x4c\x45\xcb\x8f\x3a\xc0\
-\x5f\x32\x6e\xc9\x2a\x38\xa9\x8e\x95\xf9\xa1\x9f\xcc\xa5\xcf\x69\
-\xaa\xc3\x7c\xca\x8f\x52\x8f\x9f\x86\x00\xc7\x3e\xe9\xa4\x00\x2b\
-\xfb\x72\x65\xdc\x97\x16\x9f\xa7\x09\x67\x36\xb0\xe1\x37\x44\x69\
-\xfa\x40\xd1\x7d\xfb\x3b\x7a\x67\x2c\x4c\xcb\x7b\xc8\x01\x2e\x98\
-\xd3\xd3\xc8\x2d\x4c\x05\xab\xaf\x58\x9d\x25\x36\x22\x2c\xac\x63\
-\xc6\x28\xba\x06\x36\x0f\x90\x32\xc3\x08\xfa\x25\x99\x6f\x75\x18\
-\x0a\x28\x8b\xa9\xff\x44\xfc\x8d\x2c\x5b\xec\x92\x89\x50\xfe\x9d\
-\xd2\x2c\x82\x4b\x1c\x0d\x01\xe5\xc8\x6f\xba\x01\x62\x65\x45\xbc\
-\xf6\x9a\xa6\xc5\x2b\x6e\x3b\x8b\x8d\xf5\x75\x5c\xd8\x9a\x59\x84\
-\xcf\x35\x3e\x21\x03\x7d\xe4\x2a\x8d\xf8\x4e\x33\x00\x72\x23\x78\
-\x3f\x42\x3d\x92\xbd\x94\x0c\xb6\x00\xdc\x77\xad\x3a\x00\x00\xf8\
-\x38\x80\xf7\xcc\x33\x84\x04\x93\x0c\x93\x24\xa3\x77\x7a\xb9\x1b\
-\x8a\x2b\xb9\x46\x8c\xdd\x5a\x61\x38\x14\x32\x58\xd1\x09\x4c\xd6\
-\x41\x13\xa3\x00\x17\x11\x50\xca\x11\x60\xca\xd8\x81\x94\xed\x3d\
-\xee\x6f\xc8\x2d\xa8\xc0\x71\x22\x70\x7b\xa6\xaf\x60\x75\x94\xfb\
-\xc6\x3c\x8f\xf2\x67\xb4\x3d\xa7\xfe\x31\x93\xa1\x42\xe7\xcf\x51\
-\xa9\xd6\x83\xd4\x5f\xcf\x42\x21\xd2\x01\xe2\x92\x73\xe0\x5e\x1b\
-\x51\x0a\xd4\x59\x72\x36\x42\x31\x4b\x29\x32\xa5\x79\xba\xb2\xf1\
-\xa7\x32\xe9\x22\x45\x6f\x29\x28\xc7\xb9\x0d\x68\x91\x94\x9c\xb9\
-\xed\x2c\xf1\x95\x64\xbd\x2c\xb5\x97\xa8\xbc\x4c\x80\xb8\x42\x1f\
-\x9f\x5d\x56\x85\x02\xac\x77\xee\xac\x7d\x67\xff\xaf\x23\x80\x8b\
-\x65\x38\x12\x89\x32\xdc\x79\xaf\x12\x2e\xc0\x54\x08\xa3\x52\xfe\
-\x08\x31\x47\x25\x98\xd7\x55\xe8\x11\x98\x8a\x12\x27\xa2\xaf\x52\
-\x64\x46\x22\x2e\xd1\x46\x98\xcb\xce\x88\xc0\xfb\x11\xbc\xaf\x40\
-\xd4\x68\x06\x40\x95\x22\xfe\xce\x9c\x01\x55\x66\xf0\x96\xfa\xfb\
-\x11\x5c\x74\x06\xbe\x42\xed\xf6\x64\xfa\xde\x67\xa5\xf4\x35\xeb\
-\x00\x06\xbd\x57\x10\x81\x78\xc0\x71\x5e\x9f\x24\x1d\x5d\xfd\xc2\
-\xf0\xa3\x54\x12\xb1\x19\x51\x77\x26\x5f\x02\xc3\x6f\x1e\x06\xd1\
-\x08\xd4\xb2\xb6\x9f\x84\xe2\xf5\x91\xdb\x43\xc8\x4b\x2a\x88\x65\
-\x80\x0d\x88\x82\x72\xdc\x65\x09\x92\x00\xb8\x3c\xd3\x67\x58\xf1\
-\x49\x4d\xa7\x04\xde\x52\xda\x8f\xb2\x5d\xa7\x46\xe5\xca\x68\x03\
-\x49\xa5\x44\xc2\x42\xd2\x90\x0d\x4a\xb7\x58\xe8\x02\x14\x9d\x81\
-\x24\xa6\x2c\x5d\xa7\x43\x65\x4b\xb1\xa0\x23\x47\xdd\x43\x1b\xed\
-\x4d\x20\x27\x4b\x87\x85\x38\x54\xf7\x53\xa9\xf9\x93\xfa\xf5\x9c\
-\x8c\x57\x02\x01\xac\x60\x5f\xd4\x06\x44\xe4\xfa\x93\x4b\x78\x8e\
-\x38\xc9\x98\x81\x8b\x05\xb4\xcb\xde\x8a\xb4\x06\x76\x31\x9b\x70\
-\x46\x9a\x29\xfe\x3f\xb2\x3e\xba\xa0\x64\x35\x92\x0d\x13\x65\x11\
-\x63\x44\x4e\x40\xd4\x10\xa0\xa2\xe9\x25\x85\xe2\x2c\xf5\xcb\x81\
-\x3c\x84\x16\x5b\x9b\x62\x0e\x25\x2d\x96\x92\xd8\x2a\xcc\x8e\x68\
-\xb7\x06\x02\x3b\x78\xaf\xd1\x1d\x45\x8b\x0f\xce\xc3\xbb\x91\x96\
-\x01\xae\x52\xd0\xcf\xa9\xc3\x70\x7e\x0c\xf1\x84\x9a\xea\xbd\x3a\
-\x00\x3f\x81\x6b\x78\x18\x08\x00\x7e\xc9\x28\xc1\x55\x17\x88\x17\
-\xb4\xc2\x98\xd0\xc8\x34\xe7\x1d\x18\x04\x96\x90\x53\xcf\x84\x10\
-\x6b\x2a\xd6\x89\xf8\x92\xeb\x34\xb0\xc0\x6d\xac\x6b\xda\xd8\xb2\
-\xad\x67\x93\xce\x04\x61\x87\x62\x1c\xd1\xe1\x72\x01\x07\xf7\x59\
-\x7e\x5c\x18\x49\xc1\xad\xbf\x38\x05\x78\x0c\x9a\x8c\x32\xfd\x37\
-\x81\x77\x84\xfe\x18\x8c\x72\xe0\x8b\xf4\x3e\x02\x7c\xf1\x82\xe3\
-\x7c\x3f\x8a\xba\x3f\x19\x75\xf1\x78\x2a\x38\x26\xe8\xf1\x04\xfa\
-\x40\x61\x09\x12\x12\xa3\xeb\xc8\x52\x26\x40\x5d\x3c\x80\x29\xb3\
-\xe5\xa8\xb7\xb8\xa7\x90\xd4\x12\xeb\x69\x2b\x0a\x4f\x4a\xde\x61\
-\xdd\x87\x27\x70\x5a\x1f\x47\x24\x3f\xae\xb5\x8b\x75\xbf\x45\x7e\
-\x89\xb6\x2d\x86\x0d\x90\x5a\x3f\x09\x81\x39\x14\x48\xba\xba\x42\
-\x8e\x71\x3c\x82\x80\x66\x13\x9a\xae\x9b\x93\x10\xe9\x64\x8b\x28\
-\x9c\xaa\x98\x2e\x9f\x3a\xb0\xde\xa0\x55\xa9\x3e\x64\x23\xca\xa9\
-\x67\x1f\x9d\x53\xd1\x40\x4a\xb0\xab\x39\xdf\x59\xeb\x71\xe8\xf0\
-\x21\x6c\x3d\xfa\x14\x9c\x1f\x59\xd4\xd7\xb5\xdf\xde\x8d\x40\xbe\
-\xd2\xe8\x1f\x23\xbf\x1f\xc1\xfb\x31\xbc\x1f\x63\xcb\x4d\x3b\x9b\
-\xe2\x06\xce\x7f\x7d\x3e\x8d\xf3\x85\x70\x00\x9f\x04\xf0\x30\x80\
-\x9b\xfa\x20\x4c\x2d\x8c\x15\xa7\xde\x52\xd9\x93\x1c\xf1\xb5\xac\
-\x68\xcd\x0c\x21\x86\x13\x32\x00\xc9\x48\x6b\x05\x0f\x95\x40\x70\
-\xeb\x2b\x36\x7a\xd9\x80\x82\x05\x14\x2a\xbd\x85\x14\x22\x9b\xdc\
-\x23\xf5\xf4\xe8\xc0\xfd\x8d\x41\x69\xb9\x84\xc9\x65\x5d\x9c\x02\
-\x9b\x02\x1a\x57\x9d\x16\x1b\x51\xd1\xc6\x8b\x43\x3b\xc5\xc2\xe3\
-\x12\x0f\x88\x17\x7f\x29\xf8\xe1\x4a\x24\x59\xfa\xbd\xf8\x72\x4e\
-\x80\xd2\x73\x77\xea\xfd\x7e\x6b\x30\xf1\x17\xec\x71\x8c\x39\x27\
-\x3a\xbf\x7c\x37\x3b\xdd\xd8\xd2\xd3\x69\x1d\x4d\xb5\x11\xa5\xbe\
-\x9c\xd3\x36\x5f\x1c\xdc\x8b\x35\xbc\xb3\x5a\xdc\xba\x36\x22\x92\
-\x95\x71\xa0\x3f\x97\x36\x41\x7b\x40\xd8\xa9\x40\x46\x19\xe9\x8d\
-\x2b\x20\xe2\x2c\x1b\x10\xb8\x60\x35\x39\xf5\xb2\x12\x94\x42\x46\
-\x9c\x39\xf7\xb1\xea\xa3\x5c\x5e\x26\x21\x52\x64\x39\x3a\xa2\xde\
-\x7d\x69\x28\xc9\x1b\xf7\xc0\xda\x99\xdd\xa2\x2c\xcd\x0c\x88\x00\
-\xeb\xeb\xab\xb8\xf3\xf6\xb3\x78\xf0\xe1\x67\x2c\xad\xd7\x74\x9f\
-\x5c\xa5\xce\xc0\x55\xf0\xd5\x08\xe4\x47\x09\xf8\x73\x7e\x0c\xe7\
-\x3d\x76\xb8\xd9\x2b\xfa\x7f\x18\xc0\xcf\x5e\xeb\x0e\x60\x17\xc0\
-\x4f\xcd\x3b\x00\xa0\x61\x46\xeb\x18\x23\xaa\x3a\xde\xd5\x19\xbb\
-\x4c\x61\x17\x97\x82\x52\xfc\xe8\xd3\x34\x97\xe1\xca\x34\x42\xb5\
-\xb2\xae\x93\x6c\xa1\xa4\xe7\x46\xe0\x8d\x8b\x51\x63\x1e\xde\x65\
-\x5f\x7e\x0c\x39\x0f\xa6\x9e\x5e\x3f\x01\x2a\xfb\x74\x61\x0a\xec\
-\x9b\x80\x26\x55\xbe\x34\xd8\x1a\x48\x76\x71\x39\xd3\x31\x88\x8c\
-\xd8\xb4\xfd\x9c\x74\x42\xcf\x15\xd8\x40\x02\xf3\x4c\x98\x03\xe8\
-\x92\x7a\x4a\x91\x50\x57\x46\xfb\x6e\xf5\x9a\x85\x45\x38\x8f\x00\
-\xe7\x2c\x80\x72\x19\x90\x9a\x68\x99\xb2\x5a\x12\x30\x62\x0a\x4c\
-\x05\x56\x48\x91\xb7\x1f\x22\x0a\x6f\x92\x6e\x0e\x10\xf8\x5c\xf7\
-\xc7\x14\xdc\x98\x7c\x22\xc8\xb8\x00\x18\xe2\x8c\x13\x20\x80\x48\
-\x6b\x18\x41\x7c\x1d\x6d\x6a\xf5\x01\x6c\x2a\x6d\xce\xfc\x43\x80\
-\x13\x29\x9c\x80\x31\xfe\x22\xce\x11\x97\x74\xc4\xad\x45\x11\x37\
-\x40\x39\xab\x91\x57\xa9\x65\xb2\x91\xcb\x6a\x45\x44\x1a\xbd\x49\
-\x39\x2a\x92\xde\x6d\x9f\xa2\xbe\x14\x60\xaf\x40\x30\x1e\x79\x1c\
-\x39\xb4\x1f\xa0\x0a\xde\x8f\x00\xef\xe1\x9c\x45\x7d\x37\x02\xf9\
-\x18\xfd\xd5\x01\xb8\x6a\x84\xca\xaf\x60\x17\x3b\x98\x85\xb0\x97\
-\x03\xf8\x3f\xf1\x3c\x8e\x02\xbf\x50\x0e\x00\x00\x7e\x1c\xc0\xef\
-\x1c\xf4\x0e\xdc\x60\xec\x47\xf0\xa1\x02\x11\x21\x20\x24\xd2\x08\
-\x4b\xc8\x3a\x72\x60\xbd\xc8\x84\x2d\xfd\x94\x64\xdc\x54\x8d\xe1\
-\xd6\xf6\x81\x9a\x00\x0a\x6a\x40\xc1\x19\xb9\xc4\x15\xed\x43\x2a\
-\x87\x5e\x7a\xd1\x3f\xf4\x5a\x8d\x1d\x19\xaf\x3e\x91\x08\x20\x0a\
-\xc0\xc5\x00\x6c\xae\x80\x26\x3e\x63\x13\x94\x95\x7b\xb4\x37\x5e\
-\x44\xe6\xf8\x3d\x63\xfb\xc1\x1c\x41\xda\x9d\x17\x1f\x53\x68\xa6\
-\xa6\xc1\x1f\x29\x81\x45\x9a\x43\xff\x93\x7c\x17\x97\x68\x7f\x11\
-\xf1\x99\xba\xd3\x8a\x91\xcc\x13\x68\x7e\x3b\xb1\x71\xea\x4b\x8e\
-\x3c\x19\xc8\x27\x64\x42\x9a\x08\xd6\xb6\x8b\x86\x1c\x8c\xe4\xa3\
-\x86\x1b\x23\x38\xc4\xa5\x99\x7f\x4e\x48\x5d\xb1\x58\xd3\xb9\x3c\
-\x87\x90\x7a\xac\xfa\xf7\x27\xdb\x1d\xa1\x76\x6d\xd9\x05\xeb\xd0\
-\x13\x1b\xf9\x27\x39\x6d\xa2\xb4\x94\x43\x24\x4a\xcf\x1b\xf1\xc6\
-\x15\x2d\x5e\xa2\x12\xd5\x2c\x24\xc7\x4a\x46\xa3\xb7\xf1\xe4\x4c\
-\xda\xc9\x18\x29\xa1\x14\x5d\x67\xbb\x6f\x34\x1a\xc3\x57\x13\xf8\
-\x6a\x62\xe9\x7e\x05\xb8\xdc\xe7\x27\xaf\xce\x41\x1d\xc0\x04\xce\
-\x57\xb8\x34\xdd\xde\xcb\x66\x1e\x05\xf0\xef\x9f\x6f\xc3\x7c\xa1\
-\x1c\xc0\x8f\x18\x27\xe0\xc0\x5c\x19\xc0\x01\x8d\x67\x4c\x7c\x95\
-\x26\xce\x84\x83\x5e\x68\x26\x08\x21\x85\x60\xa4\x5e\x54\x48\x2a\
-\x32\x44\xaa\xe2\x43\xab\x6b\x0a\x00\x72\x37\x59\x93\x82\x6a\x2b\
-\x3d\x62\x51\xdc\x0f\x37\x4f\x2d\x96\x4e\x96\xd0\xa1\xf4\x52\xc1\
-\xbf\x17\x01\x2e\xec\x80\x36\x27\xa0\x95\x71\xd6\xe5\xa7\x62\x9e\
-\x41\xb2\x56\x7e\x9a\xb3\x2f\x85\x41\xd3\x4a\x6e\xca\x3a\x7a\x9d\
-\x0e\x00\x0d\xb4\x0a\x63\xc6\x21\xc5\x7c\x3e\x12\xb9\x27\x3a\x99\
-\x64\xec\xa1\x1c\x30\xea\x7e\xcf\xc8\xf3\x85\x86\x07\x41\x82\x14\
-\xfc\xfb\x22\x7b\x8a\x17\xbf\x97\x04\x86\xa9\x69\x32\xd2\xfc\x8e\
-\x03\x84\x3c\x84\x19\x4c\x41\x9d\xb5\xbd\xef\x9e\x08\xec\x5d\xb1\
-\x16\x4e\x53\x6d\x81\x80\x29\x24\xe2\x50\x04\x68\x39\x0a\x69\xba\
-\x28\x22\x43\x69\xe0\x46\x33\x0d\xc9\x64\x2f\xd2\xe7\x25\x13\x10\
-\x49\x9b\xe6\x24\xb3\x16\xa5\x53\x02\x94\x94\x1d\x14\x72\x63\x4e\
-\x33\x09\x72\x8a\x03\x90\x53\x67\x60\x99\x40\x7f\x58\x3b\x96\x50\
-\xce\x8f\xe1\x47\xab\xf0\xa3\x95\x6e\xcd\x4f\x1e\xe4\xb5\xee\x8f\
-\x37\x5f\x4d\xb0\x1d\x2e\x61\x27\xcc\x3a\xf8\x42\xef\xfc\x35\x00\
-\xe7\x5e\x2e\x0e\xe0\x09\x73\x02\x5f\x3b\xf4\xcd\xed\x30\xc3\xa4\
-\x1a\x2b\x60\xc2\xad\xa6\x88\xe0\x54\xff\x03\x0e\xcc\x79\xb8\x43\
-\x62\x81\xe7\x4d\x4a\xaa\xaa\xe0\xc7\x23\x48\xc3\xf9\x62\x8e\x35\
-\xb9\x49\x90\x0b\xc1\x94\x66\x8b\xa5\x24\xe8\x6b\xff\x15\xa8\x3f\
-\x4a\x84\x3d\x83\x92\xfd\xb1\x5d\x02\x80\x4b\x33\x4d\xad\x57\x46\
-\x99\x47\x16\xc5\x30\x81\x0e\x42\xef\x28\x3b\x91\xdc\x2d\xb0\xaf\
-\xad\x3d\xd6\xd1\xdc\x33\xfe\x7f\xe6\xca\xe7\x41\x21\x2a\x6a\x7b\
-\x67\x53\x8d\x89\x85\xc8\xd9\x41\xa4\x6e\x00\x53\x22\x19\x25\xdc\
-\x20\xed\xb6\xb3\x95\x56\xc1\x8a\x0c\x8a\x92\xe9\x2e\x65\x01\x20\
-\xd1\x74\x9d\x19\xe2\xc9\x06\x33\x25\x91\x82\xc4\xe9\xcf\xc5\x49\
-\x4b\x62\x06\x47\xad\x40\xaf\xdf\x73\xec\x20\x0e\x60\xf6\xd9\x63\
-\x79\x86\x8b\x1a\x2f\x28\x3a\x02\x54\xa4\xfb\x0e\x3a\x41\x6a\x58\
-\x81\xb3\x71\x5d\x31\xc0\x0e\x5c\x68\x8a\xa7\xf2\x20\xfe\x1d\xed\
-\x73\x2a\xb1\x7e\x97\x90\x7a\x4a\xac\x3c\x05\xee\xba\xac\xbd\xf8\
-\x79\x04\x03\x5d\xbf\x61\xa2\x44\x53\x3f\x86\x1f\xaf\xa0\x9a\xac\
-\xe9\xc4\x9f\x81\x7d\x44\x4e\x33\x54\xcb\x0a\x9c\xd7\x8e\xc0\xb9\
-\xdd\xf3\x7b\xa5\xfe\xbf\x6a\xe9\x3f\x5e\x2e\x0e\x00\x00\xfe\xd5\
-\xb0\x03\x20\x34\xa1\xc5\x8e\x9f\x62\x9f\xdf\x44\x30\xc1\x07\x91\
-\x00\x46\x50\x47\x20\x80\xf7\x86\xf2\xf6\xb6\x05\x31\x82\xa5\x55\
-\x15\x42\xcb\x70\x31\x05\x34\x19\x9b\x38\x6d\xa8\xe9\x37\xdb\x38\
-\x2c\xe7\xe5\xa0\x49\x12\x8c\x7b\x48\x79\xd1\x58\x2f\x5b\x7a\xa9\
-\x7c\xe6\x8c\x12\x07\x06\x2e\xee\x02\x4d\x00\xad\x8f\xd5\x48\x03\
-\x40\x2e\xd3\x70\xc9\xf4\xfb\xf4\x02\x2b\x5a\x7a\x94\x97\x7b\xb8\
-\x4e\x9d\x4f\x05\xfa\x9f\xe9\xad\x51\x2d\x28\xd6\xf4\x2e\xbe\x36\
-\xa6\xfc\xbc\x21\x92\xe7\x28\xb7\x0f\x8d\x6c\x93\xb0\x00\x29\x81\
-\xcd\x08\x7e\x76\xb7\x12\x49\xda\x6e\x4b\x49\xe7\x2f\x12\x6b\x24\
-\x66\x07\x56\x67\x8b\xb3\x57\x1d\x00\xa1\x60\x6d\x38\x9f\x66\x05\
-\xf2\x42\x24\xed\x08\x78\xf2\x60\x22\x45\xf3\x29\x1b\xad\x63\x01\
-\xa7\xa5\xa3\xa4\x15\x02\x67\x96\xa0\x63\x36\xe2\x6f\x6c\x9d\x5a\
-\x9d\x4f\xc5\xf2\x54\x2b\x43\x12\x19\x28\xb6\xff\x52\x59\x95\x11\
-\x7f\x1d\x34\x32\xe3\xa7\xc8\xd4\xf3\xc6\xdc\xa3\x2c\x5c\x8a\x72\
-\x48\xc9\x75\x26\x37\x05\x02\x57\x8d\x51\x8d\xd7\xe0\xab\x95\x04\
-\x00\x3a\x97\xa3\x3f\x91\xd3\xc7\x54\x63\x3c\xbd\xfd\x28\xa6\xed\
-\xd4\xe6\xff\x31\x4f\x91\x01\xfe\xb8\x91\xe8\x5e\x56\x0e\xe0\x47\
-\x00\x7c\x04\xc0\x3d\xf3\x3e\x80\xb0\xd5\xee\x62\xd5\xaf\x62\xec\
-\x27\x60\x69\xc1\xac\x5e\x94\xcb\xa8\x6d\x44\xa0\xf4\xb6\x8b\xe8\
-\x1f\x6a\xbc\x0a\x27\x0e\x12\xc4\xca\x49\xb1\x08\x21\x39\x62\xc6\
-\x46\x12\xc7\xc9\x42\x2e\xe6\x09\x50\xf2\x3c\x8b\x32\x81\xba\x7c\
-\xfa\xd4\x6f\xa7\x4e\x4f\x3f\x6a\xf5\xd3\xd6\xd4\x84\x49\x27\x20\
-\xaf\xfb\x0f\x63\xe0\x70\x6c\x91\x30\x94\xa0\x60\x9c\x8a\xeb\xa7\
-\xfc\x52\xf0\xc9\xf3\x24\x60\x1a\x0a\xb2\x3a\x38\x91\x82\xec\x73\
-\xfd\x9e\x32\x2a\x93\xe1\x47\x96\x22\xa3\x33\xbb\x50\x32\x16\x15\
-\xca\xef\x4d\x0e\xd9\xc2\x54\x4d\xf9\xf5\x77\x11\x56\x00\x4f\xb1\
-\x54\xd1\xf6\x5f\xd0\xf9\x7f\x71\xca\x8d\x60\x97\x5b\x91\xb9\x03\
-\xe0\x34\xc2\x93\x80\x9d\x4b\x3a\x7e\x1a\xb8\x43\x7a\x8c\x96\x1c\
-\x01\x8e\x08\xec\x48\x3b\x04\x12\xe0\x9c\xd3\x5d\x32\x46\x0e\x73\
-\x30\xaa\x70\xd1\xa2\x4c\x1b\xe6\x2c\xf2\xc7\x41\x1c\x05\x33\xd9\
-\x10\xfd\xa2\x6f\x90\xea\x7b\x0f\xe7\x1c\x60\x1f\x15\xb9\xf7\xda\
-\xb7\x37\x34\x5f\x23\x7a\xee\x0a\xc4\x0e\x49\x4a\x36\x58\xe0\x5c\
-\x85\x6a\xb4\x06\x3f\x5e\x49\x00\x20\xb9\x4a\x9f\xc3\x57\x20\xaa\
-\x50\x55\x13\xec\xd4\xe7\xf1\xec\xf4\xd9\xbd\x52\xff\xbf\x01\xe0\
-\xc7\x5e\x28\xa3\x7c\x21\x1d\x40\x0d\xe0\xef\x02\xf8\x67\x43\xdf\
-\x14\x06\xce\xd7\x17\x71\x6c\xf5\x18\x2a\x4c\x10\xa8\xb5\xb4\x2d\
-\x6f\xdc\x8c\xa9\xbb\x74\xb8\xc2\x01\xb4\xb6\x4f\x19\x84\x81\x6d\
-\x66\x47\xf2\x98\xad\xe5\xc0\x5a\x0a\x44\x06\x20\x67\x47\x12\x17\
-\x5c\x26\x8a\xaf\x11\x66\xa8\xe4\xdd\x97\x6c\x3e\x2b\x8f\xcb\x7d\
-\x7c\xa5\xed\x6c\xd7\xa0\x9a\x95\x36\x5c\xf9\x84\xf8\xc7\x89\xb7\
-\x14\xf5\x9d\x81\x81\xce\x24\xaa\x62\x37\x80\xba\x14\x62\xcd\x1c\
-\xcc\xc0\x51\x92\x80\x8a\xb5\x5e\x49\xcf\x2f\x7f\x4c\x20\x60\x27\
-\x3b\xa0\x0e\x0b\x10\x51\x95\xb7\xfc\x05\x5c\x99\x21\x38\x88\xe3\
-\x34\xef\x1e\xa9\xd4\xea\x04\xac\xd5\x67\x3c\x7e\x89\xfa\xf6\x4e\
-\x4d\x54\xab\x07\xe3\x77\x04\xa4\x61\x21\x90\xd1\x85\xc5\x00\x5b\
-\x28\xc0\xc6\x64\x3f\x4f\x04\x26\x1d\x35\x66\x90\x96\x17\x11\x7c\
-\x8b\x9c\x8c\x58\x93\x3b\xd3\x50\x4c\x82\xb2\x2e\x73\x01\x52\x8d\
-\xcf\x49\x76\x3c\x29\xf3\x24\x63\x77\x70\x64\xc6\x4a\xc6\xe0\x4b\
-\x65\x41\x65\x6c\x3d\x0f\xef\xbd\x65\x0a\x59\xca\x4b\x0a\x40\x98\
-\x45\x20\xe4\x51\x4d\xd6\x50\x8d\xb5\x1d\xed\x7c\x7c\x5e\x0f\xe7\
-\x3d\x9c\x1f\xa3\x6d\xa7\x78\xfc\xd2\x43\xe0\x94\xa2\xce\x9d\x9f\
-\x06\xf0\x17\x5e\x40\x9b\x7c\x41\x1d\x00\x00\xfc\x6b\x00\x7f\x10\
-\xc0\xab\x87\xb2\x80\x26\x04\x9c\x9b\x9e\xc3\xb1\xb5\xe3\x18\xb9\
-\x15\x15\x60\x24\x46\xb9\x8d\x26\x66\x01\x59\x0a\x2a\x80\x26\xab\
-\x86\x68\x6b\x94\x70\x94\x95\x6f\x74\xf4\x34\x4a\x48\xe7\xe5\x16\
-\x99\x0e\xcc\xf3\xe2\x22\x71\x75\x59\x31\x4e\xdc\x5d\xc0\x19\x01\
-\xa3\x42\x9f\xaf\x44\xe4\x67\x0d\x10\x5a\xb8\xf5\x15\x55\x29\x32\
-\x58\x5f\x8d\xdc\xa5\xfe\xbf\x8b\xb3\xe2\x49\x17\xd0\x7a\xfb\xae\
-\xc8\x06\xac\xad\xe7\xe2\x7f\x1f\x32\x6b\x30\x8a\x6c\x0e\x81\x81\
-\x11\xe5\x27\x2e\x66\x11\x30\xb0\x82\xac\xfc\x2a\x0a\xdb\x96\xca\
-\x25\xce\x2b\x28\x48\xd0\x8e\x4a\x5a\x62\x69\xad\x3d\x22\x88\xc9\
-\x5e\xeb\x90\x8c\x87\x50\x30\x43\xae\x20\xd2\x5a\x24\xf6\x10\x22\
-\x38\x17\x55\x84\xed\xb7\x0e\x96\xda\x07\x8b\xef\x44\x16\xf1\x05\
-\xce\x00\x44\xe1\x56\x33\x3a\x23\xf4\x50\x62\x09\xda\x4c\x01\x59\
-\xc7\x01\xb1\x14\xd0\xb6\x9d\xc0\x22\x7f\x39\xa9\x19\x6b\x7a\x17\
-\x01\xbf\x48\xd1\xad\x52\xda\x9e\x09\x3b\x55\xe2\xed\x3b\xf2\x59\
-\xd7\xa0\x78\xdb\x04\x40\x1b\x18\x75\x00\xaa\xc9\x1a\xfc\x78\xd2\
-\xfd\x3f\x9c\xa2\xff\xc2\x2d\x1e\xbb\xf4\x69\xcc\xb8\x5e\x94\xfa\
-\x3f\x62\x9d\xb2\xdd\x97\xb3\x03\x98\x01\xf8\x4e\x63\x37\xd1\x90\
-\x13\xd8\x6d\xa7\x78\x7a\xfa\x34\x8e\xaf\x9d\xc2\xc8\x8d\xc1\xd2\
-\xd8\x1f\x9a\x3b\x4e\x20\xb2\x3b\x84\x02\x68\xbc\x02\x0e\x80\x63\
-\xb6\xd4\xd4\xc0\x34\x92\x02\x08\x32\xd1\x91\x38\x63\x90\x32\x01\
-\x15\x14\xa1\x92\x6c\x40\x92\xb6\x0a\xa3\x0f\x1e\x45\x43\x74\xa5\
-\x5e\xbd\x81\x54\x28\xc6\x83\x5b\x02\x5d\xdc\x05\xad\xb6\xc0\xfa\
-\x18\xce\x53\x6e\xf9\x51\x97\xdc\x43\x12\x1b\x50\xda\xcb\x8e\xa8\
-\xbd\xeb\xa8\x08\xa3\x23\xdc\xe1\x62\x29\x50\x0e\x1d\x85\x02\x07\
-\x40\x91\xf2\x73\xce\x18\xb2\x7e\x61\x21\x53\x46\xb9\x1b\x10\x6f\
-\x52\x30\x86\x22\xf1\x47\x9d\x68\x48\x0c\x3f\x71\x06\xd4\x7a\x67\
-\xf3\x03\xb6\x6c\xd3\xa8\xc0\xce\xd8\x80\x12\x01\x42\x01\x58\x3c\
-\x48\x82\x95\x78\xe6\x6f\x02\xac\xe7\x1f\x53\xff\xe8\x04\x0c\xcf\
-\xb1\x5d\x7e\xce\x91\x4e\xe6\x99\xea\x70\xa4\x20\x67\x75\x5f\x42\
-\x77\x6b\x48\xde\x3c\x1d\xc7\x72\xe3\xd4\x9f\xd6\xf7\xd1\x11\x8c\
-\x14\xc4\xf3\x63\x43\xe9\x47\x56\xb7\x97\x1c\x7e\x07\xe7\x9d\x61\
-\x02\xf1\x12\xd4\xff\x7b\x67\xb7\xc5\xe3\xcf\x36\x58\x59\x5d\x87\
-\x1f\x55\xf6\x18\xcd\x30\xbc\x1f\x83\xb9\xc1\x23\x17\x3e\x81\xad\
-\xfa\x12\x40\x83\x26\x77\xce\xf0\xb1\x07\x5e\x60\x7b\x7c\xc1\x1d\
-\x00\x00\xfc\x20\x80\x7f\x0a\xe0\xdb\x06\xbf\x4b\x0e\x3b\xf5\x0e\
-\x9e\xc4\x67\x71\x7c\xe3\x34\xc6\x6e\x1d\x81\xdb\x34\x02\x9a\x61\
-\x97\x34\x55\x00\x54\x93\xce\xca\x00\x76\xba\xc9\x16\x04\x30\x49\
-\xaa\x1d\x73\xf4\x67\xa3\xb1\x76\x5b\x81\x44\x11\x24\x44\xa7\xd6\
-\x2f\x01\x41\x12\x4a\xda\x02\xa5\xb2\xb1\x1a\xb7\xa5\xdb\xae\x58\
-\xd1\xb5\x33\x83\x6b\x02\x68\x6d\x0c\x9a\x54\xe6\x00\x62\x2a\x99\
-\x3b\x00\xaa\x02\xa4\xb3\xed\x24\xd4\xdd\xa0\x13\x22\x2f\xc0\xee\
-\x67\xd1\xb2\x80\x72\xaa\xef\x0a\xb9\x71\x2a\x90\xfe\x58\x3a\x24\
-\x52\x10\x51\x57\x6c\xd4\x5b\x3f\x3e\xf6\xd3\x12\x97\x3f\x0e\x64\
-\x51\x8a\xfc\x20\x23\xf1\x88\xcf\x13\x99\xa4\xa3\xc1\xc2\x6c\xc3\
-\x3f\xd1\x39\x10\x04\xad\xa1\xf6\x06\xfe\x85\x02\x81\x77\x02\x66\
-\x25\x4b\xb1\x00\xf0\x5e\xf1\x0b\x88\x81\x83\x99\x2f\xc1\x51\x40\
-\xd4\x54\x86\xb4\x44\x81\xd5\xe6\x3a\x9f\x4f\x12\x07\x09\x6c\xf6\
-\x23\x11\xab\x59\xc1\xc8\x28\xa5\x94\x94\x78\x2a\x63\xe6\x59\xaa\
-\x5f\x8d\xe0\xbd\x4f\x51\xdf\x3b\x8f\x2a\xb6\xef\xac\x5c\x20\x47\
-\x49\xbe\x3c\xfa\x18\x16\xc1\xd8\x33\x9e\x38\x17\x30\x5e\x59\xd5\
-\xc7\xda\x05\xe0\xab\x31\x9a\x66\x07\x8f\x3c\x7b\x1f\x2e\x4d\xcf\
-\x2f\x32\xfe\xf3\x00\xbe\x06\xc0\xcf\xbf\x08\xb6\xf8\xa2\x38\x00\
-\x00\xf8\x93\x00\xee\xb5\xdb\x02\x27\xb0\x8d\xc7\x2f\x3d\x84\x63\
-\x9b\xa7\xb1\x3e\x3e\x00\x4e\x19\x00\xf7\x7a\xb0\x01\x52\x8d\x4d\
-\x4b\xc2\x5a\x6d\x71\xf8\x8c\x04\xde\xc2\x21\x17\x19\x40\x34\xfe\
-\x74\xd1\xc6\x12\x80\x38\x45\x53\x29\xd7\xc6\x00\x03\x23\xbe\x05\
-\x8f\xdc\x15\x6a\x40\x8e\xb2\x33\x88\xc3\x3e\xb3\x56\x49\x4a\x93\
-\x91\x76\x09\x46\x2e\x45\xf9\x24\x8d\x65\x8e\x8a\xb8\xd8\xa5\x67\
-\xad\xb0\x58\x0a\xb8\xa8\x32\x53\x64\x01\x9d\xec\xc0\x22\xbc\x2b\
-\x16\x8a\x12\x5c\x67\x15\x79\xb9\x93\x80\xa8\x18\x0b\xee\xac\xf5\
-\x89\xf2\x59\xa6\xe2\x4b\xa6\xa9\xe0\x7c\x8a\xf2\x51\xe4\x43\x84\
-\x20\xdc\xea\xfd\x06\x16\x3a\x69\x15\x1b\xb0\x35\x5e\xc2\xa4\x18\
-\xab\x17\x78\xd6\x28\x1e\x99\x92\x0c\x82\xf3\xd6\xe6\x75\x3a\x0e\
-\xec\x88\x4d\x79\x57\xdf\x4f\x27\x86\x29\x48\x6a\x9d\xd8\xfc\x41\
-\xa6\xf3\x4a\x9a\xa4\x24\xd3\x12\x88\x10\x80\x19\x64\xe2\x62\xd8\
-\x58\xae\xaf\x0a\x4a\xee\x18\xde\xa9\x43\xf0\x96\xb2\x2b\x71\x47\
-\xeb\xff\xca\x1c\x82\xb7\xdd\x07\x48\x03\x42\x3a\x84\x34\x9e\x08\
-\xc6\x93\x15\xec\xb6\x01\xce\xbb\x54\x32\x5c\xde\x79\x12\x8f\x3e\
-\xfb\x49\xec\xb6\xbb\x8b\x8c\xff\x59\x00\xbf\xdd\x88\x72\xf8\xad\
-\xe4\x00\x2e\xda\x2f\xfe\xdf\x01\xdc\xb0\xc8\x09\xcc\xda\x1a\x8f\
-\x5e\x78\x10\x87\xd7\x8f\xe2\xd0\xfa\x49\x8c\xab\x55\xc5\xf2\x39\
-\xe4\x14\xcf\xb1\xd6\x9a\x2d\xc3\xdb\xea\x71\xbd\xf8\x34\xa2\x6b\
-\x1f\x9d\x0d\xc4\x2a\x56\x5f\x0b\xab\x53\x61\x01\x49\x48\x2c\xc1\
-\xb8\xc1\xd5\x15\xba\xfe\xd1\x03\xb8\xb2\x78\x8e\xc2\x7c\xcc\x70\
-\x4c\x5d\xb2\x4f\xc1\xf9\x25\x2a\x98\x75\xbb\x0d\xa8\x09\x70\x2b\
-\x23\x60\x32\x32\xdd\x3c\xb1\xc1\x93\xe8\x0c\x32\x00\xe8\x8a\x4e\
-\x80\x4b\x0c\xc2\x3c\x32\x9c\x32\x02\xc9\xad\x4a\x57\x2e\x20\x2d\
-\xf6\xf2\x25\x52\x12\x65\x75\xa4\xd8\x26\x84\x65\x2e\x5d\x30\x90\
-\x33\xa8\x26\x0c\xf1\x2a\x8b\x16\x25\xbd\xe2\xc8\xb6\x92\xb6\xa0\
-\x11\x9f\x29\x8d\xff\x8a\x30\x18\x1e\xe4\x01\x26\x45\xf6\xc1\xc6\
-\x05\x80\x53\x19\x6d\x52\xe3\x17\xc3\x1d\xb8\x98\x79\x53\x10\xd0\
-\xfa\xf7\x91\xf5\x19\x7b\x31\xa4\xba\x7a\x4c\x9c\x5b\x75\x8e\x00\
-\x0e\xa6\xfa\x6f\xad\x49\x8e\xfb\x07\x25\xf5\xfd\x13\x42\x4f\x1e\
-\xce\x4d\xe0\x5c\x95\x52\xff\x9c\xfe\x57\xa8\x2a\x45\xf0\xbd\xa5\
-\xfe\xde\x91\x45\xf7\x5c\xb9\xb2\x00\x23\x02\x3e\xf5\xe8\x0e\x76\
-\x6a\x87\xd1\x78\x04\xef\x3c\x9a\x66\x1b\x4f\x5c\xf8\x0d\x3c\x75\
-\xe9\x51\x7d\xa7\x86\x6b\xfe\x07\x00\x7c\x3d\x80\x5f\xc0\x8b\x78\
-\xaa\x17\xf1\xff\xfe\x34\x80\xf7\x03\xf8\x4f\x18\x10\x0c\xc9\xcc\
-\x33\xc1\x33\x5b\x4f\xe0\xd2\xee\x79\x1c\x58\x3f\x8a\xfd\x6b\xc7\
-\x30\x19\xad\x25\x06\x99\x84\x16\xa0\xca\x22\xaa\x80\x3c\xe0\x59\
-\xd2\x4a\x76\x20\xe3\x00\x2e\xf2\xd4\x6d\xa7\x9c\xf6\x94\x39\x6f\
-\x8b\x11\x01\x5c\x28\xc6\x6f\x25\xd7\x8f\xae\x2b\x8d\x1d\x69\xa9\
-\xe5\xfe\x3b\x72\x45\x0f\x3e\x62\x02\x45\xfd\xe9\x48\xb4\x43\xd0\
-\xd6\xa0\x99\x65\x04\xe3\x2a\xb5\xcd\x72\x26\x80\xae\xf1\x23\x4e\
-\x14\x96\x7b\x75\x90\x81\xc4\xa2\xa9\x47\x91\x43\xc0\x45\x67\xa0\
-\xa4\x22\xb3\xeb\x08\x96\x02\xa5\x44\xb1\x91\x15\xb8\x98\xfc\x93\
-\xbc\x36\x5d\x28\x18\x37\xc0\x06\x64\x02\xab\x7e\x07\x79\x48\x08\
-\xe6\x78\xbd\x45\x7c\x82\x67\x9b\xe6\x70\x52\x10\xba\x14\xad\x75\
-\x70\x86\x15\x20\xf5\xeb\x93\x96\x6f\x6c\xd9\x59\xc4\x95\xb8\x4e\
-\x8c\x3d\x20\x21\x89\x91\xc4\x0c\xc6\x91\x03\x83\x4d\x62\x2c\x2a\
-\x4a\xbb\x3c\xab\x00\x06\xb9\x11\x1c\x55\x6a\xc4\xf0\x99\x99\xe7\
-\xf4\xe6\x63\x26\x50\x8d\x0d\xfd\xd7\xb2\xc0\x79\x5f\x08\x78\x50\
-\xe2\x12\x44\xc5\xe0\xd5\xca\xa1\x0d\x0e\xd3\x86\xe0\xdd\x36\x9e\
-\xba\xf4\x18\x9e\xdd\x7a\x1c\xb3\x76\x0a\x38\x8f\x05\xba\xbb\x3f\
-\x03\xe0\x77\x03\xf8\x14\x5e\xe4\x53\xbd\xc8\xff\xff\xaf\x03\x78\
-\x37\x80\x7f\x01\xe0\x1d\xc3\x0f\x51\x69\xa9\x3a\x34\x78\xea\xd2\
-\xa3\x78\x66\xeb\x09\xac\x8f\x37\xb1\x6f\xed\x30\x36\x57\x0e\x63\
-\x5c\xad\x02\x34\x42\x1b\x24\xcb\xf6\x19\x25\xd7\x17\x53\x80\x31\
-\x9d\x67\x61\x38\x51\xb5\x57\x04\xb6\x36\x23\xd2\x36\x17\x49\x52\
-\x5f\xdc\x11\xeb\x50\x51\x9b\xa2\xbd\x14\x37\xba\x3a\x0f\x22\xdd\
-\x67\x47\xba\x9c\x28\x1b\x5c\xb1\x2e\x8e\xac\xdd\x17\x35\x0a\x5c\
-\xcd\xa0\x7a\x06\x1a\x05\xb8\x95\x0a\x34\xf2\xfa\x98\xb2\xcd\x67\
-\xc6\x1c\xb3\x02\x87\xee\x8c\x80\xeb\xa9\xf5\xa6\x19\x01\xd6\x00\
-\x9e\xf4\x0a\xa4\x74\x10\x62\xd2\x5a\x39\x53\x91\x24\x55\x26\x86\
-\xb2\x8b\x51\xb2\xd9\x80\xd6\x68\x44\x5e\x3b\x27\xdc\xda\x24\x9c\
-\xd5\xe6\xc2\xd6\xb2\x53\x6c\x20\x6e\x04\x62\x6a\xe1\x22\xbb\x0f\
-\x1e\xce\x05\x80\x9d\x12\x7d\x3c\xe0\x38\x80\x45\xf1\x1a\x81\x02\
-\x80\x0e\x39\xdd\x77\x8e\x75\x20\xc7\x11\x1c\x6b\xc4\x17\xc3\x03\
-\x92\xfc\xb8\xf1\xfc\x63\x39\x01\xe7\xb3\x7a\x94\x8f\xbf\xb5\x81\
-\x79\xa4\xcb\x37\x1c\x34\xca\xfb\x2a\x0f\xe8\x78\x33\x7e\xef\x47\
-\xf9\xa3\xaf\x34\xf5\xf7\x1e\xae\xa8\xff\xe3\x0c\x00\x04\x98\xcd\
-\x5a\xfc\xf2\x27\xef\xc3\x23\x4f\x7d\x06\xbb\x61\x0b\x1c\x5a\xbd\
-\x08\xdc\x42\xd3\xfa\x3f\x00\x7c\x17\x80\x1d\xbc\x04\x4e\xf5\x12\
-\x78\x0d\x0f\x00\xf8\x72\x00\x7f\x07\xc0\xb7\x2c\x7c\x94\x81\x4b\
-\x2c\x8c\xcb\xd3\x0b\xb8\x3c\x3d\x0f\xe7\x1f\xc2\x46\xb5\x86\x43\
-\xee\x4e\xac\xac\x9f\x42\x2b\xad\x75\x01\xa4\xd3\xa6\x89\x6a\x74\
-\x82\x82\x20\x54\xd0\x69\x25\xcd\x92\xe7\x5d\x7e\xc9\x29\x50\xb9\
-\x8e\x0b\x49\xcd\x26\x13\x75\x42\x26\x1b\x51\xb1\xf6\xc9\x01\x2e\
-\x48\x96\x83\x66\x49\x00\x9f\x02\x81\x66\x84\x75\x0b\x6a\x03\xdc\
-\xa8\x02\x8d\x2a\x50\xe5\xe1\x5c\x36\x78\x97\x04\x43\x94\xb6\xeb\
-\x4c\x3c\x24\xe2\x0c\x71\x24\x58\xb1\x03\x4a\xf8\x40\x5a\xdd\x5d\
-\x3a\x86\x38\x0b\x40\xbd\x6d\xb4\x54\xac\x27\xf5\xa6\xb1\xc8\x92\
-\x8c\x09\x22\xd6\xbb\x8f\xc0\x2a\x81\x42\x54\xfe\x31\xda\xaf\x27\
-\x08\xd9\xe6\x1c\xd3\x74\x48\x35\xbe\x38\x9b\xbc\x96\x08\x6c\x58\
-\xba\x2f\x46\xf7\x35\x7a\xaf\xf3\xe0\xb8\x2a\x2c\x2e\x03\xf5\x04\
-\x32\x4d\x41\x02\xa5\xd2\x40\x01\x47\xcd\x14\x94\xc7\xe4\xe0\x85\
-\x8a\xf5\x11\x46\xa9\x8e\xd4\xde\x18\xc5\xa9\x82\xa3\x51\x67\x38\
-\xc7\xfb\x49\xea\x02\x54\xd5\x18\x55\x35\xd2\x9b\xf3\xa8\x62\x19\
-\xe0\xf4\xff\x8e\xb4\x68\x36\x5c\xc3\x63\x07\xbf\xf0\xa9\x5f\xc3\
-\x6c\xd6\x2a\x90\xb9\xd8\xf0\x1f\x07\xf0\x47\x01\xfc\x3b\xbc\x84\
-\x4e\xf5\x12\x79\x1d\xdb\x00\xbe\xd5\x32\x82\xbf\x0c\x60\x6d\xf1\
-\x43\x73\xab\x87\x39\xe0\xd2\xce\x33\x18\x4f\xcf\x63\x5d\xce\x74\
-\xb6\x79\x83\xa4\x90\xb5\xcb\xed\x43\x4e\x24\x19\x31\xd0\xd0\xea\
-\xda\xc8\x08\x4c\x62\x9e\xdc\x75\x08\xb1\xbe\x77\x85\xf1\x27\x8e\
-\x80\x5d\xea\x16\x3d\x5d\x5a\xf6\xaa\x68\x77\x44\xb7\x49\x44\xdb\
-\x81\xc6\x21\x70\x8e\x92\xf1\xd2\x2c\x80\x6a\x86\xab\x1c\x5c\x15\
-\x33\x02\x97\x08\x3c\xce\x15\xc6\x6e\x11\xdf\x19\x75\x37\x2a\xeb\
-\xeb\x3c\x0d\x65\x6d\xc2\x22\x8b\x88\x09\x0d\xc5\xfa\xbf\xd8\x48\
-\x4b\x3d\x15\xa6\x44\xaa\x2d\x16\x66\x2a\x3e\x68\x22\x20\xe4\x54\
-\xe1\xc7\x80\x42\x25\x02\x69\x09\x90\x24\xc5\x08\x60\x52\xe0\x8c\
-\xdb\xa0\x44\x1f\x28\xa8\x19\xd3\x22\xb6\xec\xce\xb9\xa0\x4e\xc0\
-\x38\x0e\xda\x1e\xa4\x54\xae\x44\x3a\x70\x04\x09\x53\x73\xc6\x52\
-\x2e\x97\x40\xc9\x72\x13\xb4\x24\x3d\x3e\x4a\x83\x3d\x45\x7f\xdf\
-\xa2\x7e\xd4\xe9\xf3\xd5\x08\x55\x35\x86\xaf\x46\x18\x8d\x46\xf0\
-\x95\x19\x7f\x74\x00\xe4\x52\xf6\x17\x6c\xe4\x78\x6d\x52\xe1\x63\
-\x0f\x3e\x82\xd9\x6e\x03\xf8\xd1\x5e\xd7\xf7\xf7\x01\xf8\xd3\x50\
-\x6d\x0c\x2c\x1d\xc0\xe2\xf3\xb7\x0d\x14\xf9\x87\x83\x94\xe1\x05\
-\xe5\x01\x40\xba\xc5\x96\xf3\xf0\x97\x23\x74\xc6\x36\x3b\x63\xb3\
-\xc9\x11\xf4\x8d\x1e\x85\xce\x40\x71\x7f\x54\x97\x34\x30\x2f\xcf\
-\x92\x2b\xc5\xd6\x45\xce\xbf\x53\x56\x5a\xfe\x7f\xca\x88\x6f\x4e\
-\xc3\x66\x04\x22\x78\xe7\xcc\x00\x9d\xa9\xe1\x52\x23\xa0\xd0\xc2\
-\xd5\x0c\x57\x99\xd8\xa9\x57\x13\x77\xdc\x05\xf6\x08\x80\x37\x83\
-\xcb\x98\x81\x6d\xea\x2d\x92\x7e\xd7\x33\xfc\x4e\xfb\x32\x31\x80\
-\x90\xd7\x59\x39\xe4\xb6\xab\x45\x55\x89\x13\x95\x4a\x82\xd0\x74\
-\xdc\x9b\x53\x10\x06\x87\x72\x51\x07\x74\x5c\xd8\x90\x72\x67\xef\
-\x23\x5b\x49\xe6\xc8\xe9\x78\x3d\xa2\x61\xeb\xac\x7f\xdc\x27\x10\
-\x17\x80\x10\x15\x5b\xa3\x1c\x25\x89\xf1\xa8\x36\xee\xca\x25\xaf\
-\xf6\xf7\x60\x6b\xe1\x38\x9b\xe2\x53\xce\x40\x05\x4f\x23\x75\x06\
-\x95\xb5\xf9\xaa\x31\x9c\x1b\x5b\x8d\x3f\xc2\xa8\x5a\xb1\x71\xde\
-\x4a\xa3\x7f\xec\x02\x54\x0e\xce\x6b\xf4\xd7\xaa\x51\xc7\xd1\x39\
-\x00\x6d\x68\xf1\xf1\x87\x1e\x56\x7f\x36\x6c\x49\xf7\x01\xf8\x6e\
-\x00\xff\x01\x2f\xd1\x53\xbd\x04\x5f\xd3\xcf\x02\xf8\x22\x00\x7f\
-\x0e\xc0\xb7\x63\xaf\x8d\x69\x91\x09\xc0\x6c\xed\xa7\x42\xcc\xb6\
-\xe0\xe8\x4a\x8c\x6e\xe9\x86\x8e\xea\x2d\x97\x60\x58\xbc\xe8\x29\
-\x0f\x8f\x24\x47\x60\x12\x58\x9a\x84\x70\xb1\xd1\xd7\xb6\xd7\x04\
-\x2e\xa2\x76\xb1\xd9\x87\x58\x2f\x7a\x43\xfd\x5d\x4a\xdf\x25\x13\
-\x80\x98\xe0\xad\xcd\xe0\xac\x15\xe8\x1a\x06\x1a\x81\x77\x0c\xaa\
-\x3c\xc8\xbb\xd4\x67\x76\x44\x70\x12\xeb\xd2\xb8\x64\x92\xba\x2b\
-\xa7\x05\x79\xd5\x36\xb2\x63\x72\x54\xea\x25\x22\x13\xa0\x22\xc7\
-\xa1\xa0\xba\x0a\xab\x37\x15\xd6\xee\x8b\x98\xd2\x92\x27\x6f\x23\
-\xbb\x11\x6d\xd7\xb9\x0d\x17\x42\x52\x03\x42\xdc\xdb\x00\x4e\x83\
-\x50\x2c\x3a\x05\x48\x21\xb6\x6b\xb5\xce\xa7\x82\xe8\x03\xa3\x02\
-\xc7\x19\x01\x11\xb6\xb9\x90\x00\xe7\x19\x2c\x4e\x5b\x90\x56\xaa\
-\x48\xf6\x16\xa9\x05\x4c\xe4\x2d\x37\x53\x03\x07\x39\xf8\x38\x9c\
-\xe3\x74\x78\x4c\x1d\x40\x85\xca\xea\xff\xca\x8f\x50\x55\x15\xbc\
-\xaf\x50\x55\x6a\xfc\x9e\x1c\xbc\xbd\xc7\x2c\x5a\xfb\xb7\xad\x96\
-\x70\x97\x9b\xf3\xf8\xf8\x43\x9f\x05\x46\xd5\x50\xba\xff\x4f\x00\
-\xfc\x7d\xbc\x00\x23\xbd\x2f\x37\x07\x10\x99\x51\x7f\x08\xc0\x7f\
-\x31\x47\xf0\xb6\xbd\xb0\x81\x7a\xb6\x05\x04\x15\xa8\xf0\x31\xa0\
-\x89\x14\x0b\x18\x35\x6d\xeb\xb2\xea\xf2\x36\x5b\x92\x12\xad\xeb\
-\xae\xc7\x8b\x8d\xf7\xa4\x52\xef\x7a\x43\x42\x36\x9f\xee\xe2\x7e\
-\x3a\xb6\x68\x4e\x05\x93\x0f\x02\xe7\xad\x9d\x25\x04\xe7\x91\x15\
-\x84\x9c\x45\x6c\x29\x33\x02\xfb\x3d\xac\xb8\x70\x6c\xce\xa0\x55\
-\x60\x53\xb5\x26\x75\xc4\xd6\xd9\xef\xa7\x9d\x82\xde\xda\x69\x8a\
-\xdf\x43\xda\x56\x44\x3e\x76\x1a\x4a\x42\x93\xa1\xfc\x52\x72\x1f\
-\x2c\x44\x3b\x49\xa3\xd8\x1a\x8b\x2b\x05\xfa\x9c\x0d\x63\x49\x00\
-\x07\x80\x83\xb6\x5c\x99\xd8\x40\x41\x7d\xf5\x9e\x2a\xb0\x53\xad\
-\x47\x07\xd5\x0d\xe4\x10\xac\x96\x37\xea\xb6\x19\x3a\x47\x3e\x05\
-\x79\xf5\x45\x9e\xd2\x9e\x3f\x35\x7e\xc3\x21\x24\x53\xbb\xe1\x0a\
-\xf5\x5f\x2e\xb6\x12\x3b\x9f\x26\xfe\x9c\xa9\xf4\xba\x82\xdf\xef\
-\xbc\xa1\xfd\x95\x39\x00\xaf\xc0\xdf\x68\xe4\x51\x55\x15\x46\x55\
-\x85\xca\x90\xff\x08\xfa\x89\x08\x42\x20\xb4\x10\x6c\xac\x10\x7e\
-\xf9\x37\x3e\x85\xd9\x4e\x0d\x8c\x53\xfa\xff\x14\x80\x7f\x04\xe0\
-\x7b\xcc\x09\xbc\xe4\x4f\xf5\x12\x7f\x7d\x3f\x06\xe0\x7f\x1a\x67\
-\xe0\x5b\xac\x53\x50\xf5\xf9\x02\xd3\xed\xf3\x08\xa1\x41\xe5\x2a\
-\x04\x00\x3e\x14\x2c\x3e\xab\x7f\x75\x6f\x7d\x30\x6e\xbc\x82\x48\
-\x49\x35\x46\xca\xd9\xbe\xac\x37\x10\x67\xc8\x89\x8b\x2c\x20\x76\
-\x03\x62\xd4\x67\xfb\x58\x90\x85\x22\x4b\x2f\xee\xc6\xcb\xfd\xf9\
-\x22\xf5\x97\x78\x81\x47\xa4\x9f\x8c\x01\x18\x81\x3c\xa7\x20\x20\
-\x51\x5a\x21\x9d\xba\x02\xc6\xfd\x77\x41\x39\x0e\xae\x72\x79\xc8\
-\xc8\x1c\x80\xa7\xbc\xb8\x83\xac\xaf\x9e\x97\x92\xb8\x4c\xa3\x88\
-\x4b\x3e\xcc\x69\xe6\xbd\x20\x52\x50\x85\xb5\xbf\xe9\xbc\xb6\xfe\
-\x84\x75\x8c\x57\x47\xb5\xd9\xba\x20\x62\x8a\xdf\x04\x81\xd7\xff\
-\xd7\x07\x05\x0c\x6d\x9c\x97\x43\x06\x4c\xb9\x33\xb7\x6f\x65\x1b\
-\x03\xe4\x2a\x2d\x1f\x62\xc6\x1f\xac\x85\xa8\x2f\x14\x1c\xc1\x3e\
-\x62\x05\x2c\x51\x0c\xf9\x54\xde\x86\xbc\x5c\xb7\xf6\x37\xae\xbf\
-\x66\x4f\xca\x03\xf0\xb1\xff\x9f\xd2\x7d\x45\xfd\x2b\xef\x35\xfa\
-\x7b\x6f\xd4\x5f\xeb\x68\x30\xd0\xda\x82\x50\x82\xc7\xac\xbe\x84\
-\x5f\xf8\xc4\xfd\x40\xd5\xe9\xf1\xff\x43\x00\x7f\x1e\xd7\xd0\xa9\
-\xae\x81\xd7\x18\x00\xfc\x1b\xbb\xbd\x1e\xc0\x17\x00\xf8\x52\x00\
-\x5f\x12\x1d\x40\x08\x33\x6c\xef\x9c\xc3\xa1\x8d\x93\x60\x69\x7b\
-\x2b\xb3\xd4\xf8\x1d\x02\x82\x90\x0d\xe3\x04\xa3\x8b\xe4\xf1\xe2\
-\x38\x9e\xc3\x51\x13\x0f\xa6\x27\x68\x13\x6a\x11\x85\x4e\x6b\xc0\
-\x4a\x3e\x7f\x8c\xe4\x26\x9d\x15\xbb\x0b\xce\xda\x91\x64\x6a\xb7\
-\x31\x5a\x13\x1b\x60\x5c\xa4\xea\x51\x6a\x82\xd8\x3e\xf7\x94\xb8\
-\x46\xde\x96\x55\x44\x99\x2a\x67\xfd\xf1\xc8\x4a\x73\x11\xfc\xf3\
-\x3a\x2c\xe4\x6c\xce\xdd\x99\x34\x36\xb9\x38\x7d\x58\xe8\xe0\xb9\
-\x4c\x0e\x2a\x33\x81\x58\x53\x4b\x04\x04\x83\x4d\x51\x12\xac\xc5\
-\xa7\x0e\x32\xaa\xf4\xb2\x73\x70\xf0\x46\x41\x56\xd4\x9f\x5d\x80\
-\x87\x45\x63\x62\x84\x64\xe6\xd6\x61\xf0\x71\x21\x4c\x5c\x0a\x63\
-\xc3\x43\xa6\x41\x90\xa8\xbf\x62\x4a\x41\xa2\x40\x1f\x9b\xe6\xa3\
-\xb0\x00\x15\x99\x1e\x44\x41\xcd\x25\x9f\xb6\x0e\x21\xfe\xde\x71\
-\xb4\xd7\x08\x40\xde\xfb\x42\x93\x7f\x64\x6d\x3e\x4d\xfd\x95\x14\
-\xe4\x92\xf1\x7b\xa3\x1e\xc7\x5d\x00\x8d\xbd\x37\xfb\xd6\x1c\x3e\
-\xfa\xc0\xc7\x71\xf9\xe2\x36\x30\x1e\xf7\x6b\x7e\x2c\x1d\xc0\xf3\
-\x77\x7e\xd1\x6e\x3f\x06\xe0\x8b\x13\x7a\x15\x02\xce\x5d\x7c\x04\
-\x87\x36\x4e\xc2\x9b\xb6\x85\x4b\xa8\x76\x6c\xdb\xe7\x8d\x36\x1a\
-\x5d\xc9\x06\xdf\x28\xa1\x00\x4c\x92\xf4\x5e\x22\xed\x38\x8e\xc0\
-\xba\x52\x3a\xaa\x58\xfe\x64\x59\xa8\x46\x39\x43\x1e\x33\x8f\xbf\
-\xa8\xc9\x4b\x23\xb7\xb6\x55\xba\xaf\x88\xfe\x31\xb3\x70\x56\xab\
-\xc7\x5d\xf2\x4e\xf2\xe7\xf1\xc2\x4c\x9b\x66\xc9\xe5\x2c\x82\xca\
-\xd4\xdf\x6a\x69\xea\x6d\xf9\x8d\x33\x0d\x71\x36\x20\x6f\xd5\x48\
-\xb5\x74\xca\x05\x9c\x35\x50\x2d\x53\x50\x32\x10\x74\x7a\x4f\x8c\
-\x4a\x1d\x97\x70\x20\x68\x36\xc0\x0e\x8c\xa0\xef\xa7\x4d\x73\xb2\
-\xbd\x6f\x4c\x3a\xb4\x45\xde\xa2\x74\x68\x55\x35\x88\x19\x54\x39\
-\xb0\x90\xf2\x34\x38\x98\x16\xa1\xb7\x56\x63\x94\x05\xd3\xe1\x23\
-\x8d\xca\x6c\x20\xa8\x49\x79\x17\xf3\xfa\x94\x34\xfd\x7c\xca\x02\
-\x3c\x45\x55\x9e\xbc\xa1\xc7\x9b\x52\x4f\xe5\x75\xe0\x27\xa3\xfe\
-\x79\xad\x0b\xb3\xa0\x35\xe3\x77\xae\xc2\x85\xcb\x4f\xe0\xe7\x3f\
-\xf6\x49\xa0\xea\x20\xff\xe7\xa1\xe3\xbc\x4b\x07\xf0\x02\x9c\x8f\
-\x1a\x58\xa8\xd8\x80\xf3\xb8\x7c\xf1\x71\x9c\xdb\xf7\x18\x8e\x6c\
-\x5e\x87\x36\xd4\xe6\x04\x74\x5a\x46\x7b\xf0\x2e\xe9\xe8\x39\x78\
-\x28\x51\x55\xa3\x1a\xc7\x48\x1a\x99\x82\x89\x3d\x10\xdb\x62\x1c\
-\x77\x49\x66\x99\xb0\x58\x5b\x53\xb1\xdc\x5a\x4a\xd9\x2e\x33\x7a\
-\xe7\x52\x1a\x9f\x8c\x1c\x45\xea\x1f\x6f\x49\x87\xbe\x88\xf0\x70\
-\x09\xcd\x26\x03\xc6\x62\x16\xe0\x8d\xd7\xee\xe3\x9c\xba\x73\x0a\
-\x1c\xc6\x35\xdd\xe4\x6c\xa6\xa0\x58\xd9\x5d\xac\xcd\x76\xc5\x66\
-\x5e\x4d\x6c\x8a\x35\x6d\x6c\x82\x1f\x62\xd2\xdd\xa2\xf2\xec\x8a\
-\x07\x98\x62\x93\x6d\x59\x22\x56\xb1\x56\x36\xd1\x0d\x62\x0f\x27\
-\x8c\x10\x3c\x1c\xb7\x26\xde\x09\x35\x5e\xdf\x82\xd9\x83\x43\xb0\
-\x76\x62\xb0\x1e\xbd\x2e\xdf\x74\xc2\x70\x81\xcd\xb1\x54\x10\x56\
-\xa3\x17\xa7\xb3\x01\xe2\x94\x5c\x17\xb3\x14\x5f\x88\xa7\x25\xd5\
-\xe2\xe4\xf4\x28\x4f\xf2\xa5\x2c\xc0\x27\xd9\x6e\xe7\x94\xe4\x13\
-\xf7\xf6\xa9\x23\x88\x20\x6b\x2e\xa7\x58\xb4\x0c\x21\x0b\x22\xfb\
-\x37\x5a\xfc\xc4\xaf\xfc\x12\xa6\xbb\x35\x30\xea\x38\x80\x7f\x8b\
-\xe7\x71\x83\xcf\xd2\x01\xcc\x97\x05\x7f\x3b\x39\x00\xdb\xfa\xf9\
-\xe8\xe3\x1f\x41\x75\x66\x8c\x03\xeb\xc7\xd0\x86\xc6\x58\x66\x91\
-\x30\x5b\x2e\x73\x62\xe5\x8b\x5b\xaa\xaf\x63\xc3\x94\x52\x5f\x29\
-\xf4\xb4\xa5\xf8\x1e\x15\x5c\x79\x92\xbc\x2e\x2b\x21\xec\x36\xd8\
-\x13\x9d\x03\x15\xd1\x9b\x8a\xf4\x3d\x92\x85\x7c\xda\x15\x4f\x1a\
-\xc9\x92\xe1\xc7\x36\x96\xd5\xfd\x96\x09\x38\xdb\x38\x13\x49\x29\
-\xc9\x11\x14\x3f\x13\x1d\x45\xca\x02\x0a\x07\xe0\xe2\x4a\x72\x97\
-\xb3\x01\x11\x97\xf9\x00\xd6\xf7\x67\x0f\x93\xf6\x29\x76\xe1\x31\
-\x25\xfd\xbf\x38\x71\xc9\x36\x7e\xcd\x8e\xb5\x8d\xc7\x0c\x92\x60\
-\xce\x82\x21\xec\xd5\xf0\xb9\x82\x30\x23\xc8\x48\x0d\xdc\x05\x84\
-\xd0\x2a\xd1\xca\x33\x5c\xab\x11\x9e\xb9\x31\x50\x36\x4e\x6c\xe6\
-\x49\x3f\xe6\xb8\x09\x9a\xba\x2b\x0c\x4a\x0e\x43\x12\x5a\x31\xb1\
-\x8f\x28\xfa\x51\x92\x80\x7c\xd6\xff\xf3\x2e\xab\x02\x79\x72\x06\
-\xaa\x66\x29\x88\xc0\x99\x45\x1a\x18\xd8\xb7\x56\xe1\xe3\x0f\xfe\
-\x12\x1e\x78\xf8\x89\x7e\xea\xbf\x0d\xe0\xef\x5d\x8b\x86\x74\xad\
-\x3a\x80\x48\xae\xf8\xd1\xff\x3f\x7b\xe7\x12\x1b\x77\x96\x95\xf1\
-\xdf\xbd\xf7\x5f\x55\x76\x39\x8e\x1f\x15\x27\x9d\x4c\x37\xd3\x42\
-\xc3\x63\x40\x83\x04\x12\x48\xcc\x0e\x09\x16\x2c\x60\xc1\x6c\x80\
-\x01\xb1\x45\x42\x88\x1d\x4b\x10\x68\x46\x48\x23\x36\xb0\x9a\xd5\
-\x20\x60\x81\x10\x1b\x1e\x2b\x24\xc4\x63\x01\x03\x33\x4c\xbf\xa7\
-\x5f\xc9\xc4\xb1\x1d\xe7\xe1\x3c\xdc\xb1\x5d\xae\x72\xd5\xff\xde\
-\xcb\xe2\x9c\xfb\xa8\x74\x92\x0e\xd0\xd3\x24\xa6\xae\x54\x72\xb9\
-\xaa\x5c\xb6\xab\xea\xbc\xbe\x73\xce\xf7\xcd\x60\x01\xed\x09\x9b\
-\x3b\xff\xce\xa5\x0b\x9f\xe3\xfc\xca\xcb\x5a\xf7\xfb\x6c\xe8\x64\
-\xb5\xbe\x24\x42\x91\x94\x6a\x8a\x5a\x8d\x48\x58\x15\x72\x89\xa4\
-\x4e\x6c\xcc\x0c\xa8\x50\x46\xe7\x8d\xad\xa2\x68\x01\xe1\xac\xa6\
-\xa3\xc9\x11\x3c\x6c\x9c\x39\x33\xd0\x85\x98\x9c\xee\x5b\x2b\xe9\
-\x3e\xb6\x8a\xfa\x56\x1f\x6f\x35\x4a\x25\x83\x16\x07\x90\xa2\x96\
-\x35\x06\x67\xcb\x44\x80\xd5\xda\xdf\x56\xe0\x20\x14\xec\x20\x31\
-\x5b\x65\xd6\x74\x6d\x81\xd4\x94\x88\xb2\x85\x49\x16\xde\x08\xc1\
-\x82\x0f\x04\x27\xd9\x80\x38\x01\x21\xe4\x08\x21\x10\x82\xa4\xec\
-\x4d\x88\x78\xef\xf5\x67\xc4\x59\xd8\xd0\x12\x6d\xc4\x87\x16\xeb\
-\xba\x04\xef\x09\xbe\x15\x5e\x81\x08\x31\xf6\x88\xc1\xcb\xef\xf4\
-\x54\x40\x5f\xac\x84\x38\x0a\x7c\x58\x04\x40\x4d\x11\xf4\x48\xaf\
-\xad\x4a\x74\x25\xbe\x3f\xc9\x04\x4a\x29\x60\x6c\xea\xa0\xd8\xea\
-\xf5\x29\xc3\x5d\x21\xb5\x45\x63\xa4\xf5\x70\x66\xa1\xc3\xfe\xe1\
-\x65\x5e\x79\xf7\xbd\x87\x23\x3f\x08\x83\xef\x3b\x73\x07\xf0\xc9\
-\x67\x01\xbf\x0d\x7c\x1d\x58\x48\x4e\x20\xf8\x96\xeb\x37\x5e\xe1\
-\x78\xb4\xcf\xa5\x8d\xcf\xd2\x75\x3d\xbc\x6f\x55\x55\xc0\x6a\xb3\
-\x2f\x66\xf1\xc8\x14\xed\xa3\x49\xbc\x3c\xb2\x4f\x1b\x4d\xa6\xc7\
-\x51\x21\xcb\x98\x89\x27\x73\x36\x60\x2b\x50\x2d\xa5\xd8\xa9\x23\
-\x60\x85\x0f\x3f\xa5\xf6\x56\x99\x71\x53\x7a\x9a\x6e\xcb\x8e\x20\
-\x19\xb8\x35\xe5\x83\xe9\xc4\xa0\x93\x11\xdb\x34\x92\x5a\x5d\x37\
-\xfa\x33\xae\xfe\x3d\xd5\xc5\x59\x4d\x8b\x5d\x29\x43\x12\xf1\x6e\
-\x85\x64\x3c\xd4\xfc\x57\xa7\xa8\x4b\x41\x21\xd3\xa6\x39\x89\x8a\
-\x41\x22\x62\x42\xdc\x43\x6b\xf0\x3e\x10\xa3\xd1\x11\x59\x31\x78\
-\xe3\x84\xc8\x25\xb4\xd2\xeb\x0f\x8a\x1b\xb8\x28\x65\x40\x6b\x1d\
-\xd1\x35\xd9\x49\x64\x03\x0f\x91\xe0\x42\x6e\xf9\xc5\x64\x90\x89\
-\xa3\x30\xa6\xc1\xa4\xd2\xd9\x48\x4e\x51\xb8\x06\x54\x9a\xdc\xd4\
-\xe5\x90\x0a\x76\x6a\xe9\x64\x15\x98\xcd\x92\xe4\xa1\x90\xbf\xa5\
-\x5d\x04\x19\xf9\xb5\x9c\x59\xb0\x1c\x0c\xdf\xe7\x9f\x5f\x7d\x85\
-\x49\x8b\x08\x9a\x96\xf3\xf7\xc0\x57\x9e\x57\x23\x7a\x9e\x1d\x00\
-\x08\x7d\xf2\xef\xcc\xbc\x01\x1a\x91\xef\xdf\xfb\x0e\xc3\xe3\x7b\
-\x5c\x3a\xff\x43\xac\x2d\x5d\xd4\x05\xa0\x96\x42\xea\x98\x5a\x51\
-\xda\x45\x32\x11\x97\x6a\xfe\xcc\x98\x61\x4b\xf4\x37\x85\xe1\x37\
-\xaa\x03\xc8\x3b\xff\xb6\xe2\x05\xa0\xe2\xfc\x33\x95\x41\x5a\xc4\
-\x01\x98\x2a\x3a\x27\x83\x77\x29\x43\x90\x76\x9d\x73\x2e\x7f\x70\
-\x9d\x35\x38\x67\x67\x1d\x86\xae\xa6\xa6\x68\x9f\x1c\x80\x25\x45\
-\x7c\x75\x0e\x96\x8c\x27\x98\x44\xa6\x61\x8c\x4e\xe6\xd9\x42\x8d\
-\x9f\xc8\x43\xb2\x02\x30\xaa\x0d\x90\x9c\x80\x60\x02\x21\x44\x1a\
-\x15\xce\x14\x83\x95\xb2\x20\x34\xd2\x1f\x8f\x21\x12\xbc\xc1\x07\
-\x9d\x95\xf7\x41\x26\x2e\x1b\x83\x6f\x0d\xa1\x31\x19\x43\xf0\xad\
-\xc1\x36\x41\x1f\xa3\x4c\x4e\x31\xe4\x01\x1f\x1f\x94\x27\x5c\x8d\
-\x3f\xaa\xc8\x6b\x7a\xc3\x6a\xd2\x16\x53\xde\x88\x9c\x19\x91\x9c\
-\x68\x22\xe8\xc8\xa2\x1f\x59\x9d\x34\xeb\x0e\x66\xbc\xb8\x52\x8c\
-\xf3\x01\x9c\x6d\x38\xdb\x6f\x79\x6f\xfb\x9b\xbc\x75\x75\x53\xca\
-\x25\x37\xb3\xdd\x77\x19\xd9\xea\x3b\x99\x3b\x80\xff\xbb\xf3\x87\
-\x08\xc7\xe0\x2f\x57\xc3\x01\xe0\x3a\x9c\x8c\x0f\xd8\xdc\xf9\x0f\
-\x1e\xac\x7d\x9a\x4b\x83\x1f\xa0\xd7\xf4\x69\xc3\x34\x6b\x07\xa4\
-\x5a\x3c\x26\x19\x71\x63\x0b\x57\x7d\x2a\xf4\x09\x95\x86\x44\x64\
-\x46\x53\x42\x53\x7f\x9b\xb6\x77\x52\x19\x90\x6a\x74\xd4\x08\xad\
-\xf2\xde\x69\x24\xb6\xa6\xec\x96\xe7\x34\x3f\x19\xb5\xb3\x39\x8d\
-\x15\xc4\x5f\x32\x00\x57\x19\x7e\x72\x2c\xd6\x29\x06\x60\x2d\xce\
-\x95\xd6\xa0\x49\x2d\xac\x9c\x4d\x90\x81\x42\x53\xf1\x19\x38\x53\
-\xc4\x49\x6a\xf1\xa3\x2c\x9c\x54\xe9\xdf\xa5\xaf\x21\xdd\xe6\x43\
-\x1e\x8d\x0d\x3e\xd2\x04\xc9\x02\x42\x30\x34\x3a\x30\x13\x7c\x31\
-\x78\xd7\xa4\xef\xc5\x39\x38\x97\xb2\x05\x43\xf4\xc2\x3b\x20\x8e\
-\x40\x9c\x81\xd3\x7d\xee\xac\x2f\x58\xcb\xb9\x51\xb2\xae\x04\x60\
-\x26\x46\xe0\x14\xf5\x13\x1d\xb3\x2d\x23\x5c\xd9\x09\x44\x95\x3f\
-\xa7\xd2\x4c\x48\x4f\xef\xbd\x50\x1b\x2f\x2d\x58\x4e\xc6\x37\xf9\
-\xc6\x5b\x6f\xb0\x7d\xeb\x2e\x34\x0d\x59\xa0\x41\xce\x16\xf0\x85\
-\xe7\x11\xf8\x3b\x6d\x0e\x20\x02\xbf\x0e\x9c\xd3\xf9\x80\x72\xac\
-\x93\x6c\xe0\xfe\x26\x87\x47\x7b\x5c\x18\x7c\x86\x73\x2b\x2f\xd1\
-\xb8\xae\x64\x03\x6a\xb4\xb1\x4a\xf3\x8d\x29\x1c\xf8\x99\x51\xb8\
-\x16\x19\xb5\xd4\xfb\x48\xf2\x99\xb0\x46\x05\x3f\x28\x65\x80\x49\
-\xe3\xad\x54\xc6\xae\xd7\x53\x5d\x9e\xd2\x7f\x47\xc6\x08\x5c\xc2\
-\x03\x5c\x8a\xf6\x92\x1d\x38\x8b\x02\x5a\x46\x00\x2b\x6b\xaa\x12\
-\x41\x10\x7f\xe9\x61\x97\x3a\x38\xb3\x0d\xd5\xd9\x88\x66\x06\x65\
-\x54\x78\x06\x51\xcb\x8a\xb7\xa4\x54\xd8\x94\x08\x1c\x63\x24\xf8\
-\x02\x0a\x06\x1f\xf1\x89\x17\x20\x45\xfd\x18\x15\x0b\x28\x06\x1f\
-\x83\xc1\x07\x43\xf0\x8a\x13\x78\x3b\x13\xf9\x43\x4a\xfd\x7d\xcc\
-\xcc\x4f\xc9\xe1\xa4\x9c\x24\x04\xd9\xab\x88\x0f\x0d\x81\xe5\x0e\
-\x8c\xa9\xde\x80\x6a\x13\x22\x92\x64\xc2\x75\xce\x21\x50\x16\x96\
-\xaa\xdf\x23\x5b\x8c\x86\x85\x4e\x07\xcb\x03\xb6\x6f\xbc\xcb\x9b\
-\x9b\x57\x69\x27\xfe\x51\x35\xff\x35\xe0\xe7\x81\x37\x9f\x77\xe3\
-\x39\x0d\x0e\x00\xe0\x10\xf8\x45\x6d\xc5\xcc\x3a\x01\x0c\xd8\x86\
-\xe9\x74\xc4\xf5\x9b\xaf\x73\xff\xc1\x0e\x17\x06\x9f\x61\x6d\xf9\
-\x05\x1a\xd7\x21\x44\x9f\x1d\x40\xc5\xf9\x9d\x27\xd6\x0a\x11\xc8\
-\xec\x2a\x5e\x31\x78\xa3\x04\xa4\x26\xf1\x4d\x96\x75\xe0\x6c\xec\
-\x1a\x71\x2b\xe3\xb3\x4d\x5d\xfb\x97\x76\x61\x36\x7c\x57\x52\xf9\
-\x7c\x31\x86\xa6\x29\x43\x3e\x05\x18\xd4\x32\xc0\x55\xb7\xa7\xc1\
-\x9f\xec\x14\xd2\x0e\x80\xee\x19\x24\xd5\xdc\x4a\x9c\x24\xd6\x22\
-\x48\xca\xba\x2c\x93\x78\x9a\x01\xf8\x84\xc6\x23\xa9\xbe\x0e\xe5\
-\x48\x7d\x2f\x53\x72\x31\x04\x89\xfe\xc9\x09\x04\xe1\x0d\xf0\xad\
-\xa4\xfb\x31\x5a\x29\x11\x5a\x8d\xf6\x31\xe2\xa3\x2a\x3c\xc5\x3a\
-\xeb\x28\xc6\x69\x1e\x02\x26\x33\x77\x6b\x35\x7f\x69\x66\xd4\x82\
-\x65\x9e\x20\xed\x7b\x88\x81\x17\x62\x97\x3c\x4d\xac\x25\x4e\x88\
-\x86\x5e\xc7\x61\x39\xe2\xe6\xde\x15\xde\xd9\xba\xc2\xd1\xe1\x48\
-\xa2\x7e\xf3\x21\x13\xf9\x16\xf0\xab\xcf\x2b\xe8\x77\x5a\x1d\x40\
-\x1a\xc4\xf8\x02\xf0\x55\xe0\x8b\x1f\xba\x57\x99\x5a\x8f\x8f\xf7\
-\xd9\x3c\xfe\x26\x7b\x4b\x03\x2e\x0c\xbe\x97\xf5\xb3\x17\xe9\x34\
-\x5d\xe1\xb5\x33\x51\x28\xa7\x73\x5d\x99\x26\x75\x2a\x85\x1f\x5b\
-\xf1\x01\xb8\xe2\x00\x4a\xdd\x5f\x8c\x2a\xa3\xf0\x5a\x06\x94\xc8\
-\x5f\x8c\x3a\x03\x7c\xae\x42\xfc\x9d\x82\x76\xd6\xe2\x0c\x33\x94\
-\x54\x12\xf5\x4b\x09\x60\x53\x26\xe0\x0a\xe8\x97\x71\x02\x97\xca\
-\x13\x72\x86\x90\x66\x00\xd2\xdf\x95\x28\xea\x63\xad\x81\x10\x75\
-\xee\x3f\x30\x53\x02\x48\x59\x1e\x44\x45\x2d\x88\x43\x88\x31\xd2\
-\x66\x83\x4f\x18\x40\x50\xc0\x2f\xe2\x5b\xb1\x36\xdf\x14\x80\x50\
-\x80\x44\x59\x2d\x0e\x3e\x81\x6d\x3a\x50\x14\x63\x99\x41\xa8\xcb\
-\x0f\x0a\x56\x51\x46\xb7\xc9\xcb\x5d\x69\xe3\x33\x54\x24\x28\x04\
-\x93\xb7\x3e\x8d\x31\x95\x83\x91\xff\x2f\x46\xc7\x62\xd7\x42\x3c\
-\x64\xe7\xd6\x15\xde\xdf\xbe\xca\xe1\xc1\x50\xc6\x34\x3b\x8f\x5c\
-\xef\xfd\x4b\xe0\x37\x10\x2e\x3f\xe6\x0e\xe0\xd9\x3b\x47\xc0\xaf\
-\x20\xd3\x82\xbf\x0f\x9c\xfd\xd0\x23\xac\xcc\x6e\x0f\x87\xf7\xb8\
-\x3a\xbc\xc7\xad\xfe\x1a\xe7\x07\x2f\x33\x58\xfd\x14\x8b\x9d\x45\
-\x21\x07\x51\xe5\x5b\x93\xc5\x2e\x65\x27\x3d\x01\x68\x09\xac\xab\
-\xb0\xa7\xbc\xd4\x63\x2c\x82\xbc\xeb\x63\xf2\x62\x90\x95\x45\x1c\
-\x01\xa8\x0b\xfa\xef\xac\x7e\x9f\x23\x39\xa5\x2d\x68\x2d\xd6\x69\
-\x6a\x6f\x35\x6b\x50\xe3\x4f\xd1\x3e\xd5\xfa\xce\x29\x56\x90\x6e\
-\x4f\xa5\x85\xb5\xfa\x9c\x65\x73\xd0\xe6\x8d\x46\x53\x6d\x3c\x52\
-\x0c\x2a\x47\x5b\x05\xfc\xf4\xab\x6f\x95\x5a\x25\x48\x8f\x5c\x52\
-\xf6\x88\xf3\x9a\xe6\xb7\xa9\x8e\x37\x78\x5d\x10\xf2\x1d\x93\x33\
-\x87\xa0\x00\x9f\x64\x02\x11\x1f\xac\x96\x08\xa9\xcc\xd0\xd2\xc3\
-\x57\xd8\x43\x55\xab\x87\x8a\xa0\x39\x86\xe4\x10\x0a\xc7\x83\xe8\
-\x11\x6a\x84\xaf\x18\xde\x53\x06\x23\x0d\x0c\x4b\xb7\xe3\xe8\xc5\
-\x96\xe9\xf8\x2e\xdb\xbb\x9b\xbc\xbf\xb3\xcd\xd1\xd1\x48\x3e\x1b\
-\x8f\x36\xfc\x31\xc2\x53\xf1\xa5\x53\x66\x2f\xa7\xce\x01\xa4\xf3\
-\x47\x08\xef\xda\x1f\x03\x3f\xf9\xc8\x47\xa8\x23\x38\x3e\xde\xe7\
-\xda\xf0\x3e\x37\xee\x5c\x66\x63\xed\x45\xce\xad\xbf\xc4\xf2\xd2\
-\x59\x9c\x2e\xa5\xa4\x59\x80\x94\xe2\x1b\x74\x9b\xcf\xd6\x19\x41\
-\x8a\xa8\x31\x1b\x9a\x2c\xa2\xa9\x41\xa7\xfb\x9d\xa2\xf2\xb6\x44\
-\x7c\x63\x29\xc6\x6b\x05\x0b\xb0\x4d\x9d\xd2\x4b\xfd\x9f\x4a\x86\
-\x94\x1d\x24\x50\xd0\xa9\x91\xbb\x64\xe4\x75\x96\xe0\xc8\x04\x1b\
-\xc5\x19\x19\x75\x66\x7a\x5f\xa5\x72\x9a\x79\x50\x8d\x0a\x75\xaa\
-\x22\x91\xd0\x7d\x45\xa9\xe3\x75\x05\xd7\x47\x41\xf9\xc5\xd8\x63\
-\x6e\xe3\xf9\xd6\x68\x64\x87\xd6\xcb\xa0\x51\xf4\x01\xaf\x91\x3f\
-\x78\x99\xb3\x08\x21\x39\x85\x98\x9d\x00\x21\xaa\x5c\x43\xca\x02\
-\x14\x74\x54\x50\x32\xe9\xb8\x24\x85\xb7\x42\xe6\x1c\x55\x70\x34\
-\x35\x77\xc9\x5c\x0f\x01\x83\x8f\xe0\x1a\xc3\x82\x01\xda\x21\x77\
-\xee\xed\xb0\xbd\xbb\xc5\xce\xde\x1e\x93\xc4\xe4\xd3\x3c\x96\xd0\
-\xe3\x5f\xb5\xdd\xfc\x6f\xa7\xd1\x50\x4e\xab\x03\x00\xf8\x4f\xe0\
-\xa7\x11\x1a\xa6\xdf\x02\x36\x9e\xe4\x08\x26\x27\x43\x76\x6f\xbc\
-\xcd\x8d\xbd\xef\xb0\x7a\x76\x83\x8d\xf5\x17\x19\xac\x5d\x64\x71\
-\x61\x51\xc8\x20\x28\xca\xc3\x75\xc4\xcf\xe9\xbd\x23\x47\xe3\x4c\
-\xdf\xa5\x06\xef\x1c\xa5\x33\x90\xbb\x00\x46\xa3\xbb\xa9\x5a\x81\
-\xcc\xd6\xf3\xd9\x90\x93\x81\x6b\x26\x90\xef\xab\x6f\x43\xb3\x04\
-\x05\x12\xb3\xe3\xa1\xfc\x4c\xf5\x37\xa7\x6c\x45\x80\xcc\xb2\x33\
-\x91\x80\xf6\x44\xcb\x1d\xbd\xd1\x68\x6d\xb2\x81\xe6\xda\xde\xcb\
-\x96\x9c\xcf\x60\x5f\x14\x67\xa0\xf8\x40\x93\x53\x7e\xa3\x59\x02\
-\x19\x27\x90\x72\x81\xdc\xf2\x8b\x2a\xb1\x95\x41\x46\xbd\x1e\x2a\
-\x94\x3e\x24\xa7\xe0\x93\x1a\xb8\x3e\x87\x45\x75\x0b\x0a\xdd\x43\
-\xc0\xd2\xed\x39\x62\xdb\x62\xc3\x88\x9b\xb7\x6f\x70\xf8\xc1\x6d\
-\xde\xd9\xbe\xce\xd1\x70\xa8\xa4\x06\x8f\x8d\xf8\x20\x54\x75\x5f\
-\x01\xbe\x06\x4c\x4f\xab\x91\x9c\x66\x07\x00\x42\xbc\xf8\x65\xad\
-\xdd\x7e\x53\x5b\x85\xe7\x1e\xf9\x48\xb1\x14\x62\xf0\xec\xdf\xdf\
-\x65\x7f\xff\x06\x9d\xde\x12\x83\xd5\x17\x38\xb7\x7e\x91\xf5\xb5\
-\xf3\xf4\x17\xfa\xb8\x46\x57\x61\x4d\xe1\xe9\x73\x33\x35\xbf\xde\
-\xe6\x4a\xd4\x95\x8c\xc1\x6a\x86\xa0\xc6\x9c\x0c\xdb\x25\xc0\x10\
-\xa5\xa0\x2e\xc6\x5f\x3b\x03\xa7\x06\x2c\xd7\x6d\x2e\x1d\x9c\x33\
-\x34\x4e\x1c\x8b\xb3\xe9\x2b\x34\x36\x0d\x1e\x91\x7f\x5f\xea\x00\
-\xb8\xe4\x04\x14\xd8\xc8\xb2\x66\x45\x35\x3c\x2b\x84\x85\x3a\xf5\
-\x0e\x62\xfc\x5e\x8d\xd4\x7b\xa7\x46\x1a\x09\x2d\xf8\x20\xab\xca\
-\x29\xe5\x4f\x99\x81\x0f\x68\xa7\x00\xbd\x4d\x23\xb8\x5e\xb7\xc1\
-\xe6\xe7\x49\x02\xaf\xd1\xcb\x7a\xb1\x64\x0a\x52\x16\x28\xf3\x37\
-\xd6\x85\xcc\xef\x90\x79\x01\x34\x25\xeb\xf7\x1a\x26\xe3\x11\x4d\
-\x18\xb2\xb9\xb5\xc3\x83\xfd\xdb\xbc\x7f\xfd\x16\xa3\xf1\x98\x38\
-\xf5\x02\xea\x3d\x99\xbe\x6b\x17\xd9\xe7\xff\x2a\xb2\xdf\x7f\xaa\
-\x8f\x89\x31\x7e\xf7\x9e\xfc\xa7\x9e\xb9\xd5\xe8\x4f\x23\xfa\x6b\
-\x5f\x04\xbe\xff\xa3\x1b\x8c\x21\x7d\xe2\xe8\xf6\x96\xd8\x58\xbf\
-\xc8\xb9\xf5\x17\x58\x5f\xdf\xa0\xbf\xd4\xa7\xdb\x69\x48\x05\xaa\
-\xb1\xb1\xd4\xdc\x29\xd5\x77\x3a\x06\xec\x22\xae\x49\x75\xbe\x44\
-\x79\xa7\xe4\x1c\x2e\xa5\xfb\x6a\xdc\xc6\x55\x75\xbc\xd3\x88\xae\
-\xa5\x84\x6b\xca\x7d\x4d\xed\x24\xf4\x67\x9c\xad\xb2\x80\x5c\x7e\
-\x24\x83\xaf\x30\x80\xbc\xb3\x50\x06\x97\x66\x60\x00\x0a\xf0\x96\
-\x88\x30\x52\x6a\x9e\x89\x31\x52\xc4\x0e\x09\xfd\x97\x91\xd9\xe8\
-\xe5\xbe\x64\xfc\x41\xd3\xfe\x14\xad\x83\x0f\xd5\xfd\xf2\x7d\xf0\
-\xfa\x3b\x5a\xfd\xd9\x08\xb1\x0d\x0a\x3a\x46\xed\x30\x48\xf6\x20\
-\x7d\x7a\x69\x43\xb6\xd1\xd0\x55\x2a\xf0\xf1\xf1\x88\x30\x3e\x64\
-\x73\x67\x9b\xdd\x9b\xbb\xdc\xdc\xbb\xc7\xf1\xf8\x44\xb9\x4d\x5c\
-\x11\x5c\x7c\xfc\x79\x1b\xf8\x53\xe0\xcf\x80\x5b\xcf\x5c\xaf\xfb\
-\x9f\x7e\x77\xee\x00\x3e\xc6\x73\x06\xd1\x24\xf8\x35\x64\xad\xb8\
-\x79\x2a\x67\xe0\xc5\x19\xb8\x4e\x8f\xf5\xd5\x0d\x06\xeb\xe7\xb9\
-\xb0\x71\x91\x95\x95\xb3\xf4\x16\x17\xe8\x74\x94\xee\x2a\x11\x89\
-\x38\x2d\x0d\x4c\x95\xee\xbb\x52\x0a\x38\xad\xff\x5d\x53\x81\x75\
-\x8d\xdc\xd6\x58\x04\x0b\x30\xea\x24\x1a\x31\x7a\x57\x01\x85\xae\
-\x31\x39\xba\xbb\x3a\xeb\x30\x46\xbb\x07\xc2\x25\x60\x13\x20\xa9\
-\x99\x8a\x33\xb5\x22\x11\x33\xc6\x9f\xff\x5d\x5d\xab\xce\xe8\x3f\
-\x1a\x8d\x23\xda\xb6\x53\xe3\x4f\x59\x42\xaa\xf1\xd3\xd7\x58\x9c\
-\x80\xf7\x64\x47\x10\x5b\xf9\xbe\x60\x02\x41\x1d\x43\x89\xf6\xde\
-\x07\x2d\x25\xd4\x07\x0b\x19\x12\x44\x4b\xd7\x18\xc2\xd4\x33\x1a\
-\x1e\x63\x27\xc7\xbc\x75\x65\x0b\x73\x72\xc8\x1b\x57\x77\x18\x8f\
-\xc6\x8c\x8e\x15\xcc\x73\xee\x21\x21\x87\x47\x9e\x09\x42\x38\xf3\
-\x35\xe0\xef\x78\x46\xa8\xba\x3f\x49\x07\x70\xda\x4b\x80\x27\x75\
-\x0b\xfe\x42\x2f\x3f\xa1\x7d\xdd\x5f\x00\x2e\x3d\xde\x9b\x59\x68\
-\x64\xcc\xd8\xb7\x13\xee\xec\x6d\x73\xe7\xf6\x16\xef\x5d\xee\xb2\
-\xb0\xb8\xc4\xb9\xf5\xf3\xac\xad\xae\xb2\xb1\xf1\x02\x6b\x6b\x2b\
-\x2c\xf6\x17\xe9\xf6\x3a\x58\x17\x33\x19\x86\x71\x31\x4f\x06\xce\
-\x00\x75\x09\xd0\x6b\xc8\xe9\x7e\x72\x1e\xa9\x64\x70\x33\xa5\x81\
-\x7c\xc6\x1b\x6b\x70\x36\x2a\xea\x2f\xe8\xbe\x53\x3a\xb1\xb4\x53\
-\x90\xa2\xbd\x33\x69\x2c\xb8\x80\x7f\x59\x82\x0c\x33\x1b\xfe\xc9\
-\x4c\x08\xd2\x05\x30\xc2\x98\x60\x8d\xc1\xa7\x36\x61\x25\x88\x62\
-\x63\xc4\xab\x33\xf1\x15\xd3\xb0\x31\x46\xbe\xb7\x85\x6f\x30\x38\
-\x93\x75\x1b\xa3\xb6\xe2\x48\x0c\xcc\x49\xee\x2b\x0a\x52\xdf\x44\
-\x08\x93\x96\x83\xa3\x11\xfd\x76\xca\xf6\xcd\xdb\xdc\xbc\xb1\x47\
-\x38\x19\xf1\xea\xe5\x2d\xfc\x74\xca\xf1\xf1\x48\x3c\x55\xa7\x91\
-\x7f\xa6\xdb\xfb\x48\x5b\x42\x46\xc8\xff\x46\x2f\xaf\xf1\xff\xf8\
-\x34\xcc\xcf\x37\xf4\xf2\x7b\x9a\x15\xfc\x12\xc2\x3a\xd4\x7d\x8c\
-\x27\x50\x3a\xde\x46\x23\x65\x60\x34\x3c\x60\xe7\x70\x9f\x9d\x6b\
-\x60\x3a\x5d\x7a\xbd\x05\x06\xeb\x17\x58\x5d\x3b\xcb\xfa\xfa\x3a\
-\x83\xf5\x01\x2b\x6b\x4b\x2c\xf6\x7b\x74\xbb\x5d\x3a\x1d\xe9\x18\
-\x18\x35\x0e\x63\x52\x36\x30\x3b\x2f\xe0\x52\xfd\x5e\x65\x0d\xd6\
-\xa2\x44\x95\xc9\x80\xab\x4d\xc0\x84\xea\x5b\x93\x07\x60\x1d\xb2\
-\xbb\x92\xbe\xb7\x86\xca\xf8\x4d\xa1\x30\xaf\xba\x01\x21\x69\xec\
-\x29\x65\x7a\x12\x0f\xc1\x40\xa3\x7b\xf7\x3e\x16\x99\x72\x6f\x54\
-\xb9\x08\x35\xea\xc4\xe9\xaf\x8a\xbf\x51\x39\x3b\xf2\x6b\xa7\x7a\
-\x02\x4d\x03\xdd\xe8\x84\xe5\xc7\x07\x3e\x38\x1c\x13\x8f\x46\xf4\
-\xfc\x94\xd7\xbf\x73\x9d\xc3\xbd\x07\xd8\x30\xe1\xb5\x2b\x3b\x1c\
-\x1f\x1d\x33\x9a\x4c\xf1\xe3\x89\xfc\xb1\x9d\x46\x9e\xaf\xd3\x7d\
-\xda\xf7\xf9\x8a\x46\xf9\xbf\x46\x16\xc8\xa6\xf3\x8f\xfe\xdc\x01\
-\xd4\xe7\x2e\xa2\x50\xf4\x27\xc0\x8f\x68\x46\xf0\x73\x7a\xfd\xf1\
-\xaf\x53\x9a\xfc\x51\x3a\xda\x18\x03\xe3\xd1\x90\xdd\x9d\xcb\xec\
-\x6e\x05\x70\xc2\x40\xdb\x5b\xe8\xb1\xba\x7a\x8e\xf5\xb5\x15\x36\
-\xce\xaf\xb0\xb2\xb2\xc6\xf2\xf2\x32\x2b\x83\x45\xce\x9c\xe9\x61\
-\x6d\x87\x6e\xb7\xa1\xd3\x4d\x2d\xc4\x28\x65\x80\x2d\x5d\x07\x67\
-\x2b\xa7\x60\x2a\x55\xa0\x6a\xb5\xb7\x96\x0e\xb3\x66\x56\x32\x2c\
-\xcd\x00\x24\x66\xa2\x99\xc7\x99\x5a\x2c\x2c\x66\x75\xdd\xbc\x30\
-\xa5\x25\x41\x28\x36\x2c\xb5\xb8\x4e\x1c\x46\x63\x08\x4a\xd5\x6d\
-\xa3\x32\x1f\x77\x75\x9b\xb0\x15\x03\x9f\xb6\x9e\x0f\x8e\xc6\x8c\
-\x0e\x4e\xe8\x4d\x3d\xc3\xe1\x90\xd7\x2e\xef\x32\xba\x77\x44\x37\
-\x06\xde\xdc\xdc\xe5\xf6\xed\x7d\xac\x85\xa3\xd1\x18\x26\xad\xfc\
-\xe3\x1d\x57\x5e\xe7\x85\xde\xd3\xbe\x9f\x11\x19\xd9\xfd\x07\xe0\
-\x6f\x11\x01\xce\xe3\xf9\xc7\x7c\xee\x00\x9e\xe6\xbc\xa1\x97\x2f\
-\x03\x3f\x8a\x28\x17\xfd\xac\x5e\xef\x3c\x19\xf8\x98\x75\x08\x10\
-\x09\xc1\x33\x1a\x0e\x19\x1d\x1e\x70\xf3\x9a\x12\x08\xaa\xee\x5c\
-\xa7\xeb\x38\xb7\x36\xa0\xbf\x7c\x96\x95\xd5\x3e\x83\xc1\x22\x17\
-\xce\x0f\xe8\x2d\xf4\xe9\x2d\xf4\x58\x5e\xed\xb1\xba\xd6\xa3\xdf\
-\xef\xe2\x8c\x15\xa5\xda\xc6\xd2\xe9\x58\xba\x1d\xab\xf4\x7a\x41\
-\x97\x8f\x22\xce\x14\x30\xd0\xe9\x9f\x61\x4c\x41\xfe\x53\xe6\x50\
-\x3b\x00\xaa\xeb\x32\x40\x57\xad\xc6\x6a\x49\x11\x81\x56\xc3\x66\
-\xf0\x10\x5b\xd9\x98\x9b\xfa\xc0\xc9\xa4\x15\xc3\x1e\x7b\xc2\x89\
-\xa7\x99\xb4\xb4\x93\x29\x97\x77\xef\xf2\xde\xb5\x3d\xe2\x89\xa7\
-\xdb\x7a\x4e\x4e\xc6\x7c\x7b\xeb\x16\x7b\x77\x0e\x44\x30\x24\x78\
-\x46\xc3\xb1\x3c\x91\x31\x42\xb0\x99\xb6\xed\x6c\x03\x8b\xff\xed\
-\x8f\xe7\x31\xf0\x2a\x42\x19\xf7\x8f\x48\x2b\x78\x38\xff\x38\xcf\
-\x1d\xc0\xff\xf4\x4c\xab\x12\xe1\x4b\xc0\xe7\xd4\x11\xfc\x0c\xf0\
-\x63\x3c\x6a\xd2\xf0\x71\x25\x43\x72\x0a\x4d\x41\xd9\x42\x68\x39\
-\x19\x4d\xd9\x1d\xee\xa4\x6d\x14\x79\x7c\xb7\xa3\x9a\x83\xd2\x26\
-\x3c\x73\x66\x81\x4f\x5d\x18\xd0\xed\x2d\x60\xbb\x5d\x3a\xdd\x86\
-\xfe\x52\x87\xe5\xbe\xe3\xcc\x52\x8f\x97\x2e\x0e\xe8\x76\x1b\x56\
-\x96\x17\xb1\xc6\x30\xd5\x21\x98\xa5\xa5\x2e\x4d\xe3\x8a\xea\x70\
-\xaa\xfd\x6d\x62\x2b\x92\xdb\xbb\x56\x8c\x7c\x3c\x9e\x10\x42\xa4\
-\x63\x0d\xbe\x0d\x1c\x8d\xc6\x84\x10\x79\xfb\xda\x6d\x0e\x8e\x46\
-\x8c\xa7\x91\xc9\x24\x08\x51\xe8\x89\xc7\xb4\x2d\x27\x93\x09\x77\
-\x0f\x86\x7c\xfb\xea\x2d\xda\x56\xd0\x42\xab\xab\xbd\xa3\xf1\x04\
-\x4e\xa6\xe5\xff\x37\xda\x7b\x77\x55\xbd\xd1\xeb\xfe\x6f\xde\x9f\
-\x11\xf0\x3e\xc2\xc5\xf7\x75\x64\x68\x67\x9b\x5a\x43\x7e\x7e\xe6\
-\x0e\xe0\x63\x3a\xad\x46\x97\x57\x81\x3f\x50\xc0\xf0\xf3\xc8\xa4\
-\xe1\xe7\xd5\x39\xf4\x9f\xbe\x45\x52\x74\xf9\x4a\xb6\x50\x9c\x43\
-\x8c\x9e\x18\x5a\x82\x87\xfd\x7b\x63\xf6\xf7\xee\x97\xd1\xb7\xb4\
-\x19\x13\xa2\x18\x54\xaf\x83\x31\x86\xc6\x39\x25\x40\x15\x07\x90\
-\x68\xad\x4b\x46\xfc\x68\x54\x3c\xfd\xf6\xa0\x70\xbf\x8a\x01\xe3\
-\x83\x97\xd4\x7f\x74\x02\x6d\xa2\x39\xa6\x6a\x1b\x98\xa2\x69\x9e\
-\xe8\xb1\xeb\x5f\xe1\x2c\x2c\x2d\x7c\x9c\xef\xc1\x7d\x44\x3e\xee\
-\x5b\xc0\x2b\xea\x98\xaf\x29\x9a\x3f\x3f\x73\x07\xf0\x89\x9d\x88\
-\x0c\x8c\xfc\x95\x5e\x1a\xe0\x25\x84\xa3\xf0\xc7\x35\x3b\xf8\x2c\
-\xb0\xc6\x53\x28\x1b\x3d\xd1\x39\x64\x63\x72\x4f\xf8\x6b\x64\x18\
-\x66\xda\xb6\x33\x86\x1e\x7c\xfb\xf4\xff\x0d\x8f\xfa\x4b\xf5\x86\
-\x7e\xef\x93\x7e\x7d\x03\xf0\x40\xa3\xfb\xeb\xc0\xbb\x55\x59\x76\
-\x6f\x1e\xe1\xe7\x0e\xe0\x59\xcc\x0e\x36\xf5\xf2\xe7\x1a\x54\xd7\
-\x81\x1f\x46\x34\x0e\xbf\x0f\xf8\x41\x75\x0a\x03\x12\x85\xd9\xc7\
-\x75\x66\x9a\xf9\xe6\xc3\x06\xfc\xec\x1e\xaf\x75\xfb\x16\xc2\xae\
-\x73\x19\x41\xeb\xdf\x41\x84\x34\xf7\xf5\xb5\x9d\x9f\xb9\x03\x78\
-\xae\x4e\x40\xba\x0a\xff\xa2\x97\x74\xce\x68\xa6\xf0\xb2\x7e\x7d\
-\x09\x78\x11\xf8\x1e\xbd\xfe\x82\x3a\x87\xce\x29\x79\x1d\x3c\x42\
-\x97\x75\x0c\x5c\xd7\xfa\x7c\x4b\xaf\xef\x68\xfa\xbe\xa9\x86\x7e\
-\x32\xff\xd8\xcc\x1d\xc0\x69\x3f\x47\x1a\xdd\x1e\x45\x26\xb1\x08\
-\x2c\x57\x8e\xe1\x92\x66\x0b\xcb\x5a\x4a\xac\x56\x97\x15\xcd\x30\
-\x7a\xfa\x1e\x76\xa1\x62\xc7\xf8\xee\x39\xb5\x80\x00\xa3\xc9\xb0\
-\xef\x03\x1f\xa8\x01\x3f\x50\xa7\xb7\x07\xdc\x46\xc6\x69\xd3\xd7\
-\xbb\xc8\x4a\xed\xbc\x56\x9f\x3b\x80\xf9\x79\xcc\x19\xe9\x65\x0f\
-\x01\xb9\xea\xd3\xd5\xec\xa1\x0f\x2c\xe9\xd7\x33\x48\x17\x62\xa0\
-\x97\x0e\xb2\xf1\x68\xf4\xfa\x39\x4a\x67\xcf\xe8\xf7\x9d\x8f\x70\
-\x4e\x0f\x28\x98\x60\x04\xee\xa8\xb1\x7f\xa0\x51\x7c\xa4\xd7\x0f\
-\xf4\xb1\x47\x48\x9b\x6d\xa8\xf7\x1f\xe8\xe3\xe7\xe7\x39\x39\xff\
-\x35\x00\x3b\x5a\xbc\x82\x3b\x3c\x64\xc8\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x8c\x04\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0a\x4f\x69\x43\x43\x50\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x49\x43\x43\x20\x70\x72\x6f\x66\x69\
-\x6c\x65\x00\x00\x78\xda\x9d\x53\x67\x54\x53\xe9\x16\x3d\xf7\xde\
-\xf4\x42\x4b\x88\x80\x94\x4b\x6f\x52\x15\x08\x20\x52\x42\x8b\x80\
-\x14\x91\x26\x2a\x21\x09\x10\x4a\x88\x21\xa1\xd9\x15\x51\xc1\x11\
-\x45\x45\x04\x1b\xc8\xa0\x88\x03\x8e\x8e\x80\x8c\x15\x51\x2c\x0c\
-\x8a\x0a\xd8\x07\xe4\x21\xa2\x8e\x83\xa3\x88\x8a\xca\xfb\xe1\x7b\
-\xa3\x6b\xd6\xbc\xf7\xe6\xcd\xfe\xb5\xd7\x3e\xe7\xac\xf3\x9d\xb3\
-\xcf\x07\xc0\x08\x0c\x96\x48\x33\x51\x35\x80\x0c\xa9\x42\x1e\x11\
-\xe0\x83\xc7\xc4\xc6\xe1\xe4\x2e\x40\x81\x0a\x24\x70\x00\x10\x08\
-\xb3\x64\x21\x73\xfd\x23\x01\x00\xf8\x7e\x3c\x3c\x2b\x22\xc0\x07\
-\xbe\x00\x01\x78\xd3\x0b\x08\x00\xc0\x4d\x9b\xc0\x30\x1c\x87\xff\
-\x0f\xea\x42\x99\x5c\x01\x80\x84\x01\xc0\x74\x91\x38\x4b\x08\x80\
-\x14\x00\x40\x7a\x8e\x42\xa6\x00\x40\x46\x01\x80\x9d\x98\x26\x53\
-\x00\xa0\x04\x00\x60\xcb\x63\x62\xe3\x00\x50\x2d\x00\x60\x27\x7f\
-\xe6\xd3\x00\x80\x9d\xf8\x99\x7b\x01\x00\x5b\x94\x21\x15\x01\xa0\
-\x91\x00\x20\x13\x65\x88\x44\x00\x68\x3b\x00\xac\xcf\x56\x8a\x45\
-\x00\x58\x30\x00\x14\x66\x4b\xc4\x39\x00\xd8\x2d\x00\x30\x49\x57\
-\x66\x48\x00\xb0\xb7\x00\xc0\xce\x10\x0b\xb2\x00\x08\x0c\x00\x30\
-\x51\x88\x85\x29\x00\x04\x7b\x00\x60\xc8\x23\x23\x78\x00\x84\x99\
-\x00\x14\x46\xf2\x57\x3c\xf1\x2b\xae\x10\xe7\x2a\x00\x00\x78\x99\
-\xb2\x3c\xb9\x24\x39\x45\x81\x5b\x08\x2d\x71\x07\x57\x57\x2e\x1e\
-\x28\xce\x49\x17\x2b\x14\x36\x61\x02\x61\x9a\x40\x2e\xc2\x79\x99\
-\x19\x32\x81\x34\x0f\xe0\xf3\xcc\x00\x00\xa0\x91\x15\x11\xe0\x83\
-\xf3\xfd\x78\xce\x0e\xae\xce\xce\x36\x8e\xb6\x0e\x5f\x2d\xea\xbf\
-\x06\xff\x22\x62\x62\xe3\xfe\xe5\xcf\xab\x70\x40\x00\x00\xe1\x74\
-\x7e\xd1\xfe\x2c\x2f\xb3\x1a\x80\x3b\x06\x80\x6d\xfe\xa2\x25\xee\
-\x04\x68\x5e\x0b\xa0\x75\xf7\x8b\x66\xb2\x0f\x40\xb5\x00\xa0\xe9\
-\xda\x57\xf3\x70\xf8\x7e\x3c\x3c\x45\xa1\x90\xb9\xd9\xd9\xe5\xe4\
-\xe4\xd8\x4a\xc4\x42\x5b\x61\xca\x57\x7d\xfe\x67\xc2\x5f\xc0\x57\
-\xfd\x6c\xf9\x7e\x3c\xfc\xf7\xf5\xe0\xbe\xe2\x24\x81\x32\x5d\x81\
-\x47\x04\xf8\xe0\xc2\xcc\xf4\x4c\xa5\x1c\xcf\x92\x09\x84\x62\xdc\
-\xe6\x8f\x47\xfc\xb7\x0b\xff\xfc\x1d\xd3\x22\xc4\x49\x62\xb9\x58\
-\x2a\x14\xe3\x51\x12\x71\x8e\x44\x9a\x8c\xf3\x32\xa5\x22\x89\x42\
-\x92\x29\xc5\x25\xd2\xff\x64\xe2\xdf\x2c\xfb\x03\x3e\xdf\x35\x00\
-\xb0\x6a\x3e\x01\x7b\x91\x2d\xa8\x5d\x63\x03\xf6\x4b\x27\x10\x58\
-\x74\xc0\xe2\xf7\x00\x00\xf2\xbb\x6f\xc1\xd4\x28\x08\x03\x80\x68\
-\x83\xe1\xcf\x77\xff\xef\x3f\xfd\x47\xa0\x25\x00\x80\x66\x49\x92\
-\x71\x00\x00\x5e\x44\x24\x2e\x54\xca\xb3\x3f\xc7\x08\x00\x00\x44\
-\xa0\x81\x2a\xb0\x41\x1b\xf4\xc1\x18\x2c\xc0\x06\x1c\xc1\x05\xdc\
-\xc1\x0b\xfc\x60\x36\x84\x42\x24\xc4\xc2\x42\x10\x42\x0a\x64\x80\
-\x1c\x72\x60\x29\xac\x82\x42\x28\x86\xcd\xb0\x1d\x2a\x60\x2f\xd4\
-\x40\x1d\x34\xc0\x51\x68\x86\x93\x70\x0e\x2e\xc2\x55\xb8\x0e\x3d\
-\x70\x0f\xfa\x61\x08\x9e\xc1\x28\xbc\x81\x09\x04\x41\xc8\x08\x13\
-\x61\x21\xda\x88\x01\x62\x8a\x58\x23\x8e\x08\x17\x99\x85\xf8\x21\
-\xc1\x48\x04\x12\x8b\x24\x20\xc9\x88\x14\x51\x22\x4b\x91\x35\x48\
-\x31\x52\x8a\x54\x20\x55\x48\x1d\xf2\x3d\x72\x02\x39\x87\x5c\x46\
-\xba\x91\x3b\xc8\x00\x32\x82\xfc\x86\xbc\x47\x31\x94\x81\xb2\x51\
-\x3d\xd4\x0c\xb5\x43\xb9\xa8\x37\x1a\x84\x46\xa2\x0b\xd0\x64\x74\
-\x31\x9a\x8f\x16\xa0\x9b\xd0\x72\xb4\x1a\x3d\x8c\x36\xa1\xe7\xd0\
-\xab\x68\x0f\xda\x8f\x3e\x43\xc7\x30\xc0\xe8\x18\x07\x33\xc4\x6c\
-\x30\x2e\xc6\xc3\x42\xb1\x38\x2c\x09\x93\x63\xcb\xb1\x22\xac\x0c\
-\xab\xc6\x1a\xb0\x56\xac\x03\xbb\x89\xf5\x63\xcf\xb1\x77\x04\x12\
-\x81\x45\xc0\x09\x36\x04\x77\x42\x20\x61\x1e\x41\x48\x58\x4c\x58\
-\x4e\xd8\x48\xa8\x20\x1c\x24\x34\x11\xda\x09\x37\x09\x03\x84\x51\
-\xc2\x27\x22\x93\xa8\x4b\xb4\x26\xba\x11\xf9\xc4\x18\x62\x32\x31\
-\x87\x58\x48\x2c\x23\xd6\x12\x8f\x13\x2f\x10\x7b\x88\x43\xc4\x37\
-\x24\x12\x89\x43\x32\x27\xb9\x90\x02\x49\xb1\xa4\x54\xd2\x12\xd2\
-\x46\xd2\x6e\x52\x23\xe9\x2c\xa9\x9b\x34\x48\x1a\x23\x93\xc9\xda\
-\x64\x6b\xb2\x07\x39\x94\x2c\x20\x2b\xc8\x85\xe4\x9d\xe4\xc3\xe4\
-\x33\xe4\x1b\xe4\x21\xf2\x5b\x0a\x9d\x62\x40\x71\xa4\xf8\x53\xe2\
-\x28\x52\xca\x6a\x4a\x19\xe5\x10\xe5\x34\xe5\x06\x65\x98\x32\x41\
-\x55\xa3\x9a\x52\xdd\xa8\xa1\x54\x11\x35\x8f\x5a\x42\xad\xa1\xb6\
-\x52\xaf\x51\x87\xa8\x13\x34\x75\x9a\x39\xcd\x83\x16\x49\x4b\xa5\
-\xad\xa2\x95\xd3\x1a\x68\x17\x68\xf7\x69\xaf\xe8\x74\xba\x11\xdd\
-\x95\x1e\x4e\x97\xd0\x57\xd2\xcb\xe9\x47\xe8\x97\xe8\x03\xf4\x77\
-\x0c\x0d\x86\x15\x83\xc7\x88\x67\x28\x19\x9b\x18\x07\x18\x67\x19\
-\x77\x18\xaf\x98\x4c\xa6\x19\xd3\x8b\x19\xc7\x54\x30\x37\x31\xeb\
-\x98\xe7\x99\x0f\x99\x6f\x55\x58\x2a\xb6\x2a\x7c\x15\x91\xca\x0a\
-\x95\x4a\x95\x26\x95\x1b\x2a\x2f\x54\xa9\xaa\xa6\xaa\xde\xaa\x0b\
-\x55\xf3\x55\xcb\x54\x8f\xa9\x5e\x53\x7d\xae\x46\x55\x33\x53\xe3\
-\xa9\x09\xd4\x96\xab\x55\xaa\x9d\x50\xeb\x53\x1b\x53\x67\xa9\x3b\
-\xa8\x87\xaa\x67\xa8\x6f\x54\x3f\xa4\x7e\x59\xfd\x89\x06\x59\xc3\
-\x4c\xc3\x4f\x43\xa4\x51\xa0\xb1\x5f\xe3\xbc\xc6\x20\x0b\x63\x19\
-\xb3\x78\x2c\x21\x6b\x0d\xab\x86\x75\x81\x35\xc4\x26\xb1\xcd\xd9\
-\x7c\x76\x2a\xbb\x98\xfd\x1d\xbb\x8b\x3d\xaa\xa9\xa1\x39\x43\x33\
-\x4a\x33\x57\xb3\x52\xf3\x94\x66\x3f\x07\xe3\x98\x71\xf8\x9c\x74\
-\x4e\x09\xe7\x28\xa7\x97\xf3\x7e\x8a\xde\x14\xef\x29\xe2\x29\x1b\
-\xa6\x34\x4c\xb9\x31\x65\x5c\x6b\xaa\x96\x97\x96\x58\xab\x48\xab\
-\x51\xab\x47\xeb\xbd\x36\xae\xed\xa7\x9d\xa6\xbd\x45\xbb\x59\xfb\
-\x81\x0e\x41\xc7\x4a\x27\x5c\x27\x47\x67\x8f\xce\x05\x9d\xe7\x53\
-\xd9\x53\xdd\xa7\x0a\xa7\x16\x4d\x3d\x3a\xf5\xae\x2e\xaa\x6b\xa5\
-\x1b\xa1\xbb\x44\x77\xbf\x6e\xa7\xee\x98\x9e\xbe\x5e\x80\x9e\x4c\
-\x6f\xa7\xde\x79\xbd\xe7\xfa\x1c\x7d\x2f\xfd\x54\xfd\x6d\xfa\xa7\
-\xf5\x47\x0c\x58\x06\xb3\x0c\x24\x06\xdb\x0c\xce\x18\x3c\xc5\x35\
-\x71\x6f\x3c\x1d\x2f\xc7\xdb\xf1\x51\x43\x5d\xc3\x40\x43\xa5\x61\
-\x95\x61\x97\xe1\x84\x91\xb9\xd1\x3c\xa3\xd5\x46\x8d\x46\x0f\x8c\
-\x69\xc6\x5c\xe3\x24\xe3\x6d\xc6\x6d\xc6\xa3\x26\x06\x26\x21\x26\
-\x4b\x4d\xea\x4d\xee\x9a\x52\x4d\xb9\xa6\x29\xa6\x3b\x4c\x3b\x4c\
-\xc7\xcd\xcc\xcd\xa2\xcd\xd6\x99\x35\x9b\x3d\x31\xd7\x32\xe7\x9b\
-\xe7\x9b\xd7\x9b\xdf\xb7\x60\x5a\x78\x5a\x2c\xb6\xa8\xb6\xb8\x65\
-\x49\xb2\xe4\x5a\xa6\x59\xee\xb6\xbc\x6e\x85\x5a\x39\x59\xa5\x58\
-\x55\x5a\x5d\xb3\x46\xad\x9d\xad\x25\xd6\xbb\xad\xbb\xa7\x11\xa7\
-\xb9\x4e\x93\x4e\xab\x9e\xd6\x67\xc3\xb0\xf1\xb6\xc9\xb6\xa9\xb7\
-\x19\xb0\xe5\xd8\x06\xdb\xae\xb6\x6d\xb6\x7d\x61\x67\x62\x17\x67\
-\xb7\xc5\xae\xc3\xee\x93\xbd\x93\x7d\xba\x7d\x8d\xfd\x3d\x07\x0d\
-\x87\xd9\x0e\xab\x1d\x5a\x1d\x7e\x73\xb4\x72\x14\x3a\x56\x3a\xde\
-\x9a\xce\x9c\xee\x3f\x7d\xc5\xf4\x96\xe9\x2f\x67\x58\xcf\x10\xcf\
-\xd8\x33\xe3\xb6\x13\xcb\x29\xc4\x69\x9d\x53\x9b\xd3\x47\x67\x17\
-\x67\xb9\x73\x83\xf3\x88\x8b\x89\x4b\x82\xcb\x2e\x97\x3e\x2e\x9b\
-\x1b\xc6\xdd\xc8\xbd\xe4\x4a\x74\xf5\x71\x5d\xe1\x7a\xd2\xf5\x9d\
-\x9b\xb3\x9b\xc2\xed\xa8\xdb\xaf\xee\x36\xee\x69\xee\x87\xdc\x9f\
-\xcc\x34\x9f\x29\x9e\x59\x33\x73\xd0\xc3\xc8\x43\xe0\x51\xe5\xd1\
-\x3f\x0b\x9f\x95\x30\x6b\xdf\xac\x7e\x4f\x43\x4f\x81\x67\xb5\xe7\
-\x23\x2f\x63\x2f\x91\x57\xad\xd7\xb0\xb7\xa5\x77\xaa\xf7\x61\xef\
-\x17\x3e\xf6\x3e\x72\x9f\xe3\x3e\xe3\x3c\x37\xde\x32\xde\x59\x5f\
-\xcc\x37\xc0\xb7\xc8\xb7\xcb\x4f\xc3\x6f\x9e\x5f\x85\xdf\x43\x7f\
-\x23\xff\x64\xff\x7a\xff\xd1\x00\xa7\x80\x25\x01\x67\x03\x89\x81\
-\x41\x81\x5b\x02\xfb\xf8\x7a\x7c\x21\xbf\x8e\x3f\x3a\xdb\x65\xf6\
-\xb2\xd9\xed\x41\x8c\xa0\xb9\x41\x15\x41\x8f\x82\xad\x82\xe5\xc1\
-\xad\x21\x68\xc8\xec\x90\xad\x21\xf7\xe7\x98\xce\x91\xce\x69\x0e\
-\x85\x50\x7e\xe8\xd6\xd0\x07\x61\xe6\x61\x8b\xc3\x7e\x0c\x27\x85\
-\x87\x85\x57\x86\x3f\x8e\x70\x88\x58\x1a\xd1\x31\x97\x35\x77\xd1\
-\xdc\x43\x73\xdf\x44\xfa\x44\x96\x44\xde\x9b\x67\x31\x4f\x39\xaf\
-\x2d\x4a\x35\x2a\x3e\xaa\x2e\x6a\x3c\xda\x37\xba\x34\xba\x3f\xc6\
-\x2e\x66\x59\xcc\xd5\x58\x9d\x58\x49\x6c\x4b\x1c\x39\x2e\x2a\xae\
-\x36\x6e\x6c\xbe\xdf\xfc\xed\xf3\x87\xe2\x9d\xe2\x0b\xe3\x7b\x17\
-\x98\x2f\xc8\x5d\x70\x79\xa1\xce\xc2\xf4\x85\xa7\x16\xa9\x2e\x12\
-\x2c\x3a\x96\x40\x4c\x88\x4e\x38\x94\xf0\x41\x10\x2a\xa8\x16\x8c\
-\x25\xf2\x13\x77\x25\x8e\x0a\x79\xc2\x1d\xc2\x67\x22\x2f\xd1\x36\
-\xd1\x88\xd8\x43\x5c\x2a\x1e\x4e\xf2\x48\x2a\x4d\x7a\x92\xec\x91\
-\xbc\x35\x79\x24\xc5\x33\xa5\x2c\xe5\xb9\x84\x27\xa9\x90\xbc\x4c\
-\x0d\x4c\xdd\x9b\x3a\x9e\x16\x9a\x76\x20\x6d\x32\x3d\x3a\xbd\x31\
-\x83\x92\x91\x90\x71\x42\xaa\x21\x4d\x93\xb6\x67\xea\x67\xe6\x66\
-\x76\xcb\xac\x65\x85\xb2\xfe\xc5\x6e\x8b\xb7\x2f\x1e\x95\x07\xc9\
-\x6b\xb3\x90\xac\x05\x59\x2d\x0a\xb6\x42\xa6\xe8\x54\x5a\x28\xd7\
-\x2a\x07\xb2\x67\x65\x57\x66\xbf\xcd\x89\xca\x39\x96\xab\x9e\x2b\
-\xcd\xed\xcc\xb3\xca\xdb\x90\x37\x9c\xef\x9f\xff\xed\x12\xc2\x12\
-\xe1\x92\xb6\xa5\x86\x4b\x57\x2d\x1d\x58\xe6\xbd\xac\x6a\x39\xb2\
-\x3c\x71\x79\xdb\x0a\xe3\x15\x05\x2b\x86\x56\x06\xac\x3c\xb8\x8a\
-\xb6\x2a\x6d\xd5\x4f\xab\xed\x57\x97\xae\x7e\xbd\x26\x7a\x4d\x6b\
-\x81\x5e\xc1\xca\x82\xc1\xb5\x01\x6b\xeb\x0b\x55\x0a\xe5\x85\x7d\
-\xeb\xdc\xd7\xed\x5d\x4f\x58\x2f\x59\xdf\xb5\x61\xfa\x86\x9d\x1b\
-\x3e\x15\x89\x8a\xae\x14\xdb\x17\x97\x15\x7f\xd8\x28\xdc\x78\xe5\
-\x1b\x87\x6f\xca\xbf\x99\xdc\x94\xb4\xa9\xab\xc4\xb9\x64\xcf\x66\
-\xd2\x66\xe9\xe6\xde\x2d\x9e\x5b\x0e\x96\xaa\x97\xe6\x97\x0e\x6e\
-\x0d\xd9\xda\xb4\x0d\xdf\x56\xb4\xed\xf5\xf6\x45\xdb\x2f\x97\xcd\
-\x28\xdb\xbb\x83\xb6\x43\xb9\xa3\xbf\x3c\xb8\xbc\x65\xa7\xc9\xce\
-\xcd\x3b\x3f\x54\xa4\x54\xf4\x54\xfa\x54\x36\xee\xd2\xdd\xb5\x61\
-\xd7\xf8\x6e\xd1\xee\x1b\x7b\xbc\xf6\x34\xec\xd5\xdb\x5b\xbc\xf7\
-\xfd\x3e\xc9\xbe\xdb\x55\x01\x55\x4d\xd5\x66\xd5\x65\xfb\x49\xfb\
-\xb3\xf7\x3f\xae\x89\xaa\xe9\xf8\x96\xfb\x6d\x5d\xad\x4e\x6d\x71\
-\xed\xc7\x03\xd2\x03\xfd\x07\x23\x0e\xb6\xd7\xb9\xd4\xd5\x1d\xd2\
-\x3d\x54\x52\x8f\xd6\x2b\xeb\x47\x0e\xc7\x1f\xbe\xfe\x9d\xef\x77\
-\x2d\x0d\x36\x0d\x55\x8d\x9c\xc6\xe2\x23\x70\x44\x79\xe4\xe9\xf7\
-\x09\xdf\xf7\x1e\x0d\x3a\xda\x76\x8c\x7b\xac\xe1\x07\xd3\x1f\x76\
-\x1d\x67\x1d\x2f\x6a\x42\x9a\xf2\x9a\x46\x9b\x53\x9a\xfb\x5b\x62\
-\x5b\xba\x4f\xcc\x3e\xd1\xd6\xea\xde\x7a\xfc\x47\xdb\x1f\x0f\x9c\
-\x34\x3c\x59\x79\x4a\xf3\x54\xc9\x69\xda\xe9\x82\xd3\x93\x67\xf2\
-\xcf\x8c\x9d\x95\x9d\x7d\x7e\x2e\xf9\xdc\x60\xdb\xa2\xb6\x7b\xe7\
-\x63\xce\xdf\x6a\x0f\x6f\xef\xba\x10\x74\xe1\xd2\x45\xff\x8b\xe7\
-\x3b\xbc\x3b\xce\x5c\xf2\xb8\x74\xf2\xb2\xdb\xe5\x13\x57\xb8\x57\
-\x9a\xaf\x3a\x5f\x6d\xea\x74\xea\x3c\xfe\x93\xd3\x4f\xc7\xbb\x9c\
-\xbb\x9a\xae\xb9\x5c\x6b\xb9\xee\x7a\xbd\xb5\x7b\x66\xf7\xe9\x1b\
-\x9e\x37\xce\xdd\xf4\xbd\x79\xf1\x16\xff\xd6\xd5\x9e\x39\x3d\xdd\
-\xbd\xf3\x7a\x6f\xf7\xc5\xf7\xf5\xdf\x16\xdd\x7e\x72\x27\xfd\xce\
-\xcb\xbb\xd9\x77\x27\xee\xad\xbc\x4f\xbc\x5f\xf4\x40\xed\x41\xd9\
-\x43\xdd\x87\xd5\x3f\x5b\xfe\xdc\xd8\xef\xdc\x7f\x6a\xc0\x77\xa0\
-\xf3\xd1\xdc\x47\xf7\x06\x85\x83\xcf\xfe\x91\xf5\x8f\x0f\x43\x05\
-\x8f\x99\x8f\xcb\x86\x0d\x86\xeb\x9e\x38\x3e\x39\x39\xe2\x3f\x72\
-\xfd\xe9\xfc\xa7\x43\xcf\x64\xcf\x26\x9e\x17\xfe\xa2\xfe\xcb\xae\
-\x17\x16\x2f\x7e\xf8\xd5\xeb\xd7\xce\xd1\x98\xd1\xa1\x97\xf2\x97\
-\x93\xbf\x6d\x7c\xa5\xfd\xea\xc0\xeb\x19\xaf\xdb\xc6\xc2\xc6\x1e\
-\xbe\xc9\x78\x33\x31\x5e\xf4\x56\xfb\xed\xc1\x77\xdc\x77\x1d\xef\
-\xa3\xdf\x0f\x4f\xe4\x7c\x20\x7f\x28\xff\x68\xf9\xb1\xf5\x53\xd0\
-\xa7\xfb\x93\x19\x93\x93\xff\x04\x03\x98\xf3\xfc\x63\x33\x2d\xdb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8e\x7c\xfb\x51\x93\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\
-\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\x81\x1f\
-\x49\x44\x41\x54\x78\xda\xec\xfd\x79\xbc\x75\xd9\x55\xd7\x0b\x7f\
-\xc7\x5c\x7b\x9f\xe6\xe9\x9f\x7a\xaa\x6f\xd3\x54\x42\xa5\xab\x90\
-\x04\x93\x10\x22\x20\x84\x90\x20\x7d\x23\x01\x2e\x8d\x80\x78\xed\
-\x5f\x45\xf1\xbe\x88\x46\x14\xbd\xd7\x57\xe5\x8a\xbd\x78\xd1\x8b\
-\x5e\x41\xd4\xab\x82\xa8\x17\x14\x5e\x91\x4e\x20\x09\x24\x81\xf4\
-\x55\x49\x55\xaa\x49\x55\xaa\x7b\xfa\x73\xf6\x5e\x6b\x8e\xfb\xc7\
-\x9c\x73\xad\xb1\xe6\x9a\x6b\xed\x7d\x9e\xaa\xa7\xaa\x9e\xaa\x3d\
-\x3f\x9f\xfd\x39\xe7\xec\xb3\xcf\x3e\xfb\xec\xb3\xc6\x6f\xfc\xc6\
-\x6f\x74\xa2\xaa\x5c\xb6\xf3\xfd\xc2\xe6\x3c\xad\x67\x1b\xb8\x11\
-\xb8\x0a\x38\x09\xdc\x04\xdc\x1c\xbf\xf6\xc0\xe1\x78\x7f\x0d\x3c\
-\x1c\x7f\xe6\x22\xf0\x28\xf0\x10\xf0\x00\xf0\x04\xf0\x78\xfc\x7a\
-\x6f\xf3\x96\x3e\x4b\xce\x3b\x2f\x8f\x9d\xce\x36\xef\xec\x15\x7d\
-\xb6\xa2\xc1\xbf\x0c\x78\x05\x70\x07\xf0\x92\x68\xf4\xa7\x80\x9d\
-\x08\x0a\xab\x8e\x07\xf6\xe3\xed\xe1\x08\x04\x77\x03\x1f\x06\x3e\
-\x12\x3f\xde\x03\x5c\xd8\xbc\xe5\xcf\xad\xb3\x01\x80\x2b\xef\xdc\
-\x0c\x7c\x0e\xf0\x26\xe0\x73\xa3\xc1\x1f\x7e\x92\xcf\xe9\x80\xdd\
-\x78\x3b\x01\xbc\x14\xf8\x7c\xf3\xfd\xbd\x08\x0a\xef\x8e\xb7\x5f\
-\x01\x7e\x13\x38\xb7\xf9\x77\x6c\x00\x60\x73\x2e\xff\xb9\x05\xf8\
-\xbd\xc0\x57\x46\xc3\x3f\xfa\x34\xff\xfe\x1d\xe0\x45\xf1\xf6\x75\
-\x91\x31\xdc\x0b\xfc\x3c\xf0\xdf\xe3\xc7\x4f\x6e\xfe\x4d\x1b\x00\
-\xd8\x9c\xa7\xee\x1c\x06\xbe\x0c\xf8\x2a\xe0\xad\xd1\x33\x5f\xfa\
-\x59\x15\x42\x1e\x4c\xae\x71\xc0\x0b\x80\x6f\x8f\xb7\xd3\x11\x04\
-\x7e\x12\xf8\x7f\xa2\x7e\xb0\x39\x1b\x00\xd8\x9c\x4b\x38\x37\x02\
-\xdf\x0a\x7c\x4b\x8c\xe9\x0f\x6e\xe4\x1a\x6f\xde\x98\xab\x8b\x46\
-\x2e\x23\x3f\x97\x1e\xef\xcd\xe3\xdc\xda\xe0\x70\x3c\x02\xd5\x57\
-\x01\x8f\x00\x3f\x0d\xfc\x73\xe0\x17\x80\x66\xf3\x2f\xdd\x00\xc0\
-\xe6\xac\x17\xdb\xff\x61\xe0\xdb\x80\x1b\x0e\x64\xf0\x4d\xfc\x7c\
-\x0e\x54\xf1\xe3\x11\xe0\x50\x8c\xea\xb7\x09\x72\xe1\x3c\x1a\xb5\
-\x66\x3f\x5f\x03\x0b\x60\x49\xc8\x09\xec\x11\xe4\xbe\x8b\xf1\x7b\
-\x4d\xbc\x4d\x81\x48\x77\xae\x8e\x7f\xc3\xb7\x01\xbf\x0a\xfc\x9f\
-\xc0\x4f\x44\x96\xb0\x39\x1b\x00\xd8\x9c\xec\xec\x02\xdf\x05\x7c\
-\x77\x8c\xf5\x57\x1b\x7d\xf2\xd4\xb3\x68\xd8\x27\x08\x89\xbe\xab\
-\xa2\xd1\x6f\x45\x20\x48\x9e\xdf\x17\xbc\xbc\x05\x00\x29\x30\x88\
-\x26\x1a\x7f\x02\x83\x27\x80\x33\x04\xd9\xaf\x36\x80\xe0\x26\x5f\
-\xed\x67\xc7\xdb\x9f\x06\x7e\x04\xf8\x51\xe0\x53\x9b\x7f\xf9\xb3\
-\xe7\xc8\xa6\x0e\xe0\x19\x3d\x5f\x0b\x7c\x2f\xf0\x9a\x95\x8f\xf4\
-\xd1\xe8\x66\x91\x70\x5f\x17\x0d\xfe\x44\xf4\xf0\x95\x31\xee\x44\
-\xe3\xdd\x0e\xcc\x6f\x80\xf9\x8d\x30\xbb\x06\xaa\x93\xe0\x8e\x81\
-\xdb\x05\x99\x83\x7a\xf0\xfb\xe0\xcf\x43\xfd\x04\x2c\x1e\x85\xe5\
-\x43\xb0\xff\x49\xa8\x4f\x43\xd3\x04\x30\x48\x5e\xbf\x26\x24\x0a\
-\xcf\x10\x2a\x05\x1e\x8f\xe0\xa0\x86\x1d\x4c\x9f\x4f\x02\x7f\x17\
-\xf8\xe1\x08\x29\x9b\xb3\xee\xd9\xd4\x01\x3c\xa7\xce\xcb\x81\xff\
-\x8d\x20\xf2\x4d\x7b\xfb\x26\x1a\xd6\x61\xe0\x7a\xba\x32\x9f\xad\
-\xf8\xfd\xda\x78\xf8\xed\x17\xc2\xee\x67\xc2\xa1\xcf\x82\x9d\x57\
-\x86\xaf\xb7\x6e\x8e\x06\xbf\xb5\xd2\x5d\xa3\x4b\xd0\x05\x2c\x1f\
-\x83\xbd\x8f\xc3\xde\x5d\x70\xf6\xd7\xe1\xec\xfb\xe0\xc2\xfb\xc0\
-\x9f\x0b\x57\xcc\x35\xf1\xb6\x1f\x41\xe0\xd1\x68\xce\xfb\x99\x76\
-\x30\x3c\xb7\x00\x7f\x0d\xf8\xfd\xf1\xef\xff\xd1\xcd\xa5\xb0\x61\
-\x00\xcf\xb7\xf3\xc7\x80\x77\x12\x0a\x75\xa6\x0d\xbf\x8a\x86\x76\
-\x1b\x70\x6d\x0c\x16\xd2\xf7\x3c\xe0\x04\x76\x5f\x0b\xc7\xbe\x10\
-\x8e\x7c\x21\xec\xde\x09\xb3\xab\x41\x66\x1d\x6d\xd0\x3a\xfc\x90\
-\xe6\x81\xff\xe0\x52\x00\x31\xea\x9f\x18\xdf\xe0\x2f\xc0\xc5\xbb\
-\xe0\xf4\xaf\xc1\xa3\xff\x19\x1e\xff\x45\xb8\xf8\xe9\xce\x85\x68\
-\xd4\x0b\x1e\x23\x94\x11\xa5\xea\x00\xb7\xf2\xbd\xf8\x19\xe0\xcf\
-\x03\xbf\xb1\xb9\x2c\x9e\x19\x06\xb0\x01\x80\xa7\xef\xdc\x06\xfc\
-\x20\xf0\xd5\x2b\x0d\x7f\x16\x3d\xfd\x0b\x09\x92\x5a\x65\x8c\x5e\
-\x81\xad\x1b\xe0\xc4\x97\xc1\x89\xaf\x81\x43\xaf\x87\xea\x44\x34\
-\xf2\x05\x68\x63\x02\xfe\x4b\x38\x5a\x02\x06\x17\x42\x06\x99\x05\
-\x40\xb9\x78\x37\x3c\xfa\x33\xf0\xe0\xbf\x86\xc7\x7e\x31\xbc\xae\
-\xa4\x39\x2c\x23\x2b\xf8\x54\x0c\x15\x56\x03\xc1\x05\xe0\x7f\x8d\
-\x8c\xa0\xde\x5c\x26\x1b\x00\x78\x2e\x9e\xb7\x02\x7f\x1f\x78\xf1\
-\xe8\x23\x12\xd5\xbf\x81\x50\x87\x77\xb5\x89\xfd\x93\x68\xb7\xf3\
-\x52\x38\xf5\x2d\x70\xe2\xeb\x60\xeb\xc5\xd1\xe8\xf7\x8d\xd1\x5f\
-\xc6\xf7\x5b\xb5\x63\x09\x32\x0f\x21\x45\x73\x0e\x1e\xff\xef\x70\
-\xdf\x8f\xc0\x43\xff\x09\x96\x8b\x4e\x18\x6c\x62\x58\xf0\x60\x64\
-\x04\xab\xb3\x07\xff\x0d\xf8\xe3\xc0\xfb\x37\x97\xcb\x06\x00\x9e\
-\x4b\xe7\xbb\xa3\x87\x9b\x17\xbf\x9b\x0c\xfc\x2a\x42\xd6\xff\x46\
-\x63\x40\xc9\x91\x6f\xdf\x02\x57\xff\x41\x38\xf9\x8d\x30\xbf\x39\
-\x7a\xfa\x05\x43\x19\x7f\x85\x67\x97\x29\x4f\x7f\x90\x9f\xd5\x8e\
-\x19\xb8\x1d\xf0\x4b\x78\xfc\x97\xe1\x13\x7f\x17\x1e\xfc\xe9\x2e\
-\x7c\xa9\x22\x23\x78\x24\x86\x06\x7b\xf1\xbe\xf1\xf3\x69\xe0\xff\
-\x03\xfc\xd8\xe6\xb2\x79\x7a\x00\x60\x23\x02\x5e\xbe\xb3\x03\xfc\
-\x10\x21\xc5\x57\x3e\x35\x41\xcc\x7b\x49\xbc\x6d\xd3\xa5\xd8\x3c\
-\x50\xed\xc0\x55\xdf\x0a\xd7\xfc\xb1\xe0\xf1\x75\x1f\x9a\xd3\x97\
-\xee\xed\xf5\x49\x3c\x46\x0b\x60\xe0\x6b\xf0\x8b\x80\x58\x57\xfd\
-\x6e\x38\xf1\x06\xb8\xe1\xa7\xe1\xa3\x7f\x1d\x1e\x7b\x5f\xc7\x6a\
-\xae\x05\x8e\xc5\xb0\xe0\xb1\x49\xcc\xba\x06\xf8\x17\xc0\xab\x80\
-\xef\x63\x53\x44\x74\xd9\xcf\x86\x01\x5c\x9e\x73\x92\x50\x00\xf3\
-\xe5\xa3\xc6\x54\x13\x52\x79\x77\x12\xe4\xc0\xc6\x18\x99\x07\x0e\
-\xbf\x1a\xae\x7f\x27\x1c\xfd\xc2\x40\xf1\x5b\x8f\x2f\x97\x66\xec\
-\x72\x09\xb2\x80\xae\xc1\x08\xd4\x3c\x50\x2a\xa8\x0e\xc1\xde\x83\
-\x70\xd7\xdf\x81\xbb\x7f\x18\x96\x7b\xfd\x14\xe1\xe9\x18\x16\xec\
-\xaf\xd4\x06\xfe\x2d\xf0\x1d\x6c\xd2\x85\x1b\x06\x70\x85\x9d\x9b\
-\x81\x1f\x07\xde\x3c\x1a\xeb\x57\x84\x44\xe0\x1d\x31\x30\xa8\x33\
-\xc3\xba\xe6\xdb\xe1\x9a\xef\x81\xf9\xf5\xd0\x9c\xa7\x4b\xec\x3f\
-\x99\x18\x7e\xc4\x88\xf5\x49\xfc\x7c\x7e\xbf\x7a\xf0\x4f\xc0\xec\
-\x38\xdc\xf1\x17\xe1\xe4\x1b\xe1\xfd\xdf\x07\xa7\xef\xee\x40\xe0\
-\x68\x64\x3a\x9f\x8a\x60\x30\xae\x0d\x7c\x75\xe4\x0e\xdf\xc8\xa6\
-\xd1\xe8\xb2\x9d\x0d\x00\x3c\xb5\xe7\x85\x84\x86\x98\x57\x8d\x52\
-\xfe\x43\xc0\x67\x12\x32\xe2\x8d\x21\xb9\x4a\x30\x9c\xeb\xbf\x17\
-\x4e\x7e\x5b\x34\xa6\xa7\xb8\x7a\x56\xd7\xf0\xf0\xba\xca\xdb\xaf\
-\xf1\x1c\xfe\x62\xf8\xa1\xeb\xbe\x18\x0e\xbf\x08\xde\xfb\xbd\xf0\
-\xc0\xcf\x77\x55\x89\x55\xd4\x3a\xb6\xa3\x3e\x30\x4e\x6c\xde\x4c\
-\x68\x2e\xfa\x0a\xe0\x63\x9b\xcb\x6b\x03\x00\xcf\xe6\x73\x2b\xf0\
-\x53\xc0\x2b\x8b\xdf\x5d\xc6\x08\xf7\xb5\x74\x33\x79\x12\x35\xf7\
-\x84\xd4\xde\x8d\x7f\x03\x8e\xbe\x25\x1a\x90\x5f\x11\xbc\x1d\x30\
-\xb6\x3f\xa8\xf7\xd7\x35\x3e\x1f\x63\x02\xed\xdf\x7c\x1a\x0e\xdd\
-\x0a\xaf\xfb\x7b\xb0\xfd\x97\xe1\xae\x1f\xeb\x98\x80\xc6\xf7\x61\
-\x4e\x10\x08\xeb\x51\x10\x78\x39\xa1\xb9\xe8\xf7\x02\x77\x6d\x2e\
-\xb3\x0d\x00\x3c\x1b\xcf\x4d\xc0\xbf\x1f\x35\xfe\x3a\x06\x06\xaf\
-\x23\x48\x83\xb9\xf1\xef\xdc\x0a\x37\xff\x3d\xd8\x79\x2d\xf8\x33\
-\x41\x65\x97\x35\x8c\xf8\xc9\x30\x00\x9d\x00\x82\xfc\x7e\x9d\xd0\
-\x11\x74\xc5\x6b\x5a\x9e\x83\x6a\x17\xee\xfc\x01\xa8\x8e\xc0\x07\
-\x7f\xb8\xfb\xdb\x52\x85\xe3\x75\x11\x04\x96\xa3\x20\xf0\x19\x11\
-\x04\xbe\x04\xf8\xf8\xe6\x72\xdb\x00\xc0\xb3\xe9\x9c\x00\xfe\x0d\
-\xa5\x7a\xfe\x54\xd8\xf3\xc2\xf8\xdd\xca\x50\xfe\x64\x4c\xdb\x37\
-\xc3\x4d\xff\x00\x76\x5e\x15\x8c\x9f\x82\xd1\x3d\x15\x74\xbf\x44\
-\xe9\x0f\xea\xd1\x75\x4d\x66\x90\xff\x6c\x73\x31\x14\x11\xbd\xe2\
-\x7f\x01\xaf\xf0\xc1\x7f\xdc\xc5\xfe\x4d\x64\x01\xd7\x11\x92\x80\
-\xfb\xa3\x7f\xf3\x1d\xc0\xff\x0d\x7c\x71\x7c\xe4\xe6\x6c\x00\xe0\
-\x19\x3f\x73\xe0\x9f\x00\x6f\x2c\x7e\xb7\x21\xa4\xf7\xee\x34\xde\
-\xde\x1a\xff\xfc\x1a\xb8\xe9\x6f\xc2\xce\xcb\x43\x7a\x4f\x9e\x22\
-\x4f\xbf\x0a\x14\x56\x79\x6d\x9d\x88\xfd\xd7\x79\x8e\xd2\xd7\x5a\
-\x83\x9b\xc1\xcb\xbf\x1b\x16\x67\xe1\x23\xff\xb2\xff\xfc\x15\xa1\
-\x16\xe2\xb1\x49\x10\x78\x0d\xf0\x7f\x11\xe6\x0e\x6c\xe6\x13\x6e\
-\x00\xe0\x19\x3f\x7f\x3d\x5e\x8c\x65\xda\x7f\x3b\xf0\xea\x11\x1a\
-\x5d\xed\xc0\x75\xdf\x07\x3b\xaf\x89\x62\x9f\x96\x8d\x51\x9e\x02\
-\x83\x67\x0d\x03\x5d\xe7\x7e\x9d\x60\x03\xeb\x80\x42\x5d\x83\x9b\
-\xc3\x2b\xfe\x14\x9c\xfb\x14\xdc\xfb\xdf\xba\x5e\x82\x44\xff\x4f\
-\x10\x4a\x89\x17\xa3\x7f\xfb\x5b\x81\xbf\x43\x48\x11\x6e\xce\x06\
-\x00\x9e\xb1\xf3\x5d\xc0\x9f\x18\x35\xfe\x17\x44\xe3\xd7\x11\x63\
-\x3e\xf5\x5d\x51\xf0\x3b\xd3\x3d\x68\x8a\x01\xc8\x53\x6c\xf8\xba\
-\xc6\x73\x58\x2d\x60\x5d\x16\xb0\x0a\x14\xea\x3a\x80\xdf\x9d\x7f\
-\x16\x4e\x7f\x02\x9e\xf8\x44\xff\x77\xa4\x54\xe1\x99\x49\x4d\xe0\
-\xdb\x81\x0f\x02\x7f\x63\x73\x19\x6e\x00\xe0\x99\x38\xaf\x1b\xbd\
-\xf8\x96\x04\x49\xf0\xb5\x86\xf6\xdb\x8b\xd8\x03\xc7\x3f\x1f\x4e\
-\x7c\x53\xe8\xc3\xd7\x66\x48\xb5\xd7\x09\x05\xe4\x00\xa1\xc2\xa5\
-\x7a\xfc\xdc\xd3\x8f\x79\xfd\x75\x98\x81\x05\x93\x65\x0d\x87\x6f\
-\x84\x57\x7d\x37\xfc\xca\x9f\x86\xe5\xfe\xf0\x71\x87\x81\xb3\x74\
-\xd5\x84\xc3\xf3\x57\x80\xf7\x10\x66\x11\x6e\xce\x06\x00\x9e\xb6\
-\x73\x22\xc6\xfd\x47\x8b\x9e\xff\x54\x84\x07\x97\x19\x7f\x2b\xfa\
-\x5d\x0d\xa7\xfe\x70\xb8\x43\xcd\x85\x2f\x4f\xd2\xeb\xaf\xcb\x04\
-\xd6\xbd\x6f\x2c\x04\x58\xc7\xfb\x4f\x01\x49\xba\x2d\xce\xc2\x75\
-\x9f\x0d\x2f\xfe\x7d\xf0\xdb\xff\xbc\xab\x0a\xf4\xe6\xfd\xd8\x99\
-\x8c\xf4\xb7\x80\x7f\x44\x98\x38\xf4\xc8\xe6\xb2\xdc\x00\xc0\xd3\
-\x75\xfe\x2a\x41\xd6\xeb\x1f\x1f\x2f\xd8\xd7\xc6\x8f\x25\xcf\x25\
-\xc0\xc9\x6f\x86\xad\xdb\x82\xf7\xb7\x46\x5e\x32\xfa\x75\x2b\x7f\
-\x0f\x5a\xcd\x37\x66\xbc\xeb\x50\xfe\xb1\xe7\xf0\x13\xbf\x4b\x0b\
-\xef\x55\xfa\x78\xfb\x3b\xe0\xbe\x5f\x82\x47\x3f\xde\x81\x66\x3a\
-\x2e\x9a\xf9\x62\xf4\x2f\xba\x9d\xd0\x68\xf5\x07\x36\x97\xe5\x06\
-\x00\x9e\x8e\xf3\xc5\xc0\x1f\x1c\x35\xac\x57\x11\x94\xec\xba\x60\
-\xf8\x0a\x1c\x7a\x39\x1c\x79\x6b\x34\xfe\xe6\xc9\x79\xfb\x4b\x2d\
-\xe5\x5d\x45\xd7\xfd\x9a\xf4\x5e\x0b\x9e\x3d\x7f\x7e\x3f\xa1\x05\
-\xa4\xcc\xc0\xf6\x09\x78\xe9\x37\xc2\xaf\xfc\x95\xe1\xbc\xc2\x34\
-\x6a\xcc\x31\x55\x17\xf5\x1d\xc0\xbf\x03\xfe\xd3\xe6\xf2\xdc\x00\
-\xc0\xe5\x3c\xc7\x81\xbf\x45\xa9\x85\xa5\x26\xa4\xfb\x6e\xa3\x5f\
-\xe4\x93\x7f\x3c\xfe\xb5\x61\x3c\x97\x5e\x1c\xf7\xf6\xba\x82\x05\
-\xac\x62\x0c\xeb\xb2\x82\x4b\xc9\xe9\xeb\x04\x08\x94\x68\x3e\x6b\
-\x68\x09\x8b\x73\x70\xe3\x9b\xe1\x9a\x3b\xe1\xc1\xf7\x75\x53\x8b\
-\xed\x63\xaa\x49\x00\x10\xc2\xa0\x95\x5f\x61\xd3\x38\xb4\x01\x80\
-\xcb\x78\xfe\x2c\xa5\x39\xfd\x0d\xa1\xc4\xf7\xe5\x2b\x62\xe9\x43\
-\x2f\x87\xdd\xd7\x81\x9e\x0b\x75\xfe\x14\x8c\xfa\x20\xd4\xff\x52\
-\xb2\x02\xca\x74\xde\x7f\x8c\xd6\xa7\xd7\xe3\xd7\x64\x02\xba\xe2\
-\xf7\xe6\x53\x89\xab\x5d\x78\xd1\x97\x06\x00\x68\xd6\x78\xbd\xc3\
-\xf3\x19\xc0\x9f\x01\xfe\xdc\xe6\x32\xdd\x00\xc0\xe5\x38\x77\x10\
-\xa6\xd5\x0c\x0d\x67\x16\x15\x81\x6d\xfa\x55\x7e\xb9\xb1\x1e\x79\
-\x4b\x98\xa2\xa3\x17\x87\xde\x7e\xcc\xfb\x5f\x4a\x68\x90\x87\x1d\
-\x07\x05\x85\x31\x66\xe0\x27\xb4\x00\x9d\x00\x11\x5d\x03\x30\xfc\
-\x05\xb8\xf6\xd5\x70\xf2\x45\xf0\xd0\xdd\xc1\xe3\x6b\x01\x70\x94\
-\xa9\x16\xe2\x3f\x0a\xfc\x53\x36\x4d\x43\x1b\x00\xb8\x0c\xe7\xfb\
-\x29\x2d\xe0\x6c\xa2\x0c\x75\x8a\xf1\x66\x16\x05\xb6\xae\x81\xdd\
-\x57\x83\x5e\x08\x71\xaf\xc8\x6a\x10\x98\x02\x85\x4b\x35\x7a\x0a\
-\xf1\xbe\x30\x2d\xf8\x8d\x51\x77\xbf\x86\xa1\xfb\x75\x9f\xb3\x86\
-\xd9\x21\xb8\xf1\x4d\xf0\xa9\xbb\xfb\x22\x61\xfe\x5c\x8c\x82\xc0\
-\x31\xc2\x88\xf5\x6f\xdf\x5c\xae\x1b\x00\x78\x2a\xcf\x9b\x09\xf3\
-\xfb\x87\xc6\x7f\x2c\xc6\xfe\x7e\x85\x41\xee\xbe\x1a\xdc\x71\xd0\
-\xbd\x83\x79\xf0\x55\x4c\xa0\x54\xaa\x2b\x4c\x57\xe9\xe9\x1a\x4c\
-\x60\xca\x9b\xfb\xc2\xef\x98\x02\x8b\x55\x6c\x21\x01\x5c\x4d\x60\
-\x01\x5b\xff\x06\x16\x7b\xe3\xec\x23\x65\x57\xca\xa0\xf8\x4d\x84\
-\xd9\x8b\xef\xda\x5c\xb6\x1b\x00\x78\xaa\xce\x9f\x19\xf5\x39\x77\
-\x10\xfa\xfb\x97\x13\x5e\x5a\x80\x9d\x3b\xc3\x15\xae\xf5\xd0\xe3\
-\x8e\x79\x79\x65\x7a\x90\xa6\xac\xf0\xfc\xab\xba\xfc\xc6\x84\x3c\
-\x3f\x02\x02\x5a\x30\xc8\xd2\x2e\xc2\x55\xa1\x80\x1f\x63\x13\x0d\
-\x1c\xba\x1e\x4e\xbc\x08\x1e\xf8\x40\x27\x06\xfa\x02\x5b\x49\x0d\
-\x44\x43\xb6\xb3\x05\xfc\x29\xc2\x10\x91\xcd\xd9\x00\xc0\x93\x3e\
-\x9f\x43\xe8\x43\xef\x9f\x9a\x30\xbd\xf7\x66\xc6\x07\x59\x27\x03\
-\x9d\x1d\x87\xf9\x2d\xb1\xc7\xbf\x29\x7b\xee\x75\x2a\x01\xd7\x61\
-\x03\xa5\xb6\xdd\x75\x1a\x75\x56\xd1\xff\x31\x43\x67\x22\x56\x2f\
-\xfd\xbc\x9f\x60\x19\x1e\x98\xed\xc0\xa9\x97\xc2\x7d\x1f\xe8\x44\
-\xc7\x12\x00\x2d\x23\x24\x57\x45\x10\xf8\x6a\xe0\x15\xc0\xef\x6c\
-\x2e\xdf\x0d\x00\x3c\xd9\xf3\x47\xc9\xe7\xd8\xa6\xce\xb5\x97\xc4\
-\x8f\xf5\x84\x71\x2a\xc1\xf8\xab\xc3\x61\xa6\x9f\xe8\x50\xcc\xca\
-\x63\xfd\xa7\x4a\xfd\x5f\xd5\xc3\xbf\x0e\x35\xbf\x94\xdb\x14\x28\
-\x4c\xdd\xe7\x01\x59\xc2\xb1\x17\x74\x69\xbf\xd2\xe3\xd2\x63\x17\
-\x84\x45\x29\xc3\xb3\x0d\x7c\x27\xf0\x27\x37\x97\xef\x06\x00\x9e\
-\xcc\xb9\x9d\xd2\xea\xae\x86\x50\xeb\x7f\x2d\xd3\x6b\x2c\x92\x31\
-\xcc\x6f\x00\x95\x70\xc5\xaa\x96\x69\xff\x54\xee\xff\x52\x06\x00\
-\xe7\x54\x7f\xdd\x69\xc0\x07\x01\x86\x31\xaf\x3f\xc5\x06\x4a\xa2\
-\x9e\xf5\xf2\xb5\xc2\xa1\xab\x83\x20\xb8\x77\xa1\xff\xd8\xfc\x75\
-\x2d\x62\x18\x30\x2b\xfe\x7d\xdf\x40\xe8\x15\xd8\x94\x08\x6f\x00\
-\xe0\x92\xcf\xb7\x50\x52\xfe\x2b\xe0\x45\x6b\x18\x5f\x32\xc0\xd9\
-\x75\x81\xb3\xaa\xe9\x6f\x2d\xd1\x75\xe1\xa9\xeb\x01\x58\x65\xe0\
-\xab\x3c\xf3\xd4\xd7\x7e\x0d\x16\xe0\x57\x68\x06\x7e\xe4\xb9\x69\
-\x60\xb6\x0b\x3b\xa7\xe0\xc2\x85\xbe\x0e\x50\xd2\x14\x16\xa3\x57\
-\xf0\x75\x84\x39\x82\x3f\xb2\xb9\x8c\x37\x00\x70\x29\x67\x17\x78\
-\x47\xd1\xfb\x5f\x4b\xd8\xda\xe3\x57\x50\xf4\xb6\x8c\xf5\x48\xdc\
-\xde\x53\x97\x29\xf9\x94\xa7\x7f\x32\xcb\x7e\xa6\xbc\xbe\x5f\x01\
-\x08\x53\xc2\xde\xd4\xad\x59\xe1\xfd\x75\xd5\xf3\x46\xe4\xdc\x39\
-\x36\x4c\x21\x52\x08\x05\x16\x74\x9b\x91\x87\x7f\xef\x3b\x36\x00\
-\xb0\x01\x80\x4b\x3d\x9f\x1b\xa3\xfc\xe1\xb9\x35\xbe\x6b\xab\xb6\
-\xd8\x49\x7c\x7b\x65\x3b\x7a\xff\xba\x1c\x9b\x4f\x8d\xe8\x5a\xa7\
-\x54\x78\x4a\xcc\x1b\x13\xf7\x0e\x42\xdd\x99\x60\x00\xeb\xc4\xf9\
-\xfe\x20\x4c\x42\xc2\xe8\xb0\xd9\xa1\xf5\x2a\x0c\x1b\xc2\xf4\xa0\
-\x43\xc5\xff\xc0\x9b\x09\x15\x82\x1f\xde\x5c\xce\x1b\x00\x38\xe8\
-\xf9\xda\xa2\xd7\x3c\x12\x19\xc0\xba\xfb\x6a\xd2\x52\x4d\x5d\xf6\
-\x7f\xa8\x44\xfb\x4b\xdf\x63\x0d\x8d\x60\x2c\x04\xf1\x2b\x8c\x9f\
-\x15\x71\xbe\x1f\x11\xf6\xd6\xf5\xe8\x7e\x0d\xfd\xc0\x17\x28\xbe\
-\x73\x50\x6d\xad\x5f\x55\xb8\x3f\x2a\x06\xee\x00\x6f\xdf\x00\xc0\
-\x06\x00\x0e\x7a\x8e\xc5\x0b\x67\x08\x00\x37\x30\xde\xea\x5b\xf4\
-\xc8\xf1\x41\x7e\x01\xe2\xcb\xe9\xbe\xb1\x31\x60\x7a\x80\xaf\x4b\
-\x9e\x7e\x95\xf1\xaf\x23\xfa\xf9\x35\xe9\xfc\x3a\x20\xe0\x47\xe2\
-\xff\xc1\xf3\xcc\x02\x70\xe6\xcf\xe3\x29\x17\x3e\x2d\x23\x08\xec\
-\x14\xdf\x93\xb7\x13\x1a\xb8\x36\x67\x03\x00\x6b\x9f\x37\x12\x74\
-\xfe\xbe\x61\xcd\x22\x00\x4c\x4d\xcd\x2d\xa9\xfb\xba\x0c\xf1\xbf\
-\xfa\x7e\x39\x51\x69\x5a\x50\xe9\xe7\xa7\xc2\x81\x29\x9a\x3f\x66\
-\xf0\x7e\x8d\xcf\xd7\x35\xfa\xd2\xcf\xfb\x03\x18\x7f\xe9\x39\x59\
-\x82\xf7\x43\xe0\x82\x61\x5d\x00\x46\x0c\xdc\x19\xfd\x5f\xde\x40\
-\x58\x46\xb6\x39\x1b\x00\x58\xeb\xbc\xa5\xe8\xfd\x4f\x12\x1a\x82\
-\xfd\x9a\xc2\x9b\xc4\x3b\x9a\xbd\xa0\x03\x48\xd3\xaf\x66\x13\xfa\
-\xd9\x82\xa9\xe2\x9d\x04\x16\x6e\x8d\xdf\xbd\x2a\x1f\xbf\x4a\x0b\
-\xc8\x8d\x73\x0a\x24\xf2\x7d\x86\xfe\x00\xe1\xc1\xd8\x63\x55\xa0\
-\xde\x9f\x7e\xad\x39\x40\x2e\xe2\x6b\x71\x45\x36\xf7\x46\xc2\xbc\
-\x80\xcd\xd9\x00\xc0\xca\xe3\x28\xed\xf4\xd3\x18\xfb\xdb\x3d\x7e\
-\xab\x14\x7b\x05\x7c\x03\x7a\x1e\x38\xdc\x65\x01\xc6\x0c\x3b\x7d\
-\x2c\xa5\x03\xfd\x08\x63\x58\x07\x00\x60\xfd\xb4\x9d\x5f\x13\x1c\
-\xd6\x01\x0d\xd6\x60\x05\x83\xe7\x93\xf0\xf5\x72\x6f\xf8\x5e\x96\
-\xc4\xd3\xb6\x7e\x20\x86\x02\xe5\x30\xe0\x4d\x1b\x00\xd8\x00\xc0\
-\xba\xe7\x46\xf2\xbd\x7e\x89\xfe\x5f\x7d\x29\x4f\xe7\xa1\x39\x0b\
-\xb3\xab\x42\x28\x20\x05\x66\x61\x0d\xdb\x1a\x9e\xa3\x5c\x1d\x38\
-\xb6\xa7\x6f\x8a\x01\xac\xa2\xed\x53\xc6\x9c\x7b\x7b\x3f\xf1\x9c\
-\x7e\x85\xf1\xfb\x55\x8c\xc1\x05\xa0\xdc\x3f\x5f\x0e\x01\x4a\xf7\
-\xd9\xf2\xe0\x72\x18\xf0\x59\x5c\xda\x6e\xe4\x0d\x00\x3c\x0f\xcf\
-\x6b\x09\x5a\x7f\xff\xec\x44\x32\xd9\xac\x88\xc3\x07\x5e\x59\xc3\
-\xd8\x6f\xdf\xb0\x3a\x6f\x68\x80\x60\xca\xdb\x37\x07\x60\x01\xeb\
-\x78\xfa\x49\x3a\xbe\x06\x60\xf8\x0c\x20\x56\x81\x44\x33\xc5\x0e\
-\x04\x1a\x1f\xa6\x04\x8d\x01\x40\x89\x45\xa5\x30\xa0\xfc\xd8\x57\
-\xc6\x00\xee\xb1\xcd\xe5\xbd\x01\x80\x55\xe7\x55\x45\x83\x3b\x41\
-\xe8\x33\xf3\x13\x17\xe0\x98\x41\xd6\x8f\xc2\xf6\x32\x00\x80\x66\
-\xde\x7d\xdd\x93\x33\x81\x55\x83\x3e\x4a\xc2\x1f\x07\x00\x04\x5d\
-\xe1\xc1\xd7\x11\xfd\xc6\x7e\x76\x92\x19\x38\xd8\x3f\x0b\xfb\xa7\
-\x57\x6b\x2c\x9a\xbd\x37\x69\xd3\xf2\xb0\x34\xf8\x2a\xe0\xa5\xc0\
-\xff\xd8\x5c\xde\x1b\x00\x58\x75\x5e\x56\xbc\xe8\x8e\x31\x3e\x97\
-\x6e\x95\x21\xd7\x8f\x82\xdf\xeb\xac\xc3\x15\xbc\x7b\xba\x88\xdd\
-\xc8\xe7\xc2\xaa\x69\x38\xd3\xe2\xde\x94\x0a\xef\x27\xa8\xfc\x18\
-\x5b\x60\xc2\xe3\xfb\x35\x41\xc0\x17\x42\x01\x66\x70\xe1\x31\x58\
-\x2e\xc6\x07\x95\x4c\xfd\xed\xcb\xe2\x15\xed\x08\x8d\xdb\x1b\x00\
-\xd8\x00\xc0\xca\xf7\xe2\x8e\xc1\x45\x35\x27\xa8\xff\x0d\xe5\xf6\
-\xdd\x55\x53\x7c\xea\xc7\x82\x0e\xe0\x76\xba\x6e\xc0\x55\x21\x40\
-\x32\x30\x37\xf1\xfd\x31\xea\x4f\x16\xff\x33\x11\xe3\xfb\x35\xa8\
-\xfc\x2a\x4a\x3f\x16\x2a\x94\xa8\xfe\x2a\xa0\x10\xe0\xec\x43\x5d\
-\x98\xb3\x2a\xe5\x6a\x4d\x5c\x99\x2a\xd0\xba\x7d\x73\x79\x6f\x00\
-\x60\xd5\x39\x4c\x98\xeb\xdb\x3f\x55\xfc\x4e\x69\x9d\xf6\xd8\x45\
-\x6a\x41\xa0\xb9\x08\xcb\x87\x61\xeb\xe6\x6e\x20\x48\x29\x15\x48\
-\xc1\xcb\x5b\x83\x77\x99\x46\x50\xf2\xfc\x36\x6b\xc0\x0a\x03\x5d\
-\x57\x99\xf7\x23\xde\x5b\x27\x8c\xfb\xa0\xa1\x40\x13\xe3\x7f\xad\
-\x03\x00\xc8\x01\x3c\xbf\x9d\xba\x5c\x8f\x3e\xfe\xb6\xcd\xe5\xbd\
-\x01\x80\x55\xe7\x06\xf2\x6d\x3f\x1a\x05\xc0\xed\x42\xcc\x39\x26\
-\x04\xe6\x40\xe0\x81\xe5\xfd\x30\xbf\x8e\xde\x2e\x00\xc9\xe8\xfe\
-\x94\x31\x3b\x86\x13\x7a\x4b\x9f\xaf\xea\xf8\x5b\xa5\xda\xaf\x13\
-\x0e\x94\x8c\xb8\x19\x79\x1e\x3f\xc2\x2e\x72\xe3\xf7\x80\x54\x70\
-\xe1\x34\x5c\x7c\xec\x60\x86\x9f\xb3\x80\xb2\x38\x7b\x2b\xab\xb6\
-\x0b\x6c\x00\xe0\x79\x7f\x6e\x8e\x52\x5f\xdf\x03\x1f\x61\xd8\x6d\
-\x96\x5f\x68\xab\xea\xf2\x17\x0f\xc1\xf6\x59\x70\xdb\xdd\x4c\x80\
-\xdc\xd3\xa7\xfb\x9a\x02\x33\x28\x55\x0c\x96\xe2\xfe\x29\x11\x70\
-\x55\xbe\x7e\x55\xec\xbe\xea\xeb\xa9\xd0\x62\x0a\x00\x5a\x10\x52\
-\x38\x73\x7f\xd8\x1b\x38\xb5\x9d\xa8\x14\x82\x09\xab\xe6\x27\x5c\
-\x17\xff\xb7\x7b\x9b\xcb\x7c\x03\x00\x63\xe7\xd4\xe0\xd2\xd1\xe8\
-\xfd\x85\x7e\xfa\x4d\xd7\xa4\xa7\x2d\x0b\xb8\x08\xcb\x07\x61\xeb\
-\x96\x8e\x05\x94\xaa\x02\x2d\x10\xd8\xe7\x77\x0c\x8b\x61\xc6\xc0\
-\xc6\x67\x0c\x63\x9d\xd2\x5f\xcf\x74\x3a\x6f\x95\xf8\xe7\x47\x1e\
-\xeb\x0b\x7a\x40\x11\x3c\x04\x9a\x7d\x38\x7d\xff\x10\xc8\x74\x85\
-\x06\x20\xd9\xe7\x0d\xa5\xf6\xe0\x53\x91\xcb\x6d\x00\x60\x03\x00\
-\xa3\xe7\x64\xf1\xde\x2d\xe9\xca\x7a\xa7\xb6\xde\x96\xd8\x80\x8d\
-\xd9\xf7\xef\x83\xea\x5a\x70\x12\x58\x80\x2b\x18\x38\x13\x9e\x7e\
-\x2c\xcc\xc8\xc3\x05\x2d\x88\x6f\x30\x9e\xc3\x1f\x8b\xdd\x57\x79\
-\x78\x32\x0a\xbf\x6e\x71\x90\x05\x90\x56\x58\xad\xe0\xcc\x43\x70\
-\xf1\xec\xf8\x54\xe3\xb1\xe5\xa9\x62\xc2\xa8\xf1\xf4\xea\x21\x42\
-\x2e\xe7\x89\xcd\x65\xbe\x01\x80\xb1\x73\x6c\x70\x8f\xb3\xf1\x7f\
-\x34\xdc\x75\xd6\x72\x97\xea\xd5\x97\x4f\xc0\xf2\x21\xd8\xba\x36\
-\xac\x04\xf7\x05\xd1\xce\x66\x00\xc6\xf2\xfe\xab\x6a\x01\xc6\x06\
-\x71\x96\x6a\x02\x9a\x15\xc6\xdf\xac\x21\x06\xae\x13\x12\xe8\xc4\
-\x63\x55\xa0\xa9\xe1\x89\x7b\xa7\xe9\x3e\x13\x61\x97\x44\xaf\x3f\
-\x5e\x93\x51\x15\xff\xbf\x9b\xb3\x01\x00\x73\xb6\x27\x01\x20\x81\
-\x80\x2f\x58\xdf\x18\x08\xe4\x54\x7e\xff\x5e\xa8\x8e\xc5\x76\x57\
-\x1d\x7a\x31\x9d\xa0\xb6\x6b\x55\x1e\x8e\xd0\xe7\x75\x1b\x7e\xa6\
-\xbc\x7d\x0e\x16\xcd\x9a\x06\x3e\x26\x18\xaa\x11\xff\xce\x3e\x04\
-\x17\x4f\x97\x43\x98\xa9\xae\x4b\x97\x79\xff\x5c\x50\xed\x5f\xe7\
-\x87\x37\x97\xf8\x06\x00\xa6\xce\xbc\x68\xc0\xb3\x82\xe8\x57\x2a\
-\x2d\xcf\xeb\xf9\x4b\xe5\xbc\xf5\x59\x58\x3c\x18\x06\x85\xd2\x94\
-\xe7\x03\xc8\x04\x33\x18\x0b\x0d\x56\x89\x80\x5a\x08\x0f\x1a\xd6\
-\x4f\x11\xfa\x35\x62\xff\x49\x2f\x3f\xf6\x33\x31\xf6\x7f\xe2\xbe\
-\x21\xc0\xf9\x11\x51\xcf\x66\x4e\x72\xe3\xaf\x46\xc3\x00\x29\x02\
-\xfc\xe6\x6c\x00\x60\x85\x1f\x8f\x31\x7b\xae\x01\xe8\x7a\xd4\xbf\
-\x54\xc2\xbb\x7f\x7f\x98\x13\xe8\x76\xfa\x4b\x42\x1d\xe3\x9b\x80\
-\x65\x82\xfe\xaf\xda\xf1\x37\x55\xfe\x0b\xab\x0b\x7f\xc6\x8c\xba\
-\x59\x83\xf2\xe7\xcf\x9d\xc7\xff\xb8\x20\xfc\x2d\x2e\x4c\x2f\x32\
-\x91\x0c\x0c\x73\x00\x48\xc6\x3f\x1b\x65\x49\xe9\x11\x9b\xb3\x01\
-\x80\xd1\xb3\x28\x5e\x36\x2e\xf3\xfa\xeb\x6f\xac\x1d\x86\x02\x00\
-\xf5\x12\xf6\x3e\x09\xdb\xb7\x85\xe7\x94\x91\x27\x13\x56\x37\x06\
-\x4d\x81\xc0\xd4\x14\x5e\x65\xbd\xf2\xdf\x55\x29\xc0\x52\xfe\xdf\
-\xaf\xc9\x18\x70\x70\xf1\x09\x38\xf3\xf0\xf4\xb8\x32\x99\x60\x48\
-\x92\x79\x7e\xd9\x00\xc0\x06\x00\x2e\xfd\x94\x53\x44\xbd\x22\x9d\
-\x2c\x18\xd7\x02\x79\x28\xc5\xea\x0d\xfd\xfa\xfe\xc5\x69\xe0\x21\
-\x98\x5f\x13\x46\x85\xe5\x61\xc0\x3a\xb4\xff\x20\x21\xc0\x3a\x5d\
-\x7e\x7e\x45\x28\x30\x16\xc3\x8f\x01\x44\x93\x31\x8c\xde\xf3\x4b\
-\xe8\xf9\x3f\x7d\x7f\x37\xfd\xa7\xc4\xc1\x64\x04\x10\x2d\xf5\x77\
-\x46\x00\xb4\x5b\x85\x65\x10\xa0\x2d\x36\x97\xf8\x06\x00\xa6\xce\
-\x13\xe3\xc6\x65\xbc\xbf\xe4\x4c\x40\xc7\x0d\x72\x0c\x08\x00\x16\
-\x0f\x87\xb7\x7f\x76\x74\xd8\x23\x30\xa6\x74\xaf\x23\x3c\x6a\x06\
-\x4c\x9e\xf2\xa4\xde\xa9\x22\xa0\x9e\x31\xcb\xc1\xd5\xff\xb1\xf0\
-\xa0\x89\xe8\xd8\x78\x38\xf3\x20\x2c\xf6\x87\xef\x97\x7f\x92\x40\
-\x60\xff\xb6\xfe\x3b\xb3\xdc\x5c\xe2\x1b\x00\x98\x3a\x8f\x96\x01\
-\x20\x0b\xe2\x7d\xbc\x0a\x55\x87\xe0\x30\xe5\xa9\x07\x62\x96\xc2\
-\xfe\xa7\xc2\xf3\xcf\x76\xfb\x57\xed\x98\xf7\xd7\x15\x60\xb0\x32\
-\x04\x90\xd5\xb5\xfa\xaa\x65\xc3\x5e\xc7\xf3\xaf\xfa\x1e\x40\x2d\
-\x70\xee\xd3\xb0\x77\x6e\x35\x80\xe5\xa3\xd3\xdd\x84\xf1\xcf\x26\
-\x49\xbe\x67\x53\x04\xb4\x01\x80\x15\xe7\x53\x74\x75\x64\xdd\x05\
-\x69\xbd\xb6\x48\x97\xbe\xd3\x8c\x21\xe8\x44\x28\x50\x2a\x5d\x85\
-\x50\x0f\xb0\xff\x29\xe0\x3a\x10\x33\x70\x60\x55\xfa\x4f\x18\x2f\
-\x4d\x4e\x46\x9e\xbf\xc6\xa4\xba\xc3\x78\xdd\xbf\x02\x5e\x27\x3c\
-\xbe\x8e\x87\x01\xba\x22\xfe\x4f\xe3\xbe\xce\x3d\x1e\x52\x7e\xa5\
-\x2a\x3f\x5f\xf8\xfb\x56\x79\xff\xca\xdc\xc6\xaf\xe6\x1a\x38\xbb\
-\xb9\xc4\x37\x00\x30\x75\xee\x05\x2e\x62\x27\x02\xf9\x48\x1c\xc5\
-\x58\x70\x69\xe6\xfe\x18\xcd\x2f\x85\x04\x03\x83\xae\x61\xff\x21\
-\x98\x9f\x8a\x20\xa0\xeb\xd3\xff\x1e\x10\xc8\xea\x5d\x00\xeb\x4c\
-\xe7\x5d\xa7\xb6\x5f\xb5\x4c\xf5\xf3\xd8\x3f\x7d\xf4\x11\x38\xcf\
-\x9f\x81\x8b\x67\xca\xef\xdd\x54\xce\xbf\xd4\xf8\x53\x65\xd4\x3f\
-\xdd\xca\x44\xbf\x01\xce\x6c\x2e\xf1\x0d\x00\xac\x0a\x01\x1e\x20\
-\x4c\x8f\xe9\xea\xca\xf7\x25\x14\xee\x94\xdc\x53\x4b\x51\xb3\x70\
-\xc0\x33\xee\xc9\xad\xaa\x9f\x6e\x75\x0d\xcd\x23\x30\x3f\x01\xd5\
-\x76\xb9\xe2\xb0\xe4\xf9\xed\x2f\xd1\x11\xe2\xbb\xee\x5a\xaf\x55\
-\x79\xfb\xa2\x60\xa8\xc3\x10\x61\xf0\x3c\x12\x84\xbe\x0b\x67\x61\
-\xef\x7c\xf7\xbe\x42\x79\x6d\xf8\x54\x18\x54\xf2\xfc\xb3\x0c\x00\
-\xca\xfd\x7e\x67\x81\x0b\x9b\x4b\x7c\x03\x00\x53\x67\x1f\xf8\x60\
-\x0b\x00\xe9\xc2\xdc\x8f\x0c\x40\x64\x64\x32\xad\xf6\x2f\x3a\x2d\
-\xa4\x0b\xc7\xda\x77\xed\x85\xad\x0d\x2c\x1e\x83\xea\x08\xb8\x43\
-\xe5\xf4\xa0\x64\x5f\x8c\xed\x10\x18\x0b\x01\x72\x63\x5b\xb7\x03\
-\x30\x2f\x0b\x1e\x54\x14\xea\x88\x30\x28\xd0\x34\xb0\x77\x16\xf6\
-\xf7\xcb\x71\xfe\xd4\x82\x93\x12\xfd\xcf\x3d\xbf\xcb\x80\x40\x47\
-\xc3\xbb\xfd\xcd\x25\xbe\x01\x80\x55\xe7\x37\x09\x5b\x65\xfb\xd1\
-\x23\x19\x0b\x50\xed\x84\xc0\xdc\xeb\xaf\x33\xba\x8a\xb1\x58\x57\
-\xc3\xf4\xa0\x6a\x09\xd5\xa1\xae\x64\xb8\x67\x08\x32\xfe\xbc\xa5\
-\x78\x3a\xdf\xef\xb7\x0e\x08\x78\x56\x6f\xff\x29\x66\x0f\xb4\x0f\
-\x18\xf5\x32\x78\xfd\x65\x53\x7e\x5d\xeb\xcc\x58\x94\x11\xe3\xb7\
-\x05\x40\x16\x00\xca\x0c\xe0\x61\x36\x59\x80\x0d\x00\xac\x71\x7e\
-\x7d\x10\x6b\xee\x69\xf0\x64\x3d\x11\xb0\xf0\x91\xe8\x09\x29\x88\
-\x82\x07\xe9\xf0\x13\xa0\xde\x03\x5f\x43\xb5\x13\x96\x65\xaa\x31\
-\xfc\x7c\x98\x88\x5f\x93\x01\x70\x40\xa3\x9e\x9a\x1f\xb0\x0a\x28\
-\x1a\x0f\xcb\xfd\x90\xeb\x6f\x72\x21\x92\xe9\xad\xc4\xa5\xd8\x7f\
-\x4c\xfc\x9b\x99\x8f\x33\xba\x9a\x8d\xe1\x7b\xfc\xc0\xe6\xd2\xde\
-\x00\xc0\x3a\xe7\xdd\xc0\xe3\xa4\xd6\x60\x07\x9c\x56\x68\x24\x16\
-\xf1\xb8\x40\xcd\xc5\x5c\xcd\x6a\x68\xbf\xed\xc1\x2f\x35\xb3\x94\
-\xe6\xd8\xe5\xf7\xb7\xc6\x5a\x83\x3f\x07\x6e\x2b\x88\x83\xce\x95\
-\x99\xc3\xd8\x9e\xc1\xa9\x74\x20\x2b\x44\x3f\x38\xd8\x44\x60\x7b\
-\xab\xeb\x90\xdf\x6f\x9a\xa1\xee\xe1\x27\xe8\xff\x54\x97\x63\xa9\
-\xf6\xbf\x94\x01\x58\x30\x36\x36\xfd\xe3\x9b\x4b\x7b\x03\x00\xeb\
-\x9c\x4f\xc7\x30\xe0\x0b\xda\x7b\x16\x3e\x2e\x9d\xa8\xe2\x82\xcf\
-\xb8\xe4\xd3\x49\x64\x06\x1a\x6a\xfa\xdb\x3c\xbb\x8e\x5f\xe4\x53\
-\x69\xae\xd2\x47\x4f\x5c\x2d\xbe\x0c\x5b\x86\xdd\x3c\x86\x23\x13\
-\x0c\x62\xac\x1f\x80\xc2\xeb\xf0\x8c\xa7\xe3\x72\x63\x97\x02\x48\
-\xf4\x80\xa4\x09\xd3\x7c\x97\xcd\x34\xc3\x99\xda\x5d\x68\xe7\x1f\
-\x5a\xa0\x74\x23\xe2\xdf\xcc\xb0\x80\x39\x21\xd3\x5f\xee\x9a\xbc\
-\x67\x73\x69\x6f\x00\x60\x9d\xa3\xc0\xaf\xb5\x00\x90\x06\x4d\x9e\
-\x03\x0e\xbb\x50\xc9\x26\x66\x8f\x57\x62\x03\x22\xe5\x34\x99\xae\
-\xa9\x03\xc8\xc4\xe7\x6d\x28\xb1\x08\xac\xc0\x55\xa1\x85\x36\x01\
-\xc1\xd4\x80\xd2\x12\xf8\xc0\xf8\xce\xc0\x55\x9a\x42\x69\x4a\x8f\
-\xf7\xa1\x9f\xbf\x6e\x86\x1d\x91\x53\xba\x87\xb2\x7a\x03\xb2\xcb\
-\xe2\xff\xa4\x01\xe4\xc6\x9f\x3e\x2f\xef\x5e\x69\xd8\xac\x08\xdf\
-\x00\xc0\x01\xce\xaf\x0c\x44\xc0\xc7\x3d\xdc\xe8\xc0\x69\x88\xf3\
-\x1d\x9d\xd7\xcf\x27\x76\x8a\xd5\x00\xac\x2e\x50\x30\x00\x47\x39\
-\xae\x1f\x2d\x1c\xf2\x21\xbe\xa6\x0e\x40\x24\x2e\x6a\x03\x79\xf1\
-\x8f\x4e\xeb\x01\x63\xde\xd8\x8f\x50\x75\xe8\x0a\x79\x52\x31\x90\
-\x8f\xaf\xc5\xfb\xe1\x2e\x83\x55\x63\xbc\x99\xf8\x7e\xa9\xe1\xc7\
-\xaa\xfd\x73\xfa\xa9\xbf\x39\x61\xda\x9f\x10\xaa\x38\x86\xbf\xe7\
-\x09\xe0\xa3\x9b\xcb\x7a\x03\x00\xeb\x9e\x5f\x05\x1e\x21\x6d\x03\
-\x14\xe0\x6c\x0d\x4d\x15\x2f\x4c\x1f\xbd\x7e\xbc\xda\x9d\x0f\xda\
-\xc0\xc0\xc5\x4e\x18\x5d\x3e\xfb\xdf\x7a\x3f\x57\x78\xdc\x80\x31\
-\x68\x48\x1b\x6a\xd3\x01\x40\xba\xc9\x88\xf7\x1f\x13\xdf\x4a\x1e\
-\x7f\x10\x86\x58\x56\x63\x42\x9e\xb1\x33\x36\x7f\x37\x9f\x84\xec\
-\x0b\xef\x8b\xcb\x18\x40\x55\x88\xf7\x4b\x61\x00\xa3\x0c\xe0\xc3\
-\x6c\x46\x81\x6d\x00\xe0\x00\xe7\xd1\x08\x02\x5f\xd6\x5e\xcc\x8f\
-\xd5\x71\xeb\x4c\x65\xbc\xb2\x0f\xc6\xdf\x88\xd1\x04\x92\x0e\xe0\
-\xfb\x25\xc3\x5a\x28\x21\xce\x27\xfe\x96\x8a\x84\xc6\xe6\x0d\xf6\
-\x68\xbf\x16\x3c\xbe\x0c\xa9\xff\xaa\xe6\xa1\xa9\xe5\x22\x29\xac\
-\x29\x69\x15\x25\x11\x73\x6a\xcd\xf9\xaa\x9a\x88\x7c\xd2\xaf\xac\
-\x61\xfc\x73\xe0\x74\x90\x4a\x0a\x13\x81\xde\xc3\x66\x1c\xf8\x24\
-\x56\x6f\xce\xf0\xfc\x42\xef\x1d\xda\x57\x78\xbc\x86\xd9\xac\x8b\
-\xc1\x9d\xeb\x68\x78\xeb\x7d\xc5\x84\x00\x12\x99\x81\x1b\xef\xc3\
-\x1f\x18\xd9\x48\xdc\x7c\x90\x51\x5f\x44\x63\xf5\xf1\x66\xbf\xa9\
-\xe6\xa3\x8e\x3c\x81\x64\xdf\x6f\x75\x8e\x82\x48\x67\x5b\x71\xd7\
-\xe9\xdb\x67\x85\xde\x61\x45\xbf\x52\xa9\xef\xac\x60\xf8\xe9\xf3\
-\xbd\x51\xcd\xe5\xdd\x9b\xcb\x79\x03\x00\x07\x3d\xff\x7f\xec\xa2\
-\xa9\x1a\x78\x64\x19\x8d\xbe\xea\x0c\xdf\xb9\xe0\xf9\x13\x08\x48\
-\xe4\xad\x6a\xe2\x72\xdb\x88\x53\x2a\xba\xb1\x9e\x6f\xac\x99\x66\
-\x6c\x44\xb6\xae\x21\x30\x8e\xc5\xe0\x63\x31\x77\xc9\x63\x8f\x19\
-\xf0\x2a\x91\x6f\x9d\xe7\xc8\x0b\x7b\xec\x7d\x33\x86\x85\x3e\xc9\
-\xf0\xe7\x46\x03\x20\x0a\xb5\xc3\xbf\x61\x3f\xb2\xb9\xcd\xd9\x00\
-\xc0\x81\xce\xfb\x81\xdf\x69\xbf\xaa\x80\x87\xf6\x22\xc5\xac\xe2\
-\xcd\x30\x00\x27\xdd\xd7\x2d\x10\x58\x71\x6e\xa2\x0b\xaf\xd4\xaf\
-\xcf\x84\xf7\x5f\xc5\x04\xc6\x0c\x5e\x27\x0c\x71\xca\xe0\x4b\xf7\
-\x8f\x01\x46\xb5\xe2\x67\xa0\x3c\xca\xab\x62\x98\xee\xb3\xde\x7f\
-\x36\x71\x9b\x47\xf1\x6f\xaf\x78\x35\x7f\x00\xb8\x6b\x73\x39\x6f\
-\x00\xe0\xa0\x67\x09\xfc\xe7\xde\xc5\x7c\xb6\x81\xc7\x97\x21\x0c\
-\x10\x67\xc2\x00\x13\x12\x10\x0b\x86\x7a\x20\xe0\xb2\x61\xa2\xd2\
-\x17\xe6\xa6\xaa\xf3\xa6\xf6\xf7\xad\x7b\xc6\x0c\x56\x0e\xe0\xa1\
-\x65\xe2\xa6\x85\x10\xc0\x8d\x3c\x47\xe9\x63\xa9\xb0\xa7\x44\xfb\
-\x93\xda\x3f\xcf\xa8\xff\x8c\xd0\xe7\xd7\x8c\x86\x72\xf5\xe6\x72\
-\xde\x00\xc0\xa5\x9c\x9f\x6e\x7d\x73\xea\x60\xbb\xff\x22\x54\x55\
-\xa7\x03\xc8\x0c\x2a\x17\x6e\x16\x10\x9c\xd1\x03\x52\x58\xd0\x32\
-\x85\x11\x2a\xbd\x4e\x01\xcf\xba\xa9\xb4\x29\x20\x60\x85\x41\xbb\
-\x15\x86\xef\x18\x56\x34\xda\xd7\x5c\x62\x0e\x5a\x00\xa1\x31\xe3\
-\x9f\x15\xe8\x7e\x29\xee\x4f\x80\xa0\x84\xda\xcd\xf2\xdf\xfe\x9f\
-\x37\x97\xf1\x06\x00\x2e\xf5\xfc\x1a\xf0\xdb\xbd\x77\xea\x81\x0b\
-\x70\xc1\x43\x35\xef\xc2\x80\xf6\xa3\xd1\x04\x9c\x33\x46\x6f\x2f\
-\xfe\x82\x2b\x5e\xd5\x19\xb7\xae\x91\xcb\x84\xc1\x53\x30\xe0\x29\
-\x5a\x5f\xfa\xda\xb1\x7a\x4e\x61\x89\xea\xc3\xf4\x20\x8f\x9c\xea\
-\x8f\x79\xfa\x79\x81\xfe\x6f\x45\xef\x7f\xb1\x78\x25\xdf\xbb\x89\
-\xff\x37\x00\xf0\x64\xc3\x80\x1f\xef\xbd\x53\xe7\x3d\x3c\x70\x1e\
-\x66\x73\xa8\x66\xe0\xd2\x2d\x82\x40\x65\xb4\x81\xca\xe8\x02\xce\
-\x99\x0c\x41\xb4\x08\x95\xe1\x88\xae\x29\x26\x70\x10\xa0\x18\xf3\
-\xd8\xf9\x47\x37\xe1\xe1\x73\x41\x6e\xac\x56\xbf\x24\xf6\x55\x13\
-\xcf\x59\xa2\xf9\xd5\x88\xc1\xcf\xb3\xfb\xe7\xc6\xf0\x93\x08\xf8\
-\xe9\xd1\xf7\xe3\x3f\xb0\x99\x02\xb4\x01\x80\x27\x79\xfe\x15\x70\
-\xbe\x67\x58\x1f\x3f\x03\xb5\x06\xfa\x9f\x32\x02\xad\x30\x58\xc5\
-\x90\x40\xe2\x47\xba\x59\x02\x6d\xd5\x1e\xab\x5b\x7a\x57\x15\xec\
-\x40\x79\xe4\xd8\xaa\x78\x9f\x35\x8c\xbc\x14\x06\xe4\x86\x3e\x65\
-\xfc\xa5\xdf\x95\x3e\xcf\x3d\xb9\x2b\xdc\x37\x2f\xb0\x80\x2d\xca\
-\xea\xff\x39\x42\x89\x4f\x55\x7c\x27\xff\xcd\xe6\xf2\xdd\x00\xc0\
-\x93\x3d\x77\x03\x3f\xdb\x7e\x55\x01\x8f\x2e\xe0\xc1\xf3\x30\x9f\
-\xc7\x78\x3f\x02\x41\x65\x34\x80\x2a\x69\x03\x15\xcc\xc4\x50\x5d\
-\xe9\xd8\x40\x65\x6a\x06\x56\x79\x73\x77\xc0\x78\x7e\x0c\x14\xdc\
-\x84\x20\xb7\xca\xf8\x6d\x3c\x5f\xaa\xd9\x1f\x4b\xe5\x89\x31\xf4\
-\x12\xdd\xcf\x3d\xbc\x35\xfa\x2d\x03\x04\x5b\x05\x56\xf0\x29\xc6\
-\xba\xfc\xdf\x03\xfc\xd2\xe6\xf2\xdd\x00\xc0\x53\x71\x7e\x78\xe0\
-\x5b\x3e\xf6\x58\x90\x07\xab\x68\xfc\xae\x1a\xb2\x00\xab\x11\x24\
-\xe1\xb0\x8a\xdf\x6b\x99\x00\x01\x08\x90\xf1\xb8\x7d\x95\xa0\xb7\
-\x8a\xfe\xbb\x35\xbd\xfe\x98\xf1\x8f\xf5\x26\x94\x54\x7c\x37\x22\
-\xee\x4d\xe5\xf3\x67\x05\x83\xdf\xca\xee\xcb\xc3\x83\xad\xc8\xcb\
-\x1e\x66\x6c\x12\xf0\x3f\x63\xa3\xfe\xaf\x75\x36\xa5\xc0\xab\xcf\
-\x7f\x01\x7e\x19\xf8\x9c\xf6\x1d\x7b\x78\x0f\x1e\x38\x0b\xb7\x9c\
-\xe8\x4a\x64\x91\xee\x62\xb4\xb3\x85\x53\xac\x5f\x35\xdd\x46\x1c\
-\x88\x83\x32\x1b\xb3\xe4\xd2\xee\x1e\x28\x50\xed\x31\x8f\xcc\x1a\
-\x34\x7c\xac\x68\x07\x86\xdd\x79\x63\x55\x89\x3e\xf3\xf8\x79\x4d\
-\xbf\xd5\x15\xd4\xc4\xfb\x9e\x61\x9d\x3f\x94\xd3\x81\xb3\x82\x2e\
-\x90\x0b\x7f\x09\x3c\xee\x23\xf4\xff\x0f\xaf\xe0\x4f\xf5\xb4\x9b\
-\xcd\xd9\x00\xc0\x93\x3c\x0d\xf0\x43\x2d\x00\x10\x2f\xea\x0f\x3d\
-\x02\x37\x9c\x08\x21\x80\x12\x3a\x05\xa9\xba\xd4\x5f\x6b\x78\xb1\
-\x71\xc8\x2b\xd4\xc6\x8a\x04\xf0\x55\xb7\x19\x47\x34\x00\x85\xe8\
-\xea\x74\xde\x94\x92\xcf\x01\x58\x44\x3e\x2e\x4c\x57\xb0\x0a\x6b\
-\xec\x49\xe8\xf3\x06\xa0\x12\x50\xd8\x06\xa7\x19\xe5\x9e\x06\x0b\
-\x08\x55\x16\x26\xcc\x19\xef\xfb\xdf\x26\xd4\xfd\x7f\x6a\xd4\xfb\
-\xff\x68\x94\x06\x37\x67\x03\x00\x4f\xd9\xf9\x49\x42\x4d\xf9\xeb\
-\x7a\x2c\xe0\xee\x47\xe1\x8e\x6b\x43\xaf\x40\xde\x84\x63\xaf\x4e\
-\xd1\xae\xbc\xd7\xa5\xcf\x7d\x00\x0a\x47\x57\xb3\x2f\x59\xc3\x8d\
-\xd3\xd5\x71\xbe\xac\xf0\xfe\xa5\xa0\x6f\x6c\xff\x9e\x30\x1e\x8a\
-\xb8\x82\x71\x5b\x76\xd2\x64\xc0\xa4\x2b\xc0\x29\xef\x27\xc8\xfb\
-\xfd\x4b\x35\x01\xe9\xf9\x3f\x11\x63\xff\xe1\xd5\xfb\x38\xf0\x0f\
-\x36\x97\xeb\x06\x00\x9e\xea\xb3\x00\xde\x49\x28\x0e\xea\x2e\xe4\
-\x0f\x3e\x0c\x37\x9f\x80\xdd\x79\x88\x38\x5b\x03\x90\xae\x1f\x40\
-\x1c\x48\xdd\x19\xb7\xd7\xae\xb0\x48\xe2\xbc\xc1\x1e\xb5\x17\xd3\
-\xa8\x23\xfd\x46\x9c\x52\x9e\x7d\x1d\x70\x18\x6b\x2d\x4e\x8f\x6b\
-\x46\x40\xc3\x15\x58\x80\xad\x4e\xb4\x4c\x00\xfa\x73\x0e\x24\xfb\
-\xbc\x34\xed\xc7\xa6\x03\x4b\x23\xbe\x72\x50\x98\x03\x0f\x02\x0f\
-\x8d\x5e\xb9\xff\x90\xcd\xf4\x9f\x0d\x00\x5c\xa6\xf3\x1f\x81\x9f\
-\x02\xbe\xbc\xbd\x78\xcf\x36\xf0\xfe\x07\xe1\x8d\x2f\x8a\xc3\x42\
-\xa2\xa5\x38\x82\xfa\xdf\xa4\x91\x42\x69\x82\x4f\x13\x26\xe7\x48\
-\x0c\x15\xbc\xef\xc2\x03\x7c\x16\xdf\x4b\x37\x11\xb8\xa5\xfd\xba\
-\xda\xf8\x5d\xc1\x8b\x4b\x81\xfa\xfb\x89\x90\x40\x18\xce\x2c\xb4\
-\x9e\xbe\x29\x3c\xa6\xc4\x34\xf2\x12\x61\x26\x04\xc4\x92\xf7\xb7\
-\xdf\x9f\x47\xaf\xff\xb1\xd1\xff\xcf\x27\x81\xff\x7d\x73\x99\x6e\
-\x00\xe0\x72\x9e\xbf\x00\xbc\x05\x38\xd4\xbe\x7b\x77\x3f\x01\x37\
-\x3f\x0e\xb7\x5e\x15\xf7\xcf\xfa\x28\x02\x36\xc6\xc3\x4a\x60\x01\
-\xc9\xd3\x7a\x1f\x0c\xb0\x8e\x1e\xde\x79\xf0\xd1\xba\x34\x6a\x01\
-\x4e\xfb\x21\x84\x64\x99\x02\xd1\xb2\x7a\x3f\xe6\xb9\x4b\x43\x44\
-\xad\xb1\xfa\xcc\x30\x6d\x3c\xdf\x2e\xf7\x1c\x01\x98\x52\xb7\x7d\
-\x45\x7f\xe8\x47\x1e\x56\xcc\x18\x0e\xfd\xb0\x3a\x40\x65\xd8\x45\
-\xba\xff\x83\x84\xca\xbf\xf2\x55\xfb\xfd\x9b\xd8\x7f\x03\x00\x97\
-\xfb\xbc\x17\xf8\x01\xe0\xaf\xb6\x46\xe0\x81\xf7\xdc\x07\xa7\x8e\
-\xc2\xa1\xad\x30\x0b\xbf\xa2\xdb\xc3\x67\xa9\xb3\x6b\x42\x2d\x40\
-\x93\xe6\xe7\x49\x37\x52\x4b\x35\xcc\x0f\x68\x7b\xf1\x31\x75\x02\
-\x6a\x8c\xdb\x80\xc1\x80\x09\x58\x50\x30\x43\x48\xc8\x62\xfe\x92\
-\x3e\x50\xd1\x1f\xe9\xa5\x23\x6c\x21\x19\xb5\x0d\x05\x66\x99\xbe\
-\x60\x43\x80\x7c\xb9\x27\x0c\x87\x7c\x96\x98\x80\x33\x32\xca\x16\
-\x61\xb0\xf7\x3d\xa3\xc2\xdf\x2f\x45\xf1\x6f\x73\x36\x00\x70\xd9\
-\xcf\xdf\x04\xbe\x18\xf8\xbc\xd6\x70\x4e\x2f\xe1\x3d\xf7\xc2\xef\
-\x7e\x49\xa8\x0d\xf0\x51\x03\x48\x54\x3e\x4d\x10\xf6\x31\x0c\x68\
-\x45\x33\x9f\xad\xd9\x4a\xa9\xc0\x26\x63\x01\x66\xf8\x28\x3e\x3c\
-\x1f\x0c\xc7\x67\x89\xf4\x85\xc4\x04\x02\x3e\x3e\x57\x4c\x54\x0c\
-\xaa\x0c\xed\x08\xaf\xb1\xc1\x24\x96\x09\xe4\xd5\x8a\x79\x83\x93\
-\x8e\x08\x8d\x96\x61\x90\x19\xfa\x58\x5d\x41\x45\xa8\xf5\xff\xed\
-\xf8\xbb\x87\x00\x70\x01\xf8\x93\x6c\xf2\xfe\x1b\x00\x78\x1a\x05\
-\xc1\x3f\x42\xa8\x0d\x38\xde\xbe\x8b\x1f\x7f\x02\x4e\x3d\x00\xaf\
-\xba\x05\x96\xcb\x2e\xff\x2f\xe6\x63\xba\xf9\x74\xbf\x8f\xf3\xf3\
-\x5d\x0c\x0b\x62\x70\x9d\x18\x81\xa4\xec\x80\xd9\x00\xe2\x5c\x77\
-\x5f\x6b\x54\xda\x19\x7f\x7b\xbf\x51\xfe\x34\x5f\x2a\x62\x96\x9a\
-\xf4\x46\x96\x49\xb7\xe6\x2b\x01\x90\x4a\x27\x5c\xa6\xcf\x4b\x47\
-\x18\xce\xf8\xa3\x20\x48\x96\x7a\x06\x4a\x95\x84\x96\x31\xbc\x97\
-\x50\xf8\x53\xbe\x5a\xff\x12\xf0\xae\xcd\x65\xb9\x01\x80\xa7\xf3\
-\xfc\x0e\xf0\x87\x80\x7f\x01\x48\x7b\xb1\xfe\xd6\xfd\x70\xe2\x30\
-\xdc\x76\x0a\xf6\x17\x86\x06\xbb\x21\x13\x70\x11\x00\xd2\x47\x4f\
-\x64\x0e\xde\x18\x67\xdc\x43\xa0\xc4\x51\xe0\x26\x75\x68\xeb\x05\
-\x9c\xef\xd7\x1f\x38\x33\xb4\x54\xdc\x50\xe5\x4b\x4d\x48\xd6\x9b\
-\x8b\xcb\xd6\x88\xab\x01\x2a\x63\xf8\x9a\x65\x2d\x06\xbb\x11\x33\
-\xda\x2f\x05\x61\x90\x35\x8c\x5e\xa2\xf0\xf7\xde\x48\xff\xe7\xc5\
-\xff\xc3\xcf\x03\x3f\xb8\xb9\x1c\x37\x00\xf0\x4c\x9c\x1f\x07\x5e\
-\x0e\x7c\x5f\x7b\x41\x37\xc0\xaf\xde\x0d\xbb\x5b\x70\xed\xf1\xb0\
-\x21\x27\x79\x7a\xcb\x08\x9c\x04\xd1\xcf\x47\x4d\xc0\x47\xca\xef\
-\xbd\x31\xbe\x04\x04\x49\x4b\x48\xbb\x08\xa2\x67\x16\x53\x37\xe0\
-\x5c\x59\x0b\xc8\xbd\xaf\x5d\x59\x26\x19\x10\x58\x77\x9d\x58\x41\
-\xaf\x40\x48\x46\xa6\x10\x49\x7f\x62\x70\x2e\xfb\x97\x00\x60\x9d\
-\x96\xe1\x19\x61\x98\xf7\x47\x46\xaf\xd2\xfb\x80\xef\x64\xb3\xf3\
-\x6f\x03\x00\xcf\xe0\x79\x27\x70\x07\xf0\xb5\xad\x1e\x70\xbe\x86\
-\xff\xfe\x11\x78\xcb\xcb\xe1\xc4\x21\x58\xd6\x21\xee\x6f\xe7\x04\
-\xc6\x99\x81\xae\xe9\xb4\x02\x8d\x60\xa0\x3e\x32\x00\xdf\xa7\xe5\
-\xc9\x00\x5b\x6a\xef\x4d\x28\xa0\xfd\x05\x25\xe9\x31\x2e\x06\xf7\
-\x69\x93\x11\x46\x3c\x54\xc9\x52\x78\xda\xf7\xe8\xd6\xa8\x61\xcd\
-\x35\xe3\x52\xa6\xfe\x30\x3d\x67\xa0\xf4\x98\x19\xa1\xd8\xe7\xbd\
-\x8c\xf5\x3d\xec\x03\xdf\xc6\x66\xe5\xd7\x06\x00\x9e\xe1\xe3\x81\
-\xef\x00\xae\x22\x6d\x13\x9a\x01\x4f\x2c\xe0\x17\x3e\x0c\x6f\x79\
-\x05\x1c\xde\x09\x99\x81\x76\x81\x47\xfa\x58\x05\x10\x50\xcb\x10\
-\xe2\x38\x71\x8d\x65\x83\x09\x10\xc4\xac\xdc\xb1\xb1\xbd\xa4\xec\
-\x80\x99\xdc\xeb\x6c\x01\x91\x74\x3d\x06\xb6\x34\x39\x0f\x09\x72\
-\xc1\xcf\x8f\x79\x7c\xcd\x00\x41\x0c\x60\x98\xe7\x2c\xad\x52\x17\
-\xa3\x3f\x4c\x4d\x45\x9a\x03\xf7\xc7\xa8\xde\x33\xd6\xae\xf6\x27\
-\x80\x9f\xdb\x5c\x7e\x1b\x00\x78\x36\x9c\x33\xc0\x37\x10\x0a\x85\
-\x3e\x0b\xe2\x45\xfc\xf0\x45\xf8\x85\x0f\xc1\x17\xbe\x02\x76\xb6\
-\xa1\x59\x76\x41\xae\xa6\x9c\x7f\xb4\x0a\x1f\xaf\xf4\x96\x01\xc4\
-\xcf\x89\x02\x61\xe2\xe9\x76\x29\x69\x9b\xf2\x33\x1f\x49\x00\x60\
-\xbf\xe7\xfa\x5f\xf7\xe8\x79\xca\x3a\x24\xef\xad\x1d\x48\xf5\x16\
-\x81\x58\xed\x20\xdb\x7f\xd8\xf3\xfc\x76\x63\x32\xe5\x30\x20\x81\
-\x53\x0e\x40\xc9\xf8\x1f\x02\xfe\x47\x24\xf6\xe5\x94\xdf\xf7\x02\
-\xff\x68\x73\xd9\x6d\x00\xe0\xd9\x74\x1e\x06\xbe\x86\x30\x3b\xe0\
-\x33\x80\x98\xbb\x3e\x07\xff\xf5\xb7\xe1\xf7\xbc\x02\x8e\x1e\x0a\
-\x89\x2a\x51\x03\x02\x2e\x32\x01\x1f\xbd\x7e\x63\x0c\x3f\xaf\xc2\
-\xf1\xc6\x80\xbd\x49\xf7\x45\x61\x30\x6d\x2c\x42\xc2\xf3\x91\xeb\
-\x01\xe6\xa3\x5d\x61\xd6\xdb\x17\x10\x7f\x9f\x66\xb1\x7f\x43\x77\
-\x7f\x9e\x41\x18\xec\x03\x34\xcc\x41\x74\x64\x4d\x58\xc6\x18\xd2\
-\x95\xf8\x49\xc2\x62\xb6\xbd\x51\xe3\xff\xab\xc0\xff\xba\xb9\xdc\
-\x36\x00\xf0\x6c\x3c\xf7\x02\x5f\x15\x41\xe0\xe6\x96\x09\x3c\x78\
-\x1e\x7e\xf6\xfd\xf0\x05\xaf\x80\x53\xc7\xa0\x5e\xc4\x18\x3c\x25\
-\xb9\x93\xf1\x57\xb4\x75\xb6\x9a\x19\xbe\xf5\xfa\xed\xe7\x06\x04\
-\x68\x8c\x10\x68\x94\x7f\x47\x1f\x2c\x7a\x29\x45\x5b\xa9\x63\x81\
-\x80\xfe\xc7\x54\x3b\x90\xd2\x83\x64\xdf\xeb\x01\x46\xce\x28\xa4\
-\xff\x78\xeb\xed\xc5\x00\xcc\x1c\xb8\x4b\xc3\x04\xbf\x71\xcf\xff\
-\x17\x09\xd5\x7e\x9b\xb3\x01\x80\x67\xed\xf9\x60\x64\x02\x3f\x05\
-\x5c\xd7\x82\xc0\x23\x17\xe1\x67\xdf\x17\x98\xc0\x4d\x57\xc3\x22\
-\x2d\xb2\x4f\xf1\x7d\xd5\x19\x7e\x4a\xf7\xb5\xb5\xb7\xd9\x6c\x70\
-\x29\x7d\x34\xc6\xef\xbc\xf1\xf0\xc4\x66\x24\xed\x34\x03\xb1\xd5\
-\x40\x25\x00\xd0\x7e\xbc\x9f\x3e\x77\xf9\xfd\xd6\xf0\x33\xd1\x72\
-\xc0\x16\xe8\x87\x09\xb6\x00\xa9\x8a\xef\xda\xaf\x33\x56\xe8\xb3\
-\x00\xfe\x0c\xf0\xb7\x37\x97\xd7\x06\x00\xae\x84\xf3\xeb\x84\x86\
-\xa1\xff\xbb\xc7\x04\x4e\x2f\xe0\x67\xde\x07\x9f\xf3\x52\x78\xe9\
-\x4d\x71\x16\x40\x13\x0d\x38\x36\x05\xa5\x95\xe3\x44\x31\x50\x52\
-\xe7\x8d\x76\x1f\xdb\xe5\xa4\x04\xe6\xe0\xcc\x3a\x2f\xfb\x3d\x67\
-\x0c\xbc\x15\xdd\x7c\xa6\x5f\x42\xaf\xe8\xdf\x02\x40\xbb\x42\xcc\
-\x18\x38\x46\x13\x50\x93\x52\x24\x36\x34\xe5\x9e\xdf\xae\x2a\x6b\
-\x45\xc3\xf8\x23\xb3\xc8\x28\xde\x0d\xbc\xcf\x34\x39\xf5\xcf\x3d\
-\xc0\x77\x61\xc7\xb2\x6d\xce\x06\x00\xae\x10\x10\xf8\x52\xe0\xdf\
-\x01\x2f\x6c\xdf\xe9\xbd\x06\x7e\xee\x83\xf0\xe9\x33\xf0\xfa\xcf\
-\x80\xed\x94\x21\xf0\x5d\x38\x40\x13\x8d\xd8\xc7\xae\xc1\x6c\x9d\
-\x90\x6b\x8c\x0e\x30\x33\x4c\xc0\x84\x08\x6d\x28\xe0\x33\xcf\x6f\
-\xe3\xff\x14\x06\x98\x45\xa6\xe4\x0c\x20\x19\x7b\xd5\xdf\x17\xd8\
-\x4b\x11\x16\x76\x0a\xe6\xa5\xc6\x92\xaa\x09\x23\x48\xa4\x71\xde\
-\xbf\xa2\xf0\x71\xed\x1a\x83\xfa\xe7\x17\x09\x19\x96\xcd\x6a\xef\
-\x0d\x00\x5c\x91\xe7\xbd\xc0\xef\x05\x7e\x02\x78\x15\x18\xe6\xfd\
-\x9b\xf7\xc3\xa7\xcf\xc2\xe7\xbd\x02\xae\x3d\x09\x75\x1d\x57\x7d\
-\xa7\xce\x9a\x18\x1a\xf4\x68\xbe\x37\xc0\xa0\x06\x28\x34\xd3\x04\
-\xb2\xda\x00\xf2\x8f\xf4\xef\xc3\x77\xc6\x69\x3d\x7c\xcf\xdb\x27\
-\xc3\xf7\x86\x11\xc4\xef\x57\xda\x0f\x01\x7a\x20\xe0\x0c\x3b\x21\
-\x0e\x45\x8d\x46\xff\xab\x0a\x8f\x6b\xa9\xc2\xef\x02\xf0\xd7\x81\
-\xbf\x46\xe8\x02\xd8\x9c\x0d\x00\x5c\xd1\x9a\xc0\x5b\x08\x7d\xea\
-\x5f\x0b\x6c\x21\x04\x0f\x78\xff\x19\xf8\xc9\xdf\x80\x37\xbe\x04\
-\x5e\xfe\x02\x98\x6d\xc5\x54\xa1\x66\xc6\x9f\x42\x01\xdf\xad\x25\
-\x6f\x01\xc2\x1a\xbc\xfd\xbe\x7d\x0e\xc9\x7e\x16\x06\x75\xc0\x95\
-\xf1\xec\x76\xe5\x78\xbb\xe6\x5c\xbb\xd9\x05\x2d\xfd\x4f\x65\xcb\
-\x1a\x5b\x99\x23\xd3\xd0\xc6\x88\x85\x66\xc6\xe1\xb6\xc0\x79\x85\
-\xf7\x34\xf0\xfe\xd8\x32\x3d\x34\xfe\x9f\x05\xfe\x38\xf0\xe1\xcd\
-\xa5\xb3\x01\x80\xe7\xca\x79\x98\xd0\x42\xfc\x7a\xe0\xf6\xf6\xde\
-\x39\x70\xb1\x86\x9f\xff\x20\x7c\xfc\x61\x78\xd3\xcb\xe0\xba\xab\
-\x63\x53\x50\x9d\x19\xf2\xac\x6f\xe8\x3d\x2d\xc0\x32\x84\x9c\xfa\
-\xe7\x20\x60\x42\x82\x76\x38\x41\x6e\xfc\xb5\x01\x01\xdf\xa5\xf2\
-\x9c\xcf\xee\xf3\x5d\xfb\xb2\x8b\x00\xa1\x31\xcb\xe0\x22\x43\xf0\
-\x1e\xe6\x3e\x00\xdb\xc7\x80\xdf\xf0\xf0\xb0\x76\xc3\x3e\x87\xe7\
-\x58\x64\x4d\x33\xec\x72\xd6\xcd\xb9\x6c\x47\x54\xf5\xf2\x3d\xfb\
-\xf7\xcb\xf3\xf9\xbd\x9d\x01\x5f\x42\x28\x59\xfd\x22\xe0\x48\xf1\
-\x51\x4a\x48\x7d\xed\x0a\xdc\xf9\x02\x78\xcd\x4b\xe1\xf8\x91\x38\
-\x33\xa0\xe9\x1b\xad\x33\x9e\xdb\xaa\xfd\xe9\x31\xce\x97\xc3\x01\
-\x9b\x42\xec\x15\x03\x99\xd5\xc4\x6a\xb2\x0d\xd6\xf3\xa7\xa6\xa4\
-\x14\x2a\xb4\x5e\xdf\xf7\xbf\xa7\xe6\xbe\xf4\xfa\x5c\xc3\x85\xfb\
-\x1c\x67\x3f\xf0\x62\xae\xbd\xeb\x93\xc8\xb9\x47\xc2\x50\x4f\x58\
-\xb5\xdd\x68\x1f\xf8\x19\x42\xb3\xd5\x7f\xc4\x2e\x67\x79\xbe\x9e\
-\x77\xea\x06\x00\xae\x90\x73\x04\xf8\x7d\x04\xf5\xfa\x0d\x93\x8f\
-\xcc\x37\xeb\x38\xb8\x70\x7c\x9b\xbd\x17\xdf\xc6\x89\x3b\x5f\x8c\
-\x3b\x79\x14\x1a\x85\xa6\x36\x14\x3f\xf5\x02\xd0\x19\xaf\x33\x46\
-\x67\x99\x40\xeb\xed\x33\x96\x30\x58\x35\x6c\x0c\xbf\x9d\x47\x40\
-\x67\xd8\xda\x98\x32\xe5\x04\x06\xbe\x5f\xba\x9c\xd8\x41\x15\x42\
-\x96\xbd\xfb\x94\x7b\x7f\x75\x97\xfb\x7e\xeb\x18\xcb\xe5\x55\x5c\
-\x73\xe3\x29\x5e\x38\x7f\x84\x93\x4f\xfc\x56\x08\xf3\x77\xe9\x0f\
-\x20\x19\x3f\x1f\x26\x6c\x68\xfa\x97\x84\x75\xdf\x1b\x00\xd8\x00\
-\xc0\xb3\xd6\xf0\xff\x27\xe0\x8f\x11\xba\x04\x57\x1b\xbd\x59\x7e\
-\x51\x0b\x7c\xfa\x22\x3c\x7a\x1a\x96\x7b\xb0\x7d\x7c\x8b\x6b\x3e\
-\xf3\x36\xae\x7a\xcd\xed\x54\x57\x9f\x8c\xce\x7a\xd9\xcd\x09\xb0\
-\xd5\x7f\xbd\x3c\xbf\xa5\xff\x79\xfe\xdf\xf7\xb3\x01\x16\x04\xac\
-\xf1\x27\x6f\x8f\x31\xfe\x96\x19\x24\xa3\xaf\xbb\xcf\x45\x61\x16\
-\xe6\x19\x5c\xf8\xc4\x82\x7b\x7e\xc1\x71\xff\x7b\x77\x58\x5e\xdc\
-\x65\xb6\x3b\x67\xb6\x55\xa1\xe2\x98\x1f\x39\xc5\x8d\x47\x8f\x72\
-\xcb\x13\xbf\xcd\xd6\x63\x1f\x86\xc3\x84\xdb\x9c\xfe\x96\xe1\xf2\
-\xb9\x08\xfc\x3f\x91\x15\xfc\xa7\xe7\x9d\x40\xb8\x01\x80\x67\xed\
-\xd9\x05\xbe\x25\x1a\xfe\x2b\x26\x0d\x3f\x19\xfd\x36\xdd\xb6\x1b\
-\x81\x33\x0b\x78\xe4\x02\x5c\x8c\xf5\x41\xbe\x0e\xb6\x5e\xef\xc3\
-\xf6\xf1\x19\x27\x5f\x79\x2b\xa7\xee\x7c\x21\x3b\x37\x5f\x0b\xdb\
-\x5b\x61\xbf\x80\x6f\xe8\x2b\xfe\xd0\xef\x11\xf0\x19\x03\xc8\x94\
-\xff\x76\x82\x47\xd2\x02\xa2\xd7\xd7\x9a\x5e\x23\x52\xcf\xf0\x7d\
-\xd7\xa8\x84\x0f\xcc\x63\xd6\xa0\x67\xf7\x79\xe2\xc3\x17\xb8\xff\
-\x57\xf7\x79\xf0\x37\x85\xc5\xc5\x6d\xb6\x0e\xcd\x99\x6d\x6f\x23\
-\xf3\x39\xae\x9a\x53\xcd\xe6\x88\xab\x60\xbe\xcd\xe1\x93\x37\x70\
-\xdb\xf2\x71\x4e\xdc\xf3\x0b\x50\xef\x85\x09\x8b\x3b\xf1\x16\xdf\
-\x93\x15\xac\xe0\x83\x84\xec\xca\x8f\x13\x1a\x86\x37\x00\xb0\x01\
-\x80\x67\xe4\x7c\x25\x61\x1e\xc0\xeb\x26\xbd\x7d\x5a\x68\xb1\xdb\
-\xbf\xc0\x17\x0a\x8f\x2f\xe0\xdc\x22\x8a\xe7\xe6\x96\xbe\xae\x97\
-\xc1\x46\xdc\x16\x1c\xbb\xed\x2a\x4e\xbc\xfc\x56\x4e\xdc\x71\x33\
-\xf3\x53\x27\x61\x7b\x1b\x1a\xdf\xef\x1e\x6c\x8b\x7e\x0a\xa0\x80\
-\x61\x08\x79\x85\xa1\x7d\x0e\x32\xda\x9f\xca\x95\x5d\x2c\x2a\x72\
-\x35\x5c\xd8\xe7\xc2\xfd\x67\x79\xe8\xdd\xa7\xf9\xd4\xbb\xce\xf3\
-\xc4\xdd\x9e\xa6\x9e\xb1\x75\x78\x8b\x6a\x6b\x86\xab\x66\xb8\xd9\
-\x16\x6e\xbe\x4d\x35\xdb\xc2\xcd\xb6\xa8\x66\x5b\x48\x55\xa1\xce\
-\xe1\x8e\x5c\xc5\x8d\xbb\x5b\x5c\x77\xef\x2f\xe3\x9e\xb8\xaf\x5b\
-\x06\xb2\x15\x81\x60\x1b\xb3\x5d\x69\xf4\xfd\x3f\x47\xd8\x02\xfc\
-\xcf\x08\x1b\x9c\x9a\x0d\x00\x6c\x00\xe0\xe9\x38\x9f\x13\x0d\xff\
-\x6d\x93\xde\x7e\x2b\x1a\xbd\xbd\x98\xa3\x7d\x9d\x13\x38\xd3\xc0\
-\xa2\x01\xea\xce\xde\x7c\xdd\xe9\x7f\xbe\x89\xa1\x76\x1d\x84\xf4\
-\x7a\x11\x32\x6e\xb3\x13\x8e\x63\x2f\xb9\x8a\xa3\x2f\xb8\x89\x13\
-\xb7\x5e\xcf\xd6\xa9\x6b\x70\x3b\x5b\x30\xdf\x8a\xbf\xc3\x78\x6f\
-\x9b\x06\x24\xab\x1b\xb0\xe5\xbf\x16\x08\x06\x45\x43\x35\x2c\xf7\
-\xa9\xcf\x5e\xe0\xc2\x7d\x8f\xf3\xc8\x87\x1e\xe7\xf1\x8f\x3c\xc1\
-\xe3\x9f\xd8\x67\x79\x0e\x9c\x54\xcc\x5c\x68\x6c\x72\x32\x47\x5c\
-\x04\x80\x6a\x8e\xdb\xda\x09\x00\x30\xdf\x42\x66\x5b\xb8\x59\x60\
-\x04\x54\x0e\xd9\x3a\xcc\xb1\xe3\x57\x73\xf3\xc3\xef\x66\x7e\xdf\
-\xfb\xc2\xfb\x65\xf7\x09\xa6\xdd\x80\xd5\x5a\xff\x93\xff\x01\xfc\
-\x08\xa1\x02\xf3\xf1\x0d\x00\x6c\x00\xe0\x72\x9c\x5b\x80\x3f\x0f\
-\xfc\x7e\x4a\x89\xac\xd4\xc0\xb7\x4b\xa0\xb5\xdb\xe6\xfe\xf8\xd1\
-\x3b\x38\x3b\x83\x0b\xd1\xb0\xb5\x09\x1a\x9f\x8f\x6c\xbc\x69\xcc\
-\x7d\x4d\x57\x63\xe3\xe7\xe0\x77\xe2\x47\x17\x6b\x87\x6a\x70\x73\
-\x98\xef\xec\x70\xfc\xfa\x93\x6c\x5d\x75\x2d\xc7\xae\x39\xce\xee\
-\x35\x57\xe1\x0e\x9d\xa0\xda\x9a\xc1\x56\x3e\x62\x37\x1f\xe6\x5f\
-\x47\xc7\x59\x77\xb7\x65\x4d\x7d\x71\x41\x73\xe6\x51\xce\xde\x7f\
-\x86\xd3\x9f\x3c\xcb\xde\x83\x8f\xf1\xe8\xdd\xe7\x59\x9e\xad\x59\
-\x5e\x88\xbf\x77\x4b\x10\x11\x44\x1c\x0e\x87\xe0\x10\x75\xd0\xcc\
-\x10\x9d\xe3\x64\x8e\x9b\x6d\x21\xd5\x1c\x99\xef\xe0\xe6\x5b\x54\
-\xf3\x2d\x64\xb6\x8d\xab\x66\xc8\x2c\x2c\x57\xdd\xbd\xea\x66\x6e\
-\x78\xfc\x43\xec\xde\xf3\x8b\xdd\x0e\x80\x7c\x27\xc0\x7c\x6d\x20\
-\xf8\x04\xf0\x4f\x80\x7f\x4c\x58\x20\xb6\x01\x80\x0d\x00\x3c\x25\
-\xe7\xdb\x09\x7b\x01\x6e\x1b\x78\xfb\xd4\x5f\x73\xc8\x88\x5a\x96\
-\x65\xc7\x5b\x3d\x87\x33\x5b\x50\x2b\xe8\x32\xc6\xfb\x96\xf6\xfb\
-\xbe\xe7\xf7\x0e\x74\x17\x74\x07\x34\x0e\x1b\x6e\x7c\xf7\x73\xea\
-\x3b\xa0\xa8\x17\x81\x3d\x54\x15\x48\x25\xc8\x6c\x8b\x23\xc7\x77\
-\xd8\x3d\x7e\x08\xd9\xde\x46\xe6\x3b\xa8\xcc\xa0\xda\xa5\x9a\x09\
-\xbb\x47\x66\x9c\x7f\x7c\x89\x7a\x8f\x2e\xcf\x81\xf7\xf8\xbd\x8b\
-\x34\x17\xf6\x39\xff\xd0\x05\xce\x7e\x7a\x01\x8b\x25\xf5\x5e\x78\
-\xee\xb4\xdc\x58\x5c\xb6\x05\xdc\x85\xa2\x20\x11\x87\x13\x41\xa4\
-\x42\xa4\xc2\xc9\x0c\x69\x66\x68\x33\x43\x5c\x30\xfa\x6a\xbe\x8d\
-\x9b\xed\xe0\xe6\xdb\x91\x11\xcc\x91\x6a\x06\x22\xcc\x8f\x5d\xcf\
-\xb5\x8b\x47\x38\x72\xd7\xcf\x40\xb3\xdf\x19\xbc\xdd\x15\x38\xa3\
-\x9f\x39\x98\xbe\xbc\xee\x23\xac\x09\xfb\xc7\x3c\x17\xf6\x05\x6c\
-\x00\xe0\x19\x3b\xaf\x21\xf4\xa1\xbf\xad\xe8\xf1\x2b\xe0\x28\x21\
-\x07\x90\x16\x61\x36\x0c\xea\xe1\x17\x3b\x70\x7e\x27\x7a\xfa\xba\
-\xa3\xf6\x36\xde\xf7\x51\x58\xf7\x73\xd0\x43\xc1\xf8\x7d\x15\xef\
-\xf3\xdd\xe3\x12\x50\xa8\x1a\x96\x10\xc3\xf7\x7a\xd9\x65\xe5\x9a\
-\x45\x08\x1d\xb4\xe9\x6e\xf8\x0e\xaf\xea\x45\xf7\x3a\xd3\xaa\xc2\
-\xce\xb0\xe3\x05\x42\x37\x86\x10\xc3\x21\x52\x34\xe1\x08\x0f\x10\
-\x02\x1b\x70\x52\x21\x2e\x00\x81\x73\x15\xa2\x73\xd4\xcf\x11\xbf\
-\x85\xb8\xed\x68\xfc\x3b\xc8\x3c\x7c\x2e\xf3\x2d\xa4\x9a\x05\x00\
-\x39\x7c\x15\x57\xbb\x25\x47\x3f\xf0\xef\xa0\xb9\xd8\xd1\xff\x7c\
-\x4b\x70\x6a\x9b\x58\xae\x05\x04\x1f\x27\x94\x16\xff\xf0\x15\xad\
-\x11\x5c\x26\x00\xd8\x54\x02\x8e\x9f\x1d\xe0\x7b\x80\x3f\x1d\x4d\
-\x7c\x48\xf5\x4f\xc4\xdb\xdc\x08\xea\x85\x99\xfa\xfb\xc7\x60\x6f\
-\x27\x7c\xdf\xc5\xb9\x1b\x69\x2e\x88\xc3\x64\xf6\x76\xc1\x1f\x02\
-\x77\x38\xf4\xdf\x78\x0d\x0b\x85\xda\x1d\x22\x74\xb3\x3c\x25\x6e\
-\x17\x4f\xed\xfd\xea\xbb\x61\xc3\x49\x02\x98\xcd\x62\xb2\xc0\x0a\
-\xf8\xbe\xd3\x1b\xe6\x3b\x1d\x40\x69\x56\x22\xd0\xab\x1a\x56\x33\
-\x5a\x20\xa2\x42\x5b\x74\xa8\x20\xaa\xb1\xeb\x58\x10\xf1\xa6\xac\
-\x41\x03\x90\xc4\xf7\x47\xe2\x7b\xe4\x5c\xec\x52\xae\x04\xe7\x25\
-\x00\x46\xe5\x70\x7b\x4f\xf0\xd8\xee\x71\xb8\xf3\xf7\x71\xf4\xfd\
-\xff\x0a\xea\x8b\xc3\xce\xe5\x64\xf0\x3b\x31\xd4\xda\x8f\xb7\x71\
-\x20\x78\x21\xf0\xf7\x09\x53\x9b\xfe\xbf\x84\x71\xee\x9b\xb3\x01\
-\x80\xc9\xf3\x06\xc2\xb8\xe9\x37\x0d\x0c\x5f\x08\x05\xab\x57\xc7\
-\x0b\xd0\x1a\xbe\x1d\x7a\x19\x1f\xbb\x7f\x12\xf6\x77\x83\xd7\x77\
-\xa9\xab\xd6\x45\x20\x48\xb7\x39\xf8\x23\x50\x1d\x05\x99\xf7\xeb\
-\x6d\xd2\x1a\xc1\x64\xa0\x69\x78\xb0\xc4\xe7\x4a\x95\xbe\xea\xe2\
-\xec\x51\x17\x7f\x8f\x37\xd5\xba\x4d\xf7\xb9\x5d\xf7\xd5\xcb\xf2\
-\xb9\x72\x91\xa0\xdd\x33\xd2\x9b\x2e\x46\x36\x99\x1c\x45\x34\xec\
-\x0e\x0b\xba\x40\x13\x80\x21\xfd\xba\xca\xe3\xe6\x0a\x5e\x91\x46\
-\xa1\x11\x5c\x1d\x35\x04\x27\x38\xef\x70\x33\x07\x8b\xb3\x9c\xae\
-\x8e\xc3\xab\xdf\xc1\xd1\xdf\xf9\x57\xd0\x9c\xef\x98\x55\x7e\xe6\
-\x31\xec\xaa\x63\x3e\x20\x55\x06\x94\x81\xe0\x77\x13\xc6\x88\xff\
-\x75\xe0\x2f\x47\xd8\xd8\x00\xc0\xe6\x2d\x18\x9c\x3f\x1b\x85\xbe\
-\xc3\x3d\x4f\xee\x23\xcd\xbf\x2e\x02\x80\xd2\xed\xa2\xb1\xeb\xb3\
-\xd3\xc5\x57\xc1\xfe\xd5\x50\x1f\x02\x17\x87\x00\x69\xd5\x2d\x04\
-\x6e\x9f\x73\x37\xf0\x0b\x77\x28\x96\xd5\x47\x7a\xdf\xdb\xe7\x29\
-\x66\x67\x88\x19\xd5\xaf\xd2\x3d\x1e\x8d\xde\xbf\x94\xc2\x77\xa6\
-\x58\xaf\x31\x40\x60\x6e\x9a\x7b\x59\xd7\x01\x80\x18\x21\x53\xb2\
-\x2d\xe6\xc3\xcf\x3d\x2e\x6e\x45\x16\x3c\x22\x8a\x78\xc5\x89\x0f\
-\x21\x46\x8c\xe5\xc5\x0b\x12\x19\x8c\x38\x41\x9c\x43\xbc\x43\xaa\
-\x0a\xf6\xcf\x72\xc6\x1d\x47\xee\x7c\x07\x47\x7e\xfb\xc7\xfa\x4c\
-\x20\xd7\x5f\xcc\x7b\xc8\xc5\xa8\xff\x5f\x64\x6c\x9a\xf0\x16\xf0\
-\xe7\x62\x16\xe7\x0f\x01\x1f\xda\x00\xc0\xe6\x58\xaa\xf8\xb7\x09\
-\x7d\xfc\xdd\x49\xd3\xba\x6e\x01\x6e\x88\x86\x11\x05\xbc\x56\x90\
-\x92\xec\xa2\x74\xb0\xb8\x1e\x9a\x5d\x90\x65\xb8\xe8\xdb\xbd\x1a\
-\xd1\xd3\xca\x0c\xfc\x61\x90\x63\x41\xe0\x4b\x71\x7e\xc4\x8e\x6e\
-\x78\x70\xa4\xf5\x76\xeb\x78\x7e\x4b\xb4\x3f\x8d\x03\xd4\xb8\x76\
-\xc0\x56\xf2\xb6\x73\x46\xc5\x0c\x1b\x2e\x4c\x1d\x53\x3b\x7d\xcc\
-\x4c\xeb\x15\x33\x85\x1c\x3b\x72\x90\x0e\x20\xda\xf0\x40\x15\x51\
-\xdf\x66\x08\x90\x26\x76\x02\xc7\x81\x20\x4e\x91\x2d\x10\xaf\xa8\
-\x17\xdc\x32\xb0\x00\x5c\x08\x09\x98\x6f\xc1\xe2\x0c\xe7\x66\x27\
-\x71\x77\x7e\x23\x87\x3e\xf0\x63\x41\x13\x28\x31\x01\x5b\x34\x74\
-\x3c\x86\x64\x8f\x46\xd9\xaf\x19\xcd\x1c\x7c\x7e\x64\x03\x7f\x02\
-\xf8\xd7\x1b\x00\xd8\x9c\xaf\x00\x7e\xa8\xa7\xf0\x27\x31\xef\xaa\
-\x08\x0d\x47\xa3\xc7\x37\xc3\x7d\x7b\xc6\xef\xba\x0b\x6e\x79\x7d\
-\x30\x6e\xb7\xec\xc6\xfe\x4b\xd5\x5d\xb0\x12\x29\xbf\x3b\x1c\x0d\
-\xbd\xe9\x9e\x42\xcd\xe4\x70\x97\x19\xba\x34\x66\xc5\xa0\xb9\x9f\
-\x48\xff\xed\x60\x61\x67\x26\x8d\x27\xa3\x27\x1f\x38\xec\xe9\x6d\
-\xf0\x95\xc8\x32\xbc\xef\x53\x7e\xf2\x79\x22\xf9\xa4\xf1\x82\x2e\
-\x00\xda\x86\x00\x20\xe1\xf3\x04\x0e\x3e\xec\x25\x90\x34\x15\x48\
-\x41\x6a\xe9\x98\x80\x73\xc8\x7c\x0b\xdd\x3f\xcd\xb9\xdd\x93\xf0\
-\xca\x6f\xe0\xd0\x07\x7f\x1c\xfc\x8a\xea\x5f\x1f\x7d\xfc\x2d\xc0\
-\xa9\x98\x07\x38\x4d\x7f\x01\x49\x77\x6e\x20\xf4\x18\xfc\xcd\xa8\
-\x0d\x2c\x37\x00\xf0\xfc\x3b\x8e\xb0\xdc\xe3\xcf\xf7\x2e\x91\x26\
-\x5e\x48\xb7\xc7\x8b\x09\x73\x79\xd8\xea\x34\xc9\xe8\xff\x0c\xea\
-\x68\xfc\x52\x0f\x81\x42\x24\xe4\xf2\xf5\x28\xb8\xdd\x8e\x92\x63\
-\x14\xf7\xde\xc4\xed\x28\x18\x26\x11\x30\x0d\xd7\xc9\x8d\x5f\x9b\
-\xbe\xee\xa0\x06\x08\xb4\xea\xd3\x7e\x0b\x04\x98\x1e\x1e\x3b\x27\
-\xb4\x37\x74\x88\x6c\x18\xb1\xf1\xba\x8e\x0c\x14\xe8\x0f\x20\x0e\
-\x60\xd0\x0d\xf7\x97\x58\x64\x24\x0a\xae\xd1\x40\x06\x66\xe1\x8f\
-\x52\x2f\xc8\xd2\x81\x73\x81\x0d\x54\x0e\xe7\x02\x13\x38\xbf\x7b\
-\x1c\xf7\xb2\xaf\x65\xe7\x23\x3f\x01\x7e\xd1\x13\x58\x8b\xf1\xbe\
-\x1a\x81\xf6\x53\x84\x71\xad\xe3\xc3\x46\xbf\x1b\x78\x11\xf0\x07\
-\x22\x77\xd8\x00\xc0\xf3\xe4\xdc\x1c\xd5\xe1\x2f\xeb\x5d\x38\x35\
-\x70\x2d\xa1\x9d\xe7\x18\x61\x24\x65\xc1\x98\x07\x31\xbf\x83\xe6\
-\x7a\xf0\x47\x41\x16\x9d\x17\x6f\x57\xf3\xf9\x90\xd6\x93\xa3\x11\
-\x5c\xd2\x50\x1f\x6b\xe0\x66\x07\x68\x1b\x4d\xf8\x6e\xbb\x18\x44\
-\xa5\x3f\x1a\x7d\x23\x5d\x0b\xbe\x18\x8d\x20\x4d\xf8\x6e\xb5\x00\
-\xe9\x7b\xfb\x1c\x04\xda\x75\x05\xe6\x7e\x31\x1a\x82\xdd\x51\xda\
-\x1b\xe9\xaf\xfd\x35\x04\x76\xda\x78\xab\x0d\x48\x02\x01\xbb\x3f\
-\xa0\x46\x54\x71\x4d\xd0\x05\x98\x39\x98\x4b\xc8\x6a\xd4\x40\xe5\
-\xa0\x71\xa1\x5a\x90\x2d\xd8\x3f\xcb\xf9\x43\x27\x71\x2f\xfa\x52\
-\xb6\xee\xfe\xb7\xe1\x35\x8f\x85\x03\x16\xc4\xe7\xd1\xb4\xaf\x25\
-\xf4\x14\x3e\x4a\xb7\x90\xb4\x7f\xbe\x0a\xb8\x11\xf8\x26\xe0\xae\
-\x0d\x00\x3c\xf7\xcf\xeb\x09\xf5\xe3\x9f\xd1\xbb\x60\x04\x78\x59\
-\xbc\xd7\x45\x9d\xd8\x1a\x7e\xae\xf4\xbb\x8e\xbe\xfb\xeb\xc1\x9f\
-\x0c\x31\x7f\xf2\xe8\xc9\xe8\x44\xa3\x80\x78\x24\xc4\xfe\x76\xff\
-\x07\x69\x4b\x97\x59\xfd\xe7\xcd\xaf\x48\x4a\x7f\x5a\xd6\xe3\x8c\
-\xd1\x27\x0f\xde\xea\x05\x66\xb5\xa0\x9a\xd5\x82\x76\x94\xbf\xb8\
-\xac\xf5\xdf\x99\x2c\x86\xcf\xc2\x01\xc7\x60\x2a\xb9\xd8\xf9\x21\
-\x59\x33\x62\xaf\x17\x29\xb7\xcb\xf8\x03\x22\x29\x3c\x48\xf7\x3b\
-\x68\x42\x36\x80\x99\xa0\xea\x60\xe9\x3a\xfd\xc0\x39\xa4\xda\x82\
-\xfd\x27\xb8\x70\xf4\xc5\x54\xb7\x7e\x2e\xd5\xfd\xff\xbd\x03\x51\
-\xcf\x70\xe5\x98\x05\x83\x26\x32\x81\xd7\x47\xd3\xfe\x18\x63\xd3\
-\x87\xdf\x40\x98\x41\xf0\x8d\x84\x99\x8e\x1b\x00\x78\x8e\x9e\x6f\
-\x04\xfe\x5e\xbc\x2c\x3a\x7a\x7f\x84\xd0\xd2\x73\x53\xfc\x7a\x99\
-\xd1\xfd\x52\x17\x6d\xfa\xf6\x35\xe0\xaf\x09\x3f\x23\x62\x52\x6a\
-\x89\x7e\x1f\x0a\x1a\x82\x54\x1d\x60\x24\xe3\x4f\x9e\x5d\xcc\x7a\
-\xed\xa4\x05\x88\xd9\xbf\x91\x96\x08\xb7\x61\x82\x40\x25\x66\x3c\
-\x9f\x59\x3d\x88\xef\x33\x01\x5f\x58\x03\xd0\x3a\x65\x67\xc2\x01\
-\x19\xae\x0d\x10\x2b\x12\x62\x32\x03\x86\x09\x8c\x8d\x1c\xec\xa5\
-\x15\x53\xfc\x9f\x26\x20\x6b\x48\xa1\x88\xaf\x5b\x6a\x93\xea\x01\
-\x14\x87\xd4\x0e\x89\x4c\x20\xe8\x02\x73\xf4\xc2\xc3\x9c\xbb\xf6\
-\x4d\x1c\xd5\xf3\xb8\x4f\xbf\x3b\x78\xf8\xa9\x79\x02\x09\x14\x52\
-\x48\xf7\x2a\x42\xfa\xf6\xbd\x84\xb4\xe1\x70\x24\xd9\x8b\x09\xad\
-\xc6\xdf\x09\xfc\xfb\x0d\x00\x3c\xf7\xce\x5f\xc0\x2e\x97\x48\xd3\
-\x78\x6e\x04\xde\x18\x55\xe4\xfd\x42\xac\x9f\x1b\xbe\xf1\x36\x7a\
-\x1c\xfc\x75\x26\x0e\xae\xba\xe1\xb7\x22\xc0\x61\xd0\xc3\xa1\x94\
-\x56\xd3\xe8\x7f\x3a\x63\x4f\x61\x42\x9a\xa8\xdd\xda\x87\x09\x09\
-\xac\xd1\xdb\xcd\xe1\xed\xa6\x6e\xc9\xe6\x72\x1a\xf0\x68\x43\x08\
-\xe9\xe6\x73\xb6\xc6\xe1\xcd\xe7\x95\x99\x4b\xda\x64\xba\x80\xf4\
-\x9d\xaa\x64\xeb\x04\x2c\x28\x68\x8f\xfa\xf7\x0d\x54\x5a\x61\xc3\
-\x77\x71\x4c\x02\x8a\x46\xa2\x4e\x22\xc8\x2c\xf4\x15\x90\x34\x01\
-\x71\x50\x45\x70\x38\xf3\x20\xe7\xaf\x7b\x0b\x47\x9a\xb3\xc8\xd9\
-\x8f\x0c\x8d\x58\x46\x80\x20\xfd\xef\x6e\x8d\xc2\xee\x6f\x44\x7d\
-\x60\x38\x91\xf8\x14\x61\xf8\xc8\x77\x45\x96\xb8\x01\x80\xe7\xc0\
-\xd9\x26\xa4\xf8\xbe\xab\xa7\x18\x7b\xe0\x95\x02\xbf\x8b\x30\xc9\
-\x26\xa7\xfc\xae\x40\x31\x5d\x67\x38\xba\x0b\x7a\x63\x34\x62\xdf\
-\x17\xe4\xc4\x01\x3b\xa0\x47\xe2\xb5\xee\x8d\xaa\x9e\x0b\x56\x99\
-\xa7\xc4\xc6\xe2\x64\x40\x00\xbd\x05\x3f\xc9\xa6\xc4\x82\x03\x26\
-\x23\x20\x50\x19\x8f\xde\x02\x84\x2d\x0c\x32\x0b\x3c\xc5\x86\x05\
-\x4d\x37\x12\x30\xfd\x3e\x31\x93\xc4\xd3\x56\x32\xeb\xf5\xd5\x32\
-\x02\x3a\x26\x22\x76\x1b\x59\x3b\x5a\x2c\xd1\x95\xba\x03\x1e\x89\
-\xc5\x41\x73\x41\x71\x50\x07\x2d\x80\xda\x81\xab\x90\xd9\x8c\xe6\
-\xc2\x63\xec\xdd\xf4\x76\x76\x3f\xfe\x20\x34\x67\x47\xd6\x8f\x51\
-\xde\x42\x9c\x42\x82\x2f\x04\xde\x43\xa8\x04\x70\xe4\x3b\x09\xb6\
-\x09\x0d\x45\x87\x80\x7f\xb8\x01\x80\x2b\xfb\x9c\x02\xfe\x4f\x6c\
-\x7e\x3f\xc5\xfb\x6f\x72\x70\x67\xfc\x7a\x19\x41\x40\x0b\x31\xbf\
-\xcb\xbc\x65\x5c\x61\xad\xd7\x83\x6e\xd1\xa5\x06\xe9\x42\x00\xb6\
-\x63\x58\x61\x17\xe6\x9a\xc7\xa4\x78\x5f\xcd\x24\xae\x36\x2c\xb0\
-\x21\x01\x7d\x63\xea\xfd\x4c\xd5\x17\x08\xdb\xca\x40\xcc\x1e\x0e\
-\xc9\xe8\xbf\xa9\x46\xb4\x03\x80\xac\xbe\xe1\xe8\xfe\xee\x54\x71\
-\x98\x80\xa2\x7d\x7e\x5b\x11\x28\x66\x89\x71\xb6\xd5\xcc\x65\x46\
-\x29\xed\xfb\x6b\xe2\x28\x05\x15\x89\xc5\x41\x0e\x4d\xb1\x7f\x64\
-\x02\xba\xac\x10\x57\x21\x55\x85\x54\x0e\xf1\x0b\x96\xf5\x2e\xd5\
-\x0b\xbe\x9e\xad\x7b\xfe\x59\x68\x7a\x28\xd5\x63\x94\x98\x81\x0d\
-\x09\xde\x14\x59\xdf\xbb\x28\xd5\x0c\x54\x84\x66\xa2\x5d\xc2\x54\
-\xe7\x0d\x00\x5c\x81\xe7\x16\x42\xa1\x47\x37\x9b\xaf\x0e\x9e\x99\
-\xdf\x33\x83\x97\x0a\xec\x37\x7d\xa3\x77\x0c\x53\x7c\x05\x20\xd0\
-\x6b\x02\xbd\x4f\x19\x02\xb1\x9b\xb1\x76\xc2\xf7\xc4\x3e\x5e\x3a\
-\x2f\x9d\xe8\x70\x8f\x15\x18\x6f\x9c\xa6\x6f\xb7\x46\x93\x42\x87\
-\xd8\x21\x98\x8c\x0e\xe3\x9d\x5b\x8a\xef\x8c\xe7\x36\xc5\x44\x6a\
-\x00\x2c\x8d\x17\x4c\xfa\x41\x4f\xec\x33\x2c\xc4\xd6\xfd\x6b\x7c\
-\x5d\x29\xdb\xd0\x5b\x33\x48\x97\xed\x68\xb5\x81\x2a\x03\x31\xb2\
-\xf7\x55\x23\x13\xf0\x3e\x0a\xa5\x49\x13\x70\x61\x3e\x5a\xcb\x04\
-\xe2\x22\xd5\x65\xd4\x04\x2a\x07\x6e\x1b\xd9\x3f\xc3\xfe\xe1\x53\
-\xb8\x9b\xde\xc6\xec\xc1\x9f\xea\x83\x98\xa5\xfd\x63\xe1\x41\x02\
-\xab\xd7\xc4\x6c\xcf\x2f\x12\x96\x92\x0e\x2d\xe2\x07\xe3\x4f\xfe\
-\xe0\x06\x00\xae\xac\xf3\x52\xc2\x70\x88\x57\xf6\xc4\xbe\x63\xc0\
-\xdb\xb7\xe1\x56\x81\xbd\xba\x6b\x75\xcb\x3d\xbf\xcf\x42\x00\x53\
-\x30\xa3\x27\x40\x4f\x46\x43\xcb\x15\xe8\x2d\x90\xc3\xdd\x73\x89\
-\x51\xed\xb5\xea\x53\xef\x64\xe8\xb6\x92\xce\x32\x63\xa9\x3a\x4a\
-\x2f\x59\xa5\x5f\x1b\x7b\x4b\xbf\x91\x47\x7d\xa8\x2c\xc4\x4c\x04\
-\xb7\x46\x9e\xdb\x84\xb3\xfb\x3c\xb3\x3e\x06\x0b\x04\xb6\xef\x20\
-\xd1\xf5\xd6\xde\xb4\xef\xfd\xc5\x02\x89\x1b\x86\x0e\x2d\x10\x55\
-\xa0\x71\xf6\xa0\xa8\x47\xb5\x01\x59\x20\xaa\x51\x13\x70\x71\x8c\
-\x58\x15\xde\xb4\x3a\xf4\x24\x8b\x73\x50\x6d\xc1\xde\xe3\xec\x1f\
-\x7b\x05\xd5\x35\x0f\x20\xa7\xdf\x55\x36\xf8\x52\x28\x60\x0b\x83\
-\x6a\xe0\x8e\xc8\xd6\xfe\x0b\x70\xb6\x28\x0e\xfe\x4d\x03\x06\x1b\
-\x00\xb8\x02\xce\x67\x46\xe3\x7f\x51\x7b\xcf\x02\xb8\x56\xe0\x4b\
-\x77\xe1\x7a\x63\xfc\x69\x8f\x9e\x4e\x78\x7e\xeb\xb5\x76\x81\x6b\
-\x0a\x17\x58\x0c\x0b\xda\x79\x00\xde\xac\xce\x93\xcc\x3b\x62\xa8\
-\x3e\x59\xfc\x69\x0b\x7a\x8c\xb0\x98\xc7\xe9\xe4\x40\x52\x88\xe3\
-\x5b\xa3\xcb\x04\x3f\xb5\xcc\xc4\x16\xf2\x14\x40\xa0\x7d\x5a\x31\
-\xe2\xa5\xcb\x42\x19\x3f\xfe\xba\x7a\x99\x80\xec\xeb\xb6\x86\x21\
-\x52\x21\x11\x1f\xb3\x13\xb1\xdc\xb1\x09\xb1\xbf\x38\x07\x33\x17\
-\x66\x0b\x2c\x22\x0b\xf0\x21\x1c\xd0\xf3\x8f\xb0\x77\xf2\x2d\xec\
-\x2e\x3e\x09\xf5\x43\x21\xf4\xca\xbd\xff\xaa\x4e\xda\x05\xa1\x06\
-\xf4\xcb\x09\x89\xc0\x4f\xc7\x10\x61\x08\x02\xfa\x5c\x0b\x07\xdc\
-\x73\xd0\xf8\x3f\x0b\xf8\xe9\x9e\xf1\xef\x03\x37\x39\xf8\xba\x63\
-\x70\xe3\x2c\x0c\xe3\x4b\xbc\xdd\x26\xae\xa7\x6e\x49\x58\xbb\xba\
-\x8b\x15\xc5\xd2\xfa\x0a\xe4\x88\xb9\x70\xcc\xf7\xc4\xf5\x0d\xac\
-\x35\x1c\x97\x3d\x26\x7e\x2d\x55\xbc\xb9\xce\x4b\xb7\xbb\x43\xdb\
-\x56\xda\x38\x9c\xc3\xde\x17\x74\xb2\x70\xb3\xf7\x99\xc7\xb7\x3f\
-\x57\x75\x43\x3e\x9c\x33\xb7\x6a\x78\x93\xca\x3c\x47\xfa\x3c\xd6\
-\x24\xb8\xc2\xef\x68\x9f\x0b\xf3\xf7\x48\xff\xe6\x62\x1a\xb3\xbd\
-\x4f\x7d\x7b\xc3\x37\x88\xaf\x11\xbf\x40\xeb\x7d\xa4\xde\x47\xfc\
-\x1e\x8e\x8b\xe0\xf7\xc3\xb4\xd4\x7a\xd1\x0e\x43\xa8\xf7\xce\xb3\
-\xbc\xee\x2b\x41\xb6\xfb\x0d\x5a\x53\x27\xff\xff\x2e\x08\xc5\xc1\
-\x5f\x19\x3f\x2e\x8a\x3f\xf5\x83\x84\x26\xa2\x0d\x00\x3c\x4b\xcf\
-\xeb\x81\x9f\x24\x64\xf3\x3b\xe3\xbf\xb5\x82\xaf\xbb\x0a\x4e\xcd\
-\x3b\xc1\xae\xbd\x12\x0b\x2a\x7f\x89\x36\x6a\x14\x8c\x0e\x15\x3c\
-\xa6\xa3\x1d\x01\xd6\x5e\xd0\xe9\x0d\x36\xcf\x27\xae\x70\xe1\x39\
-\x73\x7f\x66\xcc\x22\xd1\x00\x73\x83\xab\xba\xc7\x60\x8d\xb2\x00\
-\x10\x52\x65\xc0\x62\x41\x23\x33\x58\x0b\x18\xce\x18\x75\x35\x0b\
-\x25\xbb\x6e\xd6\xbd\x9e\x2a\xfd\x5e\xe9\x00\x21\xfd\x0e\x67\x41\
-\xaf\x60\x8f\x62\x9a\x9b\x2a\x0b\x94\xea\x91\xd4\x56\xec\x6b\xc4\
-\x2f\x91\x66\x01\xcb\x3d\x64\x79\x11\xfc\x45\x84\x3d\x58\xee\x23\
-\xf5\x02\xea\x25\xe2\x15\xa9\x2f\xb0\x68\x8e\xd3\x5c\xfd\x96\x00\
-\x00\x3a\xa2\x3b\x30\xa1\x09\x48\x0c\x11\xaf\x8a\x20\x70\x13\x63\
-\x0d\xc3\x7f\x97\xb0\xec\x65\x03\x00\xcf\xb2\xf3\x06\x42\xf1\xc6\
-\x8d\x3d\xe3\xbf\x6d\x0e\x5f\x7f\x2d\x9c\x8c\xb3\xb8\x5c\xb4\x4a\
-\xa7\x7d\x20\xc8\x8d\x1e\x03\x06\x1a\x55\xfd\x93\x23\x17\xce\x56\
-\x70\x3e\xbd\xfb\x5d\xc1\xe0\xe9\xd4\xff\xf6\x2e\xeb\x05\xcd\xcf\
-\xb4\x06\x6a\x18\x43\x91\x41\x24\x66\x50\x8d\x30\x8a\xf8\x3d\xcb\
-\x0c\x92\x11\x3b\x29\xb0\x82\x11\x20\x69\x7f\x7e\x96\x31\x81\x1c\
-\xb0\xf2\xd7\x65\x7f\x4f\xba\x65\xaa\x7c\xda\x1b\x1a\x3e\xf7\xb8\
-\xd8\x4d\x88\x6f\x10\x6d\x90\x38\x23\x5d\x9a\x7d\x44\xf7\x82\x5a\
-\xb7\x8c\xb3\xca\xfc\x12\x51\x81\xfd\xc7\x59\x6c\x7f\x26\x7a\xec\
-\x55\xdd\xa4\xa0\x83\x32\x81\xa4\x13\x9d\x20\x14\x07\xdf\x52\x64\
-\x02\x0e\xf8\x47\xc0\x3b\x36\x00\xf0\xec\x39\xaf\x06\xfe\x6d\x24\
-\x6f\xc6\xf3\xcf\xe1\x1d\x37\xc3\xf1\xdd\x30\x4b\xdf\x65\x73\xf4\
-\x7b\xfb\xf5\x0a\x4c\xc0\x5e\x24\x27\x43\x8c\x2f\xf9\x45\x33\x07\
-\x39\x44\x9b\xb3\xcf\x59\x44\x9b\xd2\x93\x61\x58\x40\x66\xb0\x98\
-\xf4\xa0\x05\x85\xf4\xfd\xd6\xd3\xe6\xb4\xbf\x14\x06\xd8\x90\xa2\
-\xf0\xb8\x96\xda\x1b\x50\x70\x99\xf7\x77\xd2\x0f\x73\x7a\x3f\x6b\
-\x9f\x4b\xba\x9f\x49\x1e\xbe\xbd\xcf\xb0\x01\x97\xe9\x6f\x42\x06\
-\x8a\xa6\x5a\xd0\xa5\xd1\x45\xcd\x32\x34\x00\xf9\x38\x1f\xbd\xbe\
-\x88\xf8\x3d\x50\x13\x0a\x34\x75\x98\xb3\x70\xe1\x31\x96\xc7\xde\
-\x16\x26\xab\xe4\x63\xd9\xa6\x3c\x7f\x0e\x06\xcb\xc8\xf6\xbe\x26\
-\x32\x81\x21\x08\x6c\x11\x26\x10\x7f\xc9\x06\x00\x9e\xf9\xf3\x19\
-\x03\xcf\xbf\x00\x6e\x9c\xc3\xd7\xdf\x1e\x8d\xbf\xe9\x5b\x6e\xdb\
-\xba\xe6\xfa\x9c\xb4\x74\x41\xa4\x3a\xfe\xc3\x0c\x73\xcd\x29\xdf\
-\xef\xb2\x0b\x88\xcc\xb0\xed\xaf\xa6\x4b\xcd\xd9\xaf\xed\x4b\x1b\
-\xc4\xfb\xae\xe0\x59\x73\x6d\xc1\x7a\x6c\x43\xff\x2d\x95\xcf\x9f\
-\x13\x57\x60\x0b\xd9\xf3\x58\xe3\xce\xbf\x27\x46\x23\xb0\x8f\x1f\
-\x80\x58\x1e\x12\x54\xe6\xfd\xc9\x99\x90\x69\x31\x74\xea\x91\x38\
-\x2c\x51\x9a\x25\x52\xef\x07\xcf\xdf\xec\x21\x7a\x11\x69\xf6\x61\
-\x11\x42\x01\x8d\xba\x41\xbd\xaf\x34\x27\xbf\xbc\x3f\x90\x95\x15\
-\xa2\x60\x09\x04\xea\x08\x02\x5f\x0d\x5c\x5f\x04\x81\x43\xc0\xff\
-\x05\xbc\x79\x03\x00\xcf\xdc\xb9\x2d\xc6\xfc\x2f\xe8\xa5\xfa\xae\
-\x9d\xc3\x3b\x5e\x09\x27\x8f\x06\xda\xdf\x9b\x65\x95\xf7\xad\x16\
-\x02\x55\x53\xdd\xc6\x2c\xa6\x0e\x19\x7a\xf1\x76\x93\x0d\x65\xd1\
-\xb0\xd7\x2b\x6f\xda\x78\x7b\xc2\x60\x66\x2c\x39\xcd\xc7\x88\x68\
-\x2d\x13\x90\x02\x18\x30\x12\x02\x54\x59\x68\x51\xf5\xe9\x7a\x8f\
-\x29\x48\xe1\xf3\x2a\x63\x1f\xe6\x7b\x3d\x26\x20\x99\xe0\x67\x74\
-\x0b\xcb\x8c\x5c\x65\x98\x05\x43\xcd\xa4\xfd\xf7\xf8\x24\x0a\xc6\
-\x69\xa9\xcd\xa2\x03\x81\xfa\x62\x60\x03\xfe\x22\xda\xec\xc7\xf0\
-\x60\x19\xc6\x8d\x2d\xce\x50\xcb\x0b\xd1\x23\xaf\xe9\x04\xc1\x29\
-\xea\xbf\x8a\x09\x5c\x1d\x99\xc0\xd5\x94\x26\x06\x9c\x24\xcc\x14\
-\xb8\x73\x03\x00\x4f\xff\xb9\x2a\xbe\xf9\x5d\x47\x5f\x0d\x1c\xad\
-\xe0\xeb\x5e\x0b\x57\x9f\x0a\xf4\x31\x6f\x58\xb7\xf9\x34\x60\x72\
-\xc6\xb4\x12\x06\x81\xcc\xfb\x0f\xd3\x38\xd4\x43\xb6\xfa\xc5\x3d\
-\xb9\x66\x58\x8a\x33\x4b\x9e\x71\x00\x2c\xf6\xb1\x55\xc1\xe0\x24\
-\x8b\xb9\xab\xbe\x11\x26\xe1\x31\x67\x13\x3d\x83\xad\x0a\x1f\xab\
-\x21\x48\xd8\x8f\xbd\xb0\xc0\x65\x7f\xbb\x0c\x7f\xbf\xfd\x3b\x92\
-\xf4\x22\x26\xe6\xb7\x5a\xc8\x00\x9b\x01\x92\x28\x18\x47\x22\x6b\
-\x53\x07\x1d\xa0\x65\x02\x41\x18\x0c\xa1\x40\x1c\x7f\x0c\xf8\x8b\
-\x8f\x51\xef\x7c\x51\x17\x0a\xac\x9b\x0e\x2c\x39\x82\x94\x1d\xf8\
-\x2a\xba\xc2\xaf\xfe\xb9\x21\xa6\x9c\x6f\xdb\x00\xc0\xd3\x77\x12\
-\xfd\x7a\x7d\x7b\x4f\xea\x11\xff\x9a\xd7\xc3\x8d\x37\x85\xc1\xfb\
-\x52\xfa\xf3\x9a\xec\x62\x28\x48\xc4\xc9\xd8\xb7\x32\xea\x6f\x23\
-\x87\xed\x69\x0f\x22\x59\xb4\x51\x4c\x2b\x8e\x7d\x2f\xf3\x8a\x79\
-\xc6\x60\x60\xc4\xd2\xcf\x0a\xe0\x86\x22\xa4\x14\xd2\x91\x94\x8c\
-\x3c\x03\x84\x9e\x0e\x91\x81\x03\x59\x88\x92\xc0\x03\xa3\x23\xd8\
-\x74\xa7\x35\xf2\xde\xdf\xa8\xd9\xdb\xd0\xfb\x97\xf8\xd0\x41\xa8\
-\x4d\xf8\x9f\xfa\x26\xb2\x80\x3d\xa8\xf7\x10\x7f\x31\xec\x11\x48\
-\x99\x01\xdf\x20\x5a\xd3\xec\x2b\xcd\xb1\xaf\x18\x4e\x6a\xce\xff\
-\xc7\xab\x42\x01\x89\x7a\xd2\x0b\x62\x76\x60\x46\x69\xb8\xf8\xed\
-\xd1\x19\x5d\xb5\x01\x80\xa7\xe7\xfc\x03\xe0\xed\x74\xd7\x48\xf8\
-\x67\x7e\xc5\x67\xc1\xed\x77\x44\xd8\x4e\x45\xee\x39\xf4\x4b\x41\
-\x1d\x1e\xe9\x29\x3d\x5a\x10\x03\x09\x8c\x40\x5d\xc1\xa9\x48\xf9\
-\x22\x92\x15\x17\x59\x2e\x41\x48\x96\x85\x90\x1c\x48\x5c\x59\x9c\
-\x23\xcf\x22\x48\xa7\x03\xd8\x0b\xda\xb9\xa1\x7e\x80\xeb\x0b\x98\
-\x6d\x08\x52\x19\x50\x31\x3a\xc2\xc0\xf8\x5d\x37\xc1\x58\xc6\xd8\
-\x40\x4e\xf3\xc7\x42\x26\xfb\xbd\x54\x29\xe8\xe3\xd0\x44\xbf\x0c\
-\xde\x3e\x51\xff\x08\x02\xda\xec\xa3\xcb\x20\x08\x86\x2e\xcf\x33\
-\xd4\xcd\x0b\xd1\xdd\x3b\xbb\xd4\xa0\x1e\x20\x1b\x90\x9f\x05\x61\
-\x56\xc4\x97\x8c\x3e\xd7\xeb\x81\x1f\x8d\x81\xe1\x06\x00\x2e\xe3\
-\x79\x27\x61\x1b\x6f\x67\x81\x4b\xe0\xf3\x5f\x01\x9f\xf9\x39\x01\
-\xae\xb5\xee\x66\x6e\x17\x8b\xd1\x57\x1c\x1f\x3d\xfc\x4e\xe1\x47\
-\x66\x51\xf9\xcf\x45\x3c\xb2\x38\xbe\x60\xf4\x52\xea\x4e\xb3\x1e\
-\xd1\xf5\xbd\xab\x65\x12\x2a\x13\xa1\x82\x89\xb7\xb1\x8a\x7c\x65\
-\x00\xa3\x1a\x11\x11\x6d\x51\x93\xcb\x3c\x3e\x99\x16\x20\x99\x6e\
-\x91\x83\x81\xf4\xb3\x1f\x79\x68\xd0\x0b\x09\xac\xa6\x41\x57\x92\
-\x6c\x41\xb0\x05\x43\x1f\x10\x5e\xb4\x41\xe3\xee\x34\xa9\x17\x31\
-\x14\xd8\x8f\xa2\xe0\x5e\x1b\x0a\x68\x04\x01\xdd\x7b\x9c\x7a\xeb\
-\xad\x21\x4d\xe3\x99\xde\x3a\xbc\x6a\xa6\x40\x0a\x31\x7f\x17\x61\
-\xc0\xf8\xa2\xf8\x33\x5f\x4a\xa8\x13\xd8\x00\xc0\x65\x3a\xdf\x14\
-\x01\x80\x5e\xba\xef\xce\x5b\xe0\xf3\xdf\x06\xba\x08\x29\x23\xcd\
-\x9a\xda\xdb\xd5\x39\xe6\x3f\x9d\x3e\x6f\x55\xe2\xac\x1c\xf8\xf0\
-\x88\x47\x9f\x0f\x0d\xbc\xed\x88\x1b\xbb\x70\xa4\xef\xf5\x06\x40\
-\x21\x13\xe1\x00\x43\xed\xc0\x7a\x48\x97\x8c\x3c\x7a\x6a\x97\xe5\
-\xe5\x73\x50\x19\x80\x80\xd5\x0c\x0a\xde\x5d\x32\x2d\x21\x67\x2d\
-\x03\xe1\x30\xab\x67\x48\x21\x93\xcd\x64\xe4\x7a\x88\x65\x00\x39\
-\xdb\x69\x7f\x8f\x5d\x4f\xee\x97\x41\x1c\x6c\x82\xf1\x53\x5f\x8c\
-\x7a\x40\xd4\x06\x96\xcb\xb0\x43\xcd\xd7\x34\xfb\x73\xfc\xee\x17\
-\xf7\x0b\x84\xf2\x19\x0f\x39\x08\x4c\x31\x05\x05\xbe\x80\xd0\x61\
-\x52\x2e\x14\xfa\x0e\xc2\x8c\xc9\x0d\x00\x3c\xc5\xe7\xb3\x23\xf5\
-\x97\x1e\x2d\xbb\xf5\x18\x7c\xc5\xd7\x85\xe6\x10\x7f\x21\xd2\x01\
-\xb3\x6e\xb7\x37\x02\xd7\x34\xd0\xab\xcf\x40\x40\xfa\xde\x7f\xbb\
-\x10\x39\xa4\xb5\x54\x23\x84\xa2\x97\xda\x9a\x32\x68\x86\x29\xb0\
-\x9c\x03\xe7\xde\x16\xca\x29\x43\x9b\xc5\xcc\x33\x01\xce\x15\xc0\
-\xc3\x7a\x79\x03\x1e\x52\xaa\x58\x34\x7d\xf2\xed\xdf\x64\x7e\x5e\
-\x4b\xe1\x43\x7a\x7c\x65\x8a\x7e\xb2\x70\x28\x4f\xbc\xf4\x0c\x5e\
-\xcb\xa5\x18\x61\x86\x40\x57\x20\xa4\xcd\xb2\x5b\x99\xbc\xdc\x87\
-\x45\x10\x05\xb5\x5e\x40\xbd\x40\x7d\x1d\x7e\x66\xf9\x04\xb5\x7f\
-\x25\x3a\x7b\xd1\x78\x28\x90\xa7\x0b\xa7\xaa\x06\xe3\xf0\x57\xbe\
-\x82\xb1\x42\x21\x80\xbf\x08\x7c\xfd\x06\x00\x9e\xba\x73\x1d\xa1\
-\xa7\xff\x68\x4f\xcb\x3b\x54\xc1\x57\x7c\x03\xec\x5e\x13\x06\x43\
-\xd0\xf4\x17\xe1\xb5\x5e\xc3\x18\x7a\x9a\x88\xa1\xf6\xeb\xf8\x31\
-\x45\x0b\x87\x0b\x17\x81\xa3\xdf\x3a\x35\x11\x2f\x6a\x1e\xe3\xae\
-\x91\x7e\xca\x69\x72\x1e\x2f\xe7\xa2\x5d\x31\x6e\xcd\xaa\x0d\x13\
-\x43\xc8\xd3\x8d\x14\xb2\x04\xb8\xa1\x97\xb7\x15\x89\x8c\x54\x1f\
-\x22\x7d\x06\xd2\xab\xf4\x29\x54\xfe\x08\x43\x71\xb4\x1d\x41\xee\
-\x46\x18\xb8\x29\x15\x0e\xff\x27\x1f\xd6\x28\x37\x71\x2b\x6a\x1d\
-\x8b\x82\x9a\x7d\xf0\x7b\x68\xdb\x2b\x10\xf6\xaa\xf9\xbd\x73\x34\
-\x5b\x6f\x83\x66\xde\x97\x85\xc6\x18\xc0\x3a\x21\xe2\xe1\x08\x02\
-\xbb\x45\x51\xd0\x11\x06\x89\xbc\x6e\x03\x00\x4f\xfe\xcc\x80\xff\
-\x83\xd0\xde\xdb\xfd\xa3\x3c\xf0\xb6\xb7\xc3\x8d\xaf\x84\xfa\x74\
-\xa8\x0c\xd3\x45\xbc\xd5\x06\x04\xb4\xdb\xba\x61\xd7\xe6\xb4\x46\
-\xdf\xcd\xa6\x6f\xbd\xff\x16\xc3\xde\xf2\x19\xfd\x82\x9f\x92\x77\
-\xd0\xa1\xb8\x95\xa7\xb9\x84\xb2\x08\x88\x99\x27\x20\x32\x9e\x55\
-\x28\xe9\x00\x39\x28\x48\xc1\x33\xe7\x35\x01\x79\xec\x2e\x79\x51\
-\x50\x55\xe8\x77\x28\x65\x2a\x5c\xb9\x76\xa0\x98\xfe\x24\x0b\x3d\
-\x72\x10\x18\x13\x04\x31\x7d\x5b\x89\xc9\xf9\x58\x25\xd8\xd4\x81\
-\x0d\xa4\xd4\x60\xbd\x17\xb3\x02\x8b\xa8\x05\x78\xf0\x17\x69\x16\
-\x57\xa3\xf3\x37\x74\x65\xc2\x53\x61\xc0\x3a\x40\xa0\x84\x2a\xc1\
-\xb7\x1b\x11\xba\x7f\x4e\xc4\x4c\xd5\x75\x1b\x00\x78\x72\xe7\x2f\
-\x90\x6f\xeb\xd9\x07\x5e\xff\x6a\x78\xdd\x97\x41\x7d\x06\xd8\x0b\
-\x29\xa2\x64\xfc\x7e\x19\x41\x20\x5d\x00\xda\xf5\xbd\xea\xc8\xcd\
-\x9b\x04\x63\xe9\x5d\xaa\x56\x18\x3f\x23\xb1\xa4\x1d\xca\x81\x89\
-\x36\xc6\xe2\x7e\x26\xd8\x01\x43\x36\x50\x6c\x2c\xca\x43\x0b\x37\
-\x04\x0d\xe7\x86\x21\x4b\xb1\x36\xc1\x8d\xa4\x21\x73\x90\x19\x49\
-\x2d\xf6\xfe\x7e\x1d\x11\x46\x65\x28\xfe\x8d\x6a\xa5\x5e\xdb\xcd\
-\x43\xe1\x7f\xbb\x0c\xc6\x6e\xab\x04\x7d\x04\x81\x7a\x19\xb3\x02\
-\x82\x2e\x9e\xa0\x76\x6f\x0e\x24\xb2\x19\xd1\x02\xa6\xf4\x80\x31\
-\x60\x78\x1d\xa1\xff\xb4\xac\x07\xdc\x41\x28\x19\x9e\x6d\x00\xe0\
-\xd2\xce\x17\x13\xb6\xb6\x74\x67\x09\xdc\x76\x0a\xbe\xe8\x9b\xa3\
-\xf0\x73\x0e\xf4\x62\xbc\x2d\xe3\xcd\xee\xd3\xae\x3b\x11\xd0\xc7\
-\x15\xba\x3e\xd2\x7e\x6f\xae\xcc\xb4\x55\x66\x6b\xa8\xce\x8f\xcc\
-\x92\x2f\xe7\x8d\x27\xc4\xe4\x55\x00\x22\x79\xfd\xc0\xd4\x30\x8b\
-\x6c\xbc\x58\xb1\xdb\x90\x2e\x0e\x2f\xf6\x23\x48\x99\x05\x58\xe1\
-\x6e\x90\x9d\x60\x84\x11\x14\x18\x07\x59\x85\x9f\x94\x9a\xad\xec\
-\xfb\xa0\xe6\xef\xc9\x8d\xdf\xfe\xbc\x4f\x93\x59\x62\x18\xe0\x97\
-\x5d\x28\xb0\xdc\x43\x5b\x16\xb0\x0f\x75\xdd\x3e\x46\x17\x15\x7e\
-\xfe\x85\xdd\x6a\xb7\x7c\xd8\x6b\x0e\x04\xa5\x2c\x72\x09\x30\xde\
-\x16\xf5\x80\xf2\x6e\xa1\xdf\x0b\x7c\xdf\x06\x00\x0e\x7e\xae\x8f\
-\x71\xd4\xac\x9f\x9e\x13\x78\xfb\xb7\xc0\xee\x09\x68\x1e\x07\xce\
-\x87\x6a\x30\xdd\x07\xdd\x8b\x59\x80\xc4\x04\xbc\xf1\xf0\x71\xb8\
-\xbe\xfa\xcc\xfb\x9b\x0b\xe0\x50\x21\x55\x34\xe6\xfd\x65\x05\x0b\
-\xa0\x4c\xe3\x25\x8f\xf7\x75\xfc\x79\xac\xf0\x36\x78\xea\xcc\x60\
-\xc7\xea\x0b\x06\x80\x50\xca\x4e\xe4\xba\x40\x56\xf4\x83\x1b\x7a\
-\xf8\x12\x70\xe5\x85\x3c\x82\x49\x1f\x96\x0c\xbe\xf0\xf3\xa3\x9e\
-\x3f\x9f\x36\xdc\xd6\x05\x84\x1e\x00\x9a\x3a\x08\x80\x8b\xbd\x16\
-\x04\xb4\xd9\x47\xeb\xfd\x90\x3a\xf4\x8a\x2e\x4f\xd3\xf8\x57\x01\
-\x37\x94\x43\x01\xcf\x70\xec\xfb\x18\x03\xb0\x8f\xdb\x21\xd4\x07\
-\x6c\xd1\xcf\x3a\x77\xe7\xcf\x45\x98\xd8\x00\xc0\x01\xce\xdf\xc3\
-\xd6\xf8\x27\xef\xff\x79\x6f\x81\xdb\x3e\x13\xf6\x3f\x0d\x7a\xc1\
-\x18\xff\x7e\xc7\x00\x7c\xd2\x00\x6a\x63\xfc\x06\x08\xda\x79\x74\
-\xd1\xf3\xd7\x31\xbd\xb7\x53\x88\xfd\x2b\xd6\x2a\x1d\xb8\x94\xd3\
-\xab\x21\xa0\xac\x0f\x94\x52\x89\x93\x02\xe0\x04\x7b\x28\x89\x7c\
-\x2b\xc3\x91\x52\xcd\xbe\x1b\x66\x22\x7a\x57\x54\x61\xf4\x96\x8e\
-\x84\x38\x79\x5a\x54\x0a\x6c\xa8\xf4\x7e\x75\x00\x6e\x0a\x84\x9a\
-\x05\x34\x0b\x74\x91\x2a\x03\x63\xcb\xb0\x19\x1e\xa2\x8b\x05\xbe\
-\x7a\x6b\xb7\xf1\x49\xb3\x18\xbe\xc4\x06\x72\x90\xc8\xbf\xdf\xc4\
-\x2b\xf5\x73\x47\x59\xc0\x0c\xf8\x61\xc2\x36\xaa\x0d\x00\xac\x71\
-\xbe\x93\xd0\x87\x45\x2f\xe5\x77\xc7\xad\xf0\xc6\xaf\x82\xc5\x23\
-\xa0\xa7\x41\x0d\xfd\xf7\x7b\x21\x0f\xec\x23\x08\x34\x75\x9b\x0b\
-\x6e\xc5\xc0\xd6\xf8\xe9\x0b\x7f\x9e\x72\xde\xdf\x1d\xf0\x1d\x2a\
-\xc5\xf2\x3a\xad\x19\xc8\x58\xfb\xf1\x58\x55\xa1\xeb\x06\x82\xc2\
-\x48\xc7\x9d\x8c\x34\x1a\xb9\x61\xae\xbe\xc7\x30\x0a\xd5\x80\x79\
-\x13\x65\xf1\xf7\xb9\x69\x10\x69\x05\x45\x62\xca\x91\x21\x1b\xd1\
-\x91\x34\xea\x00\x37\xec\x1a\x32\x6f\xd6\x1f\xfb\x10\x0e\x68\x5b\
-\x25\xb8\xd7\x35\x0a\xc5\x96\x61\xbc\x87\xfa\x1c\x8d\xbe\x00\xad\
-\x5e\xd2\x15\x8c\x96\x8c\x3b\xff\x7c\x0a\x0c\x92\x13\xf9\x1c\xe0\
-\x25\xa3\xa9\xc1\x5b\x08\x69\x6c\xb7\x01\x80\xe9\x73\x3b\xf0\xbf\
-\xf5\xee\x69\x80\x23\x33\x78\xcb\x3b\x02\xff\xab\x9f\x00\x3d\x0f\
-\xfe\x7c\x64\x01\x51\x04\xf4\xd1\xfb\x7b\x53\x07\x90\xbc\x7f\xba\
-\x58\xbc\x46\x60\x48\x9f\x6b\xc0\xe7\xdd\x82\xb1\x8e\x51\xec\x31\
-\xd1\xef\x52\x99\x40\x66\x04\x63\xd9\x82\x22\x47\x66\xdc\xa3\x8f\
-\x89\x70\x5a\xa8\x2c\x2c\x75\x27\x32\xf2\x35\xa5\x8c\x06\x4c\xf6\
-\x36\xb4\xba\x42\x7a\x4e\x46\xb2\x1c\x3a\x1d\x4d\xf5\x5a\x87\x7b\
-\xa1\x40\x62\x01\x41\x0f\xd0\xe5\x5e\xb8\x35\x29\x2d\xb8\x0c\x5a\
-\x80\x2a\xba\x38\x87\x9f\xbd\x25\x0c\x19\x5d\x66\x86\x9c\x7b\xf8\
-\x66\xc4\xeb\xfb\x42\xc8\x30\x03\xde\x1a\x43\xc9\xa6\xf8\x67\x7c\
-\x29\xf0\x87\x37\x00\x30\xfd\x7a\x7e\x88\x30\xcb\xbf\x0f\x00\x6f\
-\xfe\x7c\xb8\xee\x05\xb0\x78\x08\xf4\x6c\x34\xfe\xd8\x0d\xa6\x7b\
-\x26\x0d\xb8\x6c\xe9\x5e\xc8\x17\xfb\x2e\xfe\x6f\xd2\x3f\x34\x0a\
-\x81\x4d\x44\xee\x43\xf4\x0b\x7c\x12\xf5\x77\x6b\xc4\xf6\x79\x1a\
-\x50\xd7\xc8\x12\xe4\x86\xab\xeb\x09\x89\xd3\x56\x31\x01\x0e\x8e\
-\xc1\x10\x12\x19\x79\xec\xaa\xd4\xdf\x28\xd8\x94\x2a\xfc\x18\xa7\
-\xf7\xa3\xc0\x3a\x52\x58\x95\xbf\xaf\x5d\xc7\x60\x12\x74\xa3\x20\
-\xd8\xd4\xb0\x5c\xc4\x8a\xc0\x45\x57\x1f\xd0\x84\x12\x61\xf5\x1e\
-\x9a\x3d\x9a\xe6\x3a\x74\xf6\x9a\x2e\x14\x68\x26\x18\x40\xc9\xe3\
-\x97\x58\xc1\x3e\x61\x2a\xc5\xe7\x8c\x02\x00\xc0\x0f\x00\xaf\xd8\
-\x00\x40\xf9\x7c\x0b\xf9\x94\x95\x05\xf0\xe2\x1b\xe0\xb5\x5f\x00\
-\xfb\x8f\x80\x9e\x01\x7f\x36\xa8\xff\x2d\x08\xec\x77\x53\x63\x7c\
-\x54\x85\x9b\xa8\xfe\xaa\x0f\x5e\xbe\x89\x20\x90\xd8\x40\x02\x03\
-\xa1\x9d\xf3\x57\x34\xce\xd2\x45\xaa\x07\x64\x00\xeb\x64\x10\x18\
-\xc6\xf8\x92\x75\xcc\x49\xde\x37\x30\xd5\x5d\xe8\x46\xd2\x6d\x32\
-\x11\xab\x4f\x55\x2d\x4e\xd5\x01\x8c\xa4\x2b\x07\x22\xe5\x58\x97\
-\x24\xe3\x00\x26\x6b\xe0\x1d\x69\xa0\x68\xe3\xe3\x04\xa1\x3a\x78\
-\xfc\x65\x98\x1f\xa8\xf5\x3e\xba\xdc\x0b\xf7\xf9\x38\xcf\x7c\x79\
-\x9a\xa6\xfa\x3c\x68\xb6\xc2\x35\xe6\xd7\xbc\x95\xc4\x42\x7b\x5b\
-\x10\xfa\x05\x5e\x30\xaa\x07\x1c\x8f\xfa\xd6\xd6\x06\x00\x86\xaa\
-\xff\x0f\xf4\xee\xf1\xc0\x8e\x0b\x75\xfe\xb3\x06\xea\xc7\x82\xf7\
-\xd7\x73\x81\xfa\x6b\x4c\xf7\x24\x00\x68\x4c\xac\xd7\xe4\x21\x00\
-\x01\x04\x1a\xed\x6e\xb5\x06\xea\x3f\x2f\xa8\xf1\xb2\xa6\x41\xcb\
-\x9a\xa0\x71\x90\x70\x61\xe2\xaa\x4f\x69\xbd\x9c\x6c\x48\x41\xed\
-\x17\x37\xf2\x3c\x23\xc3\x49\x8b\x14\xde\x31\xde\xcc\x94\xff\xbe\
-\x42\x1d\x7f\xaf\x06\x81\x09\x90\x61\x05\x2b\x90\x32\xf0\x86\xc9\
-\x6e\x8a\xf8\xc8\xd7\xd5\xc7\x6b\x20\x15\x07\x99\x2a\xc1\x7a\x1f\
-\xad\x6b\xb4\x09\xe1\x82\x6f\x0e\xe3\xab\xcf\x0e\x9e\xdb\x82\x40\
-\xb3\x06\x08\x8c\x31\x82\x65\xbc\x9e\x3e\x7f\x32\x2b\xf0\x79\xc0\
-\x1f\xdd\x00\x40\xff\xfc\x65\xec\x34\xdf\xa4\xfa\xbf\xf6\x55\x70\
-\xe3\x2d\xb0\xff\x70\xdf\xfb\x37\x17\x42\x23\x88\xdf\x6f\xd5\xdf\
-\x10\xff\x27\x1d\x20\xd2\xff\x86\x48\x0d\xd5\xc4\xfd\xe6\x1f\x76\
-\x64\x4d\xf1\xcf\xd2\xf4\x83\xd0\x7c\x26\xc2\x85\xfc\x79\x27\x7e\
-\xa6\xc4\x0e\x06\xea\xff\x2a\xf0\x98\x28\x3b\x96\xc2\xd0\x92\xb1\
-\x49\x46\x56\xd9\xcf\x67\x1e\x0e\x42\x80\x12\xfb\xd0\x09\x1d\x61\
-\xe4\x7d\xb2\x5b\x8a\xf2\xe1\x4e\xb4\x5a\x80\xc6\x50\xa0\x0e\x63\
-\xe0\x7c\x1d\x2a\x03\x97\x7b\x31\x1d\xb8\x68\x67\x08\xe2\x15\xea\
-\x33\xf8\xd9\x1b\xc0\x1f\x0a\x00\xb0\x34\x61\x62\xb3\x02\x08\x9a\
-\x09\x70\xd8\x8f\x92\xdf\xab\x99\x9a\x4a\xf4\x7d\x84\x6d\xc4\x1b\
-\x00\x88\x51\xd3\xb7\xf5\xee\xa9\x81\x6b\x0e\xc1\x67\xbd\x1e\x16\
-\x8f\x43\x93\x8c\x3f\xe6\xfd\xdb\x5b\x8c\xfd\x7d\x1d\xe9\x7f\x63\
-\xe2\x7e\x6f\xa8\x7f\xf2\xfe\xf1\xf3\x94\xfa\xdb\x2d\xc4\xe0\xab\
-\x28\xfb\xe5\x38\x3a\x02\x36\x13\xbf\x7b\x50\xb9\x47\x61\xa0\x46\
-\x29\xcd\x56\x18\x59\x36\x28\x4b\x66\x3c\x05\x99\xd3\xfe\xd1\xf7\
-\x4b\x26\xb2\x24\x63\xcf\x5d\x4a\x15\xea\xc4\xdb\xa0\x76\x69\x6a\
-\x4a\x0b\xc6\x32\xe1\xe5\x02\xad\x97\xe8\x32\x32\x81\x65\xd7\x23\
-\xa0\xde\xc7\x8f\x3b\xf8\xf9\x9b\x3b\x16\x60\xf5\x80\x66\xc5\x6d\
-\x0c\x10\xd2\xae\xc9\xd7\x47\x35\xab\xac\x07\x9c\x1c\x88\xdd\xcf\
-\x53\x00\xa8\xa2\xf7\x9f\x0d\x0c\xe2\x0d\xaf\x81\xc3\x73\x58\x3e\
-\x06\xfe\x0c\x34\xe7\xa0\x39\x1f\xbc\xbf\xdf\x8b\x5e\x7f\x11\x6b\
-\xc2\x4d\xdc\xdf\x34\x19\xdd\xc7\x7c\xee\x3b\xf1\xef\x08\xf9\x42\
-\xc8\x3e\x15\x5e\x33\x95\x37\x6a\xd0\x3a\x61\xe8\xf2\x24\x9e\x5f\
-\x56\x88\x8a\xa5\x9a\x80\xec\x3f\xae\x32\xd4\x0a\xa4\xa4\xd8\x8f\
-\x01\x91\x5b\xa3\x29\xa9\x94\x52\x2c\xbc\x7e\xcd\xde\x83\x55\xd1\
-\x53\x6f\xd6\x62\xef\xfd\xf6\x21\x14\xf0\x31\x0c\x48\xc5\x41\x75\
-\x27\x06\x6a\xbd\x08\xf7\x35\x35\xda\x28\xd4\xa7\xf1\xf3\xd7\x41\
-\x73\x24\x80\xc0\x32\x33\xe8\xdc\xe0\x9b\x11\xa3\x57\xf3\xb8\x14\
-\x0a\x1c\x8d\x20\xe0\x47\xff\x93\x5f\x4b\x98\x33\xf4\xbc\x06\x80\
-\x77\x00\xbf\x67\x40\xfd\x6f\x3b\x09\x2f\x7d\x01\xec\x3f\x1a\x3a\
-\xfd\x9a\x98\xf6\x6b\xf6\xa2\xf1\xef\x75\x20\x90\x8c\xbf\x65\x01\
-\xbe\x4b\xf7\x35\x86\x05\xb4\xb1\x7f\xfc\xcb\x8f\xae\x10\xff\xc6\
-\xae\x46\x5d\x53\x1c\x5c\xf5\x3d\x5d\x03\x44\xd6\xc9\x3e\xb0\x06\
-\x73\x19\x01\x86\xb6\x13\x6f\x8c\x01\xb9\x15\xec\x68\x55\xb7\xe3\
-\x1a\xda\x89\xac\x7a\xbc\x8c\xfc\x6a\xed\xb3\x80\x24\xf2\x86\x3d\
-\x83\x11\x04\xea\x05\xba\xdc\x47\x17\x31\x2d\x58\x87\x46\x21\x62\
-\xa3\x90\xfa\x06\xd5\x19\x7e\xfb\x73\xc2\x72\x50\xcb\x02\xc6\xbc\
-\xfe\x18\x43\xf0\xd9\xfd\xfb\x84\x89\x95\xe3\x65\xc2\x29\x2b\x70\
-\xe4\xf9\x0a\x00\xbb\xc0\xf7\x0e\x2e\xfa\x19\xf0\xba\x3b\xc0\xed\
-\xc3\xf2\x4c\xa4\xfd\x86\xfa\x37\xfb\x43\xcf\xef\x6b\xe3\xf9\x7d\
-\x41\xf0\x33\x9a\xc0\x92\x76\x93\x4f\xd1\xc8\x4a\x9b\x65\xc6\xe2\
-\xd3\x55\x63\xa6\x60\xb2\xdc\x77\xf4\x71\xeb\x32\x8d\x75\xd8\x80\
-\xac\x21\x50\xae\x9a\x5d\xb8\xee\xfa\x34\x59\x21\x94\x8e\xbd\x5c\
-\x03\x34\x5a\x68\xa6\x1a\xfd\xb3\x8d\x40\x98\x32\x02\x68\x1c\x21\
-\xd6\xd4\x48\x5d\x87\x42\xa0\x65\x00\x02\xea\xbd\xc8\x02\x96\xa1\
-\x4f\xc0\x13\xb4\x80\xed\xd7\x76\x2c\x60\x31\x62\xf4\x25\x83\xaf\
-\x27\x74\x82\x3a\x32\xcc\xd7\x4e\x5a\xda\x2b\x80\xff\xf9\xf9\x0a\
-\x00\xdf\x0a\xbc\x7c\x10\xfb\xbf\xe8\x6a\xb8\xf9\x2a\xd8\x7b\x22\
-\x7a\xfd\x0b\xa1\xf1\xa7\x89\xaa\xbf\xf5\xfa\x03\xda\xef\x3b\x83\
-\xaf\x7d\x57\xec\xd3\x98\xbc\xbf\x8f\xc9\x18\xf7\x14\xbf\x1b\xb9\
-\x3c\xaf\x13\x94\x7f\x6a\x9f\xbd\xae\x30\xd0\x12\x4b\xd0\x35\x41\
-\x62\xa4\x46\x60\x94\xca\xaf\x0b\x42\x07\xa9\x80\x9c\x52\xff\x75\
-\xa2\x71\x6a\xc5\xaf\xef\x04\xc1\x28\xd1\x6b\x8c\xf3\x9b\xba\x6b\
-\x0e\x5a\xa6\x81\xa2\xfb\x5d\xc6\xc8\x37\x28\x73\xfc\xee\x67\x07\
-\x16\xb0\x17\xbd\x77\x62\x02\x96\x11\xd4\xd9\xd7\xba\x82\x29\xec\
-\x45\x06\xf0\xc2\x49\x16\xf0\xa7\x78\x86\xda\x86\x9f\x49\x00\x38\
-\x06\x7c\x77\xef\x1e\x0f\x6c\x09\xbc\xea\x96\x60\xf4\xf5\x79\x73\
-\xbb\xd8\xf5\x7a\x37\xfb\x46\xcd\x4d\xde\x3f\xf3\xfc\x75\x8c\x05\
-\x6b\x1f\x3e\xb7\x00\x30\x8b\xa4\xcb\x4f\x5f\x88\x6b\x7b\xf4\x55\
-\x1e\x9e\x15\x8c\x42\x27\x58\xc0\x2a\x83\x5a\x47\x80\xd3\x35\x7e\
-\x6e\x15\x75\x5f\x97\x49\xac\x60\x35\x6b\x61\x4a\x29\x3b\x90\xcd\
-\x0b\x1c\x84\x01\x29\x14\xe8\x65\x04\xba\x66\x21\xad\x97\xb1\x30\
-\x28\x4e\x0c\x5a\xc6\x85\x22\xcd\x32\x4c\x13\xaf\xcf\xe0\x77\x5f\
-\x0b\xcd\x6e\x60\x00\x49\x0f\xc8\x8d\x7f\x95\x40\xe8\x0b\x9f\x2b\
-\xf0\x2a\x86\xe9\xe6\xee\xdc\x00\xfc\xf1\xe7\x1b\x00\x7c\x33\xa1\
-\xec\xb7\x3b\x0d\x70\xdb\x71\xb8\x7a\x0b\xf6\xcf\x76\x5e\xdf\xc7\
-\x2e\xbf\x64\xfc\x96\xf2\xd7\x4d\xff\x63\x93\x3c\xbf\x29\xf6\x49\
-\x71\x7f\x1d\xe9\xdd\x31\xca\xb9\xff\x75\x29\xf6\xda\x2a\xd5\x1a\
-\x86\x7d\x50\x11\x71\x95\xc1\xc9\x1a\x99\x84\x75\x74\x0e\x77\xc0\
-\xdf\x77\x90\xd7\xc8\x0a\x36\x53\x1a\xdc\x5c\xf8\xfb\x4a\xc4\x25\
-\x09\x8a\x49\x0c\xd4\xc6\x07\xaa\x5f\x27\x41\x30\x14\x06\xd1\x74\
-\x62\x60\xaa\x1b\xd1\x6a\x07\xdd\xf9\x2c\xb8\x18\xaf\x93\xbd\x11\
-\x10\xa8\xd7\xc8\x10\x58\x10\xd8\x07\xae\x05\x6e\x65\x2a\x2d\xf8\
-\x07\x79\x06\x9a\x85\x9e\x29\x00\xd8\x01\xfe\xc8\xe0\x9f\xbf\x25\
-\xf0\xb2\xab\xcd\xa0\xc7\x0b\x19\xed\xaf\xbb\x21\x0f\x4d\x6d\xc2\
-\x80\x98\xdf\xaf\xb5\xf3\xf6\x35\xf1\x6b\xdf\xa7\x72\x10\x66\xb5\
-\x1c\xd4\xa8\xd7\x35\xca\x83\x88\x7d\xa5\xda\x02\x59\xe3\x35\xac\
-\x4b\xfd\xd7\xf1\xfa\xeb\x7c\x7e\x90\xb0\x60\x0c\x5c\xcc\xc7\x96\
-\xf0\x14\x1a\xa3\xac\x77\x9f\x8c\x6a\xec\x10\x56\x53\x8e\xdb\x09\
-\x83\x66\x06\x44\xdd\x95\x09\xeb\x72\x11\xab\x03\x93\x16\x90\x2a\
-\x46\x81\xfa\x1c\xfe\xe8\xeb\xc3\xe8\xb0\x85\x71\x18\xcb\x82\xd1\
-\x8f\x01\xc1\xd4\x7d\x2f\x9b\x64\x01\xa7\x9e\x09\x2d\xe0\x99\x02\
-\x80\xaf\x8d\x6f\x47\x3f\xf6\xbf\xf9\x30\x5c\x35\x83\xfd\x64\xf8\
-\x8b\x8e\xee\xd7\xa6\xd2\xaf\x59\x76\x31\x7e\xa3\xe1\x1f\x5c\x37\
-\x59\xaa\xcf\xf7\x53\x80\x75\xfc\x47\x6e\x47\xf5\xdf\xaf\x50\xb7\
-\x0f\xe2\xa9\xd7\xa5\xfc\xca\xf8\x50\x4a\x59\x83\x42\x1f\x24\xcb\
-\x70\x90\xf8\xfd\x20\xcc\xe0\xa0\x42\x64\x01\xb8\xa4\x44\xdf\x27\
-\x42\x86\xd2\xf7\xa7\xb6\x7e\xa7\x2a\x3d\x89\x75\x01\xea\x3d\x92\
-\x9c\x87\x0d\x05\x62\x5d\x80\x36\x75\x98\x19\xd0\x2c\xd1\xf9\x71\
-\x74\xe7\xd5\x81\x05\xec\x65\xa1\xc0\x98\x26\x30\x15\x06\x24\xcd\
-\x69\x41\x58\x1b\x72\x33\x53\x7d\x02\xdf\x19\xb9\xc2\x73\x1a\x00\
-\x1c\xf0\x87\x06\xf7\xce\x80\x17\x1e\x09\x46\x6e\x07\x3d\x26\x8f\
-\x1f\x69\x5c\xa0\xfb\x3e\xfb\x5c\x8d\xb7\x37\x4c\x60\x69\xa8\x7f\
-\x42\xf3\x13\xf4\x2b\x0e\xd6\x09\x03\x56\x4d\x92\x3d\x08\x7d\x3f\
-\x68\x5f\xc1\xa5\xd4\x04\x1c\x14\xcc\x2e\xd5\xd0\x65\x22\xf4\x38\
-\x28\xfd\x4f\x3f\x9e\xed\x07\x18\x7d\x29\x99\xd0\x3a\x18\x9b\x96\
-\xb4\x80\x04\x02\x11\x00\x74\x19\xa9\x7f\x1a\x23\x56\x2f\xc2\x4c\
-\x41\xdf\x44\xc1\xf8\x1c\xfe\xf8\x67\x87\x4e\xc1\x94\x11\x48\x20\
-\x60\x3d\xff\xd8\xad\x19\xf9\x3a\x01\xc3\x0b\x27\xad\xee\x3a\x9e\
-\xe6\xb5\xe3\xcf\x04\x00\x7c\x36\xf0\xc6\x41\xec\x7f\xcd\x16\x9c\
-\xaa\x60\x6f\xaf\x5b\xfb\x9c\x10\xbb\x36\x45\x3e\xad\xb7\xf7\x26\
-\xb5\x67\xe2\xfd\x92\xe8\x97\x6e\x42\x58\xf2\xb8\xca\x93\x5e\x0a\
-\xcd\x3f\x48\x3c\xff\x64\x7f\x87\x3e\x49\x23\x96\x89\x0c\xc6\x41\
-\x29\xfd\x2a\x40\x58\x95\x01\x28\x89\x7c\xab\x30\x44\xbb\xd7\xab\
-\x23\xcf\x41\xa6\x05\x84\x6b\xa4\x69\x8b\x83\x74\x19\x75\x80\x65\
-\x02\x83\xd0\x23\xa0\xf5\x3e\xba\x7b\x2d\xba\xfb\xd2\x0e\x00\x12\
-\x08\x2c\x26\x0c\x7e\x4c\x00\xb4\x4c\x60\x11\x89\xfe\x35\x93\x2c\
-\xe0\x0f\xf0\x34\x36\x0a\x3d\x13\x00\xf0\xed\xc5\xdf\x7b\xeb\x6e\
-\x98\xe0\xd3\x1a\xfc\xb2\xab\xe9\x6e\x6f\xc6\xe0\x6b\x5f\xf0\xfe\
-\xbe\x6c\xf8\x4d\x7c\xf3\x0f\x51\x2e\xfe\xb9\xd4\x23\x94\x97\x4d\
-\xac\x02\x02\x39\x20\x9b\x38\x28\x58\xad\x73\x9f\x5c\x22\x50\x30\
-\xa1\x47\x3c\x45\x0c\x49\xd7\xf9\xdb\xb2\x81\x28\x56\x03\x10\xcb\
-\x0c\xd4\x9b\x12\xe1\xba\x6b\x17\x8e\x99\x80\x76\x84\x78\x9b\x12\
-\x54\xd0\x8b\xf8\x13\x6f\x82\xa5\xf4\x8d\x7f\x31\x61\xfc\xf5\x0a\
-\x70\xb0\x1a\xd4\x2d\x93\xef\xea\x2b\x79\x1a\xc7\x87\x3d\xdd\xd3\
-\x4a\xaf\x27\x2f\x7d\xf4\xc0\x11\x07\xa7\x1c\xec\xc7\x01\x9e\x62\
-\xeb\x2b\xe3\x83\xd4\x04\x77\xea\xcd\x85\xa4\xfd\xcd\x3f\x6d\x7f\
-\x38\xc3\x2e\xad\xab\x22\xf4\x34\x2b\xe2\xd4\x83\x78\xfb\x52\x1a\
-\xf0\x20\x02\xdd\xa5\x78\x7d\x99\x08\x1d\x74\xc5\xeb\xd4\x35\x5f\
-\xfb\x3a\x82\x28\x99\xfc\xbe\x6e\x38\x55\xfa\x95\xd9\x94\x23\xb5\
-\x6a\xbf\xae\xd9\x81\x1d\xd3\x87\xea\xe3\x73\xc4\x61\x41\x22\x1a\
-\xe7\x00\x68\x08\x1d\xab\x25\xba\xd8\x47\xe6\xa9\x43\x30\xb0\x4d\
-\xf1\x35\xe8\x0c\x96\xe7\xd1\x23\xb7\xc2\xec\x06\xd8\x7f\xa0\x5f\
-\x32\xad\xf4\xf7\x1f\xb8\x09\x81\x34\x7f\x4f\x12\x2b\x38\x45\x98\
-\x40\x75\x61\xd4\x05\x7f\x33\xf0\x53\xcf\x45\x06\xf0\xa5\xe4\x1b\
-\x54\x3d\x70\xfd\x1c\x9c\xef\x3c\xbf\xf5\xf6\xed\xe7\x96\xf6\x47\
-\x85\x3f\x17\xfb\x6a\x2d\x23\x70\x2a\xc0\xb8\xe6\x29\xfe\x6b\x74\
-\x8d\x4c\x81\xae\xe9\x21\x2f\x65\x41\xc5\x41\x53\x70\xeb\x7a\x74\
-\x59\x03\xec\x56\x4c\xf0\x19\x5d\xc3\x25\x2b\xfe\x8c\x02\x8d\x5f\
-\xfb\xef\xd7\x11\x11\xb1\x9d\x06\x65\x53\xc6\x75\x58\x21\x96\x34\
-\x81\x3a\x85\x01\x75\xf0\x2f\xd2\xe0\x4f\xbe\xa1\xaf\x03\xe4\x2c\
-\x60\x5d\x4d\xc0\x32\x81\x65\x74\xbb\xd7\x33\xd5\x23\xf0\xd6\x95\
-\x3c\xe1\x0a\x05\x80\xaf\x1b\xfc\xc3\xe6\xc0\xd5\x55\x9f\xe6\xdb\
-\x18\xdf\x8a\x7a\xbd\xaf\x89\x22\x9f\xf6\xef\xb3\xff\x94\xa5\x79\
-\xd3\x0f\x67\xea\xff\xba\x94\x7d\x1d\x31\xf0\xa0\x1e\x5d\xd7\x7c\
-\x3e\x5d\x13\x78\x0e\xe2\x79\xa7\xaa\x0f\x65\x0d\x40\x93\x35\xfe\
-\x86\x83\xea\x14\xeb\x3c\x87\x05\x06\x5d\x43\xfb\x1c\x78\x5f\xed\
-\xfa\x03\x9a\x26\xd4\x05\x2c\xf7\xd1\xe5\x32\xa6\x05\x53\xa6\x29\
-\x8a\x81\xf5\x59\xf4\xd4\xab\x40\x8e\xf6\x75\x80\xa5\x01\x81\xe5\
-\x0a\x30\x68\x46\xc2\x84\x65\x64\x01\xe3\x29\xc1\x63\xc0\x57\x3d\
-\xd7\x00\xe0\x76\xc2\x5e\xd5\xbe\xf7\x3f\xee\x60\x47\x61\xdf\x88\
-\x7b\x8d\xc2\xd2\x87\x5b\xbb\x02\xca\x9b\x54\x9f\x61\x06\xb5\xf6\
-\x8d\xbd\xf4\xe6\xef\x47\xf1\x6f\x76\x80\x58\x78\x95\x57\x3f\x88\
-\x47\x3f\xa8\x80\xf8\x64\x44\x42\x3d\x40\x86\x61\x95\x37\xbd\x94\
-\xbf\x71\xc2\xd3\xaf\x05\x1c\xac\x97\x05\x98\x7a\x5d\x3d\x1d\x52\
-\x43\x44\x29\x3e\x74\x0a\xaa\xf7\x61\x6f\x60\x64\x9b\x61\x5a\xd0\
-\xb2\xc7\x00\x52\xeb\xb8\xce\x05\x3d\xf1\x59\x5d\x41\xd0\xc2\xdc\
-\x96\x07\xcc\x06\x2c\x33\x46\xba\x13\xcd\x7c\x9c\x05\x7c\x25\x97\
-\xbf\x09\xfd\x69\x05\x80\xb7\x11\x9a\x7f\xfa\xe7\x44\xd5\x15\x6b\
-\x24\x23\xb7\x40\x60\xbd\xbf\xa5\xf9\xa5\x82\x8c\xd2\x3f\x62\x19\
-\xdf\xc6\xeb\x0e\x70\x11\x1d\xd4\x48\xd7\xa5\xfc\x07\x35\x58\xd6\
-\x7c\x7e\x39\x80\x86\xb1\x2a\xa5\x29\x13\x86\x2c\x97\x60\x90\x07\
-\x79\x5f\x75\x0d\x7c\xca\x86\x8d\x4c\xfe\x98\x59\x06\xd5\x3a\x1c\
-\xaf\x26\x9b\xd4\x2d\x14\xd1\x34\x3a\xac\x4e\xb3\x03\x15\xfc\x45\
-\xfc\xb5\x77\x86\x94\x60\x32\xfa\xe5\x08\x0b\x58\xae\x29\x02\x26\
-\x46\xaa\x84\x94\xf4\xf8\x7b\xfa\x06\xe0\xb6\xe7\x12\x00\xbc\x75\
-\xf0\xcf\xd9\x8a\x28\xb8\xcc\x2a\xf9\x96\x6a\xc0\xc0\x56\xf7\xd9\
-\xef\x6b\xd9\xdb\xe7\xff\x80\x84\xb6\xc7\x19\x5f\xf6\xa0\x97\x60\
-\xac\x07\xf5\xd4\x7a\x00\x41\xef\xa0\x00\xb1\xca\x6a\x0e\x92\x29\
-\xd0\x35\xa8\xbe\x5f\x03\x0c\xc7\xb4\x90\xa9\xfb\xd7\x7d\x4f\xd7\
-\x00\x1e\x29\x2e\xf1\xb0\x13\x84\xeb\x50\x05\x58\xd7\x5d\xca\xd9\
-\x76\x96\xaa\x0f\xac\xe0\xd8\xd5\x70\xe4\xa5\x7d\xfa\xbf\xc8\x40\
-\x60\x8a\xee\x97\x1c\x52\x4a\x09\x1e\x9d\x0c\x03\x0e\x3d\x1d\xd9\
-\x80\xa7\x0b\x00\x4e\x11\xf2\xff\x7d\xfa\x7f\x48\x02\x2d\x5f\x7a\
-\x23\xea\x99\xb1\x5d\x76\x90\x47\xfb\x26\x66\x5f\xaf\x12\x62\x12\
-\xfd\xdf\x62\xb8\x00\xe2\x52\xbc\xed\xba\xa2\xde\x41\xe8\xef\xa5\
-\x50\xfe\x75\x99\x83\x5c\x82\x11\xad\x32\x6e\xa1\x3f\x1b\xef\x52\
-\xe2\xfe\x91\x8c\xc0\x81\x74\x4e\x2d\x4e\x1a\x1b\x6a\x9f\xa9\x32\
-\xd0\x6b\xf8\xbc\xf1\x68\x62\x9a\xed\xd4\xa0\x45\x4c\x0f\x2e\x63\
-\x28\x10\x77\x49\xc8\x3e\xfe\xba\xd7\x0d\x4b\x83\x2d\x10\xac\xd2\
-\x02\x96\x05\x36\xb0\x8c\xd6\xb7\x3b\xf9\xbf\xff\x3d\x97\xdb\x30\
-\x9f\xae\x34\xe0\x67\x45\x33\xec\x9f\xa3\x12\x87\x38\xd2\xc1\xb6\
-\x95\x7f\x6d\xb1\xb7\x4a\xdf\x63\xae\xda\xe4\xe2\x8d\xa7\xba\x96\
-\xd5\xe9\x39\x5d\x41\x5d\xa7\xa8\xec\x2a\x40\x18\xab\xe5\x97\x27\
-\x29\x02\xae\xfa\xfd\xab\x9e\x43\x27\x04\xc5\x75\x85\x39\x5d\xc1\
-\xa4\xd6\x0c\x89\x64\x15\x83\xd1\x61\x12\x42\x6d\x58\xa0\x23\x7f\
-\x6a\xce\x6a\x34\xed\x87\x8c\x0d\x40\xb1\x2e\x40\xe2\xa4\x20\xa9\
-\xf7\xd1\x66\x07\xf1\x0d\xea\x67\xc8\xf2\x3c\x7a\xdd\xed\xf0\x91\
-\x63\xb0\x7f\xa6\x2b\xd1\xf1\x84\x74\xa0\xd2\xcd\x90\x74\xac\x6e\
-\xf1\xb6\xd7\x66\x9a\x48\x7d\x66\xd4\x6e\xde\x18\xe5\xeb\xf3\x57\
-\x3a\x03\x78\x53\x11\x7a\x0e\x45\x8f\xee\xb5\x1f\xf3\xa7\x12\x5e\
-\xeb\xfd\xfd\x88\xe7\x2f\x0d\x72\xb4\xf4\xbf\x8a\x00\xe0\x2f\x51\
-\x9c\x5b\x95\xae\xd3\x15\x17\xfc\x41\x44\xb9\x55\xa0\xf1\x64\x8d\
-\x7f\xdd\x58\xdc\x1f\x90\x15\xe5\x3f\xab\x6b\x02\xea\x3a\x2c\xea\
-\x00\xeb\xba\x57\xb1\x85\x94\x0d\x80\xae\x55\xd8\x86\x01\x1a\xbd\
-\x7f\xda\x21\xd0\x2e\x90\xd9\x02\xbd\x26\x76\x09\x2e\x0f\xa0\x05\
-\x94\xc2\x82\x65\x76\x7d\x6e\x4f\x5a\xe1\xcd\xc0\x9d\xcf\x85\x10\
-\xe0\xf5\x83\x8b\x64\x4b\x60\x66\x86\x75\x78\x0a\xf1\xfe\xc8\x9b\
-\xb8\x6e\xbc\xb5\x4f\xa8\x3a\x38\x4c\xd7\x97\x7d\xd0\x98\xf4\xa0\
-\xc6\x35\x05\x1a\xeb\xc6\xb6\x07\x69\x00\xd2\x35\x62\x71\x26\x28\
-\x7b\xce\x9a\xf2\xe7\xf7\x13\xef\xd7\x2a\x06\x70\xc0\xf7\x46\x2f\
-\x05\x0c\x4a\xcc\x40\x0b\x32\x86\x15\x04\x53\xab\x70\x1a\x22\x5b\
-\x2f\xe3\xbc\x80\xfd\x6e\x50\x48\x53\x77\x3b\x04\x74\x1f\xbd\xe1\
-\xe5\xc1\x6b\xe5\x19\x80\xe5\x0a\x21\x70\x2c\x14\x48\x37\x47\x39\
-\x3b\xd5\xd9\xe7\x1b\xae\xf4\x10\xe0\x68\x11\xc5\x52\x3e\xa0\xd1\
-\x72\xcc\xaa\x6b\xc4\xcf\xab\x16\x38\xd6\x84\xe2\x9f\x8a\xfe\x4e\
-\xf8\x83\x08\x75\xab\x3c\xd8\x41\x4b\x5e\xd7\x89\x99\xf5\x00\xaf\
-\xeb\x92\x99\x46\xa1\xef\x56\xc6\x40\x51\xc7\x1f\xb3\xca\x50\xd7\
-\x09\x9d\x74\x5a\xb3\x1c\x44\x4a\x85\xf7\x4d\xec\x28\xb1\x91\xf7\
-\x5f\x0d\x0b\x50\x47\x97\x7d\x9a\x77\xf3\x02\x52\x18\x80\xdf\x41\
-\xb5\x09\xbd\x04\xf5\x3e\x7a\xea\x7a\x38\x72\x13\x9c\xb9\xa7\x7b\
-\x41\x4d\x14\xf1\x52\x38\x30\xb5\x4c\x36\x07\x52\xbb\x64\x64\x8b\
-\xa9\x69\x41\x77\x5e\xe9\x00\x70\x3b\xa5\x24\xdc\x4e\x8c\xeb\xfd\
-\x1a\xc6\x33\xa5\x44\x8f\x01\x40\x13\xf1\xf3\xc6\xc2\x63\xd7\xfd\
-\x7d\xeb\x78\xed\x83\x52\xf5\x75\x8c\x93\x03\x00\xca\xe8\xef\x95\
-\xf2\x63\xfd\x1a\x0a\x9b\x90\xb5\x4b\xcb\x04\x68\x6a\x59\x8b\x61\
-\x0d\xb5\x7f\x9d\xc7\xe8\xb8\xb7\x1f\xfb\xfb\x73\x0c\x6d\xf5\x81\
-\xf4\x3d\x6f\xc2\x4e\xd7\x04\xc1\xaf\x5e\x22\xcb\x54\x1b\x10\x34\
-\x01\xfc\x76\xa8\x19\xf0\x0e\xd9\xa9\xd1\x1b\x5e\x8b\x7c\xfa\x9e\
-\x7e\xec\x9f\xfc\xb4\x8f\x1f\xc7\x2a\x25\xa7\xb6\x0c\x4f\x5b\xe1\
-\xab\x32\x17\x76\xc5\x01\xc0\xcb\xc9\x87\x6f\x27\xda\x53\xaf\xc1\
-\x89\xc7\x76\xb2\x97\xd0\xd4\x7e\xaf\x8e\xdc\xe3\x04\xfd\x0d\xb0\
-\x25\xaf\xb7\x8e\x97\xf5\x2b\x1e\x77\x50\x0f\x2c\x2b\xee\x3b\x50\
-\x6a\x52\xd6\x74\x9d\xf4\x8b\xef\xa7\xc4\xd4\xde\xf3\xe9\x04\x00\
-\x15\x9e\xa7\xed\xcb\x18\x01\xdf\x15\x20\x66\x69\x7c\xe9\xbd\x96\
-\x09\x0d\x35\xff\x97\x4a\x81\xbc\xa4\x11\xe2\xed\xc6\xd4\xa6\x69\
-\x97\xca\x68\xb3\x44\xea\x3a\x7c\x6c\xc3\x00\x85\xe6\x3c\x7a\xe3\
-\x4b\x91\xdf\xde\x82\xc5\x22\x5c\xbf\x33\x73\x3d\xab\x01\x02\x59\
-\x71\x6d\xd9\x31\xe2\x7e\x65\xba\xe3\x25\x84\x2c\xda\xc3\x57\x2a\
-\x00\x7c\xc6\xe0\x1f\x39\x8f\xbf\xd9\x4f\x5c\xb0\xb2\x86\x81\xe5\
-\x54\xca\x22\xec\x32\xf2\x8e\x9d\x0c\x3b\x57\x4d\xd4\x59\x57\x84\
-\x3b\x48\x99\xee\xba\x5e\xfb\x40\xe9\x45\x19\x2a\xdc\x52\x00\x85\
-\x94\x41\xd1\x35\x44\xca\x51\xd6\x21\xd9\x4c\x40\xed\xcb\xef\x83\
-\xe2\xa1\x6c\xb9\x5f\x5a\xcd\xb6\x4a\x4b\x88\x86\x3f\xb9\x2d\x68\
-\xe2\xff\x27\x05\xcc\x6a\x41\x23\xee\x83\xed\x5e\xb6\xa2\xaa\xed\
-\xb0\x10\x6d\xea\x76\x68\x88\xc6\xa1\xb3\xea\x6b\x24\xad\x96\x6f\
-\x1a\xf4\xc4\x51\xf4\xf8\x8b\x90\x47\x3e\xd4\xbf\xfe\x2a\xc3\x00\
-\x6c\x26\xc0\x15\xde\xdf\xd2\xf2\x51\x98\xaa\x07\x39\x42\x98\x22\
-\x70\x59\x00\xe0\xe9\x10\x01\x5f\x3c\xb8\xa0\x6c\x2a\xa5\xb4\x8a\
-\x79\x6c\xef\x5a\x69\x13\x4b\xc9\xf8\xd3\xd7\xa7\xcc\x3f\x27\x07\
-\x8b\xa9\xf0\xe1\xa0\x74\x35\x17\xda\xa6\xe8\xfb\x3a\x06\xe7\xc7\
-\x1e\x6f\xf7\x7d\xe7\x86\x6f\xf6\x75\xa5\xef\x7b\x42\xca\xab\x97\
-\x2f\x13\x70\x13\xdb\x37\x8b\x03\xf8\xa5\xaf\x19\x94\x66\x84\xa5\
-\xcd\x1f\x6e\x6a\x50\x80\xac\xd6\x60\xb4\xe0\xfd\x31\x2d\xbf\xa5\
-\xb7\x64\x8a\x2d\xc9\x84\x28\xea\x53\x9b\xb0\x86\xb4\x5f\x02\x80\
-\x76\x10\xcd\x22\x08\x85\xda\x84\xc7\xcf\x3d\xdc\xf2\xaa\x20\x2e\
-\x37\x05\x65\xbf\x24\x0a\xda\xec\xd4\xd4\x50\x91\xf1\x53\x45\x00\
-\xb8\x22\x35\x80\x8a\x7c\xf0\x67\xba\x57\x27\xe8\x8f\xae\x21\x02\
-\x4e\x89\x7f\x3e\xb2\x8c\xeb\xcd\x9b\x5b\xba\x00\xa6\x84\xc7\x83\
-\xce\xe1\xbb\x94\xde\x81\xa9\xf8\x5c\x0b\x16\xaa\x25\xd5\x4b\x0a\
-\xa1\x80\x51\xc4\x44\x46\xfe\xce\x15\x15\x42\xc5\xd9\x84\x39\x93\
-\xc8\x88\x78\x6f\xf9\x60\xae\xbc\x91\xbd\x1e\xed\x83\x5d\xfe\x6b\
-\x13\x10\xe8\x25\xbc\xff\xf6\xd7\xd9\x10\x20\x92\xa1\xf4\xb1\xdd\
-\x1f\xe0\x1b\xb4\x6e\x22\x13\x58\x22\xcd\x12\x7c\x18\x15\x26\x69\
-\xd9\x0c\x8a\x2c\xcf\xa1\xb7\xbc\x14\x79\xf7\x0e\x2c\xf6\x82\xf5\
-\xd8\x35\xf2\xde\xb8\x55\x57\x00\x27\x5f\xf8\x98\x9c\xd9\x74\x45\
-\xe8\x6d\x57\x2a\x00\xec\x90\x4f\x3a\x95\xcc\x2b\xaf\x3b\x0c\x93\
-\x09\xf5\x59\x0b\x4c\xe2\x18\xa1\xfc\xb7\x2e\xfc\x13\xf2\x62\x22\
-\xc7\x78\xa9\xeb\xaa\x98\x7f\xd5\xc5\xe8\x0f\x98\x75\x18\x33\xd0\
-\x5e\xd3\xbc\xf5\xf6\xd9\xfd\x6a\x01\x82\xec\x71\x3a\xf4\xc2\x53\
-\xef\xf1\x20\x8f\x26\x7d\x6b\x6a\xc3\x10\x29\x88\x19\x66\x83\xa7\
-\x0d\x1d\x34\x03\x82\xd6\xda\x57\x8b\xb4\x12\xeb\xc6\xfa\xb1\xfc\
-\x0a\xb9\xc3\xcc\x08\x18\x88\x73\xaa\x66\x63\x54\xd3\xad\x96\xf7\
-\x35\x92\xc2\x80\xa6\x0e\xa1\x80\x8f\x05\x44\xc7\xe6\x70\xf2\x36\
-\x78\xe8\xc3\xc3\xd0\xc7\x19\x01\xd5\x4d\x00\xbc\x2f\x08\xd6\x7e\
-\xd2\x8e\x6e\xb8\x5c\x06\x7a\xb9\x43\x80\x53\xe4\x33\x78\xc5\x68\
-\x9a\x25\xfa\x5f\x5a\xc3\xac\x94\x57\x33\xe7\xfb\xd8\xac\x00\x78\
-\x2d\xa1\xc8\xa2\x24\x10\xfa\x15\x1a\x42\x4e\xc7\xa7\x8c\x5f\x57\
-\xc4\xb5\xab\xb6\x08\x0d\x7e\x4e\x86\x5e\xdf\xde\xa7\x86\xde\xe7\
-\x54\xdc\x02\xc7\x60\x23\x68\x96\x19\x58\x37\xc4\x21\x07\x91\xfc\
-\x75\x26\x6a\x2f\x43\x16\x62\x81\x48\xb2\xd7\xd4\x73\xf9\x52\x7c\
-\x6d\x92\xbd\xb6\x62\x68\x30\x01\xa4\x3a\xa6\x21\xf8\x3e\x8b\x51\
-\x0d\x4f\xae\xed\xac\x80\x54\x08\x14\xfb\x03\x62\x18\xa0\x5e\x61\
-\xdb\xa1\x29\x0c\xc8\x0b\x7b\xf2\xba\x94\x52\x71\x5a\x6d\x8c\x3e\
-\x7f\xdc\xf8\xb9\xe6\x72\x19\xe8\xe5\x66\x00\x37\x44\x33\x1c\x86\
-\x83\xbe\x10\xa3\xad\xaa\x03\xd0\x15\x69\x15\x4b\xab\x52\xfc\x5f\
-\x8f\x48\xc6\xeb\x74\xf3\x69\x01\x08\xd6\xa4\x9e\xa3\x75\xf8\xa3\
-\x20\x21\x65\x91\x6f\x2c\x24\xe8\x19\xb5\x66\xf7\xe7\xe9\x55\x19\
-\x7f\x0f\xc7\xd8\x95\x4c\x64\x05\x94\xb2\x7a\x65\xe9\xbd\x0d\x03\
-\xc4\x30\x94\x24\x1a\xba\xf4\x1a\xd5\x4c\xdc\x89\xf7\x45\x4b\xd7\
-\x35\x32\x21\xba\x2e\x63\x8c\xd7\x86\x88\xc1\xce\x58\x14\x24\x69\
-\x74\x50\xd4\x01\xa4\xae\xf1\x4d\x43\x15\xd9\x80\xc6\x5d\x83\xa2\
-\xc0\xf2\x2c\x7a\xdb\x4b\x90\xdf\xd8\x0d\xa3\xeb\xab\xec\x3d\x4b\
-\x7f\x4b\xc3\x30\x2d\x98\xb3\xcc\x5c\xdf\xaa\x26\x1d\xe9\x15\x09\
-\x00\x57\x17\xff\x2c\x61\x7a\x3e\xde\x2a\x7a\x3c\xe5\x81\x53\x71\
-\xc6\xb5\x19\xfd\x9f\x2a\x58\x91\xcc\x3b\xac\x7a\x2d\xeb\x14\xbf\
-\xac\x0a\x19\xc6\xf2\xf5\x22\x23\x2a\x97\x94\x0d\x3a\xf7\xb2\x03\
-\xe0\x58\x03\x58\xd6\x9a\x13\xa0\xe3\x23\xc4\x5b\x9a\x1f\x5f\x84\
-\x33\x21\x8b\x94\x5e\xbb\xf6\x7f\xd6\xd1\x15\x84\x89\xf9\x7b\x4c\
-\x8d\x81\x26\xbe\xea\xd7\x6f\xa6\x6c\xfd\x4c\xa1\xd6\x4c\x4d\x4d\
-\x80\xaa\x86\x99\x01\x4d\xf4\xf4\x4d\x08\x01\xb4\x09\x63\xc2\xda\
-\x74\x20\xb1\x76\xe0\xc4\x2e\x1c\xbe\x0a\x9e\xb8\xbf\x4f\xe9\xf3\
-\xb8\xdf\x4f\x64\xb4\xc6\x04\xec\xb2\x34\x73\xec\x4a\x05\x80\xab\
-\xc6\xff\x2b\x99\x21\x4c\xf5\xa1\x8f\x19\x9e\x1f\x01\x81\xd4\x66\
-\x5c\x67\xcf\x37\x26\xce\xf9\x42\xca\x66\xaa\x10\x69\xdd\x39\x00\
-\x3a\x11\x57\x8f\xcd\xc9\xd6\x92\xe1\xe6\x54\x9e\xbe\x9a\x55\x34\
-\x78\x29\xbc\x77\x66\xe2\x66\x2f\x33\x50\x60\x49\x83\xc7\xb9\x2c\
-\xc7\x5f\x7a\xae\x92\x59\x8a\x29\x26\x8a\xf7\x25\xef\x2f\x36\xa9\
-\x9f\xad\xfc\x49\x2c\xc1\x56\x8a\x7a\xf3\xec\x9a\x69\x8c\x6b\xb0\
-\x05\xb1\x99\x53\xc9\xd0\xc0\xc7\x8b\xa9\xdd\x33\x19\x87\xd3\xfa\
-\x05\xea\x97\x31\x1d\xe8\x41\x2b\x38\x04\x7a\xdb\x6b\x91\x07\xef\
-\xef\x1b\x7d\xd5\x81\x54\x4f\x5b\x2a\x85\x81\x63\x19\xa9\x32\x00\
-\x1c\xb9\x52\x01\xe0\xf8\x28\x2d\x1e\xa3\xfc\xb9\x57\x5e\x95\x01\
-\xc8\x51\xb5\x06\x6e\x8a\xf2\xa3\x2f\x08\x30\x63\x45\x19\x92\x09\
-\x84\xeb\x28\xfa\xba\x82\x7a\x8e\x5e\x98\x13\xde\x7c\xb0\x2e\xc7\
-\x28\x59\x83\x9f\x99\x9a\xc3\x6d\x45\xba\x29\xe9\x67\x2c\x68\x96\
-\x2c\x74\xd0\x61\xd1\x91\x46\xb7\x97\xea\x02\xd4\xce\xea\xb6\x9f\
-\x6b\x5f\x0c\x1c\xbc\x5c\xed\x87\x2f\xb6\x82\xc7\x49\xc4\x04\x1d\
-\xe6\xf8\xfd\xea\x0b\x30\xaf\x0d\xb0\x02\xa2\xb6\x51\x49\x78\x93\
-\xd4\xfb\x28\xf6\x85\xb1\x61\xea\x0b\x6b\xe7\x55\xc1\xef\xa3\x37\
-\x5c\x8b\x54\xf3\x00\x12\x95\x79\x5d\x8e\xe1\xa0\x54\xc9\xae\xb1\
-\x29\xfd\xa8\x4c\x69\x76\xaf\x54\x00\x38\x52\x94\x1d\x0f\x5a\x47\
-\xbf\xce\x47\x3b\xfd\xf7\x64\x0c\x03\x16\x2b\x84\xb8\xf4\x79\x53\
-\xf8\xa7\xad\x5b\xf7\x3f\x96\x39\x98\x2a\xcf\x95\x92\xf1\x17\x0c\
-\xdf\xaa\xec\x79\x0a\xaf\xf7\x33\xc9\xd8\xac\x71\xba\x21\xea\xca\
-\x08\x18\x14\x41\x55\x87\xaf\x3d\x9f\xd4\x29\xae\xa3\xf8\xed\xfc\
-\xad\x78\x9f\x23\xa8\xe6\xf9\xfa\x1f\xc9\xa8\xbe\xad\x9e\x33\x8f\
-\xd5\x7c\x09\xa0\x16\x16\x01\x24\x12\x34\x56\x45\xa8\x23\xd8\x2b\
-\x26\x2d\xe8\x2c\xc0\xa5\x4d\x42\x4d\x9b\xfe\x0b\x19\x80\x3a\x68\
-\x04\x49\xa9\xab\xf7\xe0\xb6\x97\xc0\xd6\x0e\xec\x2f\xfb\x2d\xc1\
-\x36\x03\x20\x85\x6b\xdf\x4f\x30\xd8\x71\x40\xab\xae\xd4\x2c\xc0\
-\xe1\x51\xe3\x5e\x47\xe5\xf7\x13\x34\xbf\xf4\xd8\x26\xbe\x55\x57\
-\xd3\x2f\xff\x55\xca\x05\x45\x3a\xa2\xf6\xaf\x33\xeb\x7f\x2a\x43\
-\x50\x04\x0f\x29\xab\xde\x2a\x23\x71\xbb\x14\xa8\xbf\x04\x03\xeb\
-\xcd\xa9\x4e\x46\xef\x0a\x19\x83\xf8\x2f\x96\xc2\xf3\xda\xdf\x5b\
-\x02\x2c\x31\x05\x3e\x79\x85\x90\x88\x01\x0e\xf3\x3c\xce\x99\x18\
-\x5e\x3a\xd5\xdf\xb9\xee\x73\x29\xcd\xf4\x32\x05\x4a\xed\x47\xfa\
-\x85\x45\xed\xe7\x7d\xc6\xa4\x3a\x21\x19\x65\x13\x82\x6c\xec\xdf\
-\xbf\x36\x34\xda\xbe\x0f\x86\x1e\x75\x80\x2e\x0b\x10\xaa\x02\x55\
-\x9b\x30\x58\x54\x05\xd9\x3e\x8f\xde\x78\x47\x70\x32\xf9\x42\x90\
-\x3a\xfb\xda\x17\x32\x00\xa5\xac\xd7\x33\xe0\xa8\x2f\x37\x00\xcc\
-\x46\x65\xdb\x29\x63\x2e\x81\xc0\x58\x85\x60\x0e\x12\xb3\xa8\x3c\
-\x4c\x55\x0a\x96\x80\xa8\x99\x00\x9b\x29\xb4\x5e\x35\x56\x4c\x0b\
-\x55\x74\x5a\x00\xa0\xd6\xe3\x97\xd2\x6a\x66\x00\x7d\x8f\xf6\xbb\
-\x2c\x1e\x77\x99\x66\x60\x6b\x52\x5d\xf7\x5a\x54\x22\x60\x98\x1b\
-\x2e\x82\x4b\x76\x53\xf3\x7b\x55\xcc\xf7\x4c\x5a\x4f\x22\x1b\xe8\
-\x85\x0e\xf9\xb0\xfc\x04\x02\x8e\x61\xf5\x20\x85\xe7\x93\x7e\x61\
-\x51\x7a\xbe\x0a\x54\x64\x68\xe0\x4c\x68\x02\x59\x3f\x40\x5b\x71\
-\x68\x5f\x66\xbb\x46\x2c\xea\x01\xda\xc4\x46\xa0\xe8\xfd\x53\x18\
-\x10\x2b\x07\xd9\xde\x86\x1b\x6e\xeb\x00\x20\xaf\x50\xcd\x8d\xbe\
-\xb4\x35\xc8\x73\xf0\x59\x94\x57\x58\x08\x30\x9b\x4c\x9d\x79\xd6\
-\x5b\x72\xa1\x13\x94\x3b\xcf\x00\x1c\x8a\x11\x53\xc3\xfa\xdd\x79\
-\x6a\xc2\x00\x97\x81\x83\xb0\x5e\x69\x70\xf1\xeb\x82\xe1\x8f\x69\
-\x00\x45\xe1\xcf\x80\x82\x8c\x30\x8a\x14\x53\xc9\x84\x2e\xa0\x79\
-\xe8\x30\xa2\xe6\xfb\x31\xbd\xa5\xd0\xa5\x24\xa5\xc6\x0d\xc9\x12\
-\xf3\x36\xee\xcf\x74\x00\x17\x8b\xf3\xdb\x46\x9a\xce\x4a\xdb\x3f\
-\x21\xa5\x71\xdb\x67\xcc\x52\x8e\x99\xc4\xaf\x5a\xce\xb8\x15\x93\
-\x20\x5a\xd2\x23\xa2\x0e\xa0\x01\x00\x24\x86\x00\xda\x2c\x11\x8d\
-\x40\x90\x2a\x8a\xea\xb3\xe8\x2d\x37\x22\xdb\xdb\x61\x8e\x40\x3e\
-\x1d\xc8\x67\xa2\xb7\x9b\xd0\xc2\x60\x55\x61\x66\x73\xa5\x02\x80\
-\x9b\x8c\xef\xad\x91\xb1\xe2\x0d\x62\x05\xe5\x4e\x46\x7c\x8a\x6e\
-\xfe\xdf\xba\xe9\xc5\xf4\xf3\x75\xd4\x0e\x58\xc3\xc3\xfb\xcc\x70\
-\x06\xcf\x5d\x48\xcd\x8d\x65\x02\xa4\x00\x14\x79\x51\xbe\xca\x70\
-\x06\x96\xa5\xff\x16\x14\x54\x46\xd2\x90\xd9\xe6\x4d\xcb\x1e\x8a\
-\xcd\x42\x3a\x22\x3e\x52\x48\xdd\x64\xcf\x9d\x37\x0e\x89\x4d\xff\
-\x19\x20\x48\xb1\x7d\x1b\x3f\x6b\xd4\x0e\x3a\x65\x5d\xd3\xe5\x9f\
-\xbe\xe7\x22\x6d\x6f\xdf\x5b\xed\xbf\x82\x35\xc7\xb7\x49\xaf\xdc\
-\xd8\x36\x2c\x85\x8d\xc2\xda\x84\xf2\x60\x34\x56\x03\x6a\x04\x07\
-\x14\x9a\x1a\xb9\xfe\x46\x98\x6f\xc1\xde\x7e\xff\x5a\x70\xc3\x7f\
-\x5f\xb1\xee\x85\x11\xd2\x34\x3c\xcb\x2b\x35\x04\x58\x14\x53\x80\
-\x63\xaa\x79\x5e\x19\xd8\x4c\xe4\x4d\x4b\xf4\xbf\x8e\xe9\xbf\x6a\
-\x24\xbe\x5a\x15\x5e\x34\x59\xea\x70\xea\x36\x2a\x54\x66\x94\x5f\
-\xb3\x58\x5f\x46\xfe\xdb\x6a\xbc\x7d\x4b\xbb\xcd\xf3\x0d\x40\x21\
-\x3d\x26\xff\x28\x05\xef\x6d\x75\x86\x8c\xfa\x6b\xa6\x09\xf4\x5e\
-\x5f\x1e\x0a\x64\x57\x6b\x2a\xde\x69\xa9\xbb\x79\xac\x64\xcf\x25\
-\x51\x23\x48\x3f\xe7\xe8\xc7\xfc\x38\x54\x24\xd0\xfb\x01\xfd\x8f\
-\xff\x53\x11\xf3\xd6\x8a\x91\x33\x0a\x2d\xc9\x52\x4e\x72\xd8\xfe\
-\x02\x2d\x75\x51\xa7\x75\xe2\x46\x0f\xe8\xb2\x00\x41\x07\x08\xa1\
-\x82\xc0\xd6\x59\xf4\xc6\xdb\x83\x79\xfa\x8c\xde\xaf\x6a\x2c\x2b\
-\x31\xb0\x71\x00\xd8\xbf\x52\x01\xa0\x9e\xf4\xfe\xac\xd0\x03\x58\
-\x43\x0c\xb4\xc6\x5c\xc5\x0c\x80\x1f\x61\x07\xab\x8c\xda\xd3\xfd\
-\x33\xc7\xba\x03\x27\x7f\x3e\xa3\xf9\xd6\xf8\x07\xb9\x78\x19\xc6\
-\xd6\x3d\xf0\xc8\x4b\x66\xc5\xb0\x09\xd7\x07\x0a\x2f\x05\xe6\xe0\
-\xfa\x20\xa1\xb9\x31\x67\x37\xc9\xbe\x37\xd0\x07\x64\x68\xdc\xea\
-\x8c\x47\xcf\xe8\xbd\x98\x98\xdf\x45\x21\xb0\xfd\x3b\x5c\x4f\x08\
-\x54\x11\xd4\x49\x06\x26\x64\x8b\x03\x47\xd8\x92\x74\x19\x85\x01\
-\xb5\x2f\x10\x1a\xb2\x8c\x25\x03\xe3\xd7\x76\x8d\x58\x30\xf6\x3a\
-\x76\x04\xda\x4c\x40\xd4\x01\x76\x0f\xc3\x4d\xb7\x77\x73\xfe\xc7\
-\x42\xd5\xb1\xd0\xd1\x62\x6d\x45\xb9\x7d\x38\x9c\x8b\x57\x6a\x08\
-\x70\x7e\x34\x04\x10\xd6\x9b\x9c\xeb\x0b\x69\x3c\x1d\x89\xff\x67\
-\x11\x00\x6a\xd6\x2a\x0c\x19\xd5\x13\xd2\xfe\x36\x65\xfd\x01\x20\
-\x45\xaf\x6f\xd3\x67\x32\x91\x16\xcc\xbc\xbc\xe4\x3f\x9b\x67\x0b\
-\x24\xbb\x8a\x0b\x22\xe0\x58\xcc\x9f\x6b\x10\xa5\x05\xa1\xab\x8e\
-\xcd\x68\x24\x79\x5d\xb2\x52\x5f\x1b\xa2\x88\x74\x31\xbe\x4b\x74\
-\x3b\x19\xba\xb6\x94\x3e\xe8\x02\xfd\x50\xa2\xab\x00\x54\x83\x8d\
-\x36\x8f\xd7\x6f\x3c\x52\xd5\xe9\x94\x6d\x96\x97\xd7\xd2\x45\xd1\
-\x96\xfe\xfa\x96\x01\xa8\xd5\x00\xb4\x01\x99\x83\xee\xc1\x09\x81\
-\x99\x0b\xc2\xa1\x1b\x31\xf2\x29\xca\x9f\x11\xad\x91\x73\xee\x4a\
-\x65\x00\xe7\xd7\xce\xef\x8f\x65\x00\x28\xd0\x2a\x3f\xa2\xf0\xa7\
-\x39\xeb\x9e\xd5\xed\xc2\xcd\x84\x9a\xbf\x9c\x60\x0c\xc5\xd9\x03\
-\x05\x0f\xef\xb3\x3c\x7e\x9e\xe2\x1b\x78\xfe\xdc\xb0\x6d\xf3\x4f\
-\xae\xe2\x67\x22\xa0\xe4\x1e\xbc\x94\xbe\x2b\x7c\x4f\x65\x98\x72\
-\x1c\xbd\xdf\x30\x05\x59\x47\xe5\x77\xfd\xd4\x1e\x86\x0d\xf4\xc2\
-\x02\x29\xb0\x88\x10\x0a\x68\x9b\x1e\x34\x75\x03\xf1\xf7\x86\x3f\
-\x25\x7a\x7d\xc9\x98\x52\xa9\x06\x40\x3b\xe6\x3e\x3e\x74\xc6\x74\
-\x25\xa2\x31\x13\x10\x0d\xbe\x69\x3a\x10\x48\x69\x85\xc5\x1e\xfa\
-\x92\xd7\xc0\xa1\x23\xe3\xd3\x90\x99\xf0\xfa\x19\x51\x9b\x38\x67\
-\xaf\x54\x06\xf0\x78\xf1\x5e\xdb\xf8\xb0\xce\x50\x8d\xa9\x18\x1c\
-\xc3\x00\x4e\x44\x01\x50\x99\x1e\x6d\x0d\xd3\x65\xbe\x1a\xa3\xae\
-\xad\x11\xc6\xb2\x8e\xd8\x37\xf0\xc2\x32\xcc\xb1\x97\xda\x7a\x7b\
-\xed\xb2\x32\x92\x1d\xc8\x8c\x6f\x90\x19\x90\x89\x6e\x3e\x29\xf4\
-\x07\x30\xee\x35\xed\x36\x4e\x29\x89\x56\x32\x14\x0b\x9d\x98\x86\
-\x20\x8d\xde\xdf\xb0\x19\x67\x3c\x75\xaf\x81\x26\xf5\x12\xc4\xc7\
-\xa7\x4c\x81\x1a\x7a\xac\x1a\x8a\x84\xc4\xb4\x1b\xa7\xfb\x12\x93\
-\x88\x75\x83\x3a\xd6\x25\xa8\x74\x3d\x54\xc9\xd6\xd5\x16\x11\xa9\
-\x29\xfd\x0d\x3a\x80\x60\x19\x80\x6f\xd5\x3e\xd9\x5a\x86\xe5\x83\
-\xab\x9a\xc2\x24\x13\x07\xd3\xd7\x76\xd5\xf8\x78\x29\xf0\xe9\x2b\
-\x95\x01\x3c\x5a\x7c\x43\xd6\x1d\x04\xea\x57\xe4\xf0\xf3\x34\xde\
-\x09\xba\x51\x63\x6b\xc5\xec\x13\xb5\x02\xa9\xd5\x73\xb2\xf5\x37\
-\xf3\xfc\x9e\x11\x2f\x6d\x0d\x39\xf3\xe4\xbe\xf4\xd8\x2c\x67\x6f\
-\x7f\xd6\x2e\xa6\xef\x69\x0c\x6e\x44\x57\x70\xfd\xef\xe5\x85\x40\
-\x63\x5f\x4b\x81\x19\x60\x84\xbe\xc4\x3a\x9c\x74\x5e\xdd\x7a\xfc\
-\xf4\xf3\x2e\x3e\xde\x49\x7c\xc9\x51\xe8\x73\x02\x95\xeb\x0b\x8a\
-\x92\x3f\x57\xf2\xf2\xd2\xe6\xfe\xd5\x88\x8f\x41\x3b\xe8\xde\x5f\
-\x1d\xcb\xac\x8c\x6d\x38\xce\xff\xbc\x76\x56\x60\x04\x0f\x8d\x1b\
-\x85\x63\x2d\x80\x10\x45\xc1\x74\xb1\x78\x60\x67\x81\xbe\xf0\x15\
-\xc3\xc1\x33\x30\x2c\x0d\x26\xa3\xfb\x95\xf9\x38\x9b\x64\x01\x8f\
-\x5f\xa9\x0c\xe0\x53\xd1\x8c\xe6\x45\x54\xcc\x4b\x23\xd7\x99\x2b\
-\xef\x27\x52\x80\xbb\x0c\x9b\x8d\x4a\xf1\xd7\x58\x41\x4f\xfe\xd8\
-\x94\x7c\xa9\x4a\x20\x94\x95\xf1\x7a\x86\xd5\x7e\x52\x50\xf8\x07\
-\x92\xef\x48\x78\x50\x0a\x18\xb5\xf0\x7b\xd5\xd0\x67\x65\x3a\x75\
-\x38\x16\xe8\xaf\x5c\x3e\xaa\x7d\x4f\xd6\xa3\xd1\xb6\xbc\xd7\x4e\
-\xee\x14\xa8\xe2\xf4\xdd\x08\x06\x2a\x1a\x1f\xa3\x9d\x81\xa7\x97\
-\xd3\x44\xcf\xef\xa3\x37\x6f\x1b\x87\x4c\xce\x7f\xa0\x2d\x04\xa6\
-\xa0\xa2\x2d\x5b\x50\xfb\x9a\x44\xe2\x04\xe0\x91\xba\x80\x8c\x09\
-\xa8\x2d\x6f\x88\x65\xc1\x68\x83\x92\x0a\x80\xa2\x08\xa8\xa6\x68\
-\x68\xfb\x08\x5c\xf7\x22\x68\x7e\x6d\xd8\xc3\xe2\xb2\xb7\xdc\x65\
-\x9e\xdf\xde\xfc\x01\x1d\xe9\x15\x02\x00\x0f\x12\x96\x2b\xcf\x7b\
-\x6f\xc4\xaa\xb2\x86\xb1\x0b\xd2\x8f\xd0\xf1\x54\x01\x78\xdc\xa4\
-\x62\x64\x0d\x00\x99\xaa\x2f\xb0\x19\x88\xed\x1c\x58\x0c\xed\xd7\
-\x02\x4d\x2f\x79\xfe\x31\xe3\x1f\x0c\xc4\x90\x15\x54\x5f\xfa\xc3\
-\x36\xf2\xdf\xa9\x85\xe7\x29\x0a\x82\x07\x59\x1a\x58\x08\xa8\x2d\
-\x30\xb4\x42\x9d\xb4\x5c\xba\xad\x5d\x12\xfa\x22\x9f\x26\x8a\x6f\
-\xc0\x21\xaf\x86\x76\xda\x82\xaa\x5a\x40\xb1\x2f\xdb\x59\x01\xb0\
-\xe3\xcf\xa9\x69\x48\x13\xe0\xf4\xdb\x88\x86\x03\x8e\x33\x40\x0b\
-\x91\x4b\x47\x0d\xa5\xcd\x19\x9a\x0c\x40\xaa\x05\x10\x40\x1a\x90\
-\xd3\xe3\xc6\x6f\x0d\xdf\xee\x0e\xa8\x8c\xe7\xaf\x06\x09\xf3\x92\
-\x23\xbd\x22\x01\xe0\x89\xf8\xe2\x8f\xf6\xee\xb5\x46\xea\x18\xaf\
-\xda\x5b\xb7\xf5\x36\x4d\x1a\x3e\xc6\x74\x05\xe0\xa5\xcc\xa4\xf7\
-\x51\x0f\x98\x67\x06\x4f\xbc\xe0\xc7\xbc\xeb\x20\xe6\x36\xf7\x97\
-\x86\x78\x96\x26\xe9\xe4\xd9\x81\x81\xe1\x97\xe2\xfa\x09\x86\x41\
-\x89\xbd\x94\xbf\xd5\x63\x4b\x39\x16\xa5\x18\xbf\x31\x73\x00\x24\
-\x2c\xdb\x68\x85\x79\x17\xed\xa4\x2d\xf7\x4d\x06\x6f\xd4\xfe\xc8\
-\x06\x34\x75\xff\x39\xfb\xf7\xf8\x90\x1a\xf4\xf9\xdb\x18\xf5\x03\
-\x07\xda\x64\x92\xbe\x68\xac\x09\xd0\x3e\xf1\x31\x5b\x43\x8a\xc5\
-\x98\x58\x21\x4e\x4d\x77\xb2\x37\x06\xef\xdb\xf8\x3f\x70\x94\x54\
-\x11\x78\x1e\x6e\xba\x1e\x0e\xcd\x41\x96\x85\xf7\x2a\x8b\xdc\x72\
-\xe3\x9f\xb1\x4e\x09\xf0\x27\xae\x54\x00\xd8\x03\x3e\x46\x98\x6d\
-\xde\x37\xb6\x9a\xd0\xb2\x5b\x33\x6c\xfd\x9d\x1a\xfc\x3e\xd6\xbb\
-\x2e\x74\x2d\xc0\x4a\x79\x12\x8b\x30\x3d\x50\x64\xec\xbe\xd4\x55\
-\xb8\xc5\xf4\xe2\x8d\x92\x71\xeb\x88\x71\x0f\xe8\xbd\x05\x08\xe9\
-\xd3\x77\x9b\x6f\x27\xcb\x2e\xc8\x08\xb3\x50\xca\x40\xa0\x39\x83\
-\x59\xf1\x1f\xcc\xa7\x6a\x88\xe9\xce\x73\x31\x0e\x16\xb3\x9d\xb3\
-\xa5\xf9\xe6\x73\x67\xb2\x22\x06\x08\xd4\xf6\x02\x64\x33\x19\xb4\
-\x72\xdd\x1e\xbf\xa6\x2f\x2e\x8a\x93\x5e\x75\xa0\x46\xe6\xa1\x31\
-\xdd\xa8\x29\x95\xe8\xa3\x18\x28\xd1\x97\x47\x60\xd0\xc2\x38\x42\
-\xab\xbb\xb6\x75\x45\xa2\x28\x1e\x71\x1e\x2d\x35\xa0\xa8\x86\x8d\
-\x42\x37\xbd\x0c\xd9\x3d\x04\x8b\xd3\xe5\x18\xdf\x65\xb1\x7e\x02\
-\x80\x34\x1e\x7f\x39\x29\x00\x9e\x03\x3e\x70\xa5\x02\x00\xc0\x07\
-\x81\xb7\x0f\xee\xad\x47\x98\xae\x63\x38\xb1\x77\x6a\x54\x58\xba\
-\x6f\x87\x6e\x4d\xd3\x14\x9b\x58\xb5\x65\x68\xec\x7b\xfb\xf1\xca\
-\x99\xd3\x2f\x21\x93\xcc\xb3\x7b\x19\x36\xf6\x58\x6b\x6a\x41\xc8\
-\x65\x99\x01\x86\x60\x50\x6a\xac\x19\x54\x05\x96\xc2\x8d\x52\x0a\
-\x52\x32\x83\xce\xd0\x74\xb0\xc9\xc6\xbc\xf9\xce\xb0\x9d\x96\xe2\
-\x07\x57\x2f\xd1\xc0\x3a\xc2\x62\x28\xbe\x5a\x83\xef\x1b\xba\xa6\
-\xe0\xdb\xd9\x10\xa6\x63\x08\x6d\xab\x6e\xef\xff\xa1\xbd\x1a\x89\
-\xb6\xe9\x10\x0d\x29\x43\x8d\x1f\xe3\xdf\xa4\x12\xbf\xb6\xf3\x0a\
-\x44\x7b\xff\x9e\x7c\x43\x9a\x98\xaf\x42\x28\x60\xd4\xe2\x18\x1a\
-\x88\x9d\x4c\x02\xc8\xdc\xc1\x4c\xba\x5d\x7f\x55\x66\xf4\xb9\xd8\
-\x37\x33\x00\x50\x45\x37\x39\x1e\x91\x7d\x20\x86\xd2\x57\x2c\x00\
-\x7c\xa0\xe8\x55\x52\xb1\x4e\x55\x88\xc5\xa5\xf0\x1f\x19\x9b\x03\
-\x95\x3e\x3f\xc9\xea\xe2\x1d\x26\xbc\x7c\x4e\xfb\x07\x33\xf1\xa4\
-\x2b\xc8\xac\x8c\xf1\xeb\x88\xf1\xe5\x62\x9e\xb8\x61\x49\x70\x2e\
-\x0e\x4a\x49\x9a\x36\x22\x63\x49\x95\x2f\xd5\x0f\x88\x31\x58\xa1\
-\xdc\x64\xd4\xfe\x7d\x62\x1a\x6b\xb2\x18\xdb\x1b\x85\x5d\x34\xd8\
-\x51\x36\xcd\x47\xe3\xe3\x34\x19\xbd\x33\xa2\xac\xa3\x1b\x51\x9e\
-\xd2\x81\x64\xe1\x9f\x66\xa1\xa0\x73\x9d\xc2\xee\xfb\x05\x47\x42\
-\x50\xfd\xd5\x1b\x50\xf2\x9d\x50\x29\x51\x0b\x50\x33\x84\x54\xe9\
-\x66\x81\xa7\xde\xff\xe2\x20\xa3\xde\xbf\xcc\xe3\xc4\x45\x11\xdf\
-\x23\x1a\xc0\x40\x35\x01\x80\xbd\x78\x1c\xe8\x59\x70\xcb\x60\xd0\
-\x63\x0a\x7f\x0e\x00\x33\xa3\x8c\x4d\xef\x05\xf8\x05\xae\xe0\x66\
-\x20\x80\x77\xc7\x3f\x71\x36\xa8\x05\x58\x46\xe5\x3e\x6f\x92\x59\
-\x35\xe8\x2d\x9f\xe3\x27\x74\x33\x53\xd6\x9d\xe9\x97\x3f\xd6\x33\
-\xde\xfe\x6b\x29\xf5\x45\x09\xa2\xe0\x5c\x86\xe2\x1b\x63\x9e\xdf\
-\x0d\xbf\xa7\x59\x01\x0c\x05\xcf\x2e\x94\x0b\x75\x18\xd3\x00\x64\
-\x58\x7d\x58\xca\x0c\x64\x2a\xbe\xf6\x75\x34\x43\x00\xd4\x4c\xec\
-\x52\xf3\x36\x68\x57\xdd\xe7\xcd\x68\xb2\x36\x0f\xaf\x9d\xe7\xb7\
-\x7f\xbe\xef\xd8\x81\xc4\xca\x40\x75\x16\x20\x12\x83\xf2\xdd\x9f\
-\xad\x91\x2d\x88\x8f\xb5\x03\x31\x9d\x18\x8b\x76\x52\x1f\x40\xc0\
-\xde\xf4\x7a\x3b\xea\xdf\x69\x96\x11\x04\x62\x28\x50\x6a\xb6\xec\
-\x69\x01\xbd\x8f\xf1\xf5\x89\x11\x00\xed\xc5\x52\x9d\x47\x4f\x1c\
-\x43\x1e\x39\xdf\x79\xf7\xf4\xb3\xd6\xe3\xdb\x8f\xf3\x18\x52\x9e\
-\x9f\xa4\xff\x00\xff\xf1\x72\x1a\xe7\xd3\x01\x00\x1f\x06\xee\x05\
-\x5e\x34\xf8\xce\x3e\xa1\x7d\xb7\x2a\xd0\x6f\xc7\x70\x7a\xf0\xd4\
-\x64\x9e\x6d\xe3\x45\xc6\xe8\x7f\x3e\x16\x7a\xcc\xf8\x47\xa7\x00\
-\x45\x0b\xd8\x8b\x1f\x67\x05\xcf\x2f\x05\xe3\x97\x4c\x0f\x18\x0c\
-\xe8\xc8\x1e\x8b\x8c\x1b\x7e\x6f\x7e\x9e\x2b\xc4\xfb\xa5\x70\x61\
-\x44\x0b\xc8\xc4\xb1\xde\x86\xdd\x64\x58\xb6\x2c\xd7\xc5\x78\x5c\
-\xec\x34\x0e\xed\x97\xfa\x5a\x43\x27\xae\x7a\x17\x86\xb1\x7e\xcb\
-\x02\xcc\x5c\x43\x17\x45\xb8\xd4\xdb\x50\x99\x0a\x9d\x76\xfa\x90\
-\x6f\x59\x88\x8a\x2d\x01\x8e\x79\xfb\xd6\x8b\x9b\x62\xa4\xa4\x03\
-\xa8\x49\x0f\xa2\x45\xfc\x6c\x0b\x0e\x53\x71\x65\x12\x38\xf1\x38\
-\x34\x00\x61\x56\x38\x22\x3b\x47\xd0\x9b\xee\x80\x47\x1f\xec\x2f\
-\x0b\x49\xb9\xfd\x99\xa1\xfb\xe9\xe3\x56\x7c\xcc\x74\x95\xff\xbb\
-\x80\x5f\xb9\xd2\x01\xe0\x22\xf0\x8b\x03\x00\x10\xba\x35\x4a\x5b\
-\x0c\x67\xa6\xf9\x09\xda\x9e\x8b\x79\xb3\x08\x24\x9e\xf1\xc5\x9e\
-\x63\xe9\x43\x18\xef\x83\x1f\x4d\xe9\xc5\xb8\x6d\x2b\x32\x81\x52\
-\xd7\x9d\x18\xd7\xd7\xd2\xec\x9c\xe6\xbb\xe1\xf4\x1d\xcd\x7e\x6e\
-\x50\x9c\x93\xe9\x07\x53\x69\xc3\x8c\x05\x74\x79\xee\xe4\x45\xad\
-\xc0\x98\xef\xd5\xd3\x8e\xc2\xfb\xe8\x71\x53\xee\x3e\xb5\xce\x26\
-\xaf\xdd\xd6\xd9\x9a\x37\x39\x89\x83\xce\xf4\xdc\x9a\x12\x3c\x15\
-\x0d\x06\x5e\x77\xde\x5f\x1b\xf3\xb6\x49\xcc\xbc\x89\x8b\xb1\x77\
-\x12\x11\x5d\xa4\xe2\xd2\x6a\x11\x6d\x13\x50\x12\x07\xed\xfc\x01\
-\xd5\x56\x3c\xec\x67\x47\x83\x46\x50\xac\x77\x4a\x86\x8f\xef\x8c\
-\x3f\xfe\x2e\x41\xbb\xd7\x93\xea\x05\xaa\x2d\x38\x76\xaa\x6f\xe8\
-\x6e\xc4\xeb\xe7\xde\x7f\x31\xe9\xfd\xff\x0f\x2e\x63\x2b\xf0\xd3\
-\x05\x00\x00\x3f\x0f\x7c\x6b\xf1\x3b\x17\xa2\x80\x57\x65\xd7\xb1\
-\x9d\xad\xee\x0b\xf1\xb9\x35\xde\x2d\xc2\xf4\xc1\x75\x97\x7b\xf8\
-\x15\x86\x9f\xe7\x8a\x8a\x6b\xbc\x24\x40\x9b\x02\x95\x14\x3c\xab\
-\xf4\x8d\x7b\x10\x22\x94\x26\xe8\x14\x32\x01\xc8\x0a\x56\x90\x07\
-\xb0\x85\xc2\xa2\xf6\x9a\x17\x13\xfb\x4e\xcc\x09\x34\x86\xdf\xaa\
-\xf9\x36\xf6\x4f\xa5\xb8\xbd\xd9\xfe\xda\xd1\x7f\x9b\x2a\x74\x86\
-\x11\x78\xdf\xff\xd3\x9b\xa1\x0e\xa0\x4a\xbf\xa4\x37\x7a\x7f\x15\
-\x1f\x64\x14\x15\xd4\xc7\x8b\x22\x5b\x42\x6a\x7f\x56\x35\x17\x01\
-\x23\x13\x88\x99\x88\xe2\x50\x90\x98\xa6\xd3\xca\x10\x39\x97\x1a\
-\x19\x63\xec\x2f\x31\x1c\x6a\x23\xad\xf8\x24\xf3\x2a\x5c\x87\x5b\
-\xc6\xfb\x57\x85\xb8\x7f\x16\x1f\x33\x03\xce\x4c\xd2\xff\xfb\x80\
-\x7f\x7d\xb9\x0d\xf3\xe9\x02\x80\x9f\x8d\x35\x01\x27\x06\x2c\x60\
-\x3f\xa2\xe0\x4e\xc1\x48\x67\x05\x66\xe0\x0a\xb4\x5e\xe8\xb6\x00\
-\xf9\x89\x9c\x7f\xa9\xd4\x78\xcc\xf8\x7b\x3f\x9f\x15\xee\xd8\x2c\
-\xc0\x05\x60\x47\xba\x70\xa0\x34\xde\xdb\xf6\xb6\xab\xf5\xfc\xf4\
-\x0d\x5d\xb3\x46\x1d\xb2\xfb\x35\x7b\x9e\x54\x61\xa7\x82\x64\x80\
-\x10\xee\xa3\xab\x8c\xd3\xac\x61\x66\x50\x1a\x5b\x9a\xfa\x53\xf8\
-\x5a\xd4\x0c\xee\xb0\x2c\x41\xfb\x9d\x7d\x28\x38\x6f\xe2\x7e\x50\
-\xad\x82\xf7\xec\x19\x7d\x8c\xc9\xd5\x77\xc4\xa7\x89\x14\xdd\xf9\
-\x2e\x40\x8f\x9e\x3f\xa4\xff\x42\xc9\xb0\x2e\xbb\xbe\x00\x35\x7f\
-\x6b\xd2\x03\x52\xda\x31\x6d\x02\xef\x8a\x80\x4c\x28\xa0\x5d\xde\
-\xdf\x39\x86\x75\xfa\xb6\x02\x5a\x52\x66\x80\x6c\xb0\x60\x64\x82\
-\x3b\xf1\x3a\x4c\xd4\x7f\x9e\xe9\x00\xd6\xfb\x9f\x8e\x0c\x60\xbc\
-\x18\xff\xaf\x01\x8f\x3d\x57\x00\xe0\x53\x11\x04\x7e\x5f\xf1\xbb\
-\x67\xa3\x88\x37\xcf\x14\x78\xbb\x70\x61\xca\xbb\x57\xe6\x67\x4b\
-\x0c\xa1\xa4\xf2\x4f\x7d\x3d\xda\xc4\x43\xbf\xfe\x3e\x19\x8e\x0d\
-\x07\xb0\xea\xb5\x33\x4b\x3b\xec\xb0\x0f\x86\x86\xde\xfb\xda\x19\
-\x81\x4e\x10\x71\x31\x14\xee\x1e\xa3\x08\xa2\xf9\xdc\x3f\x3b\x4d\
-\x57\xe2\xe7\xa5\x34\x64\xb6\xb5\x67\x6c\x17\x60\x0f\x13\x0c\xdd\
-\x17\x13\x22\x78\xa3\x03\x24\xf1\x0f\x69\x2b\xff\x14\xdf\xaf\x01\
-\x20\xe6\xf7\x9d\xef\xf4\x34\x17\x42\x11\xf5\x09\x34\xe8\x06\x88\
-\xa8\x0f\x5e\xdc\x01\x3e\x86\x03\x02\xaa\xf1\x73\x23\x0c\x42\x1c\
-\xef\x9f\xa2\x24\x4d\xc6\x2f\x6d\x08\xd3\x56\x0a\xb6\x71\xbe\x20\
-\x95\x06\xcf\x6f\xe7\x98\xd8\x26\x4b\x9b\xd6\x93\x11\x11\x6a\x1e\
-\x8d\x7f\xa7\xa0\xfe\xcf\x33\x26\x20\xc0\xa7\x27\xed\xe5\xb7\x22\
-\xfd\xe7\xb9\x02\x00\x00\xff\xbc\x08\x00\x89\x05\x9c\xa3\xeb\xe5\
-\x4f\x06\xdf\x8c\xa9\xf2\xe6\x42\x6d\xcc\x1b\xec\x27\x32\x01\xf6\
-\x39\xfc\x2a\x46\x20\xc3\x3a\x04\x64\x38\x9b\x20\x19\x98\x8f\x9a\
-\x40\x13\x41\x40\x0a\xa2\x5d\x7b\xc5\x15\xe8\xbc\xf9\xbe\x46\x33\
-\xb7\x5d\x24\x1a\x0d\x56\xb3\x96\x32\x35\x7a\x80\x52\xc8\x20\x8c\
-\x95\x12\xc3\x50\x1c\x74\x05\x56\xe5\xcd\x9b\x57\x69\xb7\xb6\xcb\
-\xce\xfd\xb3\x15\x7e\x6d\x1d\x44\x8c\xe9\xbd\x84\xf0\x48\xb4\xb5\
-\x4c\x6d\xa3\x88\x2a\x18\x7b\xd2\x0b\x52\x08\xd8\x04\xc3\x16\x07\
-\x5a\x07\xd7\x2b\x95\x47\x1b\x33\x55\xc8\xfb\xde\xe2\x51\xb5\x8b\
-\x48\x4d\xd9\xb0\xaa\xe2\xa3\xd1\xa3\x12\x44\xcc\xb6\xb6\x21\xb2\
-\x03\x63\xe8\x62\x0c\x57\x4c\x1c\x2f\xbd\x2e\xea\x91\x7d\x6f\x73\
-\x3a\x06\x50\x0a\x01\x2a\x43\xff\xef\x8d\xcc\xb1\x3c\xec\xbb\x06\
-\xfe\x74\xbc\xa2\x9e\x53\x00\xf0\xb3\xc0\x7b\x81\x57\x17\x41\xe0\
-\x34\xdd\x40\xcf\xda\x78\x76\xcf\x74\xc5\x5e\x9a\x01\xe0\x98\x6e\
-\x17\x1e\x9b\xf2\x53\x02\x07\xb2\x3c\xbf\x8e\x2c\xe0\xcc\xf3\xee\
-\xfb\xd2\x69\x12\x52\xe8\x97\xcf\x8d\x54\x3b\x77\xa3\xf1\x6b\x89\
-\x2e\x28\x00\x81\xc4\xea\x76\xe9\xf7\xf2\x2b\xa6\xef\x9e\xa1\x26\
-\x90\x6a\x0e\x72\x9d\x40\x22\x8b\xb0\xf3\x00\x29\xc5\xff\xdd\xe7\
-\xea\xed\xf6\x1e\xed\xcf\xd7\xb6\x0d\xf6\x6d\x68\x10\xe3\xfc\x04\
-\x04\x3d\x6f\x1e\xf3\xe9\x6d\xea\xcf\x05\x10\xc8\xfb\x43\x62\xcc\
-\x9f\x32\x04\x1a\x3d\xbf\xf6\x27\x84\xc4\x7a\x7f\xda\xea\x3f\x25\
-\x56\x09\x7a\x93\x22\x44\x03\x8e\xb9\x02\xee\xb5\x39\xfb\x08\x0e\
-\x0e\x5c\xc5\x60\xfc\x41\x6b\xfc\x4e\xda\x8f\x6d\x53\x53\x12\x37\
-\x2b\xfa\x21\x40\x95\x65\x03\x92\xf1\x3f\x0e\x3c\x3c\x49\xfd\xff\
-\x06\xf0\x73\x4f\x97\x51\x3e\x9d\x00\xb0\x00\xfe\x36\xf0\x23\xa3\
-\xb9\xfd\x47\x08\xcb\xc4\xb7\x58\x3d\xa6\xdb\x2e\xf5\x38\xcc\x70\
-\xc5\x77\x69\x88\x07\x94\x67\x04\xf6\x1e\x3f\xd1\xc7\x6f\xf3\xe8\
-\xe2\x86\x40\x21\xc0\x42\x42\x8d\x7c\xf2\x04\x76\x88\x45\xa2\xed\
-\x76\xf4\x95\x69\xd5\x15\x43\xef\x13\xfd\xef\x0d\xd7\x98\x4a\x0f\
-\x8e\xcc\xef\x17\xcd\x46\x6b\x17\xd7\x73\x77\x85\x31\x76\x43\x97\
-\xf6\x0a\x82\x8c\xea\x8f\xc9\x02\xb4\x65\xbd\x1a\xd7\x77\x27\x35\
-\xce\x9b\x32\xe1\xf8\x04\xce\x8c\xe4\x4d\xde\xb8\x71\x5d\xdb\x6d\
-\x7a\x4c\xa8\x2c\x82\xca\x77\x33\x02\xf2\x42\x85\x18\x52\x88\x0a\
-\xaa\xce\xe4\xfd\xb5\x03\x86\x5e\x19\x86\x11\x04\x9d\xf9\x18\xe9\
-\x3f\xd2\x79\x7d\xa9\x52\x68\x10\xdb\x98\xab\x70\x93\xec\x3d\x4b\
-\xbc\x0b\xef\xc3\x6b\xdd\x35\x0c\xa0\xca\x3e\x6e\x45\xa6\x7b\x37\
-\xe3\xeb\xc3\xe1\x97\x80\xbf\xf4\x34\xda\xe4\xd3\x0a\x00\x00\xff\
-\x02\xf8\x63\xc0\x67\x8e\x86\x02\x9f\x02\x6e\x8d\xaf\xac\x19\x31\
-\x52\x6b\x90\xa9\xa7\x60\xac\xa2\x6f\x6a\x9b\xb0\x4e\x84\x02\x6e\
-\x4c\x08\x64\x58\xb4\x93\x57\x05\xd6\x12\x5e\xfb\xb6\x83\xb9\x18\
-\x5a\x1f\x3f\xb7\x94\xdf\x88\x80\x2a\xd9\xfc\xff\xc1\x80\x4e\x29\
-\xb3\x80\xcc\xf8\xa5\xb7\x13\x20\xab\x3a\x34\x21\x8d\xf6\x19\x73\
-\xff\x4f\xb5\x61\x54\xca\xf1\xab\xf9\xd8\xea\x01\x1a\xab\x00\x13\
-\x15\xd7\x8e\x62\x5b\x11\xa7\x15\x09\x53\xa5\x9f\x74\x83\x34\x14\
-\xc4\xb9\xa8\x17\xa4\xea\x3a\x1f\x62\xfe\xf4\x00\x1f\xbf\x1f\x5f\
-\xb0\x46\x30\x51\x1f\x7a\x00\x24\x55\x24\xaa\x15\x05\xa5\x65\x2b\
-\x29\x2b\x30\x68\xd0\x89\xde\xdf\xcd\x04\x99\x29\x32\xa3\x7f\xab\
-\x04\xe7\x04\x71\xf9\xae\x05\x8b\x9c\xcb\x30\x1e\x6c\x27\x1a\x7a\
-\x5e\x0a\x9c\xae\xe5\x8f\x46\x62\x5f\xa6\xfe\x9f\x8c\x99\xb2\x8b\
-\xcf\x65\x00\xd8\x07\xbe\x97\x50\xdd\x24\x45\xfa\x79\x1e\xb8\x3f\
-\x03\x81\xa9\x31\x4b\xa9\xa8\x82\x15\x29\xbd\xb1\xd8\xbf\xb7\x95\
-\x45\xb2\xfe\x7e\x86\x35\x00\x50\xd8\x71\x6f\xa8\x69\x1c\x53\x25\
-\x2a\xb0\x27\x68\x2d\xc8\x36\xbd\x51\x5a\x9a\xa6\xdd\xd8\xe2\x20\
-\x57\x30\x7e\x75\xe3\x62\x61\xeb\x42\x32\x06\x91\xb1\x80\x34\x48\
-\x43\x24\xbb\x4f\x6d\xfa\x2c\x6b\xb5\xf5\xd6\xe8\xe9\x1a\x7d\xda\
-\xf1\xd9\xe6\x8d\xae\xe2\x7a\x6d\x1f\xd3\x6f\xae\x8b\xf7\xbb\x35\
-\x61\xfd\x7f\x82\x48\x12\x07\x3b\x51\x2f\x14\x83\x45\xaa\xef\x8c\
-\xc1\x8b\x9d\x00\x94\x42\x01\x6d\x73\xfe\x29\xfe\x57\x27\x11\x9f\
-\x52\xc9\xaf\x99\x0f\x80\xf4\x75\x02\xd7\x69\x00\x54\xd1\xf3\x47\
-\x9a\x2e\x33\x60\xee\x90\xb9\x44\x2d\x20\xa4\x07\xc4\xb9\xfe\x78\
-\x33\x9b\x15\xa9\xcf\xc1\xf2\xee\xae\xa8\xcd\x56\x11\xce\xe3\x35\
-\xfc\xc1\x98\x07\x2b\x1b\xff\x63\x51\x1f\xbb\xfb\x69\xb6\xc7\xa7\
-\x1d\x00\x00\xfe\x33\xf0\x8f\x81\xef\x2a\x7e\xd7\x45\x3d\xe0\x5e\
-\xe0\x05\x46\x13\x28\x8d\x7d\x4e\x22\xe0\x56\x16\xcb\xb3\x86\xe7\
-\xf7\x23\x7a\x40\x4f\x11\x2f\x8c\xd6\x32\xb9\x74\xb1\x5e\x34\xc5\
-\xea\x82\xf1\xe6\x02\x4b\x42\x0c\xbb\x95\x04\xb1\x3c\xc7\x9f\x0c\
-\x3c\xf3\xf0\xb8\xa1\x56\x20\x66\x12\x50\xeb\xfd\x53\x5c\xef\xfa\
-\x19\x82\x4c\x83\x50\x1b\xbe\xa8\x8c\x6f\x29\xb6\xe3\xb7\x44\xfb\
-\x6b\xba\x8d\xd1\xa7\x3c\x7d\xaf\xf4\x17\x41\x52\xc1\x8d\x8f\xf7\
-\x89\xef\xf2\xfd\xc9\x18\xbd\x15\xf3\x1c\xea\xc2\x63\x42\x82\xc4\
-\x85\x15\xdc\x98\xbe\x62\x09\x39\x7f\x11\x8d\xd3\x83\x31\xfb\x1c\
-\x53\x36\xa0\x2b\x52\x4a\x0d\x41\xa9\xee\xc1\xc7\xdc\x7d\x98\x20\
-\x14\xef\x8f\xde\x3e\x78\x68\x41\xe6\xdd\xd7\x52\x05\x66\x20\x95\
-\x0b\xff\x33\x17\xfe\x9f\xae\x5d\x71\x96\xde\xb5\xf8\x7b\x75\x07\
-\x69\x3e\x1e\xe8\xbf\x49\x1d\xb2\x15\xfd\xf9\x6f\x13\x46\x7a\x94\
-\xad\xed\x71\xe0\xeb\x80\xff\xf1\x0c\xd8\xe2\x33\x02\x00\x00\xdf\
-\x03\xbc\x2e\xde\x86\xa7\x8a\x45\x12\x1f\x05\x6e\x8b\xd9\x81\x31\
-\x26\xe0\x23\xca\x8e\xf5\xf2\xaf\xda\x0d\x98\x0f\xf6\x4c\x06\xe1\
-\xc9\x1a\x69\x6c\x8a\x4f\xba\x19\xf5\x6a\x46\x55\xf5\x52\x6b\xe6\
-\xe7\x9a\xc0\x06\x98\x49\x07\x04\x9a\x8d\xd9\x2a\x7d\x3d\x60\x01\
-\xce\xe8\x0f\x51\x21\x37\x1e\xbf\x7b\x0d\xae\x4b\x07\x5a\x06\xe1\
-\xb2\xba\x84\xd2\x74\xe0\x7c\x6d\x36\xa6\xd0\x47\x6d\x8e\xbf\x0b\
-\x01\xda\x8f\x95\x76\x0d\x3d\x51\x1f\x50\x9f\xe8\xb9\x0f\x86\x4e\
-\xd5\x6e\xd7\xd1\x98\xe6\x43\xa3\x18\xd8\xb2\xb2\x58\xed\x27\x46\
-\x14\x8c\xdf\x57\xd7\xcd\xed\x53\xe9\xb2\x23\x9a\x98\x42\x9a\x23\
-\x48\x28\xe8\x69\x67\x12\x24\x20\x49\x93\xcd\x67\xc1\xf0\x31\xb4\
-\x9f\x59\xe8\xf6\xec\xe8\xbf\xeb\x6e\xae\x32\xcf\x93\x74\x0a\x1f\
-\xb5\x85\x43\xc8\xd6\xac\x0b\x1d\x13\x0b\xf8\x74\xf4\xfc\xe7\x46\
-\x2d\xed\x51\xe0\xeb\x09\x85\x72\x3c\x9f\x00\xe0\x74\xfc\xc3\xff\
-\x6b\xf4\xf3\x65\x26\x70\x11\xf8\x08\x70\x03\x61\xe5\xf7\x6e\xa6\
-\x0b\x08\xc3\x01\xa3\xac\xc9\x00\xc6\x40\xc2\x5a\x84\x61\x13\xc1\
-\x69\xda\x94\x5b\xfe\x62\x4d\x98\xe0\x4a\x53\x6a\x25\xee\x1c\x10\
-\x98\xbb\x98\x23\x2e\x14\xff\x58\xe3\xc7\x15\x34\x80\xfe\x7c\x3f\
-\xc5\x05\x4a\x9d\x74\x88\xe2\x8e\xbe\x6c\x7e\x7f\xae\x65\xc8\x88\
-\x28\x4b\xc6\x02\x7a\x8b\xf5\xb4\xf3\xf2\xf1\xeb\x30\xa8\xc3\x4e\
-\xfb\xf1\x31\x5e\x0f\x9e\xbe\xed\x23\x88\x5e\x3b\xe0\x9b\xeb\xda\
-\x85\xd5\x9b\x02\xa1\x04\x02\xda\xcd\x04\x34\xab\x7f\x12\x78\xf8\
-\xf8\xde\x6a\xac\x48\xf4\x22\x46\xb7\xd5\xde\xbf\x26\x79\x76\xaa\
-\x4e\x00\x74\x33\x90\xad\x30\xe5\x5b\xe6\x50\xcd\x05\x37\x17\x64\
-\x26\x91\x0d\xb8\x30\xbb\xd0\x45\x75\xd0\x89\xe9\x06\x8c\xf4\xf3\
-\xc2\xfb\xc0\x5d\xe8\xd2\xd1\x17\x22\x99\xff\x24\xdd\xb8\xfa\xe1\
-\xb9\x1b\xf8\x06\xe0\xd7\x79\x06\xcf\xec\x19\xfc\xdd\x77\x01\x5f\
-\x06\xfc\x5b\xf2\x81\x21\x79\x4a\xea\xbe\x18\x25\x5d\x1b\x6f\x87\
-\x4c\x8a\x30\x6d\x04\x9e\x1a\x37\x3e\x15\x06\xf8\x7e\x71\x8f\xe6\
-\xc2\x9f\x91\xc6\xb5\x54\x3d\x67\xb7\xd8\xd8\xd6\xda\x81\x01\x27\
-\xda\x2b\x21\x1f\xd2\x48\xa8\x19\x98\xd9\xdf\x91\x19\x7c\x8f\x05\
-\xd8\xa1\x20\xae\xa7\x05\xa8\x1d\xa9\x3d\xf8\x7e\xd6\x6d\xd8\x7b\
-\x7d\x8c\x6e\xf7\xea\x80\xc0\xa4\x01\xd5\xb6\xf4\x26\x63\x8f\x46\
-\xea\x4d\x3d\x40\x2a\xe8\xa1\x0a\x69\x3f\xef\xcc\x9b\x17\x3d\xb9\
-\xba\xee\xf3\xc4\xd3\x49\xe9\x3f\xe3\xb9\x63\xfa\x90\x46\x3a\x92\
-\xe4\x62\x1a\x30\x6b\x17\xf6\x6d\x41\x50\x1a\xea\x29\xf1\xda\xd0\
-\x76\x08\xa9\x38\xdf\x0a\x73\xae\x02\x99\x47\xf1\x6f\x2e\xb8\x2d\
-\x45\xe6\x0e\x89\xf4\x5f\x66\x95\x89\xff\xab\xfe\xc4\xa2\x34\x26\
-\xcc\x6d\x41\x75\x31\x4c\x03\xba\x10\xf5\xab\xfb\x4d\x9e\xbf\x1c\
-\xf3\xff\x32\xf0\xfb\x23\xc7\xe5\xf9\x0a\x00\xc4\xe8\xe8\x6d\xc0\
-\x3f\x05\x3e\xb7\xf8\x88\x24\x10\x5d\x24\x0c\x46\xba\x9f\x30\xfb\
-\xef\x54\xbc\xa5\x0a\x42\x86\x59\x00\x2d\x6d\x8f\x85\xf1\xdd\x03\
-\x64\xf9\x71\xeb\x1d\xbd\xeb\xa5\xd7\xda\x6a\x3f\x67\x52\x81\xc9\
-\x00\x53\x01\x0c\xa5\xf2\xdd\xf4\x18\x17\xea\x06\x9a\xc8\x08\xaa\
-\xbc\x80\x28\x9b\xc2\x4b\x41\x17\x70\x05\x86\x20\x39\x7b\xc8\x3d\
-\x7f\x34\x8a\x5e\x7f\x82\x5d\x2e\x6a\x47\x78\x1b\x63\x4f\x2d\xbf\
-\x69\x62\x6e\xeb\xe9\xa5\xd7\x38\xd3\x02\x43\x52\xf9\xc5\x99\x94\
-\xa0\x8b\xf5\xfe\xf1\x6b\x4d\x8d\x3d\x2e\x66\x13\x7c\x2b\x04\x52\
-\x81\x26\x24\x10\x45\x53\xac\x9f\x62\x79\xb1\xe3\xc8\x04\x75\x0e\
-\x49\xbd\x06\xe2\xc2\x7a\x2f\xd1\xae\x04\xb8\xd7\xa1\xd7\x19\x7d\
-\xf8\x98\x18\x80\x74\x1f\x2b\xc1\xb5\xde\xbf\x6a\x2b\x85\x44\xcc\
-\xdf\x0b\x50\xef\xc1\x07\x3f\x0a\x1f\x27\x54\xb4\x2e\xcc\xef\x29\
-\x9f\xff\x1d\xf8\xbe\x08\x11\x3c\xdf\x01\x20\x51\xa1\x2f\x01\x7e\
-\x08\xf8\x8e\xd1\x47\xd9\x06\x92\x47\xe2\x2d\x35\x01\xdd\x11\xc3\
-\x84\xd2\x4e\x01\x32\x30\x28\x4d\xf7\x2d\xa6\x1a\x4d\xcc\x3f\x36\
-\x95\xa8\xb7\x1e\x2b\x55\xce\x14\x0a\x95\x52\x1c\x9f\x0b\x7f\x09\
-\x48\x16\x71\x44\xf6\x4c\xba\x35\x5a\x89\xce\xab\x2b\xa7\x03\xa5\
-\x50\x23\x20\x6e\xb8\x7e\xdb\x86\x03\x92\x75\x23\x4a\x41\xf0\x14\
-\x93\xee\x93\x61\xca\x2f\xc8\x01\xbe\x1b\xbb\x95\x04\xc1\x54\xdc\
-\xa3\x71\x7c\x56\x95\x0a\x92\x7c\xaf\x48\xa3\xfb\x3f\xf8\x2e\x73\
-\xe2\x0c\x40\x88\x8f\x06\x4e\xdb\xc4\xd3\x4d\x19\x92\x16\x08\xda\
-\xc7\xb8\x8e\x49\xa4\xc6\x23\x25\x96\xf6\xa6\xf4\xab\x03\xad\xb4\
-\x55\xf4\x71\x3e\xc4\xfc\x5b\x31\xe7\xbf\x2d\x30\xd7\x4e\xfd\x9f\
-\x3b\xdc\xdc\x45\xfa\x5f\x81\x9b\xf5\xb2\x28\x01\x94\x1a\x60\x89\
-\xee\x1d\x41\xde\x7b\x6f\x08\xef\xaa\x49\x8b\x7a\x00\xf8\x93\xc0\
-\xbf\xe2\x59\x74\x66\xcf\x92\xd7\x71\x1e\xf8\xce\xc8\x08\xfe\x4a\
-\x24\xf9\x4c\x32\x82\x54\x03\xf0\x10\x70\x0d\x70\x63\xf9\xa1\x71\
-\xbe\xe4\xf4\x48\x30\x29\x78\xfd\xde\xb0\x90\x42\xd5\x9d\x14\xc6\
-\x6f\x8b\x29\x12\xb2\x0d\x3c\x92\x57\x02\xe6\x71\xbe\x0b\x4c\xc0\
-\xc7\x0b\x74\x16\x01\xa1\xca\x3d\xbc\xcb\xb2\x04\xce\xb0\x04\xe9\
-\x8b\x54\x92\xcf\x59\x63\x64\x7e\x20\x83\xae\xba\xde\x9c\xec\x5c\
-\x07\x30\x4d\x36\x2d\xb2\x5a\x31\x30\x3d\x3c\x69\x00\xc4\x06\x20\
-\x89\x46\xde\xb8\x6e\xda\xaf\xeb\x0a\xf7\x5b\x91\xaf\x12\x93\x09\
-\x48\x94\xde\xf5\x9b\x85\x34\x8e\x03\x73\x76\x39\x48\x64\x0c\x06\
-\x4c\x24\x3e\xbf\x98\x92\x5e\x8d\x2a\xbf\xcc\x04\xd9\xd2\xf0\x31\
-\x85\x00\x31\xf6\x97\x59\x05\xb3\x0a\xa9\xaa\x8e\xfa\x3b\x87\xb4\
-\x33\x09\x9a\x38\x88\x76\x17\xee\xb9\x1b\x16\x7b\x43\x16\xda\x3f\
-\xff\x1e\xf8\x5f\x08\xb3\x31\xd8\x00\xc0\xf8\xf9\x5b\x51\x14\xf9\
-\xfb\x94\x4a\x86\xc7\xc0\xc0\x4d\x7c\x5f\x87\xcd\x6f\x93\xbb\x06\
-\x7b\xe2\x9f\x14\xd9\x44\xf7\xdc\xce\x0c\xb2\xc8\x56\x74\x93\x01\
-\x80\x1d\x18\xe2\x73\x45\x3e\x5b\xa6\xd1\xb8\x28\x6c\x45\x31\x2a\
-\xf5\xa4\x4a\xe6\xed\xd3\xc2\x8d\x1e\x0b\x30\x42\xa0\x38\x8a\xad\
-\xc3\x92\x8f\x25\xcf\x34\x17\x5b\xfa\x1b\x43\x00\x35\x21\x80\x5d\
-\xa0\xd1\xa6\x00\xd5\x18\xac\x9a\x3e\xfc\x26\xe4\xfb\x03\x08\x47\
-\x23\xae\x6c\x5d\x6e\x6a\x11\x16\x13\x52\xd0\x2e\x0b\x4d\x4d\x3c\
-\xa9\x7c\x58\x5d\x57\xec\x23\x51\xfc\x53\x67\x62\xfe\x54\x83\x91\
-\xfa\x11\x52\x09\x6f\x15\xc2\x16\x17\x59\x96\x9b\x2b\x2e\x29\xfe\
-\x15\xc8\x96\x43\xb6\x82\xf1\xcb\x2c\xaa\xfe\xae\x82\x6a\x86\xb8\
-\x0a\x91\x28\x34\xf9\x06\x5c\x50\xa2\xb5\xde\x86\x4f\xde\xc3\xc4\
-\x64\xd5\x0f\x00\xef\x04\xfe\x0d\xcf\xd2\x33\x7b\x16\xbe\xa6\x5f\
-\x01\xbe\x00\xf8\x8b\xc0\x1f\x65\x9d\x01\xf6\xeb\x4c\x4c\xb3\x76\
-\xe0\x29\xcf\xf4\x63\x98\x1b\xef\xaa\xf8\x86\x80\x90\x8a\x4c\x44\
-\xbb\x82\x9b\xe0\x50\x0b\x43\x43\xad\x0e\xe0\xe8\xd3\x79\x4d\xf5\
-\xff\x9d\x21\x0b\x51\x30\xac\xa3\xf1\x6b\x97\x93\x6e\x43\x84\x1e\
-\x03\xa0\xaf\x09\x48\xa6\x09\x68\x21\x04\x28\xd5\x01\xa4\xbb\x6c\
-\x23\x90\xcb\x62\x28\x51\xf0\x46\x79\x75\x3e\xe6\xf7\x4d\xaa\x50\
-\xba\xe1\x7b\x9a\xc0\xa8\x02\x9a\x18\xeb\x7b\x89\xe9\xbd\x08\x02\
-\x49\x17\xc1\xc7\x22\x47\xd7\x62\x4a\x5b\x36\x6c\xc0\x59\x91\xb6\
-\x16\x20\xf5\x37\xa8\x9a\xd6\xd1\xc8\xc4\x44\x7c\x48\x43\x56\x11\
-\x08\x66\xd6\xeb\x47\xe3\x8f\xd4\x5f\xe6\x41\xf8\x73\xf3\x0a\xaa\
-\xc8\x00\xda\xb0\x0a\xe3\xfd\x17\xe1\x35\x3d\xbe\x83\x3c\xf0\xb1\
-\x92\x15\x3d\x00\xfc\x23\xe0\xef\xf2\x34\xb4\xf4\x3e\xd7\x00\x80\
-\xf8\xa6\xfd\x71\xe0\x27\x23\x10\xbc\x79\xd2\xb0\xcf\xaf\x00\x81\
-\xb1\xb1\x7b\x4c\xc0\x4b\xdb\xe7\x62\x6b\xf9\xb3\xd8\x3f\x55\xad\
-\xe6\x13\x7c\x54\x86\x53\x7e\x65\xbc\xd0\x47\xf3\x18\x3f\x35\x03\
-\x59\x01\x50\xa3\x60\x98\x56\x7d\xb5\x95\x69\xae\x1f\x12\x48\x26\
-\x26\xba\x8c\xfe\x4b\xa9\x53\xd0\x20\x5a\x62\x01\x55\x56\x09\xd8\
-\x0a\x84\x96\xf2\x47\x43\x56\x69\xc5\xba\xe4\xd5\x93\x01\xaa\x03\
-\x66\x3e\x52\xfa\xb4\x45\x37\x86\x38\xe2\x43\xd9\xb4\xba\x18\x85\
-\xf9\x6e\x22\x30\xc0\x5c\x90\x26\x00\x8b\x44\xa1\x0f\xdf\xc4\x2a\
-\x3f\x33\x86\x2c\x4d\x1f\x36\x7f\x8f\x73\x69\xe2\x4f\xfc\x9e\xd0\
-\x15\xfa\xcc\x62\x08\x30\x4f\x99\x80\x10\x76\xb9\x59\x54\xfe\xab\
-\x19\x6e\x36\x03\x37\xeb\xde\x3f\x7c\x37\xb2\x48\x6b\x70\x87\x91\
-\x8f\xde\x0d\xfb\x7b\xb6\x10\xed\x61\xe0\x1f\x00\x3f\x1c\x41\xe0\
-\x59\x7f\x66\xcf\xf2\xd7\xf7\x73\xc0\x7f\x8b\x35\x03\xdf\x11\x33\
-\x05\xb3\x81\x38\xf8\x18\xdd\x32\xcf\x7c\x5a\x70\x96\xda\x92\xb1\
-\x25\x3d\x74\xca\xb8\x16\x90\x41\x25\x9b\xf5\x5f\x6c\x0d\xcd\xd2\
-\x6d\x22\x86\x19\x64\x9d\x83\xbd\xad\xb9\xdd\xe3\x13\x85\x17\xc9\
-\x9b\xd3\xb3\xcd\xbb\xde\xf5\x8d\xbc\x97\x2d\x90\x0e\x1c\xc8\x87\
-\xdd\xe5\x21\x01\xe5\x8d\xba\xa2\x6d\xc1\x4d\x4b\xfb\x07\x2a\x6a\
-\x37\xe9\x27\x80\x92\xb6\xa3\xb9\xc2\xc6\x1c\x9b\x6a\x8c\x4f\x3e\
-\x8b\xf5\x00\xa9\xd2\xca\xb9\x2e\x7c\x88\xcc\x45\x69\xda\x1e\x09\
-\xb5\x7b\x02\x7d\x60\x06\xe0\x43\x5a\x30\x16\x00\x49\x4f\xd4\xd4\
-\x30\xd1\x57\x7c\x57\x33\x15\x43\x80\xd4\xf7\x4f\x05\xae\x92\x98\
-\x05\x00\x99\x57\x01\x10\x2a\x87\x54\x55\x47\xff\x63\xf1\x4f\xf8\
-\x33\x9a\x58\xf3\xdf\x04\x70\x3c\x73\x14\x3e\xfa\x3b\xf9\xd5\xf8\
-\xf7\x81\xef\xe7\x0a\x3a\xb3\x2b\xe0\x35\x36\xc0\x8f\xc5\xdb\xef\
-\x02\x3e\x0f\x78\x2b\xf0\x45\x2d\x00\xec\x13\x0a\x2a\x6f\xa0\x3f\
-\x10\x64\x64\x09\x64\x6a\xe9\x0c\x02\xb5\x0c\xc6\x8d\xb5\xd5\xb2\
-\x3e\x34\xeb\xf4\x66\xe5\xe5\x82\x59\xaf\xd2\x84\x6c\x65\xb5\x0c\
-\x63\xf1\x52\xcc\x4f\x5f\xbd\x17\xb2\xc7\x88\xf1\xf4\xa1\x55\x2d\
-\x34\xc0\x88\x59\x1b\x9e\x0b\x82\xed\xfd\x98\xac\xc2\xb0\x3d\x78\
-\xb4\x1a\xb0\xb7\x2b\x6b\xaa\xa8\x22\x7e\xbf\x8a\x40\x90\xf2\xf6\
-\x91\x09\x08\x2e\x4c\xf1\xa9\x08\xa0\x50\x1b\xa0\x75\xa1\xe3\x4f\
-\x6d\x61\x53\x4a\xf9\x35\x71\xef\x80\x8b\xbd\x13\x5e\x7b\x35\x1b\
-\x52\x99\x81\x27\xa2\x48\x64\x04\xdd\x5a\xc6\xae\x74\x58\x5c\xac\
-\xf6\x73\xc9\xf8\x5d\x4b\xff\x99\x39\x64\x26\xb8\xaa\x42\x23\xed\
-\x17\x37\x6b\x8d\xbf\xcb\x11\x37\x5d\x18\x54\x1d\x43\x3f\x78\x1f\
-\x72\xfe\x6c\xbf\x0c\xfd\x32\x2e\xf0\x78\x3e\x03\x80\x3d\xbf\x11\
-\x6f\x3f\x07\x7c\x61\xab\xbc\x35\x84\x62\xa1\x1b\x19\xdf\x26\xe4\
-\x32\x9a\x6b\x05\xef\xc2\x26\x21\xe9\x65\x03\x46\x56\x72\x59\xd1\
-\x2c\x55\xdb\xe5\xbb\xee\xa1\x90\x7e\x33\x71\xb9\x33\x22\xa1\x73\
-\xed\x3c\x80\xd6\xe8\x5d\x34\x76\x5c\x30\x98\xf4\x3d\x67\x0c\x3e\
-\x7a\xfb\x16\x14\x06\x82\x60\x8e\x80\x98\x8a\xc1\x02\x08\xc4\x54\
-\x97\xa4\xa1\x9a\xaa\x5d\xa7\x5f\xa2\xf8\xbd\x70\x40\x50\x6d\xba\
-\x92\x5e\xdf\xed\x12\x68\x6b\x0e\xbc\x8b\xca\x7f\xd3\xb1\x1a\x1f\
-\x10\xb7\xa5\xf7\x0d\x5d\x9a\xb1\xd1\xfe\xb6\x65\x9f\xba\xff\x68\
-\xe3\x7c\x49\xa3\xd0\x62\xff\x81\x6b\x07\x85\x86\xda\x7f\x91\x60\
-\xc7\x01\x04\x3a\xf5\xdf\x55\x82\x9b\x69\xcc\xf1\x47\xea\x1f\x3d\
-\x7f\xf0\xfe\xb6\xe6\x3f\xad\x08\x8f\x17\xcf\x0c\xf4\x41\x45\x3e\
-\xf4\xfe\x5c\xf9\x7f\x9c\xd0\xce\xbb\x01\x80\xa7\xe1\xbc\x2f\x8a\
-\x85\x41\x1b\xa8\x08\x05\x42\x0f\x10\x4a\x86\x4b\x93\x56\xf3\x8d\
-\xc4\x76\x27\xbb\x37\xf1\xbb\xef\xe2\x04\x1d\x5b\x41\xd6\xa3\xce\
-\x62\xb2\x6c\x76\x72\x8f\xcd\xcd\x1b\x40\xb0\x29\xba\x1e\xf5\x77\
-\xf1\x35\x99\xb5\xdb\xe6\x7b\xea\x4a\xe1\x41\x15\xc3\x8c\x58\xad\
-\x26\xf9\xef\xcb\xc0\x60\xc0\x3c\x0a\x69\xc0\xe4\xf5\x5d\xd5\x5d\
-\xf4\x9e\x2e\x2f\xea\xed\x76\x4d\x6f\x4a\x7e\x63\x69\x66\x2a\x00\
-\xf2\x11\x10\x7d\xd3\xe5\xea\x89\x45\x4f\x0d\xf1\x31\x29\x2b\x12\
-\x47\x02\x7b\xa2\xce\x11\x2b\x24\x9b\x58\x28\xa4\x12\x26\x02\xa1\
-\x71\x0a\x58\x1e\x8e\x45\xce\x94\xd2\x90\x2e\xfe\x2f\xe2\xb8\x2f\
-\x97\xf2\xff\x95\xe2\xaa\xd4\xf4\xe3\x3a\xc0\x9d\xb9\x7e\xc5\x5f\
-\x6a\xa6\x4a\x05\x3f\xba\x0c\x5e\x46\x96\x68\x7d\x3d\xbc\xe7\xae\
-\x52\xea\xef\x5f\x72\x19\x37\xf8\x6c\x00\x60\x18\x16\xfc\xad\x16\
-\x00\x92\xa7\xfe\x4d\xc2\x3f\xe5\x1a\xba\x0e\x42\xc9\x52\x5c\xf1\
-\x07\x7a\x9e\x5f\xec\xb6\x1b\xd3\x0c\x64\xbb\x01\x73\xf5\xb0\x57\
-\xf3\x9f\x2d\xf4\x6c\xe3\x56\xc9\x42\x90\x74\x9f\xf1\xdc\xae\x63\
-\x01\x22\x46\xb0\x33\x20\x20\xe2\x62\x01\x8c\x0b\x7d\xe9\xd2\xf7\
-\xfc\x12\xd9\x40\xcb\x1e\x5c\x9a\x6e\x61\x5f\x87\xeb\xeb\x00\x52\
-\x98\x17\xd8\xaa\x9f\x19\x3d\x6a\xc5\x50\xb5\xea\xa8\x19\xbf\x4d\
-\x7f\x63\x70\xaa\xed\x6f\xa4\x6f\xfc\xe2\xda\x29\xc2\xda\x02\x14\
-\xa8\x8f\xa9\x42\xa1\x63\x10\x89\xd2\x47\x70\xd6\xb8\x50\x34\xe0\
-\x8c\x86\x1e\x08\xa3\x1d\x48\xca\xf7\xa6\x51\xdf\x4e\xa2\x41\x83\
-\x54\x3e\x14\x01\x55\x12\x07\x7d\x84\x81\x1f\xc4\x3e\xff\xf0\x79\
-\x88\xf9\xa5\x27\x8a\xda\x52\xd1\x1a\x9d\x1d\x87\xf7\x3c\x8e\x3c\
-\x78\x4f\x4e\xfd\xcf\x03\x7f\xe7\x4a\x34\xa4\x2b\x15\x00\x20\x14\
-\x57\xfc\x97\x9e\x16\xb0\x07\xfc\x2a\x70\x27\xa1\x8b\xd0\x8e\x9a\
-\xca\xeb\x62\xec\xf4\x9f\x34\xf3\xbe\x57\xf5\x97\x8d\x03\xd3\x6c\
-\x07\xa0\x0e\x05\x44\xb5\xc2\xa0\x33\xe2\xa1\x88\x31\x5c\x31\xad\
-\xfc\x52\x00\x8d\x48\xe5\x5d\xa4\xc5\x18\x80\x30\x60\x91\x42\x00\
-\x4d\x5e\xcc\xb9\x5e\x97\x60\x0f\x08\xda\xb0\xc4\x65\xda\x84\x4c\
-\x50\x25\x35\x05\x41\x59\x1a\x30\x7d\x1e\xe7\x06\x28\x21\xbd\xd7\
-\x4e\x0f\xb2\xc2\x5e\x5a\x19\x1c\xab\x02\xa5\x6d\xec\xb1\xa3\xbd\
-\x13\xd0\xa5\xf9\x87\xf1\x6f\xf5\xb1\xf2\x0f\x1f\x62\xfc\x58\x5f\
-\x20\xda\x8f\xf3\xc4\xce\x31\x14\x17\x49\x54\x78\x3d\xe1\x63\x95\
-\xa4\x93\xee\x3d\x8c\x86\xef\x5c\xd7\x50\x25\xbd\xfa\x90\xc6\x84\
-\x3c\x4b\x98\x1f\x81\x8f\xed\x22\x1f\xfa\xad\x52\xd1\xcf\x5f\x23\
-\xf4\xfd\x6d\x00\xe0\x69\x66\x01\xdf\x13\x4d\x7e\xa7\x0d\x05\x6a\
-\xe0\x3d\x31\x22\xbb\x83\x6e\x03\xb1\x0e\x9d\x75\x98\x1a\x2b\x9d\
-\x10\x68\x43\x82\x44\x29\x53\x8e\xde\x67\xc6\x5f\x5a\xd8\xd1\x1a\
-\x7e\x8a\x45\x0b\xd4\x5f\x6c\x1e\xdf\xf4\x0c\x38\x31\x34\x5f\xba\
-\x9f\x35\x71\x7f\xe7\x35\x5d\x5f\xe5\x37\x29\x41\x45\x86\xe1\x00\
-\x63\xe1\x80\x15\x03\x0b\x59\x13\x2d\x18\x7c\x95\xa6\xf6\xc4\x3a\
-\x7f\x3b\x1c\x44\xa3\xd0\xa7\xae\xb5\x6d\xf5\xa9\xd6\x3f\x18\x71\
-\x9a\x6f\x28\xe2\xa3\x9c\x10\x0d\x3f\xfd\x1f\x7c\x04\xbf\x14\x1e\
-\xa4\x39\x03\xde\x4c\x4e\x42\x71\x29\x43\x00\x6d\x48\x24\x71\x66\
-\xa1\xa4\xda\x81\x16\x08\x22\x5e\x46\x2d\x20\xbc\x05\xd2\x86\x6c\
-\xae\x57\x39\x69\x2a\xfd\xd4\x83\xab\x51\x77\x1c\x3e\x7a\x1c\x79\
-\xf7\x7b\x83\xe2\xdc\xc7\xcc\x9f\x01\xfe\x7f\x57\xaa\x11\x5d\xc9\
-\x00\x00\x61\x7c\xf2\x5f\xe8\xfd\x03\x92\x77\xff\x18\xa1\x5f\xe0\
-\x15\x26\x3b\xd0\xf4\xc5\x40\xd5\xcc\xe3\xdb\x14\x5d\xf2\xf6\x71\
-\xf0\x85\x38\xd3\x29\x38\x58\x28\xc7\x40\x61\xd7\x78\x91\x75\x4b\
-\x7c\x2c\x18\x18\x26\x22\x26\x0c\x48\xb8\x52\x59\xd0\xb0\x39\x7f\
-\xf3\xb5\x98\xf2\x54\x04\x6d\x5b\x55\x5d\xbf\x97\x20\xd7\x21\xf2\
-\x0e\xc6\xd2\x98\x2b\x5b\xf2\xeb\x0d\xc5\xaf\x12\x20\x7a\xc3\x9c\
-\x14\x89\xfb\x01\x34\x79\x7b\x6d\x57\x00\x67\x5b\x87\xd5\xf4\x4f\
-\x68\x08\x6d\xbc\x8f\x20\x40\x6b\xe8\xda\x56\x4a\x46\xfb\xf7\x76\
-\x0e\x40\xb7\xe0\x44\x70\xad\xd1\x87\xe7\x33\xc6\x2f\x1a\xff\x7c\
-\x41\x5c\x10\x34\x83\xf7\x8f\xbf\xa7\x5d\xee\x61\x95\x7e\xfa\x20\
-\x30\x03\xad\xaf\x83\x77\x5d\x44\xee\xfe\xcd\x00\x6e\xfd\xaa\xd3\
-\x8f\x12\xba\xfa\xf6\x37\x00\xf0\xcc\x9d\xbf\x41\x98\x31\xf8\x8d\
-\xbd\x70\x76\x4e\x18\x2a\xf2\x6b\x31\x1c\xf8\x0c\x42\x87\x41\x6d\
-\x42\x52\x3b\x0e\xcb\x66\x08\x6c\x2b\x70\x2a\x51\xcd\xb7\xfd\xda\
-\x5f\x26\xc3\xd9\xfb\x62\x97\x81\x58\xe3\x76\x36\x35\xe7\xb2\xe9\
-\x5e\x99\x77\xef\x85\x0d\x56\xf9\x4f\x63\xaa\xa4\x1b\x82\xd1\x86\
-\x05\x85\x02\xa1\x51\x00\x90\x71\x11\xd0\xf2\x6b\x8d\x2b\xb1\xb4\
-\xab\x09\x08\x95\x7b\xd1\x53\x4a\x05\xda\x44\xdb\x77\x1d\x53\x50\
-\x31\x5e\x3f\xbc\x96\xf0\x98\xae\x41\xa8\x5b\x29\x6e\x76\x83\x39\
-\x90\x76\x95\xaf\xb4\xeb\xd4\x53\xb4\x1f\x80\xc7\xb7\xfa\x43\x5a\
-\xd7\x25\xa9\x81\xc8\xd1\x03\x03\xa1\x1a\xce\x4e\xd5\x6e\x8d\x68\
-\xf7\xcf\x8f\x43\x3e\xaa\x06\xdc\x31\xf4\x81\xe3\xf0\xbe\x47\x91\
-\x47\x1e\xe8\xe6\xf9\x77\xe7\x1e\xe0\x6b\xae\x44\xe1\xef\xb9\x06\
-\x00\x0a\xfc\xcf\xc0\xd5\xb1\x3e\xa0\x3b\xa9\x5a\xf5\x6e\x42\x8d\
-\xd6\xed\x84\x59\x83\x5b\xc4\x0a\x34\x53\x21\x58\x5c\x09\xb6\x62\
-\x96\x7e\x2e\x9f\x0d\xa8\xb5\x05\x03\xc9\x94\xfd\xcc\xe8\xad\xc1\
-\x3b\xc9\xa8\x7d\x14\x02\xcd\xcf\xa7\x21\x95\xad\x80\x45\x56\x22\
-\xdc\x13\x02\xf3\xa2\x22\xb2\xa2\x20\x0a\x2b\xd9\x8d\xe0\xa7\xa6\
-\x50\xc2\x27\x63\x8c\xad\xb6\x09\x04\xb4\x4a\xcb\xfc\x02\x2b\xd1\
-\x6e\xc9\xa7\x98\x52\x64\x4d\xa3\xcf\x13\xcd\x57\x87\x68\x13\xe2\
-\x7d\x8d\x53\x8c\x35\x82\x81\xba\x6e\xbc\x97\x7a\xf3\x7e\x9b\xb0\
-\x02\xcc\xc8\x30\x5a\xda\xe0\x52\xda\xb2\x55\xf3\xcd\x4a\xaf\x08\
-\x6c\xd2\xd3\x36\x9a\xe0\xe1\xe7\xbb\x70\xe6\x3a\xf4\x43\x4b\xe4\
-\xae\x0f\x43\xb3\x28\xc5\xfc\x9f\x00\xbe\x1c\x78\xff\x95\x6e\x3c\
-\xcf\x05\x00\x80\xd0\x89\xfd\x8e\x98\x8a\x79\xeb\xc0\x3a\x67\x84\
-\xee\xeb\xdf\x22\x4c\x69\xb9\x1d\xb8\x3e\xb2\x04\x1f\x0b\x4e\x84\
-\xde\xee\xf8\xd6\x12\x8c\xd1\x8b\x09\x75\x87\x9d\x75\x32\x68\x10\
-\x6c\x8d\xbf\x57\xf1\x97\xeb\x01\x5d\x5f\x51\x1b\xc2\xf4\xd4\xfc\
-\x4e\x40\x94\x1c\x1c\x2c\x70\xf4\x00\xc6\xf5\x5b\x83\xa7\x52\x82\
-\x9a\xd5\x04\x48\x47\xed\xdb\xb4\x5f\x3b\xe8\xd3\x2c\xf3\x50\x8f\
-\xa8\xeb\x40\x00\xa0\x71\x01\x73\xd4\xa4\x01\xdb\xf6\xe2\xf8\x37\
-\x68\xda\xda\x43\x17\xd7\x7b\x17\xea\x03\xb4\x0a\xff\x0b\x8d\xe3\
-\xbd\xd4\x07\x63\xf7\xda\x4e\x3a\x56\x4d\x95\x7f\xde\x74\xe7\x25\
-\x36\x61\x81\xc0\x92\x1b\x3b\xf3\x5c\xbb\xc2\x6e\x8d\x5d\x8a\x52\
-\x43\xb5\x8d\x9e\xbb\x1a\xb9\xcb\xc3\xc7\x3e\x89\x5c\x38\xdb\xcd\
-\xf3\xef\x9f\x77\x03\xdf\x7c\xa5\x8a\x7e\xcf\x55\x00\x20\xca\x7e\
-\x5f\x03\xfc\x43\xe0\x9b\x06\xdf\x4d\x95\xb2\x8f\x01\xbf\xae\x61\
-\x98\xc8\xed\xc0\xf5\x12\x19\x01\xed\x70\xcf\x36\x8e\x4f\x43\xe8\
-\x32\x44\xe9\x39\xcb\xa2\x0e\xd0\x09\x4c\x16\x0c\x7a\x46\x1a\x3f\
-\x97\xf4\x51\xb2\xca\x3f\x27\x66\xf2\x77\x16\x0a\x50\x08\x0f\x4a\
-\xd4\x3f\xef\x14\x2c\x35\x0b\xb9\xdc\xf3\x5b\xc6\xa3\xdd\x8a\xee\
-\xca\xec\x0e\x37\x23\xbc\x24\xf5\xe8\xb7\x6b\x79\x63\xcf\x42\x25\
-\x81\xa5\x47\xba\xad\x66\xba\x51\xf0\xbc\x55\x9b\xda\x4b\xa3\xd1\
-\x44\x93\x30\x18\x2a\x08\xa5\x27\x46\xc6\xa2\x21\xc4\x30\x00\x5b\
-\x8d\xe8\xe3\xc8\x36\xa2\xc0\x28\x48\x4a\x01\xa9\x05\x82\x24\x60\
-\x36\x91\xea\x1f\x86\xb3\x47\xe1\xae\x25\x72\xd7\x83\x70\xfe\x6c\
-\xb7\x6a\x6e\x78\x7e\x02\xf8\x23\x84\x59\x7e\x6c\x00\xe0\xd9\x77\
-\xce\x01\xff\x13\xa1\x5a\xf0\x2f\x01\xc7\x06\x8f\x48\xb3\x04\x1e\
-\xd5\xf0\x6f\xbc\x0a\x78\x01\xe8\x4d\x82\xec\x4a\x6f\x4a\x50\xf2\
-\x14\xda\x2b\x1d\xec\xbe\x33\xd6\x0a\xd0\x81\x8e\x29\xed\x75\xc3\
-\xe4\xc1\xb0\x07\xa0\x7f\x93\xdc\xf0\xad\x41\x4b\x9e\x46\xb4\x99\
-\x01\x37\xac\x16\x64\x18\x06\x08\x63\x3a\x40\x97\xd3\x57\xcd\x07\
-\x26\xba\xb6\xfb\x2f\x79\xef\x6e\x67\x47\x63\x96\x99\x48\xb7\xa1\
-\x28\x51\x7b\xe9\x0a\x7b\x02\x78\x74\x03\x80\xec\x46\xf2\xae\xdd\
-\xd8\x34\xe2\x98\xf5\xc1\x42\xda\x11\xd0\xe3\x5f\x26\x27\x68\x8a\
-\x82\xc4\xac\x34\xa3\x01\x57\x43\x35\x87\xfa\x30\xfa\xe8\x51\xf8\
-\xf8\x02\xb9\xe7\x3e\xb8\x78\x6e\xca\xf0\xf7\x08\x73\x2a\x7e\xe0\
-\x39\x66\x2f\xcf\x39\x00\x48\xe7\x87\x08\x73\xd7\xfe\x36\xf0\xd9\
-\xc5\x47\x24\x20\x78\x4c\x03\x18\x7c\xd4\xc3\xcd\x0e\x6e\x71\x70\
-\xbc\xea\xd6\x5a\x9b\xb2\xe0\x76\x2b\x15\x0c\xdb\x6a\xc5\x96\xf4\
-\x66\x94\x3f\x31\x07\x67\x3a\xff\xa4\x90\x15\xb0\xa5\xc3\xce\x16\
-\x0d\x0d\xd9\x41\x39\xae\x77\x03\xf0\x50\x3b\x3d\xb8\x14\x06\x0c\
-\x7a\x02\xec\x1f\x1b\x94\x75\x12\x25\xf7\x11\x1d\xed\xae\xc3\x76\
-\x83\x6f\xf2\xee\x5d\x33\x45\x2f\x9c\x8a\x2d\xc2\x29\xb5\x1a\xe2\
-\x7d\xd7\x81\x40\xfa\x7d\x6a\x26\x20\xdb\x26\xa1\x6c\x37\xa3\xb4\
-\x83\x03\x5b\x38\x26\x1f\xfd\x24\x09\x10\xaa\x65\x04\xc1\x1d\xf4\
-\xfc\x11\xb8\xcf\x23\x9f\x38\x87\x3c\x7c\x57\x18\xe9\x35\x6e\xf8\
-\xc4\xeb\xe8\x7b\x08\x95\xa7\x6c\x00\xe0\xca\x39\xef\x02\xde\x42\
-\x18\xc3\xf4\x27\x08\xf5\x81\xa3\x40\x20\xe7\x80\xdf\xf1\xf0\x31\
-\x0f\xd7\x7a\xb8\xa5\x42\xaf\xaf\x90\x43\xae\xa5\xb5\xb6\x4a\x4c\
-\x4b\xdd\x84\x43\x59\xa0\xff\x18\x97\xe1\x46\x5e\x99\x67\x81\xc3\
-\xa6\x0f\xf3\xcf\xa1\x50\x44\x94\x19\x3f\xb6\xba\xb0\x50\x13\x50\
-\x1c\x1b\x66\x18\x40\x5b\x04\x93\x86\x6f\xf8\xae\xf8\x48\x5d\x14\
-\xcd\x7c\x57\xa7\xdf\x3e\x9f\x6f\x47\x83\x49\xcb\x00\xe2\xbc\x80\
-\x94\x62\xf1\x1e\x97\x86\x7d\x78\x31\x9a\x63\x0c\x05\x30\x5b\x81\
-\x4d\x63\x93\x38\xdf\xc5\xed\x76\x7a\xab\xad\x57\x10\x1f\x40\xc6\
-\x2d\x61\xb6\x05\xf5\x1c\xbd\x78\x0d\xdc\x7f\x01\x1e\xae\x90\x4f\
-\xde\x0b\x17\xce\x87\xc7\x4f\x1b\xfe\xdd\x31\xbd\xfc\x4f\x08\x03\
-\xbf\xd8\x00\xc0\x95\x77\x2e\x44\xea\xf6\x13\x84\x95\x64\xdf\x18\
-\xb3\x05\x8c\x6a\x04\x0d\x70\x9f\x87\xfb\x3d\x1c\x59\xc2\xf5\x15\
-\xdc\x30\x43\xaf\x9d\x21\xbb\xb1\x51\xa4\xe9\x7a\xd6\x7b\x02\x5e\
-\x6e\xf8\x2e\x5b\xea\x91\xb3\x87\xfc\xbe\x12\x20\xf4\xb4\x03\x7a\
-\x8c\x40\xcc\x86\xdc\x72\xeb\x70\x5e\x1d\xe8\xc6\x01\x40\xf3\xd6\
-\xdd\x7c\x57\x5a\x67\xdc\x42\xac\xfd\x4f\x8d\x41\x55\x8c\xf1\x93\
-\xba\x97\x04\xc0\x5e\xb9\xb5\x06\xb5\xdf\xe4\x3d\x03\xb3\xf2\xfd\
-\x95\xeb\x74\x69\x57\xb1\x5f\xf7\x16\x95\x98\xe5\x9c\xb1\x5c\x57\
-\x24\x16\x7a\xcc\x76\xe1\xa2\xa2\xe7\xaf\x87\xfb\x4e\xc3\xc3\x20\
-\x0f\x7c\x14\xf6\x16\xd0\xd4\x63\xc2\x9e\x3d\xf7\x13\xfa\xf9\xff\
-\x61\xcc\x1d\x3d\xa7\xcf\x73\x1d\x00\xd2\xf9\x58\x64\x01\x3f\x48\
-\xd8\xbf\xf6\x4d\xc0\x4b\x8b\x8f\x94\xee\x5d\x91\xf3\xc0\x47\x1a\
-\xb8\xab\x81\xc3\x0b\xb8\x61\x16\x6e\xd7\xcc\xe1\xd0\x2c\x8c\xeb\
-\xf2\xe6\x42\xb5\xc3\x3d\xf2\x82\x1f\xf2\x78\xdf\x4e\xf1\x36\x7d\
-\xef\x3d\x2f\x0f\xfd\x79\x01\xd9\xbc\xbf\x92\x76\x00\xc6\xd8\x5d\
-\x79\x9e\x80\xe4\xc3\x45\xc9\x98\x80\x9a\x5c\x3b\x96\xa3\xd3\xdf\
-\x91\xee\x5a\x95\xbf\x37\x35\xa9\xb7\x86\x8c\xae\xe9\x27\x55\xf3\
-\xb4\xa3\xc5\x3b\x91\xb0\xed\x2f\x68\x7f\x8d\x59\x0c\xa2\x6a\x06\
-\x3b\x36\x46\xf1\x5f\xa2\xd5\x16\xd2\x6c\xc1\xc5\x06\x3d\x7b\x14\
-\xee\x7d\x1c\x1e\xb8\x10\x72\xf7\xfb\xe7\x3b\x96\x37\x3e\xa2\x3b\
-\x9d\x0f\x00\x3f\x0a\xfc\x33\xc2\x86\xca\xe7\xc5\x79\xbe\x00\x40\
-\x3a\xf7\x44\x71\xf0\x07\x09\x3b\x09\xbe\x95\xd0\x56\x3c\x9b\x64\
-\x05\x0a\x72\x5e\xe1\xc3\x4b\xf8\xd8\x12\xb6\xf7\xe0\xda\x0a\xae\
-\xd9\x82\x1b\xe7\x70\x6c\x2b\xae\x85\x76\x61\x58\xac\xa9\x30\x54\
-\x19\x09\x0d\x7a\xde\xde\x8c\x16\xa0\x20\x0e\x22\x23\xdf\xb3\x69\
-\x3e\xb2\x74\x63\x56\xe9\x26\x76\x13\x68\xe9\x17\xf6\x54\x4e\xb3\
-\x86\xcc\x1a\xa2\xf4\x0b\x27\xc4\xee\x34\x28\xcc\x42\xc4\x18\xfc\
-\x60\xbd\x9a\xd9\x8f\x48\xb6\xfc\xb7\x9d\xb4\xd4\xc4\x34\x24\x71\
-\xc0\x08\x20\xbb\xe1\x3d\xbe\xe0\xd1\x8b\x27\xe0\x13\xf7\xa2\xe7\
-\x76\xe1\xde\x8f\x23\x7b\x0d\x5c\xbc\xd0\x19\xfb\x7c\xe5\xf5\xb0\
-\x20\x0c\x9c\xf9\x27\xc0\x7f\xe0\x59\x32\xaa\x7b\x03\x00\x4f\x4f\
-\xb6\xe0\xc7\xe3\xed\xf5\x84\xbc\xee\x57\x53\x9c\x2d\x9c\x79\x72\
-\x05\x16\x0a\x9f\xa8\xc3\x6d\x0b\x38\xec\xd0\xeb\xe6\xc8\x89\x2d\
-\xf4\xfa\x2d\xe4\xf8\x0e\xec\xce\x02\x20\x68\x1c\x45\x4b\x07\x08\
-\x6d\xf5\xdb\x58\xe6\xa0\xe7\xe1\xe9\x4f\x1f\x1a\x13\x0d\x07\x82\
-\x5e\x16\x32\xe4\xd9\x00\xf2\xc1\xa1\x0c\x19\x40\x5a\xca\xd9\x2b\
-\xe3\xb5\x35\x04\xda\x0f\x25\x2c\x58\xc4\x3f\x58\x8a\x6f\xa6\xf6\
-\xab\x2e\xbd\xe9\x3a\x4c\x5e\xbe\x72\x08\xdb\x68\x23\xc8\x85\x8b\
-\xe8\xf2\x5a\x78\xe8\x31\xe4\xe1\xb3\xe8\xc5\x5d\xe4\x9e\x0f\x23\
-\x4b\x17\xd4\xfb\x74\x25\x0b\x01\x88\xa7\x8f\x12\x2a\x42\x7e\x32\
-\xde\x7e\x8b\xe7\xf1\x99\xb1\x39\xbf\x1e\x6f\xdf\x1f\x59\xc1\x37\
-\x10\xa6\x0e\x6d\x8d\x82\x01\xc6\xbb\x78\xe0\x8c\x47\x1e\xdb\x07\
-\xd9\x47\xb6\x40\x77\x1c\x5c\x3f\x47\x8e\x6e\xa3\xa7\xb6\xe1\xd4\
-\x16\x72\x68\x07\x76\xe6\xc8\x56\xa8\xd0\x93\x34\xdb\x8f\x91\x9a\
-\xfc\xa2\xa0\x28\xe5\x0a\xbe\x5e\x53\x8f\x0c\x01\x23\x9f\xfe\x4b\
-\x41\xf7\xcb\x97\x1e\xe4\x2d\xbe\x85\x05\xa9\x3d\xcf\xdf\xb2\x03\
-\x33\x33\xb0\xb4\xa2\xa9\x0d\x6f\xe2\xf4\x8f\x4a\x40\x77\x83\x6e\
-\xb0\x77\x06\xf6\x0e\xa1\xcb\x13\x70\xdf\x47\x91\x27\xce\xc2\xf2\
-\x08\xdc\x7b\x17\x72\xe1\x03\xb0\xac\x61\xb1\x1f\x7e\x4d\x32\xf8\
-\xad\x03\x85\x81\xff\x81\xd0\x45\xfa\xab\xcf\x65\x61\x6f\x03\x00\
-\x97\x76\x1e\x21\x6c\x28\xfa\xa7\x84\x86\xe2\xaf\x8e\x80\x70\xe7\
-\xe4\xfb\x24\xd9\x85\xe8\x41\xce\x7b\xf8\xc8\x3e\xf8\x7d\x64\x1e\
-\x7f\x7a\x67\x86\x5e\x3d\x43\x8e\x6d\xc3\x89\x63\xe8\x55\x73\xe4\
-\x88\x83\x9d\x43\xb0\xb3\x13\x1e\x33\x8f\x5b\x2b\x35\x29\x8b\x69\
-\xa0\x7d\xde\x6b\x50\x98\xee\x2b\x45\x15\x72\xf8\x62\x7b\x63\xcc\
-\xcc\x47\xfb\xf3\x6d\xb1\x0c\x66\xdc\x98\x37\xd9\x01\x9f\x55\x0c\
-\x26\xe3\xaf\x0c\xcd\x21\x4e\xdf\x94\xae\x32\xb0\xf1\xb0\x77\x16\
-\xf6\x3d\x34\x57\xa1\x17\x3d\xf2\xc9\x0f\xc2\x79\x41\x9b\xe3\xc8\
-\xfd\x77\xc1\xe3\x8f\x21\xcc\x61\xef\x3c\xd4\xbe\x1d\xe3\xd5\xfe\
-\x59\xdb\x6b\xff\x3f\x95\x50\xb2\xfb\x5f\x81\x9f\x22\x2c\xe0\xbc\
-\xb0\xb9\xcc\xb3\x2b\x42\x55\x2f\xdf\xb3\x7f\xbf\x5c\xe9\xef\xcf\
-\x1c\x78\x0d\x61\x73\xd1\xdb\xe3\xe7\xf3\x03\x3d\x83\x75\x82\x69\
-\xb1\x69\xda\x1b\x5f\x01\x55\x85\x9e\x3a\x0c\xc7\x08\x2c\xe1\xd0\
-\x51\xf4\xd4\x49\x38\xa4\xb0\xad\xc8\xd6\x21\xd8\x3e\x0c\xdb\xdb\
-\x71\x4b\x4d\x1a\x5e\x31\x03\x37\xa7\xcb\x8f\x27\x46\x51\xb5\x73\
-\x03\xc3\x16\x8c\x68\x98\xed\xd0\x50\x7b\xb3\x5b\x56\xf2\x99\xe9\
-\xf6\x63\x65\xfe\x80\xf4\x47\xd0\xa9\xf0\xcb\x45\xf0\xde\xcd\x32\
-\xec\x34\x68\x0e\xa3\xcb\x0a\x1e\xb9\x17\x79\xe8\x13\xd0\xcc\xa0\
-\x39\x86\x2e\x80\x07\x3f\x86\x9c\x7e\x2c\xec\xe2\xf2\x0a\x7b\x17\
-\xba\x55\xdf\x15\xc3\xac\xc8\xc1\xce\x05\xc2\x58\x98\x9f\x8b\x06\
-\xff\x2e\xc2\xb0\x8e\x2b\xff\xbc\x53\x37\x00\xf0\x2c\x60\x4b\xaf\
-\x8a\x40\xf0\x45\xc0\x6b\x29\x55\x1a\x5e\x0a\x30\xd8\x75\xe5\x12\
-\x99\x40\x15\xc5\x33\x71\xb0\xb3\x8b\x5e\x7d\x75\x98\x6d\x30\x0f\
-\x6d\xaa\x32\xdf\x86\x6a\x17\xb6\x77\xd1\xab\x6f\x80\xd9\x0c\xd9\
-\xdd\x0d\x6d\xc1\x7e\x11\x9e\x6c\x7b\x1e\xd6\x5b\x69\x96\x0d\xc8\
-\x97\x87\xba\xb0\xd8\x5e\x17\x3e\xb6\xf9\x6f\x81\x6f\xd0\xbd\xfd\
-\x50\x96\xfb\xd0\x47\x43\xac\xad\x4b\xf0\x75\xd8\x09\xd0\xcc\xa1\
-\xd9\x42\x17\x0a\xe7\x9f\x40\x1e\xfc\x48\xec\x09\x10\xd0\x59\x50\
-\xfe\x97\x7b\xb0\x68\xfa\x06\x5d\x51\xae\x95\xb8\xb4\x93\xf6\x47\
-\xff\x52\xa4\xf5\xbf\x0c\xdc\x4b\xb6\xe7\x79\x03\x00\x1b\x00\x78\
-\xca\xdf\xb7\x28\x18\xbe\x89\x50\x69\xf8\xa6\x08\x0e\x87\x9e\x92\
-\x67\xd7\x11\x90\x28\x85\xd5\x15\x30\x8f\x9e\xbe\xdd\xb8\x13\x1f\
-\xec\x64\x4d\x03\x73\x9d\x9e\x91\x84\xc1\xb4\xe2\x5b\x81\xfd\x45\
-\x3f\xfb\x97\xcb\x06\x8e\x72\x8a\xed\xc9\x1b\x78\x7e\x1e\x23\xac\
-\x8f\x7b\x37\x61\xec\xcb\xaf\x47\x9a\xbf\x78\xce\x73\xf5\xcb\x04\
-\x00\x1b\x0d\xe0\xd2\x4d\xf4\x7e\xe0\x5f\xc7\xdb\x0c\xb8\x85\x30\
-\xa3\xf0\x77\x45\x76\xf0\x32\xe0\xe4\x25\x99\x40\xa9\x38\x6f\x2a\
-\x87\x9d\xa6\xd6\x2e\xb3\x9f\xab\x9f\x02\x98\xe3\x40\x71\xf7\x53\
-\x75\x3c\x70\x3a\x7a\xf7\xf7\x02\x1f\x22\x0c\x82\x7d\x1f\xa1\x83\
-\xc3\x6f\x2e\xc1\x0d\x00\x3c\x9b\x4e\x4d\x58\x10\xfd\x71\xe0\x9f\
-\x47\x9f\x78\x15\x61\x1e\xd1\xab\x81\x97\x10\x06\x94\xbd\x8c\xd0\
-\x87\xb8\xf3\x94\xf3\x11\x98\xda\x70\xf6\x6c\x3d\x4d\x8c\xdb\xef\
-\x21\x4c\xd7\xf9\x28\x41\xad\xff\x20\x61\x91\xe6\xe3\x4f\x01\x8c\
-\x6d\xce\x06\x00\x9e\x11\x0f\xf6\x08\xf0\x0b\xf1\x96\xce\x91\xc8\
-\x14\x5e\x10\x3f\xde\x02\xdc\x4c\x18\x53\x72\x0b\x61\x4a\xc1\x0e\
-\x07\x15\x1a\x9f\xdd\x06\xbe\x1f\x8d\xfc\xbe\x18\x9f\xdf\x13\x3f\
-\xff\x64\xa4\xef\x1f\x8f\x86\xbe\xbf\xb9\x6c\x36\x00\xf0\x5c\x3f\
-\xe7\xa2\x77\x2b\x0d\x93\xd8\x05\x8e\x1a\x60\xb8\x31\xb2\x85\xa3\
-\x31\x94\x38\x61\x6e\xc7\x23\xc3\xd8\x8e\xff\xc3\xad\xcb\x12\x71\
-\x0f\x41\xcd\xc7\x40\x23\x19\xf6\x63\xc0\x13\xd1\x80\x4f\x47\xd0\
-\x7b\x98\xb0\xb4\xfd\x53\xe6\xe3\x23\x84\x96\xda\xc5\xe6\x12\xd8\
-\x00\xc0\xe6\x94\xcf\xc5\x78\x7b\x98\x20\x72\xd9\xb3\x15\xd9\xc3\
-\x21\xe0\x70\xfc\x78\x84\x90\x85\x38\x15\x6f\x69\x23\x42\x9a\x88\
-\x78\x35\xfd\x01\xe6\x57\xaf\x60\x16\xe7\xa2\x11\xdb\x11\x21\x9f\
-\x8e\xc6\xfe\x44\xf4\xe2\x17\xe3\xe7\x67\xe2\x63\xcf\x11\xd2\x6c\
-\xe7\xe3\xf7\xcf\xb0\xde\xae\xe6\xcd\x79\x96\x9c\xff\x77\x00\x45\
-\xed\x07\x72\xaf\x8c\x89\xf7\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
-\x42\x60\x82\
-\x00\x00\xd2\x01\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0a\x4f\x69\x43\x43\x50\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x49\x43\x43\x20\x70\x72\x6f\x66\x69\
-\x6c\x65\x00\x00\x78\xda\x9d\x53\x67\x54\x53\xe9\x16\x3d\xf7\xde\
-\xf4\x42\x4b\x88\x80\x94\x4b\x6f\x52\x15\x08\x20\x52\x42\x8b\x80\
-\x14\x91\x26\x2a\x21\x09\x10\x4a\x88\x21\xa1\xd9\x15\x51\xc1\x11\
-\x45\x45\x04\x1b\xc8\xa0\x88\x03\x8e\x8e\x80\x8c\x15\x51\x2c\x0c\
-\x8a\x0a\xd8\x07\xe4\x21\xa2\x8e\x83\xa3\x88\x8a\xca\xfb\xe1\x7b\
-\xa3\x6b\xd6\xbc\xf7\xe6\xcd\xfe\xb5\xd7\x3e\xe7\xac\xf3\x9d\xb3\
-\xcf\x07\xc0\x08\x0c\x96\x48\x33\x51\x35\x80\x0c\xa9\x42\x1e\x11\
-\xe0\x83\xc7\xc4\xc6\xe1\xe4\x2e\x40\x81\x0a\x24\x70\x00\x10\x08\
-\xb3\x64\x21\x73\xfd\x23\x01\x00\xf8\x7e\x3c\x3c\x2b\x22\xc0\x07\
-\xbe\x00\x01\x78\xd3\x0b\x08\x00\xc0\x4d\x9b\xc0\x30\x1c\x87\xff\
-\x0f\xea\x42\x99\x5c\x01\x80\x84\x01\xc0\x74\x91\x38\x4b\x08\x80\
-\x14\x00\x40\x7a\x8e\x42\xa6\x00\x40\x46\x01\x80\x9d\x98\x26\x53\
-\x00\xa0\x04\x00\x60\xcb\x63\x62\xe3\x00\x50\x2d\x00\x60\x27\x7f\
-\xe6\xd3\x00\x80\x9d\xf8\x99\x7b\x01\x00\x5b\x94\x21\x15\x01\xa0\
-\x91\x00\x20\x13\x65\x88\x44\x00\x68\x3b\x00\xac\xcf\x56\x8a\x45\
-\x00\x58\x30\x00\x14\x66\x4b\xc4\x39\x00\xd8\x2d\x00\x30\x49\x57\
-\x66\x48\x00\xb0\xb7\x00\xc0\xce\x10\x0b\xb2\x00\x08\x0c\x00\x30\
-\x51\x88\x85\x29\x00\x04\x7b\x00\x60\xc8\x23\x23\x78\x00\x84\x99\
-\x00\x14\x46\xf2\x57\x3c\xf1\x2b\xae\x10\xe7\x2a\x00\x00\x78\x99\
-\xb2\x3c\xb9\x24\x39\x45\x81\x5b\x08\x2d\x71\x07\x57\x57\x2e\x1e\
-\x28\xce\x49\x17\x2b\x14\x36\x61\x02\x61\x9a\x40\x2e\xc2\x79\x99\
-\x19\x32\x81\x34\x0f\xe0\xf3\xcc\x00\x00\xa0\x91\x15\x11\xe0\x83\
-\xf3\xfd\x78\xce\x0e\xae\xce\xce\x36\x8e\xb6\x0e\x5f\x2d\xea\xbf\
-\x06\xff\x22\x62\x62\xe3\xfe\xe5\xcf\xab\x70\x40\x00\x00\xe1\x74\
-\x7e\xd1\xfe\x2c\x2f\xb3\x1a\x80\x3b\x06\x80\x6d\xfe\xa2\x25\xee\
-\x04\x68\x5e\x0b\xa0\x75\xf7\x8b\x66\xb2\x0f\x40\xb5\x00\xa0\xe9\
-\xda\x57\xf3\x70\xf8\x7e\x3c\x3c\x45\xa1\x90\xb9\xd9\xd9\xe5\xe4\
-\xe4\xd8\x4a\xc4\x42\x5b\x61\xca\x57\x7d\xfe\x67\xc2\x5f\xc0\x57\
-\xfd\x6c\xf9\x7e\x3c\xfc\xf7\xf5\xe0\xbe\xe2\x24\x81\x32\x5d\x81\
-\x47\x04\xf8\xe0\xc2\xcc\xf4\x4c\xa5\x1c\xcf\x92\x09\x84\x62\xdc\
-\xe6\x8f\x47\xfc\xb7\x0b\xff\xfc\x1d\xd3\x22\xc4\x49\x62\xb9\x58\
-\x2a\x14\xe3\x51\x12\x71\x8e\x44\x9a\x8c\xf3\x32\xa5\x22\x89\x42\
-\x92\x29\xc5\x25\xd2\xff\x64\xe2\xdf\x2c\xfb\x03\x3e\xdf\x35\x00\
-\xb0\x6a\x3e\x01\x7b\x91\x2d\xa8\x5d\x63\x03\xf6\x4b\x27\x10\x58\
-\x74\xc0\xe2\xf7\x00\x00\xf2\xbb\x6f\xc1\xd4\x28\x08\x03\x80\x68\
-\x83\xe1\xcf\x77\xff\xef\x3f\xfd\x47\xa0\x25\x00\x80\x66\x49\x92\
-\x71\x00\x00\x5e\x44\x24\x2e\x54\xca\xb3\x3f\xc7\x08\x00\x00\x44\
-\xa0\x81\x2a\xb0\x41\x1b\xf4\xc1\x18\x2c\xc0\x06\x1c\xc1\x05\xdc\
-\xc1\x0b\xfc\x60\x36\x84\x42\x24\xc4\xc2\x42\x10\x42\x0a\x64\x80\
-\x1c\x72\x60\x29\xac\x82\x42\x28\x86\xcd\xb0\x1d\x2a\x60\x2f\xd4\
-\x40\x1d\x34\xc0\x51\x68\x86\x93\x70\x0e\x2e\xc2\x55\xb8\x0e\x3d\
-\x70\x0f\xfa\x61\x08\x9e\xc1\x28\xbc\x81\x09\x04\x41\xc8\x08\x13\
-\x61\x21\xda\x88\x01\x62\x8a\x58\x23\x8e\x08\x17\x99\x85\xf8\x21\
-\xc1\x48\x04\x12\x8b\x24\x20\xc9\x88\x14\x51\x22\x4b\x91\x35\x48\
-\x31\x52\x8a\x54\x20\x55\x48\x1d\xf2\x3d\x72\x02\x39\x87\x5c\x46\
-\xba\x91\x3b\xc8\x00\x32\x82\xfc\x86\xbc\x47\x31\x94\x81\xb2\x51\
-\x3d\xd4\x0c\xb5\x43\xb9\xa8\x37\x1a\x84\x46\xa2\x0b\xd0\x64\x74\
-\x31\x9a\x8f\x16\xa0\x9b\xd0\x72\xb4\x1a\x3d\x8c\x36\xa1\xe7\xd0\
-\xab\x68\x0f\xda\x8f\x3e\x43\xc7\x30\xc0\xe8\x18\x07\x33\xc4\x6c\
-\x30\x2e\xc6\xc3\x42\xb1\x38\x2c\x09\x93\x63\xcb\xb1\x22\xac\x0c\
-\xab\xc6\x1a\xb0\x56\xac\x03\xbb\x89\xf5\x63\xcf\xb1\x77\x04\x12\
-\x81\x45\xc0\x09\x36\x04\x77\x42\x20\x61\x1e\x41\x48\x58\x4c\x58\
-\x4e\xd8\x48\xa8\x20\x1c\x24\x34\x11\xda\x09\x37\x09\x03\x84\x51\
-\xc2\x27\x22\x93\xa8\x4b\xb4\x26\xba\x11\xf9\xc4\x18\x62\x32\x31\
-\x87\x58\x48\x2c\x23\xd6\x12\x8f\x13\x2f\x10\x7b\x88\x43\xc4\x37\
-\x24\x12\x89\x43\x32\x27\xb9\x90\x02\x49\xb1\xa4\x54\xd2\x12\xd2\
-\x46\xd2\x6e\x52\x23\xe9\x2c\xa9\x9b\x34\x48\x1a\x23\x93\xc9\xda\
-\x64\x6b\xb2\x07\x39\x94\x2c\x20\x2b\xc8\x85\xe4\x9d\xe4\xc3\xe4\
-\x33\xe4\x1b\xe4\x21\xf2\x5b\x0a\x9d\x62\x40\x71\xa4\xf8\x53\xe2\
-\x28\x52\xca\x6a\x4a\x19\xe5\x10\xe5\x34\xe5\x06\x65\x98\x32\x41\
-\x55\xa3\x9a\x52\xdd\xa8\xa1\x54\x11\x35\x8f\x5a\x42\xad\xa1\xb6\
-\x52\xaf\x51\x87\xa8\x13\x34\x75\x9a\x39\xcd\x83\x16\x49\x4b\xa5\
-\xad\xa2\x95\xd3\x1a\x68\x17\x68\xf7\x69\xaf\xe8\x74\xba\x11\xdd\
-\x95\x1e\x4e\x97\xd0\x57\xd2\xcb\xe9\x47\xe8\x97\xe8\x03\xf4\x77\
-\x0c\x0d\x86\x15\x83\xc7\x88\x67\x28\x19\x9b\x18\x07\x18\x67\x19\
-\x77\x18\xaf\x98\x4c\xa6\x19\xd3\x8b\x19\xc7\x54\x30\x37\x31\xeb\
-\x98\xe7\x99\x0f\x99\x6f\x55\x58\x2a\xb6\x2a\x7c\x15\x91\xca\x0a\
-\x95\x4a\x95\x26\x95\x1b\x2a\x2f\x54\xa9\xaa\xa6\xaa\xde\xaa\x0b\
-\x55\xf3\x55\xcb\x54\x8f\xa9\x5e\x53\x7d\xae\x46\x55\x33\x53\xe3\
-\xa9\x09\xd4\x96\xab\x55\xaa\x9d\x50\xeb\x53\x1b\x53\x67\xa9\x3b\
-\xa8\x87\xaa\x67\xa8\x6f\x54\x3f\xa4\x7e\x59\xfd\x89\x06\x59\xc3\
-\x4c\xc3\x4f\x43\xa4\x51\xa0\xb1\x5f\xe3\xbc\xc6\x20\x0b\x63\x19\
-\xb3\x78\x2c\x21\x6b\x0d\xab\x86\x75\x81\x35\xc4\x26\xb1\xcd\xd9\
-\x7c\x76\x2a\xbb\x98\xfd\x1d\xbb\x8b\x3d\xaa\xa9\xa1\x39\x43\x33\
-\x4a\x33\x57\xb3\x52\xf3\x94\x66\x3f\x07\xe3\x98\x71\xf8\x9c\x74\
-\x4e\x09\xe7\x28\xa7\x97\xf3\x7e\x8a\xde\x14\xef\x29\xe2\x29\x1b\
-\xa6\x34\x4c\xb9\x31\x65\x5c\x6b\xaa\x96\x97\x96\x58\xab\x48\xab\
-\x51\xab\x47\xeb\xbd\x36\xae\xed\xa7\x9d\xa6\xbd\x45\xbb\x59\xfb\
-\x81\x0e\x41\xc7\x4a\x27\x5c\x27\x47\x67\x8f\xce\x05\x9d\xe7\x53\
-\xd9\x53\xdd\xa7\x0a\xa7\x16\x4d\x3d\x3a\xf5\xae\x2e\xaa\x6b\xa5\
-\x1b\xa1\xbb\x44\x77\xbf\x6e\xa7\xee\x98\x9e\xbe\x5e\x80\x9e\x4c\
-\x6f\xa7\xde\x79\xbd\xe7\xfa\x1c\x7d\x2f\xfd\x54\xfd\x6d\xfa\xa7\
-\xf5\x47\x0c\x58\x06\xb3\x0c\x24\x06\xdb\x0c\xce\x18\x3c\xc5\x35\
-\x71\x6f\x3c\x1d\x2f\xc7\xdb\xf1\x51\x43\x5d\xc3\x40\x43\xa5\x61\
-\x95\x61\x97\xe1\x84\x91\xb9\xd1\x3c\xa3\xd5\x46\x8d\x46\x0f\x8c\
-\x69\xc6\x5c\xe3\x24\xe3\x6d\xc6\x6d\xc6\xa3\x26\x06\x26\x21\x26\
-\x4b\x4d\xea\x4d\xee\x9a\x52\x4d\xb9\xa6\x29\xa6\x3b\x4c\x3b\x4c\
-\xc7\xcd\xcc\xcd\xa2\xcd\xd6\x99\x35\x9b\x3d\x31\xd7\x32\xe7\x9b\
-\xe7\x9b\xd7\x9b\xdf\xb7\x60\x5a\x78\x5a\x2c\xb6\xa8\xb6\xb8\x65\
-\x49\xb2\xe4\x5a\xa6\x59\xee\xb6\xbc\x6e\x85\x5a\x39\x59\xa5\x58\
-\x55\x5a\x5d\xb3\x46\xad\x9d\xad\x25\xd6\xbb\xad\xbb\xa7\x11\xa7\
-\xb9\x4e\x93\x4e\xab\x9e\xd6\x67\xc3\xb0\xf1\xb6\xc9\xb6\xa9\xb7\
-\x19\xb0\xe5\xd8\x06\xdb\xae\xb6\x6d\xb6\x7d\x61\x67\x62\x17\x67\
-\xb7\xc5\xae\xc3\xee\x93\xbd\x93\x7d\xba\x7d\x8d\xfd\x3d\x07\x0d\
-\x87\xd9\x0e\xab\x1d\x5a\x1d\x7e\x73\xb4\x72\x14\x3a\x56\x3a\xde\
-\x9a\xce\x9c\xee\x3f\x7d\xc5\xf4\x96\xe9\x2f\x67\x58\xcf\x10\xcf\
-\xd8\x33\xe3\xb6\x13\xcb\x29\xc4\x69\x9d\x53\x9b\xd3\x47\x67\x17\
-\x67\xb9\x73\x83\xf3\x88\x8b\x89\x4b\x82\xcb\x2e\x97\x3e\x2e\x9b\
-\x1b\xc6\xdd\xc8\xbd\xe4\x4a\x74\xf5\x71\x5d\xe1\x7a\xd2\xf5\x9d\
-\x9b\xb3\x9b\xc2\xed\xa8\xdb\xaf\xee\x36\xee\x69\xee\x87\xdc\x9f\
-\xcc\x34\x9f\x29\x9e\x59\x33\x73\xd0\xc3\xc8\x43\xe0\x51\xe5\xd1\
-\x3f\x0b\x9f\x95\x30\x6b\xdf\xac\x7e\x4f\x43\x4f\x81\x67\xb5\xe7\
-\x23\x2f\x63\x2f\x91\x57\xad\xd7\xb0\xb7\xa5\x77\xaa\xf7\x61\xef\
-\x17\x3e\xf6\x3e\x72\x9f\xe3\x3e\xe3\x3c\x37\xde\x32\xde\x59\x5f\
-\xcc\x37\xc0\xb7\xc8\xb7\xcb\x4f\xc3\x6f\x9e\x5f\x85\xdf\x43\x7f\
-\x23\xff\x64\xff\x7a\xff\xd1\x00\xa7\x80\x25\x01\x67\x03\x89\x81\
-\x41\x81\x5b\x02\xfb\xf8\x7a\x7c\x21\xbf\x8e\x3f\x3a\xdb\x65\xf6\
-\xb2\xd9\xed\x41\x8c\xa0\xb9\x41\x15\x41\x8f\x82\xad\x82\xe5\xc1\
-\xad\x21\x68\xc8\xec\x90\xad\x21\xf7\xe7\x98\xce\x91\xce\x69\x0e\
-\x85\x50\x7e\xe8\xd6\xd0\x07\x61\xe6\x61\x8b\xc3\x7e\x0c\x27\x85\
-\x87\x85\x57\x86\x3f\x8e\x70\x88\x58\x1a\xd1\x31\x97\x35\x77\xd1\
-\xdc\x43\x73\xdf\x44\xfa\x44\x96\x44\xde\x9b\x67\x31\x4f\x39\xaf\
-\x2d\x4a\x35\x2a\x3e\xaa\x2e\x6a\x3c\xda\x37\xba\x34\xba\x3f\xc6\
-\x2e\x66\x59\xcc\xd5\x58\x9d\x58\x49\x6c\x4b\x1c\x39\x2e\x2a\xae\
-\x36\x6e\x6c\xbe\xdf\xfc\xed\xf3\x87\xe2\x9d\xe2\x0b\xe3\x7b\x17\
-\x98\x2f\xc8\x5d\x70\x79\xa1\xce\xc2\xf4\x85\xa7\x16\xa9\x2e\x12\
-\x2c\x3a\x96\x40\x4c\x88\x4e\x38\x94\xf0\x41\x10\x2a\xa8\x16\x8c\
-\x25\xf2\x13\x77\x25\x8e\x0a\x79\xc2\x1d\xc2\x67\x22\x2f\xd1\x36\
-\xd1\x88\xd8\x43\x5c\x2a\x1e\x4e\xf2\x48\x2a\x4d\x7a\x92\xec\x91\
-\xbc\x35\x79\x24\xc5\x33\xa5\x2c\xe5\xb9\x84\x27\xa9\x90\xbc\x4c\
-\x0d\x4c\xdd\x9b\x3a\x9e\x16\x9a\x76\x20\x6d\x32\x3d\x3a\xbd\x31\
-\x83\x92\x91\x90\x71\x42\xaa\x21\x4d\x93\xb6\x67\xea\x67\xe6\x66\
-\x76\xcb\xac\x65\x85\xb2\xfe\xc5\x6e\x8b\xb7\x2f\x1e\x95\x07\xc9\
-\x6b\xb3\x90\xac\x05\x59\x2d\x0a\xb6\x42\xa6\xe8\x54\x5a\x28\xd7\
-\x2a\x07\xb2\x67\x65\x57\x66\xbf\xcd\x89\xca\x39\x96\xab\x9e\x2b\
-\xcd\xed\xcc\xb3\xca\xdb\x90\x37\x9c\xef\x9f\xff\xed\x12\xc2\x12\
-\xe1\x92\xb6\xa5\x86\x4b\x57\x2d\x1d\x58\xe6\xbd\xac\x6a\x39\xb2\
-\x3c\x71\x79\xdb\x0a\xe3\x15\x05\x2b\x86\x56\x06\xac\x3c\xb8\x8a\
-\xb6\x2a\x6d\xd5\x4f\xab\xed\x57\x97\xae\x7e\xbd\x26\x7a\x4d\x6b\
-\x81\x5e\xc1\xca\x82\xc1\xb5\x01\x6b\xeb\x0b\x55\x0a\xe5\x85\x7d\
-\xeb\xdc\xd7\xed\x5d\x4f\x58\x2f\x59\xdf\xb5\x61\xfa\x86\x9d\x1b\
-\x3e\x15\x89\x8a\xae\x14\xdb\x17\x97\x15\x7f\xd8\x28\xdc\x78\xe5\
-\x1b\x87\x6f\xca\xbf\x99\xdc\x94\xb4\xa9\xab\xc4\xb9\x64\xcf\x66\
-\xd2\x66\xe9\xe6\xde\x2d\x9e\x5b\x0e\x96\xaa\x97\xe6\x97\x0e\x6e\
-\x0d\xd9\xda\xb4\x0d\xdf\x56\xb4\xed\xf5\xf6\x45\xdb\x2f\x97\xcd\
-\x28\xdb\xbb\x83\xb6\x43\xb9\xa3\xbf\x3c\xb8\xbc\x65\xa7\xc9\xce\
-\xcd\x3b\x3f\x54\xa4\x54\xf4\x54\xfa\x54\x36\xee\xd2\xdd\xb5\x61\
-\xd7\xf8\x6e\xd1\xee\x1b\x7b\xbc\xf6\x34\xec\xd5\xdb\x5b\xbc\xf7\
-\xfd\x3e\xc9\xbe\xdb\x55\x01\x55\x4d\xd5\x66\xd5\x65\xfb\x49\xfb\
-\xb3\xf7\x3f\xae\x89\xaa\xe9\xf8\x96\xfb\x6d\x5d\xad\x4e\x6d\x71\
-\xed\xc7\x03\xd2\x03\xfd\x07\x23\x0e\xb6\xd7\xb9\xd4\xd5\x1d\xd2\
-\x3d\x54\x52\x8f\xd6\x2b\xeb\x47\x0e\xc7\x1f\xbe\xfe\x9d\xef\x77\
-\x2d\x0d\x36\x0d\x55\x8d\x9c\xc6\xe2\x23\x70\x44\x79\xe4\xe9\xf7\
-\x09\xdf\xf7\x1e\x0d\x3a\xda\x76\x8c\x7b\xac\xe1\x07\xd3\x1f\x76\
-\x1d\x67\x1d\x2f\x6a\x42\x9a\xf2\x9a\x46\x9b\x53\x9a\xfb\x5b\x62\
-\x5b\xba\x4f\xcc\x3e\xd1\xd6\xea\xde\x7a\xfc\x47\xdb\x1f\x0f\x9c\
-\x34\x3c\x59\x79\x4a\xf3\x54\xc9\x69\xda\xe9\x82\xd3\x93\x67\xf2\
-\xcf\x8c\x9d\x95\x9d\x7d\x7e\x2e\xf9\xdc\x60\xdb\xa2\xb6\x7b\xe7\
-\x63\xce\xdf\x6a\x0f\x6f\xef\xba\x10\x74\xe1\xd2\x45\xff\x8b\xe7\
-\x3b\xbc\x3b\xce\x5c\xf2\xb8\x74\xf2\xb2\xdb\xe5\x13\x57\xb8\x57\
-\x9a\xaf\x3a\x5f\x6d\xea\x74\xea\x3c\xfe\x93\xd3\x4f\xc7\xbb\x9c\
-\xbb\x9a\xae\xb9\x5c\x6b\xb9\xee\x7a\xbd\xb5\x7b\x66\xf7\xe9\x1b\
-\x9e\x37\xce\xdd\xf4\xbd\x79\xf1\x16\xff\xd6\xd5\x9e\x39\x3d\xdd\
-\xbd\xf3\x7a\x6f\xf7\xc5\xf7\xf5\xdf\x16\xdd\x7e\x72\x27\xfd\xce\
-\xcb\xbb\xd9\x77\x27\xee\xad\xbc\x4f\xbc\x5f\xf4\x40\xed\x41\xd9\
-\x43\xdd\x87\xd5\x3f\x5b\xfe\xdc\xd8\xef\xdc\x7f\x6a\xc0\x77\xa0\
-\xf3\xd1\xdc\x47\xf7\x06\x85\x83\xcf\xfe\x91\xf5\x8f\x0f\x43\x05\
-\x8f\x99\x8f\xcb\x86\x0d\x86\xeb\x9e\x38\x3e\x39\x39\xe2\x3f\x72\
-\xfd\xe9\xfc\xa7\x43\xcf\x64\xcf\x26\x9e\x17\xfe\xa2\xfe\xcb\xae\
-\x17\x16\x2f\x7e\xf8\xd5\xeb\xd7\xce\xd1\x98\xd1\xa1\x97\xf2\x97\
-\x93\xbf\x6d\x7c\xa5\xfd\xea\xc0\xeb\x19\xaf\xdb\xc6\xc2\xc6\x1e\
-\xbe\xc9\x78\x33\x31\x5e\xf4\x56\xfb\xed\xc1\x77\xdc\x77\x1d\xef\
-\xa3\xdf\x0f\x4f\xe4\x7c\x20\x7f\x28\xff\x68\xf9\xb1\xf5\x53\xd0\
-\xa7\xfb\x93\x19\x93\x93\xff\x04\x03\x98\xf3\xfc\x63\x33\x2d\xdb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8e\x7c\xfb\x51\x93\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\
-\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\xc7\x1c\
-\x49\x44\x41\x54\x78\xda\xec\xfd\x79\x9c\x6c\xd9\x55\x1e\x88\x7e\
-\x6b\xef\x73\x22\x72\xbc\x99\x37\xef\x3c\x54\xdd\xba\x35\x97\x6a\
-\x52\xa9\x34\x0f\x46\x12\x92\x40\x32\x42\x80\x85\x8d\xc1\xc6\x18\
-\x30\x78\x00\xdc\x9e\xda\xed\x11\xd3\xf6\xe3\xd9\x3f\xb7\x71\x7b\
-\x68\x1b\x63\x9b\x67\xfb\xb5\x4d\xdb\x0f\x68\x1b\xe3\x81\xf6\xc8\
-\x28\x30\x62\x90\x40\x13\x94\x86\x92\x4a\xaa\xe9\x56\xdd\x31\x33\
-\x23\xce\xd9\x7b\xad\xf7\xc7\x5a\x7b\x38\x11\x91\xb7\x4a\x48\x25\
-\xa9\x4a\xb1\xeb\x17\x95\x99\x91\x91\x99\x71\x23\xce\x9a\xbe\xf5\
-\xad\x6f\x91\x88\xe0\xb9\x3a\xf4\x3d\x84\xe5\xf9\x9c\x9e\x31\x80\
-\xd3\x00\x76\x00\x1c\x06\x70\x06\xc0\x59\xfb\x9a\x01\xac\xdb\xfd\
-\x01\xc0\x13\xf6\x33\xfb\x00\x9e\x02\xf0\x38\x80\x4f\x01\xb8\x04\
-\xe0\xa2\x7d\x3d\x59\xbe\xa4\x5f\x18\x47\xbe\xfb\xb9\xb1\xd3\x66\
-\xf9\xd2\x3e\xaf\xcf\xc8\x0c\xfe\x2e\x00\x77\x03\xb8\x13\xc0\x6d\
-\x66\xf4\x47\x00\xac\x98\x53\x78\xa6\xc3\x00\xa6\x76\x7b\xc2\x1c\
-\xc1\x47\x00\x7c\x08\xc0\x6f\xd8\xc7\x87\x01\xec\x2d\x5f\xf2\x17\
-\xd6\x59\x3a\x80\xe7\xdf\x39\x0b\xe0\x35\x00\x5e\x0d\xe0\xb7\x99\
-\xc1\xaf\x7f\x86\xbf\xd3\x01\x58\xb5\xdb\x36\x80\xdb\x01\xbc\xbe\
-\xfa\xfe\xc4\x9c\xc2\x2f\xd9\xed\xe7\x00\xfc\x0a\x80\x6b\xcb\xb7\
-\x63\xe9\x00\x96\xe7\xb9\x3f\x37\x00\xf8\xed\x00\xbe\xca\x0c\x7f\
-\xf3\x73\xfc\xf7\x57\x00\xdc\x6c\xb7\xaf\xb5\x8c\xe1\xe3\x00\xfe\
-\x2b\x80\x9f\xb2\x8f\x9f\x58\xbe\x4d\x4b\x07\xb0\x3c\x9f\xbd\xb3\
-\x0e\xe0\xed\x00\xbe\x1a\xc0\x5b\x2c\x32\x7f\x06\x45\xe4\x33\x7c\
-\xff\xd3\x83\x6b\x1c\x80\x9b\x00\x7c\xb3\xdd\x2e\x9b\x13\xf8\x37\
-\x00\xfe\xa3\xe1\x07\xcb\xb3\x74\x00\xcb\xf3\x5b\x38\xa7\x01\xfc\
-\x3e\x00\xdf\x68\x35\xfd\xa7\x6f\xe4\x62\x37\xae\xcc\xd5\x99\x91\
-\xd3\x01\x3f\x97\x1e\xcf\xd5\xe3\xdc\xb3\x76\x0e\x5b\xe6\xa8\xbe\
-\x1a\xc0\x05\x00\x3f\x0e\xe0\xff\x0b\xe0\x27\x01\xc4\xe5\x5b\xba\
-\x74\x00\xcb\xf3\xec\x6a\xfb\x3f\x0c\xe0\x9b\x00\x9c\xfa\xb4\x0c\
-\x3e\xda\xe7\x2d\xd0\x7a\x87\xd5\xb6\xc5\xe1\x8d\x15\x1c\x5f\xdb\
-\xc0\xc9\xd5\x0d\xac\x8d\x5b\xac\x8d\x5a\xac\xb6\x2d\x5a\xe7\x21\
-\x22\x10\x48\xfe\xf9\x69\x08\xd8\xed\x3a\xec\xf7\x01\x57\xf6\xa7\
-\x78\x62\xb2\x8b\x27\xf7\xf6\x70\x65\x7f\x82\x49\x08\x88\x51\xf4\
-\x6f\x5c\xcf\x89\x94\x73\xd4\xfe\x0d\xdf\x04\xe0\x5d\x00\xfe\x09\
-\x80\x7f\x69\x59\xc2\xf2\x2c\x1d\xc0\xf2\xcc\x9c\x55\x00\xdf\x06\
-\xe0\x4f\x58\xad\xff\xcc\x46\x9f\x22\x75\x03\xac\x8c\x1a\x9c\xdd\
-\x3e\x84\xdb\x77\x8e\xe0\xdc\xce\x16\x4e\xae\x6d\x62\x67\xb4\x82\
-\xc6\x13\x5a\xe7\x31\x72\x04\xe6\x88\x28\xac\x37\x66\x30\x73\xfe\
-\x5d\x02\x06\x91\x86\x7b\x12\x0d\xf9\x9d\x00\x7d\x64\x74\x81\xf1\
-\xd4\x64\x1f\x8f\xed\xed\xe2\xe1\x4b\x17\xf1\xb1\x2b\x97\xf1\xc4\
-\xb5\x5d\xf4\x21\x16\x87\xe0\xae\xfb\x6c\x5f\x65\xb7\x3f\x09\xe0\
-\x1f\x03\xf8\xa7\x00\x1e\x5b\xbe\xe5\x5f\x38\x87\x96\x3c\x80\xcf\
-\xeb\x79\x27\x80\x3f\x0b\xe0\x81\x67\x7c\x24\x5b\xa4\x6f\x80\x13\
-\x5b\x1b\xb8\xf7\xc4\x09\xdc\xb2\x73\x18\xb7\x6d\xef\x60\x6b\x3c\
-\xc6\x8a\x6f\xc0\x1c\xd0\x71\x87\xc8\x02\x4f\x23\x78\x37\xc6\x6a\
-\x7b\x18\x6b\xed\x0e\x56\x9b\x2d\x8c\xfc\x06\x1a\xb7\x0a\xef\x46\
-\xf0\xd4\x40\x84\x11\xb8\x43\xcf\x13\x4c\xc2\x2e\xf6\xbb\xcb\xd8\
-\xed\x2f\x61\x77\x7a\x01\xd3\x70\x0d\x5d\x9c\x82\x39\xa0\x71\x0d\
-\x00\x87\xfd\xc0\xb8\x38\xdd\xc7\xc3\x57\x2e\xe1\xa3\x97\x2e\xe1\
-\x37\x2e\x3e\x85\x2b\x7b\x53\x75\x4a\xee\x59\x95\x0a\x9f\x00\xf0\
-\x77\x01\xfc\x00\x94\x6f\xb0\x3c\xcf\xb6\xba\x7b\x8e\x78\x00\x4b\
-\x07\xf0\xf9\x39\x2f\x02\xf0\x57\xa1\x20\xdf\xf5\xa3\x7d\x54\xc3\
-\xda\x5c\x1f\xe1\xbe\x93\x27\xf0\xe0\xe9\xd3\xb8\x6b\xe7\x18\x36\
-\x47\x63\x40\x18\x93\x30\x45\x94\x00\x4f\x2b\xd8\x1c\x9f\xc0\xce\
-\xea\x4d\x38\xba\x76\x3b\x0e\xaf\xdc\x80\xcd\xf1\x49\xac\x8f\x8e\
-\xa0\x71\x23\x38\x6a\x40\xcf\x10\xae\xa3\x04\xb0\x04\x4c\xfb\x6b\
-\xb8\x3c\x79\x14\x17\x27\x8f\xe2\xb1\xab\x1f\xc2\xe3\x57\x3f\x8c\
-\x27\xaf\x7d\x14\x7b\xdd\x25\x08\x22\xc6\x6e\x0c\x81\xc3\xa5\xe9\
-\x14\x1f\xba\xf4\x14\xde\x7f\xe1\x09\x7c\xf8\xf2\x45\x74\xd3\x38\
-\xc4\x0e\x0e\x3e\x1f\xb4\x7f\xff\x3f\x5d\x5e\x0a\x4b\x07\xf0\xc5\
-\x76\xbe\x13\xc0\x77\x43\x89\x3a\xd7\x37\x7c\x0f\xdc\x76\x6c\x07\
-\xaf\x3d\x77\x0e\xf7\x1d\x3f\x89\xa3\xab\x6b\x20\x01\xa6\xb1\x43\
-\xe0\x1e\x8d\x5b\xc1\x91\xd5\xf3\x38\x7d\xe8\x7e\x9c\xde\xb8\x0f\
-\x3b\xab\x37\x61\xa5\xd9\x02\x91\xb3\x5f\xc3\x10\xe1\xaa\xde\x97\
-\xaa\x19\x20\x83\x90\x4d\x20\xfb\x92\x40\x20\x38\xf2\xf9\x7b\x7d\
-\x9c\xe0\xd2\xfe\xa3\xf8\xd4\x95\x0f\xe2\xc3\x4f\xfd\x02\x3e\x7e\
-\xf1\xd7\x70\x69\xff\x71\x00\x82\x15\xbf\x82\x20\xc0\x85\xc9\x2e\
-\xde\xf7\xd4\x93\x78\xcf\x13\x8f\xe3\xc9\xdd\x5d\xfd\xc1\x67\x76\
-\x04\x3f\x01\xe0\x2f\x00\xf8\xc5\xe5\x65\xb1\x74\x00\x2f\xf4\x73\
-\x0e\xc0\xf7\x01\xf8\x9a\x67\x34\xfc\x06\xb8\xff\xf4\x49\xbc\xf1\
-\xfc\x79\xdc\x73\xf4\x38\x56\xfd\x08\x5d\x0c\xe8\xb9\x03\x4b\xc4\
-\xe6\xe8\x24\x6e\xdc\x7e\x39\x6e\xda\x7e\x15\x8e\xad\xdd\x86\x91\
-\x5f\x07\x20\x88\x12\x20\xc2\xb8\x5e\xcf\xef\x19\xdf\x6d\x99\xfd\
-\xc2\x1c\x82\x6b\xe0\xc8\x83\x25\xe2\xd2\xfe\xa3\xf8\xf0\x53\xbf\
-\x88\x5f\x7f\xf4\xbf\xe1\xe1\x8b\xef\x41\x17\xa6\x18\xbb\x31\x1a\
-\xdf\xe0\x6a\xdf\xe1\x83\x17\x2f\xe0\x97\x1e\xff\x14\x1e\xb9\x72\
-\xe5\xd9\x38\x82\x3d\x00\xff\x6f\xcb\x08\xc2\xf2\x32\x59\x3a\x80\
-\x17\xe2\x79\x0b\x80\xbf\x07\xe0\x96\x83\xf3\x6f\x0d\xc8\x2f\x3a\
-\x75\x1c\x6f\xbb\xfd\x36\xdc\x7b\xf4\x04\x1a\x38\x74\x1c\x11\xb8\
-\x87\x80\xb1\xb3\x72\x0e\xb7\x1e\x79\x03\xce\x6f\xbf\x06\x1b\xa3\
-\x13\x20\x00\x51\x7a\x8b\xf2\xc3\x12\xfc\xb3\xf9\xae\x96\x4b\x44\
-\xb2\x33\xf0\xd4\xa2\x8b\xfb\x78\xf8\xe2\x7b\xf0\xcb\x9f\xf8\xf7\
-\xf8\xe0\xe3\x3f\x87\xbd\xfe\x1a\x5a\x37\x42\xeb\x3c\x26\x31\xe2\
-\x03\x17\x9f\xc4\xcf\x3f\xf6\x08\x9e\xd8\xdd\x7d\x36\xdd\x83\xff\
-\x0e\xe0\xbb\x00\xfc\xda\xf2\x72\x59\x3a\x80\x17\xd2\xf9\x13\x16\
-\xe1\xda\x85\xdf\x35\x44\xff\xd4\xce\x06\xde\x7e\xe7\x9d\x78\xd5\
-\xe9\x1b\x30\x72\x0d\xba\x18\xc1\x12\x10\xa5\xc7\xd6\xf8\x0c\xee\
-\x3c\xfa\x65\xb8\xf9\xf0\x6f\xc3\x7a\x7b\x04\x51\x7a\xb0\x44\x08\
-\xe4\x40\x9b\x92\x45\x77\x3c\x4b\x0f\x21\xd7\xbb\x47\xaa\x5f\x45\
-\x0e\x8d\x1b\x81\x25\xe0\xe3\x4f\xff\x1a\x7e\xee\xa3\x3f\x8a\xf7\
-\x3d\xfa\xd3\xe8\x63\x87\x91\x1f\xa3\xa1\x06\xbb\x71\x82\x5f\xb9\
-\xf0\x38\xde\xfd\xc4\xa7\xb0\xdb\x75\xcf\x94\x0d\x3c\x09\xe0\x7f\
-\x02\xf0\x2f\x96\x97\xcd\xd2\x01\x3c\xdf\xcf\x0a\x80\xbf\x05\x6d\
-\xf1\x2d\x3e\x01\xf0\x23\xc2\x9b\x6f\xbb\x15\x6f\xbf\xed\x0e\x1c\
-\x1e\xaf\xa2\x0b\x11\x0c\x41\xe4\x0e\x23\xbf\x8e\x5b\x77\xde\x80\
-\x17\x1d\x7b\x1b\x0e\x8d\x4e\x21\x48\x0f\xc9\x86\x4f\x95\x55\xcb\
-\xa7\x9f\xea\x0f\x1e\x41\x90\xc1\xdd\x72\xe0\x8f\x08\x0d\x7f\x5c\
-\x9f\x8b\x43\xeb\x47\x88\x1c\xf0\x81\xc7\x7f\x16\xff\xed\x37\xfe\
-\x39\x3e\xf6\xf4\xfb\xd0\x50\x0b\x4f\x0e\xde\x11\x2e\x4c\xf6\xf1\
-\xb3\x8f\x7f\x02\x1f\xbc\x78\x21\xfd\xc9\xeb\x9d\xbf\x0a\xe0\xcf\
-\x63\x49\x22\x5a\x3a\x80\xe7\xe9\x39\x0c\x25\xc0\x7c\xe5\x81\xb6\
-\x17\x80\x73\x27\xb6\xf1\xf5\xf7\xdd\x8b\x7b\x8f\x9c\x44\x88\x8c\
-\x28\x02\x01\x83\xb9\xc7\xb1\xf5\x3b\xf0\xe2\x93\xbf\x0b\xa7\x36\
-\xef\x81\x88\x80\xa5\xcf\x15\xf9\x7c\x38\x9f\x37\xda\xb9\xb7\x75\
-\xe0\x27\xca\xcf\xcb\xf5\x9c\x83\x1c\xf0\x7d\xfb\x71\xa9\xfe\x90\
-\x00\x70\xe4\xd0\xba\x31\xae\x4e\x9f\xc6\x4f\x3d\xf4\xaf\xf0\x73\
-\x1f\xfe\x51\xec\xf7\xbb\xea\x08\x9c\x83\x80\xf0\xc1\x4b\x17\xf0\
-\xb3\x8f\x7f\x1c\x57\xba\xe9\x33\x65\x03\x3f\x0a\xe0\x5b\xb0\x6c\
-\x17\x2e\x1d\xc0\xf3\xec\x9c\x05\xf0\x43\x00\x5e\x7b\x60\xad\xef\
-\x81\x2f\xbd\xed\x66\x7c\xed\x9d\xf7\xe0\x50\x3b\xc6\x34\x06\x00\
-\x04\x96\x00\x47\x0e\xb7\x1f\x79\x33\xee\x39\xf6\x55\x58\x6d\xb7\
-\x11\x78\x5a\x45\xfc\x67\x75\xa9\x3c\xab\x2c\x40\x16\x26\x0f\x07\
-\xfc\xec\xa0\x02\x90\xf9\xac\x60\x26\x79\x68\x5c\x03\x47\x0d\x3e\
-\xf0\xf8\xbb\xf0\xe3\xef\xf9\x7b\xf8\xd4\xa5\x0f\xa3\xf1\x2b\x70\
-\x44\xf0\x44\x78\xba\xdb\xc7\x4f\x3f\xfe\x09\x7c\xf4\xea\xc5\x67\
-\x72\x02\x3f\x03\xe0\xeb\xb1\x1c\x34\x5a\x3a\x80\xe7\xc9\x39\x0f\
-\x1d\x88\xb9\xf7\xa0\x94\x7f\x7d\xad\xc5\xd7\xbf\xf8\x3e\xbc\xfe\
-\x86\x9b\x11\xa3\xb2\xf3\xd4\xf8\x7b\xac\x34\x87\x70\xff\xc9\xaf\
-\xc5\x2d\x87\xdf\x00\x11\x06\x1b\x28\x4e\xb3\x69\xfa\xc2\xc2\x5e\
-\x16\x66\xd6\x72\x9d\xba\x40\x0e\xb8\x53\x16\x45\xfb\x2a\xd2\xd7\
-\x7e\x43\x44\x9f\x99\x0c\x7e\x5e\xcb\x82\x51\xb3\x82\x27\xaf\x3e\
-\x82\x1f\xfb\xd5\xbf\x83\x5f\xfb\xd4\xcf\x2a\x5e\x00\x82\x07\xc0\
-\x02\xfc\xf2\xd3\x8f\xe2\xdd\x17\x3f\x05\xd6\x5f\x72\xd0\x79\x3f\
-\x80\x77\x00\x78\x68\xe9\x00\x96\x0e\xe0\x0b\xf9\xdc\x08\xe0\xdf\
-\x01\xb8\x67\xe1\x77\x7b\xe0\xf4\xb1\x4d\x7c\xdb\x4b\x1e\xc4\x1d\
-\x87\x8f\x63\x1a\x82\x1a\x13\x01\x91\x3b\x6c\x8e\x4e\xe0\xa5\xa7\
-\xbf\x09\xa7\x36\xef\x43\xe4\x4e\x29\xba\x73\x39\xfc\xec\x97\x83\
-\x5c\xfc\x19\x2b\x7d\x29\xd6\x3c\xb0\xe2\x45\xa6\x2d\xb2\xe0\x77\
-\xc8\x8c\xcb\x90\xf9\xef\xcf\xba\xa4\xd6\x8d\xb1\xdf\x5f\xc5\x7f\
-\x78\xef\x3f\xc6\xcf\x3c\xf4\x6f\x40\xe4\x95\x90\x24\x40\x43\x0e\
-\x1f\xbe\x76\x11\x3f\xf3\xf4\xc7\xb1\x17\xfb\xeb\x39\x81\x0f\x41\
-\xc7\xa1\x3f\xbc\x74\x00\x9f\xdd\xb3\x9c\x05\xf8\xec\x9c\x33\x00\
-\xfe\xf5\x81\xc6\x1f\x80\x3b\xcf\x1e\xc5\x1f\x7c\xf0\x65\x38\xb6\
-\xb2\x81\x49\xe8\xb5\x9a\x27\x42\xe4\x29\xb6\x56\x4e\xe3\x95\x67\
-\xbf\x0d\x3b\x2b\xb7\xa0\xe7\xbd\x62\xa0\x33\x75\xfa\xa0\x0c\x18\
-\x58\xe1\x7c\xea\x4e\x0b\x12\x76\x11\x02\x81\x8b\xbf\x10\x00\x24\
-\x73\x51\xbf\x94\x07\x32\xf8\x7a\xe8\x37\x86\x3f\x57\xb7\x0a\xa5\
-\x2a\x07\x26\x71\x0f\xad\x1f\xe3\x2b\xee\xff\x83\x68\xfd\x2a\xfe\
-\xd3\xfb\xfe\x85\xb1\x12\x09\x41\x18\xe7\x57\xb7\xb1\xb2\xd3\xe2\
-\x27\x2f\x7e\x0c\x97\xc3\xe4\x20\x27\x70\x07\x74\xc2\xf0\x6d\x00\
-\x3e\xba\xbc\xdc\x96\x0e\xe0\x0b\xe9\x6c\x03\xf8\x61\x2c\xe2\xf3\
-\x1b\xb1\xe7\x65\xe7\x4f\xe3\x0f\x3c\xf0\x52\xac\xfa\x11\xa6\x31\
-\x28\xb5\x86\x00\x96\x0e\x87\xc6\xa7\xf0\xca\x33\xdf\x8e\xc3\x2b\
-\xe7\xd4\xf8\x13\xd4\x27\x50\x53\xa5\x3a\xa2\x3e\xeb\xa6\x1f\x58\
-\x16\x60\x7f\x10\x9d\x04\xac\xfd\x88\xcc\x38\x0f\x99\xc9\x00\x12\
-\x83\x50\xf4\x37\xb1\xcc\x96\x0b\xf3\x19\x43\x7d\x3f\x04\xe8\x42\
-\x84\x73\x1e\x5f\x76\xcf\xef\x43\x64\xc1\x7f\xfa\xf5\x7f\x01\x4f\
-\x36\x5f\x10\x03\x8e\xba\x55\xbc\x69\xeb\x66\xfc\xd4\x95\x8f\xe1\
-\xc9\x7e\xef\x20\x27\x70\x27\x80\x1f\x01\xf0\x65\xd0\x76\xe1\xf2\
-\x2c\x1d\xc0\xe7\xfd\xb4\x00\x7e\x10\xc0\x2b\x0f\x02\xfc\x5e\x75\
-\xdb\x8d\xf8\xd6\xfb\x5e\x82\x96\x3c\x7a\x8e\x95\xf1\x47\xac\xb7\
-\x47\xf1\xb2\x33\xbf\x1f\x5b\x2b\x67\xd1\xc5\x3d\x10\xcd\x9a\xac\
-\xf6\xdd\x0a\x04\x28\x07\x82\x7b\x34\x07\xd3\x49\xc6\x0d\x64\xa6\
-\xb8\xaf\xeb\xf9\x59\x80\xaf\xce\x0e\x84\x00\x92\xc4\x36\xe0\x6c\
-\xd8\x32\x9b\xfe\xdb\xff\x38\xfd\x0d\xc1\x5c\x39\x11\x39\xc2\x91\
-\xc7\x5b\xee\xfe\x06\xec\x4d\xaf\xe1\xa7\x3e\xf0\xaf\xe1\x69\x04\
-\x02\x61\x12\x23\xd6\x30\xc2\x97\xac\xdd\x84\x9f\xda\x7d\x18\x4f\
-\x84\xdd\x83\x9c\xc0\x03\x00\xfe\x4f\xa8\xee\xc0\x52\x9f\xf0\xb3\
-\x70\xdc\xf2\x25\xf8\x8c\xce\x5f\xb7\x8b\x71\x61\xda\xff\xaa\x5b\
-\x6f\xc0\xb7\xdd\xff\x20\x1a\x72\x08\xc2\xd9\xf8\x21\x8c\x91\x5f\
-\xc5\xfd\x27\xbe\x16\x87\x57\xce\x23\xf0\x3e\x04\x51\x19\x7d\x12\
-\x01\x61\xb0\xb0\xcd\xed\x47\x08\x22\x18\xd1\x4c\x2c\xcd\x02\x0f\
-\x6f\xfa\xbd\xf4\x38\xe5\x0a\x88\xfd\x1e\x48\x34\x50\x31\x96\xf9\
-\x80\x74\x43\x84\x48\x54\x62\x11\xeb\xdf\x57\xae\x81\x7e\x8c\xc2\
-\x46\x48\x52\x62\x12\x4b\xb4\xcf\xed\x6b\xd6\xaf\x63\xfe\x79\xfd\
-\x9b\xd1\x7e\x26\x56\x8f\xef\xe3\x14\x91\x23\xbe\xfc\xde\xdf\x83\
-\x7b\xcf\xbe\x06\xd3\x7e\x02\x66\x01\xb3\xa0\x0f\x01\x23\x78\xbc\
-\x6e\xe5\x46\x1c\x73\x6b\xd7\x7b\xcd\xdf\x02\xe0\xef\x2c\x2f\xbd\
-\x65\x06\xf0\xf9\x3e\xdf\x06\xe0\x8f\x1e\x64\xfc\x0f\xde\x74\x0a\
-\xdf\x7a\xff\x83\x70\x42\x88\x60\x10\x1c\x88\x52\x5c\x14\xdc\x71\
-\xe4\x2d\x38\xb9\x79\x2f\x02\xef\xe5\xfa\x5e\x88\x73\xaa\x4f\x09\
-\xf5\x17\x80\xc0\x00\x51\x2e\x01\xe8\xc0\x22\x40\xe6\x53\xf0\x14\
-\x99\x01\x40\x08\x0c\x1e\x3c\x46\x66\x33\x07\xd6\x12\x21\xd7\xfb\
-\xd5\x10\x91\xd8\xcf\x70\x82\x28\xc4\xa0\xca\x0a\xfc\xcb\x25\x85\
-\x98\x20\x91\x0c\xf3\x92\xc8\x11\xad\x1f\xe3\xb7\x3f\xf0\xcd\x78\
-\xfc\xe2\x27\xf1\xc9\xa7\x3f\x8a\x86\x5a\x88\x08\xfa\xc8\x68\xc5\
-\xe1\x55\xed\x59\xfc\x4c\xff\x09\x3c\x2d\xfb\x07\xbd\xf6\xdf\x0c\
-\xe0\x03\x00\xfe\xb7\xe5\x65\xb8\xcc\x00\x3e\x1f\xe7\xc1\x03\x2f\
-\xbe\x1e\xb8\xe3\xf4\x11\x7c\xdb\x4b\x5e\x8a\x96\x1c\x82\xe8\xb0\
-\x3c\x99\x91\x47\xee\x71\xe6\xd0\x03\x38\xbf\xfd\x3a\xed\xf1\x4b\
-\x15\xe1\x45\xcc\xe2\x2c\x32\xe7\xe8\x6e\xf7\x0b\x03\x39\x72\x97\
-\xc7\x08\xd8\xbe\xa7\x8f\x91\x41\x56\x90\xee\x97\xf2\x33\x96\x0d\
-\xb0\x94\x88\x9f\x3e\x67\x70\xce\x04\xa2\xe8\xf3\xd2\x2c\x20\x5a\
-\xf4\xb7\xc7\x71\xfa\x5c\xb3\x02\x91\x80\x98\xb2\x01\x8e\x3a\x5a\
-\x6c\x1f\xa3\x04\x70\x8c\x88\xac\xe3\xc6\x93\x6e\x0f\x87\xd7\x8f\
-\xe1\x6d\x2f\xfe\x46\x8c\xfd\x0a\x42\x08\xe0\xa8\x99\x40\x17\x22\
-\x5a\x69\xf0\x72\x3a\x83\x8d\xeb\x2b\x9a\xff\xbf\x00\xbc\x71\x79\
-\x29\x2e\x1d\xc0\xe7\x03\xf4\xfb\x41\x2c\x52\xe6\x0d\xc0\xa9\x23\
-\x9b\xf8\x83\x0f\xbe\x0c\x6b\x6e\x84\x9e\x19\xce\xa2\x3e\x11\x41\
-\x24\x62\x63\x7c\x0c\xb7\x1d\xf9\x32\xa4\xde\x7f\x36\xd0\x9c\xba\
-\x97\x32\xa0\xa8\x80\x14\x83\xc7\xe0\x26\x33\x5f\x27\xe3\xb7\xaf\
-\x93\xc3\xa8\x7f\x3e\xa5\xfd\xf6\x78\x80\x8b\x23\xa8\xca\x0d\xb6\
-\xe7\xc1\x52\x4a\x04\x96\x08\xe6\x30\xf8\x3a\x9a\x33\x60\xd6\xb4\
-\x5f\xd8\xee\x67\x2e\x25\x03\x97\xc7\xc5\xa8\x5f\xef\x77\xd7\x70\
-\xeb\xa9\xfb\xf1\xea\xdb\xdf\x8a\x3e\xf4\x88\x41\x20\x0c\x30\x03\
-\x7d\x8c\x58\x93\x16\x2f\xe5\x53\x18\xc1\x1f\xf4\x3e\x8c\x00\xfc\
-\x03\xa8\x04\xd9\xf2\x2c\x1d\xc0\xe7\xec\x7c\x2f\x80\xfb\xe6\xee\
-\x65\x60\x65\xa5\xc1\xb7\xbe\xe4\x25\x38\xbe\xb2\x81\x8e\xa3\x49\
-\x6d\x55\x29\x3b\x01\x37\x1f\xfe\x6d\xd8\x1c\x1d\x43\x94\x69\x36\
-\x46\x35\x36\xd1\x5a\x1d\x6c\x09\xb3\xd5\xee\x59\x03\x2c\x16\x74\
-\x6e\xa0\xe2\x99\xb2\x06\x31\xa3\x96\x0a\xce\x8b\x83\x6c\x20\xfd\
-\x7e\xb1\x6c\x41\x52\x16\x90\xb2\x02\xae\xf1\x80\x2a\x2b\x48\x46\
-\x6e\x58\x42\xcc\xc6\x5f\x61\x00\xac\x3f\xa3\x9f\x17\xc3\x67\x8e\
-\xe0\x18\x10\x39\x64\xe3\x67\x09\x08\x31\xa0\x0f\x53\xbc\xea\x8e\
-\xb7\xe2\xec\xe1\x5b\x10\x42\x07\x31\x3c\x40\x58\x25\xc9\xb6\x65\
-\x15\xf7\x84\xe3\xd7\x7b\x2f\x6e\x85\x0e\x5a\x2d\xcf\xd2\x01\x7c\
-\x4e\xce\x97\x01\xf8\xf6\x03\x0a\x70\xbc\xf3\xde\x17\xe1\xae\x9d\
-\x63\x98\x18\xb5\x37\x99\x3f\x91\xd2\x7c\x8f\xac\x9e\xc7\xe9\x8d\
-\x17\xa3\xe7\xa9\x19\xbe\x64\xc3\xcf\xa9\xfe\x00\xdc\x9b\x31\xf4\
-\xfa\x3e\x99\xf9\x38\xf7\xd8\x99\xfb\x4c\x18\x44\xa4\x94\x0d\x05\
-\x74\x2c\xd9\x07\x27\x20\x0f\x29\xb2\x57\xd1\x7f\x81\x33\xe0\x0a\
-\x10\x8c\xac\x37\x66\xb6\x8f\x66\xf4\xc2\xa5\x2c\x90\x88\x18\x19\
-\x1c\x23\xba\x30\xc1\xda\x78\x13\xaf\xb9\xeb\x6d\x80\x78\xc4\xc8\
-\xd9\xd7\x49\x14\x74\x31\xe2\x74\xd8\xc4\xcd\xfd\xf6\xf5\xde\x93\
-\x6f\x81\xf2\x03\x96\x67\x09\x02\x3e\xa7\x67\x0b\xc0\xff\xbe\xd0\
-\x69\x06\xe0\x95\xb7\x9d\xc5\x9b\xcf\xdd\x82\x49\x30\xfa\x2e\x59\
-\xed\x6f\x8c\x3d\x4f\x0d\x6e\xdc\x7a\x25\xbc\x1b\x21\x4a\xa7\xde\
-\x97\xea\x76\x9c\x03\x88\x40\xc2\x10\x4a\x20\xa0\x80\x84\x32\xeb\
-\x4f\x55\x7b\x66\xe8\x77\x54\xbc\x10\x49\xdd\xf2\xab\x29\x3b\x3c\
-\x6c\x07\x82\x0d\x16\x90\x9c\x2b\x88\x48\xce\x1d\x12\x40\x98\x40\
-\x3c\xc9\x19\x46\x82\x13\x18\x15\xd6\x97\x7f\x57\x02\x03\xc5\xfe\
-\x27\x35\x51\x88\x4b\xfb\x30\x81\x89\x10\x60\xd2\xed\xe3\x8e\xb3\
-\x2f\xc1\xf9\x13\x77\xe2\x37\x1e\x79\x2f\x1a\x1a\xe5\x2c\x80\xb5\
-\xf3\x88\x5b\xbb\x23\xb8\xe4\x26\x78\xba\x99\x2c\xea\x81\x12\x54\
-\x68\xe5\xe7\xb0\x1c\x1c\x5a\x66\x00\xcf\xe1\xf9\xd3\x58\xa4\xd3\
-\x1f\x81\x33\xc7\x36\xf1\x0d\x2f\xba\x0f\x92\xc8\x3b\x95\xfa\x05\
-\x81\xc0\x12\x71\x78\xf5\x1c\x76\x56\x6f\x46\x90\x49\x89\xba\x09\
-\x7c\xab\xea\xfb\x84\x01\x94\x76\x5f\xc4\x7c\xdb\x4f\x40\xc4\x20\
-\xe8\x6d\x71\xb6\x10\xab\xba\x3f\x65\x01\x31\xb7\xe9\x64\x80\x39\
-\xd8\x2d\x95\x00\x88\x19\xd8\x63\x84\xaa\xfd\x67\x51\x5e\x4a\xaa\
-\x5f\xa2\xbe\x81\x80\x09\xf8\x8b\xa9\x44\x08\x08\xf6\xbd\x90\x1f\
-\xdf\xeb\xfd\x56\x06\x34\xae\xc1\x4b\x6f\x7b\x3d\x1c\x35\xa6\x5a\
-\xac\x44\x26\x01\x10\x23\xc3\x31\xe1\xae\xbd\x63\x18\xb1\xbf\x1e\
-\x53\xf0\x4f\x2d\x2f\xd1\xa5\x03\x78\xae\xce\x9d\x50\xb5\x9a\xb9\
-\xd4\xdf\x37\x84\xaf\xbf\xef\x7e\x1c\x1e\xaf\xe6\x5e\x7f\xd1\xd6\
-\xb3\x10\x45\x0e\x27\x37\xee\x85\xa7\x06\x6c\xb2\x5d\x9c\x6a\x71\
-\x54\x40\x9d\x2c\xe8\xf3\x93\xd8\x70\x8d\x1a\xb1\x36\x03\x87\x69\
-\x3e\xcd\x7c\x5f\x7b\x87\x8b\x4a\x87\xea\xf7\xa7\xae\x40\xdd\xf7\
-\x4f\x5c\x84\xe4\x08\x58\x71\x01\x06\x57\xa9\x7f\x28\x3f\x33\x83\
-\x1b\x44\x03\x09\x99\x23\x22\x62\x76\x08\x6c\xce\x40\x62\x44\x8c\
-\xe6\x28\xa2\x81\x82\x1c\x31\xed\xf6\x71\xfe\xc4\x5d\x38\xbd\x73\
-\x0e\x7d\x1f\x0c\xff\x14\xed\x46\xb0\x20\x44\xc6\x7a\x3f\xc2\xad\
-\xbb\x3b\xd7\x7b\x8f\xbe\xc3\x30\x81\xe5\x59\x3a\x80\xcf\xfa\xf9\
-\x1e\x2c\x5a\xc0\x19\x81\xd7\xde\x7c\x0e\xf7\x1e\x39\x91\x53\xff\
-\x9c\x8e\x27\x6c\x50\x22\xd6\xdb\x1d\x1c\x5e\x3d\x87\x28\x9d\x1a\
-\x17\xaa\xba\xdb\x22\xae\x5e\xf5\xe9\x63\xc2\x05\xa4\xea\x06\x2c\
-\xaa\xed\x87\x75\xbe\x96\x1d\xc9\x11\x70\x76\x0a\x32\x68\x2b\xc6\
-\xd2\x71\x60\xab\xfb\x53\x36\x92\x0c\x1d\xd6\xda\x43\xe9\x02\xc4\
-\x41\x37\x20\x45\xfc\x30\xc8\x04\x38\x06\x8b\xfe\xe5\xfb\x39\xea\
-\x47\x8d\xfc\x51\xd4\x09\x04\xbb\x45\x0e\xe8\x62\x87\x51\xb3\x82\
-\x3b\xce\x3e\x90\x8d\x9e\x59\x20\x51\x39\x07\x2c\x82\x5e\x18\x27\
-\xf6\x37\x71\x74\x7f\xed\xa0\x2c\xe0\x10\x54\x62\x7d\x79\x96\x18\
-\xc0\x67\xf5\xbc\x16\xaa\xdf\x3f\x67\xfc\x5b\x87\x56\xf0\xf6\xdb\
-\xee\x00\xf3\x70\x14\x37\xc3\x7f\x36\x46\x7b\x78\xf5\x26\x8c\xdc\
-\x1a\xa2\xf4\x15\x95\x87\xb2\xab\x70\x70\x56\x02\x90\xfd\x2c\xe9\
-\x0f\xd7\xf7\xd1\x50\x08\x84\xea\x3f\x58\x13\x7f\x12\x10\x20\x35\
-\x25\xb8\xea\x14\x58\xdd\x6f\x90\x60\xae\xef\x59\xa4\xe0\x00\x52\
-\xbe\xe6\x44\xf3\xe5\x0a\x2b\xc8\xdf\x47\x66\x18\x4b\xaa\xf9\xf3\
-\xfd\xfa\x91\x0d\x08\x48\x18\x40\x26\x1b\x49\xc1\x0a\x14\x6b\x98\
-\xe2\xfc\xc9\xbb\xb0\xbe\xb2\x89\xdd\xfd\x3d\x7d\x4d\x12\xa0\xc0\
-\x02\x66\xc0\x31\x70\xfe\xda\x61\x5c\x1a\x4f\x10\x1c\x2f\xc2\x03\
-\xbe\x01\xaa\xbd\xf8\xee\xe5\x65\xbb\xcc\x00\x3e\x5b\xe7\x4f\x1d\
-\xf4\x3a\x7d\xe5\x9d\x77\xe0\xd4\xda\x3a\x7a\x8e\x8b\xa7\x75\x01\
-\x38\x6a\x70\x78\xe5\xc6\x9c\x6e\xf3\x0c\x15\x37\xd5\xe6\x58\x44\
-\xde\xc9\xa9\xfc\x30\xfd\xa7\xc1\xfd\xfa\x39\x61\x78\x93\xb9\x12\
-\xc0\xfe\x1e\xcd\xb7\x04\xb9\xc2\x1d\x52\x5b\x6f\x16\xf5\xd7\x6c\
-\x20\x0c\xee\xcf\x24\x22\x4e\x8f\x09\xf9\x73\xad\xf9\x2d\x7b\xc8\
-\x25\x41\x28\x25\x00\x47\xcb\x10\xb4\x44\xe8\xfa\x09\xb6\xd7\x8f\
-\xe0\xc4\xe1\x1b\x10\x63\xc8\x0e\x42\xcc\xf8\xc1\x9a\xb7\x6c\x74\
-\x23\x9c\xb9\xba\x79\x50\x16\x30\x02\xf0\xc7\x97\x97\xec\x32\x03\
-\xf8\x6c\x9d\xd7\x40\xe7\xd0\xe7\x50\xff\x5b\x4f\xed\xe0\x4b\xce\
-\x9e\xc3\x24\xf0\xe2\x9f\x24\x8d\xca\x2b\xcd\x26\xd6\xda\x23\x88\
-\xdc\x15\x1c\xde\x68\xbd\x4e\x34\xda\x8b\xf1\x05\x20\xa4\x72\x19\
-\x24\x33\xae\x84\x86\x9f\x93\xcc\xeb\x7b\x52\x05\xb9\x93\xd8\x10\
-\x4f\xba\x8f\xf3\x90\x6e\x41\xf4\x39\x67\x00\xe9\x3f\x96\x92\x15\
-\xd4\x59\x40\xc9\x0c\x18\x91\x31\x13\xe1\xab\x6e\x42\xca\x02\xb8\
-\x64\x0a\xd9\x90\x45\x4a\x75\x03\xa9\x1e\x63\x59\x00\x03\xa3\x66\
-\x84\xb3\x47\xcf\xe3\x37\x3e\xfe\xeb\xa5\xab\x90\x98\xcb\xf6\x7b\
-\xa2\x08\x4e\x5d\xdd\xc4\x13\x6b\xbb\xd8\x6f\xc3\xa2\x2c\xe0\x6b\
-\x00\xdc\x0d\xe0\x7d\xcb\xcb\x77\xe9\x00\x3e\xd3\xf3\x1d\xc0\x0c\
-\x15\x4d\xf4\x9e\xb7\xdd\x76\x3b\xc6\xbe\xc1\x24\xc4\xea\x1b\x94\
-\xf9\xfe\x7a\xd1\x46\xac\xb7\x47\xd0\xfa\x15\xb0\xf4\xd6\xe6\x03\
-\x44\x1c\xc8\x19\x52\x20\x04\x26\x75\x06\x44\x0e\x42\xb1\xb4\x00\
-\x67\xd6\xf4\x6a\xe4\xa7\xaa\x08\x48\x2a\x81\x32\x33\x27\x28\x65\
-\x3e\x97\x24\x67\x1a\x96\xec\x67\xc3\x86\xb0\x71\x11\x92\x31\x72\
-\x95\xfa\x97\x5b\x31\x76\xce\x35\xb9\xde\x47\xf9\xb1\xc9\x88\x53\
-\x8b\x2f\x45\xef\x81\x53\x40\x55\x0e\x54\x4e\x21\x7d\x1e\x22\xe1\
-\xd8\xf6\x69\x34\xae\x85\xb0\xcc\xfc\x73\xf4\x6b\x16\xc1\x28\x7a\
-\x9c\xba\x72\x08\x1f\x39\xfa\xf4\x22\x07\x30\x06\xf0\xad\x00\xfe\
-\xd8\xf2\xf2\x5d\x3a\x80\xcf\xe4\xdc\x8a\x45\xab\xbb\x22\x70\xd7\
-\x99\x63\xb8\xff\xf8\x09\x4c\x43\xc8\x06\x48\x0b\x3a\x04\x80\x60\
-\xb5\x3d\x6c\x43\x38\x11\x64\x73\x01\x4c\x02\x27\x00\x48\x17\xea\
-\x91\x90\x65\x05\x8a\x08\x88\x28\x79\x48\xec\x7b\x9a\x11\xd0\xc0\
-\xe8\x67\x94\xf8\xf2\x90\x51\x32\x7e\x49\x93\x3c\x99\xf5\x57\x77\
-\x01\x90\x33\x00\x54\xd1\x9f\xf3\x14\xa2\x1a\x9a\x30\x67\x63\x4e\
-\xce\x20\x19\x2f\xa7\x5a\x1e\x32\x70\x0a\x5c\xd7\xf6\x33\x06\x3e\
-\x30\xfc\x81\x23\x48\xa9\x3e\x63\x6b\x6d\x07\x2b\xed\x1a\x76\xf7\
-\xaf\xe9\xb2\xd2\x0a\x07\xcd\x8e\x09\xc0\xb1\xab\xab\x78\x74\xa3\
-\xc5\xfe\x4a\x5f\xd6\xa0\x97\xf3\xbb\xa1\xb3\x02\x17\x96\x97\xf1\
-\xd2\x01\xfc\x56\xcf\x37\x2e\x44\xfe\x3d\xf0\xc6\x9b\xcf\xa3\x85\
-\xc3\x14\xa1\x32\x48\x42\x96\xe7\xa2\x94\x86\x37\x58\x69\xb6\x72\
-\xfd\xec\x92\xe1\x12\xc0\x42\x70\x10\x9b\x11\x30\x83\x17\xa7\x4e\
-\x80\x52\xd4\x77\x95\xa1\xbb\x4a\x17\x60\x91\xf2\x1f\x2d\xec\x0e\
-\xd4\xa9\xbf\xf2\x0f\x4a\xba\xce\x29\xe2\xb3\x58\x07\x40\xef\x13\
-\x06\x0c\x19\x50\x80\x53\x8a\x91\xb3\x19\x7d\x9d\xc2\xa7\xd2\x81\
-\xb9\x4e\xf5\x53\x49\x51\x95\x04\x03\x83\xb7\xbf\x93\xca\x09\x56\
-\xc8\x73\xd4\xac\xe0\xd0\xda\x61\x5c\xdd\xbb\xaa\xd9\x92\xcd\x39\
-\x71\x06\x1b\x35\xeb\xf0\xd1\xe1\xe4\x95\x75\x7c\x74\x7c\x69\xd1\
-\x7b\x77\x02\xaa\x23\xf8\x8f\x97\x97\xf1\xd2\x01\xfc\x56\xce\x2a\
-\x80\xaf\x5b\x14\xfd\xcf\x1d\xdf\xc6\x7d\x47\x4f\x28\xf0\x37\x63\
-\x7e\x98\x41\xe6\x9d\x73\x68\xdd\x4a\x5e\xe4\x91\x68\xc1\xb9\xf6\
-\x87\x58\xfd\x4f\x60\x71\xf0\x94\x44\x3c\x9c\x25\x10\x89\x15\xe8\
-\x50\xc2\x5c\xed\x14\x6a\x17\x50\x0c\x3e\x4d\x0f\x4a\x95\xf6\x97\
-\xba\x9f\xab\xd4\x5c\x67\x10\x8a\xf1\xeb\x7d\x11\xc3\x32\x60\xfe\
-\xf3\x61\x8d\xcf\x89\x1d\x98\xa3\xb4\x7d\x34\xab\x95\xfa\xeb\x0a\
-\x1f\x60\x46\xe5\x2c\x12\x8c\x41\x58\x1d\x6f\x80\x23\xc3\x3b\x3f\
-\x28\x6c\x90\xf9\x01\xfa\x2f\xda\xb9\xba\x8a\x4f\x6e\x5f\x45\xd7\
-\xc6\x45\x2f\xc9\xd7\x2d\x1d\xc0\xd2\x01\xfc\x56\xcf\x6f\x03\x70\
-\xdb\xa2\x6f\xbc\xf6\xc6\x1b\xb1\xd6\xb4\xa6\xeb\x87\x03\x22\xb1\
-\x65\x00\x70\xf0\xd4\x20\x4a\x80\x62\xd8\xce\xca\x01\x75\x04\x3a\
-\x78\x4f\x70\xe4\x40\x10\xb0\x7d\xdf\x99\x11\x13\x25\x47\x61\x00\
-\x21\x91\x5a\xcc\x42\x41\x80\x0a\x07\x90\x2a\xf2\x83\x2b\x90\xae\
-\x2c\x0b\x4d\x9f\xb3\x08\xa2\x68\xfa\xad\xe9\x7c\xb9\x9f\x53\xdd\
-\xcf\x69\xd1\xa8\x82\x70\xa5\x0c\x90\x52\xc7\xb3\xe4\xaf\x33\x16\
-\x90\x9d\x82\x7d\xdf\x3e\x22\x65\x12\x39\xbd\xb7\x76\xa3\x00\x8e\
-\x3c\xc6\xcd\x4a\xa5\x2b\x20\xd5\x0d\xd9\xb9\xb1\x00\x6d\xe7\x71\
-\xe4\xca\x1a\x1e\x3d\x7a\x75\x91\x03\x78\x2d\x94\x21\xf8\xa1\xe5\
-\xe5\xbc\x74\x00\x9f\xee\x99\xef\xfb\x33\x70\x68\x63\x8c\x07\x8e\
-\x9f\xc4\x34\x46\x30\x66\x7b\x83\x0b\x24\xba\xc9\x81\x8c\xfd\x47\
-\x96\x52\xeb\xe6\x5d\x00\xe2\xb4\xee\x97\x64\xee\xce\x84\x3f\xbc\
-\xa6\xb9\x24\x96\x09\xa8\xe0\x06\x65\x41\x90\x54\x66\x2c\x2a\x03\
-\x92\xe6\x9f\x19\x69\x9d\x09\xa4\x88\x8f\x2a\xea\xe7\xfb\x8b\x7a\
-\x50\xc6\x02\xd8\x1c\x43\x8d\xd4\x67\xc3\x95\xec\x20\x0a\xd2\x5f\
-\x9c\x46\x72\x08\xc3\x5a\xbf\x72\x1c\x5c\xd5\xff\xa9\xa4\x30\xc6\
-\x72\xe3\x1c\x9a\xa6\xcd\x13\x8b\x83\xb9\xa7\xac\x32\xa2\x6f\x08\
-\x83\xb0\x73\x65\x15\x8f\x1f\xbe\x0a\x9e\x77\x8a\x2b\x00\xde\xba\
-\x74\x00\x4b\x07\xf0\xe9\x9e\x43\x76\xe1\xcc\x39\x80\x17\x9f\x3a\
-\x89\xa3\x2b\x6b\x98\xc4\x60\x06\x39\x0f\xcd\x0d\x41\x40\xfb\x94\
-\x03\x84\xd2\xf0\x0f\x59\xfd\xcf\x60\x72\x33\x1b\x3a\xf4\xa3\x23\
-\x07\x11\x87\xa4\xb0\x0f\x72\x26\xca\x99\xb2\x0b\xc2\x40\xd9\x13\
-\x32\x5c\x01\x5e\x45\x7c\x54\xf5\xbe\xd8\xec\x3f\x43\xaa\xe8\x6f\
-\x86\x9b\xbe\x97\x6f\x56\xa7\xa7\x1a\x5f\x04\x71\xc6\xf8\x35\x72\
-\x4b\x7e\x2c\x57\x6d\xbf\x1a\x30\x14\x7b\x5c\x22\xf4\x30\xa7\xba\
-\x5f\x32\x06\xc0\x51\x3f\x3a\x72\x70\xce\xcd\x91\x99\x06\x3a\x84\
-\x95\x43\x58\x9b\x34\xd8\xdc\x1b\xe3\xf2\xe6\x74\x11\x18\xf8\x56\
-\xe8\x00\xd7\xf2\x2c\x1d\xc0\xb3\x3e\xaf\x84\xca\x7c\x0f\x8c\x99\
-\x1a\xe0\x25\xa7\x4e\xe9\x85\x8c\x05\xab\xb7\x92\x5d\x4a\x15\x9c\
-\x05\x99\x34\x63\xbb\xb3\x34\x03\x48\xbd\x7f\x16\x30\xa5\x56\x1e\
-\x43\xcc\xd0\x85\x92\xc0\xa6\x3e\xd6\x41\xc0\x94\x9a\x82\x0e\x24\
-\xc8\x5a\x03\xd9\x01\x98\xb1\xd4\xbd\x7b\x9e\x49\xff\x35\xb2\xa7\
-\x48\x1d\xab\x68\xce\x88\x16\xba\xd3\xfd\xb9\x34\xc8\xf5\xba\x20\
-\x56\xb5\x7c\xee\x12\xd8\x04\xaf\x08\x83\xe3\x0c\xaa\x9f\x30\x02\
-\x2e\x8f\x95\x2a\x43\x60\x49\x24\x1f\xc9\x6d\x42\x0a\x0e\x1c\x63\
-\xc9\x69\x06\x98\x26\x15\x7e\x80\x0d\x3c\xfa\x40\x38\x7c\x75\x45\
-\x1d\xc0\xe2\xf7\xf2\x14\x80\x47\x97\x97\xf5\xd2\x01\x3c\xdb\xf3\
-\xa6\x45\xd1\xff\xf8\xe1\x75\xdc\xbc\xb5\x5d\x81\x7f\xf3\xfb\xf9\
-\x92\x53\xe0\xe4\x0c\x20\x08\xb1\x83\xa7\xc6\x16\x80\x00\xce\xa2\
-\xb7\x90\x83\x23\xe4\x68\xcf\xa9\xbe\x87\x66\x05\x2e\x57\xf1\xd6\
-\x36\x64\x82\xd5\x0e\xf6\xd7\x67\x04\xbf\xb3\x63\x4a\xce\xa0\x20\
-\xfc\x11\x66\xf0\x52\xea\xfc\x38\x88\xfa\x92\x27\x13\x73\x56\x90\
-\x0c\x9e\x65\xd0\x02\xe4\x94\x09\x30\xe7\x96\x9f\x3a\x04\xce\x78\
-\x00\x57\x60\x20\xec\x71\x6c\xe0\x5d\x22\x39\x96\x91\x5f\xbb\x1f\
-\x30\x90\x90\xd0\xc7\xae\x8a\xf4\x85\x6f\x90\x89\x43\x55\x36\xc0\
-\xc4\xd8\xbc\xb6\x02\x1f\xae\x20\xfa\xb9\x65\x86\x87\xcc\x09\xfc\
-\xdf\xcb\xcb\x7a\xe9\x00\x9e\xcd\x71\x58\xb4\xd3\x4f\x80\x17\x1d\
-\x3f\x86\xf5\x76\x8c\x2e\xf5\xfe\xe9\x60\xfc\x2f\x47\x7f\x16\x04\
-\x99\x60\x84\x15\x4b\xc7\xab\x76\x21\x58\x79\x00\x2c\x4a\x72\x67\
-\x07\x38\x07\xa2\x12\xbd\x95\x27\x20\x20\x56\x51\x50\x62\x07\x22\
-\x1a\x0c\x1b\x97\xf4\xb8\x6e\xef\x21\x47\x7f\x46\x6a\xf7\xc5\x0c\
-\xea\xc5\x2a\xd5\x57\x00\x30\xe6\xec\x20\xa6\xc7\x60\x88\xfa\xeb\
-\xf7\xcc\xa1\x08\x0f\xfa\xf9\xd1\xb2\x81\x04\xfe\xb1\xe8\x20\x8f\
-\x96\xf0\x0c\x8e\xd6\x29\x88\x46\xe6\x89\x35\x47\x80\x73\xab\x2f\
-\x3d\xdf\x69\x37\x31\xec\x63\xfe\x25\xd6\x7f\x6a\x45\x7d\x22\x60\
-\xd4\x79\x1c\xda\x1d\xe3\xe2\xd6\x42\xbd\x80\x57\x2f\x1d\xc0\xd2\
-\x01\x3c\xdb\x73\x1a\xb3\x7b\xfd\x44\x5f\xa5\x3b\x8e\x1e\x5d\x60\
-\xe7\x32\xa3\xd4\x3b\xbb\x97\x27\x22\xc4\x09\xb8\xd1\xe9\xbf\x44\
-\xfc\x81\xa5\xf2\xcc\x6c\xa5\x80\x03\x88\x55\x14\x04\x0e\x22\x0c\
-\xe7\x0c\x20\x24\x82\x27\x67\x8b\xc2\x18\xce\xc4\x42\x20\xb3\xf5\
-\x3f\x0d\x68\xbc\xd1\x18\x34\x29\x3a\xe7\xe8\xce\x55\x9d\xcf\x5c\
-\x39\x84\x2a\x33\x30\x52\x4e\xdd\xfb\x4f\x59\x81\x70\xc1\x02\x8a\
-\x73\xa8\xb0\x01\x1e\x82\x7e\x6c\x83\x8d\x5c\x19\x3a\x9b\xb3\x00\
-\x0f\xdb\x81\xca\x2f\x08\xd8\x9f\xee\xc3\xc1\xe5\x17\xba\xd8\x74\
-\x4d\x77\xb2\xd7\x98\x04\x9e\x81\x8d\xbd\x91\x3a\x80\xf9\xf3\x52\
-\x1c\xb4\x43\x7d\x79\x96\x0e\x60\xe6\xbc\x04\xc0\xc6\xec\x9d\x1b\
-\x2b\x23\xdc\x74\x68\x1b\x5d\x0c\xa8\xb7\x66\x25\xb5\x9f\x83\xe4\
-\xba\x59\x22\x3a\xde\x05\xf3\x8e\xed\xfa\x2b\xe9\xbb\xcb\xbc\xbf\
-\xea\xda\x64\xaf\x8e\xc0\x9c\x82\x23\xd6\xd6\x20\x6c\xa7\x00\x48\
-\xfd\x08\x25\x8d\xe1\x19\x02\xb0\x94\x56\x5c\x01\xeb\xd8\x22\x76\
-\x32\x7e\xb1\x81\x1f\x29\x4e\x80\xcd\x09\x70\xe1\x03\xa4\x28\x1f\
-\x39\xd5\xfc\xc8\x0e\x83\xab\x36\x5e\x72\x00\xd9\xa8\xab\x52\x81\
-\xb9\x6a\xff\x45\x03\x14\xa3\x0c\xbb\x04\x5c\xb7\x0d\x05\x31\x30\
-\xf6\x26\xbb\xd6\xf2\x44\xde\x48\x34\xec\xae\xd4\x6b\xc9\x08\x4c\
-\xc0\xe6\xee\x18\x14\xc9\x86\xa0\x06\xe7\x1e\xe8\xba\xf6\xa7\x97\
-\x97\xf7\xd2\x01\x3c\xd3\x99\xdf\xea\x1b\x81\xb3\xdb\x87\xb0\x31\
-\x1a\x29\x50\x66\x35\xbe\x35\xed\xe0\x68\xc8\xc3\x1b\x84\x1a\x11\
-\x4c\xc2\x55\xf0\x58\xa7\xe9\x9c\x68\x07\x80\x9c\xd6\xfb\xfa\x3b\
-\x12\xc9\x87\x50\xa4\x3f\x28\xb7\x00\x6b\x6a\xb0\x4b\x86\x2f\x18\
-\x38\x1c\xa9\x73\x01\x29\x43\x3d\x5c\x1b\x39\x2a\xc4\x3f\x89\x7b\
-\x72\x02\x00\xeb\x72\xa0\x38\x01\x66\x54\x4e\xa3\xfa\x5e\x65\xb4\
-\x35\x20\xc8\x96\xd2\x73\xaa\xed\x33\xc5\xb7\xcc\xf6\xa7\x0c\x20\
-\x3b\x81\x0a\x10\x24\x21\xec\x4d\x77\xb1\x3f\xb9\x96\xb3\x9c\xbc\
-\x03\xd5\xb6\x0d\x0d\xc7\x9e\x0b\xe7\x62\xd4\x7b\x8c\x82\xc7\x74\
-\x34\x37\x20\xb4\x03\xe0\x76\x00\x3f\xbf\xbc\xbc\x97\x0e\xe0\x99\
-\xce\x5d\x8b\xea\xff\x9b\x0e\x6d\x63\xe4\x3d\xa6\x1c\x06\x84\x5b\
-\x02\x55\x8b\x33\x68\x60\xfc\xc9\x38\xa7\xe1\x2a\x02\x77\x65\xbc\
-\xc7\x11\x1c\x2b\x08\xa8\x93\x01\x09\xf9\x77\x10\xc7\xf6\x39\x41\
-\x5c\x32\x7c\x2d\x03\x48\x08\xe2\x52\xe4\x3f\xc0\x01\x48\x35\xef\
-\x5f\x67\x00\x89\xea\x5b\xa5\xff\x91\x2d\x23\x48\xe9\xbd\xa1\xff\
-\xd9\x09\x30\x06\x80\x5f\xb9\xbf\xd4\xef\x25\xfa\x1b\x91\x48\x0a\
-\xb0\xc7\x55\xcf\x7f\xd0\x05\xa8\x94\x7f\x15\x2b\x28\x9d\x05\x0f\
-\x8f\xab\xbb\x97\xd0\x85\x69\xce\x6f\xea\x1d\x83\x54\x67\x5f\xb9\
-\x16\xd3\x2f\x1a\x26\x6c\xee\x8d\x30\x1d\xcf\x39\x00\x07\x55\x74\
-\x5a\x3a\x80\xa5\x03\x78\xc6\xd7\xe2\xce\xb9\xfa\xbf\x05\x4e\x6d\
-\x6d\x20\xc6\xb2\x11\x27\x45\x7d\x11\x31\x60\x5e\xac\x57\x5f\x74\
-\x3b\x92\xb0\xe7\x34\x5c\x45\x1f\xf7\xd1\xba\x31\x84\x18\x4e\x9c\
-\xc5\x7b\xb6\x28\xcf\x5a\xef\x82\x01\xb6\x9e\x3f\x48\x53\x66\xe7\
-\xec\x71\xfa\xbb\x98\xd3\xb4\xe1\x8c\x0b\xc8\x00\x20\x86\xa3\xbd\
-\x6c\xa2\xe3\x22\x83\x1e\x7f\x36\x7c\x9e\x2f\x0f\x62\xb4\xaf\x6b\
-\xe0\xcf\xc6\x80\x33\x9e\x50\x19\x70\x76\x00\x75\x3a\xcf\x15\x61\
-\x68\xc6\xe8\x25\xce\x64\x08\xb1\x0c\x08\x01\xc0\xc5\x2b\x4f\xd9\
-\x1e\xc1\x26\x77\x00\x92\xf5\xd7\x4b\x93\x53\x17\xa4\xcc\x4d\x12\
-\x56\xfa\x03\x2f\xe7\xa5\x54\xd8\xd2\x01\x3c\xe3\x59\x07\x70\x6e\
-\xee\x05\xf2\x0e\x27\xd6\x37\x10\xac\x26\x4e\x2a\x3f\xa9\x13\x50\
-\x56\x68\x49\xbe\x1c\x5d\x55\x0f\x74\x71\x82\xfd\xfe\x12\xfc\xe8\
-\xa8\xb1\xf4\x38\xcf\x03\x50\xaa\xf7\x49\x8d\x9c\x85\xe0\x9d\xcb\
-\xf3\x85\xcc\x4a\x13\x66\x10\xc8\x01\x94\x1c\x00\xd1\xb0\xe1\x90\
-\xd8\x72\xc6\x1f\x48\xc3\x3c\x19\x10\x94\x45\xd1\xbf\xa4\xff\x52\
-\x81\x7f\xb1\xea\xf3\x67\x46\x20\x17\xa3\x4d\xf7\x95\x12\x40\x7f\
-\x07\x04\x88\x71\x08\xea\x29\xf0\x27\x56\xf7\x4b\xee\x04\x94\x8f\
-\x52\x3a\x00\x2c\x10\xee\xf1\xd4\x95\x27\x66\x20\xd5\x5a\x5d\xb8\
-\x38\x3a\xd4\xc0\x20\x01\x70\x82\xf5\xe9\x68\x11\x19\x08\x8b\xde\
-\xd7\xe5\x59\x3a\x80\xd9\x73\x0a\xb3\xdb\x7e\x04\xd8\x5c\x19\x63\
-\x6b\xbc\x82\x60\x51\x36\xc9\x74\x53\x5a\x99\x5d\xcd\xff\xb3\x5e\
-\x87\x25\x03\x25\x65\xc8\xed\xf5\x4f\x63\xb5\xdd\xce\xa5\x82\xb3\
-\x34\x3f\x8f\x01\x3b\x32\x61\x30\xc5\x06\x28\x69\x04\x24\x27\xe0\
-\x48\x8d\x3f\xd5\xff\xc9\x01\x08\x32\x33\x18\x83\x91\xdc\x2a\x0b\
-\xa8\x71\x00\x03\x04\xe3\x6c\x3f\x1f\x6a\xc4\xb1\xea\xf9\xd7\xc6\
-\x1e\xb9\xa0\xfd\x75\x06\xa0\xdd\x00\xb6\xdf\x23\x19\xe4\x2b\xe9\
-\xbf\xe4\x7a\x5f\x9d\x02\x97\x2e\x41\x6a\xfb\x45\x9b\x0f\x00\xe1\
-\xda\xde\x15\x5c\xdd\xbb\x0c\x47\x7e\xb8\x02\xa1\x36\x77\x4b\xc1\
-\x84\xc5\xb8\x16\x76\x1f\x01\x2b\xc1\xc3\x31\x81\xe7\xf9\x00\x37\
-\x5a\x29\xc0\xcb\xcb\x7c\xe9\x00\x0e\x3a\x67\xa1\x92\x52\x15\x8c\
-\x0f\x1c\xd9\x58\x45\xe3\x9d\x6e\xd9\x4d\x70\x9d\x11\x53\x9c\xe5\
-\xa3\x42\xb3\xf5\x78\x59\xc6\x09\x02\x76\xbb\x8b\x38\x34\xde\x87\
-\x77\x6d\x9e\x78\x23\x47\x36\xd7\xe7\x20\x6c\x60\x9f\x23\x70\x54\
-\xb0\x8f\xc8\x9c\x04\x60\xa9\xbf\x2b\x2b\x43\x53\x2b\xd0\xfe\x54\
-\x59\xf7\x5d\x84\x3b\x8a\x03\x98\x41\xf7\xb9\x80\x7f\x5c\x63\x03\
-\x16\xfd\x53\x8b\x2f\x83\x7f\xd1\xc0\xc0\xf4\xbb\x2c\x72\x73\x44\
-\x95\x0d\x54\x91\x3f\x4a\x19\x18\x8a\x40\x34\xaa\x20\x33\xc0\x71\
-\x1e\x07\x48\xa5\x84\x83\xc3\x53\x97\x9f\x40\xdf\x77\xda\x22\xcd\
-\xff\xb6\xc2\xb0\xac\xbd\x41\x32\xfe\x2c\x97\x48\x04\xcf\x0e\x8d\
-\x38\x74\x88\xb3\xef\xed\x09\x7b\x6f\x27\xcb\xcb\x7c\xe9\x00\x0e\
-\x3a\x47\x30\x47\xed\x03\xb6\xc6\x2b\xf0\x44\xe0\xc8\x0a\xc8\xe5\
-\x9a\x5b\xbf\x5f\x63\xf8\x6a\xd2\x43\x36\x10\x91\x43\xcf\x13\xec\
-\xf6\x17\xb1\x31\x3a\x8a\xdc\xd2\xe3\x94\x05\xb0\xfa\x09\x72\x6a\
-\xe8\x70\x70\xe6\x1c\x58\x6c\xa9\xa8\xd3\x6c\x81\x84\x72\x0d\x9c\
-\x1a\x8f\x83\x34\x99\x24\xf3\xf3\x75\xc3\x6f\x6d\xfc\x96\xfa\x57\
-\x19\x41\xa1\x01\xa3\x80\x81\x71\x36\xfd\x4f\xfc\x7d\x2e\x34\xe0\
-\x2a\x83\xc8\xe5\x40\x9e\xef\xaf\x50\x7f\xd6\xdf\x8d\xaa\xff\x2f\
-\x11\x83\x6e\x81\x62\x00\x84\x2e\x4c\x71\xe1\xf2\x63\x1a\xd1\x65\
-\x26\x82\xcf\x2a\xa4\x55\x5f\x50\x42\x03\x09\xf0\x8e\xb0\xda\xb5\
-\x8b\xc6\x83\x8f\x40\x87\x83\x96\x0e\x60\xe9\x00\x0e\x3c\x87\x17\
-\xdd\xb9\x3d\x5a\x81\x23\x42\x80\x80\x84\x73\xaa\x4e\x40\x35\xc2\
-\x9a\x2e\xcc\xca\x49\x00\x06\xea\xa9\x61\x5e\x9b\x3e\x89\x15\x7f\
-\x28\x0f\xba\x28\xd1\xc7\x7e\x8f\x23\x38\x91\xb2\x44\x14\x65\x64\
-\xd8\x55\x9b\x85\x33\xfc\x57\x91\x80\xea\x32\x20\x0f\xdf\x40\xf2\
-\x70\x8e\x8e\xf9\xa2\x44\xfd\x5a\xf9\x87\x8b\x11\xc7\x4a\x20\x24\
-\x56\x46\x5e\x0c\xbe\xa4\xef\x09\x44\x14\x11\xc4\x84\xe2\xc7\x4a\
-\x31\x28\xe1\x05\x91\xcb\x74\xa0\x95\x06\x1c\xab\x41\x22\xfb\x59\
-\x82\xc3\xc5\x2b\x17\xb0\xbb\x77\xd5\xa8\xd1\x32\x54\x38\x1a\xe4\
-\xff\x49\xef\xb0\x44\xfe\x34\x27\xe5\xe1\x30\x8e\x0b\x97\x89\xae\
-\x41\x69\xc1\x97\x96\x97\xf9\xd2\x01\x1c\x74\x0e\xcd\xdd\xe3\x80\
-\xd5\x71\x93\x65\xa8\x9c\x08\x40\x5c\xd3\x72\xc0\xe2\x2a\xf3\xb4\
-\xa8\x9f\x65\xbc\x24\x1b\xf9\xa4\xbf\x86\xbd\xfe\x22\xd6\x46\x87\
-\xb3\x02\x0e\x59\x2a\x4f\x4c\x10\xc4\xfc\x35\x47\x05\xfb\x1c\x99\
-\x23\x90\x22\x17\x4e\x24\x99\x26\x3b\x3f\x0f\x58\x89\x78\x26\x1a\
-\x30\x97\xb9\x7e\x49\xad\x3c\x94\xf4\xbe\xae\xfb\x45\x18\x21\x31\
-\xf5\xec\xfb\xa9\xa4\x08\xd1\x68\xbb\x51\x10\xd2\xf7\x98\xc1\x42\
-\x99\x21\x58\x40\xbf\xaa\x15\x98\xa3\x7f\x8d\x07\x70\xbd\xed\x1c\
-\xcc\x3d\x9e\xb8\xf4\x49\xa3\x4b\x17\x6a\x94\x94\xe0\xae\x06\xcf\
-\x65\x15\x8a\x4e\x44\x95\x32\xc0\x79\x2d\x9d\x9a\xc5\x02\xce\x7e\
-\xe1\xfb\xbb\x3c\x4b\x07\x50\x9d\xf1\x62\x07\xd0\xea\x05\x6f\x81\
-\xc8\x71\x1d\x82\xf5\xd2\x64\x19\x6a\xf7\x02\x80\xb7\xe9\x3f\x28\
-\x38\x0f\x06\xe3\xea\xf4\x02\x5a\xbf\x06\x47\x96\x05\xc0\x6a\x7b\
-\x9b\xee\x25\x71\xb9\xcd\x47\x04\x9b\x00\xa4\xcc\x8a\x23\x9a\xcb\
-\x81\x51\x4b\x81\x89\xd4\xe8\x3f\x06\x2a\x3e\x92\x27\x13\x25\x67\
-\x06\x71\x96\xe1\xc7\x62\xaa\xbf\x55\xe4\x37\xa1\x8f\x58\x19\x79\
-\x8c\x89\xcc\x63\x8f\x67\xce\xc3\x41\x5a\xeb\xa7\x4c\x40\xca\x9a\
-\xaf\x28\x05\x03\xc8\xd9\x84\xe2\x29\x17\xaf\x5c\xc0\xb5\xbd\x2b\
-\x20\xe7\x8a\x0a\xf0\x33\xbd\x5b\x44\xc8\x6c\x61\xa7\x26\xee\x60\
-\xc3\x56\x8b\xaf\xf3\xf5\xe5\x25\xbe\x74\x00\xd7\x3b\xed\x6c\xfd\
-\x0f\x07\xac\x34\x6d\x66\xd0\x25\xe2\x99\x5b\xf4\xc0\x94\xee\x1b\
-\x20\xc7\xa4\x6d\x3b\x50\xe9\x53\x4f\xc3\x35\xec\x75\x17\xb1\xde\
-\x2a\x35\x38\x81\x87\x24\xd6\xea\x23\x1e\xb4\xf9\x88\x5d\x76\x06\
-\xc5\xf4\x09\x33\x75\x40\x45\x46\xc2\x80\x09\x58\x66\xf9\xb9\xd0\
-\x73\xa1\xc6\xa7\xbc\x86\x92\x15\x44\x29\x8a\x3d\x75\x8d\x9f\x75\
-\x00\x62\x05\x12\x5a\x24\x8f\x83\xb4\xbf\x90\x87\x32\xdf\xbf\x1a\
-\x02\x12\xfb\xba\x06\x00\x21\x40\x1f\x02\x9e\xb8\xf4\x29\x5b\xae\
-\x42\x45\x42\x8c\x17\x8c\x5c\x27\x4a\x40\x92\x4c\x4c\x2a\xe9\x5e\
-\x9d\x81\x73\x04\x4f\x74\xd0\x02\xd1\xf1\xf2\x12\x5f\x3a\x80\xeb\
-\x1d\x99\xbf\x6a\x08\x8d\x73\x39\x9d\x76\x42\xb9\x8f\x44\x22\x95\
-\x23\xa8\x34\x02\xcc\x78\xa3\x68\xc9\x40\x86\x01\x68\x0b\x4f\x70\
-\x75\x7a\x01\x8d\x1b\xa3\x71\xe3\x7c\x85\x13\x58\xfb\xfc\x52\x88\
-\x3e\x39\xf2\xd7\x52\xe3\x99\x65\x54\x51\x8e\x2d\x4f\xce\xba\x7b\
-\x98\x19\x0b\xae\xc5\x3f\x45\x23\x76\x6e\xe5\x21\xd5\xe4\x3c\x1c\
-\xfd\xad\x28\xc0\xc2\xa5\xbe\x2f\x9c\xff\x12\xf9\xb3\xd1\xc7\x61\
-\x9f\x3f\xc6\x08\x30\x55\x3c\x00\x73\x08\x8c\x4a\x1b\x10\x78\xf2\
-\xd2\x63\xd8\x9f\xec\x29\xdf\xa1\xde\x18\x84\x61\x7b\x35\x0b\x03\
-\xb8\xe4\x04\x45\xa5\xd5\xed\xc5\x71\x04\xc0\x13\x1a\xf2\x07\x39\
-\x00\xbf\xbc\xc4\x97\x0e\xe0\x7a\xa7\x5b\x98\x65\x3a\xca\x92\x9a\
-\x92\x81\x3f\x13\xe9\xc8\x95\x39\xa3\x6a\xd2\xa5\x8a\x55\x55\x00\
-\x55\x0a\xc8\xba\x04\x84\x2e\x74\xb8\x32\x79\x12\x1b\xe3\xe3\x5a\
-\xed\x9a\xc3\x70\x96\x5b\xe4\x6a\x3f\x65\x02\x94\xdb\x0c\x07\x4c\
-\x1c\x16\x83\x91\x4a\x37\x2f\xcb\x7c\xa1\x9e\xe9\x1f\xce\xee\xd7\
-\x51\x9e\xb9\xfe\x1c\x05\x40\x34\x63\x4f\x82\x21\x91\xb5\x04\xa8\
-\xd9\x7e\xb1\xe6\xf4\x5b\xbb\x2f\x19\x39\xc7\x19\x2e\x40\x4c\xbc\
-\x7f\x87\x6b\x7b\x57\x70\xf1\xca\x85\x4c\xa9\x1e\x60\x9b\x3c\xdf\
-\xff\x97\x2a\x1b\x4a\xc0\x1f\x39\x80\xbc\x66\x01\xe4\x80\x66\xf1\
-\xca\xa0\xa5\x03\x58\x3a\x80\x67\x3c\x93\xc5\xa5\xa6\x39\x00\x13\
-\xc1\xa4\x4c\x4d\x27\xcb\x02\x0c\x0c\xb4\x2b\x8c\x44\xb2\x5a\x8f\
-\xda\xae\xd8\x94\x9a\xb1\xf9\x04\xd8\xeb\xae\x81\xd0\x62\xad\xdd\
-\x52\xa9\xb0\xe4\x58\x2c\xea\xa7\x52\xdf\x55\x79\x6f\xca\x06\x16\
-\xf5\xc4\xd2\xdc\x7d\xc2\x01\xd2\xbe\x3d\x19\x48\x79\x15\xf5\xde\
-\x9c\x01\xc8\x0c\x9d\x77\x46\xfc\x23\x56\x84\x9d\x3c\x13\x10\x39\
-\x0b\x7e\xc4\x3c\xe4\x33\xe3\x00\xac\x03\x90\xd9\x81\x39\x0b\x30\
-\xb2\x12\x13\xfa\x7e\x8a\x0b\x97\x1e\x03\xb3\xaa\x25\xcb\x5c\xd8\
-\xb6\x4e\x40\xdd\x2a\x45\xd5\xfb\x77\x94\x3f\x92\x29\xa8\xbb\xc6\
-\x69\x09\x30\x7f\x78\x91\x83\x5f\x9e\xa5\x03\xa8\xcf\xa5\x45\x77\
-\xda\x36\x3f\xc4\x04\xec\xa5\xd5\x1a\x02\x65\xf4\xd9\x85\xea\x20\
-\x08\xc8\xac\xd4\xdc\xd2\x2b\xfb\xfa\x9c\x0a\x62\x58\x8a\xbf\xdb\
-\x5d\x02\xc1\x61\xd4\xac\x69\xff\xbe\x4a\x7b\x89\x2c\x1f\xa8\x40\
-\xbf\x39\x00\x50\x64\xa6\x55\x5e\x49\x65\x25\x1c\x02\x15\x17\xbf\
-\x96\xfa\x4e\xbd\x7b\x6b\x17\x46\xc6\x40\xf1\x47\x81\xbe\x94\x0d\
-\x90\x65\x07\xd1\xba\x02\x95\x91\x33\xcf\x20\xfd\x05\x1c\x2c\xdd\
-\x80\x22\x14\x92\x34\x06\x63\x60\x5c\xb8\xfc\x38\xa6\xdd\xb4\x1a\
-\xa8\xa2\x2c\x02\xca\x40\x69\x6d\xce\x30\x2b\xc9\xa2\x7f\x92\x56\
-\x70\x0e\x40\x43\x70\x0e\x70\x0d\x0e\xda\x76\x29\x00\xfa\xe5\x25\
-\xbe\x74\x00\xd7\x3b\x4f\x2d\x74\x00\x26\xae\x21\x24\x88\x42\x66\
-\xdc\x52\xf6\x72\x1a\xca\x2f\xc6\x07\x10\x33\x7a\x9b\x0f\xd2\xb9\
-\x7f\x22\x80\xa3\x19\xb4\xf2\xff\xa2\x30\xae\x4d\x2f\x60\x5d\x8e\
-\xa2\x6d\x46\x39\xcf\xd7\x4d\xc0\x1a\x15\x5d\x9d\xff\x22\xfd\xbd\
-\x34\xf3\x3e\x0f\x02\xa2\xa8\x67\x0f\x16\x76\xa0\xd6\xe7\x9b\x11\
-\xf2\x48\xfd\xfd\xe2\x00\x2a\xde\x3f\x43\x17\x85\xb2\x11\x84\x22\
-\x57\x13\x80\xa9\x2d\x88\x32\xfb\x1f\x05\x1c\xa3\xfe\xfd\x68\x20\
-\xa1\x65\x09\x48\x6a\xc0\x41\x70\xf1\xda\xd3\x3a\xf3\x0f\x2a\xcb\
-\x43\x6a\xe5\xdf\xba\x14\x48\x38\x89\x33\x3d\xc0\x8a\xf9\x47\x5e\
-\xeb\x7e\x35\x7e\x82\x6b\x48\x65\xc1\x16\x67\x00\x4b\x12\xd0\xd2\
-\x01\x5c\xf7\x3c\x06\x5d\x4e\x93\x6b\x45\x16\x41\x1f\x75\x60\x47\
-\xc0\xd5\x46\x1f\x6b\xed\x59\x09\x50\x04\x79\x35\xda\x07\x18\xb1\
-\x27\xaa\x58\x85\x6e\x00\xb2\x34\x9f\x38\x75\x07\x11\x24\xe2\xda\
-\xf4\x02\xd6\x70\x18\x0d\x35\x65\xf3\x0f\x95\xf2\x63\xbe\xfd\x97\
-\xb6\x09\xc9\x40\x9c\xa4\x16\x17\x96\x0a\x07\xc8\xab\xbf\xb9\xfc\
-\x4c\x69\xe9\x95\x8c\x00\x15\x0e\xc0\x33\x38\x40\x8c\xb1\x32\xfa\
-\x8a\x28\x14\x6b\xa9\x6f\x19\x52\x7d\xa3\x54\x2d\x41\xe4\xdd\x81\
-\x57\x77\x2f\xe3\xda\xfe\xe5\xac\x60\x44\x59\xe9\xbb\xec\x18\x40\
-\x95\xea\x3b\x4a\x12\x60\x39\x3d\xd2\xf6\x5f\x95\xfe\x93\x27\x50\
-\x43\xf0\x8d\x53\x07\x30\xcf\xf8\x0f\x00\xae\x2e\x2f\xf1\xa5\x03\
-\xb8\xde\xf9\x38\x80\x7d\xd4\x8a\x40\x0c\xec\xf7\x3d\x88\xa4\xa2\
-\xfb\xea\x05\x69\x8d\xbb\xc2\x55\x33\xe3\x72\x42\x83\x8d\x3e\x54\
-\x45\x33\x47\xe5\x7b\x79\xc4\x17\x3d\x76\xa7\x4f\x63\xdc\x6c\xa1\
-\x71\x4d\xa9\xec\xa9\x74\x22\x06\x9f\x63\x66\x2c\x36\x77\x04\x08\
-\xcc\xf6\x9c\xa4\xb4\x04\x53\x54\xcd\x2d\x3e\x54\x2a\x3d\x52\xa5\
-\xeb\x52\xb7\xff\x6a\xea\x2f\x0f\x48\x3d\x31\x49\x85\x73\x2a\x13\
-\x92\xc1\x57\x5f\x47\x99\x11\xfe\x50\x07\x71\x6d\xef\x0a\xae\xed\
-\x5f\x35\x04\x4f\x6c\xb7\x60\x06\x58\x06\x53\x8d\x03\xbc\x23\x0d\
-\x5f\xa5\xd4\x3f\x01\x7f\x55\xe4\x77\x9e\x40\x5e\x81\xd7\x85\x95\
-\x1c\x70\x65\x79\x89\x2f\x1d\xc0\x33\x95\x00\x9f\x82\xaa\xc7\xe8\
-\xf5\x17\x81\x6b\xd3\xce\x32\x00\xf3\x08\xc6\xda\x49\x12\x9f\xaa\
-\x47\x21\x96\xce\x22\x47\x35\x05\x03\x39\x73\xfe\xf5\x2a\x4c\x03\
-\x44\x2a\x62\x91\x14\x7e\x62\xe8\xd1\x85\x4b\x58\x6b\x37\x6c\x29\
-\x06\x66\x7a\xff\xa5\x14\x20\x59\x44\x04\x42\x5e\x03\xce\x55\xd1\
-\xcb\xb3\xab\xbc\xeb\x65\x9e\x9c\x30\x83\x42\x08\x2a\xeb\xbf\x93\
-\x08\x08\xe7\x3a\x3e\xf3\xfc\xa5\x90\x82\x24\x31\x0d\xa3\x82\x83\
-\x99\xe7\x5f\x2f\x02\x89\xda\x15\xb8\xba\x7f\x0d\xfb\xfb\xbb\xb9\
-\x35\x38\x98\xf4\xab\x96\xff\xe4\xc1\x1f\x42\x69\x05\x58\xbd\x4f\
-\x44\x15\xf2\xaf\x51\x9f\xbc\x1a\xbf\x6b\x09\xd4\x02\xd2\x2d\x74\
-\x00\x57\x01\xec\x2d\x2f\xf1\xa5\x03\xb8\xde\x99\x02\xf8\x40\x76\
-\x00\x66\xef\xbb\xd3\xde\xf8\xe6\x1a\xd5\x5c\xc6\xac\x29\x93\x6d\
-\xca\x58\xbf\x54\x1d\x02\x18\x6d\x17\x70\x6c\x13\x7c\x56\x42\xa4\
-\xb6\x5f\x20\x03\x08\x89\x00\x04\xec\xf6\x57\xd0\xf2\x2a\x5a\x37\
-\xce\xd9\xae\x14\x64\x60\xa6\x14\x20\x33\x18\xa9\x1c\x00\xaa\xae\
-\x40\x31\x2a\x36\xb0\x2f\x19\x5a\x94\x32\xd8\x53\xaf\xef\x2e\xd2\
-\x5e\x82\xc0\x3c\x90\xe2\x8e\x32\x2b\x0f\xce\x03\x0a\x70\xea\x2a\
-\xe4\x11\xe3\xa8\x68\x5d\x0c\x01\xbb\xfb\xd7\x30\x99\x4e\x4b\x2a\
-\x9f\x22\x7e\x65\xfc\xa9\xb6\xe7\xa4\x03\x48\x73\xa9\x90\xbe\x1e\
-\xc9\xf8\x7d\x69\x01\xc2\xc3\x32\x00\xa8\x6c\x3b\x2d\x2c\xef\xa6\
-\xcb\x4b\x7c\xe9\x00\x9e\xe9\xfc\x0a\x74\xab\x6c\x3e\x93\x3e\x20\
-\x24\xd6\x1e\x11\x84\x81\x60\x5a\x3e\x26\xda\xad\xe9\x3e\x4b\xa2\
-\xa7\x1b\x16\x90\x66\xf7\x8d\x2f\x90\x75\xc4\x24\xab\xd9\x48\x5a\
-\xf0\x61\xad\x43\x8e\x8c\x10\x77\x11\x7c\x40\xeb\x47\x46\x19\x26\
-\x03\x17\x13\xb3\x70\xa8\x07\x54\xeb\x0f\x4a\x95\x1d\xe4\xc5\x9c\
-\xa8\x96\x85\x00\x95\x5a\x6f\xcc\xad\xc1\xb4\x9b\x2f\xb2\x64\xba\
-\x70\x29\x13\xea\xad\xbf\x45\x12\x4c\xeb\x7d\x41\x88\xb3\x00\x63\
-\x99\x03\xe8\xbb\x0e\xfb\xd3\x3d\xf4\x7d\x28\xaa\xc5\x5c\x13\x95\
-\x30\xb3\xfa\xab\x2a\x6d\x92\xe6\x1f\x95\x79\xff\x04\xf8\xa5\x0c\
-\xc0\x79\x82\xf3\x80\xb7\x32\x80\x1b\x60\x7f\x31\xd8\xff\xc4\xb2\
-\x0b\xb0\x74\x00\xcf\xe6\xfc\x8f\xc1\x57\x0e\xb8\x36\x9d\x22\xb0\
-\xe4\x01\x14\x65\xf7\x52\xbe\xd8\x29\xe7\x02\xc8\xe3\xba\x94\x2f\
-\x66\xed\x79\xc3\x19\x2b\x30\x31\xd8\xc8\x0d\x52\x75\xbd\xd6\x39\
-\x5f\xf0\x1d\x4f\x10\x62\x40\xeb\xc7\xf0\x4e\x87\x91\x52\xf4\xcf\
-\xd3\xaf\x69\x1c\x8e\x31\xc0\x05\x58\x6a\x04\x9d\xcb\xce\xe0\x84\
-\xa8\xf3\x90\x23\x90\x97\x78\xd4\x82\x9f\xb1\x1e\x22\x1a\xe2\x03\
-\x32\x43\x22\xca\x6d\xbe\x8a\xf4\x13\x23\x63\xda\x4d\xd1\x75\x53\
-\x84\xc8\x83\xfd\x9e\x75\xa7\x02\x15\x4e\xc1\x5c\x46\xac\x85\x52\
-\x1e\x65\x8e\xc0\xc0\x3e\xa9\xa8\xbf\xce\x69\xda\x5f\xdf\xa2\x17\
-\x5c\x73\xfd\x22\x26\xe0\xa7\x96\x97\xf6\xd2\x01\x3c\x9b\xf3\x4b\
-\x00\x2e\x22\x8d\x06\x3b\xe0\xf1\xcb\xd7\x30\x8d\x11\x63\x6a\xd4\
-\x48\x2d\xad\x87\x21\xf1\x94\x04\x2a\x01\x38\xa8\xa8\xe7\x40\xb5\
-\x57\x04\x14\x53\x6f\x3b\x11\x89\x4a\x27\x20\x35\xb7\x29\x81\x0a\
-\x46\x07\x96\x18\xc1\xbc\x87\xc6\x35\x68\x5c\x0b\xef\xdc\xcc\x4e\
-\x82\x4a\x10\x64\x06\x11\xa8\x79\x00\xc9\x23\xf0\xcc\x3a\x6f\x08\
-\x06\x43\x41\x32\x58\xfe\x89\xbc\x06\xac\x56\x05\x96\xca\xe0\x63\
-\xb4\x75\x62\xc6\x8b\x50\x5c\x21\x22\xc4\x88\x49\x37\x41\x0c\xc1\
-\x86\xa4\x2a\x19\xd5\xba\xe4\x00\xb2\xb0\x68\x9d\xce\x48\xf5\x8f\
-\x92\xd4\xee\xab\x3e\x92\xab\xd8\x7f\x55\x26\xe0\x47\x84\x69\x1f\
-\x54\x9e\x6c\xbe\x04\xf8\xe8\xf2\xd2\x5e\x3a\x80\x67\x73\x9e\xb4\
-\x32\xe0\x8d\xe9\x8e\xbd\xae\xc3\xb4\x0f\x18\xaf\x34\x79\x84\x17\
-\xae\x8c\xf3\xe6\x76\x9b\xd8\x7c\xbf\x88\x1a\xb3\x5d\xca\x0e\xc8\
-\x8b\x3d\x07\x0b\x45\xa8\x48\x5a\x67\x80\xcf\x1e\x9f\xd3\x02\x08\
-\x42\x8c\x88\x31\xa2\xf1\x1e\x8e\xbc\x6d\x14\x40\xa5\x0e\x90\x30\
-\x84\x34\x0d\x58\x80\x48\xce\x7a\x85\x69\x4b\x10\x95\x5a\xdf\x38\
-\x02\x79\xd0\x89\x87\x9b\x7e\x66\x89\x43\x82\x4a\x2e\x7c\xb0\x7f\
-\xc0\x54\x80\x42\x8f\x2e\xf4\xe8\x7b\x25\x0c\x99\x22\x49\x9e\x8f\
-\xa8\x49\xfe\x79\xa5\x78\x3d\x43\x31\x60\x38\x97\xf1\xca\x9c\xfe\
-\x9b\xe1\xbb\x04\xfe\x35\x16\xf9\x1b\x02\xb5\x84\xa6\xf5\xd8\xed\
-\xf6\x10\x45\x16\x39\x80\x87\x97\x97\xf6\xd2\x01\x3c\x9b\x23\x00\
-\x7e\x21\x3b\x00\x52\xd6\xda\x93\xd7\xf6\x70\x78\x7d\x3d\xcf\xc7\
-\x53\x36\x62\x54\x03\x3a\x5c\xe6\xf4\x25\x91\x83\x64\x50\xa3\xa7\
-\x19\x7f\x31\x86\x5e\x32\xfa\x9a\xf7\x2f\x70\x45\xf3\xde\xa5\x56\
-\x61\x44\x17\x22\x1c\x39\x34\xe4\xe1\x9c\xcf\x59\x48\xad\x4e\xc4\
-\x82\xca\xe0\x34\xc4\x26\x87\x90\xea\x79\x54\xdb\x7d\xd3\xfc\xbe\
-\x18\x75\x98\x31\x1c\x21\xce\x44\x22\x70\xb5\x68\x44\x72\x2b\x10\
-\x02\x84\x18\x11\x62\x40\xe0\x90\xf7\x26\x64\xd5\x5e\xab\x87\x24\
-\xca\xe0\xf9\xd6\xa9\x3f\xcc\x21\x11\x55\xe8\x65\x36\x7e\x01\x79\
-\x97\xdb\x7f\x6a\xf8\xa5\xfd\x47\x0d\xc1\x35\x4a\x01\x6e\x1a\xc2\
-\x25\x59\xc8\xf5\x89\x58\xae\x08\x5f\x3a\x80\x4f\xe3\xfc\xdc\xc0\
-\x23\x04\xe0\xd1\x8b\x97\x71\xd7\xa9\x13\xe8\x9d\x19\x5c\x06\xe5\
-\x2a\xb0\xa0\x62\x9f\x48\x35\xb1\x1b\xab\xbd\xd6\x89\x3c\x94\x99\
-\x82\xd0\x5a\x36\x83\x78\x36\xf9\x23\xc6\x20\x04\x93\xae\x10\x87\
-\x39\x0e\x61\x04\x61\x80\x83\x0a\x85\xc2\x1b\x00\x59\x2f\x0d\x35\
-\x84\x3d\xad\x22\x4f\xe9\x34\xcf\x2c\x0e\x91\x4a\xda\x1b\x15\x13\
-\xd0\x5a\x89\x05\xd0\xe3\x01\x06\x10\x0c\xfc\x4b\xb5\x7e\x88\xc1\
-\xf4\x02\x31\x98\x56\x44\xb5\xc5\x17\x28\x6c\xff\x7a\xcd\x37\xcf\
-\x32\xff\xa8\x74\x4e\x34\xdd\x77\x03\xbe\x7f\x6a\xfd\xb9\x56\x1d\
-\x80\x6f\x08\x7e\xe4\xe0\x47\x04\xf6\xc0\xd5\xfd\x6e\x51\xf4\xbf\
-\x04\xe0\x37\x97\x97\xf5\xd2\x01\x3c\xdb\xf3\x2e\x00\x17\x00\x1c\
-\x4d\x17\xe5\x93\x57\x77\xd1\xb3\x6e\xf2\x65\xc7\x46\x49\x75\x39\
-\x3a\xd6\xfb\x3e\x6b\x59\x50\xaa\xe1\xed\xdc\x02\x43\x1e\xef\x55\
-\xca\xac\x98\x06\x20\x21\x12\xe0\x48\x40\x4c\x88\x39\x33\xe0\x92\
-\xe2\xd7\x08\x40\x64\xfd\x1e\x28\xcf\x0c\xd4\x4b\x4b\xea\xde\x7a\
-\xd2\xf9\x1f\xec\x0f\x48\xca\xc1\x44\x25\xc5\x4f\x86\x5f\xcd\x3f\
-\xe6\xf1\xe0\x2c\x22\x1a\x0b\x00\x68\xce\x0a\xd1\x02\x7b\x52\xf2\
-\xb5\xd7\x23\x71\x10\xca\x2a\x43\xa9\xa6\x79\x30\x74\x9a\x52\xf9\
-\x52\x54\x33\xff\xce\x5a\x7e\x8d\x7e\x74\x1e\xf0\xad\x2b\x65\x40\
-\x43\xf0\x2d\x21\x20\xe2\x29\xde\x5b\xe4\x00\x3e\x84\xa5\x14\xd8\
-\xd2\x01\x7c\x1a\xe7\x29\x73\x02\x6f\x4f\x17\xe4\x23\x4f\x5f\xc2\
-\x7e\xd7\x63\xb5\x6d\xd5\x80\x9d\x19\x50\x9a\x4d\x97\x8a\x7b\x5a\
-\xed\x08\x17\x29\x73\x02\x90\xb2\xd0\xdb\x55\xed\xad\x44\xd8\x01\
-\xca\xb2\xe0\x44\x7a\x49\xd3\x80\xa9\xb6\xa7\x34\xf7\x9e\x17\x65\
-\xa8\xd5\xc5\x4c\x4c\xa2\x21\x1c\x98\x5a\x73\xa4\xe9\x7e\x9d\x65\
-\xc7\x3c\x78\xc3\x36\x21\x58\x5a\x79\x10\xe5\xfc\x47\xcb\x38\x92\
-\x2c\x18\x57\x1a\xfd\x42\x96\xb1\x54\xdb\x50\x8a\x1a\x01\xaa\xfe\
-\x7e\x01\x22\x8b\x94\x97\xcc\x49\xfd\x49\x1e\xb8\x1e\x0a\x7e\x10\
-\x95\xbe\x7f\x6a\xf7\x65\xe0\xcf\xc8\x3f\xcd\x88\x70\xf1\xca\x14\
-\xd3\x18\x16\x0d\x03\xfd\x32\x96\x72\xe0\x07\x1e\xb7\x7c\x09\x16\
-\x9e\x9f\xac\x5f\xa1\xc9\xb4\xc7\x63\x97\xae\xa0\x69\x1a\xab\xd5\
-\x5d\x19\x43\x35\xf9\x6e\x81\x2e\xf9\x65\x68\xda\xaf\x13\x84\x82\
-\x60\x43\x30\x91\x13\xb2\x8e\xac\x86\x53\xdf\x06\xc6\x25\xf3\x11\
-\x1c\x99\xd1\x27\x83\x61\x1f\x16\xca\xe4\x99\xba\xc6\x8f\x1c\x75\
-\x90\x07\x0c\x91\x08\xdd\x55\xcc\xb6\x29\x88\x81\xf4\x95\xc4\xfc\
-\x5c\x99\xd8\x32\x81\xb2\x29\xb8\x36\xcc\xb2\xbf\x50\x32\xd6\xa1\
-\xf5\xd0\x2c\x73\x31\x0d\xf0\xc8\x70\x23\xfa\xa0\xb6\x4a\xe4\xa8\
-\x82\x15\x64\x83\x77\x65\xbe\x1f\x5e\x11\x7f\xd7\x20\x47\x7d\x6a\
-\x00\x3f\x22\xf8\xd6\xc1\xb7\x0e\x4d\xe3\xf1\x44\xb7\x3b\xaf\x20\
-\x54\x3a\x3b\xcb\xb3\x74\x00\x9f\xd6\xf9\x6f\x06\x1e\x65\x1c\xe0\
-\x63\x4f\x3e\xa5\x5b\x7b\x5c\x9a\x44\x49\x57\x2a\x6c\xb9\x87\xda\
-\x02\x27\x67\x30\xd8\xd3\xc7\x83\xb9\xfb\xac\xcc\x93\xb6\xeb\x24\
-\xc6\x9e\xdd\x87\xbc\x4f\xaf\x70\xf2\xa5\x46\xdd\x65\x7e\xba\x4f\
-\xaa\xb1\xe5\x64\xb2\x69\x6a\x50\x6c\x9a\xb1\x68\xed\x4a\xce\xd6\
-\x41\x43\xcc\x22\x7f\xdf\x22\xb5\xcb\x03\x4a\x69\x20\x47\x86\xec\
-\x63\x29\xa8\x7e\x2a\x73\x98\x0b\x55\x89\x04\x43\xeb\x97\x12\xf6\
-\x13\xaf\xbf\x46\xfc\x89\x6c\x79\xaa\xb3\x14\xdf\x5b\xd4\x6f\x9c\
-\x72\xfe\x47\xda\xf2\x73\x2d\x01\x0d\xe0\x5b\x42\x24\xc1\x85\xdd\
-\xbd\x45\x57\xf3\xd4\xb2\xb9\xe5\x59\x3a\x80\x4f\xeb\xfc\x1a\x80\
-\xf7\xe5\xaf\x3c\xf0\xe1\x27\x9e\xc4\xa4\x0b\xf0\xce\xcf\x38\x81\
-\x14\xc5\xea\xb9\x7d\xe4\xac\x40\x44\xc9\x43\x19\x80\xcb\x12\xdc\
-\x65\xaa\x4e\x6c\x5b\x6f\xbe\x21\x02\x48\x0b\x3b\x2b\x5d\xff\x01\
-\x42\x5f\xa6\xfe\x98\xaa\xda\x3f\x99\xbf\x2b\x58\x44\x59\xb2\x99\
-\xea\xf1\x12\x99\x33\x61\x89\xd4\xe8\x79\x68\xa3\x10\x47\x55\xcb\
-\x92\x8b\xc7\xc8\x53\x90\x15\x33\x89\xc4\x36\xf6\xe4\xfe\xe3\x00\
-\xb7\xd0\xdf\x59\x75\x04\x52\x96\xe0\x92\xe1\x97\xba\xbf\xae\xff\
-\x13\xe0\x47\x56\xef\xfb\xd6\x65\x47\xd0\x8c\x1d\xae\x4d\xa6\x78\
-\xb2\x5b\x58\xff\xbf\x1f\xc0\x87\x97\x97\xf3\xd2\x01\x7c\xba\xa7\
-\x07\xf0\x1f\xea\x72\xfa\xa9\xab\xbb\x78\xf4\xd2\x65\xb4\x4d\x0b\
-\x90\xab\xca\x00\x97\x23\x16\x1c\x59\x46\x5c\x80\xaf\x58\xe1\x5e\
-\xc5\x44\x6d\x31\x07\xc7\x4a\x98\xb3\xb0\xec\xa2\xa4\x32\xa2\x32\
-\xe0\x0c\x2d\xa8\x13\x80\x45\x75\x0c\xa0\x3f\x19\xc8\x83\x73\x8e\
-\xfc\x33\x01\x98\x12\x7f\x11\xb9\x76\x4f\xdb\x84\xca\xa3\xa8\x70\
-\xf7\x9d\x18\x53\xb1\x44\xf3\xdc\x0a\xcd\x54\x46\x7b\x8e\x8e\x72\
-\x4d\x9f\xb2\x86\xb2\xc5\x47\x71\x03\x75\x98\x66\xf8\x8e\x40\x4e\
-\x2a\x94\x3f\xa5\xfd\x5a\xeb\x53\x6b\xad\xbf\x96\xd0\x8c\x4a\xdf\
-\x5f\xc1\x3f\x87\xb6\xf5\xf8\xd4\xd5\xab\x26\x2a\xba\xb0\x94\x0b\
-\xcb\xcb\x79\xe9\x00\x7e\x2b\xe7\xc7\x33\x78\xa4\xb3\x3a\x78\xff\
-\x27\x1f\x85\x73\x3e\xdf\xc8\x79\x64\x72\xba\x73\xe6\x04\x5c\x5e\
-\xed\xcd\x54\x3a\x63\x85\x37\x90\xda\x5c\x32\x54\xf1\x41\x89\xe8\
-\xb5\x14\x8e\x0c\x20\x72\x54\xb5\x78\x6a\xa3\xf3\x50\x09\x18\xf5\
-\xa6\xe0\x2a\xcd\xb7\x15\x66\x4c\x54\xba\x17\x88\x10\x1a\x96\x03\
-\x9a\x92\x6b\xef\x3d\x19\xbe\x18\xd6\x20\x70\xa5\x04\x31\xea\xae\
-\x02\xa2\xc8\x6d\xcd\xbc\xa5\xc8\xfe\xbe\xab\xb0\x81\xa4\x8f\x94\
-\x27\xfa\x2c\x91\x70\x29\xd2\x7b\x07\xd7\xb8\xcc\xf1\x77\x2d\x72\
-\xba\xef\x13\xe5\x77\xe4\x72\xfb\xcf\x8d\x08\x41\x18\x9f\xb8\x7c\
-\xe5\xa0\x2b\xf9\x3f\x2c\x2f\xe3\xa5\x03\xf8\xad\x9e\x5f\x00\xf0\
-\xeb\x75\x19\xf0\xc1\x4f\x3d\x8a\x6b\x7b\x13\x34\xbe\x01\x39\x6f\
-\x59\x80\xd3\x48\x95\xae\x66\xbb\xb8\xc5\x89\xca\x55\x59\x56\x50\
-\x88\x36\x30\x84\x5d\x97\x7e\x44\xa1\x0c\x0e\xea\xf7\x29\x13\x75\
-\x32\xd8\x07\xca\xfc\xfd\x94\x05\xa4\x72\xa1\x52\x03\x04\xe7\xac\
-\xa1\xd2\xcc\x47\xee\x42\x1a\x6a\xc7\x46\x69\x66\x44\x2a\xf2\x5b\
-\xaa\xb1\x47\x65\xd3\x8e\xe3\xec\x8c\xb2\x50\x49\x6d\xd9\xb5\x84\
-\x77\x6e\xdc\x17\xa7\x45\x75\x2b\xb0\x72\x5c\x64\x91\x5f\xb5\xfc\
-\xb5\x54\xc9\x73\xfd\x29\xb2\x9b\x71\xfb\x76\x98\xf2\x6b\xe4\x07\
-\xdc\x48\xb9\x00\xa3\xb1\xc7\x85\x2b\x7b\xb8\x30\x5d\x98\xfe\x7f\
-\x7c\x59\xff\x2f\x1d\xc0\x67\x5a\x06\xfc\x50\xfd\x4a\xed\xee\x4e\
-\xf1\xa1\x47\x1f\xc3\x4a\xd3\xc2\x11\xc1\x39\x07\x67\x25\x00\x79\
-\x67\xfa\xf4\xa4\x19\x80\xd5\xce\x42\x26\x5c\x67\x35\xaf\x38\x54\
-\xc6\x54\x29\xf8\x56\xba\xfe\x09\xb4\x4b\x69\x79\x12\xf2\x54\xda\
-\x6e\x1c\xb4\xdb\x58\x4a\x5a\x5f\x1b\x01\x43\x37\x0c\x47\x82\x61\
-\x04\x86\xfe\xdb\x80\x10\x27\x6e\x3d\x95\x4e\x06\xec\x71\x42\x36\
-\x44\xc4\x69\x27\x21\xf2\xf8\xae\x54\x7f\x21\xb7\x3a\x9d\x65\x34\
-\xd6\x72\x2c\xd2\xe6\x05\x13\xd1\x50\x6f\xba\x69\x5e\x40\xce\xf8\
-\x0f\xa9\xc7\x9f\x7b\xfb\x00\xb5\xd0\x48\x6f\x46\x4f\x39\x0b\x70\
-\x4a\xfc\x19\xdb\xd7\x9e\xf0\x91\x0b\x17\x0f\xda\x22\xf2\x6f\xb1\
-\x54\x01\x5a\x3a\x80\xcf\xf0\xfc\x2b\x00\xbb\x35\x16\xf0\xee\x8f\
-\x7e\x14\xd3\x10\xe1\x7c\xa3\x0e\x80\xa8\x64\x03\xde\x32\x02\xa7\
-\xe9\x6c\x66\xb0\x11\x15\xe0\x50\xca\x7a\xab\x7a\x91\x47\xcc\x69\
-\xb5\xe4\xb9\xfc\x02\x0c\x96\x94\x9e\x93\xf0\x88\x45\x6f\x99\x11\
-\xcf\x4c\xee\x21\x35\xf4\x14\x9e\xb7\x1e\x3e\xe9\x1e\xc2\xc4\x64\
-\x2c\xdd\x0b\x4d\xf5\x39\x0d\x3b\xe5\x94\xa1\x1e\x1f\x1e\x82\x8c\
-\x79\xba\x39\x81\x7d\x92\xea\x7b\x14\xa0\x31\x2d\x4e\x24\xca\x51\
-\xdf\x35\x96\xf2\xa7\xca\xa9\x71\x85\xd3\xdf\x68\x8a\xef\x5a\x42\
-\x33\xa6\xec\x04\x52\x16\xe0\xc7\xda\x05\x70\x9e\xd0\x8e\x3d\x2e\
-\x5f\x9b\xe2\xe3\x97\x2f\x2f\x12\xfc\x16\x00\x3f\xbc\xbc\x7c\x97\
-\x0e\xe0\x33\x3d\x1f\x01\xf0\xff\xd4\x65\xc0\xa3\x4f\x5d\xc2\x43\
-\x8f\x3e\x86\x71\x3b\x52\xc3\xb7\x21\x1d\x67\x65\x00\x39\xd2\x5a\
-\xd6\x11\xe0\xb5\x9e\x85\x47\x06\xbc\x34\x43\x28\x6d\xc3\x2c\x14\
-\x20\x5c\xd6\x7a\xa5\x72\xc1\x96\x84\x46\x14\x40\x90\xeb\x19\x7f\
-\x33\x74\x01\x83\x49\xfb\xfc\xb9\x85\x67\x04\x9f\x04\x4a\x92\x4b\
-\x20\x9c\x19\x7e\xee\xcf\x4b\xfe\xbb\xaa\xd6\xe3\x8a\x80\xa7\x95\
-\x2b\x6c\x8f\x23\x4b\x03\x98\x4b\x2d\x9f\x79\x09\xae\xca\x28\xa4\
-\x74\x46\xb2\x2f\xc9\xda\xfd\x32\x34\xfc\x96\xe0\x5a\x67\xa9\xbf\
-\xd6\xfc\xcd\xa8\xb4\xfb\x72\xc4\x4f\x59\xc0\x48\x1d\x43\xdb\x7a\
-\x3c\xf4\xf8\xd3\xe8\x38\x2e\x7a\xdf\x7e\x19\xc0\xcf\x2c\x2f\xdf\
-\xa5\x03\xf8\x6c\x9c\x1f\x98\x8d\x2d\xef\x7a\xe8\x37\xc1\x51\xe0\
-\x5d\x03\x47\xce\xa2\x7d\xa3\xce\xc0\x7b\xbd\xdf\x2b\x50\xa8\x4e\
-\xc0\xa9\x41\x78\x2d\x19\x32\xe7\x9d\x8c\x52\x9c\x0c\xa5\x8e\xde\
-\x09\xc5\x47\x71\x10\x52\x3d\x82\x51\xda\x89\xe5\x9e\xe2\x54\xc4\
-\x6a\x6d\xb1\x1b\x27\x00\x90\xd8\x74\xcb\xed\xa7\x58\x57\x93\xd5\
-\x11\x9f\x79\x06\xe1\xcf\x53\x7b\xa4\x8a\x46\x2e\x29\x11\x19\xb0\
-\x39\xe8\x8a\x9a\x5a\x6f\x6a\xe5\x11\x32\x85\x57\x53\x7f\xab\xe3\
-\x2d\xcd\x77\xad\x39\x82\x31\xc1\x8d\x1d\x9a\x31\xc1\x8f\x8d\xe0\
-\x33\xb2\x94\xbf\xca\x04\x5c\xe3\xd0\x8c\x1d\xae\xee\x4e\xf1\x9b\
-\x17\x9e\x3e\x68\xdd\xc7\x3f\x5b\xa2\xff\x4b\x07\xf0\xd9\x3a\xff\
-\x09\xc0\xcf\xe6\xaf\x1a\xe0\x63\x4f\x5c\xc0\x87\x3e\xf5\x29\xac\
-\xb4\x23\x1d\xd1\x75\x1e\xce\x39\x35\xfc\xc6\x1b\x8a\xed\xe1\xbd\
-\xb3\x6e\x01\x15\xa0\x30\xb7\xbe\x34\x82\x72\xae\xc1\x35\x47\xae\
-\x75\xfd\x51\x39\x02\x26\x03\xff\x50\x00\xc5\x12\xc9\xad\xdb\xee\
-\xd8\x1c\x8b\xda\x73\xb4\x9f\xe1\xa4\xb0\xe3\xea\x12\xa3\xcc\xe2\
-\x27\x4c\x8f\xa5\xec\xec\x1b\x18\x3f\x53\xe6\x1d\x94\x94\xdf\x06\
-\x16\xad\xf9\x31\xb3\xae\xd0\x3a\x0a\x56\xef\x7b\xad\xff\x7d\x03\
-\xf8\x16\x19\xcd\x77\x23\xa7\xc0\xde\x48\x53\xfe\x66\x9c\x22\xbe\
-\x1a\xb9\x1b\x3b\x34\x2b\xfa\xb9\xb7\xac\xc0\x35\x84\xb6\x71\xf8\
-\xd0\x23\x17\xb0\x1f\x16\x8a\xfc\x3c\x36\xc0\x6e\x96\xe7\xba\x67\
-\x39\x0b\xf0\xcc\x27\x02\xf8\x5b\x00\x5e\x53\xe3\x5f\x3f\xfd\xc1\
-\x0f\xe0\x8e\x53\x67\xd0\xf8\x06\x12\x83\xa2\xd9\x76\xcd\x2b\xb2\
-\xce\xa5\x66\x26\x6f\x51\x9e\xc1\x70\xba\x2b\x40\x24\x7f\x44\x05\
-\xa2\x27\x52\xcd\xb0\xc7\x6f\x2a\x84\x44\xa5\xad\x96\x95\x48\xa4\
-\x72\x04\x34\x68\xfd\x15\xe2\x2e\x55\x8c\x3d\xca\xc8\x7e\xaa\xe8\
-\xb9\x16\xe9\xac\x48\x3c\x69\xbd\x79\x52\x1a\xd3\xa5\xc6\x9c\x07\
-\x7c\x54\xb8\xa4\xe0\x05\xf0\xc8\xcb\x4f\xe0\x44\x37\x27\x79\x15\
-\x01\x75\x28\x99\x81\x18\x85\x3a\x6f\xf4\xc9\x02\x9f\xfa\x37\xfc\
-\xc8\x69\xd6\x90\xb2\x83\x06\x06\x12\x02\xed\xd8\xe1\xd2\xe5\x09\
-\x3e\xf8\xc4\x53\x07\x45\xff\x7f\x0a\xd5\x75\x58\x9e\xa5\x03\xf8\
-\xac\x9d\x7f\x03\xe5\x94\x3f\x98\x5e\xb5\x4f\x3c\xf9\x34\x7e\xf9\
-\xa3\x1f\xc1\xab\xef\xb8\xd3\x46\x7c\xc9\xd8\xf6\x86\x80\x4b\x84\
-\x34\xb6\x2f\x30\x26\x19\x2e\x82\x73\x0c\x0e\x02\x62\x2e\xba\x1f\
-\x28\x11\x35\x6d\x1b\x2c\x46\x27\x95\x12\x90\x0c\x09\x36\xd0\x4c\
-\x42\xb2\x33\x30\xe9\xac\x4c\xe4\xb1\x88\x4e\xa6\x17\x28\x94\x01\
-\x3a\xe1\x6a\x2e\x81\x4c\xc9\xd7\x26\x97\xa4\xea\x24\x24\xf9\x53\
-\x47\xd6\x7b\x48\xdb\x78\xb8\xd0\x9e\x25\xa9\x98\xb0\x0d\x34\x25\
-\x62\x60\x5a\x62\x92\x08\x42\x89\x30\x45\x02\x78\xb2\xcc\x28\x95\
-\x08\x94\xc5\x3d\x5d\xa2\xfd\x5a\xcb\x2f\x2b\x00\x37\x80\x77\x0e\
-\xef\x7d\xf8\x71\x1d\xfc\x99\x77\x00\x17\x01\xfc\xfd\xe5\xe5\xba\
-\x74\x00\x9f\xed\xd3\x01\xf8\x6e\x28\x39\x28\x17\x4f\xff\xed\x03\
-\xef\xc3\x8b\xce\xdc\x80\xf5\xb5\x15\x74\x21\xe4\x8d\xbe\x02\x06\
-\x79\x75\x08\xd4\x68\xdd\xad\x99\x01\x5b\x04\xd6\xfd\x23\x4c\xda\
-\xe2\x83\x68\xb4\xcc\xb4\xd9\x34\x0d\x34\xc3\xbf\xaf\xf3\x81\x84\
-\xac\x73\x35\xa8\x43\xc6\x05\x48\x89\x3d\x89\x1a\x20\x09\x65\x91\
-\x91\x24\xc5\x95\xcb\x0c\x7b\x0e\x49\xaa\x5f\x4c\x9a\x37\xa9\x71\
-\x2b\x79\xc8\xf0\x04\x33\x6a\xce\x82\x86\xc6\xe0\x43\x11\x25\x49\
-\x99\x50\x12\x28\xd4\xad\xbd\xae\x2c\xf5\xf0\x09\x0c\x2d\x72\x5e\
-\x69\xf0\x27\x6b\xfc\x37\x00\x35\xce\x66\x01\xa0\xce\xa2\x11\x8c\
-\xc6\x1e\x8f\x3c\x72\x15\x0f\x3d\x79\x60\xed\xff\xfd\x58\xaa\xff\
-\x2c\x1d\xc0\x73\x74\xfe\x1d\x80\x1f\x03\xf0\x95\xc9\x01\x5c\xb9\
-\xba\x8f\xff\xfc\xeb\xef\xc5\x3b\x5f\xf5\x1a\x6b\xe1\x25\xfa\x6c\
-\x54\x47\x40\x04\x8a\xb1\x28\x07\xc3\x81\x63\x54\xdb\x70\x0c\x17\
-\x01\x61\xaf\x92\xdd\x35\x39\x97\xca\x5e\xc1\x54\x4f\xa7\x55\xd8\
-\xc9\x21\xa4\x5a\x9c\xa8\xa6\xe5\x52\x11\x0c\xcd\xb5\x38\xe5\xf5\
-\x60\x62\x9b\x89\xf2\x28\x71\xf6\x01\x94\xb3\x80\x44\xd4\x71\xac\
-\x86\x2f\x24\x10\xab\x3b\x5c\xa4\x22\xb9\x45\xa2\x46\x98\x76\x0f\
-\xa4\x2e\x07\x08\x5e\xca\x36\x5f\xdd\x98\x8a\x82\x7f\x58\x19\x40\
-\x94\xa2\xbe\x0d\xfc\x98\xe2\x4f\xd6\xf8\x6f\xec\xf7\xa5\x51\xe0\
-\x91\x43\xe8\x18\xff\xe3\xc3\x8f\x58\x97\x63\xee\x7c\x02\xc0\xdf\
-\x5c\x5e\xa6\x4b\x07\xf0\x5c\x9e\xbf\x08\xe0\x4d\x00\xd6\xd2\xab\
-\xf7\xee\x8f\x7c\x04\x77\x9f\xb9\x11\xf7\x9c\xbb\x11\xfb\xdd\xd4\
-\xa2\x2c\xc1\xe9\x1a\x10\xdd\xd8\x43\x6c\x86\x6f\x99\x00\x11\x28\
-\x3a\x1d\xc2\x25\x01\x9c\xcb\xa2\x1c\x6a\x84\x54\xcd\xd8\xcb\x70\
-\x9c\xd6\x52\x69\x19\xa0\x6d\xc8\x52\xe4\x09\xa9\x93\x6a\xa6\x38\
-\x6f\x29\x4e\x33\xfc\x79\xc9\x66\x91\xde\xe6\xbc\x62\xc8\x30\x08\
-\x57\x64\xbd\x9c\xed\xfd\x13\x08\xc8\x97\x59\xa0\x44\x23\xa4\x0a\
-\x01\x74\x96\x4a\x90\x19\x77\x76\x0e\xbe\xf4\xfe\x41\x16\xf9\xb3\
-\xc2\x2f\x8c\x48\x55\xa4\xbe\x6a\xd1\x4f\x78\x60\xd4\x78\xfc\xfc\
-\xfb\x1e\xc5\x93\xbb\x7b\x07\x5d\xb5\xdf\xb3\xac\xfd\x97\x0e\xe0\
-\xb9\x3e\xef\x01\xf0\x57\x00\x7c\x6f\xb2\x3d\x61\xc1\x8f\xff\xea\
-\x2f\xe2\xc6\x23\xc7\xb0\xb9\xbe\x8a\x3e\xf4\xd9\xc8\x38\x0d\xbf\
-\x70\x84\x73\x04\x71\x0c\xa6\xa8\x64\x1c\x27\xfa\x51\x18\x1c\x59\
-\x4b\x80\x24\xa4\x59\xa4\x31\x2c\x23\x28\x25\x40\xd9\x8b\x67\xa9\
-\x7d\xb5\x3a\xb7\xa6\xe0\x12\xe9\xaa\x30\x48\x01\x08\x99\x93\x78\
-\x69\xde\x64\x9a\x87\x7d\x1c\x5b\xcb\xb0\x92\x38\x07\x18\x14\xed\
-\xef\x7b\x94\xa1\x3f\x5b\x94\xa2\x51\x9d\x6d\xc3\x91\x45\x7d\x16\
-\xc0\x3b\xd3\xf2\x93\xbc\xc5\x37\x47\x7d\x53\x35\x29\x4c\x40\xca\
-\x32\xdf\xe4\xab\x8d\x3f\xa6\x05\x00\x02\xda\x91\xc7\x23\x9f\xbc\
-\x8c\x5f\xf9\xc4\x63\x07\xa5\xfe\x3f\x63\xe0\xdf\xf2\x2c\x1d\xc0\
-\x73\x7e\xfe\x06\x80\x2f\x03\xf0\x25\x09\xf9\xbe\x70\xe9\x1a\x7e\
-\xec\x57\xfe\x07\xbe\xf1\xb5\x6f\x04\x3c\x10\x38\x28\x62\xef\x74\
-\x81\x86\x23\x35\x7e\x65\xdb\xe9\x02\x10\x76\x51\x23\x39\x1b\x38\
-\x66\x9a\x7b\x90\x44\xf4\x1d\xce\xf0\x71\x25\x9a\x31\x28\x0b\xa4\
-\x90\xef\xc9\xe4\xc4\x52\x0d\xe0\x1a\x67\x0a\xbd\x66\x84\xde\x32\
-\x85\x2c\xd2\x63\xd9\x01\x95\x81\xe1\x12\xd9\x15\xec\x63\x54\x52\
-\x66\x9c\x3e\x0a\x9c\x38\xcd\x2a\x84\x72\xea\xaf\x13\x7e\x7a\x49\
-\x89\x2b\x5a\x7e\xaa\xa2\x44\x99\x27\x90\xa3\xbf\x1b\x46\xff\xb2\
-\xf7\xaf\xea\x10\xb4\x0e\x93\x6b\x01\x3f\xf5\xbe\x87\x15\x62\x9d\
-\xe7\xfc\xef\x01\xf8\x63\x58\xf6\xfd\x97\x0e\xe0\x73\x08\x08\xfe\
-\x11\x28\x37\x60\x2b\xbd\x8a\xbf\xfa\xd1\x8f\xe1\xa6\x9d\x5f\xc3\
-\x9b\xef\x7d\x00\x7b\x01\xb6\x33\x80\xc1\x88\x5a\xbb\x8b\x39\x00\
-\xe7\x20\x2e\x82\xa3\xea\x0b\x66\xc1\x0f\x13\xd9\x14\x08\x9c\x51\
-\x80\xd3\xd6\x5c\x10\xc1\x27\x24\xdf\x51\x19\x37\x4e\xac\xbb\x24\
-\x4d\x96\x24\x3f\xcc\x09\x28\xcf\xc8\x15\x05\xae\x4a\x90\xdf\x55\
-\x60\x20\x31\x99\x10\x29\x59\x1b\xcf\xf0\x02\xe7\xe0\x41\xb9\x63\
-\xc1\x42\x90\x98\x22\xbe\xc0\x1b\xe6\x41\x1e\x79\xc4\x18\xa9\xdd\
-\x97\x77\x1f\xd6\x3b\xfd\x54\xfb\x30\x0d\x49\xb9\x0a\x0f\xa0\x04\
-\x0e\xda\x06\xa0\x54\x46\x38\x21\xfc\xd4\x7b\x1f\xc6\x53\x7b\xfb\
-\x07\x5d\xad\xff\x2b\x80\x77\x2f\x2f\xcb\xa5\x03\xf8\x5c\x9e\xf7\
-\x01\xf8\x43\x00\xfe\x39\x52\xe7\xce\x01\x3f\xfe\x9e\x5f\xc2\xa9\
-\xc3\x3b\xb8\xef\xc6\xf3\xd8\xef\xa6\x8a\x05\x78\xca\x48\xbb\xa6\
-\xff\x6c\x54\xe0\xa4\xae\x1b\xd5\xf0\x9d\x83\xf7\xac\xeb\xb7\xe0\
-\x8c\xff\xcf\x85\x79\x6f\xd1\x3e\xcd\xd2\x67\x4d\x8e\x5a\x23\x90\
-\x93\x01\x4a\xae\xcb\x1b\x14\xa9\xb0\x3c\x33\x90\x15\x44\x34\xf3\
-\xa0\xa8\xc6\x9e\x74\x0e\xd3\x86\xe1\x2c\x5d\x2e\x1e\x51\x04\x9e\
-\x05\xce\x90\xbf\x84\x43\xa4\xce\x45\x02\xed\x64\xa0\x02\x66\xe0\
-\x61\x12\x4e\x31\x27\x43\x86\x7b\x50\x12\xfd\xc8\xd8\x00\xca\x06\
-\x20\x47\x68\xbd\xc3\xbb\xde\xf3\x49\x7c\xe8\xb1\x0b\x40\xbb\xf0\
-\x7d\xf8\xaf\x00\xbe\x6f\x79\x39\x2e\x1d\xc0\xe7\xe3\xfc\x10\x80\
-\x17\x01\xf8\xf3\xa9\x2b\x10\x22\xe3\x9f\xbf\xeb\xa7\x70\x68\x65\
-\x1d\xe7\x4f\x9c\xc0\xa4\x9b\x02\xf0\x20\x8a\x10\x31\x9d\x00\x8e\
-\x60\x72\x8a\x07\x30\x43\xd8\xc1\xfb\xa8\x06\x17\x93\x5e\x5f\xa5\
-\xfc\x93\x78\xfa\x94\xa6\x04\x93\xd6\x5e\xed\x08\xca\xd7\x20\x18\
-\xbd\x57\xc7\x8a\xc1\xba\x8a\x4c\xd2\xc2\x12\x31\x20\x2f\x15\x19\
-\xac\x8e\x08\xe4\x6c\xbc\x38\x51\x7e\x05\xc4\x46\x32\x62\x93\x29\
-\x4f\xdd\x07\xef\xf2\x24\x63\xd2\x03\x28\xd3\x41\xca\x34\xce\x3c\
-\x85\x34\x20\x64\x91\xbf\x9e\x40\x4c\x0e\x00\xd5\x5c\x42\x1a\x28\
-\x1a\xb5\x0e\xef\xf9\xe0\xe3\xf8\xd9\x87\x3e\x7e\xd0\x55\xfa\x08\
-\x80\x6f\xc5\x72\xe7\xdf\x67\x74\x48\x0e\x50\x52\xfc\xac\xfc\xf2\
-\xef\xa1\x17\xfa\xeb\xe7\x00\xfc\x4b\x00\xef\xcc\xf7\x04\xe0\xf8\
-\xa1\x43\xf8\x8e\x37\x7d\x05\x4e\x1e\x3e\x8c\x69\xdf\x69\x15\x2d\
-\x31\xb7\xe3\x74\x31\x67\xcc\x2a\x40\x60\xb6\x0d\xbb\x5c\xa9\x02\
-\x55\x5a\x80\x69\xfe\xdf\xe9\xce\xf2\xcc\xfa\x23\x53\x00\x4c\x74\
-\x60\x8b\xa2\x5c\x35\x08\xd2\x5e\x00\x0e\x86\xfb\x89\x82\x81\xce\
-\x57\x0b\x44\x33\xb5\x37\xed\x06\x40\xe6\x02\x90\x93\x4c\x01\x26\
-\x6f\xdd\x02\x54\x1d\x00\x5b\x0f\x96\xc7\x86\x51\x24\xcc\xf3\x7c\
-\x00\x0a\x69\x29\x6f\xfb\x49\xa4\x25\xaa\xca\x19\x4b\x4a\x46\xad\
-\xc3\x07\x3f\x7c\x01\x3f\xf6\xee\xdf\x40\x8f\x85\xdb\x7e\xa7\x00\
-\x7e\x3b\x80\xff\xf2\xc5\x62\xa8\xf2\xdd\xcf\x8d\x9d\x2e\x33\x80\
-\xcf\xec\x30\x80\x6f\x01\xb0\x83\xb4\x4d\xa8\x01\x9e\xb8\x7c\x05\
-\xff\xe8\xa7\x7e\x02\xdf\xf5\xa6\xaf\xc4\xf6\xfa\x06\xfa\xd0\xab\
-\x8c\x58\x1e\xef\xf1\x80\x58\x39\x20\xb1\x6c\xde\xcd\x8b\x37\x23\
-\x1a\x20\xcb\x75\xeb\x90\xaf\x37\xb0\xce\xe7\x79\xfd\xac\xdc\x43\
-\x50\xea\xb1\x0d\x19\xa5\xfe\xbd\x03\x81\x2d\x1c\xcb\x08\x79\x46\
-\x00\xb6\xd4\x94\xcd\xb2\x38\xb2\xb5\x02\x91\xbb\x10\x90\x4a\xae\
-\xdb\x1e\x9f\xd5\xcf\xb9\x9a\x11\x92\x02\x2c\x3a\xaa\xf7\x16\x57\
-\x78\xe5\x40\xab\x40\x8a\x4c\x90\x31\x08\xb3\xcc\x38\x80\x51\xeb\
-\xf1\x91\x8f\x5f\xc4\xbf\xff\xa5\xdf\x44\x2f\xf1\xa0\x69\x95\x3f\
-\xfa\xc5\x64\xfc\xcb\x12\xe0\x0b\xfb\x5c\x01\xf0\xbb\xa1\x44\xa1\
-\x97\x02\x00\x5a\xe0\xe3\x4f\x3c\x85\x1f\xf8\xc9\x9f\xc0\x77\xbe\
-\xf1\x2b\xb0\xb9\xba\x86\x3e\x76\x1a\x29\x9d\x2e\xd8\xd0\xb4\x3c\
-\x2a\x11\xa8\x52\xf8\x49\x0e\x00\x76\x5f\x14\x33\x7a\x18\x93\x90\
-\x58\xf9\x05\x54\x72\x10\x4a\x2c\x43\x4a\xb3\xfd\x92\x57\x6c\x37\
-\x28\xdd\x03\xa1\xa4\x1f\x64\x43\x48\x66\xa6\x49\xfb\x4f\xaa\xb5\
-\xe6\x62\x6d\xc9\xb4\x45\x38\x71\x95\x49\x90\x57\x7c\x3b\x29\xbb\
-\x0f\xac\x76\x30\x21\x90\x0a\x90\xb4\x4c\x40\x68\xb8\x52\x2d\x6b\
-\x27\x66\xb7\x48\x68\x47\x0e\x8f\x7c\xf2\x0a\x7e\xec\x17\x3e\x84\
-\x7d\x0e\x07\x19\xff\x9f\x05\xf0\x0f\x96\x97\xdd\xb2\x04\xf8\x42\
-\x3b\x37\x42\xb5\x03\xee\xc8\xf7\xf4\xc0\xad\x27\x4f\xe2\x8f\xbc\
-\xe1\x2b\x70\xec\xd0\x16\xba\x60\xe5\x40\x16\xea\x48\x03\x37\x46\
-\x02\xaa\x0c\x3f\x2f\xe8\x20\x29\x3b\xfe\x28\xcd\xf8\x57\x20\x20\
-\x86\xf8\x40\x1a\xc4\x49\x0e\x00\x55\x74\xd5\x88\x6e\x5d\x89\x2c\
-\xf4\x25\xa5\xf6\xb7\xff\x69\xa3\x40\xb2\x51\xab\x91\x6b\xe9\x50\
-\x93\xf0\xc4\x4a\x88\x1c\xef\x2b\x32\x52\xbd\x29\x0c\x24\xd5\xf0\
-\x11\xe7\xd4\xa9\x5e\x25\xd2\xb6\x0e\x0f\x3d\xfc\x34\x7e\xf4\x5d\
-\x1f\xc0\x95\xe9\xf4\xa0\x7e\xff\xf7\x02\xf8\x73\x5f\x8c\x86\xfa\
-\x5c\x95\x00\x4b\x07\xf0\xd9\x3d\x77\x99\x13\x38\x5b\x3b\x81\xb3\
-\x47\x76\xf0\x5d\x6f\x7c\x3b\xce\x1d\x3d\x89\x69\x3f\x01\x8c\x23\
-\x38\x14\xf3\x66\xc5\x09\x04\x96\xf2\x17\xc7\x90\xa5\xba\xcc\x68\
-\x84\x4c\xe5\xc7\x5e\xde\xa4\xe4\x43\x59\xb1\x9b\x8d\x8c\x24\xd5\
-\x2c\x81\x31\xf9\xc8\xa1\xac\x0c\x05\x50\x0f\x0e\xa9\x55\x0f\x0c\
-\x1f\x15\x65\x58\x0c\x44\xcc\x62\x7f\xb9\x64\x40\xd1\x13\x40\x75\
-\x5f\xbd\xaf\x50\x64\xa0\x5d\x9c\x16\xa1\x00\x82\xd6\x7b\xbc\xe7\
-\xc3\x8f\xe1\x5f\xbf\xeb\x83\xd8\x8b\xfd\x41\xc6\xff\x97\xa0\x6c\
-\x3f\x2c\x1d\xc0\xd2\x01\x7c\x21\x9f\x97\x43\x67\x06\x4e\xd4\xc0\
-\xe0\xb1\xcd\x4d\x7c\xe7\x1b\xdf\x8e\x7b\xcf\x6a\x8b\x10\xda\xec\
-\x2b\x7c\xff\x81\x08\x38\x0f\xc0\x3f\x50\xad\xec\x6f\xb2\x5d\xc4\
-\x55\xf4\x47\x96\xd9\x46\x96\x02\x37\x4a\x70\x26\x0f\xd5\x8f\x2d\
-\xcb\x44\x19\x6c\x63\x44\x55\xaa\x9f\xfd\x80\x14\xb9\xaf\xca\xf0\
-\x35\x23\x28\x9a\x86\x43\x6d\xc3\xe2\x23\x92\x54\x37\x03\x2a\x71\
-\x46\x95\x1e\x81\x21\x8b\x8d\x23\xbc\xeb\xfd\x9f\xc0\x8f\xfd\xe2\
-\x87\xd0\x6b\xbb\x61\xf6\x74\x00\xfe\x14\x80\xbf\xfd\xc5\x9c\xaa\
-\x2f\x1d\xc0\xf3\xcf\x09\xfc\xc8\x20\x13\x08\xc0\xa1\xd5\x55\x7c\
-\xf3\xab\xbf\x14\xaf\xbf\xe3\xc5\x88\x1c\xc1\x1c\x95\xbd\x97\x1c\
-\x01\xd5\x0e\xa1\x38\x02\xca\x3b\x00\x34\x76\xa6\x1e\x3f\x57\x92\
-\x62\xc5\xe8\x39\x0f\xde\x88\x95\x0d\xb0\x31\x63\xa6\xa2\x72\x3e\
-\xc8\x28\x20\x99\x2c\x24\x49\xfd\x73\x41\x19\x50\x36\x1d\x65\xc5\
-\x10\x1d\x23\x4e\x0e\x2b\x75\x10\xaa\x4d\x46\x9c\xd6\xa4\x59\xaf\
-\x30\x9a\xf1\x3b\x4f\x88\x81\xf1\x5f\x7e\xf9\x23\xf8\x89\x5f\x7b\
-\xa8\x48\x92\x0f\xcf\xc3\x00\xbe\x0d\xb5\x2c\xdb\xd2\x01\x2c\x1d\
-\xc0\xf3\xe4\xdc\x0f\xe0\xff\x06\x70\x3e\xdf\x63\xf2\x75\x6f\xbf\
-\xf7\xa5\xf8\x3d\xaf\xf8\x52\x6c\x8c\x57\xd1\x85\x69\x56\xcf\x4a\
-\xc4\x5b\xaa\x45\x3f\x12\xdd\x26\x83\x66\x6c\x34\x7e\xc9\xa0\x5e\
-\xa2\xf3\x66\x91\x90\xac\x2e\x52\x00\xc1\x81\x50\x67\x5d\x00\x18\
-\x49\x49\xc9\x3f\x5c\xad\xfb\xe2\x3c\x32\x9c\x30\x81\x3a\x7a\x0f\
-\xb6\x0c\xe7\xe5\xa2\x92\xf7\x0a\x8a\x2d\x1e\xe5\xdc\xd6\x34\x67\
-\x20\x82\xb6\xf1\x78\xea\xf2\x2e\x7e\xe4\xe7\xde\x87\xf7\x3e\xfc\
-\xb8\x42\xd1\xf3\x97\xca\x4f\x43\x3b\x2c\xcb\xd5\xde\x58\xb6\x01\
-\x9f\x8f\xe7\x3d\xd0\x5e\xf5\xbf\x04\x70\x2f\x00\xe3\xe2\x03\xff\
-\xf6\x57\xdf\x8d\x87\x9e\x7c\x14\xdf\xf1\x25\x6f\xc7\x1d\x27\x6e\
-\xc0\x34\x74\x80\xb0\x8d\xcb\x1b\xa1\x96\xca\xa8\xaf\xe4\xcf\xcb\
-\x0c\x7f\x5a\x4b\x4e\x94\x74\x03\x58\x29\xb6\xa8\x60\x79\x73\x14\
-\x94\x00\x44\xa0\x72\x24\xa5\xa4\xc8\x5f\x0b\xe5\x5d\x03\x45\x9a\
-\xcc\x64\xc9\xa8\x4c\x2b\xc6\x24\x5e\x9a\xf7\x13\xa6\xd5\xe2\x6c\
-\x0a\xc7\xba\xf1\xc8\xc1\x23\x48\xc9\x12\xbc\x07\x3c\x11\xde\xf3\
-\x91\xc7\xf1\x23\xef\x7a\x1f\x1e\xbf\x7c\x6d\x11\xc3\x6f\x0f\xc0\
-\x5f\x07\xf0\xd7\x00\xec\x2f\x2f\xa3\xe7\xf6\x2c\x33\x80\xe7\xfe\
-\x1c\x87\xce\xa9\xbf\x13\xc0\xa8\x06\x07\xb7\xd6\x57\xf1\x4d\xaf\
-\xf8\x52\xbc\xed\xee\x57\x60\xe4\x5b\x74\xb1\x83\xea\x5f\x10\x40\
-\x9c\xd7\xe4\x25\xa8\x3d\x6b\xef\x51\x29\x17\x28\xd5\xf3\xc9\x49\
-\x24\xd9\x2e\xfb\x1d\x24\x49\xb1\x07\x39\x93\x40\x92\x0c\x47\x2d\
-\x28\x52\xcb\x8f\x27\xee\x7f\xd9\x3a\xc4\xb6\x9b\x20\x45\x78\xd8\
-\xfa\x70\x96\xb4\x71\x58\x33\x81\xc0\xe5\xf3\x28\x82\x60\xb2\xe4\
-\x4d\xe3\xf1\xf4\xb5\x3d\xfc\xc7\x77\xff\x06\xfe\xf3\xfb\x3f\xac\
-\xf8\xc0\x3c\xd8\xf7\xff\x00\xf8\x2e\x00\x1f\x5a\x5e\x36\xcb\x12\
-\xe0\x85\x74\xee\x32\x60\xf0\xd6\xc1\xbd\xba\x9d\x0b\x2f\x3f\x7f\
-\x2b\xfe\xc0\xab\xdf\x8a\xbb\x4f\xde\xa4\x06\xc4\x41\xf5\x34\x91\
-\x57\x0e\xaa\xc0\xae\x8d\xe0\xe6\x32\x21\xb3\xea\x94\x9b\x9f\x1c\
-\x82\xa0\x94\x03\x94\x41\x3f\x23\x0a\xa5\x45\xa0\x35\x26\x5f\x8d\
-\x20\xeb\xe2\x11\x64\x23\xd6\xfa\xbd\x4a\xe5\x11\xcb\xb6\x63\x33\
-\xf2\x68\x24\xa6\x90\x9c\x84\x2d\x31\x89\xc2\xa0\x06\x98\xc4\x09\
-\xde\xf3\xd0\x63\xf8\xd7\xbf\xf8\x01\x3c\xf2\xe4\x15\x8d\xfa\x8b\
-\x2f\x8d\x9f\x07\xf0\xff\x03\xf0\x13\xa8\x97\xb3\x2e\xcf\xd2\x01\
-\x3c\x0f\x4f\x03\xe0\x6d\x00\xbe\x09\xc0\x9b\x01\x6c\x1c\xf8\xc8\
-\x0e\x18\xaf\x36\x78\xfb\xbd\xaf\xc0\xef\x7e\xe0\x0d\xb8\xe1\xf0\
-\x71\x70\x88\x10\x8e\xba\x81\x08\x3a\x20\xe7\x5d\xde\xae\x67\x83\
-\x35\x52\xa4\xb8\xab\xb2\x01\x40\xde\x0e\x9c\x07\x05\xa9\x6c\x07\
-\xae\x54\x03\x4b\x26\x50\xed\x25\x48\x11\x9d\x6d\xb7\x40\xd9\x4a\
-\x64\x1f\x61\x1f\x99\x11\x21\x88\x1c\x11\x25\x66\xa3\x8f\xc2\x20\
-\x0f\x44\x1f\xf0\xc9\x8f\x5d\xc5\x87\x7f\xdd\xe1\x5f\x7e\xec\x67\
-\x71\x61\xef\x02\xb0\x52\x61\x9c\x07\x5f\x7a\x53\x73\x02\xff\x1c\
-\x4a\xb0\xda\x5d\x3a\x80\xa5\x03\x78\xbe\x9c\x0d\x00\xbf\x13\x8a\
-\x5e\xbf\xe2\xfa\xef\x6a\x02\xfb\x08\xab\xd4\xe0\x28\xad\xe0\x45\
-\x9b\xa7\xf1\x9a\x5b\xef\xc7\x4b\xef\xbf\x07\xa7\x76\x8e\x41\x22\
-\x43\x62\xb4\x4c\x80\xe0\xd3\x92\x1d\x57\x56\xec\x39\x73\x0c\x69\
-\x1f\xa0\x2b\x6b\x0a\x15\x30\x44\x71\x00\x39\x43\x40\x41\xe5\x61\
-\xf5\x7d\xcc\x29\x7e\x80\x08\x10\x84\xed\xfe\x64\xdc\x29\xea\x47\
-\x04\x89\x60\x89\x88\x60\x44\xd6\xaf\x23\x74\xc6\x20\x50\xc0\xc7\
-\x3f\x7e\x19\xbf\xfa\xd3\x17\xf0\xd1\x5f\xda\xc3\x28\x6c\xe2\xc4\
-\xe9\x63\x78\x62\xf4\x24\x7e\xf9\xd2\xaf\xe0\x89\xe6\x22\xb0\x4e\
-\xe0\x46\x30\x43\x87\x58\x74\x3e\x04\xdd\xd0\xf4\x7f\x41\xd7\x7d\
-\x2f\x1d\xc0\xd2\x01\x7c\xc1\x1a\xfe\xef\x01\xf0\x9d\xd0\x29\xc1\
-\xeb\x1a\xbd\x23\xc2\x91\x66\x15\x37\x8c\xb6\x70\x7a\xb4\x89\x2d\
-\x8c\x11\xf6\x04\x57\x2e\x4e\xb0\x3b\x99\x62\x73\x7b\x03\x0f\x3e\
-\x70\x17\x5e\xfd\x92\x07\x70\xe3\xf1\xd3\x70\x02\xc4\x18\x92\xa0\
-\x6e\x2e\x0d\x3c\x11\x3c\x91\x65\x03\x54\x86\xeb\xa8\x50\xee\xf3\
-\x14\x5f\x8d\x19\xe4\x9e\x42\x9a\x3e\xe4\x0c\xee\x45\xc4\x12\xdd\
-\x25\x82\x11\x35\xd5\x97\xa8\xd1\x1e\x8c\xc0\x01\x11\x41\xdb\x7a\
-\xc4\xa0\x86\x30\xe5\x1e\x0f\x7d\xe4\x09\xbc\xeb\xbf\x3e\x82\x87\
-\xde\x7d\x15\x3c\xf1\x58\x5b\x1b\x63\xd4\xb6\x70\xce\x61\x67\xe3\
-\x08\x36\xd6\x36\xf1\xeb\x4f\xbe\x17\x1f\x7a\xfa\x83\x08\x87\x05\
-\x61\x1b\xd8\x5d\xeb\xc0\xbe\x1e\x32\x5a\x78\xf6\x01\xfc\x47\xcb\
-\x0a\xfe\xfd\x17\x1b\x40\xb8\x74\x00\x5f\xb8\x67\x15\xc0\x37\x9a\
-\xe1\xdf\x7d\x3d\xc3\x27\x02\x8e\xb4\x6b\xb8\x71\xb4\x85\x1b\x46\
-\x87\x70\xa4\x59\xc5\x88\x3c\x26\xd3\x88\xab\xbb\x1d\xa6\x93\x80\
-\x18\x54\xa7\xbf\xef\x22\x26\xd3\x0e\x9b\x87\xd6\xf0\xc0\x7d\x77\
-\xe1\xe5\x0f\xdc\x8b\xdb\x6f\xb8\x09\x9b\xe3\x35\x70\x60\x08\x47\
-\x8b\xf0\x62\x99\x41\x2a\x15\x68\x80\x1b\xb8\xaa\x3c\x40\xee\x24\
-\x98\x82\x70\x5a\x2b\x06\x80\x11\x0a\x82\x8f\x82\xe4\xc7\x9c\x01\
-\x44\x04\x8b\xfe\xd1\x96\x90\x39\x2f\x88\x9e\xf1\xf4\xd5\x6b\x78\
-\xef\xfb\x3f\x81\x9f\xff\xe9\x87\xf1\xa1\x77\x3f\x8d\xb8\x4f\x58\
-\x5f\x5f\xc1\x68\x3c\xc6\xa8\x6d\xd0\x34\x23\xb4\x5e\xb7\x25\x8d\
-\x9a\x31\x4e\xec\x9c\xc4\xd3\x7b\x4f\xe3\x17\x3e\xf4\xd3\x98\xf0\
-\x3e\x46\x87\x46\xd8\x3b\xd4\x63\x7f\xb3\xc7\xee\x6a\x9f\x07\x98\
-\xae\x93\x15\x7c\x00\xda\x5d\xf9\x21\x00\xbf\xb1\x74\x00\x4b\x07\
-\xf0\xf9\x3a\x5f\x05\xd5\x03\x78\xf0\x7a\xd1\x7e\xcd\xb7\x38\x37\
-\xde\xc6\xad\x2b\x3b\x38\xde\xae\xa3\x25\x67\xe0\x59\x44\xd7\x31\
-\xa6\x53\x46\x8c\x51\x8d\x3f\x32\x42\x10\x70\x34\x47\x30\x0d\xd8\
-\x9f\x4c\xd1\xb6\x0d\xce\xdd\x74\x06\x0f\xde\x73\x17\x1e\x78\xd1\
-\x9d\xb8\xe1\xe8\x69\x6c\xae\xac\xe9\x78\xb1\x39\x03\x12\xd5\xd9\
-\x2b\xe0\x21\xe5\x4e\x42\xed\x08\x6c\xf3\x40\xb5\x6a\x4c\xc1\xbf\
-\x54\xdb\x2b\x06\x50\x0c\x9e\xd3\x7f\x24\xf0\x9e\xd0\x53\x8f\x4b\
-\x7b\x7b\xf8\xe0\x27\x3e\x89\x5f\xf8\x85\x0f\xe3\x97\x7e\xe1\x61\
-\x7c\xf2\xa1\xcb\xa0\xe0\xb1\xb6\x3e\xc6\x68\xdc\xa2\x69\x5a\xb4\
-\x4d\x8b\xb6\x19\x61\x34\xd2\x8f\x6d\x33\x82\xf7\x1e\xde\x39\x6c\
-\x6f\x6c\xa3\x19\x8d\xf0\xf3\xbf\xf9\x33\x78\xec\xe2\x23\x58\x1b\
-\xad\xc1\xb5\x40\x5c\x15\x5c\xdd\xea\x70\x65\x7d\x8a\x49\x1b\x06\
-\xaf\xe3\x82\x73\x0d\xba\x05\xf8\x9f\x41\x37\x38\xc5\xa5\x03\x58\
-\x3a\x80\xcf\xc5\x79\x8d\x19\xfe\x97\x1f\x68\xf8\x04\x9c\x1a\x6d\
-\xe0\x96\x95\x1d\xdc\x34\xde\xc6\xa6\x1f\xe5\xba\x3a\x2d\x12\x89\
-\x81\xd1\x07\x33\x78\x8e\x88\x11\x88\x41\x10\x03\x83\x83\x21\xec\
-\xc9\x29\x74\x01\xdd\x34\x20\x10\x63\x7b\x67\x1d\xb7\xdc\x7e\x06\
-\xf7\x9c\xbf\x0d\x77\xdc\x74\x1e\xe7\x8f\xde\x80\xcd\xd5\x35\x6c\
-\xb4\x6b\x70\x70\x60\x8e\xca\x2b\x48\xf8\x1f\xe9\xdf\x73\x95\x03\
-\x70\x69\x50\x48\x44\x07\x84\x24\xad\x24\x8f\x2a\x5d\x66\xa5\x83\
-\x07\xa1\x47\x8f\x4b\xfd\x2e\x2e\x5c\xb9\x8c\x5f\xfb\xf8\xc3\x78\
-\xcf\xaf\x7f\x0c\xef\x79\xff\xc3\xf8\xf8\x47\x9e\xc6\xe4\x5a\x8f\
-\xd6\x37\x68\x9c\x07\x89\x83\x27\x8f\xc6\xb5\x68\x7c\x83\xb6\x69\
-\x31\x1a\x8d\xd0\xb6\x6a\xfc\xfa\xb1\xc1\xa8\x19\x81\x1c\x61\x6d\
-\xbc\x8a\x9d\xad\x63\x78\xef\x27\x7e\x05\xef\x7d\xf8\x97\xb1\x36\
-\x5a\x41\xe3\x3c\x9a\xc6\x03\x23\x60\x6f\xa3\xc3\xc5\xf5\x09\x2e\
-\x8f\xa7\x65\xc1\xc8\xc1\xe7\xe7\x01\xfc\x63\x28\x03\xf3\xe2\xd2\
-\x01\x2c\x1d\xc0\x73\x71\x6e\x00\xf0\x17\x00\xfc\x7e\x2c\x22\x51\
-\xb1\x02\x72\xe7\x57\xb7\x71\xf7\xea\x71\x9c\x1c\xad\xa3\x81\x57\
-\xa3\xb7\x15\x5c\x8e\x08\x8d\x89\x75\x86\xc8\x08\xe6\x04\x38\x0a\
-\x22\x17\x83\x8f\x81\xd5\x19\xb0\xd6\xef\x7e\xa4\x8b\x33\x5d\xab\
-\x72\x62\x7d\x17\xd1\x85\x1e\x6d\xd3\x62\x6d\xbc\x8e\x1b\x4e\x1f\
-\xc7\x2d\x47\xcf\xe1\xe4\xf1\x63\xb8\xe9\xc4\x49\x9c\x59\x3f\x89\
-\xf1\x78\x8c\x95\x51\x83\x11\x1a\x34\x99\x6e\xd7\x56\x21\xd5\x41\
-\xb5\x34\x3b\x00\x11\x11\x1d\x3a\xf4\x98\x76\x1d\xae\xee\xef\xe2\
-\x23\x97\x1f\xc1\x47\x1f\x7e\x02\x1f\xf9\xf8\x63\xf8\xf5\x4f\x3c\
-\x8c\x87\x1f\x7a\x02\x17\xaf\xec\xa1\xdb\x0b\x6a\xc8\xe3\x56\x01\
-\x48\x72\x79\x0c\xd8\x89\x03\xb1\x87\x87\x87\xa7\x06\xa3\x46\xb3\
-\x81\xf1\x68\x8c\xb6\x1d\x61\xd4\x28\x26\xd0\x34\x2d\x7c\xe3\xe1\
-\xc9\xe1\xe4\x91\xb3\x78\xe8\xf1\x0f\xe1\x17\x1f\xfa\x59\x78\xef\
-\xd0\xb6\xad\x7e\x24\xdd\x10\xd4\xad\x05\x5c\x58\xdf\xc3\x85\xf1\
-\x1e\xe2\x33\x3b\x82\x8f\x01\xf8\x41\x00\xff\x10\xba\x27\x70\xe9\
-\x00\x96\x0e\xe0\xb3\x72\xbe\x19\xba\x17\xe0\xdc\x5c\xb4\x17\xa0\
-\xf1\x0e\xb7\xae\xee\xe0\xee\xf5\x63\x38\xde\x6c\x80\x48\x8c\x14\
-\x83\xcc\xaa\x6b\x1b\x8f\xf1\xc8\x83\x45\xd0\x75\x11\x31\x0a\x98\
-\x35\x03\x08\x91\xf5\xeb\xc8\x08\x91\x21\x11\x70\xce\x61\xbc\xe6\
-\xd1\xac\x10\x7c\xeb\x20\xd0\xdf\x19\xa3\xdd\x02\x23\xf4\x7a\x9b\
-\x4e\x03\xa6\x5d\x87\xc6\x7b\x8c\xda\x11\x46\x7e\x8c\x43\x87\xd7\
-\x71\xe4\xf0\x16\x36\x57\xd6\xb0\xd9\xae\x63\x4c\x2d\x36\xdc\x26\
-\x7c\xeb\xb1\xb6\x39\xc2\xb5\xa7\x27\xe8\x39\xe0\x62\x77\x09\x21\
-\x06\x3c\x3d\xb9\x82\xcb\xd7\xf6\xf0\xf8\xa3\x17\xf1\xf4\x13\x57\
-\xb1\xd7\x4f\xb1\xb7\x37\x45\x98\x32\x5a\xe7\xe1\x5b\x57\xd6\x91\
-\xa5\xf7\x98\x9c\xc9\x7e\x11\x1c\x1c\xc8\x39\x38\xd2\x4c\xc0\xb1\
-\x3a\x83\xc6\xb5\x18\xb5\x23\x8c\xdb\x31\x46\xed\x58\x9f\x5f\x3b\
-\x42\xdb\xb4\xf0\x4d\x03\xe7\x1c\x8e\x1e\x3a\x81\x8b\x7b\x17\xf0\
-\x93\xef\xff\xcf\xe8\x63\x87\x95\xf1\x08\xce\x13\xbc\x23\x8c\x5a\
-\x87\xa6\xf1\xe8\x56\x22\x1e\x1f\xef\xe2\x89\x66\x17\x3d\x3d\x63\
-\xb6\xff\x08\x74\x4d\xd8\x3f\xc4\x0b\x60\x5f\xc0\xd2\x01\x7c\xfe\
-\xce\x03\xd0\x39\xf4\x2f\x5f\x14\xf1\x5b\xef\x70\xd7\xc6\x31\xdc\
-\xb3\x79\x02\x47\x9b\x55\xc4\xc8\xe8\x99\xf3\xa8\x2b\x1b\x07\x7e\
-\x7d\xa5\xc5\xda\x4a\x83\x10\x05\x21\xa8\x91\x87\xc8\x66\xf0\x76\
-\x9f\xd5\xfe\x4d\xeb\xb0\xb2\xd6\x60\xbc\xe6\xe1\xbc\x43\x64\x46\
-\x88\x2a\x1e\x1a\x58\x10\x23\x9b\xe3\x50\x47\xc0\x11\x9a\x41\x44\
-\x46\xe8\x05\x1c\xf4\xf1\xa1\x67\x74\x7d\xd4\x6c\x82\x55\x88\x24\
-\x84\x68\x3b\x0a\x09\xa1\x0b\x2a\x1b\x6e\x5b\x89\x9d\x58\x14\x27\
-\x52\x35\x61\x0c\x06\x07\x01\x50\x1e\x04\xaa\x31\x3a\xd2\x7d\xe1\
-\x2a\xf8\x69\x4e\xc0\x7b\x07\xef\x3c\x1c\x3c\x3c\x37\x70\xe2\x31\
-\xf2\xe6\x04\x46\x63\x73\x06\x5a\x16\x34\xbe\x05\x39\x87\xc3\x1b\
-\x87\x11\x10\xf0\x1f\x7e\xf9\xdf\xa0\x8f\x93\xec\x04\x9a\xd6\xc1\
-\x37\x1e\xa3\xc6\xa3\x1d\x39\x74\x6d\xc4\xa3\xcd\x55\x7c\x92\xae\
-\xaa\x6a\xd0\xf5\x2f\xb3\x8f\x42\xa9\xc5\x3f\xf0\x7c\xc6\x08\x96\
-\x0e\xe0\x73\x7f\x56\x00\xfc\xcf\x00\xfe\x24\x80\xcd\x59\xc3\x87\
-\x03\xee\x3c\x74\x14\x2f\xdb\x3e\x83\x13\xcd\x06\x02\x07\x74\x31\
-\x82\x19\x88\x03\xad\x3d\xc6\xd6\xa1\x55\xac\xaf\x8c\x10\x42\xd4\
-\x9a\xdf\xa2\x7d\x88\x6a\x98\xa1\x8f\x08\x51\xd0\x78\x87\xb5\xf5\
-\x16\xab\x6b\x23\x50\x03\xfd\x5e\x72\x16\xac\x8c\xbb\x64\xfc\xd1\
-\x1c\x48\x64\x2b\x1f\xcc\x79\xc4\xa8\x12\x5f\x09\x44\x4c\x65\x84\
-\x8a\x8e\xda\xc4\x1e\x0b\x38\xc2\xf4\x09\x4d\x1e\x1c\x2a\x4b\x96\
-\x76\x07\xb2\xa8\xde\x5f\x19\x05\x46\x16\x0b\xa9\x15\x86\xcb\x9b\
-\xad\x3c\x64\x92\x5a\xff\xdf\xa3\x71\x0d\x1a\xdf\xc2\xc3\xc3\xc5\
-\x06\x2d\xb5\x18\x35\x23\x8c\x47\x63\xac\x8c\x56\x30\x1a\x8d\xd1\
-\x36\x23\x34\x8d\xb6\x0a\x37\xd7\x0e\x81\x1c\xe1\xc7\xdf\xfd\xa3\
-\xe8\x79\x1f\x2b\x2b\x63\xf8\xc6\xa1\x6d\x09\xae\xf1\x68\x5b\x87\
-\xf1\xc8\xa1\x6d\x3d\xf6\x7d\xc0\xc7\x70\x09\x9f\x88\x57\x6c\xbc\
-\xf8\xba\xef\xe7\x4f\x03\xf8\x33\xa8\x57\xbd\x2f\x1d\xc0\x72\x18\
-\xe8\x80\xf3\x0a\xa8\xdc\xf4\xab\xe7\x0c\x9f\x80\x9b\x0e\x6d\xe3\
-\x55\x47\x6e\xc0\x4d\xab\xdb\x88\xcc\x98\x86\x68\x84\x1a\x95\xbc\
-\x76\x44\x08\xac\x53\x7b\x47\x77\xd6\xb1\xbe\x32\x46\x1f\x58\xd9\
-\x7b\x5e\x23\xa5\x88\xc0\x89\x1a\x5a\xdb\x36\xd8\x3e\xd4\x62\x63\
-\x73\x84\xb6\xf5\x08\xac\x59\x04\x81\x80\xc6\x0c\xca\xe4\xbb\x89\
-\x80\x10\x8b\xcd\x39\x26\x44\xc7\x20\xc7\x88\x01\xba\x7c\x33\x38\
-\x55\x0e\x8e\xa2\x1b\x78\x2c\x3b\x70\x0e\x60\x26\x90\xdd\x2f\x6c\
-\x46\xce\xaa\xf7\xc7\xa4\x99\x80\x38\xc9\x4e\x0e\x4c\x65\x52\x30\
-\x13\x09\x9d\xa9\xff\x48\xe5\x04\x4c\xa8\xc4\x95\x1e\x03\x8b\x3e\
-\x57\x22\x00\x8e\x41\x23\x20\x0a\xd0\x31\x81\x82\x6d\x07\xb6\x9b\
-\x63\x07\xef\x3d\x76\x27\xd7\x70\x68\xfd\x10\xde\xf1\xf2\xaf\xc5\
-\xbf\xfb\xe5\x1f\x41\x17\xf6\xe1\x9b\x31\xd8\x94\x89\x45\x44\x75\
-\x03\xc4\x61\xdd\xb5\x78\xc9\xf8\x14\x6e\xa2\xc3\xf8\x8d\xe9\x05\
-\x3c\x36\xbd\x96\x12\x95\x45\xe7\x75\x50\x19\xf1\xbf\x0e\xe0\x2f\
-\x43\xd9\x86\x5f\xf4\x67\xe9\x00\xe6\xcf\x9f\x36\xa0\x6f\x7d\x50\
-\xe7\x33\x70\x6c\x7d\x1d\xaf\x3b\x79\x23\xee\x3e\x74\x1c\xc4\x84\
-\x49\x08\x08\x36\x9f\x9f\x26\x70\xc5\x8c\xc5\x7b\xc2\xa9\xa3\x87\
-\xb0\xb1\xd6\xa0\xeb\x94\xc9\xe7\x9d\x07\x4b\x84\x17\x02\x3b\x5d\
-\x7a\xb1\x39\x6a\xb1\xbd\x39\xc6\xda\xda\x18\x02\x46\x1f\x15\x30\
-\x6c\xe0\x74\x8b\xb0\x6e\xfd\x30\x15\xa0\x72\x75\x47\xb2\x4d\x3d\
-\x2c\x2a\xf0\xe7\x08\xe4\x58\x8d\xdd\x01\x31\x10\x9c\x67\x70\x24\
-\x44\x12\x38\xa7\x99\x09\xb1\xf1\x01\x6c\x29\x08\xb3\xca\x7e\x73\
-\x84\x3e\x2f\x49\x60\x25\x74\x75\x58\x96\xfd\x76\x2a\x02\x92\x52\
-\x7f\x36\x09\x30\x2e\x3b\x04\xf3\x36\xc3\xbc\xe6\x5c\x3b\x0c\x81\
-\x51\x96\x99\x78\x01\x35\x84\x5e\x74\x3f\xa2\xeb\x75\x29\x80\x73\
-\x1e\x2e\x3a\x8c\xda\x11\xf6\xa6\xd7\xb0\xb1\x7a\x08\x5f\xf9\xf2\
-\xaf\xc5\x8f\xbd\xfb\x5f\xa1\xeb\x27\x18\xbb\x71\x1e\x4c\x72\xa2\
-\x2c\x86\x20\xba\x76\xed\xe8\x78\x15\x27\xd7\xce\xe1\xd1\xee\x2a\
-\xde\x77\xed\x49\x3c\x3d\xdd\x1f\xee\x53\x2c\x67\x04\x95\x14\x7b\
-\x0d\x74\xaf\xc3\x07\x97\x0e\x60\x79\xd2\x39\x0f\x55\x9d\xf9\x8a\
-\xc1\xbd\x51\xe5\xb0\x5f\x73\xc3\x0d\x78\xfd\xc9\xf3\xd8\xf0\x63\
-\xec\xf7\x3d\x3a\xb6\x88\x6e\xfb\x35\x5d\x5a\x94\xc1\x6a\xfc\x37\
-\x9e\xdc\xc6\xfa\x6a\x8b\x69\x1f\xf3\x86\x1b\x55\xde\x75\x36\x13\
-\xef\x70\x78\x7d\x05\x47\xb6\xd6\xd0\x36\x1e\x3d\x47\x84\x08\x88\
-\x69\xf6\xf7\x88\x20\xf2\xa0\xc8\x66\x60\x04\x47\x4e\x59\x7d\x0c\
-\x10\x13\x98\x75\x09\x80\x8b\x2a\x02\xc2\xe4\x11\x89\x6d\xef\x9e\
-\x80\xa3\x43\x74\xa6\x25\xc0\x0e\x14\x05\xd1\xa2\xbf\xee\x24\x20\
-\x20\xea\xf6\x5f\x95\xff\x16\x20\x90\xc9\x86\xa5\xed\x46\x8a\x2f\
-\x68\x16\x80\x2c\x05\x46\x1e\xb6\xa9\x08\x79\xd5\x18\x95\x5c\x20\
-\x4f\x1b\x80\x74\x09\x2a\x03\x88\x4c\x79\x6f\x21\x35\x40\x2f\xd0\
-\xa5\x24\x3d\xc1\x39\x97\x33\x81\x91\x6f\xb1\x3b\xbd\x86\xad\xf5\
-\x6d\xbc\xe3\x65\xbf\x13\xff\xf6\x57\xfe\x15\xfa\x30\x85\x6f\xc6\
-\xf9\x6f\x65\xf5\x21\x08\x02\x04\x8e\x18\x37\x6d\x1e\xc6\x0d\x5b\
-\x5b\x78\xff\x95\x27\xf1\xde\xa7\x1f\xd7\x89\xc3\xc5\xc2\xa2\xaf\
-\xb7\x6c\xe0\x8f\x42\x87\x8f\x96\x0e\xe0\x8b\xfc\xbc\x03\xc0\xdf\
-\x1a\x20\xfc\xaa\xc6\x8d\xb3\x87\x0f\xe1\xed\xe7\xef\xc0\x1d\x87\
-\x8e\xa0\xeb\x23\x26\xbd\xe6\xdf\xde\x69\xad\x4c\x64\x7a\xf7\xa2\
-\x5b\x7d\x1a\x4f\xb8\xe9\xe4\x61\x6c\xae\x8f\x30\xed\x23\xbc\x23\
-\xb0\x38\xc0\x0b\x7a\x5b\xe7\xbd\xda\x36\x38\xb2\xbe\x86\xc3\x1b\
-\x2b\x60\x12\xf4\xb1\xda\x02\x5c\xa5\xf7\x81\x6d\xac\xd7\xd2\xe8\
-\x48\xa6\xf8\x13\x15\xa0\x8b\x36\xfe\x1b\x09\x90\x48\x20\x62\xad\
-\xc3\x59\x8d\x9c\x1c\xe7\x5d\x7b\x1c\x44\xd3\x70\xa7\xa0\x22\x31\
-\xe9\xc6\x62\x5b\x1a\xca\x8e\x34\xcd\x26\xfb\x77\x25\x43\x63\x81\
-\xb3\x4d\x45\x94\xea\xfe\xb4\x52\x2c\x2d\x1c\x81\x94\x65\x20\x26\
-\x47\x20\x49\x0c\x94\x4c\xb9\x28\x81\x75\x55\x06\x02\x9f\xe6\x94\
-\x08\x14\x9c\xa1\xfe\x0e\xce\x11\x46\x7e\x8c\x6b\x93\x2b\x38\xb4\
-\xb6\x85\xb7\x3f\xf8\xb5\xf8\xf1\x5f\xf9\x61\x74\xa1\xc3\x4a\xab\
-\xcb\x06\xa3\x00\x8e\x19\xcc\xde\x06\x99\x3c\x3a\x0e\x18\x37\x0d\
-\x5e\x75\xf2\x2c\xce\x1f\xde\xc6\xbb\x1e\x7d\x04\x8f\x5d\xbd\x66\
-\xa3\x94\x73\xef\xf9\x29\xe8\x8c\xc1\xdf\x30\x6c\xa0\x5f\x3a\x80\
-\x2f\xbe\xe3\x00\x7c\xb7\xa5\xfc\x54\x47\xfd\x66\xe4\xf0\xe6\x5b\
-\x6f\xc6\x5b\xce\xde\x82\x55\x6a\x71\xad\xef\x8c\xfe\x4a\xaa\xa2\
-\x27\x1a\xf5\x59\x6c\xd5\x95\xe8\x32\xce\x5b\x4e\x6e\x63\x7b\x63\
-\x15\xd3\x10\x14\x4d\x27\xbd\xa8\x39\x6a\xa9\xb0\xbe\xd2\xe2\xe4\
-\xe6\x21\x6c\xaf\x8e\x10\x85\x31\x8d\x11\x70\x2a\xf5\x0d\x26\x48\
-\x35\x23\x2f\x79\x6c\xd7\xd9\xf8\x6f\x91\x0b\x53\x5c\xc0\xb2\x00\
-\xc3\x1e\x02\xeb\x1e\x3f\x66\xe3\x0f\x58\x64\xe7\x28\x08\xc4\x70\
-\xde\x96\x85\x06\x32\x3c\xc1\xeb\x3a\x72\xbb\x29\x46\x50\xca\x02\
-\x62\x93\xec\xb6\xbd\x84\x89\xc0\x64\x12\x44\x5a\x02\x50\x31\xfc\
-\xa4\x38\x22\x39\xf0\x5a\xa6\x01\x97\x9d\x80\x4d\x2f\xeb\x3e\x42\
-\x08\xa8\x01\xbc\x73\xe8\x84\xe0\xea\x4c\x20\x3a\x8c\xdc\x08\xd7\
-\xa6\xd7\x70\x68\xed\x10\xde\xfa\xe2\xaf\xc1\x7f\x78\xef\x0f\x23\
-\xc4\x00\xcf\x2d\x1c\xdb\xc8\xb2\xe1\x10\x6c\x72\x64\x11\x82\x29\
-\x33\x6e\xd8\xdc\xc2\xd9\xad\x43\xf8\x95\x27\x1f\xc3\xcf\x3f\xf2\
-\x08\x42\xe0\x83\xc4\x46\xff\x04\x80\x9b\x01\xfc\x01\x00\x4f\x2d\
-\x1d\xc0\x17\xcf\x39\x0b\xe0\xef\x01\x78\xfb\x20\xea\x07\xe0\xa6\
-\x63\xdb\xf8\x86\xbb\xef\xc5\x9d\x87\x8e\x62\xaf\x0b\x98\x86\x90\
-\x23\xbd\x93\x6a\x04\xd7\x52\xff\xc8\x0c\xe7\x08\xb7\x9e\xda\xc1\
-\x91\xcd\x55\x4c\x7b\x86\x23\x0f\xe7\x24\x6b\xe7\x3b\x47\xd8\x1e\
-\xaf\xe1\xc4\xe6\x26\x36\x46\x6a\xfc\xc2\x3d\x5a\xb8\xbc\x38\xa3\
-\x27\x5d\x15\x96\x67\xf8\x59\xa3\x6e\x9f\xe7\xff\xc5\x80\x3f\x06\
-\xb1\x03\x45\x46\x54\x05\x10\x95\x0f\x67\x02\xb3\xd3\xb5\xe0\xcc\
-\x6a\xd8\xc4\x79\x13\x2f\x47\x75\x79\x0d\x01\xec\x49\x3b\x05\x51\
-\x40\x96\x11\x48\x14\x1b\x29\xd6\x1d\x81\xcc\x16\xed\x39\x09\x81\
-\x96\xfd\x81\xba\xd0\x28\xed\x07\x20\x64\x99\x40\xa9\x5b\x87\xba\
-\x27\x4c\x55\x86\x08\x22\x0e\x4c\xca\x3a\x44\x14\x88\xf8\x42\x53\
-\x76\x84\x4e\x08\xd4\x03\xce\x3b\xb8\xe8\xe1\xbd\x87\xcb\xc0\xe0\
-\x36\x5e\x7f\xd7\x5b\xf1\x5f\x3e\xf0\x6f\xd1\x34\x7a\x7f\xc2\x04\
-\x22\x33\xbc\x95\x56\x0c\x55\x2f\x9a\x72\xc0\x4a\xd3\xe0\xf5\xe7\
-\xce\xe1\xf6\x63\x3b\xf8\x89\x87\x3e\x82\x4f\x3e\x7d\x25\xaf\x1c\
-\x9f\x39\x5f\x0d\xe0\x34\x80\x6f\x00\xf0\xe1\xa5\x03\x78\xe1\x9f\
-\x97\x43\xf9\xe3\x77\xd4\x51\x1f\x04\xbc\xe9\xae\xf3\xf8\xfa\x3b\
-\xee\xc5\xba\x1b\xe3\x5a\xd7\xe9\x86\x1d\x47\x06\x90\xa5\x34\x59\
-\x41\x3c\x32\x9d\x3c\x02\x70\xf3\xa9\x1d\x9c\x3c\xbc\xa1\xce\x22\
-\x8d\xea\x8a\x83\x17\x81\x48\xc4\xe1\x8d\x75\x9c\xdc\xdc\xc6\x8a\
-\xf7\x88\xdc\x43\x18\x68\x5c\x03\x42\x44\x1e\x81\xab\xc6\x78\x55\
-\xdc\xd3\xab\xc5\x52\x04\x22\x81\xaa\xa5\x1e\xc9\x50\x89\x09\x8e\
-\xb5\x3c\x20\x62\x04\x02\xc8\x79\x20\x02\x91\x74\x93\x2f\x7b\x80\
-\x83\x57\x3c\x20\x0a\x98\xd8\x32\x04\xc3\x18\xa3\x53\x83\x4c\xeb\
-\x05\x93\x71\x1b\xb8\x29\x4e\xcb\x04\xb1\xcc\x40\x20\x60\xa7\x91\
-\x9b\x99\xf3\x42\x01\xb2\xd7\x10\x15\x59\xcf\x9b\x23\x49\x12\xe7\
-\x0c\xdb\x90\x64\xce\x23\x70\x00\x45\xdb\x21\xd8\x12\xbc\x38\x4c\
-\x7b\x9f\x33\x27\xe7\x08\x8d\x1f\xe3\xda\xe4\x32\xce\xee\x9c\xc3\
-\xcb\x6e\x7e\x2d\x7e\xe1\x63\x3f\x89\x43\xa3\x75\x33\x7e\x95\x51\
-\x53\xf5\xe4\x32\xe1\x20\x00\x82\x08\x26\x1c\x71\xe3\xd6\x61\x7c\
-\xcb\x83\x0f\xe0\x3f\x7d\xf4\xc3\x78\xd7\x47\x1e\xd1\x97\xdb\x2f\
-\xec\xfc\xfc\x04\x80\xaf\x07\xf0\x3f\x96\x0e\xe0\x85\x7b\xbe\x1e\
-\xc0\xff\x01\x60\x3b\xdf\xd3\x03\xeb\x1b\x23\x7c\xdb\x83\x2f\xc1\
-\x97\x9e\xb9\x19\xd3\x3e\x60\xbf\xef\xcd\xf0\x9d\x2e\xdb\xb4\xf6\
-\x1e\x39\x07\x27\xac\xe3\xb9\x26\x8f\x7f\xc3\xb1\xc3\x38\x7b\x7c\
-\x1b\x5d\xdf\xe7\xcc\x80\xd2\x30\x0e\x39\xec\xac\xaf\xe1\xc4\xc6\
-\x16\x46\xbe\x41\x88\x3d\x40\x5e\xf5\xfb\x52\x2b\x8d\xaa\x0c\x24\
-\xad\xd9\xe0\xb2\x49\xc7\x96\xf5\x21\x9a\x72\x6e\x4c\x2d\x00\xd2\
-\xba\xbf\x38\x04\xcd\x12\x58\x2c\x03\x61\x42\x8c\xd6\x4d\x30\xe5\
-\xdf\xe8\x74\x65\x38\xac\x24\x71\xe6\x04\xa2\xd7\xd5\xdf\xcc\xa9\
-\xbb\x90\x1c\x81\xfd\x78\xda\xe6\xe3\x52\x79\xa0\x29\x37\x99\xe0\
-\x40\xdd\x2a\x94\x9a\x3c\x24\xf6\x18\x2e\x1c\x02\xb2\x6d\x40\x91\
-\x23\x88\x6d\x3b\x30\x93\x66\x35\x5e\xd9\x83\x2e\x28\x99\xc8\x39\
-\xa7\x53\x84\xae\xc5\xc5\xdd\xa7\x70\xdf\x0d\x2f\xc5\x84\xf7\xf1\
-\xbe\xc7\xde\x8d\x8d\x76\x1d\xcc\x11\x1c\xbd\xd2\xa8\x59\xe0\x44\
-\x74\x8c\x19\x82\x06\x2a\x49\xb6\x1f\x7a\x6c\xac\xb4\x78\xe7\xdd\
-\x2f\xc2\xad\x47\x77\xf0\x23\xef\xfd\x20\xf6\xf6\xba\x45\x57\xff\
-\x2d\xd0\x51\xe3\x6f\x05\xf0\xaf\x97\x0e\xe0\x85\x77\xfe\x22\xea\
-\xe5\x12\x0a\xb7\xe3\xe6\xd3\x87\xf1\x27\x5f\xf9\x6a\xbc\xe8\xd0\
-\x31\x5c\x9a\x4e\xc0\x10\x78\xef\x54\xd9\x26\x19\xb3\x21\xfe\x5e\
-\xb4\x65\xa6\x19\x3a\xe3\xc4\xf6\x26\xce\x9f\x38\x82\x68\x11\x88\
-\x9c\x53\x70\xca\xd6\x60\xef\xac\x6f\xe2\xf8\xc6\x36\x5a\xe7\x10\
-\x38\xc0\x39\x0f\x0f\x32\x80\x2d\x02\xce\xa1\xb1\xf4\x99\x59\xd0\
-\xaa\x67\x40\x0e\xbf\x54\x3d\x07\x13\xf8\xcb\x91\xdf\x24\xc2\xa2\
-\x23\xc0\xf6\xfb\x91\x53\xb4\x9d\x6d\x59\x68\x7a\x6c\x24\x1d\xef\
-\x2d\x13\x42\x1e\x8e\x8c\xaa\xec\xb4\x5c\x60\x67\x65\x45\xb4\xc8\
-\x9d\xc1\x47\xc0\x71\x5a\x1e\x0a\xb0\x95\x2c\xce\x36\x06\xe5\xa5\
-\x22\xb6\xf3\xd0\xd4\xc9\x51\x86\x8f\x4b\x66\xa0\x72\x64\x0c\x82\
-\x2e\x28\x89\x1c\x40\x51\xd7\x86\xf7\x09\x33\x69\x1d\x3a\x36\x4c\
-\xc0\x27\x67\xe0\xe1\xbd\xe0\xa9\xab\x4f\xe0\xe5\x37\xbd\x16\x7b\
-\xfd\x35\x3c\x7c\xf9\x37\xb0\xd1\xac\x9a\x20\xa9\x3a\x80\x26\xe9\
-\x17\xc2\xd9\x2e\x45\x00\x4e\xd0\x1b\xb7\xe2\xd5\x37\xde\x88\x73\
-\x3b\xdb\xf8\xa7\xef\x7e\x0f\x3e\xf1\xf8\xe5\x45\x8a\xc4\x47\xa0\
-\xe2\x23\xdf\x66\x59\xe2\xd2\x01\xbc\x00\xce\xd8\x5a\x7c\xdf\x96\
-\xef\xb1\x28\xf7\x86\x7b\xce\xe3\x7f\x7e\xd9\x6b\xb0\xed\xc7\xb8\
-\x3c\x9d\x6a\x5a\x6b\xf4\x5d\xe7\x04\x8e\x95\x36\xeb\x84\x4c\x4c\
-\xa3\xd4\xd3\x5b\xab\xab\xb8\xe3\xf4\x09\x80\x80\x18\x25\xf7\xf9\
-\x13\x8d\xf6\xf0\xea\x06\x8e\x6f\x1c\x51\xe3\x8f\xc1\x5a\x85\x0e\
-\x9e\x04\xc4\x9a\x83\xc6\xa8\xc8\x7b\xeb\xd5\x38\x02\x17\x91\x4e\
-\x67\x64\x9c\x0c\xb4\x59\x04\x75\x88\x43\x1c\x82\x8b\x32\x50\x64\
-\xe5\x0e\x10\xa5\x35\x5e\xd6\xae\x64\x5f\x39\x06\x06\x3b\x41\x74\
-\x4e\x01\x4f\x68\xb9\xa0\x76\xea\xf2\x96\x60\xc0\xea\xfd\x88\xaa\
-\xee\x07\x5c\xb4\x6c\x20\x11\x88\x8c\xf8\x43\x99\x38\xa4\xad\x45\
-\x14\x02\xa1\x7e\x4f\x50\x96\x88\x40\x3b\x16\x2c\x8c\x60\xe3\xcc\
-\x92\x9e\x81\x73\xa0\x46\x5f\x73\xd7\xe9\xf8\x70\xe3\xb5\x4b\xd0\
-\xba\x06\x57\xf6\x2e\xe1\xd5\xb7\xbc\x01\x17\xdf\xff\x04\x26\xe1\
-\x2a\x1a\xf6\xb6\x69\x59\x39\x0c\x62\xc0\x25\x5b\x26\x90\xc0\xc2\
-\x20\x8c\xdd\xbe\xc3\xf9\xed\x6d\xfc\x99\x37\xbc\x16\xff\xec\x57\
-\x7f\x15\x3f\xff\xa1\x4f\x16\x69\xa5\xe1\xf5\xf2\x83\x00\xd6\x00\
-\x7c\xff\x0b\x1d\x05\x7f\xa1\x9f\x23\x00\x7e\x78\x60\xfc\xd6\x6a\
-\xfb\x7d\xaf\x7e\x31\xfe\xe6\x97\x7c\x39\x4e\x8c\x36\x30\xe5\x08\
-\xef\x4d\x58\x23\x21\xd1\x64\xc6\x9f\x18\x6b\x66\x74\x42\x82\xd6\
-\x37\xb8\xe3\xf4\x09\x8c\x47\x8d\x71\xe6\x69\x70\xdb\x5e\xdd\xc4\
-\xa9\x43\x27\xb0\xd2\x8c\xb4\x87\xef\x3c\x88\x7c\x2e\x0b\x9c\x73\
-\xf0\xc6\x99\x27\xd2\x01\x9a\xd6\x79\x34\x56\xf7\xb6\x5e\xbf\xdf\
-\x10\xa1\x71\x0e\x6d\xe3\x94\x0b\xef\x9d\xde\x9c\x43\xe3\x75\xb2\
-\xd0\x3b\x42\xe3\xed\x6b\xdf\xa0\xf5\x84\xc6\x5a\x6a\xad\xf7\xca\
-\xcb\xf7\x84\xc6\xeb\xa8\x6d\xd3\xe8\x60\x8f\x72\xec\x01\xdf\xb8\
-\x7c\x73\x8d\xcb\x8f\xf7\x8d\x3e\x17\xdf\x98\x1e\x21\x39\x90\x27\
-\x90\x57\x27\xa8\x1f\x91\x31\x0f\xcd\x94\x5c\x1e\x10\x02\x69\x0b\
-\xd2\x59\x66\xe2\x5c\x49\x6c\x04\x32\x50\x19\x0e\x12\x11\x39\x20\
-\xc4\x1e\xd3\x7e\x8a\x3e\x76\xe8\xd1\xa3\x97\x0e\xd3\x7e\x8a\x69\
-\xe8\x11\x62\x0f\x16\x41\x1f\x7b\x88\x00\x6f\xba\xeb\x1d\x70\x18\
-\xa1\x0b\x3d\x22\x4b\x26\x31\xc5\xb4\x87\x20\x09\x9f\xdb\xc6\xe4\
-\x68\x9b\x09\xf7\x42\x8f\x8d\xd1\x08\x7f\xec\xd5\xaf\xc2\x57\xbd\
-\xfc\xce\xc1\x35\x51\x1d\x0f\x1d\x26\xfa\x63\xcb\x0c\xe0\xf9\x7b\
-\x6e\x80\x12\x3d\x8a\x36\x5f\x00\xda\x15\x87\x3f\xfb\x86\x37\xe0\
-\x1b\x6f\xbf\x1f\xfb\xd3\x29\xf6\xa4\x47\x43\xba\x7e\x3b\x1a\x72\
-\xef\xc9\xea\x65\xa6\x6a\x51\x47\x49\x65\x6f\x3d\x71\x1c\xdb\x1b\
-\xeb\x98\xf4\x3d\x60\x8a\x3c\x6c\x2b\xb2\xd7\x57\x36\x71\x6c\xfd\
-\x38\x46\xde\x23\xc6\x5e\x27\xe8\x88\x40\xae\x81\xb3\x88\xa4\xac\
-\x59\x97\x5d\x30\x5b\x5b\xad\x51\x71\x7f\x2d\x29\x00\x0d\xef\x11\
-\x20\x78\xf4\x8e\xd1\x68\x4b\x41\x6b\x7a\x06\x1c\xd8\xe6\x06\xf4\
-\x79\x2b\xea\xef\xb2\x0e\x40\x74\x0c\x62\x20\x12\x29\x08\xc8\x0c\
-\x21\x97\x57\x8a\xe7\x6c\x21\x3a\x04\xa4\x2e\x00\x2b\x76\x60\xdf\
-\x87\xb5\xdc\x9c\xb5\xfb\x18\xc6\x49\x60\x05\xf4\x9c\xb1\x01\x39\
-\x95\x02\x8e\x40\x89\x44\x24\x45\xab\x10\x15\x47\x40\x39\x05\x92\
-\xa9\xc7\xcc\x4a\xa7\x26\xa8\xd3\xe9\x82\x3a\x5e\x4f\x0e\x2e\x12\
-\x5c\x6f\x8e\x8c\x3c\xdc\xd8\x63\x77\x7a\x15\xdb\x1b\x87\xf1\x9a\
-\xf3\x5f\x8a\xff\xfe\xb1\x7f\x87\x76\xdc\x20\x32\x21\x8a\x53\x3d\
-\x85\x11\x23\xc2\xa1\x17\x86\x87\xd3\x6d\x8b\xb6\x52\x8d\xc9\x63\
-\xc2\x01\x0d\x3b\x7c\xcb\x03\x2f\xc1\xe9\x43\x9b\xf8\x81\x9f\xfe\
-\x25\x84\x29\x2f\xb2\x88\xef\xb3\x77\xfd\xfb\x96\x0e\xe0\xf9\x75\
-\x6e\x87\x8a\x43\xdc\x53\x83\x7d\x9b\x87\x46\xf8\xdf\xdf\xfa\x15\
-\x78\xdb\x8d\x77\xe1\xf2\x64\x17\x02\x45\xb3\x9d\xb0\x0d\xb2\x38\
-\x35\x22\x47\x5a\x67\xbb\xd4\xf3\xd7\xf4\x96\x85\x71\x66\xfb\x30\
-\x4e\x1d\xde\x42\x1f\xb5\xd7\x2f\x44\x99\xfe\xba\x31\x5a\xc7\xd1\
-\xf5\x13\x18\xbb\x11\xa2\x04\x2d\x07\x8c\xc7\x0e\x38\xb0\x6b\x94\
-\x83\xef\x0c\x98\x63\x8d\xd4\x30\x2d\x7f\x61\x7d\x3e\x90\x94\x66\
-\x7b\x38\x1b\x03\x86\xa8\x61\x3b\xd6\xd6\x20\x48\x6c\xfe\x9e\x40\
-\x88\x08\xe2\xb4\xcb\x95\xb6\x04\x71\xb5\x14\x80\x04\x24\x0c\xeb\
-\xc4\x83\x29\x91\x89\x24\xff\x7b\xe1\x55\x8c\x04\x70\x4a\x3d\x8e\
-\xea\x68\x44\x3c\xc8\x33\x3c\xb1\x21\xfa\xa4\x9c\x01\xd3\x18\x64\
-\xdb\x4b\x48\xd1\x5a\x97\x94\x1c\x9a\x45\xfb\x6a\x6a\x88\xbc\xfd\
-\x53\xab\x31\x69\x11\x25\x0b\x45\x30\xc0\xbd\x4a\x14\x60\x98\x29\
-\xf5\xc1\xa3\xeb\x3d\x1a\xe7\xe1\x1a\x8f\xb1\x1f\xe1\xea\xe4\x32\
-\xce\x1f\xbd\x1d\x17\xa6\x8f\xe3\x83\x4f\xfd\x12\x9a\xd1\xba\x4d\
-\x3d\x12\x42\x14\x78\x61\x30\x39\xcd\x32\x16\xdc\x7a\x89\x98\x84\
-\x80\x77\xde\xf1\x22\x9c\xda\xd8\xc0\x5f\xfd\xcf\x3f\x83\xdd\xab\
-\xfd\xa2\x65\x25\x7f\xa3\x72\x06\x4b\x07\xf0\x3c\x38\x2f\x36\xe3\
-\xbf\x39\xdf\xd3\x01\xc7\x8e\x6f\xe0\xfb\xbf\xe2\x9d\x78\xc3\x89\
-\x9b\xf1\xf4\xe4\x6a\xae\x37\x3d\x04\x5e\xb4\xe6\xf4\xa2\x03\x36\
-\x25\x9d\xd7\x8b\x91\x48\xc1\xae\xad\x95\x35\xdc\x7c\xfc\x84\xad\
-\xdc\x2a\x8f\x11\x22\x8c\x9b\x31\x8e\xad\x9f\xc4\x4a\xbb\x0a\xe6\
-\xde\xe0\x70\x07\x47\x02\x86\x07\x21\x2a\xab\xce\x69\xf4\x66\x93\
-\xee\xd6\xcc\x01\x00\x6b\x5b\xd0\x59\x86\xa0\xb3\xf7\x40\x30\x4b\
-\x22\xb6\x35\x60\x20\x08\xa9\xea\x8f\xa4\x4d\x60\x64\x28\x3a\x48\
-\x5b\x73\xce\xa2\xbb\x28\x93\x2f\x5a\xcb\x4c\x8c\x6d\x48\x09\xb4\
-\x8c\xa9\xbb\x20\x40\xd4\xbd\xc5\x20\x01\x02\xb2\x72\x30\x6c\xab\
-\x70\xb4\xbf\xee\x2c\xfb\x00\x60\xce\x4c\xb1\x00\x72\xc6\x21\x88\
-\x69\x41\x09\xe5\x9d\x83\x29\xec\x27\x49\xf3\x84\x47\x9a\x24\x29\
-\x20\x0a\xda\x11\x82\x12\x9a\x22\xa1\x0b\x56\x82\x90\xd7\xf7\x29\
-\x7a\xf8\x5e\x47\x83\x9b\xc6\xc3\x89\xc3\xc5\xdd\xa7\xf0\xd2\xb3\
-\xaf\xc1\x85\xfd\x4f\xe1\x52\xf7\x24\x9a\xf1\xaa\x76\x04\x62\x44\
-\x64\x67\xa9\x7f\x92\x3a\x53\xda\x70\x80\xc9\x9e\x19\x4e\xb0\x1b\
-\x7a\xbc\xe9\xc6\x9b\xb1\xfd\xf6\x55\xfc\xa5\x9f\xf8\xef\x78\xea\
-\xc2\x5e\xbd\xc2\xa5\x76\x02\x02\x5d\xf2\xb2\xc4\x00\xbe\x80\xcf\
-\x4b\x01\xfc\xf8\xc0\xf8\xa7\xc0\x0d\x67\xb6\xf1\x43\x5f\xfb\xfb\
-\xf1\xe6\xd3\x77\xe3\x6a\x3f\x55\xd1\x0a\xa7\xb5\xaa\x07\x15\x15\
-\x5d\xab\x57\xa9\x4a\xf9\x13\x08\xe7\x9d\xc3\xcd\xc7\x4e\xa2\x6d\
-\xda\x12\xa1\xac\xd6\x6d\x5d\x8b\x23\xeb\x27\xb1\x36\xda\xb0\x72\
-\xc1\x99\x5a\x8e\xd7\x41\x17\x7b\x6c\x99\xb7\x4f\xdf\x33\x11\x8d\
-\x7c\xd3\x1e\x78\xe3\x08\x2d\x11\x1a\x72\x68\x1c\xa1\x21\x82\x77\
-\x1e\x8d\xd7\x5a\xbd\xf5\x1e\x23\xd7\x28\x8e\x40\x0e\x8d\xf3\x68\
-\xbd\x62\x04\xe9\xfb\xad\x45\xcf\xc6\xf0\x84\xf4\x79\xd3\x10\x1a\
-\xe7\xe1\x1d\xc1\x7b\x87\xc6\x95\x9a\xbf\x69\x09\xbe\x55\x24\xde\
-\xb5\xaa\xc8\xe3\x1a\x05\x18\xbd\x37\x7c\xc4\x3b\x90\x47\xc6\x46\
-\x60\xaf\xa3\x32\x0f\x9d\x0d\x26\x59\xb4\xf7\xb9\xed\x30\x9c\xcf\
-\x19\x2c\x36\x41\x06\xf0\x82\x08\xa2\x04\x04\x8e\x08\xb1\x47\x17\
-\x3a\x74\x61\x82\x69\x9c\xa2\x8b\xf6\x31\x74\xe8\xfa\xde\xa2\x3d\
-\x63\xd2\xed\xe3\x75\xe7\xbf\x1c\x9e\x46\xe8\xfa\x60\x82\x29\xa6\
-\x8f\xc0\xc5\xf0\x23\xca\x16\xa3\xe2\x0c\x54\xf2\xfc\x4a\xdf\xe3\
-\xb5\x27\x6f\xc0\xdf\xfd\xaa\xb7\xe1\xd4\xa9\x4d\x15\x49\xc2\xc2\
-\x72\xe0\x0f\x2d\x1d\xc0\x17\xee\x79\x39\x80\x7f\x03\xe0\x4c\x6d\
-\xfc\x37\xdd\xb8\x83\xff\xeb\x6b\xbf\x0d\xaf\x39\x72\x1b\xae\xf5\
-\x53\xed\x91\x1b\xf0\xe6\x1d\x69\x44\x4e\xaa\x36\x54\x84\x30\xc8\
-\xd2\xfa\xa4\xa5\x7f\x76\xeb\x28\x76\x36\x36\xc1\xc2\xf6\x78\x67\
-\xf5\x7f\x83\x9d\xb5\x13\xd8\x5c\xd9\xd1\xab\x5e\xe7\x5f\x41\x30\
-\x03\x87\x37\xa0\xcf\xdb\x06\x1f\x1d\x09\xce\x0e\x22\x01\x83\x29\
-\xe5\xf5\x5e\x9d\x82\x87\x39\x02\x33\x70\x07\x34\xce\x1c\x82\x23\
-\xb4\xce\xa1\x25\x35\xfa\xc6\x79\x34\x44\x18\x79\x87\x91\x57\x47\
-\xd1\x7a\x87\x91\x57\x50\x2f\x01\x83\xe9\xe7\x9d\x87\x02\x85\x8d\
-\xdd\x9c\x37\xe2\x8d\x3a\x08\xef\xcd\xe0\x1b\x03\x03\x5b\xc0\x35\
-\x40\xd3\x58\x39\xe4\xbc\x02\x7c\x4e\x77\x15\xd8\x4b\xa1\xff\xf3\
-\x94\x97\x95\x00\x3a\x02\x4d\x54\x7a\x6d\x54\x79\x57\x32\xfc\x44\
-\x9d\x80\x92\x05\x54\x9d\xb8\x47\x88\x01\x7d\xec\x31\x0d\x53\x74\
-\x61\x8a\x8e\xa7\xe8\x79\x8a\x69\x3f\x41\x1f\x3a\x84\xd0\x43\x44\
-\x30\xe9\xf6\xb1\xe6\x37\xf1\xf2\x33\xaf\xc7\x7e\x37\x51\xdd\x04\
-\x46\xd6\x5c\x08\x62\xe4\xa7\x24\x80\x0a\xce\x65\x40\x84\xa0\x27\
-\x46\xa0\x88\xcb\x61\x8a\x17\xef\x9c\xc4\xdf\xff\xaa\xb7\xe1\xcc\
-\x99\xcd\x83\x06\x86\xff\x2e\x74\xd9\xcb\xd2\x01\x7c\x81\x9d\x57\
-\x40\xc9\x1b\xa7\x6b\xe3\xbf\xf5\xdc\x51\xfc\xf0\xef\xfa\x2e\xbc\
-\xfc\xf0\xed\xb8\x16\xa6\x7a\xc1\x26\x64\xbf\x36\xfa\x9c\xea\x4b\
-\x49\xfd\xed\x63\x14\xc6\xa1\xd1\x3a\xce\xee\x1c\x53\x00\x8f\xb4\
-\xff\xad\x8f\x77\xd8\x1c\xef\xe0\xd0\xca\xb1\xca\x79\xf8\x1c\x09\
-\x53\xb4\xd7\xbf\xe1\x72\x46\x40\xd9\xe0\xd5\xf8\xc8\x32\x01\x64\
-\xc7\xe4\xe1\xc8\xe7\x4e\x41\xe3\x9c\x66\x03\x29\x2b\x20\x07\xe7\
-\x60\xe8\xbf\xde\xda\xc6\xe7\xce\x41\xeb\x14\x5b\x50\x47\x01\x78\
-\x9f\x3a\x0b\x1a\xc5\x1b\xbb\x79\x1b\xc5\x4d\xaf\x49\xd3\x58\xe7\
-\xa3\x31\x27\xd1\xd8\x90\x4e\xa3\xf7\x91\x27\xa5\xea\xe6\x2e\x89\
-\x71\x24\x52\xd4\xb7\x8e\x48\xd2\x26\xcf\xaf\xa5\x23\x4b\x09\xaa\
-\x3c\x80\x30\x60\x3f\x92\x68\xf9\x92\x29\xbe\x12\x11\x63\x44\x08\
-\x01\x5d\x98\x62\x1a\x3a\xf4\x32\x41\x17\xd5\x09\x74\xa1\x43\x08\
-\x01\x22\x84\xab\x93\x4b\xb8\xf9\xf0\x5d\xb8\x7d\xe7\x7e\xec\x4d\
-\x27\x9a\x05\xb0\xe9\x2a\x9a\xd2\x71\x2f\x82\x1e\x11\x41\x45\xd0\
-\x11\x6b\x57\x60\x5d\x82\xcb\xfd\x04\xf7\x6e\x9d\xc4\x3f\xfa\xea\
-\xaf\xc4\x8d\x37\x6c\x2d\xca\x04\x1c\x80\x7f\x00\xe0\xeb\x96\x0e\
-\xe0\x0b\xe7\xdc\x0f\xe0\x47\xa1\x13\x5e\xd9\xf8\x6f\xbc\xf1\x08\
-\x7e\xf8\xeb\xfe\x24\x1e\xdc\xba\x1d\xd7\xc2\x7e\x89\x56\x59\x22\
-\x9b\xf3\xf6\x1c\x67\x03\x35\x99\x8c\x97\xa2\x12\x04\x9e\x1c\x6e\
-\xda\x39\x89\xb6\x69\x2c\x82\x51\x8e\x78\x2b\xed\x21\x6c\xaf\x9d\
-\x81\x77\x4d\x76\x08\x2e\x7d\x24\x6d\x30\xab\x11\x94\x2c\x40\x5b\
-\x8b\x1e\x49\x44\x8b\xac\x3c\x28\x25\x85\x39\x26\x2b\x09\x92\xc1\
-\x3a\xe7\x2d\x75\xd7\xf4\xbe\x75\x1e\x8d\x47\x6e\x09\xa6\x34\xdf\
-\x67\x03\x57\x67\xd1\x3a\x8f\x96\x1a\xd5\x0b\x74\x56\x26\x98\x21\
-\x37\xde\xe9\x72\x11\x2b\x03\x94\x79\xa7\x37\x6d\x0d\x92\x46\xf0\
-\x54\xa2\x58\xfa\xef\x3d\x59\x29\x90\x0c\x3d\x19\x7e\x65\xd7\x79\
-\x39\x49\x5a\x53\x04\xf3\x16\xa5\xb3\x92\xb3\x02\x97\x70\x83\xb4\
-\x8b\x50\x1d\x40\x88\xda\xfe\xeb\xfb\x1e\x5d\x3f\x45\xd7\x77\xe8\
-\x78\x8a\x2e\x76\xe8\xfa\x0e\x21\x74\x88\x51\x37\x19\x5d\xdd\xbb\
-\x84\x97\x9e\x7a\x1d\xd6\x9a\x6d\xfb\x9e\x96\x00\x21\x32\x02\x04\
-\x4c\xb6\xc9\xc8\x8c\xbd\xb7\xcf\x83\x95\x03\x0c\x46\x24\xc6\x95\
-\x30\xc1\x7d\x5b\x27\xf0\x83\x5f\xf3\x55\x38\x7d\x7a\x61\x39\x30\
-\x82\x2a\x10\xbf\x6d\xe9\x00\x3e\xff\xe7\x8e\xb9\xc8\xdf\x01\x27\
-\x4f\x6f\xe1\x47\x7e\xd7\x9f\xc7\xfd\x5b\x77\xaa\xf1\x13\x41\x31\
-\x72\xa7\x86\x47\xaa\x57\x47\x29\x15\x45\x75\x11\x53\xa9\x57\x83\
-\x30\x4e\x6d\x1c\xc5\xf6\xfa\xba\x8d\xc0\xa6\x04\x1e\x68\xdd\x08\
-\xdb\xe3\x93\x68\xdd\xaa\x81\x7d\x3e\x97\x05\x85\xa8\xe3\xb2\x01\
-\x50\xca\x02\xa0\x0d\x74\x1a\x28\xea\xba\xec\x18\xbc\x91\x5e\x52\
-\x56\x90\x9c\x46\x93\xa2\x3a\xb9\x1c\xdd\x3d\x14\x07\x68\x53\x76\
-\x60\xbd\x7e\x6f\x65\x80\x37\x87\xd1\x78\x75\x06\xde\x6b\xe9\xd0\
-\x18\xe7\x40\xf9\x01\xc9\xf8\x29\x67\x48\x9a\xfe\x3b\xdd\x49\xe8\
-\x15\x2b\x20\x7b\x5e\xde\xb8\x00\xce\x68\xc5\x89\x13\x30\xc8\x04\
-\x52\x09\xe0\x00\xe7\xab\x16\x2a\x95\xd0\x9f\x9d\x40\xf5\xd1\x3b\
-\x4a\xb4\x48\xdb\x4b\x18\x11\x38\x20\xb0\xe2\x01\xd3\x7e\x82\x69\
-\x98\xa0\xe7\x89\x66\x05\xbd\x96\x02\xcc\x11\x21\x06\x80\x81\x57\
-\x9d\xf9\x52\x74\x21\x98\xf4\x9a\x8a\xa7\xf6\xb1\x18\x7a\x04\x6b\
-\xed\x0f\xce\xf7\xf5\x50\xc9\xf5\xde\x28\xd7\x97\xc2\x04\x0f\x6c\
-\x9d\xc4\x3f\xf9\x1d\x5f\x85\xa3\x27\xd6\x16\x39\x81\x35\x00\xff\
-\x27\x80\xd7\x2e\x1d\xc0\xe7\xef\x9c\xb3\x9a\xff\xa6\xba\xd5\x77\
-\xf4\xf8\x26\x7e\xf8\xeb\xbe\x07\x2f\x3d\x7c\x1f\x26\x61\x62\xa9\
-\xb9\x33\xa3\xb4\x8f\x28\xdb\x73\x69\x80\x4e\x49\x46\xa7\x23\x18\
-\xeb\xcd\x2a\x4e\x6f\x1d\xcd\xf3\xfa\x99\x0d\x48\x1e\x87\x56\x4e\
-\x61\xa5\xdd\xca\xa0\x5f\x0a\x63\x94\xfe\x5e\xea\xff\x93\x9f\x29\
-\x37\x7c\x2e\x09\xdc\xe0\xfe\xe2\x14\xea\xef\x3b\x97\x40\x45\x97\
-\x8d\xb3\xc9\x46\x4c\xf0\x28\x40\x60\x5d\x22\x34\x66\xf8\xfa\x78\
-\x82\xf7\xc8\x19\x42\x6b\xb7\xf4\xfb\x14\x47\x48\xa5\x03\xc1\x27\
-\x63\x6e\xbc\x65\x02\xca\x56\xcc\x60\xa0\xb7\xda\xde\xc0\x3e\x72\
-\x2a\xf2\x91\x32\xa3\xb4\xaa\x1c\x99\xfc\x33\x83\xfa\xb9\x52\x26\
-\x54\x23\x10\x39\x51\xe0\xb4\x7c\x94\x25\x13\x84\x62\xec\x35\x03\
-\xe8\xa7\x8a\x0b\xc4\x89\x81\x84\xbd\x95\x02\x8c\xbd\xe9\x55\x9c\
-\x5a\xbb\x01\xb7\x1f\xbe\x1f\xfb\xd3\x09\x62\x50\xc1\xd5\x18\x22\
-\x22\x2b\x1b\xb0\x17\x2d\x01\x98\xb4\x24\x88\x64\x5b\x90\xc1\x60\
-\x62\xf4\x88\xe8\xc0\x78\x3a\xec\xe3\xd5\x47\x6f\xc4\x3f\x7b\xe7\
-\x57\x63\xeb\xc8\xca\x22\xc5\x80\xc3\x50\x4d\x81\xfb\x96\x0e\xe0\
-\x73\x7f\x76\xec\xc5\xbf\xa3\x26\xf9\xac\x6f\x8e\xf1\x43\x5f\xfb\
-\xbf\xe2\x35\x47\x5f\x8b\x3e\xee\xa6\xd1\x9a\x42\xe6\x49\xfa\x5e\
-\x54\x82\x91\xa4\xf1\x35\x2a\x42\x56\x6c\x73\xe6\x67\x0e\x1d\xc7\
-\xb8\x6d\x6c\x1c\xb6\xcc\x05\xac\xb6\x3b\x58\x1f\x1d\x87\xab\x5e\
-\x42\x8d\xe4\x29\xcb\xd0\xcf\x29\xa1\xdf\xd9\x32\x60\xea\x3e\x1e\
-\x8e\x1a\x90\xf3\x99\x79\x58\x1c\x82\xcb\x1d\x02\xe7\xea\x7e\xb8\
-\x61\x02\x29\x65\x27\x05\xfa\x12\xb8\xe7\x53\xb7\x80\xcc\x88\x29\
-\xe1\x07\x29\xba\x5b\xd6\x90\x98\x7e\x1e\xe5\xe7\x12\x46\x90\x45\
-\x39\xbc\xee\x20\xb4\x9f\xf3\x8e\x2c\xfa\xeb\xbf\x45\x31\x03\x94\
-\x6e\x80\xb7\x7f\xaf\x95\x47\x4a\x48\x70\x4a\x47\x26\xfb\xbe\xab\
-\x2c\xbc\xc2\x58\xa8\xca\xb8\xd2\x60\x51\xa2\x3d\x6b\x77\x40\x17\
-\x90\xf6\xb1\x47\x17\x3b\xf4\x61\xaa\x4e\xa0\x9f\x5a\x16\x30\x45\
-\x1f\x3a\x30\x47\x2d\x05\x26\x97\xf1\x92\xe3\xaf\xc5\x7a\xb3\x85\
-\x49\xdf\x65\xb5\xe5\x3e\x44\x8d\xf0\xe0\x5c\x02\xf4\x12\x33\x1e\
-\xd0\x83\xd1\x43\xb5\x13\x84\xf4\xe3\xc5\xe9\x1e\xde\x7c\xf2\x16\
-\xfc\xa3\xaf\xf9\x4a\x8c\x37\x1a\xe3\x28\x0c\xce\x29\x6b\x39\x9f\
-\x5b\x3a\x80\xcf\xdd\x49\xe9\xd7\xcb\xf3\x3d\x51\x11\xea\x7f\xf6\
-\x3b\xfe\x02\xde\x74\xfa\xad\x88\x72\x15\x73\x85\xa6\x76\xdd\xf3\
-\x45\x56\xe3\x50\x9c\xe3\x3f\xcc\xf8\x19\x5b\xa3\x2d\x1c\x59\xdf\
-\xca\xa9\x7f\xda\xad\xd7\xba\x35\x1c\x1a\x9f\x82\xa7\x56\x7b\xdd\
-\x16\xf1\x13\xaa\xed\x72\x58\xc4\x20\x0c\xa6\xf2\x22\xb5\x0e\x73\
-\x67\xc0\x4a\x07\x7d\x2e\x2e\x97\x0e\x29\x5b\x20\x47\x25\xbd\x4e\
-\x6d\x45\x8b\xee\xa9\x34\x68\x7c\x49\xeb\x5b\x57\x9c\x40\x43\xea\
-\x30\x6a\x4c\xa0\x49\x0e\x22\x95\x14\x5e\xe5\xc7\x93\x94\xb7\xf7\
-\xc9\xb1\x78\xcd\x04\x3c\xac\xf6\x37\x00\xd0\x23\x3b\xa7\xb4\x8b\
-\xd0\xa7\xa8\x9f\xf1\x82\xd4\x22\xa4\x32\xd7\x94\x36\x97\xd6\xb5\
-\x3f\xd1\xa0\x04\xa8\xdf\x13\x15\xfb\x88\xb6\x95\x58\xa9\xc2\x31\
-\x06\x6b\x03\x4e\x15\x0c\x8c\x13\x73\x08\x9d\x51\x82\x23\x62\x0c\
-\x40\x14\xbc\xea\xd4\x9b\xd1\xf7\x3d\x42\x8c\xe8\x43\xcc\x4a\xca\
-\xd3\x04\x04\x1a\x37\xa0\x17\x8d\xf8\xea\x00\xa2\x39\x03\xdd\x76\
-\xdc\x39\xc6\x53\xdd\x3e\xde\x79\xd3\x5d\xf8\xbe\x77\x7c\x99\x0d\
-\x4e\xcc\x5d\x54\xb7\x5a\x30\xda\x59\x3a\x80\xcf\xcd\xf9\xfb\x00\
-\xde\x5a\xdb\x34\x04\xf8\x6b\xef\xf8\x4e\x7c\xcd\xad\xdf\x08\xc1\
-\x55\x0c\x95\xeb\x79\xf8\xc0\xea\x22\xb4\xb1\x94\x8c\x02\x07\xa4\
-\xc9\x36\x87\xd3\x9b\x47\xb5\x26\xad\x40\x2d\x82\xc7\x7a\x7b\x02\
-\xad\xdb\x2c\x17\xb0\x91\x07\x4a\x24\x2b\xe0\x5e\xee\x8f\x13\xe5\
-\xed\x39\x39\xc6\xe5\x0b\x3f\xcd\x09\xf8\x01\xc6\x90\xb8\x06\x64\
-\xdf\x47\xe6\x2b\x54\x78\x81\x61\x0f\x39\xea\xa7\x8e\x81\x65\x06\
-\x3e\xf1\x07\x1c\xa1\x4d\x5d\x85\xd4\x01\x48\x2d\xc1\x9c\x35\xb8\
-\x52\x2e\x38\xe4\xdf\xe7\xbd\x1a\x76\x93\xbb\x00\x96\x19\x78\x67\
-\xa5\x82\x75\xff\x5c\x19\x2f\x06\xe5\xed\xa4\x43\xa0\x6f\xa6\x09\
-\x90\xfb\x82\x44\x8b\x9d\x80\xa8\x6e\x79\x64\x03\x05\x39\xa0\x0f\
-\xc6\x0f\xe8\x27\xe8\xc2\x04\x1d\x5b\x87\xa0\xef\x10\x43\x80\x88\
-\x60\xb7\xbb\x8a\x93\xab\x67\x71\xeb\xd6\x7d\xd8\x9f\xec\x23\x04\
-\x41\xdf\x59\x29\x90\xbb\x01\x7a\xeb\x11\xcd\xf8\x17\x39\x01\x46\
-\x87\x80\xcb\xdd\x04\x7f\xf8\xae\x57\xe0\x4f\xbf\xed\x75\x07\x2d\
-\x2e\x7d\x39\x80\x7f\x0a\x95\x93\x5f\x3a\x80\xe7\xf0\x7c\x37\x74\
-\x1b\x6f\x09\xd9\x3d\xf0\x2d\xaf\xff\x1a\xfc\xf1\x17\xff\x39\x00\
-\x7b\x60\x09\x36\xc2\x26\xc5\xf8\xc5\xc6\xff\x50\x7a\xce\x02\x1d\
-\x87\x8d\xc6\x49\x4f\xc2\x16\x21\x46\x1c\x1e\x6f\x63\x6b\x75\xbd\
-\xb4\xfd\x12\xfc\xdb\x6c\x63\xa5\x3d\x52\x5d\xc8\xb5\x61\x17\xf1\
-\x39\xfd\xda\x2b\x17\x20\x83\x8c\x2e\x67\x01\xa0\xe4\x04\xa8\x0c\
-\xcd\x92\xd3\x92\x20\x95\x01\x46\xb0\x71\xc9\x11\xe4\x92\x00\xb9\
-\x63\xe0\x53\x0a\x9f\x06\x89\x6c\xf0\x48\xf1\x00\x8b\xe4\xce\xc1\
-\x53\x53\xa2\x76\x2a\x0f\xc8\xdb\xcf\x6a\xb1\x92\x32\x85\x4c\x4a\
-\x32\xfc\x40\xff\x86\x46\x70\x9f\xcb\x09\x03\xfd\x12\x39\x28\x75\
-\x46\x40\x15\x87\x22\x53\x22\x06\x2c\xc0\x8c\x0f\xd4\x36\x9f\xb3\
-\xa5\x61\x17\x06\x86\x07\xe8\x5e\x03\x46\x88\x41\xcb\x01\x8b\xfa\
-\xd3\xce\x5a\x82\xac\x04\xa1\x3e\xe1\x01\x2c\xb8\xb6\x7f\x19\x0f\
-\x1c\x79\x0d\xc6\xb4\x81\xe9\xb4\x57\x27\xd0\x33\xfa\xa0\x8b\x4f\
-\x3b\x61\x03\x05\x61\x1a\x02\x9c\x0d\x7f\x6a\x40\x61\x6f\x9d\x81\
-\x29\x22\x26\xa1\xc3\x5f\x7e\xd9\x9b\xf0\x75\xaf\xbb\x47\x41\xc1\
-\x79\x27\xf0\x15\xc6\x13\x58\x3a\x80\xe7\xe8\x7c\x83\x39\x00\xd4\
-\xed\xbe\x37\xdf\xf7\x32\xfc\xdd\xd7\xff\x2d\x88\x04\x04\xde\x87\
-\x48\x92\x84\xd0\xf9\x2f\xb1\x0d\xb7\x2a\x68\xcb\xd9\xf8\xcb\x82\
-\x6c\xc9\x5b\x70\xa3\x89\x69\x9c\xda\x38\x96\x67\xf1\x53\x42\xea\
-\x69\x8c\xb5\xf6\x04\x3c\x8d\x2b\x23\xaf\xd6\x63\x81\x72\x2f\x3f\
-\xd7\xb7\x39\xc2\xbb\xdc\x23\x77\x95\x85\x94\xd5\x5a\xa5\x6b\x90\
-\x39\x02\xf9\xf7\xe7\x3e\x41\xee\x34\x38\xcb\x34\x9c\xa1\xfc\x2e\
-\x63\x02\x4d\x95\xde\xfb\xcc\x78\xf4\x1e\x25\xca\xbb\xd2\xd6\x53\
-\xf0\xb0\xe6\x04\x58\xe4\xcf\x2b\xc7\xc9\x56\x7d\x99\xc3\xf1\x3a\
-\x3d\x98\x48\x40\x75\xcb\xb2\x06\x3a\xf3\x24\x25\x0d\xda\xfd\x19\
-\x47\x99\xe5\x00\x64\x6f\x90\xf6\x9a\x63\x68\x60\x62\xad\x41\x16\
-\x45\xfb\x63\x8c\x9a\x05\x64\x4e\x80\xf2\x03\xba\x7e\x8a\x3e\xf4\
-\xba\x39\x29\x06\x34\x68\xf0\xe0\xb1\xd7\x61\xbf\x9b\x20\x84\xa8\
-\xbb\x18\x3b\xd5\x62\x0c\x88\xe8\x24\xa2\x97\x80\xa9\x04\x4c\x25\
-\xa2\x43\xb4\x12\x21\xa2\xa7\x88\x3d\xf4\x98\x42\xef\xdf\x93\x0e\
-\x4e\x22\xbe\xff\x8d\x5f\x89\x97\xdd\x73\xe6\x20\xb6\xe0\xb7\x40\
-\x35\x26\x97\x0e\xe0\xb3\x7c\x5e\x65\xa9\x3f\xd5\xed\xbe\xf3\x37\
-\x9e\xc4\xff\xe7\x1d\xff\x08\x2b\xfe\x10\x02\x5f\x83\xa0\x57\x78\
-\xc7\xf6\xdb\x8b\x58\xa3\xa7\x1a\x3d\x4d\x35\xbe\xb0\xb6\xf9\xf4\
-\x7b\x2a\x21\x15\x39\x62\x67\xe5\x08\x36\xc6\x2b\x80\xd0\xc0\xc8\
-\x57\x9b\xa3\x18\xfb\xed\xba\x7e\x50\x63\xae\x33\x59\x24\x86\xa0\
-\xa6\xec\x42\xa8\xda\x8b\x19\xfd\x2a\x9d\x09\x54\xad\xc0\x9c\x06\
-\xbb\x52\x52\x54\xce\xc5\xa5\x8d\x3b\xd5\xc8\x6d\xc9\x10\xa0\xc6\
-\x4c\x29\xba\xbb\x2c\xa9\x95\x22\x7e\x93\xb3\x01\x8f\xd6\x15\xb2\
-\x90\x33\x80\xcf\x79\xfb\x59\x57\x5a\x82\x9a\x0d\xa4\x48\x6f\xa4\
-\x26\x47\xb9\x03\xe0\x8c\x0f\xa0\x5f\x57\x2d\xc0\xac\x88\xa4\x8e\
-\x27\x47\xfb\x1a\xf0\xa3\x0a\x14\x04\x86\x9e\xa1\x76\x0e\xa2\x72\
-\xeb\x89\x2e\xcc\x1c\xd0\x47\xed\x0c\x74\xbd\x8d\x0b\x77\xc6\x16\
-\x0c\xbd\x66\x01\x31\x42\x58\xb0\x3b\xbd\x82\x9b\xd6\x6f\xc7\x99\
-\xd5\x5b\xb0\x37\xdd\x47\xe8\x6d\xf3\x72\x48\xed\x3f\x8d\xf6\xd1\
-\x4a\x81\xce\x32\x83\x0e\x7a\x13\x08\x3a\x04\x74\x88\xe8\x89\xb1\
-\xc7\x01\x5b\xcd\x2a\xfe\xc9\x3b\xbe\x06\xc7\xcf\x6c\x1c\xe4\x04\
-\xfe\x12\x80\xdf\xb5\x74\x00\x9f\xbd\x73\x02\xc0\x3f\x41\xbd\xa2\
-\x2b\x02\xab\x6b\x23\xfc\xc3\x77\x7c\x3f\xce\xac\xde\x8d\x69\xbc\
-\x68\x86\x9e\x0c\xbf\x07\x4b\xa7\x06\x2f\x92\xd7\x74\xe5\x9b\x21\
-\xc1\x85\x74\xa2\x48\xb3\xc3\x08\x27\xd7\x8f\xea\xe8\x68\x85\x4d\
-\x35\x6e\x0d\x2b\xcd\x71\x43\xf9\x0b\x5f\xa0\x46\xb0\xa8\xfa\x9a\
-\x32\x2e\x90\x40\xc0\x64\xf0\xc6\x15\x48\x2f\x3f\x15\x46\x61\xb9\
-\x21\xab\xf6\x90\x19\x3b\x5c\x29\x1b\xb2\x63\x48\x04\x1c\x97\x9c\
-\x80\x42\x91\x39\xad\x77\x40\x9b\x4a\x86\x2a\xda\x7b\xaf\xdd\x82\
-\x12\xed\x0b\x2d\x3a\x19\x6d\x76\x1c\xf9\xfb\xa6\x09\xe0\x2a\xc3\
-\x4f\x8e\x23\x77\x40\x0d\xed\xa7\x1a\x33\x19\xce\x59\xd4\x33\x00\
-\x34\xf3\xb5\xbe\x70\x32\x57\x02\xa4\x2f\x99\x39\x8b\x80\x6a\x6b\
-\x30\xa0\xb7\xb6\x60\x97\x3a\x02\x61\x82\xae\x53\x3c\x20\xc4\x00\
-\x66\xc1\xa4\xdb\xc3\x83\x47\x5e\x07\x8a\x0d\xfa\x3e\xa2\xef\x23\
-\x42\xaf\xc0\x60\x6f\x5a\x04\x9d\xf0\x00\xfc\x0b\x88\x06\x0e\x86\
-\x14\x52\x10\x0c\x0f\xd8\xe3\x09\x5e\xb4\x7e\x1a\x3f\xf8\x55\xef\
-\x40\xb3\xea\x16\x81\x82\x0e\x2a\x24\xf2\xe0\xd2\x01\x7c\xe6\xa7\
-\x01\xf0\x8f\xa0\xe3\xbd\x35\x54\x8f\xbf\xf2\xe5\x7f\x02\x5f\x7a\
-\xfa\x2b\x31\x09\x17\xc0\x32\x35\x83\xef\xc0\xdc\x83\x25\x2c\xb8\
-\x25\x67\xa0\x3d\xe6\x94\xf2\x07\x73\x00\x3d\x33\x0e\x8f\x0f\x63\
-\x6d\xd4\xe6\x29\xbb\x14\xad\x57\x9a\x13\xf0\x6e\xdd\x7a\xd6\x54\
-\x15\x00\x85\x1b\x20\x52\xa5\xec\xa9\xc6\x17\x67\x23\x78\x55\xdd\
-\x8f\x6a\x28\x28\x4d\x06\x90\xcb\x7a\x79\x85\x30\x94\x9c\x84\xcb\
-\x3c\x83\x5a\x8d\xd8\x25\x66\xa1\xb5\x09\xc9\xda\x8b\x8d\x65\x00\
-\x69\x90\xa8\xad\xe6\x07\x52\x7a\x9f\xda\x8a\x99\x5b\x90\xc0\xc0\
-\xaa\xed\x97\x6a\xff\xb4\xa5\x57\x9d\x40\x62\x2d\x1a\x39\x88\x92\
-\x30\x88\x0d\x09\x51\x71\x06\xf3\x25\x4e\x8d\x9b\xcc\x34\x04\x1c\
-\x06\xad\x00\x19\xc2\x84\x19\x9f\x91\xec\x04\xb4\x14\xc8\x43\x43\
-\x75\x16\x10\x15\x1f\x08\x31\x80\x23\x63\x1a\xa6\xd8\x6a\x76\x70\
-\xe7\xa1\x97\x60\x77\xb2\x8f\xbe\x17\xf4\x5d\x44\xdf\x45\x5d\xc3\
-\x26\x4a\x13\xee\x24\x22\x4a\xc4\x54\x22\x26\x92\x4a\x01\x1b\x1d\
-\x46\xc4\x04\x21\x97\x03\xbd\xec\xe3\xb7\x9f\xb9\x17\xff\xcb\x5b\
-\x5f\x9b\xb1\xe5\x99\xb3\x6d\x9d\xaa\x13\x4b\x07\xf0\x99\x9d\xbf\
-\x88\xd9\x6d\x3d\x53\xe0\x77\xbc\xfc\xad\xf8\x8e\x07\xff\x17\x4c\
-\xc2\x65\x44\xec\x43\xa4\x03\xcb\x14\x51\x7a\xfb\x38\xd5\xd6\x91\
-\x44\x13\x9b\x88\x60\x0e\xd6\x4e\x52\xc3\xef\x62\x34\x62\x48\x44\
-\xe0\x08\x87\x06\x27\xd6\x8f\x60\x18\xc7\x05\x8d\xdb\x44\xeb\x8f\
-\x69\x14\x37\xf2\x50\xa2\x0c\x95\x94\xb6\xbe\x58\x29\x13\x8a\xf2\
-\xe2\x90\x9c\x03\xcb\xc0\x18\x86\x6d\x30\x1a\x70\x0a\xe6\x22\x7e\
-\x45\x13\xce\x1b\x76\x6a\x50\x31\xd7\xdd\x34\x18\x30\x4a\x4c\x41\
-\x47\x25\xc5\xf7\xa9\x04\xc8\xbd\xfe\x12\xf1\x13\x1e\x40\xb9\x55\
-\x49\x15\x27\x81\x72\x4b\x90\x12\x19\xc8\x13\x9c\x2b\x2a\xc3\x35\
-\x01\x08\xd5\x38\x35\xd1\x3c\xc0\x37\x9b\x19\x14\x85\x54\x0c\x17\
-\x7a\x64\xb9\xf1\xba\x14\x88\xe8\x43\x4d\x13\x56\x07\xd0\x47\x53\
-\x14\x0a\x3d\x62\x8c\x90\x08\xec\x4e\xaf\xe0\xee\xed\x07\xb1\x4e\
-\xdb\xe8\xba\xbe\x38\x81\x9e\x33\x0e\xd0\x49\xcc\xdd\x81\x08\x46\
-\xcf\x01\x1d\x02\x26\xe8\xd1\x19\x5e\x30\x45\x8f\x29\x02\xf6\xa5\
-\x47\xc0\x1e\xbe\xfb\xc1\x37\xe2\x2d\x2f\xbd\xe5\xa0\xc1\xa1\x3b\
-\xa1\x94\xe1\x66\xe9\x00\x7e\x6b\xe7\xcb\xa0\x5b\x5b\xca\xe9\x81\
-\xdb\xce\x9d\xc5\xdf\x7d\xf3\xff\x06\x8a\x84\xc0\xbb\x10\x9e\x56\
-\x19\x80\x39\x01\x8e\xf6\xb1\x57\xe3\x97\x88\x28\x9a\x12\xb2\xa8\
-\xe1\x47\x13\x92\x8c\x2c\xe8\x38\xe0\xf0\xf8\x30\x36\xc6\x2b\xda\
-\x2b\xa0\x52\xfb\x8f\xfc\x71\x03\xfe\xea\xa2\xa0\xe6\xb3\x57\xbd\
-\xee\x7c\xcd\xba\xca\xa6\xa9\x94\x02\x49\xea\xbb\x50\xe4\x86\x72\
-\x62\xae\x6a\x11\xe6\x3a\x38\xb9\x98\x54\x52\x58\xa7\x00\x43\x19\
-\xae\x01\x28\x47\x55\x7b\xcf\x9c\x47\x8e\xf2\xc6\x0d\x48\x78\x42\
-\x7a\x4c\x93\x67\x09\x92\x43\x28\xca\xbc\x64\xdd\x05\x57\x2b\x1e\
-\x27\x4c\x20\x0f\x3c\x25\xae\x42\xa6\xfc\x0f\xbb\x00\x34\x1c\xb3\
-\x9e\x6f\x07\xd6\xe0\x00\x86\xb5\x41\xa5\x34\x9c\x06\x86\xa2\x30\
-\x38\x95\x02\xa1\xd7\x12\xa0\x2b\x04\xa1\xae\xef\xd0\xc7\xc2\x0d\
-\x68\xd0\xe0\xc5\x87\x5f\x85\xbd\xc9\x04\xa1\x63\xf4\x53\x46\x37\
-\xd5\x8d\xcd\xbd\x68\xca\x3f\xb5\x8c\xa0\x33\x6e\xc0\x44\x22\xa6\
-\x62\x1f\xa1\x4e\x62\x2a\x11\xfb\xe8\xb1\xcf\x1d\x1a\x10\xbe\xff\
-\xcb\xbf\x12\xa7\x6e\xd8\x38\x68\xb7\xd0\x6f\x07\xf0\xe7\x97\x0e\
-\xe0\xd3\x3f\x27\xad\x8e\x6a\xea\x7e\xff\x68\xec\xf1\x37\xdf\xfa\
-\xd7\x70\x7c\xf5\x46\xec\xc7\xab\x60\xec\x23\xca\x3e\xa2\x4c\x10\
-\x65\x8a\xc8\x1a\xfd\xa3\xd8\x1b\x2f\x51\x9d\x00\x07\x5d\xb7\xcd\
-\x9a\x36\xf6\xe9\x26\x01\x3d\x07\x08\x7b\x9c\x58\x3b\x36\x40\x9f\
-\x09\x84\xd6\x6d\xa3\xf5\x47\x2a\x63\xf6\x33\xc1\x9a\x80\x01\xbf\
-\x65\x2e\x64\xe5\x85\x3e\xb9\xc7\x4f\x2e\x67\x0f\x83\x9f\xa4\xaa\
-\x61\x6e\x1c\x43\x4a\x4a\xc3\x29\xda\xa3\xd0\xe9\x52\xc7\x81\xaa\
-\x08\x5b\xe8\xce\xea\x24\x72\x7b\x8f\xd2\x47\x18\x79\x47\x71\x83\
-\x96\x34\x3b\xf0\x73\x08\xbe\xcb\xac\x43\x97\xa9\xca\xfa\x5c\x3c\
-\x6a\xe9\xf3\xaa\xe4\x71\xc8\xd2\xe9\x09\x9b\xa8\x1f\x03\x0c\x9f\
-\xe3\xc0\xee\x65\xd6\x13\xcc\x7c\x5e\xf7\xde\x8d\x1d\xc8\x96\xc9\
-\x85\xd8\xa3\x8f\x01\x5d\xdf\x61\xd2\xed\x63\xd2\x4f\xcc\x09\xe8\
-\xc0\x50\x8c\x01\x91\x05\xbb\xd3\xab\xb8\x69\xfd\x0e\x1c\x6d\xce\
-\x60\x7f\x3a\x41\xdf\x31\x42\x17\xd1\x4f\x23\xba\xa8\x38\xc0\xd4\
-\x1c\x41\xc7\x6a\xe8\x5a\x22\xe8\x75\x92\x9c\xc1\x54\x34\x1b\x98\
-\x48\xc0\x55\xde\xc7\xf9\x95\x1d\x7c\xdf\xdb\xbe\x5c\x47\x84\x78\
-\xe1\xb5\xfc\xe7\x00\x7c\xf9\xd2\x01\x7c\x7a\xe7\xff\x40\xcd\xf1\
-\xb7\xe8\xff\x9d\x5f\xf2\x4d\x78\xdb\xb9\xb7\xe2\xca\xf4\x12\x58\
-\x26\x60\xde\xd7\x8f\xb2\x8f\xc8\xc9\x09\xf4\x56\x0a\x74\xea\x08\
-\xac\x14\x88\x1c\x54\x6c\xc2\xea\xfd\x20\x11\x3d\x33\x26\xb1\xc7\
-\xd6\x68\x1b\x87\xc6\x6b\x45\x61\x07\xda\x6b\x6f\xfd\x51\x10\x8d\
-\x80\x41\xa2\x4f\x83\x36\x60\x2e\x07\x16\xb8\x01\xd5\xcf\xc6\x40\
-\x1b\x5b\xec\x77\x17\x0e\x41\xa2\x0f\x7b\x8b\xfe\x52\x66\x08\xaa\
-\x30\x49\x06\xdc\xd5\x3c\x02\x57\x0f\xd7\xa0\xea\x0e\x00\xa6\x3f\
-\xd0\xd8\x74\x62\xa1\x14\xe7\xec\x20\xe3\x01\xd6\xea\xb3\x92\x47\
-\xb3\x04\x54\x6d\x3d\x0c\x01\x42\x5f\x51\x96\xd3\x1c\x40\x72\x40\
-\x99\xb1\x48\x25\xfa\x67\xbf\x46\x8b\x6d\x1c\xa8\x5a\xa6\x0b\xae\
-\x04\x1a\x62\x01\x59\x4f\x90\x13\x4d\x98\x11\x63\x50\x8d\x80\xd8\
-\x63\x3a\xed\x30\x35\x70\xb0\xb7\xb6\x60\x34\x40\x30\xc6\x1e\x0f\
-\xec\xbc\x16\xdd\xd4\x80\xc0\x9e\xd1\xf7\xac\xed\x41\x89\x08\x12\
-\x31\xe5\xa0\x81\xc1\x8c\x7c\x2a\x41\x39\x03\x86\x0d\x74\xd9\x19\
-\x44\xec\x71\xc0\xa5\xb8\x8b\xdf\x79\xd3\xdd\xf8\xe6\xdf\xf6\xc0\
-\x41\x59\x40\x03\xe0\x07\xa0\xdb\xa8\x96\x0e\xe0\x59\x9c\x6f\x05\
-\xf0\x35\x83\x7b\x3a\xe0\x55\x77\xde\x8b\x3f\xf3\xca\x3f\x8d\xab\
-\xdd\xae\x19\xfa\x2e\xa2\xec\x9b\xf1\x5b\xdd\xcf\x3d\xa2\x74\x88\
-\xdc\x21\x70\x72\x06\x4a\x21\x0d\x1c\x0d\x3c\x2a\x19\x80\x22\xc5\
-\x84\x93\x6b\xc7\x8b\x6a\xad\x5d\x85\xde\x6d\xa2\x71\xdb\xf6\x35\
-\x63\xd8\xb1\x76\x83\x28\x45\xf5\x55\x5c\x47\x76\xa9\x41\x2f\x1b\
-\x28\x92\xfa\xe7\x92\xd4\xb8\x1b\x38\x19\xa2\xd9\xe1\xa3\x21\x95\
-\x98\xc8\x0f\x24\x8b\xc8\xf2\xee\x22\x40\x4a\x25\x1b\x70\xae\x32\
-\xfe\x32\x4b\xe0\x50\xb5\x12\x2d\x7a\xfb\xaa\x9f\xef\x8d\xdd\xe7\
-\x5d\xdd\xd6\x23\x23\xf8\xa5\xcf\x9d\xa5\xfe\xa9\x25\x4a\x83\xf9\
-\x0b\xaa\x70\x0e\x19\xd8\xb3\x0c\xec\xba\x86\x42\x64\x06\x27\x18\
-\x38\x05\x29\x9f\xe8\x86\x63\x73\x02\x51\xb5\x03\xb4\x05\xd8\x15\
-\x30\x30\xf4\x36\x1a\xac\xdc\x81\xbd\x7e\x17\xa7\x57\xcf\xe2\xec\
-\xca\x6d\xd8\x9d\xee\x23\x4c\x35\x03\x98\xec\x1b\x1e\xc0\x8c\x29\
-\x07\xec\x73\xd4\xcf\x25\x62\xc2\xca\x11\x98\x72\xca\x04\x02\x3a\
-\xe9\xb1\x2f\x3d\xf6\x25\x60\xc2\x3d\xae\x84\x09\xbe\xe7\xd5\x6f\
-\xc0\x9d\xb7\x1d\x3b\xa8\x35\x78\x83\xb5\xb1\xdd\xd2\x01\x5c\xff\
-\xdc\x0a\xe0\xaf\x0e\xee\x89\xc0\xda\xc6\x18\xdf\xfb\xa6\xbf\x88\
-\x35\x5a\xc7\x34\xec\x83\x79\x0f\x2c\x7b\x88\xb2\x87\xc8\x7b\x39\
-\xfa\x07\x9e\x22\x70\x87\xc0\x41\x5b\x45\x56\x23\x06\x56\x6e\x40\
-\x17\x23\x7a\xd6\xb4\x7f\x1a\x23\xa6\x31\x62\xad\xd9\xc4\xe1\xb5\
-\x0d\x55\xfa\xc9\xd7\x9c\x47\xeb\x8e\xc2\x91\xe6\x75\x4a\xc5\x5d\
-\x74\x4d\xba\xc1\x45\x39\x1f\xc2\xa8\x5a\x95\x45\x55\xbf\xbf\x32\
-\x5e\x67\x08\x77\x05\xf8\x0d\xb2\xde\x99\xa2\x39\x93\x8e\xf2\x94\
-\x23\x55\x29\x76\xad\x6b\x46\x15\x90\xe7\xf2\x68\x92\x99\x7e\x06\
-\xf5\x52\x1b\x50\x23\xfb\xb0\x1c\xf0\x55\x2f\xdf\x55\xa8\xbe\xa3\
-\xa1\x5a\x32\xf9\xe2\x74\xe0\xa4\x72\x40\x43\xb0\xb3\x94\xf4\xb4\
-\x30\xd0\x13\x2d\xca\x02\xa8\x5e\x38\x58\x5e\xff\x54\x0a\x58\x0b\
-\xb7\x0f\x01\xc1\x68\xc2\xd3\xae\xea\x0a\xf4\x9a\x19\x44\x56\x6e\
-\xc0\x34\xec\xe3\xc5\x3b\xaf\x82\x74\x1e\xd3\x89\x3a\x80\xbe\x8b\
-\x98\xee\x47\x4c\xad\x35\xd8\xb3\xe1\x00\x6c\xe0\x5f\x8a\xfa\x1c\
-\x30\x35\xe7\xb0\x6f\xf7\xef\x49\x8f\x6b\xb1\xc3\xe1\x66\x05\xdf\
-\xfb\xe6\x37\xa2\x5d\x5b\xd8\x1a\x84\x81\xd9\x7f\x78\xe9\x00\xae\
-\xff\x7c\xfe\x16\x54\xcb\x7f\xe0\x00\xbe\xeb\xb5\xdf\x88\x57\x9e\
-\x78\x25\xae\x74\x97\x35\xe2\xcb\x2e\x82\xec\x22\xf2\x1e\x82\x4c\
-\x14\x03\xe0\x54\xfb\xa7\x0c\x20\x45\x7c\xd5\x8f\xeb\xed\xcd\xec\
-\x24\xa2\x8b\x01\x81\x95\x11\x76\x72\xfd\x28\x46\xde\x0f\x50\x29\
-\xef\xd7\xd1\xb8\xad\xea\x49\x70\x89\xff\xb9\x7e\xa5\x61\xda\x2a\
-\x54\x45\x77\x54\x7c\x7f\x19\x04\x30\x41\x19\x43\x16\xaa\xcd\x21\
-\xcd\x29\x54\x24\x21\xc8\x8c\x3d\xd0\x30\x14\xba\x19\x01\xd3\x1a\
-\x48\xc4\xbc\xd6\x41\x4d\xf2\x29\x9d\x85\xa2\x57\x98\x74\xfd\x3c\
-\x55\x73\x07\x69\x20\xc9\xb2\x82\x44\x45\xf6\x54\x38\x00\xd5\x80\
-\x5f\x2e\x1b\xb2\xe1\xd6\x23\xc2\x75\x4b\x70\x51\xb6\x3f\xf8\xe4\
-\x80\x2c\xa0\x4e\x08\xd8\x3a\x02\xc2\x45\x3d\xa8\x53\xdd\x80\xae\
-\x9b\x68\x19\x10\x3b\x1d\x0a\x0a\xa9\x2d\x38\xc1\x91\x95\x63\xb8\
-\x75\xe3\x5e\x6d\x0b\x4e\x23\xc2\x94\xb5\x2d\xd8\x47\x84\xc8\xda\
-\x15\xb0\x40\xd1\xb1\x65\x01\xdc\x5b\x8b\x50\xa3\xff\x24\xf6\xea\
-\x20\x2c\x53\x78\xa2\xdb\xc5\x97\x9c\x3e\x8f\x6f\x7c\xcd\x8b\x17\
-\x4d\x0d\xa6\xf3\x57\x00\xdc\xbd\x74\x00\x8b\xcf\x37\x62\x56\x65\
-\xa5\x03\x1e\xb8\xe5\x76\xfc\x91\x97\x7c\x3b\xae\x4e\xaf\x98\xb1\
-\x5f\x43\x60\x8b\xfc\xb2\x8b\xc0\x13\xbd\xc5\x49\x95\x01\xf4\x7a\
-\x8b\x1d\x82\x68\x26\xd0\x47\xbd\x4d\x63\x44\xcf\x82\x69\x0c\x68\
-\x69\x05\x27\xd6\x76\x54\xbf\x3e\x9b\xad\x43\x43\x3b\x56\xfb\x63\
-\x86\xb6\xa6\x56\x5b\x9b\x65\x92\x07\x3b\xf0\x4a\xad\xc6\x8c\x93\
-\xe1\x8a\xed\xd3\x1e\x34\xfe\x72\x19\x20\x96\xea\x97\x7a\x1e\x95\
-\x46\xe1\x60\xf8\x68\xae\xd5\x56\x0c\x19\x75\x67\x21\xd1\x91\xab\
-\xd6\xa2\xcf\xa0\x1f\xaa\x8e\x81\x22\x11\x03\x75\xa2\x5c\x1e\x50\
-\x06\x08\xc9\x95\xe7\xe8\x92\x16\x98\xab\x32\x9a\x0a\x04\x1c\xcc\
-\xf9\x98\x84\x3a\xf2\xae\xc5\x79\xcc\x8f\xb0\x18\x03\x2c\x0a\xa2\
-\xc8\x59\x95\x4a\x8b\xb3\xe9\x07\x68\x79\x17\x63\x40\xdf\xf7\x19\
-\x07\xc8\x1d\x81\x3e\x65\x01\xc0\x5e\x77\x15\xf7\xed\xbc\x1c\x23\
-\x59\x45\xd7\x85\xdc\x15\x98\xee\x07\x4c\xfb\x88\x8e\x05\x5d\xd4\
-\x92\xa0\x8b\x9a\x39\x4e\x62\xc4\x24\x06\x4c\x38\xa2\x63\xcd\x08\
-\xf6\xa4\xcf\x0e\xa1\x17\xc6\xb5\x6e\x82\x3f\xfa\xb2\x57\xe0\xe6\
-\xf3\x87\x0f\xc2\x03\xb6\x0c\xdf\x1a\x2d\x1d\xc0\x3c\xea\xff\x57\
-\x06\xf7\x30\xd0\xac\x78\xfc\x85\xd7\xff\x71\xac\xfb\x35\x4c\xc2\
-\xae\x19\xff\xae\xd6\xff\xbc\x87\xc0\x13\xc4\xb8\x6f\x86\x3f\xb5\
-\xba\xbf\x53\xc3\xb7\x7e\x70\xaa\xf9\xbb\xd8\xe7\xb4\x7f\x1a\x03\
-\xf6\x43\x87\xe3\xab\x47\xb0\xd6\x8e\x2c\xfd\xd7\x2b\xcb\xd1\x2a\
-\x3c\x6d\x21\x99\x2d\xcd\xd5\xfa\x15\x1a\x50\x3b\x87\x19\x3f\x20\
-\x33\x3f\x9b\x37\x6c\xce\x94\x07\xc3\x47\xd4\xe1\x51\x0a\x2d\xb8\
-\x6e\x35\xd6\xed\x32\xa9\xb8\x02\xd5\xf3\x21\xd4\x5a\x87\x09\x4b\
-\x90\x32\x49\x08\x37\x04\x02\x2d\xb2\xfb\x8a\x68\x44\x95\x73\xa0\
-\x6c\xb8\xe5\xf7\xb9\xba\xb5\x57\x8f\x2c\x0f\x5e\x8b\xa1\x03\x1b\
-\x10\x7c\x6a\x6c\x4f\xea\xd7\x40\x0e\x08\xf8\x84\xb9\x62\x8b\x8a\
-\xa2\x30\x57\x6d\xc1\x18\x7b\xf4\x49\x33\xa0\xef\x0c\x0f\x50\x2c\
-\x20\x44\xcd\x0a\xd7\x9b\x75\xdc\xb1\xf9\x62\xec\x4d\x26\x98\x4e\
-\x23\xfa\x4e\xe7\x04\xba\x49\xc4\x34\xf4\x1a\xf5\x63\x4a\xf9\xad\
-\x14\x60\x75\x06\xfb\x6c\x03\x45\xac\xf7\x4d\x39\x62\x9f\x7b\x5c\
-\x09\x1d\x0e\xb7\x2b\xf8\xd3\xaf\x7f\x2d\xdc\x88\x0e\xea\x0a\x7c\
-\x09\x80\xef\x58\x3a\x80\xe1\xf9\xcb\xa8\xd5\x7c\x0d\xf5\xff\x9d\
-\x2f\xf9\x32\xbc\xee\xf4\x2b\x71\xa5\xbb\x88\x28\xd7\x10\xe3\x55\
-\xf4\xbc\x8b\xc0\x7b\x08\x71\xdf\xa2\x7e\x15\xfd\x63\x97\x25\xa4\
-\x02\x5b\x1b\x87\xfb\xea\x8d\x0c\xe8\xa2\xbe\xb1\xc2\x0e\xa7\x37\
-\x8f\x59\x8a\x5a\xd2\xe5\xc6\x6d\x81\xdc\x18\xc3\x69\x14\xcc\xf4\
-\xa3\x2b\xd4\x9f\x64\x1e\xa3\x1a\x26\xaa\x33\x59\x2d\x65\x66\xdb\
-\xa2\x14\x37\x39\x17\xa9\x41\x44\x1a\x1a\x16\xe5\x5e\x65\x95\xba\
-\xcf\x3c\xc6\xcd\x70\xeb\x35\x2b\x10\x93\x1d\x47\x55\xeb\x53\x51\
-\x26\x42\x62\xfb\x95\xf6\x5d\xcd\xe9\x4f\xb8\x41\xf9\x3b\x43\xfe\
-\x7f\x7d\x1b\x64\x40\x34\x0f\xf6\x2d\xae\xf7\x67\xec\x5d\x66\x5e\
-\x98\x3a\x0b\xc8\x65\x00\x6c\xb3\xb1\xd2\x84\x43\x0c\xf9\x36\xed\
-\xad\x1c\xe8\x3b\xf4\xa1\x43\x17\x3a\xc4\x18\xc1\x51\xb0\x1f\x76\
-\x71\xf7\xe1\x07\xb0\xc2\x9b\xe8\xa6\x01\xfd\x24\xa0\xcf\xa5\x80\
-\xee\x2c\xec\x98\xf5\xda\x89\x01\x7d\x54\x43\x9f\xb0\x66\x02\x53\
-\x2b\x01\xf6\x39\x60\x8f\x15\x0c\x9c\x4a\x8f\xa7\x27\x7b\x78\xfd\
-\xd9\x73\x78\xcb\xfd\xb7\x5c\xaf\x14\xf8\xf3\xd0\x6d\xc4\x4b\x07\
-\x00\xe0\x35\x98\x95\x5a\x0e\xc0\x89\x63\xdb\xf8\x9f\x5e\xfa\xfb\
-\xb1\xdf\x5d\x43\x1f\xae\x22\xc4\xab\x08\xbc\x6b\xb7\x6b\x08\xbc\
-\x6f\xe9\x7f\x8a\xfe\x9a\xf6\xf7\xa1\xb3\x61\x11\xbd\xa9\xc1\x4f\
-\xd1\xc5\x80\x2e\x44\x4c\x43\xc0\x24\xf4\xd8\x1a\x1d\xc2\xce\xea\
-\x26\xd8\x16\x6e\x68\x94\x1a\xc1\x55\xd1\x1f\x33\xc8\xf5\xd0\xac\
-\x65\x58\x1a\x0c\xaa\x7c\xcc\xfc\x86\x94\xf2\xcb\xec\x15\x8e\xbc\
-\x06\x68\x10\xdd\x28\x8b\x8c\x0c\xb9\x09\xbe\xea\xad\x4b\xe1\xce\
-\x63\x86\x86\x4c\x94\xd3\xe6\x62\xc8\x2e\xcf\x0c\x54\xe5\xb9\x1a\
-\x7d\x9e\x41\x48\x92\x69\xae\x10\x7b\x80\x61\x67\xc1\x0d\xc7\xfd\
-\x4b\x99\xe2\x2a\x01\x90\x32\xa7\x40\xb3\x1d\x3d\xaa\x9c\x52\x9d\
-\xf3\xcb\xd0\x17\x2e\x6c\x0b\xd6\xbc\xa0\xc1\xb4\xa0\x94\x99\x0e\
-\xeb\x06\xe8\x60\x50\x67\x98\x80\xb1\x04\x6d\xc7\x60\x64\xc5\x0b\
-\x56\xda\x55\xdc\xbd\xfd\x20\xf6\xf6\xf7\xd1\x4d\x19\xdd\x7e\xcc\
-\xb7\x69\xe2\x07\xc4\x88\x2e\x6a\x77\xa0\x8f\x8a\x0b\xf4\x31\x39\
-\x81\xa0\xd9\x25\x07\x4c\x99\xcd\x21\x44\xec\x87\x80\x6f\x7f\xd9\
-\x4b\x71\x68\x67\x7c\x10\x20\x78\x78\x0e\xec\xfe\x22\x75\x00\xde\
-\xa2\x7f\x33\x1b\x34\xff\xd0\x2b\xbe\x0e\x67\xd6\x4f\xe0\x5a\xff\
-\x14\x7a\xb9\x86\x9e\x77\xd1\xc7\x6b\x08\x51\xeb\xfe\x7e\x60\xfc\
-\x06\xf6\xc4\x5e\x3f\xb2\x3a\x81\x8e\x7b\x74\x31\x62\x1a\x19\xfb\
-\xf6\xa6\xf5\x1c\xd1\x85\x88\xb3\x9b\x27\xd0\x7a\x3f\xf8\xa3\xde\
-\x6d\xc0\xd1\xea\xe2\xe8\x3f\x17\xf1\x69\x01\x69\x85\x0a\x2e\x20\
-\x85\x23\x90\xf7\xec\x48\x0d\xf6\xd5\xbf\x7f\x06\xe1\xb6\xfd\x59\
-\x54\x0f\xd7\x57\xed\x48\xa9\x79\x09\x96\x11\xcc\x02\x6c\x09\xb8\
-\xcb\x25\x44\x9e\x54\x4c\x06\x4e\x95\x0a\x31\xf2\xd0\x4f\xe2\x17\
-\x38\x1b\x3b\xce\x40\x63\xcd\x80\xc8\x14\xe7\xba\x45\x89\x21\x5e\
-\x41\xb5\xc1\xcf\x3a\x81\xa1\x01\x2f\xcc\xf4\xd3\xe3\x16\xbe\xce\
-\x15\x03\x23\xad\x1f\x12\xce\x4c\xcf\x68\x1d\x81\xbe\xb7\x96\x60\
-\x76\x00\x86\x05\xc4\x08\x66\xc1\x5e\x7f\x0d\x77\xec\xdc\x87\x55\
-\x39\xa4\x59\x40\xaf\xd1\xbf\xdb\x8f\xe8\x27\x8c\xae\xd7\x2c\xb2\
-\x63\xed\x10\xd4\x99\xc0\x94\x25\x67\x03\x8a\x11\xf4\xd8\x8b\x01\
-\xfb\x1c\x70\xa9\x9b\xe0\xdc\xe6\x16\xbe\xfe\xe5\xf7\x1e\x54\x06\
-\x00\xc0\x3b\x01\x7c\xd5\x17\xbb\x03\xf8\x3a\x00\x6f\x98\x4d\xfd\
-\xef\xba\xf1\x1c\xbe\xfa\xf6\x37\xe2\xf2\xe4\x49\x84\x78\x0d\x7d\
-\x4c\x91\x7f\x1f\x81\xf7\xd1\xc7\x7d\x84\xb8\x8f\x3e\xec\xa3\x8f\
-\x13\xf4\x51\x01\xbf\x3e\x4e\xd1\xb3\x2e\x95\xe8\xb8\xc7\x34\x74\
-\x98\x84\xa9\xf2\xfe\x6d\xd1\xc4\x24\x04\xb4\x6e\x84\x33\x9b\x47\
-\xc0\xc2\xd5\x65\xd5\x68\xed\x4f\x35\x7b\xa5\x5a\x8f\x35\x53\xb7\
-\xcf\x65\x05\x59\x6a\xcc\x55\x86\x6f\x19\x81\xf0\x7c\x51\x20\xa8\
-\x96\x6f\x95\x9c\x02\x0b\x71\x7f\x07\xa9\x53\x7a\x99\x71\x40\x34\
-\x07\x29\x94\xda\xbf\x82\x28\x24\x51\x96\xaa\x29\x3c\x3f\xd0\x23\
-\x18\x66\x08\x54\xf5\xfc\xf3\x4c\x02\x2a\xfd\xff\x0a\xe1\x73\x79\
-\xa4\x9f\x2a\x1e\xb0\x94\xef\xb9\x05\xa8\x7e\x9e\xfe\xab\x29\x55\
-\x98\x23\xfe\x2c\xc4\x56\xab\x12\x09\xc0\x60\x45\x38\x8b\xaa\xff\
-\xf4\xa1\xc7\xb4\x4b\x23\xc3\xfa\xb1\xef\xa7\xca\x0b\x60\xe5\x0e\
-\xac\xb4\x63\xbc\x68\xfb\xa5\xd8\xdb\xdf\x47\xec\x04\xdd\x34\xa2\
-\x9b\xb0\x95\x04\x66\xf8\x41\x4b\xc8\x69\x64\x4c\x82\x46\xfe\x2e\
-\xf6\xe8\x92\x43\xb0\x5b\xce\x18\x38\xe2\xf2\x74\x8a\xaf\xbc\xe3\
-\x0e\xdc\x78\x76\xfb\x99\xba\x02\x1b\x5f\xac\x0e\x60\x15\xc0\x9f\
-\x9d\xb3\x8c\x06\xf8\xf6\x07\xdf\x81\x55\x22\x4c\xc2\x65\xad\xf9\
-\xcd\x09\xf4\xbc\x8f\x10\xa7\x08\x71\x82\xde\x36\xc5\x68\xe4\x57\
-\xe3\xcf\x3a\xf2\x51\xe7\xc2\xa7\x91\xd1\xd9\x9b\xb6\x1f\x02\xba\
-\xc8\xd8\xeb\xa7\x38\xb9\x76\x14\x9b\xe3\xb5\x0a\xfd\x07\x1c\x56\
-\x40\xb4\x5e\x45\x64\x99\x69\xed\x0f\x2c\xdf\x20\xe8\xe1\xf7\xa4\
-\x2e\x02\x12\x89\xa7\xea\x30\x08\xd5\x17\xf9\xf0\xf7\x89\xcc\x94\
-\x16\x42\x83\xce\x41\x71\x2e\xa9\xaf\x26\xb3\xa1\x32\x47\x7a\x47\
-\xa5\x88\xa1\x8a\xa8\x34\x90\x2e\x47\x49\xdf\x1d\x68\xd0\xa6\xf3\
-\x55\x29\x51\x91\x0f\x87\xbd\xfd\x02\xfc\x63\xc0\x62\xae\xfd\x02\
-\xcd\xa3\xfb\x43\x16\x35\x1d\x80\x98\xcc\x27\x4a\x38\xa8\x45\x98\
-\xb6\x0c\xa3\x1a\x19\x36\x87\x1f\x7a\x1d\x19\x9e\x76\x1d\xba\x2e\
-\x65\x02\x5a\x1a\x24\x76\xe0\x7e\x7f\x15\x2f\x3a\x76\x2f\xd6\x70\
-\x08\x93\x49\x8f\x7e\xc2\xca\x0d\x98\x2a\x20\xd8\x59\x29\x10\x62\
-\x44\x1f\xb9\x32\x74\xc6\x24\x58\x77\x80\x7b\x4c\x53\xcb\xd0\x4a\
-\x83\xbd\xbe\xc7\x9a\x6f\xf1\xf5\x2f\xb9\xe7\x7a\x96\x76\x37\x80\
-\x3f\xf8\xc5\xea\x00\x7e\x1f\x80\x17\xcd\xd6\xfe\xaf\xbc\xf9\x0e\
-\x7c\xc9\x0d\xf7\xe1\xf2\xf4\x82\x19\xff\x1e\x42\xdc\xb3\x48\x3f\
-\x41\x17\xf7\x6d\xe2\xab\x4e\xfb\xad\xc6\x8f\x9a\xfa\x4f\x83\xa2\
-\xfc\xd3\xd8\xd9\x1b\x16\xd0\x85\x80\x49\x08\x60\x06\x6e\xda\x3e\
-\x31\x50\xa0\x02\x04\xce\x6d\x80\xd0\xce\xa4\xe3\xb3\x00\x5f\xa9\
-\xe3\x67\xa3\xad\x58\x61\x9a\x0d\x3e\x5f\x98\x34\xcf\x0e\x14\x19\
-\x3a\x03\xa9\x5c\x88\x98\x20\x26\xd5\xbc\x3a\x29\x11\x53\x6a\x21\
-\x32\xaa\x7c\x11\x55\x33\x06\x35\xd7\x88\x2a\x63\xac\x35\x0e\x0b\
-\x98\xe7\x72\xed\x3f\x24\xfb\x14\x02\x4e\x35\x7c\x64\x9d\x84\xda\
-\xb9\xd4\xdd\x06\x4a\xe9\xfd\x0c\xd5\xef\xa0\x24\x9e\x16\x27\x33\
-\x07\x82\xa9\x8b\x3a\x08\xe9\x69\x0a\x2b\x45\x58\x33\x81\x58\x74\
-\x03\x6c\x2e\xa0\xb3\x92\x20\xf3\x02\x38\x22\x84\x88\xf1\x68\x84\
-\xbb\x77\x1e\xc4\xde\xfe\x1e\xfa\x29\x23\x74\xac\x18\xc0\x94\x0b\
-\x51\x28\x65\x02\x51\x3f\x76\x31\x58\xed\x6f\xdc\x81\xc8\x5a\x0e\
-\xb0\x52\xcc\x3b\x0e\xb8\x38\x99\xe0\x55\x37\x9c\xc5\xdd\xe7\x8e\
-\x1f\xd4\x16\x04\x80\x3f\x8e\xcf\xd3\xd8\xf0\xe7\xd3\x01\x1c\x02\
-\xf0\x27\x66\xdb\x7e\x6e\x44\xf8\xbd\xf7\xbe\x09\x1c\xa7\x98\x86\
-\x6b\xe8\xc3\x2e\xba\x78\x0d\x5d\xdc\x43\x1f\xf7\xf3\xad\x8b\x93\
-\xca\x01\x4c\xb3\x42\x4c\x1f\x03\xfa\x10\x2c\x65\x0b\x98\x06\xad\
-\xcd\x3a\x03\x03\xf7\x43\x8f\x8d\x66\x1d\xa7\x36\x8f\x20\x72\xac\
-\xa2\x6b\x0b\x47\x1b\x03\x23\x9b\xbb\xf8\x06\x96\x2a\x55\x1b\xca\
-\x9e\xbc\xed\x1a\x18\xa2\x5a\xb5\xec\x8d\xe4\xab\x55\xaa\xef\x8b\
-\x48\xe6\x05\x0c\xdb\x84\xd5\xfc\xcb\x22\x94\xac\x62\xc8\xd5\x06\
-\x2d\xb3\xcb\x38\x8b\xb8\xc1\xcc\x38\x6e\xbd\x0c\x45\x4a\x16\x30\
-\xd3\x8e\x4b\xed\xc0\x41\xad\x2f\x34\x50\x43\x1a\x4e\x47\x0e\x7a\
-\x24\xc3\xed\x40\x0b\x86\x01\xe8\x33\xb9\x8a\x64\x98\x05\x68\x57\
-\x20\x82\x19\x03\x72\x50\xdf\x75\x85\x0f\x60\xf4\xe0\xa4\x1f\xc8\
-\x2c\x98\x84\x5d\xdc\x79\xec\x5e\xc3\x02\x3a\x74\x53\x46\x98\x4a\
-\x19\x16\x9a\x44\x4c\x3b\xc3\x90\x82\x65\x00\x21\xa2\x0f\xa2\xd7\
-\x5a\x30\x72\x59\x8c\x56\x12\x18\xf8\x1c\x02\xc0\x84\x77\xdc\x7b\
-\x07\xa8\xa5\x83\xda\x44\xa7\x00\x7c\xd7\xe7\xc3\x08\x3f\x9f\x73\
-\xca\xbf\x17\x4a\xfb\x2d\x27\x02\xaf\xb8\xf9\x36\xdc\x7f\xf4\x06\
-\x5c\x99\x5c\x02\x4c\x9b\x05\xc2\x59\xba\x11\xa6\xf7\x97\xee\x53\
-\xa9\x28\x5b\xec\x94\xc8\x20\x62\x3c\x7f\x49\xad\x1c\x9d\x03\xe8\
-\x62\xc4\xa4\xef\x71\xef\x91\x63\x58\x6d\xc7\xe8\x62\x9f\x53\x6e\
-\xa2\x15\x10\x56\x17\x75\xfb\x2a\xb4\x4a\x06\xdf\xac\x95\x01\xa4\
-\x2a\xc0\x85\xa4\xf8\x09\x6b\x7e\xab\x0a\xd1\xb0\x0f\x2e\x8b\xba\
-\x5e\x09\x07\x90\x61\x47\x61\x36\x02\xca\xf0\xd1\xe5\xff\xd9\x79\
-\xd5\xb9\xb7\xd6\xfd\x43\xd0\xcd\x01\xa4\xfb\xc2\xab\x52\xdd\x1c\
-\x82\x01\x6b\xa0\x79\x7a\xae\x54\xec\xc7\x9a\xf1\x37\x28\x67\xa8\
-\x3c\x17\xfb\xe5\x8b\x01\x3f\x9a\x79\x15\xe4\xa0\x17\xe5\x40\xb4\
-\x90\xaa\xd7\x87\x0c\x23\x65\x27\x20\x61\xc4\x48\x70\x2e\x5a\xdf\
-\x3f\x6a\xf4\x37\x8a\xf0\xa8\x1d\x67\x07\xd0\xb6\x2d\x42\x88\x38\
-\xb4\x76\x08\x77\x6c\xdf\x87\x5f\xb9\xf0\x33\x68\x7d\x83\x2e\x75\
-\x50\x04\xc6\x9b\x88\x20\x11\x78\x4f\xe6\x53\x75\xdd\x68\xe3\x3c\
-\x22\x04\x2d\x1c\x02\x09\x9c\xb0\x3a\x47\x01\xbc\x10\xba\x18\xf1\
-\xa2\x63\xc7\x70\xcf\x0d\xc7\xf1\x6b\x1f\x79\x1c\x68\x17\xfe\x63\
-\xbe\x1d\x3a\x2b\xf0\xc8\x17\x43\x06\xb0\x02\xe0\x8f\xcc\x7a\x72\
-\x37\x72\xf8\x1d\x77\xbe\x02\x31\x4c\x31\x8d\xbb\xe8\xe2\xee\x30\
-\xe5\x0f\x9d\x46\xfe\xd0\xd9\x82\x88\xde\x96\x45\xf4\xe8\x43\x40\
-\x17\x7a\x4c\xed\xa6\xde\x57\x3f\xef\x43\xf2\xd6\x11\x10\xe0\xfc\
-\xce\x49\xcc\xc6\x2a\x8d\xfe\xbe\x32\x3a\x19\x32\x54\x66\x6a\xcd\
-\x62\x90\x3c\xec\xdd\x0b\x66\xda\x81\x3a\xbb\xbe\xf0\x92\xad\x3a\
-\x02\x83\x72\x7e\xd6\xe4\x05\xf3\x3f\x33\x43\x4d\x18\x46\x5f\x19\
-\x32\x0a\x06\x3b\xb8\x12\x08\x68\x05\x03\xe5\x39\xc2\x9a\x9b\x3c\
-\xf3\xea\x14\x71\xd0\xd2\x76\xac\x11\x7f\x9a\x99\x8f\x24\x73\x20\
-\xae\xaa\xf5\xe5\x00\x4a\xcf\x01\x40\xe6\xec\xb4\xa0\x1c\x58\x0c\
-\x54\xac\x40\xc9\x4b\x5e\x72\x19\x10\x59\x3b\x02\x96\x19\xaa\x80\
-\xc8\x34\xab\x0a\x67\xd1\x10\x16\x4c\xe3\x2e\xee\x39\xf9\x00\x5a\
-\x5e\x45\x37\x0d\xba\x52\x6c\xa2\xb7\xe9\x5e\x40\xe8\x04\xa1\x67\
-\xed\x14\x84\x88\x69\xb0\xa9\x52\x8b\xfa\x9d\x65\x06\x0a\x16\x5a\
-\x19\x60\xf7\x0b\x0b\xde\x72\xe7\x2d\x70\x07\x67\x01\x47\x3e\x1f\
-\x58\xc0\xe7\x2b\x03\x78\x27\x80\xbb\x66\x6b\xff\x97\xdc\x7c\x23\
-\xee\xde\x39\x85\xab\xdd\x15\x33\x9a\x68\x6f\x28\x9b\xd9\x68\x06\
-\xa0\xb6\x18\xf3\xe2\x88\x2c\xf1\x65\x23\x9b\xbd\x0d\x87\x28\x09\
-\x28\x58\x26\x20\xd8\xef\x7b\x1c\x5f\xdb\xc2\xc9\xcd\x1d\x04\x8e\
-\x66\x1c\x02\x41\x03\xa2\x55\x54\xda\xe0\x0b\x12\x70\x99\x63\x00\
-\x94\xc8\x96\x1c\x06\xcf\x5f\x9e\x29\xbd\x17\xc9\xa0\x21\xd9\x2e\
-\x82\xf4\x73\x62\x78\xc0\xc0\xb9\xa4\xd2\xa2\x72\x1e\x22\xe5\x27\
-\x73\x2e\x61\xb4\x64\xbd\xf8\x2b\xe7\x40\x02\x11\x02\x91\x4a\x9f\
-\x0f\x59\x8b\x52\x64\xca\x66\x9d\x49\xde\x7c\x6c\x19\x02\xd1\xa0\
-\x53\x31\xd3\xa1\x33\x19\x34\x19\x52\x78\x33\xee\xc0\x43\xed\xff\
-\x94\xb7\x2c\x44\xf4\xab\xc5\xac\x15\xf2\xcf\xf2\x4c\x97\x52\x95\
-\x22\x54\x7e\x4f\xc0\x10\x26\xb0\xa3\xdc\xf3\x8f\x19\x10\xec\x31\
-\xea\x3b\x8c\xba\x29\xfa\xd1\x58\xd5\x83\x63\x83\xae\xef\xb1\xbd\
-\x79\x18\xb7\x1c\x7e\x11\xde\xff\xd4\xbb\x55\x32\x4d\x74\x37\xa2\
-\x23\x42\xe7\x23\x00\x0f\x6a\x35\x73\x12\x8a\x80\x13\x30\x09\x5a\
-\x7b\x2f\x39\x56\x2b\xe6\xab\xce\x50\x3f\x8d\xb8\x75\xe7\x30\xee\
-\x38\x73\x04\x1f\x78\xf8\xc2\x41\x96\xf7\xad\x00\xfe\x36\x80\x27\
-\x5e\xc8\x0e\xc0\x01\xf8\x43\x8b\x9e\xc9\x5b\xce\xdf\x0d\x89\x3d\
-\xa6\xb1\x33\x1d\xff\x54\x17\x73\xae\xb1\x45\xd2\xc7\xe4\x00\xd2\
-\x3a\xe9\xa4\xf2\xc3\x66\xf8\x2a\xfd\x15\xd2\xd7\x31\x62\xbf\xeb\
-\x71\xfe\xec\x29\xac\x34\x25\xfd\xd7\x37\x68\x0c\x60\x3c\x93\x6e\
-\x0e\x8d\x38\x19\x22\x65\xa3\xe5\xb9\x46\x76\xed\x14\x44\x64\x61\
-\x85\xab\x86\x4e\x33\xd1\x6b\x3e\xe3\xc8\xe8\xbf\xc9\x60\xcd\x5f\
-\xee\x32\x70\x14\x92\xb3\x8b\xeb\xa5\xcd\x64\xce\x47\xe6\x1e\x43\
-\x04\x38\x19\x8c\x25\x0d\x34\x0f\x33\x26\x30\xbb\xc5\x27\x03\x99\
-\xb5\x50\x9a\x1c\x40\xe4\xa1\xeb\x82\x79\x8b\x91\xd5\xd9\x4c\x41\
-\xae\xeb\x0a\xea\xc4\x8c\x9d\x80\x58\x40\xc4\xb6\x51\xa8\x47\xd3\
-\xf7\x68\xad\x14\xe8\xda\x71\xce\x02\x9a\xa6\x41\xc3\x1e\x53\x9e\
-\xe0\xfe\xd3\x2f\xc5\x07\x9f\x78\x2f\xba\x69\x34\x92\x94\xa9\x36\
-\xb8\xa8\xcf\x20\x00\x34\x02\xc4\x6b\x00\x61\xa7\xaf\xa9\x87\xd8\
-\x3c\x85\x58\xa2\x44\x25\xa1\x13\xc1\xc8\x37\x78\xf5\xb9\x1b\xf1\
-\x81\x4f\x5c\x38\xe8\x9f\x70\xc2\xda\xe2\x7f\xfb\x85\xec\x00\x5e\
-\x05\xe0\x95\xb3\xb5\xff\x2d\x27\x8e\xe2\x9e\x9d\x93\xb8\x32\xb5\
-\xad\x3e\x69\x19\x1f\xd8\x50\x75\x8b\x94\x29\x76\xda\xe2\x0f\x11\
-\x28\xf1\x03\x82\xc0\x6c\xc2\x1f\xb6\x16\x9a\xa3\x49\x7d\x33\xa6\
-\x21\xc0\xc1\xe3\xf6\xa3\xa7\xaa\x68\x99\xaa\xf7\x55\x10\x9a\xfc\
-\x77\x65\x10\xe9\x87\x35\x76\x7a\x8c\xc6\xb7\xbc\x48\x6c\xc6\x2c\
-\x87\x7b\x89\x48\x34\x92\x15\xbc\xaa\xf4\xfb\x67\x99\x82\xf9\xa7\
-\x17\x3a\x17\xae\x52\x5d\xe4\x7b\xa4\x62\x1c\x24\xb0\x31\x3b\xaa\
-\x81\xd1\x48\xe5\x06\x68\x06\x93\x18\x72\xfd\x1d\x69\x64\x9b\x81\
-\xf9\x06\x5d\x04\x19\xf0\x23\x64\x4e\xc3\x53\x06\x65\xc7\x3c\x8b\
-\x92\x16\xa0\x1c\x83\x80\x2e\x8b\x63\xfd\x22\x17\x20\xd5\x9f\x97\
-\x2c\x1a\xc2\x60\x56\xe0\x32\xc6\x44\x0e\x0a\xa6\x17\x68\x37\xa3\
-\x08\xb7\xa1\x45\x0c\x2d\xa6\xdd\x04\xc7\xb7\x8f\xe3\xdc\xa1\x5b\
-\xf1\x91\x2b\x1f\x44\x43\xab\xe8\x48\x0d\xbf\x4b\xbe\x78\x04\xf4\
-\xa4\x3c\x7f\xe7\x04\xe2\xf4\x4d\xd6\x1c\xd5\xa1\x21\xc9\x7b\x1b\
-\x8a\x98\x29\xd0\x87\x1e\xb7\x1e\x39\x8c\x1b\x8e\x1e\xc2\x27\x9e\
-\xbc\x92\xc4\xa5\x66\xcf\x1f\x80\x2a\x61\x75\x2f\x54\x07\xf0\xcd\
-\x8b\xb0\x87\xd7\xdf\x70\x1b\xbc\x08\x26\xb1\x43\x4d\x9b\xcd\x73\
-\x74\xb6\xe5\xa7\x7c\x2c\x1b\x63\x22\x54\xdf\x8f\xcd\xe8\xcb\x1a\
-\x29\x4d\xfd\x23\x33\xf6\xfb\x80\x73\xdb\x3b\x38\x79\xe8\x08\x82\
-\x95\x11\x45\xd8\x63\x8c\x79\xc8\x4d\x86\x17\x66\x49\xd8\x2b\xc0\
-\x2d\x65\xfd\xf6\xfc\x24\x39\x10\xa9\x0c\xa4\x72\x10\xa9\x96\xa7\
-\x45\x75\x3d\x66\x7f\x7b\x36\x76\x35\x3d\x1e\xfe\x5d\x29\x4b\x4d\
-\x69\xce\x41\xe5\x9e\xe4\x82\xfc\x64\xf8\x7b\x07\x5d\x8f\x0a\xc7\
-\xd3\x04\x87\x06\xce\x84\x33\x43\x81\x8a\xc1\x49\x05\x68\x4a\x3d\
-\x09\xc5\xa5\x03\x71\x70\x58\x9f\xfb\x96\x1c\x94\x09\x5c\x37\xec\
-\x6b\xad\x20\x55\xed\x90\xfe\x2c\x8b\xc0\xb1\x61\x01\x89\x0c\xd6\
-\x77\xe8\xba\x1e\xdd\x48\x67\x03\xfa\xae\x47\x6c\x95\x18\xd4\xb0\
-\x47\xc0\x14\xf7\x9d\x7e\x29\x3e\x7c\xe1\x03\x08\x0d\xdb\xe4\xa4\
-\x66\x12\x0e\x0e\x01\x0c\x87\x08\x1a\xab\xc4\x23\x47\x01\x3b\x8f\
-\x06\x80\x27\xc9\xfb\x22\xbd\x30\xa2\x75\x88\x9c\x00\x91\x81\x71\
-\xe3\xf1\xd2\xb3\x67\xd4\x01\x2c\x3e\xf7\x40\xe5\xc3\x7e\xec\x85\
-\xe8\x00\x4e\x62\x96\xfa\xc8\xc0\xf6\xc6\x1a\xee\xdd\x39\x85\x6b\
-\xd3\x09\x18\x31\x47\x14\xca\xbc\xb5\x62\x58\x8a\xfe\x0b\x58\xd4\
-\xb4\x52\xed\xcf\x59\xe4\x53\xa3\x3f\x5b\xdd\x1f\x4c\x32\x6a\xda\
-\xf5\xb8\xe5\xc8\x69\x8c\xdc\x08\xd3\xd8\xdb\xf5\xce\x00\xb5\x56\
-\x02\x0c\xa3\xae\xd4\x35\xfc\x50\x90\x6e\x60\x0e\x42\x35\x81\x27\
-\x19\x53\x2a\x13\x6a\x48\x31\x6f\x21\x1c\xa6\xfc\xd5\x6f\x17\xc1\
-\xa7\x61\x28\xb3\xc8\xba\xcc\x90\x89\x16\x3c\xbe\x8e\xc6\x34\xcf\
-\xc5\x25\x33\xdc\x1c\xb9\x89\x67\xe3\x73\x79\xc6\x54\x83\x7d\x73\
-\x64\x88\x05\x02\x9f\xcf\xd4\x01\x78\x16\xd9\xbe\x3c\xfb\x0b\x4d\
-\xd2\x5b\xc1\x02\x26\x86\x13\xa7\x01\x22\x04\x53\x11\x56\x4e\x40\
-\xdf\x4d\xd1\x8d\x94\x1e\x3c\x1a\x45\x70\x64\x4c\xba\x7d\xdc\x78\
-\xec\x46\x1c\x5d\x39\x8d\xa7\x27\x8f\xc1\xd3\x0a\x7a\x12\x90\x63\
-\x78\x0a\x9a\x2d\xb2\x3a\x49\x1e\x09\x1a\xef\x21\x31\x82\x49\x94\
-\x4e\x0d\x75\x18\x51\x0a\x28\x4c\x02\x9b\x53\x60\xdc\x7c\xf8\x30\
-\x0e\xad\x8f\x71\x65\x6f\x7a\x10\x0c\xff\x7b\x5f\xa8\x0e\xe0\x2b\
-\x30\xbb\x41\x95\x81\x97\x9c\x3c\x83\x75\xdf\x60\xbf\x9f\x82\xc0\
-\x15\xaa\x8c\x02\xac\x59\xda\x2b\xc2\xc5\x84\x44\x10\x05\x60\x8e\
-\x60\xa0\x64\x00\xc2\x60\x46\xce\x00\x42\x8c\xf0\xe4\x70\xfb\xf1\
-\x53\x73\x97\xb3\x12\x7f\x9a\xda\x0c\x67\x50\xfc\xe1\xc7\x81\xd1\
-\x1a\x50\x59\xa2\x1c\x67\xe0\x2e\xff\x5c\x85\xec\x0d\x7e\x87\xcc\
-\x14\x18\x32\x4c\xff\x65\x0e\x74\xac\xdc\xc6\xe0\x77\xce\x18\x29\
-\xd5\x39\xf0\x2c\x1f\x81\x87\xc5\xca\xa0\x65\x38\xf3\xca\x58\x76\
-\x23\x78\x66\x43\x94\xba\xb1\x49\x72\x20\x8c\xba\xe8\x4e\x19\xf6\
-\x55\x9f\xd1\xd0\x17\xfa\x48\x59\x50\x0f\xa4\xad\x4c\x49\x3b\xd0\
-\x69\x8b\x38\x5a\x37\x28\x71\x01\xb2\x23\x88\x3d\x42\xdf\x23\x36\
-\x0d\x7c\xf4\x70\xab\x82\x7b\xcf\x3c\x88\x9f\x78\xff\x8f\x62\xec\
-\x55\x13\xd2\x3b\x42\x27\xa2\xad\x68\xd6\xd5\xea\x11\x0c\xf1\x02\
-\x38\x0f\xb6\xb2\xc9\xc3\xe5\xf9\x1f\x27\x35\xcb\x53\xd0\x33\xb0\
-\xea\x1b\xdc\x79\xec\x28\xfe\xc7\xc7\x3e\x79\xd0\x3f\xf3\x2d\x50\
-\x09\xb1\x4f\xbc\xd0\xda\x80\x5f\x3b\xfb\xe6\xf9\xd6\xe1\xc5\x47\
-\x4e\x61\xd2\x2b\x9d\xb7\x0b\x51\x75\xdc\x62\x9a\xe6\x8a\xe8\x12\
-\xeb\x2a\x04\x6b\xab\xd8\xe7\xe9\x8d\x8c\x01\xd3\xbe\x57\x32\x46\
-\x60\xf4\x41\xf4\x7b\xb6\xfd\x65\x7f\xda\xe3\xf8\xfa\x26\x4e\x1f\
-\x3a\x82\xc0\x61\x68\x98\x32\xce\x75\x33\x66\x62\xb2\xc8\x4c\x51\
-\x90\xb6\x0b\xd5\x84\x5f\xc1\x0c\x0e\xc0\x15\x18\x28\x8b\xb1\x84\
-\xaa\x9c\x11\x99\x01\xc7\x06\x58\xc1\x82\x52\x44\x16\x20\x0e\x52\
-\xa3\xf4\x83\x62\x60\xf0\x11\x25\x9f\xc2\xec\x6c\x7d\x7e\x2c\xd1\
-\x7c\x7c\xa6\x79\x2e\x42\x7e\x6e\xa9\x35\x5a\xf1\xa4\x6a\x43\x9e\
-\x1b\xa2\x94\x83\x50\xbb\xe1\xfd\xcf\x58\x0a\xd0\xc1\x1e\x22\x3b\
-\xa3\xbc\x17\x56\xc0\xd1\x36\x0a\x45\xed\xfd\x87\x10\xd0\xf5\xbd\
-\x69\x06\x0e\x25\xc4\x99\x19\x7b\xdd\x2e\xee\x3a\x7b\x37\x0e\x35\
-\x3b\xe8\xba\x4e\x1d\xc7\x34\x22\xf6\xba\x65\x98\x7b\xc6\x74\xa2\
-\x33\x03\x61\x9a\x5a\x83\x8c\x60\x2d\xe7\x2e\x7d\x1d\x4b\x0b\xba\
-\xef\x75\xb8\x68\xda\x47\xdc\xbe\x73\x04\xbe\x39\xb0\x25\x78\x08\
-\xc0\x57\xbf\xd0\x32\x80\x5b\x01\xbc\x6e\x36\xfa\xdf\xb0\xbd\x85\
-\xe3\xe3\x75\xec\x75\xdd\xa0\x5f\x4c\x33\x91\x0b\x28\xc8\x3a\x43\
-\x77\xc5\x31\xd4\xbb\x47\x4b\xff\xf5\x73\x1b\x0b\x65\x41\x8c\x7a\
-\xff\x7e\xd7\xe3\xd6\x63\xa7\x30\x6e\x56\xd0\xc5\x6e\x10\x68\x88\
-\x1a\xcc\x56\xe0\x32\x6b\xbc\x19\xd5\x97\x2a\x5a\xf3\x20\x4b\x90\
-\xb4\x7e\x6c\x90\x9e\x2f\xa8\xea\xa5\x76\x12\x98\x31\xd6\xe2\x20\
-\x68\xe1\x82\x73\x59\x3c\x38\x44\x85\x9d\x38\xcc\xea\xb9\xea\x5e\
-\xd4\x4d\x39\xeb\x05\xc8\x2c\x74\xa9\x35\x73\x8d\x4f\x0c\xff\x5d\
-\x96\x55\xd0\xcc\x73\x19\x80\x76\x25\x9a\x8b\x0c\x5b\x8c\x07\x95\
-\x27\x83\xd1\x40\x99\x21\x38\x5c\x2f\x05\x90\xeb\x67\x09\xf9\x2d\
-\x23\xd1\x14\xdd\x53\x66\x07\x26\x4e\x40\xd7\x4d\xd1\x8f\x57\x0c\
-\x0c\x2c\xc4\xa0\x18\x18\x6b\x6b\x1e\x77\x9d\xb8\x1f\x3f\xff\xf0\
-\x7f\x85\x77\x0d\x48\x08\x3e\xe1\x00\xa4\x82\xa4\x60\x0f\x12\x0f\
-\x30\x83\x3d\x74\xe5\x1a\x74\x20\x2a\x8a\x28\x51\x4a\x30\xc0\x24\
-\x7a\x11\x1c\x1e\xaf\xe0\xe4\xc6\x26\x3e\x79\xe9\x40\x30\xf0\xab\
-\x00\xfc\x9d\x4f\xaf\xf0\xf9\xc2\x76\x00\x5f\x0e\x1d\xfe\x19\xbc\
-\xef\x77\x6d\x1f\x07\x09\xac\x2d\x97\x98\x65\x95\x66\x5e\x55\x47\
-\x67\xba\x27\x95\xe5\x10\x3a\x03\xae\x1f\x85\xd9\x4a\x02\x41\x30\
-\xb5\xd8\x3e\x46\x78\x10\xee\x3c\x79\x4a\xd9\x82\x33\xf8\x3f\xa1\
-\x29\x86\x23\x32\xb8\x72\x86\xc6\xcb\xd5\x3d\x9c\x9d\x02\x0f\x32\
-\x85\xaa\xdf\x3f\x1b\x83\x65\xbe\x16\xaf\x79\x02\x32\x93\x71\xcc\
-\xa7\xcc\x15\xd5\x55\xa4\x4a\xbb\x69\x2e\x5a\x96\xbf\x57\xc3\x83\
-\x54\x95\x16\x3c\xdb\xb8\x44\x21\x34\x0d\xf1\x8b\x81\x76\x49\x85\
-\x6d\xcc\xe2\x7b\xe5\x7d\xaa\x32\x9b\x0a\x67\xa8\x31\x7f\xc2\x82\
-\xd2\xe2\xa0\x0e\x5f\xf5\x60\x59\xdc\x48\xbc\x6e\xeb\x53\x18\x59\
-\xb7\x35\x67\x02\x2e\x58\x16\xd0\xab\x88\x68\xb5\x43\xa0\x0f\x3d\
-\x46\x71\x84\x86\x1b\x74\x3c\xc5\xdd\xe7\xee\xc1\x2f\x7e\xf4\xe7\
-\xd0\x77\x11\x9e\x08\xbd\xb3\xd7\x8e\x09\xd2\xea\x1f\x70\x02\x44\
-\xe7\xd0\x34\x00\x3b\x42\x63\x63\xdc\x0e\xa4\x20\xa0\x54\x19\x13\
-\xeb\x3a\xfa\x86\x1c\x6e\x3a\xb4\x8d\x4f\x5e\x3e\x10\x0c\x7c\x05\
-\x80\x73\x00\x3e\xf6\x42\x71\x00\x6f\x99\x75\xd3\x6d\xeb\x71\xeb\
-\xa1\x1d\xec\x77\xbd\xf6\xd5\x69\xa1\xe8\xd3\x00\x55\x67\xd6\xc8\
-\xc6\xe9\x22\x65\xc5\x01\xc4\xba\x00\x69\xdb\x0f\xa7\x8d\x3f\x7d\
-\xc0\xce\xc6\x3a\x6e\x38\x7c\x22\x93\x7f\x0a\x63\xcc\x03\x46\xe1\
-\x40\xfd\x7f\x99\xab\xf6\xf3\x46\x61\x83\x1e\x87\x6e\x7d\x00\xf5\
-\xf1\x30\xa6\x57\x2d\x4c\xa6\x2a\xaa\xa6\x7a\x7c\x60\x0d\x32\x53\
-\x2e\xcc\xe3\x01\x75\x6b\x51\x6d\x3a\xe6\x88\xcb\x0b\xdb\x6d\xe9\
-\x29\x0c\x01\xc8\x3c\x3d\x37\x80\x14\x66\xdc\xc3\x00\x6b\x40\xc1\
-\x60\x04\x60\x9e\x69\x5c\x4a\xe9\x74\x50\x5d\xce\xcc\x42\x2b\x15\
-\xd5\x59\x0e\xc2\x06\xe8\x00\xf0\x40\x16\x00\x0f\x8c\xc5\x80\x44\
-\xad\xbb\x20\x54\x1c\x00\x33\x38\x72\x2e\x03\x7a\x2b\x05\xfa\xae\
-\x47\x58\xe9\xb3\x88\x4c\xcb\x2d\xba\x7e\x8a\x13\xc7\x8e\xe3\xa6\
-\xc3\xb7\xe0\xc3\x17\x3f\x80\xc6\x79\x90\x28\x1d\x98\x24\x8d\x46\
-\x33\x7a\x06\x7c\x63\x89\x98\x77\x45\x9f\xa1\xe2\x01\xe8\x6b\x4e\
-\x59\xca\x3c\x80\x71\x66\x75\x13\x6d\xe3\xd1\xc7\xb8\x28\xdb\x59\
-\xb3\xa0\xf9\xfd\x2f\x04\x07\x70\xc4\xfa\xff\x83\x37\xea\xcc\xda\
-\x26\x36\xfd\x08\xd3\xbe\xab\x48\x25\x65\xba\x2c\x49\x5f\x48\x75\
-\x51\xb1\x94\x14\x9b\xd9\x3a\xf1\x5c\xd2\x7e\x4e\x6b\xbf\x2d\x43\
-\xd8\x9b\xf4\x78\xc5\xcd\xc7\xb1\x31\x5a\x45\x17\xe3\x0c\xe2\x5e\
-\x09\x75\xa4\xdc\x40\x64\x70\x51\x8b\x0c\x13\xf4\xbc\x69\xd8\x1c\
-\x41\xee\x06\x54\x2d\xc0\x3a\x86\x33\x86\xa5\x03\x0f\xb8\x06\x3c\
-\x97\xb6\xcb\x1c\x27\xa0\xfc\x7b\x45\x30\x83\x3f\x1c\x04\x5d\xa2\
-\x72\x46\x0b\x4a\x11\xa9\x4b\x08\x73\x1e\x32\x84\x1a\xb9\x02\x25\
-\x53\xb6\xa3\xff\xc6\xca\xea\xa4\xce\x46\x2a\x3c\xc0\x4a\x85\xa1\
-\x06\xc2\x2c\xbe\x21\xa5\x03\x29\x33\xa5\xcb\x41\xff\xa8\x45\xe9\
-\xfe\x01\xdd\x02\x19\xa4\x06\x29\x78\x30\x88\x49\x4b\xc3\xa8\x74\
-\xde\xae\xeb\x31\x1a\x19\x18\xd8\x75\xe8\xc7\xbd\xed\x10\x08\xf0\
-\xd1\x21\xba\x80\x7b\x6f\x7a\x00\xbf\xf9\xd8\xfb\x11\xbc\x1a\xbf\
-\x8a\xa5\x18\x3f\x85\x3d\xe0\x19\x12\xf5\x45\xf4\x4e\xc0\x49\x79\
-\x39\x4f\x6a\xa6\x59\x0c\xdb\x65\x60\xc0\xf5\x0a\x79\x1c\x1f\xaf\
-\xe3\x93\xbb\x57\x0e\xc2\x34\xde\xf0\x42\x71\x00\x2f\x05\x70\x74\
-\xf6\xce\x9b\xd6\x0f\x83\x22\xd0\x31\xe7\x81\x95\x3c\x93\x5e\xa1\
-\xe4\x64\x17\x24\x81\xd4\x00\xcd\xe8\x51\x39\x02\x16\x14\x1c\x80\
-\x05\x31\xea\x06\x59\x11\xc1\xad\x27\x4f\x81\xc8\xdb\xd0\x10\xec\
-\x77\xd4\xa4\x98\x82\xde\xb3\x14\x84\x3f\x1b\x7a\x32\xee\x94\x01\
-\x48\x41\xdf\x73\x74\x9f\x31\xb2\xb4\x86\x7c\xf6\xfb\xa5\x9d\x29\
-\xe0\x3c\x68\x14\x4b\x46\x50\xd5\xcd\xb9\x24\x48\xf5\x74\x45\x0f\
-\x96\x99\x68\x3e\xec\x4e\xc4\xaa\x7b\x9f\xdc\x0c\x55\x0e\x8c\xca\
-\xbf\xaf\x4a\xeb\x39\x57\x30\x75\xe1\x33\x84\x15\xa5\xaa\xef\x53\
-\x36\x20\x52\x32\x09\xcc\xbc\xbe\xf9\xf9\xd5\x65\x03\x63\x01\x02\
-\x72\x1d\xa0\x50\x64\xe1\x8c\x10\x5f\xaf\xb5\x28\xd5\xcf\xa6\xeb\
-\x29\x8d\x0a\x3b\xc9\x53\x82\x21\xf6\x59\x2b\x30\x8d\x0c\xab\x64\
-\xd8\xd8\xb4\x02\x76\x71\xdb\x8d\xb7\x62\xf3\x97\x77\x30\xe9\xaf\
-\xc2\x93\x43\x24\x01\x21\x02\xde\x02\x48\x24\x48\xe3\xf4\x35\xf1\
-\xda\x2e\x24\xd8\x12\xd5\xec\x08\x29\xbf\x6e\x6c\x19\xaa\x63\x87\
-\x93\x2b\x1b\xea\x00\x16\x9f\x57\x02\x58\x07\xb0\xfb\x7c\x77\x00\
-\xaf\x9e\x6b\x3f\x78\xc2\x0d\x6b\x87\xd0\x45\x5d\xdb\x45\xb9\xeb\
-\x8f\xaa\xb2\xa5\x19\xc6\x18\x0f\xc0\x94\x44\x06\x52\x25\x18\xbd\
-\x2f\xa5\xfe\xcc\x82\xae\x67\xac\x34\x2d\x6e\x3b\x71\x52\xf7\xff\
-\x0d\xc0\x3d\x1e\x46\xcb\x59\xa3\xaa\x5a\x6e\x6a\xc0\x5c\xd5\xfb\
-\x6c\xd3\x87\x32\x44\xff\xb3\x83\xa8\x98\x02\x33\x2d\xc1\x41\x66\
-\x2b\x33\x10\x61\x8a\xb2\xb3\x44\xa1\xd9\xee\x04\xae\xd7\x9b\xe3\
-\x52\x30\x55\xb5\xe7\x6c\x69\x21\x88\xe5\x2b\xc2\x82\x12\xc8\xbe\
-\x32\xe7\x9a\x0d\x5d\x16\x40\x98\x55\x1b\x42\x92\x1e\x42\x76\x32\
-\x75\x67\x4e\x9e\x55\x5f\x7f\xe1\x44\xc6\x33\xf9\x08\x5c\xa7\xf7\
-\x98\x96\x3a\x09\x81\xa3\xc0\x39\x54\xdb\x85\x83\xad\x08\x4b\xbb\
-\x03\xfa\xac\x27\xd9\x72\x0b\x89\x82\x76\xcd\xe3\xee\x1b\xee\xc7\
-\x4f\x7f\xf0\x3f\xa1\x75\x8d\x4a\xa2\x83\x21\xec\xb4\x0d\xdc\x38\
-\xf3\x80\x04\x30\x9b\x96\xa2\x80\x83\x64\x35\xe6\xf4\x7a\xe8\x4e\
-\x43\x75\x06\x81\x23\x8e\xfa\x35\x38\x47\x33\xaf\x69\x3e\x67\x01\
-\xdc\x07\xe0\x5d\xcf\x77\x07\xf0\xf2\xd9\x77\x6f\x67\xbc\x8a\x2d\
-\xb7\x82\x3e\xc4\x41\xda\x4c\x8b\xca\x41\xc1\x4c\x3a\x6a\xe5\x40\
-\xb4\x24\x5c\x94\x8d\x25\x55\x07\x80\x99\x31\x9d\xf6\xb8\xf9\xd4\
-\x09\xec\x6c\x6c\xe9\x0a\xb0\x2a\xad\x65\x29\x0e\x66\x18\xdd\x64\
-\x81\x43\x48\x75\x3f\x97\x31\xe4\xda\x11\xa0\x8a\xf6\xd5\xbc\x42\
-\x9d\xfa\xd7\xf4\xe6\x92\x3d\xf0\x4c\xc9\x20\x43\x8c\x02\x33\xd1\
-\x5e\x86\xc8\xc4\x90\x3f\x30\x1c\x9c\x29\xc6\xa7\xcf\x87\x67\x4a\
-\x9a\x44\x66\xe6\x19\x30\x33\xfd\x2b\x12\x96\x52\x97\x04\x99\xfc\
-\xc2\xf6\x9a\x4b\xc1\x09\xb2\x73\x93\xe2\x8c\x67\x59\x80\xe5\xb1\
-\xf3\xa5\xc0\xc1\xc4\x01\xb9\x3e\x2e\x30\x24\x14\x0c\x1f\x38\x00\
-\x10\x29\xef\x14\x64\x61\x10\x03\x21\x04\x34\x4d\xa3\x72\xe1\x15\
-\x39\x28\x5a\x09\xc0\x1c\x21\xd2\x20\x48\x87\x17\x9d\xbf\x0b\xbf\
-\xf0\xa1\x9f\x46\xe8\x03\x1c\x35\x60\x71\x20\xeb\x3a\x39\x61\xc0\
-\x2b\x5b\x13\x91\x10\x89\xe0\xd3\x20\xa4\x8d\x44\x93\x70\xee\xb0\
-\xe8\x2a\x33\xcd\x46\x56\xa4\xc1\x96\x1b\xe3\x22\x4f\x0e\x6a\xd3\
-\xbf\xe2\xf9\xee\x00\x36\xcd\x8b\x0d\xde\xaf\x53\x2b\x9b\x68\xc8\
-\x21\x70\x2c\x52\x97\x96\xb6\x11\x66\x2e\x12\xeb\xe9\xd6\x17\x4d\
-\xce\x00\x6c\xec\x33\x66\x15\x18\xe4\x2c\x60\xda\x07\xdc\x7a\xec\
-\x24\xc6\xbe\xc5\x24\xb1\xff\x64\x01\x0f\x6f\x66\xd6\x60\xf0\xb8\
-\xca\x78\xd5\x90\x78\xc0\x07\x10\xe1\xcc\x4e\x1c\x22\x00\xa5\x4b\
-\x81\x1a\x1c\xcc\x8f\x2d\xb4\xe6\x41\x1a\x3c\x68\x10\xc8\x7c\xcd\
-\x2e\xb3\x6d\xc6\x21\x67\x00\x32\x24\xfb\xb0\xc8\x8c\x91\xf2\xe0\
-\x6b\x54\x33\x01\xc9\x66\x63\x35\x93\xcb\xa0\xac\x9b\x98\x40\xcb\
-\xfa\xf9\x8b\x50\x01\x64\xa5\x34\x47\x51\xf1\x03\x84\xa5\xcc\x74\
-\xcd\x32\x2e\xe4\x19\x6a\xfc\x67\x41\x0e\x3a\xb0\x53\x28\xb3\xa4\
-\x23\x13\x63\x61\x86\x88\xd3\x00\x12\xa3\x75\x8b\x82\x71\x01\x74\
-\x99\x48\x88\x2b\x5a\x42\x46\xc1\xb4\x9f\xe2\xf4\xa9\x53\x38\xb5\
-\x75\x23\x1e\xb9\xf4\x51\x95\x55\x33\x24\x34\xd1\xc9\xbd\x2a\x90\
-\x40\x6c\xb3\x92\xe2\x00\xe6\x76\xa4\xc2\x7d\x2c\x58\xc5\xa8\x0e\
-\xc1\x05\xc2\xb6\x5b\xc1\xc5\x38\x39\x08\x07\xb8\xef\xf9\x8e\x01\
-\xdc\x8a\x59\xb9\x23\x02\x8e\xb7\xeb\xfa\x42\x88\x32\xff\x24\x6f\
-\xba\xa2\x61\x5a\x2e\x34\x20\xd5\x70\xa2\x77\x56\x17\x71\x02\x01\
-\xb3\xf1\x5b\xfd\x3f\x72\x0e\x77\xdc\x70\x52\x33\x82\x54\x77\xe7\
-\x88\xc9\xc8\xe3\xc6\x90\x3c\x57\xc0\x03\x27\x91\xd2\xf9\x58\x81\
-\x6a\x3c\x04\x00\xa5\x74\x05\xd4\x50\x62\xd5\x63\xaf\xe0\xc5\x5c\
-\x27\xcb\x7c\x3d\x3d\x83\x1d\xcc\xb6\xe8\x06\xfd\x76\x61\xcc\xf1\
-\x0a\x65\x38\xb0\x5b\xa2\xf1\xec\xe8\x6f\xdd\x81\xa8\xe1\x72\xaa\
-\x26\x2f\x6a\x2d\x20\x03\x60\xa5\xac\x48\x49\xc2\x45\x54\xa5\xfc\
-\xf9\xb9\xb2\x0c\xe9\x0e\x40\xed\x11\xe6\x9b\xf4\x32\xaf\xb7\x22\
-\x33\x16\x3c\xc7\x58\x7e\xa6\xda\xe0\x00\x07\x92\x6d\x8b\x15\x13\
-\x90\x28\x60\x97\x36\x09\xd9\x52\x51\xe3\x01\x24\x3d\xc9\x68\xe5\
-\x69\xc3\x1e\x7e\x15\xb8\xfb\xdc\xbd\xf8\xf0\x63\x1f\xc2\xb8\x19\
-\xc1\xd9\x1b\x4a\xd0\x92\x47\xa2\x66\x01\x68\x74\x8c\xda\x13\x00\
-\xef\xab\x96\x71\xe2\x77\x10\x22\x33\x38\x5a\x26\x15\x81\x6d\xac\
-\x5c\xef\x9f\x70\x2f\x94\x29\x10\x9f\xaf\x0e\xe0\x45\x98\xa1\x3a\
-\x38\x47\xd8\x69\x56\xd0\xc7\xa8\x29\x94\xab\xd2\xd6\xc1\xe2\x87\
-\x52\x13\x33\x57\xd1\xbf\x72\x00\xc5\xf8\x87\xb7\x10\x18\x5b\x9b\
-\xab\x38\xb7\x73\x02\x5d\x08\x66\xe0\x75\x29\xa1\xd1\xd7\x11\x0f\
-\xd2\xee\x0c\x88\xe5\x94\xd8\x8c\x9f\x87\x75\x7f\x9d\x25\xe8\x73\
-\xe1\x6c\xec\x45\x69\x98\x87\x25\x40\x76\x14\x92\xeb\xe1\x41\xe9\
-\x41\xc3\x3a\x3c\xd7\xf1\x95\x03\x9c\x63\x18\xcc\xb6\xd8\xea\xfd\
-\x02\xd9\xbe\x09\x98\x9b\x30\x4c\xce\xa2\xe0\x2a\x94\xd3\xf4\xe2\
-\x98\x06\x13\x76\xd9\x98\x48\xff\x4e\x92\x3e\xaf\xd9\x8c\xe5\xa5\
-\xa8\xb2\x9f\xf2\x3c\xa5\xb2\x4a\xc1\x33\x30\xfe\xe4\xfa\xc6\x4f\
-\x07\xe1\x05\x55\x1a\x45\x35\x6b\x31\xed\x4b\xc8\x00\xa6\x66\x03\
-\xa1\x8f\x08\xad\x89\x88\x9a\x13\x08\xb1\xb7\x05\xb3\xd1\x24\xc3\
-\xf6\x70\xc7\xcd\xb7\x63\xed\x17\xd7\x11\xa6\x01\x0e\x0d\xd0\x38\
-\x50\x60\x55\x0c\xf2\x46\xff\x15\xb6\x9a\x1e\xf0\x31\xbd\xc6\x36\
-\x36\xcc\xd6\xdd\x8a\xfa\x3e\x85\xc0\x90\x00\x6c\xc8\x08\x8e\x0e\
-\xc4\x01\x6e\xb3\x2e\xda\x13\xcf\x57\x07\x70\xc7\xec\x9b\xba\xd1\
-\x8c\xb0\xe1\x47\x08\x51\xd1\xff\x18\x25\xab\xd6\xc8\x50\x72\x47\
-\x3f\xb5\x9a\x33\x1b\x41\xaa\x47\x07\xa9\x7f\xba\xe9\xfd\xd3\x2e\
-\xe2\xe6\x53\x47\xb0\xbe\xb2\x82\x10\x23\x30\x30\x5a\x58\xa4\x8d\
-\x60\x89\x85\x19\x87\x61\x3d\x5c\x5a\x7c\x09\x02\xac\x32\x82\x84\
-\x05\xd4\x83\x41\x76\x7f\x41\xfe\x39\x97\x0e\xc3\x02\x81\x87\x91\
-\x58\xe6\x47\x80\xc5\x6a\x1e\x19\x10\x93\x30\x60\xf0\x49\x5e\x35\
-\x26\x59\x00\x44\x06\x42\x85\x19\xfd\xca\xd1\x59\xe5\xad\xc8\xd2\
-\xfc\x45\x1a\x04\x69\xee\x3f\x51\x69\x87\xa3\x59\xc9\x41\x67\x0e\
-\x43\x65\xf8\xba\xf2\x8f\x2a\xc5\x6f\xaa\x18\x85\x03\x59\x85\x03\
-\x89\x44\x73\xd6\x2e\xd7\x23\x03\xca\xf5\xc9\x43\x82\xb9\x31\x83\
-\x3c\x27\x60\x0e\x4a\xe9\xc1\x46\x0c\x8a\xa6\x18\x14\x4a\x2b\x30\
-\x0b\xcd\xc4\x88\xc3\x47\x0f\xe1\x86\xa3\x37\xe1\xa1\xc7\x3e\xa0\
-\x6b\xd4\x13\xd1\x87\x05\x9e\x19\x04\x07\x81\xe8\x32\x15\x47\x3a\
-\x26\x6c\xe4\x1f\x47\xa5\xc3\xa2\xd7\x2e\x83\x83\x5e\x73\x3e\x3a\
-\xac\x4a\x8b\x5d\x5a\x38\x01\xbc\x01\xe0\xfc\x73\xe5\x00\x3e\x17\
-\xb3\x00\x73\xeb\x8f\x0e\x37\xab\x70\xe2\x34\x15\x4a\xa4\x9d\xa8\
-\x37\x8e\x32\x87\xe6\xc7\xd4\xbe\xc9\xf5\xbd\xb5\xfe\xd2\xfd\x06\
-\xa8\x94\xdf\x05\x84\x18\x71\xee\xd8\x71\x34\xde\xab\xfe\x7b\xee\
-\x16\x18\xb2\x0d\xd5\x11\x28\x82\x22\x89\x43\x50\xd5\xf8\x19\xf0\
-\x1b\x7e\x4c\xa0\x5f\xaa\xff\x33\x06\xc0\x45\xbc\x44\x35\x0c\x67\
-\x3a\x00\xc2\x45\xc8\x64\x6e\xc0\x28\x19\x3b\x9b\x9c\xd5\x90\x08\
-\x54\x08\x3d\xf5\x26\x22\x37\x5c\x4b\x48\x26\xef\x9d\x8d\xc3\xa4\
-\xc5\xb9\xb2\x0c\x47\x79\x46\x28\x37\x59\xa9\xd0\x87\x58\xe6\x44\
-\xcb\x33\x37\xa3\x80\x88\x45\x78\x34\x2d\xee\x48\x4f\x8d\xe7\x05\
-\xc9\x4c\x61\xa8\x32\x46\x19\xb2\x80\x0e\x8a\xf2\xb2\x70\x6e\xe0\
-\x99\xd3\xfd\x85\xa5\xc2\x0c\xa7\x40\x98\x6d\x9d\x58\x9a\x26\x35\
-\xf1\x50\x5b\x2f\x9e\x1c\x41\xe4\x90\xaf\x35\x3f\x22\xdc\x7d\xcb\
-\x3d\x98\x4e\x3b\xe5\xf9\x77\x11\x31\x08\x42\xd0\x54\x3e\x74\x8c\
-\x18\x04\x31\x08\xb8\x17\xc4\x9e\xc1\xbd\x5e\x17\xc1\x1e\xa7\x8f\
-\x67\x84\xc0\x7a\x9d\xf6\x0c\xea\x08\x9b\x71\x74\xd0\xbf\xd1\x9b\
-\x03\x78\x5e\x62\x00\x1e\xb3\xc2\x9f\x00\x36\xfd\x08\x64\x14\xde\
-\xfc\xde\x0e\xd4\x74\x87\xac\x2e\xa9\x52\xd2\x0c\x36\x71\xb9\x20\
-\x73\x09\x10\x93\x67\x15\xac\x34\x0d\x6e\x39\x73\x0c\x21\xb0\x45\
-\x62\x1a\x30\xe6\x84\x35\x52\x47\xe9\x40\xd4\x58\x2a\xcf\x39\xfa\
-\x66\xe4\x3c\xe1\x03\x26\x3a\x5a\xd7\xfd\x92\xc9\xc5\x5c\x22\x7e\
-\xc6\x13\x78\x88\xa0\x1b\x36\x80\x7a\xa2\xaf\xe4\x1d\xd9\x81\x0c\
-\xc6\x87\xe6\x54\x85\xea\x61\x9d\xaa\x03\x50\xef\x1d\xc8\x3f\x37\
-\x44\xc3\x05\x6e\x98\x55\x98\xa1\x32\x8a\x58\x09\x57\x86\x1f\x73\
-\x4f\xc6\xb2\x18\x36\x37\xc0\x09\x17\xa8\x53\x7b\x2a\x98\x02\x59\
-\x5b\x91\x1c\x84\x38\x83\x92\xe4\xc8\xd4\x79\x34\xdb\x4b\x4e\xae\
-\x92\x33\x1a\xb4\x12\xe7\x82\x3b\xc9\x00\x08\x9d\x7d\x80\xe0\xfa\
-\x8c\xc1\x61\x17\xb2\xbe\x8e\x74\x5a\x34\x86\xaa\x04\x88\xbd\x6d\
-\x98\x0e\xb6\x41\x48\x27\x3e\xf7\xfb\x5d\xdc\x79\xeb\x9d\xd8\xfc\
-\x99\x2d\xc4\xbe\xb3\x4c\x8a\x01\xaf\x7b\x3f\x1a\x4f\x60\x8b\xf6\
-\xde\x16\xa5\xce\x2e\x84\x81\x00\xd1\xfa\xaa\xfa\xb7\x05\x2e\x02\
-\x2d\xf9\xeb\xd9\xd1\xb9\xe7\xab\x03\x58\xb1\x5e\xe6\xd0\x01\xd0\
-\x18\xd1\x38\xd1\x49\x38\x56\xa8\xf4\xfe\x07\xb2\x57\x32\xcc\x54\
-\x39\xbd\x78\x39\x9d\xb2\x96\x14\x17\x7c\xa0\x0f\x8c\xed\xad\x15\
-\x9c\xd9\x3e\x82\x2e\xf6\xd6\x1e\x4b\x40\x15\x9b\x7e\x84\x46\xeb\
-\x88\x09\xbc\x5b\xc9\xd1\x5c\x07\x8d\x62\xea\xfa\x17\xa3\xb7\xd6\
-\x9f\x54\xd1\x9f\x07\xce\x80\x81\x01\x70\x68\xee\x81\x65\xd0\xf2\
-\xc3\x4c\xab\x71\xc0\x01\x18\x38\x87\x3a\xfd\xc6\xc0\xa8\xa9\x2a\
-\xf2\xa5\x9e\x01\x94\x61\x93\x30\xd7\xf8\x20\x53\x53\xae\x58\x7a\
-\x28\xf3\xff\x43\x3c\xad\xac\x36\x23\x4b\x5f\x79\x8e\x59\x97\x58\
-\x7c\xb5\x0a\x90\x43\x3d\xba\x9d\xdb\x7d\x49\x4a\x9c\x8b\x44\x3a\
-\x91\xa1\xe5\x3c\xa3\x85\x20\xd7\xc9\xec\xe5\xa0\x36\xe1\xb3\x38\
-\x54\xfd\x91\xaa\x6c\xc9\xa5\xa3\x31\x03\x63\x8c\x99\x03\x90\x16\
-\x87\x84\x18\x34\x7b\x34\x81\xd1\x8d\xed\x0d\x9c\x39\x7a\x23\x1e\
-\xfa\xd4\xfb\xe1\xc9\xab\x72\x52\xfa\x77\xb3\xca\xa7\x8b\xb3\x7f\
-\x5f\x5e\xd0\x6a\x4f\xd9\xc4\x63\x98\x91\x19\x81\x12\x05\x31\x30\
-\x56\xa5\x39\x48\x2d\x18\x50\xd9\xf0\xe7\xa5\x03\x38\x02\x60\x7b\
-\xf0\x5e\x10\xb0\x4e\xad\x46\x66\x92\x4a\x8e\xba\x4c\x99\x31\x66\
-\xe4\x9d\xcc\x60\x85\x51\x22\x65\x05\x00\xea\x80\x85\xd2\x31\x59\
-\x80\xbe\x8f\xb8\xe9\xd4\x61\xac\xae\x8c\x11\x22\x57\x8c\x3a\x4a\
-\xe8\x14\x98\x2c\x25\xe7\x29\x1c\x29\xd0\x93\x8d\xb6\x46\xf8\x59\
-\x20\xc4\x39\x8a\x6b\xd9\x80\x4a\x8f\x70\x58\x12\x0c\xb1\x02\xeb\
-\xfb\x0b\x0f\x06\x7d\xb8\xc6\xfd\xb3\x53\x41\x45\x18\x21\xdb\x13\
-\xa0\x19\x0d\x2d\x30\x86\x6c\x4f\x83\xa5\xa2\x16\x7d\xc5\x15\xbc\
-\x80\x9c\x45\x21\x5f\x89\x7d\x58\xa6\x04\xcd\x0c\x54\xd3\x80\x4a\
-\xfa\x5e\xa9\x0d\xa5\x85\x23\x5c\xb1\xfd\x44\xe6\x8b\x6d\xca\x25\
-\x47\x51\x71\x9a\xd7\x0f\x1c\xee\x2f\x23\x27\x10\x4e\xd3\x8c\x33\
-\x90\xde\x02\x74\xef\xa0\x1d\xcc\xcf\xd4\x0c\x10\xa9\xb3\x49\x73\
-\x70\x0c\xc0\x97\xd2\x51\x84\x11\x59\xeb\x7e\xbd\xb1\x65\x02\x3d\
-\x98\x03\x58\x22\x98\x1d\x46\xeb\x1e\x77\xdf\x72\x2f\xde\xf7\x91\
-\xf7\x62\xd4\xa8\x36\x80\x6f\x6c\xda\xc8\x09\xc4\x39\x38\xb6\xcd\
-\xa9\x89\xce\xee\x8a\xf1\x0b\xa7\x0d\x46\xc8\x73\x01\x88\x82\xb1\
-\x34\x70\x42\x79\x5e\x64\xe6\x1c\x7b\xbe\x3a\x80\x53\x48\x7a\x5b\
-\x28\x6d\xbe\xb1\xf3\x6a\xb0\x52\x6d\x9c\x99\x1d\x09\x1f\xb4\x7f\
-\xaa\x9e\xb2\x14\x6a\x6c\xde\x05\x97\x65\xa0\xf5\x85\x4e\xf5\x7f\
-\xeb\x1a\x4c\xfa\xae\x4a\x31\x39\x63\xf3\x48\x35\x3f\xf6\x10\x4d\
-\x22\x8c\x4d\x6c\x94\x0d\x40\xe3\xac\x3e\x14\xf4\x42\xa9\x28\xbb\
-\x8c\x50\x95\x05\x52\x95\x03\xa5\x6c\x48\x3a\x71\x73\x63\xc6\x75\
-\x7d\x9f\x37\x04\x99\x31\xd6\x12\xe2\xb5\xdc\x56\xd5\xce\x2b\x6b\
-\xc7\xa4\xae\x6c\x0c\x94\xa7\x39\x3c\x9c\x2a\xbe\x7e\x4d\xc4\xc9\
-\x54\xa6\x8a\xc3\xaf\xaf\x2d\x19\x80\x57\x03\x8a\x43\x2b\x4b\xa5\
-\x83\x3e\x95\x5a\x4a\xd4\xdc\xb7\x53\x01\x67\xa3\xc7\x58\x82\xc0\
-\x79\x59\x28\x55\x58\x83\x73\xd5\x73\xe2\xeb\xd8\xb2\x3c\x8b\xcf\
-\x9f\x01\x23\x20\xaa\xf6\x3b\xb1\x3d\x5f\xc3\xa3\x62\x94\x8c\x03\
-\xa4\xa1\xa0\x68\xe2\xb2\x6c\x6d\xa8\xbd\x7e\x17\x77\xde\x76\x3b\
-\x36\x7e\x6a\x0b\x21\x74\x20\xf1\x20\x73\xa3\x6c\x01\x03\xce\x41\
-\x24\x6d\x5a\x92\xfc\x3a\x28\x79\x0d\xa5\x25\xcd\xfa\x3d\x16\x82\
-\x8b\x74\x3d\x98\xe3\xc8\xf3\xd5\x01\x1c\x9d\x6d\x01\x7a\x38\x8c\
-\xc4\xe7\x88\x4b\x55\x7d\x46\x33\xeb\x9e\x66\x1d\x00\x50\x88\x3f\
-\x43\x44\xb5\x00\x84\x1c\x05\xe3\xb1\xc7\xd9\x53\x5b\x08\x51\x55\
-\x82\x93\x76\xdd\x50\xe0\x23\xb5\xef\xa6\x60\x9a\x02\xd4\x82\x25\
-\x18\xe1\x28\xe6\x4e\x01\xa3\x8e\xec\x92\x15\x88\x87\xc8\x7e\x9c\
-\x9f\x1d\xa8\x3a\x09\x2c\x9c\x8d\x9e\xa5\x6e\x0d\x62\xd0\xaf\xcf\
-\x8b\x44\x50\xeb\x01\xd0\x20\xfd\x1e\xcc\x2d\xce\xec\x15\xc8\xb3\
-\x12\x83\xd9\x7a\x51\x74\x3a\x13\x84\x28\xf3\x2b\x6a\xda\x6e\x12\
-\x5f\x25\xfb\x7d\x3c\xe0\x13\xcc\xa0\x71\x54\xef\x0e\x9a\x1f\x71\
-\x26\x53\xe2\x71\xa4\xac\xb8\x01\xcb\xb1\xc2\x30\xd3\xfe\x22\x31\
-\xf9\x31\x4d\x5e\x48\xf7\x95\xcc\x70\x07\xe4\x99\xac\xfd\x80\x9e\
-\xa0\xcc\x72\x0d\x68\xfe\xfb\x89\x9f\x11\x8d\x14\x14\x13\x17\x20\
-\x2a\x37\x20\x72\x00\xc7\xb2\x73\x70\xeb\xe8\x06\x76\x0e\xed\xe0\
-\xd1\xa7\x3f\x09\x6f\x38\x3a\x81\xe1\x9c\x62\x1d\x10\x01\x71\xd4\
-\x6d\x0a\xb6\x22\x3d\x05\xac\xb4\x12\x4e\x22\x23\x26\x0c\xd9\xde\
-\x33\x12\x93\x66\x9e\xff\x27\x1e\x7a\xbe\x3a\x80\x9d\xd9\x3b\x46\
-\xf0\x80\xa5\xec\xf9\x7a\x4f\x17\xc3\xcc\x1c\x07\x66\x98\x6f\x19\
-\x74\x62\xab\xe1\x19\x03\x46\x60\xea\xff\xaf\xac\x8c\x70\x66\x7b\
-\x07\x5d\xe8\x74\x88\x48\x34\xe7\xab\x85\x3d\x4a\xdd\xdd\xa1\xe7\
-\x6b\x68\xdc\x56\x36\xf4\xdc\xc6\x13\xd6\xa8\x9f\xa9\xb4\x9c\xef\
-\x07\xb8\x02\xf7\x6a\x99\x70\x19\x4c\x08\x4a\x4d\x40\xaa\x56\x80\
-\xcd\xd6\xd4\x32\xf8\x8c\x87\x08\x56\x62\xb0\xc9\x8c\x5a\x80\xa5\
-\x49\x35\x46\x32\xa4\xd9\x5a\xf4\xcd\x2d\x4e\x1a\x38\x1e\xcd\x1a\
-\x14\x1c\xe4\x4c\xc0\x9a\x11\xf4\x10\x8d\x50\x0a\xf1\x3b\xdb\xcd\
-\x50\xaf\x30\x73\xc0\x60\x14\x78\xa8\xae\x54\x6f\x37\xcf\x7d\x78\
-\x9a\xd9\x91\x64\x5c\x85\x64\xf4\x94\x36\xa9\xb1\x81\x85\x98\xa1\
-\x15\xcb\xb3\x40\xfe\x17\x39\x88\xba\xa6\x4c\x19\x48\x1a\x02\xb3\
-\xee\x8f\x46\xfc\x98\x5b\x82\x51\xac\x24\x10\xdb\x42\xc5\xc0\x68\
-\xdd\xe3\xbe\xdb\x1e\xc0\x43\xff\xed\x21\x34\x9b\x4d\xee\xde\x34\
-\x8d\x03\x49\xda\xb6\x44\x20\xd2\x72\xd1\xdb\x56\xe4\x94\xa9\xd6\
-\xad\xec\xd4\xc9\x02\x80\x36\x3a\x04\xcf\x07\xb5\x02\x9f\x97\x0e\
-\x60\x6b\xf6\x8e\x31\xbc\x2e\x6c\x28\xac\x12\x05\x4e\x30\x04\xb9\
-\xd2\x9b\x23\x75\xef\xb6\x02\x02\xe7\x4a\x01\x6b\x13\x86\xc0\x38\
-\x7e\x62\x1d\xab\x2b\x2b\xe8\x63\x28\x06\xc4\x33\x8c\xc2\x9c\x86\
-\x45\x40\xae\x81\x68\x4d\xdf\x60\xaa\x0c\x3c\xd7\xf6\x65\x1e\x80\
-\xa5\xe0\x04\x45\xa0\xb4\x1a\x0b\x4e\x19\x43\x92\x0a\x93\x59\x61\
-\x90\x8a\x5e\x43\x95\xc8\xc9\x60\xbe\xad\x44\xec\xf9\x5d\x05\x15\
-\x98\x96\x99\x92\x9c\x0d\x7e\xfe\x91\x02\x2e\x09\xe8\x70\xf6\x4e\
-\xaa\x28\xcf\x35\x75\x97\x16\xb6\xea\xa4\xde\xe2\x69\x1b\x82\xf2\
-\x3e\x42\xa9\xd7\x04\x4b\xb5\xf9\x57\x6c\xd2\x53\x06\x0b\x42\x55\
-\x4f\x3f\xa5\x7f\x9c\x4b\x82\x3c\x14\x96\x36\x10\x39\xca\x06\x32\
-\x7b\xf8\xd9\x50\x82\x07\x9c\x80\xc2\x49\xa0\x64\x91\x2e\x4d\x96\
-\x9a\xb6\x24\xb3\xad\x0d\x0f\xba\x58\x34\x04\x04\xc3\x00\xa2\x30\
-\x1a\x11\xf4\xd2\xe1\xec\x8d\xa7\xb0\xda\xac\x21\xf4\x11\x6d\xeb\
-\xc1\x00\x42\x90\xdc\x09\x00\x29\xc1\xad\x16\x24\x51\xb5\xe5\x7a\
-\x7b\x51\x35\xb3\x21\x40\x2b\x0d\xf6\x17\xef\x11\x5f\x7d\xbe\x3a\
-\x80\x8d\xf9\x3f\xe8\x33\x2d\x56\xd3\x7e\xd5\x01\xa6\xd9\xcd\x31\
-\x73\x84\xa0\x42\xa0\x98\xc5\x02\x12\xa9\x43\x18\x98\xf6\x11\xe7\
-\x8e\x1c\xc1\xb8\xf5\xe8\xba\x68\xd1\x9f\x72\x0b\x0c\x52\xcf\xfe\
-\xeb\xf3\x88\x71\x0f\x8e\x26\x70\xd4\x0e\xb8\x01\x0a\xfa\x2d\x9a\
-\x01\x58\x80\xf8\x73\x69\xe9\x95\x34\x9c\x8b\xa3\xc9\x69\xbb\xab\
-\x58\x80\x98\xa1\xfd\x56\x05\x0a\x55\xbb\xff\x2a\x42\x0d\x55\x28\
-\x7e\x01\xfd\x2a\xea\x6e\x26\xe6\x70\xb5\x84\x6c\xd1\x7e\x83\xa1\
-\xac\x78\x5e\x63\x61\xe3\xab\xb9\xcb\x52\x2f\x28\xa9\xd9\x79\x92\
-\x0a\xfb\x58\xf7\x25\x6c\x7b\x91\xfd\x3e\x4b\xeb\x1c\x01\xd1\x16\
-\x0d\x21\xe3\x14\x96\x2b\x58\x47\x40\xec\x82\x48\x80\x30\x73\x79\
-\x6d\x9c\x65\x0d\xb3\x73\x03\x24\x95\x13\x90\xeb\x74\x0d\xea\xcf\
-\x5d\x4d\x38\x33\x05\x2a\x23\x94\x35\x48\x83\x3a\x9a\x01\xc4\x18\
-\xb5\x15\x28\xb1\x2a\xfb\x80\x69\x3f\xc5\x1d\xb7\xdc\x8e\xb5\x95\
-\x0d\xec\x4e\xaf\xc0\x41\xc7\x81\x21\x8c\x20\x54\x22\xbe\x39\x3c\
-\x8e\x52\x4a\x01\x2e\xd9\x5f\x22\xb1\x09\x00\x44\x41\x13\xe9\x7a\
-\xed\xf4\xe7\xe4\x3c\xd7\x44\xa0\xf5\x85\xa5\x9a\x24\x02\x90\xaa\
-\xf7\xca\x0c\x8d\x97\x63\xc5\xef\x97\x8a\x20\xc4\xd5\xfc\x3f\x97\
-\xb4\x5f\x8c\x03\x10\xa3\xc0\x79\xe0\xf8\x89\x43\x60\x6b\x33\x46\
-\xdb\x16\x24\x06\xe4\x44\x89\xe5\x6f\x9b\x61\x47\xe9\xd0\xf3\x55\
-\xb0\xa1\xfc\x29\xf5\x8f\x92\x40\x41\x1e\x4c\x05\xa6\x72\x80\x59\
-\xaa\x56\x60\x5a\x53\x56\x19\x7f\x4a\x2f\x33\xdb\x8f\x06\xc6\x5f\
-\x66\x1d\x68\x30\x2a\x5c\xea\x03\x32\x44\x3f\xa1\xe7\x09\x6e\xaa\
-\x57\x8d\x93\x5d\x1f\x34\x00\xfd\x86\xb5\x30\x0d\x00\xc8\x32\x98\
-\x43\x45\x07\x20\x65\x57\x55\x86\xa1\xe8\x7f\x5a\x3d\x86\x32\xe5\
-\x07\xa7\xe4\xa1\xb9\x21\x1e\x9f\x41\x36\xb2\xc7\xa4\x0c\x81\xe0\
-\x94\x0b\x40\x48\x2b\x88\xf2\xdc\x81\xab\xf6\x11\x9b\xda\x86\x75\
-\x85\x28\x03\x43\x64\xf5\x75\xbd\x0e\xfd\x60\x80\x70\x5e\x3f\xa0\
-\xae\x2f\xa9\xce\x6a\xec\xfa\x43\xbe\x1e\x4d\x3d\x38\x19\xbf\x71\
-\x01\x62\x0c\xd9\x09\x80\x01\x59\xe9\x70\xfb\x8d\x77\x60\x3a\xe9\
-\xf4\xf5\xcb\xd7\xa8\xed\x09\x88\x76\x1f\x23\xdf\x62\xb0\xc7\xc4\
-\x9a\xdc\x56\xae\xeb\x45\x54\x98\xe7\x3a\x50\x3f\xd7\x0e\xa0\x99\
-\xff\x83\x94\x6b\xae\x68\x22\x1e\xda\x0e\x51\x04\x35\xc6\x05\xce\
-\x20\xed\xfe\xe3\x32\xfb\x2f\x15\xf5\x97\xab\x9f\x59\x69\x3d\xce\
-\x1e\x3d\xa4\xfc\x7f\x56\xe3\x8f\x6c\x00\x8e\x24\xa3\x17\x33\xfc\
-\x98\x1d\xcd\x34\x5e\x45\xe4\xa9\x45\xbf\x68\xc6\xac\x69\x9f\xee\
-\x99\x4b\xa9\x7d\xf5\x7c\x10\xf3\x4e\x02\x36\x86\x5f\xe1\x0f\x58\
-\xa1\x30\x23\x0b\x5e\x14\xc4\x87\x83\x46\x19\x74\x93\x04\xc0\xd1\
-\xcc\x8a\x31\x0c\x69\xb8\xb9\xa6\x4f\xd0\x79\xb9\x7a\x38\x83\x2b\
-\x55\x44\x4e\x59\x83\x88\x19\x75\x95\x8e\x0e\xd4\x7a\xa8\x1a\xb4\
-\xa2\xc5\x04\xa3\xea\x4a\xcd\xc4\x24\x72\xb6\x70\x34\xd5\xf9\x65\
-\x77\x58\x46\xfb\xf3\x9a\x74\x73\x0a\x0e\xf9\xb1\xd9\x51\x24\x56\
-\x62\xa5\x4e\x9c\x16\x98\x52\x72\x04\xb3\x4c\x45\xb9\x4e\x0d\x20\
-\xf3\x70\x4a\x7a\xed\xea\xad\xc7\xcc\x05\xc3\xd1\x1d\x13\x01\x6c\
-\x59\x40\xcc\x33\x01\x9c\x9d\xfc\xca\xea\x0a\x6e\x3c\x7b\x0e\x5d\
-\xd7\x6b\x2d\x1f\xf5\x16\x83\x5e\x93\x89\xd9\x1a\x43\x5a\x52\x5a\
-\x5f\xd7\x5c\xae\x5f\x29\x73\x2e\xcf\xad\xfc\xe7\xe7\xa7\x04\x68\
-\xe6\xeb\x36\xa5\xf2\x66\x4f\x6d\x80\x8c\xa3\x82\x6c\x97\xb9\x80\
-\x4a\xfb\x8e\xcb\xf4\x07\x0f\xda\x80\x65\x80\x25\x46\xc6\xea\xda\
-\x18\x87\xd7\x37\xd1\xc5\x90\x57\x78\x95\xfa\x78\x38\xaa\x8b\x8a\
-\xde\x1a\xe2\x04\x9e\x76\xd1\xba\x0d\xb0\x01\x5d\x6c\x1c\x00\x54\
-\x54\xe1\xba\xae\x1f\x4a\x83\x0d\x27\xed\x6a\x61\xce\x9c\xbe\x27\
-\xd1\x12\x1c\xc4\xdc\xa3\x99\x4c\x09\xf9\x39\xa6\xbd\x7c\x9c\x23\
-\x18\x0f\x46\x5e\x64\x40\xff\x49\xbd\x7f\x4d\x4b\xcb\x34\x9a\x1b\
-\xfc\xbd\x52\x23\xd3\x80\x74\x25\x83\xd5\xe7\x45\xd1\x46\xc8\x81\
-\x88\x67\x96\x96\xa6\x18\x12\x2b\xdc\xc1\xb0\x7d\xca\x4d\x40\x90\
-\x73\xf9\xcd\xab\x05\x5f\xe1\x54\x3b\x9f\xed\xe9\x26\x0c\x54\x48\
-\x40\x4e\x53\xe3\xd4\xb6\xcb\xef\xa0\xd3\x16\x29\xd7\x22\x08\x03\
-\x31\xa0\xc5\x5b\x91\x86\x03\x90\x83\x6d\x06\x19\x84\xcc\xf4\xf4\
-\x98\xb6\x4b\x05\xe5\x02\x88\x4e\x06\x26\x66\xdf\x5e\x77\x0d\x37\
-\xdf\x7c\x03\x0e\xad\x6e\x23\xf4\x1d\x1a\xef\xb5\xa4\x10\x9d\xb3\
-\x10\xd1\x64\x86\x1c\x21\x46\xbb\xa6\x07\x0e\xbd\xa2\x77\xa7\xd2\
-\xed\xe0\x3e\x60\x7c\xbe\x3a\x00\x37\xdf\x8b\x95\xc2\xcc\xb3\x37\
-\x3b\xeb\x01\x10\x2a\x72\x0c\x72\x6a\x9c\x2f\xd6\x58\xc4\x15\x33\
-\xf0\x5c\x01\x82\x21\x44\x1c\x3f\xb1\x86\x76\xa4\xfc\x7f\xc2\xbc\
-\xf4\xbc\xc8\xcc\x04\x9e\xdd\x17\x85\xb1\xdf\x5f\x01\x8d\x46\xb9\
-\xdd\x98\xb9\x00\xb2\x40\x20\x24\x01\x80\x76\x51\x0f\xd9\x7c\xd5\
-\xf4\x1b\xd5\xf3\xf1\xd1\x28\x8f\xb6\x81\x87\x2a\xa8\x7c\x86\x00\
-\x23\x15\x28\x48\x54\x37\xfa\x07\x23\x3b\x76\x4d\xf3\x1c\x61\x26\
-\x6d\x12\x96\x4c\x7f\x4e\x8e\xc8\x29\x3a\xcd\xa5\x3c\x40\x35\xa0\
-\x52\x11\xf9\x72\xea\x9f\x66\x0a\x6a\x4c\x22\x83\x74\x52\x4b\xb9\
-\x24\xf4\xdb\xb6\x0a\x25\x23\x73\x80\xe3\xf2\x1e\xbb\x34\x48\x68\
-\x12\xda\x6c\xa4\x20\x12\xd2\x9e\xb9\x03\x88\x49\xb3\x23\x47\x40\
-\x34\x17\x67\x94\x51\xb2\xe1\xa7\x02\x16\x17\x8c\x62\x96\x51\xb8\
-\xe8\xfa\x2b\xb3\x0d\x95\xdb\x95\x9a\xf7\x11\x6d\x36\x20\x5a\xe4\
-\x8f\x08\x12\x72\xf6\xa8\x2d\xc3\x80\xb3\x67\xce\xa0\x6d\x46\xe8\
-\x26\x53\x9d\x68\x65\x64\x50\x97\x48\x15\x82\x5d\xc6\x3d\x0a\x70\
-\x31\xc0\x4c\x2a\x7c\xe5\x3a\x84\xa6\xfe\xf9\x5a\x02\x74\xf3\xff\
-\x92\xa2\xe8\x9b\x6a\x7c\x25\x95\x98\x96\x5f\x9d\xfa\x57\x69\x93\
-\x64\xd6\x9f\x8d\xe6\x72\x35\xdc\x63\x38\x41\x1f\x18\xa7\xb6\xb7\
-\xd0\x34\x7e\x38\x68\x94\x76\x07\x58\x49\x50\x0f\x1b\x45\x5b\x1f\
-\xc6\x22\xe8\x79\x1f\xd3\x70\x6d\x06\x00\x94\x9c\xe6\x8b\x94\x35\
-\x64\x99\x85\x98\x18\x75\x86\x27\x70\xa5\x2b\x98\x3a\x05\x94\xf4\
-\x04\x85\xf2\xc5\x20\x34\x23\x44\x9a\xd1\x77\xc2\x70\x4c\xb7\xea\
-\xb9\xe7\x8c\xc6\x6a\xf3\xdc\x76\xa4\x61\xbf\xbc\xe2\x23\xb0\x76\
-\xd3\x66\xc8\x48\x94\x1d\x8a\x54\x6a\x3e\x0c\xc2\x8c\x1c\x01\xd8\
-\x2e\x91\x62\x53\x2e\xff\x0e\xca\xe9\xbc\x75\x03\xc8\xa0\x3d\xa3\
-\xc0\xa6\xfb\x3d\x39\x4b\xed\x29\x23\xfb\x48\x69\x7f\x22\xcd\x25\
-\xc7\xe1\x0a\x2b\x34\x7d\x3f\xa5\x0c\x44\xc3\xe5\xe4\x64\x24\xa2\
-\x14\x5d\x17\x93\x83\x64\x31\x2b\xb0\xaa\xb7\x07\x82\x28\xe9\xba\
-\xc9\xef\x73\x71\x02\xcc\xba\x3a\x2c\xbd\x97\x3c\x9e\xe2\xb6\x1b\
-\x6f\x45\xdf\xf7\x56\xef\x57\x1d\xa9\xaa\x4c\x95\x5a\x44\xba\x9e\
-\xeb\xa8\x56\xa8\x09\xe9\xf6\xa2\x03\xce\xf4\xf9\xea\x00\xc2\xfc\
-\xbf\x24\x64\xb1\xce\x5c\x14\x70\x34\xc3\xa9\x80\x3d\x29\x7d\xf7\
-\x84\x0f\xd4\xb4\xcd\x32\x02\x0c\xc4\xa8\x2f\x36\x79\x60\xe7\xc8\
-\x46\xe6\x19\x44\xe1\xbc\x32\x3c\x72\x49\xe3\xd3\xf7\x18\x95\x41\
-\x9b\x03\xda\xef\xaf\xa0\xe7\xde\xd6\x8e\xd9\x9b\x9e\x77\x0f\xd6\
-\x20\x61\xc9\x0e\x52\x8b\x88\xb9\x72\x00\xc2\x39\xea\x33\xf3\x40\
-\x3b\xa0\x4c\x04\x12\x86\x5b\xc6\x0b\xbd\x78\x08\xf4\xd5\x3d\x7b\
-\x57\x92\x06\x94\xba\x7e\x56\x49\x77\x40\x32\x92\xda\xe8\x31\x10\
-\x60\x93\x9a\xd0\x23\x6e\x4e\x0d\x38\x65\x0f\x18\x10\x96\xc8\x1c\
-\x01\x4a\x26\x90\xda\x97\xae\xb4\x03\xd5\x80\x5d\x45\xf6\xa9\xf8\
-\xf1\xe4\x40\x9e\x32\x3d\x58\x0d\x19\x03\xc7\xa0\x84\x22\x52\x67\
-\x92\x3a\x86\x8e\x06\x00\x22\x08\x05\x4b\x38\x00\x14\x9c\x51\x6f\
-\xaf\x76\x0f\xca\x70\xa9\xf1\xa0\xb5\xcc\x60\xa9\x40\x40\xb6\xf7\
-\x3e\x61\x3c\xcc\x58\x5f\x5f\xc3\xcd\xe7\x6e\xc1\xb4\xeb\x32\x98\
-\x28\xb5\xf8\x68\xd2\x50\xcc\x41\xa1\xe2\x86\xd4\x43\x9d\x44\x10\
-\x0f\x4c\x9b\x03\x33\xfd\xfd\xe7\x6b\x09\xb0\x3b\xef\x00\x22\x02\
-\x18\x5e\x86\x03\x2c\xf9\xcd\x48\x73\x23\xa9\x92\x9b\x5b\x42\x61\
-\x25\x04\x57\x5b\x6c\xcc\x71\x8c\x5b\x8f\xe3\x47\xd7\x31\x0d\xc1\
-\xc0\x3b\xe4\x48\x31\xab\x4b\x5f\x74\x06\x8a\xba\x2d\x43\x10\x78\
-\x0a\xea\xae\x60\xa5\xdd\x28\x53\x7d\x89\xbd\x65\xd6\xca\xb5\xb4\
-\x57\xc5\xe5\x1f\x24\x76\x52\x4f\xde\xcd\xae\x06\xa3\xf9\x3a\x55\
-\x86\xba\x76\x54\xb3\xfe\x12\x09\x28\x73\xed\xa5\xa2\xe8\xd6\x20\
-\x21\x2a\x54\x3f\xe1\x28\xf5\x9c\x01\x66\x94\x80\xea\xc1\xaa\x42\
-\x31\x66\x71\x96\x9d\xd4\x4b\xd0\x13\x81\xa7\x8e\xc4\xd5\xeb\x9b\
-\xfa\xfc\x35\xef\xdf\x80\x41\x58\x49\x40\x8e\xb5\x76\x27\xd2\x39\
-\x00\xc3\x7b\x9c\xb3\x12\x24\x93\x0c\x0b\x43\x14\xc9\xb0\x39\x95\
-\x01\xc8\x44\x1e\x9a\x15\x4f\x25\x9a\xa1\x90\x2e\x88\xfe\x54\x47\
-\x7f\x9a\x73\x0e\x32\x50\x87\x12\x0b\x00\x31\x13\x84\x92\xe3\x27\
-\x22\xf4\x3c\xc5\xc6\xce\x18\xe3\x66\x15\x91\x23\x3c\x79\xfb\x39\
-\xcb\x8d\x2a\xa6\xa6\xd8\x24\xa5\xfe\xdb\xab\x44\x80\x34\x8b\x89\
-\x1e\xe8\xfc\x81\x3c\xe8\x6b\x2f\x18\x07\x20\x00\x82\x08\x46\x44\
-\x86\xbc\x96\xe2\x2d\x11\x5b\xca\xeb\x26\x05\xc9\xce\x5c\xe0\xe1\
-\x96\x95\x2c\x10\xca\x82\x51\xeb\xb1\xbd\xb6\x86\x50\x65\x18\x79\
-\x17\xde\x40\xa7\x5e\x91\xf0\x64\xa8\x31\x6d\x20\xb0\x48\xbf\x1f\
-\xae\xc2\x39\x0f\x4f\x3e\xeb\xe5\xa3\x62\x01\x16\x8a\x6f\x45\x2c\
-\xb1\x41\x8e\x3c\x72\x2b\x43\xc3\x1c\xd6\x78\x34\x63\xfb\xf3\x1b\
-\x31\x06\x6a\x01\x9c\xca\xc7\x19\x6d\x80\x9a\x3f\x58\x49\xa7\x89\
-\xcc\xfc\xde\xcc\x7c\x93\xca\x89\x20\xb3\xfc\xd8\x90\x7f\x92\x42\
-\x1d\x92\xe4\x04\xa8\xe2\x08\xe4\x57\xd4\x06\x88\x0c\x18\x04\xc5\
-\x62\xc8\x52\xa2\x71\x8a\xe2\x91\x8a\x56\x41\xaa\x68\x9c\x03\x38\
-\xaa\x53\x21\x2b\x0b\x28\x0a\x9c\x8d\x13\xe7\x7a\xdf\x09\x98\x6d\
-\xd1\x67\xfa\xb7\x3a\xfb\x99\x48\x03\x2e\x85\xa3\x32\x9f\x70\xe0\
-\xe6\xe1\x05\x75\x76\x72\x6c\x69\xba\x94\x92\xda\x74\x88\x96\x2d\
-\x46\xcb\x08\x34\x23\x4c\x0e\x67\xda\x4f\xf1\xc0\x8b\x1e\xc0\xa1\
-\xf5\x1f\xc3\xb5\xe9\x65\x38\xe7\xc0\x52\x66\x5b\x12\xd9\xcd\x55\
-\x38\x05\x39\xc9\x59\x4c\xca\x5e\xe0\xec\xe3\xc1\x6d\x80\xab\xcf\
-\x57\x07\x70\x71\xbe\x0b\xc0\xd8\x97\x1e\xeb\x68\xca\x45\xcc\xc3\
-\x0d\xaa\x19\x2d\xaa\x23\x17\xcb\x20\xe8\xe5\x54\xcd\x2e\xf2\x10\
-\x05\x47\x76\x56\x30\x1a\xb7\x08\x31\xe4\x28\x9b\x9b\x50\x32\xb3\
-\x1e\x63\x30\xd1\x67\x35\x70\x6e\xf3\x05\x5c\x9b\x5e\xc2\xc6\x68\
-\x6b\x5e\x36\x9c\x65\x30\xc5\x0f\x93\x96\x2a\x4b\x4c\x0a\xb3\x6f\
-\x4e\x85\x66\x0e\xa3\x2e\xcc\x40\x1d\x88\xab\x1c\x41\x1a\xe3\x9d\
-\x03\xf7\xaa\x3a\x92\xaa\xf4\x3e\x0f\x4c\x95\xcf\x79\xb6\x44\xa8\
-\xd8\x7f\x5c\x43\x87\x82\x92\xd6\x4b\xb4\x6e\x41\x1c\x66\x0b\x64\
-\x29\x3e\x04\x82\xa0\xe4\x9e\x64\x92\x29\xd2\x8b\x01\xaf\xc6\xf0\
-\x73\x42\x60\x27\x20\x56\x95\x1c\x89\x1a\xfd\x53\xc4\xaf\x4b\x7a\
-\x01\x66\xa6\x07\xd5\x50\x32\xab\x8e\x68\xb0\xa2\x2c\x71\x03\x92\
-\x13\x20\xb3\x7e\x82\xa8\x12\x0f\x2f\x68\x05\xce\x72\x2c\x6a\x8a\
-\x63\x3d\x8a\x3c\x00\x04\xd9\x4a\xbc\x50\x91\xc4\xb8\x2c\x49\x19\
-\x47\x08\x15\x11\x97\xdc\xb5\x4a\xfd\x90\xbc\xd3\x41\x97\x85\x24\
-\x06\x25\x08\x5a\x02\x79\xa5\x0a\x87\x96\xaf\xd7\x05\xbc\xfc\x7c\
-\xc5\x00\x9e\x5a\x94\x01\x5c\xa5\x2e\xd7\x89\x52\xcf\xf5\xd7\x00\
-\x4a\x34\xe5\x9f\x68\x02\x0a\x40\xc1\x09\x2a\x55\x60\x31\x95\xd5\
-\xd0\x33\x8e\x1e\x5e\x83\x6f\xc8\x40\xbd\x98\x6f\x31\xdf\x0c\x17\
-\x60\xfb\x9a\x0b\x36\xa0\x29\x9e\x91\x36\x44\x30\x09\xfb\xd8\xeb\
-\x77\xed\x6f\xc5\x8a\x43\x90\x30\x01\x1b\x11\x95\x92\x24\xeb\x73\
-\xa7\x2a\x63\x29\xd2\xe1\x52\x54\x4c\x32\xbe\x81\xea\xa2\x11\x29\
-\x59\x46\x76\x0a\xb3\x7c\xf7\xd4\x0e\xcc\x9a\xfd\xf5\x94\x24\x2d\
-\x56\xcb\xae\xbe\x3f\x60\x1d\x2e\xd2\xee\xb7\x54\x7f\xd8\xa6\xac\
-\xdb\x53\xd5\x84\x20\x39\x38\x03\xf7\x40\xae\x02\xef\xb4\x44\x70\
-\x5a\x98\xeb\xcf\x3b\x43\x1a\x9c\xb3\xef\x19\x31\x88\x08\xce\xa7\
-\x30\x48\x33\xf5\x7f\xd5\xd4\x24\x95\xd8\x52\x4a\xad\xe2\x0a\x79\
-\x80\xc4\x61\x50\x92\x64\xe4\xa4\x6a\x25\xcf\x26\x04\xb3\x6b\xd0\
-\x33\xe9\xa8\x1a\x06\x47\x9e\xd9\xe7\x99\xfa\xbf\x74\x7f\x84\x05\
-\xcd\x1a\x70\xcf\xed\x77\xa3\xeb\xfb\x8a\x04\x56\x91\xae\x92\xd6\
-\x85\x2b\xe5\x1c\x72\xd4\xd7\x7f\x97\x77\x0e\xbb\xa3\xfe\xa0\x51\
-\xe0\x85\x81\xf4\xf9\x92\x01\x3c\x66\x2d\x8c\x81\xd4\xc1\xbe\xf4\
-\xb9\xb3\x24\x24\x03\xc5\x96\xa1\x3a\x5d\x1a\xdd\xad\x35\x1d\xca\
-\x04\x20\x2a\xd9\xe9\x18\x23\x76\xd6\xd7\xe0\x1d\xd0\xe5\xcd\x38\
-\x34\xbf\x9e\xda\x22\x7d\x8a\x94\x3c\xdb\xc2\x93\xb2\xfd\x6f\xb7\
-\xbf\x0a\x80\xd0\xfa\xd6\x26\xfa\x86\xd2\xe1\x1a\x6a\x64\x98\x5e\
-\xdb\x38\x51\x6a\xdd\x95\x2c\x20\xa2\x6c\x87\x19\x26\x38\xd9\xe0\
-\xc4\x19\xce\x96\xfa\xee\x94\xb3\xa1\xa2\xe6\x4f\x55\x2b\xb3\x5e\
-\x6b\x36\xb7\x34\x7c\x7e\xad\xc8\x4c\x24\xe4\x4c\x0a\xaa\x77\x02\
-\x54\x66\x44\xae\xea\xef\x57\x62\x24\x36\x40\x94\xea\x7b\x07\xd1\
-\xa9\x3f\xd2\x16\x23\xd9\x92\x57\xa1\xa2\x8b\x2f\xe4\x34\xfd\xb5\
-\x5a\xd8\xa5\xf7\xdd\xb2\x18\x32\x9a\xae\x98\xd4\x36\x91\x53\x92\
-\x71\xd2\x0a\x30\x2a\x31\x39\xcd\x18\x29\x0b\xc5\x4a\x6e\x1b\x32\
-\xaa\x45\x1c\xa8\x70\x8d\xeb\x11\x85\x92\xa3\xe0\x1c\xb3\x07\xad\
-\xe2\x9a\xfd\x59\xba\x41\x85\x30\xb4\xb6\xb2\x8e\x73\xa7\xce\xa3\
-\x8f\xff\x05\x82\xd5\x9c\x4c\x64\xb8\xb4\x02\x27\x73\x97\xc3\x19\
-\x09\xca\x03\xbe\x21\x78\x4f\xe8\x5d\x3c\x78\x41\xea\x82\x40\xfa\
-\x7c\x71\x00\x8f\x02\x98\xcc\x3a\x80\xab\x98\x22\x10\xcf\xec\x8a\
-\xab\x06\x7f\x2a\xa5\xd9\xda\xd0\x33\x4a\x5b\xaf\xcb\x32\x36\x95\
-\x6b\x80\x8d\x9d\xb1\x31\x09\xd9\x2e\xd2\xb2\x93\xcd\xd5\x2b\xae\
-\x2a\xad\x7c\x1e\xec\xeb\xab\xa6\xf6\xa0\xed\xc1\x2b\x7c\x19\x9b\
-\xe3\x2d\x38\xb8\x19\x21\x4f\xca\xba\x7f\xf5\x45\x53\x2b\xf9\x96\
-\x25\x07\x18\xfc\x5b\xa9\xae\xd9\x31\x33\x02\x95\xe6\xf1\xe7\x4a\
-\x08\xa9\x16\x6a\xce\xec\x35\x18\xa4\xf1\x5c\x06\x8c\x2a\x40\x2c\
-\x8f\xde\x8a\xae\xad\xe6\x52\x1c\xcd\xa8\x13\x16\x89\x70\xc9\x4b\
-\xc9\x2d\xa7\x26\xae\x3c\x17\xd9\x90\x91\x11\x73\x38\xb5\xec\x5c\
-\x99\x01\xb0\x74\x5c\x84\x94\xef\x2f\x62\xfd\x7e\x58\x29\xa0\x74\
-\xe9\x94\x44\x48\xe4\xac\x1d\xc0\x20\xfb\x73\x92\xc1\xcd\xb4\x3a\
-\x0e\x49\x48\x04\x54\x08\x06\x15\x06\x40\x54\xf8\x12\x49\x05\xb8\
-\x26\x02\xe5\xb6\xa1\xab\x47\xd0\xab\x9c\x8b\x12\x65\xad\x5e\xfd\
-\x1e\x73\x7e\x90\x46\xba\x09\x04\xa6\x88\xa9\xdb\x35\x6f\x57\x95\
-\x16\x96\x9d\x88\x91\x81\x60\x06\x9f\x6e\xce\x13\xc8\x13\x5c\x4b\
-\x40\x03\x4c\x5c\x78\xa6\x40\xfa\xbc\x74\x00\x97\xec\xc9\x6f\xd6\
-\x77\x5e\xc1\x14\x1d\x02\x46\xd4\xcc\xe0\x61\x43\x05\x59\x9d\x51\
-\x2f\xec\x3f\xcc\x00\x5c\xa5\x76\x17\xb4\x23\x87\xad\xed\x15\x74\
-\x31\x66\x94\x9e\xd2\xb0\x07\x4b\x1e\x59\x29\xda\xfc\xac\x7d\xf7\
-\xe4\xe7\x99\x87\x3b\x01\xec\x6f\x86\xd8\xe3\xaa\x5c\xc6\xfa\x68\
-\xc3\xc4\x2d\xec\xf7\xe4\xed\x3f\x94\x4d\x85\x2a\x92\x0e\x65\x59\
-\xef\x9a\x51\x27\x39\x3d\xad\xe5\xab\xd3\xe4\x23\x65\x66\x20\x2a\
-\x95\x9c\x6a\xdd\x16\x68\x80\x13\x24\xd5\x61\x16\x29\x5b\x6f\x2a\
-\xa0\x91\x66\xe6\xe9\xcb\xbe\x22\x2a\x42\x2a\xa8\x35\x07\x4a\xe7\
-\x44\xb3\x8f\x14\xd5\x39\x63\x00\x64\x86\xcd\x94\x68\xbc\xce\xca\
-\x5a\xb1\xc7\xb9\x6c\xb4\xe4\x75\xf1\x45\x4c\xf3\x4f\x69\xc4\x97\
-\x58\x93\x0b\x71\x40\x94\x3c\x14\x04\xb2\xcc\x01\xf6\x37\x1d\x65\
-\x7a\x20\xb1\x3a\x13\x52\xe5\xd1\xac\x25\x51\x06\xa5\x0c\x70\xcb\
-\x63\xd3\x15\xde\x32\x50\x97\xa1\xc1\x87\x5c\x09\x58\xfb\x52\x6a\
-\x8d\xf4\x74\x6d\x50\x1c\x28\x45\x81\x0a\xf6\x34\x0d\xfb\xb8\xe9\
-\xdc\x59\x6c\xae\x6f\x41\x10\xca\x5c\x7b\x6e\x85\x1a\x57\xc1\x9b\
-\xc3\xf1\x04\xd7\x58\xea\xdf\x12\x5c\xe3\x10\x1d\xe3\xaa\xef\xae\
-\x47\x05\xfe\xd8\xf3\xd5\x01\x4c\x00\x3c\x04\xd5\x36\xaf\x78\x8d\
-\x82\xa7\x65\x82\x33\x6e\xd3\x94\x73\x2a\xe0\x44\x66\x06\xb9\x6a\
-\xca\x2e\x32\x89\x6e\xf8\x18\x16\x34\xde\xe1\xd0\xaa\x49\x80\xa5\
-\x0b\x44\x14\xa0\x82\x89\x58\xa6\xd1\x75\xa9\xea\xf0\x92\x4d\x54\
-\x3b\xf0\x32\x3f\x40\xff\xc6\x5e\xd8\x07\x43\xb0\x31\x5a\xb3\x08\
-\x5a\x39\x27\x00\x4c\xae\x8c\xf9\x66\xc4\xb1\x44\xd7\xf4\x65\x41\
-\xf1\xdd\x82\x85\x17\x25\xc5\x27\x92\xdc\xef\x4f\xfd\xb1\xe1\x3e\
-\x80\xfa\x45\x70\xe6\x96\x64\x8e\xf1\x38\xd8\xad\x24\xa8\x16\x9f\
-\xd0\x80\xfe\x9a\xfe\x9d\x42\x54\x6d\x1c\x96\xf2\x62\x67\xb2\x91\
-\xcd\xb8\x67\xd2\x0e\x19\x55\xc8\xa8\xc7\xa4\x93\x70\x91\x2b\x67\
-\xe0\x54\xf4\xd2\xe6\x9a\x94\x37\x4f\xde\x28\xd6\x95\x1e\x84\x49\
-\x9a\x73\x06\x08\xd5\xf0\x25\x73\x03\x38\x2b\x1a\xc1\xe6\x08\xf4\
-\x0d\xab\x94\x91\x32\x1b\x8f\x8a\x10\x48\x5e\x2e\x42\xb9\xbd\x38\
-\xf0\x00\xb9\x51\x22\x79\x3e\x21\x95\x5c\x59\xce\x2d\xd7\xf4\xf3\
-\xe3\xdd\x7d\x08\xb8\xfd\xdc\x9d\x58\x5f\x5f\xc7\xb5\xe9\x25\x8d\
-\xf0\x69\xa0\xc9\x11\x90\xa2\xbe\x53\xc3\x77\xad\x83\xb3\x0c\xc0\
-\xb5\x84\x51\xeb\xf0\xb4\x4c\xad\x13\x75\x60\x0b\xf0\xfd\xcf\x57\
-\x07\x00\x00\x1f\x00\xf0\xd6\xb9\xd4\x40\xf6\x71\x86\x36\x87\xc6\
-\x0f\x4d\xef\x4c\xb5\xb3\xd8\x51\x0d\xda\x16\xa9\xfb\x81\x13\x18\
-\xaf\xb7\x18\x8f\x46\x88\x1c\x2b\x31\xdc\xe1\x5a\x26\xca\x73\xee\
-\x5c\xb5\xf7\xaa\x48\x98\x09\x1b\x9c\x07\x34\x92\x74\xd9\xee\x74\
-\x0f\x10\xc2\x6a\xbb\x9a\x7f\x27\x57\x88\x7d\xe6\xfc\x4b\xe9\x89\
-\xe7\xdc\x75\x80\xf2\xdb\xc5\x99\x84\x23\x50\x54\x10\x6b\x5c\x60\
-\xb8\x23\xa0\xd4\xa7\x2c\xc3\x7a\x22\x6f\x0d\xae\xcc\x94\x2d\x57\
-\x61\xa9\xd4\x7f\x72\xfb\x90\x72\x8f\x5f\x0a\x62\x61\xaf\xb3\x37\
-\x03\x97\xdc\x09\x48\xb9\xac\xce\xf3\xdb\x73\x76\x29\x4f\xe7\xcc\
-\xda\x53\x05\x5c\x0f\x26\xd1\xd4\x1e\x80\xb0\x33\xa5\x1c\xca\x6d\
-\x5b\x76\x69\x9b\x8e\x1a\xb8\x27\x81\xb8\xa8\x6d\x59\xc3\x4d\x1c\
-\x39\xb0\x97\xcc\x80\x17\x52\x99\x2d\xe2\xb2\xf2\x3c\x39\x20\x62\
-\xb6\x26\x52\x72\x6a\x95\xb2\x52\xe6\x0a\xc8\x9c\x7e\x62\x1e\x48\
-\xc8\x57\x50\x25\xb1\x4e\x65\xba\x22\x3b\x70\x57\xeb\x40\xf3\x00\
-\x98\xf2\xad\x83\x6f\x08\xd4\xdb\xcf\x37\xb6\x1e\xdc\x5b\xad\xdf\
-\xe8\xe7\x7a\xd3\xc7\xab\x33\x00\x9a\x86\x70\xa5\xbf\x2e\xd1\xef\
-\xfd\x56\x4a\x3f\x6f\x1d\xc0\x42\xef\x75\x41\xf6\x31\x45\x40\xe3\
-\x15\xec\x29\x1b\x65\xa8\x26\x9d\x65\x59\x70\x72\xf9\xfa\x1b\x90\
-\x3f\x04\xda\x25\xd8\x3c\x32\x06\xb5\x82\xc0\x51\x55\x95\x88\x2c\
-\x36\xc2\xda\x43\x34\x88\x86\x3c\x58\x9e\x59\xad\x05\xe7\x9a\xb5\
-\x85\x4c\x07\x16\x00\x57\xcd\x09\xac\xf8\x51\xb5\x24\xa3\xb4\xf8\
-\xa8\x92\x80\x96\x34\xe9\x22\x52\x10\xed\x0c\x1a\x32\x38\x1b\x15\
-\x15\x50\x30\x35\xc9\x73\x6b\x00\x65\x73\xaf\xd4\x9b\x92\xa5\x02\
-\x4d\x0b\x97\x82\xac\x77\xaf\x7c\x0a\x37\x98\x4e\x8c\x99\x20\x54\
-\x5a\x80\x9c\xa7\xfb\x2c\xda\x82\x07\x92\xe1\x85\x66\x27\xd6\xeb\
-\x77\x8a\xe8\xdb\x3f\xd3\x9b\xe4\x17\x13\xdb\x34\x20\x40\x88\xd6\
-\xcb\x37\x47\x21\x2a\x46\xea\x04\x19\x33\x70\x66\xa8\x31\xb5\xee\
-\x12\x31\x08\x94\xb1\x16\xc7\xd6\x1d\x4e\x3a\x02\x89\x68\x94\x54\
-\x36\x52\x49\x48\x92\x7f\x77\xa1\x4c\x88\x81\x90\x29\x13\x90\xdc\
-\xf3\x12\x5e\x50\x05\xcc\x88\x97\xa6\x0d\x55\x09\xcb\xa8\x07\xbc\
-\x32\xc6\x92\x72\x31\x22\x74\xd8\x03\xbb\xa8\x86\xed\x2d\xf5\xaf\
-\x6a\x7d\xd7\x9a\x43\x68\x08\xbe\xd1\xaf\x7d\x43\x68\x46\xba\x6a\
-\xfc\xa9\x6e\xff\x7a\x83\x40\x3f\x89\xe7\xf1\x30\x10\x00\xfc\x92\
-\x51\x82\x07\x7f\x6b\x2a\x01\x4f\xff\xff\xd9\xfb\xd6\x58\x4b\xcf\
-\xeb\xac\x67\xad\xf7\xfb\xf6\x3e\xe7\xcc\xcd\x9e\x8b\xe3\xb1\x13\
-\xe7\x52\xbb\x4d\x28\xbd\xd1\xa6\x2a\x55\x01\x89\xaa\x15\x20\x95\
-\x1f\x48\x80\xda\x82\x10\x2a\x42\x48\xdc\x84\x84\x2a\x84\x10\xa5\
-\x15\xfc\x28\x42\xa2\x5c\x54\xca\xad\x08\x0a\x08\x08\x82\x16\x54\
-\x01\xa5\x49\x53\xb5\x49\xdc\xa4\x76\x9d\x38\x71\x7c\x8b\x9d\xf1\
-\x8c\xed\xb1\x3d\xe3\xb9\x9f\xdb\xfe\xde\xb5\xf8\xb1\x2e\xef\xfb\
-\x9d\xb9\x38\x4d\xe3\xf1\xd8\x9c\x6f\xb4\x75\xce\x9c\xb3\xcf\x6d\
-\xef\xbd\xd6\xbb\xd6\xb3\x9e\xf5\x3c\xb2\x85\x93\xe3\x21\x53\xe5\
-\xf1\xc9\x4e\xb2\x60\xb5\x09\x83\x10\xd1\x1e\x6b\x6d\x9d\xb9\x51\
-\x89\x2a\x0e\x1e\x18\x41\x64\xc0\xdd\x10\x6a\x39\x32\x07\xe1\xa8\
-\x07\x01\xa3\xba\xf6\xbe\x37\x74\xfb\xd2\xe8\x52\x34\x05\x33\xa3\
-\xbc\x57\x15\x5c\xda\xbe\x02\x59\x6c\x60\x39\x2e\x67\x0e\xbc\xa4\
-\x8d\x29\xd7\x80\x0d\xc9\xc0\xee\xdd\x69\x1b\x73\x2e\xcc\xbc\xa9\
-\xeb\xfb\x7b\x96\x5f\x03\xbf\x7a\x1e\xc1\x4c\xb9\x77\x46\xd3\x95\
-\x0e\x0c\xd4\xf9\x68\xaf\x23\x59\xa5\x90\x09\xb5\x85\x1f\xd1\x50\
-\x4a\x66\xd7\xe7\xd3\xe6\x25\x10\x43\x77\x32\x01\x4d\x90\x98\xfd\
-\xb5\xb0\xcf\xe8\x19\x42\x8a\xe2\x7d\xbb\x28\x37\x77\xa1\xa2\x40\
-\x2d\xd9\xf7\x93\x47\x20\x41\x0c\x24\x74\xf4\x9f\xd4\xe8\xc0\x4a\
-\x36\xfa\x9d\x89\x1e\x77\x2e\xbf\xd9\x7a\xd4\xf6\xa4\xce\x74\x04\
-\x3b\x4a\x66\x6b\xb3\x18\xc4\xd2\x7e\xd6\x4c\xb2\x4c\x2d\xb1\x05\
-\x19\x29\xe4\xbc\xb9\x01\x86\x8d\xa4\x23\x33\x13\xd7\x78\x1e\xa6\
-\xb2\x83\x63\x47\x8f\xe0\xcc\xab\x57\x50\x46\xff\x1e\xc5\x83\x7e\
-\x24\x94\x81\xbb\x93\x9f\x51\x46\xa0\x2c\x18\x8b\x45\xc1\x6b\xdb\
-\x9b\xd8\xc1\x2d\x01\xc0\x5f\x7c\x33\x83\xf3\x76\x24\x80\xa7\x00\
-\xbc\x00\xe0\x03\xd8\x33\x7f\x7d\x59\xae\xe2\x24\x1d\x02\x97\x38\
-\xa9\xe7\xe3\x2b\x02\x20\xe2\x4f\xae\x73\x84\xaf\x5b\xf6\xf2\x2c\
-\x7d\x60\x6d\x69\xab\x97\xab\x8a\x0a\x06\xc7\x09\x1b\x62\x8b\x5d\
-\x6f\x1b\x23\x1f\x8b\x79\x99\xe1\x02\x92\x54\xd0\x8e\x68\xe4\x2f\
-\xfa\x58\x16\xb9\xb4\x7d\x0d\x87\x54\xb1\x18\x16\x1d\x13\xaf\x4b\
-\x02\x69\x8f\x25\x1d\xb6\xdc\xc0\x3e\x9f\x6a\x75\xa6\x1a\x1d\x6e\
-\x40\x7b\x16\x7c\xba\x47\x64\x8e\x63\xe9\xcc\xc0\x13\xb3\xb1\x60\
-\x03\x47\x6b\xb7\x7e\x2c\x7b\x90\xfd\xf6\x99\xf8\x8a\x02\x50\xcd\
-\xa4\x9b\x7b\xf8\x0c\xb0\x18\x89\x27\x78\xf8\xcc\x6c\xa7\x6f\xb4\
-\x1c\x6a\xab\xd3\xec\x1b\x3a\xc9\x67\xf0\xc4\x12\x5a\x81\xcc\x6c\
-\x8f\x8a\x32\x0a\x04\xc2\x05\x52\xab\x97\xf8\xd1\x0a\x89\x81\x79\
-\x6c\x3d\x38\x87\x63\x31\xa9\xd5\x2e\xd4\x11\x6a\xfa\x49\x86\xc4\
-\x32\xd2\xbc\x55\xe8\x27\x32\x01\xc2\x86\x19\x4d\x2a\x1a\x77\xee\
-\x4a\x44\x64\x76\xdf\xdc\x19\x9d\x84\x92\x48\x54\x05\x1d\x1e\x70\
-\x60\xfd\x20\xbe\xe1\xbd\x1f\xc4\x0b\xe7\x4e\x81\xc7\x05\x4a\xb1\
-\x4a\x20\xc0\x3e\x1e\x08\xc3\xc8\x28\x63\x03\xfe\x86\x05\xa3\x14\
-\xc6\xd9\xd5\x95\x5b\x9d\xfe\xbf\x09\xe0\x93\x6f\xf7\x04\xb0\x05\
-\xe0\xd7\xae\x4b\x00\x00\xce\xcb\x16\x2e\xc9\x36\x8e\x0c\x6b\xdd\
-\x2c\xbb\x09\x48\x86\x66\x9b\xb6\x0e\xbb\xcd\xf5\xa3\xbf\x56\x80\
-\x46\xc2\xda\x81\xd1\xf8\x00\xda\xcc\x3e\x89\xa2\x12\x88\x76\xaf\
-\x53\x11\xee\xe8\xc1\x6d\xeb\xcf\xd5\x61\xb5\x1b\xe7\x05\x17\xb7\
-\xa3\x23\x4f\x2a\xb8\xb8\xbd\x89\xc3\x4b\x60\x39\x2c\xb2\xae\x94\
-\xe4\xac\x4b\xbe\x58\xac\x0f\x8e\x50\xe5\x64\x27\x48\xca\x02\x52\
-\xbe\xc0\xa8\x57\x0e\xc2\x1e\xc6\xda\x75\x54\xd6\x9b\xc9\x75\xbb\
-\x65\x77\xec\x2c\x84\xb2\x0f\x04\x42\x92\x0a\x3f\xbd\x59\x86\x50\
-\xa8\x0a\x45\x05\xc1\x4e\xd1\xcd\xdd\xc3\x04\x2e\x99\x05\x55\x7c\
-\xc4\xaa\xe2\xbc\x16\x85\x69\xbd\x12\x54\xd8\xd1\x78\x75\x1a\xaf\
-\xc3\x9e\xdc\x56\xa7\xd9\xab\x01\x05\x41\x27\x4b\x0a\x50\x31\x30\
-\x75\x92\x6c\x35\xe0\x01\xad\x6c\xd5\x82\x19\xf4\x50\xb6\x4e\x31\
-\xf7\x8b\xe7\x29\x0c\x36\x29\x94\x93\x58\xbc\x7d\xe8\x5a\x81\x00\
-\x15\x7b\xdf\x82\xee\xe4\xa7\x28\xdf\x09\x06\x54\x32\xac\xf2\x29\
-\x0d\xab\x52\x48\xbf\xbb\x8e\xb1\x8c\x38\x7a\xe4\x18\x68\x50\xc3\
-\x03\x8a\x05\x39\x17\x80\xfd\xff\x65\x64\xab\x06\x46\x4b\x06\x8b\
-\xb5\x82\xcb\x9b\x3b\x38\x57\x6f\x59\xfe\xff\x2b\xbc\x89\xab\xc0\
-\xb7\x2b\x01\x00\xc0\xc7\x00\xfc\x99\xeb\x5f\xc7\x8a\x53\xab\x4b\
-\xf8\x96\x71\x1d\x34\xa0\xf1\xbb\x5d\x0c\x42\xab\xb9\xc7\x58\x29\
-\x40\xee\x6d\x61\xb4\xd2\x10\xc6\x50\x01\x86\x05\x63\xe3\xf0\x90\
-\x6e\xc3\x0a\x3b\x35\x48\xc9\x30\x45\xed\xda\xea\x28\x9d\xa5\x2b\
-\x85\xe3\xa4\xcc\x51\x63\x70\x03\x68\x6e\x45\xe5\x60\x91\x40\x41\
-\xb5\xe2\x52\xbd\x86\x43\x6b\x82\x65\x19\x5b\xbb\xd2\x8d\xea\x48\
-\xda\xe0\x30\x82\xbf\x2d\x15\xb1\x27\x02\x6d\x23\xc3\x7e\xa4\x38\
-\x6b\x4b\xa9\xbd\xe8\x3a\x71\x4b\x9a\xf1\x01\x3a\x62\x4f\x92\x7a\
-\x38\x55\x86\x85\x9a\xd0\x47\x22\xdc\x20\x54\xea\x2d\xc3\xac\xec\
-\x67\x17\x46\x6d\xa0\xa5\x97\xe7\x4a\x20\xf1\xe0\xac\x86\xf2\x33\
-\x7b\x6f\x5c\x4d\x06\xdb\x02\x57\xdb\x09\xce\xad\xd6\xa0\x18\xcf\
-\xb2\x9d\xba\x55\x19\xec\x00\x20\xa9\x57\x00\x8e\x39\x90\x4d\x08\
-\x53\xee\xdc\x56\x8c\x35\x40\xfe\x46\xfe\xd1\x96\xec\x95\x15\xec\
-\xa3\x5d\x72\x1c\x08\xac\x49\x15\x30\xad\xfe\x26\x5d\x8e\x3d\xac\
-\xea\x60\xe9\xc5\x96\x62\x12\x76\x98\xda\x01\x34\xdf\x83\x4a\xae\
-\xc1\xb8\x18\x30\x2c\x0b\x86\xa5\x9d\xfe\xa5\x4f\x00\xde\xfb\x97\
-\x91\x51\x46\xc6\xb0\x64\x8c\x03\xe3\xcb\xd7\x2e\x42\x6f\x3e\xfb\
-\x3b\x03\xe0\x23\x6f\x76\x60\xde\xae\x04\xf0\x4b\xce\x09\xb8\x6b\
-\x6f\x1b\xf0\x4a\xbd\x86\x8b\xb2\x85\xbb\x86\x35\x4c\x70\x55\xde\
-\xea\x65\x3f\x42\x30\x52\x33\x6b\xab\x9f\x1c\xac\xb6\x24\x42\xa4\
-\x18\x99\xb1\xbe\x31\xe6\x5e\x7f\xdf\x38\x9a\xc9\x45\x3f\x4e\xec\
-\x08\x45\x5d\x99\x2f\x9d\x72\x4e\x5b\xf8\xe1\xd9\x29\xab\x5e\x9e\
-\x36\x8a\x6d\xc5\xc5\xcd\x4d\x1c\x5a\xae\x63\x6d\x31\x3a\x4a\xef\
-\xbb\x60\xfe\x3b\xe7\x06\x7f\x20\x67\x21\x66\x42\x3d\x29\x48\x1b\
-\x67\x88\xf6\x2c\x0a\xd1\xfc\xd5\x16\x2f\x6e\xa0\x6d\xfd\xcd\xcd\
-\xc7\x35\xc1\xaf\xe6\x5a\x10\x3f\xc9\xfc\xfa\x66\x82\x1f\x33\x7a\
-\x7a\x31\x91\x56\x7f\xa5\x33\x19\x8e\x62\x23\x39\xc9\xd1\x5c\xd1\
-\x4e\xf1\x48\x02\x64\x0d\xc1\x2f\x05\x15\x9b\xa2\x50\x8d\x09\x80\
-\xb8\x04\x97\xa0\x30\x41\xc4\xc6\x86\x44\x02\x14\x47\xeb\x2b\x0c\
-\x00\xe4\xf6\x5c\x24\xcb\xd8\x2b\x1a\x4b\x38\x96\x30\x72\xc7\x3e\
-\xba\xc0\x58\x1a\x62\x05\x3a\x93\x0d\xa5\xc6\xc8\xcb\x35\xe2\x18\
-\x07\xd2\x1c\x10\x8c\x60\xe7\xf8\xb9\x11\xfc\x51\x6d\x04\x29\x85\
-\xfa\xd7\x84\x3d\xaf\x65\x41\x18\xd7\x19\xe3\x5a\x31\xa0\xaf\xd8\
-\x69\x4f\xa5\x0f\x7e\x7b\xbb\x5c\x16\x9c\xbf\xbc\x85\x97\x77\xae\
-\xde\x8a\x8c\xff\x93\x00\x5e\x7f\xa7\x24\x80\xb3\x9e\x04\xfe\xc4\
-\x8d\xaa\x80\x67\x77\x2e\xe0\xc3\x8b\xfb\x50\x46\x46\x9d\x24\xc6\
-\xcb\xf6\x22\x12\x2b\xd1\x44\x1a\xb1\x3a\x24\xa4\x8b\x9a\x1e\xc0\
-\x30\x30\x16\x63\xc1\x4a\xaa\x9b\x5b\x70\xdb\xd0\x93\x90\xae\x0e\
-\x63\x06\x24\x4f\x20\x5a\x00\x75\x6d\xc2\xd6\x06\xc4\xec\x5d\x3a\
-\x34\x4a\x3b\xb5\xe2\xfe\xf8\xa8\xb8\xbc\xb3\x09\xd1\x75\xac\x8d\
-\x0b\x8f\x4c\x69\x0a\xd9\xc9\xf0\x8b\x16\x86\x93\xa9\x96\x09\xc9\
-\xd1\xae\x14\xf4\xec\xe5\xb7\x35\x9a\x8b\xae\x87\x9d\x99\x79\x6a\
-\x02\x97\x15\x0d\x70\x0c\x94\xbf\xb5\x00\x01\xf2\x05\xe1\x45\xb2\
-\x54\x17\x3f\xb9\x59\xd4\x7a\x6d\xb6\x89\x82\xc9\x74\xc5\xef\xc9\
-\x66\xf6\xc1\x46\x9a\x2a\xc4\x4d\x08\xc5\xdb\x05\x76\x55\x1f\x49\
-\x9a\x75\x80\x6c\x05\x25\x56\x81\x99\xad\x22\x28\x6a\xd5\x84\x9a\
-\xb5\x76\x2e\x27\x91\xed\x0c\xa8\xf3\x2c\xa2\xdc\x67\x30\xc4\x41\
-\xc6\x00\xfc\x52\x61\x28\xf3\x6d\x87\xa3\x70\xa7\x7f\xc0\x73\x10\
-\x78\x76\xd2\x17\x80\x8b\x13\x74\x1c\xb8\x03\x93\xa3\xf8\x2e\x64\
-\x5a\x90\x15\x41\x0b\xd8\x39\xf5\xba\x2c\x18\x8b\x35\xc6\x72\xa3\
-\x78\xdf\x6f\xa0\x1f\xb1\xa1\xfd\xdc\x25\x02\x66\xc2\x53\x17\xce\
-\x75\xa4\xae\xeb\xae\xc7\xbc\xfc\xc7\x3b\x25\x01\x00\xc0\xcf\xdd\
-\x28\x01\x80\x80\xf3\xd3\x26\xce\x6c\x5f\xc6\xfb\x0e\xdd\x85\x5d\
-\x46\x5a\x7e\xa3\xb2\x03\x7f\x8a\x22\xbd\x48\x66\xb7\x02\x5b\xed\
-\x81\x1e\x06\xb2\x11\xa0\x44\xa1\x6e\x55\x82\x33\x75\xd2\xe8\x52\
-\x3b\x43\x91\xde\x74\xc4\x84\x43\x1b\x3e\xa0\x8e\x12\x12\xf1\x9c\
-\x4a\x8a\xce\x65\xcc\xb9\xee\x55\x04\x97\xb6\x36\xb1\xaa\x15\x07\
-\x16\x4b\x4f\x0b\xa6\x0f\xd7\xc4\xb2\xbc\x72\xc9\xf5\x01\x49\x11\
-\xcc\x26\x7d\xa6\xc9\x7c\x33\x24\x9e\xdb\x24\xa0\x9b\x10\xc4\x8b\
-\xdf\x02\xda\x01\x3e\xa2\x4c\x5a\xc1\xde\x97\x9c\x9e\x34\xf7\x20\
-\xf1\x40\x0a\x62\x8c\x2a\xa7\xb3\xb1\x50\x4f\x2c\x42\x96\xfd\xd9\
-\x33\xc7\x10\x91\xd8\x4a\x7c\xa9\x1e\x90\xc5\x70\x00\x76\xc6\x65\
-\x75\x46\x5e\x21\xa7\x04\x07\x7f\x92\xa1\x55\x9c\x25\xe8\x7f\x7b\
-\x75\x76\x9f\x07\x6d\x6a\x1e\x06\xbf\x20\xf0\x12\x97\x17\x17\x69\
-\x81\x4d\x6e\xc4\x49\x42\xce\x94\x6c\x3d\x7d\x2e\x5a\x85\x4d\x99\
-\x68\x1b\x6e\x26\x27\xdf\x95\x8b\x4a\xcc\xec\xfb\x84\xc0\x9e\x8c\
-\x68\xa6\x51\x10\x5f\x3b\x0b\x5e\x15\x0c\x8b\x82\xc5\xc6\x80\x61\
-\xad\x01\x80\x5c\x18\x65\x96\x08\x08\xcb\xc5\x80\x67\xce\x9c\xc7\
-\x6b\xdb\x9b\x37\x13\xfb\x9e\x00\xfc\x75\x27\xd1\xbd\xa3\x12\xc0\
-\x2f\x01\xf8\x2c\x80\x6f\xb9\x51\x12\x78\x6a\xeb\x1c\x8e\xae\xaf\
-\xe3\xd0\x72\x89\x69\x12\xeb\xe7\x06\x5f\xf8\x70\xb9\x2c\x03\xf1\
-\x3a\x95\x1c\x25\x50\x11\x2c\xd6\xd9\x59\xa5\xde\x69\x6a\x75\x75\
-\x9b\x0e\x34\x74\xbd\xb6\x20\xf8\x88\xe8\x4c\x3b\x22\x14\x5a\x9b\
-\x12\x8e\x78\x39\x5e\xaf\xdb\xe1\x4f\x72\x49\x54\x24\xfe\x22\xb8\
-\xba\xbd\x6d\xc2\xa4\xcb\x25\x0a\x17\x54\xad\x21\x88\x6d\x42\x10\
-\x64\x89\x86\x3a\x3c\x20\x4f\xfd\x18\xf5\x75\x14\xe0\xb6\x1d\xa5\
-\xa9\x96\x91\xc3\xa8\x14\x4e\x61\x7f\x3f\x68\xab\xbd\x26\xa0\xba\
-\x1f\x0a\x75\x46\xa0\xd2\xc0\xb0\x68\x2b\xfc\xc4\x4f\x0d\x42\x5f\
-\xe6\x11\x31\x60\xb0\x78\x3f\x2e\x62\x23\x3f\xb8\x6e\x1e\x13\xa1\
-\xba\x3e\x20\x17\x4d\x84\x04\x3d\x8f\xc2\x83\x48\x10\x15\x04\xdc\
-\x5d\xc8\x67\xfe\xd5\x69\xc5\xec\x5a\x00\x15\xa9\x1a\x24\x8e\x03\
-\xb1\xef\x06\xe4\x1f\x97\x3c\x1f\x4d\xa2\x40\xaa\x0b\x72\x63\x93\
-\xa6\xeb\xb4\x18\xcf\x20\x9f\x47\x9a\x2f\xe4\x70\x3f\xb6\x1b\x18\
-\x54\xec\x94\x2e\x4e\xdc\x21\x6e\x09\xc2\x92\x3e\x37\xcd\x03\x6f\
-\xc5\x78\x20\x8c\x1b\x05\x8b\xb5\xe2\xc1\xef\x73\x7f\x3f\xf9\x69\
-\xb0\xd2\xff\xe2\x85\x2d\x7c\xfe\xfc\x6b\xb7\x2a\xfd\xff\x01\x80\
-\x8f\xde\xae\xa0\xbc\x9d\x09\x60\x17\xc0\x3f\x06\xf0\xaf\x6f\xf4\
-\xc9\x15\x04\x8f\x5f\x7a\x05\xdf\x75\xcf\x7b\xb0\x58\x16\x4c\x93\
-\xb8\xc7\x5a\xb3\x6f\x32\xee\x7e\xcc\xd2\xbd\x97\xae\x8c\x8d\xc3\
-\xa3\x9d\x3e\x22\x79\x42\xc6\x58\x8e\x7c\x3d\x4b\x52\xe8\x01\x69\
-\xf1\x14\x1c\x02\x24\xfa\xef\x5a\x6f\x49\x1c\x53\xf4\xac\xa4\xbe\
-\x8c\x6f\xe6\x38\x73\x18\xe7\xda\xee\x0a\xbb\x22\x38\xb8\x58\x60\
-\x28\x43\x43\xfc\xc3\x0a\xdd\xd1\x67\xb7\x90\xb3\x2a\x85\xd9\xc7\
-\x68\x73\x7b\x34\x74\x04\x36\xd1\x36\x10\xd4\x6e\x52\x32\x37\x23\
-\xa3\xe4\xfb\xb7\x99\x0a\xbb\x0b\xb3\x63\x03\x29\xe7\xa5\xa9\xca\
-\x4b\xdd\x8e\x3c\x67\xe5\x10\x00\x9a\x9b\x72\xc4\x44\x46\xb5\x1b\
-\xf5\xd9\xfd\xe3\xf3\x22\x2e\x7e\xc1\x56\x87\xb0\x63\x7a\x15\xc6\
-\xe2\x23\x17\x0e\x29\x4c\xd0\xca\xf6\x78\xb3\xb7\x45\xee\xf5\x40\
-\xa4\x9d\x6c\x98\xff\x2e\xde\xc3\x8b\x73\x89\xc3\x3a\x8c\x85\x53\
-\xdb\x80\xbc\x82\x08\x8c\x27\x16\x93\x6c\x80\xd3\x4c\x49\x15\x5e\
-\xee\x47\x8f\xef\x27\x35\x11\x19\x10\x1d\x04\x9e\x21\x90\x7c\xb2\
-\xb1\x1e\x75\x82\xa7\x5d\x39\x18\x6d\x10\x15\xc5\xd2\x13\x00\x31\
-\x50\x86\xd2\xb5\x16\xc0\xb8\x18\x30\x6d\x57\x7c\xfa\xd4\x4b\x58\
-\x69\xbd\x59\x02\xf8\x75\x00\x3f\x71\x1b\x63\xf2\xb6\x26\x00\x00\
-\xf8\x0f\x00\xfe\x32\x80\x6f\xbd\x51\x15\x70\xa1\x6e\xe3\xb1\xd7\
-\xcf\xe2\x3b\xdf\x75\x1f\xc6\x35\x46\xad\xb6\x04\x72\x9d\x35\x9c\
-\x74\xb6\x61\x55\xb0\x5c\x1f\x1c\xec\x12\x2f\xf7\xdb\x0b\x01\x42\
-\x0e\x4c\x77\xf2\x61\x41\xfa\xd1\xa6\x2a\xa4\x1d\xf7\x5f\x44\x73\
-\x7e\x4c\x68\xfb\x9d\x69\xc0\x19\x2b\xa8\x41\xf3\xa5\xb6\xc8\x03\
-\x98\x3b\x51\x9d\xb6\x71\x60\x6d\x89\xc5\xb8\x04\x05\x26\x90\x5b\
-\x71\x41\xa8\x09\xfe\x4e\x4f\xfb\xa5\x50\xdb\x33\x40\x14\x6d\xf4\
-\xa5\xb0\x4d\x3e\xea\x7d\x02\x93\x35\xcd\xb9\x22\x1c\xbe\x00\xc9\
-\xed\x8b\x51\x63\x8f\x3e\xf6\xbb\xa7\x94\xe8\x44\xb7\x4c\xa4\x79\
-\xb2\x9b\xc1\x6a\x7b\x1c\xd5\x81\x4e\xd3\xf1\x33\x39\xf6\x28\x93\
-\xa5\x08\xa8\xfa\x29\x39\x08\x74\xf2\x59\x7c\xf1\xd6\x41\x6b\x8e\
-\x19\x41\x40\xf5\x99\x7f\xa5\x20\x4e\x91\x4f\x79\xc4\xc6\x83\xa8\
-\x90\x89\xb2\x52\x23\x57\xda\x95\x4e\x4c\xd3\x26\x00\x3e\x82\x8d\
-\x3f\xb1\x38\xcb\x30\x9d\x87\x7d\xa9\x88\x5b\x02\xb0\x93\xdd\x4a\
-\x7e\x0b\x78\x2f\xdb\x9d\xaa\x6b\x48\xbe\xdd\xa8\xb0\x93\x88\xe6\
-\xda\x03\x80\x9a\x6e\x20\x76\xb1\xdc\x18\xb0\x58\x16\xff\x19\xf6\
-\xf8\x04\x07\x00\x13\xf0\x1b\x5f\x3a\x83\xd7\x77\xb7\x6e\x56\xfa\
-\x9f\xf6\x49\xd9\xd6\x3b\x39\x01\xec\x00\xf8\x9b\xce\x6e\xa2\x1b\
-\x25\x81\x97\xb7\xaf\xe0\xb7\x5e\x3b\x8b\x6f\xbf\xef\x24\xca\x82\
-\x51\x57\x92\x74\xfb\x5e\x8f\x3e\x25\x9d\x2b\x61\xb1\x56\xcc\xb8\
-\x5b\x6c\xce\xcd\x20\x3f\xfd\xd1\x4b\xdf\xb9\x03\x0c\xba\xe0\xd7\
-\x14\x14\x09\xd5\x16\xf5\x93\xba\x6a\x93\x8b\x8e\x5e\x3c\x27\x11\
-\x80\x2d\xb8\xc4\xb9\x49\xda\x99\x5e\x58\xb7\x3b\x91\xe2\xd2\xd6\
-\x36\xd6\x27\xc3\x05\x8a\xb3\xe5\x48\x7b\x13\xd0\x0e\x53\xf4\xa3\
-\x9e\x49\x1b\xef\xd3\x91\xef\xa6\x4a\x34\x87\x9f\xfa\xcd\x3f\x05\
-\x6c\x27\xff\x3a\x1d\x42\x6a\x6c\x43\xea\x4d\x31\x14\xb3\x73\xdf\
-\xfd\xf9\x48\x8b\x01\xa9\x4d\x77\xdd\x89\x3f\x80\x68\x01\x22\xd8\
-\x0b\xc0\x2e\xe2\x52\x38\xb8\x0c\xe2\xf3\x78\xb1\x2d\x41\x9f\x7e\
-\x10\xb9\x22\x10\x18\x5a\xd4\xd6\x7e\xd9\x50\x7f\x23\x0f\xdb\x9c\
-\x2e\xc4\x42\xc4\xef\x6f\x1c\x82\xb6\xd8\xc3\x84\x24\x23\x31\xb5\
-\x8d\xc4\x46\x86\x6c\xdc\x85\xa4\x91\x3b\x98\xa8\x39\xd6\xeb\xb8\
-\x00\x51\xfe\x8f\x84\xb2\xf0\xdb\xd8\x48\x3b\x34\xc0\x13\x80\x25\
-\xa5\xc2\x3c\x77\x27\xf2\x27\x73\x6b\xda\xc4\xf9\xd5\x4b\x58\x3f\
-\xb0\xc0\x38\x70\x0a\x7d\x30\x03\xc3\xa2\x40\x57\x8a\x4f\x3d\x79\
-\x1a\xa7\x2f\x5f\xbe\x59\xc4\xbd\xee\xf8\xd8\x73\xb7\x39\x1e\x6f\
-\x7b\x02\x00\x80\xff\x05\xe0\x5f\x02\xf8\xf3\x37\xfc\x2c\x03\x2f\
-\x6c\x5e\x82\xbe\x0c\x7c\xfb\xfd\x27\xb1\x76\x60\xc0\x6a\x72\xf5\
-\x9c\xbd\x5b\x40\xb0\x91\xcf\xb0\xe4\xa6\xeb\x17\xe0\x9b\x38\x8b\
-\xad\xdb\x83\xcd\xcd\x37\xe9\xac\x9a\xb5\x11\x67\x68\x8f\x42\x6f\
-\x8a\x4e\x6a\x6c\xae\x05\xfb\x8d\xe6\x82\xa3\x08\x1f\x38\x73\xd9\
-\x4d\xef\x1b\x05\x36\x77\x56\x58\x55\xc5\xc6\x62\xc4\x72\x28\x16\
-\x60\x44\x0d\xd4\x4b\x21\x4b\x1b\x81\x75\xd4\x7e\x44\x5d\x51\xa3\
-\x12\xa1\x6e\xfc\x47\xad\x1a\xe9\x21\x8a\x6e\xff\xc8\xff\xae\x46\
-\xe5\x89\x35\xdb\xdc\xf5\x37\x6a\x85\xcf\xdb\xd9\xbf\x67\xc8\x6f\
-\x29\x20\xb6\xde\xca\xae\x16\x6c\x20\x3c\x43\x0b\x75\x02\x1a\x6a\
-\x04\x23\x89\x91\x21\x01\xc5\xb8\x04\x98\x62\xc7\xc6\x82\xbe\x06\
-\xa5\x98\x09\xac\x46\x4c\x8a\xe5\x9d\x52\x1c\xe5\xd7\xb6\x7e\x6c\
-\xfa\x85\x8d\xc6\xcb\x5e\xd6\x8b\xff\x0d\x2e\x44\x94\xe0\x2d\x33\
-\x27\xc7\x23\xcb\x01\x01\xb4\xf8\x68\xaf\x03\xff\x68\xb0\x60\x2f\
-\x5e\xea\x0f\x63\xeb\xd7\xad\x2a\x60\x94\xc1\x12\x01\x33\xdb\x2d\
-\x54\x8e\x7b\x39\x71\x15\x14\x59\xe0\xf5\xfa\x12\xd6\xd6\x17\xe0\
-\x48\x12\x44\x58\x2c\x0a\x76\x36\x27\x7c\xe2\x89\xd3\x38\x75\xe1\
-\xe2\xcd\xa2\xed\x02\x80\x3f\x0e\xe0\xe1\xb7\x20\x16\xdf\x92\x04\
-\x00\x00\x3f\x0a\xe0\xdb\xfd\x76\xc3\x24\x70\xfa\xda\x25\x6c\x9e\
-\xda\xc5\x87\xef\xbf\x1f\x47\xef\x5a\xf7\x19\x3f\x7a\xd5\x47\x2b\
-\xeb\xaa\xd8\x52\x45\xa7\xcc\xc3\x9d\x7b\x6e\xe7\x5f\x01\x37\xf6\
-\xc9\xe0\x97\x94\x72\xf6\xb9\x73\x68\x13\xce\x76\xe9\xfb\xad\xa4\
-\x3a\xa3\xdf\xc4\x8b\x81\xd1\x58\x82\x71\x4a\x51\x17\xb4\x3b\x53\
-\xc5\xaa\x9a\x6a\xf1\x81\xc5\x12\x23\x3b\xb5\xb5\xd7\xd4\x8f\xe9\
-\x04\x35\x67\x3e\x05\x3b\x53\x90\x3a\x87\xdf\xb6\xe9\xde\x0a\x1c\
-\xe7\xf9\x53\xe7\x10\x14\x24\x26\xa6\x1c\x79\x26\x5d\xd8\x77\x00\
-\x6c\x79\xc8\x11\xee\x04\x3e\xd3\x38\xd0\xb1\x09\x07\x3d\x45\xc0\
-\x05\xe8\x57\x8b\x95\xad\xff\x97\x09\x0e\x16\x12\xaa\xb2\xb1\xfb\
-\xa0\xa9\x00\x24\x64\xd3\x87\xa2\x76\x6a\x4b\x08\x8b\xf8\xad\x30\
-\x3b\xc0\x08\x88\xb3\xf7\xc4\xad\xc6\x99\x04\xca\x9c\xe6\xac\xd4\
-\x49\x8e\x89\x27\xb1\x40\xe7\x13\xe3\xa3\x96\x9e\xc5\x4b\xfd\x66\
-\x3b\x1e\x4b\x39\x30\x5e\xbe\x9f\xfc\x1c\xc1\x3e\x70\x6e\xf7\x95\
-\x52\x50\x4a\x69\x6d\x00\x71\xee\x0d\x84\x9e\xa4\x40\xb1\xd4\x25\
-\x96\x6b\x0b\x4c\x75\x0b\x85\x0b\x4a\x21\x0c\x85\xf1\xea\x2b\xd7\
-\xf0\xc9\xa7\x4e\xe3\xdc\xd6\xe6\xcd\x22\xed\x3c\x80\x3f\xe9\x44\
-\x39\xfc\xff\x94\x00\x2e\xf9\x1f\xfe\xcb\x00\xde\x77\xb3\x24\x70\
-\x7e\x77\x0b\x1f\xfb\xf2\xf3\xf8\xdd\x27\xee\xc1\x83\x27\x8f\x62\
-\x7d\x7d\x30\x6d\xbe\xaa\x79\xca\xb1\x58\x36\x9f\x5c\x4a\x4a\xa4\
-\x6b\x01\x24\x27\x6a\x8d\x38\x32\xd3\x6e\xf7\x56\xc0\x47\x51\xb1\
-\x75\xa8\x32\x17\x12\x6d\x67\x3d\x35\x27\x5d\x32\xc4\x5b\x84\x1b\
-\xad\x37\xa8\xb3\x2a\x29\xa4\x61\x2f\x62\xab\x30\xb6\x56\x13\x56\
-\x55\xb1\x36\x0e\x58\x8e\x23\x98\xcc\x29\x99\x59\xd1\xcc\xb1\x9d\
-\xc6\x9a\xbc\xff\xb6\x15\xa8\xe9\x74\x4c\x33\x7b\x2b\xa5\xde\x24\
-\x04\x0d\xe1\xdf\xc3\x83\x57\xa7\xc9\x46\xa3\x22\x9d\xd2\x8e\x90\
-\xcd\xe9\xa3\xcc\x60\x11\x80\x4b\x4a\xb0\x95\x12\x41\xa9\xad\xf7\
-\x10\x85\x54\x6f\x11\x88\x33\xf1\x31\x9b\x71\x0b\x0a\xa1\x80\x41\
-\xde\x36\x48\x08\x7a\x30\xa1\x7a\xb5\x50\x7c\x37\x00\x5a\xbb\x95\
-\x37\x17\x72\xb1\xb5\x4e\x1f\x0d\xb6\xd5\xc0\x3c\xc9\xc5\x49\x3d\
-\xec\x3f\x3f\xa8\x83\x0c\x90\x70\x87\xd5\xc4\x6c\x5f\x13\xa1\xa7\
-\x02\xf0\xd2\x93\xc1\x82\x51\xc6\x82\x32\x02\xc3\x68\x44\x9e\x61\
-\x28\x06\xfe\x31\xa3\x70\x01\x93\xbd\x4f\xb3\xfd\x03\x01\x61\xc4\
-\x99\xcd\x67\xb1\xcb\x9b\x58\x8e\x23\xc6\x52\xb0\x75\x6d\x85\x2f\
-\x3c\xfd\x2a\x3e\x7b\xe6\x15\xec\x6a\xbd\x59\xcf\xff\x1c\x80\x1f\
-\x04\xf0\x69\xbc\x85\xd7\xf0\x16\xfe\xec\x2f\x01\xf8\x01\x00\xff\
-\x0d\x7b\x04\x43\x7a\x4c\x60\x57\x2b\x1e\x3d\xfb\x32\xbe\x7c\xe1\
-\x22\xbe\xee\xc4\x51\x3c\x70\xcf\x11\x1c\xdc\x18\x41\xc5\x00\xb1\
-\x69\xb2\x5e\xad\x3a\x69\xa7\xc0\xca\x55\xbe\x81\xea\xab\xa6\xb8\
-\x68\xb4\x01\xc8\x79\x71\x30\xf4\xb8\x36\x15\x9e\x64\x11\x66\x59\
-\xaf\xf3\x51\xb3\xa3\xcf\xe4\xe3\xa8\x10\xcb\xf6\xe1\x5c\x26\x83\
-\x90\x85\x22\x25\xec\x8a\x60\xda\x5d\x61\xa7\x0a\x96\xe3\x02\x8b\
-\xa1\xf8\xee\x7d\xdb\x71\x99\xa1\x8e\x39\xaf\x0f\x23\xce\x5e\x4a\
-\xb7\x67\xa7\x75\x0f\x1a\x35\x71\xcf\x9e\x29\x48\x60\x1b\xad\xe9\
-\x5c\xed\xb7\xd1\x6d\xa3\x34\xf7\x3a\x39\xd6\x6d\x49\x20\x5a\x4c\
-\xb6\xdb\x4f\x7d\x25\x42\x15\x13\x03\xa1\x42\xe6\xcc\x0c\x43\xc3\
-\xc5\xd1\x7b\x43\xed\x6d\x5d\x97\x6c\x44\x60\x24\xa1\x6a\xec\x1d\
-\x6b\x35\x6a\xdb\x90\xf4\x20\xb7\x49\xa3\xf4\x45\x82\x25\xd1\xe2\
-\xf4\x70\x47\xfc\x83\xf3\x4f\x8e\x0a\x1a\x49\xa9\xa3\xf4\x06\x7f\
-\x42\x00\x1e\x01\x1a\x6c\xbc\x07\x67\xe9\x95\xd1\x76\xf2\x79\x6c\
-\x95\xc0\xb0\xb0\x8d\x3d\x6b\x0b\x4a\x5b\xec\x29\x96\x04\x7a\x11\
-\x35\xd1\x8a\x81\x37\x00\xde\x85\xd2\x0e\xb6\xaf\x0d\xf8\xe2\x8b\
-\xe7\xf0\xf4\x4b\xe7\xf1\xfa\xb6\x83\x7d\x37\x46\xfb\x3f\x01\xe0\
-\xcf\x02\x78\x06\x6f\xf1\x35\xbc\xc5\x3f\xff\xf3\x00\xfe\x10\x80\
-\x7f\x03\xe0\xf7\xdf\x2c\x09\xa0\x00\xaf\xaf\xb6\xf0\xfa\x99\x17\
-\xf1\xf8\xd9\x57\x70\xdf\xa1\x43\xb8\xff\xd8\x61\x9c\x3c\x76\x10\
-\xeb\xeb\x83\x31\x08\xd3\xd1\x46\x52\x38\x23\x46\x80\xb9\xd2\xda\
-\xd9\x41\xab\x9a\xea\x30\x79\x52\x08\x8d\x39\xe9\xfc\x07\xa8\x53\
-\xc2\xa9\x4e\xc1\x8d\x18\x0c\x3e\x01\x17\x03\x22\x89\x6d\xc7\xbf\
-\x64\x59\x6e\xc1\x11\xf4\x5c\xf6\x15\x40\xf6\x11\xdd\xae\x28\x76\
-\x77\x76\x31\x56\xc6\xda\x30\x62\x2c\x04\xd6\xd2\x4b\x7f\x66\x12\
-\xa0\x96\x4e\xf2\xe3\x04\xdd\x63\x70\xd9\xac\xb4\x33\xf8\x09\xdd\
-\xe7\x1a\x37\x56\x43\xa5\xb7\x4b\x2e\x14\xda\x05\xcc\x71\xf0\x42\
-\x52\xa0\xd3\x8e\x7f\x2e\xa1\x97\xef\x6d\x93\x6f\xfd\xa9\xb3\x77\
-\xa4\xd8\x88\x35\xb5\x01\x26\x98\xd1\x6a\x80\x86\x95\x20\x5c\x40\
-\x0a\xdb\x04\xac\x4e\xe6\x12\xdb\xc0\x61\xe3\x03\xbb\x3b\x32\x83\
-\x45\x3c\x01\x19\x83\x90\xc4\xf6\x08\x34\x58\x93\xcc\x06\x44\xda\
-\xe2\x85\x55\x84\xa5\x69\x37\x96\x40\x2b\x07\x4d\x0d\x3e\x2a\x00\
-\x62\x1f\x3f\x17\x74\x80\xb2\xb0\x9d\x92\x32\x16\x7f\xcb\x3e\x05\
-\xf0\x36\xc0\x67\xff\x01\x3a\xc6\x26\xe5\xee\xb4\x83\x4f\x3c\xf1\
-\x59\x7c\xea\xf9\x17\x71\xf6\xea\x26\xb6\xa7\xc9\x02\xff\xe6\x91\
-\xf5\x0f\x01\xfc\x2d\x00\x9b\xb8\x03\xae\xe1\x0e\xf8\x1d\x9e\x03\
-\xf0\x47\x00\xfc\x23\x00\x3f\x72\xd3\x7b\xf9\x73\xb9\x2d\x13\x9e\
-\xbb\x78\x01\xcf\x5d\xb8\x80\xb5\x53\x03\xee\xdb\x38\x84\x6f\xfe\
-\xd0\xbb\xf0\xf5\xf7\x1d\x47\x9d\x0c\x27\xe0\x34\x80\x0c\x67\x46\
-\xed\x2c\xb2\x3a\x7d\x41\x0f\x46\x92\x5e\xc0\xa3\x8d\xf7\x72\x8b\
-\x50\x1b\x41\x86\xbc\x8c\x4e\x5e\x6e\x6d\x64\xa3\x9c\xe5\x87\x52\
-\x6e\xb4\x14\x91\x58\x7c\xad\x99\xd4\x0d\x22\xa0\xd8\x9d\x14\x53\
-\x55\x8c\x43\xc1\x38\x00\x43\x61\x70\xb7\xea\x9b\x93\x09\x38\x37\
-\xdf\x4f\x35\xe9\x2d\xb7\x02\x84\xa4\x46\xaf\xb6\x58\xe7\x99\x6e\
-\x42\x80\x84\x39\x00\xa4\x36\xc6\x8c\x09\x46\x01\x72\x37\xc2\x82\
-\xc9\x1e\xbe\xc2\x9a\xad\x11\x91\xa9\x00\x33\x6b\x2a\x14\x15\x12\
-\x57\xe6\x0d\xa8\xa4\xed\xd7\x5a\x0f\x4f\xe9\x93\xc8\x14\x98\x8d\
-\xb7\x6a\x1e\xdc\xec\x8c\x23\xed\xb4\xfc\x0a\x99\x66\x1e\x39\x11\
-\x8a\x9d\xfb\xab\x3e\xe2\x83\xfa\x80\x8f\x03\x2b\x89\xfd\x0a\x4e\
-\x03\x12\x30\x72\xdc\x47\x03\x81\x46\x57\xe3\x1d\x5d\xcd\x67\x49\
-\x28\x0b\xa0\x2c\x2c\xf8\x87\xb1\x60\x18\x4b\x0b\x7e\x2e\xe0\x90\
-\x3a\xf7\xea\xd0\x80\x48\xc1\xb4\x39\xe1\xbf\x3f\xfe\x30\xb6\xa7\
-\xed\x37\x0a\xfc\x97\x00\xfc\x35\x00\xff\x05\x77\xd0\x35\xdc\x21\
-\xbf\xc7\x35\x00\x7f\xce\x2b\x82\xbf\x07\x60\xe3\x96\x89\xc0\x5f\
-\xd0\xdb\x75\xc2\x73\xe7\x2e\xe0\xe8\x85\x75\x7c\xf0\xdd\xc7\xb1\
-\x4a\xcd\x99\x46\x0d\x25\x74\x0a\xb9\xfd\xd2\x4c\x47\x00\x4a\xde\
-\x00\x34\xbf\x4e\x73\xf7\xc0\x02\x3b\xfa\x7b\xd6\x59\xa5\xdd\xd8\
-\xbb\xce\x36\x63\xed\x4e\x6f\x76\xb5\x1a\xd2\x6c\x31\x8a\xf7\xac\
-\xa4\xe2\x2f\x28\xeb\xc5\x77\xaa\x60\x57\x56\x18\xb8\x60\x18\x18\
-\x63\x19\x9c\x36\x4c\xb9\x77\xdf\x96\xa5\xd9\x7b\x78\x9a\xfd\x22\
-\x15\x1d\x46\x40\x0d\xaf\x00\x61\xa6\xef\x9b\x4b\x40\xf1\x50\xc6\
-\xdf\x4c\x73\x7d\x76\xed\xdc\x72\x14\xb6\xc2\x2b\xe2\x3a\x7f\x31\
-\x26\x8c\x96\xc0\xc5\x3d\x53\x28\x14\x02\x2a\x36\xf1\x98\xaa\xf8\
-\xae\x3f\x3b\xd8\x59\x83\x7e\x68\xf3\xf2\x6a\x80\x61\xf5\x09\x00\
-\x7b\xaf\x2f\x4e\xec\x61\xdf\x9a\xcc\x4a\x20\xea\x24\xa9\xa0\x82\
-\x74\x8b\x6e\x26\xa9\x05\x29\x6f\x50\xa4\x2d\xf6\x8c\x4d\x95\xa7\
-\x8c\x16\xf4\xec\x0a\x3d\xc3\xc8\x18\x16\x05\xc3\xc8\x18\xc7\x01\
-\x43\x19\x1a\x08\xc8\x25\x3d\x0d\xec\xb1\xac\x20\x05\x0e\x0c\x1b\
-\xf8\xb5\xd3\x9f\xc7\xf6\x6a\x7b\x8f\xee\xf5\x75\xd7\xcf\x03\xf8\
-\x1b\x30\x6d\x0c\xec\x27\x80\x9b\x5f\x3f\xe5\xa0\xc8\x4f\xdf\x90\
-\x32\x7c\x93\xaa\x80\xc9\x66\xc9\x92\x7d\xfa\x5c\x02\xac\x81\x61\
-\x73\x29\x31\x49\xbd\xbe\x66\x89\xd5\x2f\xfb\x50\xa7\x42\x13\x63\
-\x28\xb3\x7e\x72\x20\x4a\x8d\xe2\xca\x29\x67\x48\x9d\xc4\x06\xba\
-\x13\x5f\x73\xa9\xa5\x42\xfd\xfe\x6d\xec\x06\xa5\xdc\x5d\x59\xa9\
-\xa2\x4e\x15\xbb\xa2\x18\xa4\x60\x28\x8a\x52\x6c\x41\x5d\x5c\xa2\
-\x6b\xb6\x5d\x40\x9d\x52\xb0\x27\x94\x36\x1b\x6f\xa5\x3f\x77\x13\
-\x00\xcc\xe8\x2c\xad\x4f\x0d\x3b\x2b\x76\xb7\x26\xf5\x59\xb7\x40\
-\x6c\x62\xe0\xfc\x00\x5b\xc5\x15\x14\xa8\x8d\xe8\x24\x04\x3b\xec\
-\xc8\x25\x1f\xcf\x5a\x7f\xcf\x8d\x30\x15\x70\x05\x9b\x18\x08\x7c\
-\x2f\x81\x01\x48\x75\xfd\x40\xa7\x49\x26\x8a\xe3\xec\x4e\x26\xdf\
-\x0c\xd5\x10\x22\x0d\x8e\x00\x35\x00\x56\xa9\x55\x61\xdc\xd8\x80\
-\x3c\x00\x34\x32\xa8\x98\x06\x1f\x17\x2b\xf7\x79\x41\x28\xbe\xb2\
-\x3b\xac\xd9\x2a\xef\x30\x14\x0c\xe3\x80\xe2\x20\xe0\xc0\x05\xc5\
-\x4d\x50\x4c\x3d\x7a\x32\x8e\x02\x04\xbb\xd3\x84\x47\x5e\x78\xf2\
-\x56\xaf\xd0\x27\x00\xfc\x18\x80\xff\x8a\x3b\xf4\x1a\xee\xc0\xdf\
-\xe9\x93\x00\xfe\x20\x80\xbf\x03\xe0\x2f\xe1\x56\x72\x09\x41\x23\
-\x96\xea\xca\x37\xd2\x5e\xdc\x14\xa5\xba\x13\x54\x3a\x23\x92\x99\
-\xa4\x58\x7f\xa2\x6b\xb3\xee\x26\x69\xa3\xc0\x5c\xbf\x75\x9b\x2a\
-\x72\xcd\xfa\xa6\xcc\xe3\x2a\x55\xe2\xec\x35\x6d\x82\xe1\xd9\x9e\
-\xb2\x91\x57\xa0\x94\xa3\x3e\xd5\xa6\xbc\x2b\xc4\xa9\x95\x27\x0e\
-\x36\xad\x44\xb0\x52\x9b\x74\x0c\x45\x0d\x8d\x66\x1f\xaf\x11\xb9\
-\x6e\x9d\x26\x80\x47\x59\xf2\x53\x1a\x52\x36\x49\xef\x6e\xc4\x49\
-\x94\x58\x44\x4e\x08\x52\xa9\xa8\xb7\x64\x71\xa3\x4b\x9f\x62\x48\
-\x00\x7d\xd0\x3c\x79\x0d\x6d\x17\xd0\xc0\x10\x21\xd4\x5a\x3b\x67\
-\x64\xa7\x29\x8a\x05\x34\xb3\x40\x8b\x21\xf4\x35\xf2\x4e\x50\x75\
-\x73\x92\xe0\xc4\xaa\x18\xa7\xb2\x89\x8c\xf0\x60\x85\x43\x11\xb1\
-\x95\x70\x97\x1e\x13\x0f\x7a\x22\x4d\x11\x33\x40\x41\xae\xcd\x87\
-\xa2\x60\x97\xe9\x62\x37\xe2\xe0\x91\x30\x0c\x00\x2f\x7c\xdc\xe7\
-\xe0\x5f\x19\x07\x43\xff\x87\x82\xa1\x0c\x18\x78\xf0\x93\xdf\xdb\
-\x2d\x32\x58\x75\xd2\x09\x85\x09\xaf\x5d\xb8\x82\xcf\xbe\xfc\xc4\
-\x8d\xa2\xe8\x25\x00\xff\x1c\xc0\x3f\xc5\x6d\x58\xe9\x7d\xa7\x25\
-\x80\x60\x46\xfd\x15\x00\xbf\xe0\x89\xe0\x7b\x6e\x55\x05\x5c\xb8\
-\xba\x8d\xdd\x5a\x13\x9c\xe1\x5e\x63\xcf\x83\x44\x92\x2c\xd3\x27\
-\x00\x97\xe0\x4e\x39\x69\x9d\xbb\xf2\x3a\x68\xc6\x1d\xc0\xc6\xbd\
-\x52\xb1\xb6\x55\xd4\xf0\xa7\x13\x57\xa6\xc9\xf6\xc0\x83\xbe\xc4\
-\x1e\x02\x29\x4a\xae\xf1\xfa\x74\xc1\x4f\x75\xf5\x17\x5a\x3f\xc6\
-\x0b\xdd\xc0\x95\x08\x26\x07\x36\x0b\x06\x14\x32\x4f\xb9\x08\x7c\
-\x64\x42\x40\x63\x2d\x26\x33\x8e\xd3\x35\xa7\x10\x25\xf8\xc7\x9d\
-\xf5\x97\xcc\xf8\x55\x9a\xa3\x2b\x76\x1b\xf6\x9c\xa7\x0e\x46\x02\
-\x62\xaf\x08\xb4\xda\xe9\x5f\x7d\xa6\x48\x42\x9d\x69\x87\x2d\xc1\
-\x30\x11\xb4\x56\x80\x18\x85\xc4\x26\x06\xde\x4f\x9b\x63\x2e\x3b\
-\xa9\xc7\xf9\x18\xc5\xaa\x81\xe2\xf8\x81\x8d\x1b\x03\x87\x20\x5f\
-\xf4\x92\x64\x4e\xc2\xdd\x7a\x25\x74\x08\xc9\xfa\xfd\x46\xfa\x41\
-\xd2\x72\x63\x0c\x18\xe5\xff\x30\xb0\x8d\x01\x1d\xf8\x1b\xcb\x88\
-\x61\xb0\x44\x60\xc8\xbf\x03\xa5\xae\xdb\x50\xa9\x02\x3a\x61\x8d\
-\x0e\xe2\xd7\x9e\x79\x14\x3b\xbb\x3b\x7d\xf9\xff\x2a\x80\x7f\x06\
-\xe0\x5f\x78\x12\xb8\xe3\xaf\xe1\x0e\xff\xfd\x3e\x0a\xe0\xe3\xce\
-\x19\xf8\x11\x9f\x14\x0c\x7b\xf9\x02\x2f\x5f\xb8\x8a\xad\xd5\x84\
-\xb5\x61\x30\x4a\x6c\xc7\xe2\x8b\xfe\xd7\x84\x22\xfc\xd4\x8b\x59\
-\x7f\x4e\x08\x3b\x55\x8c\x70\x29\xce\x5d\x7c\x78\x09\x1c\xd3\x80\
-\xb6\xa4\x17\xa3\x40\xa6\x8e\xa0\xab\x0d\x68\x0b\xd5\x9d\xa4\xe5\
-\x2a\xb7\xb9\x3d\x0c\xe0\x8a\x00\xb4\x13\xbd\x03\xec\x18\x5d\x39\
-\xef\x6a\xb8\x9e\x14\x22\x58\xab\x2a\x48\x04\x43\x2c\xd4\x84\xc0\
-\x65\xec\x27\x50\x31\x5f\x04\x67\xf7\xa5\x29\x09\xb7\x85\xa2\xec\
-\xaf\x31\x77\x29\x8e\xbf\x57\x51\x2d\x88\xaa\xd9\x5f\xd7\xd0\x06\
-\xac\xce\xce\x14\x5b\xff\x25\xef\xd5\xe1\x7a\x7a\x4a\x84\x52\xad\
-\x02\x31\xe2\x4f\xb1\x9d\x81\x1c\xcd\x6a\x5b\xe6\x47\x48\xaa\x11\
-\x78\x70\xba\xb1\x2b\x04\x57\x35\xfc\x80\x1d\x84\x54\xa7\x1d\x93\
-\x30\x4a\x4a\x7c\xd9\xf4\x64\x70\xc5\xa8\x74\xe1\x61\xb8\x3c\xb7\
-\xcf\xff\x39\xe8\xbd\xc8\xf9\xff\xe0\xa2\x9d\x65\x2c\x5e\xf6\x17\
-\x0c\x85\xad\xff\xe7\x92\xc8\xbf\xa0\xa2\x2a\xd9\x16\x64\x21\x5c\
-\xbc\xbc\x83\x8f\x3f\xfb\x99\xbd\x33\xfe\x9f\x06\xf0\xe3\x78\x1b\
-\x5d\xc3\xdb\xe0\x77\xac\x00\xfe\xa3\xdf\x3e\x0c\xe0\x0f\x00\xf8\
-\x7e\x00\xdf\x17\x09\x60\x77\x67\xc2\xd9\xd7\xaf\xe2\xeb\x4e\xde\
-\x6d\xb4\xe1\xd9\xc4\x5e\xa0\xae\x22\xab\xbe\x3f\xae\xb5\xf5\xbd\
-\xda\x49\x4e\xb7\x55\x52\x6a\xfb\xf3\xb1\xa1\xd6\x3b\x7d\xe9\xdc\
-\xc8\xdb\xe1\x2d\xf8\x62\x5f\x02\x8d\xb9\x2a\xca\xc1\xf7\xf7\xad\
-\x36\xc0\x5f\xbc\xda\x25\x09\x00\xde\x19\x03\x7e\x52\x47\x30\x72\
-\x38\xf4\x50\xd2\x4c\xd3\xcf\x92\x9c\x7b\x40\xda\x68\xbd\xbe\xe7\
-\xce\xde\xf2\xb0\xa3\xe7\xbd\xa4\x15\xa3\xb5\x09\x9c\x32\x61\x6d\
-\xe9\x46\x9d\xaa\x5c\x85\x4d\xfb\x0f\x6c\x23\x3e\x65\xef\xe5\x35\
-\xc8\x82\x40\xb1\x44\xa3\xce\xf0\x33\x2e\x85\x13\xa1\x24\x5c\x41\
-\x24\x39\x18\xc5\xe7\xfc\xd0\x58\x17\xd4\xac\x82\xd8\xed\xb3\xc3\
-\x8e\x8b\x2a\x19\xa6\xa7\x6c\x58\x83\x2f\x73\x0d\xa1\x85\x90\x66\
-\x1f\xde\x96\x38\xc8\x1a\x7f\xb7\x2d\xfe\xd8\x6a\x39\x17\x34\xbd\
-\x3e\x57\xe7\x09\xe5\x9e\x61\x18\x8d\x05\xc8\x05\xa5\x0c\x49\xfe\
-\x69\x4b\x55\x02\x55\x93\xe7\x3b\xcc\x87\xf1\xbf\xbf\xf8\x38\x2e\
-\x5f\xbb\x0c\x2c\xae\xeb\xf9\xb1\x9f\x00\xde\xbc\xeb\x33\x7e\xfb\
-\x28\x80\xef\x8d\x30\xd6\x0a\x3c\x79\xfa\x35\x7c\xe0\xe4\xdd\x73\
-\x7b\xcc\x94\x7b\x72\x4d\x3c\x6a\x22\x12\x69\x0a\x49\x61\x4f\xde\
-\xec\xb7\xa0\x4d\x38\x24\x57\x4c\xa9\xeb\xea\xd3\x54\xa2\xdb\x09\
-\xa7\x26\x42\x93\x92\x24\xd4\x05\x56\xfe\x09\xdd\xd8\x2a\x42\xd1\
-\xcb\xf7\x0c\x48\x6a\xbd\x7a\x5a\x56\x39\xb0\x85\x5c\x95\xed\x40\
-\xb7\x3e\x41\x74\x0e\xbb\x08\x25\x2b\x60\xc6\x10\x8c\x9f\x17\x8b\
-\x4c\xe1\x19\x18\x7f\x56\x4f\x1d\x66\xef\x79\xd8\xf7\x1c\xa8\x5a\
-\xeb\x50\x5d\x10\x44\x73\x77\x5a\x80\xca\xa0\x0a\x88\x01\x22\x96\
-\xdf\xbc\x5c\xe9\x31\x49\x11\x4b\x02\x54\x80\x3a\x09\x88\x0a\x44\
-\x14\x03\x8b\xaf\x16\x03\x52\xc5\xb8\x00\xa5\x8d\x6d\x45\xcd\x8c\
-\xa4\xb0\xb7\x75\xa2\xd9\xc2\x91\x8b\x90\xa2\x7b\x68\xfa\xcd\xbf\
-\x60\xff\x95\x81\x13\x07\x30\x82\x8f\x73\xfe\x1d\xed\x0f\xf6\x1f\
-\x51\x23\x59\x99\x2d\xb8\x3d\x5b\x8b\x81\x71\xfa\xec\x45\xfc\xf2\
-\x53\x0f\xef\x45\xfe\x2f\xc0\xd6\x79\xf7\x13\xc0\x6d\xb8\x3e\xe7\
-\x60\xe1\xf7\xf8\xc1\x89\xe7\x5f\xba\x88\x67\x5f\x7c\x1d\x0f\xbd\
-\xe7\x28\x76\x76\x6b\x07\x6b\xfb\x0b\xa8\xb5\x9c\x29\x80\x1b\x02\
-\x23\x69\x00\x21\x7b\xd8\x83\x14\xc7\xb9\x2f\x19\x05\xa9\xa6\xe5\
-\x8f\xeb\x3c\xee\x9b\xee\x9c\x13\x80\xba\xf1\x91\x36\xdd\xe9\x46\
-\xdc\xf1\x1b\x33\x37\x1f\x8e\x08\xe0\x10\xad\x48\x60\x6c\x5e\x05\
-\x18\x9b\xce\x6d\xb6\x99\x53\xfd\x26\xef\x03\xce\x3d\x78\x72\x4b\
-\xee\xec\x8d\xa2\xe5\x88\xe0\xe4\xe4\x05\x87\xcc\x1f\x54\x15\x25\
-\x46\xa7\x22\x86\x07\x38\xcd\xd7\x5c\x96\x5c\xaa\xad\x68\x3a\xf7\
-\x06\x19\xa8\x16\x82\x4c\xd6\xdb\x5b\x25\x44\x28\x13\x41\x0a\xa1\
-\x56\x36\x92\x51\x15\x80\x05\xac\x66\xc3\xad\x62\xe4\x2c\x15\x82\
-\x0e\xec\x56\xf0\x64\x92\xe4\x6a\xc8\x7f\x09\x1b\x32\x48\x63\xd9\
-\x79\x8f\x4e\x9d\x72\x10\x51\x37\xfb\x2f\xbe\xd0\xe3\x26\x1d\xa5\
-\x34\x2c\x80\xd9\x05\x40\x0a\xa3\x30\xdb\xc8\x0f\x2d\x91\x2a\xc4\
-\x5a\x2d\x90\x61\x20\xd3\x5d\xf8\xf9\x47\x7e\x15\xdb\xbb\x5b\x7b\
-\x13\xc0\x7f\xc2\x9b\xe8\xe0\xb3\x9f\x00\xae\x6f\x0b\x7e\x2a\x13\
-\x00\xd9\x82\xcf\xc7\x3f\xfb\x3c\x96\x8b\x82\x07\xee\x39\x82\x9d\
-\xd5\xd4\xd6\xdf\x19\xf3\x0d\x42\x49\xce\x4f\x96\xfa\x73\x7f\x8d\
-\x26\x24\x32\x33\x7c\x9d\x79\xcc\xcf\x37\xf4\x82\x73\xd0\x44\x23\
-\xbc\x6f\x8f\xd3\x9b\x9a\xf4\xb4\x76\xe5\x3b\x38\x80\x4a\xcc\xca\
-\x7a\x72\xb4\xdf\x4e\xec\xee\x94\x2f\x94\x25\x3d\x39\x37\x3d\x40\
-\xc0\x48\x0c\x4c\x9c\xaa\x35\x2d\x01\x44\x45\xe2\xcb\xcd\x89\x35\
-\xc4\x0e\x42\x9b\xfb\x17\x28\x24\xa4\xcb\x52\x69\xc8\xd5\x86\x7d\
-\x1c\xc6\x2a\xbe\x7e\x2d\x60\x11\x48\x25\x88\x54\x68\xf5\x7d\x0c\
-\x21\x48\xb1\xf5\x6c\x19\x7c\xb5\x77\xac\xa8\xc2\xe0\x2a\xa8\x93\
-\x05\x7a\x11\x60\xf2\x11\x8d\xac\x6c\x7d\x58\x83\xaa\x0d\xa4\xa1\
-\x49\x9c\xfe\x42\x3d\x7a\xd1\x14\x93\xb4\x9b\x1e\xa8\xcf\xfd\x39\
-\x31\x00\xaf\x00\x06\x13\xf7\x68\xfa\x7f\xa1\xf9\x67\x6f\x8b\xb3\
-\x86\xd2\xb0\x4d\x6b\x37\x13\xa9\x38\x32\x1c\xc1\xc7\x1e\xf9\x22\
-\x9e\x3a\xfb\xa5\xbd\xa5\xff\x35\x00\xff\xe4\xed\x18\x48\x6f\xd7\
-\x04\x10\xe4\x8a\xff\xdb\x63\x01\x5b\x3b\x13\x7e\xf1\xe1\x67\xf0\
-\xfb\xbe\xe9\x01\x7c\xe8\x7d\x27\x50\xab\xd3\x4d\xb3\x6c\x6f\x8b\
-\xe5\xe4\x49\x80\x3a\xa1\x91\x14\xbd\x60\xca\x6d\xd2\xbd\x42\xb0\
-\x8d\xb3\xee\xab\x3b\xde\xe0\xa7\xe1\x44\x2c\x04\x71\x9b\x1c\x50\
-\xef\x38\x43\xe1\x3c\xd3\x50\xfa\x92\x25\x6c\x71\xc3\x0d\x2f\xed\
-\x7d\xfe\x6c\xbb\xe5\xed\x45\xda\x2a\x01\xbf\x4f\x9e\xf6\x04\xe6\
-\x92\x12\xb7\x9c\xc9\xa0\x25\x25\xf4\x49\x26\x5f\xea\xd7\x5b\x0d\
-\xa4\xf9\x95\x74\xb6\x58\x62\x15\x40\x15\xa0\x28\x41\x5c\xe1\x57\
-\x48\xa1\xec\x8b\x51\xa5\x3a\x93\x50\x6d\x24\xe8\x1a\x0d\x22\x02\
-\x99\x60\x89\x63\x32\x15\xdd\x5a\x05\x75\x22\xb0\xb8\x8a\xe1\x12\
-\x90\x6a\x63\xbf\x0a\xab\x32\x4a\x48\x96\xab\xe9\x18\x1a\x41\x4b\
-\xb2\x50\x4b\x69\x35\xea\xd4\x84\x5c\xc2\xcb\x88\x46\x68\x09\x20\
-\xa4\xbd\x4a\x54\x5c\x5e\xa1\x10\x77\xaa\xc1\x68\x3f\xcf\x1f\x8f\
-\x8a\x09\x87\xc6\x83\x78\xe2\x99\x8b\xf8\x95\xa7\x1e\xb9\x11\xe9\
-\xe7\x27\x61\x1e\x98\xfb\x09\xe0\x36\x57\x01\x3f\x0a\xe0\x53\x00\
-\xd6\x22\x09\xac\xa6\x8a\x8f\x3d\xfa\x3c\x5e\xbd\x70\x0d\xdf\xf9\
-\xa1\xfb\xb1\xbe\x1c\xb1\x3b\xd5\xc6\xd8\x03\x3a\x4d\xad\x38\xed\
-\x9b\x6c\x34\xd4\xf4\x04\x28\xcc\xe6\xd1\x57\x03\x51\x4e\x50\xa2\
-\xde\xd4\x6d\x02\x86\x68\x85\x81\x63\x36\x93\xe6\xd4\x91\x33\xe1\
-\x8c\xdc\x4b\xf7\x53\xd9\x12\x81\xf7\x9d\xbe\x20\x03\x32\xe6\x59\
-\xa1\x7e\x0f\xdd\xcb\x58\xe2\xbc\xbf\x55\x01\x4e\x53\xe5\xd2\x9d\
-\xf4\xc8\xd5\xd5\xc0\x0b\x4a\xd7\x86\x90\xfb\x26\xcd\x0d\x32\x3b\
-\x21\x91\xb0\x64\xf7\x0c\x28\x31\xd7\x8f\x5d\x00\xd8\xde\x83\x8a\
-\x69\xf0\x4d\x24\xa8\x62\x63\x4c\x21\x1b\xd1\x99\x72\x30\x41\x45\
-\x30\x89\x40\x49\x50\xa9\x5a\x79\x5f\x18\xb5\xd6\x9c\xcb\xdb\x56\
-\x26\x7b\x1b\x60\xd2\xee\x45\xec\xfd\xc6\x29\xb0\xb6\x21\x60\xd7\
-\x24\xfc\xa0\xe1\x22\x29\x15\x46\xb6\xf9\x97\x15\x12\x6b\x1a\x76\
-\xe6\x7d\xd8\x7e\xdf\xf8\x5a\xa1\xf6\x28\x48\xe7\x16\x05\x16\x6c\
-\xf0\x21\x7c\xf1\xe9\x2b\xf8\xc8\xa3\x1f\xc7\x0a\xbb\x7b\x99\x29\
-\xff\x07\xc0\xdf\x7f\xbb\x06\xd1\xdb\x39\x01\x00\x26\x9f\xfc\xb7\
-\x67\x4f\x80\x97\xae\x9f\xff\xd2\xab\x78\xe9\xfc\x15\x7c\xd7\xef\
-\x7a\x37\xde\x7f\xf2\x2e\x4c\xa2\x90\xa9\x03\x89\x94\x66\x27\x3f\
-\x69\x4b\x00\x59\x15\xc4\xe9\x1e\x1f\x43\xb7\x16\x9c\x5a\xfa\xd4\
-\x4e\x75\x34\x56\x5a\x3b\x79\xfd\x64\x06\x3b\x78\x85\xe4\xb4\x47\
-\xc0\x17\x0f\xfe\x58\x1d\x2e\xa5\x95\xfd\xf1\x79\xcc\x02\xdf\xdf\
-\x72\x2c\xd1\xb0\x9f\x68\xfd\xf7\x65\x4f\x50\xd1\x16\x74\x58\x80\
-\x86\xbc\x55\x87\x57\xcc\x9d\xb6\x6c\xb9\xca\xf7\xf7\x01\xcd\x53\
-\xdd\x4e\x46\x77\x53\x22\x0b\xd0\x41\x15\x95\x04\xa2\xd5\xcc\x42\
-\xd5\x46\x85\xe6\x20\x24\x18\x48\x30\x91\x60\x20\x4e\x0c\x61\x22\
-\x60\x10\xdb\x28\xb4\x04\x20\x96\x1c\xd8\x49\x47\xe2\x2e\x43\xda\
-\xf6\xee\x53\x21\x96\x4a\xa6\xab\x14\x57\xe9\xd8\x7f\x14\x13\x53\
-\xf6\xa0\xe7\xd6\x0a\xc6\x2a\x71\x2b\xe4\x9a\xfb\x51\x4b\x2f\xa6\
-\x69\x38\x0e\x05\xc3\x74\x18\xbf\xf4\x99\xa7\xf1\xc9\xe7\x1f\xb7\
-\x76\x6d\xbe\xdd\xf7\x0c\x6c\xab\x6f\xe7\xed\x1a\x40\xa4\xaa\x6f\
-\xde\x37\xff\x71\xba\x2d\x7f\x03\x80\x7f\x0f\xe0\x87\x6e\x58\x23\
-\x10\xf0\x8d\xef\x3d\x81\xef\xf8\x86\xfb\x71\x70\x63\x81\xd5\xaa\
-\xe6\x69\xae\x5d\x20\x67\xa0\x4b\x57\xe2\xfb\xa6\x5a\x7a\x48\x28\
-\xa1\xfd\x8b\xd2\xdf\xb5\xf1\xfc\x73\xf0\xb2\x3d\x46\x48\xec\x0c\
-\xb7\x76\x12\x97\x2c\xd5\x23\x41\xc4\xe7\x63\xf7\x3c\x74\xf1\xcc\
-\x08\xa3\x80\xa9\xe4\x89\x6f\x5f\xc7\xb9\x4b\x4f\x54\xc0\x0c\x94\
-\xae\xef\x8f\x36\x81\x3d\x1a\xc8\xc9\x46\xd1\x2a\x00\xbd\xc0\x65\
-\xbf\x6d\x88\x2c\x8d\xda\x29\x28\x49\x82\x09\x11\x0c\x55\x6b\x03\
-\xcc\x46\xdd\x34\x03\x45\x05\x55\xaa\x9b\x7a\x08\xaa\x88\x4b\xad\
-\x7b\x1b\x20\xf1\x79\x85\x48\x35\x15\x66\xa9\xf6\xf1\x48\x2c\x12\
-\xb8\x42\x6d\x5b\x9c\xa9\xda\x14\x42\x27\x32\x73\xf3\x31\x00\x53\
-\x32\xf9\x37\xd0\x14\x5d\xe0\x77\x68\x27\x37\xd3\xd9\x26\xa8\x9a\
-\xee\x0a\xf6\xb3\x19\xd8\xe0\x83\x38\xf3\xf2\x0e\x7e\xe5\x73\x4f\
-\xe0\xd9\x73\xa7\xec\xa8\x9c\xbf\x9c\x4f\xc1\xd6\xd9\x1f\xbf\x1d\
-\x2f\x72\xfd\x31\xdd\xaf\x00\x6e\xf6\xd8\x00\xf8\x0b\x00\x8e\x3b\
-\x3f\xa0\x5d\x7e\x50\x7c\xe1\xf9\xd7\x70\xfa\xd5\xcb\xf8\xb6\x07\
-\xef\xc5\x37\xbc\xe7\x38\x96\x8b\x82\x69\x52\xd7\x0f\x8c\x4c\xe8\
-\x5c\xf2\xec\x8d\xa9\x7d\xac\x4b\x10\xdc\xa5\x80\x00\x8c\x8c\x64\
-\xd3\x12\x43\x82\x70\x3e\x63\xe7\xa4\x93\xce\xa5\xa5\xe2\xe3\x05\
-\xad\x9f\x2f\xf1\x36\x82\xde\x17\x51\x18\x16\xc0\x86\x09\x30\x98\
-\x0a\x0a\xc1\x12\x84\xeb\xd4\x15\x1e\x3c\x11\x50\x87\x0b\xc4\xef\
-\x83\x6c\x09\x18\xdc\xa8\xc2\xdd\xd6\x61\xb2\x1a\xdc\x49\x43\x42\
-\x4f\x2f\x7c\x06\x55\x5c\x7a\xdd\x54\x7d\xaa\x57\x03\x55\x2c\x70\
-\x84\xac\x8c\x17\x31\xf2\x8f\x55\x05\xc6\xf7\x17\xaa\xa8\xae\xf3\
-\x57\x99\x50\x5d\x42\x2c\xab\x0a\x51\x54\xad\xbe\xaa\x3d\x78\xe2\
-\x91\x9c\xca\x88\xa8\xef\x3c\x34\x0c\x80\xf2\xc9\x93\xae\xad\xd2\
-\x74\x9a\x0e\xf0\x46\xbb\x09\x8d\x84\x63\x33\x61\x66\xf0\x69\x1f\
-\x17\xac\x8f\x6b\xb8\x76\xa9\xe0\xa3\x4f\x9e\xc2\xaf\x3f\xf7\x79\
-\x48\x5d\xdd\xa8\xe7\xff\x32\x80\x3f\x7a\xbb\x82\x7f\xbf\x02\xf8\
-\xca\xae\xbb\x7d\x14\xf3\xfd\x37\xfc\xac\x4f\x8e\xee\x3d\x7a\x10\
-\xdf\xfa\xe0\x49\xbc\xff\xde\xbb\x30\x0e\x03\xa6\x5a\xf3\xb4\x27\
-\xdf\x97\xe5\x28\xe6\xbb\x80\x87\xb6\xc4\xc0\xca\xc8\xcf\x90\xe9\
-\xe9\x11\x85\xc4\x65\xbc\x1f\x01\x3b\x0f\x44\xf6\x63\x6a\xd8\x03\
-\xe0\x65\x32\xf0\x53\xbf\x90\x3b\xcc\x50\xe9\xc0\x3c\x5b\x4e\xb1\
-\xff\x97\xc4\x0d\x62\x59\x25\xde\x72\x8a\x6d\x58\x35\x50\xa8\xa4\
-\xf4\x18\x7b\x22\x6a\xba\xf6\x73\x8d\x3b\xda\x63\x3f\x6e\x8a\xc0\
-\x9a\xb2\xe9\xe2\x84\x9e\xaa\x82\xaa\xd5\xc5\x55\xc5\xbd\x15\x2b\
-\x24\xf6\x32\xbc\x1a\xb0\x8a\xa0\x62\x92\x6a\x41\xef\xf7\x9b\xfc\
-\xf4\x8f\x8a\x42\xa4\xa6\xf0\xa9\xea\xdc\x7d\xb7\x57\x3b\xd2\xf4\
-\x43\xd2\x3d\x28\x6d\x77\x42\xc7\x86\x62\x37\x22\x94\x00\xf5\x3c\
-\xd8\x05\xf6\x7b\x4f\x30\xfb\xa9\xb5\xb2\xc4\xb5\xab\x05\xbf\xf5\
-\xec\x4b\xf8\xd4\xb3\x5f\xc4\x95\xad\xab\x37\x3a\xf5\x01\xb3\xbb\
-\xff\xd3\xb7\x1b\xf4\x7b\xb3\x2a\x80\x77\x52\x02\x00\x80\x83\x00\
-\x7e\x06\xc0\x0f\xdf\x12\x3a\x04\x70\xdf\xb1\x43\xf8\xb6\x0f\x9c\
-\xc4\xfb\x4e\xde\x85\xe5\x62\xc0\x6a\xb2\x91\x12\x0b\x65\x69\x6e\
-\xbb\xe6\xec\x0e\x3f\x94\xe0\x59\xd0\x64\x4b\x8c\xe8\xb4\x1b\xbf\
-\xa1\x0f\xb6\x92\xbd\x38\x53\x37\xb3\xef\x82\x9a\xa9\xb4\xc0\xa7\
-\x16\xd0\x25\x67\xfb\x65\x26\x49\x95\xf7\xa3\x26\x55\x55\xbc\x62\
-\x88\xdf\x81\xe3\xe3\xe8\x26\x04\x30\x3d\x7e\x6f\x84\xf3\xf7\x0a\
-\x17\xa5\x30\x02\x0d\x53\x0f\xcb\x99\x9a\xe2\x1a\xc6\x8b\x32\xe5\
-\xe5\x08\xa8\x1a\xe5\xbe\xd6\x1c\x09\xda\xfb\x7e\x9a\xab\x60\x92\
-\x7a\xdd\x7d\xc4\x1d\x99\xad\xfc\x37\x92\x8d\xb8\xa8\x88\x66\xd2\
-\x30\xef\xc5\xf8\xd9\xb1\x8b\xd0\xe4\xd0\x35\x89\x5c\xcd\xec\xb4\
-\x55\x09\x51\xa5\xc4\xef\x1a\x41\x2f\xbe\x34\xa6\x54\x41\x50\x0c\
-\xbc\x8e\xab\x57\x08\x8f\x3e\x7b\x1a\x0f\x3f\xf7\x14\x2e\x5f\xbb\
-\x72\x2b\x25\x9f\xff\x0c\xe0\x2f\xc2\xb4\xfc\xf0\x4e\x48\x00\xef\
-\x84\x16\xa0\xbf\xae\x02\xf8\x53\x30\xb6\xe0\x4f\x00\x38\x7c\xdd\
-\x3d\x9c\xbb\xfd\xd2\xf9\x2b\x78\xe9\xfc\x15\x9c\xbc\xfb\x10\xbe\
-\xf1\x7d\xf7\xe0\xc1\xfb\x8f\xe1\xd0\xfa\xd2\x59\x68\x9a\x63\x32\
-\xf6\xf6\x20\x01\x35\xdd\x5b\xf6\x7b\x80\xe7\xc9\xdf\x4e\xfd\x0c\
-\x7a\xb4\x13\x9a\x10\xa7\xbc\xb7\x01\x68\xa7\x7d\xf1\xaf\x2f\xde\
-\xe7\x33\x17\x14\x70\xf6\xf4\x03\x97\x16\xfc\x54\x5a\x82\x21\x9a\
-\x25\x03\xbb\x4f\xc9\x04\xc0\xfe\x33\x1b\x19\xa8\xab\x5e\x3a\x07\
-\xc3\x74\x26\x42\xb3\x47\x53\x0a\xe0\x4f\x31\xa9\x11\x77\x24\x13\
-\x40\x04\xb7\x95\xf9\x93\x56\xa8\xd8\xfb\xb6\x20\x24\x18\x89\xbd\
-\x3a\x10\x1b\x15\x3a\x3e\xa0\x2a\x10\xb6\x7e\x3f\xda\x00\xd1\x0a\
-\xa0\x64\x62\x09\x73\xd6\x1b\xfd\x13\x48\x0b\xfa\xd4\xe7\x89\x40\
-\x6f\xf2\xed\xcd\xda\x31\x34\x0d\x04\xeb\x65\x81\x69\x5a\xe2\xdc\
-\xb9\x15\x1e\x7b\xfe\x05\x7c\xe6\x85\xa7\x71\x75\xeb\xaa\xbd\x36\
-\x6e\xbc\xd7\xbf\x0d\xd3\xa9\xf8\xbb\xef\xb0\x78\x79\xc7\x55\x00\
-\xfd\xf5\x1d\x30\x27\xa2\xdf\xfb\x86\xc3\x44\x05\xee\x3a\xb4\x86\
-\x0f\xbd\xfb\x04\x3e\xf8\x9e\x7b\x70\xe2\xf0\x01\x94\xa1\x58\x22\
-\x70\xc0\x30\x82\x1b\xde\xb3\x73\x5f\x11\xf8\x49\xce\x0a\xe3\xf0\
-\x53\xb1\xca\x81\x08\x8c\x76\x32\x97\xae\x15\x28\x59\x1d\xb4\x00\
-\x67\x58\x05\x30\x50\x17\xcc\x6c\x49\x62\x70\xc0\xaf\x74\x6d\x82\
-\x7d\xcf\xe2\x41\x3e\x74\xed\x03\xe5\xe7\x62\x02\x11\x55\x47\xfc\
-\x3f\xd9\x6e\x7b\x13\x40\x13\x0d\xf7\xd3\x33\xe8\xb0\x11\xf8\x1e\
-\xb0\xb0\x92\xde\x96\x64\x24\x1d\x95\x27\x3f\xe9\x2b\x0c\xf4\x53\
-\x68\x03\xff\xb4\x66\xdb\x60\xdf\x47\xbc\x25\x90\xfc\x58\x9e\xd8\
-\x8e\x01\x44\xf9\x2f\x5d\xe0\xb7\xb7\x92\xbf\xa3\x86\x3c\xb9\x0a\
-\x04\xf6\x33\x2a\x0c\x7b\x00\xaa\x55\x5a\x58\xe0\xda\x35\xe0\xa9\
-\xd3\xaf\xe1\xb1\x53\x2f\xe0\xe9\x57\x4f\x63\x35\xed\xdc\xea\xc4\
-\x07\x4c\xbf\xef\x47\x61\xcc\xd3\xb7\x0e\xe8\xda\x6f\x01\xbe\xaa\
-\x6b\x03\x26\xc3\xf4\x57\x01\x9c\xb8\xe5\x3d\xc5\x92\xc1\xb0\x64\
-\x7c\xe0\xc4\x51\x7c\xf0\xdd\xf7\xe0\x03\x27\x8f\xe2\xd0\xfa\x9a\
-\xcd\x89\x7d\x3a\x90\xc0\x5e\x04\x7e\x9c\xee\x11\xf0\x44\x20\x58\
-\xb0\x45\x00\x96\xae\x1a\x28\x5e\xf2\x33\x15\x14\xc0\x4f\x6c\xdf\
-\x3c\x8b\xea\x20\x03\xdd\x83\x9c\x87\x59\xa2\xc8\xcf\xa1\xb4\x8f\
-\xc1\xee\x3b\x90\x7f\xac\xc7\x22\xf2\xfe\x5d\x02\x20\xee\xc6\x96\
-\xfd\x88\xb3\x05\xbe\x29\x9e\x49\x33\x0f\xd5\xf9\xfb\x55\x2c\x0c\
-\x2b\x24\x03\xba\x76\x37\xd1\x29\x83\xb9\x6a\xcd\xaf\xcb\x76\xa1\
-\xff\x3f\xa2\x9d\xd0\x0c\xfc\xea\x49\x40\xc2\xf7\x49\xe3\x3d\x4f\
-\x01\xfe\x3d\xec\xfd\xf8\xbd\xaa\x25\x00\x12\x2c\xcb\x12\x3b\x53\
-\xc5\xce\xd6\x80\x27\x5f\x7a\x19\x2f\xbc\x72\x05\x9f\x3e\xf3\x04\
-\xae\x5c\xbb\x9a\x62\x32\xb7\x50\x9b\x78\xce\xc7\xcb\x3f\x0b\x60\
-\xf5\x96\x23\xdd\xfb\x09\xe0\x77\x74\x3d\x08\xb3\x24\xfb\x21\x9f\
-\x16\xdc\x7a\xa6\xe0\xe3\xc3\xc3\x07\x96\x78\xf0\xde\xe3\x78\xf0\
-\xe4\x31\xbc\xff\x9e\xa3\x38\xb4\xb1\x61\xca\x30\x55\x5a\x32\x98\
-\x95\xf8\xd4\x25\x84\xd6\xe7\x97\x40\xff\xb5\x05\x27\x7b\x0f\x5f\
-\x22\x48\x11\xa7\xb7\x05\x6b\xdc\x5a\xc0\xb7\x76\xc1\xbe\xc7\x80\
-\xe2\x63\x45\xbb\x91\x27\x8e\x92\x27\x7e\xfe\xac\xac\x00\x78\x96\
-\x04\x72\x1c\x88\xa6\xa1\x94\xcb\x4c\x7d\xe9\xad\x3a\xeb\xa5\xa3\
-\x6f\xaf\x68\x6d\xc0\x14\x7d\xb6\x46\x45\xd0\x2a\x03\x89\x2a\x20\
-\xaa\x05\xa9\xfe\x7d\x5a\x55\x91\xdf\xd3\x83\xbe\xe6\xf7\x93\xbc\
-\xaf\xd5\x1b\x36\x31\xf0\xf4\x61\x6d\x87\xb7\x28\x4a\x15\xcb\x61\
-\x1d\x57\xb6\x76\xb0\xb5\x39\xe0\xb1\xd3\x5f\xc6\xa9\x57\x2e\xe1\
-\xb1\xb3\x4f\xe3\xda\xf6\xa6\xad\x12\x0e\xb7\x3c\xed\x01\xe0\x45\
-\xd8\x3e\xff\xcf\xc0\xf6\xfb\xef\x8c\x51\xd7\x7e\x02\xf8\x9a\x5c\
-\xef\x85\xf9\xaf\xfd\x30\x80\xaf\x7f\xc3\x7b\x7b\x55\x80\x02\x1c\
-\x39\xb0\x86\xaf\x3f\x79\x02\x0f\xdd\x7b\x1c\x0f\x9c\xb8\x1b\x77\
-\x6f\x1c\xc0\x72\x18\x7d\x69\x86\x9c\x23\x42\xd9\xb7\x53\x94\xfc\
-\xcc\x28\x4a\x18\xa8\x80\xb8\xa0\xa0\x78\x9b\x60\x41\x3d\xd0\xd0\
-\x5a\x81\x0c\xe6\x56\x05\x0c\x39\x3d\x18\xec\x74\xdf\x93\x14\x0a\
-\x0d\xed\x6b\x3c\xb1\x0c\x81\x0f\x44\xad\xd2\x81\x8d\x59\xc3\x04\
-\x1e\xe0\x1c\x81\xeb\x5e\x70\x5a\x73\x2c\x18\xfd\x73\x5f\x96\x0b\
-\xaa\x0b\xac\xd6\xbc\xd5\x2e\x70\xab\xd6\xf9\xe9\xaf\x82\xba\xb7\
-\x6d\x40\x45\x95\x6a\x27\x7a\x97\x44\x14\x3e\x25\xf0\x93\xbd\x55\
-\x0f\xde\x42\xc0\x54\x84\x94\x26\x8c\xbc\x40\x15\xc2\xa5\xad\x6d\
-\x5c\xba\xa2\x78\xf4\x85\xe7\xf1\xc4\x8b\x2f\xe2\xf9\xf3\x2f\x63\
-\x73\xe7\x5a\xc3\x7d\xf8\x0d\x9f\xed\x27\x00\xfc\x5b\x00\xff\x0e\
-\xc0\xd9\x3b\x6e\xd6\xbd\x9f\x00\xbe\xe6\xd3\x82\x1f\xf0\x64\xf0\
-\xbd\x5f\x11\x18\xda\x25\x83\xb5\xe5\x80\x07\x4f\x1c\xc7\x03\xf7\
-\x1c\xc5\x87\x4e\xde\x8b\x13\x87\x0f\xe1\xf0\xda\x12\x63\x19\xdc\
-\xbf\x9e\x12\x28\x6c\xc9\xa0\xeb\xdf\x33\x60\xad\xf4\x1f\xd0\xf5\
-\xfa\x81\xfa\x83\x30\x10\x83\xc8\x02\x7f\xe8\xfb\xff\xf8\x3a\x1a\
-\x32\xe8\x39\x40\x3f\x2a\x20\xf2\x76\x02\x3d\xc3\xb0\x64\x32\x98\
-\x27\x81\xa4\x39\x75\x25\x50\x93\x4f\xd5\x94\x5a\xd3\x2e\x01\xb4\
-\x92\x5f\xfb\x12\xbc\x2b\xf9\xb5\xc3\x06\x2a\x6a\x56\x04\x93\x5a\
-\xc0\x4b\x54\x09\x52\x11\xff\xa2\x8c\xaf\x22\xa8\x3a\xd9\xc7\xb2\
-\x0e\x99\x7c\x2c\x3a\x60\x55\x05\x17\x36\xb7\xb0\xb9\xc9\xf8\xe4\
-\xa9\x2f\xe0\xca\x15\xc2\xc3\xa7\x3f\x87\x2b\xdb\x5b\xd8\xde\x72\
-\x3d\xfe\x5b\x97\xf7\x71\xed\xc2\x04\x67\x7e\x16\xc0\xff\xc4\x1d\
-\x22\xd5\xbd\x9f\x00\x6e\xef\xf5\x9d\x3e\xd7\xfd\x63\x00\xee\x7b\
-\xe3\x67\x62\x0e\x1e\x0e\x0b\xc6\x5d\x07\xd6\xf1\xd0\x3d\x27\xf0\
-\xae\xbb\x0e\xe3\x83\xf7\xbe\x0b\xef\x3a\x72\x04\x47\xd6\x37\xb0\
-\x3e\x2e\xdc\x71\xc8\x19\x02\x1a\xcc\xc0\x92\xa7\xf4\x0c\xe5\x47\
-\xf1\x13\xdd\x4f\xf7\x4c\x06\x05\x43\xd7\xfb\x17\xbf\x9f\xb5\x15\
-\x0c\xe6\xc1\x71\x87\x16\xe8\xc5\x27\x01\xad\xdf\x2f\x79\xea\x07\
-\x29\x29\x09\x4d\x69\x78\xd1\xef\x03\x04\x3f\x2e\x80\x38\x49\x32\
-\x50\x04\xf8\xfc\xad\xce\xaa\x01\xd5\x2e\xa8\xfb\x24\xe0\xa7\xbe\
-\x28\x32\xf0\xad\x3d\x98\x92\x99\x37\x61\xc2\x50\x08\xc0\x80\xdd\
-\x49\x71\x61\xeb\x12\x56\xab\x35\x3c\xf5\xca\x0b\x78\xf2\xd5\x97\
-\x71\x65\x4b\xf1\x89\x53\x8f\x60\x67\x25\xd8\xda\xba\xd6\xe6\x59\
-\xf4\x15\x05\xbd\xc2\x28\xe4\xbf\xe0\xb7\xc7\xde\x0e\x2f\xd2\xfd\
-\x31\xe0\x9b\x77\x7d\xda\x6f\x3f\xee\x55\xc1\x0f\xc2\x54\x87\x16\
-\x37\xce\x6a\xf3\x47\x6e\x12\xc1\xb9\xcb\xd7\x70\xee\x82\xbd\x10\
-\xcb\x82\x70\x70\x6d\x0d\x0f\xbd\xeb\x38\xee\x39\x7c\x04\xef\x3f\
-\x7a\x1c\x0f\x1c\x3b\x8a\x63\x07\x0e\xe3\xc8\x72\x1d\x1b\x8b\x11\
-\x23\x2d\x92\x6e\x6c\xdb\xc0\x06\x1c\xce\x80\xc4\xc0\x13\xe0\xd8\
-\x02\x51\x96\xf9\xc4\x1d\x1f\xd1\x59\x80\xb9\x77\x80\x66\xa2\xd9\
-\xd6\x66\x39\x57\x00\x67\x30\x26\x75\xd4\xe0\x6e\x1a\x60\xc6\xa1\
-\xe4\x36\xe0\x94\xf3\xf7\xf4\x19\x26\x4b\x6a\xe6\x6b\xaa\xfe\xd6\
-\x81\x13\x72\x7d\x21\x32\x11\x44\x0a\xc1\x4f\x47\x1b\x8d\xd7\x40\
-\x10\x9d\x4c\x28\xb4\x0c\x10\x25\x54\x01\xce\x6f\x5f\xc0\x95\x2d\
-\xc1\xee\x6a\x89\xcf\x9c\x79\x0c\x67\x2e\x5d\xc6\xce\x6e\xc1\x6f\
-\x9c\x7e\x0c\xaf\x6f\x5e\xc3\xe6\x6a\x1b\xba\x6b\x86\xa5\x19\xf0\
-\x8b\xaf\xf8\x79\x7e\xd6\x4f\xf9\x9f\x87\x2d\x90\xad\xf6\x5f\xfa\
-\xfb\x15\xc0\xcd\xae\x6f\xf6\x8a\xe0\x07\xfc\xfd\xaf\x3c\x51\x6a\
-\x07\x24\x0a\x80\x11\x18\x07\xc6\x81\xe5\x1a\xde\x7f\xfc\x28\xee\
-\x3b\x72\x37\xee\x3f\x72\x1c\x0f\xdc\x7d\x14\xc7\x0e\x1d\xc4\xf1\
-\xf5\x43\xb8\x7b\x79\x10\xcb\x71\x81\xf5\x61\x89\x25\x8d\xe9\x24\
-\x44\xf0\x12\x3f\x29\xc6\x56\x0d\xcc\xf9\x05\xa5\xfb\x78\x99\x51\
-\x91\x19\x43\xa2\xfd\x7d\x35\x40\x28\x7b\x2a\x01\xe4\x5e\x00\xc2\
-\x0b\x20\xa6\xeb\xdd\xe9\x6e\xff\xaf\x73\x1c\x00\xd2\x0f\x0d\xfd\
-\x73\x13\x94\x24\x97\xa4\xaa\x1a\x5d\x78\x55\x27\x5c\xd8\xbe\x88\
-\x8b\x3b\x5b\xd8\xad\x4b\x5c\xbe\xb6\x89\x87\x5f\x7c\x14\xaf\x5c\
-\xdd\x46\x95\x05\x1e\x7d\xf1\x71\x9c\xba\x70\x16\x0a\xc6\xe6\xf6\
-\xd5\x74\x17\xce\x72\xfe\x2b\x3b\xe1\xfb\x67\xe2\xcb\x30\xff\xc9\
-\xff\x01\x33\xe0\xdc\x7c\xbb\xbe\x20\xf7\x5b\x80\xb7\xe6\x1a\x01\
-\x7c\x1b\xcc\xb9\xe8\x0f\xfb\xfb\xe3\x6f\xef\x99\xdb\x33\x5d\x70\
-\x1d\x02\x8c\xc0\x58\x0a\x16\x65\xc0\xfb\x8f\x19\xf7\xe0\xc4\xc6\
-\x61\xdc\xb3\x7e\x14\x5f\x77\xec\x24\x0e\x6f\x2c\x71\x70\xb9\xc0\
-\xdd\xcb\x43\x38\xba\x3c\x8c\xc3\x8b\x83\x58\x94\xc1\xe5\xaa\x0b\
-\x46\x1e\x31\xf2\x02\x8c\x82\x2a\x2e\x13\xa6\x11\xe8\x96\x0c\xcc\
-\x29\x91\xd3\xde\xcb\x18\x0c\x81\x88\xed\x9d\x83\xc5\xc7\x64\xcf\
-\x2f\x2d\xc8\xa5\x0a\x4c\x7e\x70\xb6\xf1\x5f\x95\x15\xb6\xa6\x6d\
-\x5c\xd8\xbe\x88\xed\xba\x85\x9d\xaa\xd8\x9d\x06\xec\xac\x2a\x9e\
-\x3a\xf7\x34\x1e\x7f\xf5\x29\x6c\x55\xc5\x54\x17\xd8\xda\xde\xc1\
-\x63\x67\xbf\x80\x33\x97\x5f\x85\x12\x63\xaa\x82\xdd\xed\xad\x26\
-\xa0\xd8\x83\x75\xfc\x55\x3d\x5f\x9b\x00\x7e\x0b\x26\x19\xf7\x31\
-\x00\xbf\x09\x13\xeb\x78\xdb\x5f\xfb\x09\xe0\xad\xbf\x06\x00\xdf\
-\xe4\x89\xe0\xfb\x00\xfc\x1e\xdc\x88\x69\xf8\xd5\x24\x06\xe9\xe2\
-\x8e\x2c\x39\x98\x44\x15\x30\xd0\x80\x23\x6b\x07\xf1\xd0\xb1\x77\
-\xe3\xd0\xda\x02\xcb\x45\xc1\xfa\x30\x60\x63\x5c\xc7\xc1\x72\x10\
-\x47\x96\x07\xf1\xd0\xb1\xf7\x62\x39\x2c\x70\x7c\xfd\x08\x98\x18\
-\x93\xae\xa0\x00\x0e\x2f\x36\x30\x96\x61\xb6\xa4\x94\x6a\x00\xdc\
-\xad\x2f\xd1\x02\x84\x82\xcd\xdd\x1d\x53\xf8\xa1\x05\x56\xb2\xc2\
-\x95\xed\xab\x10\x55\x3c\xfa\xca\xe7\x71\x69\xeb\x32\x76\x75\x07\
-\xbb\xb2\x83\x2a\x84\x9d\xaa\x58\x4d\x84\xad\xdd\x5d\xbc\x76\xed\
-\x1c\x1e\x39\xfb\xb8\xd1\x7e\x61\x32\x5e\x2a\xc0\xf6\xee\x66\x2b\
-\xb4\xe9\x06\x39\xe7\xb7\x77\xa2\xdf\xe8\xda\x02\xf0\x34\x4c\x8b\
-\xef\x53\x30\xd2\xce\x0b\x88\x6d\xa1\x77\xd0\xb5\x9f\x00\xee\xb0\
-\xd6\xc9\x01\xc3\xef\x86\x31\x0d\xbf\xdb\x93\xc3\xc6\xd7\xe6\xd9\
-\xbe\x49\x92\xd0\x3d\x1f\x0b\x7d\xc3\xd1\xfa\x6b\x0b\x76\xdf\xad\
-\x07\x9c\x3d\xd8\x36\x7d\xd2\xf9\xeb\xba\x1f\x68\xdb\x7f\x55\x42\
-\x93\xd8\x7c\x04\x6a\x75\xa5\x9e\x9d\xda\x4e\xe9\xbd\x8f\x42\x1f\
-\xd8\xb8\xc9\xe7\xbf\x76\xd7\xeb\x30\xfb\xb8\x47\x00\x3c\xea\xd8\
-\xcd\x97\x1d\xcd\x7f\x47\x5f\xfb\x20\xe0\x1d\xf6\x7c\xc0\x08\x23\
-\x1f\xf1\xdb\x00\xe0\x3d\x30\x8d\xc2\x0f\x7b\x75\xf0\x21\xd8\x86\
-\x22\x7d\x55\xe9\x05\x7b\xbe\xb2\xbc\x11\xee\xa0\x58\x4d\xab\x59\
-\x84\xd7\xa9\xfe\xce\xd3\x1c\x00\x2c\x6f\xfb\xe3\x2b\x00\x2e\xf9\
-\xe9\xfe\x59\x00\x4f\xc2\x84\x60\x3f\x07\x5b\xc4\x91\xfd\x97\xe0\
-\x7e\x02\xb8\x93\xae\x09\xc0\xf3\x7e\xfb\x39\x3f\x52\x8f\x02\xf8\
-\x46\x98\xc7\xe1\x43\x00\x3e\xe8\x49\xe1\x18\x42\xc2\xec\x6b\x59\
-\x8f\xbc\xd1\xfb\x77\xe6\x55\xbd\x6f\x3f\x05\x53\xd7\x79\x06\x86\
-\xd6\x7f\x11\x66\xa4\x79\xc1\x1f\xdb\xfd\x6b\x3f\x01\xbc\xad\x2e\
-\x01\x70\x0e\xc0\xaf\xfa\x2d\xae\x83\x5e\x29\xbc\xcf\xdf\xbe\x07\
-\xc0\xbb\x01\x3c\xe0\xef\xdf\xeb\xc9\x61\x7c\x87\x3c\x0e\x15\x26\
-\x97\xb5\x09\xe0\x8c\xf7\xe7\xa7\xfc\xfd\xd3\x5e\xbe\x3f\xef\x81\
-\xbe\xb3\xff\xb2\xd9\x4f\x00\xef\xf4\xeb\xaa\x9f\x6e\x37\x12\x93\
-\x58\x07\x70\xa8\x4b\x0c\xf7\x79\xb5\x70\xc8\x5b\x89\xbb\xba\xdb\
-\x11\xaf\x30\x96\xfe\x1c\x2e\xde\x94\x8e\xfb\xfa\xa4\x26\x30\x58\
-\x2f\x02\xfb\x75\x00\x17\x3d\x80\x2f\x79\xd2\x7b\x15\xc0\x2b\x30\
-\x3a\x6d\xbc\x3d\x07\x5b\xa9\xdd\xdd\x7f\x09\xec\x27\x80\xfd\xeb\
-\xc6\xd7\x96\xdf\x5e\x85\x81\x5c\xfd\xb5\xf0\xea\x61\x03\xc0\x01\
-\x7f\x7b\x10\x36\x85\x38\xe6\xb7\x11\xb6\xf1\xe8\x73\x04\x1c\x47\
-\xd3\x3e\x26\xff\xff\xf8\x06\xc9\xe9\x12\xe6\xda\xc9\xaf\x79\xb0\
-\x5f\xf4\x53\x7c\xcb\xdf\xbf\xec\xf7\xbd\x0a\x1b\xb3\x5d\xf3\xcf\
-\x5f\x46\x4a\xae\xec\x5f\x6f\x87\xeb\xff\x0d\x00\x10\x36\xd5\x05\
-\xb8\xc3\x4e\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\xa1\x0f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
-\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
-\x01\x00\x9a\x9c\x18\x00\x00\x0a\x4f\x69\x43\x43\x50\x50\x68\x6f\
-\x74\x6f\x73\x68\x6f\x70\x20\x49\x43\x43\x20\x70\x72\x6f\x66\x69\
-\x6c\x65\x00\x00\x78\xda\x9d\x53\x67\x54\x53\xe9\x16\x3d\xf7\xde\
-\xf4\x42\x4b\x88\x80\x94\x4b\x6f\x52\x15\x08\x20\x52\x42\x8b\x80\
-\x14\x91\x26\x2a\x21\x09\x10\x4a\x88\x21\xa1\xd9\x15\x51\xc1\x11\
-\x45\x45\x04\x1b\xc8\xa0\x88\x03\x8e\x8e\x80\x8c\x15\x51\x2c\x0c\
-\x8a\x0a\xd8\x07\xe4\x21\xa2\x8e\x83\xa3\x88\x8a\xca\xfb\xe1\x7b\
-\xa3\x6b\xd6\xbc\xf7\xe6\xcd\xfe\xb5\xd7\x3e\xe7\xac\xf3\x9d\xb3\
-\xcf\x07\xc0\x08\x0c\x96\x48\x33\x51\x35\x80\x0c\xa9\x42\x1e\x11\
-\xe0\x83\xc7\xc4\xc6\xe1\xe4\x2e\x40\x81\x0a\x24\x70\x00\x10\x08\
-\xb3\x64\x21\x73\xfd\x23\x01\x00\xf8\x7e\x3c\x3c\x2b\x22\xc0\x07\
-\xbe\x00\x01\x78\xd3\x0b\x08\x00\xc0\x4d\x9b\xc0\x30\x1c\x87\xff\
-\x0f\xea\x42\x99\x5c\x01\x80\x84\x01\xc0\x74\x91\x38\x4b\x08\x80\
-\x14\x00\x40\x7a\x8e\x42\xa6\x00\x40\x46\x01\x80\x9d\x98\x26\x53\
-\x00\xa0\x04\x00\x60\xcb\x63\x62\xe3\x00\x50\x2d\x00\x60\x27\x7f\
-\xe6\xd3\x00\x80\x9d\xf8\x99\x7b\x01\x00\x5b\x94\x21\x15\x01\xa0\
-\x91\x00\x20\x13\x65\x88\x44\x00\x68\x3b\x00\xac\xcf\x56\x8a\x45\
-\x00\x58\x30\x00\x14\x66\x4b\xc4\x39\x00\xd8\x2d\x00\x30\x49\x57\
-\x66\x48\x00\xb0\xb7\x00\xc0\xce\x10\x0b\xb2\x00\x08\x0c\x00\x30\
-\x51\x88\x85\x29\x00\x04\x7b\x00\x60\xc8\x23\x23\x78\x00\x84\x99\
-\x00\x14\x46\xf2\x57\x3c\xf1\x2b\xae\x10\xe7\x2a\x00\x00\x78\x99\
-\xb2\x3c\xb9\x24\x39\x45\x81\x5b\x08\x2d\x71\x07\x57\x57\x2e\x1e\
-\x28\xce\x49\x17\x2b\x14\x36\x61\x02\x61\x9a\x40\x2e\xc2\x79\x99\
-\x19\x32\x81\x34\x0f\xe0\xf3\xcc\x00\x00\xa0\x91\x15\x11\xe0\x83\
-\xf3\xfd\x78\xce\x0e\xae\xce\xce\x36\x8e\xb6\x0e\x5f\x2d\xea\xbf\
-\x06\xff\x22\x62\x62\xe3\xfe\xe5\xcf\xab\x70\x40\x00\x00\xe1\x74\
-\x7e\xd1\xfe\x2c\x2f\xb3\x1a\x80\x3b\x06\x80\x6d\xfe\xa2\x25\xee\
-\x04\x68\x5e\x0b\xa0\x75\xf7\x8b\x66\xb2\x0f\x40\xb5\x00\xa0\xe9\
-\xda\x57\xf3\x70\xf8\x7e\x3c\x3c\x45\xa1\x90\xb9\xd9\xd9\xe5\xe4\
-\xe4\xd8\x4a\xc4\x42\x5b\x61\xca\x57\x7d\xfe\x67\xc2\x5f\xc0\x57\
-\xfd\x6c\xf9\x7e\x3c\xfc\xf7\xf5\xe0\xbe\xe2\x24\x81\x32\x5d\x81\
-\x47\x04\xf8\xe0\xc2\xcc\xf4\x4c\xa5\x1c\xcf\x92\x09\x84\x62\xdc\
-\xe6\x8f\x47\xfc\xb7\x0b\xff\xfc\x1d\xd3\x22\xc4\x49\x62\xb9\x58\
-\x2a\x14\xe3\x51\x12\x71\x8e\x44\x9a\x8c\xf3\x32\xa5\x22\x89\x42\
-\x92\x29\xc5\x25\xd2\xff\x64\xe2\xdf\x2c\xfb\x03\x3e\xdf\x35\x00\
-\xb0\x6a\x3e\x01\x7b\x91\x2d\xa8\x5d\x63\x03\xf6\x4b\x27\x10\x58\
-\x74\xc0\xe2\xf7\x00\x00\xf2\xbb\x6f\xc1\xd4\x28\x08\x03\x80\x68\
-\x83\xe1\xcf\x77\xff\xef\x3f\xfd\x47\xa0\x25\x00\x80\x66\x49\x92\
-\x71\x00\x00\x5e\x44\x24\x2e\x54\xca\xb3\x3f\xc7\x08\x00\x00\x44\
-\xa0\x81\x2a\xb0\x41\x1b\xf4\xc1\x18\x2c\xc0\x06\x1c\xc1\x05\xdc\
-\xc1\x0b\xfc\x60\x36\x84\x42\x24\xc4\xc2\x42\x10\x42\x0a\x64\x80\
-\x1c\x72\x60\x29\xac\x82\x42\x28\x86\xcd\xb0\x1d\x2a\x60\x2f\xd4\
-\x40\x1d\x34\xc0\x51\x68\x86\x93\x70\x0e\x2e\xc2\x55\xb8\x0e\x3d\
-\x70\x0f\xfa\x61\x08\x9e\xc1\x28\xbc\x81\x09\x04\x41\xc8\x08\x13\
-\x61\x21\xda\x88\x01\x62\x8a\x58\x23\x8e\x08\x17\x99\x85\xf8\x21\
-\xc1\x48\x04\x12\x8b\x24\x20\xc9\x88\x14\x51\x22\x4b\x91\x35\x48\
-\x31\x52\x8a\x54\x20\x55\x48\x1d\xf2\x3d\x72\x02\x39\x87\x5c\x46\
-\xba\x91\x3b\xc8\x00\x32\x82\xfc\x86\xbc\x47\x31\x94\x81\xb2\x51\
-\x3d\xd4\x0c\xb5\x43\xb9\xa8\x37\x1a\x84\x46\xa2\x0b\xd0\x64\x74\
-\x31\x9a\x8f\x16\xa0\x9b\xd0\x72\xb4\x1a\x3d\x8c\x36\xa1\xe7\xd0\
-\xab\x68\x0f\xda\x8f\x3e\x43\xc7\x30\xc0\xe8\x18\x07\x33\xc4\x6c\
-\x30\x2e\xc6\xc3\x42\xb1\x38\x2c\x09\x93\x63\xcb\xb1\x22\xac\x0c\
-\xab\xc6\x1a\xb0\x56\xac\x03\xbb\x89\xf5\x63\xcf\xb1\x77\x04\x12\
-\x81\x45\xc0\x09\x36\x04\x77\x42\x20\x61\x1e\x41\x48\x58\x4c\x58\
-\x4e\xd8\x48\xa8\x20\x1c\x24\x34\x11\xda\x09\x37\x09\x03\x84\x51\
-\xc2\x27\x22\x93\xa8\x4b\xb4\x26\xba\x11\xf9\xc4\x18\x62\x32\x31\
-\x87\x58\x48\x2c\x23\xd6\x12\x8f\x13\x2f\x10\x7b\x88\x43\xc4\x37\
-\x24\x12\x89\x43\x32\x27\xb9\x90\x02\x49\xb1\xa4\x54\xd2\x12\xd2\
-\x46\xd2\x6e\x52\x23\xe9\x2c\xa9\x9b\x34\x48\x1a\x23\x93\xc9\xda\
-\x64\x6b\xb2\x07\x39\x94\x2c\x20\x2b\xc8\x85\xe4\x9d\xe4\xc3\xe4\
-\x33\xe4\x1b\xe4\x21\xf2\x5b\x0a\x9d\x62\x40\x71\xa4\xf8\x53\xe2\
-\x28\x52\xca\x6a\x4a\x19\xe5\x10\xe5\x34\xe5\x06\x65\x98\x32\x41\
-\x55\xa3\x9a\x52\xdd\xa8\xa1\x54\x11\x35\x8f\x5a\x42\xad\xa1\xb6\
-\x52\xaf\x51\x87\xa8\x13\x34\x75\x9a\x39\xcd\x83\x16\x49\x4b\xa5\
-\xad\xa2\x95\xd3\x1a\x68\x17\x68\xf7\x69\xaf\xe8\x74\xba\x11\xdd\
-\x95\x1e\x4e\x97\xd0\x57\xd2\xcb\xe9\x47\xe8\x97\xe8\x03\xf4\x77\
-\x0c\x0d\x86\x15\x83\xc7\x88\x67\x28\x19\x9b\x18\x07\x18\x67\x19\
-\x77\x18\xaf\x98\x4c\xa6\x19\xd3\x8b\x19\xc7\x54\x30\x37\x31\xeb\
-\x98\xe7\x99\x0f\x99\x6f\x55\x58\x2a\xb6\x2a\x7c\x15\x91\xca\x0a\
-\x95\x4a\x95\x26\x95\x1b\x2a\x2f\x54\xa9\xaa\xa6\xaa\xde\xaa\x0b\
-\x55\xf3\x55\xcb\x54\x8f\xa9\x5e\x53\x7d\xae\x46\x55\x33\x53\xe3\
-\xa9\x09\xd4\x96\xab\x55\xaa\x9d\x50\xeb\x53\x1b\x53\x67\xa9\x3b\
-\xa8\x87\xaa\x67\xa8\x6f\x54\x3f\xa4\x7e\x59\xfd\x89\x06\x59\xc3\
-\x4c\xc3\x4f\x43\xa4\x51\xa0\xb1\x5f\xe3\xbc\xc6\x20\x0b\x63\x19\
-\xb3\x78\x2c\x21\x6b\x0d\xab\x86\x75\x81\x35\xc4\x26\xb1\xcd\xd9\
-\x7c\x76\x2a\xbb\x98\xfd\x1d\xbb\x8b\x3d\xaa\xa9\xa1\x39\x43\x33\
-\x4a\x33\x57\xb3\x52\xf3\x94\x66\x3f\x07\xe3\x98\x71\xf8\x9c\x74\
-\x4e\x09\xe7\x28\xa7\x97\xf3\x7e\x8a\xde\x14\xef\x29\xe2\x29\x1b\
-\xa6\x34\x4c\xb9\x31\x65\x5c\x6b\xaa\x96\x97\x96\x58\xab\x48\xab\
-\x51\xab\x47\xeb\xbd\x36\xae\xed\xa7\x9d\xa6\xbd\x45\xbb\x59\xfb\
-\x81\x0e\x41\xc7\x4a\x27\x5c\x27\x47\x67\x8f\xce\x05\x9d\xe7\x53\
-\xd9\x53\xdd\xa7\x0a\xa7\x16\x4d\x3d\x3a\xf5\xae\x2e\xaa\x6b\xa5\
-\x1b\xa1\xbb\x44\x77\xbf\x6e\xa7\xee\x98\x9e\xbe\x5e\x80\x9e\x4c\
-\x6f\xa7\xde\x79\xbd\xe7\xfa\x1c\x7d\x2f\xfd\x54\xfd\x6d\xfa\xa7\
-\xf5\x47\x0c\x58\x06\xb3\x0c\x24\x06\xdb\x0c\xce\x18\x3c\xc5\x35\
-\x71\x6f\x3c\x1d\x2f\xc7\xdb\xf1\x51\x43\x5d\xc3\x40\x43\xa5\x61\
-\x95\x61\x97\xe1\x84\x91\xb9\xd1\x3c\xa3\xd5\x46\x8d\x46\x0f\x8c\
-\x69\xc6\x5c\xe3\x24\xe3\x6d\xc6\x6d\xc6\xa3\x26\x06\x26\x21\x26\
-\x4b\x4d\xea\x4d\xee\x9a\x52\x4d\xb9\xa6\x29\xa6\x3b\x4c\x3b\x4c\
-\xc7\xcd\xcc\xcd\xa2\xcd\xd6\x99\x35\x9b\x3d\x31\xd7\x32\xe7\x9b\
-\xe7\x9b\xd7\x9b\xdf\xb7\x60\x5a\x78\x5a\x2c\xb6\xa8\xb6\xb8\x65\
-\x49\xb2\xe4\x5a\xa6\x59\xee\xb6\xbc\x6e\x85\x5a\x39\x59\xa5\x58\
-\x55\x5a\x5d\xb3\x46\xad\x9d\xad\x25\xd6\xbb\xad\xbb\xa7\x11\xa7\
-\xb9\x4e\x93\x4e\xab\x9e\xd6\x67\xc3\xb0\xf1\xb6\xc9\xb6\xa9\xb7\
-\x19\xb0\xe5\xd8\x06\xdb\xae\xb6\x6d\xb6\x7d\x61\x67\x62\x17\x67\
-\xb7\xc5\xae\xc3\xee\x93\xbd\x93\x7d\xba\x7d\x8d\xfd\x3d\x07\x0d\
-\x87\xd9\x0e\xab\x1d\x5a\x1d\x7e\x73\xb4\x72\x14\x3a\x56\x3a\xde\
-\x9a\xce\x9c\xee\x3f\x7d\xc5\xf4\x96\xe9\x2f\x67\x58\xcf\x10\xcf\
-\xd8\x33\xe3\xb6\x13\xcb\x29\xc4\x69\x9d\x53\x9b\xd3\x47\x67\x17\
-\x67\xb9\x73\x83\xf3\x88\x8b\x89\x4b\x82\xcb\x2e\x97\x3e\x2e\x9b\
-\x1b\xc6\xdd\xc8\xbd\xe4\x4a\x74\xf5\x71\x5d\xe1\x7a\xd2\xf5\x9d\
-\x9b\xb3\x9b\xc2\xed\xa8\xdb\xaf\xee\x36\xee\x69\xee\x87\xdc\x9f\
-\xcc\x34\x9f\x29\x9e\x59\x33\x73\xd0\xc3\xc8\x43\xe0\x51\xe5\xd1\
-\x3f\x0b\x9f\x95\x30\x6b\xdf\xac\x7e\x4f\x43\x4f\x81\x67\xb5\xe7\
-\x23\x2f\x63\x2f\x91\x57\xad\xd7\xb0\xb7\xa5\x77\xaa\xf7\x61\xef\
-\x17\x3e\xf6\x3e\x72\x9f\xe3\x3e\xe3\x3c\x37\xde\x32\xde\x59\x5f\
-\xcc\x37\xc0\xb7\xc8\xb7\xcb\x4f\xc3\x6f\x9e\x5f\x85\xdf\x43\x7f\
-\x23\xff\x64\xff\x7a\xff\xd1\x00\xa7\x80\x25\x01\x67\x03\x89\x81\
-\x41\x81\x5b\x02\xfb\xf8\x7a\x7c\x21\xbf\x8e\x3f\x3a\xdb\x65\xf6\
-\xb2\xd9\xed\x41\x8c\xa0\xb9\x41\x15\x41\x8f\x82\xad\x82\xe5\xc1\
-\xad\x21\x68\xc8\xec\x90\xad\x21\xf7\xe7\x98\xce\x91\xce\x69\x0e\
-\x85\x50\x7e\xe8\xd6\xd0\x07\x61\xe6\x61\x8b\xc3\x7e\x0c\x27\x85\
-\x87\x85\x57\x86\x3f\x8e\x70\x88\x58\x1a\xd1\x31\x97\x35\x77\xd1\
-\xdc\x43\x73\xdf\x44\xfa\x44\x96\x44\xde\x9b\x67\x31\x4f\x39\xaf\
-\x2d\x4a\x35\x2a\x3e\xaa\x2e\x6a\x3c\xda\x37\xba\x34\xba\x3f\xc6\
-\x2e\x66\x59\xcc\xd5\x58\x9d\x58\x49\x6c\x4b\x1c\x39\x2e\x2a\xae\
-\x36\x6e\x6c\xbe\xdf\xfc\xed\xf3\x87\xe2\x9d\xe2\x0b\xe3\x7b\x17\
-\x98\x2f\xc8\x5d\x70\x79\xa1\xce\xc2\xf4\x85\xa7\x16\xa9\x2e\x12\
-\x2c\x3a\x96\x40\x4c\x88\x4e\x38\x94\xf0\x41\x10\x2a\xa8\x16\x8c\
-\x25\xf2\x13\x77\x25\x8e\x0a\x79\xc2\x1d\xc2\x67\x22\x2f\xd1\x36\
-\xd1\x88\xd8\x43\x5c\x2a\x1e\x4e\xf2\x48\x2a\x4d\x7a\x92\xec\x91\
-\xbc\x35\x79\x24\xc5\x33\xa5\x2c\xe5\xb9\x84\x27\xa9\x90\xbc\x4c\
-\x0d\x4c\xdd\x9b\x3a\x9e\x16\x9a\x76\x20\x6d\x32\x3d\x3a\xbd\x31\
-\x83\x92\x91\x90\x71\x42\xaa\x21\x4d\x93\xb6\x67\xea\x67\xe6\x66\
-\x76\xcb\xac\x65\x85\xb2\xfe\xc5\x6e\x8b\xb7\x2f\x1e\x95\x07\xc9\
-\x6b\xb3\x90\xac\x05\x59\x2d\x0a\xb6\x42\xa6\xe8\x54\x5a\x28\xd7\
-\x2a\x07\xb2\x67\x65\x57\x66\xbf\xcd\x89\xca\x39\x96\xab\x9e\x2b\
-\xcd\xed\xcc\xb3\xca\xdb\x90\x37\x9c\xef\x9f\xff\xed\x12\xc2\x12\
-\xe1\x92\xb6\xa5\x86\x4b\x57\x2d\x1d\x58\xe6\xbd\xac\x6a\x39\xb2\
-\x3c\x71\x79\xdb\x0a\xe3\x15\x05\x2b\x86\x56\x06\xac\x3c\xb8\x8a\
-\xb6\x2a\x6d\xd5\x4f\xab\xed\x57\x97\xae\x7e\xbd\x26\x7a\x4d\x6b\
-\x81\x5e\xc1\xca\x82\xc1\xb5\x01\x6b\xeb\x0b\x55\x0a\xe5\x85\x7d\
-\xeb\xdc\xd7\xed\x5d\x4f\x58\x2f\x59\xdf\xb5\x61\xfa\x86\x9d\x1b\
-\x3e\x15\x89\x8a\xae\x14\xdb\x17\x97\x15\x7f\xd8\x28\xdc\x78\xe5\
-\x1b\x87\x6f\xca\xbf\x99\xdc\x94\xb4\xa9\xab\xc4\xb9\x64\xcf\x66\
-\xd2\x66\xe9\xe6\xde\x2d\x9e\x5b\x0e\x96\xaa\x97\xe6\x97\x0e\x6e\
-\x0d\xd9\xda\xb4\x0d\xdf\x56\xb4\xed\xf5\xf6\x45\xdb\x2f\x97\xcd\
-\x28\xdb\xbb\x83\xb6\x43\xb9\xa3\xbf\x3c\xb8\xbc\x65\xa7\xc9\xce\
-\xcd\x3b\x3f\x54\xa4\x54\xf4\x54\xfa\x54\x36\xee\xd2\xdd\xb5\x61\
-\xd7\xf8\x6e\xd1\xee\x1b\x7b\xbc\xf6\x34\xec\xd5\xdb\x5b\xbc\xf7\
-\xfd\x3e\xc9\xbe\xdb\x55\x01\x55\x4d\xd5\x66\xd5\x65\xfb\x49\xfb\
-\xb3\xf7\x3f\xae\x89\xaa\xe9\xf8\x96\xfb\x6d\x5d\xad\x4e\x6d\x71\
-\xed\xc7\x03\xd2\x03\xfd\x07\x23\x0e\xb6\xd7\xb9\xd4\xd5\x1d\xd2\
-\x3d\x54\x52\x8f\xd6\x2b\xeb\x47\x0e\xc7\x1f\xbe\xfe\x9d\xef\x77\
-\x2d\x0d\x36\x0d\x55\x8d\x9c\xc6\xe2\x23\x70\x44\x79\xe4\xe9\xf7\
-\x09\xdf\xf7\x1e\x0d\x3a\xda\x76\x8c\x7b\xac\xe1\x07\xd3\x1f\x76\
-\x1d\x67\x1d\x2f\x6a\x42\x9a\xf2\x9a\x46\x9b\x53\x9a\xfb\x5b\x62\
-\x5b\xba\x4f\xcc\x3e\xd1\xd6\xea\xde\x7a\xfc\x47\xdb\x1f\x0f\x9c\
-\x34\x3c\x59\x79\x4a\xf3\x54\xc9\x69\xda\xe9\x82\xd3\x93\x67\xf2\
-\xcf\x8c\x9d\x95\x9d\x7d\x7e\x2e\xf9\xdc\x60\xdb\xa2\xb6\x7b\xe7\
-\x63\xce\xdf\x6a\x0f\x6f\xef\xba\x10\x74\xe1\xd2\x45\xff\x8b\xe7\
-\x3b\xbc\x3b\xce\x5c\xf2\xb8\x74\xf2\xb2\xdb\xe5\x13\x57\xb8\x57\
-\x9a\xaf\x3a\x5f\x6d\xea\x74\xea\x3c\xfe\x93\xd3\x4f\xc7\xbb\x9c\
-\xbb\x9a\xae\xb9\x5c\x6b\xb9\xee\x7a\xbd\xb5\x7b\x66\xf7\xe9\x1b\
-\x9e\x37\xce\xdd\xf4\xbd\x79\xf1\x16\xff\xd6\xd5\x9e\x39\x3d\xdd\
-\xbd\xf3\x7a\x6f\xf7\xc5\xf7\xf5\xdf\x16\xdd\x7e\x72\x27\xfd\xce\
-\xcb\xbb\xd9\x77\x27\xee\xad\xbc\x4f\xbc\x5f\xf4\x40\xed\x41\xd9\
-\x43\xdd\x87\xd5\x3f\x5b\xfe\xdc\xd8\xef\xdc\x7f\x6a\xc0\x77\xa0\
-\xf3\xd1\xdc\x47\xf7\x06\x85\x83\xcf\xfe\x91\xf5\x8f\x0f\x43\x05\
-\x8f\x99\x8f\xcb\x86\x0d\x86\xeb\x9e\x38\x3e\x39\x39\xe2\x3f\x72\
-\xfd\xe9\xfc\xa7\x43\xcf\x64\xcf\x26\x9e\x17\xfe\xa2\xfe\xcb\xae\
-\x17\x16\x2f\x7e\xf8\xd5\xeb\xd7\xce\xd1\x98\xd1\xa1\x97\xf2\x97\
-\x93\xbf\x6d\x7c\xa5\xfd\xea\xc0\xeb\x19\xaf\xdb\xc6\xc2\xc6\x1e\
-\xbe\xc9\x78\x33\x31\x5e\xf4\x56\xfb\xed\xc1\x77\xdc\x77\x1d\xef\
-\xa3\xdf\x0f\x4f\xe4\x7c\x20\x7f\x28\xff\x68\xf9\xb1\xf5\x53\xd0\
-\xa7\xfb\x93\x19\x93\x93\xff\x04\x03\x98\xf3\xfc\x63\x33\x2d\xdb\
-\x00\x00\x00\x04\x67\x41\x4d\x41\x00\x00\xb1\x8e\x7c\xfb\x51\x93\
-\x00\x00\x00\x20\x63\x48\x52\x4d\x00\x00\x7a\x25\x00\x00\x80\x83\
-\x00\x00\xf9\xff\x00\x00\x80\xe9\x00\x00\x75\x30\x00\x00\xea\x60\
-\x00\x00\x3a\x98\x00\x00\x17\x6f\x92\x5f\xc5\x46\x00\x00\x96\x2a\
-\x49\x44\x41\x54\x78\xda\xec\xfd\x79\x98\x64\xd9\x59\xdf\x89\x7f\
-\xce\xb9\x37\x22\x72\xab\xcc\xaa\xcc\xda\xbb\xaa\xab\xab\x77\xf5\
-\xbe\x49\xdd\x2d\x09\x84\xd4\x42\x2c\x92\x58\x05\x08\x18\x63\x0c\
-\x32\xf6\x60\x8c\xc7\xc6\xc6\x1e\x8c\x8d\xb1\xb1\x7f\xf6\xcf\xd8\
-\xe3\xdd\x18\x0f\xcc\x60\x8f\xc1\xc6\x78\x1d\xcc\x36\x86\x41\x48\
-\x46\x20\x24\xa1\xbd\xd5\x92\x7a\xef\xea\xea\xaa\xae\x3d\xb7\x58\
-\xee\x3d\x67\xfe\xb8\xe7\xbd\xf9\xde\x13\xe7\x46\x66\x49\xbd\x55\
-\x2b\xce\xf3\xc4\x13\x11\x37\x6e\x46\x46\xdc\x38\xef\xf7\x7d\xdf\
-\xef\xbb\x19\xef\x3d\x2f\xd6\xfa\x71\x63\x98\xae\x97\x74\xf5\x80\
-\xc3\xc0\x32\xb0\x07\xb8\x0a\x38\x12\x9e\x3b\x60\x3e\x1c\x2f\x80\
-\xd3\xe1\x6f\x36\x81\xb3\xc0\x29\xe0\x59\xe0\x02\x70\x3e\x3c\xef\
-\x4f\x2f\xe9\x2b\x63\xfd\xd8\x8b\x24\xa7\xf9\xf4\xd2\x5e\xd1\xab\
-\x1b\x04\xfe\x35\xc0\xad\xc0\xcd\xc0\x0d\x41\xe8\x57\x80\x99\x00\
-\x0a\xdb\x2d\x07\x0c\xc2\xed\x74\x00\x82\xc7\x80\x47\x80\xcf\x86\
-\xfb\x27\x81\x8d\xe9\x25\x7f\x75\xad\x29\x00\x5c\x79\xeb\x08\xf0\
-\x06\xe0\xf5\xc0\x97\x07\x81\x9f\xff\x22\xdf\xd3\x02\xb3\xe1\xb6\
-\x1b\xb8\x11\xf8\x0a\xf5\x7a\x3f\x80\xc2\x87\xc3\xed\x77\x81\x3f\
-\x04\xd6\xa6\x3f\xc7\x14\x00\xa6\xeb\xc5\x5f\x47\x81\xb7\x03\xdf\
-\x10\x04\x7f\xd7\x4b\xfc\xff\x67\x80\x6b\xc3\xed\x5b\x82\xc5\xf0\
-\x14\xf0\x5b\xc0\xef\x84\xfb\xa7\xa7\x3f\xd3\x14\x00\xa6\xeb\x85\
-\x5b\xf3\xc0\x3b\x81\x6f\x04\xde\x16\x34\xf3\x17\xbc\xb6\xf3\x20\
-\x2f\x93\xad\xb1\xc0\x35\xc0\xf7\x84\xdb\xc5\x00\x02\xff\x05\xf8\
-\xb5\xc0\x1f\x4c\xd7\x14\x00\xa6\xeb\x0b\x58\x87\x81\x3f\x0a\x7c\
-\x57\xf0\xe9\x2f\x5b\xc8\x7d\xb8\x39\x25\xad\x36\x08\xb9\x69\xf9\
-\x3b\x39\xdf\xa9\xf3\xec\xce\xc1\x61\x29\x00\xd5\x37\x02\x67\x80\
-\x5f\x06\xfe\x35\xf0\x5e\xa0\x9c\xfe\xa4\x53\x00\x98\xae\x9d\xf9\
-\xf6\xdf\x0f\x7c\x37\x70\xe8\x72\x04\xbe\x0c\x8f\x3b\x40\x16\xee\
-\x17\x80\xb9\xe0\xd4\xf7\xa8\xd8\xc2\x4e\x10\x6a\x1f\xfd\x7d\x01\
-\x0c\x81\x11\x55\x48\xa0\x4f\xc5\xf6\x6d\x86\xd7\xca\x70\x9b\x04\
-\x22\x6a\xed\x0d\xdf\xe1\xbb\x81\x0f\x00\xff\x27\xf0\xef\x82\x95\
-\x30\x5d\x53\x00\x98\xae\x68\xcd\x02\xdf\x07\xfc\x50\xf0\xf5\xb7\
-\x15\x7a\xd1\xd4\x79\x10\xec\xdd\x54\x71\xbe\xe5\x20\xf4\xdd\x00\
-\x04\xa2\xf9\x5d\x42\xcb\x6b\x00\x30\x09\x0b\xa2\x0c\xc2\x2f\x60\
-\x70\x01\xb8\x44\xc5\xfa\x15\x0a\x10\xec\xe4\x8f\xfb\x60\xb8\xfd\
-\x79\xe0\x67\x80\x9f\x03\x9e\x9b\xfe\xe4\xaf\x9c\x65\xa6\x79\x00\
-\x2f\xeb\x7a\x17\xf0\x23\xc0\xdd\xdb\x9d\xe8\x82\xd0\xe5\xc1\xde\
-\x3e\x10\x04\x7e\x77\xd0\xf0\x99\x12\x6e\x31\xe3\xed\xcc\x0c\x9d\
-\x43\x87\xe8\x1c\x3e\x4c\xbe\x6f\x1f\xd9\x9e\x3d\xd8\xc5\x45\xec\
-\xec\x2c\xa6\xd3\xc1\x3b\x87\x1b\x0c\x70\xeb\xeb\x14\x17\x2e\x30\
-\x3c\x7b\x96\xd1\xa9\x53\x0c\x9e\x7e\x9a\xe2\xe2\x45\xca\xb2\xc4\
-\x29\x21\x2f\xa8\xe2\x84\x97\xd8\x4a\x16\xd8\x08\x80\x61\x77\xe6\
-\x2a\x3c\x0d\xfc\x13\xe0\xa7\xc3\x5b\x4c\xd7\x0e\xd7\x34\x0f\xe0\
-\xd5\xb5\x6e\x01\xfe\x36\x15\xc9\x37\x51\xdb\x97\x41\xb0\xe6\x81\
-\x83\x6c\x65\xf9\x74\xc3\xeb\x85\xd2\xf0\xbd\xe3\xc7\x99\xbd\xeb\
-\x2e\xe6\xee\xbb\x8f\x99\xdb\x6e\xa3\x77\xfc\x38\xdd\x23\x47\x2a\
-\x81\xef\x76\xc1\x4e\xd6\xd7\x7e\x34\xc2\x0f\x87\x8c\xce\x9d\xa3\
-\xff\xf8\xe3\xf4\x1f\x7d\x94\xd5\x0f\x7e\x90\xd5\x8f\x7f\x9c\xb5\
-\x8f\x7f\x1c\xb7\xb6\x46\x07\xd8\x17\x6e\x83\x20\xc5\x67\x82\x7d\
-\x3f\x88\xb8\x83\xc4\x3a\x0a\xfc\x1d\xe0\x8f\x85\xef\xff\x73\xd3\
-\xad\x30\xb5\x00\xbe\xd4\xd6\x9f\x06\x7e\x8c\x2a\x51\x67\xa2\xe0\
-\x67\x41\xd0\x8e\x01\xfb\x83\xaf\x20\xaf\x39\xc0\x1a\xc3\xec\x3d\
-\xf7\xb0\xf8\xd0\x43\x2c\x3c\xf4\x10\xb3\x77\xdc\x41\xbe\x77\x2f\
-\x26\x0f\xb8\xee\x1c\xbe\x28\xc0\x7b\xea\xdf\xb9\xed\xf7\x36\x06\
-\x63\x0c\x18\x03\xd6\x6e\xbd\x07\x50\x6e\x6c\xb0\xf9\xe8\xa3\x5c\
-\xfa\xfd\xdf\xe7\xec\xaf\xfe\x2a\xe7\xdf\xf7\x3e\x36\x9f\x7f\x1e\
-\xc2\x67\xf4\xc1\x55\x38\x4b\x95\x45\xb4\x1e\xfe\xce\x6e\x7f\x2d\
-\x7e\x1d\xf8\x2b\xc0\x1f\x4c\xb7\xc5\xcb\x63\x01\x4c\x01\xe0\xa5\
-\x5b\xc7\x80\xbf\x0f\x7c\xd3\x76\x82\x9f\x07\x4d\x7f\x9c\x8a\x51\
-\xcb\x94\xd0\x7b\xa0\x7b\xe8\x10\xbb\xdf\xf9\x4e\x76\x7f\xf3\x37\
-\x33\xf7\xba\xd7\x91\xed\xde\x5d\x09\xf9\x70\x88\x2f\xcb\x4a\xc8\
-\xbf\xc0\xdf\xd5\x27\x80\x01\x6b\xb1\x9d\x0e\x26\xcf\xf1\x45\xc1\
-\xe6\x63\x8f\x71\xf6\xd7\x7f\x9d\x93\xff\xfe\xdf\x73\xfe\x7d\xef\
-\xa3\x08\xc2\x9e\x51\x11\x89\x92\x47\x7c\x69\x67\x40\xb0\x01\xfc\
-\xff\x82\x45\x50\x4c\xb7\xc9\x14\x00\x5e\x8d\xeb\x6d\xc0\x3f\x03\
-\xae\x6b\x3b\x41\x4c\xfd\x43\x54\x69\x78\x7b\x95\xef\x2f\xa4\xdd\
-\xcc\x8d\x37\xb2\xf2\x5d\xdf\xc5\xee\x6f\xf9\x16\xba\xd7\x5d\x57\
-\x09\xfd\x60\xb0\x25\xf4\x2f\xd2\xf5\xf6\x62\x39\x04\x0b\xc1\x76\
-\x3a\x98\x6e\x97\x72\x6d\x8d\xf3\xbf\xf3\x3b\x3c\xfd\x33\x3f\xc3\
-\xa9\x5f\xf9\x15\x46\xc3\x61\x4d\x0c\x96\x01\x08\x9e\x0b\x16\xc1\
-\x0e\xa2\x07\xbf\x0d\xfc\x20\xf0\x89\xe9\x76\x99\x02\xc0\xab\x69\
-\xfd\x50\xd0\x70\x9d\xd4\x8b\x22\xe0\xcb\x54\x41\xff\xc3\x4a\x80\
-\x84\xb9\xef\x1d\x3d\xca\xde\x3f\xf1\x27\xd8\xf3\x1d\xdf\x41\xe7\
-\xc8\x91\x4a\xd3\x0f\x87\x5b\x5a\x7e\x07\xd7\xd9\x47\x02\xe8\x5f\
-\x00\x30\x30\xd6\x62\x67\x66\xf0\xa3\x11\xe7\xfe\xc7\xff\xe0\xf1\
-\x7f\xf2\x4f\x38\xf9\xcb\xbf\x5c\xbb\x2f\x26\x7c\x8f\x33\xc1\x35\
-\x18\x6e\x6f\x0d\x3c\x0f\xfc\x2f\xc0\xcf\x4f\xb7\xcd\x14\x00\xae\
-\xf4\x35\x03\xfc\x43\xaa\x10\x5f\x72\x15\x54\x64\xde\x0d\xe1\xd6\
-\x53\x36\xb0\x03\xb2\x99\x19\x96\xff\xe8\x1f\x65\xdf\x9f\xfe\xd3\
-\x74\xaf\xbb\xae\xd2\xf6\xa3\xd1\x8b\xaf\xed\x77\x00\x22\x5e\xf3\
-\x09\xd6\x92\xcd\xce\xe2\x86\x43\x4e\xfd\xf2\x2f\xf3\xd9\xbf\xfb\
-\x77\x39\xf7\xf1\x8f\x37\x12\x8a\xfa\xc1\x2d\x38\x2f\x1b\x6f\xf2\
-\xc7\xf8\xdb\xc0\x8f\x32\x4d\x22\x9a\x02\xc0\x15\xba\xf6\x50\x25\
-\xc0\x7c\x5d\x9b\x20\x15\x54\xa1\xbc\x3b\xa8\xd8\xc0\x52\x09\x9f\
-\x03\xe6\xef\xbc\x93\x83\x3f\xf6\x63\xec\x7a\xe8\x21\x7c\x59\x6e\
-\x69\xfc\x1d\x5e\xd3\xf8\x57\x35\x5f\x80\xd6\xf7\x97\x09\x04\x26\
-\xcb\xb0\x73\x73\x0c\x4e\x9e\xe4\xf3\xff\xf8\x1f\xf3\xe8\x4f\xff\
-\x34\xa3\x7e\xbf\x11\x19\xb8\x10\x80\x60\x07\xd6\xc0\x7f\x04\xbe\
-\x97\x69\xb8\x70\x0a\x00\x57\xd8\x3a\x02\xfc\x02\xf0\xc6\x36\x5f\
-\x3f\x0b\x1a\xff\xe6\xe0\x17\x94\x91\x60\xad\x7c\xcf\xf7\xb0\xef\
-\x87\x7f\x98\xce\xc1\x83\xb8\x8d\x0d\x70\xee\x05\xd7\xf8\xfe\x32\
-\x40\xc1\x5f\xc6\x6b\xde\x7b\x6c\xb7\x8b\xc9\x73\x4e\xfd\xda\xaf\
-\xf1\xb1\x1f\xfd\x51\x2e\x3c\xf6\x58\xed\x12\x98\x20\xfc\xa7\x80\
-\xd5\xed\x41\xe0\xfd\xc0\x77\x30\x2d\x34\x9a\x02\xc0\x15\xb2\x8e\
-\x53\x15\xc4\xdc\xde\x66\xf2\xcf\x01\x77\x51\x05\xc4\xb5\xd6\xf7\
-\x40\xbe\xb4\xc4\xc1\x1f\xf9\x11\xf6\x7c\xf7\x77\xe3\x9d\x83\xe1\
-\xf0\x25\x33\xef\x5b\x05\x7a\x1b\xa0\xf0\x6d\xcf\x8d\x21\x9f\x9f\
-\x67\xf5\x73\x9f\xe3\xa3\x3f\xf2\x23\x3c\xfb\x5b\xbf\xd5\x10\x76\
-\x0f\x9c\x0b\x2e\x81\x9f\xec\x12\x7c\x1a\xf8\x7a\xe0\xf3\x53\x00\
-\x98\x02\xc0\x2b\x79\x5d\x0d\xfc\x37\xe0\xb6\xd4\x8b\x23\xaa\x98\
-\xfe\x3d\x6c\xb5\xe4\x11\xd3\xdc\x51\x85\xf6\x0e\xff\xe4\x4f\xb2\
-\xeb\xad\x6f\xc5\x6d\x6e\x56\x5a\x7f\xd2\x0f\x77\x99\x82\x7d\xb9\
-\xda\xdf\x5f\x8e\xb0\x4f\xf8\x1b\x3b\x33\xc3\xe8\xe2\x45\x3e\xfe\
-\x37\xfe\x06\x9f\xff\xf9\x9f\x6f\xb8\x0e\x86\x2a\xb5\xf8\x1c\x5b\
-\x51\x90\x96\xf5\x08\x55\x39\xf4\xa3\x53\x00\x78\x61\xd7\x34\x13\
-\xf0\x85\x59\x57\x01\xff\xb9\x4d\xf8\x8b\xe0\x17\xdc\x4b\xc5\x0c\
-\xc6\xc2\x3f\x73\xf5\xd5\x1c\xf9\xa7\xff\x94\x99\x7b\xee\xc1\x5d\
-\xba\x84\xf7\x7e\xdb\xb4\xda\x2f\x64\x3b\xf8\xe8\x71\x1b\x10\xc4\
-\xc7\x27\x9d\xb7\x1d\x60\x94\x6b\x6b\x64\xb3\xb3\xdc\xf9\x13\x3f\
-\x41\xb6\xb0\xc0\xa7\x7e\xfa\xa7\x1b\x20\x30\x4b\x15\x01\x39\x1f\
-\xae\x4b\xcb\xf7\xbe\x89\xaa\xc2\xf0\x6b\x81\xc7\xa7\xdb\x6d\x0a\
-\x00\xaf\xa4\xb5\x1b\xf8\x25\x12\xf9\xfc\x92\xd8\x73\x3c\xbc\x98\
-\x29\x7f\x5f\x04\xaa\x77\xe4\x08\x57\xfd\xf3\x7f\xce\xcc\xed\xb7\
-\xe3\x2e\x5d\x1a\x13\xa8\x2f\xd4\x86\xda\x09\x81\x37\x49\x8b\x6f\
-\x77\x7f\x39\x8f\x8b\xcd\x4d\x6c\x9e\x73\xdb\x5f\xfa\x4b\x38\xef\
-\xf9\xe4\xbf\xfc\x97\xf5\x67\x90\xa2\xa2\x25\xaa\xc4\xa1\x51\xfb\
-\x77\xbe\x19\xf8\x0f\xc0\x57\x51\x85\x0b\xa7\x6b\x0a\x00\x2f\xfb\
-\xea\x00\x3f\x0b\x3c\x90\x7a\xb1\xa4\x22\xfb\xee\x50\xda\x5e\x0b\
-\x7f\x67\xdf\x3e\xae\xfa\x7b\x7f\x8f\x99\x5b\x6e\xa1\xbc\x78\xb1\
-\xb5\x56\xff\x85\xe6\x00\x76\xa2\xb9\x53\x5a\x7f\xa7\x8f\x53\xa0\
-\xe2\x8a\x02\x93\xe7\xdc\xfa\x43\x3f\xc4\x60\x75\x95\x87\xff\xed\
-\xbf\x6d\x80\x00\x81\x1f\x59\x9f\x6c\x09\xdc\x0d\xfc\x5f\x54\x7d\
-\x07\xa6\xfd\x09\xa7\x00\xf0\xb2\xaf\xbf\x1b\x36\x63\xd2\xec\xbf\
-\x1e\xb8\x33\xa1\xd1\x3d\x55\x8c\xff\xc0\x8f\xfe\x28\x33\x77\xdf\
-\x8d\xbb\x78\xb1\xca\xea\xdb\xc6\xd7\x7f\x21\xad\x80\x36\x60\x88\
-\x4d\xff\xed\x84\x7e\xbb\x63\xfa\xb9\x2b\x0a\x4c\xa7\xc3\xed\x7f\
-\xee\xcf\xb1\xfa\xdc\x73\x3c\xf1\xdb\xbf\xdd\xa8\x62\x24\xb8\x48\
-\x1b\x93\x81\xef\x6d\xc0\x3f\xa6\x0a\x11\x4e\xd7\x14\x00\x5e\xb6\
-\xf5\x7d\xc0\x9f\x69\x13\xfe\x6b\x82\xf0\xfb\x16\x61\x5e\xf9\xbe\
-\xef\xab\x08\xbf\x4b\x97\xb6\xe2\xe8\x13\x84\xd5\xbc\xc0\x82\xdf\
-\x76\x8e\x4b\x80\xc0\x4e\xdd\x83\xed\x5e\x13\x10\xc8\x66\x66\xb8\
-\xfb\x2f\xfe\x45\xce\x3f\xf1\x04\xe7\x9e\x78\xa2\xfe\x7f\xba\xb1\
-\xc9\x68\x32\x08\x7c\x0f\xf0\x30\xf0\x93\xd3\x6d\x38\x05\x80\x97\
-\x63\xdd\xdb\xb6\xf9\x46\x54\x8c\xe0\x3d\xca\xec\x37\x91\x80\x2d\
-\x7d\xc5\x57\xb0\xfb\x3b\xbf\x13\xb7\xbe\x8e\x2f\xcb\xb1\x86\x1c\
-\x3b\x71\x05\xcc\x65\xb8\x0a\xdb\xf9\xf9\x63\x9a\x7a\x07\xbc\xc0\
-\xe5\x02\x83\xbe\x0e\xc3\xa2\x60\xfe\xf0\x61\xee\xfa\xa1\x1f\xe2\
-\xbd\x7f\xfe\xcf\x33\x1c\x0c\xea\x73\x62\x8e\x64\xc2\xfa\x9b\xc0\
-\x47\xa8\x7a\x11\x4e\xd7\x14\x00\x5e\xb2\xb5\x3b\xf8\xfd\xbb\x52\
-\x9a\x7f\x25\xa0\x83\x8d\x36\x7d\x4d\xfa\xed\xdd\xcb\xca\xf7\x7f\
-\x3f\x18\x83\x0f\x1b\xbf\x8d\x98\xfb\x62\x83\xa8\xfe\x8b\x38\xb6\
-\x9d\xe0\xc7\xc2\xbd\x9d\x6b\x10\xdf\x86\xab\xab\x1c\x7a\xf0\x41\
-\x6e\xfc\xd6\x6f\xe5\xa3\xff\xfa\x5f\x37\xde\x4b\x77\x2f\x9a\x90\
-\x28\xd4\x05\xfe\x05\x55\xc7\xa1\x33\xd3\x6d\x39\x05\x80\x97\x6a\
-\xfd\x2d\x2a\x5e\x6f\xcc\x74\x9e\x09\x9a\x7f\x86\x74\x5c\xdb\x00\
-\x7b\xfe\xc8\x1f\xa1\x7b\xec\x18\x6e\x7d\xbd\x21\xe4\x29\xa1\xf7\
-\x3b\x04\x01\x7f\x99\x80\xd0\xa6\xbd\x35\x07\xd0\x46\xec\xb5\x81\
-\xc2\x24\x8b\xc0\xb5\x80\x86\x03\x6e\x7a\xf7\xbb\x79\xf2\xfd\xef\
-\xe7\xf9\xc7\x1f\x6f\xb4\x2f\x93\xfb\x62\xf2\x26\xbd\x9e\xaa\xd0\
-\xea\x8f\x4f\xb7\xe5\x14\x00\x5e\x8a\xf5\x55\xc0\x9f\x68\x13\xac\
-\xdb\xa9\x62\xda\x45\x42\xf0\x3d\x30\x77\xcb\x2d\x2c\xbc\xed\x6d\
-\x95\xf0\x97\xe5\x17\xa5\xed\x2f\x27\x95\x77\x3b\xcd\x4c\x8b\x36\
-\x77\x13\x80\xa2\x4d\xbb\xef\xd4\x62\xf0\x00\x45\x41\x6f\xf7\x6e\
-\x5e\xf3\x1d\xdf\xc1\xe9\xbf\xf9\x37\xeb\x9e\x07\x2e\x01\x04\x9d\
-\xf6\xaf\xf6\xbd\xc0\x7f\x02\x7e\x65\xba\x3d\xa7\x00\xf0\x62\xae\
-\x25\xe0\x1f\xa4\xac\xd2\x82\x2a\xdc\x77\x8c\x66\x92\x4f\x7c\xbf\
-\xf4\xae\x77\x61\x67\x67\xf1\x9b\x9b\xad\xda\xde\x6f\x63\x05\x6c\
-\x67\x31\xec\xd4\x2a\xd8\x09\xc3\xbf\x9d\xc0\xb7\x1d\x4b\x9d\xe3\
-\x5a\x40\x61\xb8\xb6\xc6\x91\x37\xbe\x91\x03\x77\xdc\xc1\x33\xa1\
-\x82\x50\x83\x00\x6c\x15\x0e\xe5\xe9\xef\x65\xa8\x1a\xad\xfc\x2e\
-\xd3\xc2\xa1\x29\x00\xbc\x88\xeb\x2f\x92\xe8\xd3\x5f\x52\xa5\xf8\
-\xde\xb2\x8d\x2f\x3d\x77\xcb\x2d\xcc\xde\x7b\x2f\x7e\x6d\xad\xca\
-\xf3\x4f\x08\xf5\xe5\x98\xfe\x5f\x48\x54\xc0\x33\x39\xee\xbf\x9d\
-\xd9\x3f\x49\x90\xe3\xbf\x2f\x23\x0b\x25\xf5\x77\xa2\xdd\xf3\xd9\
-\x59\x6e\x78\xc7\x3b\x38\xf1\xf1\x8f\x37\xb4\xbf\xbc\x8f\xa7\x0a\
-\x0d\x2e\xd0\x6c\x6b\xae\xd6\x4d\xc0\x5f\x00\xfe\xf2\x74\x9b\x4e\
-\x01\xe0\xc5\x58\x37\x53\x75\xab\x19\x13\x9c\x3c\x10\x02\x3d\x9a\
-\x0c\x76\x2c\xac\x0b\x6f\x7d\x2b\xa6\xdb\xc5\x6f\x6e\x8e\x69\xfb\
-\x36\xed\xff\x85\xb8\x06\xb1\xdb\x71\xb9\xa0\xe0\x49\x47\x03\xb6\
-\xd3\xf2\x6d\x5a\x3f\x25\xf0\xf1\xf9\xc3\x8d\x0d\x0e\xdc\x79\x27\
-\xcb\xd7\x5e\xcb\xc9\xc7\x1e\x6b\xf0\x10\xda\x1a\x58\x67\xe2\x4c\
-\xb4\x1f\x00\xfe\x0f\xbe\xc4\x8b\x86\xa6\x00\xf0\xe2\xac\x1f\x27\
-\x31\x80\xb3\x0c\x2c\xd4\x0a\xed\xd9\x6b\x1e\xe8\xee\xdb\xc7\xec\
-\x9d\x77\xe2\x37\x36\xf0\x45\x81\x31\x66\x5b\x10\x98\x04\x0a\x5f\
-\xa8\xd0\x93\xf0\xf7\xdb\xb2\xfd\xb6\x23\xfb\x52\xc2\x2c\xef\xe7\
-\x5a\xf8\x01\xdf\x02\x0c\xbe\x28\xc8\xe7\xe6\x38\xf2\xfa\xd7\x73\
-\x42\x01\x80\x8b\xfe\x76\x33\x6c\xd8\xd9\xf4\xf7\x5c\xa4\x6a\xb1\
-\xfe\x3d\xd3\xed\x3a\x05\x80\x17\x72\xbd\x91\xaa\x7f\xff\x98\xf0\
-\x2f\x06\xdf\xdf\x6d\x23\x90\xb3\x77\xde\x89\x5d\x5a\xc2\xf7\xfb\
-\x97\xa5\xc1\xb7\xb3\x04\x4c\xc2\x44\x37\xb4\xa7\xe3\xb2\xcd\x71\
-\xdf\x22\xb8\xec\x40\xa8\xfd\x36\x37\xd7\x62\x19\xe8\xbf\x3f\x78\
-\xe7\x9d\xcc\xfc\xd2\x2f\xb1\x19\xae\x53\xca\x0a\x58\x0b\xd6\x56\
-\x8b\x2b\xf0\x9d\x54\xbd\x17\x3f\x34\xdd\xb6\x53\x00\x78\xa1\xd6\
-\x5f\xa0\x25\x1c\x7d\x33\x55\xfe\xfa\x84\x02\x16\x0c\x30\x73\xc7\
-\x1d\x50\x14\x95\xf6\x6f\x11\xd8\x36\x1e\xc0\xec\x00\x20\x52\x9a\
-\x7f\xbb\x2a\xbf\x36\x4d\xef\x26\x80\xc0\x76\x42\xde\x26\xdc\xae\
-\xe5\xb5\xc6\xad\x2c\x99\x3f\x78\x90\x3d\xd7\x5e\xcb\xda\xa7\x3f\
-\x5d\x0b\x78\x8a\x10\x5c\xa5\x4a\xc6\x48\x00\x40\x17\xf8\x73\x54\
-\x4d\x44\xa6\x6b\x0a\x00\x5f\xf4\x7a\x03\x55\x1d\x7a\x63\x15\x54\
-\xdd\x7b\x8f\xd0\xde\xc7\x5a\x04\x34\x5f\x5a\xa2\x73\xf4\x68\x55\
-\xe3\x1f\x42\x7f\x6d\x4c\xfe\x4e\x43\x82\x66\x1b\xf3\xdf\xec\x40\
-\xe3\xa7\x9e\xfb\x1d\x68\x79\xb7\x03\x2b\xc0\x4d\xb0\x02\xda\x80\
-\xc2\x01\xf9\xcc\x0c\x7b\x6f\xbc\x91\xa7\x3e\xfd\xe9\x31\xcb\x41\
-\x9f\xbb\x1a\x80\xb7\x93\x06\x81\x6f\x02\x6e\x05\x3e\x35\xdd\xbe\
-\x53\x00\xf8\x62\xd7\x0f\x50\x55\xf1\x36\x84\x44\x5a\x7a\x65\xa4\
-\x63\xfe\xfa\xdc\xce\xd1\xa3\x64\xf3\xf3\xf8\xe1\x10\x13\x0a\x7e\
-\xbc\x32\x29\x62\x5f\xff\x85\x62\xff\xfd\x36\x96\xc0\xe5\x68\xf6\
-\x9d\xde\xdc\x04\xb0\x70\x13\x8e\xcb\xe3\x72\x34\x62\xf7\x35\xd7\
-\x34\x12\x82\x52\x9f\xaf\xa4\x2a\x1d\xde\x9b\x06\x80\x1e\xf0\x1e\
-\xe0\xcf\x4e\xb7\xef\x14\x00\xbe\x98\x75\x3d\x89\xd1\x5d\x25\x55\
-\xae\xff\x7e\x26\x4f\xb1\x90\x8d\xd9\x39\x74\x08\x6f\x0c\x0c\x87\
-\xf5\x74\x9e\xd8\xec\x9f\x14\xfb\xbf\x1c\x12\xb0\xcd\xd4\xdf\x69\
-\x2b\xb0\x36\xbf\x7d\x92\x16\x67\x87\xa0\xe0\x5b\xb4\x7e\xc3\xcf\
-\xf7\x9e\xb9\xbd\x7b\xe9\xcc\xcd\xb1\xb9\xb1\x31\xc6\x01\xe8\xef\
-\xb2\x4a\x15\x16\x9c\x49\x73\x30\xdf\x4e\x55\x2b\x30\x4d\x11\x9e\
-\x02\xc0\x17\xbc\xbe\x8b\x04\xf3\x9f\x01\xd7\xee\x40\xf8\x44\x00\
-\xf3\x03\x07\x20\xcc\xdc\x93\xc6\x9e\x29\x73\xdd\xf0\xc2\xd5\x00\
-\x6c\x27\xe0\x6c\x23\xe8\x93\x08\x3b\xb7\x8d\xaf\xef\x69\x0f\xff\
-\xa5\xa6\x14\x37\xde\xb7\x2c\xc9\x67\x67\x99\x5b\x59\x61\x23\x00\
-\x80\x6b\xb1\x06\xc4\x0a\xe8\xa5\xbf\xee\x01\xaa\x3e\x82\x3f\x33\
-\xdd\xc6\x53\x00\xf8\x42\xd6\x2c\xf0\xee\x94\xf6\xdf\x1f\x4c\x4f\
-\xb7\x8d\x89\x2e\x66\xbe\x5d\x58\xa8\xfa\xf9\x17\x45\xd2\x24\x9f\
-\xa4\xe9\x3d\x2f\x7c\x47\xa0\x36\xe1\x7d\x21\xdc\x02\xb7\x83\xe7\
-\x93\x40\xc0\x87\xc9\x43\xbd\xc5\xc5\xba\x53\x50\xfc\xb9\x35\x21\
-\x28\x64\x60\x0b\x17\xf0\xee\x29\x00\x4c\x01\xe0\x0b\x5d\x5f\x1e\
-\xdc\xfc\xb1\x75\xb5\x31\xe4\x40\xb1\x4d\x93\x46\x03\x90\xe7\x98\
-\x5e\xaf\xd2\xfe\x01\x00\x62\xcd\x3f\xa9\x45\xd7\x4e\x52\x85\x27\
-\x91\x79\x6d\xe4\x1e\x3b\x34\xf7\x27\x59\x08\xb1\xaf\xbf\x9d\x8f\
-\x3f\xe9\xde\x29\x00\x30\x79\x4e\x3e\x37\x37\x31\x24\x59\x27\x10\
-\x4d\xe6\x02\xde\x48\x95\x21\xf8\xc8\x74\x3b\x4f\x01\xe0\x72\xd7\
-\xbb\x52\x5a\x73\x21\x58\x00\x25\x54\xe6\xfc\x76\x20\x60\x2d\xa6\
-\xd3\xa9\xa6\xf9\x94\x65\x43\xb0\xdb\x8a\x79\x76\x52\x0f\x30\xc9\
-\x32\x90\xd7\xdc\x36\xc2\xcf\x36\x9a\xde\x5d\xe6\xf1\xed\x34\x7d\
-\x9b\xd0\x3b\x65\x5d\x79\xc0\x5a\x4b\xde\xed\x4e\x0c\x33\xea\x75\
-\x89\xaa\xcb\x72\xe2\x7a\xcc\x00\x5f\x33\x05\x80\x29\x00\x5c\xee\
-\x5a\x0c\x1b\x67\x0c\x00\x0e\x19\xd3\x5a\xea\x9b\xd4\xc8\xc1\xe7\
-\x77\xc3\x21\xc6\xb9\x64\xb8\xaf\xad\x0d\x98\xbf\x8c\xe7\x29\x4d\
-\xbf\x9d\xf0\xef\x24\xce\xef\x2e\xe3\xb9\x9b\xf0\xf7\xb1\xe0\xa7\
-\x38\x01\x01\x00\x93\xe7\x58\x6b\xb7\x4d\x66\x92\xc7\x7d\xaa\x3a\
-\x81\x5d\x69\xb7\xec\x6b\xa8\x0a\xb8\xa6\x6b\x0a\x00\x3b\x5e\x0f\
-\x50\x11\xfd\x8d\x8d\x97\x07\x00\x90\x51\x58\x3e\x61\x05\xa4\xd8\
-\x7d\x3f\x1a\xe1\x8b\x02\xef\x5c\xc3\xa7\x4d\x75\x0b\x4a\xfd\xfd\
-\x24\x77\x60\x92\x70\xb4\x09\xbc\xbb\xcc\xc7\x7e\x1b\xb3\x5e\x5b\
-\x1a\xe5\x84\xf3\xdd\x04\x0b\x40\xbf\x4f\x31\x1a\x51\xaa\x62\xa9\
-\x49\x96\x86\x31\x86\x22\x70\x01\xbb\xd2\xd6\xd8\x03\x54\x29\x1b\
-\x27\xa7\xdb\x7a\x0a\x00\x3b\x5d\x6f\x4d\x69\xff\x3d\x54\xf5\xc0\
-\x6e\x87\xc4\x9b\x09\x40\x51\xf6\xfb\x98\x5e\x0f\x53\x96\x8d\xdc\
-\x7b\x43\x33\x5a\x30\x29\x79\x47\xc0\xc2\xee\xe0\x7f\xa7\x12\x77\
-\xda\xfc\xff\x9d\xb8\x00\x93\x04\x7f\x92\xb0\xfb\x1d\x68\xff\x58\
-\xf8\x1d\xe0\x8c\xa1\x54\x9d\x92\x5a\x93\x8e\x54\x44\x65\x8d\x2a\
-\x24\x9b\x8d\x5f\xbb\xc5\x00\x02\xff\x69\xba\xad\xa7\x00\xb0\x93\
-\x65\x49\xcc\xf4\xf3\xc0\x7e\x6b\xe9\x18\x53\x91\x7f\xc6\x60\xf4\
-\x68\xee\x60\x11\xc4\x5a\xda\x95\x25\x7e\x7d\x1d\xe6\xe7\xeb\x28\
-\x40\x9b\x60\xcb\x7d\x2a\x1c\xe8\x5a\x2c\x86\x9d\x00\xc0\x76\x5a\
-\xb4\x4d\xd8\xd9\xc1\x39\x93\xfc\x7e\x3d\xf6\xac\x8c\x8e\x95\x6d\
-\x80\x12\x84\x7a\xa8\x6a\x01\x76\x02\xb4\x43\x60\xdd\x18\x96\xd2\
-\x9d\x95\x5f\x3f\x05\x80\x29\x00\xec\x74\x1d\x26\x9a\xeb\x27\xe6\
-\xff\xde\x31\xe9\x55\xe6\x7f\x1b\x21\xe8\x1c\xe5\xea\x2a\xf9\xf2\
-\x32\x7e\x34\x1a\x13\xde\x58\xb0\xb5\xe0\x59\xd2\xd9\x81\xa6\xc5\
-\x4a\x98\x64\x01\x5c\x8e\xdf\x7e\x39\x5a\x7c\x3b\x0b\xc0\x25\x04\
-\xde\x4d\xb0\x06\xb0\x16\x57\x14\x0c\xa2\x76\x69\x13\x89\xd6\xf0\
-\xb7\x1b\xc1\x42\x4b\xac\xfb\xf8\xc2\x86\x23\x4f\x01\xe0\x4b\x70\
-\xdd\x43\x45\xf6\x37\xd6\x0c\xb0\x68\x2d\xa5\x8c\xe7\x4e\x68\xfc\
-\xa4\xa6\xf2\x1e\x77\xe9\x12\xae\x2c\xeb\x30\xe0\xa4\xe5\x94\xc0\
-\xb7\x69\xfb\xf2\x32\xac\x80\x9d\x9a\xf5\x6e\x1b\xdf\xdf\xed\x80\
-\x33\x70\x4c\x66\xfb\xb5\xf6\x6f\xe3\x03\xbc\x31\x14\xce\xd1\x5f\
-\x5b\x6b\xad\x6a\x24\xf8\xfe\x3e\x7a\xbe\xee\x7d\xdb\xb5\xb9\x2d\
-\x78\x70\xe7\xa6\xdb\x7b\x0a\x00\xdb\xad\xdb\x53\x02\xb7\xdb\x5a\
-\xba\xc6\xe0\x12\x1a\xdf\xa4\x2c\x02\x25\x88\xc5\xd9\xb3\xf4\x46\
-\xa3\xaa\x1a\x30\xd2\xee\x3b\x5d\xb1\x25\xb0\x5d\xa3\x8f\x14\xf1\
-\xc7\x65\xfa\xf9\x7e\x07\xc4\x9d\xdf\xe1\xeb\x6e\x1b\x2b\xa0\xfe\
-\x9f\xd6\x32\x58\x5d\xa5\x7f\xf1\x62\xab\x55\x13\x13\xa6\x18\x83\
-\x01\x46\xc1\x3d\xeb\x8e\x9f\xbb\x0c\xdc\x08\xfc\xde\x74\x7b\x4f\
-\x01\x60\xbb\xf5\x9a\x94\x40\x2d\x1a\x53\x4d\xb0\x69\x11\xf2\x49\
-\xab\x38\x7b\x16\xd7\xef\x57\x7f\xe7\xfd\x58\xbb\x70\x2d\xe0\xb6\
-\xe5\xb1\xa1\x59\x40\x74\x39\xc2\xdf\x96\xbe\xeb\x76\x60\xea\x5f\
-\x8e\xe0\xef\x94\xec\x73\x2d\x96\x81\x03\xc8\x73\xd6\xcf\x9d\xa3\
-\x48\x8c\x45\xd7\x63\xc7\xe3\x04\x2a\x13\x7e\x9b\x0d\x63\xe8\x8d\
-\xf3\x00\x96\xaa\x72\x7b\x0a\x00\x53\x00\xd8\xf6\x5a\xdc\x1c\x6f\
-\xba\x0e\xb0\x64\x2d\xa5\x32\x3b\x4d\x70\x05\x6a\xf6\x3e\x4c\xf3\
-\xf5\x81\x1c\xd4\x9b\xb3\x38\x77\x8e\x72\x75\x15\x3b\x33\x53\xbf\
-\xb6\x9d\x0b\x20\x96\x87\x9d\xf0\x7a\x9b\xe9\x4f\xe4\xff\x33\xc1\
-\xac\x4f\x09\xff\x76\xa1\xbc\x9d\x3c\x9e\x74\xac\x6c\x01\x00\xf9\
-\xec\x97\x4e\x9d\x6a\x70\x22\x8d\x9c\x09\xc5\xfc\xd7\x56\x97\x02\
-\xe5\x51\x7b\x72\xd6\xf5\xd3\xed\x3d\x05\x80\xed\xd6\x3c\x55\x63\
-\xdf\xc6\xca\x80\x79\x95\x98\x52\x9b\x9e\xde\x57\xbe\x68\xd8\x70\
-\x6d\x4d\x3e\xca\xcd\x4d\x46\xa7\x4f\xd3\x3d\x72\xa4\x6e\x08\x92\
-\x0a\x05\x92\xd0\xf2\x5a\xe0\x6d\xc4\x11\xa4\x34\xbf\x8e\x1a\x70\
-\x99\x44\xdd\x76\x1c\xc1\x4e\x00\xa0\x6c\x79\xbd\x6c\xe1\x02\x1a\
-\xef\x6f\x0c\xae\x28\xb8\x74\xea\x54\xbb\xf6\x6f\x79\x6e\x8c\xc1\
-\x1a\xc3\xc0\xfb\xb6\x30\xed\xb1\xe9\xf6\x9e\x02\xc0\x76\xeb\x10\
-\x51\xcf\x49\x0f\xcc\x18\x43\x4f\x04\x3d\xdc\x6f\x57\xc0\xa3\x81\
-\xc0\x01\xa3\x13\x27\xe8\x1c\x38\xd0\x98\x05\x60\x22\x73\x7f\x92\
-\x30\xdb\x48\xa8\x4d\xcb\xe3\xed\x2a\xfe\x26\x25\xf2\xec\xd4\x1d\
-\xd8\x2e\xb1\xa7\xdc\xa1\xf9\x1f\x9f\x4f\x96\xb1\x71\xf1\x22\x1b\
-\xe7\xce\xd5\xd7\xcd\x47\xa6\x3f\xea\x7a\x39\x63\x30\xea\x98\x31\
-\x86\x22\xcb\x70\xce\xa5\xf2\x01\xae\x8e\x2e\xe3\x74\x4d\x01\x60\
-\x6c\x1d\xa1\x6a\x29\xd5\xd0\xc0\x0b\xd6\x92\x59\x5b\x01\x40\xc8\
-\x50\xf3\x62\xfe\xc7\x39\x01\x11\x19\x28\x02\x3a\x3c\x75\x8a\xde\
-\xea\x2a\xb6\xd7\xab\x2d\x86\x58\xd3\xcb\xb1\x32\x61\x19\xa4\x32\
-\x06\x69\x21\xc8\xb6\xeb\xd0\x93\xca\xc3\x6f\x13\xf2\x58\xa0\x27\
-\x69\x70\x9f\x20\xfb\xca\x04\x11\xd8\x06\x04\x78\xcf\xc5\x13\x27\
-\x18\xa9\x68\x49\x6a\x4c\x79\x4d\xfc\x45\xc2\x2f\x3c\x40\x8b\x8b\
-\x75\x20\xfc\xb6\xfd\xe9\x36\x9f\x02\x40\xdb\x5a\x89\x15\xba\x07\
-\x7a\xd6\x62\xac\xa5\x2c\xcb\x7a\xd3\xf9\x04\x31\xd5\x56\x18\x64\
-\x00\xb7\xb9\xc9\xe8\xe4\x49\xba\x47\x8f\xd6\x56\x40\x2a\x2b\x50\
-\x03\x81\x7e\x7f\x9b\xf0\x87\x53\x66\xb2\xd6\x9c\x86\xcb\x4b\xfd\
-\x6d\xe3\x00\x76\x9a\xc6\xdb\x66\xf6\xb7\x71\x00\x0d\x90\x30\x86\
-\x62\x30\xe0\xe2\x89\x13\xad\xa0\x46\xcb\x77\x37\x81\x07\x10\x37\
-\x60\x68\x0c\x9d\x71\xae\x65\x85\x2a\x9a\x3b\x05\x80\x29\x00\xb4\
-\xae\x3d\xa9\x83\xdd\x00\x00\x38\x57\x69\x6f\x6b\x6b\x46\x5f\x6b\
-\x28\x13\x40\xc0\x24\x7c\x78\x03\x0c\x9e\x79\x86\x6c\xff\x7e\x6c\
-\x70\x23\x6c\x42\xc0\x99\xa0\xe9\xdb\xdc\x8c\xd8\x5d\x48\x35\xe1\
-\x80\xc9\x31\xfe\x49\x75\xfb\xdb\x91\x7c\xad\x3e\x7d\xc2\x1a\x68\
-\xb3\x10\xc8\x32\x2e\x9d\x3a\xc5\xc6\xea\x6a\x3a\x63\x47\x93\x7f\
-\x9a\x8c\x0d\x9a\xdf\x28\x20\x28\xad\x6d\x54\x5e\x86\x35\x47\x95\
-\x16\x7c\x61\xba\xcd\xa7\x00\xd0\xb6\x16\xe3\x03\x36\x58\x00\xde\
-\x18\x08\x6e\x80\xe4\xf8\xcb\xa6\xf4\x09\xf3\xdf\x2b\xb7\x40\x5e\
-\x1d\x5d\xb8\xc0\xe8\xd4\x29\xba\xfb\xf7\xe3\x55\x5d\x80\x76\x01\
-\x74\x04\xa0\x2d\xee\xbf\x5d\x2e\xc0\x76\x5d\x7a\xe3\xe2\x9d\x49\
-\xc2\x5f\x4e\x30\xfd\xcb\x09\x20\x51\xee\xd0\xff\xd7\xe4\xdf\x85\
-\xa7\x9e\x6a\xed\x62\x5c\x03\x6a\xb8\xe6\x28\xc1\x17\x20\xc8\xa8\
-\xca\xaf\xe5\x77\x49\x70\xb9\x8b\xd3\x2d\x3e\x05\x80\x49\xab\x97\
-\x04\x80\x2c\xab\x7c\xfe\xa0\xf9\x9d\x73\x95\x15\xa0\x2b\xd6\x12\
-\xe6\xbf\x4f\x98\xf2\x83\xa7\x9e\x22\x5b\x5c\xc4\x08\xa7\x40\xba\
-\x28\x88\x08\x00\x76\x3a\x20\xe4\x72\xba\xf9\xec\x34\x99\x27\xc5\
-\x13\x94\x97\x69\xfe\xcb\xdf\x24\x41\x43\xb4\xff\xc5\x8b\x69\x96\
-\x2e\x2d\xd0\x15\x19\x18\x5e\xb3\xc6\x90\x05\xe1\x37\xe9\xf3\x73\
-\x12\xed\xdd\xa6\x6b\x0a\x00\x7a\x75\x52\x02\x9c\x5b\x8b\x17\xed\
-\x6f\x83\x48\xc7\x26\xa6\x31\x95\x46\x57\xbe\x67\x2a\x9d\xb7\x58\
-\x5d\x65\x78\xf2\x24\x9d\x43\x87\xa0\x2c\x93\xfd\x01\xcc\x04\xcb\
-\xa0\xcd\x35\xd8\x8e\x04\x4c\x35\xf3\xdc\x69\xbc\xbf\x8d\xd0\x6b\
-\x3b\x96\xca\xfe\x2b\xdb\x80\x21\xf8\xfe\x17\x9e\x79\x66\x62\xd7\
-\x21\xad\xf5\x7d\xb8\xb7\x41\xd8\x0d\x90\x19\x53\xb5\x5f\x33\xa6\
-\x02\xd7\x34\x5e\xf4\xa6\x5b\x7c\x0a\x00\x3b\x51\xa0\x4d\x2b\x20\
-\x00\x00\xce\xd5\x89\x28\x18\xb3\xf5\xb8\xa5\x3e\x40\x47\x0a\xb4\
-\xa0\x0f\x4e\x9c\xc0\x2e\x2c\x60\x67\x66\x1a\x43\x42\x2d\xed\x93\
-\x80\xcd\x04\xf3\x7f\xa7\x63\xbb\x53\xe1\x3d\x5a\x80\xc0\xed\x40\
-\xf8\xb7\xe3\x02\xca\x04\xf1\x37\x06\x00\xd6\x72\xe1\xc4\x09\xfa\
-\x1b\x1b\xe9\xd0\x9f\xfe\x3e\xe1\x3a\x5b\x01\x83\xf0\xd8\x58\x5b\
-\x01\x81\xb5\x64\xe1\x78\x0b\x00\x64\xd3\x2d\x3e\x05\x80\x49\x6b\
-\x98\x34\x33\xb3\xac\x32\xf9\x83\x0b\xe0\x45\xf8\x15\x18\xd0\x12\
-\x06\x8c\x5d\x01\xa8\x1a\x5e\xf4\x9f\x7e\x9a\xde\xb1\x63\xe3\x21\
-\xc4\xe8\x7f\x6f\x57\x18\x34\x09\x04\xda\x78\x00\x37\x01\x10\x26\
-\xc5\xfb\xdb\x4c\xfc\xed\xb2\xfd\xca\x16\xab\xc1\x5b\xcb\xc6\x85\
-\x0b\x5c\x3a\x7d\x3a\x09\x6a\x4e\x9b\xff\x41\xd3\xd7\x26\xbe\x70\
-\x00\x01\x04\x32\x63\x2a\x2b\x40\xff\x2e\x53\x00\x98\x02\xc0\x65\
-\xae\x64\x88\xc8\x08\x01\x28\x00\x20\x02\xab\xbb\x02\x45\x9a\x2a\
-\xde\x82\x42\xea\x89\x96\x1f\x5e\xbc\x08\xa7\x4e\xd1\xd9\xb7\x0f\
-\x23\xb9\x05\x2d\xda\xbe\xcd\xec\xbf\x1c\x17\x60\x27\x1d\x7e\x1c\
-\x3b\xeb\xe2\x53\xee\xd0\x3a\x68\x33\xff\x7d\x20\xf3\x46\xfd\x3e\
-\x17\x4e\x9c\xa8\x38\x95\x09\xab\xe6\x3f\xd4\x75\xd6\x2e\x80\xb5\
-\x16\x1b\x80\x20\x0f\xd6\x40\x62\xb9\x14\xc0\x4f\xd7\x14\x00\xf4\
-\xba\x90\xde\x81\xa6\xb6\x00\x52\xc9\x40\x68\x57\x20\xe1\xd3\x6b\
-\x8b\x40\x97\xab\x0e\x4f\x9f\x86\x3c\x27\xdf\xb5\x6b\xac\x46\x20\
-\x05\x02\x66\x07\xfe\xca\xd8\x20\x90\x90\x1a\x9b\xf2\xaf\x27\x25\
-\x01\x35\xc2\x7a\x81\xdf\xd8\x89\x2b\xb0\x5d\xde\xbf\x0b\x16\x54\
-\xe1\x1c\x17\x4f\x9e\x64\xa8\x3a\xff\xc4\xe0\x15\xe7\x5c\xe8\xeb\
-\x29\x31\x7f\x01\xd5\x3c\x00\x41\x1e\xc0\xa0\xe5\xd2\x8c\xa6\x5b\
-\x7c\x0a\x00\x93\xd6\xd9\xe4\xce\xb1\x16\xb2\x0c\x13\xf2\x00\x7c\
-\x96\x6d\x6d\x56\xe7\xea\xf4\x60\x09\xfd\x19\x15\x1e\xb4\x13\x08\
-\x41\xef\x3d\x83\xe7\x9e\xc3\x1b\x43\x3e\x3b\xdb\x88\x2a\xb4\x69\
-\x7f\xbf\x0d\x18\x6c\xeb\x02\xa8\x4a\xba\xd6\x56\xdd\x0a\x34\x62\
-\x4d\x9f\xca\xfe\x2b\x13\xe7\x40\x93\xf5\xd7\xe7\x14\xc6\xb0\xf6\
-\xfc\xf3\xf4\xd7\xd6\x26\x72\x18\x0d\x90\x15\xeb\x49\xc7\xfd\xb5\
-\xe9\x6f\x2d\xb9\x31\xe4\xd6\xb6\xd9\xf9\x8e\x69\x12\xd0\x14\x00\
-\xb6\x59\xcf\x85\xbd\x9a\x69\xc1\x2a\x03\xd1\x84\xb5\x95\xa6\x96\
-\x24\x20\x79\x2c\x21\xc2\xb2\xac\xb8\x01\x15\xff\x2f\x49\x87\xf2\
-\x6a\x81\x2e\x4b\x06\xcf\x3d\x07\x07\x0e\x60\xba\xdd\x1a\x04\xb6\
-\x0b\xff\x99\x16\xb3\xdf\x44\x42\x33\xd6\x19\x48\xba\x14\x33\x21\
-\xef\x3f\x58\x23\x49\x9f\x5f\xbd\xd6\xe6\x0e\xb4\x11\x7f\x3e\x58\
-\x12\xeb\xe7\xcf\xb3\x79\xf1\xe2\xe4\x0a\x46\x9d\xe6\x1b\x59\x05\
-\xb5\xf6\x0f\xf7\x36\x80\x40\x1e\x40\x20\x23\x99\xf0\x2f\xbd\x43\
-\xa7\x6b\x0a\x00\xad\xeb\x29\x60\x13\xd5\x11\xc8\x01\x23\x09\xff\
-\x49\x06\xa0\x44\x03\xf4\x4d\x2c\x05\xef\xf1\xce\x6d\x09\xad\x6a\
-\x20\x52\x97\x0c\xc7\x02\x5d\x14\x0c\x4e\x9d\x22\x5f\x59\xc1\x76\
-\xbb\xe3\x8d\x46\x26\x68\xfc\x06\x10\x04\x01\x9b\x64\x11\x4c\xea\
-\x0b\xb0\x93\x7c\x00\x17\x59\x09\x65\x8b\x85\x30\x96\x27\x10\x9a\
-\xa9\x6c\x5c\xba\xc4\xe6\xa5\x4b\xc9\xd9\x82\x8d\xe1\x20\x91\x0b\
-\x16\x9b\xfe\x12\xf7\xb7\x5a\xf0\x43\xcd\x46\xcb\x92\x49\x62\xd3\
-\x35\x05\x80\x89\x2e\xc0\xb3\x54\xdd\x63\xaa\x52\x5e\x60\xe0\x3d\
-\x26\xcf\x2b\xed\xec\x3d\x26\xcb\x6a\x2b\xa0\x61\x09\x28\x0d\xab\
-\xdb\x56\x3b\x21\x05\xa3\x54\x61\x6d\x09\x14\x45\x41\x71\xe6\x0c\
-\x9d\xdd\xbb\xc9\x43\xc1\xd0\x76\x23\xc0\x1b\x1c\x45\x0b\x27\x30\
-\x29\x0b\x70\xbb\x1a\x81\x54\xd2\xcf\x18\x87\xa0\x80\xa0\x24\x1d\
-\x1d\x28\x8d\xa1\x74\x8e\xcd\xd5\x55\x36\xd7\xd7\x93\x83\x3e\x3d\
-\xe3\x85\x3f\x46\xb9\x2b\x3a\xe6\x2f\x04\xa0\x68\x7d\x11\xfc\x8e\
-\x31\x74\x8c\x61\x98\x26\x15\x57\xa9\xda\x06\x4e\xd7\x14\x00\x5a\
-\xd7\x00\x78\x58\x00\x40\x04\x68\xe0\x1c\x26\xcb\x30\xa1\xd4\x14\
-\xef\x21\xcb\x1a\x00\x50\x37\xf7\x54\x59\x82\x75\xb5\x20\xcd\x9a\
-\x80\x56\xb2\xaf\x2c\x19\x9d\x3b\x87\x5b\x58\xc0\xce\xcd\x8d\xd5\
-\x15\x8c\x59\x02\xaa\x21\x49\xca\x94\x6e\xe5\x01\xd8\x59\x89\xf0\
-\xa4\x09\x40\x63\x96\x42\xb8\x06\x63\x49\x40\xc6\x50\x94\x25\x9b\
-\xab\xab\x0c\x06\x83\x89\xed\xca\x4d\x24\xf4\x86\x71\xe6\xdf\x28\
-\x93\x5f\x7c\x7f\x79\x9c\x85\xc7\x4e\x0d\x60\x89\xdc\xbb\xc1\x74\
-\x8b\x4f\x01\x60\xbb\xf5\x87\x54\x53\x65\xeb\x35\x2a\xcb\xca\xff\
-\xb7\xb6\x02\x01\xd1\xfe\x0a\x04\x8c\xf7\x55\x29\xaa\x12\x7e\x94\
-\x26\xab\x0b\x87\xa2\xb8\x7f\xdc\x17\xa0\xf4\x9e\x72\x75\x95\x6c\
-\x34\x22\x9b\x9b\xab\x53\x86\x1b\xf9\x00\x2d\xa9\xb1\x31\x89\xe6\
-\xb8\xfc\x4e\xc1\x6e\x87\xe0\xe0\x13\x04\x9f\x0f\x40\xa0\xcf\x1b\
-\x8e\x46\x0c\xd6\xd7\x19\x95\xe5\x8e\x46\x8a\xc7\xc2\xee\x95\xdf\
-\x6f\x94\xd0\x5b\x25\xf0\x19\x55\xf8\x4f\x5c\x81\x44\x21\x10\xc0\
-\x69\xa6\x51\x80\x29\x00\xec\x60\x7d\x50\x3f\xb1\xc0\xa0\x28\x70\
-\xd6\x56\x83\x3e\x83\x56\xf7\xe2\xeb\x87\x88\x80\xb6\x06\x6a\x3e\
-\x20\x58\x0b\xd2\xd0\xa3\x41\x64\x25\xfa\x0a\x6a\x20\x70\xfd\x3e\
-\x65\x51\x90\xcd\xcc\x60\xf3\xbc\x11\x07\x1f\x3b\x37\xa1\xf5\x53\
-\x80\xb0\xdd\xa0\xcf\xb6\x0e\x3e\xdb\xe5\x12\xa4\xc2\x7e\xa5\x73\
-\x0c\x07\x03\x86\xfd\x7e\x13\x20\x26\x7d\x2e\xf9\x7e\x9a\x03\x50\
-\x69\xbf\x63\xa9\xbf\xc1\xe4\xef\x64\x19\x1d\x6b\xe9\x04\x40\xb0\
-\x0a\x80\xd5\x7a\x76\xba\xb5\xa7\x00\xb0\x93\xf5\x61\xe0\x3c\xa1\
-\x34\xd8\x02\x17\x07\x03\xca\x30\xb5\xd6\x78\x5f\x25\xee\x04\xad\
-\x5f\x6b\x3d\x21\x08\x95\x16\x44\x55\x10\x96\x8a\xd8\xab\x1b\x5a\
-\x44\x23\xc5\xe2\xfe\x00\x65\x51\xe0\xd6\xd6\xb0\xdd\x6e\x75\x6b\
-\x21\xb8\xfc\x36\xc7\x26\x69\xdc\xed\xa6\xfc\x4c\xca\x0a\x2c\x69\
-\xb2\xed\x35\x78\x14\x05\xc3\xc1\x80\x42\x69\xfd\x14\x27\x11\x5b\
-\x29\x31\xa1\xa9\xdd\x00\x7d\x6f\x95\xe9\x6f\x85\x03\x30\x86\xae\
-\xb5\x8c\x8a\x62\x8b\x73\x69\xae\xc7\xa7\x5b\x7b\x0a\x00\x3b\x59\
-\xcf\x07\x37\xe0\x2d\x72\x60\x58\x14\x8c\x8a\x82\x99\x5e\xaf\xf2\
-\x2f\xbd\xc7\x7a\xbf\xb5\xd1\x02\x00\x08\x19\xe8\xad\xad\xe6\x00\
-\xe8\x90\x60\x22\x59\xa8\x2d\xcf\x5f\x6b\x79\x80\x72\x38\xa4\x1c\
-\x8d\xc8\x3a\x1d\x4c\xa7\x93\x4c\x75\x6d\xe3\x01\xb6\xe3\x02\x98\
-\x20\xf8\x93\xac\x86\xf8\xf5\x12\x28\xca\x92\x62\x38\x64\x54\x96\
-\x63\x5a\xdf\xd0\x1e\x91\x90\xeb\xa3\x5b\x7c\x13\x99\xfe\x35\xfb\
-\x1f\x04\x5e\x62\xfe\x1d\xb9\xcf\x32\x3a\x59\xc6\xb0\xdf\x6f\x23\
-\x50\x9f\x9c\x6e\xed\x29\x00\xec\x64\x79\xe0\xf7\x05\x00\x0c\x50\
-\x78\xcf\xda\x70\xc8\xfc\xc2\x02\x65\x59\x36\x22\x00\x26\x44\x05\
-\xd0\xf9\x01\xb2\xd9\x13\x79\x01\xda\xfc\x77\xea\x71\x5c\x05\x38\
-\xd6\x06\xdc\x7b\x8a\xe1\x10\x53\x14\x98\x2c\xab\xea\x13\xa4\x3a\
-\x2e\x21\x9c\x86\xcb\x2f\x0e\x6a\x3b\x2f\x75\xbc\x91\x31\xe8\x5c\
-\x65\xad\x84\x1e\x07\x31\xa8\x49\x34\x25\xd6\xf2\xda\xf4\x8f\x3f\
-\xb3\x51\x00\x90\x29\x00\x10\x3f\xbf\x7e\x9c\x65\x35\x18\xe4\xd6\
-\x56\x63\xd8\xc7\x57\xc9\x74\x44\xf8\x14\x00\x2e\x63\xfd\xae\x7e\
-\x52\x00\xe7\x37\x37\x39\x94\x65\x95\x3f\x2e\x82\xef\x5c\x33\x2a\
-\x20\xe1\x27\xc9\x06\x0c\xa4\xa0\x87\x9a\x0f\x48\xcd\xed\xb3\x09\
-\xad\x6f\x95\xb6\x6e\x80\x82\x73\x78\xe7\x70\x45\x51\xb9\x04\x21\
-\xf7\xdd\x45\x56\x41\x6c\x06\xb7\x69\x71\x37\x49\x2b\xc7\x2e\x40\
-\x10\xd4\x52\x32\x05\x9d\xab\x84\x3f\xf8\xdc\xdb\x35\x28\x4d\xb9\
-\x28\xa9\xee\xbe\xba\xd7\x5f\x9c\xef\x9f\x29\x8d\x2f\x42\xdf\x0d\
-\x43\x5b\x32\x63\xd8\x1c\x0e\x53\xda\xff\x02\xf0\xb9\xe9\xb6\x9e\
-\x02\xc0\x4e\xd7\x07\x80\x33\x84\x71\x80\x06\x58\x5d\x5f\xc7\x59\
-\x5b\xcd\xae\x0f\xda\xde\x88\x25\x10\x88\x41\x93\xe7\xb8\xa2\xd8\
-\x8a\x0e\x58\x5b\x97\xfb\x4a\x04\x20\xee\x16\x84\x31\x94\x51\xca\
-\xb0\x26\xf6\x62\xcb\x00\x65\x11\x94\x65\x89\x09\xae\x86\x89\x92\
-\x92\x26\x69\xfc\xd8\x25\x30\x09\xc1\x27\x01\x1e\x12\xea\x93\x64\
-\xa7\xb8\x91\xa9\x06\x0b\x93\xd0\xe8\xf1\xfb\x8f\x25\x37\x49\x73\
-\x0f\x71\x05\x12\x99\x7e\x12\xee\xeb\x88\x1b\xa0\x00\x01\xe7\x70\
-\x69\x00\x78\x84\x69\x2b\xb0\x29\x00\x5c\xc6\x3a\x1b\x40\xe0\x9d\
-\xb2\x21\xcf\xad\xad\x31\x2c\x0a\x3a\x9d\x4e\x95\xe3\x1f\x40\xc0\
-\x6a\xf6\x3f\x58\x02\xd2\xe1\x56\x84\x46\xba\x09\x35\xaa\x08\xa5\
-\x6e\x20\x6c\x76\xa7\x3a\x05\xa7\x06\x82\xc6\x0d\x43\x1a\xe6\xb4\
-\xae\x50\x54\x24\x1a\x4c\xe8\xaa\xcb\xce\x46\x84\x37\x6e\x51\x8b\
-\xb3\x54\x17\x23\x12\x16\x44\x0c\x30\xf5\xdf\xc5\xa5\xbe\xf2\xb9\
-\xa3\x74\x5f\xa3\xe2\xfc\x75\xd6\x9f\x02\x82\x8e\xb5\x74\xb3\x8c\
-\x4b\x1b\x1b\x94\x65\x99\x9a\x9e\xf4\x11\xa6\xed\xc0\x5b\x97\x9d\
-\x5e\x82\xe4\x7a\xaf\xbe\x40\x83\xb2\xe4\xc2\xda\x1a\x79\xb7\x5b\
-\x45\x03\xf2\x1c\x1b\x6e\xf2\x9c\x2c\xab\xcd\x72\x2f\xa9\xc3\xd6\
-\xe2\xb3\xac\xae\xa8\x13\x4b\xc0\x11\x15\xe6\x24\xba\x0d\xfb\x1d\
-\x6a\xf1\x36\x61\x75\x51\xdd\x02\x51\xf6\x62\xea\xb1\x49\x65\x38\
-\x2a\x4b\x87\x09\x5c\x81\x69\xd9\x5c\x49\x2b\x46\xb3\xfc\x62\xfa\
-\x5b\x3b\x96\xec\x63\xb5\xf0\x2b\x5f\x5f\x4c\x7f\x09\x01\xe6\xd6\
-\x32\xdc\xdc\x6c\xeb\x93\xf8\xe1\xe9\x76\x9e\x02\xc0\xe5\xae\xff\
-\x57\x71\x57\x14\xc0\xf3\x17\x2e\x8c\x09\x7d\x7d\x0b\xc4\x9c\xc9\
-\xb2\xaa\x6e\x20\xcf\x2b\xad\x1f\xfa\xd4\x89\x15\xe0\x94\xf0\x8f\
-\x65\xdb\xa9\x63\xc9\xbe\xf9\x3b\x00\x85\x78\xed\xa4\xc3\xf0\xa4\
-\xe6\xa3\x6d\xdd\x89\xcc\x04\xae\x80\x49\x2e\x85\xea\xa4\x24\xa5\
-\xbc\x96\x28\xd4\xa7\x4c\xff\x5c\x6b\x7e\x11\xfc\x2c\xa3\x1b\x58\
-\x7f\x31\xff\x8d\xf7\xac\x6f\x6c\xa4\x36\xf3\x20\x58\x73\xd3\x35\
-\x05\x80\xcb\x5a\x9f\x00\x3e\x25\x4f\x32\xe0\xf4\xb9\x73\x0c\x8b\
-\x02\xdb\xe9\x60\x43\x48\x4e\x84\x5f\x6e\x84\x6c\x41\x02\x5f\x20\
-\x16\x80\x09\xac\xbd\xb7\xb6\xb5\x10\x47\x97\xeb\x8e\xf9\xdf\xdb\
-\x08\xbe\xb9\x8c\x1f\xd6\x4c\x10\xf0\x54\xea\xb1\xa5\xbd\x25\x59\
-\x0a\x30\xda\xd2\x9e\x53\xff\x1f\x21\xf8\x94\xe6\x97\xde\x7e\xd6\
-\xda\xad\xb0\x9f\x62\xfc\x3b\x41\xe8\xbb\xc6\xd0\x35\x86\x5e\x96\
-\xd1\x1f\x0e\x19\xa6\xfd\xff\x4f\x03\x8f\x4e\xb7\xf3\x14\x00\x2e\
-\x77\x8d\x80\x5f\xd5\x9b\x76\xb5\xdf\xe7\xc2\xc5\x8b\x95\x1b\x20\
-\x84\x60\x96\x55\x80\x90\xe7\x5b\xc0\x90\x65\x55\xff\x80\xd0\x47\
-\x40\xdc\x81\xba\x65\x75\xb8\x97\x2a\xb9\x49\x99\x76\xb4\x68\x52\
-\xbf\x8d\x56\xdf\xee\x9c\x49\x03\x46\x53\xc7\xec\x04\x81\x8e\x43\
-\x78\x29\xc0\x68\xb4\xf1\x52\x26\x7f\x43\xe0\x85\xec\xd3\x69\xbe\
-\x41\xe0\xf3\x90\xf5\xd7\xcd\xf3\x4a\xeb\x07\x40\x10\x17\x60\x75\
-\x6d\x6d\x6b\x74\xfb\xb8\x2b\x57\x4c\xb7\xf3\x14\x00\xbe\x90\xf5\
-\xcb\x62\xcd\x9a\xb0\x8b\x4e\x9c\x3e\x5d\x09\x7b\xb7\xdb\x10\x7e\
-\xd3\xed\x36\x40\xc0\x2a\xcd\x6f\x14\x27\x20\x1b\x1f\x75\xef\x95\
-\x59\xec\x95\x7f\xec\x69\x0f\x97\xb5\xf9\xe3\x6d\x02\x6d\xb6\xd1\
-\xf2\x29\x8d\x6f\x22\xc1\x6f\x4b\x0e\xb2\x4c\x1e\x4f\x36\x06\x36\
-\xaa\x93\x8f\x36\xf9\x45\xe0\xf3\x2c\xdb\x22\xf9\xb2\x6c\xcb\xd7\
-\x0f\xc2\xde\x0d\x96\x40\x37\xf0\x00\xde\x7b\x2e\xae\xad\xb5\x6d\
-\xe4\x5f\x9d\x6e\xe3\x29\x00\x7c\xa1\xeb\xf7\x81\x4f\x6a\x37\xe0\
-\xd9\xd3\xa7\xd9\xe8\xf7\xc9\xba\xdd\xda\x0d\xb0\x9d\x0e\x59\x96\
-\x55\x59\x7a\x59\xb6\x45\x10\x5a\x5b\x81\x84\x58\x03\xca\x22\x88\
-\x85\x3e\x26\x02\x53\x4d\x3d\x98\x20\x64\xa9\xd7\xed\x04\x5f\x3f\
-\x95\x78\x14\x13\x76\x76\xc2\xff\x6c\x4b\x3e\x32\xa4\xa3\x04\x63\
-\x6e\x45\x44\xf4\x89\xbf\x2f\xda\xbe\x2b\x82\xaf\x84\xbf\x9b\x65\
-\x55\xe6\x5f\x78\xbd\x63\x2d\xbd\xc0\xfe\x0f\x06\x83\x94\x55\xf3\
-\xd4\xd4\xff\x9f\x02\xc0\x17\xeb\x06\xfc\x82\xbe\x50\xeb\xa3\x11\
-\x27\x9f\x7b\xae\x8e\x06\x58\x75\xcb\xc2\x2d\x76\x07\x04\x24\x1a\
-\x91\x02\x3d\x6c\x44\xfb\xfd\xd1\xd8\xab\x31\x90\x98\x20\xf4\x6d\
-\xda\x3d\x26\xf9\x52\x33\x08\x52\x80\x00\xe3\x35\x02\xf1\x72\x91\
-\xd9\xdf\x08\x61\xaa\x90\x5e\x7d\x0d\x45\xf0\x95\x9f\x2f\x3e\x7e\
-\x27\xcb\x2a\x3f\x5f\x69\x7a\x01\x01\x0d\x06\xdd\x2c\xa3\x27\xc5\
-\x3f\xd6\x72\x46\x75\x17\x8a\xd6\xff\xcd\xb4\x0b\xd0\x14\x00\xbe\
-\xc8\xf5\x8b\xc0\xba\x16\xa8\xc7\x9f\x7c\x92\xa2\x28\x2a\x2b\x40\
-\x34\x7e\x10\xf0\x4c\xf8\x80\x2c\xab\x1e\x77\x3a\x75\x74\xc0\xe6\
-\x79\xc3\x1d\x40\x85\x0c\xc5\x2a\x90\x76\x58\x5e\x87\x0d\x5b\x4c\
-\xec\x49\xb3\x02\x26\xb9\x02\x29\x4d\x1f\x83\x40\x5b\xf9\x70\x1b\
-\xa9\x18\x5b\x01\x0d\xa1\x8f\xb4\x7e\x2e\x96\x91\x74\xf4\x09\x15\
-\x7d\x8d\xf0\x5e\xd0\xee\x35\xe3\xaf\x8f\x05\xc1\xef\xe5\x39\x6b\
-\xfd\x3e\x17\x2f\x5d\x4a\xf5\x01\xf4\xc0\x2f\x4d\xb7\xef\x14\x00\
-\xbe\xd8\xf5\x18\xf0\x1b\xda\x0d\x38\xbb\xb6\xc6\xc9\xe7\x9e\xa3\
-\x13\xfc\xfe\x2c\xcf\x31\x9d\x4e\x75\x2f\xd6\x80\x7a\x2d\xcb\x32\
-\xb2\xe0\x0a\x08\x38\x08\xc3\x6d\x14\x39\xe8\xdb\x3a\xfb\x24\x32\
-\xfc\x68\x31\xad\x49\x80\x82\x89\x04\xb1\x4d\xeb\xb7\xb5\x07\xf3\
-\x2d\xe7\x11\x99\xf8\x96\xa8\x8e\x3f\x22\x01\xa5\x73\x4f\x6c\xf2\
-\x77\x54\x51\x4f\x57\x85\xf9\xea\x9b\xb5\xf4\xc2\xf1\xd8\x32\x38\
-\x75\xfe\x7c\x1b\xf9\xf7\x11\xe0\xfd\xd3\xed\xbb\xfd\x9a\x66\x02\
-\x6e\xbf\x7e\x1a\xf8\x46\x2d\x80\x9f\xff\xfc\xe7\xb9\xea\xe8\x51\
-\x6c\xb7\x8b\x07\x32\xef\xa1\xd3\x21\x53\x44\x5e\xc6\xd6\x34\x1b\
-\x11\xf0\x2c\x3c\xae\x1b\x5f\x16\x45\x65\x09\xc0\x56\xb2\x8d\x24\
-\xe2\xa4\x9a\x87\x24\x86\x8e\xa4\x84\x7f\x12\xe9\x17\x6b\x6d\x47\
-\x7b\xa5\x5e\x2a\x8b\x50\x4c\x7e\xa7\x84\x5b\x9e\xeb\x6e\xbd\xda\
-\xa5\xc9\x14\x90\xf9\xa8\xba\x6f\x2c\xdc\x67\x2d\x99\x58\x04\xe2\
-\xff\x2b\xb0\xc8\x83\x25\xb0\x3e\x18\x70\xe6\xc2\x85\xb6\x2e\xc0\
-\xff\x8a\x29\xfb\x3f\x05\x80\x17\x68\xfd\x3f\xc0\xff\x00\xde\x20\
-\x17\xec\xf4\x85\x0b\x3c\x7b\xe2\x04\x57\x1f\x3f\x8e\x73\xae\xc1\
-\x84\xe7\xb2\xd9\x45\x70\x46\x23\xbc\xf7\x64\x54\x99\x45\x35\xb9\
-\x26\xd5\x73\x52\x44\x14\xda\x89\x49\xfd\x80\x91\x7a\x02\x29\x3e\
-\xd2\x05\x3f\xaa\xbf\xa0\x61\xbc\x88\xa8\x8d\xe9\x37\x09\x0d\x4f\
-\xf4\x5a\xac\xf9\x53\xd6\x80\xce\xf9\xd7\x60\x50\x57\x3f\xaa\xda\
-\x7d\x94\x5b\x63\x43\x18\xd4\xa8\x7a\x7e\xa3\x05\x3e\x7a\x9c\x2b\
-\x17\xa0\x76\x15\x82\xb5\xf0\xcc\xd9\xb3\x14\x65\x99\x02\x80\xe7\
-\x34\x77\x33\x5d\x53\x00\xf8\x62\x57\x09\xfc\x43\x01\x00\x21\xbf\
-\x3e\xf3\xc8\x23\x1c\x3a\x7a\x94\xac\xd3\xd9\x12\x6c\x3d\xba\x4a\
-\x99\xee\x3a\xfc\x87\xea\x7c\x23\x40\x50\x93\x7e\x22\xfc\xd2\xd7\
-\x4e\x0b\xbd\x08\xbc\x7e\xcf\x96\x72\xe2\x14\x08\xf8\x09\xfe\x7c\
-\xca\xdc\xf7\x2d\x6e\x84\xb6\x46\xa4\xd4\xb7\xb6\x7a\x8c\xa9\x9a\
-\xa7\x04\xe1\x17\xab\xc7\x85\xef\x9d\x29\x8d\x6f\x74\xb2\x4f\x10\
-\xfa\x2c\xf0\x03\xdd\x2c\x6b\xe4\xfa\xe7\xaa\x00\xa8\x97\xe7\x5c\
-\xdc\xdc\xe4\xf4\xb9\x73\x6d\xda\xff\xe7\xa8\xfa\x3a\x4c\xd7\x14\
-\x00\x5e\xb0\xf5\x5f\xa8\x72\xca\xef\x95\x8b\xf6\xfc\xc5\x8b\x3c\
-\xfe\xf9\xcf\x73\xd3\xad\xb7\x6e\x0d\xf9\x8c\x4c\x5f\xb9\xb8\xa5\
-\x62\xfb\xad\x31\x14\xa8\x16\x58\x4a\x7b\x36\x40\x23\x58\x05\x56\
-\xbf\x6f\xdc\x32\xdc\x18\x6c\x04\x0c\x36\x1a\x56\xea\x48\x57\xe6\
-\x69\x4b\x20\xee\x48\x34\xc6\x41\x88\x45\xa2\x62\xf8\xba\x3f\xa1\
-\x7c\x46\x27\x03\x3b\x05\xe0\x64\x5a\xaf\x36\xf7\x65\x90\xa7\x12\
-\xfe\x4c\xdf\x4b\xd6\x9f\x22\x05\x25\x3f\x20\x0f\xd7\xef\xc9\xd3\
-\xa7\x29\x9d\x4b\x01\xc0\x79\xe0\x9f\x4f\xb7\xeb\x14\x00\x5e\xe8\
-\x35\x04\x7e\x8c\x2a\x39\xa8\xde\xf4\x0f\x3f\xfc\x30\x57\x5d\x7d\
-\x35\x73\xf3\xf3\x14\xc3\xe1\x56\x65\x9b\x4c\xa8\x09\x9b\x58\x0a\
-\x5d\x30\x06\x17\x04\x82\xd1\xa8\xd2\xfa\xd6\xe2\x8b\xa2\xb2\x04\
-\x42\x79\xaf\x54\xf9\x19\x63\x20\x74\x21\x1a\x33\xeb\xa5\x8c\x38\
-\xe6\x05\x22\x10\xd2\xe1\x39\xe1\x24\x64\x44\x97\xb4\x26\x6b\xeb\
-\x33\xa8\xad\x0b\xab\xba\xf6\x38\xf5\xfe\x36\x22\x28\xad\x12\x7c\
-\x07\xb5\xb0\x9b\x48\xf0\x63\xe1\xb7\x91\xe0\xd7\x2e\x81\x00\x40\
-\xd0\xfe\xcf\x5c\xb8\xc0\xf3\xed\xbe\xff\x4f\x31\xed\xfe\x33\x05\
-\x80\x17\x69\xfd\x37\xe0\xbf\x02\x5f\x27\x00\xb0\x3a\x1c\xf2\xc9\
-\x8f\x7d\x8c\x07\xbf\xfc\xcb\xab\xe6\x20\x6a\x72\xb0\x6c\x78\xdd\
-\x0d\x87\x2c\xa3\x0c\xaf\x5b\xaa\x9e\xf9\x4e\x99\xc8\xd2\x52\xdc\
-\x58\x5b\xf5\x1e\x94\x7a\x7f\xef\xb1\xe2\x16\x84\xfb\x54\x29\x6e\
-\x83\xb4\xd3\x96\x04\x5b\xd3\x79\xe2\xf6\xdb\x1a\x28\xa4\x4b\x91\
-\xd6\xf0\xc6\xb9\x5a\xc8\x4b\x9a\xe3\xb9\x32\x55\xdc\x64\x95\xf0\
-\x7b\x15\xdd\xc8\xa4\xca\x2f\xcb\xaa\x1c\x80\x20\xec\x26\xd2\xfc\
-\x02\x00\x99\x32\xfb\x75\x86\x60\x37\xcb\x18\x96\x25\x8f\x3e\xfb\
-\x6c\x5b\x0a\xf4\xd3\xc0\xff\x36\xdd\xa6\x53\x00\x78\x31\xd7\x5f\
-\x05\xde\x0a\xcc\xc9\xc5\x7b\xec\xa9\xa7\xb8\xea\xc9\x27\x39\x76\
-\xed\xb5\x55\x4f\xba\x78\x6a\x90\x00\x41\x60\xfd\x4d\xd0\x8a\xa5\
-\x10\x62\xa1\xbb\x8f\xb3\x16\x42\x6b\x2d\x11\x3c\xc4\x02\x70\xae\
-\x8e\x00\xd8\x60\xf6\x37\xca\x74\xc3\xe4\x21\xed\x9f\xc7\xf5\xfb\
-\xb5\x36\x17\x2b\x45\x26\x15\xb5\x58\x01\x35\xa1\x98\x65\x75\x13\
-\x50\xa8\x18\x7d\x79\x1f\xb1\x04\xc4\xea\xa9\xad\x17\x11\xec\x00\
-\x06\x5a\xf0\x35\xf1\x97\x72\x05\x6a\xcd\x9f\x48\x11\xfe\xd4\x89\
-\x13\xac\xf7\xfb\x6d\x9b\xf6\xc7\xa7\xbe\xff\x14\x00\x5e\xec\xf5\
-\x31\xe0\x27\x80\xbf\x85\x32\x97\x3f\xfa\xe1\x0f\xb3\xb2\x6f\x1f\
-\xf3\xbb\x76\x55\xbd\xfb\xc4\xec\x2f\x8a\xba\x65\x97\xcd\x32\x6c\
-\x78\xad\x1e\x69\x9d\x65\xf8\xd1\x88\x72\x34\xda\x4a\x11\x0e\x73\
-\x06\x51\x43\x46\x4c\x59\x56\x3e\xb8\x73\xb5\xcf\x6f\x65\x58\x69\
-\x14\x3e\xd4\x65\xb5\x4e\x09\xb6\x7e\x2e\xa1\xbc\xba\x0b\x8f\x7c\
-\x46\x1d\xb6\x0c\xc2\x2d\xf3\x0d\x33\xb6\xb2\x13\x25\x2a\x51\x27\
-\x12\x49\x7d\x43\x00\x0b\xf1\xe5\x4d\x44\xf8\x49\x6d\x84\x55\xc9\
-\x40\xda\x05\xd0\x8d\x3f\x44\xf8\x0d\xd0\xcd\x32\x4e\x5c\xb8\xc0\
-\xd3\xa7\x4f\xb7\x99\xfe\xef\x0f\xe4\xdf\x74\x4d\x01\xe0\x45\x5f\
-\x7f\x0f\xf8\x2a\xe0\x4d\xa2\x11\x2f\x6c\x6c\xf0\x87\x1f\xfc\x20\
-\x6f\x7c\xeb\x5b\xc9\x3a\x9d\xca\x94\x0e\x1a\xac\x94\xca\x37\xd1\
-\xec\x59\x46\x29\x42\x10\x66\x0e\x58\x6b\x71\x45\x51\x81\x80\x08\
-\x7f\x51\x54\x42\x5d\x96\xf5\x74\x62\x13\xf8\x00\x42\x4f\x42\xab\
-\x1a\x77\x08\x4f\xe0\xa4\xb1\x07\xd5\xd8\xec\x52\x69\x75\xc9\x53\
-\xf0\x62\x21\xe8\x71\x65\xaa\x62\x4f\x34\xbb\xce\x12\xf3\x01\x24\
-\x74\x96\x62\x1d\xde\x53\x05\x4e\xf2\xb8\x01\x72\x3a\xf1\x29\x24\
-\x46\x19\x01\xc5\x60\x1d\xe8\xba\x80\x2c\xcb\x6a\x97\xa2\x63\x2d\
-\x6b\xc3\x21\x9f\x7a\xea\xa9\xe4\xb4\x24\xaa\x91\x5f\x7f\x96\x69\
-\xdc\x7f\x0a\x00\x2f\x21\x21\xf8\xa7\xa8\x72\x03\x96\xe4\x22\x3e\
-\xfe\xcc\x33\x2c\x7f\xec\x63\xdc\x7e\xdf\x7d\x14\xb0\xd5\x10\xc4\
-\x5a\x4c\x59\xe2\xcb\xb2\xa1\xfd\xca\x2c\xab\x00\x60\x38\xac\xba\
-\x06\x15\x05\xe5\x68\x54\x4d\x19\x0e\x60\x20\x56\x80\x08\xbf\x97\
-\x96\x57\x02\x26\xd2\x9a\x4c\x59\x00\x28\x10\xa8\x35\xbd\x08\x71\
-\xd4\x98\x54\x47\x02\xac\xd6\xf8\xa1\xbd\xb9\x58\x04\x7a\x68\x47\
-\x29\xc3\x52\x75\x82\x53\xd0\xf2\x68\xbf\x5f\x7a\x23\x04\xd0\xab\
-\xc1\x41\x6b\xff\x00\x00\x46\x0d\xfb\x94\x16\x60\x04\x8e\xc1\x03\
-\x1f\x7f\xe2\x09\x36\x06\x83\xb6\xcd\xfa\xd7\x81\x0f\x4d\xb7\xe5\
-\x14\x00\x5e\xca\xf5\x29\xe0\x7f\x06\xfe\x8d\xd0\x6d\x16\xf8\xd8\
-\x47\x3f\xca\x9e\xe5\x65\xae\xbe\xe1\x06\x86\xfd\x7e\xe5\x0b\x07\
-\x41\xf0\x41\x68\x45\xf3\x5b\x6b\x71\x59\x86\xcb\x32\xca\xe1\xb0\
-\x16\x08\x57\x96\x50\x14\x15\x08\x48\x93\xd1\xb2\xac\xb4\x7d\x70\
-\x05\x4c\xe8\x82\x23\xc0\x20\x9a\xd1\x85\x70\x64\xa6\x66\x16\x08\
-\x0f\x50\xf7\x0f\x0c\x00\xa1\xc7\x78\x95\x50\x95\x30\x2b\x20\x90\
-\xf3\x4c\x38\xee\x75\xf7\x61\xa5\xf5\xe5\x26\x39\xfe\x5e\x01\x01\
-\xd2\x1c\x45\xdc\x80\xd0\x24\xc5\x44\x59\x80\xf5\xe4\x9f\xa0\xf5\
-\xe5\x7a\x66\x59\xc6\xc7\x9e\x7c\x92\xe7\x2e\x5c\xa0\x93\xfe\x1d\
-\x7e\x0b\xf8\xfb\xd3\xed\x38\x05\x80\x97\x63\xfd\x02\x70\x0b\xf0\
-\xa3\x12\x15\x28\xbd\xe7\x03\xef\x7f\x3f\x33\xf3\xf3\x1c\xb8\xea\
-\xaa\x1a\x04\x8c\x73\xb5\x19\xec\xca\xb2\x6e\x21\xe6\xb2\x0c\x17\
-\xea\x05\x7c\x59\x52\x0e\x87\x95\xd0\x77\x3a\xf8\xd1\xa8\x7a\x2c\
-\xd6\x43\x88\x0a\xc8\x60\x12\xe3\x7d\xcd\x0d\x48\xe2\x90\xdc\x3b\
-\x69\xd5\xad\x06\x98\xd4\x7d\x02\x83\x2b\x20\x82\xec\xe4\x1c\x69\
-\x61\xce\x56\x39\xb2\x44\x02\x9c\x8e\x6c\x04\x6d\x2d\x64\xa7\x55\
-\xe5\xcd\x3e\x08\xb7\x0f\x9a\x1f\xe5\xf7\x13\x4c\xfe\xba\xff\x9f\
-\x72\x13\xe2\xe9\x3f\x06\xe8\xe4\x39\x9f\x39\x71\x82\xcf\x3f\xfb\
-\x6c\xdb\x26\x7d\x06\x78\x0f\xd3\x99\x7f\x53\x00\x78\x19\xd7\x8f\
-\x01\x37\x03\xef\x12\x3e\x60\x7d\x30\xe0\x77\x7e\xf3\x37\x79\xeb\
-\xdb\xdf\xce\x9e\x7d\xfb\x18\x0d\x06\xb5\x49\x4d\x96\x61\xca\xb2\
-\xf6\x8b\x5d\x9e\xe3\x8b\xa2\xbe\xcf\xf2\xbc\x1a\x28\x52\x14\xf8\
-\x00\x0a\x14\x45\x35\x70\xb4\x28\xb0\xce\x6d\x45\x05\x64\x4c\x99\
-\x3c\x0f\x49\x43\xba\xb1\xa7\x09\xc3\x32\x3d\xd5\x80\x13\x61\xfd\
-\x9d\xf7\xf5\x24\xdd\xba\x39\x69\x38\xdf\x29\x60\x20\x08\xa8\x44\
-\x16\xb4\xe0\xbb\x20\xe0\x72\xaf\x5d\x9e\x9a\x4f\x50\xc2\x8f\x16\
-\x76\xc5\x13\x34\xb2\x18\x03\x00\x74\xb2\x8c\x47\x4f\x9d\xe2\x13\
-\x4f\x3c\xd1\x56\xcf\x30\x00\xbe\x9b\xe9\xc8\xaf\x29\x00\xbc\xcc\
-\xcb\x01\xdf\x0b\x2c\x13\xa6\x09\xe5\xc0\xc5\xf5\x75\x7e\xe7\x37\
-\x7e\x83\xb7\x7e\xdd\xd7\x31\xbf\xb4\x54\x47\x06\x6a\x66\x3f\xcb\
-\xf0\x59\x86\x2d\xcb\x5a\xd0\x05\x04\x7c\x59\x56\x13\x6e\x3a\x9d\
-\x66\x82\x90\xcc\x01\x88\xac\x01\xa3\x06\x95\xc4\x96\x00\xd2\xc2\
-\xdc\x39\xba\x01\x1c\x1a\x2d\xb9\xc3\x2a\x83\xf0\xc7\x8d\x49\x4c\
-\x28\x54\x92\xd0\x9e\x53\xc2\x5f\xb7\x3b\x57\x5d\x8d\xa4\x1d\x9a\
-\x6e\x7d\x26\xe4\xa0\xbc\x17\x52\x13\xc0\x56\xde\x40\x0d\x56\xde\
-\xd3\xc9\x73\x9e\x3a\x73\x86\x0f\x3f\xfa\xe8\x16\xbf\x31\xbe\xfe\
-\x0c\xf0\x9b\xd3\xed\x37\x05\x80\x57\xc2\xba\x04\x7c\x3b\x55\xa2\
-\xd0\x7d\x00\x1d\xaa\x82\xa1\xf7\xfe\xda\xaf\xf1\x96\x77\xbe\x93\
-\xd9\x85\x05\xca\xe1\xb0\x0a\xe3\x05\x3f\xdf\x64\x59\x35\x60\x23\
-\xcf\x6b\x33\xbf\xd6\xfe\x9d\xce\xd6\xb1\x60\x01\x10\xdc\x81\x5a\
-\xf8\xc3\xbd\x84\x05\xd1\xee\x80\x84\x03\xf5\x08\x33\x79\x1e\x80\
-\x61\x6c\xee\x80\x0a\xfd\x79\x05\x06\x8d\xfb\xa0\xe5\xeb\x4c\x40\
-\xe1\x07\xa4\xe9\x69\x24\xf8\xb5\x1b\x90\x48\x73\x6e\x54\x36\x86\
-\xe3\xdd\x3c\xe7\xc4\xf9\xf3\xfc\xfe\x67\x3f\x8b\x4b\xf7\xf8\x07\
-\xf8\x11\xe0\x5f\x4c\xb7\xdd\x0b\xb3\x8c\xf7\xfe\x45\x7b\xf3\x1f\
-\x37\xe6\x4b\xe9\x5a\x5e\x4d\xd5\x3b\xe0\x26\x39\x30\x02\x0e\xee\
-\xdd\xcb\x9b\xdf\xf1\x0e\x16\x57\x56\x28\xfa\xfd\x60\x37\x54\x23\
-\xbe\x08\x37\x1f\x04\xdc\x07\xa1\xf6\xc1\xe4\xf7\x41\xeb\x7b\xa5\
-\xf9\xe5\x58\xec\x02\xc8\xeb\x92\x23\xa0\x05\xde\x48\x91\x91\x08\
-\xbf\x8a\xf7\xd7\xb3\x01\xa2\xf8\xbf\xae\xf0\xf3\x3a\xfc\x17\x35\
-\x36\xd5\xcf\xe5\x71\x3d\xe8\x53\xdc\x07\x3d\xd9\x58\x55\x0c\xd6\
-\x95\x90\xc1\xec\x7f\xf2\xf9\xe7\xf9\xc0\x67\x3e\xc3\x60\x34\x6a\
-\x8b\xf7\xff\x2d\xe0\x2f\x7f\x49\xfa\x9a\x2f\x92\x9c\x4e\x01\xe0\
-\x85\x5d\xaf\x09\x20\x70\x44\x83\xc0\xca\xee\xdd\xbc\xe5\x1d\xef\
-\x60\xef\x55\x57\x31\xea\xf7\xeb\x59\x81\x84\xe4\x1e\xb9\x17\x2b\
-\x00\x01\x82\xf0\x58\x04\x9d\x84\x0b\xa0\x13\x85\x6a\xf3\x5f\x08\
-\xc2\x00\x36\x46\x99\xd8\xc2\x0b\x34\x04\x91\xc4\xe4\x20\xad\xfd\
-\x55\x1f\x03\xaf\xc2\x7f\xfa\x35\xaf\x2b\x1d\x95\x56\xaf\x8f\x69\
-\x6d\xaf\x46\xa9\x43\x95\x38\xf4\xe8\xb3\xcf\xf2\x81\x47\x1e\xa1\
-\x4c\x97\xf8\x02\xfc\x35\xaa\x6c\x3f\xa6\x00\x30\x05\x80\x57\xf2\
-\x7a\x1d\x55\xcd\xc0\x01\x39\x50\x00\xbb\xe6\xe7\x79\xcb\x3b\xde\
-\xc1\x91\xeb\xaf\xaf\xa2\x03\x1a\x04\x04\x08\x12\xb7\x3a\x02\x20\
-\x49\x41\x5a\xfb\x0b\x08\x84\x73\xac\x9a\x55\x88\xe6\x06\xb6\x7e\
-\xec\x86\xbf\xdd\x98\xf8\x13\xe7\x08\x28\x8b\xa0\x1e\x0d\x26\x3e\
-\x3f\x51\x23\x53\x6d\x3d\xb0\x95\x8e\xec\xd4\x7b\x3b\xf5\xff\x6b\
-\xd2\x91\x2a\xfc\xf8\xe9\x27\x9e\xe0\x0f\x3e\xf7\xb9\x36\x9f\x7f\
-\x08\xfc\x05\xe0\x1f\x7d\x49\xb3\xcd\x53\x00\xb8\xe2\x40\xe0\x3f\
-\x68\x4b\xa0\x00\x66\x7b\x3d\x5e\xff\x96\xb7\x70\xd3\x3d\xf7\x54\
-\xe1\xb7\xd1\xa8\xc9\xda\xeb\xe6\x20\x5a\xe8\x95\xb9\x8f\x8e\xfd\
-\x47\x8f\x51\x44\xa0\xd5\x20\x20\xa5\xbc\xf2\x9e\xd6\x36\xc1\x47\
-\xaa\x03\x05\x08\x44\xe3\x4b\x93\x12\x0d\x0e\x21\x8b\xb0\x76\x15\
-\x14\xaf\xe0\x62\x2b\x42\x69\x79\x1f\x8d\x1c\xcb\x8c\xa1\x70\x8e\
-\x8f\x7c\xf6\xb3\x7c\xe2\xc9\x27\x1b\xf5\x07\x6a\x3d\x09\x7c\x1f\
-\xaa\x2d\xdb\x14\x00\xa6\x24\xe0\x95\xb0\x3e\x08\xbc\x03\xf8\x4f\
-\xc0\x71\xb9\xd0\xfd\xc1\x80\xdf\xfa\xd5\x5f\xe5\xf9\x93\x27\xb9\
-\xff\x2b\xbf\x92\xde\xfc\x3c\x45\x08\x13\xd6\x82\x2f\x9a\x52\x55\
-\xff\x8d\x3d\x16\x73\x5f\xdc\x05\x65\xf2\x27\x09\xc0\x68\xee\x9f\
-\x36\xfd\x4d\xc8\x19\xa8\x0b\x8a\x64\xa0\xa9\xe6\x0a\x60\x6b\x32\
-\x70\x24\xe0\x71\x3a\x32\x84\x31\xe6\x72\x7e\x88\x42\x78\xf5\xfe\
-\x9d\x2c\xe3\xe2\xda\x1a\xbf\xfb\xc9\x4f\xf2\xe4\x99\x33\xe4\x24\
-\x43\x7d\xef\xa3\x8a\xb0\x4c\x47\x7b\xbf\x88\x6b\x0a\x00\x2f\xde\
-\xfa\x18\xf0\x76\xe0\xdf\x01\xb7\xc3\x56\x2e\xfe\x47\x3f\xfa\x51\
-\x9e\x3f\x75\x8a\x37\xbd\xe3\x1d\x1c\xb8\xe6\x1a\x8a\xe1\x10\xaf\
-\x42\x77\x9a\xb9\x47\x9b\xf1\x7a\x88\xa7\x22\xfa\xc4\x0d\xb0\xe2\
-\xe7\x2b\x20\x31\xaa\xcb\x50\xc3\xfc\x57\xef\xd7\x70\x01\xf4\x48\
-\x73\x75\x5c\xfe\x67\x0c\x04\x22\xe0\xa2\xe5\x7d\xc8\x58\xac\xc1\
-\xc4\xb9\xca\x9d\x70\xae\x4e\x19\x7e\xec\xc4\x09\x3e\xf0\xe9\x4f\
-\x73\x71\x73\x33\x95\xe1\xb7\x01\xfc\x5d\xe0\xef\x00\x9b\xd3\x6d\
-\xf4\xe2\xae\xa9\x0b\xf0\xe2\xaf\xfd\x54\x75\xea\xef\x02\xba\x9a\
-\x1c\x9c\xef\xf5\xb8\xff\x2d\x6f\xe1\xd6\x07\x1f\x24\xeb\x76\xab\
-\x50\x61\xd0\x86\xba\xdd\x57\xdc\x14\xa4\x2e\x0a\xd2\x9a\x3e\xf4\
-\x11\xb0\x02\x0e\xba\x1e\x40\x59\x18\x0d\xff\x3f\x2a\x2b\x8e\xab\
-\x0b\xbd\x4a\x19\xf6\x12\xad\xa0\x6a\x63\xe6\x43\x0b\xb3\xfa\x58\
-\xe0\x2b\x9c\x02\x85\xfa\x75\xef\xc9\xb3\x8c\xb5\xb5\x35\x3e\xf4\
-\x99\xcf\xf0\xe9\x27\x9e\xa8\xaa\x06\xc7\xaf\xd5\x6f\x00\x3f\x08\
-\x3c\x32\xdd\x36\x53\x17\xe0\xd5\xb2\x4e\x53\x95\x10\xbf\x0e\xb8\
-\x5e\x0e\x76\x94\x4b\xf0\xf8\x67\x3e\xc3\xeb\xbf\xe6\x6b\x38\x78\
-\xdd\x75\x38\xe7\x70\xa1\x6f\x00\xca\xa4\x4f\x01\x43\xdd\x27\x40\
-\x08\x40\x5d\xeb\xaf\x53\x84\x15\x70\x48\x83\x91\x3a\x04\xa7\xc6\
-\x80\x1b\xb6\x7a\x14\x7a\x01\x12\x95\x56\x2c\xa1\xcb\x86\x80\x7b\
-\x5f\x71\x05\xfa\xbd\x15\xe3\xdf\xc9\x73\xca\xcd\x4d\x3e\xf7\xcc\
-\x33\xfc\xc1\xc3\x0f\xf3\xfc\xda\x1a\x9d\xb4\xf0\x03\x2c\x06\xab\
-\x29\x47\x0d\x67\x9d\xae\xa9\x05\x70\xa5\xba\x57\x5f\x4b\x95\xb2\
-\xfa\x95\xc0\x42\xdb\x89\x43\x60\x36\xcb\xb8\xfd\xfe\xfb\xb9\xfb\
-\xcd\x6f\x66\xcf\xc1\x83\x14\x65\x59\x01\x81\x2a\xd9\xb5\x8a\xa8\
-\xb3\x31\x28\x48\x9d\x7e\xd0\xf4\x75\x85\x20\x2a\xd5\x56\x17\x09\
-\xc5\xda\x3f\x68\x6a\xaf\x73\x13\xb4\x0f\x2f\x82\x1f\x78\x07\x2d\
-\xf8\x4e\x72\x17\xd4\x2d\x03\xb2\xa2\xe0\x89\xf3\xe7\xf9\xa4\x73\
-\x3c\xf1\xa1\x0f\xb1\x71\xf6\x2c\x33\x9a\x20\x6c\xbf\x76\x03\xe0\
-\xd7\xa9\x8a\xad\xfe\x1b\x6a\x38\xcb\xd4\x02\x98\x02\xc0\x2b\x7d\
-\x2d\x00\xdf\x4a\xc5\x5e\xdf\x3f\xe9\xc4\xd4\x98\xae\x5d\x0b\x0b\
-\x5c\xff\xc0\x03\xdc\xf9\xfa\xd7\xb3\x7c\xf8\x30\xa5\x73\x94\xd2\
-\x49\x48\x69\x78\x1b\x8d\xdc\x42\x95\x05\xa7\xc6\x7c\x8d\x85\x00\
-\x95\xdf\x2e\x16\x81\x0f\x5c\x82\x57\x5a\xbe\xce\x4f\xd0\x9a\x5f\
-\xb2\x14\xc3\xf9\x02\x00\x38\x57\x35\xf1\x28\x0a\x9e\x3a\x73\x86\
-\xf7\x9d\x3c\xc9\x87\xd7\xd6\x28\x76\xed\xe2\xf0\x81\x03\x74\xcf\
-\x9c\xe1\xc2\x47\x3f\x4a\xbe\xb1\xc1\x7c\x40\x48\xbf\x3d\x18\x3c\
-\x42\x35\xa1\xe9\xdf\x52\x8d\xfb\x9e\x02\xc0\x14\x00\x5e\xb1\x82\
-\xff\x3f\x01\x7f\x9a\xaa\x4a\x70\x5b\xa1\xef\x18\x43\x17\xe8\x86\
-\xb0\xdc\xba\xf7\x9c\xf7\x9e\x3e\xb0\x7b\x7e\x9e\xbb\xef\xbf\x9f\
-\x7b\xbe\xec\xcb\xd8\x7f\xec\x18\x1e\xaa\xce\x41\x11\x60\xd4\x69\
-\xb6\x09\xc1\x1f\x7b\x1c\x95\x09\xeb\x44\xa4\x86\xe6\x77\xae\x0a\
-\xef\x05\x61\x97\xe3\xbe\x2c\xb7\xb4\xbe\x54\x2a\x06\x37\x21\xb7\
-\x16\x37\x1c\xf2\xd8\xb3\xcf\xf2\x5b\x8f\x3d\xc6\x87\x2e\x5e\xa4\
-\x9f\xe7\xcc\xf5\x7a\x74\xc2\xc4\xe4\x85\x95\x15\xe6\x76\xed\xe2\
-\xf9\x4f\x7e\x92\x73\x8f\x3c\xc2\x1e\x60\x0f\x30\xab\x5c\x02\xd7\
-\x7e\x7d\x37\x81\x5f\x0b\x56\xc1\xaf\x7c\xa9\x11\x84\x53\x00\x78\
-\xe5\xae\x59\xe0\xbb\x82\xe0\xdf\xda\x26\xf4\x52\x6b\xdf\x31\xa6\
-\x1a\x75\x15\x66\xde\x1b\xef\xd9\x74\x8e\x75\xef\xe9\x7b\x5f\xb5\
-\x0c\x0f\x6e\xc1\x00\x58\xec\xf5\xb8\xe3\xde\x7b\xb9\xfb\xf5\xaf\
-\xe7\xe8\x8d\x37\xd2\xdb\xb5\xab\x76\x0f\x6a\x8e\x40\x0d\xe1\xd4\
-\x25\xb5\xf2\x5c\x34\xbf\x49\x24\xff\x10\x7c\x7e\x82\x46\xf7\x21\
-\xef\xc0\x2b\xad\x5e\x6b\x7c\x01\x84\x70\x4e\xe6\x3d\x99\x73\xac\
-\x5e\xba\xc4\xa7\x1f\x7b\x8c\xf7\x3d\xfa\x28\x1f\x3a\x7d\x9a\xcd\
-\x2c\x63\x7e\x76\x96\x5e\x10\xfe\xbc\xd3\x21\x0b\x53\x94\xf3\x5e\
-\x8f\xe5\x43\x87\xd8\x38\x7f\x9e\x47\xde\xfb\x5e\x5c\xbf\xcf\x22\
-\xb0\x64\x0c\x0b\xde\x33\x4b\x7a\xe4\x78\xb4\x1e\xa6\x8a\xae\xfc\
-\x02\xf0\xd9\x29\x00\x4c\x01\xe0\xe5\x5a\xdf\x40\xd5\x0f\xe0\xde\
-\x49\x82\x9f\x1b\xc3\x8c\xb5\xcc\x06\xc1\x97\x30\x5a\xe9\x3d\x83\
-\xb2\xa4\x1f\x92\x68\x0a\xaa\xe6\x1c\x72\xef\x02\x08\xf4\x03\x69\
-\x78\xcd\x35\xd7\x70\xdb\xdd\x77\x73\xcb\x5d\x77\xb1\xf7\xea\xab\
-\x99\x99\x9f\xaf\xa6\xf9\x28\x73\xde\xc6\x05\x37\xf1\xe3\x38\x04\
-\xa8\x98\x7d\x6d\x01\x34\x04\x5e\xe5\x1f\x58\x63\x30\x83\x01\x1b\
-\x1b\x1b\x9c\x38\x71\x82\x3f\xf8\xfc\xe7\xf9\xc0\x67\x3e\xc3\xe7\
-\xce\x9e\xa5\x08\x82\xdf\xed\x76\xe9\xe4\x39\x79\xb7\x4b\xde\xeb\
-\xd1\xed\x76\xab\xc7\xdd\x6e\xdd\xff\x6f\x61\x79\x99\x6e\xaf\xc7\
-\xe7\xdf\xff\x7e\xce\x3f\xf3\x0c\x5d\x63\xc8\xa9\xba\xad\x2e\x01\
-\x73\xde\xd7\x21\xc2\x09\x3b\x74\x8d\x6a\x0a\xf0\xbf\xa2\x9a\xe0\
-\x54\x4e\x01\x60\x0a\x00\x2f\xc5\x7a\x43\x10\xfc\xaf\x4e\xbd\x28\
-\x2d\xb6\x7a\x59\xc6\x6c\x9e\x33\x6b\x6d\xed\x9f\xbb\x60\x5e\x7b\
-\xe7\x18\x95\x25\x45\x10\x78\xa7\x84\x5f\x6e\x5e\x81\x81\x58\x04\
-\x00\x2b\x87\x0f\x73\xd3\x2d\xb7\x70\xed\x2d\xb7\x70\x6c\xff\x7e\
-\x56\x8e\x1c\x61\xb6\xd7\xa3\x33\x37\x07\x79\x5e\xd5\xf9\x4b\xbe\
-\x3f\xd1\xc4\x20\x1d\x3e\x0c\xa0\x21\xda\xdf\x48\xd7\x21\xc9\x18\
-\x94\xf3\x86\x43\x46\x1b\x1b\xac\xae\xae\xf2\xf4\xd3\x4f\xf3\xc8\
-\xe9\xd3\x7c\xf6\xd9\x67\x79\x72\x7d\x9d\xd5\x7e\xbf\x02\x8d\xc1\
-\x80\x62\x30\xa8\x89\xcb\x2c\x68\xfe\xee\xcc\x0c\x9d\x20\xfc\x9d\
-\x6e\x97\x3c\x1c\xb7\xd6\xd2\x9b\x9f\x67\x69\xdf\x3e\x9e\xf9\xf0\
-\x87\x79\xf2\x63\x1f\xa3\x1b\xf8\x8c\x3c\xb8\x46\x0b\xde\x33\x07\
-\xf4\x24\x42\x31\xf9\x37\xf9\x3d\xe0\x67\xa8\x32\x30\xcf\x4f\x01\
-\x60\x0a\x00\x2f\xc6\x3a\x0a\xfc\x15\xe0\x8f\x11\x85\x50\xb5\x99\
-\x3f\xdf\xe9\xb0\xd0\xed\xd6\xda\xde\x09\x81\x06\x95\x26\x2d\x8a\
-\x8a\xdc\x53\xc2\x2e\x1a\xbf\x88\x80\xc0\x01\x66\x66\x86\xee\xf2\
-\x32\xbd\xfd\xfb\xe9\xec\xde\x8d\x9d\x9d\xa5\xb0\x96\x72\x34\xa2\
-\x93\x65\xcc\x74\xbb\x1c\x9c\x9d\x65\xef\x91\x23\xec\x9b\x9d\x65\
-\xff\xca\x0a\xf3\x87\x0f\xd3\xcd\xf3\x8a\x5f\xc8\x32\xe8\x74\x2a\
-\x40\xe8\x74\xc4\x37\xa8\x4d\x7f\x06\x83\xea\x7e\x38\x84\xd1\x88\
-\x61\x59\xd2\xdf\xd8\xe0\xd2\xd3\x4f\xf3\xcc\xc5\x8b\x9c\xb8\x70\
-\x81\x13\x4f\x3f\xcd\xe3\x1b\x1b\xac\xf7\xfb\x6c\x3a\x57\x0f\xf1\
-\xa8\x87\x7e\x78\x8f\x2b\x4b\x46\x83\x01\xc3\x8d\x8d\x3a\xb9\x29\
-\xef\x74\xc8\xbb\xdd\x26\x10\xf4\x7a\xe4\x79\x4e\x9e\xe7\x98\x2c\
-\x63\xe5\xc8\x11\x4e\x7d\xe6\x33\x3c\xfa\xbe\xf7\x91\x05\x37\x49\
-\xba\x10\x77\x82\x8f\x35\xe7\x3d\xbd\x9d\xed\xd5\x27\x80\x9f\x05\
-\xfe\x25\xd5\x9c\xc0\x29\x00\x4c\x01\xe0\x05\x59\xdf\x43\x35\x17\
-\xe0\x58\x4a\xf0\x33\x63\x58\xe8\x76\xd9\xd5\xed\x56\x42\x07\x94\
-\xce\x55\xc2\x1f\x32\xe8\xf2\xa2\x20\x2b\x0a\x9c\xf7\x8c\x12\x42\
-\xdf\xb8\x19\x83\x5d\x5a\x62\xee\xf0\x61\x66\x0e\x1e\xa4\xb3\xb4\
-\x04\xdd\x2e\xce\x7b\xca\xb2\xa4\x0c\xc0\x52\x84\xdb\xb0\x2c\x29\
-\x47\x23\xac\x08\x5d\xa7\xc3\x6e\x63\xd8\x3d\x33\x43\x6f\x76\x96\
-\xee\xdc\x1c\xa6\xdb\x25\x5f\x5a\x22\x0b\x8c\xe5\x45\xc0\x15\x05\
-\xc3\xb3\x67\x71\x45\xc1\xe6\xea\x2a\x1b\x1b\x1b\x9c\xde\xdc\xe4\
-\x6c\x51\x30\xea\xf7\xd9\x1c\x8d\x18\x78\x4f\x96\xe7\x75\xca\x6e\
-\x3d\x3f\x40\x57\x19\xaa\x8e\x3f\x84\xcf\x38\xdc\xd8\x60\xb0\xb1\
-\x01\xce\x6d\x81\xc0\xcc\x0c\x1d\xe1\x06\x02\x10\x58\x6b\x59\x3c\
-\x70\x80\xcd\xe7\x9f\xe7\xd3\xbf\xfe\xeb\x94\x83\x01\xbd\x30\x5d\
-\x29\x0b\x48\xdb\x31\x86\x5e\x00\x81\x2c\xdd\x1d\x38\x5e\xcf\x50\
-\x8d\x09\xfb\x97\xbc\x0a\xe6\x05\x4c\x01\xe0\xe5\x5b\x77\x53\xd5\
-\xa1\x7f\x75\x2c\xf8\x2e\x6c\xcc\xa5\xd9\x59\x96\x66\x66\xe8\x18\
-\x53\x69\x76\x15\x32\x13\x73\xbf\x5b\x14\x74\x47\xa3\x86\x8f\xaf\
-\x6f\xda\x12\xe8\x2c\x2f\x33\x77\xcd\x35\xcc\x1d\x39\x42\xb6\xb0\
-\x80\x53\xef\xeb\xbc\xdf\xba\x0f\xfd\xfc\xe4\xff\x95\xde\x53\x04\
-\x4d\xec\xbc\xaf\xc1\xa1\x0c\xb1\x7a\x01\x0f\x1f\x84\x68\x24\xa9\
-\xbd\xaa\x0f\x40\x2a\x82\xa0\x39\x83\xda\x92\xd1\xc9\x43\x21\x0f\
-\xc1\x42\xa3\xf5\x97\x0d\x56\xca\x70\x73\x93\xe1\xc6\x06\x18\x43\
-\x77\x66\xa6\x02\x82\x5e\xaf\xba\x75\xbb\x64\x12\x25\xd8\xb3\x07\
-\x8a\x82\x3f\xfc\x4f\xff\x89\x72\x63\xa3\x06\x81\x4e\xb8\xce\xf5\
-\xbd\xf7\xe4\x12\x92\x84\xed\xc0\xe0\x71\xaa\xd4\xe2\x9f\xbe\x92\
-\x39\x82\x29\x00\xbc\xf4\x6b\x06\xf8\x61\xe0\xcf\x03\xbb\xf4\x0b\
-\x65\xd0\x4c\x7b\xe6\xe6\xd8\xbb\xb0\x40\xd7\xda\x5a\x40\x8b\x10\
-\x2a\xab\x9b\x70\x7a\xcf\xfc\x60\x40\x77\x34\x6a\x08\x79\xa9\x2c\
-\x00\xb1\x06\xb2\x5d\xbb\x98\xbf\xfe\x7a\xe6\x8e\x1f\x27\xdf\xb5\
-\xab\xb2\x0e\x44\x80\x45\xe8\x03\xe9\x57\x2a\x00\x70\x1a\x10\xe4\
-\x7f\x87\xf3\xe4\x33\xe8\x7b\x7d\xd3\x29\xbf\x52\xd1\xa7\x9f\xd7\
-\x15\x7d\x89\xe7\x75\x8d\x40\xbc\x87\xa4\xcb\x6f\xe8\xf1\x6f\x02\
-\x10\xf4\xd7\xd6\x28\x47\x23\xb2\x3c\xa7\x3b\x3b\x5b\x83\x41\x1e\
-\xb8\x01\x6b\x2d\x73\x4b\x4b\x64\xc6\xf0\xa1\x5f\xfc\x45\x5c\x00\
-\x81\x0e\xd4\x24\xa1\x84\x4e\x3b\xc6\x90\x05\x10\x28\x76\x06\x04\
-\xef\x03\xfe\x57\xaa\x76\xee\x53\x00\x98\x02\xc0\xc4\x75\x3f\x55\
-\xbb\xe9\xd7\xc7\xe4\x1e\xc0\x9e\xd9\x59\x0e\x2d\x2d\x31\xdf\xed\
-\x52\x94\x25\x45\x59\x56\x00\x10\x4c\xf3\x7a\x53\x7a\xcf\xd2\x60\
-\x40\x77\x38\x1c\x13\x7c\xfd\xdc\x77\x3a\xcc\x1e\x3b\xc6\xae\x5b\
-\x6e\xa1\xb3\x6f\x5f\x2d\xbc\x22\xf8\x65\x10\x4c\xad\xf9\xcb\xa0\
-\xbd\x9d\x80\x43\x88\x2a\xf8\xc0\x2d\x48\x67\x60\x01\x01\xa7\x04\
-\x5d\xac\x12\x2d\xec\x2e\x12\x7a\x01\x87\x18\x24\x24\x8f\xc0\x45\
-\x96\x40\x6a\x72\xb1\x58\x05\x36\x98\xf9\xd6\x18\x86\x9b\x9b\x0c\
-\x36\x36\x30\x62\x0d\x04\x20\xc8\x83\x5b\x60\xac\x65\x7e\x69\x09\
-\x6b\x0c\x1f\xf9\xc5\x5f\xc4\xad\xad\x31\x13\x26\x03\x8b\xe0\x8b\
-\x35\xd0\x33\x86\x5e\xf8\x0c\xfd\xb2\xa4\xaf\x3b\x1f\xa5\xd7\x30\
-\x58\x03\x7f\x43\x71\xaa\x53\x00\x98\x02\x40\x63\xfd\xc5\x40\xf4\
-\xcd\x6b\x73\xbf\x04\x96\x66\x66\xb8\x7a\x79\x99\x3d\x73\x73\x38\
-\xe7\x18\x16\x45\x25\xf4\x41\x58\xf5\x63\xef\x1c\xbb\x37\x37\x99\
-\x1d\x8d\x18\x46\x4c\xbf\x06\x80\x7c\x65\x85\x5d\xb7\xdf\xce\xdc\
-\xf1\xe3\xd0\xed\x6e\xf9\xf7\x41\xd0\xbd\x00\x80\x16\x7c\xd1\xe0\
-\x91\x80\x97\x41\xe8\x4b\x65\x81\x68\x17\x41\xdc\x04\x5d\xe4\xa3\
-\x81\xc1\x47\x20\x41\xa2\xad\xf8\x58\xe1\x50\xa2\x80\xa8\xe6\x06\
-\x02\x10\xd4\x93\x81\xb3\x8c\x2c\x44\x29\x06\x6b\x6b\xb8\xa2\xa8\
-\xb8\x81\xb9\x39\x7a\xb3\xb3\x15\x08\x74\xbb\x64\xc6\x30\xbb\x7b\
-\x37\x99\x31\x7c\xf8\xdf\xfc\x1b\xd8\xd8\xa0\x97\x65\xb5\x15\xd0\
-\x95\x04\xaa\x70\x3f\x13\x40\x61\xe8\x1c\x97\x8a\x82\x7e\x54\x03\
-\x91\x58\xbf\x4d\x35\xd7\xe1\x33\x53\x00\x98\x02\x80\xac\xe3\x54\
-\x5d\x67\xde\xa1\x0f\x16\x54\x71\xfc\xe3\xfb\xf6\x71\xf5\xca\x4a\
-\xa5\xc5\x46\x23\x8a\xc0\xe4\x17\x65\x49\x59\x14\x95\x70\x96\x25\
-\x45\x10\xda\xbd\x6b\x6b\xb5\xd9\x5f\x2a\x00\xa8\x19\xff\x2c\xa3\
-\x77\xfc\x38\x4b\xf7\xdc\x43\xbe\xb2\x32\xe6\xcb\x97\x4a\x60\xc7\
-\xcc\xfc\xe8\x56\xaa\xd7\xb5\xb6\xd7\x6e\x83\x57\x60\x52\x57\xf7\
-\x29\x4d\xde\xb0\x10\x54\x01\x10\x0a\x08\x74\x8d\x3f\xca\x65\xa8\
-\x33\x07\xb5\x45\x10\x1e\xd7\xf9\x07\x6a\x28\x68\x96\xe7\x18\x63\
-\x18\x6d\x6e\x32\x1c\x0c\xc8\xf2\x9c\xde\xfc\x3c\x3d\xe1\x06\xba\
-\xdd\xca\x1d\xd8\xb3\x07\xe3\x1c\x1f\xfb\xf9\x9f\xc7\xad\xaf\x33\
-\x93\xe7\x95\xe6\x17\xe1\x0f\x00\xd0\x0b\x79\x16\xdd\x60\x71\x5c\
-\x18\x8d\x38\x33\x1a\x6d\x4d\x3c\x4a\xaf\x93\x54\xdd\x85\xff\xfd\
-\x97\x32\x00\x58\xa6\x0b\xe0\xeb\x81\xff\x57\x0b\xbf\x08\xeb\xbe\
-\x85\x05\x5e\x7f\xd3\x4d\xbc\xe6\xe8\xd1\xaa\xb2\x4d\xb4\x8b\x22\
-\xcc\x64\x9a\x8d\x0f\x03\x36\x0f\x6e\x6c\xb0\x30\x1a\xd5\x5d\x6e\
-\x2c\x6a\xaa\x2e\xd0\x99\x9d\x65\xf9\xb5\xaf\xe5\xc0\x9b\xde\xc4\
-\xec\xfe\xfd\xd5\x64\x1c\x68\x0c\xc5\xcc\xe5\x5e\x0d\xcd\x94\xc1\
-\x99\xf5\x44\xdd\x70\x9e\x9c\x2b\xe7\xd4\xaf\x87\xf3\x3b\x72\x8e\
-\x4c\xdf\x8d\xcf\x55\x53\x78\x33\xf5\xbe\x72\xcc\xaa\xe3\xf5\xd0\
-\x4e\x79\x1c\xbe\x7f\x16\xbe\x83\xce\x4a\x6c\x00\x42\x68\x61\xe6\
-\x8a\x82\xb2\x28\xf0\xde\xd3\x9b\x9f\x67\x76\x61\x01\xe3\x3d\x45\
-\xbf\x4f\x31\x18\x50\x8e\x46\x75\xed\xc3\xe0\xd2\x25\x6c\xa7\xc3\
-\x3d\xdf\xfe\xed\xe4\x73\x73\x14\x21\xfb\x91\xa8\x49\xa9\x34\x1b\
-\x71\xde\x93\x01\x87\x7b\x3d\x6e\x9a\x9b\x63\x57\x96\xd5\xb3\x11\
-\x13\xeb\x10\x55\x8d\xc1\x4f\x06\x9e\xf1\x4b\x72\x7d\xa9\x97\x03\
-\x5b\xaa\xe1\x1e\x7f\x45\x5b\x8c\x05\x30\x93\x65\xdc\x7c\xe4\x08\
-\xc7\x0f\x1e\xc4\x02\x83\xc1\xa0\x4a\x7f\x95\x1e\xf8\xa8\x94\x55\
-\x35\xcb\x6e\x65\x63\x83\xb9\xc1\x80\x42\x09\xbc\x0d\x5a\xdf\x00\
-\x33\x8b\x8b\xec\x7a\xe0\x01\x66\x6f\xbc\x11\x6f\x2d\xa5\xb4\xbf\
-\x0e\x1b\x3a\xcb\xb2\xad\x2e\x3f\x52\xb2\x6b\x6d\xa3\xb9\x87\x00\
-\x8f\xb3\xb6\x9e\x03\x68\x42\x0b\x2f\x27\xf7\x54\x6d\xbc\x5d\xd4\
-\x15\xc8\x06\x4b\x43\x42\x79\x36\x44\x18\x74\x8b\x2f\xe9\xe2\x6b\
-\xc3\xfb\x69\x82\x50\xc0\x51\x3e\x73\xdc\x51\x48\x04\xd1\xaa\x81\
-\x23\xb5\x7b\x40\xd5\xc5\xa8\xe6\x18\x9c\xa3\x1b\x7c\xff\xe1\xc6\
-\x06\xa3\xcd\xcd\xad\xa1\xaa\x61\x7a\xd2\xe0\xd2\x25\xe6\x96\x96\
-\xb8\xf3\x5b\xbf\x95\x4f\xfc\xc2\x2f\x50\x8e\x46\xd5\x44\x25\x9a\
-\x85\x44\x2e\x02\x86\x5d\x79\xce\xad\x79\xce\xa9\xe1\x90\xa7\x07\
-\x03\x46\x01\x1c\x12\xeb\x87\x80\x6b\x81\x3f\x0e\x9c\x9d\x02\xc0\
-\x97\xce\x3a\x02\xfc\x33\xe0\x9d\xda\xd7\x1f\x01\x57\xed\xde\xcd\
-\xbd\x37\xde\xc8\xee\xf9\x79\x06\x83\x01\xa3\xd1\xa8\xde\x98\x4e\
-\x09\xb5\x93\xea\xbc\xa0\xf9\x0e\x5c\xba\xc4\x5c\xbf\xcf\x48\x9d\
-\xa3\x13\x84\x7a\x87\x0f\xb3\xeb\xc1\x07\xe9\x1e\x3d\xba\x55\x4e\
-\x2b\xc3\x3f\x45\xa8\xa5\xb4\x57\x9a\x6a\x4a\x9d\xbd\x98\xd1\xca\
-\x25\x10\x50\xf1\x41\x10\x05\x10\xea\x7b\xe9\x09\x60\x4c\x25\xcc\
-\x6c\x0d\xfc\xd0\xa6\x3e\xd6\x6e\x85\xd4\x94\xd9\xee\xc2\x67\x73\
-\x41\x98\xa5\xa3\x91\x80\x87\xd7\xbd\x04\x95\xc9\x6f\xc2\xfb\xe9\
-\x49\x44\xf2\x3d\xbc\x31\x75\xbd\x01\xe1\x3b\x64\xdd\x2e\x33\x0b\
-\x0b\x0c\xd6\xd7\x29\x36\x37\x2b\x37\x41\x59\x28\xfd\xd5\x55\xe6\
-\x97\x97\xb9\xf9\xeb\xbe\x8e\xcf\xfc\x87\xff\x40\xe9\x5c\x35\x4e\
-\x4d\xcd\x30\x94\x50\xa6\x7c\xfe\xd2\x7b\x72\x6b\xb9\x76\x76\x96\
-\x03\xbd\x1e\x8f\xac\xaf\x73\xb6\x28\x6a\x4b\x2c\x5a\xdf\x08\x1c\
-\x06\xbe\x13\x78\xf4\x4b\x4d\x03\x7e\x29\xae\xd7\x01\xff\x5d\x0b\
-\xbf\x04\x88\xef\xbd\xf6\x5a\xbe\xf2\xfe\xfb\x59\xd9\xb3\x87\x32\
-\x68\x5c\x19\x55\x6d\xf4\x1c\x3b\x54\x1d\xbe\x31\xec\x5d\x5d\x65\
-\x71\x73\x73\xeb\xfc\xe8\xb6\x70\xfc\x38\x7b\x1f\x7a\x88\xb9\xe3\
-\xc7\x2b\x53\x39\xbc\xa7\x55\x83\x32\x33\x35\x25\x37\xa3\x6a\x97\
-\x6d\xb3\x8c\x5c\x0f\xd3\x54\xa6\x7a\x2e\x2e\x81\x32\xd1\x63\xf3\
-\x3d\xb3\x96\x3c\x58\x27\xb5\x1b\x11\xb9\x17\xb9\x32\xed\xc7\xdc\
-\x02\x75\xbe\x1e\xe4\x69\xd5\xdf\xc4\x83\x3d\xeb\xc7\x21\x05\xba\
-\x76\x0d\xc4\x25\x90\x1e\x02\xe2\x12\x84\x4e\x48\xb3\x0b\x0b\x64\
-\x79\x4e\xb1\xb9\xc9\x68\x30\xa0\x18\x0e\x6b\x77\xa0\x7f\xe1\x02\
-\x7b\xae\xbb\x8e\x6b\xbf\xe2\x2b\x18\x4a\xd3\x12\xb6\xe6\x17\x7a\
-\x05\x86\xa8\x63\x25\xb0\x3b\xcf\xb9\x7f\x69\x89\x9b\xe6\xe6\x1a\
-\xbf\x75\x22\xf2\xf3\xeb\x61\x6f\x4c\x2d\x80\x57\xf1\xfa\x0e\xe0\
-\x9f\x02\xbb\xe5\xc0\x28\x30\xfc\x6f\xbc\xeb\x2e\xae\x3e\x7c\x98\
-\xe1\x60\x50\xcd\xf4\x13\x4d\xaf\x04\xbe\x6e\xba\x29\xbe\xae\xb5\
-\x2c\xad\xae\xb2\xbc\xbe\xde\x30\xfb\xf5\x6d\xfe\x86\x1b\x58\x78\
-\xd3\x9b\xc8\xf6\xec\xa9\x37\xb4\x55\x6d\xb4\xa5\xab\x8f\x57\xbd\
-\xfa\x9d\xea\xdd\xe7\x42\xb9\xb0\xb4\xd1\x2e\x83\x56\x8f\xbb\xfe\
-\x88\x85\xe0\xc3\x71\x89\x3a\xf8\xf0\xf7\x56\xda\x73\xcb\x79\xce\
-\x55\x56\x4d\x68\x27\xe6\xd5\x48\x71\x19\x13\x5e\x8a\xcb\x23\x44\
-\x9f\x1a\x1c\x5a\x67\x41\x2a\x6b\xa0\x51\xdf\x1f\x3e\x7f\xed\x0e\
-\xa8\xbe\x84\x42\x70\x0a\x30\x94\xc6\x60\xba\x5d\x7a\x73\x73\x14\
-\x83\x01\x45\xbf\x5f\x03\x60\x96\x65\xd8\x6e\x97\xf5\xe7\x9f\xe7\
-\xc8\x83\x0f\xe2\x36\x36\x38\xf5\x7b\xbf\x47\xa7\xd7\xab\x85\xdc\
-\x09\x27\xa0\x19\xee\xf0\xb9\x0a\xef\x99\xc9\x32\xee\xd8\xb5\x8b\
-\x7d\xbd\x1e\x7f\x78\xf1\x22\x6b\xce\xa5\x1c\xff\xeb\xa8\x4a\x8d\
-\xdf\x03\xfc\xe7\x29\x00\xbc\xfa\xd6\x5f\x45\x0d\x97\x10\x93\xff\
-\xd8\xca\x0a\x5f\xf1\xc0\x03\xec\x5e\x5a\xa2\xbf\xbe\x5e\x77\xd4\
-\x91\x91\xd8\x5a\xeb\x8b\x35\xe0\x82\xe9\xbc\xb0\xb6\xc6\xca\xc5\
-\x8b\xb5\x06\x12\xc0\x90\x0d\x38\x7f\xe3\x8d\x2c\x7c\xc5\x57\x60\
-\xf7\xec\xc1\x15\x45\x3d\x0f\x4f\x4c\xd7\xba\xab\x6e\x30\xdb\x25\
-\x9b\x4e\xd7\xf7\xeb\x9b\x0f\x3e\xba\x53\x40\xa4\x39\x86\x1a\xb0\
-\xac\xad\x27\x04\x39\x65\xb6\x37\x78\x09\x31\xd5\xc5\xb5\xd0\x6e\
-\x42\x88\x54\x64\x12\x2d\x90\xd9\x86\x8a\x03\xd0\x6e\x80\xb1\xb6\
-\x72\x69\x54\xd7\x22\xcd\x5f\x08\xb7\xe0\xa4\xcd\xb9\x10\x77\xe2\
-\x0e\x04\x40\xb0\xa1\xa8\xa9\xec\xf7\x19\xf5\xfb\x64\x59\x46\xa1\
-\xdc\x81\x4b\xa7\x4e\x71\xf5\x43\x0f\x51\x5c\xba\xc4\xc5\x4f\x7f\
-\x9a\xbc\xd7\x6b\x58\x03\x71\x19\xb1\x76\xdd\x4a\xef\x39\x36\x3b\
-\xcb\x72\xb7\xcb\x07\xcf\x9f\xe7\xd9\xe1\x90\xce\xb8\x4b\xb0\x42\
-\xd5\x7c\xe4\xfb\xa8\xaa\x0c\xa7\x00\xf0\x2a\x58\xbd\x10\xe2\xfb\
-\x3e\xcd\xf2\x3b\xe0\xde\x1b\x6e\xe0\x0d\xf7\xdf\x4f\x9e\x65\xf4\
-\x37\x36\x92\x42\xa7\xcd\x5a\xa7\xe2\xdb\xdd\xe1\x90\xbd\x67\xcf\
-\x56\x9a\x52\x09\x85\xf8\x55\xb3\x37\xdd\xc4\xc2\x5b\xde\x82\x5d\
-\x5a\xa2\x54\xc2\x2f\x02\x81\x31\xb5\xe0\x8a\x6f\x2a\x64\x96\x74\
-\xe0\xb5\xd1\x06\xf5\x31\x38\x04\x30\xc0\xfb\xda\xcf\x37\xda\x1c\
-\x56\xfe\xbf\x0b\x9a\x5c\x5b\x35\x42\xf2\x19\x05\x1a\x72\x6d\xa4\
-\x45\xb8\x03\xb2\x40\xec\xc5\xc7\x85\x9f\x70\xc1\x3a\x91\x04\x23\
-\xa3\x48\x40\xcd\x1b\xc8\x39\xa8\xf6\x65\x4e\x0d\x49\x31\xa1\x0c\
-\xb8\xd3\xeb\x51\x0c\x87\x8c\xfa\xfd\xca\x0a\x10\xd7\x24\xcf\xd9\
-\x38\x7f\x9e\xe3\x5f\xfb\xb5\x7c\xe6\xb9\xe7\x28\x2e\x5c\xc0\x75\
-\xbb\xb5\xf0\xeb\xcf\xa4\x81\x9e\x70\x3d\x46\xde\xb3\xa7\xd3\xe1\
-\x2b\x0f\x1c\xe0\x43\xe7\xcf\xf3\xf0\xda\x5a\xed\xa6\x44\xfb\xe5\
-\x67\xa9\xaa\x93\x7f\x6a\xca\x01\x5c\xd9\x6b\x05\xf8\x25\x2d\xfc\
-\xe2\x03\x3e\xf4\xba\xd7\xf1\xd6\xaf\xfc\xca\x6a\xb3\x8d\x46\x0d\
-\xdf\x3c\xd6\xfa\x26\xd6\x2a\xde\xb3\xf7\xcc\x19\x3a\xc1\x1f\x8d\
-\xc1\x62\xf6\xc6\x1b\x59\x7c\xf3\x9b\xc9\x77\xef\xae\x84\x4e\xaa\
-\xe6\xe4\xef\xc5\xcf\x56\xc3\x33\x25\x1c\x68\xc5\xff\x57\x39\xf5\
-\xb9\x0e\x09\x2a\xff\x3b\xe5\xbf\x67\xca\x67\xcf\x34\x1f\x10\xf1\
-\x03\xda\xb7\xcf\x42\xde\x7d\x9d\xc2\x1b\x92\x6e\x32\x15\xf6\x33\
-\xda\xef\x57\xaf\x59\x75\x8d\xe4\x3b\xa0\xae\xa1\x55\xfc\x40\xed\
-\xf2\xe8\x61\x28\x92\x99\x58\x96\x94\xa1\xa2\xd0\x95\x25\xdd\x5e\
-\x0f\x63\x6d\xc5\x07\x84\x10\xa1\xf7\x9e\x72\x38\xc4\x79\xcf\x4d\
-\xdf\xf6\x6d\x98\x99\x19\x0a\x65\xb9\x68\x4b\x40\xb7\x51\xd3\xbf\
-\x5f\xe1\x3d\x1d\x63\xf8\xb2\xfd\xfb\x79\x70\x79\xb9\x72\x41\xc6\
-\xf7\x4d\x46\x55\x4c\xf4\x67\xa7\x00\x70\xe5\xae\xa3\x54\x4d\x25\
-\xdf\xa1\xfd\xfd\x99\x4e\x87\x6f\xf8\xea\xaf\xe6\x81\x2f\xfb\xb2\
-\xba\x76\xbe\xb1\x51\x5a\xcc\x6f\x3d\xc7\x7e\xcf\xb9\x73\xcc\x6e\
-\x6e\x36\xcc\x6a\x01\x82\x99\xeb\xae\x63\xd7\x5b\xde\x42\x67\x65\
-\xa5\xc1\xe2\x5b\x25\xf8\xb5\x40\x29\xa1\x43\x13\x6d\x41\xc0\x72\
-\x0d\x10\xca\xa4\xd5\xef\x91\x87\xdd\x9a\xc5\xb1\x7b\x15\xff\x8f\
-\x05\x5a\xc7\xf7\x35\x99\x67\x23\x60\x90\xcf\xa7\x05\xdd\x2a\xb0\
-\x4a\x7d\x8f\xfa\x35\xb1\x66\xd4\xf1\x18\x04\xea\x54\xe3\x50\x43\
-\xe1\x8a\x02\x57\x14\x55\x6f\x81\xb2\x24\xef\x76\xc1\xfb\xaa\xcc\
-\x38\x44\x64\x00\x06\xab\xab\x64\x7b\xf6\x70\xcd\xd7\x7e\x2d\xa3\
-\x00\x08\x4e\x47\x1d\x22\xed\xdf\x00\xe9\x60\x79\x39\xef\xb9\x77\
-\xef\x5e\xbe\xf2\xe0\x41\x7a\xd6\x52\xa4\xf7\xd0\xdf\x07\xfe\xdc\
-\xd4\x05\xb8\xf2\xd6\x8d\x54\xcd\x21\x6e\x93\x03\x43\x60\x65\x6e\
-\x8e\xaf\xff\xfa\xaf\xe7\xea\x6b\xaf\xa5\xbf\xba\x5a\x0f\xd8\xb0\
-\x91\x8f\x2c\x64\x5f\x4d\x9c\xc9\x86\xb6\x96\xf9\xf3\xe7\x59\x38\
-\x7f\xbe\x71\x5c\x36\x76\xf7\xaa\xab\x98\x7f\xf3\x9b\xb1\x7b\xf7\
-\xe2\xcb\x12\x2b\x26\x7a\x70\x1d\xe4\xfd\xa4\x8d\xb7\xce\x56\x33\
-\xda\xbf\x96\xd8\xbe\xb8\x2c\x8a\x34\xd4\x1c\x83\x17\x92\x50\x4d\
-\xe3\x11\x30\x73\x6a\x84\x97\x51\x7f\x4f\x04\x58\x46\x62\xfc\xca\
-\x9c\xd7\xb1\xfe\x3a\x86\x1f\x11\x6d\xc2\x59\xf8\x88\xb4\xf4\xc1\
-\xcd\x91\x7c\x09\xc9\x05\xb0\xea\xf3\x4b\xf8\x51\x9a\x91\xca\x88\
-\x73\xc9\x5b\x28\xc2\xf7\xe8\x1a\x43\xa7\xdb\xa5\x1c\x8d\x28\x42\
-\xd6\x60\x9e\x65\x64\xbd\x1e\xfd\x73\xe7\xd8\x73\xdb\x6d\x0c\x4e\
-\x9e\xe4\xfc\x07\x3e\x40\x77\x66\xa6\x02\x82\x20\xe0\x3e\x1a\x80\
-\x2a\xae\x9b\xbe\x76\x23\xe7\xb8\x79\x79\x99\x85\x5e\x8f\xdf\x38\
-\x71\x82\x8b\x45\x91\x22\x07\xff\x9e\x02\x83\x29\x00\x5c\x01\xeb\
-\xae\x20\xfc\xd7\xca\x81\x01\x55\x7c\xff\x9b\xde\xf5\x2e\xf6\x1f\
-\x3d\x4a\xff\xe2\xc5\x2d\xb2\x8f\xa8\xdf\xbe\xb2\x04\x1a\x5d\x75\
-\xac\x25\xef\xf7\xd9\x7d\xea\xd4\x18\xa9\x66\x80\x7c\x79\x99\xf9\
-\xb7\xbc\x85\xce\xc1\x83\x5b\x31\xf6\x98\x64\x12\x52\x2a\x10\x80\
-\x5a\x60\xf4\x6c\x3d\xa7\x00\xa3\x91\x17\x10\x09\xbf\x36\x75\x9d\
-\x06\x95\x40\xba\xe9\x71\x5f\x02\x58\xa5\x02\x98\x32\xfa\x8e\x63\
-\xdf\x5d\x00\x40\x81\x55\x4d\x56\x6a\x32\x53\xfd\x7f\x2b\xf9\x01\
-\x92\x66\xac\xc0\x41\xac\x05\xcd\x25\x78\x35\xc9\x48\x5a\xa5\x11\
-\x22\x03\xa3\xf0\xdd\x3b\xdd\x2e\xae\x28\x18\x6d\x6e\x56\xcd\x48\
-\xf2\x9c\xcc\x5a\xd6\xcf\x9c\xe1\xd0\x43\x0f\xd1\x7f\xfa\x69\x46\
-\xcf\x3e\xcb\xcc\xcc\x4c\x1d\xfd\x70\xea\xda\xd7\xe0\xa7\x66\x16\
-\xc8\x6b\x23\xe7\x38\xb6\xb8\xc8\x37\x74\x3a\xfc\xca\x53\x4f\x71\
-\x7a\x38\xdc\x9a\xe0\xd2\x04\x01\x4f\x35\xe4\x65\xea\x02\xbc\x82\
-\xd7\x7d\xc0\x2f\x6b\xe1\xef\x03\xd7\xec\xdd\xcb\x77\xfc\xb1\x3f\
-\xc6\x81\x6b\xaf\x65\x18\xe2\xf5\x0d\xc1\x0c\x9b\x3a\xd9\x52\x5b\
-\xdd\x2f\x3d\xf7\x1c\xb9\x34\xe4\xd4\x04\xe1\xfc\x3c\xf3\x5f\xf6\
-\x65\x74\x8f\x1d\x6b\xf4\xf1\x17\x1f\xde\x04\x53\x5e\xbb\x03\xb1\
-\xdf\xaf\x4d\x7b\x6b\x6d\x93\x83\x88\xcd\xfa\xc8\xd4\xd6\xe9\xbc\
-\xb9\xe2\x10\x24\x0d\xd9\x26\x78\x03\x1b\xb9\x04\xba\x01\x47\xae\
-\x5f\x0f\x9f\x45\x9b\xfc\x26\x72\x63\xb4\xff\xdf\x70\x0b\x14\x3f\
-\x30\x96\x47\x11\x85\xeb\xbc\x76\x05\x42\x83\x93\x62\x38\xac\xdc\
-\x01\xe7\xb0\x79\x5e\xb9\x07\xfd\x7e\xcd\x13\xb8\xb2\x64\xb8\xb9\
-\xc9\xb1\x6f\xf8\x06\xcc\xcc\x0c\xa3\xb2\xa4\x0c\x16\x40\x49\xba\
-\xcb\x70\xca\x12\x1a\x96\x25\x07\x17\x16\xf8\xe6\x1b\x6e\xe0\xaa\
-\x99\x99\xb6\x52\xc1\xbf\x4f\x55\x44\x34\x05\x80\x57\xe8\x7a\x1d\
-\xf0\x5f\x80\xab\xb4\xf0\x5f\xb7\x7f\x3f\xdf\xfe\xc7\xff\x38\xbb\
-\x0f\x1f\x66\xd4\xef\x37\x4c\x5f\x13\xcf\xe1\x53\xe6\xaa\x26\x00\
-\xbd\xb5\xcc\x9e\x3d\xcb\xec\xa5\x4b\xe3\xad\xb9\xf3\x9c\xb9\x37\
-\xbc\x81\x99\x5b\x6f\x6d\x4c\xe3\x15\x6d\x4f\x24\x2c\xf5\xc5\x8f\
-\x85\x09\x1a\x02\x5b\x13\x81\x4a\x90\x62\xc0\x30\x2a\x47\xdf\xa8\
-\x04\xa2\x2c\xe6\x05\x12\x40\x10\xd7\x12\xe8\x44\x9f\x4c\x09\x76\
-\x16\x01\x4e\x4c\xfc\x35\x66\x16\x24\xdc\x22\x93\xb0\x82\x52\x04\
-\xab\x6e\x9b\x56\x86\x9a\x01\x17\x40\x60\xd4\xef\x57\x20\x9d\x65\
-\x8c\x86\xc3\x0a\x18\x42\x9b\xf4\xe1\xc6\x06\x66\xf7\x6e\x0e\x7d\
-\xf5\x57\x33\xe8\xf7\x6b\x17\x46\x3a\x2b\x35\x7a\x05\xc4\x61\x4a\
-\xc5\xf9\x8c\x9c\x63\xcf\xec\x2c\xdf\x74\xe3\x8d\x5c\x3d\x3b\xdb\
-\x06\x02\xff\x84\x6a\xd8\xcb\x14\x00\x5e\x61\xeb\x7e\xaa\xe4\x8d\
-\xc3\x5a\xf8\xaf\x3f\x74\x88\x77\xff\xc9\x3f\xc9\xae\x43\x87\xaa\
-\xe4\x9e\xc4\xb4\xdc\xc6\xe8\xac\x78\x92\x6e\x30\xe5\xf3\x7e\x9f\
-\x85\x93\x27\x1b\xe6\xb7\x3c\xee\xdd\x76\x1b\x33\x77\xdd\x85\xc9\
-\xb2\x2d\x33\x57\x6b\xf3\x58\x63\xaa\x88\x40\x83\x54\x6b\xd1\xaa\
-\x59\x64\x11\x88\x35\x61\x23\x21\xcf\xd5\x79\xa9\x8c\xbd\x4c\x65\
-\xe6\x59\x9d\xc1\x47\xba\x68\x49\x08\x41\x2d\xf4\xf1\xeb\x36\x45\
-\x50\x2a\x02\xb0\xfe\xfe\xd6\x8e\x93\x71\x11\x20\xe8\xb0\x61\x4d\
-\x0c\x16\x45\x55\x20\x34\x1a\x31\xea\xf7\xeb\x54\x63\xb1\x02\x8a\
-\xe1\x10\x0f\xf4\xcf\x9f\x67\xf1\xce\x3b\x59\x7e\xed\x6b\x19\xf4\
-\xfb\x35\xc9\x27\xd5\x8f\xb5\xe6\x6f\xa9\xaa\xab\xdd\x81\xb2\x64\
-\x69\x6e\x8e\x77\xdd\x72\x0b\xc7\xe6\xe6\x52\x20\x60\x81\x7f\x01\
-\xbc\x7b\x0a\x00\xaf\x9c\x75\x27\xf0\x1f\xa9\x2a\xbc\x6a\x9f\xff\
-\xba\xfd\xfb\x79\xf7\xf7\x7f\x3f\x0b\x87\x0e\x51\x6c\x6e\x36\x46\
-\x66\xc7\xc3\x31\x1a\xed\xb2\x15\x71\x25\x1a\x63\xe1\x99\x67\xe8\
-\x28\xd3\x5f\x36\x79\xe7\xd8\x31\xe6\xde\xf0\x06\xec\xcc\xcc\xd6\
-\x18\xef\xb8\x37\x7f\x64\x02\x5b\x6d\x09\xa8\xd0\x60\xca\x1a\xd0\
-\x8c\xbb\x8e\x10\xc4\x9a\x3a\x6b\xb1\x12\x4c\x64\x1d\xd4\xa0\xa1\
-\xc0\xc3\x44\x69\xbd\x3a\x22\x60\x23\x6b\xa8\xe1\x52\xc4\xa6\x7f\
-\x24\x50\xfa\x7b\x8e\x69\xfc\x44\xc7\xe2\xda\x0a\x08\x40\xec\xa4\
-\xc7\x42\x51\x50\x8c\x46\xd5\x6d\x38\xac\x93\x88\x8a\xc1\x80\x22\
-\x54\x0f\x7a\x60\xe3\xc2\x05\xf6\x7f\xd5\x57\x91\xad\xac\x54\xe5\
-\xda\xca\x15\x48\xb9\x74\xf5\xef\xad\x40\xc1\x00\x45\x59\xb2\x6b\
-\x6e\x8e\x77\xdd\x76\x1b\x47\x67\x67\x19\x8e\xef\xb7\x2e\x55\x07\
-\xe2\xaf\x9d\x02\xc0\xcb\xbf\x6e\x8a\x35\xff\x00\xb8\x7a\x79\x99\
-\x6f\xfb\x81\x1f\x60\xfe\xd0\x21\xca\x8d\x8d\xad\x92\x54\xb9\x49\
-\x1a\xad\x2e\x57\xd5\x56\x81\x54\xc0\x19\x43\xef\xec\x59\x66\x2e\
-\x5c\x18\x6b\x3b\x65\x77\xed\xa2\xf7\x86\x37\x60\x43\xb8\xaf\xe1\
-\xe3\x2a\x61\x26\x3a\xae\xad\x04\x13\xfd\x18\xda\xef\x6e\x08\x59\
-\xe4\x4f\xeb\xe4\x15\x9d\xb7\x20\x3e\x7c\x1c\xa3\x17\x41\xcf\xa2\
-\x7c\xfe\x86\x7b\xa0\x84\x36\x53\xda\xbe\x51\xb3\xa0\xad\x15\xf5\
-\x77\xfa\x33\x4d\xf2\xf5\x49\xb8\x05\x71\x1e\x01\x51\x6f\x02\x27\
-\x20\x10\x5c\x81\x72\x34\xaa\xda\x8c\x39\xc7\xb0\xdf\xa7\x18\x8d\
-\xb6\x38\x03\x63\x38\xf4\xf6\xb7\x57\x7d\x1a\x42\x82\x56\x11\xee\
-\x89\x89\xc0\xc8\x1a\xd0\x4a\x60\x34\x1a\xb1\x34\x37\xc7\xb7\xdc\
-\x79\x27\x87\x67\x66\x52\x20\x30\x07\xfc\x5f\xc0\x1b\xa7\x00\xf0\
-\xf2\xad\x63\xc1\xe7\xbf\x46\x87\xfa\x0e\x2f\x2d\xf1\xee\x1f\xfc\
-\x41\x76\x1d\x3b\x86\xdb\xd8\xd8\xca\x99\x8f\x47\x62\x69\xa1\xd7\
-\xda\x40\x6d\x0c\x3b\x18\x30\xf7\xcc\x33\x63\x9b\xd6\x64\x19\x33\
-\x0f\x3e\x48\xe7\xda\x6b\x6b\xcd\xdf\x10\xf2\x58\xf0\xa3\xd7\x8d\
-\xea\x94\x93\x4a\x3a\xd2\x13\x7f\x1a\x84\xa1\xd2\xe4\x36\x0a\x21\
-\x8e\x25\x30\x45\xc2\x1d\xff\x9d\x8d\x2c\x82\xe4\x6b\x4a\xd0\x53\
-\xe7\x98\x58\xf8\x19\x4f\x9a\xd2\xdf\xbf\xd5\x0d\x88\x5c\x02\xa7\
-\x06\x93\xba\xc0\x05\x34\x40\x20\xe4\x6e\x88\x6b\x50\x84\x24\xa1\
-\xe1\xa5\x4b\xcc\x5c\x77\x1d\xbb\xef\xbf\xbf\xe6\x03\x04\x04\x9c\
-\x76\x31\xe2\xff\x1b\x83\x41\x70\x07\x96\x77\xed\xe2\x5b\xee\xba\
-\x8b\xfd\xbd\x1e\xa3\xf1\xfd\xb7\x87\xaa\xa7\xc0\x1d\x53\x00\x78\
-\xe9\xd7\x72\xb8\xf8\x37\xc9\x81\x11\xb0\x7b\x66\x86\x6f\xfd\xfe\
-\xef\x67\xf7\x4d\x37\xe1\x45\xf3\xa7\xb4\x7f\xe4\xe7\xa3\x86\x61\
-\xd4\xbe\xbf\x31\xcc\x3c\xfb\x2c\xf9\x60\x50\xfb\x90\xb2\xd9\x3b\
-\x37\xdd\x44\xf7\x8e\x3b\x9a\x31\x66\x31\x6d\x55\xba\x30\xca\x17\
-\x4e\xa6\x17\x47\xbe\x74\x23\x5b\x30\xa1\x5d\x6d\x64\x3d\x64\x91\
-\xc9\x1e\x73\x08\x59\xc4\xc6\xdb\xc8\xfc\x8f\x49\xc1\x2c\xf6\xed\
-\xd5\x7b\x25\x93\xa2\xd4\x67\x22\xfa\xec\x29\x61\x37\x6d\x96\x80\
-\xbe\x6e\xc2\x01\xb4\xb8\x02\xa3\xe1\xb0\x8e\x02\x00\x15\x21\x38\
-\x1c\x56\x15\x86\xde\xb3\x79\xfe\x3c\xcb\x6f\x7e\x33\xd9\xca\x0a\
-\xc3\xa2\xa0\x08\x21\xcc\x22\xe1\xff\xfb\x84\x02\xd0\xa1\xd0\x61\
-\x51\xb0\x7f\xcf\x1e\xbe\xe9\xce\x3b\xd9\x95\xe7\xa9\x64\xa1\x43\
-\x21\xe4\x7c\x6c\x0a\x00\x2f\xdd\x12\xf3\xab\x2e\xdd\x2c\xa9\xda\
-\x44\xbd\xeb\x3d\xef\x61\xff\x3d\xf7\xc0\xda\x5a\x53\xe8\x53\x37\
-\x6d\xfa\x47\xc7\xbc\x31\x64\x6b\x6b\xcc\x3c\xf7\xdc\xb8\xc9\xba\
-\xbc\x4c\xef\x81\x07\x30\xb3\xb3\x5b\x7e\x7f\xac\xf1\x22\x93\x9f\
-\x09\x42\x94\x14\x8a\x98\x0b\x48\xf9\xe2\xda\xc4\x8f\x38\x00\x0d\
-\x12\x26\x32\xdb\xc7\xd2\x8e\xa3\x28\x81\x7e\x6e\x52\x6c\x7f\x44\
-\xfa\x11\x75\x47\xd2\x9f\x73\x22\x08\x44\x7f\x9b\x22\xe5\x9c\x4a\
-\x15\xf6\x21\x4b\xb0\xd6\xfa\xa1\x49\x8b\x0f\xe9\xc3\x92\x3d\xe8\
-\x82\x2b\xb0\xff\x9d\xef\x64\x14\xda\xb5\x35\x9a\xb0\x46\xbd\x0c\
-\x7d\x8a\x13\x10\xb2\xd8\x39\x86\xa3\x11\x47\x0f\x1c\xe0\x1b\xef\
-\xb8\x83\x3c\xf0\x0a\xd1\xba\x3e\x28\xa3\xe5\x29\x00\xbc\x34\xeb\
-\x9f\x03\x5f\x23\x4f\x24\xd6\xfb\x8d\xdf\xfe\xed\x1c\x7f\xf3\x9b\
-\x2b\xe1\x57\x33\xed\x5a\x05\x5f\x66\xe1\x69\x6b\x40\x75\xc6\x9d\
-\x79\xf2\x49\xb2\xa8\x0b\x0f\x59\x46\xe7\x9e\x7b\xb0\x87\x0e\x35\
-\x84\xdf\xb4\x6c\x62\x5d\x27\x1f\xfb\xa0\xa9\xb0\x99\x51\xc9\x37\
-\x31\x18\x90\x30\xb9\xe3\x63\x31\xd1\x67\x12\x3e\xb6\x4d\xc5\xe8\
-\x5b\xdc\x84\x98\x30\xcc\xb4\x15\x92\xb0\x4e\xe2\xf0\xa9\x6d\x11\
-\x6c\x12\xa1\xb9\x54\x01\x4f\xdd\x8f\x30\xe4\x07\x94\xc1\xd7\x2f\
-\x83\x15\x30\x0a\xbd\x04\xca\xd1\xa8\x02\x81\x40\x08\x0e\x57\x57\
-\xe9\x1d\x3f\xce\xae\xfb\xee\xa3\xdf\xef\x53\x84\x61\x2c\x85\xf4\
-\x44\x8c\x7f\x0f\x6d\x01\x26\xc0\xa0\x18\x8d\xb8\xf1\xd8\x31\xde\
-\x79\xcb\x2d\x5b\x45\x47\xe3\x21\xe8\x9f\xa3\x6a\x27\x3f\x05\x80\
-\x17\x71\xfd\x18\xd5\x34\xde\x7a\xa3\x8c\x80\x87\x1e\x7a\x88\xdb\
-\xbf\xf9\x9b\x61\x63\x03\x8a\xa2\x12\x6c\x99\x64\x1b\x83\x81\x0c\
-\xbe\x54\xc7\x6a\x53\xb0\x2c\x71\xd6\x92\x9d\x3d\x4b\xf7\xec\xd9\
-\x31\xe2\x2f\x3f\x7e\x9c\xce\x6d\xb7\x6d\x4d\xdb\xdd\xe9\x4a\xd4\
-\x17\xa4\x04\x22\x16\x48\x3d\xd4\x33\x6e\xae\x31\x49\xf8\x6a\x17\
-\xa0\xcd\x8d\x68\x01\x12\x4b\x95\x45\xd8\xe0\x06\xe2\xa4\xa3\x96\
-\xb0\xa1\x89\xc8\xb4\x46\xde\xbf\x8e\x7a\x44\x80\x46\x8b\xa5\x50\
-\x5f\x3a\x29\x49\x0e\x61\x41\x57\x96\x75\x44\xa0\x16\x7a\xef\xeb\
-\xa4\xa1\x22\x4c\x5f\xda\xbc\x78\x91\xdd\x6f\x79\x0b\x66\xf7\x6e\
-\x06\x6a\x0e\x63\x29\x2e\x46\x6a\x5a\xb2\x56\x0e\xba\x60\xc9\x39\
-\xca\xd1\x88\x7b\x6e\xbe\x99\x37\x5f\x7b\x2d\x23\x92\xbd\x06\xdf\
-\x41\x95\x27\x30\x05\x80\x17\x69\x7d\x67\x00\x00\x34\xe3\x7f\xd7\
-\xad\xb7\xf2\x65\xef\x79\x0f\x8c\x46\xf8\xd1\x68\x4c\xf8\x45\xd8\
-\xbd\xd6\xfa\xca\x1a\xd0\xc7\x65\x58\x66\xef\xa9\xa7\xc6\x4d\xf3\
-\xf9\x79\x3a\xf7\xde\x8b\x59\x58\xd8\x1a\xab\xcd\x56\xdd\x00\x41\
-\x78\x74\x92\x11\x3a\xd1\x28\xc5\x90\xc7\xc0\xa0\xea\xfc\x1b\x9a\
-\x32\x22\x15\xeb\xda\x82\x88\x2b\xc8\x44\x80\x43\x4a\xae\x89\x04\
-\x75\x22\x60\x44\xe1\xc3\x86\x5f\x9f\xe0\x2e\xb6\xf3\xeb\x27\x15\
-\x56\xc1\x0e\x12\x86\x62\x10\x90\x39\x09\x21\x49\xa8\x18\x0e\x29\
-\x83\xe9\x2f\xaf\x4b\x6e\x80\x2b\xcb\xaa\x6a\xb0\xdb\x65\xf9\xa1\
-\x87\xaa\xe4\xa1\xe0\x0a\x8c\x42\x7e\x80\x28\x10\xaf\xad\x82\x44\
-\x24\xa8\xe6\x24\x42\x17\xa3\x37\xdd\x75\x17\x77\xec\xdf\xdf\x96\
-\x28\xf4\xbd\x54\x3d\x26\xa7\x00\xf0\x02\xaf\x07\x83\xe9\x6f\x34\
-\xe3\x7f\x7c\xff\x7e\xbe\xfe\x07\x7f\x10\xdb\xed\xe2\x07\x83\x4a\
-\xa8\x8b\xa2\x12\x7c\xd1\xfc\xda\x12\xd0\xb3\xee\x95\x0b\x50\x3f\
-\xb7\x16\xfb\xfc\xf3\x74\x2f\x5e\x1c\xd3\x4c\xf9\xad\xb7\x92\x5d\
-\x73\xcd\xd6\x48\x6d\x1d\x3a\xa2\x39\x79\xd7\xb4\xf8\xbe\x63\x03\
-\x34\x12\xd6\x80\x99\x60\x2d\x34\x84\x4f\x81\x41\x2a\xda\x60\x27\
-\x59\x03\x3a\x9f\x40\x99\xf7\x63\xe9\xc9\xca\x1a\x48\xb1\xfd\xad\
-\xc2\x1d\xb5\x09\x8b\xdd\xa0\xed\x84\x3e\x99\x1f\x20\xad\xd2\x35\
-\x17\x10\xa2\x02\xc3\xe1\xb0\x06\x07\x69\x25\xe6\xbc\x67\x78\xf1\
-\x22\xb3\xb7\xdd\xc6\xcc\xcd\x37\x33\xe8\xf7\x19\x85\x42\xa3\x22\
-\x15\xf9\xd1\xa3\xcf\x62\x8b\x40\xa6\x27\x17\x05\x59\x9e\xf3\xf5\
-\x0f\x3c\xc0\xb1\xf9\xf9\x54\x78\x10\xe0\xaf\x01\xdf\x36\x05\x80\
-\x17\x6e\x1d\x00\xfe\x4f\xd4\x88\xae\x02\x58\xe8\x74\xf8\xfa\xef\
-\xff\x7e\x7a\x87\x0e\xe1\xd7\xd7\x2b\xe1\x0e\xe6\xbf\x17\x61\x2f\
-\x8a\x1a\xb9\x1b\x66\xbf\x72\x0b\xbc\xd2\xfe\xae\x28\x98\x7d\xf2\
-\xc9\xb1\x0d\x68\xf7\xee\x25\xbf\xfd\xf6\x6a\xd2\x6e\x6a\xf0\x84\
-\x4a\x27\xae\x9f\xc7\x5a\xa4\xcd\x0f\x4e\x69\x49\xe9\xe2\xcb\x78\
-\xca\xac\x69\xf1\xb3\xc5\x6a\x68\xcb\xf6\x1b\xb3\x06\x22\x86\x3f\
-\xe5\x1a\xe8\x63\x59\xe2\xf3\xa4\x78\x83\x46\xf4\xa3\x0d\xec\xd4\
-\xc8\xef\x14\x61\x98\x02\x01\xa7\x7f\xa7\x10\x15\xa8\xd3\x82\x07\
-\x83\x2a\x21\x28\x58\x01\x23\x01\x01\xe7\x18\x6c\x6c\xb0\xfb\xad\
-\x6f\xc5\x75\x3a\x35\x17\x30\x82\x7a\x7a\x93\x9e\x8b\x40\x4b\x5e\
-\x48\x03\x24\x86\x43\x66\x77\xed\xe2\x1b\x1e\x78\x80\xf9\xd0\x7a\
-\x3c\x21\x57\x3f\x05\xdc\x3b\x05\x80\x2f\x7e\xe5\xc0\xff\x4e\x55\
-\xde\xdb\x20\x88\xde\xfe\xee\x77\x73\xe0\xde\x7b\x71\xab\xab\xb5\
-\x90\xa7\x84\x5e\x84\xdd\x07\xff\x51\x0b\xbd\x53\xc0\xe0\x8c\x21\
-\x7b\xfe\x79\xf2\xd5\xd5\xe6\x46\xb4\x96\xfc\x8e\x3b\xb0\xfb\xf6\
-\x6d\x11\x7f\x7a\x1c\x56\x94\x3d\xa8\x05\x5f\x4f\xd0\x31\x89\x70\
-\x93\xde\xf4\x3e\xaa\x48\x6c\x00\xc9\x36\x26\x78\x9b\x56\x1e\xab\
-\x1f\x88\x05\x5c\x73\x0b\xd1\xf3\x38\xc2\x10\xe7\x29\xd8\x08\xc0\
-\x6c\xe2\xb3\xd0\xa2\xdd\xfd\x24\x2e\x24\xba\x36\x3e\x01\x02\x32\
-\x89\xc9\x15\x05\x45\x51\x54\x42\x1f\xf2\x03\x64\x4c\xb9\x0c\x6c\
-\x19\x6d\x6e\xc2\xbe\x7d\x2c\x3c\xf8\x20\xfd\x60\x05\x08\x08\xf8\
-\x58\xf0\xc5\x1a\x8c\x27\x1f\x89\xc2\x90\x28\xd1\x60\xc0\xc1\xc3\
-\x87\xf9\xda\x3b\xee\x18\xeb\x45\x18\xd6\xee\x10\xa9\x3a\x30\x05\
-\x80\x2f\x6e\xfd\x55\xa2\x69\x3d\x03\xe0\x81\xfb\xef\xe7\x8e\x6f\
-\xfa\xa6\x4a\xf3\x17\x45\x6d\xfa\x0b\x08\xa0\x41\x20\x72\x07\x6a\
-\x6b\x20\xdc\x4b\xfc\xd8\x2b\xdf\xbf\x71\x91\x0e\x1e\x24\xbb\xa9\
-\x4a\x37\x30\x11\x5b\x6c\x12\xa6\xa4\x8f\x52\x4b\xed\x36\xc2\x6c\
-\x52\x16\x44\xca\x3a\x88\x8a\x97\xc6\x8e\x45\x15\x8d\x46\x09\xb5\
-\x49\x69\x77\x25\xb8\x29\x30\xd0\xff\xa7\xe1\x4a\xc4\xe7\xb5\x81\
-\x91\x06\xb4\x96\x91\xde\x6d\x6e\x51\x4c\xa0\x7a\xa2\xaa\xc1\xf0\
-\xfb\xd5\x56\xc0\x60\xc0\xb0\xdf\x67\x14\x38\x20\xa9\x24\x94\x2e\
-\x42\x83\x8b\x17\x59\x78\xf0\x41\xcc\xf2\x32\xa3\xa2\xa8\x40\x20\
-\xdc\x1a\x63\xd1\xb4\xe6\xd7\x96\xa2\xe2\x8a\xea\xe3\xc3\x21\x77\
-\xdd\x76\x1b\xf7\x5f\x7d\x75\x1b\x1f\x70\x33\x55\xca\x70\x3e\x05\
-\x80\x2f\x6c\x7d\x15\xd5\x44\x57\x1a\x7e\xff\xc1\x83\xbc\xf5\xfb\
-\xbe\xaf\x0a\x0d\x0d\x87\x95\xc6\x0f\x37\x01\x83\x5a\xc0\x63\x20\
-\x50\x9a\xdf\x29\x97\xc0\x19\x43\x76\xfa\x74\xed\xfb\xeb\x8c\xbf\
-\xec\xf6\xdb\x31\x8b\x8b\x0d\xe2\xaf\x16\xfe\x44\xf2\x48\x43\xcb\
-\x47\xda\x3f\x26\x96\x4c\x42\x38\x93\x42\x13\x33\xeb\xea\xff\xda\
-\x49\x56\x40\x24\xc4\x63\x0d\x4f\x5a\xcc\x7e\xed\xfb\xdb\x48\xe3\
-\x4f\x8a\x40\x6c\x97\xdf\x40\x04\x72\x29\x30\xf0\x2d\xae\x80\x90\
-\x74\x32\x01\xb9\x54\x5d\x84\x0a\x29\x18\xda\xdc\xac\x53\x83\x25\
-\x42\x50\x86\xdc\x00\xd7\xe9\xb0\xf8\xa6\x37\xd1\x1f\x8d\x18\x01\
-\x03\xef\x19\x04\x77\xb2\x6d\x3e\xa2\xcc\x34\xf0\xda\x3a\x50\x8a\
-\x04\xef\x79\xdb\x03\x0f\x70\xcd\xae\x5d\x6d\x7c\xc0\xdb\x81\x1f\
-\x9d\x02\xc0\xe5\xaf\x83\xc1\x8f\xca\x75\xbc\x7f\x26\xcb\x78\xfb\
-\x7b\xde\x43\x6f\x65\x05\x17\x42\x7e\x94\x25\x8c\x46\xf5\x8f\xe2\
-\x46\xa3\x0a\x0c\x82\x35\xe0\x02\x10\xe8\x5e\xf4\x04\x80\x70\xaa\
-\xfe\xbc\x77\xe2\x44\xa3\xd2\x0f\xc0\x1e\x3e\x4c\x76\xdd\x75\x4d\
-\x93\x5d\x9b\xf3\x24\x52\x49\x23\xe1\xf7\x2d\x20\x10\x17\x20\xc5\
-\xc2\x4d\x14\x6f\x8f\x05\xc8\x4e\x22\x0e\xf5\xff\x4b\x1c\x1f\x23\
-\x29\x5b\xac\x84\x31\x10\x91\x06\x25\x13\x08\xcd\xf8\x6f\xc6\xac\
-\x1a\xe5\x06\xb0\x4d\x28\xd5\xc4\xed\xbd\x64\x02\x91\x02\x81\x32\
-\x14\x0a\x8d\x86\xc3\xca\x0a\x18\x0c\xaa\x39\x8d\xc1\x35\x10\x2e\
-\x60\x78\xe9\x12\x33\xb7\xdd\x46\x7e\xf5\xd5\x0c\x86\x43\x46\xc0\
-\xd0\x7b\x86\x6a\x10\xab\x44\x05\x74\xa3\x52\xb1\x0e\x1b\x7c\x91\
-\x28\x98\xe1\x90\xde\xdc\x1c\x6f\x7f\xe0\x01\x66\xac\x4d\xf6\x1f\
-\x00\xfe\x32\xf0\xd5\x53\x00\xb8\xbc\xf5\x4f\x51\x39\xfe\x42\xfc\
-\x3d\xf4\xf6\xb7\x73\xd5\x7d\xf7\x51\xac\xad\x55\xc2\x5f\x14\x55\
-\xe8\xaf\x2c\xab\xfb\xd1\xa8\x3a\xa6\x6f\x02\x02\x91\xc0\xd7\xd6\
-\x00\x60\xcf\x9f\xa7\x7b\xee\x5c\x23\xee\x6f\xb2\x8c\xec\x96\x5b\
-\xb6\xc2\x7e\xa9\xba\x81\x04\x5b\x1c\x6f\x6a\x1b\x59\x0b\x63\xae\
-\x43\xcc\x29\x90\xc8\x9d\x57\xa3\xbd\xcc\x04\xa2\x2c\x16\xfc\xb6\
-\x6a\x3c\xa3\x35\x7b\xcc\x47\xc4\x2e\x46\x14\x79\xc8\x76\x18\xd2\
-\x23\x41\x60\xc6\x60\xe0\x23\x37\xc8\xd2\xec\x76\x34\x66\x01\x68\
-\x2e\x20\x4a\x10\x12\x2b\x60\xd8\xef\x37\x42\x81\xa3\xd1\xa8\xb6\
-\x16\x8a\xa2\x60\xf1\xcd\x6f\x66\x50\x96\x8c\x9c\xab\x48\xc1\x10\
-\x15\x18\x1b\xa7\x2e\x84\xa3\xfc\xaf\x98\x34\x96\xfd\xd4\xef\x73\
-\xe4\xc8\x11\xde\x7c\xcb\x2d\xa9\x7a\x01\xe1\xb1\x7e\x9a\x6a\x1a\
-\xd5\x14\x00\x76\xb0\xde\x03\x7c\x53\xec\xf7\xbf\xe6\xba\xeb\xb8\
-\xff\x5d\xef\xa2\xdc\xd8\xc0\x4b\xee\x77\x2c\xec\xea\x26\x49\x23\
-\x3e\x58\x04\xda\x15\xd0\x2e\x40\xe9\x1c\xbd\x67\x9e\x19\x13\x04\
-\x7b\xf8\x30\xf6\xf8\xf1\x74\x86\x58\x1c\x42\x8a\xcd\xf6\x38\xe7\
-\x40\x59\x0e\x3e\x16\xfe\xd0\x9a\x2c\x26\x08\x75\xb5\xa2\x69\xc9\
-\x21\xd0\x6e\x84\x8d\x04\x3f\xe6\x00\x6c\x14\x22\x24\x7a\x9e\xe4\
-\x0b\x12\xb5\x00\x24\xc2\x8d\x29\x13\x3f\xe6\x01\xc6\x40\x69\xbb\
-\x44\xaa\xb6\xdc\xfd\x00\x06\xd2\x76\x4d\x00\x5d\x5c\x81\x51\xc8\
-\x0a\xac\xf3\x05\x94\x2b\x30\x5a\x5b\xa3\x77\xfc\x38\x33\xaf\x79\
-\x0d\x83\x7e\x9f\x21\x30\x74\x8e\x81\xe2\x03\x9c\xca\x39\x68\xb8\
-\x8d\xa9\x5c\x12\xd9\x4f\xc3\x21\x0f\xdc\x75\x17\x37\xef\xdd\xdb\
-\xc6\x07\x1c\x0d\x61\x6c\x3b\x05\x80\xc9\xeb\x7a\xe0\x6f\xeb\x03\
-\x25\xb0\xab\xdb\xe5\xab\xbe\xfb\xbb\xc9\x66\x66\x70\xfd\x7e\xa5\
-\xfd\xb5\xc6\x17\x21\x0f\x82\xef\x13\x24\xa0\x53\xee\x80\xb8\x02\
-\x85\xf7\x98\xb5\x35\x66\x9e\x7f\xbe\xc9\xe4\x5a\x8b\xbd\xf9\xe6\
-\x5a\xfb\x9b\x94\xd6\xd7\x3e\xab\x7e\xcd\x35\x0d\x41\xaf\x8f\x89\
-\x86\x56\xb1\x65\x1b\x0b\x7e\x8b\xd9\xdc\x88\x1e\x24\xcc\x78\x68\
-\x4f\x2f\x36\xa9\x4a\xc7\x48\xdb\x67\xd0\x5a\xb4\x94\xe4\x15\xa2\
-\xf7\x22\xf1\xb9\x52\xa1\x3f\x22\x60\x48\xba\x02\x29\x70\x88\xad\
-\x07\x29\x17\x56\x2d\xc4\xca\xd1\x88\x52\x3a\x08\x8b\x2b\x30\x1c\
-\x56\x49\x41\xa1\xe9\xe8\x68\x63\x83\xc5\x2f\xff\x72\x46\x9d\x0e\
-\x83\xb2\x64\x10\xdc\x80\x81\xe4\x07\x48\x15\x62\xb0\x06\x7c\x14\
-\x35\xd2\xd6\x64\x4d\x46\x8e\x46\xe4\x79\xce\x57\xdd\x7f\x3f\x0b\
-\xe9\xd0\x20\x81\xcc\xfe\xfe\x29\x00\x4c\xfe\x3c\xff\x90\xaa\x97\
-\x7f\x03\x00\xbe\xe2\x6b\xbe\x86\x7d\x37\xdd\xc4\x70\x6d\xad\x12\
-\x60\xc9\xfa\x0b\xa5\xa2\x7e\x34\xda\x12\x7c\xd1\xfe\xe1\x3c\xa7\
-\x40\x41\x7e\x40\x09\x17\x39\xa0\xf7\xdc\x73\x58\x9d\xd9\x07\x64\
-\x07\x0e\x60\x43\x7f\x3f\x12\xc4\x5d\x23\x63\x4c\x58\x62\xa8\x1b\
-\x5c\xb6\x65\x93\xb5\x69\x48\x52\x24\x61\xc2\xca\x48\xba\x17\x09\
-\x72\x2e\xfe\xdb\x64\x04\x20\xd2\xf6\x4c\x60\xf7\x53\x7c\x80\x51\
-\xd9\x86\x26\x41\x14\x92\x70\x25\x48\x85\x08\xe3\x12\xdd\xc8\x6a\
-\xf0\x09\x2e\xa0\xce\xde\x93\xe4\x20\xe7\x28\x82\xdf\x3f\x0c\xc9\
-\x41\x23\x69\x18\x12\x40\xa0\x28\x8a\xea\xbc\xcd\x4d\xf2\x83\x07\
-\x99\xbb\xfb\x6e\xfa\x62\x05\x78\xcf\xd0\xb9\x3a\x4b\xb0\x36\xff\
-\x23\xab\xc0\xc7\x56\x81\x0a\x3f\x8f\x36\x37\x39\x70\xe0\x00\x5f\
-\x7e\xeb\xad\x6d\x00\x00\xf0\x13\xc0\xad\x53\x00\x48\xaf\xef\x22\
-\xea\xb2\x32\x04\x6e\x38\x76\x8c\xfb\xde\xf1\x0e\x46\xeb\xeb\xf8\
-\xe1\xb0\x16\x7e\x17\x6e\x5a\xfb\x37\x1e\x2b\x37\x40\x84\xbe\x01\
-\x02\xce\xe1\xfb\xfd\xba\xe2\x6f\x0b\x01\x0c\xe6\xc6\x1b\x31\xbb\
-\x76\x25\xb5\x7f\x6c\xc2\xfb\x36\x4e\x20\x06\x01\xd1\xfc\xb2\xa1\
-\xa3\x64\x13\x1b\x71\x04\x8d\x74\xe2\x08\x2c\xc6\x84\x97\x44\x89\
-\x6e\x4b\x74\x80\x6d\xb4\x7b\x4c\xe6\xd9\x84\x2b\x61\x13\x44\x9f\
-\x6d\x7b\x9f\x38\xbf\x21\x06\xb8\xb6\x88\x40\x02\x10\x1a\xdc\x80\
-\x0e\xdd\xa9\xc6\x21\xe2\x0a\x0c\x65\xa0\x48\x08\x15\x8e\x86\xc3\
-\x6a\x3f\x78\xcf\x70\x75\x95\xc5\x37\xbc\x01\xbf\xb0\xc0\xa8\x28\
-\x6a\x0b\x60\xe0\x3d\x23\x19\x34\x12\xde\xbb\x8c\x22\x47\x2e\x24\
-\x22\x79\x4d\x32\x87\xdb\x68\x30\xe0\x75\xb7\xdd\xc6\x75\xcb\xcb\
-\x6d\x51\x81\xa5\xc0\x6f\x75\xa7\x00\x30\xce\xfa\xff\x84\x3e\xe0\
-\x80\xd9\x2c\xe3\xa1\x6f\xfb\x36\xb2\x99\x19\xca\x7e\xbf\x12\xf0\
-\x10\xfa\xab\x73\xff\x05\x0c\xc4\xcc\x13\xc1\x0f\xe1\x20\x4d\x04\
-\xd6\x40\x50\x96\x55\x09\xf1\xf3\xcf\xd3\x09\x03\x3e\xea\xcd\xb7\
-\xbc\x8c\x39\x76\xac\x95\xec\x33\x09\xed\x4f\xec\xb3\xb7\x68\xf1\
-\x18\x2c\x7c\xca\x32\x48\xf0\x0a\x24\xe2\xff\x63\x11\x86\x44\xaf\
-\x43\x13\xe7\x14\xa8\x76\xe4\x9a\x08\x1c\x8b\x02\xa4\xf2\x0d\xda\
-\xa2\x0e\x09\x4b\x22\x0e\xeb\x6d\x17\x02\x4c\x5a\x3f\x09\xb3\x3f\
-\xd5\xe6\xbb\x8c\x4c\xf4\x3a\x32\x10\x5c\x01\x49\x0d\xae\xb9\x00\
-\xe7\x70\xa3\x11\x76\x71\x91\xb9\x50\x2d\x28\x1c\x80\xf0\x01\x45\
-\x78\xdf\x52\x5c\x01\x79\x2c\xb9\x23\x62\xfa\x47\xee\x65\x19\x66\
-\x17\x3c\x74\xdf\x7d\x93\xa2\x02\x6f\x02\x7e\x60\x0a\x00\xcd\xf5\
-\x37\x50\xdd\x7c\xa1\xca\xd4\x7a\xed\x83\x0f\x72\xe4\x35\xaf\x61\
-\xb8\xba\xba\xa5\xfd\x87\xc3\x4a\xd8\x95\xf0\xc7\xee\x80\x36\xfd\
-\xb5\x66\x28\xc3\x8f\x56\x84\x1f\x6c\xf6\xf9\xe7\xc7\x4c\x52\x7b\
-\xcd\x35\xd8\xa5\xa5\x06\xf3\xaf\x2b\xc3\x62\x9f\xd5\x6c\x17\x1d\
-\x88\xc3\x87\xfa\x3d\xe2\x06\x25\x51\x63\x12\x9f\x08\x11\xc6\x96\
-\xc0\x58\x48\x30\x02\x09\xcd\x35\x34\x58\xfd\x36\x37\xa0\xad\x40\
-\x49\x01\x03\x2d\xc0\x40\xf4\xfe\x71\xa8\x34\x95\xe1\x48\x04\x14\
-\x66\x3b\x1e\x20\x51\xc7\xaf\x35\xb3\xf4\x09\x2c\x8b\xa2\x76\x05\
-\xca\x50\x3b\x20\x16\x41\xe9\x1c\xa3\xd5\x55\x16\x5f\xfb\x5a\xdc\
-\xee\xdd\x0c\x8b\xa2\xb6\x00\x86\xce\x55\xe3\xc6\x24\x17\x40\x5b\
-\x01\x52\x95\x28\x24\x72\xcc\x09\x94\x25\xc3\x7e\x9f\x23\x07\x0f\
-\x72\x6f\xa8\x1a\x6c\x59\x3f\x4a\x35\x8d\x78\x0a\x00\xc0\x1b\x88\
-\x5a\x2d\x17\xc0\x81\xa5\x25\xee\x7f\xfb\xdb\x19\xf6\xfb\xb8\xc1\
-\xa0\xe1\xf7\x37\x5c\x00\xe5\xef\x37\x04\x5f\x84\x5e\x5a\x4c\x6b\
-\x40\xf0\x9e\x6c\x7d\x9d\x99\x10\xfa\xab\x37\xf4\xfc\x3c\xe6\xf8\
-\xf1\x7a\x42\x6f\xd2\x37\x8f\x9b\x89\xe8\x63\x2d\x6e\x40\xd2\x97\
-\xd7\x7e\x6d\x6c\x31\x44\xef\xe7\xe3\x46\x15\x71\xbc\x5f\xbf\x16\
-\xe5\x1c\xa4\xca\x75\x4d\x2a\xf4\x97\xd0\xf2\x0d\x6b\x21\x0a\x09\
-\x8e\x91\x96\x93\x48\xcc\x54\xf6\xa4\x6c\xc2\x1d\x12\x7e\x31\x20\
-\x68\x77\x40\xfb\xea\xa5\x2a\x17\x2e\xa4\x4f\x40\x78\x2c\xd9\x81\
-\x42\x1a\xda\xb9\x39\x76\x3d\xf0\x00\x9b\xc1\x0a\x90\xdb\x66\x00\
-\x82\x32\xb8\x8a\x9a\x6c\x8c\x2d\x49\x21\x94\x6b\xf7\x32\xb8\x1c\
-\x0f\xdc\x76\x1b\xfb\x67\x67\xdb\x46\x8e\xed\x89\xc9\xee\x2f\x55\
-\x00\xc8\x82\xf6\x1f\x4b\x97\x7c\xe3\xdb\xde\xc6\xc2\xf2\x32\xa3\
-\x8d\x8d\x2d\x6d\x1f\xb4\xbf\x57\x9a\xbe\x0c\x42\x2f\x28\x5f\x2a\
-\xc1\x6f\x08\xbd\x22\xff\x0a\x60\xf6\xf4\xe9\x46\xc3\x0f\x09\xfd\
-\x19\x99\xe9\x27\xc2\x17\xa7\xff\xb6\x68\xa4\xb1\xaa\xb2\x84\xe0\
-\x37\x6a\xcc\xb5\x96\x4f\x34\xa5\x30\x89\xd2\xe2\xd4\xff\x35\x29\
-\xe1\xd7\x9a\x5c\xbd\x7f\xc3\x27\x8f\xfe\xc6\x44\xae\x42\xa3\xc4\
-\x39\x61\xc9\xd8\x84\x3b\x90\x24\x39\x13\x40\x67\xda\x08\xc0\x18\
-\x0c\x23\x81\x1f\xfb\x3b\xe5\x5a\xe9\xdc\x80\x52\x6a\x04\x82\xef\
-\x5f\x73\x01\x02\x02\x21\x22\x50\xac\xae\xb2\x78\xf7\xdd\xf8\x3d\
-\x7b\x18\x14\x45\x4d\x04\xf6\xcb\x92\x41\xc8\x13\x70\x21\xe1\xa8\
-\x88\x5c\x81\x06\x99\xac\x5d\xcf\xf0\x7f\x17\xe6\xe7\x79\x7d\x68\
-\x20\xd2\xb2\xde\x05\x7c\xc3\x97\x3a\x00\xbc\x1b\x78\x73\x4c\xfc\
-\x5d\x73\xd5\x55\xdc\xfc\xba\xd7\x31\x10\xd3\x5f\x04\x5f\x99\xff\
-\x9a\x04\x74\x42\xf0\xa8\x06\x92\x5e\x40\x41\x35\x92\x90\x1f\x92\
-\xe1\x90\xf9\x38\xf4\x97\xe7\x98\xe3\xc7\x31\x9d\x4e\x9d\xf6\x9b\
-\xf2\xe5\x7d\x8a\xdc\x8b\xe3\xfb\xa9\xd7\x5a\xc0\x20\xd5\x8f\x30\
-\x99\x20\xd4\xf6\x7e\xb4\x14\xdf\x24\xb4\xfa\x18\xc9\x48\x3a\x4b\
-\xb0\xc1\x3d\x24\xc8\x3d\x52\xcf\x23\xf7\xa0\xb5\xeb\x6e\x22\x64\
-\xa8\xc1\x30\x05\xb0\xa6\x05\x04\x62\xe0\x70\x2a\x2a\x20\xa5\xc1\
-\xc3\xc1\x80\x81\x84\x05\x55\x05\xa1\xec\x87\xac\xd7\x63\xf1\x81\
-\x07\xea\x42\xa1\x81\x73\x15\x29\xe8\x5c\x65\x05\x38\x47\x29\x15\
-\x88\x22\xf4\xca\x35\xa8\x8f\xa9\xe1\xa6\xbe\x28\x18\xf4\xfb\xdc\
-\x7c\xcd\x35\x1c\xdb\xb3\x67\x92\x2b\xf0\x13\xc0\xc2\x97\x2a\x00\
-\xcc\x02\x3f\x12\xa3\x7c\x07\x78\xe0\xad\x6f\xc5\x66\x19\x45\xbf\
-\xdf\x00\x00\x27\x26\x7e\x04\x02\x35\xe9\x17\x99\xfd\x22\xfc\xe2\
-\xf7\x97\x65\xc9\xc8\x7b\x7a\x17\x2e\xd0\xd9\xd8\x68\x02\xc0\xca\
-\x0a\xe6\xe0\xc1\x2d\x41\x96\xc1\x95\x2d\xac\xbe\x8f\x49\xbd\x09\
-\xe7\xc5\x31\x7c\x12\x83\x49\x62\x37\x60\xac\x30\x25\x22\x22\x4d\
-\xc2\xea\x60\x02\x09\xd9\x46\xe6\x91\x60\xfe\x93\xa4\xdf\x24\x70\
-\x88\x73\x02\xda\x38\x92\x84\xfb\x63\x76\x10\xf7\x8f\x2d\x0a\x1f\
-\x91\x81\x5e\xb1\xf6\x35\x17\x50\x14\x8c\x54\x27\x61\x21\x04\x47\
-\x3a\x3b\xd0\x7b\x8a\xf5\x75\xf6\x28\x2b\x40\xe7\x05\xf4\x9d\x63\
-\x28\x2d\xc6\x15\x31\xa8\xad\xc9\x32\x91\x65\x2a\x40\x93\x59\xcb\
-\xfd\xaf\x79\x0d\x19\xb4\x59\x02\xb7\x02\x7f\xf2\x4b\x15\x00\xfe\
-\x28\x70\x4b\x4c\xfc\xdd\x78\xc3\x0d\x1c\xbb\xf9\x66\x06\x6b\x6b\
-\xb5\xaf\x2f\x7d\xe0\xb4\xd0\x97\xc1\x9f\x93\x5b\x7d\x9e\x06\x00\
-\xc9\x06\x93\x5b\xf8\xa1\x16\xce\x9e\x1d\xfb\xf2\xf6\xf0\x61\x98\
-\x9f\x1f\xef\x0f\x17\x37\x0f\x8d\x85\x5d\x37\x8c\x88\xca\x48\x53\
-\xd6\x82\x1c\x6f\xd3\xe8\xbe\x4d\x8b\xea\x4c\xc2\xb8\x5b\x4d\x6a\
-\xd2\x51\x22\x8a\xd0\x96\x50\x34\x16\x72\x6c\x71\x3d\x4c\x64\xfe\
-\x8f\xfd\xcf\xc4\xf9\x93\xac\x00\x1f\x55\x4f\x26\xc9\x53\x65\x2d\
-\xa5\x84\x48\xae\x65\xed\x06\x68\xb2\x4e\x75\x0f\x92\x3e\x01\x9a\
-\x1f\x10\x61\xcd\x7b\x3d\x96\x5e\xfb\x5a\x36\x07\x83\x8a\x07\x08\
-\x56\x80\x44\x05\x84\x0f\x28\x02\x00\x14\x0a\x00\x24\x1a\x50\x46\
-\xdc\x93\x2f\x0a\xfa\xfd\x3e\x57\x1f\x38\xc0\xf5\x07\x0e\x4c\xb2\
-\x02\xfe\x1c\x2f\x53\xd9\xf0\xcb\x09\x00\x8b\xc0\x0f\xc5\x61\xbf\
-\x9e\xb5\xdc\xfb\xc6\x37\xd6\x21\x95\x52\xb2\xb8\x82\xdf\x2f\x8f\
-\x4b\x31\xf9\xc5\xff\x8f\x7c\xff\x32\xb2\x02\x6a\xdf\xbf\x2c\xb1\
-\x83\x01\xf3\x8a\xfc\x03\xa0\xd7\xc3\x5c\x75\x55\x95\x03\xa0\x7b\
-\x04\x46\x1a\xb2\xde\x8c\x5a\xe8\x53\x21\xbc\xb6\x66\x12\xb1\x45\
-\xa1\x36\x70\x92\x0f\x68\xb3\x2c\x12\x49\x49\x66\x8b\x12\x1f\x1b\
-\x6d\x66\x12\x5a\xb4\x91\x72\xac\x4d\xf2\x38\xf1\x29\x61\x01\xf8\
-\x16\x5e\x20\xd6\xfa\x7e\x82\x50\x93\xc8\x0f\xf0\x71\xf1\x4f\x5b\
-\xf7\xde\x84\xb5\xe0\x55\x44\xa0\x31\x54\x64\x34\x62\x28\x64\x60\
-\x70\x03\x0a\x35\x5f\xb0\x74\x8e\xd1\xda\x1a\xcb\x77\xdf\x8d\x5b\
-\x5c\xac\xad\x80\x7e\xe4\x0a\x8c\xa2\xd0\x60\x19\xa2\x05\x45\x64\
-\x0d\x08\x18\x48\x38\xd2\x39\xc7\xdd\xd7\x5f\x4f\x37\x9a\xf0\xac\
-\xd6\x21\xe0\x07\xbf\xd4\x00\xe0\x8f\x50\xa5\xfd\x36\x98\xff\x1b\
-\xae\xbf\x9e\x03\x47\x8f\x32\x5c\x5b\xab\x09\xbf\x5a\xe0\x23\x6d\
-\xef\xe4\x07\x0c\xcf\x8b\xd1\xa8\x8a\xf3\x86\x63\x85\x22\x83\xea\
-\xea\x30\x60\xfe\xe2\x45\x3a\x61\xb0\x64\xbd\x61\x57\x56\x20\x22\
-\xff\x1a\x71\xfe\x94\xa0\x25\x1a\x49\x90\x60\xe5\x93\x1c\xc0\x0e\
-\x80\xc2\xc7\x11\x86\x38\x67\x60\x1b\x70\x20\xd1\xa0\xa4\xad\x32\
-\x2f\xc5\x0d\xc4\x6e\x43\x83\xc4\x6c\x21\xf9\x92\xe1\xbb\x9d\x6a\
-\xf8\x09\x42\x4d\xca\xf7\x57\x6e\x98\x57\x89\x42\x4e\xa5\xf2\xd6\
-\xc2\x28\x84\x60\x00\x81\xda\x0a\x08\x95\x82\x65\x51\xd0\x5d\x58\
-\x60\xf1\xee\xbb\xd9\xec\xf7\x2b\xcd\xef\x1c\x7d\x01\x82\x70\x13\
-\x61\x17\x37\xa0\x50\x42\x5f\x68\x4b\x40\xf1\x4e\x83\x7e\x9f\x03\
-\x7b\xf6\x70\xdd\x81\x03\x93\x32\x04\xff\x04\x2f\x43\xb1\xd0\xcb\
-\x05\x00\x33\xc0\x9f\x8a\x7d\xff\x9e\xb5\xdc\x71\xdf\x7d\x75\x3e\
-\x77\x43\xf8\x85\xb8\x09\xcf\x4b\xcd\xfe\x8b\xd9\xaf\x5d\x00\xc9\
-\xf5\x0f\x3f\x4c\x51\x14\x15\x8b\x5b\x96\xec\x3a\x7f\x7e\x3c\x09\
-\xe5\xf0\x61\xe8\xf5\xb6\x6a\xfe\x13\x1a\xcc\xef\x40\x90\xfd\x0e\
-\x8f\xc5\x64\xa2\x6f\x4b\x1d\x4e\xb0\xdd\xb4\x59\x27\xdb\x70\x11\
-\xa9\x63\x31\x07\xe0\x53\xf5\x0c\x89\xf0\x63\x2a\xd9\x48\x7f\x46\
-\x9f\xb0\x0a\x48\x99\xf1\x09\x50\xf2\x2d\xa0\xe2\x27\xa4\x44\xc7\
-\xbf\x51\x5d\x2e\xec\x5c\xc5\x03\x44\x43\x45\xca\xe1\x90\x61\xd8\
-\x53\xd2\x3f\xb0\xdc\xd8\x60\xdf\x6b\x5f\x4b\x39\x3b\x4b\x3f\x44\
-\x00\xfa\xc1\x05\xd8\x2c\x4b\x86\xa1\x82\x70\x24\x69\xc7\x62\x61\
-\x08\x18\xa8\xc8\x93\x06\x1e\xd9\x8f\xb7\x5d\x73\x0d\xdd\x30\xad\
-\x38\xb1\x56\x5e\x0e\x2e\xe0\xe5\x02\x80\x77\x01\xaf\x89\xb5\xff\
-\xb5\xc7\x8e\xb1\xef\xd0\x21\x86\xeb\xeb\xb5\xe9\x1f\x6b\x7e\xad\
-\xed\xcb\xc8\xe7\xaf\x59\x7e\xe5\xf7\x97\x1a\xa1\x9d\xa3\xd3\xef\
-\xb3\x70\xf1\x62\x6d\x8a\x19\xc0\x74\xbb\x98\x03\x07\xb6\xfa\xf1\
-\x5f\xa6\xa6\xde\xa9\xc9\xef\x5b\x40\x64\x3b\xa2\xb1\x8d\xf9\xd7\
-\x80\xe0\x5b\xdc\x95\xb6\x5a\xfd\xb6\xbc\x84\x36\x56\x7f\x62\xfe\
-\x42\x8b\x3b\x60\x26\x25\xef\xb4\xf8\xfe\x3b\xe1\x03\x52\x51\x8f\
-\x46\x33\x4f\x19\x2d\xa6\xb3\x03\xc5\x0a\x1c\x8d\xaa\x5a\x01\x71\
-\x01\x44\x99\x84\x7a\x81\xb9\xe5\x65\x96\xee\xb8\x83\xfe\xe6\x26\
-\x7d\x55\x1f\x20\xd1\x81\x91\xf7\x95\xd9\xaf\x72\x04\x64\xcf\x69\
-\xb7\xa0\x0c\xca\x47\x00\x61\x38\x18\xb0\x77\x69\x89\x63\x7b\xf7\
-\xb6\xe5\x05\x40\x55\x05\xbb\xff\xa5\x14\xc4\x97\xa3\x55\x91\x05\
-\xfe\xe7\x58\xfb\xe7\xc0\xcd\xb7\xdd\x56\x69\x6d\xe9\xee\x9b\x28\
-\xbd\x6c\xf4\xf4\x53\xfd\xff\x9d\xea\xf8\x53\xea\xd4\x5f\x95\x1e\
-\x3a\x32\x86\xbd\x17\x2f\x92\x87\x34\xe0\x7a\x43\xee\xde\x0d\x4b\
-\x4b\xe3\x59\x7e\x32\xa8\x32\xe1\x7f\xfa\x68\x33\xeb\xb1\x56\x7e\
-\x82\xbf\x6a\x22\x0d\x38\xc6\xfc\x47\xc2\xd6\xd0\xca\x29\xcd\x9f\
-\xe8\x6f\x5f\x73\x18\x93\xac\x82\xe8\xf3\x27\xcb\x94\x63\x2d\x9e\
-\x6a\x6a\x92\x72\x87\x22\x70\x88\xcd\x77\x93\xb0\x02\x4c\xd4\xf6\
-\xab\x4d\xf0\xc7\xae\x71\xe2\x73\x0b\xa0\x96\x52\x77\x21\x33\x04\
-\xb3\x8c\x61\x96\x91\x77\x3a\x0c\x7b\x3d\x72\xc5\x03\xe4\xdd\x6e\
-\x25\xc0\x1b\x1b\xec\xbf\xff\x7e\xce\x7e\xf8\xc3\x0c\xcb\x12\x93\
-\x65\x58\xe7\x2a\x6e\xc8\x5a\x70\x8e\x9c\x2a\x91\xbf\xee\xa2\xec\
-\x7d\x35\x1a\x3e\xd4\x8d\x34\x5c\x40\x6b\xf1\x21\xa9\xac\x63\x0c\
-\x37\x5c\x75\x15\x8f\x3f\xff\x7c\xdb\xd7\x3a\x10\xc2\xe2\xff\xe8\
-\xd5\x0c\x00\x0f\x02\x0f\xe8\x03\x25\x70\xf4\xc0\x01\xf6\x1f\x3c\
-\xc8\x60\x7d\xbd\xd9\xb9\x57\xfa\xb1\x3b\x57\x6d\x6c\xdd\xd2\x3b\
-\x2e\xf7\x15\xc4\x0f\x68\xac\x01\xa0\x08\x7d\xff\xf6\x5c\xba\x34\
-\xfe\x89\xf6\xef\x87\x99\x99\xaa\xb6\xdb\x98\x6d\xbf\x80\x4f\x08\
-\x7d\x43\x43\x46\xef\x11\x83\x85\x6f\xf3\x8f\x53\x25\xc6\xfa\x5e\
-\xb5\x23\x4f\x6a\xe4\x9d\x66\x23\x4e\x70\x23\x4c\x34\x16\x8b\xd4\
-\xe7\x68\x79\x9f\x54\xbb\xb2\x54\x8c\x3f\xee\xc1\xef\xd5\xb1\x98\
-\xf0\xf3\x89\x48\xc0\x18\x60\xe9\xff\x11\x4c\x6c\xaf\xc0\xd1\x39\
-\x47\x61\x0c\x99\x58\x86\xc1\x15\xa8\xef\x87\x43\x8a\x6e\x97\x22\
-\xcf\x19\xf5\xfb\x2c\x1e\x3a\xc4\xfc\xcd\x37\xb3\xf6\xc9\x4f\x62\
-\x66\x67\xab\x7d\x17\x7e\x53\x17\x84\xdf\x04\xae\xa1\x1e\xc5\xa6\
-\xbf\xb7\xb5\x15\x58\x64\x59\xc3\xf2\x29\xbd\x67\xef\xd2\x12\x07\
-\x96\x96\x78\xf6\xe2\xc5\x36\xe1\xfb\xe3\x54\x9d\xb0\x86\xaf\x56\
-\x00\xf8\x9e\xd8\xf5\x30\xc0\xf5\x37\x56\x4d\x7f\x65\xde\x5b\xac\
-\xfd\xeb\x7b\x01\x05\x69\xf6\x21\xd3\x7c\x54\x83\x4f\x2d\xf8\xda\
-\x2c\x5b\x18\x0e\x99\x5f\x5d\x6d\x32\xb1\xd6\x56\x16\x80\x31\x15\
-\xe0\xd8\x9d\x7b\x45\x26\x4c\x9c\xd5\x42\xee\x5b\x40\x40\x6b\x7b\
-\xd3\x06\x08\x93\x7a\x0d\x44\xc9\x33\x63\xda\x4f\x67\x2e\xc6\x5a\
-\x74\x1b\xd7\x45\x37\xdb\x94\xe7\x2e\x05\x42\xf1\xe7\x12\x8b\x29\
-\xa1\xf1\x63\x70\xf0\x71\xd8\x6f\x02\x10\xa5\x5c\x00\x3f\x21\x0d\
-\x38\x76\x2d\x08\x9f\x5f\x1a\xb3\x18\xc0\x19\x53\x67\x02\xe6\x83\
-\x41\x25\xf0\xbd\x5e\xd5\x46\x6c\x38\xa4\x33\x1a\xe1\xba\xdd\xaa\
-\x07\xe0\x60\xc0\x81\x07\x1e\xe0\xfc\x27\x3f\x59\x59\x01\xd6\x82\
-\xb5\x15\x20\x1a\x53\x7f\xef\x9e\xb5\x64\xa1\x9f\xa4\x4d\x44\x4c\
-\x1a\x7c\x4d\xb0\x04\x3a\x9d\x0e\xc7\x0f\x1e\xe4\xd9\x68\xee\x84\
-\x5a\xb7\x51\xb5\x0f\xfb\xaf\xaf\x46\x00\x38\x48\x94\xfa\xe8\x80\
-\xa5\xf9\x79\x0e\x1e\x3c\xc8\x60\x63\xa3\xea\xd7\x27\x17\x30\x72\
-\x03\x7c\x64\x11\x88\xc0\xa3\xaa\xb3\xea\xc4\x0c\xc9\xdc\x0a\xe7\
-\x0c\xac\xe5\xaa\xd5\x55\x32\xe7\x1a\x4c\xac\x99\x9d\x85\xe5\xe5\
-\xb4\xb0\xb5\x99\xf2\x4a\xc0\x4d\xd0\x3a\x0d\x12\x2b\xa5\xe9\xdb\
-\xde\x23\x55\x0f\x90\xd0\xfc\x5e\xf3\x13\x5a\xf8\x12\xe6\xef\xb6\
-\x42\x15\xbb\x0e\xa9\x6a\x45\x48\x46\x14\x26\xf5\x2f\xd4\x02\xde\
-\xa8\xd7\x8f\x43\x96\x93\xac\x9f\x84\x3b\x91\x9c\xe5\x37\x29\x69\
-\x48\x7d\xd6\x1a\x08\x8c\xa9\x14\x41\x00\x01\xc9\x09\x18\xa9\xc4\
-\xa0\x6e\xd8\x2f\xc3\x8d\x0d\x56\x8e\x1f\xa7\x7b\xe4\x08\xfd\x13\
-\x27\x30\xdd\x6e\xd5\xb5\x49\x81\x80\xb4\x02\xef\x7a\x5f\x1d\xd7\
-\x1c\x4b\x78\x8e\xf7\xf8\x2c\xab\x2c\x88\x00\x00\xa5\xf7\xec\x5f\
-\x5a\x62\xb1\xd7\x63\x6d\x30\x68\x23\xe1\xfe\xc8\xab\x15\x00\xde\
-\x41\x34\x41\xb5\x04\xae\x3e\x7a\x94\xbc\xd3\x61\x14\xf9\xfe\x35\
-\xf2\x47\x96\x80\x6e\xca\x80\x6a\xd5\xd4\xa8\xd7\x56\xa4\x4c\x19\
-\xdc\x89\x95\xf5\xf5\xf1\x4f\x34\x3f\x0f\x61\xca\xef\x76\x0d\x2a\
-\x93\xae\x40\xa4\xf5\x53\x9a\xc9\xb7\xfd\xad\x62\xda\x7d\x2c\xc4\
-\x13\x84\xc2\xc7\x6e\x80\x2e\x49\x56\xa4\xa2\x4f\x25\x32\xb5\xf1\
-\x00\xb1\x39\x1f\x6a\xe2\x53\x29\xce\x93\x34\x7d\xb2\xc5\xf9\x76\
-\x8c\x7e\x82\xf0\x33\x09\xad\x1e\x7f\x96\x98\xff\x68\x5c\xc3\x70\
-\xb3\x21\x2f\xc0\x18\x53\x93\x81\x85\x9a\x25\x50\x74\xbb\x75\x54\
-\x60\x34\x1a\x91\x77\x3a\x94\x59\xc6\x8c\xf7\x1c\x7c\xdd\xeb\xf8\
-\xec\xbf\xfb\x77\x64\x9d\x4e\x65\x2c\x0a\xb1\x68\x2d\xae\x2c\x2b\
-\x40\x93\xf1\xec\xa1\x14\xdc\x38\x57\xf1\x01\xd2\x3c\x55\xb4\xbf\
-\x5c\x53\xef\xc9\xb2\x8c\xab\x96\x97\x79\xf8\xe4\xc9\x36\x00\x78\
-\x1b\x55\x0b\xb1\xa7\x5f\x6d\x51\x80\x6f\x49\x85\xfe\x0e\x1f\x3e\
-\xcc\x70\x73\x73\xab\x62\x2b\xc4\xf3\x47\x21\xf1\xa7\x50\x61\x9c\
-\xc6\x7d\x59\x6e\x85\x78\xa2\x90\xdf\x48\x9a\x3e\x86\xa2\x8e\xd9\
-\xd1\x88\x85\xf5\xf5\x71\x93\x7d\xcf\x1e\xe8\x76\x9b\x4d\x3f\xa3\
-\xb8\x7e\x3c\x30\x62\xcc\x94\x8e\xd2\x74\xb7\x0d\xff\x29\x70\xf3\
-\xd1\x68\x72\x9f\x7a\xef\xa8\x43\x6d\x9c\x81\xe8\x5b\x7a\x14\x36\
-\xc6\x9e\x4f\xd2\xb2\xea\x1c\x33\xa1\xbb\x71\x2a\xf3\xb0\xee\xa4\
-\x9b\xe2\x23\x22\x6b\x23\x69\xc6\xb7\x64\xf8\xc5\xae\xc2\x4e\x06\
-\xb1\x36\xde\x4f\xf7\x0e\x54\x79\x01\x75\x6e\x88\x84\x04\x43\x89\
-\xf0\x48\x27\x97\x85\xc4\xa0\x43\x77\xdc\x41\xbe\x77\x6f\x95\x44\
-\xa4\xa2\x00\xc3\x90\x4e\x3e\xf0\x9e\xbe\xf7\x0c\x8a\xa2\xda\x6b\
-\x21\x74\x58\x94\x25\x23\xd9\x8b\xc1\xea\xa8\x8f\x15\x05\xc3\xa2\
-\x60\xff\x9e\x3d\x74\xda\x43\x82\x8b\xc0\x37\xbe\xda\x2c\x80\xeb\
-\x81\x2f\x8b\xb5\xff\xfe\x3d\x7b\x98\x9b\x9f\x67\xa8\x7d\x7f\x9d\
-\xc5\xa6\xa6\xf6\x7a\xdd\x9f\x4d\x5c\x01\xf9\x71\xa5\xc3\x8f\x54\
-\x83\x05\x16\xd8\x95\x25\x43\x60\xcf\xfa\x3a\xb9\xf7\x94\x91\xd9\
-\x6d\xe6\xe6\x6a\xbf\xae\xcd\xf4\xf7\xda\xcc\x97\xc7\x3a\x52\xa0\
-\x37\x9f\x7a\x9e\xb6\xfc\x7d\xf2\xff\xb5\xba\x02\x93\x84\x5b\x6b\
-\xfd\x94\xb6\x8e\xa3\x01\x71\x48\x2e\xa1\xc9\x7d\xf4\x1e\x3e\x91\
-\x87\x60\x52\x9f\x57\xb5\xd4\x16\xd7\xce\xc7\x7f\xdf\xa2\xfd\xb7\
-\x73\x5b\x7c\x8b\xe9\x9f\x02\x1e\xd3\x62\x49\x95\x52\x09\x69\x6d\
-\x9d\x14\x24\x56\xe7\xa8\xdb\xdd\x4a\x11\x2e\x0a\x3a\x65\x49\x91\
-\x65\xcc\x76\x3a\xec\xbd\xfb\x6e\x4e\xfc\xfa\xaf\x63\xf2\xbc\xee\
-\x7a\x24\xd9\xa2\xce\x7b\x9c\xb5\xf8\xe0\x12\x58\x6b\xc9\xbc\xaf\
-\xba\x39\x07\xcd\x6f\x60\x6b\xbf\x58\x5b\xef\xdd\xd9\x6e\x97\xdd\
-\xf3\xf3\x9c\x59\x5b\x23\x4b\x6f\x95\x6f\x00\xfe\x31\xdb\x24\x40\
-\x5e\x49\x00\xf0\xd5\x54\xc5\x3f\x0d\x7f\x79\xff\xfe\xfd\x78\xe7\
-\x28\x46\xa3\x66\xd1\x8b\x1e\xc3\x24\x1b\x59\x0b\xbf\xba\xd7\x84\
-\x9f\x54\x84\xe9\x74\x4d\x0f\xec\xeb\xf7\x1b\x02\x5a\x13\x80\x0b\
-\x0b\x63\x43\x21\x7d\xf8\xb1\xc6\x7c\xf5\x30\x2d\xb7\x36\xc3\xd5\
-\xe3\xda\x05\x50\x8c\x71\x6b\xe4\x20\x32\xfd\xcd\x04\xc2\x4f\x6f\
-\x64\xbf\x4d\x14\xc0\xeb\xf7\x4d\x54\x14\xee\x28\x1b\x31\x8e\xef\
-\xc7\x71\x76\xad\xfd\x63\xd6\x3e\xf1\x39\xda\xf2\x16\x62\x93\x3e\
-\x15\x01\x48\x0e\xed\x6c\xa9\xac\x24\x32\xff\x35\x19\x68\x03\x59\
-\xeb\x00\xab\x34\x72\x11\x2c\x4c\xc9\x0e\x1c\x0d\x06\x14\x33\x33\
-\x75\x65\x9f\x1f\x0c\x38\x72\xd7\x5d\x3c\xf5\xde\xf7\x32\x2c\x4b\
-\xac\xb5\x0c\xc5\x05\xa0\x2a\x5a\xab\x07\xca\x7a\x4f\x1e\x46\xcb\
-\x37\x46\xc7\xcb\xbe\x90\xfe\x12\x21\x47\x21\xcb\x73\x56\x16\x17\
-\x39\xb3\xb6\xd6\x26\x2f\xf7\x03\xc7\x80\x27\x5e\x2d\x00\xf0\xb6\
-\x31\xf3\x3f\xcf\x59\xde\xb3\x87\x41\xbf\x5f\x13\x7c\xa9\x22\x1b\
-\x0d\x00\x4e\x36\x84\x22\xfa\xe2\xc6\x8d\xa5\xa0\x73\x30\xd9\xe6\
-\x9c\x63\x69\x63\xa3\x61\xfe\x03\xf8\x6e\xb7\xe2\x00\xe2\xcd\x2f\
-\x00\xa4\x04\x5e\x06\x52\x10\x6b\x79\x0d\x2a\x1a\x2c\xe2\x70\x96\
-\x0c\xd3\x88\x98\x73\x33\xc9\xe7\xa7\xa5\xdf\x60\xd8\x78\x49\xc2\
-\x31\x15\x49\x68\x49\x3e\xa2\x4d\xa0\x62\x01\x8f\x09\x39\x89\x7e\
-\x24\xfa\x24\xc6\x16\x88\x06\x0f\x9f\x02\x83\x28\x17\x22\x65\xc2\
-\xb7\x12\x7f\x2d\x7c\x4c\xfc\xbb\xe8\x89\x42\x65\x88\xdd\x17\xa3\
-\x51\x15\xf6\x1b\x8d\xe8\x84\x48\xc0\x8c\x4a\x2c\x73\x81\x1b\x58\
-\x39\x78\x90\xdd\x37\xdd\xc4\xf9\x4f\x7c\x02\x3b\x33\x53\x37\x7e\
-\xf5\x6a\x7c\x7a\x0d\x06\x81\x67\x30\x01\x04\x24\x07\xa1\x56\x1a\
-\x01\x08\x7c\x70\x15\x76\xcd\xcf\xd3\xb5\x96\x42\x6a\x31\x9a\x6b\
-\x2e\x28\xcd\x9f\x7a\x35\x00\xc0\x4a\x88\xff\x37\xd9\xff\x5d\xbb\
-\xe8\xe4\x39\xa3\xe1\x70\x8c\xa4\x6a\x34\x7c\x54\x16\x41\x63\x42\
-\xac\x1a\xec\xe1\x75\xd7\x16\x65\x01\xf4\x81\xa3\xfd\x7e\xc5\xf0\
-\x46\xc9\x3a\xe8\x58\xad\x6c\x3c\xf9\xc1\x5a\x08\xbc\x86\xa9\xaf\
-\xee\xc7\x88\xb9\xd8\x0a\x50\x82\xef\x53\x42\x9e\xd2\x98\x91\x15\
-\xe0\xdb\xf2\xe7\x27\xb0\xf5\x29\x0d\x9f\xfa\xff\x3e\x15\x76\x8b\
-\xb4\x6f\x63\x76\x5e\x64\x15\xc4\x82\xae\xe3\xfa\x9a\xf0\xf4\x2d\
-\xc0\xd2\x2a\xe0\x6d\x2e\xca\x84\x0c\xc9\x64\xb6\x61\xd8\x13\x16\
-\xea\x52\x61\xe9\x20\xdc\x09\xc2\x3e\x1c\x0e\xe9\x49\x96\x69\x51\
-\x50\x66\x19\x76\x34\xe2\xc8\xbd\xf7\x72\xea\x63\x1f\x23\x0b\xda\
-\xbe\xb6\xd8\x82\x25\x20\x91\xa5\x8e\x8c\x56\x0f\xd6\x82\x65\x6b\
-\x9a\x11\x8a\x0c\x14\x5e\x22\xcb\x32\xe6\x67\x67\x39\xbf\xbe\xde\
-\xe6\x06\xbc\xf9\xd5\x02\x00\xf7\x01\x7b\xe3\x83\xbb\x97\x96\x2a\
-\x54\x1e\x8d\x1a\xcc\x6e\xaa\xab\x4e\x3d\x93\x4d\x4f\x6d\x89\x04\
-\xdf\x4b\x4b\xe7\x90\xae\x59\x06\x70\xd8\xd7\xef\x37\xc2\x75\xb5\
-\x4f\x96\x65\x15\x08\x88\x3b\x21\x5a\x3e\xd2\x24\x72\x7c\xec\xef\
-\x35\x27\x90\x22\xb1\x52\x7c\x42\x64\xfa\x27\x3b\x0c\xc7\xe6\xb1\
-\xf8\xde\x91\xd9\x9d\x6c\x44\xd2\x62\xfe\xc7\x40\xe2\x53\xa5\xcb\
-\x9a\xd0\x4b\x91\x85\x91\x15\xe0\x23\xe0\x4b\xba\x06\x93\xc2\x9c\
-\x09\xd7\xc2\x4f\x4a\x79\xde\xc6\x21\x36\x21\xd9\x26\x19\x1a\x0d\
-\x20\xe4\x42\xe6\x9e\x14\x00\x95\x3a\x19\x48\xea\x04\x66\x66\x6a\
-\x97\x72\xb4\xb1\xc1\x55\x37\xdf\xcc\xc7\xf7\xee\x65\x74\xf1\x62\
-\x3d\x5c\xc5\x1b\x53\x8d\x0f\x0b\xa1\xbd\xdc\x7b\x9c\x31\xe4\xd6\
-\x56\x89\x41\xce\xd5\x63\xd4\x64\x8f\xd5\x7b\x29\xb8\x01\x06\x98\
-\x9f\x9b\xe3\x7c\x2a\x3a\x55\xad\x07\x80\x79\x60\xfd\x4a\x07\x80\
-\xd7\xc7\x5a\x34\x37\x86\xc5\x85\x05\x8a\xc1\xa0\xba\x90\x09\x82\
-\xc8\x4b\x61\x8e\x12\x76\x79\xdd\xc5\xd6\x80\xbe\x85\x0e\x2e\x85\
-\x73\x64\xde\xb3\x77\x38\x6c\x9a\xff\xb2\x21\x3a\x9d\x0a\x04\x22\
-\xb3\x3c\x36\x1f\x7d\x8b\x2f\x1f\xa7\x02\x4f\x12\xf8\xd4\xe6\x4d\
-\x69\x74\x2d\xe8\x6d\x26\x7d\xeb\xe3\x28\x1a\xe1\x15\x41\x97\xac\
-\x73\x88\xab\x17\xe5\x5a\xab\x73\x5c\xac\xcd\x5b\x22\x02\x31\x18\
-\x8c\xb9\x19\x6d\x56\x49\x2a\x67\x22\x06\x96\x1d\x86\x63\xdb\x78\
-\x17\xdd\xf3\x51\xef\x1b\xc9\xe1\xaf\x23\x02\x52\x5d\xaa\x6b\x4b\
-\xf2\x9c\xd9\x3c\xe7\xd0\x3d\xf7\xf0\xe8\xaf\xfc\x0a\x76\x7e\xbe\
-\x36\xd7\xc5\xf2\xec\x68\x37\x20\x84\x1c\xad\x4c\x71\x0a\x7c\x80\
-\xb7\xb6\xe6\x8d\xbc\x72\x1d\x7a\xbd\x5e\x9b\xf6\x87\xaa\x3a\xf0\
-\x0e\xe0\x03\x57\x3a\x00\xbc\x2e\xfe\x61\x66\x67\x66\xc8\x83\x0f\
-\xe6\xa3\x98\xae\x57\x84\x5a\x23\x85\x34\x12\xfa\x52\x78\x81\xf0\
-\x9a\xf6\xfd\x5d\x98\xfc\x7a\xa4\x2c\x99\x1f\x8d\x28\xa3\x90\x8b\
-\x87\x4a\xf8\x53\xc9\x38\xc1\x54\x4b\xa5\xfb\xd6\x56\x40\x9c\xff\
-\x3f\x21\x02\x10\x6b\xfd\xb6\xd8\x78\x4a\x53\x4e\xcc\x0f\x98\x20\
-\x64\x49\xd2\x2e\x65\x3e\xeb\xcf\x17\xf1\x20\x2e\x12\x66\x27\x02\
-\x94\xb2\x24\xda\xe2\xfb\x91\x65\xe0\x52\xc2\xbd\x13\x70\x93\x49\
-\xbd\x1a\x98\x62\x77\x31\x51\x67\xe0\xa3\xb6\xe4\x2e\xec\x17\x69\
-\x19\x26\xd9\x81\x52\x25\x58\x0f\x13\x91\x4c\x53\xe7\xf0\xa3\x11\
-\xd7\xdc\x7e\x3b\x9f\xff\xad\xdf\x62\xe8\x5c\x95\xdf\x2f\x00\x10\
-\x3e\x9f\x0d\x24\x5f\x19\x0b\xbf\x70\x05\x4a\xfb\x7b\xc0\x59\x5b\
-\x7d\x87\x2c\xa3\xd3\xed\x32\x1c\x0e\x53\x3c\x80\x0d\x64\xe0\x15\
-\x0d\x00\xbb\x02\x8a\x35\x36\xd7\xc2\xdc\x1c\x84\xd8\xe9\x58\x42\
-\x47\xec\xf7\x6a\xd6\x5f\x1d\x77\xba\x05\x94\x12\x7c\xd9\xa8\x43\
-\x60\x65\x30\x20\xf3\xbe\x59\xfc\xd3\xa2\x89\x7d\xe4\xd3\x6b\xe2\
-\xcf\x47\x1a\x3e\xf5\x38\x19\x1a\x9c\xa0\xf5\x53\x04\x57\x23\xa4\
-\x97\x02\x84\x16\x72\xd0\xb7\xf9\xc3\xca\xac\xf7\x91\x50\xf8\x18\
-\xfc\x98\x90\x83\xdf\xe6\xa2\x25\x7c\x73\xb9\xfe\x3e\x95\xe7\x1f\
-\x01\x42\xb2\xb2\x31\x05\x68\x97\x91\x98\x45\x0a\x98\x68\x76\x10\
-\xae\xad\xc4\xb2\xa4\x23\x40\x20\x09\x41\x83\xc1\x56\xe7\x60\xef\
-\xab\x89\x3f\x47\x8f\xb2\x78\xcd\x35\x5c\xfc\xdc\xe7\xb0\xbd\x1e\
-\x0e\xc8\x55\x64\x28\x0b\xc0\x92\x09\x0f\x10\x8a\x87\xea\x68\x80\
-\x44\x95\x8c\xa1\xb4\x76\x6b\xae\xa1\xb5\xe4\xbd\x1e\xc3\x61\x6b\
-\xea\xff\x1d\x57\x3a\x07\x70\x3d\x51\xbb\x23\x03\xcc\xf6\x7a\x75\
-\x17\x95\x31\xc2\x2b\x4e\x94\x09\x3f\x1a\xd1\xdc\xf6\x7a\x2c\x94\
-\xae\xff\x0e\x7e\x60\x19\xac\x86\xc3\xa3\x51\xf5\xb7\x89\x2c\xbd\
-\x38\x01\x67\x4c\xbb\x47\xf1\xff\x06\xf1\x97\xf0\xff\x5b\x0b\x7e\
-\x5a\x04\xab\xcd\x0d\xa0\xc5\xfc\xf7\xa9\xa4\x9f\x49\xec\x7a\x9b\
-\x1b\xa2\xbf\xd3\x4e\x92\x6b\x14\x50\xd4\x7c\x88\xbc\xa6\xdc\x0e\
-\x97\x22\x0f\x53\xb9\xfc\x09\xee\x20\x06\x85\x31\x10\x98\xd0\x3e\
-\xcd\xa7\x78\x90\xe8\x3b\x18\xf5\xbb\xba\xc0\xe2\x3b\x55\xb3\xaf\
-\x93\xd0\x4a\xd5\x39\xd8\x97\x25\x3e\xcf\xe9\x02\x57\xdf\x7d\x37\
-\x7f\xf0\xa9\x4f\x91\x77\x3a\x0d\x6d\xee\xbd\xa7\xb4\x96\x2c\x08\
-\x94\x09\x16\x41\x1e\x8a\xcb\xea\x70\xb1\x54\x07\x06\xd2\xd0\x85\
-\xbf\x97\x4c\xc3\x96\x75\x3b\x55\xe1\x61\x79\xa5\x02\xc0\x2d\xe1\
-\x0b\xd4\x3f\x46\x66\x0c\xdd\x4e\x67\xcb\xfc\x6f\x23\xb4\xc4\xec\
-\x8b\x4c\xce\xda\x0c\x95\xe1\x8d\x82\xea\x61\xa2\x8b\x0b\x61\x96\
-\x79\xef\xd9\xad\xcc\x7f\x5d\x2f\xee\xbd\x87\xa2\xc0\x14\x05\xe4\
-\x79\xd3\x77\x4d\x98\xf2\x4e\x5b\x06\xb1\x8f\x99\x72\x2f\xb6\x79\
-\x3e\x96\x4c\x43\x34\xff\x6e\x52\x78\x2d\xf6\xf3\x5b\xfe\x97\x24\
-\xa1\x98\x09\x53\x88\xe2\x22\x26\x3f\x29\xfa\xa1\xaf\x9f\x02\x07\
-\xdf\xd2\xe7\xcf\xb7\xf4\x48\xf4\x6d\x49\x42\x2d\x40\x3a\xa9\xbc\
-\x3a\x2e\x8e\x6a\x4b\x18\xd2\xe9\xc9\x42\xe0\x89\xd2\x90\x88\x40\
-\x29\x59\xa8\xaa\xd9\x8c\x90\x81\xc5\xc6\x06\xc7\x6e\xb9\x85\x8f\
-\x2c\x2e\x32\x18\x0e\xf1\x59\xd6\xe4\xb4\x42\x21\x99\xa4\x1f\x1b\
-\xe7\xb6\x92\xce\xc2\x6f\xe0\x24\x81\x28\x5c\xb7\x52\xc8\xc0\x2c\
-\x63\x42\x0d\xea\x0d\x21\x8a\x76\xfa\x4a\x05\x80\x9b\xe2\x03\x9d\
-\x3c\x27\xb3\x96\xa2\x28\xb6\xfa\xcb\x45\x9b\x3a\x36\x79\x9d\x62\
-\xaa\x6b\xe1\x67\x2b\xe3\xac\xd4\xb9\x00\x54\xb5\x94\xd7\x96\x25\
-\x33\xfa\x87\x88\xb5\x62\x18\x26\xc2\xcc\x4c\x4d\x94\xf9\x58\xd0\
-\x75\xe6\x9f\x08\x7a\xcc\xfc\x27\xfc\xff\xa4\x8b\xb0\x8d\x2b\xd0\
-\x36\x73\x30\x39\x4e\x4c\x03\x99\x30\xd3\x51\xfb\x6c\xad\x35\x5d\
-\x4b\xd8\x2e\xe9\xb7\x87\x9c\x05\x17\x5b\x0b\x92\xcb\x90\x48\xcf\
-\x6d\x5c\x8f\x94\x6b\x31\xa1\xa3\x52\xea\xf5\x89\x6e\x47\xc2\xaa\
-\x48\xf5\x12\x8c\x3f\xa7\x53\x8f\x05\xb8\xca\x10\x1e\x16\xbf\x5f\
-\x37\x0c\x15\x37\xc0\x7b\x4f\x59\x14\x2c\xef\xd9\xc3\x9e\x6b\xaf\
-\xe5\xf4\x27\x3e\x51\x55\x08\x0a\x2f\x65\x4c\xa5\xcd\x03\x3f\x20\
-\xc3\x57\x6d\x70\x0f\x7c\x78\x2e\x19\x83\xb2\xcf\x44\x31\x39\x63\
-\x2a\x3e\xaa\x4c\x2a\xf9\x05\xe0\xf8\x95\x0c\x00\xd7\x8d\x25\x00\
-\x75\xbb\x5b\xe6\x63\xdc\x1c\x33\x36\x01\x13\x1b\xb8\x31\xb5\x55\
-\x84\x3f\x98\xfe\x02\x06\x25\xb0\x32\x1a\x91\x79\xcf\x28\x10\x31\
-\xda\x7f\x36\x21\xca\xe0\xa5\xc1\x88\x76\x35\xe4\xdc\x58\xa8\xf5\
-\xb1\xd8\xad\x90\xe4\x98\x96\x7e\x02\xbe\xc5\xe4\x4f\x25\xfe\xb4\
-\x12\x7b\x09\x30\x49\x36\xda\x88\xce\x77\x0a\xc0\x6c\x14\xee\x6c\
-\xf0\x0e\x3a\xd9\x29\x01\x0a\xc2\x27\x68\x57\x28\x9e\x05\xe8\xe3\
-\x3c\x88\x09\xc4\x5c\x1b\x38\xa4\x7a\x02\x48\xe9\x75\x8a\x37\x71\
-\x13\xd2\x8c\x1b\x51\x00\x15\x65\x91\xa4\x20\x2b\xfe\xb8\x44\x04\
-\xc2\x10\x11\xb1\x04\x6a\x2b\x20\xcf\x99\x33\x86\xe3\x77\xdd\xc5\
-\x53\x1f\xfd\x28\xb9\xe2\x51\x32\xf5\x79\x6d\x59\x6e\x71\x00\x6c\
-\xb5\x48\x2f\xd5\x9e\x72\x02\x06\x01\x10\x4a\x63\xaa\xaa\xc1\x34\
-\x00\x64\x01\x00\x7e\xff\x4a\x04\x80\x8c\xa8\xf1\x67\x45\xbe\x67\
-\x75\xec\xbe\x36\xe1\xa2\xe2\x11\xa7\x9b\x47\x44\x3e\xa1\x76\x01\
-\xb4\x4b\xa0\xdd\x80\xcc\x18\x0e\x7b\x5f\xb7\x5f\x8a\x37\x95\x03\
-\x18\x0e\xf1\xfd\x3e\x66\x71\x31\x6d\xde\x47\x82\x9f\x4c\xe4\x89\
-\xdd\x85\x6d\xcc\xf2\xe4\x31\xa5\xa1\x5a\x43\x63\xaa\xfc\xb8\xd5\
-\x42\x48\xbd\xb7\x4e\x4b\x6d\xfb\x2c\x31\x27\x90\xf0\xb9\x9d\x06\
-\x62\x05\x98\x3e\xe1\x76\x8c\x07\xe8\x4d\xc3\x5c\x1f\x4b\xea\x49\
-\xb9\x1a\xdb\x0c\x5c\x71\x2d\x6e\x40\xb2\x30\x89\xf1\x5e\x0c\x75\
-\x54\x43\xda\x77\xe5\xf9\x96\xef\xaf\x66\x4d\x94\xaa\xef\xc4\x68\
-\x7d\x9d\xeb\x6e\xbb\x8d\x0f\x2c\x2e\x32\xea\xf7\xeb\x24\x32\x17\
-\x22\x00\xd2\x1c\xc4\xaa\x49\xc9\x28\x0b\x4d\xf6\x50\xad\xcc\x02\
-\x00\x38\x6b\xab\x0a\xc2\xf6\x75\xec\x4a\x25\x01\x67\x88\x3a\x9d\
-\x9a\x00\x00\xa5\x34\xf0\xd0\xfd\xe3\x24\xf4\x97\x88\xd9\x37\x98\
-\xff\xd8\x0a\x50\xc2\xef\xa8\xfa\x0b\xee\x2a\x4b\x96\x8a\x82\x22\
-\xf2\xcf\x9d\xde\x04\xce\xc1\xea\x2a\x76\xdf\xbe\xad\xcd\x18\x10\
-\x7a\x8c\x04\x6c\xf1\xf9\x7d\x4b\x07\x20\xfd\xff\x76\x62\x0d\x6c\
-\xc7\x78\xfb\x49\xcd\x42\x64\x73\x25\xac\x8b\xb1\xa8\x41\x6c\xdd\
-\xc4\x91\x8f\x08\x14\x9c\x06\xc0\x44\xc8\xd4\x6c\xd3\xb3\xaf\xd1\
-\x8e\x5c\xb9\x29\x26\xc1\x19\x30\x01\x44\xdb\x7a\x00\xb8\xb6\x1e\
-\x0a\x51\xe4\x41\x5f\x57\x49\x0a\xf3\x21\x31\xa8\x84\x46\xef\x48\
-\x21\x05\x25\x2d\xd8\xab\x14\xf3\xdd\xf3\xf3\xac\x5c\x73\x0d\x27\
-\x3f\xf9\xc9\x2d\xdf\x5d\x0d\x68\x15\x10\xc8\x24\x44\x29\xc0\xad\
-\x00\x5e\xac\x32\x71\x1f\xca\xe0\x3a\x4c\x80\x80\x43\x57\x2a\x00\
-\xac\x00\xbb\xc7\x36\x86\x31\x55\x8b\x2e\x9d\xb8\x12\x08\x12\x12\
-\x1a\xc2\x08\x69\xa3\x90\xbb\x41\x06\x86\x8b\x2b\xcf\x87\xc0\x41\
-\xef\x99\x51\x16\x80\x16\x10\x0d\x02\x6e\x75\xb5\xae\xec\x4a\x09\
-\xaa\x8b\x18\x64\xdf\x62\xfe\xfb\xc8\x0f\xd6\xc9\x27\x49\x1e\x20\
-\x36\x73\xb5\x6f\x4a\x7a\x0c\x36\x11\x00\x99\xd8\xf7\xd6\xc7\x94\
-\x89\xae\xdf\x3b\xc5\x23\x8c\x59\x30\x71\x7a\xb3\x02\x0d\xdf\xc2\
-\x7f\xc4\xdd\x85\x35\x0f\x90\x02\x82\x54\x47\xe1\x54\xbd\x80\x4b\
-\xd4\x25\xa4\xba\x03\x7b\xe5\x0a\x98\x96\xb4\x69\x93\x48\x10\x72\
-\x9a\x53\x0a\x7d\xfc\x4b\x35\x67\x52\x2c\x01\xc9\x38\x9d\xef\x74\
-\x38\x7e\xd7\x5d\x3c\xf6\xf1\x8f\xd7\xdd\x80\xf2\x70\x4d\x4c\x10\
-\x7c\x1b\x04\x5b\xbe\xaf\x8d\x2d\x59\xd1\xfc\xc2\x5f\x05\x00\xb7\
-\x6d\x16\x14\xec\xbb\x52\x01\xe0\x10\xd0\x8b\x37\xa8\x0d\xa8\xd7\
-\xc8\x50\xd3\xd9\x80\x4a\xe8\x7c\x22\xfd\xd4\x69\x20\x90\x1f\x5f\
-\x12\x3c\xc2\x6d\xa5\x28\xb6\x2e\x3c\x8c\x35\xbf\xa8\x37\xf7\xc5\
-\x8b\x15\x11\x18\x4c\xb0\xb1\x58\xb8\x26\x6f\x12\x85\x3f\x49\x2d\
-\x15\x09\x71\x9b\x66\xf3\x7a\x63\x2a\x13\xb1\xa1\xa9\x5b\x42\x78\
-\x46\x77\x24\x8a\xcd\xeb\x09\x26\xbe\x4f\x98\xfc\x8d\xcf\x94\x10\
-\x72\x1f\x71\x01\x8d\xbf\xd3\x2e\x86\x12\xec\xf8\x5a\xc4\x0d\x48\
-\x8c\x7a\x1f\x29\xb1\x75\xa9\xd4\xe2\x09\x16\x80\x8b\x9a\xa7\xb6\
-\x69\xff\x64\xe8\x35\xfc\x7f\x57\x96\xf5\xfe\x29\x55\xdf\x09\x9d\
-\x0d\xe8\x54\xb8\x7a\xb4\xb6\xc6\xf5\xb7\xde\xca\xfb\x77\xed\xaa\
-\xc6\xd6\x59\x5b\x03\xa0\x58\x16\x62\x09\x18\xa9\xfc\x54\x5c\x89\
-\x53\x96\x97\x53\x9d\x85\xfc\xf6\x8a\xf4\x8a\x04\x80\xbd\x3a\x04\
-\x88\xda\xe8\x12\x86\x49\xc6\xbc\x63\x01\x50\x1b\xc3\x45\x05\x27\
-\x2e\xe2\x05\x4a\xef\xe9\x1a\xc3\xa1\xe0\x0a\xe8\x18\x6c\x32\xb4\
-\xb5\xba\x8a\x59\x5f\xc7\x2c\x2e\x6e\xf9\xba\x91\xf9\x9f\x02\x8e\
-\x54\xc5\x99\x6f\xe1\x1b\x7c\x4b\x74\x20\x25\xa0\x63\x5d\x76\x27\
-\xf4\x17\xf0\xb1\xd6\x4f\x11\x6c\x2d\xb9\x00\x3e\x8a\xe9\x37\xde\
-\x2f\xf8\xb4\x8d\xef\xa1\x35\x7a\xe4\x0a\xa4\xf2\x0a\xa4\x37\x9e\
-\x15\x3e\x47\x01\x85\x89\x34\xb2\x16\x20\x13\x71\x3f\x0d\xa5\xa0\
-\x73\x0d\xb6\x21\x02\x7d\x0b\xf8\x36\x78\x26\xb1\x3a\x43\xe6\x67\
-\x3d\x3d\x4a\xb5\x9c\x17\x22\xb0\x54\xe9\xc3\x2b\xbb\x76\xb1\x6b\
-\xef\x5e\xce\x3f\xf9\xe4\xd6\x18\x79\xe5\x02\x64\xe2\x46\xca\x35\
-\xd0\x56\xa3\xb2\x42\x5d\xb0\x20\x7c\x0a\x4c\x9b\x6b\xf1\x4a\x05\
-\x80\xe5\x31\xdf\x50\x58\xd7\xa8\x2e\x7e\x6c\x34\x94\x2a\x77\xd5\
-\x1b\x54\xfe\x56\x93\x38\x35\x99\xe2\x1c\x05\x30\xe3\x3d\x8b\x81\
-\xe5\xad\x53\x41\xa3\xcd\x5e\xff\x18\xa3\x11\xee\xdc\x39\xec\xe2\
-\x62\x05\x48\x6d\x02\xad\xcc\x7f\x1f\x97\x03\x2b\xd3\x3d\xe9\xeb\
-\x47\x96\x48\x2b\xf9\xd6\x46\x9e\x25\x2c\x18\x2d\xf8\xbe\x8d\x7c\
-\x4c\xc5\xfc\xa3\x42\x26\x93\x88\x26\xa0\xbe\xa7\xbe\x77\xfa\xda\
-\x44\x56\x45\xfa\xe3\x9b\xf1\x51\xe3\x41\x38\x6c\xb0\xd4\xb4\x7b\
-\x15\x5b\x35\x46\x45\x1e\xc6\x48\xdc\x49\xcc\x7f\x22\x94\x6a\x52\
-\xc0\xad\x73\x4b\x74\x79\x79\x70\x05\x8a\xe1\xb0\x9e\x30\x2d\x5d\
-\xa7\x1d\x30\xdf\xe9\x70\xdd\x7d\xf7\xf1\x3b\x8f\x3f\xce\x2e\x65\
-\x55\xe5\xca\x4a\xad\x01\x2f\x90\x82\xe8\xfd\x17\xf3\x00\x62\x01\
-\x05\x17\xc2\xa7\x43\x81\x57\x24\x00\x2c\xa5\x36\x45\x19\x4f\xa4\
-\x49\xb5\xaa\x4a\x94\xd9\xea\xec\xb3\x86\xef\xaf\xea\x01\x46\xc6\
-\x70\x34\xf8\xff\x65\x82\x8c\xf3\x09\x1f\xdf\x9f\x3e\x8d\x39\x7a\
-\xb4\x8e\x13\xc7\x99\x80\x63\x05\x40\xa9\xa8\x40\x64\xf2\x4e\xcc\
-\xfc\x0b\x31\xe4\xb1\x4d\xa9\x7d\x72\x11\x9e\xf6\xb6\x51\x4d\x2d\
-\x09\xc9\x78\xfe\x98\xdb\x12\x01\x50\xa3\x83\x8f\xbe\x26\xda\x15\
-\x88\xf2\xe9\xe5\x77\x34\xda\xff\x57\xfe\xbd\x49\x09\xb6\x6e\xf4\
-\x1a\xce\xb3\x71\xc8\x97\x66\xb3\x51\xab\x88\x33\x03\x75\x9f\xff\
-\xb6\x21\x25\x6d\xa5\xd4\x6d\xe5\xd5\x42\x40\x0b\x98\xd4\x8d\x65\
-\xc4\xfc\x57\x16\x40\xdd\x88\xd6\x7b\xdc\x70\xc8\xd1\x23\x47\xb0\
-\xbd\x1e\xa3\xb2\x24\x0f\xdf\xb9\x30\x86\x4c\xe5\x1b\x88\x0b\x6a\
-\x23\x45\x21\xf7\x4e\x73\x02\x93\x8b\x9e\x66\xaf\x54\x00\x58\x48\
-\xf9\xb0\x3a\x21\x23\x35\x6f\xcf\x90\x6e\x22\xe1\x22\x32\xc5\xa9\
-\x14\x5e\x49\x03\x1e\x39\xc7\x32\x55\x6d\xf6\x50\xc8\x99\x96\x90\
-\x95\x3c\x2e\xcf\x9f\xc7\x5c\xba\x54\xbb\x01\x63\x79\xf3\xda\xbc\
-\x8e\xfd\x67\xc5\x96\x6f\x1b\x06\x0c\x4c\xba\x89\x3b\x02\xeb\x6e\
-\x43\x4a\x00\x1a\xa4\x9c\x12\x68\x1f\xc7\xde\x13\x56\x43\xb2\x91\
-\x46\xd4\xc3\x80\x04\x89\xa8\xd3\x5b\x53\x83\x3d\x1a\x6e\x43\x10\
-\x62\xa7\xc0\xaa\x11\x72\x13\xd3\x5e\x71\x3f\x3e\xe1\x3e\xd8\x38\
-\x5a\x22\xd7\x22\xd5\x28\x23\x31\x40\xd4\x4f\xf0\xfd\x53\x65\xc9\
-\x46\x09\xa9\x68\x6d\xa7\xfa\x4d\xe8\xe1\x9e\xb5\xf0\xab\x26\xb4\
-\x45\xbf\xcf\x75\xaf\x79\x0d\x33\x73\x73\x0c\x2f\x5c\xc0\xe7\x39\
-\x5e\x91\x7f\x99\xb8\x35\xb2\x9f\x55\x4e\x80\x53\x85\x6e\x4e\x29\
-\x14\xd7\x12\x31\x52\xe1\xf4\x17\x65\xbd\xd8\x4d\x41\xe7\x69\x09\
-\x69\x35\x8a\x77\x24\x79\x47\xc2\x78\xe1\x47\xa8\xcb\x36\x43\x6c\
-\xbf\x6e\xf3\x95\x78\x2c\xf7\x19\xb0\x2f\x2e\x63\x15\x4b\x21\x8a\
-\x18\xd4\x42\x3e\x1a\xe1\x4e\x57\x89\x56\x8d\xf6\x63\xba\x29\x49\
-\xa2\x11\xa7\x8b\xfa\x16\xfa\x09\xe3\xc1\x75\x08\x6a\xac\xc9\x68\
-\x5b\x2a\xb1\x08\x4c\xac\xe1\x75\xe8\x4f\xbb\x0a\x72\x4c\xbf\x9f\
-\x7a\x8f\x3a\x7f\x3d\xca\x48\xf3\x9a\xac\x8b\x32\xfa\x7c\xf4\x9e\
-\x9a\xc4\xd3\x51\x82\x1a\xdc\xd4\xe6\x37\x2a\xfe\xad\xbb\x05\xdb\
-\x28\x9f\x01\x75\x8e\x8d\x40\x40\x5b\x0f\x92\x5c\x33\x36\x2b\x31\
-\x41\x18\xb7\x5a\x4c\x11\xc9\xd8\x08\x21\xab\xf6\x72\x7a\xd4\x77\
-\x1d\x0e\x14\x37\x01\x98\x19\x8d\xb8\xfa\x96\x5b\x18\x48\x12\x5a\
-\xb8\xb9\xa8\x1e\xc5\xa9\xfd\x59\xc8\x6b\x52\x0b\x10\x97\xb1\xbf\
-\x0c\x8a\xfa\xc5\x06\x80\x9c\x44\x92\x88\x16\x78\x2d\xbc\x2e\xd4\
-\xf0\x3b\x25\xa4\x45\x54\xe5\x57\x6a\xc0\x08\xe7\x95\xea\x79\xee\
-\x3d\xfb\xbc\xa7\x50\x0c\x6b\x23\x8b\x50\x6f\x6e\x05\x0a\xe5\xc9\
-\x93\xb8\x7e\x7f\x4b\xc3\x45\x5d\x80\x5d\x34\x78\xd2\xc5\x8d\x34\
-\xe2\x0e\xc2\x1a\x44\x12\xa1\x4d\x37\xa9\x13\x6e\x8a\x6c\xd4\xe1\
-\xb5\xc8\x17\xaf\x7d\x72\x6d\x41\x68\x57\x22\x06\x01\xe5\x73\x36\
-\x2c\x86\x04\x50\x90\xc8\x83\xd0\x61\x3c\x0d\x3e\x46\x9b\xf6\x6a\
-\x5a\x4e\xed\x1a\x44\x9f\xcf\x50\xa5\xc8\x1a\xfd\xdd\x14\x81\x58\
-\x9f\x2d\x2e\x53\x6c\x8d\xc4\x49\x4b\x29\xed\xdf\x32\x2c\x45\x5a\
-\xaa\xe9\x32\xe1\x46\xe5\xa9\xca\x0b\xd0\xc3\x66\xe4\x37\x9a\x9d\
-\x9d\xe5\xaa\xe3\xc7\x19\xea\xfd\x1c\x88\x67\x11\xf6\x22\x84\xa1\
-\x1b\x7b\x34\x02\x08\x1f\xb9\x5f\x2f\xf5\xca\x5f\xea\xf7\xf7\x0a\
-\xe9\x74\x8c\xdd\x28\x7f\xcc\xa8\xe6\x15\x2e\x22\x9a\x1a\xe9\xc0\
-\x34\x4b\x4d\x4b\x60\xce\x18\xe6\x02\x1a\xef\xa4\x40\x47\xfe\xbe\
-\x5c\x5b\xc3\x9c\x3a\x85\x3d\x7a\xb4\x1e\xc4\xd1\x48\x1a\x4a\x90\
-\x7f\x63\xe6\x73\xc2\xc7\x4e\x86\xdb\xe2\x1e\x03\xb1\x16\x6f\x89\
-\x26\x98\x9d\x6c\x94\x44\xfa\xb2\x4f\x45\x04\x34\xc7\x90\x00\x94\
-\x46\xa8\x53\xce\x0d\xe5\xad\x3e\x31\xa8\x24\x8e\xfd\xd7\x40\xa1\
-\x81\x40\x69\x74\x54\x98\x2c\x26\x22\xb5\xdb\x50\xff\x8e\xd6\xd6\
-\xb9\xf2\x26\xc5\xbd\x10\x65\xfb\xb5\xd4\x09\xd4\xee\x65\x60\xff\
-\x35\x20\x79\x65\x05\x94\x65\x59\x4d\x9f\x0a\x5c\x80\x2f\x8a\xea\
-\x56\x96\xd0\xe9\x30\x5c\x5b\xe3\xda\xe3\xc7\xe9\xcd\xcd\x31\xea\
-\xf7\xc9\xa4\xdd\x97\x84\x17\x83\xcb\xa3\x09\x4d\xed\xda\x9a\x88\
-\x9b\xa2\x3d\x07\x00\x5e\xa4\x4a\xc0\x97\x02\x00\x6c\x32\xb9\x26\
-\x22\x62\x62\x56\x5a\x6b\xd7\xfa\xc7\x96\x41\x15\x9a\xd0\xd3\x20\
-\x60\x0c\x85\xf7\x1c\x00\xba\x2a\x0c\x13\xc7\xa2\xfd\x04\x10\x18\
-\x3d\xf3\x0c\xdd\xfd\xfb\x21\xcf\x2b\x9f\x50\xb3\xe0\x89\xb0\x5f\
-\xcd\x4d\xa4\xc2\x85\x92\x0b\x10\x25\xd0\xe8\x1c\x07\x9d\x25\xa6\
-\x23\x13\x31\x48\x68\x73\x3b\x0e\xc9\xa5\x62\xf3\x24\xb4\x1f\x09\
-\x1f\xb8\xd1\xa2\x4a\x27\xfd\xc4\xd1\x0d\xed\x8a\x44\xbc\x0a\x91\
-\x9f\x8f\x31\x58\x09\xab\xa9\xe3\x3a\x0a\xe0\x55\x46\xa0\x0f\xed\
-\xb2\x4c\x64\xe1\xe8\x61\xa1\xe2\x3b\x7b\x65\x79\x78\x75\xbe\xd3\
-\x1d\x9d\x52\xfd\x19\x55\xd8\xb1\x16\xfe\xd8\xed\xd2\xf3\x1a\x82\
-\x45\x57\x08\x00\x04\x30\xd0\xae\x5d\x59\x14\x1c\x0e\x03\x6d\x06\
-\x1b\x1b\x75\x93\x10\x2d\xe0\x35\xc7\xa4\xb2\x02\x35\x78\x35\x2c\
-\xa9\xc9\x6b\x74\xa5\xba\x00\x43\x5a\x48\x9c\xf8\x36\x66\xe2\x27\
-\x4c\x27\x1f\x67\xfe\xa9\xc7\x65\x30\xb7\x16\xa9\xda\x8d\xb9\x20\
-\x98\xda\xdf\x77\x09\x4e\xa0\xf1\x3e\x97\x2e\x51\x3c\xf7\x5c\x33\
-\x77\x40\x37\x23\x51\x8f\x5d\x34\xd8\xa3\xd1\xc3\x20\xde\x8c\xea\
-\xf8\x58\xd8\x4d\x09\xb7\x4b\xe4\xd8\x27\xf3\x05\x52\xd6\x84\x06\
-\x39\x4d\xf0\xc9\xa6\x0b\x09\x2b\x0d\x7f\x3e\xca\x66\x6c\x24\xaa\
-\x48\x2f\xbb\x38\x24\xa9\x4d\x7e\x35\x12\x8b\x48\xd0\x45\xdb\x5b\
-\xed\x1a\xe8\x54\x60\xcd\x13\x44\xc4\xa7\x51\x2e\x8c\x7e\xdf\xb1\
-\xe3\x3a\x85\x3c\x95\xa2\x1c\xe7\x45\x44\xbd\x24\x4c\x94\xc3\x50\
-\xe7\x93\xa8\x09\x54\x8d\x59\x93\x81\x18\x94\xf7\x9c\x19\x0e\xb9\
-\xfa\xa6\x9b\x18\x46\xfb\xb6\x54\x2e\xac\x8b\x73\x58\x26\xcc\x43\
-\xc8\xda\xfb\x33\x0c\xae\x54\x00\x28\x52\x00\xa0\x85\x4e\xb3\xce\
-\x9a\x8c\x49\x75\x96\x6d\x74\x9a\x51\xef\x23\x17\xdc\x7a\xcf\x4a\
-\x24\xe8\x8d\xd0\x16\xe9\x29\xb4\xfa\x9c\xd1\x53\x4f\xe1\x36\x37\
-\xb7\xc2\x8d\x2d\x20\xd0\x20\x09\x13\x75\x0a\x31\x5f\xe0\x23\x40\
-\xd0\xe1\xc9\xb8\x17\x81\x9f\x90\xf0\x43\xdc\x6e\x3a\x02\x98\xda\
-\x6f\x57\x24\xa1\x8f\xcd\x7b\x79\x3d\x1a\x84\x1a\x83\x4a\xfc\x7e\
-\x5e\x11\x73\x26\x26\xeb\xb4\xb0\x46\xe7\x98\x98\x14\x8c\x42\x86\
-\x7a\x23\x1a\x95\x50\x13\x87\x2f\x63\xae\x40\x2c\x1f\x9b\xca\x23\
-\x21\x5d\x66\xad\xc3\x90\x63\x00\xab\x7e\x53\x19\x37\x5f\x87\x04\
-\xc5\xfc\x97\x71\x74\xde\x33\x3b\x3f\xcf\xd1\x1b\x6e\x60\xa0\x7d\
-\xfa\xa8\x52\xd5\x27\xac\xce\xd4\xdc\x83\x6c\xb2\x30\x6e\x5e\xa9\
-\x00\xb0\x9e\xe2\x00\x62\xa1\x74\x91\xef\xd9\x00\x05\xd1\xe4\xca\
-\x4c\xd5\x11\x03\xdd\x0f\xa0\x03\xac\x18\x53\x65\x00\x6e\x73\xa3\
-\xc5\x0a\x28\x37\x36\x18\x3e\xfd\x74\xa3\x0d\xb6\x53\xe4\x50\x8a\
-\x0c\xf4\x2d\x33\xea\x27\x65\xa4\xd5\x9f\x43\x2c\x87\x44\x48\xae\
-\xd6\xb4\x51\x72\xd2\xd8\x77\xd1\x8c\x79\xc4\xe6\xfb\x98\x08\xd4\
-\xb7\xd8\xc4\x97\x96\xd7\x89\x44\x24\x22\xe1\xd5\xef\xa1\x05\x3e\
-\xbe\xd9\xe8\x73\xe9\x7e\x79\x56\x59\x06\x36\xd2\xee\x12\x3f\xb7\
-\xb1\x9b\xa4\x40\x42\x5f\x6b\x4b\x62\x30\x6b\x0b\x01\xdb\xb6\x1f\
-\xeb\xbf\x91\xa9\xd3\xd1\xd0\x59\x19\x44\x5b\xcf\x64\x18\x0e\x59\
-\x99\x9d\xa5\x93\x65\xe3\xed\xcf\x62\x02\x3a\x52\x68\x1a\xd4\xa4\
-\x7f\x40\xd6\x9e\x0b\xb0\xf6\xaa\x01\x80\xd4\x34\x18\x1d\x5b\x76\
-\x8a\x9d\x77\xca\xbc\x6f\x7b\x2c\xe3\xc0\x84\xb0\x9b\x8b\xf2\xab\
-\x7d\x8b\xd9\x5f\x4e\x18\xe4\x59\x9c\x38\x41\x79\xfe\xfc\x56\xa2\
-\x4c\x8b\xd0\x37\x7a\x12\xd2\xac\x58\x74\x29\x5f\x34\x26\x33\xd5\
-\xa4\x9f\x49\xc4\x5e\x0c\x90\x49\x52\x33\x65\xda\x8b\x50\xc7\x02\
-\x1f\xfd\x0d\xaa\x63\x6d\x23\x11\x49\x0b\xbb\x4e\x5e\xd2\x42\xac\
-\x04\xdc\xa8\xa9\x38\x86\xaa\xd6\xde\x28\x17\xc0\x44\x05\x32\x72\
-\x4d\x44\xf8\xb3\x10\xf0\x36\x11\xf0\xd8\xd8\xc2\xd0\xa4\x5a\x02\
-\x18\xda\xa6\x26\x3b\x3d\x59\x29\x41\xbe\xd5\xbf\x69\xf8\xdd\x0b\
-\x89\xff\xcb\xf8\xf9\x60\x11\xc8\x7b\x8e\xfa\x7d\x5e\x73\xdf\x7d\
-\xcc\x2d\x2c\x6c\x31\xfa\x2d\x5a\xbf\x4e\x68\x0a\xf9\x02\x92\x28\
-\x64\x15\x00\x4c\x58\xab\x57\x2a\x00\x9c\x6f\xcb\x03\x10\x9f\x34\
-\xe5\x8f\xd6\x31\x52\x48\x86\xff\x5c\x14\xda\x93\xd7\x97\xa9\x2a\
-\x8f\xca\x84\x76\x77\x89\x06\x95\x6d\xee\x81\x2b\x0a\x06\x8f\x3f\
-\x5e\xb1\xbf\x91\x2b\xe0\xa2\xb0\x5f\xaa\x15\xb6\x6f\x69\xcf\x9d\
-\x4a\xce\x49\x66\x0c\x46\xd7\x64\xac\xe7\xbe\xb6\x0c\x12\x2c\x7e\
-\xac\xed\xe3\x58\x7f\xed\xdf\x6b\x8b\x41\x3a\xdc\xc8\x18\xab\x48\
-\xcb\xeb\x98\x7d\x83\xdd\x0f\xaf\x5b\xdd\x0c\x33\x66\xfe\x95\x70\
-\x1a\x55\xf5\x66\x52\x82\x1d\xbd\xa6\xfd\xfc\x31\xce\x40\x81\x52\
-\x0a\x04\x52\xa6\xff\xc4\xdc\x00\xad\xad\xf5\x28\x7a\x7d\x8b\x1a\
-\xd4\xce\x84\xa6\xb6\x29\x17\x33\xe6\x7e\x74\x2e\x84\x01\xb2\x30\
-\x4f\x20\xa7\x6a\x29\x3e\x61\x5d\xbc\x52\x01\xe0\x6c\x5a\xa5\xb9\
-\xb1\xf8\xb2\xd3\x25\x92\xca\xb7\xd7\xf9\xfc\x2e\xe1\xd7\xca\xdf\
-\x8c\xbc\x67\x39\xe4\x63\xbb\x08\x50\x62\x80\x91\xd7\xc7\x92\x83\
-\xd4\xf3\xe2\xc2\x05\x46\x91\x2b\x10\x37\x2b\x8d\x5b\x6c\x35\x78\
-\x8d\x44\x25\x9f\xdb\x8e\x97\x68\xf1\x11\xc7\xc2\x77\xba\x56\x3f\
-\x91\x90\x33\xe6\xff\x27\xcc\xff\x06\xf0\xc6\xae\x41\xe4\x26\x34\
-\xda\x5b\x6b\x4d\x1e\xb7\xbf\x6e\xe1\x01\xb4\xa5\x50\x9b\xf5\x92\
-\x07\xa0\xc6\x68\xe9\xa6\x27\xad\xc0\x10\x69\xf7\xac\xa5\x17\x83\
-\x89\x2c\xad\xb6\xca\xc2\x18\x54\x48\xcc\x9d\x10\x37\x20\x1e\x5e\
-\xeb\xbc\x67\x16\xb8\xe1\x8e\x3b\x18\xd1\xde\x2d\x5a\x7f\x6e\x49\
-\x82\x8a\xb5\x7f\x37\x3d\x1e\x6c\xa2\x22\xbd\x12\x00\xe0\xb9\x54\
-\x08\xa3\x1e\xf8\x11\x6d\x34\x54\x12\xce\x98\x09\xac\x04\x6e\x2c\
-\x83\x2a\xb0\xaf\xb3\xc2\x34\xef\x40\xd0\xda\x04\x5f\xff\x70\xa3\
-\x67\x9e\xa1\x38\x73\xa6\x1a\xea\x10\x13\x94\x51\x63\xd2\x06\xeb\
-\x1b\x13\x8c\xd1\x94\x1f\x97\x20\x21\x49\x68\x21\x1d\x62\xd4\x66\
-\xf8\x18\x5f\x10\x25\xec\xa4\xdc\x2e\x5a\x08\x3e\x1f\x25\x0c\xd5\
-\xef\x23\x82\x29\x66\xbc\x06\x01\xd1\xbe\x4a\xfb\xb7\xb2\xff\x11\
-\x77\x60\x75\x12\x50\x42\xe3\xeb\xd0\xa2\x8d\xdd\x06\xed\x4e\xb4\
-\xb8\x08\x63\x79\x13\xca\xf4\x4f\x69\xff\x54\x3c\xde\xa7\xc6\xab\
-\x07\x10\x88\x15\xc1\xcc\xc2\x02\x87\xaf\xbb\xae\x0e\xd4\x9b\x94\
-\x7b\x11\x00\xa3\xee\x18\x14\x5c\x1d\x1b\xe2\xf0\xb9\xba\x16\x97\
-\xa5\x48\xaf\x80\x3c\x80\x93\x40\x3f\xb6\x70\x7c\x59\xd6\xa3\x9a\
-\x05\x0c\xc6\x98\x6a\x6d\xb2\xeb\x56\xd4\xca\xec\xd7\x45\x14\x39\
-\xb0\x2c\x9d\x56\xa3\xc4\x14\x3f\xc1\xec\x9b\xd4\xc4\xd3\x95\x25\
-\xee\xb1\xc7\xe8\xcd\xcd\xc1\xcc\x4c\xc3\xb4\xf7\xaa\x0c\xb4\xd1\
-\xc9\x28\x22\xe1\xe2\x8a\xbd\x54\x48\x6f\x8c\x94\x4a\x65\xe0\xa5\
-\x78\x02\xf5\x19\xfc\xa4\xef\x17\x25\x17\x8d\x75\xe2\x9d\x00\x1e\
-\x26\x4e\x1c\x8a\x85\x36\xb4\xb9\x36\x21\xfe\x8f\x4a\x12\xb2\x4a\
-\xc8\x44\xeb\x3b\x15\xf7\x97\x3a\x00\x1f\x5b\x0e\xea\x6f\x7d\x22\
-\x57\x22\x2e\x1b\x6e\x13\x3c\x3d\x93\x50\x0b\xbc\x44\x00\x6c\x82\
-\x6f\xa8\xdf\x4b\xcf\x40\x14\xa1\x17\x20\x50\xaf\x99\xb2\xc4\xae\
-\xaf\x8f\x75\x7a\xae\x5d\x9d\x00\x64\x5a\xdb\x67\x62\xfe\x47\x00\
-\xb0\x8d\x22\xbd\x22\x2d\x80\x0b\xc9\x0f\xaf\xbb\x01\xc5\xa1\xa9\
-\xb8\x63\xaa\x72\x11\xfc\x04\x8d\xd9\x01\x76\x5b\x5b\x21\xb1\xfe\
-\x5b\x65\xea\xa7\xdc\x0c\xdf\x62\x09\xd4\xae\xc0\xe6\x26\xfd\x47\
-\x1f\xc5\x0d\x87\x4d\xee\x20\x6a\x71\x9d\x9a\xb2\xa3\x59\xe0\xd6\
-\x3a\xf5\x36\x36\x5a\x6d\xfe\xc6\x14\x9a\xc8\x2f\x1f\xab\xff\xd7\
-\x49\x3b\x6d\xec\x7f\x9c\xdc\x13\x71\x09\x44\x89\x2c\xc2\x17\x98\
-\xd8\x1a\xd0\x5a\x5c\x1f\x53\x56\x42\x1c\x1d\xd0\xe7\xc7\x69\xc4\
-\x28\x17\x41\x57\x41\xda\x54\xb8\x30\xe6\x04\xa2\xcf\xae\x2d\xcd\
-\x56\x21\x8f\x04\xc1\x10\x8d\x45\x0f\x16\x80\x51\xa3\xea\x89\x06\
-\xd9\x14\xfd\x3e\xc7\xae\xbe\x9a\xf9\x4e\xa7\x91\xd0\xa4\x41\xca\
-\xaa\x30\x5f\x46\x95\xae\x9e\x45\xc2\x6f\x27\x57\x03\x3e\x71\xa5\
-\x02\x40\x1f\xf8\x7c\x92\x06\x28\x8a\x4a\x63\x44\xfe\xa3\xfe\x01\
-\x92\xf1\xf0\x28\x55\xd5\x2b\x33\x79\x36\x00\xc0\x58\x78\x4f\x75\
-\xf4\xf1\x2d\xc2\x9f\x4a\x0e\x12\xdd\x51\x9c\x3b\xc7\xf0\x89\x27\
-\xb6\xfe\x9f\x0e\x51\xea\x56\xe5\xb1\x16\x8e\xf3\x03\x5a\xfc\xc4\
-\xf8\x16\x9b\xb3\x3e\x61\xe2\xd7\xae\x84\x22\xf3\x88\x18\xfe\x94\
-\xcf\xdf\x48\x10\x8a\xfe\xa6\x4e\x18\x0a\x37\xa3\x22\x08\x0d\x9f\
-\x5c\x25\x00\xe9\x50\x9f\xf6\xe9\x33\xe9\x97\x17\x77\xc8\xd1\x84\
-\xa1\x02\x03\x1b\x93\x85\x2d\x09\x46\x9e\x66\xad\x40\xcc\x3b\xd8\
-\x5a\xc7\x94\x8d\xd4\xe0\x98\xb4\x8c\xf7\x94\x7c\x4f\x1b\xf7\x25\
-\x50\x5a\xdf\x47\x73\x13\x01\x8a\x50\x14\x34\x3f\x37\x57\x11\x7b\
-\xca\xbc\x97\xe6\x20\xb5\xb9\xef\x3d\x1d\x45\xfa\x75\x80\x2e\xd5\
-\x74\xe1\x09\x6b\x0d\xf8\xf4\x95\x0a\x00\x00\x0f\x27\x35\x5e\x51\
-\xd4\x66\xa3\xfe\x51\x6c\x98\xae\xda\x60\xc4\x15\xe9\xe4\xe3\x38\
-\x74\x38\x36\x67\x4c\x95\x02\x1c\xb3\xe1\x6d\x71\x7f\x9d\x5c\xb4\
-\x03\x8e\x60\x70\xea\x14\x83\x13\x27\xb6\xf8\x00\xc6\x5b\x94\xe9\
-\x10\x60\xad\xb9\xb5\xcb\x12\x11\x82\x2e\x4a\x6e\xd2\xdf\x57\x83\
-\x17\x89\x0c\x40\x11\xfc\x54\x29\x70\x2a\x09\x88\x94\xaf\x9f\xd0\
-\xc0\x71\x8c\x1f\x99\x76\x1b\x5b\x00\xc2\x03\x84\x9b\x55\x9a\xda\
-\x46\x02\x69\x8c\xa9\x04\x41\xfd\x5f\xab\x40\xc8\xb6\x90\x7d\x46\
-\x85\x05\xad\xca\x51\x68\x44\x21\x52\x5a\x5d\x55\x4c\x8e\xe5\x2e\
-\x44\x80\x91\x4a\x34\x32\x09\xee\xc4\xaa\x46\x35\xe8\x6e\xd6\x40\
-\x27\xcb\xaa\x91\x60\xe1\x6f\xb5\x69\x5f\xb3\xfc\xe1\x3e\x53\x82\
-\xdf\x0d\x51\x00\x26\xfb\xff\x9f\x0e\xae\xf4\x15\xc9\x01\xd0\x86\
-\x5e\x7e\x34\xaa\xfc\x44\x15\x76\xaa\xbb\xbf\xc4\x28\xed\x5c\xdd\
-\x49\xc6\x44\xec\xb6\xa4\xaf\xae\x64\x59\x35\xa5\x55\xd7\xdc\x0b\
-\x4f\x20\x3f\xa6\x6e\x32\x92\x1a\x05\xae\x4d\xed\x84\xc6\x1e\x3c\
-\xfd\x34\xbe\xdb\x25\x3b\x70\xa0\xda\x00\x12\xcd\x48\xd5\x02\x44\
-\x33\x08\xda\x86\x8a\x48\x1f\x39\x43\x62\x74\x38\x89\xe6\xa0\x09\
-\xb2\xab\x51\xa4\xa4\x66\xd0\xd7\x99\x7e\x2d\x89\x46\x12\x8e\xad\
-\xfb\x13\x48\xff\x3a\x25\x3c\x5e\x34\xbe\x34\xe8\xb0\xb6\x12\x86\
-\xe0\xfb\xcb\xa6\x77\xaa\x0a\x50\xb8\x19\x1b\x4d\xc2\xd5\x44\x60\
-\xa9\xc2\x75\x02\x2a\x59\xf8\xfd\x4a\xa5\x9d\x74\x41\x96\x0d\xbf\
-\x5f\xd9\xe6\xef\xab\x44\x1e\x2b\xca\x40\x71\x1d\xfa\xfd\x52\xee\
-\x80\x4e\x2b\xae\x2d\x0c\x5d\x06\x2e\xa1\x41\x9d\xc8\x63\x2d\x6c\
-\x6c\x90\x8d\x46\x74\x94\x46\xd5\x26\x7f\x27\x22\xfc\x04\x10\x3a\
-\xe1\x7f\x0e\x27\x03\xc0\x7b\x79\x11\x8b\x81\x5e\x0a\x0b\xe0\xc3\
-\x24\x52\x82\xbd\xf7\xb8\xd1\x88\xcc\xda\x0a\xdd\xad\x25\x13\x0d\
-\xa3\x4d\x4f\x29\x2e\x49\x84\xba\x6a\xe2\xc9\x18\x16\xb2\xac\x22\
-\xa4\x94\x30\x94\x11\x87\xd0\x70\x0b\x24\xbf\x40\x27\x07\x29\x81\
-\x6f\xb8\x12\xb2\x31\x9d\xa3\xff\xf8\xe3\x8c\xce\x9c\x69\x6a\x72\
-\x55\xda\x19\x73\x0a\x71\x34\xa0\xad\xf4\xd3\x2b\x86\x9f\x16\x0b\
-\x66\x2c\xef\x3f\x91\xa6\xeb\xa3\x88\x81\x68\x71\x9f\xc8\x0d\x30\
-\xe1\xba\xcb\xeb\xc2\xec\x6b\x4d\x6b\x95\x89\x6c\x74\xec\x3d\xca\
-\xe0\x8b\x27\xe2\x66\xca\x6a\xd3\x0c\x77\xcc\xe4\x8f\x45\x02\xa2\
-\xd7\x4d\xd4\x2f\x31\xe5\xf7\xd7\xc4\x5e\xc8\xdd\x1f\xd3\xe4\xca\
-\x35\xd0\x89\x4b\x44\x11\x08\xed\x96\xc4\x19\x8b\x8d\x10\xb6\x22\
-\xfc\x3c\x90\x0d\x87\xec\xd9\xb3\x07\x2b\xda\x5d\xf9\xf8\x1d\x75\
-\xdf\x0d\xb7\x5e\xb8\xcd\xb0\xa3\x12\xe0\xff\xf6\x62\x0a\xe7\x4b\
-\x01\x00\x8f\x00\x4f\xa5\x48\x98\x72\x30\xd8\xda\x48\x11\x08\x58\
-\x0d\x08\xca\x04\x25\xf2\xd5\xe4\xc7\xeb\x05\x33\x54\x0b\x6c\xd2\
-\xcf\x8e\x81\xa0\xc5\xf7\x4f\x86\x08\xad\xa5\x2c\x0a\xfa\x8f\x3e\
-\xca\xf0\xec\xd9\xba\xa7\x9b\xd7\x63\xc9\xe2\xde\x01\x89\xc4\xa3\
-\x31\x3f\x9e\x66\x99\x74\x6b\x34\x2f\x15\x3d\x48\x80\x41\x6d\x91\
-\x08\x20\xea\xdc\xff\x94\x0b\xa0\xfe\xbe\x21\x88\xf2\x5b\xa8\xb0\
-\x9f\x89\x43\x7d\xea\x37\x6a\xa4\xf4\x06\x60\xb7\xea\x33\xa7\xd2\
-\x80\xe5\xef\xb2\x88\x67\xb0\x51\xbe\x81\xd5\xee\x43\x22\x6c\x28\
-\xc2\xaf\x43\x91\x9a\x2c\x24\x45\x52\xea\x10\x65\x74\x2c\xd3\xbc\
-\x84\x1a\x43\xae\xdb\x9d\x89\x25\x30\xbb\xb0\xc0\xb1\x5b\x6e\xc1\
-\x04\xcd\x5e\x0b\xba\x62\xfa\xbb\xde\xd3\xf5\x9e\x5e\xf4\xda\x68\
-\xb2\xf6\xff\x10\xf0\xbb\x2f\xa6\x70\xbe\x14\x2e\xc0\x26\xf0\x3e\
-\xe0\xda\x31\x22\x30\xf4\x5d\xcf\x3b\x1d\x8c\x73\x75\x13\x8f\xdc\
-\xda\x2a\xc5\x37\x98\xa5\x0e\xd5\x89\x56\x0b\x5d\x10\x8a\xdc\x5a\
-\xe6\xb3\xac\x36\xff\x45\x83\x1a\x25\xf0\x26\x4a\xd6\x99\x44\xc2\
-\xf9\x84\xc0\xd5\x24\x5a\x96\xe1\x8b\x82\xfe\xe3\x8f\xd3\x33\x86\
-\x7c\x65\x65\xac\xb8\x47\x27\xb3\x38\x15\x42\x4b\xb5\xfc\x6a\xb4\
-\x08\x4b\xc5\xe3\x13\xb1\x7e\x1f\x91\x77\x71\xa5\x5e\xb2\xef\x80\
-\xe2\x50\xea\xc7\x89\x5e\x7f\xba\x3c\xb7\xb6\x1e\xc2\x73\xab\x9b\
-\x89\x68\xcd\x1a\x35\x10\x8d\x33\xf8\xac\x80\x8f\x2a\x76\xb2\x2a\
-\x62\x61\x55\x2a\xb7\x4e\x13\x76\x29\xdf\x5e\x87\x02\xc3\x7b\x17\
-\x21\x55\xd7\x44\xa5\xda\x56\x95\x85\xeb\x70\xa2\x06\x04\x4d\x4a\
-\x6a\xeb\xc5\x50\x0d\xf8\x94\xb4\xdd\x2c\x8a\xe9\x6b\x77\x21\xeb\
-\x76\x59\x5a\x5e\xae\x04\x5d\x11\x7e\x59\x00\x04\xb1\x06\xba\x8a\
-\xfc\x9b\x01\x36\x82\x3b\x33\x01\x00\xfe\x77\x5e\xc4\x52\xe0\x97\
-\x0a\x00\x00\x7e\x0b\xf8\xa3\xa9\x17\x46\x9b\x9b\x74\x7a\xbd\xfa\
-\x87\x2d\xcb\xb2\xda\x0c\xd6\x56\xf5\xe4\xc1\xff\x74\x21\x76\xea\
-\xc2\xe8\x65\x3d\x5a\xa9\xeb\x3d\x8b\xd6\x56\xa1\x43\xc9\x6d\x97\
-\xd1\xcc\x2d\x0c\xbc\xdb\x06\x04\xc6\x7c\xeb\x28\xfe\x5e\x8e\x46\
-\x94\x8f\x3d\xc6\x0c\x90\xad\xac\x8c\x87\x90\x74\x12\x8f\x12\x70\
-\x13\xc5\xfa\xc7\x86\x7b\xc4\x39\xe1\x71\x68\x4e\x77\xd6\x89\xc9\
-\xd2\x09\x49\x42\x46\x00\x35\xf6\x7b\xc5\xf7\xd7\x75\xfe\x92\x5f\
-\x20\x5d\x6d\x95\xc0\xd7\x1a\x59\xda\x6a\xab\x96\x66\x65\x70\xd5\
-\x8c\x73\x64\x22\xdc\xaa\xc5\xb8\xce\x09\x28\xc3\x77\xcf\xc4\xe7\
-\x97\x24\xae\xf0\x9a\x5c\x87\x2c\x34\x91\xf5\xaa\x9c\xb8\xc1\x8d\
-\x04\x9f\x5f\xde\x57\xf7\x39\xa8\x79\x0b\xf5\x3b\x9a\xd4\xf7\x8f\
-\xa2\x11\x59\xb0\x6c\x74\x7a\x73\xaa\x25\xba\x91\x30\xa1\x31\x74\
-\xf3\xbc\xd6\xee\x22\xf0\x99\x72\x01\x34\xf3\xdf\x0b\xcf\xd7\x27\
-\xcb\xcc\x33\xc0\xbf\x7f\xb1\x05\xf3\xa5\x02\x80\xdf\x08\x39\x01\
-\xbb\xc7\xdc\x80\xe1\x10\x37\x1c\x92\xf7\x7a\x50\x96\xb5\xe0\xeb\
-\x89\x30\x46\xd5\x77\xdb\x88\x61\x17\x73\x72\x4e\x11\x80\x8d\x3e\
-\x75\x9a\x00\x8b\x93\x8b\x12\xf1\xf7\xd6\xee\x39\x8a\x25\xaf\x0b\
-\x6f\x8a\x82\x8d\xc7\x1f\xa7\xe7\x7d\xd5\x48\x24\xca\xe0\x33\x91\
-\xe0\xeb\xf0\x60\x5c\xf9\xa6\xb5\x92\x6e\x3e\x12\xf7\x0d\x60\xc2\
-\x67\x6b\x7c\xc6\x96\xa4\x21\x13\x85\xfd\x8c\xea\x2f\x68\x02\xe0\
-\x8e\x65\xce\x49\xe3\xce\x60\x1d\x08\x27\x83\x73\x78\x6b\xeb\x89\
-\x4e\x22\xd0\xe2\x36\x35\x3a\x07\x8b\x30\x8b\x70\x69\x50\x08\x80\
-\x52\x46\xe0\x66\x55\xd4\xa7\x91\xe3\xaf\x92\x7c\x7c\x59\x36\x7a\
-\x0e\x5a\x01\x94\xe8\xfa\x19\x65\x75\xb5\xe5\x10\xe8\x1c\x04\xab\
-\x2d\x03\x89\x84\xc4\x0d\x6c\x15\x60\x77\x8d\x61\x36\x68\x76\x2d\
-\xfc\x59\x24\xfc\x9d\xe0\x06\x5c\xa2\x2a\xf2\x9f\xe0\x83\xff\x1d\
-\xe0\xdc\xab\x05\x00\x9e\x0b\x20\xf0\xad\xa9\x17\x07\xeb\xeb\x74\
-\x7b\x3d\x3a\x59\x46\x21\xac\xb2\x0a\xa9\x59\x68\x54\x72\xf9\x08\
-\x04\xf2\x10\x8a\xd1\x6d\x96\x6b\x7f\x3f\x9a\xca\xd2\xe8\x48\x34\
-\xe9\x16\xbb\x12\x44\x59\x7d\x62\x92\x97\x25\x83\x27\x9e\xc0\x3b\
-\x47\xe7\xc0\x81\x9a\x01\x37\x91\xe9\x3f\xd6\xc9\x57\x1d\x8f\xcb\
-\x58\x63\x70\x88\x7b\x00\xc4\x09\x3c\x63\x39\x12\x71\x9f\xbf\xa8\
-\x83\x70\xa3\x65\xb7\xfa\x8e\x36\x44\x61\x8c\xb2\x00\x8c\xe2\x26\
-\xac\xfa\xfe\x8e\xad\xc9\xba\x96\xaa\xba\xb2\x9e\xf0\x23\x1c\x40\
-\xf0\xc9\x9d\x70\x3c\xba\x95\x98\x0a\x79\x8a\x4f\x5e\x28\xa2\xce\
-\x8b\x30\xab\x1e\xfb\x72\xae\x53\x7d\xfb\xb4\x6b\xe2\xd4\xf7\xb3\
-\xca\xd2\xd2\x83\x39\x34\x31\x99\x59\x5b\x87\x27\xb3\xc0\x39\xd5\
-\xb3\xfd\x14\x0f\x90\x69\x50\x88\x43\x8d\x61\x75\x83\xf0\xcf\x29\
-\xc6\x5f\xd8\xff\x6e\x04\x04\x96\x2a\xb9\x7f\x82\xe9\xff\xd1\x60\
-\xfe\xf3\x6a\x01\x00\x80\x7f\x9d\x02\x00\x13\x92\x29\xfa\x1b\x1b\
-\xec\x5a\x5c\xac\x7f\x60\xdd\x28\x14\xef\x71\xaa\xe6\x5a\x0b\x47\
-\xe9\x1c\x1d\x6b\xc9\xad\xad\x52\x77\x65\xf3\x6a\x7f\x55\x69\x65\
-\x19\x70\x11\x67\xd0\xb9\xc8\x77\x1e\x1b\x29\x96\x1a\x32\x1a\x36\
-\x86\xf3\x9e\xcd\x27\x9f\xa4\x1c\x0e\xe9\x5e\x75\xd5\xd6\x98\xb1\
-\xc4\xe0\x50\x4d\x8a\x35\x5a\x69\x47\x26\xbf\x89\xf2\x1c\x4c\x42\
-\xf3\x1b\xf5\x1d\x4d\x22\x27\xc0\xb4\x71\x01\xb1\x8b\x11\xb5\x21\
-\x8b\x35\x6d\x2d\x80\x65\x59\x9b\xd3\xe2\x86\xa1\x42\x80\x02\x14\
-\x99\x58\x05\x21\xc4\x9b\xc9\x90\x16\x3d\x24\xc3\xda\x2a\x8d\x56\
-\xbb\x00\xe2\x56\x04\xc1\x2b\xa3\x86\xa2\xd2\x26\x4c\x3a\xf4\xe8\
-\x7e\x83\x1a\xec\x1a\x21\x40\xc5\x31\xa0\xae\x95\x8d\x73\x14\x82\
-\xf0\xd7\xa0\x20\x04\x68\x54\xd3\x60\x52\xbd\x0b\xc2\x34\xaa\xb9\
-\x00\x02\xda\x05\x88\x81\xa0\x1b\x6c\xfb\x3e\xad\xbd\xbe\x0b\xe0\
-\xcf\x87\x53\x5e\x55\x00\xf0\x1b\xc0\xc7\x80\x3b\x53\x20\xb0\xb9\
-\xb6\xc6\xec\xec\x2c\xbd\x6e\x97\xc2\x39\xac\x73\x95\x50\x07\xad\
-\x54\x0b\x71\xd4\x4b\x20\xb3\xb6\x2a\x02\x92\x0d\x29\x93\x83\x02\
-\x79\x55\x27\xd6\xe8\x29\x2c\x0a\x0c\x74\x13\xc7\x98\x1c\x34\xba\
-\x7c\x56\x13\x49\xba\xbc\x56\x09\x70\xff\xe4\x49\xca\xd1\x88\xde\
-\xd5\x57\x63\x7b\xbd\x46\x6c\x5a\xcc\xce\xb1\x26\x90\x3a\xf7\x3f\
-\x32\xdf\x4d\xd4\x96\xdb\xa4\x08\xbd\x18\x08\x22\xb0\x8a\xf3\x09\
-\xea\x38\x77\xdc\x57\x90\x44\xab\xef\x60\x75\xc9\xb0\x0b\xac\xad\
-\xac\x04\x69\x1d\x26\xdf\x4b\x72\x03\x14\x2f\x13\xb7\xfd\xaa\xcd\
-\x79\x1d\xde\xd3\x6e\x92\x1a\xae\xa9\xdd\x22\x1b\x4d\x14\x2e\x43\
-\x53\x8e\x46\x18\x50\xe5\x78\x58\x95\xdf\xa1\xf9\x23\x1b\x5d\x23\
-\xad\xe9\x6d\x98\xcc\x6b\xad\x25\xd7\x9a\x3f\x80\x81\x00\x43\x5b\
-\x31\x92\x0f\xa4\xdf\x5c\xe4\x02\xe8\xfb\x3c\xf8\xfe\xe7\xa9\x2a\
-\x7b\x26\x98\xfe\x3f\x09\xfc\xe6\x4b\x25\x94\x2f\x25\x00\x0c\x81\
-\x7f\x04\xfc\x4c\x3a\xc6\xe5\xb9\x78\xfe\x3c\xfb\xf7\xef\xa7\x97\
-\xe7\x55\x33\x06\x65\xb6\xc7\xcd\x44\x75\xac\x7f\x31\xfc\x88\x4e\
-\x12\x54\x14\xdb\x5c\x9b\xac\x71\x97\xa1\x68\x5c\x96\xe6\x0a\xda\
-\x84\xa9\x61\x8e\x8b\x1f\xac\x35\xac\xb5\x0c\xcf\x9d\xc3\x8d\x46\
-\x74\xaf\xbe\x9a\x6c\xd7\xae\x71\xe2\x4f\x69\xb5\x86\x89\x4a\x7a\
-\x80\x29\x91\x15\x12\x97\xe9\x92\x70\x07\xc6\x00\x36\xfe\x4e\xda\
-\x8a\x50\x8d\x58\x63\x90\x91\x24\x21\xdd\x3f\xcf\x68\xff\x5f\xc2\
-\x80\xce\x55\xfe\xbb\x10\xb4\xe2\x97\x07\xed\xeb\x75\x95\x66\xe8\
-\xee\xab\x41\xc1\xaa\x44\x1f\xdd\xaa\x3c\x53\x2e\x00\xde\xd7\x53\
-\x7a\x45\x0b\xd7\x8d\x42\x55\xa2\x92\x8f\xba\xf0\x3a\xc6\x33\xfc\
-\x44\xe8\xad\x31\xe4\x41\xc8\x8d\x31\xb5\xf0\x67\xe1\x71\x1e\xdc\
-\x82\x2c\xcb\xc6\x4a\xa2\x1b\x85\x5d\xce\x91\x39\x57\x03\x80\x55\
-\xc2\x2f\xb7\x6e\x50\xe9\x4f\xa2\xa6\x05\x8d\xaf\xf7\x03\x7f\xfd\
-\x25\x94\xc9\x97\x24\x0f\x40\xaf\x7f\x13\xfc\x1b\x92\x79\x01\xa3\
-\x11\xe7\xce\x9d\xc3\x1a\xc3\x4c\xa7\x43\x37\xcb\xb6\x6e\xd6\xd2\
-\xcb\x32\x7a\xe1\x79\x27\xcf\xeb\xd7\x66\xb3\x6c\xab\x46\x5e\xb4\
-\xbf\x4e\xa9\x4d\xd4\xbf\xcb\x6b\x65\x74\x73\xd1\x7d\x7d\x3c\x2a\
-\x2a\xf2\x2a\xdf\xa0\x41\x2a\x66\x19\xa3\xf5\x75\x36\x1e\x7d\xb4\
-\x4a\x18\x52\xe7\x68\x62\x53\xe7\xf1\x37\xe6\x16\x4c\x18\x35\x3e\
-\xd6\xfc\x23\x4a\x1a\x22\x32\x73\x4d\x94\xdc\xa3\x93\xab\x4c\x82\
-\x70\x33\x51\xa7\x9f\x46\x68\x2c\x08\x4e\x83\x20\x53\x09\x5b\xfa\
-\xb9\x68\x4f\x1b\xf9\xd0\x8d\x84\x9b\x28\xff\xde\xaa\x84\x1b\x13\
-\x34\x6e\x0d\x58\x32\xa1\x27\x64\x84\x8e\xa5\x24\x47\xc9\x46\x3a\
-\x94\x37\xf6\x3d\x44\xa8\xd5\x67\xcb\x82\xb0\xe7\xe1\x75\x71\x29\
-\x6b\x00\x10\x7e\x40\x95\x40\x6b\xc5\xe5\x8a\x02\x36\x37\x99\xa3\
-\x9a\xe1\x25\x64\x60\x4f\xf1\x02\x00\x8f\x06\x2d\xd8\x22\x74\x4f\
-\x87\x48\xd9\xe6\x4b\x29\x90\xf9\x4b\x0c\x00\x03\xe0\x47\x42\x76\
-\x93\x49\x81\x40\x7f\x73\x93\xe7\x9f\x7f\x9e\xc3\x07\x0e\xd0\xed\
-\x74\x18\x05\x73\xcf\x25\x2a\xdf\xa0\xea\x04\x34\x23\xf9\x02\xe2\
-\x06\x88\x05\x10\x59\x03\xf1\x38\xe6\xba\x9f\x60\x44\xf6\xb5\x45\
-\x01\xb4\xc0\x94\x89\x21\x1c\x3a\xd1\xc6\x14\x05\x9b\x4f\x3e\x49\
-\xb1\xbe\x4e\xf7\xaa\xab\x30\x33\x33\x35\x91\xa5\x37\x4f\xdc\x33\
-\x5e\x6b\x18\xdf\x12\x05\x68\x4b\x3f\x36\x2d\x6e\x0a\x91\xcf\xaa\
-\xdb\x6e\x4b\x1f\x40\x19\x6d\xd5\xe8\x6a\xa4\x43\x97\x12\x01\x08\
-\xa5\xd0\x36\x24\x3e\x89\xb0\x7a\x3d\xde\x4c\x4f\x57\x16\xf7\x25\
-\x6a\x0e\xe2\xe2\x90\xa0\xe2\x1f\x8c\x06\xe2\xd0\x94\x53\x9b\xf4\
-\x8d\x4e\x43\x89\x8e\x41\x71\xc8\xcf\x2b\x90\xb0\x89\x64\x9f\x8e\
-\x31\x74\xad\xad\x14\x8b\xb5\x74\xc2\x7d\xae\xdd\x00\x49\x6c\x8a\
-\xbb\x12\x1b\x43\xb1\xb6\xc6\xe8\xb1\xc7\x98\x47\x55\xf7\x29\xbf\
-\x7f\x04\x7c\x26\x30\xff\x2d\x02\x77\x2e\xf0\x63\x8f\xbd\xc4\xf2\
-\xf8\x92\x03\x00\xc0\xaf\x02\xff\x12\xf8\xbe\x36\x93\x64\x63\x63\
-\x83\x93\xa7\x4e\x71\xd5\x81\x03\xcc\x77\xbb\x55\xa2\x47\xdc\x46\
-\x2b\x3c\x2f\x03\xd2\x6a\x66\xd6\x07\x30\x10\xf3\x2c\xd6\xd2\x4e\
-\x99\x8f\x8d\x1e\x03\xe2\x3f\x46\x42\xa4\x09\xc1\x58\x90\x1a\x20\
-\x10\x15\xd3\x78\x63\x18\x9c\x3d\x4b\xb9\xb9\x49\xf7\xaa\xab\xc8\
-\x77\xef\x6e\x24\xca\x88\x60\x78\x11\x2a\x9d\xb4\x94\xf8\x3f\xba\
-\x7a\xcf\x24\x34\x7e\x6a\xb8\x48\xdc\x3b\xaf\x11\x9a\x54\x6e\x49\
-\x72\x0e\x81\x9e\x63\x17\x42\x84\x5e\x0d\x6b\x11\xc1\x28\xf5\x08\
-\xf0\x48\xb3\x7b\x65\x51\xe8\xeb\x6c\x23\xae\x40\x67\xfc\x39\x6b\
-\xab\xa1\x1c\xa3\x51\xad\xf5\x7d\xc2\x94\xb7\x2a\x51\xc9\x2b\x0b\
-\xc2\x29\xde\xc5\x85\xcf\x69\x22\xdf\x3f\xb7\x96\x8e\x68\xfe\xa0\
-\xf5\xb3\x2c\x6b\x98\xfd\x79\x9e\xd3\x51\x82\xdf\x48\x53\x57\xe6\
-\xbf\xcb\x32\xca\xcf\x7d\x8e\x59\x25\xf8\x26\x08\xff\x06\x55\x31\
-\xcc\xf9\x76\x61\x3b\x0f\x7c\x0b\xf0\x7b\x2f\x83\x2c\xbe\x2c\x00\
-\x00\xf0\xc3\xc0\xbd\xe1\x96\x04\x81\xf5\x8d\x0d\x9e\x7c\xf6\x59\
-\xae\xda\xbf\x9f\xdd\xf3\xf3\x5b\x69\xb6\x91\xf9\x55\x86\x44\x20\
-\xb4\xd6\x12\xe1\xf7\x1e\x2f\x8c\x7c\x00\x02\x2d\xfc\x2e\x8a\x08\
-\x38\xad\x5d\xe3\x46\x1b\x89\x94\x5b\xbd\x79\x7d\x9c\x5e\xaa\x1a\
-\x65\x16\x83\x01\xe5\x13\x4f\xd0\x59\x59\xa1\x7b\xf0\x20\x76\x76\
-\x36\xe9\xa3\x37\x0a\x55\x54\x6d\x80\x49\x24\xfd\x8c\x59\x02\x71\
-\xee\xbc\x2e\xce\xd1\x16\x47\x34\xa2\x0b\xcd\xce\x6b\xeb\x47\x8a\
-\x84\xbc\xc7\x05\x92\xcc\xcb\x63\x9d\xfe\x2c\xc4\xa0\x1e\x10\x12\
-\x45\x25\x8c\x22\x69\x9d\xba\xb6\x56\xe5\x6a\x08\x88\x15\x5a\xeb\
-\x07\xd0\xb1\x42\xee\x6a\x10\x50\x61\x4c\x13\x15\x30\x19\x65\xbd\
-\xc4\x9d\x85\xad\xf2\xef\xf3\xe0\x5a\x76\xc3\xe3\x8e\x31\xd5\x7d\
-\x96\x55\xda\x3f\xcb\xaa\x5b\x9e\x57\x3c\x40\xa8\x37\xa9\xc9\x5b\
-\x09\x4d\xcf\xce\x32\x93\x65\x75\x81\x93\xf8\xfd\xa7\xa8\xf2\xe0\
-\x37\xdb\x05\xed\x2c\xf0\x6d\x21\x51\x8e\x2f\x25\x00\xb8\x18\xbe\
-\xf8\x7f\x07\xae\x69\x03\x81\xe1\x60\xc0\x13\xcf\x3c\xc3\xbe\x95\
-\x15\x0e\x2d\x2f\x33\xdb\xed\xd6\xc3\x42\xbd\x32\x15\x73\x09\x17\
-\x66\xd9\x56\x26\x98\x08\x77\xd0\x28\xba\x00\x48\xa2\x02\x02\x2a\
-\xba\x43\x70\x9d\x4d\xa6\x49\xbe\x48\x28\x75\x28\x4d\xb2\x16\x1b\
-\xa4\xa1\x36\x47\x45\x18\x8c\x61\x74\xf6\x2c\xe5\xc6\x06\x9d\xfd\
-\xfb\xe9\x2c\x2f\x63\xba\xdd\x34\x21\x14\x09\xc5\xd8\x34\x21\xa5\
-\x59\xdb\x80\x41\xbb\x12\x26\x41\x68\x6a\x57\x40\x13\xab\x44\x73\
-\xff\x7c\x14\xba\xcc\x14\x99\xa7\xad\x84\x5a\x3b\xaa\x2a\x40\x71\
-\x15\xc4\x52\x23\x6a\x29\xa6\xd3\x79\x25\xa3\xcf\x8d\x46\xb5\x6b\
-\x61\x95\x76\xf7\xd1\xdc\x40\xc9\x41\xd0\xa1\xba\x52\xbf\x26\x6d\
-\xb8\xd4\x77\xc8\xc4\xaf\x0f\xe6\x7f\x2f\x3c\xaf\x4d\xff\x60\xfe\
-\xe7\xd6\x92\xe7\x79\xe5\xf7\x67\x59\xc5\x6d\xc8\xbd\xbe\xde\xce\
-\x41\xa7\xc3\xc6\x1f\xfe\x21\x76\x63\xa3\x4e\xfc\x59\x07\x3e\x1b\
-\xc2\x7d\xbe\x3d\xdc\xf7\x18\xf0\xed\xc0\x07\x79\x19\x57\xfe\x32\
-\xfe\xef\x47\x81\x77\x02\xff\x11\xb8\xa1\x8d\x18\xf4\xde\xf3\xdc\
-\x99\x33\x9c\xbf\x74\x89\x7d\xbb\x77\xb3\x7f\x69\x89\xb9\x5e\xaf\
-\xda\x88\x61\x00\x63\xae\x09\x32\x63\x6a\xad\xdf\xe8\xc8\x2b\xed\
-\xa8\x74\x5f\x41\x09\x33\x2a\x93\xb7\x8c\x12\x89\x7c\xa4\x55\x1b\
-\x00\x10\x6b\xd3\xd8\x0c\x97\x2a\x3b\xd9\xe4\x59\x86\x1b\x8d\x18\
-\x3e\xfb\x2c\xe5\xc5\x8b\x74\xf6\xef\xaf\xdc\x82\xf0\x79\x6b\x1f\
-\x3e\x16\xfe\x94\xd9\x1f\xf1\x0f\x66\x52\x74\x20\xe5\x0e\x44\x63\
-\xd3\x89\xea\xe6\xbd\xd2\x72\x71\x74\x44\x5f\x4f\xed\x93\x5b\x65\
-\x61\xd8\xe8\xfa\x94\x3a\x04\xa7\x72\xf9\x65\xb4\x97\x4c\xe4\xad\
-\x13\x81\x42\x74\x41\x03\x45\x26\x42\xae\xfe\x17\x3a\x21\x49\xf2\
-\x08\xa2\xf0\xa1\xf3\xbe\x36\xf7\x6d\x00\x80\x5a\xe0\xc3\x4d\x88\
-\xe6\xae\x00\x80\xb8\x05\xea\x66\xe2\x31\xed\x65\x89\xed\x76\xb1\
-\xe7\xcf\x63\x8a\x82\x75\xe0\x04\xf0\xac\x8a\xf3\xb7\x10\x7e\xff\
-\x03\xf8\x63\xc0\xe7\x78\x99\x57\xfe\x32\xff\xff\x4f\x02\x5f\x0d\
-\xfc\x1f\xc0\x97\xb7\x81\x40\x06\x8c\x86\x43\x9e\x39\x7d\x9a\xe7\
-\xce\x9c\x61\xd7\xfc\x3c\x2b\x8b\x8b\xac\xec\xda\xc5\x6c\xb7\x4b\
-\x87\xaa\xc1\x88\xce\x61\xf7\x41\xe0\xc6\xfa\xb3\x0b\x59\x28\x53\
-\x88\x55\x87\x5d\xad\x79\x5d\x42\xfb\xc7\xe1\x25\x82\x26\x29\xa3\
-\x6a\xb5\x54\x48\x4e\x67\xbc\x61\x2d\x6e\x73\x93\xc1\xd3\x4f\x53\
-\x5e\xbc\x48\xbe\x77\x2f\xd9\xe2\x22\x3e\xcf\xc7\xfd\xf1\x18\x5c\
-\x26\x81\x40\x42\x90\x89\xc2\x7f\x8d\xf7\xd4\xf1\x73\x45\xa0\xea\
-\x3c\x0b\x13\xc8\xbf\x06\xc1\xaa\xd2\x85\xad\x0a\xbd\xea\xaa\x3d\
-\x1f\x5c\x83\x52\x91\x87\x4e\xd5\x06\x94\xc1\x2d\x2b\x87\x43\x0a\
-\x09\xef\x45\xe6\xbe\x13\x10\x50\x1a\xbf\x21\xf8\x2a\xc9\x4b\xc2\
-\x91\x19\xcd\x2c\x47\x42\xa7\xe8\x3a\xc1\x07\x6a\x96\xbf\xa3\x34\
-\xbf\x44\x94\x3a\xea\x3e\x17\x17\x40\x4c\x7f\x35\xf7\x40\x72\x24\
-\x8a\xf5\x75\x3e\xfd\xf0\xc3\x3c\x4e\xd5\xba\xa7\x50\xb1\xff\x96\
-\xf5\xbf\x01\x3f\x1a\xe8\x01\xbe\xd4\x01\x40\x4c\xa1\xaf\x05\xfe\
-\x21\xf0\xbd\x6d\x27\x09\x10\x38\xe7\xb8\xb0\xba\xca\xf9\xd5\x55\
-\x9e\xb4\x96\xb9\x85\x05\x5e\xb3\xbc\xcc\xe1\x99\x99\x6a\x23\xc5\
-\x5d\x85\xc5\x5f\x95\x88\x80\x32\x2b\x75\xf3\x0a\x3d\x4f\x4f\x17\
-\x0c\x99\xd4\x98\x6c\x15\x4e\x2b\xa3\x1e\x7b\x9a\x04\x13\x62\x4f\
-\x27\x23\x19\x5d\x24\x63\x0c\xc5\xea\x2a\xe5\xe6\x26\xf9\xfc\x3c\
-\xf9\xca\x0a\xd9\xe2\x22\x74\x3a\x4d\x7e\x40\xe7\x9f\x47\x2d\xb9\
-\x63\xeb\x23\xd5\x6b\x2f\x9e\xb3\x57\x0b\xbe\x12\x5c\x54\x46\x9d\
-\x89\xae\x19\x3a\x9d\x36\x32\xbd\x1d\x55\x0a\xb1\x55\xef\x67\x55\
-\xe8\x53\x3e\x8f\x74\x03\x2a\x82\x55\x51\x0c\x87\xd5\xc8\x2d\xf5\
-\xb7\x84\xec\xcf\x46\x7b\x70\x3d\x53\x50\x92\x8e\x02\x9f\x63\x55\
-\x83\x53\x6b\x0c\x26\xcb\x1a\x83\x40\x4c\x9c\xda\x1b\x98\x7d\x61\
-\xf8\x05\x00\x7a\x4a\xfb\x77\xf3\x9c\x4e\xb8\x65\xe1\x66\x15\x00\
-\xd4\xef\x1d\x3a\x03\x6d\x64\x19\x9f\x78\xf4\xd1\x9d\x08\xfe\xb3\
-\xc0\x9f\x05\x7e\x91\x57\xd0\xca\x5f\x21\x9f\x63\x1d\x78\x4f\xb0\
-\x08\xfe\xa6\x0a\x9d\x26\x81\x40\xb6\x73\xe9\x1c\x67\x2e\x5d\xe2\
-\x7c\xb7\xcb\x91\xf9\xf9\x66\x27\x57\x15\x29\x68\xd4\xe1\x0b\x71\
-\x13\xd8\x6d\x3d\x08\x54\x77\x10\x76\x51\x19\xb0\x89\xdc\x8c\x78\
-\xdc\x95\x53\xac\xb7\x84\x03\x6b\x53\x96\xad\xda\x7c\x29\x2c\x69\
-\x34\xe0\x30\x86\x72\x63\x03\xb7\xb9\x89\x9d\x9b\x23\x5f\x5a\x22\
-\xdf\xb3\x07\xd3\xeb\x35\x48\xbb\x98\xe8\x8b\x1b\x67\x8e\xb5\xf6\
-\xd2\x16\x42\xa4\x15\xc7\xac\x01\x45\x06\x8e\x8d\x23\x8f\xab\x16\
-\x95\xbf\x2f\x21\x51\xf1\xd7\x1b\xd7\x42\x11\x86\x65\x68\x00\x53\
-\x06\xc1\x17\x6e\x22\x0b\x51\x84\xba\x0e\x41\x12\x7b\x14\xfb\x2f\
-\xcf\xeb\x52\x61\xb1\xda\x42\xa9\xad\xf0\x11\x3a\x05\xdc\x07\xf6\
-\x3f\x53\x79\x06\x31\xeb\xdf\x0d\x64\x9f\xf8\xfe\xdd\x3c\xaf\x40\
-\xa1\xd3\x69\x90\x7f\x56\xf9\xff\x92\x97\xe0\x81\x7c\x6e\x8e\xa7\
-\x3f\xf5\x29\x46\x83\xc1\x76\x83\x3d\xfe\x33\xf0\x97\x02\x27\xc8\
-\x14\x00\xda\xd7\x3f\x08\xa4\xc8\x3f\x23\x91\x32\xdc\x66\x15\x34\
-\x9a\x59\x8a\x19\xab\x5a\x66\xeb\xf6\x60\xf5\x4d\x46\x4a\xeb\xfa\
-\x02\x5d\x23\xa0\x48\xc0\x06\x11\xa7\x00\xa0\xf6\x89\xd5\x54\x1d\
-\x9d\x0b\xa0\x35\xfe\xd8\x24\x1f\xd5\x77\x5f\x83\x81\x1f\x0e\x29\
-\xce\x9c\xc1\x5d\xba\x44\xb6\xb0\x40\xb6\xb4\x44\x36\x3f\x0f\x9d\
-\xce\x58\x93\x0c\x2d\xf8\x29\xad\xaf\x0b\x7d\x24\x83\xcf\x24\xe2\
-\xe3\xda\x1d\x90\x76\x58\xe2\xfb\xdb\x20\x60\xa2\xf5\x7d\x30\xc7\
-\x4b\x31\x83\x55\x88\x2d\x53\x96\x8f\xb4\xd6\x76\x65\x89\x1b\x0c\
-\xaa\xf2\x69\x55\xea\x2d\xe4\xa0\x54\x12\x96\x8a\xb0\x8c\x5b\x8b\
-\xe9\xde\x81\x75\xab\x33\xe5\x7a\x34\xc0\x4a\x11\x88\x02\x52\xa2\
-\xed\x25\xc3\x2f\x53\x3e\xbf\x24\xfe\xcc\x74\x3a\xf4\x82\xd9\xdf\
-\xc9\xf3\x8a\x04\x0c\xc2\x5f\x6b\xff\x30\x34\xd4\x86\xfd\x53\x14\
-\x05\x4f\x3d\xfc\xf0\x78\x09\xf7\xd6\xfa\x34\xf0\x63\xc0\x2f\xf1\
-\x0a\x5d\xf9\x2b\xf0\x33\xfd\x2e\xf0\x16\xe0\xaf\x01\x3f\x00\xdb\
-\x8f\x4f\x77\x01\x91\x1b\x42\x4f\xb3\x4f\xdc\x58\x9b\x28\x9a\xbd\
-\xe3\xe3\x1e\xf3\x4e\x57\xac\x29\xab\xc0\xa8\x8c\x43\x13\xb1\xee\
-\x0d\x2b\x40\xbb\x18\xb2\x21\x45\x20\x45\xd8\x03\x08\xc8\x3d\x2a\
-\xe5\x14\xc0\xad\xad\xe1\xd7\xd7\x71\x33\x33\x64\x0b\x0b\x30\x3f\
-\x8f\x9d\x9b\xc3\x76\xbb\x5b\x9d\x79\x13\x21\x49\x1d\x81\xb0\x9a\
-\x7c\x53\x80\xa0\x0b\x91\xb4\x55\xe0\xb5\xcb\xa1\x2a\x30\x8d\x90\
-\xa8\x2a\x62\x60\x74\x96\x5f\x68\xe2\x62\x02\x1f\x53\x06\x6d\x5f\
-\x14\x45\x65\xd6\x87\x6b\x90\x49\x8e\x86\x73\x95\x3b\x21\x20\xa0\
-\xd2\x8a\x75\xe7\x61\x49\xf9\x95\x26\x31\x12\x76\xb4\x51\x5b\xf6\
-\x38\x7c\x9a\x05\x5f\x5d\x04\xdc\x42\x15\xdb\x17\x17\x40\xc2\x7f\
-\xd6\xd2\x0d\x59\xa5\x22\xf8\x79\xd0\xfe\x56\x00\x20\x64\x9a\x8a\
-\xd9\xef\x8b\x02\x6b\x0c\xe7\x57\x57\x39\xf9\xf0\xc3\x29\x21\x7a\
-\x16\xf8\x17\xc0\x3f\xe1\x25\x28\xe9\x7d\xb5\x01\x80\x64\x46\xfd\
-\x20\xf0\x5f\x02\x10\xbc\x71\x92\x15\xb0\x36\x1c\xd6\xec\x70\x5d\
-\x89\x47\x54\x78\x22\x1d\x63\xa2\x9e\x82\x46\x57\x8f\x69\x72\x2c\
-\xb2\x0e\x8c\x1a\xa2\xa9\x8b\x84\xac\xd2\xfc\x56\x35\xd1\x6c\x08\
-\xb8\x4a\x4f\x36\x89\xd6\x5c\x26\xb2\x08\x6a\x30\x90\xf7\x2a\x4b\
-\xdc\xa5\x4b\xf8\xb5\x35\x6c\xb7\x4b\x3e\x37\x87\x99\x9b\xc3\xce\
-\xcc\x60\x7a\xbd\x46\x7c\x3a\x76\x11\x4c\x64\x19\x58\xc5\x62\x8f\
-\x2d\x25\x48\x42\xa2\xe2\x3d\xa6\x2c\xab\xef\xa2\x1b\x6d\x48\x4d\
-\x85\x4c\xcf\x2d\x0a\x8a\xd1\x88\xd1\x70\x58\x69\xfa\x20\xc8\x79\
-\xf8\x3e\x65\x20\xf3\x4c\x70\xdd\x6a\x72\x51\xdc\xa2\x00\x38\x3e\
-\x10\x75\x75\x0e\x80\x54\x87\x86\x3e\x04\x2e\x6a\xb3\xd6\x08\x8f\
-\xaa\x88\x44\xc6\x56\x8f\xbf\x5c\xe5\xfd\x4b\xa2\x4f\x57\xa5\xfb\
-\xd6\x00\x90\x65\x64\x9d\x4e\x05\x02\x9d\x0e\x59\x9e\x37\x48\x3f\
-\x2f\xd7\xa2\x28\x30\x0b\x0b\x7c\xee\x23\x1f\x61\xd8\x34\xff\x4f\
-\x03\xff\x1c\xf8\xe9\x00\x02\xaf\xf8\x95\xbf\xc2\x3f\xdf\x6f\x02\
-\xbf\x1d\x72\x06\xbe\x37\x44\x0a\xf2\x38\x5f\xe0\x7c\xbf\xcf\xa8\
-\x2c\xc9\xf3\xbc\xea\xdc\x1a\x34\xa9\x4e\x07\x95\x9a\xf5\xba\xc3\
-\x4d\xd4\x3d\xd8\xa8\xcd\xa4\xc7\x78\x91\x68\xbf\x15\xf7\x92\x1f\
-\x2b\xdd\x55\xbe\x7d\x2d\xec\xe2\x52\x68\x41\xd7\x03\x37\x54\x43\
-\x54\x01\x13\xdd\x9b\xbf\x9e\xa1\xe0\x3d\x6e\x7d\x1d\xb3\xb9\x59\
-\xb5\x27\xeb\xf5\xb0\xbd\x5e\x0d\x06\xe4\x39\xa6\xd3\xa9\x40\x21\
-\x9e\xef\xb7\x13\x73\x4a\x45\x51\x84\x33\x11\x2d\xed\x64\x30\x46\
-\x59\xd6\xda\xbd\x28\x0a\x46\x45\x51\x59\x61\x41\x68\x33\x63\xaa\
-\x73\x54\x2d\xbf\x80\x40\x4d\x98\x6a\x9f\x5e\xb9\x6d\x79\x28\x00\
-\x42\x71\x33\x75\x4f\x88\x40\x38\x9a\xd0\xfb\x41\xff\x6e\xa2\xf5\
-\xe5\x5c\xed\xfb\x67\x2a\x04\x28\x05\x3f\xb9\xb0\xfd\x21\xe6\x5f\
-\xb3\xfe\x42\xfe\x69\xbf\x5f\x5c\xc6\xa2\xc0\x97\x25\x99\x31\x5c\
-\x1a\x0c\xf8\xfc\x07\x3f\x18\xc7\xf8\xff\x19\xf0\xe3\x5c\x41\x2b\
-\xbf\x02\x3e\x63\x09\xfc\x7c\xb8\xbd\x16\x78\x13\xf0\x36\xe0\x2b\
-\x45\xb0\x07\x65\xc9\xb9\xf5\x75\x0e\x2d\x2f\x53\x44\x83\x47\xc5\
-\x0c\x2e\x75\xfd\xb9\xea\x53\xa7\x37\x92\x55\xd9\x5d\x46\x97\xb6\
-\xea\x12\xda\x88\x0c\x8b\x3b\xf3\xda\xa8\x09\xa7\xd7\xc5\x28\x7a\
-\x54\xb7\x68\x6d\xdd\xb0\x53\x81\x85\x51\x8f\xad\xb8\x06\x92\x92\
-\xaa\xbb\x27\x97\x25\x6c\x6c\x40\xbf\x5f\x69\x6c\x6b\xf1\xdd\x6e\
-\x15\x49\x90\xec\xb5\x4e\x07\xdb\xe9\x8c\x91\x80\x71\x64\xa1\x8e\
-\x9e\x84\x92\x5b\x9c\xa3\x0c\x21\x3a\xef\x1c\xc5\x68\x54\x69\x7b\
-\xef\xeb\xc1\x1b\x62\x66\x4b\x06\x9e\x71\xae\x12\xf4\x2c\xab\xc0\
-\x2a\x58\x5f\x5e\xb9\x0f\xba\xdf\x80\x81\xad\x8a\xbf\x60\xda\x4b\
-\x66\xa1\x0f\x9a\x3f\x53\x3c\x84\x76\x51\xa4\xfd\x98\xfc\x2e\xf5\
-\x0c\x01\x65\xf9\x09\x10\xd4\x09\x40\x21\xce\xdf\x51\xe9\xbf\x9d\
-\x90\xf6\x9b\x87\x6b\x9d\xa9\xe4\x9f\xba\x65\x9a\x73\x55\x2b\x7b\
-\xc0\x2e\x2e\xf2\xf0\xc7\x3f\xce\xfa\xea\x2a\xdd\x71\x9f\x9f\x29\
-\x00\xbc\x78\xeb\x0f\xc2\xed\x37\x81\x87\x44\x81\x94\xc0\xd3\xe7\
-\xce\x71\x68\x79\xb9\x72\x01\x82\x7f\xd9\xf0\xf7\xc5\xb7\x54\x6d\
-\x9e\x50\x85\x46\x04\x02\x09\x95\xe1\xe6\xd8\x1a\xd9\xa4\x87\x61\
-\x8e\x8d\xb6\xd2\x9a\x42\xfc\xd0\x94\x85\xa0\x84\xdc\xaa\x63\x0d\
-\xed\xaf\x5d\x02\x69\x99\x2e\xc2\x2f\x8f\x15\x57\x60\x35\x28\xc8\
-\xeb\x45\x81\x09\xed\xd5\x74\x48\xd2\x28\x37\xc4\xc4\x91\x0d\xdd\
-\xc5\x48\x7c\x7f\x01\x45\xb6\x3a\x2f\x95\xd2\x16\x3c\x08\xa4\x53\
-\xa3\xb2\x4a\x05\xae\xa5\x4c\xd6\x55\xe5\xc3\x35\x31\x18\x3e\x73\
-\x66\x0c\x45\x00\x0e\xa9\xd9\x37\xe1\xf5\x32\x98\xdc\x99\x6e\x02\
-\xab\x72\x01\x4c\x48\x20\x32\x59\xd6\x6c\xe5\xcd\x78\xb7\xe1\x3a\
-\x0c\x98\x4a\xf2\x91\xfc\xff\x3c\xaf\x38\x0a\x4d\xfc\xa9\x14\x73\
-\x1f\x92\x94\x72\x6b\x79\xee\xc2\x05\x1e\xf9\xbd\xdf\x8b\x99\xff\
-\xf3\x54\xe5\xbc\x53\x00\x78\x09\xd6\xc7\x03\x59\xf8\x46\x41\xfe\
-\x67\x57\x57\x39\x71\xee\x1c\x47\xf7\xee\x65\x58\x14\xd5\x86\x93\
-\x14\x60\x9d\xa0\x12\x58\x60\x17\xb4\x94\x0b\x31\x5d\x13\x12\x4f\
-\x74\xdf\x40\xa3\x36\x7f\x9c\xd4\x23\x91\x87\x78\xa2\x4e\x2c\xf4\
-\x56\x0b\x66\x3c\xf3\x40\x5e\x53\xc2\xad\x85\xd9\xaa\x99\x09\x46\
-\x1f\x0f\x20\x60\x15\x18\x58\xd5\x8a\x5b\x3f\x9f\x34\xda\xbb\x91\
-\x2a\xac\xad\x1c\xc9\x99\x50\x5c\x88\xf8\xde\x56\xa6\x21\xab\xc2\
-\x9e\x2c\x54\x06\x8a\xa0\x39\x6b\xc9\xca\x92\x22\x10\x76\x02\x40\
-\x45\xa8\x9b\x97\x4e\x4f\xa5\x22\x4d\x05\x2c\x24\x3b\x33\x57\x45\
-\x52\xd2\x02\x2c\x66\xfe\xad\x90\x73\x8a\xd4\xd4\x04\xa2\xee\xee\
-\x63\x55\xa9\x6f\x9d\x12\x1c\xae\xa1\x00\x81\x55\x25\xbf\x0d\xd3\
-\x5f\x22\x11\xce\x51\x2c\x2d\xf1\xe1\xf7\xbe\x97\x61\xbf\x1f\x03\
-\xc0\xbf\xe5\x45\x9c\xe0\x33\x05\x80\x71\xb7\xe0\x1f\x08\x00\x48\
-\x66\xde\xc7\x9e\x79\x86\x6e\x9e\xb3\x7f\xf7\x6e\x46\x51\x76\x99\
-\x36\xdb\xa5\xb3\xb0\x90\x46\x42\x70\x89\xe9\x3f\x46\x34\x45\xad\
-\xa5\x1b\x89\x37\xf1\x73\x01\x85\x44\x05\xd9\x58\x2d\xbb\xf6\x33\
-\x15\xe9\xa7\x85\x1f\xad\xfd\x25\x25\x35\x02\x82\x31\x0b\x21\x01\
-\x38\xb5\x85\x11\x03\x55\x34\x25\x58\xb4\xb5\x55\xdf\xbf\xbe\x4e\
-\x72\x2d\xa4\xe2\x52\x0a\xb4\x42\x43\x10\x11\x6a\xa7\xba\x38\x7b\
-\x6b\xeb\x5a\x8d\x4e\x68\xd9\x56\x3a\x57\x55\x78\xa2\xfa\x37\x78\
-\x5f\x95\x7e\x2b\xd7\xab\xd6\xbe\xba\x22\x51\x93\xb4\x51\xe4\x46\
-\x5b\x78\x56\x59\x47\x92\xca\x9b\xeb\x7e\x00\x92\xe7\x2f\x56\x42\
-\x78\x5c\xbb\x61\x21\xd5\x77\x6b\xc7\x95\xe4\x8b\x8b\x7c\xf8\xe1\
-\x87\x79\xee\xb1\xc7\x62\xd3\x7f\x1d\xf8\xc7\x57\xa2\x20\x5d\xa9\
-\x00\x20\xc9\x15\xff\x4f\xcc\x05\xfc\xde\xe3\x8f\x73\xfb\xe1\xc3\
-\x5c\xb3\x7f\x3f\xa5\xb5\x55\x0b\xa9\x68\xd4\x93\xd5\xe6\xbd\x1e\
-\xf5\x14\x1e\xdb\x68\x82\x8f\x8f\xea\xf8\x1b\xfd\xf3\xa2\x7c\x81\
-\x86\xe6\x57\x40\x10\x0b\xa7\x8d\x08\x3e\xa3\xcb\x4e\x13\xa6\xbf\
-\x4d\x58\x04\xba\x48\xa5\x06\x0a\x01\x92\x98\x2b\xd0\xe1\x42\x65\
-\xb9\x10\xf5\x27\xf4\x9a\x94\x0b\x2c\x3f\xaa\x1d\x9b\x95\x41\xa8\
-\xa1\x6d\x9b\xb8\x00\xd2\x1f\x20\x0b\xa0\xe0\xf3\xbc\x8a\x06\x28\
-\xb0\x28\x82\xa0\x17\x65\x49\x57\x80\x40\xf5\x7d\xec\x49\xc2\x50\
-\xf8\x9f\xba\x03\x94\x9e\xbd\xa8\x73\x16\x48\x54\x21\xd6\x43\x65\
-\x02\x19\xa8\x6b\xfa\xc5\x15\xb0\x29\x4e\x45\x4f\x63\xd2\xa1\xe1\
-\xa2\xa0\xb3\xb0\xc0\xe7\xce\x9f\xe7\x91\x8f\x7c\x24\x95\xf4\xf3\
-\x77\x68\x99\x81\x39\x05\x80\x17\xd7\x0a\xf8\x61\xe0\x03\x54\x8d\
-\x57\xb0\x40\xe1\x1c\x1f\x79\xe6\x19\xce\x6f\x6c\xf0\x9a\xc3\x87\
-\xab\x1e\x83\x61\x1c\xb9\x0d\xfc\x80\x98\xba\x7a\x72\xaf\x09\xae\
-\x40\x5d\x15\xa8\x4a\x8f\x75\xcb\x30\x12\xfd\x01\xb5\x49\x6d\xa2\
-\xe1\x97\x0d\x41\x56\x16\x82\x89\x34\xbb\x9e\x8e\xa4\xcf\xb5\xb1\
-\x86\xd7\x2e\x43\xcb\x79\x8d\x69\x4a\xda\xb2\x48\xe4\x2e\xa4\x0a\
-\x8c\xb4\xe5\x63\x82\x30\xf8\x60\xea\xd7\x5a\x31\x08\xb7\x95\x08\
-\x41\x59\x6e\x5d\x43\x01\x06\xb1\x06\x02\x39\x28\x91\x84\x2c\xcb\
-\x2a\x72\xaf\x28\xc8\xe5\x37\x88\xa6\x2a\xb9\x00\x0c\x35\x00\x07\
-\xe0\x69\xa4\xfa\xc6\xa0\xa6\xa6\x18\x49\x18\xd0\x28\x12\x50\x3f\
-\xb7\x89\xae\x42\x75\x14\x44\xf6\x41\x00\x3c\xbb\xb0\xc0\x67\x2f\
-\x5d\xe2\x23\xbf\xfd\xdb\x30\x1c\xc6\x91\x94\x5f\x07\xfe\xff\x57\
-\xaa\x10\x5d\xc9\x00\x00\x55\x7b\xb1\xbf\xaa\x7f\x00\x31\x5d\x1f\
-\x3d\x77\x8e\xb3\xeb\xeb\xdc\x72\xf8\x30\x87\xf6\xec\xc1\x05\x1f\
-\xd4\xe8\x38\xbe\xea\x7f\xef\xbd\xc7\x84\xe2\x21\x11\x76\xdd\x5a\
-\xba\xd1\x8d\x47\x37\xf2\x4c\xc5\xdb\xa3\x96\x5c\x8d\xd1\xd3\x09\
-\x40\x88\xcd\xfd\x4c\xf9\xf5\x46\x48\xa9\x18\x30\xb4\xb6\x97\xc7\
-\x91\x45\x31\x16\x62\x94\xec\x40\x89\xbb\xeb\x8e\x3f\x9a\xcb\xd0\
-\x3d\xfb\xb5\x16\x76\x0e\x9f\xe7\x75\xa6\xa0\x51\xdd\x83\x8c\x44\
-\x05\xa4\x5d\xb7\x0e\x1b\x42\x45\x4a\x8a\xd5\x10\xe2\xe9\x4e\x11\
-\x89\x75\xb8\x4f\x00\x20\xb8\x08\xf5\xef\xa4\x00\xb9\x11\xc9\x88\
-\x9a\x7d\xe8\x49\xc2\xda\x0d\xd0\xe3\xc6\x74\xeb\xb1\x78\x42\x70\
-\x6d\xfd\x94\x25\x79\x96\x51\x2c\x2e\xf2\x07\x8f\x3c\xc2\xe3\x9f\
-\xfc\x64\x15\xa1\x68\xee\xbf\xcf\x51\x55\xf5\x0d\xa6\x00\xf0\xf2\
-\xad\x9f\x04\xee\x02\xbe\x43\x27\x07\x75\x80\x4b\x83\x01\xbf\xff\
-\xf8\xe3\x1c\xbb\x78\x91\x9b\x0e\x1f\x66\xae\xd7\xab\xb8\x81\x58\
-\x03\x8a\xe9\xcf\xf8\xe8\x30\x3d\x11\x27\x6e\x02\x5a\xe7\xe1\x27\
-\xdc\x80\x31\xb2\x4f\xf9\xf7\x0d\x13\x3f\x26\xfd\x44\xf8\x45\x98\
-\xe5\x79\x10\xf0\xb1\xa8\x80\x26\x03\x5b\xb8\x01\xdd\x0a\xbb\x11\
-\xc9\x90\xb2\xe9\x44\x9f\x3b\x6d\x7a\x37\x6a\x25\x94\xb0\x4a\x6a\
-\xac\x77\x0e\x93\xe7\x95\x15\x20\x20\x11\x0b\x7c\x96\xd5\xd6\x81\
-\x09\xec\xbd\x58\x05\x36\xd6\xfa\xde\x57\xd6\x9a\x36\xff\xd5\x6f\
-\x12\x4f\xf5\xb1\xaa\x23\xb0\x8d\x01\x41\xb5\xf1\xd2\xa5\xc8\x3e\
-\x4e\x84\x92\xef\x57\x96\x55\x01\xd1\xfc\x3c\x27\x07\x03\x3e\xfe\
-\xc1\x0f\x72\xe6\xa9\xa7\xc8\xc7\x73\x28\x9e\x04\xbe\xf9\x4a\x24\
-\xfe\x5e\x6d\x00\xe0\x81\x3f\x09\xec\x0d\xf9\x01\xf5\xca\xc2\x8b\
-\x8f\x9f\x3b\xc7\xe9\xd5\x55\xae\x3f\x70\x80\xa3\x7b\xf7\xd2\xcd\
-\x73\x0a\xa9\x05\x10\x8d\x97\x68\x97\xdd\xa8\x81\x87\xb1\x66\x1a\
-\xe8\x48\x40\x44\xb0\xe9\xd0\x5f\xa3\x79\x66\xc2\x02\x20\x16\xf8\
-\x88\x08\xb4\xd6\x82\xf6\x5b\xb5\x45\xa0\xc8\x2b\x49\x5b\x6d\x24\
-\x0e\xb5\x45\x20\xe2\x0e\xc3\xd1\xb5\x90\x24\x20\xad\x81\xbd\x62\
-\xe3\x8d\xd2\xfc\x62\xc2\x37\xcc\x7f\xf5\xdc\x04\x8d\x2f\x9c\x81\
-\xdc\x8b\xe6\xf7\x4a\xf0\xeb\x63\xba\x34\x59\x42\x7e\x51\x06\xa3\
-\x4e\x73\x6e\xb4\x20\xd7\xae\x99\xce\x12\xd4\x5d\x99\x23\x80\x23\
-\x7c\xde\xce\xcc\x0c\x17\xad\xe5\x33\x4f\x3d\xc5\x63\x9f\xf8\x04\
-\x65\x51\xa4\x7c\xfe\x27\x80\xaf\x03\x3e\x71\xa5\x0b\xcf\xab\x01\
-\x00\x00\x56\x81\x77\x87\x50\x4c\x03\x04\x4c\xf8\x92\x9b\xa3\x11\
-\x1f\x7b\xe6\x19\x9e\x3e\x77\x8e\xeb\x0f\x1c\xe0\xe0\x9e\x3d\x74\
-\xf2\xbc\x4a\x5a\x51\x66\x7e\xa3\x09\x67\x3c\x8e\x5b\x93\x80\x6a\
-\x4c\xb6\xce\xef\xd7\x7c\x80\xd5\x59\x7f\xa2\x71\x15\x51\x65\x54\
-\xc6\x5f\xd2\xbf\x57\xc7\xea\xd7\x24\x3d\x35\x26\x05\x25\x71\x45\
-\x1d\x43\xb9\x11\x71\x84\xc2\xa8\x01\x2a\xc9\x56\xd7\xb1\xe6\x8f\
-\x01\x20\x98\xfa\x5e\xf9\xfd\x92\x24\x64\x24\x15\x38\x1c\xb7\x62\
-\xd2\x8b\xb6\x0f\x8f\xeb\x46\xaf\xaa\xe7\xa3\x26\xfc\x74\x83\xd7\
-\x78\x12\x4f\xa3\xd3\x11\xaa\x2d\x98\xca\x27\xa8\x81\x4d\x00\x4a\
-\x9b\xfb\xca\x8d\x31\xce\x91\xf5\x7a\xac\x59\xcb\xe7\x4f\x9e\xe4\
-\xf3\x0f\x3f\xcc\xe6\xda\x5a\xdd\xcf\x3f\x5a\x1f\x06\xfe\xc8\x95\
-\x4a\xfa\xc5\xcb\x78\xef\x5f\xb4\x37\xff\x71\x63\x5e\xea\xef\xb3\
-\x00\xfc\x14\xf0\x9d\x93\x98\x43\x80\x95\xf9\x79\xae\x3d\x70\x80\
-\x43\xcb\xcb\x95\x45\xa0\xda\x88\xc5\x3d\xed\xe2\x6e\xbc\x3e\xca\
-\xe3\x8f\xfb\x00\x10\x6b\xdc\x38\x96\x9f\x48\xff\x35\x09\xa1\xb7\
-\x21\x63\xb0\xd1\x92\x2a\x21\xe8\x46\x65\xad\xe9\xf3\x04\x58\xc4\
-\x52\x11\xb3\x5a\x7f\x2e\x14\x93\xde\x00\x3a\x95\x0c\x54\x03\x81\
-\x30\xf6\x41\xf0\xeb\x5b\xa8\xeb\x97\x8c\x41\x71\x0b\xea\xc7\x50\
-\x0b\xbd\x00\x85\xe4\x57\x78\x15\x4a\x34\x91\xf0\x7b\xc5\x47\xa0\
-\xb2\xff\x50\xdc\x84\x89\x9f\x0b\xaf\xa3\x0a\x9a\xbc\x6a\xe0\xe1\
-\x55\x3a\x33\xde\x63\x67\x67\x59\x05\x3e\xff\xf4\xd3\x3c\xf6\xd9\
-\xcf\xb2\xbe\xba\x3a\xa9\x93\xcf\xbf\x03\xfe\x14\x55\x2f\xbf\x97\
-\x74\xfd\xd8\x8b\x24\xa7\xaf\x16\x0b\x40\xd6\x1a\xf0\x3f\x51\x65\
-\x0b\xfe\x75\x60\x31\x3e\x41\x72\xb7\xcf\xae\xaf\x73\xf6\xb1\xc7\
-\xd8\xf3\xdc\x73\x5c\xb3\x7f\x3f\x57\xad\xac\x30\x3b\x3b\x5b\x8f\
-\x25\xd3\x99\x7e\xd2\x08\xa3\x6e\x8f\x1d\x69\xfc\xb8\x19\x87\xd1\
-\x82\x16\x99\xe2\xc4\x44\x9d\xf6\xf9\x95\xd0\x8a\x80\x6b\xd3\x3e\
-\xa5\xed\x8d\xe6\x08\x34\x17\x10\xb4\xbe\xbc\x47\xfc\x59\xb4\x0f\
-\x9d\xec\x0f\xa0\x9b\x83\x88\x70\x96\xe5\x56\xeb\x70\x01\x01\xe7\
-\xf0\x21\xed\x57\x84\xdc\x04\x90\x70\x8a\x1c\x94\xb0\xa1\x36\xf3\
-\xad\x00\x85\x02\x02\x11\xd2\x06\xf0\x68\x50\x52\x64\x9d\x89\xc0\
-\x4a\x77\x38\xd2\xd3\x8d\x35\x80\x59\xe7\xc8\xba\x5d\x8a\x5e\x8f\
-\x33\xa3\x11\x8f\x3f\xf5\x14\x4f\x7d\xf6\xb3\x6c\xae\xad\xd5\x03\
-\x3d\x13\xab\x4f\xd5\xa7\xe2\x27\x5e\x65\xf2\xf2\xaa\xb3\x00\xf4\
-\xba\x8f\x6a\x12\xd1\x83\xdb\xc5\x12\x3d\xb0\xab\xdb\xe5\xc8\xbe\
-\x7d\x1c\xdd\xbb\x97\xc5\x5d\xbb\xc8\xb3\xac\x6e\x3e\xda\x5a\xe0\
-\x13\x0d\xda\xf0\x5a\xd0\x60\x4c\xfb\x93\x30\xe9\x51\xc2\x4b\x42\
-\xc8\x6b\xff\x3f\x76\x05\x82\xa0\xa3\xce\x69\x58\x05\xa1\x2e\x60\
-\xec\xff\xaa\xae\xc9\xfa\x71\x03\x08\x94\x5f\xec\x75\x36\x9c\x08\
-\xac\x84\x01\xc5\x7d\xd2\x82\x2c\xe6\xbc\x73\xd5\xc0\x0c\x09\xed\
-\x95\x65\xf3\x3c\x65\x31\xd4\xc7\x94\xc6\xd6\xa4\x63\x2d\xf4\xa9\
-\xc7\xda\x42\x08\xef\xa5\xb5\xbe\x29\xcb\xaa\x12\x34\xcb\xa0\xd3\
-\x61\x1d\x78\xfa\xf9\xe7\x79\xf2\xa9\xa7\x38\xfd\xf4\xd3\x14\xc3\
-\xe1\x24\x8d\x0f\x55\xff\xbe\x1f\xa6\xca\x3c\x7d\xd9\xd6\x8b\x65\
-\x01\xbc\x9a\x01\x00\xaa\xce\x42\x7f\x16\xf8\x33\xc0\xbe\x49\x27\
-\xca\x20\x8a\x9e\x31\xec\xdb\xbd\x9b\x23\xfb\xf6\x71\x28\x58\x05\
-\x46\x95\xa1\x26\xcb\x78\x05\x1c\x54\x05\x5e\xe3\xb5\x38\x46\xaf\
-\xb4\xbd\x36\xe7\x69\xd1\xf0\x0d\x10\xd0\x0d\x2a\xd4\xb1\xc6\x7b\
-\xc9\x73\xfd\xb9\xe4\xfd\x75\xc9\xb1\xea\xd0\x3b\x16\x01\x50\x5a\
-\xb5\x16\x7e\x65\x42\x0b\x71\x87\x73\x5b\xc0\xa0\xc1\x40\xb9\x01\
-\xf2\x18\x05\x10\x5a\x50\x5d\x30\xc7\xe5\xfc\x06\xe1\xa8\x3f\x87\
-\x08\xbd\x9c\x23\xaf\x2b\x81\xf7\x32\x3b\x50\x34\xbd\xf7\x6c\x5a\
-\xcb\xb3\x27\x4f\x72\x6a\x75\x95\x67\x1e\x7e\x98\xf5\xb5\xb5\x66\
-\x33\x99\xf4\x7a\x2c\x84\x97\x7f\x96\x6a\xb6\x07\x53\x00\xb8\xf2\
-\x00\x40\xd6\xf5\xc0\x9f\x0e\xa1\xc2\xbd\xdb\x85\x14\xca\xb0\x31\
-\xe6\x3b\x1d\x0e\xae\xac\x70\x68\xef\x5e\xf6\x2f\x2f\x33\x37\x37\
-\x87\x11\xcb\x40\x13\x68\x89\x90\x1b\x5a\x50\xa5\x57\x80\x62\xf4\
-\x75\x18\xaf\x51\xf5\x17\x09\x79\xfd\x5c\x09\xb9\xcd\xb2\xad\xff\
-\x99\x65\x18\x21\x06\x95\x25\x61\xf2\x7c\x2b\xb5\x35\xaa\x3c\x94\
-\xf7\x1a\x6b\x11\xa6\x23\x20\x22\x78\x5a\x28\xe5\x79\x30\xeb\xd1\
-\x42\x2e\x40\xa0\x5d\x03\x11\x7c\x65\x15\x88\x9b\x10\x0b\xad\xb6\
-\x04\x1a\xaf\x29\xc0\x21\xe2\x21\x50\x96\x85\x09\xfe\x7f\xde\xeb\
-\xb1\x39\x1c\xb2\x91\xe7\x3c\xfd\xf8\xe3\x9c\xba\x78\x91\xe7\x3e\
-\xfb\x59\xfa\x9b\x9b\x94\xa1\xa0\x69\x9b\x79\x78\x27\xa8\xea\xf9\
-\x7f\x8a\xaa\xbe\xff\x15\xb1\xa6\x00\xf0\xc2\xac\x63\x54\xf3\xd7\
-\xbe\x13\xb8\x71\xbb\x93\xc5\x2a\xc8\x80\xf9\x6e\x97\x43\xfb\xf6\
-\x71\x70\xef\x5e\xf6\x05\x30\xc8\x43\x5f\xff\x7a\x96\x5f\xe4\x73\
-\x6b\xc1\xaf\x35\x79\x82\xb4\xab\xad\x84\x84\x1f\x6f\x62\x0d\x2f\
-\xc7\xf2\x7c\x0c\x24\xd0\xaf\x8b\x90\xc7\x56\x83\xb6\x4c\x54\xd8\
-\x32\x76\x01\x74\x78\xcc\xa7\xee\x63\x0d\xef\x3d\x84\xa6\xac\x68\
-\x73\x5f\x03\x84\x24\x07\x85\xd7\x51\xc9\x42\xb5\xc6\x0f\x26\xbb\
-\x53\xff\xab\x01\x2e\x21\x13\xd1\x78\x8f\x29\x0a\x6c\xb7\x8b\x33\
-\x86\xcd\x7e\x9f\x55\xe7\x78\xea\xf1\xc7\x39\x71\xe2\x04\x67\x4f\
-\x9e\x64\xb0\xb1\x51\xf3\x3e\x3b\x18\x82\xf9\x69\xe0\xe7\x80\x7f\
-\x05\x3c\xf7\x4a\xdb\xb8\x53\x00\x78\xe1\xa3\x05\xef\x0c\x60\xf0\
-\xd0\x4e\xc8\x50\x0d\x06\xbd\x2c\x63\xdf\xf2\x32\xfb\x57\x56\x38\
-\x74\xe0\x00\x8b\x4b\x4b\xcc\xf4\x7a\x64\x9d\x4e\x5d\x7d\x38\x46\
-\x0a\xc6\x9a\x5d\x7c\xfe\x20\xb8\x02\x0e\x35\x5b\xaf\x05\x5c\x0b\
-\x7d\x78\x2f\xab\x85\x3e\x7e\x1c\x00\x85\xd8\x1d\x50\xff\x37\x49\
-\x64\x36\x4c\xa1\xa6\xd0\x6b\x93\x5b\x6b\x79\xe9\x1d\xd0\x30\xfb\
-\xe5\x98\xb2\x00\x1a\x1a\x5e\x09\xb3\xd3\x66\xbc\x80\x84\x02\x88\
-\xda\xe4\x2f\x8a\x2a\xbe\xdf\xed\x52\x3a\xc7\xc6\xe6\x26\x1b\xd6\
-\xf2\xe4\x27\x3f\xc9\xaa\x31\x3c\xfd\xf1\x8f\xd3\xef\xf7\xd9\xdc\
-\xdc\xac\x27\xf3\xec\x60\xf7\x0d\xa9\x1a\xce\xfc\x2c\xf0\x7f\xf3\
-\x0a\x69\xd5\x3d\x05\x80\x97\x76\xbd\x8e\x2a\xae\xfb\x4d\xc0\xe1\
-\xed\x4e\xf6\x11\x79\xd8\x35\x86\xf9\x99\x19\xf6\xef\xdd\xcb\xee\
-\x3d\x7b\x38\xb8\x6f\x1f\x4b\x7b\xf6\x30\x3b\x3b\x4b\xa7\xdb\xad\
-\x2a\xdd\x74\xd3\xd0\x98\xa9\x8f\x85\x59\x59\x02\x0d\x30\x50\xda\
-\xbd\xee\x15\xd0\xe9\xe0\x23\x12\x70\x0c\x08\x34\x0f\x11\xf1\x00\
-\x8d\xbe\x05\xf1\xf7\xd4\x24\x9b\x08\xa9\x32\xb9\x89\x09\x37\xed\
-\xfb\x8b\xe0\xab\xe7\xa8\x63\x12\x0e\xa4\x28\x2a\x6d\x9f\x10\xf6\
-\x2c\x7c\xef\xc2\x39\x36\x2f\x5d\x62\xd4\xeb\x71\xea\xa9\xa7\x38\
-\x7d\xf2\x24\x9b\xce\xf1\xe4\x1f\xfe\x21\xa3\xb2\x64\x33\x68\x79\
-\xc9\xd4\xdb\xc1\x8e\xf3\x54\x29\xe4\xff\x25\xdc\x3e\x7a\x25\x6c\
-\xd2\x29\x00\xbc\xf8\x6b\x6f\xb0\x0a\xbe\x9d\xaa\xeb\x50\x77\x27\
-\x7f\xe4\x15\x6f\x40\x00\x84\x99\x5e\x8f\x03\x2b\x2b\x2c\xee\xde\
-\xcd\xf2\xf2\x32\x2b\x2b\x2b\xcc\x2f\x2d\xd1\x9b\x9d\xa5\xdb\xeb\
-\x61\x3a\x9d\x3a\x9c\x58\x77\xe6\x8d\x04\xb7\xe1\x16\x68\xe1\xd7\
-\x1c\x80\x16\x6a\x65\x1d\x88\x1b\x81\x3e\x4f\x09\xfd\x18\x10\xc4\
-\x03\x47\xb4\xc6\xd7\xe4\x9a\xf0\x00\x1a\x04\x44\xb8\x23\x53\x1d\
-\xed\xeb\x87\xe7\x68\x6d\x1f\xde\x2f\x0b\x4d\x4a\x9c\xf7\xf4\x2f\
-\x5c\x60\xd3\x39\x46\x79\xce\x33\x1f\xfb\x18\x17\x57\x57\x19\x5a\
-\xcb\xd3\x1f\xfd\x28\x1b\x1b\x1b\x8c\x36\x37\x19\x06\x7f\xff\x32\
-\x04\x5e\xd6\xe7\x83\x96\xff\xcf\x54\x05\x64\xa3\x2b\x69\x73\x4e\
-\x01\xe0\xa5\x5d\x77\x04\x8b\xe0\x9d\xe1\xf1\x8e\xf3\x25\x34\x20\
-\x38\xaa\xb8\x72\x6e\x2d\xbd\x5e\x8f\xbd\xbb\x77\xb3\xb4\xbc\xcc\
-\xd2\xbe\x7d\xec\x59\x5a\x62\xd7\xae\x5d\xcc\x2e\x2d\xd1\x5b\x58\
-\xa0\xd3\xed\x92\x07\x70\xa8\xad\x85\x3c\x6f\x8e\x1c\x4f\x09\x7e\
-\x64\x3d\x34\x62\xfe\xc1\x8d\x20\x8a\x3a\x34\x80\x40\x47\x05\x62\
-\xed\x1f\x93\x70\x89\x7b\x21\xe3\x6a\xed\x2d\xc5\x40\xa1\x09\xab\
-\x54\x13\x3a\xef\x29\x47\x23\xfa\x17\x2e\x30\xd8\xdc\xa4\xec\xf5\
-\x58\x5f\x5f\xe7\xc4\x47\x3f\xca\xda\xe6\x26\xae\xdb\xe5\xc4\x27\
-\x3e\xc1\xf9\x53\xa7\xc0\x5a\xfa\x6b\x6b\x14\x6c\x0d\xdb\x34\x97\
-\x2f\xf0\x9e\x2a\x65\xf7\xbf\x03\xff\x95\x6a\x00\xe7\xc6\x95\xba\
-\x21\xa7\x00\xf0\xf2\xac\x0e\x70\x37\xd5\xe4\xa2\xaf\x09\x8f\x3b\
-\x97\xf3\x06\x3e\x8a\x2e\xb8\xb0\xa9\x3b\x84\x8e\x35\x9d\x0e\x2b\
-\x7b\xf7\xb2\x38\x37\xc7\xdc\xd2\x12\xb3\x2b\x2b\xac\x1c\x38\xc0\
-\x5c\xaf\x47\xaf\xd7\xa3\xb7\x6b\x17\xbd\xdd\xbb\xe9\xce\xcd\x91\
-\x85\x4e\xb5\x36\xcb\xb0\x9d\x0e\xb6\xdb\xad\x07\xa2\xd6\xed\xbe\
-\x34\x18\x68\xb6\x5f\x1e\x2b\x00\x40\x73\x00\xaa\x11\x46\x23\xb1\
-\x26\x74\x4e\x22\x90\x7c\x8c\x46\x5b\xe6\x7a\x18\xe6\x59\x0c\x06\
-\xf4\x2f\x5c\xa0\xdc\xdc\xac\x6a\xfc\xf3\x9c\x51\x51\x70\xe6\x73\
-\x9f\xe3\xf4\x23\x8f\x50\x7a\x4f\xd9\xed\xd2\x1f\x0c\x78\xee\x53\
-\x9f\xe2\xd2\xe9\xd3\x55\x34\xc5\x39\xfa\x9b\x9b\xf5\x54\x64\x4d\
-\xd6\xd9\x2f\xec\xf7\xda\x00\xfe\x90\xaa\x65\xdc\x6f\x01\x1f\xa2\
-\x6a\xd6\x71\xc5\xaf\x29\x00\xbc\xfc\x2b\x07\x6e\x0f\x40\xf0\x95\
-\xc0\x3d\x24\x32\x0d\xbf\x10\x60\x70\x6c\x55\x21\x4a\x25\x63\xa6\
-\xf2\xf8\x67\x16\x16\x58\xb9\xea\x2a\x66\xba\xdd\xaa\x9d\x75\xa7\
-\x43\x67\x6e\x8e\x6c\xd7\x2e\x7a\x0b\x0b\xac\x1c\x3d\x4a\xde\xed\
-\x32\xbb\xb4\x54\x01\xc1\x68\x04\xde\xd3\x9d\x9f\x27\xcb\xf3\xa6\
-\x96\xd7\x5d\x87\xe5\x78\x00\x92\x61\xbf\x5f\x65\xfd\x75\x3a\xb8\
-\xb2\xa4\xbf\xb6\x86\x77\x8e\x53\x9f\xfe\x34\x9b\x97\x2e\xe1\xfb\
-\x7d\xdc\x70\x58\x69\x73\xa0\x30\x86\xe1\x60\xc0\xfa\x99\x33\x3c\
-\xf7\xa9\x4f\x55\x89\x3f\x50\xb7\xf1\x1a\x6e\x6e\xd6\x76\xb6\x81\
-\xb1\xd8\xfb\x65\x6a\xf4\xd4\xda\xa4\x1a\xc4\xfb\xfe\x60\xd6\xff\
-\x0f\xe0\xa9\x70\x39\x5f\x55\x6b\x0a\x00\xaf\xac\x65\x02\x61\xf8\
-\x7a\xaa\x4c\xc3\xd7\x07\x70\x98\x7b\x21\xde\xdc\xb7\x80\x84\x8f\
-\x8e\xc9\xe8\xe9\x4e\xe0\x11\xb2\x3c\x6f\x98\xf0\x7a\x9c\xb5\x9f\
-\x24\x6c\x81\xa4\x94\x81\x9f\x84\x86\xa9\x65\x08\xb9\x0d\xa4\x35\
-\x78\xe2\x22\x68\xc1\xa6\xe5\xf5\x17\x70\x9d\xa3\x1a\x1f\xf7\x61\
-\xe0\x23\x54\x53\xa4\x9e\x08\x6c\xfe\xab\x7a\x4d\x6b\x01\x5e\x59\
-\xcb\x53\x25\x8c\xfc\xfb\x70\xcb\x81\xa3\x54\x3d\x0a\x5f\x1b\xac\
-\x83\xd7\x00\x7b\xbe\x10\x19\x30\xd1\x3d\xb4\xce\x98\xdf\x02\x03\
-\xef\xab\xb6\xdd\xea\xef\x0a\xf7\xc5\x29\x42\x79\x9f\xde\x4b\x7f\
-\x7d\x1d\x70\x31\x68\xf7\x8f\x01\x9f\xa1\x6a\x04\xfb\x71\xaa\x42\
-\x1c\x37\xdd\x82\x53\x00\x78\x25\xad\x02\x78\x3c\xdc\xfe\x75\x70\
-\x61\x97\x81\x5b\xa9\x66\x1c\xde\x00\xdc\x1c\x40\x61\x85\xd0\xc2\
-\xec\x85\x34\x47\xb6\x7b\xfc\x0a\x5d\x65\xf0\xdb\x9f\xa4\xea\xae\
-\xf3\x39\x2a\xb6\xfe\x61\xaa\x41\x9a\xe7\xc3\xb5\x9d\xae\x29\x00\
-\x5c\x51\xcb\x01\x67\x80\xf7\x86\x9b\xac\x85\x60\x29\x5c\x13\xee\
-\x8f\x02\x47\x80\xab\xc3\xe3\x83\x01\x1c\x3a\xaf\x92\xeb\x50\x52\
-\xb5\xcb\xda\x00\x9e\x09\xfe\xf9\x93\xe1\xf1\xd3\xc1\x7c\x7f\x3c\
-\x08\xfa\x60\xba\x6d\xa6\x00\xf0\x6a\x5f\x6b\x41\xbb\xa5\x9a\x49\
-\xcc\x02\xbb\x14\x30\x1c\x0e\xd6\xc2\xae\xe0\x4a\xec\x56\xb7\xa5\
-\x60\x61\xf4\xc2\x6f\xd8\x7d\x71\x5c\xee\x31\x50\x73\x54\xf1\x73\
-\x11\xec\x73\xc0\x85\x20\xc0\x17\x03\xe8\x9d\x06\x4e\x51\xa5\xd3\
-\xca\xfd\x19\xaa\x92\xda\xe1\x74\x0b\x4c\x01\x60\xba\xd2\x6b\x33\
-\xdc\x4e\x53\x91\x5c\x7a\x75\x83\xf5\x30\x07\xcc\x87\xfb\x05\xaa\
-\x28\xc4\x4a\xb8\x75\xa8\x2a\x1e\x25\x90\xb0\x97\xad\x7e\x9f\x26\
-\x3c\xef\x6c\x03\x4e\x17\xd9\x8a\xc0\x79\xe0\xf9\x20\xec\x17\x82\
-\x16\xdf\x0c\x8f\x2f\x85\x73\xd7\xa8\xc2\x6c\xeb\xe1\xf5\x4b\x6c\
-\xe5\x44\x4d\xd7\x15\xb0\xfe\xbf\x01\x00\x57\xbc\xea\x56\x7e\x7a\
-\xb4\x5b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-"
-
-qt_resource_name = b"\
-\x00\x09\
-\x0c\x78\x54\x88\
-\x00\x6e\
-\x00\x65\x00\x77\x00\x50\x00\x72\x00\x65\x00\x66\x00\x69\x00\x78\
-\x00\x09\
-\x0a\x6c\x38\x43\
-\x00\x52\
-\x00\x65\x00\x73\x00\x6f\x00\x75\x00\x72\x00\x63\x00\x65\x00\x73\
-\x00\x05\
-\x00\x4f\xa6\x53\
-\x00\x49\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x08\
-\x01\xbf\x5e\x67\
-\x00\x41\
-\x00\x7a\x00\x75\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x05\xad\x46\x47\
-\x00\x4e\
-\x00\x61\x00\x72\x00\x61\x00\x6e\x00\x6a\x00\x61\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x08\xa8\xee\xc7\
-\x00\x56\
-\x00\x65\x00\x72\x00\x64\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\x12\x5c\x67\
-\x00\x52\
-\x00\x6f\x00\x6a\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x18\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x30\x00\x02\x00\x00\x00\x04\x00\x00\x00\x04\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\xbf\x9b\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x02\x1d\xa8\
-\x00\x00\x00\x72\x00\x00\x00\x00\x00\x01\x00\x01\x4b\xa3\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x18\x00\x02\x00\x00\x00\x01\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x30\x00\x02\x00\x00\x00\x04\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x40\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\x58\x35\xd1\xee\
-\x00\x00\x00\x56\x00\x00\x00\x00\x00\x01\x00\x00\xbf\x9b\
-\x00\x00\x01\x9a\x58\x35\xd1\xf1\
-\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x02\x1d\xa8\
-\x00\x00\x01\x9a\x58\x35\xd1\xf2\
-\x00\x00\x00\x72\x00\x00\x00\x00\x00\x01\x00\x01\x4b\xa3\
-\x00\x00\x01\x9a\x58\x35\xd1\xf3\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
@@ -5,30 +5,23 @@ import os
 import csv
 import re
 from PyQt5.QtWidgets import QDialog
-from mesas_emergente import EmergenteMesas 
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QItemSelection, QItemSelectionModel, QTimer
 from PyQt5.QtWidgets import (
-    QMainWindow, QFileDialog, QTableWidgetItem, QMessageBox, QMenu,
-    QToolButton
+    QMainWindow, QFileDialog, QMessageBox, QMenu, QToolButton, QTableView,
+    QAbstractItemView, QHeaderView
 )
 
 from Vistas.pantalla2_ui import Ui_MainWindow
-from WAnadirPersona import WAnadirPersona 
+from modelo_invitados import FiltroInvitados, ModeloInvitados
+from nucleo_mesas.csv_io import CAMPOS_INVITADO, normalizar_cabeceras
 
 # ------------------ Configuración ------------------
-CAMPOS = ["nombre", "apellido", "pref_con", "pref_sin"]
+# Columnas y cabeceras aceptadas: las mismas que lee el generador sin interfaz
+CAMPOS = CAMPOS_INVITADO
 
-CSV_MAP = {
-    "nombre": "nombre",
-    "apellido": "apellido",
-    "prefiere con": "pref_con",
-    "preferencias de con quien estar": "pref_con",
-    "preferencias de con quién estar": "pref_con",
-    "prefiere sin": "pref_sin",
-    "preferencias de con quien no estar": "pref_sin",
-    "preferencias de con quién no estar": "pref_sin",
-}
+# Espera tras la última tecla antes de filtrar
+RETARDO_BUSQUEDA_MS = 150
 
 
 def invitado_vacio():
@@ -67,7 +60,9 @@ class VPantallaInvitados(QMainWindow):
             or "Nombre del Evento"
         )
 
-        self.invitados = []
+        self.modelo = ModeloInvitados(parent=self)
+        self.filtro = FiltroInvitados(self)
+        self.filtro.setSourceModel(self.modelo)
 
         self._cargar_qss()
         self._config_labels()
@@ -75,7 +70,14 @@ class VPantallaInvitados(QMainWindow):
         self._conectar_senales()
 
         self._cargar_csv_evento()
-        self.refrescar_tabla()
+
+    @property
+    def invitados(self):
+        return self.modelo.invitados
+
+    @invitados.setter
+    def invitados(self, invitados):
+        self.modelo.reemplazar(invitados)
 
     # ---------- QSS ----------
     def _cargar_qss(self):
@@ -102,50 +104,48 @@ class VPantallaInvitados(QMainWindow):
 
     # ---------- Tabla ----------
     def _config_tabla(self):
-        tbl = self.ui.tblInvitados
-        tbl.setColumnCount(4)
-        tbl.setHorizontalHeaderLabels(
-            ["Nombre", "Apellido", "Pref de estar", "Preferencias de con quien no estar"]
-        )
+        # El .ui trae un QTableWidget; se sustituye por una QTableView sobre
+        # el modelo (mismo objectName para el QSS)
+        viejo = self.ui.tblInvitados
+        tbl = QTableView(viejo.parent())
+        tbl.setObjectName("tblInvitados")
+        self.ui.wrapTablaLayout.replaceWidget(viejo, tbl)
+        viejo.deleteLater()
+        self.ui.tblInvitados = tbl
+
+        tbl.setModel(self.filtro)
+        for cab, cab_vieja in ((tbl.horizontalHeader(), viejo.horizontalHeader()),
+                               (tbl.verticalHeader(), viejo.verticalHeader())):
+            cab.setVisible(cab_vieja.isVisibleTo(viejo))
+            cab.setDefaultSectionSize(cab_vieja.defaultSectionSize())
+            cab.setMinimumSectionSize(cab_vieja.minimumSectionSize())
         tbl.horizontalHeader().setStretchLastSection(True)
-        tbl.setSelectionBehavior(tbl.SelectRows)
-        tbl.setSelectionMode(tbl.ExtendedSelection)
-        tbl.setEditTriggers(tbl.NoEditTriggers)
+        # Alto de fila fijo: la vista no mide filas fuera de pantalla
+        tbl.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        tbl.setSelectionBehavior(QAbstractItemView.SelectRows)
+        tbl.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        tbl.setEditTriggers(QAbstractItemView.NoEditTriggers)
         tbl.setAlternatingRowColors(True)
         tbl.doubleClicked.connect(self._on_double_click_editar)
 
     def refrescar_tabla(self, filtro=""):
-        datos = self._filtrar(filtro)
-        tbl = self.ui.tblInvitados
-        tbl.setRowCount(len(datos))
-
-        for r, inv in enumerate(datos):
-            valores = [
-                inv.get("nombre", ""),
-                inv.get("apellido", ""),
-                inv.get("pref_con", ""),
-                inv.get("pref_sin", ""),
-            ]
-            for c, val in enumerate(valores):
-                tbl.setItem(r, c, QTableWidgetItem(str(val)))
-
-    def _filtrar(self, texto):
-        if not texto:
-            return self.invitados
-        f = texto.lower().strip()
-        return [
-            d
-            for d in self.invitados
-            if f in (d.get("nombre", "") + " " + d.get("apellido", "")).lower()
-        ]
+        # Los cambios ya llegan a la vista por el modelo; aquí solo se filtra
+        self.filtro.set_texto(filtro)
+
+    def _buscar(self):
+        if hasattr(self, "_temporizador_busqueda"):
+            self._temporizador_busqueda.stop()
+        self.refrescar_tabla(self.ui.txtBuscar.text())
 
     # ---------- Selección ----------
+    # Filas de self.invitados (no de la vista, que puede estar filtrada)
     def _fila_seleccionada(self):
-        idxs = self.ui.tblInvitados.selectionModel().selectedRows()
-        return idxs[0].row() if idxs else -1
+        filas = self._filas_seleccionadas()
+        return filas[0] if filas else -1
 
     def _filas_seleccionadas(self):
-        return sorted(i.row() for i in self.ui.tblInvitados.selectionModel().selectedRows())
+        return sorted(self.filtro.mapToSource(i).row()
+                      for i in self.ui.tblInvitados.selectionModel().selectedRows())
 
     # ---------- Señales ----------
     def _conectar_senales(self):
@@ -163,10 +163,16 @@ class VPantallaInvitados(QMainWindow):
             ui.btnGenerarMesas.clicked.connect(self.on_generar_mesas)
 
         if hasattr(ui, "txtBuscar"):
-            ui.txtBuscar.textChanged.connect(lambda t: self.refrescar_tabla(t))
+            # Se filtra al dejar de teclear, no en cada pulsación
+            self._temporizador_busqueda = QTimer(self)
+            self._temporizador_busqueda.setSingleShot(True)
+            self._temporizador_busqueda.setInterval(RETARDO_BUSQUEDA_MS)
+            self._temporizador_busqueda.timeout.connect(self._buscar)
+            ui.txtBuscar.textChanged.connect(self._temporizador_busqueda.start)
+            ui.txtBuscar.returnPressed.connect(self._buscar)
 
         if hasattr(ui, "btnBuscar"):
-            ui.btnBuscar.clicked.connect(lambda: self.refrescar_tabla(ui.txtBuscar.text()))
+            ui.btnBuscar.clicked.connect(self._buscar)
 
         if hasattr(ui, "btnMenuTabla"):
             ui.btnMenuTabla.setPopupMode(QToolButton.MenuButtonPopup)
@@ -185,19 +191,21 @@ class VPantallaInvitados(QMainWindow):
 
     # ---------- Menú tabla ----------
     def _invertir_seleccion(self):
-        tbl = self.ui.tblInvitados
-        total = tbl.rowCount()
-        actuales = {idx.row() for idx in tbl.selectionModel().selectedRows()}
-        tbl.clearSelection()
-        for r in range(total):
-            if r not in actuales:
-                tbl.selectRow(r)
+        total = self.filtro.rowCount()
+        if not total:
+            return
+        todo = QItemSelection(self.filtro.index(0, 0),
+                              self.filtro.index(total - 1, self.filtro.columnCount() - 1))
+        self.ui.tblInvitados.selectionModel().select(
+            todo, QItemSelectionModel.Toggle | QItemSelectionModel.Rows)
 
     # ---------- CRUD ----------
     def _on_double_click_editar(self, *_):
         self.on_edit()
 
     def on_add(self):
+        from WAnadirPersona import WAnadirPersona  # carga uic: solo al usarse
+
         dlg = WAnadirPersona(self)
 
         if dlg.exec_() == QDialog.Accepted:
@@ -207,8 +215,7 @@ class VPantallaInvitados(QMainWindow):
                 QMessageBox.warning(self, "Validación", "El nombre es obligatorio.")
                 return
 
-            self.invitados.append(datos)
-            self.refrescar_tabla()
+            self.modelo.anadir([datos])
 
     def on_edit(self):
         fila = self._fila_seleccionada()
@@ -216,9 +223,12 @@ class VPantallaInvitados(QMainWindow):
             QMessageBox.information(self, "Editar", "Selecciona un invitado.")
             return
 
+        from WAnadirPersona import WAnadirPersona
+
         invitado = self.invitados[fila]
         dlg = WAnadirPersona(self, invitado=invitado, indice=fila)
-        dlg.exec_()
+        if dlg.exec_() == QDialog.Accepted:
+            self.modelo.actualizar(fila, dlg.datos())
 
     def on_delete(self):
         filas = self._filas_seleccionadas()
@@ -229,31 +239,14 @@ class VPantallaInvitados(QMainWindow):
         if QMessageBox.question(self, "Eliminar", f"¿Eliminar {len(filas)} invitado(s)?") != QMessageBox.Yes:
             return
 
-        for f in reversed(filas):
-            del self.invitados[f]
-
-        self.refrescar_tabla()
+        self.modelo.eliminar(filas)
 
     def _datos_por_fila(self, fila):
-        return {
-            k: (
-                self.ui.tblInvitados.item(fila, i).text()
-                if self.ui.tblInvitados.item(fila, i)
-                else ""
-            )
-            for i, k in enumerate(CAMPOS)
-        }
+        return {k: self.invitados[fila].get(k, "") for k in CAMPOS}
 
     # ---------- CSV ----------
     def _normaliza_headers(self, headers):
-        norm = []
-        for h in headers:
-            base = h.strip().lower().lstrip("\ufeff").strip(" ;:,")
-            if base in CAMPOS:
-                norm.append(base)
-            else:
-                norm.append(CSV_MAP.get(base, None))
-        return norm
+        return normalizar_cabeceras(headers)
 
     def on_import_csv(self):
         ruta, _ = QFileDialog.getOpenFileName(self, "Importar CSV", "", "CSV (*.csv)")
@@ -282,8 +275,7 @@ class VPantallaInvitados(QMainWindow):
 
                 nuevos.append(inv)
 
-            self.invitados.extend(nuevos)
-            self.refrescar_tabla()
+            self.modelo.anadir(nuevos)
             QMessageBox.information(self, "Importado", "CSV cargado correctamente.")
 
         except Exception as e:
@@ -377,6 +369,9 @@ class VPantallaInvitados(QMainWindow):
             )
             return
 
+        # El solver y la ventana de mesas se cargan la primera vez que se usan
+        from mesas_emergente import EmergenteMesas
+
         dlg = EmergenteMesas(
             invitados_csv=self.invitados,
             evento_dict=self.evento,
@@ -3,8 +3,6 @@ import os
 from PyQt5.QtWidgets import QMainWindow, QListWidget, QMessageBox
 from PyQt5.QtCore import Qt
 from Vistas.pantalla_principal_ui import Ui_MainWindow as Ui_PantallaPrincipal
-from WAnadirEvento import WAnadirEvento
-from WEditarEvento import WEditarEvento
 
 
 class VPantallaPrincipal(QMainWindow):
@@ -73,6 +71,8 @@ class VPantallaPrincipal(QMainWindow):
     # ------------------ CRUD ------------------
 
     def on_add(self):
+        from WAnadirEvento import WAnadirEvento  # ventanas poco usadas: al abrirlas
+
         self._dlg_add = WAnadirEvento(parent=self)
         self._dlg_add.setAttribute(Qt.WA_DeleteOnClose, True)
         self._dlg_add.show()
@@ -83,6 +83,8 @@ class VPantallaPrincipal(QMainWindow):
             QMessageBox.information(self, "Editar", "Selecciona un evento para editarlo.")
             return
 
+        from WEditarEvento import WEditarEvento
+
         self._dlg_edit = WEditarEvento(parent=self, idx=idx)
         self._dlg_edit.setAttribute(Qt.WA_DeleteOnClose, True)
         self._dlg_edit.show()
@@ -1,238 +1,21 @@
-import sys, math, json, os
-from typing import List, Optional, Dict
-from math import ceil
+import sys, math, json
+from typing import List, Optional, Dict, Tuple
 
-from ortools.sat.python import cp_model
 from PyQt5 import QtWidgets, QtGui, QtCore
 
 import ui_mesa
-import csv
+from modelos_reparto import ModeloMesas, ModeloPool, asiento_ocupado
+from recursos import ICON_SIZE, pixmap_for_state
+from sala_mesas import MIME_INVITADO, SalaMesas, invitado_desde_mime
+from nucleo_mesas import (
+    Evento, Invitado, IndiceEnemigos, RegistroInvitados, asignar_mesas, calcular_estados_conflicto,
+    clave_invitado, crear_invitado, estados_conflicto_evento, guardar_evento_csv_mesas,
+    ruta_csv_mesas,
+)
 
-ICON_SIZE = 56
 MARGIN = 24
 
 
-class Invitado:
-    def __init__(self, rol: str, nombre: str, apellido: str = "", preferencias: Optional[List[str]] = None):
-        self.rol = rol
-        self.nombre = nombre
-        self.apellido = apellido
-        self.preferencias = preferencias or []
-
-
-class Mesa:
-    def __init__(self, mesa_id: int, numAsientos: int, nombMesa: Optional[str] = None,
-                 invitados: Optional[List[Optional[Invitado]]] = None):
-        self.mesa_id = mesa_id
-        self.numAsientos = numAsientos
-        self.nombMesa = nombMesa
-        self.invitados = invitados or []
-
-
-class Evento:
-    def __init__(self, nombre: str, fecha: str, ubicacion: str, mesas: Optional[List[Mesa]] = None):
-        self.nombre = nombre
-        self.fecha = fecha
-        self.ubicacion = ubicacion
-        self.mesas = mesas or []
-
-
-def crear_invitado(rol: str, nombre: str, apellido: str = "", preferencias: Optional[List[str]] = None):
-    return Invitado(rol, nombre, apellido, preferencias)
-
-
-def crear_mesa(mesa_id: int, numAsientos: int, nombMesa: Optional[str] = None,
-               invitados: Optional[List[Optional[Invitado]]] = None):
-    inv = invitados or []
-    if len(inv) < numAsientos:
-        inv += [None] * (numAsientos - len(inv))
-    return Mesa(mesa_id, numAsientos, nombMesa, inv)
-
-
-def crear_evento(nombre: str, fecha: str, ubicacion: str, mesas: Optional[List[Mesa]] = None):
-    return Evento(nombre, fecha, ubicacion, mesas)
-
-
-def cargar_evento_desde_csv_mesas(nombre_evento: str, fecha: str, ubicacion: str,
-                                  ruta: str) -> Evento:
-    mesas_raw: Dict[int, Dict] = {}
-
-    with open(ruta, newline="", encoding="utf-8-sig") as f:
-        reader = csv.reader(f, delimiter=";")
-        headers = next(reader, None)
-
-        for row in reader:
-            if not row or len(row) < 3:
-                continue
-
-            mesa_id = int(row[0])
-            mesa_nombre = row[1]
-            asiento = int(row[2])
-
-            nombre = row[3] if len(row) > 3 else ""
-            apellido = row[4] if len(row) > 4 else ""
-            rol = row[5] if len(row) > 5 else "invitado"
-
-            data = mesas_raw.setdefault(mesa_id, {
-                "nombre": mesa_nombre,
-                "capacidad": 0,
-                "invitados": {}
-            })
-
-            if asiento > data["capacidad"]:
-                data["capacidad"] = asiento
-
-            if nombre.strip():
-                data["invitados"][asiento] = crear_invitado(
-                    rol=rol.strip() or "invitado",
-                    nombre=nombre.strip(),
-                    apellido=apellido.strip(),
-                    preferencias=[]
-                )
-
-    mesas: List[Mesa] = []
-    for mid in sorted(mesas_raw.keys()):
-        info = mesas_raw[mid]
-        cap = max(8, info["capacidad"])
-        invitados: List[Optional[Invitado]] = [None] * cap
-        for asiento, inv in info["invitados"].items():
-            idx = asiento - 1
-            if 0 <= idx < cap:
-                invitados[idx] = inv
-        mesas.append(crear_mesa(mid, cap, info["nombre"], invitados))
-
-    return crear_evento(nombre_evento, fecha, ubicacion, mesas)
-
-
-def _split_pref(pref: str):
-    p = (pref or "").strip()
-    lower = p.lower()
-    if lower.startswith("amigo:"):
-        return "amigo", p.split(":", 1)[1].strip()
-    if lower.startswith("enemigo:"):
-        return "enemigo", p.split(":", 1)[1].strip()
-    return None, ""
-
-
-def _es_enemigo(inv: Invitado, nombre_otro: str) -> bool:
-    if not inv or not nombre_otro:
-        return False
-    for pref in inv.preferencias or []:
-        t, who = _split_pref(pref)
-        if t == "enemigo" and who == nombre_otro:
-            return True
-    return False
-
-
-def calcular_estados_conflicto(mesa: Mesa) -> List[str]:
-    estados: List[str] = []
-    invitados = mesa.invitados or []
-    for i, inv in enumerate(invitados):
-        if not inv or not (inv.nombre or "").strip():
-            estados.append("vacio")
-            continue
-        estado = "ok"
-        for j, otro in enumerate(invitados):
-            if i == j:
-                continue
-            if not otro or not (otro.nombre or "").strip():
-                continue
-            if _es_enemigo(inv, otro.nombre) or _es_enemigo(otro, inv.nombre):
-                estado = "conflicto"
-                break
-        estados.append(estado)
-    return estados
-
-
-def asignar_mesas(participantes: List[Invitado], tamano_mesa: int,
-                  nombre_evento: str = "Evento", fecha: str = "", ubicacion: str = "",
-                  num_mesas: Optional[int] = None):
-
-    nombres = [i.nombre for i in participantes]
-    n = len(participantes)
-
-    if num_mesas is None or num_mesas <= 0:
-        num_mesas = max(1, ceil(n / tamano_mesa))
-
-    tamano_mesa = max(8, tamano_mesa)
-
-    model = cp_model.CpModel()
-    mesa_var = {nom: model.NewIntVar(0, num_mesas - 1, nom) for nom in nombres}
-    nombre_set = set(nombres)
-
-    for inv in participantes:
-        amigos = []
-        enemigos = []
-        for pref in inv.preferencias or []:
-            t, who = _split_pref(pref)
-            if who not in nombre_set:
-                continue
-            if t == "amigo":
-                amigos.append(who)
-            elif t == "enemigo":
-                enemigos.append(who)
-
-        for a in amigos:
-            model.Add(mesa_var[inv.nombre] == mesa_var[a])
-        for e in enemigos:
-            pass
-
-    for m in range(num_mesas):
-        indicadores = []
-        for nom in nombres:
-            b = model.NewBoolVar(f"{nom}_en_mesa_{m}")
-            model.Add(mesa_var[nom] == m).OnlyEnforceIf(b)
-            model.Add(mesa_var[nom] != m).OnlyEnforceIf(b.Not())
-            indicadores.append(b)
-        model.Add(sum(indicadores) <= tamano_mesa)
-
-    solver = cp_model.CpSolver()
-    solver.parameters.max_time_in_seconds = 5.0
-    status = solver.Solve(model)
-
-    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
-        mesas = [crear_mesa(i + 1, tamano_mesa, f"Mesa {i+1}") for i in range(num_mesas)]
-        idx = 0
-        for inv in participantes:
-            mesa_id = idx // tamano_mesa
-            mesas[mesa_id].invitados[idx % tamano_mesa] = inv
-            idx += 1
-        evento = crear_evento(nombre_evento, fecha, ubicacion, mesas)
-        return evento, {}
-
-    mapping = {nom: solver.Value(mesa_var[nom]) for nom in nombres}
-
-    mesas = [crear_mesa(i + 1, tamano_mesa, f"Mesa {i+1}") for i in range(num_mesas)]
-    colocados = [0] * num_mesas
-
-    for inv in participantes:
-        m_idx = mapping[inv.nombre]
-        pos = colocados[m_idx]
-        mesas[m_idx].invitados[pos] = inv
-        colocados[m_idx] += 1
-
-    evento = crear_evento(nombre_evento, fecha, ubicacion, mesas)
-    return evento, mapping
-
-
-def icon_for_state(estado: str, is_empty: bool) -> str:
-    base = "Resources/Icons"
-    if is_empty:
-        return f"{base}/gris_transparente.png"
-    e = (estado or "").strip().lower()
-    if e in ("ok", "verde"):
-        fn = "Verde.png"
-    elif e in ("conflicto", "rojo"):
-        fn = "Rojo.png"
-    elif e in ("advertencia", "amarillo", "naranja"):
-        fn = "Naranja.png"
-    elif e in ("manual", "azul"):
-        fn = "Azul.png"
-    else:
-        fn = "Verde.png"
-    return f"{base}/{fn}"
-
-
 class SeatIcon(QtWidgets.QLabel):
     dropped = QtCore.pyqtSignal(int, dict)
 
@@ -242,35 +25,26 @@ class SeatIcon(QtWidgets.QLabel):
         self.setAcceptDrops(True)
         self.setMinimumSize(ICON_SIZE, ICON_SIZE)
         self.setMaximumSize(ICON_SIZE, ICON_SIZE)
-        self.setScaledContents(True)
+        # Sin setScaledContents: pixmap_for_state ya da el icono a ICON_SIZE
         self.setAlignment(QtCore.Qt.AlignCenter)
         self.setStyleSheet("QLabel{background:transparent;}")
 
     def dragEnterEvent(self, event: QtGui.QDragEnterEvent):
-        if event.mimeData().hasFormat("application/x-guest"):
+        if event.mimeData().hasFormat(MIME_INVITADO):
             event.acceptProposedAction()
         else:
             event.ignore()
 
     def dropEvent(self, event: QtGui.QDropEvent):
-        md = event.mimeData()
-        if md.hasFormat("application/x-guest"):
-            payload = md.data("application/x-guest").data()
-            try:
-                info = json.loads(payload.decode("utf-8"))
-            except Exception:
-                info = {}
-            guest = {
-                "nombre": info.get("nombre", ""),
-                "estado": "manual",
-            }
+        guest = invitado_desde_mime(event.mimeData())
+        if guest is not None:
             self.dropped.emit(self.seat_idx, guest)
             event.acceptProposedAction()
         else:
             event.ignore()
 
 
-class DraggableInvitadosTable(QtWidgets.QTableWidget):
+class DraggableInvitadosTable(QtWidgets.QTableView):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -287,12 +61,14 @@ class DraggableInvitadosTable(QtWidgets.QTableWidget):
         if not idxs:
             return super().mouseMoveEvent(event)
         row = idxs[0].row()
-        nombre = self.item(row, 0).text() if self.item(row, 0) else ""
-        estado = self.item(row, 1).text() if self.item(row, 1) else ""
+        modelo = self.model()
+        nombre = modelo.index(row, 0).data() or ""
+        estado = modelo.index(row, 1).data() or ""
+        id_invitado = modelo.index(row, 0).data(QtCore.Qt.UserRole)
         drag = QtGui.QDrag(self)
         mime = QtCore.QMimeData()
-        payload = json.dumps({"nombre": nombre, "estado": estado}).encode("utf-8")
-        mime.setData("application/x-guest", payload)
+        payload = json.dumps({"id": id_invitado, "nombre": nombre, "estado": estado}).encode("utf-8")
+        mime.setData(MIME_INVITADO, payload)
         drag.setMimeData(mime)
         pm = QtGui.QPixmap(ICON_SIZE, ICON_SIZE)
         pm.fill(QtCore.Qt.transparent)
@@ -302,55 +78,49 @@ class DraggableInvitadosTable(QtWidgets.QTableWidget):
 
 
 class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
+    detener_solicitado = QtCore.pyqtSignal()
+
     def __init__(self, evento: Evento, invitados_csv: Optional[List[Dict]] = None):
         super().__init__()
         self.setupUi(self)
         self.evento = evento
         self.current_mesa_idx = 0
-        self.pool: List[Dict[str, str]] = []
-
-        if invitados_csv:
-            for d in invitados_csv:
-                nombre = (d.get("nombre") or "").strip()
-                if not nombre:
-                    continue
-                self.pool.append({"nombre": nombre, "estado": "ok"})
-
-        self.inv_por_nombre: Dict[str, Invitado] = {}
-        for mesa in self.evento.mesas:
-            for inv in mesa.mesas if False else mesa.invitados:
-                if inv and (inv.nombre or "").strip():
-                    self.inv_por_nombre[inv.nombre] = inv
-
-        assigned_names = set()
-        for mesa in self.evento.mesas:
-            for inv in mesa.invitados:
-                if inv and (inv.nombre or "").strip():
-                    assigned_names.add(inv.nombre.strip())
-
-        if assigned_names:
-            self.pool = [
-                g for g in self.pool
-                if (g.get("nombre") or "").strip() not in assigned_names
-            ]
+        self.invitados_csv = invitados_csv or []
+        self._busqueda_activa = False
+        # Tras el primer cambio a mano ya no se aplican soluciones del solver
+        self._editado_a_mano = False
+        self._sincronizar_invitados()
 
         self._kill_arena_layout_once()
+        # Las dos listas del .ui se sustituyen por vistas sobre sus modelos
+        self.modelo_pool = ModeloPool(self)
+        self.modelo_mesas = ModeloMesas(self)
+
         parent = self.tblInvitados.parent()
         layout = parent.layout()
         layout.removeWidget(self.tblInvitados)
         self.tblInvitados.deleteLater()
         self.tblInvitados = DraggableInvitadosTable(parent)
+        self.tblInvitados.setObjectName("tblInvitados")
         layout.addWidget(self.tblInvitados)
+        self.tblInvitados.setModel(self.modelo_pool)
+        self.tblInvitados.horizontalHeader().setStretchLastSection(True)
 
-        self.tblMesas.setColumnCount(2)
-        self.tblMesas.setHorizontalHeaderLabels(["Mesa", "Capacidad"])
+        viejo = self.tblMesas
+        self.tblMesas = QtWidgets.QTableView(viejo.parent())
+        self.tblMesas.setObjectName("tblMesas")
+        viejo.parent().layout().replaceWidget(viejo, self.tblMesas)
+        viejo.deleteLater()
+        self.tblMesas.setModel(self.modelo_mesas)
+        self.tblMesas.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tblMesas.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tblMesas.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.tblMesas.horizontalHeader().setStretchLastSection(True)
 
-        self.tblInvitados.setColumnCount(2)
-        self.tblInvitados.setHorizontalHeaderLabels(["Nombre", "Estado"])
-        self.tblInvitados.horizontalHeader().setStretchLastSection(True)
-
-        self.seat_widgets = []
+        self.seat_widgets: List[Tuple[SeatIcon, QtWidgets.QLabel]] = []
+        self._asientos_pintados: List[Optional[tuple]] = []
+        self.sala: Optional[SalaMesas] = None
+        self._clear_arena()
         self.arena.installEventFilter(self)
 
         self._reload_pool_table()
@@ -362,35 +132,162 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
         self.btnEliminar.clicked.connect(self._eliminar_demo)
         self.btnConfirmar.clicked.connect(self._confirmar_demo)
 
-    def _get_invitado_by_name(self, nombre: str) -> Optional[Invitado]:
-        nombre = (nombre or "").strip()
+        # Botón para parar la búsqueda automática quedándose con lo mejor hasta ahora
+        self.btnDetener = QtWidgets.QPushButton("Detener", self.centralwidget)
+        self.btnDetener.setObjectName("btnDetener")
+        self.btnDetener.setStyleSheet(
+            "QPushButton{background:#ff9500;color:#000;font-weight:700;border:none;border-radius:6px;padding:8px 14px;}"
+        )
+        self.btnDetener.hide()
+        self.topButtons.insertWidget(1, self.btnDetener)
+        self.btnDetener.clicked.connect(self._on_detener)
+
+        self.btnConflictos = QtWidgets.QPushButton("Ver conflictos", self.centralwidget)
+        self.btnConflictos.setObjectName("btnConflictos")
+        self.btnConflictos.setStyleSheet(
+            "QPushButton{background:#ffcc00;color:#000;font-weight:700;border:none;border-radius:6px;padding:8px 14px;}"
+        )
+        self.topButtons.insertWidget(2, self.btnConflictos)
+        self.btnConflictos.clicked.connect(self._mostrar_conflictos)
+
+        # Vista de sala (todas las mesas); se crea la primera vez que se pide
+        self.btnVistaSala = QtWidgets.QPushButton("Vista sala", self.centralwidget)
+        self.btnVistaSala.setObjectName("btnVistaSala")
+        self.btnVistaSala.setCheckable(True)
+        self.btnVistaSala.setStyleSheet(
+            "QPushButton{background:#5b9bd5;color:#fff;font-weight:700;border:none;border-radius:6px;padding:8px 14px;}"
+            "QPushButton:checked{background:#1f3b57;}"
+        )
+        self.topButtons.insertWidget(3, self.btnVistaSala)
+        self.btnVistaSala.toggled.connect(self._alternar_vista_sala)
+
+    def _sincronizar_invitados(self):
+        # El registro del evento da un id a cada invitado; el pool son los ids
+        # de los que aún no tienen asiento.
+        if self.evento.registro is None:
+            mesas = self.evento.mesas
+            self.evento.registro = mesas[0].registro if mesas else RegistroInvitados()
+            for mesa in mesas:
+                mesa.usar_registro(self.evento.registro)
+        self.registro = self.evento.registro
+        sentados = [inv for mesa in self.evento.mesas for inv in mesa.invitados
+                    if inv and (inv.nombre or "").strip()]
+
+        # Invitados del CSV que el registro aún no conoce (p. ej. un plan
+        # cargado de mesas_<evento>.csv): se emparejan por nombre y apellido.
+        conocidos: Dict[tuple, int] = {}
+        for inv in self.registro:
+            clave = clave_invitado(inv)
+            conocidos[clave] = conocidos.get(clave, 0) + 1
+        for d in self.invitados_csv:
+            nombre = (d.get("nombre") or "").strip()
+            if not nombre:
+                continue
+            clave = (nombre, (d.get("apellido") or "").strip())
+            if conocidos.get(clave):
+                conocidos[clave] -= 1
+                continue
+            self.registro.registrar(crear_invitado((d.get("rol") or "").strip() or "invitado",
+                                                   nombre, clave[1]))
+
+        ids_sentados = {inv.id for inv in sentados}
+        self.pool: List[int] = [inv.id for inv in self.registro if inv.id not in ids_sentados]
+        self.indice_enemigos = IndiceEnemigos(self.registro)
+
+    def mostrar_evento(self, evento: Evento):
+        """Sustituye el reparto mostrado (p. ej. por una solución mejor del solver)."""
+        self.evento = evento
+        if self.current_mesa_idx >= len(self.evento.mesas):
+            self.current_mesa_idx = 0
+        self._sincronizar_invitados()
+        self._reload_pool_table()
+        self._reload_tbl_mesas()
+        if self.evento.mesas:
+            self._render_seats()
+        self._actualizar_sala()
+
+    def mostrar_solucion(self, evento: Evento):
+        """Muestra una solución del solver salvo que el usuario ya haya movido
+        a alguien: sustituir el evento entero desharía sus cambios."""
+        if not self._editado_a_mano:
+            self.mostrar_evento(evento)
+
+    def set_busqueda_activa(self, activa: bool):
+        self._busqueda_activa = activa
+        self.btnDetener.setVisible(activa)
+        self.btnDetener.setEnabled(activa)
+        if activa:
+            self._editado_a_mano = False
+            self.statusbar.showMessage("Buscando un reparto mejor...")
+        elif self._editado_a_mano:
+            self.statusbar.showMessage("Se conserva el reparto editado a mano", 3000)
+        else:
+            self.statusbar.showMessage("Reparto terminado", 3000)
+
+    def _editado(self):
+        # Primer cambio a mano durante la búsqueda: sus soluciones ya no se
+        # aplicarían, así que se detiene
+        if self._busqueda_activa and not self._editado_a_mano:
+            self._on_detener()
+        self._editado_a_mano = True
+
+    def _on_detener(self):
+        self.btnDetener.setEnabled(False)
+        self.detener_solicitado.emit()
+
+    def _mostrar_conflictos(self):
+        lineas = []
+        estados = estados_conflicto_evento(self.evento, self.indice_enemigos)
+        for mesa, estados_mesa in zip(self.evento.mesas, estados):
+            nombres = [inv.nombre for inv, e in zip(mesa.invitados, estados_mesa) if e == "conflicto"]
+            if nombres:
+                nombre_mesa = mesa.nombMesa or f"Mesa {mesa.mesa_id}"
+                lineas.append(f"{nombre_mesa}: {', '.join(nombres)}")
+        if lineas:
+            QtWidgets.QMessageBox.warning(self, "Conflictos",
+                                          "Invitados sentados con alguien a quien evitan:\n\n"
+                                          + "\n".join(lineas))
+        else:
+            QtWidgets.QMessageBox.information(self, "Conflictos", "No hay conflictos en ninguna mesa.")
+
+    def _invitado_de(self, guest: dict) -> Optional[Invitado]:
+        # Por id si el arrastre lo trae; si no (p. ej. desde otra ventana), el
+        # primero del pool con ese nombre o un invitado nuevo.
+        inv = self.registro.get(guest.get("id"))
+        if inv is not None:
+            return inv
+        nombre = (guest.get("nombre") or "").strip()
         if not nombre:
             return None
-        inv = self.inv_por_nombre.get(nombre)
-        if inv is None:
-            inv = crear_invitado("invitado", nombre)
-            self.inv_por_nombre[nombre] = inv
+        for id_invitado in self.pool:
+            if self.registro[id_invitado].nombre == nombre:
+                return self.registro[id_invitado]
+        inv = crear_invitado("invitado", nombre)
+        self.registro.registrar(inv)
+        self.indice_enemigos.actualizar_invitado(inv)
         return inv
 
+    # Recargas completas: solo al cambiar de reparto. Los cambios de un
+    # asiento van por _mesa_cambiada y los modelos.
     def _reload_pool_table(self):
-        self.tblInvitados.setRowCount(len(self.pool))
-        for r, g in enumerate(self.pool):
-            self.tblInvitados.setItem(r, 0, QtWidgets.QTableWidgetItem(g["nombre"]))
-            self.tblInvitados.setItem(r, 1, QtWidgets.QTableWidgetItem(g.get("estado", "")))
+        self.modelo_pool.reemplazar(self.pool, self.registro)
 
     def _reload_tbl_mesas(self):
-        self.tblMesas.setRowCount(len(self.evento.mesas))
-        for r, mesa in enumerate(self.evento.mesas):
-            nombre_mesa = mesa.nombMesa or f"Mesa {mesa.mesa_id}"
-            ocupados = sum(
-                1 for inv in mesa.invitados
-                if inv and (inv.nombre or "").strip()
-            )
-            self.tblMesas.setItem(r, 0, QtWidgets.QTableWidgetItem(nombre_mesa))
-            self.tblMesas.setItem(r, 1, QtWidgets.QTableWidgetItem(f"{ocupados}/{mesa.numAsientos}"))
+        self.modelo_mesas.reemplazar(self.evento.mesas,
+                                     estados_conflicto_evento(self.evento, self.indice_enemigos))
         if self.evento.mesas:
             self.tblMesas.selectRow(self.current_mesa_idx)
 
+    def _mesa_cambiada(self, mesa_idx: int):
+        # Repinta la mesa (arena o sala) y su fila en la lista de mesas
+        if mesa_idx == self.current_mesa_idx:
+            self._render_seats()
+            return
+        mesa = self.evento.mesas[mesa_idx]
+        estados = calcular_estados_conflicto(mesa, self.indice_enemigos)
+        self.modelo_mesas.set_estados(mesa_idx, estados)
+        self._actualizar_sala(mesa_idx, estados)
+
     def _on_select_mesa(self, *_):
         idxs = self.tblMesas.selectionModel().selectedRows()
         if not idxs:
@@ -399,6 +296,37 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
         if 0 <= row < len(self.evento.mesas):
             self.current_mesa_idx = row
             self._render_seats()
+            if self.sala is not None and self.sala.isVisible():
+                self.sala.centrar_en_mesa(row)
+
+    def _alternar_vista_sala(self, activa: bool):
+        if self.sala is None:
+            self.sala = SalaMesas(self.cardPreview)
+            self.sala.setMinimumSize(self.arena.minimumSize())
+            self.sala.asiento_soltado.connect(self._sentar_invitado)
+            self.sala.mesa_seleccionada.connect(self.tblMesas.selectRow)
+            self.cardV.insertWidget(self.cardV.indexOf(self.arena), self.sala)
+            self.sala.hide()
+            self._actualizar_sala()
+        self.arena.setVisible(not activa)
+        self.sala.setVisible(activa)
+        if activa:
+            self.sala.ajustar_a_sala()
+
+    def _actualizar_sala(self, mesa_idx: Optional[int] = None,
+                         estados: Optional[List[str]] = None):
+        # Sin índice se rehace la sala entera (evento nuevo); con índice solo
+        # se repintan los asientos de esa mesa
+        if self.sala is None:
+            return
+        if mesa_idx is None:
+            self.sala.mostrar_evento(self.evento,
+                                     estados_conflicto_evento(self.evento, self.indice_enemigos))
+        else:
+            mesa = self.evento.mesas[mesa_idx]
+            if estados is None:
+                estados = calcular_estados_conflicto(mesa, self.indice_enemigos)
+            self.sala.actualizar_mesa(mesa_idx, mesa, estados)
 
     def _first_empty_index(self, mesa_idx: int):
         mesa = self.evento.mesas[mesa_idx]
@@ -407,15 +335,8 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
                 return i
         return None
 
-    def _remove_guest_from_pool_by_name(self, nombre: str):
-        nombre = (nombre or "").strip()
-        if not nombre:
-            return
-        for i, g in enumerate(self.pool):
-            if (g.get("nombre") or "").strip() == nombre:
-                self.pool.pop(i)
-                break
-        self._reload_pool_table()
+    def _remove_guest_from_pool(self, id_invitado: int):
+        self.modelo_pool.quitar(id_invitado)
 
     def _kill_arena_layout_once(self):
         lay = self.arena.layout()
@@ -438,9 +359,27 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
             w.setParent(None)
             w.deleteLater()
         self.seat_widgets.clear()
+        self._asientos_pintados.clear()
+
+    def _ajustar_asientos(self, capacidad: int):
+        # Pool de asientos de la arena: se crean los que falten (conectados
+        # una sola vez) y se ocultan los que sobren para reutilizarlos.
+        while len(self.seat_widgets) < capacidad:
+            idx = len(self.seat_widgets)
+            seat = SeatIcon(self.arena, idx)
+            seat.dropped.connect(self._handle_drop_guest)
+            name_lbl = QtWidgets.QLabel(self.arena)
+            name_lbl.setAlignment(QtCore.Qt.AlignCenter)
+            name_lbl.hide()
+            self.seat_widgets.append((seat, name_lbl))
+            self._asientos_pintados.append(None)
+        for idx, (seat, name_lbl) in enumerate(self.seat_widgets):
+            if idx >= capacidad and self._asientos_pintados[idx] is not None:
+                seat.hide()
+                name_lbl.hide()
+                self._asientos_pintados[idx] = None
 
     def _render_seats(self):
-        self._clear_arena()
         mesa = self.evento.mesas[self.current_mesa_idx]
         capacidad = mesa.numAsientos
         invitados = mesa.invitados or []
@@ -449,14 +388,12 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
             invitados += [None] * diff
             mesa.invitados = invitados
 
-        estados = calcular_estados_conflicto(mesa)
+        estados = calcular_estados_conflicto(mesa, self.indice_enemigos)
+        self.modelo_mesas.set_estados(self.current_mesa_idx, estados)
         if len(estados) < capacidad:
             estados += ["vacio"] * (capacidad - len(estados))
 
-        ocupados = sum(
-            1 for inv in invitados
-            if inv and (inv.nombre or "").strip()
-        )
+        ocupados = self.modelo_mesas.ocupados[self.current_mesa_idx]
 
         if hasattr(self, "lblAsientos"):
             self.lblAsientos.setText(f"Asientos: {ocupados}/{capacidad}")
@@ -474,51 +411,67 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
         n_slots = max(capacidad, 1)
         start = -math.pi / 2
         step = 2 * math.pi / n_slots
+        dpr = self.arena.devicePixelRatioF()
 
+        self._actualizar_sala(self.current_mesa_idx, estados)
+        self._ajustar_asientos(capacidad)
         for idx in range(capacidad):
             inv = invitados[idx]
             estado = estados[idx]
             ang = start + idx * step
-            x = cx + r * math.cos(ang)
-            y = cy + r * math.sin(ang)
+            x = int(cx + r * math.cos(ang))
+            y = int(cy + r * math.sin(ang))
 
             is_empty = not (inv and (inv.nombre or "").strip())
+            nombre = inv.nombre if inv and inv.nombre else ""
+            pixmap = pixmap_for_state(estado, is_empty, dpr)
 
-            seat = SeatIcon(self.arena, idx)
-            seat.dropped.connect(self._handle_drop_guest)
+            # Solo se tocan los asientos que han cambiado desde el último render
+            pintado = (pixmap.cacheKey(), nombre, x, y)
+            if pintado == self._asientos_pintados[idx]:
+                continue
+            self._asientos_pintados[idx] = pintado
 
-            path = icon_for_state(estado, is_empty=is_empty)
-            seat.setPixmap(QtGui.QPixmap(path))
+            seat, name_lbl = self.seat_widgets[idx]
+            seat.setPixmap(pixmap)
             seat.move(int(x - ICON_SIZE / 2), int(y - ICON_SIZE / 2))
             seat.show()
 
-            nombre = inv.nombre if inv and inv.nombre else ""
-            name_lbl = None
             if nombre:
-                name_lbl = QtWidgets.QLabel(self.arena)
                 name_lbl.setText(nombre)
                 name_lbl.adjustSize()
-                name_lbl.setAlignment(QtCore.Qt.AlignCenter)
                 name_lbl.move(int(x - name_lbl.width() / 2), int(y + ICON_SIZE / 2 + 4))
                 name_lbl.show()
+            else:
+                name_lbl.hide()
 
-            self.seat_widgets.append((seat, name_lbl))
+    def eventFilter(self, obj, event):
+        # Al cambiar el tamaño de la arena se recolocan los asientos
+        if obj is self.arena and event.type() == QtCore.QEvent.Resize:
+            self._render_seats()
+        return super().eventFilter(obj, event)
 
     def _handle_drop_guest(self, seat_idx: int, guest: dict):
-        mesa = self.evento.mesas[self.current_mesa_idx]
+        self._sentar_invitado(self.current_mesa_idx, seat_idx, guest)
+
+    def _sentar_invitado(self, mesa_idx: int, seat_idx: int, guest: dict):
+        mesa = self.evento.mesas[mesa_idx]
         invitados = mesa.invitados
         if seat_idx >= len(invitados):
             invitados += [None] * (seat_idx - len(invitados) + 1)
+        inv_obj = self._invitado_de(guest)
         prev = invitados[seat_idx]
-        if prev and (prev.nombre or "").strip():
-            self.pool.append({"nombre": prev.nombre, "estado": "ok"})
-        self._remove_guest_from_pool_by_name(guest.get("nombre", ""))
-        inv_obj = self._get_invitado_by_name(guest.get("nombre", ""))
+        if inv_obj is None or prev is inv_obj:
+            return
+        if asiento_ocupado(prev):
+            self.modelo_pool.anadir(prev.id)
+        else:
+            self.modelo_mesas.cambiar_ocupados(mesa_idx, +1)
+        self._remove_guest_from_pool(inv_obj.id)
         invitados[seat_idx] = inv_obj
         mesa.invitados = invitados
-        self._reload_pool_table()
-        self._render_seats()
-        self._reload_tbl_mesas()
+        self._editado()
+        self._mesa_cambiada(mesa_idx)
 
     def _anadir_demo(self):
         idxs = self.tblInvitados.selectionModel().selectedRows()
@@ -526,32 +479,34 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
             QtWidgets.QMessageBox.warning(self, "Añadir invitado",
                                           "Selecciona un invitado de la lista para añadirlo a la mesa.")
             return
-        row = idxs[0].row()
-        nombre_item = self.tblInvitados.item(row, 0)
-        nombre = nombre_item.text() if nombre_item else ""
+        nombre_idx = idxs[0].sibling(idxs[0].row(), 0)
+        guest = {"id": nombre_idx.data(QtCore.Qt.UserRole), "nombre": nombre_idx.data() or ""}
         mesa = self.evento.mesas[self.current_mesa_idx]
         idx_libre = self._first_empty_index(self.current_mesa_idx)
         if idx_libre is None:
             QtWidgets.QMessageBox.information(self, "Mesa completa",
                                               "La mesa seleccionada no tiene asientos libres.")
             return
-        inv_obj = self._get_invitado_by_name(nombre)
+        inv_obj = self._invitado_de(guest)
+        if inv_obj is None:
+            return
         mesa.invitados[idx_libre] = inv_obj
-        self._remove_guest_from_pool_by_name(nombre)
+        self._remove_guest_from_pool(inv_obj.id)
+        self.modelo_mesas.cambiar_ocupados(self.current_mesa_idx, +1)
+        self._editado()
         self._render_seats()
-        self._reload_tbl_mesas()
 
     def _eliminar_demo(self):
         mesa = self.evento.mesas[self.current_mesa_idx]
         for i in range(len(mesa.invitados) - 1, -1, -1):
             inv = mesa.invitados[i]
-            if inv and (inv.nombre or "").strip():
-                self.pool.append({"nombre": inv.nombre, "estado": "ok"})
+            if asiento_ocupado(inv):
+                self.modelo_pool.anadir(inv.id)
                 mesa.invitados[i] = None
-                self._reload_pool_table()
+                self.modelo_mesas.cambiar_ocupados(self.current_mesa_idx, -1)
+                self._editado()
                 break
         self._render_seats()
-        self._reload_tbl_mesas()
 
     def _confirmar_demo(self):
         mesa = self.evento.mesas[self.current_mesa_idx]
@@ -567,35 +522,10 @@ class Main(QtWidgets.QMainWindow, ui_mesa.Ui_MainWindow):
             f"{len(ocupados)} / {mesa.numAsientos} ocupados."
         )
 
-        nombre_base = (self.evento.nombre or "evento").strip() or "evento"
-        safe = nombre_base.replace(" ", "_")
-        ruta = os.path.abspath(f"mesas_{safe}.csv")
+        ruta = ruta_csv_mesas(self.evento.nombre)
 
         try:
-            with open(ruta, "w", newline="", encoding="utf-8-sig") as f:
-                writer = csv.writer(f, delimiter=";")
-                writer.writerow(["mesa_id", "mesa_nombre", "asiento", "nombre", "apellido", "rol"])
-                for mesa in self.evento.mesas:
-                    mesa_nombre = mesa.nombMesa or f"Mesa {mesa.mesa_id}"
-                    for idx, inv in enumerate(mesa.invitados, start=1):
-                        if inv and (inv.nombre or inv.apellido):
-                            writer.writerow([
-                                mesa.mesa_id,
-                                mesa_nombre,
-                                idx,
-                                inv.nombre,
-                                inv.apellido,
-                                inv.rol
-                            ])
-                        else:
-                            writer.writerow([
-                                mesa.mesa_id,
-                                mesa_nombre,
-                                idx,
-                                "",
-                                "",
-                                ""
-                            ])
+            guardar_evento_csv_mesas(self.evento, ruta)
 
             QtWidgets.QMessageBox.information(
                 self,
@@ -0,0 +1,212 @@
+# benchmark_mesas.py
+# Mide velocidad y calidad de nucleo_mesas.asignar_mesas (el reparto que usan
+# las ventanas de mesas) con listas de invitados sintéticas: tiempo de modelo y de
+# resolución, estado, enlaces amigo/enemigo satisfechos y ocupación de mesas
+# para cada motor. Sin interfaz: pensado para comparar entre versiones.
+#
+#   python benchmark_mesas.py --invitados 100 500 1500 --tam-grupo 4 --enemigos 0.1 \
+#       --memoria --json informe.json --csv informe.csv
+#
+# --cadenas añade el evento de 1200 invitados en cadenas de amigos de 3 y
+# enemigos blandos leído como la lista de la interfaz (invitados_desde_filas),
+# con 140 mesas de 10 (necesita 134) y 4 s.
+
+import argparse
+import csv
+import json
+import random
+import time
+import tracemalloc
+from math import ceil
+from typing import Dict, List, Optional
+
+from nucleo_mesas import (ConfigSolver, Invitado, asignar_mesas, calidad_reparto, crear_invitado,
+                          evento_desde_asignacion, invitados_desde_filas, resolver_preferencias)
+
+# Nombre -> opciones de asignar_mesas
+MOTORES_BENCHMARK = {
+    "cpsat-booleana": dict(motor="cpsat", formulacion="booleana"),
+    "cpsat-entera": dict(motor="cpsat", formulacion="entera"),
+    "cpsat-dividido": dict(motor="cpsat", dividir=True),
+    "heuristico": dict(motor="heuristico"),
+}
+
+COLUMNAS = ["motor", "invitados", "tam_grupo", "enemigos", "mesas", "motor_usado", "estado",
+            "t_modelo", "t_primera", "t_resolver", "t_total", "amigos_ok", "amigos_total",
+            "enemigos_juntos", "enemigos_total", "mesas_usadas", "ocupacion", "sin_sentar",
+            "bytes_por_invitado"]
+
+
+def generar_invitados(n: int, tam_grupo: int = 3, densidad_enemigos: float = 0.0,
+                      semilla: int = 0) -> List[Invitado]:
+    """Invitados en grupos de amigos de 1..tam_grupo personas y, de media,
+    `densidad_enemigos` enemigos por invitado (siempre de otro grupo)."""
+    rnd = random.Random(semilla)
+    invitados = [crear_invitado("invitado", f"Invitado{i}") for i in range(n)]
+    grupo_de = [0] * n
+    i = 0
+    while i < n:
+        tam = rnd.randint(1, tam_grupo)
+        grupo = invitados[i:i + tam]
+        for a, b in zip(grupo, grupo[1:]):
+            a.preferencias.append(f"amigo:{b.nombre}")
+        for j in range(i, min(i + tam, n)):
+            grupo_de[j] = i
+        i += tam
+
+    if n > 1:
+        for _ in range(round(densidad_enemigos * n)):
+            a, b = rnd.sample(range(n), 2)
+            if grupo_de[a] != grupo_de[b]:
+                invitados[a].preferencias.append(f"enemigo:{invitados[b].nombre}")
+    return invitados
+
+
+# Evento de --cadenas: grupos de amigos encadenados (A->B->C) y enemigos
+# sueltos entre grupos
+CASO_CADENAS = dict(grupos=400, tam_grupo=3, enemigos=600, mesas=140, tamano_mesa=10, tiempo=4.0)
+
+
+def filas_cadenas(grupos: int, tam_grupo: int, enemigos: int, semilla: int = 0) -> List[Dict]:
+    """Filas como las de la lista de invitados (nombre, pref_con, pref_sin)."""
+    rnd = random.Random(semilla)
+    filas = []
+    for g in range(grupos):
+        nombres = [f"G{g}_{k}" for k in range(tam_grupo)]
+        for k, nombre in enumerate(nombres):
+            filas.append({"nombre": nombre, "apellido": "",
+                          "pref_con": nombres[k + 1] if k + 1 < tam_grupo else "", "pref_sin": ""})
+    for _ in range(enemigos):
+        a, b = rnd.sample(range(len(filas)), 2)
+        if a // tam_grupo != b // tam_grupo:
+            filas[a]["pref_sin"] = filas[b]["nombre"]
+    return filas
+
+
+def memoria_por_invitado(n: int, tam_grupo: int, densidad_enemigos: float, semilla: int,
+                         tamano_mesa: int) -> float:
+    """Bytes por invitado de la lista de invitados (preferencias resueltas) y
+    del evento con todos sentados, medidos con tracemalloc."""
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.get_traced_memory()[0]
+        invitados = generar_invitados(n, tam_grupo, densidad_enemigos, semilla)
+        registro = resolver_preferencias(invitados)
+        asignacion = [i // tamano_mesa for i in range(n)]
+        evento = evento_desde_asignacion(invitados, asignacion, tamano_mesa,
+                                         max(1, ceil(n / tamano_mesa)), "Evento", "", "",
+                                         registro=registro)
+        usado = tracemalloc.get_traced_memory()[0] - antes
+    finally:
+        tracemalloc.stop()
+    del evento
+    return usado / max(1, n)
+
+
+def medir(nombre: str, participantes: List[Invitado], tamano_mesa: int, num_mesas: int,
+          tiempo: float, semilla: int = 0) -> Dict:
+    opciones = dict(MOTORES_BENCHMARK[nombre])
+    config = ConfigSolver(tiempo_limite=tiempo, semilla=semilla,
+                          dividir=opciones.pop("dividir", False))
+    estadisticas: Dict = {}
+    primera: List[Optional[float]] = [None]
+    t0 = time.perf_counter()
+
+    def al_mejorar(_evento, _mapping):
+        if primera[0] is None:
+            primera[0] = time.perf_counter() - t0
+
+    evento, _ = asignar_mesas(participantes, tamano_mesa, num_mesas=num_mesas, config=config,
+                              al_mejorar=al_mejorar, estadisticas=estadisticas, **opciones)
+    t_total = time.perf_counter() - t0
+
+    r = {
+        "motor": nombre,
+        "invitados": len(participantes),
+        "mesas": num_mesas,
+        "motor_usado": estadisticas.get("motor", ""),
+        "estado": estadisticas.get("estado", ""),
+        "t_modelo": estadisticas.get("t_modelo", 0.0),
+        # Primera solución del CP-SAT, no el plan de partida que se entrega
+        # antes; sin CP-SAT (heurístico, dividido), la primera entregada
+        "t_primera": estadisticas.get("t_primera_cpsat", primera[0]),
+        "t_resolver": estadisticas.get("t_resolver", 0.0),
+        "t_total": t_total,
+    }
+    r.update(calidad_reparto(participantes, evento, tamano_mesa))
+    return r
+
+
+def escribir_csv(ruta: str, resultados: List[Dict]):
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNAS, delimiter=";", extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(resultados)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Benchmark de velocidad y calidad de asignar_mesas")
+    ap.add_argument("--invitados", type=int, nargs="+", default=[100, 300, 600])
+    ap.add_argument("--tam-grupo", type=int, nargs="+", default=[3],
+                    help="tamaño máximo de los grupos de amigos")
+    ap.add_argument("--enemigos", type=float, nargs="+", default=[0.0],
+                    help="enemigos por invitado (media)")
+    ap.add_argument("--motores", nargs="+", choices=list(MOTORES_BENCHMARK),
+                    default=list(MOTORES_BENCHMARK))
+    ap.add_argument("--tamano-mesa", type=int, default=10)
+    ap.add_argument("--mesas", type=int, default=None,
+                    help="número de mesas (por defecto el mínimo + 15%% de holgura)")
+    ap.add_argument("--tiempo", type=float, default=5.0)
+    ap.add_argument("--semilla", type=int, default=0)
+    ap.add_argument("--json", help="guardar el informe en JSON")
+    ap.add_argument("--csv", help="guardar el informe en CSV (;)")
+    ap.add_argument("--memoria", action="store_true",
+                    help="medir también los bytes por invitado del modelo (tracemalloc)")
+    ap.add_argument("--cadenas", action="store_true",
+                    help="añadir el evento de 1200 invitados en cadenas de amigos (140 mesas, 4 s)")
+    args = ap.parse_args()
+
+    print(f"{'motor':<16}{'invitados':>10}{'mesas':>7}{'modelo(s)':>11}{'1a sol(s)':>11}"
+          f"{'total(s)':>10}{'amigos':>12}{'enemigos':>10}{'ocup.':>7}{'B/inv':>7}  estado")
+    resultados = []
+
+    def imprimir(r: Dict, memoria: Optional[float] = None):
+        primera = f"{r['t_primera']:.3f}" if r["t_primera"] is not None else "-"
+        print(f"{r['motor']:<16}{r['invitados']:>10}{r['mesas']:>7}{r['t_modelo']:>11.3f}"
+              f"{primera:>11}{r['t_total']:>10.3f}"
+              f"{r['amigos_ok']:>6}/{r['amigos_total']:<5}{r['enemigos_juntos']:>10}"
+              f"{r['ocupacion']:>7.0%}{memoria or 0:>7.0f}  {r['estado'] or r['motor_usado']}")
+
+    for n in args.invitados:
+        num_mesas = args.mesas or ceil(1.15 * n / args.tamano_mesa)
+        for tam_grupo in args.tam_grupo:
+            for densidad in args.enemigos:
+                participantes = generar_invitados(n, tam_grupo, densidad, args.semilla)
+                memoria = (memoria_por_invitado(n, tam_grupo, densidad, args.semilla,
+                                                args.tamano_mesa) if args.memoria else None)
+                for nombre in args.motores:
+                    r = medir(nombre, participantes, args.tamano_mesa, num_mesas,
+                              args.tiempo, args.semilla)
+                    r.update(tam_grupo=tam_grupo, enemigos=densidad, bytes_por_invitado=memoria)
+                    resultados.append(r)
+                    imprimir(r, memoria)
+
+    if args.cadenas:
+        c = CASO_CADENAS
+        participantes = invitados_desde_filas(
+            filas_cadenas(c["grupos"], c["tam_grupo"], c["enemigos"], args.semilla))
+        for nombre in args.motores:
+            r = medir(nombre, participantes, c["tamano_mesa"], c["mesas"], c["tiempo"], args.semilla)
+            r.update(tam_grupo=c["tam_grupo"], enemigos=c["enemigos"] / len(participantes))
+            resultados.append(r)
+            imprimir(r)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+    if args.csv:
+        escribir_csv(args.csv, resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# compilar_recursos.py
+# Compila ResourcesIconos.qrc a ResourcesIconos.rcc (recurso binario que
+# recursos.py registra con QResource.registerResource y Qt mapea en memoria).
+# Volver a ejecutarlo al añadir o cambiar iconos:
+#
+#   python compilar_recursos.py [ResourcesIconos.qrc] [-o ResourcesIconos.rcc]
+#
+# Usa `rcc -binary` de Qt si está instalado; si no, compila con pyrcc5 y
+# empaqueta sus tablas en el formato binario de rcc (versión 2).
+
+import argparse
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+QRC_DEFECTO = os.path.join(CARPETA, "ResourcesIconos.qrc")
+RCC_DEFECTO = os.path.join(CARPETA, "ResourcesIconos.rcc")
+
+
+def _tablas_pyrcc5(qrc: str):
+    # pyrcc5 genera un módulo con las tres tablas (árbol, nombres, datos);
+    # se ejecuta sin registrar nada para leerlas.
+    with tempfile.TemporaryDirectory() as tmp:
+        salida = os.path.join(tmp, "recursos_rc.py")
+        subprocess.run([sys.executable, "-m", "PyQt5.pyrcc_main", qrc, "-o", salida], check=True)
+        with open(salida, encoding="utf-8") as f:
+            codigo = f.read()
+    codigo = codigo.replace("\nqInitResources()", "")
+    espacio = {}
+    exec(compile(codigo, "recursos_rc.py", "exec"), espacio)
+    return espacio["qt_resource_struct_v2"], espacio["qt_resource_name"], espacio["qt_resource_data"]
+
+
+def empaquetar_rcc(arbol: bytes, nombres: bytes, datos: bytes) -> bytes:
+    # Cabecera: "qres", versión, y desplazamientos (desde el inicio del
+    # fichero) del árbol, los datos y los nombres; enteros de 32 bits big-endian.
+    cabecera = 4 + 4 * 4
+    off_datos = cabecera
+    off_nombres = off_datos + len(datos)
+    off_arbol = off_nombres + len(nombres)
+    return (b"qres" + struct.pack(">IIII", 2, off_arbol, off_datos, off_nombres)
+            + datos + nombres + arbol)
+
+
+def compilar(qrc: str = QRC_DEFECTO, rcc: str = RCC_DEFECTO):
+    # Las rutas del .qrc son relativas a su carpeta
+    qrc = os.path.abspath(qrc)
+    rcc = os.path.abspath(rcc)
+    previa = os.getcwd()
+    os.chdir(os.path.dirname(qrc))
+    try:
+        binario = shutil.which("rcc") or shutil.which("rcc-qt5")
+        if binario:
+            subprocess.run([binario, "-binary", qrc, "-o", rcc], check=True)
+            return
+        contenido = empaquetar_rcc(*_tablas_pyrcc5(qrc))
+    finally:
+        os.chdir(previa)
+    with open(rcc, "wb") as f:
+        f.write(contenido)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Compila el .qrc de iconos a un .rcc binario")
+    ap.add_argument("qrc", nargs="?", default=QRC_DEFECTO)
+    ap.add_argument("-o", "--salida", default=RCC_DEFECTO)
+    args = ap.parse_args()
+    compilar(args.qrc, args.salida)
+    print(f"{args.salida}: {os.path.getsize(args.salida)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# conftest.py
+# Raíz del proyecto en sys.path para que los tests importen los módulos
+# (nucleo_mesas, mesas_emergente...) como lo hace main.py.
@@ -0,0 +1,315 @@
+# generar_mesas.py
+# Genera el plan de mesas de un evento sin interfaz: lee la lista de invitados
+# (las mismas cabeceras que acepta la pantalla de invitados), reparte con
+# nucleo_mesas.asignar_mesas y escribe mesas_<evento>.csv y un resumen del
+# reparto (tiempos, preferencias cumplidas, ocupación).
+#
+#   python generar_mesas.py invitados_boda_de_juan.csv --evento "Boda de Juan" --mesas 7 \
+#       --tiempo 30 --json resumen.json
+#
+# Con --eventos se regeneran en lote todos los eventos de eventos.json (cada
+# uno con su csv_invitados y su número de mesas), en paralelo en procesos:
+#
+#   python generar_mesas.py --eventos eventos.json --tiempo 60 --csv informe.csv
+
+import argparse
+import csv
+import json
+import ntpath
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from typing import Dict, List, Optional
+
+from nucleo_mesas import (FORMULACIONES, MODOS_ENLACE, MOTORES, ConfigSolver, asignar_mesas,
+                          calidad_reparto, cargar_evento_desde_csv_mesas, guardar_evento_csv_mesas,
+                          invitados_desde_filas, leer_invitados_csv, ruta_csv_mesas,
+                          tamano_mesa_por_defecto)
+
+
+def nombre_desde_ruta(ruta: str) -> str:
+    # invitados_boda_de_juan.csv -> boda_de_juan
+    base = os.path.splitext(os.path.basename(ruta))[0]
+    if base.lower().startswith("invitados_"):
+        base = base[len("invitados_"):]
+    return base or "evento"
+
+
+def generar_mesas(ruta_invitados: str, nombre_evento: str, fecha: str = "", ubicacion: str = "",
+                  num_mesas: Optional[int] = None, tamano_mesa: Optional[int] = None,
+                  config: Optional[ConfigSolver] = None, carpeta: str = "",
+                  conservar: bool = False, **opciones) -> Dict:
+    """Reparte la lista de invitados de `ruta_invitados`, guarda
+    mesas_<evento>.csv en `carpeta` y devuelve el resumen.
+
+    Con `conservar`, si ya existe el plan del evento se parte de él y solo se
+    colocan los invitados nuevos (como al reabrir el evento en la interfaz).
+    `opciones` se pasan a asignar_mesas (motor, formulacion, amigos...).
+    """
+    t0 = time.perf_counter()
+    participantes = invitados_desde_filas(leer_invitados_csv(ruta_invitados))
+    if not participantes:
+        raise ValueError(f"No hay invitados para asignar en {ruta_invitados}.")
+
+    tamano = tamano_mesa or tamano_mesa_por_defecto(len(participantes), num_mesas)
+    ruta = ruta_csv_mesas(nombre_evento, carpeta)
+    estadisticas: Dict = {}
+
+    # Aunque no haya invitados nuevos se pasa por asignar_mesas (con todo
+    # fijado es inmediato) para que el evento use los mismos invitados que
+    # el resumen.
+    plan = None
+    if conservar and os.path.exists(ruta):
+        plan = cargar_evento_desde_csv_mesas(nombre_evento, fecha, ubicacion, ruta)
+        num_mesas = max(num_mesas or 0, len(plan.mesas))
+    evento, _ = asignar_mesas(participantes, tamano, nombre_evento=nombre_evento, fecha=fecha,
+                              ubicacion=ubicacion, num_mesas=num_mesas, config=config,
+                              plan_previo=plan, fijar_previos=plan is not None,
+                              estadisticas=estadisticas, **opciones)
+
+    guardar_evento_csv_mesas(evento, ruta)
+
+    resumen = {
+        "evento": nombre_evento,
+        "invitados": len(participantes),
+        "mesas": len(evento.mesas),
+        "tamano_mesa": tamano,
+        "motor": estadisticas.get("motor", ""),
+        "estado": estadisticas.get("estado", ""),
+        "t_modelo": estadisticas.get("t_modelo", 0.0),
+        "t_resolver": estadisticas.get("t_resolver", 0.0),
+        "t_total": time.perf_counter() - t0,
+        "ruta": ruta,
+    }
+    resumen.update(calidad_reparto(participantes, evento, tamano))
+    return resumen
+
+
+def imprimir_resumen(r: Dict, salida=sys.stdout):
+    print(f"{r['evento']}: {r['invitados']} invitados en {r['mesas_usadas']}/{r['mesas']} mesas "
+          f"de {r['tamano_mesa']} ({r['ocupacion']:.0%} de ocupación)", file=salida)
+    print(f"  amigos juntos {r['amigos_ok']}/{r['amigos_total']}, "
+          f"enemigos juntos {r['enemigos_juntos']}/{r['enemigos_total']}, "
+          f"sin sentar {r['sin_sentar']}", file=salida)
+    print(f"  {r['estado'] or r['motor']} en {r['t_total']:.2f} s "
+          f"(modelo {r['t_modelo']:.2f} s, solver {r['t_resolver']:.2f} s) -> {r['ruta']}",
+          file=salida)
+
+
+def argumentos_solver(ap: argparse.ArgumentParser):
+    defecto = ConfigSolver()
+    ap.add_argument("--motor", choices=MOTORES, default="cpsat")
+    ap.add_argument("--formulacion", choices=FORMULACIONES, default="booleana")
+    ap.add_argument("--amigos", choices=MODOS_ENLACE, default="duro",
+                    help="los amigos deben (duro) o prefieren (blando) sentarse juntos")
+    ap.add_argument("--enemigos", choices=MODOS_ENLACE, default="blando",
+                    help="los enemigos no pueden (duro) o prefieren no (blando) sentarse juntos")
+    ap.add_argument("--tiempo", type=float, default=defecto.tiempo_limite,
+                    help="segundos de búsqueda del CP-SAT")
+    ap.add_argument("--workers", type=int, default=defecto.workers,
+                    help="hilos del CP-SAT (0 = todos los núcleos; con --eventos, repartidos "
+                         "entre los procesos)")
+    # Sin valor por defecto: con --eventos solo se cambia lo que se indique
+    ap.add_argument("--semilla", type=int, default=None,
+                    help=f"semilla del CP-SAT (por defecto {defecto.semilla})")
+    ap.add_argument("--gap", type=float, default=None,
+                    help="parar al alcanzar este gap relativo (0.05 = 5%%)")
+    ap.add_argument("--determinista", action="store_true")
+    ap.add_argument("--dividir", action="store_true",
+                    help="resolver aparte, en paralelo, los grupos sin relación entre sí "
+                         "(no con --eventos)")
+    ap.add_argument("--procesos", type=int, default=defecto.procesos,
+                    help="procesos para --dividir (0 = uno por núcleo)")
+    ap.add_argument("--log", action="store_true", help="mostrar el log del CP-SAT")
+
+
+def ajustes_explicitos(args) -> Dict:
+    # Opciones del solver indicadas en la línea de órdenes, para aplicarlas
+    # sobre los ajustes guardados de cada evento
+    ajustes = {}
+    if args.semilla is not None:
+        ajustes["semilla"] = args.semilla
+    if args.gap is not None:
+        ajustes["gap_relativo"] = args.gap
+    if args.determinista:
+        ajustes["determinista"] = True
+    if args.log:
+        ajustes["log_busqueda"] = True
+    return ajustes
+
+
+def config_desde_args(args) -> ConfigSolver:
+    return replace(ConfigSolver(workers=args.workers, tiempo_limite=args.tiempo,
+                                dividir=args.dividir, procesos=args.procesos),
+                   **ajustes_explicitos(args))
+
+
+# Columnas del informe del lote
+COLUMNAS_LOTE = ["evento", "invitados", "mesas", "tamano_mesa", "motor", "estado", "t_modelo",
+                 "t_resolver", "t_total", "amigos_ok", "amigos_total", "enemigos_juntos",
+                 "enemigos_total", "mesas_usadas", "ocupacion", "sin_sentar", "ruta", "error"]
+
+
+def cargar_eventos(ruta: str) -> List[Dict]:
+    with open(ruta, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return data if isinstance(data, list) else []
+
+
+def ruta_invitados_evento(evento: Dict, carpeta_eventos: str) -> str:
+    ruta = evento.get("csv_invitados") or ""
+    if not ruta or os.path.exists(ruta):
+        return ruta
+    # Ruta guardada en otro equipo (p. ej. C:\...): se busca el fichero junto
+    # a eventos.json
+    candidato = os.path.join(carpeta_eventos, ntpath.basename(ruta))
+    return candidato if os.path.exists(candidato) else ruta
+
+
+def _generar_evento(evento: Dict, ruta_invitados: str, config: ConfigSolver, carpeta: str,
+                    conservar: bool, opciones: Dict) -> Dict:
+    # Se ejecuta en un proceso del lote: los errores de un evento se
+    # devuelven en el resumen para no cortar el resto.
+    nombre = evento.get("tipo", evento.get("nombre", "Evento")) or "Evento"
+    try:
+        if not ruta_invitados:
+            raise ValueError("el evento no tiene csv_invitados")
+        return generar_mesas(ruta_invitados, nombre, fecha=evento.get("fecha", ""),
+                             ubicacion=evento.get("ubicacion", ""),
+                             num_mesas=int(evento.get("mesas", 0) or 0) or None, config=config,
+                             carpeta=carpeta, conservar=conservar, **opciones)
+    except Exception as e:
+        return {"evento": nombre, "error": str(e)}
+
+
+def generar_lote(eventos: List[Dict], carpeta_eventos: str = "", tiempo: float = 5.0,
+                 procesos: int = 0, workers: int = 0, carpeta: str = "", conservar: bool = False,
+                 al_terminar=None, ajustes: Optional[Dict] = None, **opciones) -> List[Dict]:
+    """Genera el plan de mesas de cada evento en un pool de `procesos`
+    (0 = uno por núcleo) con `tiempo` segundos por evento, y devuelve los
+    resúmenes en el orden de `eventos`.
+
+    Cada evento usa sus ajustes del solver guardados (clave "solver") salvo
+    el tiempo, los hilos y los campos de ConfigSolver que traiga `ajustes`:
+    si `workers` es 0 los núcleos se reparten entre los procesos, para que
+    el lote escale con los núcleos sin saturarlos.
+    `al_terminar(resumen)` se llama según va acabando cada evento.
+    """
+    nucleos = os.cpu_count() or 1
+    procesos = max(1, min(procesos or nucleos, len(eventos) or 1))
+    workers = workers or max(1, nucleos // procesos)
+
+    tareas = []
+    for i, evento in enumerate(eventos):
+        ruta = ruta_invitados_evento(evento, carpeta_eventos)
+        # Los subproblemas abrirían otro pool dentro de cada proceso
+        config = replace(ConfigSolver.desde_dict(evento.get("solver")), **(ajustes or {}),
+                         tiempo_limite=tiempo, workers=workers, dividir=False)
+        tamano = os.path.getsize(ruta) if ruta and os.path.exists(ruta) else 0
+        tareas.append((tamano, i, evento, ruta, config))
+    # Los eventos más grandes primero, para que no quede uno largo al final
+    tareas.sort(key=lambda t: -t[0])
+
+    resultados: List[Optional[Dict]] = [None] * len(eventos)
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {pool.submit(_generar_evento, evento, ruta, config, carpeta, conservar,
+                               opciones): i
+                   for _, i, evento, ruta, config in tareas}
+        for futuro in as_completed(futuros):
+            resultados[futuros[futuro]] = resumen = futuro.result()
+            if al_terminar is not None:
+                al_terminar(resumen)
+    return resultados
+
+
+def escribir_informe_csv(ruta: str, resultados: List[Dict]):
+    with open(ruta, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNAS_LOTE, delimiter=";", extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(resultados)
+
+
+def _main_lote(args) -> int:
+    try:
+        eventos = cargar_eventos(args.eventos)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    def al_terminar(r: Dict):
+        if r.get("error"):
+            print(f"{r['evento']}: ERROR {r['error']}", file=sys.stderr)
+        else:
+            imprimir_resumen(r)
+
+    t0 = time.perf_counter()
+    resultados = generar_lote(eventos, os.path.dirname(os.path.abspath(args.eventos)),
+                              tiempo=args.tiempo, procesos=args.paralelo, workers=args.workers,
+                              carpeta=args.salida, conservar=args.conservar,
+                              al_terminar=al_terminar, ajustes=ajustes_explicitos(args),
+                              motor=args.motor, formulacion=args.formulacion,
+                              amigos=args.amigos, enemigos=args.enemigos)
+    errores = sum(1 for r in resultados if r.get("error"))
+    print(f"{len(resultados) - errores}/{len(resultados)} eventos en "
+          f"{time.perf_counter() - t0:.2f} s")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=2)
+    if args.csv:
+        escribir_informe_csv(args.csv, resultados)
+    return 1 if errores else 0
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Genera mesas_<evento>.csv a partir de la lista "
+                                             "de invitados, sin interfaz")
+    ap.add_argument("invitados", nargs="?",
+                    help="CSV de invitados (nombre, apellido, pref_con, pref_sin)")
+    ap.add_argument("--eventos", help="regenerar en lote todos los eventos de este eventos.json")
+    ap.add_argument("--paralelo", type=int, default=0,
+                    help="con --eventos, eventos a la vez (0 = uno por núcleo)")
+    ap.add_argument("--evento", help="nombre del evento (por defecto, el del CSV)")
+    ap.add_argument("--fecha", default="")
+    ap.add_argument("--ubicacion", default="")
+    ap.add_argument("--mesas", type=int, default=None, help="número de mesas")
+    ap.add_argument("--tamano-mesa", type=int, default=None,
+                    help="asientos por mesa (por defecto lo justo para --mesas, mínimo 8)")
+    ap.add_argument("--salida", default="", help="carpeta donde escribir mesas_<evento>.csv")
+    ap.add_argument("--conservar", action="store_true",
+                    help="partir del mesas_<evento>.csv existente y colocar solo a los nuevos")
+    ap.add_argument("--json", help="guardar el resumen en JSON")
+    ap.add_argument("--csv", help="con --eventos, guardar el informe del lote en CSV (;)")
+    argumentos_solver(ap)
+    args = ap.parse_args(argv)
+
+    if args.eventos:
+        if args.dividir:
+            # Cada evento ya es un proceso del lote
+            ap.error("--dividir no se puede usar con --eventos")
+        return _main_lote(args)
+    if not args.invitados:
+        ap.error("indica el CSV de invitados o --eventos")
+
+    try:
+        resumen = generar_mesas(args.invitados, args.evento or nombre_desde_ruta(args.invitados),
+                                fecha=args.fecha, ubicacion=args.ubicacion, num_mesas=args.mesas,
+                                tamano_mesa=args.tamano_mesa, config=config_desde_args(args),
+                                carpeta=args.salida, conservar=args.conservar, motor=args.motor,
+                                formulacion=args.formulacion, amigos=args.amigos,
+                                enemigos=args.enemigos)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    imprimir_resumen(resumen)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(resumen, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,28 @@
 # main.py
+#
+#   python main.py --tiempos-arranque   mide el arranque y sale al mostrar la
+#                                       ventana (con -X importtime, el detalle)
 import sys
 import json
 import os
+import time
 
+T_INICIO = time.perf_counter()
+
+from PyQt5.QtCore import QTimer
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from VPantallaPrincipal import VPantallaPrincipal
-from VPantallaInvitados import VPantallaInvitados
+
+T_IMPORTS = time.perf_counter()
 
 RUTA_EVENTOS = "eventos.json"
 
+# Módulos que no hacen falta para la pantalla principal: se cargan al abrir
+# la ventana que los usa (invitados, mesas, solver...).
+MODULOS_DIFERIDOS = ("VPantallaInvitados", "mesas_emergente", "algoritmo", "WAnadirPersona",
+                     "WAnadirEvento", "WEditarEvento", "PyQt5.uic", "nucleo_mesas.solver",
+                     "ortools")
+
 ventana_mesas_global = None
 
 
@@ -38,6 +52,8 @@ class AppShim:
 
     # ---- Abrir pantalla de invitados ----
     def abrir_pantalla2(self, evento):
+        from VPantallaInvitados import VPantallaInvitados
+
         win = VPantallaInvitados(evento=evento, router=self)
 
         nombre = evento.get("tipo") or evento.get("nombre") or "Evento"
@@ -57,8 +73,20 @@ class AppShim:
                                 f"Edición no implementada (idx={idx}).")
 
 
+def informe_arranque(t_app: float, t_ventana: float):
+    t_pintada = time.perf_counter()
+    print(f"[arranque] importaciones {1000 * (T_IMPORTS - T_INICIO):.0f} ms, "
+          f"QApplication {1000 * (t_app - T_IMPORTS):.0f} ms, "
+          f"ventana {1000 * (t_ventana - t_app):.0f} ms, "
+          f"primer pintado {1000 * (t_pintada - T_INICIO):.0f} ms")
+    cargados = [m for m in MODULOS_DIFERIDOS if m in sys.modules]
+    print(f"[arranque] módulos diferidos cargados: {', '.join(cargados) or 'ninguno'}")
+
+
 if __name__ == "__main__":
+    medir_arranque = "--tiempos-arranque" in sys.argv
     app = QApplication(sys.argv)
+    t_app = time.perf_counter()
 
     # Sin QSS global para evitar conflictos
     app.setStyleSheet("")
@@ -68,4 +96,9 @@ if __name__ == "__main__":
     win = VPantallaPrincipal(router=shim)
     win.show()
 
+    if medir_arranque:
+        t_ventana = time.perf_counter()
+        # El temporizador a 0 salta cuando el bucle de eventos ya ha pintado
+        QTimer.singleShot(0, lambda: (informe_arranque(t_app, t_ventana), app.quit()))
+
     sys.exit(app.exec_())
@@ -1,22 +1,169 @@
-from typing import List, Dict, Optional
-import math, re, os
+from dataclasses import replace
+from typing import List, Dict, Optional, Sequence
+import math, os, threading, time
 
 from PyQt5.QtWidgets import QMainWindow, QMessageBox
 from PyQt5 import QtCore
 
 from Vistas.Emergente_mesas_ui import Ui_EmergenteMesas
 
-from algoritmo import (
-    Invitado,
+from nucleo_mesas import (
     Mesa,
     Evento,
-    crear_invitado,
     crear_mesa,
     crear_evento,
+    RegistroInvitados,
     asignar_mesas,
-    Main,
+    cargar_cpsat,
     cargar_evento_desde_csv_mesas,
+    invitados_sin_sentar,
+    ConfigSolver,
+    invitados_desde_filas,
+    ruta_csv_mesas,
+    tamano_mesa_por_defecto,
+    TAMANO_MESA_MINIMO,
 )
+from algoritmo import Main
+
+
+INTERVALO_REFRESCO = 0.3  # segundos entre refrescos de la ventana de mesas
+
+_pool_mesas: Optional[QtCore.QThreadPool] = None
+
+
+def pool_mesas() -> QtCore.QThreadPool:
+    # Pool propio para los repartos: Qt usa el pool global para convertir y
+    # escalar imágenes (QPixmap), y si lo ocupase un solver largo la interfaz
+    # se quedaría esperando. Se crea desde el hilo de la interfaz, y ahí se
+    # carga el CP-SAT: cargado en un hilo del pool, el segundo reparto en ese
+    # hilo tumbaba el proceso (ver cargar_cpsat).
+    global _pool_mesas
+    if _pool_mesas is None:
+        cargar_cpsat()
+        _pool_mesas = QtCore.QThreadPool()
+        _pool_mesas.setMaxThreadCount(max(1, QtCore.QThread.idealThreadCount()))
+    return _pool_mesas
+
+
+# Tareas de reparto en marcha, para repartir los núcleos entre ellas
+_tareas_en_marcha = 0
+_cerrojo_tareas = threading.Lock()
+
+
+def config_repartida(config: Optional[ConfigSolver], en_marcha: int) -> ConfigSolver:
+    # Con 0 (= todos los núcleos) cada tarea abriría un hilo del CP-SAT (o un
+    # proceso con --dividir) por núcleo: se reparten entre las tareas en
+    # marcha, como generar_lote entre sus procesos. Las que ya estaban
+    # resolviendo conservan lo que tomaron al empezar.
+    config = config or ConfigSolver()
+    parte = max(1, (os.cpu_count() or 1) // max(1, en_marcha))
+    return replace(config, workers=config.workers or parte, procesos=config.procesos or parte)
+
+
+class SenalesGenerador(QtCore.QObject):
+    progreso = QtCore.pyqtSignal(str)
+    solucion = QtCore.pyqtSignal(object)
+    terminado = QtCore.pyqtSignal(object)
+    cancelado = QtCore.pyqtSignal()
+    error = QtCore.pyqtSignal(str)
+
+
+class TareaGenerarMesas(QtCore.QRunnable):
+    # Genera (o carga) el reparto de un evento en pool_mesas(), sin bloquear
+    # la interfaz. Varias ventanas pueden lanzar su tarea a la vez: cada una
+    # toma su parte de los núcleos al empezar (config_repartida). Si se
+    # indica `ruta_plan` (mesas_<evento>.csv) se parte de ese reparto y solo
+    # se recoloca lo nuevo. `filas_invitados` es una copia de las filas del
+    # CSV hecha en el hilo de la interfaz: la ventana puede seguir editando
+    # las suyas mientras la tarea resuelve.
+    def __init__(self, filas_invitados: Sequence[Dict], ruta_plan: Optional[str] = None,
+                 **kwargs):
+        super().__init__()
+        self.senales = SenalesGenerador()
+        self.filas_invitados = filas_invitados
+        self.ruta_plan = ruta_plan
+        self.kwargs = kwargs
+        self.detener = threading.Event()
+        self._cancelada = False
+        self._soluciones = 0
+        self._ultima_emision = 0.0
+
+    def cancelar(self):
+        """Aborta la tarea sin entregar resultado."""
+        self._cancelada = True
+        self.detener.set()
+
+    def _al_mejorar(self, evento: Evento, _mapping):
+        self._soluciones += 1
+        self.senales.progreso.emit(f"Solución {self._soluciones} encontrada, mejorando...")
+        # El solver puede encadenar decenas de mejoras por segundo; se limita
+        # el refresco de la ventana (la solución final llega con `terminado`).
+        ahora = time.monotonic()
+        if self._cancelada or ahora - self._ultima_emision < INTERVALO_REFRESCO:
+            return
+        self._ultima_emision = ahora
+        self.senales.solucion.emit(evento)
+
+    def run(self):
+        global _tareas_en_marcha
+        with _cerrojo_tareas:
+            _tareas_en_marcha += 1
+            en_marcha = _tareas_en_marcha
+        try:
+            kwargs = dict(self.kwargs)
+            kwargs["config"] = config_repartida(kwargs.get("config"), en_marcha)
+            self._generar(kwargs)
+        finally:
+            with _cerrojo_tareas:
+                _tareas_en_marcha -= 1
+
+    def _generar(self, kwargs: Dict):
+        try:
+            plan = None
+            if self.ruta_plan:
+                self.senales.progreso.emit("Cargando el plan de mesas guardado...")
+                plan = cargar_evento_desde_csv_mesas(
+                    nombre_evento=kwargs.get("nombre_evento", "Evento"),
+                    fecha=kwargs.get("fecha", ""),
+                    ubicacion=kwargs.get("ubicacion", ""),
+                    ruta=self.ruta_plan
+                )
+
+            self.senales.progreso.emit("Preparando invitados...")
+            participantes = invitados_desde_filas(self.filas_invitados)
+            if not participantes:
+                raise ValueError("No hay invitados para asignar.")
+
+            if plan is not None and not invitados_sin_sentar(participantes, plan):
+                evento = plan
+            elif plan is not None:
+                # Plan ya confirmado + invitados nuevos: solo se colocan los
+                # nuevos, respetando las mesas que ya se comunicaron.
+                nuevos = len(invitados_sin_sentar(participantes, plan))
+                self.senales.progreso.emit(f"Recolocando {nuevos} invitado(s) nuevo(s)...")
+                kwargs["num_mesas"] = max(kwargs.get("num_mesas") or 0, len(plan.mesas))
+                evento, _ = asignar_mesas(
+                    participantes,
+                    al_mejorar=self._al_mejorar,
+                    detener=self.detener,
+                    plan_previo=plan,
+                    fijar_previos=True,
+                    **kwargs
+                )
+            else:
+                self.senales.progreso.emit(f"Buscando reparto para {len(participantes)} invitados...")
+                evento, _ = asignar_mesas(
+                    participantes,
+                    al_mejorar=self._al_mejorar,
+                    detener=self.detener,
+                    **kwargs
+                )
+            if self._cancelada:
+                self.senales.cancelado.emit()
+            else:
+                self.senales.terminado.emit(evento)
+        except Exception as e:
+            self.senales.error.emit(str(e))
 
 
 class EmergenteMesas(QMainWindow, Ui_EmergenteMesas):
@@ -26,119 +173,61 @@ class EmergenteMesas(QMainWindow, Ui_EmergenteMesas):
         evento_dict: Optional[Dict] = None,
         parent=None,
         tamano_mesa_defecto: int = 8,
+        config_solver: Optional[ConfigSolver] = None,
     ):
         super().__init__(parent)
         self.setupUi(self)
 
         self.invitados_csv = invitados_csv or []
         self.evento_dict = evento_dict or {}
+        self.config_solver = config_solver or ConfigSolver.desde_dict(self.evento_dict.get("solver"))
 
         total = len(self.invitados_csv)
         num_mesas_cfg = int(self.evento_dict.get("mesas", 0) or 0)
         self.num_mesas_cfg = num_mesas_cfg if num_mesas_cfg > 0 else None
 
         if total > 0 and self.num_mesas_cfg:
-            base = math.ceil(total / self.num_mesas_cfg)
-            self.tamano_mesa_defecto = max(8, base)
+            self.tamano_mesa_defecto = tamano_mesa_por_defecto(total, self.num_mesas_cfg)
         else:
-            self.tamano_mesa_defecto = max(8, tamano_mesa_defecto)
+            self.tamano_mesa_defecto = max(TAMANO_MESA_MINIMO, tamano_mesa_defecto)
 
         nombre_base = self.evento_dict.get("tipo", self.evento_dict.get("nombre", "evento"))
-        nombre_base = (nombre_base or "evento").strip() or "evento"
-        safe = nombre_base.replace(" ", "_")
-        self.csv_mesas_path = os.path.abspath(f"mesas_{safe}.csv")
+        self.csv_mesas_path = ruta_csv_mesas(nombre_base)
+
+        self.tarea: Optional[TareaGenerarMesas] = None
+        self._ventana_auto: Optional[Main] = None
 
         self.btnAutomatico.clicked.connect(self.on_generar_mesas_auto)
         self.btnManual.clicked.connect(self.on_generar_mesas_manual)
 
-    def _split_pref_str(self, s: str) -> List[str]:
-        if not s:
-            return []
-        partes = re.split(r"[|,;/]", s)
-        return [p.strip() for p in partes if p.strip()]
-
-    def _invitados_csv_a_modelo(self) -> List[Invitado]:
-        participantes: List[Invitado] = []
-
-        for d in self.invitados_csv:
-            nombre = (d.get("nombre") or "").strip()
-            apellido = (d.get("apellido") or "").strip()
-            rol = (d.get("rol") or "").strip()
-
-            if not nombre:
-                continue
-
-            prefs = []
-
-            pref_con = (d.get("pref_con") or "").strip()
-            for amigo in self._split_pref_str(pref_con):
-                partes = amigo.split()
-                if not partes:
-                    continue
-                base = partes[0]
-                prefs.append(f"amigo:{base}")
-
-            pref_sin = (d.get("pref_sin") or "").strip()
-            for enemigo in self._split_pref_str(pref_sin):
-                partes = enemigo.split()
-                if not partes:
-                    continue
-                base = partes[0]
-                prefs.append(f"enemigo:{base}")
-
-            participantes.append(
-                crear_invitado(
-                    rol=rol,
-                    nombre=nombre,
-                    apellido=apellido,
-                    preferencias=prefs
-                )
-            )
-
-        return participantes
-
     def on_generar_mesas_auto(self):
-        try:
-            import main
+        if self.tarea is not None:
+            self.tarea.cancelar()
+            return
 
+        try:
             nombre_evento = self.evento_dict.get("tipo", self.evento_dict.get("nombre", "Evento"))
             fecha = self.evento_dict.get("fecha", "")
             ubic = self.evento_dict.get("ubicacion", "")
 
-            if os.path.exists(self.csv_mesas_path):
-                evento = cargar_evento_desde_csv_mesas(
-                    nombre_evento=nombre_evento,
-                    fecha=fecha,
-                    ubicacion=ubic,
-                    ruta=self.csv_mesas_path
-                )
-
-                main.ventana_mesas_global = Main(evento, self.invitados_csv)
-                main.ventana_mesas_global.show()
-                self.hide()
-                return
-
-            participantes = self._invitados_csv_a_modelo()
-
-            if not participantes:
+            if not self.invitados_csv:
                 QMessageBox.warning(self, "Mesas", "No hay invitados para asignar.")
                 return
 
-            tamano = self.tamano_mesa_defecto
-            num_mesas_cfg = getattr(self, "num_mesas_cfg", None)
-
-            evento, mapping = asignar_mesas(
-                participantes,
-                tamano_mesa=tamano,
+            ruta_plan = self.csv_mesas_path if os.path.exists(self.csv_mesas_path) else None
+            tarea = TareaGenerarMesas(
+                tuple(dict(fila) for fila in self.invitados_csv),
+                ruta_plan=ruta_plan,
+                tamano_mesa=self.tamano_mesa_defecto,
                 nombre_evento=nombre_evento,
                 fecha=fecha,
                 ubicacion=ubic,
-                num_mesas=num_mesas_cfg
+                num_mesas=getattr(self, "num_mesas_cfg", None),
+                config=replace(self.config_solver)
             )
+            self._guardar_config_solver()
 
-            main.ventana_mesas_global = Main(evento, self.invitados_csv)
-            main.ventana_mesas_global.show()
-            self.hide()
+            self._lanzar(tarea)
 
         except Exception as e:
             QMessageBox.critical(
@@ -147,20 +236,90 @@ class EmergenteMesas(QMainWindow, Ui_EmergenteMesas):
                 f"Error generando mesas automáticas:\n\n{e}"
             )
 
+    def _guardar_config_solver(self):
+        # Persiste los ajustes del solver en el evento (eventos.json)
+        self.evento_dict["solver"] = self.config_solver.a_dict()
+        router = getattr(self.parent(), "router", None)
+        if router:
+            try:
+                router.guardar_eventos()
+            except Exception as e:
+                print(f"[JSON] Error guardando ajustes del solver: {e}")
+
+    # ---------- Tarea en segundo plano ----------
+    def _lanzar(self, tarea: TareaGenerarMesas):
+        self._ventana_auto = None
+        self.tarea = tarea
+        tarea.senales.progreso.connect(self.statusbar.showMessage)
+        tarea.senales.solucion.connect(self._on_solucion)
+        tarea.senales.terminado.connect(self._on_terminado)
+        tarea.senales.cancelado.connect(self._on_cancelado)
+        tarea.senales.error.connect(self._on_error_generador)
+        self.btnAutomatico.setText("CANCELAR")
+        self.btnManual.setEnabled(False)
+        pool_mesas().start(tarea)
+
+    def _fin_tarea(self):
+        self.tarea = None
+        self.btnAutomatico.setText("AUTOMÁTICO")
+        self.btnManual.setEnabled(True)
+
+    def _on_solucion(self, evento: Evento):
+        import main
+
+        if self._ventana_auto is not None:
+            self._ventana_auto.mostrar_solucion(evento)
+            return
+
+        ventana = Main(evento, self.invitados_csv)
+        if self.tarea is not None:
+            ventana.detener_solicitado.connect(self.tarea.detener.set)
+            ventana.set_busqueda_activa(True)
+        ventana.show()
+        main.ventana_mesas_global = ventana
+        self._ventana_auto = ventana
+        self.hide()
+
+    def _on_terminado(self, evento: Evento):
+        self._on_solucion(evento)
+        self._ventana_auto.set_busqueda_activa(False)
+        self.statusbar.clearMessage()
+        self._fin_tarea()
+
+    def _on_cancelado(self):
+        self.statusbar.showMessage("Generación cancelada", 3000)
+        self._fin_tarea()
+
+    def _on_error_generador(self, msg: str):
+        self.statusbar.clearMessage()
+        self._fin_tarea()
+        QMessageBox.critical(
+            self,
+            "Error",
+            f"Error generando mesas automáticas:\n\n{msg}"
+        )
+
+    def closeEvent(self, event):
+        # Cerrar la ventana antes del primer resultado cancela la tarea
+        if self.tarea is not None and self._ventana_auto is None:
+            self.tarea.cancelar()
+        super().closeEvent(event)
+
     def _crear_evento_vacio(self, tamano_mesa: int) -> Evento:
         total = len(self.invitados_csv)
         num_mesas = getattr(self, "num_mesas_cfg", None) or max(1, math.ceil(total / tamano_mesa))
-        cap = max(8, tamano_mesa)
+        cap = max(TAMANO_MESA_MINIMO, tamano_mesa)
 
+        registro = RegistroInvitados()
         mesas = []
         for i in range(num_mesas):
-            mesas.append(crear_mesa(i + 1, cap, f"Mesa {i+1}"))
+            mesas.append(crear_mesa(i + 1, cap, f"Mesa {i+1}", registro=registro))
 
         nombre = self.evento_dict.get("tipo", self.evento_dict.get("nombre", "Evento sin nombre"))
         fecha = self.evento_dict.get("fecha", "")
         ubic = self.evento_dict.get("ubicacion", "")
 
-        return crear_evento(nombre, fecha, ubic, mesas)
+        return crear_evento(nombre, fecha, ubic, mesas, registro)
 
     def on_generar_mesas_manual(self):
         try:
@@ -0,0 +1,238 @@
+# modelo_invitados.py
+# Lista de invitados de VPantallaInvitados como modelo de Qt: la tabla pinta
+# solo las filas visibles y cada alta, baja o edición avisa únicamente de las
+# filas afectadas. La búsqueda es un proxy que filtra sin tocar los datos,
+# apoyado en el índice de nucleo_mesas.busqueda que el modelo mantiene al día.
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List
+
+from PyQt5.QtCore import QAbstractProxyModel, QAbstractTableModel, QModelIndex, Qt
+
+from nucleo_mesas.busqueda import IndiceBusqueda, normalizar_busqueda
+
+# (clave del invitado, cabecera)
+COLUMNAS = (
+    ("nombre", "Nombre"),
+    ("apellido", "Apellido"),
+    ("pref_con", "Pref de estar"),
+    ("pref_sin", "Preferencias de con quien no estar"),
+)
+
+
+def texto_busqueda(invitado: Dict) -> str:
+    return f"{invitado.get('nombre', '')} {invitado.get('apellido', '')}"
+
+
+class ModeloInvitados(QAbstractTableModel):
+    # Los invitados son los mismos dicts que se guardan en el CSV; el modelo
+    # trabaja sobre la lista que recibe (no la copia). Cada fila tiene además
+    # una clave estable (no cambia al borrar otras) con la que se indexa.
+    def __init__(self, invitados: List[Dict] = None, parent=None):
+        super().__init__(parent)
+        self.indice = IndiceBusqueda()
+        self._siguiente = 0
+        self.invitados: List[Dict] = []
+        self.claves: List[int] = []
+        self.fila_de: Dict[int, int] = {}
+        self._cargar(invitados if invitados is not None else [])
+
+    def _cargar(self, invitados: List[Dict]):
+        self.invitados = invitados
+        self.indice.vaciar()
+        self.claves = list(range(self._siguiente, self._siguiente + len(invitados)))
+        self._siguiente += len(invitados)
+        for clave, inv in zip(self.claves, invitados):
+            self.indice.anadir(clave, texto_busqueda(inv))
+        self._renumerar()
+
+    def _renumerar(self):
+        self.fila_de = {clave: fila for fila, clave in enumerate(self.claves)}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.invitados)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNAS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return str(self.invitados[index.row()].get(COLUMNAS[index.column()][0], ""))
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(COLUMNAS):
+            return COLUMNAS[section][1]
+        return None
+
+    # ---------- Cambios ----------
+    def reemplazar(self, invitados: List[Dict]):
+        self.beginResetModel()
+        self._cargar(invitados)
+        self.endResetModel()
+
+    def anadir(self, nuevos: Iterable[Dict]):
+        nuevos = list(nuevos)
+        if not nuevos:
+            return
+        inicio = len(self.invitados)
+        self.beginInsertRows(QModelIndex(), inicio, inicio + len(nuevos) - 1)
+        for inv in nuevos:
+            clave = self._siguiente
+            self._siguiente += 1
+            self.invitados.append(inv)
+            self.claves.append(clave)
+            self.fila_de[clave] = len(self.claves) - 1
+            self.indice.anadir(clave, texto_busqueda(inv))
+        self.endInsertRows()
+
+    def actualizar(self, fila: int, datos: Dict):
+        self.invitados[fila].update(datos)
+        self.indice.anadir(self.claves[fila], texto_busqueda(self.invitados[fila]))
+        self.dataChanged.emit(self.index(fila, 0), self.index(fila, len(COLUMNAS) - 1))
+
+    def eliminar(self, filas: Iterable[int]):
+        # De abajo arriba y por tramos contiguos: una señal por tramo
+        filas = sorted(set(filas), reverse=True)
+        while filas:
+            fin = inicio = filas.pop(0)
+            while filas and filas[0] == inicio - 1:
+                inicio = filas.pop(0)
+            self.beginRemoveRows(QModelIndex(), inicio, fin)
+            for clave in self.claves[inicio:fin + 1]:
+                self.indice.quitar(clave)
+            del self.invitados[inicio:fin + 1]
+            del self.claves[inicio:fin + 1]
+            self.endRemoveRows()
+        self._renumerar()
+
+
+class FiltroInvitados(QAbstractProxyModel):
+    # Búsqueda por nombre y apellido (sin mayúsculas ni tildes). El proxy es
+    # la lista ordenada de filas del modelo que coinciden: filtrar cuesta lo
+    # que el índice y no una llamada por fila como un QSortFilterProxyModel.
+    # Las filas editadas se vuelven a comprobar: entran o salen de la vista.
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.texto = ""
+        self._filas: List[int] = []
+
+    def setSourceModel(self, modelo: ModeloInvitados):
+        self.beginResetModel()
+        super().setSourceModel(modelo)
+        modelo.rowsInserted.connect(self._filas_insertadas)
+        modelo.rowsAboutToBeRemoved.connect(self._filas_a_quitar)
+        modelo.rowsRemoved.connect(self._filas_quitadas)
+        modelo.dataChanged.connect(self._datos_cambiados)
+        modelo.modelAboutToBeReset.connect(self.beginResetModel)
+        modelo.modelReset.connect(self._modelo_reiniciado)
+        self._filas = self._coincidencias()
+        self.endResetModel()
+
+    def _coincidencias(self) -> List[int]:
+        modelo = self.sourceModel()
+        claves = modelo.indice.buscar(self.texto)
+        if claves is None:
+            return list(range(modelo.rowCount()))
+        fila_de = modelo.fila_de
+        return sorted(fila_de[c] for c in claves)
+
+    def set_texto(self, texto: str):
+        texto = normalizar_busqueda(texto)
+        if texto == self.texto:
+            return
+        self.texto = texto
+        # Cambio de disposición (no reset) para conservar la selección de las
+        # filas que sigan a la vista
+        self.layoutAboutToBeChanged.emit()
+        persistentes = self.persistentIndexList()
+        origen = [self.mapToSource(i) for i in persistentes]
+        self._filas = self._coincidencias()
+        self.changePersistentIndexList(persistentes, [self.mapFromSource(i) for i in origen])
+        self.layoutChanged.emit()
+
+    # ---------- Correspondencia de filas ----------
+    def index(self, fila, columna, padre=QModelIndex()):
+        if padre.isValid() or not (0 <= fila < len(self._filas)) or not (0 <= columna < self.columnCount()):
+            return QModelIndex()
+        return self.createIndex(fila, columna)
+
+    def parent(self, index=None):
+        if index is None:  # QObject.parent()
+            return super().parent()
+        return QModelIndex()
+
+    def rowCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else len(self._filas)
+
+    def columnCount(self, padre=QModelIndex()):
+        return 0 if padre.isValid() else len(COLUMNAS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            return self.sourceModel().headerData(section, orientation, role)
+        return super().headerData(section, orientation, role)
+
+    def mapToSource(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._filas[index.row()], index.column())
+
+    def mapFromSource(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        pos = bisect_left(self._filas, index.row())
+        if pos < len(self._filas) and self._filas[pos] == index.row():
+            return self.createIndex(pos, index.column())
+        return QModelIndex()
+
+    # ---------- Cambios del modelo ----------
+    def _coincide(self, fila: int) -> bool:
+        modelo = self.sourceModel()
+        return self.texto in modelo.indice.textos[modelo.claves[fila]]
+
+    def _filas_insertadas(self, padre, primera, ultima):
+        n = ultima - primera + 1
+        pos = bisect_left(self._filas, primera)
+        self._filas[pos:] = [f + n for f in self._filas[pos:]]
+        nuevas = [f for f in range(primera, ultima + 1) if self._coincide(f)]
+        if nuevas:
+            self.beginInsertRows(QModelIndex(), pos, pos + len(nuevas) - 1)
+            self._filas[pos:pos] = nuevas
+            self.endInsertRows()
+
+    def _filas_a_quitar(self, padre, primera, ultima):
+        desde = bisect_left(self._filas, primera)
+        hasta = bisect_right(self._filas, ultima)
+        if hasta > desde:
+            self.beginRemoveRows(QModelIndex(), desde, hasta - 1)
+            del self._filas[desde:hasta]
+            self.endRemoveRows()
+
+    def _filas_quitadas(self, padre, primera, ultima):
+        n = ultima - primera + 1
+        pos = bisect_left(self._filas, primera)
+        self._filas[pos:] = [f - n for f in self._filas[pos:]]
+
+    def _datos_cambiados(self, arriba, abajo, roles=()):
+        # Cada fila editada se vuelve a comprobar contra la búsqueda (el
+        # índice ya tiene su texto nuevo): sale, entra o solo se repinta
+        for fila in range(arriba.row(), abajo.row() + 1):
+            pos = bisect_left(self._filas, fila)
+            visible = pos < len(self._filas) and self._filas[pos] == fila
+            coincide = self._coincide(fila)
+            if visible and not coincide:
+                self.beginRemoveRows(QModelIndex(), pos, pos)
+                del self._filas[pos]
+                self.endRemoveRows()
+            elif coincide and not visible:
+                self.beginInsertRows(QModelIndex(), pos, pos)
+                self._filas.insert(pos, fila)
+                self.endInsertRows()
+            elif visible:
+                self.dataChanged.emit(self.index(pos, arriba.column()),
+                                      self.index(pos, abajo.column()), roles)
+
+    def _modelo_reiniciado(self):
+        self._filas = self._coincidencias()
+        self.endResetModel()
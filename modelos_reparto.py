@@ -0,0 +1,137 @@
+# modelos_reparto.py
+# Modelos de Qt de la ventana de reparto (algoritmo.Main): invitados sin
+# asiento y lista de mesas. Mover a un invitado avisa solo de las filas
+# afectadas, y la ocupación de cada mesa es un contador que se ajusta al
+# sentar o levantar a alguien en vez de recorrer todos los asientos.
+
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QBrush, QColor
+
+from nucleo_mesas import Invitado, Mesa, RegistroInvitados
+
+COLOR_CONFLICTO = QBrush(QColor("#d0021b"))
+
+
+def asiento_ocupado(inv: Optional[Invitado]) -> bool:
+    return bool(inv and (inv.nombre or "").strip())
+
+
+class ModeloPool(QAbstractTableModel):
+    # Trabaja sobre la lista de ids de Main.pool (no la copia). fila_de da la
+    # fila de cada id para quitar sin recorrer la lista.
+    CABECERAS = ("Nombre", "Estado")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool: List[int] = []
+        self.fila_de: Dict[int, int] = {}
+        self.registro: Optional[RegistroInvitados] = None
+
+    def reemplazar(self, pool: List[int], registro: RegistroInvitados):
+        self.beginResetModel()
+        self.pool = pool
+        self.fila_de = {id_invitado: fila for fila, id_invitado in enumerate(pool)}
+        self.registro = registro
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.pool)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.CABECERAS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        id_invitado = self.pool[index.row()]
+        if role == Qt.UserRole:
+            return id_invitado
+        if role == Qt.DisplayRole:
+            return self.registro[id_invitado].nombre if index.column() == 0 else "ok"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.CABECERAS):
+            return self.CABECERAS[section]
+        return None
+
+    def anadir(self, id_invitado: int):
+        if id_invitado in self.fila_de:
+            return
+        fila = len(self.pool)
+        self.beginInsertRows(QModelIndex(), fila, fila)
+        self.pool.append(id_invitado)
+        self.fila_de[id_invitado] = fila
+        self.endInsertRows()
+
+    def quitar(self, id_invitado: int):
+        # El último de la lista ocupa la fila que queda libre: se avisa de esa
+        # fila y de la última en vez de desplazar todas las siguientes
+        fila = self.fila_de.pop(id_invitado, None)
+        if fila is None:
+            return
+        ultima = len(self.pool) - 1
+        if fila != ultima:
+            movido = self.pool[ultima]
+            self.pool[fila] = movido
+            self.fila_de[movido] = fila
+            self.dataChanged.emit(self.index(fila, 0), self.index(fila, len(self.CABECERAS) - 1))
+        self.beginRemoveRows(QModelIndex(), ultima, ultima)
+        self.pool.pop()
+        self.endRemoveRows()
+
+
+class ModeloMesas(QAbstractTableModel):
+    CABECERAS = ("Mesa", "Capacidad")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mesas: List[Mesa] = []
+        self.ocupados: List[int] = []
+        self.con_conflicto: List[bool] = []
+
+    def reemplazar(self, mesas: List[Mesa], estados: List[List[str]]):
+        # Único recorrido de todos los asientos: al cargar un reparto
+        self.beginResetModel()
+        self.mesas = mesas
+        self.ocupados = [sum(1 for inv in mesa.invitados if asiento_ocupado(inv)) for mesa in mesas]
+        self.con_conflicto = ["conflicto" in e for e in estados]
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.mesas)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.CABECERAS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        fila, col = index.row(), index.column()
+        mesa = self.mesas[fila]
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return mesa.nombMesa or f"Mesa {mesa.mesa_id}"
+            return f"{self.ocupados[fila]}/{mesa.numAsientos}"
+        if role == Qt.ForegroundRole and col == 0 and self.con_conflicto[fila]:
+            return COLOR_CONFLICTO
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self.CABECERAS):
+            return self.CABECERAS[section]
+        return None
+
+    def cambiar_ocupados(self, fila: int, delta: int):
+        self.ocupados[fila] += delta
+        indice = self.index(fila, 1)
+        self.dataChanged.emit(indice, indice, [Qt.DisplayRole])
+
+    def set_estados(self, fila: int, estados: List[str]):
+        conflicto = "conflicto" in estados
+        if conflicto != self.con_conflicto[fila]:
+            self.con_conflicto[fila] = conflicto
+            indice = self.index(fila, 0)
+            self.dataChanged.emit(indice, indice, [Qt.ForegroundRole])
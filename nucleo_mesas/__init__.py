@@ -0,0 +1,52 @@
+"""Núcleo del reparto de mesas, sin dependencias de Qt.
+
+Modelo (invitados, mesas, evento), preferencias, motores de reparto
+(CP-SAT y heurístico), detección de conflictos, CSV y búsqueda por nombre.
+Los submódulos se importan al pedir el primer nombre que contienen (leer el
+CSV de invitados no carga el solver) y OR-Tools solo al resolver con el
+motor CP-SAT.
+"""
+import importlib
+
+_CONTENIDO = {
+    "modelo": (
+        "AsientosMesa", "Evento", "Invitado", "Mesa", "RegistroInvitados",
+        "clave_invitado", "crear_evento", "crear_invitado", "crear_mesa",
+    ),
+    "preferencias": (
+        "agrupar_amigos", "componentes_conexas", "enemigos_en_mismo_grupo", "enlaces_entre_grupos",
+        "grupos_demasiado_grandes", "resolver_preferencias",
+    ),
+    "conflictos": (
+        "IndiceEnemigos", "calcular_estados_conflicto", "calidad_reparto",
+        "estados_conflicto_evento",
+    ),
+    "solver": (
+        "FORMULACIONES", "MESAS_POR_SUBPROBLEMA", "MODOS_ENLACE", "MOTORES", "PESO_AMIGO",
+        "PESO_ENEMIGO", "PESO_MOVER", "TAMANO_MESA_MINIMO", "ConfigSolver", "asignar_mesas",
+        "cargar_cpsat", "construir_modelo", "dividir_en_subproblemas", "evento_desde_asignacion",
+        "invitados_sin_sentar", "mesas_necesarias", "tamano_mesa_por_defecto",
+    ),
+    "csv_io": (
+        "CAMPOS_INVITADO", "CSV_MAP", "cargar_evento_desde_csv_mesas", "guardar_evento_csv_mesas",
+        "invitados_desde_filas", "leer_invitados_csv", "normalizar_cabeceras", "ruta_csv_mesas",
+    ),
+    "busqueda": ("IndiceBusqueda", "normalizar_busqueda"),
+}
+
+_MODULO_DE = {nombre: modulo for modulo, nombres in _CONTENIDO.items() for nombre in nombres}
+
+__all__ = list(_MODULO_DE)
+
+
+def __getattr__(nombre):
+    modulo = _MODULO_DE.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    valor = getattr(importlib.import_module(f".{modulo}", __name__), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,78 @@
+"""Búsqueda de invitados por nombre, sin dependencias de Qt.
+
+Cada texto se normaliza una sola vez al indexarlo (minúsculas y sin tildes:
+"lucia" encuentra "Lucía") y se reparte en trigramas. Una consulta de tres o
+más caracteres cruza las listas de sus trigramas y solo comprueba esos
+candidatos; las más cortas recorren los textos ya normalizados. Si la
+consulta contiene a la anterior (se ha seguido escribiendo), se filtra el
+resultado anterior en vez de buscar de cero.
+"""
+import unicodedata
+from typing import Dict, Hashable, Optional, Set
+
+
+def normalizar_busqueda(texto: str) -> str:
+    texto = unicodedata.normalize("NFKD", texto or "")
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(texto.casefold().split())
+
+
+def _trigramas(texto: str) -> Set[str]:
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceBusqueda:
+    def __init__(self):
+        self.textos: Dict[Hashable, str] = {}
+        self._trigramas: Dict[str, Set[Hashable]] = {}
+        # Última búsqueda, para afinarla si la consulta solo crece
+        self._ultima: Optional[str] = None
+        self._resultado: Set[Hashable] = set()
+
+    def __len__(self):
+        return len(self.textos)
+
+    def anadir(self, clave: Hashable, texto: str):
+        if clave in self.textos:
+            self.quitar(clave)
+        norm = normalizar_busqueda(texto)
+        self.textos[clave] = norm
+        for tri in _trigramas(norm):
+            self._trigramas.setdefault(tri, set()).add(clave)
+        if self._ultima is not None and self._ultima in norm:
+            self._resultado.add(clave)
+
+    def quitar(self, clave: Hashable):
+        norm = self.textos.pop(clave, None)
+        if norm is None:
+            return
+        for tri in _trigramas(norm):
+            claves = self._trigramas.get(tri)
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._trigramas[tri]
+        self._resultado.discard(clave)
+
+    def vaciar(self):
+        self.textos.clear()
+        self._trigramas.clear()
+        self._ultima = None
+        self._resultado = set()
+
+    def buscar(self, consulta: str) -> Optional[Set[Hashable]]:
+        """Claves cuyo texto contiene la consulta; None si la consulta está vacía."""
+        q = normalizar_busqueda(consulta)
+        if not q:
+            return None
+        if self._ultima is not None and self._ultima in q:
+            candidatas = self._resultado
+        elif len(q) >= 3:
+            listas = sorted((self._trigramas.get(tri, ()) for tri in _trigramas(q)), key=len)
+            candidatas = set(listas[0]).intersection(*listas[1:])
+        else:
+            candidatas = self.textos
+        textos = self.textos
+        self._resultado = {c for c in candidatas if q in textos[c]}
+        self._ultima = q
+        return self._resultado
@@ -0,0 +1,94 @@
+# nucleo_mesas/conflictos.py
+# Detección de enemigos sentados a la misma mesa.
+
+from typing import Dict, List, Optional, Set
+
+from .modelo import Evento, Invitado, Mesa
+
+
+class IndiceEnemigos:
+    # id -> ids con los que no puede sentarse, en ambos sentidos (basta con
+    # que uno de los dos lo declare). Se construye una vez por evento y se
+    # actualiza al editar a un invitado.
+    def __init__(self, invitados=()):
+        self._declarados: Dict[int, Set[int]] = {}
+        self._enemigos: Dict[int, Set[int]] = {}
+        for inv in invitados:
+            self.actualizar_invitado(inv)
+
+    @classmethod
+    def desde_evento(cls, evento: Evento) -> "IndiceEnemigos":
+        return cls(inv for mesa in evento.mesas for inv in mesa.invitados or [] if inv)
+
+    def enemigos(self, id_invitado: int) -> Set[int]:
+        return self._enemigos.get(id_invitado, set())
+
+    def actualizar_invitado(self, inv: Invitado):
+        """(Re)indexa los enemigos de un invitado nuevo o editado."""
+        if inv is None or inv.id < 0:
+            return
+        nuevos = set(inv.enemigos)
+        antes = self._declarados.get(inv.id, set())
+        for otro in antes - nuevos:
+            if inv.id not in self._declarados.get(otro, ()):
+                self._enemigos[inv.id].discard(otro)
+                self._enemigos[otro].discard(inv.id)
+        for otro in nuevos - antes:
+            self._enemigos.setdefault(inv.id, set()).add(otro)
+            self._enemigos.setdefault(otro, set()).add(inv.id)
+        self._declarados[inv.id] = nuevos
+
+
+def calcular_estados_conflicto(mesa: Mesa, indice: Optional[IndiceEnemigos] = None) -> List[str]:
+    # O(asientos): los enemigos de cada invitado se cruzan con los ids
+    # sentados a la mesa (si no se pasa el índice, se crea solo con esta mesa).
+    if indice is None:
+        indice = IndiceEnemigos(inv for inv in mesa.invitados if inv)
+    registro = mesa.registro
+    sentados = {i for i in mesa.asientos if i >= 0 and (registro.get(i).nombre or "").strip()}
+    estados: List[str] = []
+    for i in mesa.asientos:
+        if i not in sentados:
+            estados.append("vacio")
+        elif indice.enemigos(i).isdisjoint(sentados):
+            estados.append("ok")
+        else:
+            estados.append("conflicto")
+    return estados
+
+
+def estados_conflicto_evento(evento: Evento,
+                             indice: Optional[IndiceEnemigos] = None) -> List[List[str]]:
+    """Estados de conflicto de todas las mesas del evento en una pasada."""
+    if indice is None:
+        indice = IndiceEnemigos.desde_evento(evento)
+    return [calcular_estados_conflicto(mesa, indice) for mesa in evento.mesas]
+
+
+def calidad_reparto(participantes: List[Invitado], evento: Evento, tamano_mesa: int) -> Dict:
+    """Resumen del reparto: preferencias amigo/enemigo cumplidas entre los
+    invitados sentados, mesas usadas, ocupación e invitados sin sentar."""
+    mesa_de: Dict[int, int] = {}
+    for m, mesa in enumerate(evento.mesas):
+        for inv in mesa.invitados:
+            if inv is not None:
+                mesa_de[inv.id] = m
+
+    cuenta = {"amigo": [0, 0], "enemigo": [0, 0]}
+    for inv in participantes:
+        for tipo, otros in (("amigo", inv.amigos), ("enemigo", inv.enemigos)):
+            for otro in otros:
+                if otro in mesa_de and inv.id in mesa_de:
+                    cuenta[tipo][1] += 1
+                    cuenta[tipo][0] += mesa_de[inv.id] == mesa_de[otro]
+
+    usadas = len(set(mesa_de.values()))
+    return {
+        "amigos_ok": cuenta["amigo"][0],
+        "amigos_total": cuenta["amigo"][1],
+        "enemigos_juntos": cuenta["enemigo"][0],
+        "enemigos_total": cuenta["enemigo"][1],
+        "mesas_usadas": usadas,
+        "ocupacion": len(mesa_de) / (usadas * tamano_mesa) if usadas else 0.0,
+        "sin_sentar": sum(1 for inv in participantes if inv.id not in mesa_de),
+    }
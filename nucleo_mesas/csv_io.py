@@ -0,0 +1,178 @@
+# nucleo_mesas/csv_io.py
+# Lectura de la lista de invitados (invitados_<evento>.csv) y lectura y
+# escritura del plan de mesas (mesas_<evento>.csv, separado por ";").
+
+import csv
+import os
+import re
+from typing import Dict, List, Optional
+
+from .modelo import (Evento, Invitado, Mesa, RegistroInvitados, crear_evento, crear_invitado,
+                     crear_mesa)
+from .preferencias import resolver_preferencias
+
+CABECERA_MESAS = ["mesa_id", "mesa_nombre", "asiento", "nombre", "apellido", "rol", "id"]
+
+# Columnas de la lista de invitados y cabeceras alternativas que se aceptan
+CAMPOS_INVITADO = ["nombre", "apellido", "pref_con", "pref_sin"]
+
+CSV_MAP = {
+    "nombre": "nombre",
+    "apellido": "apellido",
+    "prefiere con": "pref_con",
+    "preferencias de con quien estar": "pref_con",
+    "preferencias de con quién estar": "pref_con",
+    "prefiere sin": "pref_sin",
+    "preferencias de con quien no estar": "pref_sin",
+    "preferencias de con quién no estar": "pref_sin",
+}
+
+
+def normalizar_cabeceras(headers: List[str]) -> List[Optional[str]]:
+    norm: List[Optional[str]] = []
+    for h in headers:
+        base = h.strip().lower().lstrip("\ufeff").strip(" ;:,")
+        if base in CAMPOS_INVITADO:
+            norm.append(base)
+        else:
+            norm.append(CSV_MAP.get(base, None))
+    return norm
+
+
+def leer_invitados_csv(ruta: str, delimitador: Optional[str] = None) -> List[Dict]:
+    """Filas de la lista de invitados como dicts con las claves de
+    CAMPOS_INVITADO. Sin `delimitador` se usa "," o ";" según cuál aparezca
+    más en la cabecera."""
+    with open(ruta, newline="", encoding="utf-8-sig") as f:
+        if delimitador is None:
+            cabecera = f.readline()
+            delimitador = ";" if cabecera.count(";") > cabecera.count(",") else ","
+            f.seek(0)
+        rows = list(csv.reader(f, delimiter=delimitador))
+    if not rows:
+        return []
+
+    headers = normalizar_cabeceras(rows[0])
+    invitados: List[Dict] = []
+    for row in rows[1:]:
+        if not any(cell.strip() for cell in row):
+            continue
+        inv = {k: "" for k in CAMPOS_INVITADO}
+        for i, key in enumerate(headers):
+            if key and i < len(row):
+                inv[key] = row[i].strip()
+        invitados.append(inv)
+    return invitados
+
+
+def _separar_nombres(texto: str) -> List[str]:
+    return [p.strip() for p in re.split(r"[|,;/]", texto or "") if p.strip()]
+
+
+def invitados_desde_filas(filas: List[Dict]) -> List[Invitado]:
+    """Convierte las filas de la lista de invitados en Invitado con las
+    preferencias ya resueltas. Se omiten las filas sin nombre."""
+    participantes: List[Invitado] = []
+    for d in filas:
+        nombre = (d.get("nombre") or "").strip()
+        if not nombre:
+            continue
+        # Se guarda el nombre tal cual (con apellido si lo trae): así
+        # resolver_preferencias distingue a dos invitados con el mismo nombre.
+        prefs = [f"amigo:{n}" for n in _separar_nombres(d.get("pref_con"))]
+        prefs += [f"enemigo:{n}" for n in _separar_nombres(d.get("pref_sin"))]
+        participantes.append(crear_invitado(
+            rol=(d.get("rol") or "").strip(),
+            nombre=nombre,
+            apellido=(d.get("apellido") or "").strip(),
+            preferencias=prefs
+        ))
+
+    resolver_preferencias(participantes)
+    return participantes
+
+
+def ruta_csv_mesas(nombre_evento: str, carpeta: str = "") -> str:
+    nombre_base = (nombre_evento or "evento").strip() or "evento"
+    safe = nombre_base.replace(" ", "_")
+    return os.path.abspath(os.path.join(carpeta, f"mesas_{safe}.csv"))
+
+
+def cargar_evento_desde_csv_mesas(nombre_evento: str, fecha: str, ubicacion: str,
+                                  ruta: str) -> Evento:
+    mesas_raw: Dict[int, Dict] = {}
+
+    with open(ruta, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f, delimiter=";")
+        headers = next(reader, None)
+
+        for row in reader:
+            if not row or len(row) < 3:
+                continue
+
+            mesa_id = int(row[0])
+            mesa_nombre = row[1]
+            asiento = int(row[2])
+
+            nombre = row[3] if len(row) > 3 else ""
+            apellido = row[4] if len(row) > 4 else ""
+            rol = row[5] if len(row) > 5 else "invitado"
+            id_txt = row[6].strip() if len(row) > 6 else ""
+
+            data = mesas_raw.setdefault(mesa_id, {
+                "nombre": mesa_nombre,
+                "capacidad": 0,
+                "invitados": {}
+            })
+
+            if asiento > data["capacidad"]:
+                data["capacidad"] = asiento
+
+            if nombre.strip():
+                inv = crear_invitado(
+                    rol=rol.strip() or "invitado",
+                    nombre=nombre.strip(),
+                    apellido=apellido.strip(),
+                    preferencias=[]
+                )
+                if id_txt.lstrip("-").isdigit():
+                    inv.id = int(id_txt)
+                data["invitados"][asiento] = inv
+
+    # Primero los invitados que traen id del CSV, para que los de ficheros
+    # antiguos (sin columna id) no ocupen uno de esos ids al numerarse. Un id
+    # repetido (CSV editado a mano) se trata como ausente.
+    registro = RegistroInvitados()
+    todos = [inv for info in mesas_raw.values() for inv in info["invitados"].values()]
+    for inv in todos:
+        if inv.id >= 0:
+            if inv.id in registro:
+                inv.id = -1
+            else:
+                registro.registrar(inv)
+    mesas: List[Mesa] = []
+    for mid in sorted(mesas_raw.keys()):
+        info = mesas_raw[mid]
+        cap = max(8, info["capacidad"])
+        invitados: List[Optional[Invitado]] = [None] * cap
+        for asiento, inv in info["invitados"].items():
+            idx = asiento - 1
+            if 0 <= idx < cap:
+                invitados[idx] = inv
+        mesas.append(crear_mesa(mid, cap, info["nombre"], invitados, registro))
+
+    return crear_evento(nombre_evento, fecha, ubicacion, mesas, registro)
+
+
+def guardar_evento_csv_mesas(evento: Evento, ruta: str):
+    with open(ruta, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(CABECERA_MESAS)
+        for mesa in evento.mesas:
+            mesa_nombre = mesa.nombMesa or f"Mesa {mesa.mesa_id}"
+            for idx, inv in enumerate(mesa.invitados, start=1):
+                if inv and (inv.nombre or inv.apellido):
+                    writer.writerow([mesa.mesa_id, mesa_nombre, idx,
+                                     inv.nombre, inv.apellido, inv.rol, inv.id])
+                else:
+                    writer.writerow([mesa.mesa_id, mesa_nombre, idx, "", "", "", ""])
@@ -0,0 +1,147 @@
+# nucleo_mesas/heuristica.py
+# Motor de reparto rápido sin OR-Tools: empaquetado voraz de grupos seguido de
+# búsqueda local (mover un grupo / intercambiar dos) sobre la puntuación de
+# amigos y enemigos. Sirve para previsualizar al momento y como respaldo
+# cuando el CP-SAT no encuentra solución a tiempo.
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+def _vecinos(num_grupos: int, enlaces: Dict[str, Dict[Tuple[int, int], int]],
+             peso_amigo: int, peso_enemigo: int) -> List[List[Tuple[int, int]]]:
+    vecinos: List[List[Tuple[int, int]]] = [[] for _ in range(num_grupos)]
+    for tipo, peso in (("amigo", peso_amigo), ("enemigo", -peso_enemigo)):
+        for (k, l), n in enlaces.get(tipo, {}).items():
+            vecinos[k].append((l, peso * n))
+            vecinos[l].append((k, peso * n))
+    return vecinos
+
+
+def puntuacion(asignacion_grupos: List[int], enlaces: Dict[str, Dict[Tuple[int, int], int]],
+               peso_amigo: int, peso_enemigo: int) -> int:
+    total = 0
+    for tipo, peso in (("amigo", peso_amigo), ("enemigo", -peso_enemigo)):
+        for (k, l), n in enlaces.get(tipo, {}).items():
+            if asignacion_grupos[k] == asignacion_grupos[l]:
+                total += peso * n
+    return total
+
+
+def resolver(tamanos: List[int], enlaces: Dict[str, Dict[Tuple[int, int], int]],
+             tamano_mesa: int, num_mesas: int,
+             peso_amigo: int, peso_enemigo: int,
+             previas: Optional[List[Optional[int]]] = None,
+             fijas: Optional[List[bool]] = None, peso_mover: int = 0,
+             tiempo_limite: float = 1.0) -> List[int]:
+    """Devuelve la mesa (0..) de cada grupo.
+
+    `tamanos[k]` es el número de invitados del grupo k. Si los grupos no
+    caben en `num_mesas` se abren mesas adicionales al final.
+    """
+    inicio = time.perf_counter()
+    num_grupos = len(tamanos)
+    vecinos = _vecinos(num_grupos, enlaces, peso_amigo, peso_enemigo)
+    mesa: List[int] = [-1] * num_grupos
+    libres: List[int] = [tamano_mesa] * num_mesas
+
+    def previa(k: int) -> Optional[int]:
+        if previas is None or previas[k] is None or previas[k] >= len(libres):
+            return None
+        return previas[k]
+
+    def afinidad(k: int) -> Dict[int, int]:
+        # Puntuación que ganaría el grupo k en cada mesa donde tiene vecinos
+        # (o su mesa previa); en el resto de mesas la puntuación es 0.
+        por_mesa: Dict[int, int] = {}
+        for l, w in vecinos[k]:
+            m = mesa[l]
+            if m >= 0:
+                por_mesa[m] = por_mesa.get(m, 0) + w
+        p = previa(k)
+        if p is not None:
+            por_mesa[p] = por_mesa.get(p, 0) + peso_mover * tamanos[k]
+        return por_mesa
+
+    def colocar(k: int, m: int):
+        mesa[k] = m
+        libres[m] -= tamanos[k]
+
+    # 1) Voraz: los grupos fijos en su mesa previa, luego el resto de mayor a
+    #    menor, cada uno en la mesa con más afinidad donde quepa (a igualdad,
+    #    la más llena, para no fragmentar huecos).
+    for k in range(num_grupos):
+        p = previa(k)
+        if fijas and fijas[k] and p is not None:
+            colocar(k, p)
+
+    orden = sorted((k for k in range(num_grupos) if mesa[k] < 0), key=lambda k: -tamanos[k])
+    for k in orden:
+        por_mesa = afinidad(k)
+        mejor, mejor_clave = None, None
+        for m in range(len(libres)):
+            if libres[m] < tamanos[k]:
+                continue
+            clave = (por_mesa.get(m, 0), -libres[m])
+            if mejor_clave is None or clave > mejor_clave:
+                mejor, mejor_clave = m, clave
+        if mejor is None:
+            libres.append(tamano_mesa)
+            mejor = len(libres) - 1
+        colocar(k, mejor)
+
+    # 2) Búsqueda local: mejor movimiento o intercambio que mejore, hasta
+    #    llegar a un óptimo local o agotar el tiempo.
+    movibles = [k for k in range(num_grupos) if not (fijas and fijas[k] and previa(k) is not None)]
+    mejora = True
+    while mejora and time.perf_counter() - inicio < tiempo_limite:
+        mejora = False
+        for k in movibles:
+            actual = mesa[k]
+            por_mesa = afinidad(k)
+            base = por_mesa.get(actual, 0)
+
+            # Mover k a otra mesa con hueco
+            destino, ganancia = None, 0
+            for m, valor in por_mesa.items():
+                if m != actual and libres[m] >= tamanos[k] and valor - base > ganancia:
+                    destino, ganancia = m, valor - base
+            if base < 0 and destino is None:
+                # Está en conflicto y no tiene mesa afín: cualquier mesa neutra vale
+                for m in range(len(libres)):
+                    if m != actual and m not in por_mesa and libres[m] >= tamanos[k]:
+                        destino, ganancia = m, -base
+                        break
+            if destino is not None:
+                libres[actual] += tamanos[k]
+                colocar(k, destino)
+                mejora = True
+                continue
+
+            # Intercambiar k con un grupo l de una mesa afín
+            pesos_k = {}
+            for l, w in vecinos[k]:
+                pesos_k[l] = pesos_k.get(l, 0) + w
+            for m, valor in por_mesa.items():
+                if m == actual or valor - base <= 0:
+                    continue
+                for l in movibles:
+                    if mesa[l] != m or l == k:
+                        continue
+                    if libres[actual] + tamanos[k] < tamanos[l] or libres[m] + tamanos[l] < tamanos[k]:
+                        continue
+                    por_mesa_l = afinidad(l)
+                    delta = (valor + por_mesa_l.get(actual, 0)
+                             - base - por_mesa_l.get(m, 0) - 2 * pesos_k.get(l, 0))
+                    if delta > 0:
+                        libres[actual] += tamanos[k] - tamanos[l]
+                        libres[m] += tamanos[l] - tamanos[k]
+                        mesa[k], mesa[l] = m, actual
+                        mejora = True
+                        break
+                if mesa[k] != actual:
+                    break
+            if time.perf_counter() - inicio >= tiempo_limite:
+                break
+
+    return mesa
@@ -0,0 +1,201 @@
+# nucleo_mesas/modelo.py
+# Modelo de datos del reparto: invitados, mesas (asientos como array de ids)
+# y evento, con el registro que da un id entero a cada invitado.
+
+from array import array
+from typing import List, Optional, Tuple
+
+
+class Invitado:
+    __slots__ = ("rol", "nombre", "apellido", "preferencias", "id", "amigos", "enemigos")
+
+    def __init__(self, rol: str, nombre: str, apellido: str = "", preferencias: Optional[List[str]] = None):
+        self.rol = rol
+        self.nombre = nombre
+        self.apellido = apellido
+        # Forma texto ("amigo:Luis Pérez"), solo para leer/escribir CSV. El
+        # solver y los conflictos usan `amigos`/`enemigos`: ids de invitado
+        # resueltos una vez con resolver_preferencias.
+        self.preferencias = preferencias or []
+        self.id = -1
+        self.amigos: Tuple[int, ...] = ()
+        self.enemigos: Tuple[int, ...] = ()
+
+
+class Mesa:
+    # Los asientos se guardan como array('i') de ids de invitado (-1 = libre)
+    # del registro del evento, que todas sus mesas comparten. `invitados` es
+    # una vista tipo lista con los objetos, para el código que trabaja
+    # asiento a asiento.
+    __slots__ = ("mesa_id", "numAsientos", "nombMesa", "asientos", "registro")
+
+    def __init__(self, mesa_id: int, numAsientos: int, nombMesa: Optional[str] = None,
+                 invitados: Optional[List[Optional[Invitado]]] = None, *,
+                 registro: "RegistroInvitados"):
+        self.mesa_id = mesa_id
+        self.numAsientos = numAsientos
+        self.nombMesa = nombMesa
+        self.registro = registro
+        self.asientos = array("i")
+        self.invitados = invitados or []
+
+    @property
+    def invitados(self) -> "AsientosMesa":
+        return AsientosMesa(self)
+
+    @invitados.setter
+    def invitados(self, invitados):
+        lista = list(invitados)
+        self.asientos = array("i", (self._id_de(inv) for inv in lista))
+
+    def _id_de(self, inv: Optional[Invitado]) -> int:
+        return -1 if inv is None else self.registro.registrar(inv)
+
+    def usar_registro(self, registro: "RegistroInvitados"):
+        """Pasa la mesa al registro del evento; ValueError si algún id choca."""
+        if registro is not self.registro:
+            lista = list(self.invitados)
+            self.registro = registro
+            self.invitados = lista
+
+
+class AsientosMesa:
+    # Vista de Mesa.asientos como lista de Invitado/None: admite índices,
+    # iteración, asignación y `+=`; los cambios van directos al array.
+    __slots__ = ("_mesa",)
+
+    def __init__(self, mesa: Mesa):
+        self._mesa = mesa
+
+    def __len__(self) -> int:
+        return len(self._mesa.asientos)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._objeto(x) for x in self._mesa.asientos[i]]
+        return self._objeto(self._mesa.asientos[i])
+
+    def __setitem__(self, i: int, inv: Optional[Invitado]):
+        self._mesa.asientos[i] = self._mesa._id_de(inv)
+
+    def __iter__(self):
+        return (self._objeto(x) for x in self._mesa.asientos)
+
+    def __iadd__(self, otros):
+        self.extend(otros)
+        return self
+
+    def append(self, inv: Optional[Invitado]):
+        self._mesa.asientos.append(self._mesa._id_de(inv))
+
+    def extend(self, otros):
+        for inv in list(otros):
+            self.append(inv)
+
+    def _objeto(self, id_invitado: int) -> Optional[Invitado]:
+        return None if id_invitado < 0 else self._mesa.registro.get(id_invitado)
+
+
+class RegistroInvitados:
+    # Registro de invitados del evento: id entero denso <-> objeto en O(1).
+    # Los ids identifican al invitado en el solver, la ventana de mesas, el
+    # arrastrar y soltar y el CSV, aunque haya nombres repetidos.
+    __slots__ = ("_por_id", "_n")
+
+    def __init__(self, invitados=()):
+        self._por_id: List[Optional["Invitado"]] = []
+        self._n = 0
+        for inv in invitados:
+            self.registrar(inv)
+
+    @classmethod
+    def numerar(cls, invitados) -> "RegistroInvitados":
+        """Registro nuevo con ids 0..n-1 en el orden de `invitados`."""
+        registro = cls()
+        for inv in invitados:
+            inv.id = -1
+            registro.registrar(inv)
+        return registro
+
+    def registrar(self, inv: "Invitado") -> int:
+        # Respeta el id que ya trae el invitado (p. ej. un subconjunto de otro
+        # registro); si no tiene, recibe el siguiente libre. Un id ocupado por
+        # otro invitado es un error: renumerarlo dejaría apuntando a otra
+        # persona los asientos, amigos y enemigos que ya lo usan.
+        if inv.id < 0:
+            inv.id = len(self._por_id)
+            self._por_id.append(None)
+        elif inv.id >= len(self._por_id):
+            self._por_id.extend([None] * (inv.id + 1 - len(self._por_id)))
+        actual = self._por_id[inv.id]
+        if actual is None:
+            self._por_id[inv.id] = inv
+            self._n += 1
+        elif actual is not inv:
+            raise ValueError(f"el id {inv.id} ya es de otro invitado del registro")
+        return inv.id
+
+    def get(self, id_invitado) -> Optional["Invitado"]:
+        if isinstance(id_invitado, int) and 0 <= id_invitado < len(self._por_id):
+            return self._por_id[id_invitado]
+        return None
+
+    def __getitem__(self, id_invitado: int) -> "Invitado":
+        inv = self.get(id_invitado)
+        if inv is None:
+            raise KeyError(id_invitado)
+        return inv
+
+    def __contains__(self, id_invitado) -> bool:
+        return self.get(id_invitado) is not None
+
+    def __iter__(self):
+        return (inv for inv in self._por_id if inv is not None)
+
+    def __len__(self) -> int:
+        return self._n
+
+
+class Evento:
+    __slots__ = ("nombre", "fecha", "ubicacion", "mesas", "registro")
+
+    def __init__(self, nombre: str, fecha: str, ubicacion: str, mesas: Optional[List[Mesa]] = None,
+                 registro: Optional[RegistroInvitados] = None):
+        self.nombre = nombre
+        self.fecha = fecha
+        self.ubicacion = ubicacion
+        self.mesas = mesas or []
+        self.registro = registro
+
+
+def crear_invitado(rol: str, nombre: str, apellido: str = "", preferencias: Optional[List[str]] = None):
+    return Invitado(rol, nombre, apellido, preferencias)
+
+
+def crear_mesa(mesa_id: int, numAsientos: int, nombMesa: Optional[str] = None,
+               invitados: Optional[List[Optional[Invitado]]] = None,
+               registro: Optional[RegistroInvitados] = None):
+    # Sin registro la mesa abre uno: las demás mesas del evento deben
+    # compartirlo (pasando registro=mesa.registro)
+    inv = list(invitados or [])
+    if len(inv) < numAsientos:
+        inv += [None] * (numAsientos - len(inv))
+    return Mesa(mesa_id, numAsientos, nombMesa, inv,
+                registro=registro if registro is not None else RegistroInvitados())
+
+
+def crear_evento(nombre: str, fecha: str, ubicacion: str, mesas: Optional[List[Mesa]] = None,
+                 registro: Optional[RegistroInvitados] = None):
+    # Todas las mesas comparten el registro del evento (por defecto, el de
+    # la primera mesa)
+    if registro is None:
+        registro = mesas[0].registro if mesas else RegistroInvitados()
+    for m in mesas or []:
+        m.usar_registro(registro)
+    return Evento(nombre, fecha, ubicacion, mesas, registro)
+
+
+def clave_invitado(inv: Invitado) -> tuple:
+    # (nombre, apellido) sin espacios sobrantes: identifica al mismo invitado
+    # en listas o planes distintos, donde los ids no coinciden
+    return ((inv.nombre or "").strip(), (inv.apellido or "").strip())
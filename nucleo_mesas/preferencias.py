@@ -0,0 +1,147 @@
+# nucleo_mesas/preferencias.py
+# Preferencias amigo/enemigo: se resuelven una vez de texto a ids y de ahí
+# salen los grupos de amigos y los enlaces entre grupos que usan los motores.
+
+from typing import Dict, List, Set
+
+from .modelo import Invitado, RegistroInvitados
+
+
+def _split_pref(pref: str):
+    p = (pref or "").strip()
+    lower = p.lower()
+    if lower.startswith("amigo:"):
+        return "amigo", p.split(":", 1)[1].strip()
+    if lower.startswith("enemigo:"):
+        return "enemigo", p.split(":", 1)[1].strip()
+    return None, ""
+
+
+def _clave_nombre(texto: str) -> str:
+    return " ".join((texto or "").split()).lower()
+
+
+def resolver_preferencias(invitados: List[Invitado]) -> RegistroInvitados:
+    """Numera a los invitados (id = posición) y traduce sus preferencias de
+    texto a ids. Se busca primero el nombre completo y, si no, el nombre de
+    pila cuando es único; las referencias ambiguas o desconocidas se ignoran.
+    """
+    registro = RegistroInvitados.numerar(invitados)
+    por_completo: Dict[str, List[int]] = {}
+    por_nombre: Dict[str, List[int]] = {}
+    for i, inv in enumerate(invitados):
+        por_completo.setdefault(_clave_nombre(f"{inv.nombre} {inv.apellido}"), []).append(i)
+        por_nombre.setdefault(_clave_nombre(inv.nombre), []).append(i)
+
+    for inv in invitados:
+        resueltos: Dict[str, Set[int]] = {"amigo": set(), "enemigo": set()}
+        for pref in inv.preferencias or []:
+            t, who = _split_pref(pref)
+            if t is None:
+                continue
+            clave = _clave_nombre(who)
+            candidatos = por_completo.get(clave) or por_nombre.get(clave) or []
+            if len(candidatos) != 1 or candidatos[0] == inv.id:
+                continue
+            resueltos[t].add(candidatos[0])
+        # Tuplas: la vacía es compartida y no ocupa memoria por invitado
+        inv.amigos = tuple(sorted(resueltos["amigo"]))
+        inv.enemigos = tuple(sorted(resueltos["enemigo"]))
+    return registro
+
+
+def _asegurar_preferencias(participantes: List[Invitado]) -> RegistroInvitados:
+    # Si la lista no viene ya numerada (p. ej. invitados creados a mano) se
+    # resuelve aquí; si sí, se respetan los ids aunque sea un subconjunto.
+    ids = {inv.id for inv in participantes}
+    if len(ids) != len(participantes) or -1 in ids:
+        return resolver_preferencias(participantes)
+    return RegistroInvitados(participantes)
+
+
+def _preferencias_por_tipo(inv: Invitado, posicion: Dict[int, int]) -> Dict[str, List[int]]:
+    # Posiciones en `participantes` de los amigos/enemigos de inv que están
+    # entre los participantes.
+    return {
+        "amigo": [posicion[j] for j in inv.amigos if j in posicion],
+        "enemigo": [posicion[j] for j in inv.enemigos if j in posicion],
+    }
+
+
+def _posiciones(participantes: List[Invitado]) -> Dict[int, int]:
+    _asegurar_preferencias(participantes)
+    return {inv.id: i for i, inv in enumerate(participantes)}
+
+
+def _componentes(participantes: List[Invitado], tipos) -> List[List[int]]:
+    padre = list(range(len(participantes)))
+
+    def raiz(i: int) -> int:
+        while padre[i] != i:
+            padre[i] = padre[padre[i]]
+            i = padre[i]
+        return i
+
+    posicion = _posiciones(participantes)
+    for i, inv in enumerate(participantes):
+        prefs = _preferencias_por_tipo(inv, posicion)
+        for tipo in tipos:
+            for a in prefs[tipo]:
+                ri, ra = raiz(i), raiz(a)
+                if ri != ra:
+                    padre[ra] = ri
+
+    grupos: Dict[int, List[int]] = {}
+    for i in range(len(participantes)):
+        grupos.setdefault(raiz(i), []).append(i)
+    return sorted(grupos.values(), key=len, reverse=True)
+
+
+def agrupar_amigos(participantes: List[Invitado]) -> List[List[int]]:
+    # Union-find sobre los enlaces "amigo:": cada grupo resultante debe
+    # sentarse junto, así que el solver trabaja con grupos en vez de personas.
+    # Los grupos grandes primero: así la rotura de simetría de mesas fija
+    # antes las piezas más difíciles de encajar.
+    return _componentes(participantes, ("amigo",))
+
+
+def componentes_conexas(participantes: List[Invitado]) -> List[List[int]]:
+    # Invitados conectados por cualquier preferencia (amigo o enemigo). Dos
+    # componentes distintas no se influyen: se pueden repartir por separado.
+    return _componentes(participantes, ("amigo", "enemigo"))
+
+
+def grupos_demasiado_grandes(participantes: List[Invitado], grupos: List[List[int]],
+                             tamano_mesa: int) -> List[List[Invitado]]:
+    return [[participantes[i] for i in g] for g in grupos if len(g) > tamano_mesa]
+
+
+def enlaces_entre_grupos(participantes: List[Invitado], grupos: List[List[int]]):
+    # Devuelve {"amigo": {(k, l): peso}, "enemigo": {(k, l): peso}} con k < l
+    # índices de grupo. Los enlaces dentro de un mismo grupo no dependen del
+    # reparto y se omiten.
+    posicion = _posiciones(participantes)
+    grupo_de = [0] * len(participantes)
+    for k, g in enumerate(grupos):
+        for i in g:
+            grupo_de[i] = k
+
+    enlaces: Dict[str, Dict[tuple, int]] = {"amigo": {}, "enemigo": {}}
+    for i, inv in enumerate(participantes):
+        for tipo, otros in _preferencias_por_tipo(inv, posicion).items():
+            for j in otros:
+                k, l = grupo_de[i], grupo_de[j]
+                if k == l:
+                    continue
+                par = (min(k, l), max(k, l))
+                enlaces[tipo][par] = enlaces[tipo].get(par, 0) + 1
+    return enlaces
+
+
+def enemigos_en_mismo_grupo(participantes: List[Invitado], grupos: List[List[int]]) -> bool:
+    for g in grupos:
+        ids = {participantes[i].id for i in g}
+        for i in g:
+            if not ids.isdisjoint(participantes[i].enemigos):
+                return True
+    return False
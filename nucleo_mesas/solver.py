@@ -0,0 +1,831 @@
+# nucleo_mesas/solver.py
+# Reparto de invitados en mesas: modelo CP-SAT (OR-Tools se importa al
+# resolver, no al importar el paquete), motor heurístico y resolución por
+# subproblemas independientes.
+
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict, fields, replace
+from math import ceil
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from . import heuristica
+from .modelo import (Evento, Invitado, RegistroInvitados, clave_invitado, crear_evento,
+                     crear_mesa)
+from .preferencias import (
+    _asegurar_preferencias, agrupar_amigos, componentes_conexas, enemigos_en_mismo_grupo,
+    enlaces_entre_grupos, grupos_demasiado_grandes,
+)
+
+if TYPE_CHECKING:
+    from ortools.sat.python import cp_model
+
+
+def _cp_model():
+    from ortools.sat.python import cp_model
+    return cp_model
+
+
+def cargar_cpsat():
+    """Importa OR-Tools en el hilo actual.
+
+    La extensión de OR-Tools (pybind11) guarda el estado de Python del hilo
+    que la importa y lo reutiliza para llamar al callback de soluciones desde
+    los hilos del CP-SAT. Si ese hilo es de un QThreadPool, PyQt destruye su
+    estado al acabar cada tarea y la siguiente resolución en el mismo hilo
+    rompe el intérprete: quien resuelva en un pool de Qt debe llamar a esto
+    antes desde el hilo principal.
+    """
+    _cp_model()
+
+
+FORMULACIONES = ("booleana", "entera")
+MODOS_ENLACE = ("duro", "blando")
+MOTORES = ("cpsat", "heuristico")
+PESO_AMIGO = 1
+PESO_ENEMIGO = 3
+PESO_MOVER = 2
+MESAS_POR_SUBPROBLEMA = 10
+TIEMPO_PLAN_INICIAL = 0.2     # segundos de heurística para el primer reparto
+TAMANO_MESA_MINIMO = 8
+
+
+@dataclass
+class ConfigSolver:
+    # Parámetros del CP-SAT. Se guardan por evento en eventos.json (clave
+    # "solver") para repetir el mismo reparto o exprimir todos los núcleos.
+    workers: int = 0              # 0 = todos los núcleos disponibles
+    semilla: int = 0
+    tiempo_limite: float = 5.0    # segundos
+    log_busqueda: bool = False
+    usar_hints: bool = True
+    gap_relativo: float = 0.0     # 0.05 = parar al 5 % del óptimo
+    determinista: bool = False    # mismo resultado en cada ejecución (más lento)
+    dividir: bool = False         # resolver aparte los grupos sin relación entre sí
+    procesos: int = 0             # procesos para los subproblemas; 0 = uno por núcleo
+
+    @classmethod
+    def desde_dict(cls, datos: Optional[Dict]) -> "ConfigSolver":
+        validos = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (datos or {}).items() if k in validos})
+
+    def a_dict(self) -> Dict:
+        return asdict(self)
+
+    def aplicar(self, solver: "cp_model.CpSolver"):
+        p = solver.parameters
+        p.num_workers = max(0, int(self.workers))
+        p.random_seed = int(self.semilla)
+        p.log_search_progress = bool(self.log_busqueda)
+        p.relative_gap_limit = float(self.gap_relativo)
+        if self.determinista:
+            # Con tiempo determinista y búsqueda intercalada el resultado solo
+            # depende de la semilla y del número de workers, no de la carga.
+            p.max_deterministic_time = float(self.tiempo_limite)
+            p.interleave_search = p.num_workers != 1
+        else:
+            p.max_time_in_seconds = float(self.tiempo_limite)
+
+
+def tamano_mesa_por_defecto(total: int, num_mesas: Optional[int] = None,
+                            minimo: int = TAMANO_MESA_MINIMO) -> int:
+    # Con número de mesas fijado, lo justo para que quepan todos (nunca por
+    # debajo del mínimo); si no, el mínimo.
+    if total > 0 and num_mesas:
+        return max(minimo, ceil(total / num_mesas))
+    return minimo
+
+
+def mesas_necesarias(tamanos: List[int], tamano_mesa: int) -> int:
+    # Cota por first-fit decreasing de las mesas que ocupan unos grupos que
+    # deben sentarse juntos (los que no caben en una mesa cuentan entera).
+    libres: List[int] = []
+    extra = 0
+    for t in sorted(tamanos, reverse=True):
+        if t > tamano_mesa:
+            extra += ceil(t / tamano_mesa)
+            continue
+        for m, hueco in enumerate(libres):
+            if hueco >= t:
+                libres[m] -= t
+                break
+        else:
+            libres.append(tamano_mesa - t)
+    return len(libres) + extra
+
+
+def dividir_en_subproblemas(participantes: List[Invitado], tamano_mesa: int, num_mesas: int,
+                            mesas_por_subproblema: int = MESAS_POR_SUBPROBLEMA):
+    """Agrupa las componentes conexas en subproblemas independientes.
+
+    Devuelve [(indices, mesas), ...]: las componentes se empaquetan (first-fit
+    decreasing) en bloques de hasta `mesas_por_subproblema` mesas y cada
+    bloque recibe las mesas que necesitan sus grupos de amigos más su parte
+    proporcional de las que sobran. Lista vacía si no hay nada que dividir o no alcanzan las mesas.
+    """
+    capacidad = mesas_por_subproblema * tamano_mesa
+    bloques: List[List[int]] = []
+    cargas: List[int] = []
+    for comp in componentes_conexas(participantes):
+        for b, carga in enumerate(cargas):
+            if carga + len(comp) <= capacidad:
+                bloques[b].extend(comp)
+                cargas[b] += len(comp)
+                break
+        else:
+            bloques.append(list(comp))
+            cargas.append(len(comp))
+
+    if len(bloques) < 2:
+        return []
+    tamano_grupo = [0] * len(participantes)
+    for g in agrupar_amigos(participantes):
+        tamano_grupo[g[0]] = len(g)
+    minimas = [mesas_necesarias([tamano_grupo[i] for i in b if tamano_grupo[i]], tamano_mesa)
+               for b in bloques]
+    sobran = num_mesas - sum(minimas)
+    if sobran < 0:
+        return []
+
+    # Reparto de las mesas sobrantes por el método del resto mayor
+    total = sum(cargas)
+    cuotas = [sobran * c / total for c in cargas]
+    extra = [int(q) for q in cuotas]
+    por_resto = sorted(range(len(bloques)), key=lambda b: cuotas[b] - extra[b], reverse=True)
+    for b in por_resto[:sobran - sum(extra)]:
+        extra[b] += 1
+    return [(sorted(bloque), m + e) for bloque, m, e in zip(bloques, minimas, extra)]
+
+
+def _reparto_inicial(grupos: List[List[int]], tamano_mesa: int, num_mesas: int,
+                     previas: Optional[List[Optional[int]]] = None) -> List[Optional[int]]:
+    # First-fit por orden de grupo: da al solver una solución de partida
+    # (hint) para que tenga un reparto válido desde el primer instante.
+    # Respeta la rotura de simetría porque el grupo k abre como mucho la mesa k.
+    # Con `previas` los grupos ya sentados conservan su mesa y solo se
+    # reparten los demás en los huecos que quedan.
+    libres = [tamano_mesa] * num_mesas
+    reparto: List[Optional[int]] = [None] * len(grupos)
+    for k, g in enumerate(grupos):
+        if previas and previas[k] is not None:
+            reparto[k] = previas[k]
+            libres[previas[k]] -= len(g)
+    for k, g in enumerate(grupos):
+        if reparto[k] is not None:
+            continue
+        destino = next((m for m in range(num_mesas) if libres[m] >= len(g)), None)
+        if destino is not None:
+            libres[destino] -= len(g)
+        reparto[k] = destino
+    return reparto
+
+
+def _hint(grupos: List[List[int]], tamano_mesa: int, num_mesas: int,
+          previas: Optional[List[Optional[int]]], usar_hints: bool,
+          inicial: Optional[List[Optional[int]]]) -> List[Optional[int]]:
+    # Reparto que se sugiere al solver: el que se pasa (p. ej. el de la
+    # heurística) o, si no, el first-fit
+    if not usar_hints:
+        return []
+    if inicial is not None:
+        return inicial
+    return _reparto_inicial(grupos, tamano_mesa, num_mesas, previas)
+
+
+def _modelo_entero(grupos: List[List[int]], tamano_mesa: int, num_mesas: int,
+                   enlaces, amigos: str, enemigos: str, peso_amigo: int, peso_enemigo: int,
+                   usar_hints: bool = True, previas: Optional[List[Optional[int]]] = None,
+                   fijas: Optional[List[bool]] = None, peso_mover: int = PESO_MOVER,
+                   inicial: Optional[List[Optional[int]]] = None):
+    # Formulación original: una variable entera por grupo y un booleano
+    # reificado por cada par (grupo, mesa) para contar la capacidad.
+    cp_model = _cp_model()
+    model = cp_model.CpModel()
+    mesa_var = [model.NewIntVar(0, num_mesas - 1, f"g{k}") for k in range(len(grupos))]
+    # Hint de la mesa de cada grupo y, si el first-fit coloca a todos, de
+    # todos los booleanos auxiliares (hint completo)
+    parcial = _hint(grupos, tamano_mesa, num_mesas, previas, usar_hints, inicial)
+    for k, m in enumerate(parcial):
+        if m is not None:
+            model.AddHint(mesa_var[k], m)
+    inicial = parcial if None not in parcial else []
+
+    for m in range(num_mesas):
+        ocupacion = []
+        for k, g in enumerate(grupos):
+            b = model.NewBoolVar(f"g{k}_en_mesa_{m}")
+            model.Add(mesa_var[k] == m).OnlyEnforceIf(b)
+            model.Add(mesa_var[k] != m).OnlyEnforceIf(b.Not())
+            if inicial:
+                model.AddHint(b, inicial[k] == m)
+            ocupacion.append(len(g) * b)
+        model.Add(sum(ocupacion) <= tamano_mesa)
+
+    objetivo = []
+    for k, m in enumerate(previas or []):
+        if m is None:
+            continue
+        if fijas and fijas[k]:
+            model.Add(mesa_var[k] == m)
+            continue
+        sigue = model.NewBoolVar(f"sigue_{k}")
+        model.Add(mesa_var[k] == m).OnlyEnforceIf(sigue)
+        if inicial:
+            model.AddHint(sigue, inicial[k] == m)
+        objetivo.append(peso_mover * len(grupos[k]) * sigue)
+
+    for tipo, modo, peso in (("amigo", amigos, peso_amigo), ("enemigo", enemigos, -peso_enemigo)):
+        for (k, l), n in enlaces[tipo].items():
+            if modo == "duro":
+                if tipo == "amigo":
+                    model.Add(mesa_var[k] == mesa_var[l])
+                else:
+                    model.Add(mesa_var[k] != mesa_var[l])
+                continue
+            juntos = model.NewBoolVar(f"{tipo}_{k}_{l}")
+            model.Add(mesa_var[k] == mesa_var[l]).OnlyEnforceIf(juntos)
+            model.Add(mesa_var[k] != mesa_var[l]).OnlyEnforceIf(juntos.Not())
+            if inicial:
+                model.AddHint(juntos, inicial[k] == inicial[l])
+            objetivo.append(peso * n * juntos)
+    if objetivo:
+        model.Maximize(sum(objetivo))
+
+    def extraer(solver: "cp_model.CpSolver") -> List[int]:
+        return [solver.Value(v) for v in mesa_var]
+
+    return model, extraer
+
+
+def _modelo_booleano(grupos: List[List[int]], tamano_mesa: int, num_mesas: int,
+                     enlaces, amigos: str, enemigos: str, peso_amigo: int, peso_enemigo: int,
+                     usar_hints: bool = True, previas: Optional[List[Optional[int]]] = None,
+                     fijas: Optional[List[bool]] = None, peso_mover: int = PESO_MOVER,
+                     inicial: Optional[List[Optional[int]]] = None):
+    # x[k, m] == 1 si el grupo k se sienta en la mesa m. Cada grupo en
+    # exactamente una mesa y capacidad lineal ponderada por tamaño de grupo.
+    # Las mesas son intercambiables: el grupo k solo puede ocupar las
+    # mesas 0..k, lo que rompe la simetría y evita crear variables inútiles.
+    # Al partir de un plan previo las mesas ya no son intercambiables y esa
+    # rotura de simetría se desactiva.
+    cp_model = _cp_model()
+    model = cp_model.CpModel()
+    x: Dict[tuple, "cp_model.IntVar"] = {}
+    por_mesa: List[List] = [[] for _ in range(num_mesas)]
+
+    def mesas_de(k: int) -> range:
+        return range(num_mesas) if previas else range(min(k + 1, num_mesas))
+
+    for k, g in enumerate(grupos):
+        fila = []
+        for m in mesas_de(k):
+            b = model.NewBoolVar(f"x_{k}_{m}")
+            x[k, m] = b
+            fila.append(b)
+            por_mesa[m].append(len(g) * b)
+        model.AddExactlyOne(fila)
+
+    for m in range(num_mesas):
+        if por_mesa[m]:
+            model.Add(sum(por_mesa[m]) <= tamano_mesa)
+
+    # Hint completo (también los literales de los enlaces blandos, si el
+    # first-fit coloca a todos): si solo se sugieren las x, el CP-SAT no
+    # siempre reconstruye el resto y en eventos grandes puede acabar sin
+    # ninguna solución.
+    parcial = _hint(grupos, tamano_mesa, num_mesas, previas, usar_hints, inicial)
+    for k, destino in enumerate(parcial):
+        if destino is not None:
+            for m in mesas_de(k):
+                model.AddHint(x[k, m], m == destino)
+    inicial = parcial if None not in parcial else []
+
+    # Cada enlace blando usa un único booleano (no uno por mesa) ligado a
+    # las x[·, m] mediante cláusulas, igual de baratas que las de un enlace
+    # duro: el modelo no crece con el número de mesas.
+    objetivo = []
+    for k, m in enumerate(previas or []):
+        if m is None:
+            continue
+        if fijas and fijas[k]:
+            model.Add(x[k, m] == 1)
+        else:
+            objetivo.append(peso_mover * len(grupos[k]) * x[k, m])
+
+    for (k, l), n in enlaces["amigo"].items():
+        juntos = None
+        if amigos == "blando":
+            juntos = model.NewBoolVar(f"amigo_{k}_{l}")
+            objetivo.append(peso_amigo * n * juntos)
+            if inicial:
+                model.AddHint(juntos, inicial[k] == inicial[l])
+        for m in range(num_mesas):
+            xk, xl = x.get((k, m)), x.get((l, m))
+            if xk is None and xl is None:
+                continue
+            # Si el otro grupo no puede usar la mesa m, el enlace exige que
+            # este tampoco la use.
+            for a, b in ((xk, xl), (xl, xk)):
+                if a is None:
+                    continue
+                clausula = [a.Not()] if b is None else [a.Not(), b]
+                if juntos is not None:
+                    clausula.append(juntos.Not())
+                model.AddBoolOr(clausula)
+
+    for (k, l), n in enlaces["enemigo"].items():
+        choque = None
+        if enemigos == "blando":
+            choque = model.NewBoolVar(f"enemigo_{k}_{l}")
+            objetivo.append(-peso_enemigo * n * choque)
+            if inicial:
+                model.AddHint(choque, inicial[k] == inicial[l])
+        for m in mesas_de(min(k, l)):
+            clausula = [x[k, m].Not(), x[l, m].Not()]
+            if choque is not None:
+                clausula.append(choque)
+            model.AddBoolOr(clausula)
+
+    if objetivo:
+        model.Maximize(sum(objetivo))
+
+    def extraer(solver: "cp_model.CpSolver") -> List[int]:
+        asignacion = []
+        for k in range(len(grupos)):
+            for m in mesas_de(k):
+                if solver.BooleanValue(x[k, m]):
+                    asignacion.append(m)
+                    break
+        return asignacion
+
+    return model, extraer
+
+
+def construir_modelo(participantes: List[Invitado], tamano_mesa: int, num_mesas: int,
+                     formulacion: str = "booleana", grupos: Optional[List[List[int]]] = None,
+                     amigos: str = "duro", enemigos: str = "blando",
+                     peso_amigo: int = PESO_AMIGO, peso_enemigo: int = PESO_ENEMIGO,
+                     usar_hints: bool = True, previas: Optional[List[Optional[int]]] = None,
+                     fijas: Optional[List[bool]] = None, peso_mover: int = PESO_MOVER,
+                     inicial: Optional[List[Optional[int]]] = None):
+    """Devuelve (model, extraer); extraer(solver) da la mesa de cada participante.
+
+    `previas[k]` es la mesa que ocupaba el grupo k en un plan anterior (o
+    None); quedarse en ella suma `peso_mover` por invitado y, si `fijas[k]`,
+    es obligatorio. `inicial[k]` es la mesa que se sugiere al solver para el
+    grupo k (por defecto, un first-fit).
+    """
+    for modo in (amigos, enemigos):
+        if modo not in MODOS_ENLACE:
+            raise ValueError(f"Modo de enlace desconocido: {modo!r} (usa uno de {MODOS_ENLACE})")
+    if grupos is None:
+        if amigos == "duro":
+            grupos = agrupar_amigos(participantes)
+        else:
+            grupos = [[i] for i in range(len(participantes))]
+    enlaces = enlaces_entre_grupos(participantes, grupos)
+
+    if formulacion == "booleana":
+        constructor = _modelo_booleano
+    elif formulacion == "entera":
+        constructor = _modelo_entero
+    else:
+        raise ValueError(f"Formulación desconocida: {formulacion!r} (usa una de {FORMULACIONES})")
+    model, extraer_grupos = constructor(grupos, tamano_mesa, num_mesas, enlaces,
+                                        amigos, enemigos, peso_amigo, peso_enemigo, usar_hints,
+                                        previas, fijas, peso_mover, inicial)
+
+    def extraer(solver: "cp_model.CpSolver") -> List[int]:
+        asignacion = [0] * len(participantes)
+        for g, m in zip(grupos, extraer_grupos(solver)):
+            for i in g:
+                asignacion[i] = m
+        return asignacion
+
+    return model, extraer
+
+
+def _asientos_previos(participantes: List[Invitado], plan: Evento, num_mesas: int) -> List[Optional[tuple]]:
+    # (mesa, asiento) de cada participante en el plan previo, por nombre y
+    # apellido; si el plan no trae apellido se admite el nombre cuando es único.
+    por_clave: Dict[tuple, tuple] = {}
+    por_nombre: Dict[str, Optional[tuple]] = {}
+    for m_idx, mesa in enumerate(plan.mesas[:num_mesas]):
+        for pos, inv in enumerate(mesa.invitados):
+            if not inv or not (inv.nombre or "").strip():
+                continue
+            clave = clave_invitado(inv)
+            por_clave[clave] = (m_idx, pos)
+            por_nombre[clave[0]] = None if clave[0] in por_nombre else (m_idx, pos)
+
+    asientos = []
+    for inv in participantes:
+        clave = clave_invitado(inv)
+        asientos.append(por_clave.get(clave) or por_nombre.get(clave[0]))
+    return asientos
+
+
+def invitados_sin_sentar(participantes: List[Invitado], plan: Evento) -> List[Invitado]:
+    previos = _asientos_previos(participantes, plan, len(plan.mesas))
+    return [inv for inv, asiento in zip(participantes, previos) if asiento is None]
+
+
+def _mesas_previas(grupos: List[List[int]], asientos: List[Optional[tuple]]):
+    # Mesa previa de cada grupo (la de la mayoría de sus miembros) y si el
+    # grupo está intacto: todos sus miembros ya estaban sentados juntos.
+    previas: List[Optional[int]] = []
+    intactos: List[bool] = []
+    for g in grupos:
+        mesas = [asientos[i][0] for i in g if asientos[i] is not None]
+        if not mesas:
+            previas.append(None)
+            intactos.append(False)
+            continue
+        previas.append(max(set(mesas), key=mesas.count))
+        intactos.append(len(mesas) == len(g) and len(set(mesas)) == 1)
+    return previas, intactos
+
+
+def _mesas_heuristica(grupos: List[List[int]], enlaces, tamano_mesa: int, num_mesas: int,
+                      enemigos: str, peso_amigo: int, peso_enemigo: int, tiempo_limite: float,
+                      previas: Optional[List[Optional[int]]] = None,
+                      fijas: Optional[List[bool]] = None,
+                      peso_mover: int = PESO_MOVER) -> List[int]:
+    # Reparto con heuristica.resolver; devuelve la mesa de cada grupo.
+    if enemigos == "duro":
+        # Sin restricciones duras, un enemigo en la mesa cuesta más que todo
+        # lo que se puede ganar con amigos y movimientos.
+        peso_enemigo = (peso_amigo * sum(enlaces["amigo"].values())
+                        + peso_mover * sum(len(g) for g in grupos) + 1)
+    return heuristica.resolver([len(g) for g in grupos], enlaces, tamano_mesa,
+                               num_mesas, peso_amigo, peso_enemigo,
+                               previas, fijas, peso_mover, tiempo_limite)
+
+
+def _por_participante(grupos: List[List[int]], mesa_grupo: List[int]) -> List[int]:
+    asignacion = [0] * sum(len(g) for g in grupos)
+    for g, m in zip(grupos, mesa_grupo):
+        for i in g:
+            asignacion[i] = m
+    return asignacion
+
+
+def _asignacion_heuristica(participantes: List[Invitado], grupos: Optional[List[List[int]]],
+                           tamano_mesa: int, num_mesas: int, enemigos: str,
+                           peso_amigo: int, peso_enemigo: int, tiempo_limite: float,
+                           previas: Optional[List[Optional[int]]] = None,
+                           fijas: Optional[List[bool]] = None,
+                           peso_mover: int = PESO_MOVER) -> List[int]:
+    # Igual que _mesas_heuristica, pero devuelve la mesa de cada participante.
+    if grupos is None:
+        grupos = [[i] for i in range(len(participantes))]
+    enlaces = enlaces_entre_grupos(participantes, grupos)
+    return _por_participante(grupos, _mesas_heuristica(grupos, enlaces, tamano_mesa, num_mesas,
+                                                       enemigos, peso_amigo, peso_enemigo,
+                                                       tiempo_limite, previas, fijas, peso_mover))
+
+
+def _romper_simetria(mesa_grupo: List[int]) -> List[int]:
+    # Renumera las mesas por orden de aparición: así el grupo k nunca está
+    # en una mesa mayor que k, como exige el modelo booleano sin plan previo.
+    nueva: Dict[int, int] = {}
+    return [nueva.setdefault(m, len(nueva)) for m in mesa_grupo]
+
+
+def _valor_objetivo(grupos: List[List[int]], enlaces, mesa_grupo: List[int],
+                    amigos: str, enemigos: str, peso_amigo: int, peso_enemigo: int,
+                    previas: Optional[List[Optional[int]]] = None,
+                    fijas: Optional[List[bool]] = None,
+                    peso_mover: int = PESO_MOVER) -> Optional[float]:
+    # Lo que valdría el reparto en el objetivo del CP-SAT (para comparar con
+    # sus soluciones); None si incumple una restricción dura.
+    valor = 0
+    for k, m in enumerate(previas or []):
+        if m is None:
+            continue
+        if fijas and fijas[k]:
+            if mesa_grupo[k] != m:
+                return None
+        elif mesa_grupo[k] == m:
+            valor += peso_mover * len(grupos[k])
+    for tipo, modo, peso in (("amigo", amigos, peso_amigo), ("enemigo", enemigos, -peso_enemigo)):
+        for (k, l), n in enlaces[tipo].items():
+            juntos = mesa_grupo[k] == mesa_grupo[l]
+            if modo == "duro":
+                if juntos != (tipo == "amigo"):
+                    return None
+            elif juntos:
+                valor += peso * n
+    return valor
+
+
+def _resolver_subproblema(participantes: List[Invitado], tamano_mesa: int, num_mesas: int,
+                          opciones: Dict) -> List[int]:
+    # Se ejecuta en un proceso aparte: devuelve la mesa de cada participante.
+    evento, _ = asignar_mesas(participantes, tamano_mesa, num_mesas=num_mesas, **opciones)
+    mesa_de = {id(inv): m for m, mesa in enumerate(evento.mesas) for inv in mesa.invitados if inv}
+    return [mesa_de[id(inv)] for inv in participantes]
+
+
+def _asignar_por_subproblemas(participantes: List[Invitado], subproblemas, tamano_mesa: int,
+                              opciones: Dict, config: "ConfigSolver",
+                              detener: Optional[threading.Event] = None) -> List[int]:
+    from concurrent.futures import ProcessPoolExecutor, wait  # multiprocessing: solo si se divide
+
+    nucleos = os.cpu_count() or 1
+    procesos = min(config.procesos or nucleos, len(subproblemas))
+    # Cada proceso usa su parte de los núcleos para no sobresuscribir la CPU
+    sub_config = replace(config, dividir=False,
+                         workers=config.workers or max(1, nucleos // procesos))
+    opciones = dict(opciones, config=sub_config)
+
+    pool = ProcessPoolExecutor(max_workers=procesos)
+    try:
+        futuros = [pool.submit(_resolver_subproblema, [participantes[i] for i in indices],
+                               tamano_mesa, mesas, opciones)
+                   for indices, mesas in subproblemas]
+        pendientes = set(futuros)
+        while pendientes and not (detener is not None and detener.is_set()):
+            _, pendientes = wait(pendientes, timeout=0.1)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    asignacion = [0] * len(participantes)
+    desplazamiento = 0
+    for (indices, mesas), futuro in zip(subproblemas, futuros):
+        if futuro.done() and not futuro.cancelled() and futuro.exception() is None:
+            parcial = futuro.result()
+        else:
+            # Detenido antes de terminar: reparto rápido de ese subproblema
+            parcial = _resolver_subproblema([participantes[i] for i in indices], tamano_mesa,
+                                            mesas, dict(opciones, motor="heuristico"))
+        for i, m in zip(indices, parcial):
+            asignacion[i] = desplazamiento + m
+        desplazamiento += max([mesas] + [m + 1 for m in parcial])
+    return asignacion
+
+
+def evento_desde_asignacion(participantes: List[Invitado], asignacion: List[int],
+                            tamano_mesa: int, num_mesas: int,
+                            nombre_evento: str, fecha: str, ubicacion: str,
+                            asientos_previos: Optional[List[Optional[tuple]]] = None,
+                            registro: Optional[RegistroInvitados] = None) -> Evento:
+    """Evento con cada participante sentado en la mesa asignacion[i] (índice
+    desde 0). Con `asientos_previos` se conserva el asiento de quien no cambia
+    de mesa."""
+    if registro is None:
+        registro = RegistroInvitados(participantes)
+    mesas = [crear_mesa(i + 1, tamano_mesa, f"Mesa {i+1}", registro=registro) for i in range(num_mesas)]
+    pendientes = []
+
+    # Quien sigue en su mesa conserva también su asiento
+    for i, (inv, m_idx) in enumerate(zip(participantes, asignacion)):
+        previo = asientos_previos[i] if asientos_previos else None
+        if previo and previo[0] == m_idx and previo[1] < tamano_mesa \
+                and mesas[m_idx].asientos[previo[1]] < 0:
+            mesas[m_idx].asientos[previo[1]] = inv.id
+        else:
+            pendientes.append((inv, m_idx))
+
+    siguiente = [0] * num_mesas
+    for inv, m_idx in pendientes:
+        asientos = mesas[m_idx].asientos
+        pos = siguiente[m_idx]
+        while asientos[pos] >= 0:
+            pos += 1
+        asientos[pos] = inv.id
+        siguiente[m_idx] = pos + 1
+
+    return crear_evento(nombre_evento, fecha, ubicacion, mesas, registro)
+
+
+_ClaseSoluciones = None
+
+
+def _SolucionesMesas(al_mejorar: Callable[["cp_model.CpSolverSolutionCallback", float], None],
+                     detener: Optional[threading.Event] = None):
+    # Callback que llama a al_mejorar(solucion, valor del objetivo) con cada
+    # solución que mejora la anterior (CP-SAT solo notifica soluciones mejores) y corta la
+    # búsqueda si se activa `detener`; la asignación se lee de `solucion` con
+    # el extraer del modelo solo si hace falta. La clase hereda de OR-Tools,
+    # así que se define la primera vez que se resuelve.
+    global _ClaseSoluciones
+    if _ClaseSoluciones is None:
+        cp_model = _cp_model()
+
+        class _Soluciones(cp_model.CpSolverSolutionCallback):
+            def __init__(self, al_mejorar, detener):
+                super().__init__()
+                self._al_mejorar = al_mejorar
+                self._detener = detener
+
+            def on_solution_callback(self):
+                self._al_mejorar(self, self.ObjectiveValue())
+                if self._detener is not None and self._detener.is_set():
+                    self.StopSearch()
+
+        _ClaseSoluciones = _Soluciones
+    return _ClaseSoluciones(al_mejorar, detener)
+
+
+def _vigilar_detener(solver: "cp_model.CpSolver", detener: threading.Event, fin: threading.Event):
+    # El callback solo se ejecuta al encontrar soluciones; este hilo permite
+    # parar también mientras el solver aún no ha encontrado ninguna.
+    while not fin.wait(0.1):
+        if detener.is_set():
+            solver.StopSearch()
+            return
+
+
+def asignar_mesas(participantes: List[Invitado], tamano_mesa: int,
+                  nombre_evento: str = "Evento", fecha: str = "", ubicacion: str = "",
+                  num_mesas: Optional[int] = None, formulacion: str = "booleana",
+                  amigos: str = "duro", enemigos: str = "blando",
+                  peso_amigo: int = PESO_AMIGO, peso_enemigo: int = PESO_ENEMIGO,
+                  al_mejorar: Optional[Callable[[Evento, Dict[str, int]], None]] = None,
+                  detener: Optional[threading.Event] = None,
+                  config: Optional[ConfigSolver] = None,
+                  plan_previo: Optional[Evento] = None, peso_mover: int = PESO_MOVER,
+                  fijar_previos: bool = False, motor: str = "cpsat",
+                  estadisticas: Optional[Dict] = None):
+    """Reparte a los participantes en mesas y devuelve (evento, mapping).
+
+    Si se pasa `al_mejorar`, se llama con (evento, mapping) nada más tener el
+    reparto de partida (heurística rápida, también hint del CP-SAT) y después
+    cada vez que el solver encuentra una solución mejor, para poder mostrarla
+    al momento.
+    Activar `detener` corta la búsqueda y devuelve la mejor solución hasta
+    ese momento. `config` ajusta el solver (workers, semilla, tiempo...).
+
+    Con `plan_previo` (p. ej. el mesas_<evento>.csv ya confirmado) el solver
+    parte de ese reparto: se usa como hint, cambiar a alguien de mesa penaliza
+    `peso_mover` por invitado y, con `fijar_previos`, los grupos que ya
+    estaban sentados juntos no se mueven y solo se colocan los nuevos.
+
+    `motor="heuristico"` usa el reparto voraz + búsqueda local de
+    nucleo_mesas.heuristica en lugar del CP-SAT (mucho más rápido, sin garantía de
+    óptimo). Es también el respaldo si el CP-SAT no encuentra solución; si
+    no caben todos, se añaden mesas al final.
+
+    Con `config.dividir` los grupos de invitados sin preferencias entre sí se
+    resuelven como subproblemas independientes en paralelo (procesos) y se
+    unen en un único evento; en ese modo `al_mejorar` solo recibe el final.
+
+    Si se pasa el dict `estadisticas` se rellena con el motor que dio el
+    resultado, el estado del CP-SAT y los tiempos de modelo y resolución;
+    `t_primera_cpsat` son los segundos desde la llamada hasta la primera
+    solución propia del CP-SAT (None si no encontró ninguna), sin contar el
+    reparto de partida.
+    """
+    t_inicio = time.perf_counter()
+    config = config or ConfigSolver()
+    medir = estadisticas is not None
+    estadisticas = {} if estadisticas is None else estadisticas
+    estadisticas.update(motor=motor, estado="", t_modelo=0.0, t_resolver=0.0)
+
+    n = len(participantes)
+    registro = _asegurar_preferencias(participantes)
+
+    if num_mesas is None or num_mesas <= 0:
+        num_mesas = max(1, ceil(n / tamano_mesa))
+
+    tamano_mesa = max(TAMANO_MESA_MINIMO, tamano_mesa)
+
+    grupos = agrupar_amigos(participantes) if amigos == "duro" else None
+
+    # Un grupo de amigos que no cabe en una mesa, o enemigos dentro de un
+    # mismo grupo, harían el modelo inviable. Se detecta aquí sin esperar al
+    # solver y esos enlaces pasan a ser blandos para devolver igualmente el
+    # mejor reparto posible.
+    if grupos is not None and grupos_demasiado_grandes(participantes, grupos, tamano_mesa):
+        amigos, grupos = "blando", None
+    if enemigos == "duro" and grupos is not None and enemigos_en_mismo_grupo(participantes, grupos):
+        enemigos = "blando"
+
+    asientos = previas = fijas = None
+    if plan_previo is not None:
+        if grupos is None:
+            grupos = [[i] for i in range(n)]
+        asientos = _asientos_previos(participantes, plan_previo, num_mesas)
+        previas, intactos = _mesas_previas(grupos, asientos)
+        fijas = intactos if fijar_previos else None
+        if fijas:
+            # Si una mesa ya no da para todos los grupos que tenía (mesas más
+            # pequeñas), sus grupos quedan libres para no hacer inviable el modelo.
+            carga = [0] * num_mesas
+            for k, m in enumerate(previas):
+                if fijas[k]:
+                    carga[m] += len(grupos[k])
+            fijas = [f and carga[previas[k]] <= tamano_mesa for k, f in enumerate(fijas)]
+
+    def construir(asignacion: List[int]):
+        total_mesas = max([num_mesas] + [m + 1 for m in asignacion])
+        evento = evento_desde_asignacion(participantes, asignacion, tamano_mesa, total_mesas,
+                                         nombre_evento, fecha, ubicacion, asientos, registro)
+        mapping = {inv.nombre: m for inv, m in zip(participantes, asignacion)}
+        return evento, mapping
+
+    def heuristica():
+        t0 = time.perf_counter()
+        asignacion = _asignacion_heuristica(participantes, grupos, tamano_mesa, num_mesas,
+                                            enemigos, peso_amigo, peso_enemigo,
+                                            config.tiempo_limite, previas, fijas, peso_mover)
+        estadisticas["motor"] = "heuristico"
+        estadisticas["t_resolver"] += time.perf_counter() - t0
+        resultado = construir(asignacion)
+        if al_mejorar is not None:
+            al_mejorar(*resultado)
+        return resultado
+
+    if config.dividir and plan_previo is None:
+        subproblemas = dividir_en_subproblemas(participantes, tamano_mesa, num_mesas)
+        if subproblemas:
+            opciones = dict(formulacion=formulacion, amigos=amigos, enemigos=enemigos,
+                            peso_amigo=peso_amigo, peso_enemigo=peso_enemigo, motor=motor)
+            t0 = time.perf_counter()
+            resultado = construir(_asignar_por_subproblemas(participantes, subproblemas,
+                                                            tamano_mesa, opciones, config, detener))
+            estadisticas.update(motor=f"{motor}-dividido", subproblemas=len(subproblemas),
+                                t_resolver=time.perf_counter() - t0)
+            if al_mejorar is not None:
+                al_mejorar(*resultado)
+            return resultado
+
+    if motor == "heuristico":
+        return heuristica()
+
+    # Plan de partida: la heurística con poco tiempo. Se entrega enseguida
+    # por al_mejorar (el CP-SAT puede tardar segundos en su primera solución
+    # en eventos grandes) y es el hint del modelo; del CP-SAT solo se
+    # notifican las soluciones que lo mejoran.
+    if grupos is None:
+        grupos = [[i] for i in range(n)]
+    enlaces = enlaces_entre_grupos(participantes, grupos)
+    t0 = time.perf_counter()
+    plan = _mesas_heuristica(grupos, enlaces, tamano_mesa, num_mesas, enemigos,
+                             peso_amigo, peso_enemigo,
+                             min(TIEMPO_PLAN_INICIAL, config.tiempo_limite),
+                             previas, fijas, peso_mover)
+    if previas is None:
+        plan = _romper_simetria(plan)
+    valor_plan = _valor_objetivo(grupos, enlaces, plan, amigos, enemigos, peso_amigo,
+                                 peso_enemigo, previas, fijas, peso_mover)
+    estadisticas["t_plan_inicial"] = time.perf_counter() - t0
+    if al_mejorar is not None:
+        al_mejorar(*construir(_por_participante(grupos, plan)))
+    # Con mesas de más (no cabían) no sirve como hint: se usa el first-fit
+    hint = plan if max(plan, default=0) < num_mesas else None
+
+    cp_model = _cp_model()
+    t0 = time.perf_counter()
+    model, extraer = construir_modelo(participantes, tamano_mesa, num_mesas, formulacion, grupos,
+                                      amigos, enemigos, peso_amigo, peso_enemigo,
+                                      config.usar_hints, previas, fijas, peso_mover, hint)
+    estadisticas["t_modelo"] = time.perf_counter() - t0
+    solver = cp_model.CpSolver()
+    config.aplicar(solver)
+    proto = model.Proto()
+    if hint is not None and valor_plan is not None \
+            and len(proto.solution_hint.vars) == len(proto.variables):
+        # El hint es una solución completa y válida, pero el CP-SAT solo la
+        # toma al acabar el presolve, y el sondeo (probing) de un modelo
+        # grande puede gastar todo el tiempo (p. ej. la formulación entera con
+        # 300 invitados y 1 s acababa UNKNOWN). Con un presolve ligero se
+        # parte antes del plan, sin peor resultado final.
+        solver.parameters.cp_model_probing_level = 0
+        solver.parameters.max_presolve_iterations = 1
+
+    def mejora_el_plan(valor: float) -> bool:
+        return valor_plan is None or valor > valor_plan
+
+    callback = None
+    estadisticas["t_primera_cpsat"] = None
+    if al_mejorar is not None or detener is not None or medir:
+        def notificar(solucion, valor: float):
+            if estadisticas["t_primera_cpsat"] is None:
+                estadisticas["t_primera_cpsat"] = time.perf_counter() - t_inicio
+            if al_mejorar is not None and mejora_el_plan(valor):
+                al_mejorar(*construir(extraer(solucion)))
+        callback = _SolucionesMesas(notificar, detener)
+
+    fin = threading.Event()
+    if detener is not None:
+        threading.Thread(target=_vigilar_detener, args=(solver, detener, fin), daemon=True).start()
+    try:
+        status = solver.Solve(model, callback)
+    finally:
+        fin.set()
+    estadisticas.update(estado=solver.StatusName(status), t_resolver=solver.WallTime())
+
+    if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+        return heuristica()
+    if not mejora_el_plan(solver.ObjectiveValue()):
+        # Se devuelve el plan que ya se mostró, no uno distinto que no lo
+        # mejora. Si lo iguala, el CP-SAT lo ha confirmado (o demostrado
+        # óptimo) y es su resultado; si queda por debajo, es el de la heurística.
+        if solver.ObjectiveValue() < valor_plan:
+            estadisticas["motor"] = "heuristico"
+        return construir(_por_participante(grupos, plan))
+
+    return construir(extraer(solver))
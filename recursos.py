@@ -0,0 +1,96 @@
+# recursos.py
+# Iconos de la aplicación: se sirven desde ResourcesIconos.rcc (recurso
+# binario que Qt mapea en memoria, registrado la primera vez que se pide un
+# icono) o, si falta el .rcc o el icono no está dentro, desde Resources/Icons.
+# La resolución de cada nombre se hace una vez y queda en caché, igual que
+# los pixmaps ya escalados (cache_pixmaps).
+#
+# Para regenerar el .rcc tras cambiar iconos: python compilar_recursos.py
+
+import os
+from functools import lru_cache
+from typing import Dict, Tuple
+
+from PyQt5 import QtCore, QtGui
+
+CARPETA = os.path.dirname(os.path.abspath(__file__))
+RUTA_RCC = os.path.join(CARPETA, "ResourcesIconos.rcc")
+CARPETA_ICONOS = os.path.join(CARPETA, "Resources", "Icons")
+PREFIJO_ICONOS = ":/newPrefix/Resources/Icons"
+
+ICON_SIZE = 56
+
+
+@lru_cache(maxsize=None)
+def registrar_recursos() -> bool:
+    """Registra ResourcesIconos.rcc (una sola vez); False si no está."""
+    return os.path.exists(RUTA_RCC) and QtCore.QResource.registerResource(RUTA_RCC)
+
+
+@lru_cache(maxsize=None)
+def ruta_icono(nombre: str) -> str:
+    """Ruta del icono `nombre` (p. ej. "Verde.png"): la del recurso si está
+    en el .rcc y, si no, la del fichero en disco."""
+    # QFile.exists sobre ":/..." solo consulta el árbol del recurso, sin
+    # decodificar la imagen
+    if registrar_recursos() and QtCore.QFile.exists(f"{PREFIJO_ICONOS}/{nombre}"):
+        return f"{PREFIJO_ICONOS}/{nombre}"
+    return os.path.join(CARPETA_ICONOS, nombre)
+
+
+class CachePixmaps:
+    # Pixmaps de icono decodificados y escalados una sola vez por (icono,
+    # tamaño, device pixel ratio). Solo desde el hilo de la interfaz, como
+    # todo QPixmap.
+    def __init__(self):
+        self._pixmaps: Dict[Tuple[str, int, float], QtGui.QPixmap] = {}
+        self.aciertos = 0
+        self.fallos = 0
+
+    def pixmap(self, ruta: str, tamano: int, dpr: float = 1.0) -> QtGui.QPixmap:
+        clave = (ruta, tamano, dpr)
+        pm = self._pixmaps.get(clave)
+        if pm is not None:
+            self.aciertos += 1
+            return pm
+        self.fallos += 1
+        pm = QtGui.QPixmap(ruta)
+        if not pm.isNull():
+            lado = round(tamano * dpr)
+            pm = pm.scaled(lado, lado, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            pm.setDevicePixelRatio(dpr)
+        self._pixmaps[clave] = pm
+        return pm
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {"aciertos": self.aciertos, "fallos": self.fallos, "entradas": len(self._pixmaps)}
+
+    def vaciar(self):
+        self._pixmaps.clear()
+        self.aciertos = self.fallos = 0
+
+
+cache_pixmaps = CachePixmaps()
+
+
+def icon_for_state(estado: str, is_empty: bool) -> str:
+    if is_empty:
+        return ruta_icono("gris_transparente.png")
+    e = (estado or "").strip().lower()
+    if e in ("ok", "verde"):
+        fn = "Verde.png"
+    elif e in ("conflicto", "rojo"):
+        fn = "Rojo.png"
+    elif e in ("advertencia", "amarillo", "naranja"):
+        fn = "Naranja.png"
+    elif e in ("manual", "azul"):
+        fn = "Azul.png"
+    else:
+        fn = "Verde.png"
+    return ruta_icono(fn)
+
+
+def pixmap_for_state(estado: str, is_empty: bool, dpr: float = 1.0,
+                     tamano: int = ICON_SIZE) -> QtGui.QPixmap:
+    # Icono del estado ya escalado (compartido entre renders y vistas)
+    return cache_pixmaps.pixmap(icon_for_state(estado, is_empty), tamano, dpr)
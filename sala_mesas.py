@@ -0,0 +1,202 @@
+# sala_mesas.py
+# Vista de sala: todas las mesas del evento a la vez en un QGraphicsScene.
+# Cada mesa es un item ligero (cuerpo dibujado y cacheado) con sus asientos
+# como QGraphicsPixmapItem hijos; el índice BSP de la escena hace que solo se
+# pinte lo que entra en el viewport, la rueda hace zoom y, alejado, se
+# ocultan los nombres. Los asientos aceptan el mismo arrastre
+# application/x-guest que los de la vista de una mesa.
+
+import json
+import math
+from typing import Dict, List, Optional
+
+from PyQt5 import QtWidgets, QtGui, QtCore
+
+from nucleo_mesas import Evento, Mesa
+from recursos import ICON_SIZE, pixmap_for_state
+
+MIME_INVITADO = "application/x-guest"
+
+SEPARACION = 40          # entre mesas de la cuadrícula
+ZOOM_MIN, ZOOM_MAX = 0.05, 4.0
+ZOOM_NOMBRES = 0.45      # por debajo no se muestran los nombres
+DPR_ICONOS = 2.0         # resolución de los iconos para que aguanten el zoom
+
+
+def invitado_desde_mime(md: QtCore.QMimeData) -> Optional[Dict]:
+    if not md.hasFormat(MIME_INVITADO):
+        return None
+    try:
+        info = json.loads(md.data(MIME_INVITADO).data().decode("utf-8"))
+    except Exception:
+        info = {}
+    return {
+        "id": info.get("id"),
+        "nombre": info.get("nombre", ""),
+        "estado": "manual",
+    }
+
+
+def radio_asientos(capacidad: int) -> float:
+    # Radio del círculo de asientos para que no se solapen
+    return max(60.0, capacidad * (ICON_SIZE + 10) / (2 * math.pi))
+
+
+class AsientoItem(QtWidgets.QGraphicsPixmapItem):
+    def __init__(self, mesa_idx: int, seat_idx: int, parent: QtWidgets.QGraphicsItem):
+        super().__init__(parent)
+        self.mesa_idx = mesa_idx
+        self.seat_idx = seat_idx
+        self.setAcceptDrops(True)
+        self.setShapeMode(QtWidgets.QGraphicsPixmapItem.BoundingRectShape)
+        self.setTransformationMode(QtCore.Qt.SmoothTransformation)
+        self.setOffset(-ICON_SIZE / 2, -ICON_SIZE / 2)
+        self.nombre = QtWidgets.QGraphicsSimpleTextItem(parent)
+        self.nombre.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+
+    def pintar(self, pixmap: QtGui.QPixmap, nombre: str):
+        if pixmap.cacheKey() != self.pixmap().cacheKey():
+            self.setPixmap(pixmap)
+        if nombre != self.nombre.text():
+            self.nombre.setText(nombre)
+            ancho = self.nombre.boundingRect().width()
+            self.nombre.setPos(self.x() - ancho / 2, self.y() + ICON_SIZE / 2 + 2)
+
+    def dragEnterEvent(self, event: QtWidgets.QGraphicsSceneDragDropEvent):
+        event.setAccepted(event.mimeData().hasFormat(MIME_INVITADO))
+
+    def dropEvent(self, event: QtWidgets.QGraphicsSceneDragDropEvent):
+        guest = invitado_desde_mime(event.mimeData())
+        if guest is None:
+            event.ignore()
+            return
+        event.acceptProposedAction()
+        vista = self.scene().views()[0] if self.scene().views() else None
+        if isinstance(vista, SalaMesas):
+            vista.asiento_soltado.emit(self.mesa_idx, self.seat_idx, guest)
+
+
+class MesaItem(QtWidgets.QGraphicsItem):
+    # Cuerpo de la mesa (círculo y nombre); los asientos son hijos
+    def __init__(self, mesa_idx: int, capacidad: int, titulo: str):
+        super().__init__()
+        self.mesa_idx = mesa_idx
+        self.titulo = titulo
+        self.radio = radio_asientos(capacidad)
+        self.radio_mesa = self.radio - ICON_SIZE / 2 - 8
+        self.setCacheMode(QtWidgets.QGraphicsItem.DeviceCoordinateCache)
+        self.asientos: List[AsientoItem] = []
+        paso = 2 * math.pi / max(capacidad, 1)
+        for idx in range(capacidad):
+            ang = -math.pi / 2 + idx * paso
+            asiento = AsientoItem(mesa_idx, idx, self)
+            asiento.setPos(self.radio * math.cos(ang), self.radio * math.sin(ang))
+            self.asientos.append(asiento)
+
+    def boundingRect(self) -> QtCore.QRectF:
+        r = self.radio_mesa
+        return QtCore.QRectF(-r, -r, 2 * r, 2 * r)
+
+    def paint(self, painter: QtGui.QPainter, option, widget=None):
+        painter.setPen(QtGui.QPen(QtGui.QColor("#5b9bd5"), 2))
+        painter.setBrush(QtGui.QColor("#d1ecff"))
+        painter.drawEllipse(self.boundingRect())
+        painter.setPen(QtGui.QColor("#1f3b57"))
+        painter.drawText(self.boundingRect(), QtCore.Qt.AlignCenter | QtCore.Qt.TextWordWrap,
+                         self.titulo)
+
+    def pintar(self, mesa: Mesa, estados: List[str]):
+        invitados = list(mesa.invitados)
+        for idx, asiento in enumerate(self.asientos):
+            inv = invitados[idx] if idx < len(invitados) else None
+            nombre = (inv.nombre or "").strip() if inv else ""
+            estado = estados[idx] if idx < len(estados) else "vacio"
+            asiento.pintar(pixmap_for_state(estado, not nombre, DPR_ICONOS), nombre)
+
+
+class SalaMesas(QtWidgets.QGraphicsView):
+    asiento_soltado = QtCore.pyqtSignal(int, int, dict)   # mesa, asiento, invitado
+    mesa_seleccionada = QtCore.pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QtWidgets.QGraphicsScene(self))
+        self.mesas: List[MesaItem] = []
+        self.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
+        self.setOptimizationFlags(QtWidgets.QGraphicsView.DontSavePainterState
+                                  | QtWidgets.QGraphicsView.DontAdjustForAntialiasing)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.SmartViewportUpdate)
+        self.setCacheMode(QtWidgets.QGraphicsView.CacheBackground)
+        self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
+        self.setDragMode(QtWidgets.QGraphicsView.ScrollHandDrag)
+        self.setBackgroundBrush(QtGui.QColor("#f4f8fc"))
+        self._nombres_visibles = True
+
+    def mostrar_evento(self, evento: Evento, estados: List[List[str]]):
+        escena = self.scene()
+        escena.clear()
+        self.mesas = []
+        mesas = evento.mesas
+        if not mesas:
+            return
+        columnas = math.ceil(math.sqrt(len(mesas)))
+        celda = 2 * max(radio_asientos(m.numAsientos) for m in mesas) + ICON_SIZE + 2 * SEPARACION
+        for i, mesa in enumerate(mesas):
+            item = MesaItem(i, mesa.numAsientos, mesa.nombMesa or f"Mesa {mesa.mesa_id}")
+            item.setPos((i % columnas + 0.5) * celda, (i // columnas + 0.5) * celda)
+            escena.addItem(item)
+            item.pintar(mesa, estados[i] if i < len(estados) else [])
+            self.mesas.append(item)
+        filas = math.ceil(len(mesas) / columnas)
+        escena.setSceneRect(0, 0, columnas * celda, filas * celda)
+        self._actualizar_nombres()
+
+    def actualizar_mesa(self, mesa_idx: int, mesa: Mesa, estados: List[str]):
+        if mesa_idx >= len(self.mesas):
+            return
+        item = self.mesas[mesa_idx]
+        if len(item.asientos) != mesa.numAsientos:
+            # Cambió la capacidad: se rehace solo esta mesa
+            nuevo = MesaItem(mesa_idx, mesa.numAsientos, item.titulo)
+            nuevo.setPos(item.pos())
+            self.scene().removeItem(item)
+            self.scene().addItem(nuevo)
+            self.mesas[mesa_idx] = item = nuevo
+            self._actualizar_nombres(forzar=True)
+        item.pintar(mesa, estados)
+
+    def centrar_en_mesa(self, mesa_idx: int):
+        if 0 <= mesa_idx < len(self.mesas):
+            self.centerOn(self.mesas[mesa_idx])
+
+    def ajustar_a_sala(self):
+        self.fitInView(self.scene().sceneRect(), QtCore.Qt.KeepAspectRatio)
+        self._actualizar_nombres()
+
+    def zoom(self) -> float:
+        return self.transform().m11()
+
+    def wheelEvent(self, event: QtGui.QWheelEvent):
+        factor = 1.15 ** (event.angleDelta().y() / 120)
+        nuevo = min(ZOOM_MAX, max(ZOOM_MIN, self.zoom() * factor))
+        self.scale(nuevo / self.zoom(), nuevo / self.zoom())
+        self._actualizar_nombres()
+
+    def _actualizar_nombres(self, forzar: bool = False):
+        # Nivel de detalle: con la sala entera a la vista los nombres no se
+        # leen y son lo más caro de pintar
+        visibles = self.zoom() >= ZOOM_NOMBRES
+        if visibles == self._nombres_visibles and not forzar:
+            return
+        self._nombres_visibles = visibles
+        for mesa in self.mesas:
+            for asiento in mesa.asientos:
+                asiento.nombre.setVisible(visibles)
+
+    def mouseDoubleClickEvent(self, event: QtGui.QMouseEvent):
+        item = self.itemAt(event.pos())
+        while item is not None and not isinstance(item, MesaItem):
+            item = item.parentItem()
+        if item is not None:
+            self.mesa_seleccionada.emit(item.mesa_idx)
+        super().mouseDoubleClickEvent(event)
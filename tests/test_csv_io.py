@@ -0,0 +1,35 @@
+# Plan de mesas en CSV (nucleo_mesas.csv_io): guardar y volver a cargar.
+from nucleo_mesas import (RegistroInvitados, cargar_evento_desde_csv_mesas, crear_evento,
+                          crear_invitado, crear_mesa, guardar_evento_csv_mesas)
+
+
+def _evento_con_ids(ids):
+    registro = RegistroInvitados()
+    invitados = []
+    for i in ids:
+        inv = crear_invitado("invitado", "Ana", f"A{i}")
+        inv.id = i
+        invitados.append(inv)
+    mesas = [crear_mesa(1, 8, "Mesa 1", invitados[:4], registro),
+             crear_mesa(2, 8, "Mesa 2", invitados[4:], registro)]
+    return crear_evento("prueba", "", "", mesas, registro)
+
+
+def test_los_ids_del_csv_se_conservan_al_cargar(tmp_path):
+    ruta = str(tmp_path / "mesas_prueba.csv")
+    guardar_evento_csv_mesas(_evento_con_ids([7, 3, 0, 12, 5, 1]), ruta)
+
+    evento = cargar_evento_desde_csv_mesas("prueba", "", "", ruta)
+    ids = {inv.apellido: inv.id for m in evento.mesas for inv in m.invitados if inv}
+    assert ids == {"A7": 7, "A3": 3, "A0": 0, "A12": 12, "A5": 5, "A1": 1}
+    assert all(evento.registro[i].apellido == f"A{i}" for i in ids.values())
+
+
+def test_csv_antiguo_sin_columna_id(tmp_path):
+    ruta = tmp_path / "mesas_antiguo.csv"
+    ruta.write_text("mesa_id;mesa_nombre;asiento;nombre;apellido;rol\n"
+                    "1;Mesa 1;1;Ana;Uno;invitado\n"
+                    "1;Mesa 1;2;Ana;Dos;invitado\n", encoding="utf-8")
+
+    evento = cargar_evento_desde_csv_mesas("prueba", "", "", str(ruta))
+    assert sorted(inv.id for inv in evento.registro) == [0, 1]
@@ -0,0 +1,42 @@
+# Hint y arranque del CP-SAT de nucleo_mesas.solver en un evento mediano.
+import pytest
+
+from benchmark_mesas import generar_invitados
+from nucleo_mesas import ConfigSolver, asignar_mesas, construir_modelo, resolver_preferencias
+from nucleo_mesas.preferencias import enlaces_entre_grupos
+from nucleo_mesas.solver import _cp_model, _mesas_heuristica, _romper_simetria
+
+INVITADOS, MESAS, TAMANO_MESA = 300, 40, 8
+
+
+@pytest.mark.parametrize("formulacion", ["booleana", "entera"])
+def test_el_plan_de_partida_es_un_hint_completo_y_valido(formulacion):
+    participantes = generar_invitados(INVITADOS, 3, 0.1)
+    resolver_preferencias(participantes)
+    grupos = [[i] for i in range(INVITADOS)]
+    enlaces = enlaces_entre_grupos(participantes, grupos)
+    plan = _romper_simetria(_mesas_heuristica(grupos, enlaces, TAMANO_MESA, MESAS, "blando",
+                                              1, 3, 0.2, None, None, 2))
+    model, _ = construir_modelo(participantes, TAMANO_MESA, MESAS, formulacion, grupos,
+                                amigos="blando", enemigos="blando", inicial=plan)
+
+    proto = model.Proto()
+    assert len(proto.solution_hint.vars) == len(proto.variables)
+    # Fijando cada variable a su hint el modelo sigue siendo factible (respeta
+    # capacidad y, en la booleana, la rotura de simetría)
+    cp_model = _cp_model()
+    solver = cp_model.CpSolver()
+    solver.parameters.fix_variables_to_their_hinted_value = True
+    solver.parameters.max_time_in_seconds = 30
+    assert solver.Solve(model) == cp_model.OPTIMAL
+
+
+@pytest.mark.parametrize("formulacion", ["booleana", "entera"])
+def test_el_cpsat_encuentra_solucion_desde_el_hint(formulacion):
+    estadisticas = {}
+    asignar_mesas(generar_invitados(INVITADOS, 3, 0.1), TAMANO_MESA, num_mesas=MESAS,
+                  formulacion=formulacion, amigos="blando",
+                  config=ConfigSolver(tiempo_limite=1.0), estadisticas=estadisticas)
+    assert estadisticas["estado"] in ("OPTIMAL", "FEASIBLE")
+    assert estadisticas["t_primera_cpsat"] is not None
+    assert estadisticas["motor"] == "cpsat"
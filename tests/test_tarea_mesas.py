@@ -0,0 +1,49 @@
+# Tareas de reparto de mesas_emergente en pool_mesas(), sin interfaz visible.
+import os
+import subprocess
+import sys
+import textwrap
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Se ejecuta en un proceso aparte: OR-Tools no debe estar ya importado (lo
+# estaría si otro test resolvió antes) y un fallo aquí es un segfault.
+GUION = textwrap.dedent("""
+    import os, sys, tempfile
+    from PyQt5 import QtCore, QtWidgets
+    app = QtWidgets.QApplication([])
+    import mesas_emergente as me
+    from nucleo_mesas import ConfigSolver, guardar_evento_csv_mesas
+
+    filas = [{"nombre": f"N{i}", "apellido": f"A{i}",
+              "pref_con": f"N{i + 1} A{i + 1}" if i % 3 == 0 else "",
+              "pref_sin": f"N{(i * 37) % 300} A{(i * 37) % 300}" if i % 7 == 0 else ""}
+             for i in range(300)]
+    config = ConfigSolver(tiempo_limite=1.0)
+
+    def correr(tarea):
+        bucle, resultado = QtCore.QEventLoop(), []
+        tarea.senales.terminado.connect(lambda e: (resultado.append(e), bucle.quit()))
+        tarea.senales.error.connect(lambda m: (resultado.append(m), bucle.quit()))
+        me.pool_mesas().start(tarea)
+        bucle.exec_()
+        return resultado[0]
+
+    evento = correr(me.TareaGenerarMesas(tuple(filas), tamano_mesa=8, num_mesas=40,
+                                         config=config))
+    ruta = os.path.join(tempfile.mkdtemp(), "mesas_prueba.csv")
+    guardar_evento_csv_mesas(evento, ruta)
+    filas.append({"nombre": "Nuevo", "apellido": "X", "pref_con": "N0 A0", "pref_sin": ""})
+    evento = correr(me.TareaGenerarMesas(tuple(filas), ruta_plan=ruta, tamano_mesa=8,
+                                         num_mesas=40, config=config))
+    sentados = sum(1 for m in evento.mesas for inv in m.invitados if inv)
+    print("sentados", sentados)
+""")
+
+
+def test_reparto_en_caliente_tras_uno_nuevo_en_el_mismo_pool():
+    entorno = dict(os.environ, QT_QPA_PLATFORM="offscreen", PYTHONPATH=RAIZ)
+    proceso = subprocess.run([sys.executable, "-c", GUION], cwd=RAIZ, env=entorno,
+                             capture_output=True, text=True, timeout=300)
+    assert proceso.returncode == 0, proceso.stderr[-2000:]
+    assert "sentados 301" in proceso.stdout